@@ -0,0 +1,81 @@
+# Copyright 2020 Julian_Orteil
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Build script for the compiled parts of the application.
+
+The project metadata lives in 'pyproject.toml'. This script only adds
+the ahead-of-time compilation of the widget builder modules, which is
+opt-in: the build requirements only list setuptools, so a plain 'pip
+install .' always installs the pure Python modules. To compile them,
+install Cython and a C compiler first and build without isolation
+(e.g. 'pip install --no-build-isolation .'). If the modules cannot be
+cythonized or compiled, the pure Python modules are installed instead.
+"""
+
+
+import warnings
+
+from setuptools import setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+
+_BUILD_ERRORS = (CCompilerError, ExecError, PlatformError, OSError)
+
+
+class OptionalBuildExt(build_ext):
+    """Skips the compiled modules when they cannot be built."""
+
+    def run(self) -> None:
+        try:
+            super().run()
+        except _BUILD_ERRORS as exc:
+            warnings.warn(f"Skipping the compiled modules: {exc}")
+
+    def build_extensions(self) -> None:
+        self._skipped = []
+        super().build_extensions()
+
+        # Leave the skipped modules out of the outputs, so they are
+        # neither copied in place nor recorded as installed
+        for ext in self._skipped:
+            self.extensions.remove(ext)
+
+    def build_extension(self, ext) -> None:
+        try:
+            super().build_extension(ext)
+        except _BUILD_ERRORS as exc:
+            warnings.warn(f"Skipping the compiled module {ext.name}: {exc}")
+            self._skipped.append(ext)
+
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    try:
+        ext_modules = cythonize(
+            ["src/tensorbuilder/windows/mainwindow/ui.py"],
+            compiler_directives={"language_level": 3, "boundscheck": False}
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        warnings.warn(f"Skipping the compiled modules: {exc}")
+        ext_modules = []
+
+
+setup(
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": OptionalBuildExt}
+)
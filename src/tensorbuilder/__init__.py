@@ -30,10 +30,7 @@ will be supported.
 """
 
 
-from __future__ import absolute_import
 from __future__ import annotations
-from __future__ import division
-from __future__ import print_function
 
 
 __authors__ = "Julian_Orteil"
@@ -45,18 +42,22 @@ __version__ = "0.0.1alpha"
 
 
 import argparse
-import os
 import sys
-sys.path.append(os.path.abspath("./src"))
+from functools import lru_cache
 from multiprocessing import freeze_support
+from types import ModuleType
+from typing import Optional
 
 from loguru import logger
-from PyQt5.QtCore import QObject, QThread
+from PyQt5.QtCore import QObject, Qt, QThread, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import QApplication
 
 from tensorbuilder.windows import MainWindow
 
 
+_APPLICATION_QUALNAME = f"{__name__}.Application"
+
+
 class Application(QObject):
     """The core class of the application.
 
@@ -67,21 +68,26 @@ class Application(QObject):
 
     _args: argparse.Namespace
 
+    _backend: Optional[ModuleType]
     _loader: Loader
     _loader_thread: QThread
 
     _mainwindow: MainWindow
 
     def __init__(self, args: argparse.Namespace) -> None:
-        logger.debug(f"Initializing {__name__}.{__class__.__name__}")
+        logger.debug("Initializing {}", _APPLICATION_QUALNAME)
         super().__init__()
 
         self._args = args
+        self._backend = None
 
-        # Create the loader and start the loading thread
+        # Create the loader and start the loading thread. The backend is
+        # imported in the thread while the main window is being built
         self._loader = Loader()
         self._loader_thread = QThread(self)
         self._loader.moveToThread(self._loader_thread)
+        self._loader.backend_loaded.connect(self._on_backend_loaded)
+        self._loader_thread.started.connect(self._loader.run)
         self._loader_thread.start()
 
         # Create the main window and display it
@@ -91,40 +97,82 @@ class Application(QObject):
         # Connect signals to slots
         self._connect_slots()
 
-        logger.success(f"Successfully initialized {__name__}.{__class__.__name__}")
+        logger.success("Successfully initialized {}", _APPLICATION_QUALNAME)
 
     def _connect_slots(self) -> None:
         logger.debug("Connecting application signals")
 
+    @pyqtSlot(object)
+    def _on_backend_loaded(self, backend: ModuleType) -> None:
+        self._backend = backend
+
+    @pyqtSlot()
     def quit(self) -> None:
         """Gracefully shuts down each component of the application."""
 
         logger.info("Shutting down the application")
 
-        # Quit the loader
+        # Quit the loader, waiting for a backend import that may still be
+        # running so the thread is not destroyed while active
         self._loader_thread.quit()
+        self._loader_thread.wait()
 
         logger.success("Successfully shut down the application")
 
 
+_LOADER_QUALNAME = f"{__name__}.Loader"
+
+
 class Loader(QObject):
     """The loading class of the application.
 
     This class's primary duty is to load the backend of the application
     in a separate :obj:`QThread` (hence the need for the class).
+
+    Attributes:
+        backend_loaded (:obj:`pyqtSignal`):
+            The signal fired when the backend has finished importing.
+            The imported backend package is sent through the signal. It
+            is not fired if the backend is not installed.
     """
 
+    backend_loaded = pyqtSignal(object)
+
     def __init__(self) -> None:
-        logger.debug(f"Initializing {__name__}.{__class__.__name__}")
+        logger.debug("Initializing {}", _LOADER_QUALNAME)
         super().__init__()
 
-        logger.success(f"Successfully initialized {__name__}.{__class__.__name__}")
+        logger.success("Successfully initialized {}", _LOADER_QUALNAME)
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Imports the backend and notifies the application when done."""
 
+        logger.info("Loading the TensorFlow backend")
 
+        try:
+            from tensorbuilder.backends import tensorflow as backend
+        except ImportError as error:
+            logger.error(
+                "Unable to load the TensorFlow backend ({}). Install it with "
+                "'pip install -e .[tensorflow]'",
+                error
+            )
+            return
 
+        logger.success("Successfully loaded the TensorFlow backend")
+
+        self.backend_loaded.emit(backend)
+
+
+
+@lru_cache(maxsize=1)
 def parse_args() -> argparse.Namespace:
     """Parses the arguments supplied to the application at launch.
 
+    The result is cached, so subsequent calls return the same
+    :obj:`Namespace` without rebuilding the parser.
+
     Returns:
         args (:obj:`Namespace`):
             The parsed arguments supplied to the application at launch.
@@ -156,6 +204,10 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _excepthook(*args) -> None:
+    logger.opt(exception=args).error("An uncaught error occurred:\n")
+
+
 @logger.catch
 def main() -> int:
     """The entry function of the application.
@@ -176,12 +228,16 @@ def main() -> int:
     # Direct all uncaught exceptions to loguru for handling
     # Most should be caught by the decorater above; however, they may be
     # some that are not
-    sys.excepthook = lambda *args: logger.opt(exception=args).error("An uncaught error occurred:\n")
+    sys.excepthook = _excepthook
 
     # Parse command arguments
     args = parse_args()
 
     # Launch the application
+    # No @2x assets are shipped; this only lets the 64 px navbar sprite
+    # cells and the 112 px window icon be drawn above their logical size
+    # on high DPI screens instead of being downscaled first
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     qapp = QApplication(sys.argv)
     app = Application(args)
 
@@ -15,15 +15,13 @@
 """The entry point of the application.
 
 If running the application from source, ensure you have correctly setup
-the environment by running 'conda create -f environment.yaml'. To run
-the application from source, simply type 'python -m src.tensorbuilder'.
+the environment by running 'conda create -f environment.yaml' and then
+installing the package with 'pip install -e .'. To run the application
+from source, simply type 'python -m tensorbuilder'.
 """
 
 
-from __future__ import absolute_import
 from __future__ import annotations
-from __future__ import division
-from __future__ import print_function
 
 
 import sys
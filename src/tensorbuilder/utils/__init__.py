@@ -24,10 +24,7 @@ defined by the '__all__' attribute.
 """
 
 
-from __future__ import absolute_import
 from __future__ import annotations
-from __future__ import division
-from __future__ import print_function
 
 
 __all__ = ["QMainWindow"]
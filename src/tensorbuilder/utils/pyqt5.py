@@ -24,10 +24,7 @@ defined by the '__all__' attribute.
 """
 
 
-from __future__ import absolute_import
 from __future__ import annotations
-from __future__ import division
-from __future__ import print_function
 
 
 __all__ = ["QMainWindow"]
@@ -94,6 +91,8 @@ class QMainWindow(_QMainWindow):
     mouse_hover_changed = pyqtSignal(tuple)
     mouse_released = pyqtSignal(QMouseEvent)
 
+    _HOVER_TYPES = frozenset((int(QEvent.Enter), int(QEvent.Leave)))
+
     def __init__(
         self,
         parent: Optional[QWidget] = None
@@ -104,7 +103,7 @@ class QMainWindow(_QMainWindow):
         self.closed.emit(event)
 
     def eventFilter(self, sender: QWidget, event: QEvent) -> bool:
-        if event.type() in (QEvent.Enter, QEvent.Leave):
+        if event.type() in QMainWindow._HOVER_TYPES:
             self.mouse_hover_changed.emit((sender, event))
             return True
         return False
@@ -23,10 +23,7 @@ defined by the '__all__' attribute.
 """
 
 
-from __future__ import absolute_import
 from __future__ import annotations
-from __future__ import division
-from __future__ import print_function
 
 
 __all__ = ["MainWindow"]
@@ -39,6 +36,9 @@ from .model import MainWindowModel
 from .view import MainWindowView
 
 
+_QUALNAME = f"{__name__}.MainWindow"
+
+
 class MainWindow(QObject):
     """Processes the user interactions of the main window.
 
@@ -59,7 +59,7 @@ class MainWindow(QObject):
     _view: MainWindowView
 
     def __init__(self) -> None:
-        logger.debug(f"Initializing {__name__}.{__class__.__name__}")
+        logger.debug("Initializing {}", _QUALNAME)
         super().__init__()
 
         self._model = MainWindowModel()
@@ -68,7 +68,7 @@ class MainWindow(QObject):
         # Connect signals to slots
         self._connect_signals()
 
-        logger.success(f"Successfully initialized {__name__}.{__class__.__name__}")
+        logger.success("Successfully initialized {}", _QUALNAME)
 
     def _connect_signals(self) -> None:
         logger.debug("Connecting main window controller signals")
@@ -21,10 +21,7 @@ defined by the '__all__' attribute.
 """
 
 
-from __future__ import absolute_import
 from __future__ import annotations
-from __future__ import division
-from __future__ import print_function
 
 
 __all__ = ["MainWindowModel"]
@@ -33,7 +30,7 @@ __all__ = ["MainWindowModel"]
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class MainWindowModel:
     """Stores the data for the main window.
 
@@ -47,4 +44,6 @@ class MainWindowModel:
         ...     pass
     """
 
-    pass
+    # Declared manually rather than through 'dataclass(slots=True)' to
+    # keep support for Python versions older than 3.10
+    __slots__ = ()
@@ -2,7008 +2,67 @@
 
 # Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
 #
 # WARNING! All changes made in this file will be lost!
 
 from PyQt5 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x55\xdb\
+\x00\x00\x03\x00\
+\x51\
+\x50\x75\x73\x68\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\x20\
+\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\
+\x72\x3a\x20\x72\x67\x62\x61\x28\x32\x35\x35\x2c\x20\x32\x35\x35\
+\x2c\x20\x32\x35\x35\x2c\x20\x30\x29\x3b\x0a\x20\x20\x20\x20\x70\
+\x61\x64\x64\x69\x6e\x67\x3a\x20\x35\x70\x78\x20\x30\x70\x78\x20\
+\x35\x70\x78\x20\x32\x35\x70\x78\x3b\x0a\x20\x20\x20\x20\x74\x65\
+\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x20\x6c\x65\x66\x74\x3b\x0a\
+\x7d\x0a\x0a\x51\x50\x75\x73\x68\x42\x75\x74\x74\x6f\x6e\x3a\x3a\
+\x68\x6f\x76\x65\x72\x20\x7b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x72\x67\
+\x62\x61\x28\x32\x35\x35\x2c\x20\x32\x35\x35\x2c\x20\x32\x35\x35\
+\x2c\x20\x35\x30\x29\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\
+\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x31\x30\x70\x78\x3b\x0a\
+\x7d\x0a\x0a\x51\x50\x75\x73\x68\x42\x75\x74\x74\x6f\x6e\x3a\x3a\
+\x70\x72\x65\x73\x73\x65\x64\x20\x7b\x0a\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x72\x67\x62\x61\x28\x32\x35\x35\x2c\x20\x32\x35\x35\x2c\x20\x32\
+\x35\x35\x2c\x20\x31\x32\x37\x29\x3b\x0a\x7d\x0a\x0a\x23\x63\x65\
+\x6e\x74\x72\x61\x6c\x5f\x77\x69\x64\x67\x65\x74\x20\x7b\x0a\x20\
+\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\
+\x6c\x6f\x72\x3a\x20\x71\x6c\x69\x6e\x65\x61\x72\x67\x72\x61\x64\
+\x69\x65\x6e\x74\x28\x73\x70\x72\x65\x61\x64\x3a\x70\x61\x64\x2c\
+\x20\x78\x31\x3a\x30\x2c\x20\x79\x31\x3a\x30\x2c\x20\x78\x32\x3a\
+\x31\x2c\x20\x79\x32\x3a\x30\x2c\x20\x73\x74\x6f\x70\x3a\x30\x20\
+\x72\x67\x62\x61\x28\x32\x35\x35\x2c\x20\x31\x37\x32\x2c\x20\x30\
+\x2c\x20\x32\x35\x35\x29\x2c\x20\x73\x74\x6f\x70\x3a\x31\x20\x72\
+\x67\x62\x61\x28\x32\x35\x35\x2c\x20\x33\x37\x2c\x20\x30\x2c\x20\
+\x32\x35\x35\x29\x29\x3b\x0a\x7d\x0a\x0a\x23\x63\x6f\x70\x79\x72\
+\x69\x67\x68\x74\x5f\x6c\x61\x62\x65\x6c\x20\x7b\x0a\x20\x20\x20\
+\x20\x63\x6f\x6c\x6f\x72\x3a\x20\x67\x72\x61\x79\x3b\x0a\x7d\x0a\
+\x0a\x23\x6d\x61\x69\x6e\x5f\x63\x6f\x6e\x74\x61\x69\x6e\x65\x72\
+\x20\x7b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\
+\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x77\x68\x69\x74\x65\x3b\x0a\
+\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x74\x6f\x70\x2d\x6c\
+\x65\x66\x74\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x31\x35\x70\x78\
+\x3b\x0a\x7d\x0a\x0a\x23\x73\x65\x61\x72\x63\x68\x62\x6f\x78\x20\
+\x7b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\
+\x74\x6f\x6d\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x72\
+\x67\x62\x28\x31\x39\x30\x2c\x20\x31\x39\x30\x2c\x20\x31\x39\x30\
+\x29\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x6c\x65\
+\x66\x74\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\x20\x20\x20\x20\x62\x6f\
+\x72\x64\x65\x72\x2d\x72\x69\x67\x68\x74\x3a\x20\x6e\x6f\x6e\x65\
+\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x74\x6f\x70\
+\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\x20\x20\x20\x20\x6d\x61\x72\x67\
+\x69\x6e\x2d\x6c\x65\x66\x74\x3a\x20\x35\x70\x78\x3b\x0a\x20\x20\
+\x20\x20\x6d\x61\x72\x67\x69\x6e\x2d\x72\x69\x67\x68\x74\x3a\x20\
+\x35\x70\x78\x3b\x0a\x20\x20\x20\x20\x70\x61\x64\x64\x69\x6e\x67\
+\x2d\x6c\x65\x66\x74\x3a\x20\x31\x30\x70\x78\x3b\x0a\x7d\x0a\
+\x00\x00\x1d\x66\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\xc2\x00\x00\x00\x96\x08\x06\x00\x00\x00\x4d\x70\x88\x10\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc2\x00\x00\x0e\xc2\x01\x15\x28\
-\x4a\x80\x00\x00\x55\x70\x49\x44\x41\x54\x78\x5e\xed\x9d\x07\x98\
-\x5d\x49\x75\xe7\xd5\xe1\x75\xce\x52\xb7\x5a\x6a\x85\x96\xd4\x8a\
-\xa3\xd0\xca\x59\x9a\x61\x06\x18\x26\x10\xd6\x18\x93\x8c\xc1\xc0\
-\x1a\x30\xc6\x04\x13\x8c\xb1\x01\x7b\x6d\x8c\x6d\xb0\x61\x8d\x17\
-\x63\x76\xbd\x60\x1b\xe3\xb5\x89\xbb\x80\x03\x26\x68\x94\x46\xa3\
-\xd1\x8c\xa4\x91\x46\xa3\x51\xce\x69\x3a\xe7\xb8\xff\xdf\xd5\x3b\
-\xfd\xdd\xb9\xf3\xde\xeb\xa0\x96\xd4\xad\x39\xff\xef\xab\xee\xfb\
-\xea\x56\x9d\x3a\x55\xb7\x6e\xfd\xeb\x54\xba\x13\x1c\x0e\x87\xc3\
-\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\
-\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\
-\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\
-\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\
-\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\
-\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\
-\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\
-\x31\x56\x91\x16\x77\x0e\x87\xc3\xe1\x70\xbc\xe8\x10\x26\x40\x27\
-\x43\x87\xc3\xe1\x70\xbc\xa8\x90\xc1\x9f\x29\x53\xa6\x3c\x5c\x59\
-\x59\xf9\x70\xe0\x13\xf7\x73\x38\x1c\x0e\x87\xe3\x4e\x87\x11\xde\
-\xda\xcd\x9b\x37\x37\x6d\xd9\xb2\xa5\x49\xd7\x6b\xae\x7b\x39\x19\
-\x3a\x1c\x0e\xc7\x8b\x15\x2f\x96\xa1\xc1\x74\xb9\x3e\xb9\x85\xab\
-\x56\xad\xfa\x71\x4f\x4f\xcf\x54\x3c\x33\x33\x33\xcf\xef\xdd\xbb\
-\xf7\x3e\x5d\x1e\x91\xb3\x30\x0e\x87\xc3\xe1\x78\x11\x81\xc6\xff\
-\x4e\x87\x11\xdc\x8c\xf5\xeb\xd7\x7f\xb7\xbf\xbf\x7f\x6a\x7a\x7a\
-\x7a\x1f\x4e\xd7\x55\xf2\xfb\x8e\xee\x4d\x8b\x87\x79\x31\x94\x87\
-\xc3\xe1\x70\x38\x42\xb8\xd3\x1b\x7e\x2c\x5e\x08\x6e\xe2\x86\x0d\
-\x1b\xbe\xdb\xd9\xd9\x39\xaf\xaf\xaf\xaf\x57\xbf\xc9\x77\x3a\xd7\
-\xf2\x5b\x20\x32\xfc\xb6\x7e\x97\xc4\xc3\xfa\x02\x1a\x87\xc3\xe1\
-\x78\x11\xe1\x4e\x26\x42\x08\xad\x5f\x2e\x4b\x24\xf8\x0f\x1d\x1d\
-\x1d\xcb\x65\x01\xf6\xa4\xa5\xa5\x0d\xcc\x07\x72\x8d\x9f\xc8\x70\
-\x35\x61\xe4\x95\x25\x47\x1c\x27\x43\x87\xc3\xe1\x78\x91\xe0\x8e\
-\x5f\x24\x52\x5b\x5b\xfb\x77\x22\xbb\x57\xcb\xfa\x83\x04\x33\xe3\
-\xde\x03\x90\x5f\x3a\x64\xa8\xfb\xf3\xa7\x4d\x9b\x36\xe7\xc2\x85\
-\x0b\x58\x87\x0e\x87\xc3\xe1\x78\x91\xe0\x4e\x25\xc2\xc0\xa2\xab\
-\xa8\xa8\xf8\x62\x59\x59\xd9\xdb\x7b\x7b\x7b\x13\x92\xa0\xc1\xc8\
-\x50\x97\xcb\x7a\x7a\x7a\x26\xb5\xb5\xb5\xfd\x08\xef\xe0\xa6\xc3\
-\xe1\x70\x38\xee\x68\xdc\xd1\x73\x84\x55\x55\x55\xe5\x22\xc1\x09\
-\xb2\xf6\x06\x5d\x0d\x6a\x61\x14\xa7\x22\xf0\xb8\x3e\x44\xea\x70\
-\x38\x1c\x8e\x3b\x1c\x77\xb4\x45\x78\xe9\xd2\xa5\xef\xc9\x22\x5c\
-\x9a\x93\x93\x73\x97\x08\xb1\x9b\x39\xc1\xe0\x6e\x04\xe2\xc0\x6e\
-\x85\xc9\x92\x25\xf8\x83\x83\x07\x0f\xbe\x5e\x5e\x2c\xa8\x71\x8b\
-\xd0\xe1\x70\x38\x5e\x04\xb8\x93\x1b\x7b\xf2\x86\x55\x97\xbf\x60\
-\xc1\x82\xef\xe7\xe7\xe7\xbf\x04\xc2\x13\x19\xc6\x82\xbb\x71\xf4\
-\xf7\xf7\x07\x7e\x2d\x2d\x2d\xdb\x8f\x1e\x3d\xfa\x80\xbc\x9a\xe5\
-\x2c\xae\xc3\xe1\x70\x38\xee\x70\xdc\xc9\x43\xa3\x10\x19\xf9\x6b\
-\x3d\x72\xe4\xc8\x2f\x89\xec\x1e\x17\xe9\x41\x82\xcc\x05\x1a\x7a\
-\x84\x58\x41\x41\xc1\x53\x22\xc1\x5f\xd4\x6f\x48\x90\x38\x4e\x82\
-\x0e\x87\xc3\xf1\x22\xc1\x9d\x42\x84\x2c\x84\x49\xb4\x18\x86\x79\
-\x3f\x86\x43\xaf\xed\xdd\xbb\xf7\x17\x0a\x0b\x0b\x9f\x15\xf1\x11\
-\x8e\xa1\xcf\x5e\xae\x8b\x8b\x8b\x4f\x6f\xdb\xb6\xed\xd5\xfa\x7d\
-\x29\x1e\x36\xd1\x7c\x22\x71\x20\x51\x1f\x2e\x75\x38\x1c\x8e\x3b\
-\x0c\x77\x42\xc3\x0e\x99\x1b\x79\x41\x64\x90\x5c\x14\xe6\xbf\x68\
-\xf3\xe6\xcd\xff\xd9\xd4\xd4\x54\x89\x67\x51\x51\xd1\xb5\x47\x1e\
-\x79\x84\x23\xd6\xf6\xcb\x0d\x16\x17\xf8\x90\xa9\xc3\xe1\x70\x38\
-\xc6\x14\x02\x2b\x70\xda\xb4\x69\x1f\x9f\x3b\x77\xee\x3b\x03\x9f\
-\xeb\x96\x5b\x22\x40\x68\x60\xe3\xa6\x4d\x9b\x5a\x44\x88\xed\xba\
-\xde\x7a\xdd\x6b\xe0\x5e\x14\x26\xeb\xa5\x0b\x16\x2c\xf8\x8b\xf8\
-\xf5\x9d\x3c\x9c\xec\x70\x38\x1c\x8e\x71\x84\x80\x04\x4b\x4b\x4b\
-\x5f\xbd\x71\xe3\xc6\xfe\x0d\x1b\x36\xf4\xcc\x98\x31\x83\x15\x9f\
-\x60\x30\x32\x64\x3e\xf0\x97\xae\x5f\x0e\x4a\x82\x12\xbf\xf1\xaa\
-\xe4\xf7\x57\x56\x56\xfe\x56\xdc\x2f\xd1\x30\xac\xc3\xe1\x70\x38\
-\xc6\x21\x92\x91\xc0\x58\x07\x7a\x33\x5c\xb9\x64\xf9\xf2\xe5\xdf\
-\x69\x6b\x6b\xcb\xed\xea\xea\xea\x2f\x2f\x2f\x7f\x4d\x7f\x7f\xff\
-\xd1\xa6\xa6\xa6\x03\xba\x07\x91\x45\xe7\xfb\x6c\x01\xcd\xa1\xb8\
-\x0b\x0f\xab\x86\x41\xdc\x6e\xb9\x2d\xb2\x1e\xbf\x2f\xf9\x13\x3b\
-\x3b\x3b\x7b\xaa\xaa\xaa\xee\x3f\x7b\xf6\xec\x63\x4a\xe3\x19\xdd\
-\x83\x0c\x13\xc5\x75\x38\x1c\x0e\xc7\x38\xc2\x78\x24\x42\x23\xaf\
-\x72\x48\xaa\xbd\xbd\x7d\x66\x7a\x7a\x7a\xaf\x5c\xba\xc8\x2a\xbd\
-\xa2\xa2\xe2\x17\x62\xb1\xd8\xb3\xf5\xf5\xf5\xcc\xfb\xa5\x22\x43\
-\xe6\xfb\x12\x11\x19\x04\xc7\xca\xd2\x7b\x37\x6f\xde\xfc\xfd\xd6\
-\xd6\xd6\x62\x5d\xf7\x65\x64\x64\xa4\x75\x74\x74\xa4\x55\x57\x57\
-\xbf\xec\xdc\xb9\x73\x3f\x90\xdf\x65\x39\xca\xcf\xe7\x0c\x1d\x0e\
-\x87\x63\x1c\x63\xbc\x11\x21\xe4\x15\x2c\x58\x59\xbd\x7a\xf5\x37\
-\xbb\xbb\xbb\x37\x73\x34\x5a\xda\xf5\xe3\xd3\xd2\xc4\x85\xfd\x22\
-\xc3\xb4\xb2\xb2\xb2\xd7\xe8\xfa\x48\x63\x63\xe3\x41\xf9\x27\x23\
-\xc3\x44\x04\x66\x24\x78\xb7\x48\xf0\x7b\x2d\x2d\x2d\x85\xba\xee\
-\x93\x7c\x23\xce\x5e\xa1\x60\xce\x9c\x39\x1b\xce\x9c\x39\xf3\x7f\
-\xf4\xbb\x2d\xee\xef\x70\x38\x1c\x8e\x71\x0a\x1a\xf8\xf1\x84\xc0\
-\x8a\x9b\x3c\x79\xf2\xa7\xf4\xff\x61\x58\x29\x4e\x82\x86\x74\x59\
-\x6e\xfd\xb2\xe2\x32\xaa\xaa\xaa\xfe\x56\xbf\x1f\x94\x63\x88\x73\
-\x28\xf9\x24\x0c\x24\xb8\x76\xc3\x86\x0d\xff\xa7\xb9\xb9\xb9\x50\
-\xb2\x91\x3f\x10\x57\xd7\xc1\xd7\x2a\xda\xda\xda\x96\xaf\x58\xb1\
-\xe2\x2f\xe3\xde\x0e\x87\xc3\xe1\x18\xc7\x18\x4f\x16\x21\x84\xd4\
-\x27\x6b\xef\x97\xe7\xce\x9d\xfb\x05\xe6\xec\x64\xf5\xa1\x7f\xd4\
-\x22\xc3\x32\xec\xeb\xea\xea\xca\x9a\x39\x73\xe6\x03\xe7\xcf\x9f\
-\xdf\x27\xbf\xe3\x72\xc4\x4f\x36\x8c\x19\xc8\x96\x5b\xb5\x71\xe3\
-\x46\xe6\x1c\x2b\x25\x83\x39\xc8\x17\x94\x0f\xc4\x08\x19\xea\xfe\
-\x32\xa5\x91\xd9\xde\xde\xfe\x13\x79\xa7\x92\xed\x70\x38\x1c\x8e\
-\x31\x8c\x01\x6b\x67\xbc\xa0\xb8\xb8\x38\x87\xff\x22\xa3\x60\x88\
-\x94\xeb\x04\x48\x17\x61\xf1\x9d\xc1\x92\xad\x5b\xb7\xfe\x89\x7e\
-\xf3\x9d\x41\x88\x2e\xd9\x30\x66\x30\x74\xba\x7e\xfd\xfa\xcf\xca\
-\x9a\xac\x52\xdc\x2e\xfd\x4c\xd6\x49\xe8\xe7\x7c\xee\xac\xac\xac\
-\x09\x85\x85\x85\xd9\xe6\x17\xff\xef\x70\x38\x1c\x8e\x71\x86\xf1\
-\x64\x11\x42\x36\xe9\x0d\x0d\x0d\x8f\xe7\xe4\xe4\x9c\x2d\x2a\x2a\
-\x7a\x95\x2c\xb2\x09\xb2\xcc\xf0\x8f\x12\x1c\x64\x95\x91\x97\x97\
-\xd7\xbe\x7d\xfb\xf6\xb7\xe9\xf7\x31\xb9\xc1\x2c\xc2\xfe\x73\xe7\
-\xce\x3d\x5d\x53\x53\xf3\x0b\x92\x5b\x20\x32\x4c\x44\x9c\x7d\xbd\
-\xbd\xbd\x7d\xb9\xb9\xb9\x99\x57\xaf\x5e\xfd\xf4\xc9\x93\x27\x7f\
-\x47\x7e\xa9\x08\xd9\xe1\x70\x38\x1c\x63\x1c\xe3\x89\x08\x01\x84\
-\x93\x59\x57\x57\xf7\xb8\x2c\xb2\x53\x15\x15\x15\xaf\x6c\x6f\x6f\
-\x0f\x16\xc9\xc8\xdf\x48\xab\xbf\xa7\xa7\xa7\x4f\x44\x99\xbe\x73\
-\xe7\xce\x77\xe9\x37\x1f\xda\xb5\xa1\xcf\x64\x20\x3e\x61\xce\x9f\
-\x39\x73\xe6\xc4\xac\x59\xb3\x5e\x27\x32\xec\x93\x5c\x64\x9a\x5c\
-\x48\xb0\x5f\xe4\x0a\x09\x7e\xfc\xf8\xf1\xe3\xff\x4d\x7e\x94\x5f\
-\x2a\xb9\x0e\x87\xc3\xe1\x18\xe3\x18\x6f\x44\x08\x20\x9e\x98\x2c\
-\xc3\x7d\x22\xa4\x63\x33\x67\xce\x7c\x65\x67\x67\x67\x06\x16\x1c\
-\xf3\x77\xb2\x04\x7b\xe3\x16\xdb\x1f\x88\x30\x3f\xaf\xb0\x2c\xa6\
-\x89\x1e\x9d\x06\xb9\x45\x2d\xc4\x80\x64\xe5\x9e\x12\xc9\xb6\x97\
-\x94\x94\xbc\xac\xbb\xbb\xdb\x16\xcb\x40\x82\x13\x24\x37\xe3\xd2\
-\xa5\x4b\x1f\x90\x25\xf8\x67\xf1\xb0\x4e\x82\x0e\x87\xc3\x31\xce\
-\x31\x1e\x89\x10\x04\x64\x28\xcb\x6f\xff\xd9\xb3\x67\x8f\xcd\x9e\
-\x3d\xfb\x95\x22\xad\xcc\xfe\xfe\xfe\xee\x8c\x8c\x8c\x58\x7d\x7d\
-\xfd\x3f\x1e\x3b\x76\xec\xbd\x0a\x43\xfe\xa2\x24\x08\xb1\x99\x95\
-\xc7\xff\x30\x19\x22\x37\x43\xf1\xb7\xe7\xe4\xe4\x54\x89\xf8\x56\
-\x23\x53\xe4\x9a\xae\xeb\x74\x91\xe0\x6f\x9c\x3a\x75\xea\x8b\x0a\
-\x63\xdb\x2c\x1c\x0e\x87\xc3\x31\xce\x01\x29\x8c\x55\x40\x62\xa9\
-\xf4\x63\x5b\x04\x84\xf4\xcd\x5d\xbb\x76\xbd\x25\x3f\x3f\x9f\xb3\
-\x43\xb3\x32\x33\x33\x1f\x13\x09\xbe\x9b\x00\x42\xd4\x62\x0b\xac\
-\x3b\xb9\xb2\xb8\xe3\x3a\x9a\x06\x7e\x69\x92\xf1\x9b\xb1\x58\xec\
-\x27\xb2\x04\x63\x22\xc1\x34\x59\x98\xbf\x2e\x12\x64\xcb\xc4\x60\
-\x24\x88\xbc\xf1\xda\xc1\x70\x38\x1c\x0e\xc7\x18\x41\x98\x9c\x52\
-\x91\x21\x80\x98\xc0\xeb\xb7\x6c\xd9\xf2\xac\xfe\x2f\xb8\xfe\xf3\
-\x05\x64\x64\xf3\x7d\x19\x35\x35\x35\xff\xbe\x6c\xd9\xb2\x9f\xea\
-\xda\xce\x13\x8d\xa6\x61\xbf\xab\x24\xf3\xd0\xac\x59\xb3\xde\x17\
-\xff\x6d\x69\x25\xc3\x70\xf4\x76\x38\x1c\x0e\x87\x23\x21\x02\x02\
-\x29\x29\x29\x79\xbb\xfe\x6d\xe1\x5a\x80\x80\x6c\x38\x33\x11\x88\
-\x43\x98\x12\x39\xc2\x45\x49\x28\x20\x40\x2e\xe6\xcc\x99\xf3\x95\
-\xb5\x6b\xd7\x72\x32\x4d\xff\xec\xd9\xb3\xbf\x8e\x9f\x40\xf8\xa8\
-\x7c\x93\x81\x4c\x08\x33\x2a\x33\x0c\xe2\x1a\x49\x6e\x91\xee\xef\
-\x88\x5f\xa7\xd2\xd9\xe1\x70\x38\x1c\x63\x00\x63\x6d\x08\x0f\x7d\
-\x18\x9a\xdc\x22\xb2\xfa\xc3\x8a\x8a\x8a\x7b\xba\xba\xba\x2e\xb4\
-\xb5\xb5\x71\xc8\x75\x2a\x5d\x6d\xd5\x68\x47\xf0\xeb\xf9\xf3\x7e\
-\x00\x92\xea\x15\xf1\x7d\x6a\xf2\xe4\xc9\x1f\x6c\x6f\x6f\xef\xe9\
-\x13\x44\x58\xcb\xb3\xb2\xb2\x8a\xeb\xeb\xeb\xff\x35\x1e\x26\x3c\
-\x94\x8a\x0c\xc8\xaf\x33\x7e\x1d\xbe\x17\x06\xe9\xe2\x7a\x27\x4d\
-\x9a\xf4\xe0\x5d\x77\xdd\xf5\x47\xd3\xa7\x4f\xdf\x72\xfa\xf4\x69\
-\x8e\x77\x3b\x2d\x87\xde\x51\x7d\x1c\x0e\x87\xc3\x31\x46\x30\x96\
-\x88\x10\x32\x81\x6c\xa6\xac\x5b\xb7\xee\xcf\x9b\x9b\x9b\x73\xd8\
-\xae\x30\x75\xea\xd4\xfb\x73\x72\x72\x7a\xeb\xea\xea\xf6\xea\x9e\
-\x59\x6e\x89\x88\x05\xbf\x44\xf7\x20\xb8\x9e\x99\x33\x67\xbe\x67\
-\xca\x94\x29\x7f\x22\x52\xed\xcd\xc8\xc8\xc8\x64\x35\xa8\x48\xb6\
-\x47\x64\xb8\x31\x16\x8b\xb5\x35\x34\x34\x6c\x8f\x87\x8d\x92\x61\
-\xf8\x7f\x14\xa6\x4f\x5f\x4d\x4d\xcd\xbb\x94\xc6\xc7\x45\xb2\xbd\
-\x72\xfd\xd5\xd5\xd5\x2b\xce\x9f\x3f\xff\x63\xdd\x6b\x8e\x87\x71\
-\x38\x1c\x89\xc1\x7c\x7d\x91\x5c\x6b\xf0\xcb\xc1\x08\x54\x95\x1c\
-\x1d\xfb\xe8\x62\xbf\x9b\x05\xda\x3e\xd2\xa4\xe3\x7f\xab\xd2\x1c\
-\x33\x48\x35\xdc\x77\x5b\xb0\x72\xe5\xca\x8f\x75\x77\x77\x4f\xcb\
-\xcc\xcc\xec\x92\x9b\x20\x42\x6c\x2f\x2b\x2b\xfb\xc0\xfc\xf9\xf3\
-\x3f\xad\xdb\x76\x42\x4c\x32\xbd\xa3\x84\x45\x38\x16\xb6\xbc\x56\
-\x84\xfa\x45\x91\x60\xbf\x48\x70\x20\xae\xae\x33\x20\xc6\xaa\xaa\
-\x2a\x4e\x9f\x79\x93\x1c\x61\xa3\xb2\x53\x91\x20\xba\x64\x4b\xb7\
-\x3f\x9a\x38\x71\xe2\xfb\xd1\x55\x22\x27\xa0\x7b\x4f\x4f\xcf\x0c\
-\x59\xb5\x1f\x0d\x42\xde\x19\x80\xcc\x79\x59\x70\xc9\xca\xdf\xe1\
-\x18\x2a\xac\x0e\xbd\x5a\x8e\x2f\xc5\xf0\xe9\xb4\xb7\xe2\x21\xdc\
-\xa9\xf5\x8b\x7c\xd9\x3b\x14\xed\x1c\xdb\x6f\xa6\x62\xbe\x2b\x77\
-\x58\xee\x9b\x72\x74\x10\xc0\xcd\xe8\x4c\x9b\xcc\x7c\xb9\x7f\x92\
-\x23\xcd\xef\xc8\xd1\x31\x01\x37\x23\xcd\x31\x89\xb1\x62\x11\x52\
-\x41\xf8\xf0\xed\x1b\x4b\x4b\x4b\xdf\x26\x12\x69\x96\xc5\x86\x6e\
-\x6c\x96\x9f\x20\x62\x6c\x2f\x2c\x2c\x5c\x95\x9d\x9d\x5d\x53\x5f\
-\x5f\xbf\x53\xfe\xac\x10\x0d\xe2\xc8\x25\x03\xf7\x21\xaa\x7b\xd7\
-\xaf\x5f\xff\x0f\xb2\xd2\x72\x45\x52\x84\x0f\xbf\x64\xc8\x4f\xe3\
-\x8b\x15\xb2\xe6\x5e\x26\x0b\xee\x71\xf9\x0d\x76\x0a\x0d\x30\xd9\
-\x25\xb2\x04\xff\x44\x44\xfd\x40\x47\x47\x47\x83\x08\x10\x7f\x2a\
-\x0f\xfb\x19\x3b\x24\x7b\x91\xf2\xf2\x5c\x6b\x6b\xeb\x53\xf1\x38\
-\xa9\x64\x8e\x75\xa0\x3f\x3d\x45\xb3\x98\x5f\x34\x2f\x89\x63\xd4\
-\x41\xdd\xe1\x5d\xe0\x1d\xff\x86\xdc\x3c\x39\x1a\xe3\x55\x72\x7f\
-\x2d\xc7\x11\x87\x77\x5a\xfd\xb2\xfc\xf0\xfe\xe0\xf8\x1d\xce\xa3\
-\x4d\xa1\xb0\x36\xe2\x37\xf1\x10\x16\xcb\x71\x4e\xf2\x13\x72\x90\
-\xa7\xbd\x7b\xa3\x05\x4b\xf3\x0d\x72\x1f\xc7\x43\x60\xb1\xe1\x39\
-\xb9\x3d\x72\x76\xff\x8e\x07\x8d\xdb\xed\x86\x91\xca\x5d\x22\xa3\
-\x77\x43\x7a\x22\x90\xb0\x5e\x69\x22\xb0\x4c\x88\xa6\xb8\xb8\x98\
-\x6f\x04\xb2\x85\xa1\x52\xce\x2a\x53\x32\x04\xf7\x24\x93\x07\x5b\
-\xcc\x7e\x40\xfd\x4f\x94\xdf\x34\xee\x29\xc9\x82\x78\xd8\xc0\x2f\
-\xfe\x3f\x11\xb8\x47\xda\x93\xa5\xcb\x97\x8a\x8a\x8a\xee\x11\x91\
-\x36\xa0\x63\xfc\x5e\x00\xf2\x20\x12\x6c\xab\xae\xae\x7e\x8f\x7e\
-\xde\x25\x47\x9c\xb1\x50\xde\x23\x05\xd6\xf8\x07\xe4\xbe\x24\xb7\
-\x4c\x8e\x17\x24\x55\x39\x39\x1c\x83\x81\x3a\x55\x7a\xfd\x32\xa8\
-\x4f\x05\x72\xc1\x59\xc2\x77\x18\x78\x4f\xc8\xdf\x12\x39\xf6\x21\
-\x33\xba\x35\x29\xee\x67\xef\x90\xfd\x2f\x8f\xff\xb7\xe1\x49\x2c\
-\xc4\x9b\x8d\x8a\xf8\x7f\x23\xda\x89\xf1\xff\x2f\x1a\x8c\x99\x86\
-\xb9\xaa\xaa\x6a\xa5\x2c\xaa\xa9\xbd\xbd\xbd\x09\xf7\xe8\x89\x57\
-\xd8\x30\xdf\xd8\xd0\xd0\xb0\x5c\x04\xf4\x55\x79\xf1\xb0\x52\x35\
-\xc6\x54\xa4\xb4\xd3\xa7\x4f\x7f\xe9\xc2\x85\x0b\x7f\x90\x9f\x9f\
-\x1f\x4b\x24\x1b\x3f\xee\x29\xcc\x67\x14\x96\x4a\x8a\xbc\x64\x63\
-\xe4\x56\xa1\xcb\xb6\x6c\xd9\xf2\x55\xe9\x52\x8b\x4e\xe8\x16\xdc\
-\x8d\x40\xb2\x7b\x63\xb1\x58\xd5\xb4\x69\xd3\xe8\xe9\x8e\x77\xfc\
-\x8d\x1c\x27\xf5\x40\xec\x7c\x8b\x71\xb0\xf2\x77\x38\x06\x03\xf5\
-\x07\x07\xa8\x47\xf6\x7e\xdd\x49\xb0\x3c\x4d\x95\xfb\x91\xdc\x6f\
-\xc8\xfd\x9e\xdc\x3f\xc8\x81\x68\x7e\x8d\x8c\xac\x6d\xbe\x15\xe5\
-\x61\xed\x9d\xa5\x99\xac\xfd\xbb\x63\x31\x16\x88\x30\xb0\xec\xce\
-\x9f\x3f\xff\xf5\x13\x27\x4e\x7c\x5a\xa4\x94\x2f\xab\x10\xbd\xac\
-\x42\x0c\x20\x4d\x10\xb1\xf4\xeb\x3e\xa6\x7b\xd3\x75\xdf\x94\xa0\
-\x12\xa5\x8b\xe0\x7e\x4f\xf2\xbf\x24\xd1\x99\x7d\x7d\x7d\x03\x64\
-\xc8\x75\x4e\x4e\x4e\xe6\xb9\x73\xe7\xfe\x46\x61\x18\x1a\x20\xdd\
-\xa1\x54\xbc\xa6\xae\xae\xae\xb3\xe8\x82\x4e\x71\xbf\x30\x7a\xa5\
-\x63\x46\x41\x41\x41\xfe\xa9\x53\xa7\x3e\x29\xf9\x5f\x93\x1f\xe1\
-\x5e\x90\xa7\x71\x84\x37\xcb\xf1\x82\x30\x6c\x35\x57\xae\x46\x0e\
-\x8c\x85\x3a\xe4\x18\x9f\x30\xf2\x33\x24\x7a\x97\xc6\x3b\xec\xfd\
-\xd8\x20\x07\x19\xb2\x20\x88\x36\x68\xb5\x5c\xa2\x77\xe8\x76\x94\
-\x41\x34\xcd\x3b\xf1\x39\xa4\xc4\x58\x69\xc4\x20\x9f\xb4\x8b\x17\
-\x2f\x7e\x5d\xa4\xf1\xd1\x92\x92\x92\x7e\x19\x53\x0c\x9b\x84\x7b\
-\x26\x9c\xf7\x99\x23\xf2\xb9\xb0\x7b\xf7\x6e\x86\x16\x18\xea\xe4\
-\x81\x0d\x85\xb8\x20\xc3\xf7\x4a\xf6\x37\x15\x1f\xcb\xb2\x47\x2e\
-\x58\x3d\xda\xdc\xdc\xfc\xfd\x33\x67\xce\x70\x12\xcd\x50\x1e\x7e\
-\xa0\xa7\x5c\x8f\x74\xf8\xfd\xac\xac\xac\x8b\xe8\xa4\xdf\x61\x82\
-\xeb\xc1\x4f\x79\xe8\x56\x9a\x1f\x14\x01\xff\xbd\xfc\x86\xaa\xe7\
-\x58\x06\x79\xa4\xbe\xd8\x21\x04\xe3\x99\xd4\x1d\x8e\x5b\x05\x7b\
-\xef\x9f\x96\x63\x6d\x03\x73\xa1\x8c\x20\x9d\x91\xa3\x43\x0f\xc6\
-\x7b\xdb\x30\xee\x31\xd6\x7a\xf3\x99\x67\xcf\x9e\xfd\xc1\x23\x8f\
-\x3c\xf2\x6e\x91\xcc\x35\x91\x55\x0e\xa4\xc5\x8d\x9e\x9e\x9e\xb4\
-\xa2\xa2\xa2\x9e\x47\x1f\x7d\xf4\xf7\xf5\xf3\xa2\x5c\x74\x22\x17\
-\xb2\xc1\x2f\x8a\x81\x06\x5b\x84\xf7\xd6\xf4\xf4\xf4\x7f\x95\x4c\
-\x2c\xc3\x0c\x59\x83\x3f\x3b\x7c\xf8\x30\xab\x45\x21\x5c\xe2\x27\
-\x6a\xdc\x91\x19\x2e\x27\xd2\xc4\xef\x12\x84\x5c\x58\x58\xd8\x8b\
-\x6e\xc1\x0d\xe9\x2a\xb9\x79\xb9\xb9\xb9\x17\x94\x87\x77\x88\x04\
-\xff\x5d\xde\x09\x87\x4d\xc7\x21\x28\x83\x20\x9f\x0e\x87\x63\xc8\
-\xa0\x4d\xe1\xbd\x39\x24\xf7\x16\xb9\x5d\x72\x0c\x91\xfe\x8a\x1c\
-\xdb\x23\x78\xaf\x9c\x08\x6f\x33\xc6\x12\x11\x52\x19\x20\x3d\x88\
-\xe3\x31\xe1\x5d\x22\xaa\x13\x22\x97\x02\x91\x4b\xa7\x88\xb1\xe0\
-\xd4\xa9\x53\x9c\x04\xc3\x7e\x3f\xf4\x0e\x5b\x8b\x54\x34\x1c\x7e\
-\x89\x1a\x6c\x2a\x23\xe4\xd5\x29\x22\x7d\x63\x5e\x5e\xde\x53\x05\
-\x05\x05\x47\x77\xec\xd8\xf1\x3a\xf9\xb5\xc4\xef\x25\x22\x41\x4b\
-\x07\xdd\xc2\x32\x2d\x9d\xed\xb2\xfa\xbe\x86\x6e\xe8\x88\xae\x22\
-\xc1\x67\x44\x90\xbf\xa6\x7b\x6c\xa8\x27\x2f\xe4\xc9\x2b\xba\xc3\
-\xf1\xe2\x85\xb5\x1f\xff\x22\xc7\x10\xe9\x03\x72\x4f\xca\x81\x44\
-\xed\x8e\xe3\x16\xe3\x76\x11\xa1\x11\x57\x22\x40\x1c\x10\xd3\xb1\
-\x5d\xbb\x76\xfd\x9a\x08\xeb\x89\x8c\x8c\x8c\x6a\x59\x72\x7b\x64\
-\x2d\xfe\x95\xfc\x89\x17\x26\x16\xfb\x3d\x79\xfa\xf4\xe9\x10\x9b\
-\x55\xac\xa8\x7c\xc8\x0b\xb9\xf5\x3b\x77\xee\x7c\xad\x48\x90\xfd\
-\x4b\x57\xe3\x7e\x61\x52\x35\x50\x36\x7d\xf9\xf9\xf9\x0f\xeb\xff\
-\x22\x39\xd2\x08\x97\x57\x50\xb9\xd1\x49\xfa\xed\x91\x9b\xa5\xb0\
-\xfb\xa4\x33\xc3\xac\x0c\x7b\x20\x37\xb0\x66\x13\x00\xdd\x6e\x57\
-\xd9\x3b\x1c\x8e\x5b\x0f\xda\x0b\xda\x04\xde\x7b\xfe\xe3\x1c\x2f\
-\x62\x18\x41\x0d\x46\x06\x56\x51\x8a\xee\xbe\xfb\xee\x3f\xd6\x7f\
-\xf6\xd4\x80\x68\x9c\x40\x5e\x4d\x4d\xcd\xe7\x36\x6d\xda\x74\x6e\
-\xc1\x82\x05\x1f\x0c\x7c\xaf\xfb\x5b\x5a\x61\x10\xdf\xee\x25\x4b\
-\x3f\xf0\xbf\xeb\xae\xbb\xde\xbc\x71\xe3\xc6\x63\x5b\xb6\x6c\xa1\
-\x27\x57\x88\x9f\x10\x96\x69\xf1\x17\xdf\x73\xcf\x3d\x9f\xd1\x7f\
-\xdb\xfc\x9a\xaa\x92\x87\xe3\x27\xd2\x6f\xac\x82\x17\x19\x47\x47\
-\x83\xff\x4c\xf6\x03\x7f\xa1\x1d\xc3\x85\xd5\xfb\x5c\xb9\x53\x72\
-\x56\xb7\x1a\xe5\x6c\x3b\xc5\x78\x7a\x37\x86\x83\x64\xf9\xb2\x29\
-\x94\x4f\xca\x51\x16\x0c\x9b\xf2\xdf\xda\xb3\x9b\x31\xc5\x62\xef\
-\x2e\x69\x90\x96\x1d\x27\xf9\xbb\x72\xe0\x45\xf3\x6e\x27\x23\x82\
-\x9b\x05\x2a\x41\xff\xc4\x89\x13\x57\xea\xff\x14\x39\x1b\xb2\x4c\
-\x04\x1b\x7e\x6c\xfe\xd9\xcf\x7e\xf6\x31\xfd\x67\x8c\x9d\xf8\xe1\
-\xa1\x04\xee\xf7\x2f\x5c\xb8\xf0\xfd\x93\x26\x4d\x7a\xa8\xa1\xa1\
-\xe1\x6c\x49\x49\xc9\xbb\x45\x60\x9f\x92\xbf\x55\xb8\x68\xc5\x23\
-\x3e\x7e\xc4\x0d\xcb\x02\xf8\x07\x69\x2c\x5e\xbc\xf8\x37\x65\x8d\
-\x7e\xa2\xa9\xa9\xe9\x5a\x5b\x5b\xdb\xe2\x79\xf3\xe6\x51\x41\x41\
-\x58\x9e\xc9\x3a\xf4\xd3\x9f\xfe\xf4\xb7\xf5\x9f\xe3\xd4\x90\x9b\
-\xc8\xc2\x04\xe4\x95\x8a\xb6\x40\x16\xee\xa6\xf8\x75\x58\xde\x9d\
-\x00\xf2\x3f\xd2\x3c\x11\x8f\x17\xde\x64\x84\x1d\x7e\xdc\xe3\x7a\
-\xb8\x30\x79\x89\x74\xe3\x37\xcf\x65\xb4\xd3\x8c\x02\x59\xa4\x63\
-\xb2\x07\x03\xe1\x6f\x04\xa6\x7b\xa2\x7c\xa1\x47\xb2\xf7\x6e\x30\
-\x10\xdf\x64\x26\xd2\xd1\xd2\x0d\xa7\x67\xe1\x47\x02\xd3\x35\x2c\
-\xcf\x64\x5a\xfe\x86\x0b\xd3\xe7\x46\xf4\x0a\x23\x2c\x2b\x95\x3e\
-\x76\x6f\xb4\xd2\x4d\x04\xe4\xde\x8c\x32\x1b\x0c\xc8\x24\x4d\xcb\
-\x5b\xd8\x99\x3e\xc3\x85\xe9\x6c\xff\xa3\xc0\x2f\x5a\xc7\xed\x7a\
-\x58\x48\x24\xfc\x66\x01\xe5\x68\xf8\xcb\x17\x2d\x5a\xf4\xe7\xcb\
-\x96\x2d\xfb\x1f\xba\x9e\x2d\x67\x43\x96\x89\x10\x26\x2d\x40\x7c\
-\x03\x7e\xdc\x7f\x50\xc4\xfa\xce\xd6\xd6\xd6\xc6\xec\xec\xec\xcc\
-\xf6\xf6\xf6\x3a\x11\xd8\x9b\x44\x86\x7f\xa0\x7b\x56\x20\xd1\x82\
-\x21\x5e\x94\xac\x2c\x4c\xbf\x48\xf0\x63\xf9\xf9\xf9\xef\xed\xe8\
-\xe8\x68\x8a\xc5\x62\x19\x3d\x3d\x3d\x8d\x4a\xe3\xe1\xb9\x73\xe7\
-\x32\xf7\x47\xdc\x70\xb9\x99\x4e\xf6\x00\xb8\x1f\x85\xe5\x81\x34\
-\xd7\xca\x72\xfd\xaa\x2c\x4d\x16\xfd\x70\x94\xd1\x9d\x46\x86\x89\
-\xf2\x3f\x18\x28\x1b\x1c\x65\xc1\x70\x32\x32\xb8\x0e\x3b\xfc\x6c\
-\xbe\xd5\xca\x7a\xa8\x30\x79\xf6\x1f\x20\x83\x7a\xc7\x6f\x9e\xcb\
-\x68\xa7\x19\x06\x71\x91\x45\x3a\x26\x7b\x30\x10\x7e\x24\x30\x3d\
-\x4d\xf7\x44\xf9\x42\x0f\x1c\xe1\x86\xdb\x40\x11\xdf\x64\x86\x75\
-\x8c\xa6\x1b\x4e\xcf\xc2\x0f\x07\xe8\x85\x3c\xd3\x35\x2c\xcf\x64\
-\x5a\xfe\x08\x47\xfa\x43\x85\xe9\x33\x12\xbd\x12\x21\x2c\x8b\xff\
-\xc9\x30\xda\xe9\x86\x61\xcf\x12\xb9\x43\x29\x33\xca\x6b\x38\x65\
-\x96\x0c\x26\x07\x99\xa4\x69\x79\x0b\x3b\xd3\x07\xd8\x73\x1d\x2a\
-\x4c\x1e\xff\x2d\x5e\x38\xcd\x68\x1d\xb7\xeb\x61\x61\x38\x0a\xdd\
-\x28\x02\xc5\x6b\x6a\x6a\x3e\x51\x5c\x5c\xfc\xa6\xbe\xbe\xbe\xee\
-\xc2\xc2\xc2\x96\x6d\xdb\xb6\xb1\xb9\x94\xc3\xa9\xb9\x6f\x99\x19\
-\x0c\x56\x08\xf3\x36\x6c\xd8\xf0\xbf\x5b\x5a\x5a\x72\x33\x33\x33\
-\x07\x4e\x8e\xe9\xed\xed\x65\x7f\xe0\x44\x91\xe3\x3f\x3f\xf5\xd4\
-\x53\x98\xf9\x3c\x04\xf2\x3a\xa8\xec\x38\x09\xbe\x5d\x24\x58\x97\
-\x71\xfd\x5c\xd2\x20\x9e\xc8\x70\x82\xfc\xb3\x76\xed\xda\xc5\x86\
-\xd8\x6d\x72\xa6\xc3\x60\x08\x74\x12\xfa\xaa\xab\xab\xdf\x54\x59\
-\x59\xf9\x11\x0e\xe6\xce\xca\xca\xca\xbd\x7a\xf5\xea\xd7\x4f\x9d\
-\x3a\xc5\x90\xea\x50\x65\xdd\x4e\x44\xcb\x8e\xa3\x9f\xd8\x13\x65\
-\xf9\x03\x84\xe1\x4b\x1e\x3c\x53\x86\x76\x86\x52\xe6\xc4\x27\x0c\
-\x8e\x53\x35\xee\x91\x5b\x27\xb7\x50\xce\x86\xa3\xeb\xe5\x38\x07\
-\x71\x87\x1c\x65\xdf\x20\x87\x6c\x5c\xaa\x72\xb3\x72\xfd\x55\x39\
-\x0e\x02\x60\xa1\x15\xa3\x0b\xb6\x5a\x8f\x7b\x74\x46\xee\x96\x63\
-\x11\x03\x69\x16\xcb\xa1\x0b\xfb\x54\x49\x93\x23\xfd\x7e\x2e\x57\
-\x27\x37\x94\x34\xa3\xb0\x74\x38\x49\xe4\x17\xe5\x5e\x22\x37\x4d\
-\x8e\x65\xf4\xc8\x4a\x04\xc2\x73\x68\xc1\x1f\xc9\x0d\x56\x7e\x86\
-\xa8\x6e\x1c\x5b\x46\x59\x32\x84\x4d\x87\xd3\xce\xe9\x65\xc5\x35\
-\x0b\x35\x28\xc7\x47\xe5\x68\x48\xc2\xcf\x20\x19\x90\xcd\xfd\x3c\
-\x39\xf4\x62\x44\xe3\xcb\x72\x1c\x6e\x41\xe3\x86\x6c\xee\xcf\x91\
-\x23\x8f\x96\x2e\xcf\xf0\x31\x39\x1b\x31\xb1\x3c\x13\x96\xa1\x51\
-\xb6\x15\xcc\xc4\x43\xa0\xcc\x89\xf3\x5c\xf0\xeb\xba\x5c\x0e\xa3\
-\xe0\xf9\xd4\xca\xb1\x0f\x0f\x3f\xf6\xb2\x32\xa4\x8a\x5c\xbe\x2b\
-\x7a\x44\x0e\x0c\x96\x0f\xcb\xc3\x7b\xe5\xde\x26\xf7\x1f\x72\xd4\
-\x55\x3b\xd2\x2d\x59\xbc\x64\xb0\x38\xd4\x19\xce\x2b\x46\xc7\xbf\
-\x90\xfb\x47\xb9\xb0\x3c\xab\x03\xd4\x31\xca\xee\x8a\x1c\xc3\x91\
-\x6c\x9f\xb0\x70\x58\x36\x3c\x0b\x46\x9e\x18\xd1\x62\x98\x32\x5b\
-\xee\x43\x72\x1c\x64\x61\xf7\x13\x21\x9c\x6f\xea\xd5\x7a\x39\x3e\
-\x61\xc7\x49\x36\xd4\x3b\xd2\x68\x93\x3b\x2a\xb7\x5b\xee\x67\x72\
-\xa4\x6d\x32\xd1\xe5\x73\x72\x94\x03\xf5\x84\x32\xc1\x90\xa0\xac\
-\x8d\xc0\x12\x21\x9c\xee\x2c\x39\x7b\xee\xec\x8f\xb4\x6d\x65\xe4\
-\x95\x73\x64\x79\x87\x58\x31\x1b\x3e\x3e\x8f\x78\x89\x60\x65\xc2\
-\x56\x2d\x74\x61\x71\xd1\xdf\xc9\x51\xb6\xe1\x34\xa7\xcb\x91\x26\
-\xed\x05\xf5\x86\xe7\x40\x5d\x20\x3f\xbc\xaf\x43\x86\x29\x74\xb3\
-\x61\x15\x81\x53\x61\xfe\x57\x63\x63\x23\x7b\xf8\xd8\x6a\x90\x93\
-\x97\x97\x17\x13\x21\xfc\xe5\xb1\x63\xc7\xb0\x10\x07\x2b\x20\x60\
-\x85\x54\xb2\x7a\xf5\xea\xbf\x16\xe9\xb1\x90\x85\x87\xcc\x43\x1b\
-\x40\x9c\x0c\xcb\x44\x86\xdf\x15\x19\x52\xb9\xd8\xc3\x63\x71\x13\
-\x21\x63\xe9\xd2\xa5\x1f\xcf\xcd\xcd\x7d\x33\xc7\xb9\x85\x48\xd0\
-\xc0\x3e\xc6\xac\xa2\xa2\xa2\x7a\xb6\x46\xe8\x37\x44\x60\xf9\x4a\
-\x06\xbb\x9f\x03\xc1\x2a\xee\x1b\xa4\x4f\xb3\x64\x4b\x54\x6f\x86\
-\xf2\x9e\x26\x62\xa5\x91\xe6\xd0\xe1\xc1\x64\xdd\x6e\xa4\x7a\x26\
-\x06\x5e\x1a\x9e\x03\x15\xf1\xcf\xe3\xd7\xa9\x5e\x24\xbb\x3f\x59\
-\xee\xc3\x72\x2c\x2f\x87\x0c\x49\x2b\x5a\x37\xcd\xef\xbc\x1c\xe7\
-\x51\x7e\x41\x8e\x86\x33\x59\x1a\x56\x9e\x34\xa4\xbc\xfc\xc4\xc5\
-\x8f\x06\x99\x39\x67\xd2\xe1\x4c\x47\xce\x76\xe4\xc8\xbe\x54\x69\
-\x5e\x92\xe3\x64\x1d\x5e\x44\x5e\xb0\xc1\xf2\x65\x30\x1d\xfe\x8b\
-\x1c\x47\x03\x32\x1d\x90\x28\x9d\x28\x88\x43\x5c\xca\x83\x06\x60\
-\xb0\xf4\x90\x87\x23\xde\x0a\x39\x3a\x7f\xf7\xcb\xd1\x18\x25\x4b\
-\x8f\xb0\xd4\xbb\xcf\xca\x71\xe0\x72\x58\x46\x22\x98\x0e\x1c\x24\
-\x4f\xf9\x71\x8d\x8e\x34\x42\x9c\x4b\xc9\xb1\x7b\x1c\x4a\xc1\xe2\
-\x32\x08\xce\xd2\x25\x1c\x71\x69\x58\x69\xd4\xb8\x26\x0d\xee\x47\
-\x89\x10\xa2\xac\x96\xa3\x8c\x5f\x23\x47\xa7\x85\x69\x14\xe2\x44\
-\x61\xf2\xe9\xd4\x40\x68\xff\x4d\x0e\x3d\xd0\x89\x7b\xb8\x30\x4c\
-\xff\xad\x72\x10\x81\xe9\xf5\xeb\x72\x2c\xc2\xb3\xfb\xc3\x81\x11\
-\x09\x9d\x59\x74\x25\x4d\xda\x19\xea\x1c\xf9\x0a\xeb\x42\x87\x80\
-\x33\x43\xe9\x28\x80\x6f\xc9\xbd\x56\xce\xea\xc8\x48\x89\xd0\xe2\
-\x43\x60\xff\x55\x8e\x3a\x6d\x1b\xf5\xa3\x40\x0f\xca\x8c\xb9\x58\
-\x3a\x5a\x7f\x2a\xc7\xc7\xcc\x7f\x2b\x7e\x3d\x54\x22\x44\x06\xe9\
-\x72\x8f\xce\x23\xf5\xed\x95\x72\x90\xb0\xa5\x11\x05\xfe\x74\x2c\
-\x21\x5c\xea\x34\x79\x31\xdd\xa3\xb0\x74\x79\x37\xe9\x68\x11\x96\
-\xfc\x53\xa7\xff\x4d\x6e\xbe\x1c\xf5\x90\xf2\xa3\x5c\x2d\x4d\x7b\
-\xa6\x5f\x91\x63\xf4\x6e\xc8\x40\x91\x5b\x81\x20\xb3\xcb\x96\x2d\
-\x7b\x8f\xac\xb7\x98\xac\xb7\xbe\xb4\xb4\xb4\x4c\x11\x42\x27\xc4\
-\x50\x56\x56\xf6\x3e\x91\x10\x0f\x82\xb3\x06\x93\x15\xa4\xc1\xee\
-\x2d\x10\x69\xdd\xd5\xdd\xdd\x4d\x85\x79\x41\x3e\x20\xb2\xb6\xb6\
-\xb6\xe6\x92\x92\x12\x7a\x46\x76\x96\x5e\x22\x98\xbc\x62\x59\x7c\
-\x77\x2b\x0e\x5f\x90\xc0\x2f\xaa\x43\x9a\x88\x9b\x97\x8e\x97\x96\
-\xb3\x43\xc1\x60\x7a\x92\xef\xaa\x15\x2b\x56\xfc\x75\x76\x76\xf6\
-\x2f\x29\xef\x58\x99\xe4\x4f\xff\x32\x7a\x45\xb8\xd9\xba\xf7\x2e\
-\x02\x0b\x89\x2a\xc4\x58\x06\x95\x8e\x0a\x1a\x76\xf6\xd2\x40\x6c\
-\x83\xc1\x2a\x3b\x0d\x27\x0d\x04\x2f\x3c\xbd\x57\x5e\x46\x9e\x29\
-\x16\xbe\xc9\xe5\x1a\x3f\xae\xb1\x0a\x18\x56\xc6\x1a\xa0\xe7\x6b\
-\x95\x3f\x0a\xab\x13\x3c\x2f\xee\xd3\x59\x02\x34\x12\x34\xae\xa4\
-\xf9\x3b\x72\xe8\x6a\xf2\xa3\x69\xa2\x0b\xff\x09\xc3\xcb\xce\xa1\
-\xec\xf4\x40\x93\xa5\x19\x86\xbd\xe4\x34\x4e\x34\x7a\x90\xa0\xc9\
-\xb4\x34\x52\x39\x40\x5e\xc1\x60\xf5\x0c\x50\xaf\x68\xc0\xe8\x75\
-\xb3\x22\x9a\x46\xd4\xf2\x14\xcd\x17\xfe\x84\xc7\x82\xe1\x0b\x07\
-\xff\x4f\x8e\x3c\xa2\x6f\xb2\x36\x81\xf0\xc0\x1a\x59\xeb\xd9\x53\
-\xbe\xd4\x61\x9e\x07\xab\xb6\x21\xdf\x68\xba\x20\xd5\x3b\x68\x20\
-\x3c\xbd\x7a\x2c\xaa\x6f\xcb\xd9\x82\x2c\xe4\x85\xcb\xcd\x64\xe3\
-\x4f\x3e\xa9\x43\x8c\x16\xfc\xa1\x9c\x95\x47\xb4\xcc\xec\x37\x96\
-\x32\xe0\x5d\x06\x9c\x92\x34\x52\xd8\x3b\x6b\x65\x82\x4c\x2c\x66\
-\xac\x23\x40\x9a\x96\x2e\x8b\x80\xb0\x5a\xc8\x07\xb0\xc5\x7f\x37\
-\xf2\xde\x53\x07\x89\x0f\x19\x31\xda\xf1\xdf\xe5\x20\x5a\xca\x08\
-\x5d\xac\xfc\xad\xcc\x48\x1b\xc7\xa2\xbe\x77\xca\xed\x93\xfb\x05\
-\x39\x7b\x37\x86\x02\xcb\x0f\xef\x00\x1d\x5e\x64\x70\x68\x37\xf9\
-\x36\xf9\x96\xa6\xa5\xcb\x73\x42\x4f\x8c\x96\xff\x25\x07\x99\xd1\
-\xe1\x49\x55\xdf\x80\x9d\xfd\x6c\x65\xc6\x67\xa2\x5e\x2f\x47\x9a\
-\x58\xf4\xf0\x05\xf7\xac\x3e\x90\x1e\x98\x11\xff\x3f\x64\xa4\x52\
-\x62\xb4\x60\x69\x3c\x24\x0b\x68\x9d\xc8\x24\x3c\x9c\x96\x21\x52\
-\xcc\xe0\xd0\xea\x58\x2c\xf6\xa0\x48\x01\x26\x27\x13\xa9\xc8\xd0\
-\x0a\x6f\xf7\x91\x23\x47\x3e\x2e\x2b\x2b\xa7\xa7\xa7\x87\x0a\x61\
-\x2f\x2a\xe8\x57\x3a\x6c\xc0\xcf\x3e\x7b\xf6\xec\x27\xf4\x9b\x0f\
-\xe4\x12\x27\x1c\xc6\x80\x1f\xf7\xea\x64\x9d\x7d\xac\xb4\xb4\x94\
-\x61\xd0\x17\xc8\x63\x68\x54\xf2\x4a\x9f\x7d\xf6\x59\x08\xfb\xfb\
-\x72\xe8\x67\x0d\x7f\x14\xdc\x23\xfe\x8a\x4d\x9b\x36\xfd\xad\x74\
-\x59\x21\x0b\x90\xaf\x53\x60\xea\x5b\xbe\x32\x28\x0b\x11\xe4\x46\
-\x5d\x3f\x78\xdd\x6b\xa0\x5c\xc6\x03\x28\x23\x7a\x69\xe6\xf8\x4d\
-\x6f\x92\x45\x4d\x0c\x99\x81\x44\xe5\x0d\xc8\x27\x65\xc7\x10\x15\
-\x65\x09\x49\x50\xa1\xf1\x43\x06\x8d\x29\x65\x65\xb2\xb9\xc6\x8f\
-\x6b\x7b\xb9\x68\xd0\x18\x16\x63\xb8\x31\x15\x31\xd9\x33\xa2\xc1\
-\x04\xf7\xc9\x31\x14\xcf\x4b\x65\x2f\x8f\xc9\x8f\xa6\x49\x1c\xfe\
-\x5b\x9a\xbc\xbc\xbc\xc4\x6c\x86\x4e\x95\x26\xf9\xa3\x9e\x62\x9d\
-\x61\x09\x02\x64\x20\x17\x99\x96\x46\x22\x67\xe5\xc8\x90\xec\xff\
-\x94\x03\x96\x87\x28\xac\x9e\xa1\x23\x27\x18\x71\xe2\x12\xf1\xad\
-\xe1\x21\x2d\x64\x25\xca\x17\x3a\x5a\xfe\xa9\x7f\x0c\x95\xd2\xd3\
-\x1e\xac\x71\xb2\x67\x8a\x5c\xf4\xc2\x72\x20\x8f\xc8\x8d\xa6\x4b\
-\x7a\x5c\x9f\x94\xc3\xea\x02\xc9\xea\x04\xe0\x19\x70\x08\x05\x8d\
-\x1d\xb2\xd1\x0f\x5d\xc2\xf2\x2c\x0f\xfc\xc6\x9f\xf4\xa8\x3b\x94\
-\x05\x16\x29\xd6\x2d\x72\x48\xc7\xde\xb5\x30\x90\x09\x90\x01\x52\
-\xe9\x33\x54\xa0\x03\x30\x99\x94\x69\x14\xa4\x43\x38\x0b\x63\x7a\
-\x8c\x14\x3c\x67\xca\x88\x8e\x3e\x9d\x00\x3a\x0d\x56\x4f\x29\xa3\
-\x64\xf5\xd9\x9e\x1b\x65\x06\x91\x50\x6f\xde\x2f\x07\x52\x3d\x77\
-\x10\x2e\x4f\xde\x71\xac\x3b\xe4\x21\x8b\xbc\xd9\x33\xb1\x34\xc3\
-\xe9\x5a\x7d\xc3\xd1\x99\xa4\xbe\xd1\x21\x25\x5e\xb2\x74\xad\x8c\
-\x88\x0f\x3e\x22\xf7\xbf\xe5\x8c\x74\xc9\x07\x69\xe2\x48\x8b\x70\
-\x97\xe5\x18\x1d\x18\x16\x06\xcb\xf8\x68\x20\xa8\x24\x4b\x96\x2c\
-\x79\x87\xc8\x24\x96\x9e\x9e\x6e\x95\xc6\xc0\xd7\x25\x38\x10\xbb\
-\x51\x6e\xf1\x96\x2d\x5b\xc8\xe8\x60\x43\x48\xc8\xc8\xb8\x72\xe5\
-\xca\xf7\x45\x4c\xbf\x5b\x58\x58\x48\x7c\xf2\x12\x54\x6a\x11\x4c\
-\x5f\x56\x56\x56\xf1\x89\x13\x27\xbe\x7c\xfa\xf4\x69\x9b\x7f\x8c\
-\xa6\x1b\x86\x3d\x8c\xc7\x24\xef\x2f\x64\x19\xb2\x41\xde\x5e\x90\
-\x80\x04\x95\x46\xd1\xf1\xe3\xc7\xff\xe2\xd2\xa5\x4b\x36\x84\x9b\
-\xec\x05\x32\x3d\xe6\x6f\xde\xbc\xf9\x2b\x0d\x0d\x0d\xe5\xb2\x7e\
-\x5b\x94\x6f\x7b\x01\xc2\xe8\x93\xec\xbc\xc5\x8b\x17\xd3\xa3\x0a\
-\x7e\xc7\xff\x8f\x65\x58\xbe\xd1\x99\xde\x27\x43\x62\xcc\x45\x2c\
-\x95\xa3\x97\x0b\xb1\x33\x7f\x03\x12\xe5\x87\x17\x18\x7f\x86\x2e\
-\xe8\xc1\xda\xcb\x61\x2f\x0e\xf3\x09\x58\x5f\x10\x96\xc9\x7d\x85\
-\x1c\x73\x2b\x7c\x22\x8b\x72\x44\x06\x2f\x02\xe1\xf9\x8c\x0f\x16\
-\x10\x2f\x05\xfe\x51\x58\x1d\xb2\xff\x58\x30\x34\x00\x96\x26\xf2\
-\x20\x6f\x86\xa4\x5e\x26\x67\x69\xbe\x5c\x8e\x21\x2a\x86\xb8\x2c\
-\x4d\x7b\x31\xa9\xa3\x58\x3f\xc9\xd2\x34\xd0\x09\x23\xae\xa5\xc5\
-\x90\x14\x2f\x33\xf2\x49\x27\x91\xe3\x1e\x23\x0e\xa4\x7f\x4d\x0e\
-\x24\xab\x6b\x06\x08\xf3\x8d\x72\x58\x01\x84\xa5\x41\xe0\x3f\xf3\
-\xb5\xec\x6b\xc5\x72\x46\x26\xc4\xfc\x4b\x72\x0c\x37\x31\xef\x4a\
-\x03\x42\xb9\x40\x60\x58\x46\x3f\x94\xa3\x7c\xec\x7d\x48\x05\xe4\
-\x93\x77\x3a\x24\x84\xa7\x11\x26\x5d\xe4\x31\x54\xc9\x9c\x2c\xf3\
-\x88\xd4\x09\x1a\x3c\x9e\x2b\xf7\x92\xd5\x71\xfc\x69\xe0\xa8\x53\
-\x3c\x5b\x80\x7e\x94\xd9\xdf\xca\x51\xdf\x90\x43\x3e\xc8\x0f\x96\
-\x36\x96\xac\x35\x86\xe8\x43\x3e\xb0\x70\x18\x7a\xb3\xe7\x1d\x45\
-\xd4\x3f\x59\xb8\xe1\x20\x5a\x56\x43\x49\xfb\x46\xd2\x25\x3d\xf2\
-\x4d\x39\xd0\x91\xc4\xda\xa4\xcc\xf0\xa7\x2c\x98\x3e\x60\x6a\x82\
-\xe1\x4a\xde\x4f\x9e\x01\x43\xc2\x58\x70\x74\xb0\xac\xde\xf3\xcc\
-\x78\x86\xc3\xb1\x8a\x29\x67\x3a\x3e\xbc\xbf\xd6\xf1\x21\x4d\xd2\
-\xa6\x63\xfa\x3e\x39\x9e\x3b\xcf\x69\xb9\x1c\xcf\x83\x36\x93\x3d\
-\xdb\x16\x8e\x78\xcc\xef\xfd\x5f\x39\xac\xd9\x64\xf5\x2d\x5a\x46\
-\x74\xd4\x08\x87\xde\xc8\x42\x77\x08\x95\xaf\xe2\xd8\x9c\x28\xef\
-\x0f\x1d\x83\x61\x21\x51\xe2\xa3\x8d\x20\x33\x07\x0f\x1e\xa4\x21\
-\x3b\x2d\x42\x28\x15\x69\xf1\x10\x9f\x07\xf9\x33\x5c\x38\xa1\xb5\
-\xb5\x95\x31\x6b\x26\x58\x07\x03\x32\x62\x22\xc3\xef\xc8\x32\xfc\
-\x44\x41\x41\x41\x4c\xa4\x42\x7e\xba\x65\x79\xf1\xd9\xa5\x1f\x5d\
-\xbc\x78\x91\x07\x46\x61\x45\x5f\x3e\x74\x8a\x16\x32\x61\x32\x14\
-\xe7\x6b\x75\x75\x75\xff\x2c\x0b\x15\x19\x12\x19\x90\x60\xe1\xd1\
-\xa3\x47\xff\x34\x4e\x82\x54\xa2\x54\xa0\xa2\x80\x63\x6d\x6d\x6d\
-\x8f\x89\x90\x63\x22\xc2\x68\x63\xc9\x59\xaa\x7d\x2c\xe8\x51\x3a\
-\x3b\x9f\x7a\xea\x29\x86\xb4\xc0\x8d\xbc\x1c\xb7\x1a\xcc\x91\x9e\
-\x90\x83\x44\xf8\xde\x22\x8e\x6b\xe6\x79\xa2\xf9\x35\xf0\x7c\x78\
-\x6e\x2c\x1a\x60\x8e\x8f\x6b\xf2\xcc\x4b\xc9\xdc\x0a\xf3\x35\x6b\
-\xe4\xe8\xd1\xfd\x44\x0e\x99\x9c\xd0\x83\x15\xc6\x30\x26\x2f\x96\
-\x2d\x7e\xe2\x45\xe0\x99\xf1\x3c\x98\xbf\x63\x78\x0a\xff\xc1\xea\
-\x34\x71\xc2\x69\xd2\x1b\x66\x4e\x87\xe1\x56\x3a\x4d\x96\x26\x96\
-\x09\x16\x16\xe4\xc1\x1c\x0a\x64\x46\x1c\x03\xf3\x94\xbc\x74\xd1\
-\x34\xb9\x26\x0d\x5e\xf4\xcd\x78\x08\x56\x67\xb0\x24\x19\x51\x08\
-\x97\x59\x22\xc7\x5c\x0a\xba\xa5\xca\x0b\xf7\xa8\x6b\xcc\x4d\x71\
-\x20\x3a\x0d\x21\xfa\x91\x16\xf1\xe9\x48\xd0\x81\x40\x4f\xe6\x48\
-\xf1\x63\x38\xf8\x9f\xe5\x18\x16\x23\x5f\xcc\x13\xf1\xac\x88\x47\
-\x7c\x86\xee\x18\xba\x02\x56\x4e\x83\x81\x70\xe8\x42\xba\x74\x54\
-\x20\x70\x3a\x14\xbc\x2b\x34\xba\xe4\x15\x32\x23\x1d\x7b\x37\x12\
-\x81\xb4\xb8\x6f\xcf\x94\xf0\x7c\x24\x16\xf2\x63\x1e\x1d\x4b\x8f\
-\x21\x31\xf2\x41\x7e\x20\x73\x86\x44\x59\x10\x04\xc9\x12\x07\x47\
-\x3e\x68\x7c\x79\xa7\x90\x97\xaa\x0c\xc7\x23\x28\x27\xca\x08\xf2\
-\xa3\x43\xc6\x50\xb2\xd5\x4d\xf2\xca\x3c\x36\xf5\x12\xd2\xa3\xa3\
-\x40\xd9\xf0\x0c\x20\x0c\xc8\x91\x3a\x49\x27\x8e\x36\x96\xf2\x22\
-\x0e\x75\x78\x30\xd8\xf3\x83\x00\xe9\xe4\x50\xce\x56\xe6\xb4\x03\
-\x90\xee\xbd\x72\x74\x6e\x21\x22\x9e\x13\x8b\xb2\x78\x86\x84\x87\
-\x90\xd1\x37\x5c\xdf\x30\x78\xf0\x63\x6e\x71\x28\xf5\xcd\xde\x35\
-\xd2\x64\xb1\x0f\x73\xef\x2c\xa4\x22\xcf\x0c\x0d\xf3\xee\xd0\x79\
-\x24\x8d\x61\xe1\x56\x54\x12\x0a\x8f\x0c\xee\x79\xec\xb1\xc7\x7e\
-\x25\x3b\x3b\xfb\x67\x22\x00\xc8\xd0\x2a\x3d\x60\x28\x93\xb3\x3f\
-\xdb\x1e\x7f\xfc\x71\x6b\x20\xd1\x8d\x30\x80\xf8\x89\x0a\x29\xa8\
-\x00\xcf\x3d\xf7\xdc\xf7\x44\x54\x9f\xc2\x32\xec\xee\xee\x2e\x12\
-\xa1\x1e\x53\x5a\xcc\x17\x00\x93\x61\x40\x0e\x7e\xa6\x57\x18\xc1\
-\xc3\x78\xe6\x99\x67\x3e\x2b\x3d\x9f\x94\x8e\x45\x92\x99\x8f\x95\
-\x78\xf5\xea\x55\x5e\x3c\x1e\x00\xba\x25\x92\x69\xb2\xb8\x17\x54\
-\x2e\xe5\xe5\x8b\xca\x53\x2b\x79\x8b\xfb\x03\xac\xc0\x0c\x59\x9d\
-\x85\x17\x2e\x5c\xf8\xda\xce\x9d\x3b\xa9\x58\x54\x24\xd3\x6b\xbc\
-\xc0\x2a\x9b\xbd\x0c\xe6\x40\xa2\x17\x8b\xfc\x51\xbe\x10\x18\x43\
-\x2a\x58\x0f\xfc\x26\x0e\xbd\x45\x86\x4b\x18\x3e\xc3\x8f\x7b\x51\
-\xb9\xf8\x61\xf1\x40\x92\x58\x80\x5c\xf3\x42\x51\x07\x98\x5b\x64\
-\xd5\x1e\x18\xac\x0c\xd1\x03\xdd\xb1\x88\x20\x0a\xea\x9b\x59\x33\
-\xe1\xf4\x90\x8d\xae\xdc\x43\xdf\x87\xe4\x58\x9c\xc3\x3d\xd2\xe4\
-\x3b\x71\xf8\x83\xa0\xde\x5c\xbf\x1c\xf8\x8f\xa5\x84\x5e\xc4\xc7\
-\x8f\x05\x1a\xf4\xde\xad\x27\x1b\x4e\x2b\x91\x43\x26\x2e\x11\xa8\
-\x5f\xdc\xa3\x71\xa1\xc1\xe7\x1a\x99\x38\x7a\xe5\x34\x76\xac\xd2\
-\x23\x2d\xf2\x11\x95\x4d\x5e\x39\xfd\x08\xeb\x90\xa1\x4d\x6b\x5c\
-\xc8\x17\xcf\x81\x95\xd1\x60\x28\xed\x83\x95\x27\xa4\x47\x07\x87\
-\xce\x04\xe9\xe2\x2c\x3d\x30\x58\x63\xcb\x73\x43\x16\x8e\x74\xe9\
-\x30\xd0\xd0\x31\xac\x8a\xbe\xd1\x7c\xd8\xf3\x21\x5d\xac\x01\x3a\
-\x2e\x56\x06\x94\x07\x1d\x27\x3a\x55\x5c\x0f\x25\x1f\xe3\x05\x96\
-\x17\x46\x2b\xa8\x63\x46\x48\x94\x1b\x8b\xf8\xb0\x8e\x58\x55\x9d\
-\xe8\x1d\xb2\xba\x47\x67\x08\xab\x8d\x55\xa4\xfc\x26\x6e\x2a\x90\
-\x26\xcf\x8f\xce\x1d\xf5\x05\xe0\x47\x5c\x16\x28\x51\xfe\x90\x2e\
-\x69\x24\x4b\x17\xe2\x65\x5e\x8f\x45\x71\xc4\xe5\xf9\xa1\x3b\xcf\
-\x88\x85\x2f\x60\xb0\xe7\x64\x75\x0d\xc2\x23\x4d\xbe\xe4\x6f\xf2\
-\xad\x7e\x10\x66\xb0\xba\x76\x5b\x61\x4a\xc6\xa6\x4f\x9f\xfe\xfe\
-\xf5\xeb\xd7\x1f\x5a\xb6\x6c\xd9\x13\x2b\x56\xac\xd8\xb3\x7c\xf9\
-\xf2\x47\xd7\xad\x5b\xf7\x4c\x55\x55\x15\x66\x35\x20\xb3\x61\x10\
-\xcf\x5c\x22\x50\x08\x13\xca\xca\xca\xde\x70\xdf\x7d\xf7\xed\xd5\
-\x25\xbd\x48\x10\x95\x13\x14\xb4\xd2\xff\x75\xa5\xc5\xfc\x14\x88\
-\x16\xbe\xc5\x99\x7f\xf7\xdd\x77\xef\x9e\x34\x69\x92\x85\x33\xfd\
-\xa3\x08\xeb\x15\xbe\x1f\xc8\x21\x4f\xe4\x8d\x3c\xe2\x6a\x6b\x6b\
-\x0f\x6e\xdd\xba\xf5\xd1\xd2\xd2\xd2\x57\x05\xa1\xae\x87\x8b\xea\
-\x39\x16\x41\x43\x85\xa3\x61\xe1\xbf\x2d\x64\x18\xaa\xee\x16\x8e\
-\xf9\x1f\xe2\xf3\x12\xf0\x9f\xc6\x17\x2b\x02\x30\xaf\x91\xea\x65\
-\xe0\x1e\x61\x00\x2f\x95\xe9\x03\xd9\x70\xcd\xcb\x01\x48\x8b\xe7\
-\x05\x58\x7d\x68\xe9\x98\xee\x38\x2b\xff\xc1\xd2\xe4\x99\x5a\x9a\
-\xcc\x47\x5a\x7c\x4b\x93\xa5\xdd\xc0\xf2\x67\xff\xf1\xe7\x3e\xc3\
-\x40\xfc\x67\x01\x08\x30\xbd\x6e\x04\xa6\x2f\x43\xa2\xe1\x34\x9e\
-\x91\xb3\x45\x29\x34\x0e\xa9\x80\x1e\x16\xc6\xe4\x50\x46\xfc\x67\
-\x54\xc6\xb6\xae\x58\x9d\xb6\x34\x99\xc7\xb7\xb0\xd6\x29\x64\x74\
-\x80\x2d\x21\x80\x86\x70\x30\x98\xcc\xf0\xc9\x32\xc8\xb2\x32\x65\
-\xb8\x1b\x58\xe3\x96\x0a\x96\x07\xb6\xc1\x60\xfd\x10\xdf\xca\xc3\
-\xbe\xf9\x87\xee\x26\xc7\xea\x8d\x85\xc1\x4a\x02\x43\xad\xc7\x61\
-\x58\x99\x40\x2c\xc8\xb2\xf2\xb3\xfa\x8c\x4c\x0b\x03\x89\x90\x47\
-\xab\x83\x34\xe6\x61\x98\x7e\x0c\xd1\x73\xdf\x86\xb9\xb1\xec\x00\
-\xf7\x4d\x16\xc3\xc7\x74\xca\xb8\x6f\x65\xc6\x30\x3c\xa0\xae\xa6\
-\xca\x4b\xb8\x3e\xd3\x91\x62\xab\x0a\xf1\xd1\xcb\xf4\x67\xd4\x05\
-\x98\x1c\xd3\x8d\x15\xc6\xdc\xb7\x77\xf7\x82\x1c\xf3\xe6\x80\xe7\
-\x1e\x6e\xff\xa2\x40\x96\xd5\x0d\x56\xc1\x12\xdf\xd2\x43\x8e\x2d\
-\x0c\x23\x8f\x96\x2e\xab\x71\xb9\x4f\x1e\xad\xdc\xb0\xf8\x6c\x11\
-\xcd\x60\x69\x8e\x59\x90\xc1\xa0\x50\x8b\x8b\x8b\x5f\xb1\x71\xe3\
-\xc6\x5d\x22\x86\x03\x4b\x96\x2c\x79\x42\xc4\x48\x6f\x39\xfa\xf2\
-\xd9\x7f\x16\x36\xd8\x8b\x66\x95\x21\x0a\x93\x4d\x25\xe1\x3a\x5a\
-\x40\x41\xe1\x56\x54\x54\xbc\x61\xd3\xa6\x4d\x07\xd6\xae\x5d\x7b\
-\x70\xfe\xfc\xf9\x7c\x79\x02\x58\xc1\x1b\x48\x83\xf8\x0c\x15\x51\
-\xd8\xf6\x3b\x0a\xd3\x85\xe5\xf7\xb6\x52\x29\xaa\x7b\xa1\xf2\xf6\
-\x7f\x95\xc7\x27\x57\xae\x5c\x79\x78\xd5\xaa\x55\x3f\x90\x1f\x63\
-\xd9\x80\x17\x3d\x59\x7e\xc6\x1a\xa8\x84\x38\xab\x90\xc3\x25\x42\
-\xcb\x27\xf9\x27\xbe\x35\x44\x0c\xa1\x01\xe6\x87\x90\x35\x14\x67\
-\x2f\x32\x73\x0c\x61\x59\x34\xd2\x80\x30\xf6\xf2\x86\x89\xd0\x1a\
-\x0d\x5b\x84\x32\x18\x59\x84\x61\x61\x19\xca\x09\xa7\xc9\x62\x03\
-\x40\x9a\xe1\xff\x58\x47\x94\x95\x91\x05\x73\x8d\x0c\x01\x01\x74\
-\xb3\xbc\x44\x1d\xf7\x52\xd5\x09\xab\x57\x10\x1e\x0b\x03\x90\x6d\
-\x69\x60\x29\x83\xa0\x63\x38\x04\x84\xeb\x2f\xf3\x4a\xc8\xb0\xc6\
-\x89\x0e\x0b\x40\x27\x60\x61\xc3\x44\x68\x75\x81\x0e\x02\x18\x6a\
-\x79\x5a\x1e\xc2\x44\x68\xcf\x06\xcb\x81\x79\x4a\x60\x69\x0f\x06\
-\xcb\x2f\x04\x84\x0c\xd3\x0b\xab\x1f\x02\x02\x16\x66\x3c\x13\xa1\
-\x85\xc1\xda\xe5\x9e\x11\x12\xfb\x41\x29\x7b\xee\x27\x6a\xa7\x12\
-\xc1\x48\x89\xa9\x01\x64\x50\xfe\xa6\x7f\x98\x08\x4d\x1e\x23\x20\
-\x74\x90\xb8\x6f\xe1\x98\x7f\x06\x3c\x47\xc2\x0e\xe6\x78\x06\xfc\
-\x47\x16\xc3\xe8\xc8\xb0\xe7\xc0\x70\x3d\xb0\xb0\x20\x4c\x84\x56\
-\x3f\xcc\x58\x1a\xce\xbb\x3b\x28\x52\xbd\x70\x37\x8a\x44\x0f\xc4\
-\x7a\x7d\xe9\x8d\x8d\x8d\x3f\xda\xb1\x63\xc7\x2f\xa7\xa7\xa7\x3f\
-\x23\xab\xab\x64\xd7\xae\x5d\x8c\xf3\xda\xfc\x12\x19\x1e\xc0\xc2\
-\x85\x0b\x3f\x79\xef\xbd\xf7\xd2\xe0\xd8\xc4\xbc\x15\x54\x18\xc8\
-\xc6\xd1\x3b\xb5\xca\x66\x20\x9f\xdc\x7b\x75\x4d\x4d\xcd\xef\xb4\
-\xb4\xb4\x74\x75\x76\x76\x76\xc8\x2a\x63\x4f\x19\xf3\x09\xdc\x0b\
-\x97\x85\xc5\x67\xc8\x92\x07\x15\x95\x07\xd0\x01\xff\x69\x6b\xd6\
-\xac\xf9\x1b\x91\xdd\x9f\xe9\x9a\xca\x45\x38\xf2\xce\x7f\xc2\x34\
-\x2b\x6f\x5f\x2c\x2f\x2f\x2f\xce\xc8\xc8\xf8\x8f\xbd\x7b\xf7\x42\
-\xbe\xcc\x41\x91\x9e\x35\x26\x61\x10\x77\xa8\x95\x79\xbc\x80\xbc\
-\x92\x4f\x7a\x7d\xcc\x4d\x01\x2a\x32\x65\x6b\x0d\x11\x2f\xbe\x3d\
-\xc3\xc1\x1c\xe5\x06\x6c\x38\xd4\xea\x03\x8b\x07\x20\x54\xc2\x24\
-\x2a\x43\xab\x5b\x5f\x0a\x7e\x5d\xaf\x8b\x43\x05\x32\x01\x73\x6e\
-\xe4\xc5\x1a\x56\x08\x8f\xf9\x1a\x4b\xd3\x9e\x27\x0d\x1d\x3d\x5d\
-\xab\x7b\xf4\x62\x69\xe4\x00\xbf\x93\x39\x74\x42\x06\xb2\xc2\x75\
-\xd2\x60\x7e\x2c\x4a\x82\x0c\x29\x0b\xfc\x18\xa2\x62\xb1\x0b\xf1\
-\xac\x7c\x06\x83\xe5\x83\x7d\x92\x2c\x48\x01\x56\x26\x0c\x91\xa6\
-\x82\xe9\xc8\x3c\x90\xad\xa2\xa6\x61\x1e\x29\xac\xdc\x58\xe8\xc2\
-\x2a\x6f\x1a\x75\xca\x63\x28\xb0\x32\x60\x91\x0e\x43\xc2\x56\x06\
-\x34\xb8\x36\x4a\x90\xa8\x2c\xc7\x1b\xac\x3c\x2c\x4f\xd6\x26\x31\
-\xa5\x60\x65\x1f\x6d\xa7\x92\xc1\xc2\x63\x7d\x53\x4f\xed\xdd\x88\
-\xc2\xca\x8d\xce\x3b\xf3\xf0\xd4\x0f\x9e\x0d\x1b\xd7\xad\xce\x0c\
-\xf5\xdd\xb5\x7a\xc9\xd0\xad\xad\x22\x36\xb0\x47\x30\x19\xa8\x1b\
-\xe8\x47\xa7\xc9\xac\xfc\xa1\xd6\xf1\x21\x81\x0a\x73\x33\x61\xf2\
-\x93\x15\x30\x19\xe4\x65\x66\x92\x95\x83\xad\xc3\x99\x0b\xee\xcf\
-\x9d\x3b\xf7\x2d\x13\x27\x4e\xfc\x98\xc8\xab\xbb\xa4\xa4\xa4\x79\
-\xfb\xf6\xed\xac\xba\x63\x5e\x80\x82\xa1\x70\x07\x83\x85\xbb\x47\
-\x96\xe0\xe7\x25\xa7\x5f\xe4\x1b\xc4\xeb\xef\xef\xe7\x2b\xf2\xe9\
-\x8f\x3c\xf2\x08\xbd\x2e\x16\x67\x0c\x57\xe6\xe2\xcd\x9b\x37\xff\
-\x79\x73\x73\xf3\xe4\x98\x50\x57\x57\xf7\x95\xe3\xc7\x8f\xd3\xb0\
-\x5b\xde\x0c\x58\x30\x2c\x5e\x20\x0d\xf6\xec\x50\x2e\x89\xca\x24\
-\x55\x79\xdd\x6e\x98\x4e\xfc\x47\x4f\xc6\xf6\xd9\x3b\x36\x94\x32\
-\xb3\x30\xcc\x5d\x31\x69\xcf\x35\x7e\xf4\xfe\x99\x7b\xe5\xf7\x70\
-\xea\x22\x61\x79\x21\x19\x41\x60\xf5\x20\xab\x40\x01\x2f\x37\x2f\
-\x2c\x73\x1f\x10\x2d\xbf\xb1\x08\xd9\x93\xc6\x35\x7e\x0c\x9d\x43\
-\x98\xc4\x4f\xf6\x1c\x06\x03\x24\xc7\xaa\x38\x9e\x31\xcf\x9a\x55\
-\x79\x2c\x48\xb0\xe7\x6e\xf9\x65\x81\x18\x9d\x2d\xea\xb5\xf5\xd6\
-\x49\x9f\x06\x3b\x5a\x66\xdc\x23\x1c\x27\xbf\xb0\x5f\x11\x07\xa2\
-\x75\xc9\x64\x63\x15\x30\x5f\x4a\x23\x44\xfd\x62\x4e\x9c\xe1\x31\
-\xd2\x31\x32\x1b\x0a\x4c\x3e\x8d\x2b\x24\x62\x79\x62\x41\x0a\x64\
-\xcb\x6f\x74\xc3\x71\x8d\x45\x48\xef\xdd\xd2\x65\xb8\x8c\x05\x3b\
-\xc3\x49\xd7\xca\x3d\xbc\xa1\xde\xd2\x65\xa1\x0d\xe5\x33\x94\x7a\
-\x15\x86\xa5\x8f\x2e\x58\x12\xa6\x1f\x9b\xff\x79\x06\x74\x52\xe9\
-\x78\x61\x11\xb2\x20\xc8\xea\x03\x1d\x70\xe6\xd5\x86\x9b\x1e\xb0\
-\xb2\xc3\x22\x64\x73\x37\xe9\xa3\x87\x6d\xfc\x46\x26\xf9\x24\x0c\
-\x16\x21\x0d\xb9\x95\x25\xf5\xc5\xf6\x12\x02\xd3\x3f\xd9\x86\x7a\
-\x3a\x2c\xd4\x8f\x89\x72\x2c\x7a\x32\x4b\x17\xab\x97\x45\x64\xb6\
-\x45\x8c\xb4\x86\x0a\xcb\x33\x7b\x49\x99\x2f\xb6\x34\xc3\x1b\xea\
-\x01\x61\xb0\xc4\x6c\x3e\x1d\x5d\x79\x6e\x90\x12\x1d\xcf\xe1\xa4\
-\x49\xde\x49\x87\x21\x55\x16\x41\x21\x9b\x74\x58\x5c\xc3\xbe\x56\
-\x7b\x57\x48\xc7\x0e\x2a\xb0\x67\x85\x31\xf4\xcb\x72\x23\x79\x56\
-\xb7\x05\x28\x4a\x0f\xd8\x0a\x92\x07\x94\x08\x14\x4a\x22\x58\xf8\
-\x85\x6b\xd7\xae\xdd\x5d\x5b\x5b\xbb\x6f\xc5\x8a\x15\x8f\x2e\x5b\
-\xb6\x6c\xbf\xc8\x8c\x95\x63\xac\x16\x03\x26\x3f\x19\x4c\xce\x72\
-\xc5\x23\xfe\x93\xcc\x49\xca\xed\x8d\xbb\xc7\x98\xa7\xe4\x9e\xc2\
-\x98\xa5\x92\x4c\x57\x83\xa5\xb9\x59\xf1\x76\x29\xfe\x01\x74\x93\
-\x8e\x7b\x65\x15\xd2\x3b\x86\x20\x40\x22\x39\xf6\x12\x24\x82\x85\
-\xa7\x17\xcb\x90\xec\x58\x03\x2f\xb4\xbd\xd4\xfc\x1f\xce\xd0\xa8\
-\x85\x61\xf1\x03\x71\xa9\xec\x26\x6f\xb4\x1c\x2f\x06\xff\xd7\xca\
-\x01\x5e\x1c\x60\x43\xa3\xac\xc2\xe4\x3f\x1d\x2e\xc0\xcb\x36\x5c\
-\xd8\x33\x62\x25\x1c\xb2\x2c\x1f\x74\x72\x80\xe5\xd3\x9e\x31\x96\
-\x22\xa7\xb7\x10\x86\x97\xd9\xca\x6e\x30\x47\x23\x40\x43\x0a\xd9\
-\x82\x70\x19\x9b\x0e\xec\xe3\x22\x2c\x72\xf9\xcf\xca\x51\x30\x94\
-\xe7\x11\x86\xe9\xca\x86\x7a\x1a\x55\xd3\x81\x45\x2a\x36\x94\x4b\
-\x18\x4b\xd7\x86\x46\x69\xcc\xf8\xcf\x02\x0d\x30\x9c\xf2\xb4\x34\
-\xc3\x43\xa3\x38\xf6\x18\x47\xa7\x18\x86\x8a\x68\x1d\xb3\x72\xe1\
-\x1b\xa6\x60\xbc\x0f\x8d\x9a\xfe\x94\x8f\xd5\x65\x1c\xf3\xc2\x23\
-\x85\xa5\xc9\xea\xe8\x70\x9a\xe1\xa1\x51\x0b\xc3\xe8\x0b\xf7\xa8\
-\x9b\x96\xf6\x68\x38\x7b\x6f\x19\x9a\x67\x88\x1e\x58\x5e\x6d\x68\
-\xd4\x9e\x15\x46\x10\x18\xc9\xb3\x4a\x09\x7b\x48\xa3\x05\xab\xbc\
-\x33\xef\xbb\xef\xbe\x8f\x2e\x5f\xbe\x9c\x13\x27\x58\xde\xcb\xc3\
-\x4f\x94\x16\x99\x03\xd1\x7b\x84\x4f\x13\xb1\x7c\xa8\xa7\xa7\xa7\
-\x48\x16\x1c\x15\x8c\xed\x15\x5d\xb2\xbe\x26\xc8\x0a\xa3\x80\xd8\
-\x37\x45\x21\x26\x7b\x61\xf0\x47\x4e\xf5\x96\x2d\x5b\xbe\xd8\xd4\
-\xd4\x94\x4d\x7c\xfd\x0e\xa7\xc5\x1e\xc6\x6e\xee\x6d\xdd\xba\x95\
-\x65\xbf\x9c\x08\x91\x4c\x57\x80\x4c\xd2\x7c\x40\x24\xf8\x05\x59\
-\x97\xb9\x8a\x4f\xe5\xc9\x90\x8e\x7d\x9d\x9d\x9d\x99\x22\x6e\x56\
-\x45\x59\x2f\x29\xac\x1b\x32\xc9\xaf\xe5\xd9\x40\x18\xee\x11\x7e\
-\x96\x48\xf5\x23\xaf\x78\xc5\x2b\x58\x6e\x6c\x63\xf8\x77\x12\x68\
-\xf8\xc2\xa0\x2c\x78\xb6\x37\xe2\x28\x37\x73\xc0\x5e\xa2\x28\xec\
-\x59\xf0\x21\xe6\x1b\x05\xdb\x01\x80\x3d\x4b\x9e\x77\x18\xf8\xf3\
-\x4c\x21\x16\x2c\x05\x2c\x54\xf4\xc2\x9f\xfa\x93\x28\x1f\x38\x5e\
-\x78\xea\x28\xba\x62\x19\x71\x4a\x0c\x24\x4b\x9c\xe8\xcb\x1f\xad\
-\x1f\x4c\x2b\xdc\x08\x18\xa9\x20\x1d\x03\x1d\x89\x64\xef\x01\xb0\
-\xf2\x64\xd1\x06\x88\xd6\xeb\x91\x80\xf4\x6f\xf4\xf9\x58\x7c\xd3\
-\xcf\xe6\x93\x0d\x51\x3d\x2d\xdc\x78\x01\xc4\xc4\xb3\xb7\xfa\x4e\
-\xfb\x33\x52\x58\x59\xd8\x33\x4c\x55\x16\x89\xca\x31\x51\x1d\x1e\
-\x8e\x0b\xbf\xb7\xe4\xcb\x48\x37\x19\x4c\xcf\x51\x47\xaa\x8a\x3e\
-\x62\xcc\x9c\x39\xf3\x25\x75\x75\x75\xc8\x5e\x2d\x32\xfb\x44\x5a\
-\x5a\x1a\xfb\x5a\xc8\x30\x05\x9d\xa8\xb0\xad\x30\x40\xa0\x53\x69\
-\x69\xe9\xdb\xfb\xfa\xfa\x36\xf6\xf6\xf6\x86\xf7\xa5\x41\x5c\xbd\
-\x22\xa0\xce\x35\x6b\xd6\x7c\x62\xe1\xc2\x85\x4c\xd6\x0e\xf6\x02\
-\x5e\xeb\xee\xee\x7e\x26\x33\x33\x33\xbb\x5f\x88\xfb\x0d\x00\x3f\
-\xee\x29\x0c\x8d\x55\xaa\x0d\xcc\xe8\x8d\x3f\x8b\x6d\xfe\x18\x42\
-\x8e\x13\xb4\x95\x61\xba\x44\xd1\xa3\x5d\x3c\x67\xce\x1c\xf6\xc3\
-\x45\x11\xce\xa3\x81\xb8\x41\x5a\xb9\xb9\xb9\x0f\x4a\xee\x6f\x2b\
-\xbf\x93\xeb\xeb\xeb\x39\x07\x93\xe1\x3b\x70\x53\x9e\xd1\x6d\x42\
-\xf4\x28\x27\xca\x14\x82\xb8\x11\x67\xe5\xc3\x4b\xc4\xdc\x2b\x2b\
-\x07\x41\xb2\x7a\x91\xcc\xff\x46\x90\xac\x4e\xe3\xcf\x02\x03\x96\
-\xaa\x33\x2f\x49\x23\x6d\xbd\xec\x44\x79\xa1\x81\x83\x80\x88\x07\
-\x29\x30\xf4\xcb\xb0\x15\x96\x21\xbf\xc3\x75\x01\xab\x20\x0c\x3a\
-\x9c\x37\x02\xd2\x0a\x37\x44\x34\xb0\x61\x62\x4c\x86\xd1\x2c\x4f\
-\xd2\xb7\x6f\x7a\x8e\x14\x16\xdf\xf4\x8a\xd6\x39\xfb\x6d\xcf\x2c\
-\x1a\x7e\xa8\x20\xbe\xc5\xb1\x45\x7e\xb7\x02\x58\x64\x74\x98\xac\
-\x2e\xd0\xb9\x4c\x54\xff\x86\x02\x8b\xc7\x28\x14\x48\x55\x06\xd1\
-\xfa\x46\xdc\x44\x75\x78\x38\x8e\x3c\x98\x0e\x0c\xcb\x87\x0f\x21\
-\x4f\x84\xe1\x3e\xa3\x21\x63\x34\x1b\x59\xcb\xc0\xb4\xe9\xd3\xa7\
-\xaf\x10\x89\xf1\xb0\xda\x3b\x3a\x3a\xca\x44\x5a\xef\x9f\x3f\x7f\
-\x3e\x63\xd0\x64\x9e\x30\x96\xf9\x44\x08\x32\x3b\x63\xc6\x8c\xb9\
-\x22\x28\x7a\x21\xe8\x18\x2e\x00\xf1\x6a\x5a\xaf\xac\xaf\xae\xf2\
-\xf2\x72\x0e\x65\x65\x45\x29\x88\xca\xb4\x74\x5a\x76\xed\xda\xf5\
-\xc1\x9c\x9c\x9c\x7d\x22\xae\x12\x91\xd5\xc0\xcb\xcd\xb5\x88\xb5\
-\x58\xf7\x0e\xee\xdc\xb9\x93\x21\x08\x48\x37\xd1\x83\x30\xbf\x6c\
-\xe5\xe5\xd7\xda\xdb\xdb\xd9\xfd\x0f\x09\xbe\x20\x1f\x92\x99\x9d\
-\x97\x97\x67\x27\x35\x44\xe5\x18\x88\x47\xbe\x68\x2c\x27\xd5\xd6\
-\xd6\x7e\x50\xd6\xf3\xeb\x45\xf0\x98\xbd\x5d\x22\xe5\xbe\x95\x2b\
-\x57\xb2\x51\x98\x86\x21\x11\x81\x8e\x57\xd8\x41\x09\x56\x6e\xcc\
-\x87\x31\xf7\x40\x87\x06\x2b\x78\xa4\x8e\x7d\x6f\xcc\x15\x32\x37\
-\x43\xaf\x31\xd1\x33\xbc\x1d\xb0\x3a\x48\x07\x8b\x6d\x38\x2c\xf6\
-\x62\xdb\x06\x1d\xa5\x44\xf9\x60\xae\x8a\xf9\x4c\xe2\x41\x98\x34\
-\x7a\xcc\x09\xd9\xde\x2d\xfc\xed\x9d\x3d\x1b\xff\x6f\xf5\x99\x13\
-\x3a\xc0\x0b\xea\xe4\x20\x30\x79\x4c\x65\x40\xa6\x26\x8f\x67\x13\
-\x25\x91\x9b\x09\xea\x39\x8d\x3a\xe7\x51\x82\xe1\xb6\x4d\x96\x6f\
-\x5b\x5a\x6f\xf9\xa0\x71\x05\x76\xdf\xca\xcd\x3a\xd7\x36\x4f\x37\
-\x92\xf7\x8c\xe7\x41\x99\x71\xe2\x09\x18\xae\xce\x23\x01\x6d\x14\
-\xab\x85\x0d\xac\xb1\x60\xa5\x3c\x18\x6e\xfa\xf6\x8e\x58\xdd\x49\
-\x04\x0b\xc3\xbe\x53\x60\xbf\x99\x06\x62\x8e\x8f\x7a\x9d\xa8\x2e\
-\x0f\xc5\xf1\xde\x73\x48\x38\x0b\x08\xdf\x2a\x67\xb0\x34\x6e\x19\
-\x46\xf3\xc1\x05\x15\x4d\x04\xb6\x45\x0d\x79\x21\x64\x25\x97\x2e\
-\xd7\xdd\x25\x14\x15\x15\xbd\x72\xf3\xe6\xcd\x1f\x9f\x32\x65\xca\
-\x60\x67\x89\x06\x85\xb0\x7f\xff\xfe\x8f\x5d\xbb\x76\xed\xaf\x44\
-\x2a\x25\x22\x55\xf4\x1c\x28\x1c\xfd\xee\x97\x05\x95\x77\xf0\xe0\
-\x41\xc6\xf7\x19\x5b\x7e\xde\xfd\x10\x2c\x9d\x26\x11\xdd\xfb\x63\
-\xb1\xd8\xd3\xd2\x87\xde\x1b\x2f\x09\x15\xbf\x40\x64\x7b\x42\xf7\
-\x68\x8c\x19\xc6\x4a\x25\x87\x7b\x9d\x47\x8f\x1e\xfd\xbc\xe4\x64\
-\x4a\x87\xb0\xfe\xe2\xbf\xfe\x3e\xc9\x9a\x28\xb2\xfd\x96\xf4\xb2\
-\x25\xbe\xc9\xf2\x08\x08\xbf\x6e\xeb\xd6\xad\x9f\x94\x4e\x4b\xdb\
-\xda\xda\x5a\x15\x37\x48\xa7\xa7\xa7\xa7\x43\xe4\xcc\x64\x32\x93\
-\xe0\x60\x34\x9f\xd3\xed\x80\x35\x32\xac\xe8\xb5\x15\x6a\x80\x0d\
-\xe7\x2c\x8c\x60\xbe\x8b\xd5\x98\x6c\xa5\x18\x89\x63\x05\x1a\xa7\
-\xcb\xd0\x78\x53\xe6\x89\x9e\xe1\xed\x82\xe9\xc2\x33\xa4\x01\x63\
-\x85\x65\xa2\x3c\xe0\xbe\x28\xc7\x2a\x66\x3b\x88\xdd\xca\x89\xcd\
-\xfc\xac\xd8\x43\x96\xd5\x29\x16\x2b\x00\xb3\xe2\x18\x4a\xc5\x9a\
-\x84\x3c\x53\xd5\xbb\x64\xb0\x79\x2d\x3a\x78\x80\xc5\x1c\x00\x1d\
-\x6e\x45\x79\x1a\x71\x99\x1e\xc3\x01\xf9\xb5\x7c\x73\x48\x02\xb0\
-\xb2\x63\x11\x06\xb0\x3c\x60\xa1\xb3\x6a\xd1\xde\x29\x46\xab\x70\
-\x60\x38\xef\x99\x85\x65\x4d\x80\x1d\x20\x3d\x92\x72\x1f\x2a\xec\
-\xd9\xd3\x4e\xd9\xb3\x67\x18\x1d\x22\xe6\xf8\x34\x30\x9c\xf4\x09\
-\x4b\x99\x33\x37\x6c\x27\x20\xa5\xca\x3f\xc4\x17\x06\x0b\xd4\x38\
-\x99\x88\x91\x0e\xde\xdf\x44\xf5\x79\x30\x47\x3c\xe2\xb3\x72\xd5\
-\x3a\x5d\xb7\xa2\xae\xbd\x00\xc3\x79\xf0\xa9\x40\xa1\x52\x11\xca\
-\x64\x0d\xae\x61\x6b\x82\x1a\x77\x7b\x28\x5c\xa6\xf5\xf6\xf6\x36\
-\x35\x37\x37\x57\xcf\x9e\x3d\xfb\x77\x44\x00\xb6\xdf\x27\x15\x38\
-\xe1\xe5\x4f\x0f\x1c\x38\xf0\xfb\x05\x05\x05\x79\x8a\x6f\xd6\x51\
-\x60\xc5\x89\x6c\xff\xb3\xbe\xbe\x9e\x55\x4b\x96\x36\xe0\xda\x9c\
-\x81\x74\xc8\xe7\xd5\xdd\xbb\x77\x7f\x40\x04\x7a\x4d\x24\x96\x2d\
-\x79\x31\x91\x6c\x83\xfc\xd8\x47\xc3\xf2\x71\xc2\x98\x1c\x43\x58\
-\x4e\x50\xd1\x1b\x1a\x1a\xbe\x2f\x5e\xff\x91\xf2\x60\xbd\x67\x48\
-\x30\x2d\x2b\x2b\xab\x54\x7a\x7d\x55\xf2\x98\xd0\x65\x58\x89\xb8\
-\xd1\x3c\x9a\xbc\xfc\x05\x0b\x16\xfc\xea\xaa\x55\xab\xde\x23\x79\
-\xb9\x2a\x1e\x48\x70\x20\x2d\xc9\x99\x20\xab\xb3\x4f\x56\x22\xc7\
-\x07\x81\xa8\x5e\xe3\x0d\xf6\x0c\x28\x67\x16\x3b\x01\x5e\x62\x46\
-\x08\x98\x53\x05\x3c\x5f\xc2\x0c\xc5\x59\xe3\x0f\x28\x37\x1a\x3d\
-\xfc\x49\x67\xb0\x7a\x75\x3b\x80\x4e\xe1\x3a\x1a\xcd\x8f\x39\xcb\
-\x0b\xa4\x4e\x07\x81\xdf\x34\xf0\x94\x93\x2d\xe6\xb2\xfc\x3d\x22\
-\xc7\x66\x68\xca\x82\x7a\xc8\x7d\xdb\x47\x68\x24\x30\x18\x48\x93\
-\xb8\x8c\xaa\x58\x8f\x9c\xb4\x00\xe9\xdf\x4a\xa0\x0b\x60\x55\x20\
-\x8b\xc5\xd0\xcb\xfc\x06\x83\xe5\x97\x0e\x83\xed\xdf\x24\x1f\x58\
-\x4f\x9c\xe8\x03\x90\x47\x79\x62\x9d\x73\xfa\x0e\x60\xd4\x8a\xe1\
-\x68\x3b\x34\x83\xfb\x43\x01\xe1\xec\x39\xd8\x81\xd5\xb7\xe2\x1d\
-\xb5\x7c\x5a\x9e\x4c\x5f\x46\x18\x18\x3d\xb3\x3c\x0e\x05\xf6\x0e\
-\x71\xec\x1f\x56\x65\xb2\xb8\x96\x2f\xa6\x1c\x58\x98\x43\x3c\x3a\
-\x4b\x74\xcc\x6c\xa1\x94\xcd\x27\x0f\xe6\xd0\x3f\x5c\x37\xed\x37\
-\xf7\x6e\x2b\x46\x4b\x01\x2b\xc0\x79\xd9\xd9\xd9\x55\x9c\xcf\x29\
-\x44\x1b\x24\xb5\xf5\xe9\x6a\xdf\xdb\xf9\xf4\x10\x43\x58\xb6\xaa\
-\x2f\xd9\x83\xe3\x01\xa4\xb7\xb4\xb4\xfc\x9d\xac\xc3\x0f\x15\x16\
-\x16\x42\xa6\x59\x22\x9d\x4c\x91\x4e\xfd\xe3\x8f\x3f\xce\x11\x4c\
-\x20\x1c\x9f\x34\x2d\xdd\xb0\x7f\x20\x4b\xee\xe4\x53\x4f\x3d\xf5\
-\x5b\xf9\xf9\xf9\xe9\x22\xd7\xcc\xc3\x87\x0f\x73\x86\x24\x73\x83\
-\xdc\x8b\x56\x64\xe2\x27\x92\x35\x61\xdf\xbe\x7d\x9f\x57\x3e\x2f\
-\x4b\x97\xe0\xb0\x6f\xc9\x2a\x38\x74\xe8\xd0\x1f\x8b\x04\x59\xaa\
-\x6d\x61\xa3\xf9\x0f\x63\xa2\x2c\xe3\xad\xad\xad\xad\x1d\x22\x3d\
-\x0a\xeb\x79\xcf\x41\x72\xf9\x9e\x62\x5a\x69\x69\x29\x43\x2e\x76\
-\xe2\xc2\xf3\x74\xb8\x0d\xb0\xf2\xb1\x7c\x85\xc9\xc8\x80\x8e\x96\
-\x97\x68\xdd\x32\xfd\xed\x2c\x4b\x5e\x00\x64\x31\xbc\xc2\xca\x4e\
-\x88\x11\x3f\xd2\x49\xe6\x08\x8f\x1c\xca\x8c\xc6\x9b\xc6\x9f\x38\
-\xbc\xc4\xdc\x1f\x0f\x20\x0f\xd1\x7c\x99\x23\x1f\x06\xf6\x05\x02\
-\xfc\x01\x8d\x95\x81\xb2\x85\x04\xe9\x91\x03\x8b\xc7\xca\x3e\x56\
-\x27\x52\x3e\x94\x4b\x2a\x84\x9f\x0f\xcb\xf3\x6d\x4f\x22\xf1\xd8\
-\x23\xc6\xc1\x07\xc0\xd2\xbf\xd9\xe0\xb9\x92\x0f\x56\xda\xb2\x4c\
-\xdf\x10\xad\x47\x51\xa0\x2f\xf9\xe5\xdc\x4a\x3b\xf2\x2e\x68\x80\
-\x04\x3e\x7f\x65\x7b\x39\xc9\x87\xc9\xb2\xbd\x68\x46\xfa\x6c\x07\
-\x61\xc8\x9a\xf4\xa9\xd7\xa9\xde\x35\xee\x59\x3d\x65\x68\x8f\x13\
-\x84\xb8\x1e\xac\xbc\x47\x03\xf6\x2c\xb0\xa0\xb0\x6a\xd1\x9f\xbc\
-\x32\x72\xc4\x96\x0b\x80\x1e\xa9\xf4\x07\x46\x66\xac\xb0\xb6\x15\
-\xa2\xc9\xca\x99\xfa\x4a\x78\x3a\x15\xb6\xe2\xda\x40\x9a\xb4\x51\
-\x36\x67\x89\x7e\xc9\x9c\xd5\x7b\xca\x98\xa9\x23\x86\x63\xb9\xc6\
-\xe1\x7f\x5b\x31\x58\x25\x1b\x2a\x2c\x23\x8f\x3e\xf9\xe4\x93\xff\
-\x7d\xe2\xc4\x89\x58\x44\x7c\xc1\xe1\x79\x19\xe4\xa7\x08\x24\xe3\
-\xd9\x67\x9f\x65\xe3\xaf\xad\xe0\xa4\x80\x00\x0f\x2f\xfa\x00\x89\
-\x9f\x2e\x4b\xf2\x87\x92\xfb\x5f\xc5\x37\xcd\x39\x39\x39\xe5\x27\
-\x4e\x9c\xc0\x9c\x66\xb3\xbb\x55\x48\xcb\xc7\xda\xa5\x4b\x97\xf2\
-\x52\xd3\x3b\xb2\x46\xd3\x10\x84\x6b\x6c\x6c\xdc\xf3\xf4\xd3\x4f\
-\x7f\x52\x24\xf8\x29\x59\x94\xac\xca\xb3\x07\x68\xb0\x38\xe9\xcb\
-\x96\x2d\x83\xd8\x20\x6d\x64\x99\xae\xa4\x79\x56\x96\xea\x9f\x49\
-\x97\x12\x11\x74\xba\x48\xf9\xc3\x22\x6c\x4e\x2b\x89\xca\x02\xe1\
-\x7c\x99\x9c\xd3\xd2\xe1\x5f\x45\xc8\xb9\x98\x93\xc1\x9d\xeb\xe0\
-\x27\x8b\x77\x8a\x74\xef\xfc\x4f\x7e\xf2\x13\x36\xe9\xf3\x22\x83\
-\x70\xb8\xdb\x01\x9b\x6b\xb1\xfc\xd9\xe9\x38\x94\x07\x79\xb2\x86\
-\xc0\xee\xf3\x3f\x5a\xfe\x80\xf3\x01\x99\x18\x27\x3c\x2f\x01\xe0\
-\xb4\x16\xe6\x44\x79\x39\x91\x65\xf2\xec\x9a\x17\x91\xff\xc8\x23\
-\x0e\xf3\xcd\x0c\x79\xb1\xd7\x2e\xfc\xa5\x81\x70\x7a\x63\x05\x96\
-\x87\xa1\x38\xf2\x6c\x79\xb0\x79\x66\xfb\x6d\xab\x21\xc3\xf5\x80\
-\xa1\x54\xfc\xe9\x54\x52\x2e\xec\xc7\x63\x8e\x91\xe1\x2e\x7e\x13\
-\x17\x99\xd1\xb2\xc4\x9f\xe7\x81\x63\x1f\x1d\x87\x30\x87\x9f\x17\
-\xf5\x8e\xc5\x11\xc4\xbb\x95\xf5\x8e\xf4\xd0\x03\xcb\x8e\x61\x33\
-\xd3\x11\xbd\xac\x0e\x58\x39\xe1\xf0\x27\x9f\x0c\xb1\x43\x7a\x94\
-\x19\xbf\x29\x0f\xda\x20\xf2\x16\x06\xb2\x00\x65\xc4\x7e\x56\x64\
-\x19\x69\xb2\xcd\x82\x3a\xc8\x6f\xe4\x5a\x3a\xe1\x34\xf9\xcf\x3d\
-\xc2\x70\xf2\x0e\xe5\x0f\xac\xdc\x6e\x36\xd0\x1f\x3d\x98\xe7\x64\
-\x2a\xc1\xc0\x33\xe2\xbc\x4e\xac\x53\xcb\x0f\xba\x26\x2a\x33\xae\
-\x09\xc3\xfb\x4b\x99\x31\xc4\x69\x65\x9c\x0c\x94\x29\x60\x65\x3d\
-\xed\x11\x04\x8c\x1f\x8b\x6c\x28\x4b\x86\x86\x93\x95\x9b\xd5\x37\
-\x74\xc4\xb1\x3d\x84\x8e\x16\xef\xaf\x1d\x30\x41\xb8\xdb\x8a\x51\
-\x57\xa0\xae\xae\x6e\xdb\xcf\x7f\xfe\xf3\x4f\xcb\xa2\xd9\xa3\xc6\
-\x3c\x5f\xff\x29\x14\x0a\x9a\x42\xc8\x4a\x4b\x4b\xbb\x28\x02\x62\
-\x43\x3c\x08\xbf\x64\x56\x50\xd1\x07\x12\x3c\x7c\x11\xcd\x1e\x59\
-\x73\x1f\x90\x05\xf5\x8f\x97\x2f\x5f\x66\x25\x1d\xb0\x97\x9d\x30\
-\x15\x1b\x36\x6c\xf8\xbd\xbc\xbc\xbc\x5f\x5c\xb5\x6a\x15\xd6\x22\
-\x4b\xda\xa3\xf2\x82\x07\x2e\x1d\xbf\x23\x1d\xa8\x04\x16\xd7\x60\
-\x0f\x2c\x6b\xe5\xca\x95\x9f\x15\xd1\xbd\x7e\xeb\xd6\xad\x7c\xe3\
-\x8c\x61\x00\xc2\x51\x5e\x41\xa5\x10\x39\x7f\xbf\xa3\xa3\xe3\x1f\
-\xf7\xee\xdd\xfb\xb1\xb6\xb6\x36\x8e\xfa\xe2\x5e\x58\x16\x30\x79\
-\x38\x43\x70\x7d\xe9\xd2\xa5\x1f\x2b\x2f\x75\xf0\x5e\xdc\xaf\x4f\
-\xd7\x31\x59\xbb\x59\x92\xfb\xa3\x9d\x3b\x77\xb2\x59\x9a\x0a\x13\
-\xd6\xff\x76\xe2\x6b\xf1\xff\x06\x36\x6f\x33\xdf\x4b\x87\x06\x50\
-\x2e\xe4\x85\xcd\xb8\x3c\x5f\x16\x1f\x45\xf3\x4d\x19\xf1\x9f\x09\
-\x72\x1a\x70\xc2\x13\x8f\x95\x7b\x7c\x32\x88\xb8\xb6\x34\x3c\xec\
-\x08\xc3\x7f\x86\xa3\x79\x19\x79\xfe\xc4\xc1\x8f\x06\x89\x8d\xb8\
-\x60\xac\x94\x55\x18\xe1\x7c\x0c\xe6\x28\x1b\x1a\x14\xe6\x7c\xd8\
-\x0f\x07\x28\x23\x60\x73\x34\x41\x5d\x91\xa3\x2c\xa9\x1f\xd4\x4f\
-\x03\xe5\xc4\x97\x34\x38\xe8\x80\xaf\x01\x58\x58\x2b\x3f\xbb\xc6\
-\x9f\x45\x25\x0c\x7f\xf2\x2c\xec\x1e\x69\x51\x97\xed\x08\x3a\xfc\
-\x6e\x15\xec\x5d\xe1\x3f\xe9\x72\x18\x3d\x43\x80\xac\x98\xc5\x3f\
-\x9a\x07\xfe\xe3\xcf\x9c\x60\xf8\x23\xcd\x06\x2c\x1d\xf6\x70\x86\
-\xdf\x4b\xc2\x5b\x1d\xa4\x7e\x26\xaa\x83\x94\x27\x44\x6a\x69\x45\
-\x1d\x6b\x0c\x20\x58\xac\x32\x6b\xdb\x6e\x25\x2c\x3d\xf6\xfe\xd9\
-\x57\x37\xf0\x23\x4f\xac\x99\xa0\x63\xc8\x7e\x3c\xfc\xa2\x65\x86\
-\xa3\x7c\x59\x58\xc6\xd7\x1a\x18\x55\xe1\xde\x60\xef\x0d\xb2\xc9\
-\x2b\x73\xdc\x76\x40\x36\x20\x2e\x8b\x9b\xd8\x87\x6d\xfb\x58\x13\
-\xa5\x4b\x7c\x16\xf4\x70\x30\x37\x56\x24\xbf\x01\x7b\x3a\x21\xd3\
-\xa1\xe8\x70\x53\x71\x33\x12\x47\x66\x90\xd1\xb2\xb2\xb2\x7b\x16\
-\x2f\x5e\xfc\x3a\x91\x18\x73\x7c\x2d\x22\xa9\x22\x59\x73\xdf\x12\
-\x91\x61\x15\x84\x2b\x68\xfe\xc2\x85\x0b\x5f\x2b\x2b\xe9\x47\xba\
-\x66\x65\x61\xf8\x9e\x21\xac\xab\x15\xe4\x00\x6a\x6b\x6b\xbf\x24\
-\x4b\xea\xbe\x9e\x9e\x9e\xe7\x62\xb1\x58\xb9\x48\x85\xe3\xcc\xa8\
-\xec\x89\xe6\xeb\x4c\x56\xd4\x8f\xdf\xd9\x22\xd2\xcf\x8a\xb0\x1f\
-\xea\xee\xee\xbe\x22\xb2\x62\xa5\xe9\x53\xfb\xf6\xed\xe3\xa1\xb1\
-\x3d\x22\x2c\x2b\xfc\x22\x44\x75\xb2\x3c\x94\xac\x59\xb3\xe6\x55\
-\x7b\xf6\xec\xa1\x12\x30\x9c\x45\x7c\x5c\x9f\xca\xe7\x4d\xf3\xe6\
-\xcd\xbb\x5f\x44\xda\xc4\x9c\xa3\xca\xe7\xca\xee\xdd\xbb\xbf\xae\
-\x3c\xd0\xe8\x25\xd2\xf1\x76\x02\x6b\x03\x0b\x8c\x55\x8c\x54\x6e\
-\xf2\xce\x66\x68\x86\xa3\xd8\x1c\x8c\x15\xc2\x5c\x05\x13\xef\x76\
-\x9f\xc6\x9c\xcd\xe7\x5c\xe3\x07\xec\x9a\x7d\xa0\x76\x4e\x27\xe5\
-\x44\x79\x91\x67\x56\xa7\xb1\x41\x99\xb4\x58\xfc\x42\x78\x86\x87\
-\x99\xfb\x61\x21\x09\x5b\x4b\x08\x4f\xb9\x70\x8f\x2f\x57\x30\x34\
-\x64\x8b\xa6\xec\x79\xd0\x40\x40\x2a\x76\xb2\x8c\xcd\x07\x61\x7d\
-\xf2\x2c\xed\xfe\x70\x60\xf2\x91\xc1\xdc\x0a\x16\x2c\xbd\x63\xe6\
-\xe6\xbe\x27\x17\xce\x27\x60\x15\x24\x07\x1b\x93\xee\x50\x9e\x23\
-\xf1\x69\xd0\x19\xb2\x67\x88\x10\xfd\xd0\xf3\x11\x39\x3b\x56\x2b\
-\x5c\xff\x4c\x1f\x46\x48\x58\x85\x67\x69\x5b\x59\x32\xbc\x4a\xf9\
-\x43\x98\x75\x72\x6c\x90\xa7\xf3\xc2\x1c\x3d\x04\xc2\xc8\x09\xf1\
-\x71\xa4\x43\xc3\xfa\x52\x39\xde\xc1\x70\x3a\xc0\xd2\xb2\x93\x65\
-\x2c\xef\x58\x93\x3c\xaf\x68\xde\x53\xc1\x64\x53\x3e\xd1\x93\x65\
-\x00\xd7\x80\xdf\x3c\x37\x08\x8a\x03\x06\x38\x3d\x05\xf2\xe2\x80\
-\x6d\x56\xe0\x52\xee\x94\x17\xb2\x2c\x0e\x7a\x70\xf4\x17\x43\xee\
-\xa6\x73\x14\xa6\x2b\x75\x90\x61\x52\x8b\x8f\x5e\xc4\xa1\x5e\x33\
-\x0c\xc8\x7c\x36\xf3\xda\x84\x87\x5c\xd6\xc9\xb1\x2f\xd4\xbe\xe6\
-\x0f\x88\x13\x2e\x2b\xae\x6f\xc6\xc9\x32\xe1\xfa\x6a\xf9\xc2\xaa\
-\xa3\x33\x83\x3e\xdc\xc3\x1f\xc7\x3e\x57\x9e\x3b\x56\x2f\x23\x39\
-\x3c\x2b\xac\x66\x16\x05\xa1\x3f\xc3\x92\xe8\x85\x33\x7d\x80\xd5\
-\xb7\xf0\xc9\x32\xe1\x67\x6a\xe9\x72\x8a\x11\x1d\x06\x4b\xd3\x64\
-\xd0\xf1\xc0\xc0\x20\x6f\xcc\xc5\xf2\x7c\x79\xb6\x9c\x1c\x86\x95\
-\x6f\xfb\xab\x71\xa4\xc3\xe7\x9a\x68\x2f\x4c\x0f\x2b\x43\x4b\x37\
-\x7a\xb2\x0c\x8b\xc8\xb0\x84\xa3\x7a\x8d\x59\x84\x0b\xb7\x72\xe9\
-\xd2\xa5\x1f\x5d\xbb\x76\xed\x3f\xc8\xd1\x9b\xa7\x21\x05\xdc\xa7\
-\x10\x27\xc8\x08\x7a\xf9\x96\x2d\x5b\xfe\x45\xf7\x19\x6e\xb4\xe5\
-\xcf\xc1\xbd\x08\xc2\x72\x41\x70\x7d\xd7\x5d\x77\x7d\x40\x71\x9f\
-\xe5\xeb\x0e\x9c\x18\xc3\x7f\x91\xd9\xb3\x72\x0c\xaf\xf0\x30\x40\
-\x38\x5e\x14\x76\x2f\x67\xf5\xea\xd5\x5f\x92\x3b\x16\x95\x25\x32\
-\xe3\xb8\x2c\x10\x4d\x3f\x91\xdc\x40\xf7\xa9\x53\xa7\xce\x51\xbe\
-\x3e\xb3\x7e\xfd\xfa\x6f\x8b\xf0\xec\x60\x62\xab\x38\x60\xda\xa6\
-\x4d\x9b\xbe\xb2\x6e\xdd\xba\xaf\x2b\x2d\x7a\x69\xb6\xa7\x29\x1c\
-\x66\x2c\x81\x85\x2d\x54\x56\x5e\x2c\xab\xd0\xf6\x42\x99\xa3\x82\
-\xd2\xf9\xe0\x3a\x7c\x90\x6e\x18\xf6\x6c\xdf\x22\xc7\xcb\x44\x58\
-\x64\xda\x75\x2a\x17\x0e\xc7\xbc\x45\xb2\xaf\xfb\xf3\xa2\x01\x1a\
-\x4b\xc2\x9a\x4e\x76\x3e\xa2\xdd\x1f\x0e\x2c\x0d\x3b\x78\x9b\x17\
-\x94\xff\xe1\x2f\x89\xd8\x73\x83\x24\xe8\xfc\x70\x9f\x32\xe1\xff\
-\x50\x1d\xe5\x4a\x1c\xfb\x1f\x3e\xa9\x24\x0c\x4b\x8b\xff\xac\xc2\
-\x23\x2e\xe1\x29\xa3\xa1\xa4\x19\x2e\x4b\x3a\x1e\x76\x6c\x57\xb4\
-\x2c\x81\xf9\xd9\xc9\x32\x96\x77\xab\xd7\x51\xdd\x52\xc1\xf4\x86\
-\x88\x39\xc1\xc6\xf4\xe1\x79\xd2\x09\xe4\xda\xf2\x61\xf7\x92\xb9\
-\x68\x7e\x79\xbe\xa6\x4b\xaa\x77\xc8\xc2\xb0\x48\xc8\xf2\x42\x59\
-\x0c\xa5\x0e\x86\xc3\x31\x4c\x69\x87\x51\x9b\x0e\xe1\xe7\x65\xe5\
-\x36\xd4\x93\x65\x20\x21\xee\x5b\x7d\xb5\x93\x65\xa2\xe5\x6b\x72\
-\xf9\xd2\x0e\x3a\x10\x16\x9d\x86\x52\x66\xe1\x70\x74\x2c\xec\xf4\
-\x23\xf3\x8b\x7e\x7d\x22\x0c\x2b\x53\xa6\x8d\x08\x4b\x7e\xc2\xe5\
-\x9f\xcc\x59\x38\x2b\x37\xd6\x66\xd8\xb6\x8d\x68\x7d\xb3\x74\xa3\
-\x27\xcb\x30\x4a\x00\x12\xe9\x75\x43\x48\x54\xe1\x47\x03\x96\x79\
-\x0a\xed\x12\xf3\x69\xb2\x7a\x7e\xd8\xd4\xd4\x44\x0f\xc0\xac\x22\
-\x40\xe1\x94\x8a\xc4\xee\x6f\x68\x68\xa8\xeb\xea\xea\x2a\x15\xe1\
-\x7c\x28\x3b\x3b\x9b\xde\x2f\xf7\xd0\x2f\x5c\x99\x4d\x2e\xe0\x1e\
-\xd7\x0f\x15\x16\x16\xfe\x6a\x67\x67\x67\xa3\xac\xb8\x20\x3f\xfa\
-\x9f\x21\x0b\xb4\x4e\xff\xef\x15\xa9\x71\x16\x22\xbd\x09\xd3\x27\
-\x0a\xfc\xb8\x17\x53\xda\x14\xfc\xcb\xb1\x2a\x91\x11\xdc\xd4\x7f\
-\x59\x86\xf5\xb2\x32\x5f\xa3\x74\xb0\x02\x08\x6b\xe5\xc6\x35\x2e\
-\x0c\xee\xf5\xe5\xe6\xe6\x6e\xac\xae\xae\xfe\x88\xf2\x5c\xa9\xbc\
-\x5f\xa9\xa8\xa8\x60\xfe\xc1\x86\x22\x0c\xe7\x1a\x1b\x1b\x77\x1c\
-\x3a\x74\xe8\xef\x65\x71\xd2\xc0\xd0\x10\xa0\x0f\x61\xa2\x72\xc7\
-\x02\x18\x72\xa6\x47\xc6\x4b\x8b\x7e\xe8\x19\x6e\x44\xa8\xe8\x80\
-\x9e\x2c\xd6\x88\x2d\xe6\x08\xe7\x19\xf0\x9b\xf2\x65\x5e\x86\xde\
-\x22\xf3\xbd\xc8\xb4\x67\x8a\x4c\x7b\x29\xed\xb7\xa5\x43\x3c\x1c\
-\xbd\x75\xce\xc2\x64\x51\x47\x50\xe6\x72\x89\x60\x2f\x0d\xfa\x01\
-\x08\xea\x46\x61\x32\x79\xf9\x81\xd5\x07\x60\xd7\xe4\x0b\x92\x46\
-\xaf\x44\xf5\x2e\x11\x2c\xaf\xfc\x27\x0e\x0e\xeb\x10\xeb\x02\xb9\
-\x96\x9e\x81\x70\x06\x16\x6e\xb0\x6d\x87\x06\x94\xb2\xb4\x7a\x44\
-\x23\x62\x8d\x94\xfd\xb6\xb2\xb0\xb2\xc4\x2a\xe2\x90\x6d\x1a\xd4\
-\x54\x65\x09\x2c\x2f\xa6\x8b\x95\xc5\x48\x40\x5a\xe1\xe7\xc1\x33\
-\xc7\x52\xa5\x03\xcb\xbd\xf0\xb3\x43\x6f\xf4\x22\x1f\xa4\x6d\xf9\
-\x42\x1f\xf2\x4b\x5c\x3a\x6a\x58\xfb\x56\xe6\xe1\xf2\x89\x82\xb8\
-\xa4\x41\xa7\x06\x2b\xd8\xd6\x1c\xe0\x47\xbc\x68\x1d\xe4\xda\x9e\
-\x8d\xe9\x06\x81\x60\xd1\xd0\xae\x01\xee\x83\x44\x65\x82\x3e\xc4\
-\x1b\xac\x1e\x9a\xbf\x85\x33\x58\xb9\x1b\xc8\x23\xf2\xe8\xc0\xf0\
-\x1e\xfc\xa7\x9c\xe9\x0f\xc2\xfa\xe2\xac\x0c\x4d\x7f\xca\x8c\x51\
-\x02\x3a\x71\x36\xdf\x48\x1c\x10\x4d\x2b\x0c\x8b\x8f\xa5\x86\xd5\
-\x4d\x9b\x15\xad\x6f\xa6\x3b\xbf\xad\x1c\xb9\x8f\x7e\x38\x46\x04\
-\x29\x37\x46\x03\x2c\x5e\x22\x20\x17\x58\x5d\x4b\xa5\xd7\x0d\xc1\
-\x0a\xed\x46\x81\x82\x89\x94\xa4\xd0\xf0\xef\x3d\x78\xf0\xe0\x37\
-\x9e\x7e\xfa\x69\x86\x50\x80\xf9\x73\x0a\xcd\xbd\x1d\x1d\x1d\x13\
-\x33\x32\x32\xd8\x77\xd8\xdd\xdc\xdc\xdc\xbf\x78\xf1\xe2\x5f\xdd\
-\xba\x75\x2b\x3d\x4d\xc2\x10\x36\x11\x02\x7f\x59\x9b\x1b\xfb\xfa\
-\xfa\x30\xb9\x29\xfc\x01\x1d\x20\x30\x11\x1a\x0f\xfa\x15\xcb\x96\
-\x2d\xb3\x15\x55\x49\x51\x5b\x5b\xfb\xa9\xfe\xfe\xfe\x07\xc3\x24\
-\x68\x60\x7f\x9f\xc8\x30\x26\x62\xb3\xd3\x5e\x92\x3d\x38\xd0\x57\
-\x54\x54\xf4\x1a\x59\x92\xef\x10\x01\xa6\x29\x6e\x27\xf1\x45\xf2\
-\x05\x73\xe6\xcc\x79\xc1\x1e\x29\x95\xcb\xdf\x2b\xcf\xb6\x54\x1e\
-\x24\xcb\xef\x40\xde\x6e\x23\xd0\x81\xe1\x09\x36\xb0\xdb\x57\xc7\
-\x79\x71\xf1\xa7\xd2\x72\x4d\xd9\xf0\x62\x71\x34\x18\x61\xb8\x97\
-\x28\x4f\xd6\x10\xb1\x70\x86\xe1\x43\x1a\x7c\x3e\xcd\x42\x78\xe4\
-\x98\x5c\x1c\x1d\x19\x1c\x60\xf8\x8e\x83\x14\x18\xa6\xe2\x9a\xfb\
-\x89\x9e\x87\xf9\xd1\x5b\x87\x1c\xec\x18\x34\x5b\x8d\x99\xac\x9c\
-\x53\x81\xb4\x80\x6d\x01\x81\xf0\x19\x2e\xb7\x7d\x5d\xc8\x34\xb9\
-\x0c\xe3\xd1\x48\x0c\xe7\x1d\xb3\xbc\x13\x07\x52\x62\x68\x39\xd1\
-\x21\xee\x51\x90\x26\x61\x18\x71\x61\xb8\x0c\xeb\x90\xba\x8f\x1f\
-\xe5\xc6\x73\x42\x36\xbf\xd1\x99\x67\x45\x03\x05\xc1\x42\x80\xcc\
-\xef\xd8\x41\x04\xc9\xd2\xb1\xbc\x53\xe6\x00\x39\x2c\xa8\x31\xcb\
-\x66\x38\xe5\x49\x58\xe4\xb1\x77\x2c\xbc\x3f\x8d\xe5\xf9\xcc\x43\
-\x41\xea\x34\x94\x58\xd4\x46\xec\xa4\x87\xfe\xc4\x23\x3f\x96\x2f\
-\x56\x4f\xd2\x89\x24\xdf\x2c\xf2\x21\x4c\xf8\x39\xa4\x02\x79\x25\
-\xbc\xd5\x41\x86\x21\xd9\xeb\x4a\x1a\xc8\x0f\xd7\x41\xae\xa3\x75\
-\x90\xf6\x80\xe1\x4e\xac\x5a\x80\x85\x4b\xb9\x27\xaa\x0f\x0c\xe1\
-\x33\x64\x88\x1c\xc0\xbc\x1a\x20\x7d\x60\xe1\x20\x36\x60\x23\x59\
-\xb6\x9f\x33\x51\x7e\xd0\x1f\xdd\x98\x4e\xe0\x7d\xa3\xcd\x44\x2e\
-\xfe\xa6\xaf\xe9\x4f\x19\xda\x6f\x86\x4b\x7f\x5f\x0e\x8b\x0c\x02\
-\xe5\xbd\x03\x94\x31\xb0\x67\x9c\x0c\x56\x6e\x58\xdf\xc8\x60\xe8\
-\xd6\xa6\xb4\x48\xc3\x08\xcc\x7e\xa3\x0b\x64\xc8\xb6\x15\x56\xd9\
-\x32\x5d\x91\x68\xf8\x3d\x0a\x2b\x0b\xd3\xcb\xca\x62\xd4\x81\x22\
-\xa3\x89\x54\x19\x0b\xdf\xb3\xeb\x8a\x4d\x9b\x36\xfd\x8e\x88\x20\
-\x0f\x22\x34\x7f\x41\xff\x26\xe4\xcb\x6f\xaf\xc0\x72\x7b\xb3\x94\
-\xc2\xb2\xed\x77\xf6\xca\x95\x2b\x3f\x23\xf2\x7a\x50\x56\xe0\x80\
-\x55\x08\x58\xb5\x9a\x93\x93\x53\x20\x8b\xf4\x73\x22\xa5\x64\xab\
-\x3a\x03\xbf\x82\x82\x82\xb7\x2f\x59\xb2\xe4\x43\xed\xed\xed\x2d\
-\xec\xf3\xb8\x7e\x2b\x50\x86\x7d\x8b\x4c\xe8\xfe\x54\xba\xd0\x58\
-\x33\x94\x90\x4c\x97\x9c\xf5\xeb\xd7\xbf\x55\x71\x36\x88\xdc\xdb\
-\xe2\x62\xb8\x17\x6c\x87\x90\x45\xd9\xb7\x7d\xfb\x76\x2c\x54\x5e\
-\x1c\x8b\x13\xdc\x17\xc2\xf2\xc2\x88\xa6\x75\xbb\x61\x65\xc8\xbc\
-\x1d\x0d\x35\x5b\x18\x18\xee\x86\x10\x98\x8b\x62\xc3\xf8\x70\xe6\
-\x38\xc3\xe1\x98\xc3\x62\x2e\x10\xc7\x50\x12\x73\x41\xa4\xc5\x28\
-\x02\x65\xf6\x88\x1c\x5f\x6f\xa0\xd7\x39\x14\xf9\x56\x76\xcc\x2d\
-\xd2\x7b\x65\x95\x30\xe5\x6f\x3d\xd4\xe1\x96\xab\xc5\xa1\xc1\xa3\
-\x47\xcc\xc1\xe3\x34\xc2\xcc\x0f\x86\xe5\xd9\x35\xc3\xb2\xe1\x13\
-\x33\x06\x03\x71\x98\x5b\x41\x4f\xe6\x78\xec\x90\x87\x68\x9d\x4d\
-\x06\xc2\x22\x03\xc7\xbc\x11\xfb\x50\x99\x3f\xe5\x59\x31\xec\x0e\
-\xa9\xd0\x20\xd3\x50\xd3\x28\xf1\xbc\x08\x8b\xbe\x80\xeb\x64\xb0\
-\x3c\xd1\xa8\xb1\x60\x02\x12\xa0\x21\x64\x2e\x2d\x9c\xf7\xa1\xc2\
-\xe2\x70\xbe\x2f\x43\x71\x94\x29\x8d\x33\x3a\x41\x70\x66\x05\x30\
-\x17\xc8\x68\x0a\x8b\x66\xd8\xe2\x41\x38\xda\x03\xe6\x8f\xa9\x67\
-\xe4\xc3\x0e\x52\xc0\x0d\xb5\xac\xc2\x08\x97\x1b\x1d\x26\x2c\x2c\
-\x3a\x5a\xac\x86\xb4\xe3\xc7\xa8\x83\x58\x8d\x2c\x32\x81\x6c\xa8\
-\x43\xf6\x6c\xd0\x89\x3c\x30\x07\xc7\xe1\x0e\xac\x75\x08\x97\x89\
-\x85\x63\x51\x17\x5f\xc2\xe0\x19\x90\xd7\x64\x64\xc0\x5c\x3b\x1f\
-\x16\x60\xbe\x8d\x3d\xa5\x89\xc2\x84\xc1\x7d\x40\x18\x48\x88\x74\
-\x18\x55\x63\x15\x2d\xef\x26\xcf\x8c\x0e\x03\x04\x88\xee\xbc\x47\
-\xd6\x49\xc5\xa1\x1b\xd3\x18\xbc\xcf\x8c\xb0\xfc\xa5\xdc\x50\x10\
-\xae\x9b\xa4\x43\x7d\x63\xa8\x96\x91\x2f\xea\x1b\x65\x44\x1e\x79\
-\xa6\x74\x36\xe8\x34\xa1\x63\xb8\xbc\x53\x81\x70\x2c\xe6\xe2\xb0\
-\x08\x16\xc8\xb1\x60\x6f\xb0\xb2\x18\x11\xac\x00\x47\x02\x53\x68\
-\xee\xa2\x45\x8b\x56\x1d\x3e\x7c\x98\xd5\x66\x46\x12\x20\x95\xb2\
-\x41\x01\x2e\x5c\xb8\xf0\xf5\x58\x4f\x9d\x9d\x9d\xd7\x44\x1a\xd6\
-\x8b\x08\x20\x32\xe9\x13\x01\x15\xea\xff\xe1\xc7\x1f\x7f\xdc\xc6\
-\x8a\xa3\x30\x1d\x62\xab\x57\xaf\xfe\x43\xf1\xde\x2b\xe5\x20\xc3\
-\x0c\x08\x2c\x33\x33\xb3\x44\x04\xf4\xed\x7d\xfb\xf6\x51\xf9\x52\
-\x15\x60\x70\x4f\x56\xdc\x67\xa5\xc7\xab\x25\xa3\xc1\x64\x84\x48\
-\x90\xb1\x7a\x7a\xb0\x49\xe5\xac\x58\xb1\xe2\x7d\x8a\xb7\x16\x42\
-\x96\x1c\x5e\xe6\x01\x48\x66\x0f\x9b\xee\x9b\x9a\x9a\xb6\x1d\x39\
-\x72\x84\xa1\x9f\x54\xfa\x00\xee\x03\xc2\xe4\x4c\x9d\x3a\xf5\xe1\
-\x0b\x17\x2e\x50\xa1\xec\x5b\x86\x23\x79\xe1\x47\x0b\x83\xa5\x3f\
-\xd4\x8a\x1e\xc6\x50\xf3\x44\xb9\xe0\x6e\x67\xfe\x6f\x15\x46\xf2\
-\x9c\x87\x53\x3e\x63\xb9\x2c\xc9\x3b\x18\x8a\x6e\x23\xa9\x6f\x89\
-\x30\x9c\xf2\x1e\xc9\xb3\xb9\xd9\x18\x4e\x39\x84\xf5\xa7\x0e\x8c\
-\xb4\xec\x88\x8b\x2c\xeb\xb8\xa4\xc2\x70\xeb\xdb\x8d\xe8\x35\x2c\
-\x3c\xaf\xb1\x1e\x26\x82\x42\x9f\x31\x63\xc6\xba\xc9\x93\x27\xbf\
-\x59\x0d\xf5\x92\x96\x96\x96\x1e\x91\x1a\xbd\x0e\x32\x6a\x99\x4e\
-\x8a\x6b\xd7\xae\xd5\x4f\x9a\x34\x69\x6a\x7c\x13\x7e\xa7\x48\x04\
-\xef\xe0\x8f\x48\xa8\x5f\xc4\x11\x3b\x71\xe2\xc4\x1e\x59\x69\xf4\
-\x24\x4c\x56\x54\x26\xbf\x7b\x45\x12\x3f\xad\xaa\xaa\x9a\x23\x02\
-\x5a\x2c\xd2\xc1\x3a\x29\xd0\xf5\x11\xf6\xf8\xe9\x3a\x6c\x41\x00\
-\xae\xa3\xbf\xd9\xd2\xb0\xaf\xba\xba\x7a\x93\x74\xa1\xe7\xc9\x66\
-\xf7\x52\xe9\xb4\x2d\x05\x09\x9a\x8c\xa0\x2c\x94\xf7\x0a\x95\xc5\
-\x42\xc5\xef\x56\xbc\x01\xf9\xd2\xa7\x4f\xba\x14\x28\x9f\xa7\x64\
-\x9d\x7e\x4b\x59\xa3\xa7\x1f\x4e\x3f\x0c\xfc\x2d\x9d\xf4\xe2\xe2\
-\xe2\xb5\xcb\x96\x2d\x7b\x87\xca\xe9\x6e\x11\xfb\xb5\xfa\xfa\x7a\
-\x2b\x8b\x5b\x52\x41\x92\xc0\xd2\xa6\xfe\x58\x3e\x28\x03\x7e\x73\
-\x6f\x24\xba\x59\x1c\x93\x63\x40\x3e\xbf\xc3\xb2\x87\x2b\x1f\x99\
-\xe1\x72\x1d\x0d\x0c\x45\x26\x61\x80\x85\x1b\x8a\x23\x9f\xc4\x1b\
-\x49\x3e\x0d\x16\xcf\xca\xcd\x10\x96\x0f\x46\x9a\xc6\x68\x96\x27\
-\x32\x4c\x5e\x18\x61\xdd\x2c\x1f\xfc\xb6\xf0\xfc\xb6\xf4\x6f\x54\
-\x07\x83\xc9\x09\xcb\x07\xfc\x0f\xeb\x00\xa2\x69\x5a\x78\xd3\x29\
-\x11\xc2\xe5\x96\x0a\x23\x2d\x5f\x0b\x4b\x3c\xf4\x41\x0e\xe0\xb7\
-\xe5\x09\x10\x2e\x2a\x77\xa4\x69\x02\x0b\x1f\x4e\x03\xf0\xdb\x1c\
-\x48\x94\xee\x60\xb8\x11\xbd\x86\x8c\xb0\xd2\xc3\x45\xa0\x54\x45\
-\x45\xc5\xab\x62\xb1\x58\x51\x57\x57\x17\x56\xcb\xaa\xca\xca\xca\
-\x45\x22\x25\xc6\xc9\xcd\xec\xc7\x25\x43\xf3\xe5\xcb\x97\x1f\x9d\
-\x38\x71\x62\xae\x30\xaf\xbb\xbb\xbb\x4f\xfc\x61\x99\x95\xd8\xd8\
-\xb5\xa3\x47\x8f\x32\x34\x9a\x88\xc8\xc2\xe0\x77\x9f\xd2\xdd\xa6\
-\xf4\x17\x48\xc6\xa2\xfc\xfc\xfc\x96\xdd\xbb\x77\x43\x82\x8c\xe1\
-\x53\x98\x26\x97\xb0\xe1\x6b\x03\x61\xda\x9e\x7b\xee\xb9\x67\xa7\
-\x4f\x9f\x7e\xbf\xac\x3a\x96\xaf\x6f\x17\x09\x72\x10\x32\x96\x6e\
-\x58\x06\x08\xcb\x09\x20\xc2\x3e\x3b\x6d\xda\xb4\x95\x8a\x5b\x24\
-\x1d\x82\x1e\x92\x38\x30\x2d\x2f\x2f\x2f\x57\xe4\xb8\x6b\xcf\x9e\
-\x3d\x5f\x12\x09\x32\x07\xf2\x82\xb8\x71\x98\x3e\xdc\xab\xd9\xb0\
-\x61\xc3\xdb\x95\x9f\x57\xb4\xb5\xb5\xe5\x29\x7e\x07\x1d\x03\x95\
-\x17\x4b\xa2\x13\xc5\xbd\x1d\x40\x0f\xd3\x85\xff\xa3\xd1\x43\x36\
-\x39\xe1\x3c\xde\xa8\x6c\xe2\x9b\x1b\x2d\x0c\x45\xe6\x48\xd2\x1b\
-\x4c\xe6\x70\x80\x9c\x44\x65\x79\xa3\xf2\x4d\xc6\x8d\xca\x31\x0c\
-\x26\x8b\x7b\xe1\xe7\x6f\xbf\x47\x2b\xfd\x28\x12\xc9\x8f\xea\x10\
-\x05\xf7\xcd\x25\xc3\x50\xc2\x80\xa1\x86\x4b\x85\x68\x7c\xae\x53\
-\x95\x99\x85\x4f\x76\x7f\x28\x88\xa6\x31\x5a\x32\x6f\x54\xc6\xa0\
-\x18\x29\x11\x5a\x83\x5d\xb8\x60\xc1\x82\x57\x76\x74\x74\x64\xc9\
-\x7a\xea\x15\x91\x75\xab\xa1\xaf\x98\x33\x67\xce\xfa\x92\x92\x92\
-\xca\x2b\x57\xae\xb0\x60\xc0\xf6\xde\x25\x02\xfe\xbd\x6a\xdc\xf7\
-\xcb\x1a\xbb\x36\x7b\xf6\xec\xc5\x22\xd4\x6c\x91\x47\x97\x88\x31\
-\xff\xe9\xa7\x9f\xfe\x9e\x64\x33\x41\x6a\x24\xc4\x7f\x26\xc5\x19\
-\xdf\x7e\xde\xe2\x18\x81\xeb\xee\x8b\x17\x2f\x6e\x93\x9c\x35\x87\
-\x0f\x1f\xfe\xae\xe2\x46\x37\xba\x07\x72\x0a\x0b\x0b\x1f\x96\x75\
-\x36\x5f\x69\x31\x39\x6f\xb2\x03\xf9\x22\x9c\x0b\x4d\x4d\x4d\x99\
-\xb2\x2e\xf3\x1e\x7d\xf4\x51\xc6\xea\x59\x44\x10\x96\x61\x69\x32\
-\x81\xcb\x3e\x20\xc6\xfb\x4d\x37\x16\xfb\xf4\x4d\x99\x32\x65\x95\
-\x8a\xa2\x43\x84\x98\x25\x42\x4e\x7b\xe2\x89\x27\xfe\xe9\xec\xd9\
-\xb3\xff\xc4\x7d\x39\xe2\x27\x7a\xa8\xe6\x5f\xb2\x72\xe5\xca\xd7\
-\xcd\x9a\x35\xeb\x8d\x22\xc0\x4a\xe9\xd8\xae\xb2\xed\x97\xac\x09\
-\xb2\x0e\x73\xce\x9c\x39\xc3\xd7\xa9\xc3\x43\xd0\x0e\x87\xc3\xe1\
-\xb8\x01\x8c\x94\x08\x8d\x3c\xee\xe2\xdb\x83\x22\x9c\x4e\x35\xd6\
-\x8c\x06\xf2\xb5\x09\x86\x47\x7b\x65\xbd\xcc\x61\x95\x65\x63\x63\
-\x63\x97\x7e\x33\xc9\x9c\x0a\xe9\x22\xbf\xd3\x6a\xe4\x8f\x28\xce\
-\x3c\x5d\x57\xa6\xa7\xa7\x9f\x3b\x7e\xfc\x38\xa7\x24\x0c\x90\x87\
-\xd2\x98\xbf\x79\xf3\xe6\x8f\xca\x4a\x2a\x39\x7f\xfe\x3c\x2b\x9b\
-\x20\xa7\x30\x21\x70\xdd\x29\xd2\xf9\x89\x74\x62\x75\x20\x64\x69\
-\xa4\x13\x90\x59\x41\x41\x41\x2d\xc7\xb0\x49\xc6\xdd\xb2\xfe\x1e\
-\x15\x61\xd9\x81\xdb\x84\x0b\xc2\x4a\xdf\xa7\x24\xe3\xdf\x75\x69\
-\x43\x98\x26\xc3\xae\x63\x6b\xd7\xae\x7d\x8b\x08\xff\x8d\xe7\xce\
-\x9d\x7b\x5a\xe4\xcf\x02\x87\xe0\x9e\xe2\x9e\x17\x89\x2e\x13\x71\
-\x4d\x15\x71\x3d\xb7\x7d\xfb\xf6\x2f\x63\x0d\xea\x1e\x69\x00\x93\
-\x15\x46\x10\x57\x04\xbd\x51\x24\xf8\x1e\xc5\x5d\x2c\x39\xdd\xca\
-\x6f\x0f\x65\xca\x7d\x95\x09\x73\x8c\x25\xd2\x8b\x55\x6d\xb6\xcc\
-\x3d\x91\x2c\x87\xc3\xe1\x70\x0c\x03\xd6\x38\x8f\x14\xad\x22\x81\
-\xab\xb2\xde\x38\x39\x06\x52\x0d\x88\x09\x52\xd4\xef\x66\x35\xe6\
-\xa5\xb2\xce\xb0\xe0\x00\x8d\xbd\x21\x7c\x0d\x88\x87\x2e\xc7\x77\
-\xef\xde\xfd\x19\x59\x6b\x07\x8e\x1d\x3b\xc6\xca\x26\xac\x49\xfc\
-\xb9\x9f\xb3\x66\xcd\x9a\x37\x34\x34\x34\xf4\x88\xbc\x36\x89\x88\
-\x58\xc2\xcf\x2a\x43\xc8\xc0\xe4\xd9\x35\x43\xb3\xac\x90\x33\x98\
-\x8c\x99\x22\x41\xf6\x34\x66\xb6\xb6\xb6\x66\x2e\x5b\xb6\x8c\xe5\
-\xd6\x9c\xb4\x61\xe9\x1b\x88\x8b\x8c\x80\xa0\xf0\x10\xec\xba\x40\
-\x69\xbf\x4f\x3a\x6c\x96\x2e\xdd\xd2\x89\x73\x2f\x59\x35\x86\x0c\
-\xca\xa0\xeb\xd9\x67\x9f\xfd\x71\x2c\x16\x7b\x66\xdb\xb6\x6d\x6c\
-\xc2\x67\x4e\xcf\xd2\x0f\x13\x17\xf2\x4c\xef\xe0\x7f\xdc\x22\xae\
-\x14\xe9\x35\xab\x0c\xcd\x5f\x3f\xfb\xd2\x25\xaf\x40\x44\x88\x4e\
-\x90\xb3\xc3\xe1\x70\x38\x46\x09\x23\xb5\x08\xad\x41\x7f\x4e\x16\
-\xca\x76\x59\x5f\xcd\xd3\xa6\x4d\xab\x52\x83\x5d\x2a\xeb\xa7\x47\
-\xd6\x5c\x3f\x8d\x77\x7e\x7e\x7e\xfa\x9e\x3d\x7b\x58\x8e\xcb\x3e\
-\x17\xc8\xc0\x88\xca\xfe\x87\x61\x7e\x9d\xb2\xb2\xf6\xb6\xb7\xb7\
-\x63\xf9\x0c\x6c\xa9\x90\xac\x07\x27\x4f\x9e\xcc\x17\xeb\xd9\xbb\
-\xc4\x10\xec\x0c\x3e\xde\x2b\xcb\x90\x55\x94\x10\x57\x54\x9e\xc1\
-\xd2\x2b\x58\xb5\x6a\xd5\x17\x44\x60\xf3\x64\x65\xb5\xcb\x49\x54\
-\xef\x24\xe9\x7d\xd7\x85\x0b\x17\xb0\xfe\xa2\xf3\x90\x61\x98\x8c\
-\x32\x48\x50\x59\x5c\xa4\xf4\xdb\x90\x21\x82\xaa\x14\x21\x8a\xbf\
-\x82\x61\xd6\x20\x9c\x74\x3f\x2f\x99\xbb\x75\x1d\x1d\x56\x35\x98\
-\x3c\x43\xf0\xfb\xf2\xe5\xcb\x59\xb2\x32\x97\xa9\x03\xc1\xe2\x1a\
-\x16\x0c\x4d\xc8\xcc\xcc\xcc\x53\x47\xa3\x49\xf7\xfe\xed\xc9\x27\
-\x9f\x64\xb9\x3a\xd6\x20\x08\xc7\x77\x38\x1c\x0e\xc7\x08\x31\x52\
-\x22\x0c\xa3\x47\x0d\xff\xb1\x33\x67\xce\x3c\x9a\x93\x93\x93\x5e\
-\x5e\x5e\x3e\x4b\x04\x93\x2b\xd7\x23\xab\x06\x52\x63\x13\x3d\x2b\
-\x2e\x69\xb8\x63\x4b\x96\x2c\xf9\xb5\x2b\x57\xae\x30\x64\x19\xde\
-\xfb\x13\x06\xbf\x21\xc0\x01\x12\x94\xab\x5c\xb7\x6e\xdd\xaf\x34\
-\x37\x37\x63\x6d\xf6\x33\x5c\x28\x92\xe8\x92\xab\x9c\x3e\x7d\xfa\
-\x22\x91\x21\x56\x57\xca\xb9\x48\x59\x6e\x9f\x16\x39\xdf\xab\x38\
-\xc1\xf6\x0a\xfc\x74\x0d\x81\xce\x16\xa1\x96\x4b\x06\xfb\x91\x48\
-\x2b\x91\x3e\xf8\x97\x4b\xc6\xfb\x95\xaf\x59\x92\x03\x09\x32\x0c\
-\xcc\x30\x6a\x5f\x75\x75\xf5\x0c\xe5\x9f\x3d\x4d\xe1\x93\x61\xec\
-\x74\x85\x30\x61\x71\xcf\xe4\x2d\x51\xba\x2f\x6d\x6c\x6c\xb4\xbd\
-\x35\xa0\x63\xea\xd4\xa9\x9b\x44\xd6\xca\x66\x86\x8a\x33\x27\xfd\
-\xb9\xe7\x9e\xdb\xb1\x7f\xff\xfe\xaf\x88\x6c\xd9\xc4\x0d\x59\x3b\
-\x1c\x0e\x87\x63\x14\x31\x1a\x44\x48\xc3\x8e\xd5\xd3\x59\x5f\x5f\
-\x7f\x50\x84\xb0\xaf\xa4\xa4\xa4\xac\xb4\xb4\x74\xae\x1a\xf4\xe3\
-\xb2\x8c\x38\xbd\x82\x30\x60\xc9\x82\x05\x0b\xde\x20\xcb\x6e\xb5\
-\x08\xac\x54\x24\xc9\x89\x06\x34\xee\x66\x2d\x46\x11\xf8\x2f\x5d\
-\xba\x94\x2f\x0c\xb0\x59\xb5\x39\x4e\x62\x9c\x1c\x03\x91\x11\xb7\
-\x7c\xd6\xac\x59\x2b\x65\x99\xb2\xc7\x8e\x4d\xa3\x96\x16\x30\xb9\
-\xab\x66\xcf\x9e\xfd\xbb\x6d\x6d\x6d\x4d\x22\x18\xfc\x02\x40\x66\
-\xb2\xee\x3a\x65\x6d\x2e\x97\xde\xcc\xe3\xd9\xb7\xcb\x4c\x17\x23\
-\xad\x19\x1b\x36\x6c\xf8\xb0\xf2\x33\x45\x24\xd8\x6a\x3a\x08\xa8\
-\xd1\x8d\x65\x59\x51\x51\x11\x63\xfb\x05\x7e\xd7\x6f\xbd\x00\x26\
-\x8b\xd5\xb5\xbf\x58\x5b\x5b\xfb\xe6\xe2\xe2\xe2\x39\x4a\x97\x63\
-\x9a\x4c\xef\x76\xdd\x5b\x2e\x0b\x90\x8d\xbc\x07\x77\xef\xde\xfd\
-\x95\xba\xba\xba\x1f\xeb\xda\xb6\x6e\x38\x1c\x0e\x87\x63\x94\x31\
-\x1a\x44\x08\x68\xe0\x69\xa8\x71\x4d\x57\xaf\x5e\xdd\x2d\xd7\x7c\
-\xed\xda\xb5\x2b\x22\x0f\x0e\x57\x25\x9d\xfe\x9a\x9a\x9a\x57\x67\
-\x66\x66\x56\xb1\x12\x52\xbf\xe7\x8b\x9c\x56\xb4\xb6\xb6\x5e\x95\
-\x45\x99\xcc\x3a\x0c\x70\x59\x90\xd5\x55\x8d\x05\x28\x22\x62\xbf\
-\x61\x10\x4e\xff\x20\xb2\x0e\x11\x47\xa5\x08\x05\x12\xe3\x38\xad\
-\x20\x2d\xee\xc7\xff\x13\xf6\x42\x61\x61\x61\x86\x08\x6f\x8b\xc2\
-\x33\x2c\x1a\xc4\x97\xac\x5e\x59\x5d\x25\xb2\xca\xfe\x4a\xfa\xf2\
-\x85\x02\xfc\x2d\x2e\x30\x59\xeb\x94\xfc\x56\x11\x69\x83\x88\x74\
-\x60\xe3\xbf\xf4\x61\xd3\x7f\x81\xdc\xe9\xc7\x1f\x7f\x9c\x93\x0f\
-\xec\x98\xaa\x30\xf8\x6d\x72\xe7\xaf\x5e\xbd\xfa\xbd\xea\x24\xac\
-\x96\x75\xdb\xa6\x78\xd9\x59\x59\x59\xad\xb2\xf6\x58\x19\x4b\x5a\
-\x7d\xba\x2e\x54\xe7\xe1\xc0\xa9\x53\xa7\x18\x06\x0d\x7f\xad\x22\
-\xac\x97\xc3\xe1\x70\x38\x46\x09\xa3\x45\x84\x61\x04\x0d\xb7\x08\
-\xe7\x98\x48\x10\x62\xe2\x37\x43\x85\xa5\x8b\x17\x2f\x7e\xad\x88\
-\x2f\x43\x64\x48\xa3\xce\xbc\x5a\xa1\xac\xc3\xf5\x79\x79\x79\xc5\
-\xec\xdf\x93\x9f\xad\x10\x0d\x83\xdf\x4d\xb2\xf8\xf6\x2a\xec\xf4\
-\x58\x2c\x36\x03\x2b\x2e\x4e\x66\x0c\x93\xe6\xc8\xc9\xb8\x3c\x67\
-\x2b\x4c\x13\x02\x72\x2e\x2f\x2f\x9f\x2d\xf2\x59\x2a\x02\x0b\x86\
-\x6a\x25\x8b\x39\xcd\xff\x77\xe0\xc0\x01\xbe\xed\x95\x0a\xe7\x64\
-\xc1\xde\x25\xcb\x6f\xa2\xd2\x0a\x74\x14\x89\xf6\x89\xc4\x0a\x95\
-\x87\xa7\x45\x82\x7c\x9f\x2c\xd5\xd9\x79\x99\x53\xa6\x4c\x79\xe5\
-\xf2\xe5\xcb\xdf\xda\xd1\xd1\x51\xa2\x34\xdb\x54\x06\xc8\x98\xa0\
-\xbc\x17\x5c\xbc\x78\x91\x63\x9b\x82\xa1\x54\xca\x4c\xf7\xe9\x3c\
-\x80\x64\xf2\x1c\x0e\x87\xc3\x31\x4a\xb8\x11\x22\xa4\x91\xc6\x25\
-\x83\xdd\xb3\xa1\xc6\xa5\x33\x66\xcc\x78\x99\x88\x80\x13\x5b\x20\
-\x46\xe6\xd8\xd8\x7b\xd8\x27\x4b\x6d\xa1\xac\x43\x86\x27\x19\x2a\
-\x8d\x0e\x6f\x02\x7e\x77\x5e\xba\x74\x69\x6f\x65\x65\xe5\x44\x11\
-\xd8\x3c\x91\x52\x07\x44\x52\x50\x50\x90\x73\xe8\xd0\xa1\x6f\x74\
-\x5e\xdf\xa2\x11\x1e\xd6\x0c\x23\x90\xa7\xf8\xbb\x95\xce\x06\x91\
-\x57\xa5\xd2\xe6\xfc\xbd\xc3\xfb\xf6\xed\xe3\xab\xce\x1c\x40\x9c\
-\x2c\x2f\xc8\xec\x39\x7f\xfe\x7c\xe3\xac\x59\xb3\xd6\x29\x6e\xaf\
-\x88\x14\x12\x2d\x14\x61\xf1\x45\x7e\xbe\x05\x97\xec\xfc\x51\x50\
-\xb5\x69\xd3\xa6\xdf\x28\x2a\x2a\xda\xa2\x4e\x40\x57\x7a\x7a\xba\
-\x6d\x89\xe8\x57\xfc\x34\x59\x87\x15\xb2\xfe\xf8\x5a\x33\x44\x6a\
-\xfa\x27\xd3\x05\x70\x2f\xd5\x7d\x87\xc3\xe1\x70\x0c\x03\x34\xbc\
-\x23\x05\x0d\xb6\x35\xfc\x89\x1a\x66\xbb\x67\x2b\x26\x1f\x17\x71\
-\x7d\x45\xa4\xd7\xc5\x70\xa2\xae\x83\x06\x9f\xd5\x91\xac\x3a\xd5\
-\xef\x29\xfa\xcd\x36\x04\x10\x95\x67\xe4\xd0\x2d\xeb\xeb\xcb\x22\
-\xbd\x1f\xca\xa2\x62\xeb\x44\xae\xc8\xe5\x60\x63\x63\xa3\x7d\xf1\
-\xde\xd2\x22\x6c\x98\xe4\x89\x4f\x5e\x1b\x77\xec\xd8\xf1\x61\xe9\
-\xd0\x2a\x62\x6a\x95\xac\x8f\xc8\xcf\xbe\x10\x60\xfa\x02\x86\x3f\
-\x4d\x07\x64\x62\xbd\xed\x93\xd5\xba\x4f\x24\x96\x2b\x4b\xb0\x40\
-\x04\xfe\xe3\x27\x9e\x78\x82\xc3\x69\x6d\xc5\x6a\x38\x3e\xb0\xf8\
-\x33\x15\x67\xb1\xf4\x64\x7e\x92\xdf\xc8\x22\x6c\x7e\x4e\x4e\x4e\
-\xcf\xc9\x93\x27\xf9\x14\x11\x2b\x4e\x81\xe9\x1f\x95\x05\x4c\x1e\
-\xf7\x12\xdd\x77\x38\x1c\x0e\xc7\x08\x70\x23\x16\x21\x1f\xd0\xe5\
-\xa4\x76\x4e\x79\x31\x58\x63\x9d\x10\x67\xcf\x9e\x3d\x71\xee\xdc\
-\xb9\xc7\x58\x4c\x53\x5c\x5c\x5c\x2d\x02\x64\x9b\x00\xdb\x2d\xd8\
-\x87\x78\xf8\xe2\xc5\x8b\x9c\xe2\x0f\xc2\x0d\x7d\x58\x26\xd7\x69\
-\x97\x2f\x5f\x3e\x50\x51\x51\x91\x3e\x71\xe2\xc4\x45\xbb\x76\xed\
-\xe2\x74\x76\xe6\xd2\xc2\xa4\x3e\x4b\x56\xd8\x3b\x65\x61\xb2\x22\
-\xd3\xb6\x45\x20\x93\x30\x75\xb2\xee\x18\x4a\xfd\x99\x08\xe9\xb1\
-\xb8\x5f\x40\x76\x72\x60\xea\x96\x2d\x5b\x3e\x78\xfa\xf4\x69\xb6\
-\x6f\xd8\x09\xed\x01\x44\x84\xd7\x16\x2f\x5e\xbc\xb5\xbe\xbe\xfe\
-\x07\x07\x0e\x1c\xe0\x1b\x6e\x81\x3e\x72\xa6\xef\x40\xd8\x10\xae\
-\x4c\x9d\x3a\x75\x99\x8c\xc8\x62\x11\x62\x8f\xfe\xb3\x1c\x34\x4f\
-\x64\xbc\x5f\x44\xfc\x97\xd7\xae\x5d\xb3\x0f\x91\x26\x43\x58\x26\
-\xd7\x9c\xd6\xcf\x57\xda\xd9\x53\xe8\x70\x38\x1c\x8e\x1b\xc4\x88\
-\x89\x50\x84\xb0\x69\xe1\xc2\x85\xeb\x4a\x4b\x4b\xab\xae\x5c\xb9\
-\xc2\x76\x06\x16\x8a\xd8\x96\x81\x44\x84\x00\xf0\x6f\xbd\x7a\xf5\
-\xea\xa3\x22\xa9\x4b\xf3\xe6\xcd\x9b\x2f\xcb\xaa\x20\x16\x8b\xa5\
-\x1d\x3a\x74\xe8\x47\xba\xe6\x53\x3b\x01\xa1\x2d\x58\xb0\xe0\x6d\
-\x22\x09\x08\x22\x7c\xf2\xcb\x00\x2e\x5d\xba\xf4\x8c\xac\x29\x4e\
-\x97\x21\x0e\x44\x66\xf7\xd3\xd7\xac\x59\xf3\xce\x9e\x9e\x9e\x35\
-\xb3\x66\xcd\x9a\x2a\xf2\x65\x25\x67\xf8\x68\x33\x56\x9b\x1e\x13\
-\x09\xda\xb7\xef\x02\xbf\xf8\xff\xa2\x8d\x1b\x37\xfe\x86\x08\x7a\
-\x11\xab\x5a\x45\x98\xac\x24\x0d\xa7\xdb\x74\xe2\xc4\x89\x03\xca\
-\x2f\x16\x68\xd8\x1f\x98\x8e\x4b\xe7\xcf\x9f\xff\x80\x48\x93\xd5\
-\xa0\xc8\xed\x11\xc9\xab\x98\x4a\x17\x49\xa7\x8c\xdc\xdc\xdc\xb6\
-\xdd\xbb\x77\xff\xdd\xa9\x53\xa7\xbe\xa9\xdf\x43\x3d\x2a\x2d\xb7\
-\xb6\xb6\x76\x91\xf2\xb3\x59\x6e\x8d\xac\xd9\x34\xe9\x60\xf3\xaf\
-\x0e\x87\xc3\xe1\xb8\x01\x8c\x98\x08\xd5\xa0\xcf\xc9\xcc\xcc\x2c\
-\x94\x35\x57\xa0\xc6\xb9\xa6\xba\xba\x7a\x8e\x08\x26\xa7\x49\xd0\
-\xed\x54\xfb\xdd\x68\xbc\x21\x8d\xb3\x22\xc3\x3d\x85\x85\x85\x93\
-\xcb\xcb\xcb\x27\x1d\x3d\x7a\xf4\x1b\xf2\xb3\xfd\x86\xb3\x45\x84\
-\x6f\x95\xcc\xd5\x6d\xd7\x61\x1f\xcb\x8c\x36\xfc\x58\x45\x36\x9c\
-\x18\x10\xd1\xa4\x49\x93\x1e\x92\xbc\x7b\xdb\xdb\xdb\xaf\x89\xec\
-\x66\xce\x99\x33\x87\x15\xa5\x58\x7e\x61\xe2\x32\x59\xf8\xd9\xff\
-\x98\x48\xf0\xd7\x21\x41\x11\xf2\x73\xb2\xda\xaa\x25\xa3\x53\x69\
-\x43\x38\x46\x72\xb8\xa8\x25\x36\x20\x4b\x16\x2a\x5f\xc4\x7f\x47\
-\x5e\x5e\x1e\xdb\x22\x20\xe9\x20\x6c\x4b\x4b\x4b\xb7\xca\x88\xaf\
-\x47\xec\x67\x38\x55\x04\xc8\x9c\x60\x58\x87\x64\x28\xae\xaa\xaa\
-\x5a\xb1\x6c\xd9\xb2\x2d\xca\x0b\x9d\x06\x2c\xe7\x3e\x59\xa4\xf5\
-\x8d\x8d\x8d\xe8\xe5\x70\x38\x1c\x8e\x1b\xc4\x88\x89\x50\x16\xce\
-\x3c\x91\x58\xb1\x1a\xf5\xee\xae\xae\x2e\xce\x17\xcd\x2e\x2e\x2e\
-\x9e\x31\x7b\xf6\xec\x79\x22\x90\x02\x11\xc8\x79\x05\x4b\xd6\xc8\
-\xe3\x0f\xb9\xf0\xb5\x87\x7d\xb2\xec\xd8\x03\xc8\xf6\x87\x20\x7c\
-\x4d\x4d\xcd\x03\x59\x59\x59\x35\xad\xad\xad\x1d\x25\x25\x25\x6b\
-\x64\x0d\x95\x1d\x3b\x76\x0c\xf2\xc0\xe2\x84\x3c\x0c\x46\x50\x46\
-\x28\xd3\x57\xad\x5a\xf5\x36\x71\x31\xdf\x22\x64\x2e\xae\x43\x44\
-\x3d\x4b\x04\x92\x2d\x59\xf6\xf9\xa2\x84\x20\x9e\xf2\xb2\x4e\x71\
-\x38\xde\x2c\x53\x84\xd8\x33\x63\xc6\x8c\xd9\xa7\x4f\x9f\xc6\xb2\
-\x0b\x6f\x8b\x08\x93\x97\x5d\xe7\xdc\x7f\xff\xfd\xbf\x22\x9d\x5f\
-\xa5\xbc\x33\x67\x18\x2b\x28\x28\xe8\x56\xde\xec\x4b\xcf\xed\xb2\
-\x7a\x4f\x1f\x38\x70\xe0\xbb\x4a\x23\xd1\x9c\x24\x72\xc2\xba\x15\
-\x2a\xed\x4d\x58\xdd\xf9\xf9\xf9\x33\x55\x96\xdc\xc3\xaa\x25\x5f\
-\xe9\xfa\xdd\xd4\xd0\xd0\xe0\x44\xe8\x70\x38\x1c\xa3\x00\x1a\xe4\
-\x11\x41\x16\x61\x9a\x1a\xe5\x5c\xe6\xbc\xd2\x04\x91\x07\x2b\x40\
-\x3b\x64\xfd\xc4\x66\xce\x9c\xc9\xf9\xa2\x89\x16\xbe\x84\xaf\x6d\
-\x5e\x0e\x72\x83\x08\x39\x49\x06\x72\x28\x14\xc9\xd6\x4a\x16\x8b\
-\x6a\x18\xc6\x6c\x39\x7f\xfe\xfc\xdd\xeb\xd6\xad\xe3\xeb\xf0\x7c\
-\x05\x99\x30\x26\xe7\x79\x8b\x4b\x64\x45\xbe\x51\x84\x97\x2f\xbd\
-\x82\x53\x69\x44\x82\x19\x22\xa6\x56\x11\xeb\xfd\xb2\xd6\x5e\x1a\
-\x0f\xf7\x02\x7d\xca\xca\xca\x5e\xa7\xb0\x5b\x65\x6d\xb5\x90\x15\
-\xfc\x24\xa3\xa7\xb9\xb9\xb9\x68\xe9\xd2\xa5\x9c\x25\x1a\x86\x11\
-\x18\x71\xb9\x2e\x5b\xbf\x7e\xfd\x07\x2f\x5c\xb8\x70\xb7\x48\xb4\
-\x15\x9d\x25\xa7\xab\xa8\xa8\x88\xaf\x44\xf3\x95\x66\xd0\x71\xfc\
-\xf8\x71\xbe\x0c\x6d\xa7\xe5\x98\xde\x06\x93\x69\xcf\xa3\x52\x16\
-\xe4\x52\x11\x7a\xba\x3a\x19\x1d\xd2\xa5\x4f\xe5\x40\x31\xeb\x32\
-\x33\x97\x13\x67\xe2\xe1\x1c\x0e\x87\xc3\x71\x83\x18\x71\x83\xfa\
-\xf4\xd3\x4f\xef\x95\xc5\xf3\x98\x08\xb1\x49\x8e\xbd\x81\xd9\x71\
-\x52\x84\x10\xc3\x43\xa3\xa5\x8b\x16\x2d\xe2\x13\xfe\x65\x72\x61\
-\x12\x01\xfc\xc6\xa1\x87\xf9\x95\xcb\x0a\xc2\xd2\xc4\x2f\x38\x4e\
-\x4d\xb2\x9b\x25\xb3\x66\xc5\x8a\x15\xbf\x2d\x82\xa9\xc1\x5f\xce\
-\xc2\x0f\x40\x71\x4e\x33\xdf\x28\x42\x1a\xb8\x27\x62\xea\x93\x75\
-\x97\x56\x51\x51\xb1\x30\xee\x15\x46\xa0\xcf\xe4\xc9\x93\xa7\x29\
-\xce\x04\x91\x61\xe0\x29\xb0\xb5\x21\x23\x3b\x3b\xbb\x47\x56\x1c\
-\x8b\x59\xa2\x40\x3e\x71\xe7\x88\xa0\x7f\x5b\xd6\xf0\x3c\x74\x44\
-\x57\xfc\xa5\x2b\xe7\xac\x42\x82\x7c\xe0\x17\x10\x3e\xb8\x17\x77\
-\x60\x40\x47\x59\xbd\x15\x1b\x36\x6c\x78\x99\x2e\x27\x5d\xf7\x99\
-\xd0\xa6\xf4\x39\xc6\x0d\xc2\xcc\x90\x5e\x39\x2a\xe3\x74\x91\x7a\
-\xdd\xb5\x6b\xd7\x76\x1f\x39\x72\x84\xa1\x5e\x87\xc3\xe1\x70\x8c\
-\x02\x6e\x64\xd5\x68\x8b\x88\xf0\xcc\xb9\x73\xe7\x8e\xc8\x5d\x54\
-\xc3\xdf\x5d\x58\x58\x98\x2f\xf2\xc8\x17\x21\xa6\x73\x3a\x8a\xc2\
-\xb0\x3f\xaf\x52\x44\xb8\x75\xea\xd4\xa9\x10\x58\x81\xac\x1c\xbe\
-\x9e\x10\x9d\x43\x34\x82\x80\x1c\xea\x4f\x9d\x3a\x75\x4c\xd6\x1d\
-\x73\x62\xa5\x92\xd5\x25\x42\xc8\xd0\x7f\xbe\xfa\x5e\x54\x59\x59\
-\x59\xcb\x8a\x4f\x85\x8b\x0e\x93\x4e\xa8\xab\xab\x7b\x4a\xa4\x82\
-\xc5\xc4\xc2\x14\xe2\x4d\x90\x75\x96\x29\xdd\x5a\xf7\xed\xdb\xf7\
-\x15\x05\xb1\xb3\x40\x0d\xc1\xb5\xc8\xe5\xd4\x9c\x39\x73\x56\x8b\
-\x68\xb2\x45\x3a\x7d\x8a\xcb\xfe\xbe\xac\xfd\xfb\xf7\x7f\x43\x16\
-\xd9\x7f\xc6\xc3\x85\x09\x8c\xeb\x9c\x95\x2b\x57\x7e\x42\x04\x5a\
-\x26\xdd\x38\xad\x06\x1d\x59\x05\x9b\x27\xb2\x7e\x6e\xdb\xb6\x6d\
-\x5f\x56\x98\x81\x83\xb8\xe3\x2e\x8a\x92\xea\xea\xea\xf5\xf3\xe6\
-\xcd\xdb\x28\x39\x2c\xec\xe1\x23\xc2\x94\x0f\xf3\xae\x4b\x24\x2b\
-\x53\x72\x9b\x45\xe4\x47\x8e\x1d\x3b\xb6\x5b\xf9\x7e\x8c\x32\xd7\
-\x7d\x16\xd9\x38\x1c\x0e\x87\x63\x14\x70\x23\x44\x48\x03\x8f\xc3\
-\x6a\x69\x52\x03\x7d\xfa\xfc\xf9\xf3\xcf\xa8\x31\xaf\x97\xf5\x12\
-\xab\xaf\xaf\x67\x35\x27\x44\x58\x35\x6d\xda\xb4\x99\xcd\xcd\xcd\
-\xbd\x65\x65\x65\x55\x6a\xf8\xe7\xa9\x81\xcf\x68\x6c\x6c\xe4\x83\
-\xb6\xd1\x21\x42\x80\xcc\xab\xa7\x4f\x9f\x7e\xb4\xb8\xb8\xb8\x42\
-\xa4\x52\xcd\x1c\xa4\xe2\x60\x1d\x66\xc8\xfa\xba\x78\xf9\xf2\x65\
-\x88\x30\x4c\x4c\x06\x56\x53\x1e\x9c\x38\x71\x62\x49\xfc\xc3\xbb\
-\x1d\x05\x05\x05\x79\x8f\x3d\xf6\xd8\x77\x45\x88\xac\x1e\x35\xab\
-\x2c\x0c\xfc\xf8\x52\x7e\x8f\x74\x5b\x21\xd2\xe9\xcc\xca\xca\xca\
-\x17\x09\x7f\x4b\x84\xfc\xaf\xf1\xfb\xe1\xb4\xec\xba\x4f\x56\xe6\
-\x0a\xe9\xc5\x97\xec\x25\xbe\x77\x82\xd2\x2c\x68\x69\x69\x61\x5b\
-\xc4\x17\xe5\x07\x61\x85\xc3\x87\x91\xa5\x32\x59\xb5\x64\xc9\x92\
-\xbb\x45\xda\x53\xd5\x39\xe8\xce\xcb\xcb\x4b\x3f\x73\xe6\x0c\xf3\
-\xaa\x6c\xac\x2f\x10\xa1\x17\x49\xce\x1e\x75\x28\x76\x2a\x4f\x27\
-\x94\x6f\x48\x1c\x59\xc8\x0c\xe7\xd9\xe1\x70\x38\x1c\x37\x80\x1b\
-\x21\xc2\x30\xac\x71\xc6\x4a\xbb\x26\x12\xc4\x12\xe2\x9a\x86\x7b\
-\xca\xcc\x99\x33\xe7\x8a\x60\x3a\xb0\xea\x44\x4e\x31\x35\xf2\xd5\
-\xd3\xa7\x4f\xaf\xbe\x78\xf1\x22\x7e\xe1\xef\xeb\x19\x71\x40\x3e\
-\x1d\xb2\xd4\xf6\x88\x90\xda\x44\xa0\x8b\x14\x9d\x79\xc9\x0c\x59\
-\x69\x3f\x92\xf5\xc4\xd6\x07\xc2\x00\x0b\x0f\x02\xa2\x10\xa9\x3d\
-\x29\x12\x9d\x24\x42\xc3\x32\x3c\x24\x4b\x8a\x4d\xeb\xdc\x0b\xee\
-\xcb\x11\xde\xc8\x04\x3f\x98\xec\xa4\xd2\x99\x1f\x8b\xc5\x66\xb5\
-\xb5\xb5\x7d\xef\xc0\x81\x03\xdf\x91\x37\xe1\x20\x6b\x8b\x13\x8e\
-\xdf\x27\xfd\x32\x94\x8f\x65\x0a\xdf\x2b\xc2\x8e\x89\xd0\xbe\x77\
-\xf8\xf0\xe1\xaf\xe9\x1e\x67\xa9\x86\xc3\x1b\x28\xef\x85\xeb\xd6\
-\xad\x7b\xa9\xac\xe7\x39\x8a\x87\xf5\xd9\xa9\x32\x48\x13\x11\xe6\
-\x89\x08\x39\x1d\x07\x22\x6c\x53\x1e\x9e\xd6\x7f\x3e\xf8\x6b\x96\
-\x6f\x58\x8e\xc3\xe1\x70\x38\x46\x09\xa3\x45\x84\x61\x44\x1b\xed\
-\x36\x11\x5f\x86\x48\xa9\x54\x64\x93\xa3\x46\x9f\x7d\x75\x5d\x22\
-\xb8\xfc\x85\x0b\x17\xce\x97\xd5\x45\x63\x0f\x19\x42\x1c\x00\x9d\
-\x06\xc8\x47\x16\xd6\x31\x59\x9a\x27\x6b\x6a\x6a\x96\xc8\x22\xcc\
-\x94\xa5\x68\xdb\x2c\xb8\x0f\xd1\xf0\x55\x0a\x86\x5a\x8d\x7c\x40\
-\xff\xd5\xab\x57\x0f\x61\x89\xca\xaa\xe2\x5b\x83\xf6\x55\x89\x20\
-\xce\x8c\x19\x33\x1e\x10\x51\xce\x93\x55\xca\x99\x9e\x03\xfe\xb2\
-\xba\xda\x64\xe5\x75\x3d\xf9\xe4\x93\x10\xa7\xc9\x37\x42\x2b\x96\
-\x9b\x27\x77\x59\x2e\x80\xf2\xd2\x28\x2b\xf2\x6e\xe5\xad\x67\xe7\
-\xce\x9d\x5f\x55\x9a\x7c\xca\x89\x78\x80\x38\xe4\x25\x4c\x86\xb3\
-\xef\xb9\xe7\x9e\x57\xb0\x08\x46\x04\x48\x27\x20\x4d\x16\x21\xe8\
-\x38\x79\xf2\xe4\x7e\xe5\x15\xf2\x63\x75\xa8\xc5\xb1\x78\x0e\x87\
-\xc3\xe1\xb8\x49\xb8\x19\x44\x18\x45\x97\xac\x9b\x93\x72\xa7\x45\
-\x7c\xe9\x19\x19\x19\x65\x22\xc1\x6c\xc8\x90\x95\xa6\xb2\xd6\x20\
-\x23\x3b\xc1\x85\xf3\x3f\xb1\x80\x8c\x9c\x20\x44\xae\x2f\x9f\x3d\
-\x7b\xf6\x69\x11\x47\x87\x48\x84\x21\x4e\x88\x02\x97\xb7\x79\xf3\
-\xe6\x0f\xcf\x9a\x35\x6b\x8e\x08\xf2\x71\xfd\x0e\x7f\xc3\xb0\xe7\
-\xc2\x85\x0b\x4f\xe8\xbf\x6d\xcb\x08\xe4\xc9\xe2\x9b\x59\x5b\x5b\
-\xfb\x0e\x59\x7f\x0b\x74\xff\xa0\xf4\x80\x84\x83\x38\xb2\x3a\x2f\
-\x8b\x74\x99\xdb\x44\x0e\x30\x12\x64\x8f\xe1\xbb\x44\x7a\x2f\x91\
-\xd5\xb6\x4d\xbf\x19\xf2\x05\x9d\x90\xbb\xac\x40\xac\x47\xb6\x77\
-\x58\x78\xe4\x99\xfe\xf6\xf5\x7a\xfc\x73\x2b\x2b\x2b\xd9\x9f\xd8\
-\x27\xeb\x36\x5b\xae\x1d\x02\x7c\xe6\x99\x67\x7e\x2e\x12\xc4\x1a\
-\x4c\x7a\x68\xb8\xc3\xe1\x70\x38\x6e\x0e\x6e\x05\x11\x06\xa4\x20\
-\x12\x6b\x97\xf5\x77\x8a\x05\x21\x22\x83\xcc\xbc\xbc\x3c\x86\x2e\
-\x63\x71\x02\x63\xef\x5d\xf6\x9a\x35\x6b\x1e\x12\x11\x41\x1a\x58\
-\x89\x10\x47\x98\x58\x1a\x45\x82\x90\xcd\x80\xff\xc4\x89\x13\x37\
-\xca\xb2\x5b\xd7\xdc\xdc\x3c\x79\xce\x9c\x39\x33\x43\xa7\xc8\x58\
-\x3c\x48\x15\x79\x80\xdf\x19\x2b\x56\xac\x78\x8f\x48\xa7\x5c\xa4\
-\x97\x3e\x65\xca\x94\xe9\x17\x2f\x5e\xe4\x94\x18\x23\x3e\xc2\x58\
-\xf8\x01\x12\x14\xd9\xbe\x5b\x69\x2c\xd7\x75\x8e\x48\xfc\x6a\x6b\
-\x6b\x2b\x8b\x5a\x82\xfb\xf2\x47\x27\x23\x53\x80\x7f\x20\x43\xf2\
-\x17\x2f\x5f\xbe\x7c\x93\xc8\x13\xb2\x0f\x48\x5a\x7a\xd6\xa6\xa7\
-\xa7\x77\xab\x28\x0e\x40\x80\x71\x59\x76\xf2\x8d\xc3\xe1\x70\x38\
-\x6e\x31\x6e\x05\x11\x1a\x02\x42\x94\x6b\xc7\x42\x14\xe1\x9d\x61\
-\xf1\x4b\x43\x43\xc3\x69\xf9\x41\x04\xc5\xb2\xec\x56\x4e\x9d\x3a\
-\x75\x7e\x69\x69\xe9\xc4\x2b\x57\xae\x70\x2a\x0b\x43\xa0\x10\x8b\
-\x91\x84\xfd\x0f\x48\x6d\xee\xdc\xb9\x6f\xd0\xff\x12\xc9\x69\x93\
-\x65\x56\x5d\x53\x53\x33\x5d\xa4\x03\x19\xda\xbc\x1a\xe1\x40\x40\
-\x5a\x93\x27\x4f\xbe\xbf\xbc\xbc\xfc\x9e\x9e\xeb\x5b\x13\x7a\x72\
-\x72\x72\xa6\x32\x44\x29\x62\x0c\x9f\x1e\x63\x08\x48\x70\xdd\xba\
-\x75\xef\x96\x05\xb7\x46\xe1\x9b\x45\xe6\x1c\x91\x56\x10\x3f\x62\
-\xcd\x08\xd3\xf2\x65\x0e\xff\x49\xb2\x20\xef\xcb\xce\xce\x5e\x9e\
-\x99\x99\xc9\x19\xab\xcc\x99\x62\x45\xb2\x05\x22\xed\xe8\xd1\xa3\
-\x3f\x6b\x6b\x6b\x33\x0b\x90\x38\x0e\x87\xc3\xe1\xb8\x4d\xa0\xf1\
-\xbf\x55\x80\x58\x70\x46\x18\x57\x65\x15\xfd\x44\xff\x99\xdb\x03\
-\x1c\x1f\x96\xde\xd8\xd8\xd8\x2a\x4b\x71\xb6\xac\xb0\xff\x32\x6d\
-\xda\x34\xe6\xff\x40\xd8\xaa\x33\xe2\xe0\xe0\xee\x2a\x59\x68\x7d\
-\x22\x29\xfc\x9a\x14\x77\xf9\x4b\x5f\xfa\xd2\x77\xea\xda\xe6\xe6\
-\x00\xf7\x88\x5f\x31\x7b\xf6\xec\x07\x65\x81\xb5\xcb\x22\x03\x19\
-\x22\xa3\x76\x91\xef\x83\xba\x37\x39\x1e\xc6\x64\x83\xf4\x97\xbf\
-\xfc\xe5\xef\xe8\xec\xec\x5c\x0d\x09\x92\x86\xd2\xea\x2d\x29\x29\
-\xa9\xd2\x3d\x36\xf6\x03\xc2\x5b\x3a\x81\x8e\x22\xf2\x5a\x91\xe0\
-\x6b\x94\xce\xb4\xae\xae\x2e\x36\xe8\x67\xcb\x7b\x60\x63\x7d\x9c\
-\x44\xc3\xdb\x38\x2c\xbe\xc3\xe1\x70\x38\x6e\x03\x6e\x25\x11\x1a\
-\x68\xf8\x8d\xd0\xc2\xc4\xd3\x24\x02\x7c\xae\xa8\xa8\x88\xad\x0b\
-\xdd\x22\xb5\xb4\x29\x53\xa6\x6c\xd9\xb0\x61\xc3\x03\xba\xc7\x42\
-\x15\x23\x0c\x8b\x7b\xf5\x91\x47\x1e\xf9\xb2\x88\xa9\x5b\x04\x0a\
-\xd9\x80\x46\x59\x5c\x9b\xf5\xff\xe5\xd7\x7f\x3e\xcf\xe2\x6d\x10\
-\x29\x9d\x13\x01\x66\xe9\x1a\xd2\x62\xcf\x5f\x16\x7e\xdc\x23\x40\
-\x1c\x16\xe7\xe5\xd2\x81\xd3\x62\x82\x6d\x0b\xa4\x21\xe2\xed\x21\
-\x4d\xfd\x0e\x7f\x84\xd7\xfe\x97\x88\xbc\x1f\xac\xaa\xaa\xda\xdc\
-\xdc\xdc\xcc\x42\x1a\x56\x92\xe6\x8b\x6c\xd9\x12\xc1\x11\x6d\x06\
-\xcb\xb7\xe5\xc7\xe1\x70\x38\x1c\xb7\x11\xb7\x72\x68\x74\x30\x74\
-\x9e\x3e\x7d\xfa\xa8\x38\xb0\x7d\xf2\xe4\xc9\x7c\x38\x37\x57\xd6\
-\x58\x87\x08\xa8\x6c\xee\xdc\xb9\x0b\xce\x9c\x39\x03\xf9\xd8\x99\
-\x9f\x46\x40\x97\xe5\xff\xac\xee\xaf\x10\x01\xe6\xea\x77\x4f\x76\
-\x76\xf6\x04\xf9\xb1\xcf\x90\x45\x32\xe1\xb0\xbd\x67\xcf\x9e\x3d\
-\x21\xab\x70\x0d\x5b\x38\x44\x54\xe9\x79\x79\x79\xed\x3b\x77\xee\
-\xe4\xc3\xba\x03\x0b\x66\x42\xff\x27\xc9\x5a\xac\xed\xe8\xe8\xe8\
-\x52\xd8\x1c\x91\x5a\xdb\xf6\xed\xdb\xbf\x20\x7f\x3b\x30\x3b\x1c\
-\x96\x8f\xef\xbe\x52\x04\xc8\x42\xa0\xce\xeb\x0b\x41\x73\x5a\x95\
-\x9f\x6d\x47\x8f\x1e\xdd\xad\xfb\xa9\x0e\x21\x77\x38\x1c\x0e\xc7\
-\x6d\xc4\xed\xb0\x08\x53\xa1\xf7\xca\x95\x2b\xfb\x77\xed\xda\xf5\
-\x2f\xb2\xc4\x9e\x11\xf9\x64\xf7\xf4\xf4\xf4\xea\x1a\x2b\x8e\x0f\
-\xf1\x46\x01\x91\x1f\x15\x41\x7d\x4e\xd6\x1a\x24\x59\x24\x42\x64\
-\xf1\x89\x1d\x8b\x66\x64\x05\xc8\xeb\x05\x11\xdf\xb7\x45\x96\x59\
-\x22\xaa\x2c\xa5\xf3\x6d\xf9\x61\x11\x5a\x39\x18\xb1\x81\x27\xe2\
-\xd6\x5c\xa1\xf4\x68\x91\x25\xf8\x79\x5d\xdb\x76\x8b\x28\x0a\x44\
-\x96\xac\x84\xed\x95\x1e\x59\x75\x75\x75\x87\x94\xce\x3f\x5f\xb8\
-\x70\x81\xb9\x41\x93\xe7\x70\x38\x1c\x8e\x31\x88\xb1\x46\x84\x46\
-\x5c\x4d\xfb\xf6\xed\xfb\x8f\x1d\x3b\x76\xfc\xa0\xa4\xa4\xa4\x25\
-\x33\x33\x13\xc2\x0b\x7f\x00\xd8\x2c\x59\x86\x38\xb9\x3e\x25\xa2\
-\xfa\x5c\x69\x69\x29\xdb\x2b\x6c\x33\x3f\x79\x43\x9e\xe5\xd1\xe6\
-\x00\x7f\x9a\x91\x91\x71\x34\x3d\x3d\xfd\x59\x91\x17\x73\x94\x61\
-\xf2\x0b\xc7\xe9\xac\xaf\xaf\x3f\xa2\xf4\x3b\x91\xad\xdf\x9c\x94\
-\x43\x5a\x16\xd6\x74\x00\x8d\xe8\x28\x12\x6c\x15\x29\xff\xf0\xf8\
-\xf1\xe3\xec\x27\x64\xee\x33\x2c\xdb\xe1\x70\x38\x1c\x8e\x21\x03\
-\x02\xc1\x81\x9c\xaa\xaa\xaa\x2d\xfa\xcf\xa1\xdd\x01\x6a\x6b\x6b\
-\xd7\xd6\xd4\xd4\xb0\x9d\x01\x10\xce\x48\x69\x8e\xdc\xec\xeb\x97\
-\xd7\xe3\xaf\x5a\xb5\x6a\xab\xfe\x4d\xe3\x5a\x30\x52\xe4\x2b\xef\
-\x38\x60\x7e\x55\x6b\xd7\xae\xe5\x70\x70\x60\x69\x73\x3e\x2a\x0e\
-\x90\x46\xe0\x5f\x51\x51\xb1\x6c\xe9\xd2\xa5\xeb\xb8\x8e\xa3\x34\
-\xae\x63\xf8\x8b\x1b\x26\xc3\xe1\x70\x38\x1c\x63\x18\x46\x02\x63\
-\x0d\x58\x51\x38\xc8\xa4\xe3\xfc\xf9\xf3\x6c\x62\x1f\xf8\x20\x6e\
-\x4b\x4b\x4b\xc9\x94\x29\x53\xee\x16\xf9\x6c\xd0\x4f\xc2\xb0\x47\
-\x8f\xbc\xf0\x01\x5f\xb6\x25\xe0\x47\xfc\x22\x59\x7e\x0b\xb7\x6c\
-\xd9\xb2\x51\xd7\x6c\xd6\x0f\x56\x76\x0a\x58\x77\x38\x80\x5f\xd6\
-\xe6\xcd\x9b\x37\xa5\xa5\xa5\x2d\xd2\x75\x89\x9c\xa5\xcd\x51\x6e\
-\x76\x9c\x5b\xb0\xd7\x70\xea\xd4\xa9\xeb\x16\x2e\x5c\xf8\x92\x8e\
-\x8e\x0e\xc2\x19\xea\xe3\x3a\xb2\x1f\xd2\xd2\xc6\x39\x1c\x0e\x87\
-\x63\x8c\x63\xac\x12\xa1\xc1\x08\x09\x37\x80\x8c\x8c\x8c\xbc\xa6\
-\xa6\xa6\x4e\x0e\xbd\x7e\xf8\xe1\x87\x5f\x21\x2f\x3b\xbd\xc5\xac\
-\xb6\x20\x7c\x79\x79\xf9\x2c\x91\x1b\xdb\x24\xca\xab\xab\xab\xd7\
-\xe2\x27\xd8\xfd\x01\x99\xba\xb7\x51\xc4\x56\xde\xd7\xd7\xc7\x4a\
-\x55\xb3\x28\x01\x61\x28\x23\x64\xe7\x3c\xf4\xd0\x43\x0f\x54\x56\
-\x56\xae\x6a\x68\x68\x60\xf1\x4b\x9e\x5c\x18\x26\xd3\x09\xd0\xe1\
-\x70\x38\xc6\x11\xc6\x3a\x11\x82\xb0\x75\x15\x90\x17\xf3\x7b\x65\
-\x65\x65\x7c\xf7\xb0\xfb\xf8\xf1\xe3\x33\x36\x6e\xdc\xc8\x16\x8b\
-\x02\x39\x3b\x21\x26\xb0\xfc\x26\x4f\x9e\x5c\xdd\xd3\xd3\xd3\xd7\
-\xd5\xd5\xd5\x39\x6d\xda\x34\xac\xbd\xa9\x72\x51\xa2\x9a\xa1\x7b\
-\xf3\xe3\x2b\x54\x39\xad\x66\x66\xdc\xdf\xc2\x21\xab\x70\xc3\x86\
-\x0d\x0f\x9e\x3c\x79\x72\x86\x64\x75\x93\x76\x66\x66\xa6\x7d\x21\
-\xde\x08\x35\xac\xa7\xc3\xe1\x70\x38\xc6\x09\xc2\x0b\x3e\xc6\x0b\
-\xd2\xae\x5d\xbb\x76\xe5\xd4\xa9\x53\x17\xe6\xce\x9d\x5b\x25\x8b\
-\x2f\xbb\xb5\xb5\xb5\x60\xfe\xfc\xf9\xb3\xce\x9c\x39\x73\x56\xf7\
-\x6d\x78\x72\x42\x56\x56\x56\x55\x49\x49\xc9\x64\x59\x7a\x7c\xf5\
-\x22\x4b\xd6\x5c\xd9\xa5\x4b\x97\xf8\x1a\xfe\x00\xb1\xd6\xd6\xd6\
-\xbe\x4c\xf7\xf2\x25\xa7\x57\xe1\xb3\xae\x5c\xb9\x72\xa1\xb9\xb9\
-\x39\x3c\xbc\x5a\xb2\x69\xd3\xa6\x87\x1b\x1b\x1b\xcb\x72\x73\x73\
-\xf9\x4a\x44\xd3\x23\x8f\x3c\xf2\x6f\x57\xaf\x5e\x65\x18\xd6\x2d\
-\x40\x87\xc3\xe1\x18\xe7\x18\x0f\x16\x61\x14\x10\x0f\x7a\x5f\xdc\
-\xb1\x63\xc7\x77\x64\xf1\x9d\x8d\xc5\x62\x7c\x46\x89\xc5\x34\x33\
-\x08\x20\x04\x44\x78\xee\xdc\xb9\x9d\xb2\x1e\xaf\xea\x5e\x4c\xff\
-\xfb\x64\xc5\x31\x4f\x18\xce\x33\x5f\x7f\xe7\x20\x70\x36\xcc\x4b\
-\x4c\xac\xee\xfc\xf9\xf3\x9c\xfc\x02\xcc\xd2\x9b\x81\x6c\x71\x64\
-\x9a\xac\xc6\x53\x3b\x77\xee\xe4\x80\xed\x8b\x72\xc8\x71\x12\x74\
-\x38\x1c\x8e\x71\x8e\xf1\x48\x84\x80\xe1\x4a\x74\x6f\xdb\xbf\x7f\
-\xff\x0f\x1b\x1a\x1a\x0e\xc4\xb7\x58\xd8\x57\x21\x20\x28\x88\xac\
-\x63\xd7\xae\x5d\x3b\x8a\x8a\x8a\xf8\xa8\x6f\x4c\xd6\x20\x1f\xcb\
-\x0d\x7f\xdf\xaf\xe7\xf2\xe5\xcb\xf8\xc5\x8a\x8b\x8b\x27\x6c\xdf\
-\xbe\x1d\x12\xb4\x4f\x3c\x19\xfa\xb2\xb3\xb3\x33\xea\xea\xea\xf6\
-\x1d\x3c\x78\xf0\x47\xfa\x6d\x9f\x7b\x0a\x86\x5f\x1d\x0e\x87\xc3\
-\x31\xbe\x31\x5e\x89\x10\x40\x44\x01\x61\x9d\x3c\x79\x72\x47\x47\
-\x47\x07\x24\xc6\xe9\x32\x00\x7f\x23\xc3\x73\xb2\xf2\x8e\xe6\xe5\
-\xe5\x65\xc8\x42\xe4\xab\x16\x00\xff\x20\xae\xee\xd5\x15\x14\x14\
-\x64\xe8\x3f\xab\x43\xd9\x8c\x6f\x71\x0d\x39\x22\xda\x9d\xa7\x4e\
-\x9d\xe2\x84\x18\x8b\xe7\x24\xe8\x70\x38\x1c\x8e\x31\x03\x23\x27\
-\x48\xdd\x88\xd0\x80\x3f\x28\xbd\xe7\x9e\x7b\xde\xae\xff\x1c\x98\
-\x0d\x2c\x0e\xa8\xda\xb8\x71\x23\x07\x75\x4f\xba\xfe\x73\xc0\xdf\
-\xc0\x8a\x54\x64\x87\xe3\x38\x1c\x0e\x87\xe3\x0e\xc1\x78\xb6\x08\
-\x0d\x58\x6f\xe6\xec\x4b\x16\x06\xb3\x0a\xeb\xcf\x9e\x3d\xcb\xe2\
-\x96\x44\x48\xcf\xcd\xcd\x65\x4f\xa1\x59\x8b\x61\x6b\x10\xb0\xf8\
-\x26\x9c\x86\xc3\xe1\x70\x38\xee\x20\x8c\xc7\x55\xa3\xc3\x45\x60\
-\xc5\xd5\xd5\xd5\xf1\x9f\xfc\xf2\xa5\x89\xb0\x65\x57\xde\xd6\xd6\
-\xd6\xd0\xd2\xd2\x12\xfe\xb8\xae\xc3\xe1\x70\x38\x1c\x77\x1c\x18\
-\x36\xad\xb8\x7e\x19\x10\x9e\x91\x1e\x7e\xd1\x21\x55\x87\xc3\xe1\
-\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\
-\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\
-\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\
-\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\
-\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\
-\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\
-\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\x31\
-\x86\x30\x61\xc2\xff\x07\x21\x52\x35\xf7\x65\xd6\x08\x1c\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x6d\x69\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\xc2\x00\x00\x00\x96\x08\x06\x00\x00\x00\x4d\x70\x88\x10\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x6c\xfe\x49\x44\x41\x54\x78\x5e\xed\x5d\x07\x60\
-\x14\x45\xdb\xbe\xbd\xbd\x9e\x9e\x10\x7a\xef\xbd\xf7\x26\x88\x74\
-\x41\x11\x45\x8a\xa0\xd8\xbb\xd8\xf8\x14\xfd\xac\xff\x67\x2f\x88\
-\x82\x88\x15\x44\x50\x41\x51\x44\x44\xe9\xbd\xf7\x1a\x4a\xe8\x2d\
-\xa4\xb7\xab\xbb\xfb\xbf\xcf\x64\xe7\xbc\x5c\x2e\x21\x14\x91\x90\
-\x79\x60\x32\x7b\x53\xdf\x99\x9d\x9d\x67\xdf\x69\x2b\x69\x9a\x66\
-\x10\x10\x10\x10\x10\x10\x28\xad\x30\xea\xb6\x80\x80\x80\x80\x80\
-\x40\xa9\x84\x20\x42\x01\x01\x01\x01\x81\x52\x0d\x41\x84\x02\x02\
-\x02\x02\x02\xa5\x1a\x82\x08\x05\x04\x04\x04\x04\x4a\x35\x04\x11\
-\x0a\x08\x08\x08\x08\x94\x6a\x08\x22\x14\x10\x10\x10\x10\x28\xd5\
-\x10\x44\x28\x20\x20\x20\x20\x50\xaa\x21\x88\x50\x40\x40\x40\x40\
-\xa0\x54\x43\x10\xa1\x80\x80\x80\x80\x40\xa9\x86\x20\x42\x01\x01\
-\x01\x01\x81\x52\x0d\x41\x84\x02\x02\x02\x02\x02\xa5\x1a\x82\x08\
-\x05\x04\x04\x04\x04\x4a\x35\x04\x11\x0a\x08\x08\x08\x08\x94\x6a\
-\x08\x22\x14\x10\x10\x10\x10\x28\xd5\x10\x44\x28\x20\x20\x20\x20\
-\x50\xaa\x21\x88\x50\x40\x40\x40\x40\xa0\x54\x43\x10\xa1\x80\x80\
-\x80\x80\x40\xa9\x86\x20\x42\x01\x01\x01\x01\x81\x52\x8d\x52\x49\
-\x84\xb2\x51\x92\x60\xf4\x9f\x02\x02\x02\x02\x02\xa5\x18\x92\xa6\
-\x69\xfa\x65\xe9\x80\x44\xa0\x32\xb3\x42\x07\x5e\x0b\x08\x08\x08\
-\x08\x94\x4e\x94\x2a\x8d\x90\x78\x4f\x06\xf1\xad\xbb\xaf\xcb\x80\
-\x75\xf7\x76\x19\x80\x6b\xb8\xe9\xde\x02\x02\x02\x02\x02\xa5\x10\
-\xa5\x86\x08\x2d\x26\x19\x24\xa8\xbc\xd3\xb3\x75\xbb\xf6\x95\xcb\
-\x7d\xd7\xbe\x6a\xb9\xef\xde\xed\xd9\xba\x2d\xdc\xe0\xa7\x07\x13\
-\x10\x10\x10\x10\x28\x65\x28\x15\x44\x68\x96\x8d\x46\x8f\x4f\x51\
-\x86\x35\xae\xd4\xe0\xb1\xd6\x65\x7f\x4e\xcf\xc9\x89\x48\xcf\xce\
-\x89\x78\x94\xae\x87\x37\xae\x5c\x1f\x7e\x08\xa3\x07\x17\x10\x10\
-\x10\x10\x28\x45\xb8\xe6\x3b\x7f\x10\x9c\x57\x51\x55\x22\xc1\xaa\
-\xd3\x07\xb5\xf8\x45\xd1\xa4\x8a\x46\x49\x52\x61\xe8\xba\xd2\xf4\
-\x41\x2d\xe7\x0c\x6f\x5c\xa9\x32\xc2\x08\x32\x14\x10\x10\x10\x28\
-\x7d\xb8\xa6\x17\xcb\x10\xaf\x49\xc4\x6f\x1a\x69\x7d\x71\xdf\xde\
-\xd2\x72\x61\x8e\xdb\xd7\xc2\xa0\x19\x14\x49\x32\xb0\xa1\x50\x2a\
-\xba\x62\xa0\xeb\x70\x8b\xbc\x71\xd4\x9c\xcd\xbd\xa6\xef\x3a\x95\
-\x8e\xd5\xa4\x8a\x2a\x16\xd0\x08\x08\x08\x08\x94\x16\x5c\xb3\x1a\
-\x90\x49\x27\xc1\x3b\xeb\x57\xb7\x7c\x37\xa8\xd5\x77\x3a\x09\xfa\
-\x38\x09\x02\xec\x9a\xdc\xb2\x3d\x4a\x9b\x69\xb7\xb4\xfc\x6e\x54\
-\xb3\x6a\x16\x90\xa0\x49\x6c\xad\x10\x10\x10\x10\x28\x35\xb8\xe6\
-\xb7\x4f\x64\x3f\x35\x60\x86\x64\x55\x87\xf9\x14\xd5\x47\xfc\x66\
-\xd2\x9d\xf3\x41\x25\x32\x34\x19\x0d\x26\x4d\xb2\xcf\x08\x7f\xf3\
-\xa7\x11\xba\xb3\x80\x80\x80\x80\x40\x29\xc0\x35\xa9\x11\x62\x7f\
-\x20\xec\xd5\xa3\x3b\x4f\x30\xda\x8a\x26\x41\xc0\x28\x19\x4c\x3e\
-\xd5\xe0\x33\x6a\xb9\xc3\x57\xdf\xd5\xe9\x63\xb8\xf1\x34\x04\x04\
-\x04\x04\x04\xae\x6d\x5c\xd3\x8b\x43\x1a\xc7\x47\xc4\xab\x8a\xc1\
-\xa0\x68\x06\xb5\x28\x56\x83\x9f\xa2\x69\xaa\x4a\xd5\xd1\x38\x3e\
-\xb2\x2c\xdc\x48\x53\x16\xf3\x84\x02\x02\x02\x02\xa5\x00\xd7\x24\
-\x11\xf2\x29\xbe\xce\x53\xd7\x8c\xcc\xf6\x7a\x7f\x71\x98\x64\x8b\
-\x4f\xd5\xbc\xcc\x31\x04\x7c\x9a\xe6\x0d\xb7\x98\x2c\xd9\x1e\xef\
-\xef\x5d\xa6\xae\x1e\x09\x37\x2c\xb4\x61\x9e\x02\x02\x02\x02\x02\
-\xd7\x34\xae\xd9\x39\x42\xb3\x6c\x94\xbc\x8a\xaa\x35\x8a\x8f\x08\
-\xfb\x63\x44\xfb\xb9\x31\x36\xf3\xf5\x2a\x91\x21\x91\xa4\x59\x0f\
-\xc2\x40\xc5\xf7\x92\x4a\x68\x4e\x75\x7a\x56\xdd\xf8\xfd\x86\x7e\
-\xbb\x92\x32\xb3\x78\x5c\x3d\x88\x80\x80\x80\x80\xc0\x35\x8c\x6b\
-\x76\x68\x14\x44\x86\x7d\x81\xbb\xcf\x65\xe5\x0c\xfa\x61\xd3\xed\
-\x16\x4d\xde\x4c\xd4\x66\x26\x76\xf3\xe9\x41\x00\x9f\x5b\xf1\x99\
-\x23\xc3\x1c\xbb\xde\x59\x73\xe6\x36\x90\xa0\xd5\x24\x63\xdf\xa1\
-\x20\x41\x01\x01\x01\x81\x52\x82\x6b\x82\x08\x89\xf0\x4c\xc4\x5f\
-\x05\x16\xc3\x60\x93\x3c\xb9\xcb\x9b\x4f\xa7\x25\x4f\x5e\x7b\x7c\
-\x70\x4c\xb8\xf5\x80\x47\x51\x11\x4e\x81\xc1\x75\x7c\x84\xe3\xe8\
-\xfb\x4b\xf7\xde\x3c\x69\xd3\xae\x33\x26\xa3\x51\x76\xfb\x14\x95\
-\x45\x0e\x80\x85\xd2\x36\xca\x46\xf0\xaa\x18\x2e\x15\x10\x10\x10\
-\xb8\xc6\x50\xe2\x87\x46\x25\x49\x32\x52\x19\x18\x79\xd1\x35\x3b\
-\x4f\x94\x79\x04\x00\x04\xe7\x53\x55\xe5\xdd\x1b\x1a\x35\x7c\xb6\
-\x6b\xdd\xc5\xa9\x99\xae\xf2\x70\x8f\x8d\xb0\x26\xbf\xb7\xea\xc0\
-\x0d\xcf\x2c\xdc\xbd\x9d\x38\x4e\x56\xd5\x50\x71\x25\x8a\x9b\xe7\
-\x6e\xa1\x0c\x3c\x62\x11\x8d\x80\x80\x80\xc0\x35\x85\x12\xad\x11\
-\x12\x2f\x99\x40\x82\xdb\xee\xbf\x6e\x5c\xe2\xe3\x5d\xef\x03\x09\
-\x92\x5b\xbe\x39\x40\x00\x24\x08\x32\x7c\x76\xd1\xee\x3d\xef\xad\
-\x48\xb8\x35\x36\xc2\x92\x13\x1b\x69\x75\xbd\xb7\x2a\xe1\x56\x90\
-\x20\xb4\xc6\x50\x24\x68\x31\x19\xcd\x20\xc1\x31\x1d\x6a\xf5\x74\
-\xdf\xd7\x75\x3c\x48\x10\xc4\xab\x7b\x0b\x08\x08\x08\x08\x5c\x03\
-\x28\xb1\x1a\x21\x86\x42\xb1\x3f\x70\xcd\xd0\xae\x37\x77\xac\x17\
-\x3d\x47\xd1\x0c\x4a\xc2\x99\xf4\x3b\x1a\x4e\x59\xf1\x3d\xc8\x90\
-\xca\x55\x60\x95\x28\xd7\x0c\x3f\xe9\xdb\xe4\x36\x83\x66\x30\x3e\
-\xba\x60\xe7\x0f\xdc\x4d\x0f\xe2\x07\x48\xd0\xe3\x53\xbd\x8f\xb5\
-\xa9\xd1\xe9\xe3\xbe\x4d\x7e\xf1\x1a\xa5\x32\x9b\x8e\xa7\x3e\xdb\
-\xe1\xcb\x95\xef\xe9\x04\x1c\x38\xd7\x28\x20\x20\x20\x20\x50\x42\
-\x51\x22\x89\xd0\x4c\x1a\x9c\x57\x51\x95\xfb\x5b\x56\x6b\xf2\x69\
-\xff\x66\xcb\xb2\x5c\xde\x58\x95\x88\x30\xd6\x61\xd1\xf6\x9c\xcc\
-\xb8\xa3\xe1\x97\xcb\x7e\x28\x8c\x0c\x65\xa3\x64\x54\xd4\xbc\xa1\
-\xd4\xc0\xeb\x40\x04\x90\x60\xd7\x8f\xfb\x37\xfb\x25\xc3\xe9\x89\
-\x51\x7d\xaa\x2f\x26\xda\x61\x5a\xbd\x6c\x5f\xff\x4e\x8b\xf7\xcc\
-\x37\x99\x64\x93\xcf\xa7\x08\x32\x14\x10\x10\x10\x28\xe1\x28\x71\
-\xc3\x7c\x58\xb1\x02\x12\x7c\xb8\x4d\xb5\xf8\x29\x03\x9b\xcd\xc8\
-\xf6\xf8\x62\x71\xac\xa8\x59\x96\x8c\xa9\x4e\xb7\xdc\xb0\x72\xd4\
-\x8c\x7d\x0f\xf7\x1a\x06\x12\x0c\x35\x4c\x0a\xe2\x03\x01\x16\x41\
-\x82\x26\x90\xe0\x98\x76\x35\x7b\x7c\x7c\x63\xb3\x79\x19\xb9\x9e\
-\x18\x49\x33\xa8\x26\x52\x1d\xd3\x32\x9d\x86\x0e\x1d\x6a\x7e\xf3\
-\x70\xeb\xea\x0d\x41\x82\x20\x64\x3d\x9a\x80\x80\x80\x80\x40\x09\
-\x45\x89\xd2\x08\xb1\x6a\x53\xd5\x34\xc8\xac\xe6\x8c\x1b\x30\xd7\
-\xa0\xaa\x03\x7c\x6a\xbe\xe3\xd3\x54\xaf\xaa\x49\x31\x76\xb3\x7a\
-\xe0\xa4\x36\xbc\xee\x97\xbf\xfd\x28\x19\x49\x33\x2c\x62\x33\x7d\
-\x20\x74\x12\xf4\x3d\xd5\xbe\x56\xb7\x0f\xfa\x36\x99\x9b\x9e\xe3\
-\x89\xa0\x37\x05\x55\x92\xf2\x5e\x18\xa8\xaa\x14\x4d\x92\xe4\x28\
-\x87\xbc\xf5\xd1\xdf\xf7\xf5\xf8\x64\xc3\xfe\x34\x22\x54\xf1\xb5\
-\x0a\x01\x01\x01\x81\x12\x8c\x12\xa5\x11\x72\x12\x5c\x7b\x77\x97\
-\x57\x8c\x9a\x3a\xc0\xab\xaa\x4a\xd0\x19\xa2\x46\x8b\x51\xd2\x52\
-\x9c\x5e\xb9\x6e\x45\xc3\xd7\x93\xdb\xd7\xee\x0f\x12\x24\x65\xee\
-\xbc\xe5\x84\x86\x08\x12\x24\x4d\xb0\xdd\x07\x3d\x1b\xfd\x98\x96\
-\xed\x8e\x30\x4a\xec\x93\x4d\xfe\xb8\x74\x2d\x13\x1b\xfa\xb2\x72\
-\xbd\x2d\xde\xe8\xde\xf0\x13\xb8\x89\x1d\x87\x02\x02\x02\x02\x25\
-\x1b\x25\x86\x08\xb1\x5a\x13\x24\xb8\x6e\x58\xd7\x91\x6d\x2b\x45\
-\xbd\xec\x26\xd2\x92\x43\xac\xe0\x24\x5e\x32\x5a\x49\x71\x4c\x73\
-\x2b\x8e\xbb\x7a\x36\x98\xfe\x58\x9b\x1a\x3d\x49\x6b\x64\xc3\xa1\
-\x7a\x90\x02\x20\x4d\x93\x0d\x93\x3e\xda\xb6\x46\xeb\xf1\xbd\x1b\
-\xff\x94\xe6\xf2\xc6\x53\x78\x45\x22\x2f\x3d\x88\x1f\x38\xa0\x9b\
-\x94\x4e\x9f\x49\x72\x0f\x5f\x39\xaa\xe3\xeb\x24\x93\x58\x49\x2a\
-\x20\x20\x20\x50\x82\x51\xe2\x3a\xf0\xd8\x28\x93\x8d\x98\xc7\xa0\
-\x12\x37\xd2\xcf\xc2\xf4\x31\xec\xae\xf7\xb9\x5c\xbe\xe8\x8f\x6f\
-\x6a\xf1\x4e\xaf\x9a\x65\xf1\x9d\x41\x95\x34\xc3\x90\x1b\xe2\x15\
-\x22\x4a\xd8\x9f\xf4\x6a\xfc\x76\xaa\xcb\x57\x49\x96\x0c\x9e\x50\
-\x24\xa8\x43\xa3\xf0\x06\xbb\xc9\x6c\x28\x13\x66\xb5\x72\x37\xdd\
-\x16\x10\x10\x10\x10\x28\x61\x28\x31\x44\x08\x6d\x10\x9a\x57\xdd\
-\xc9\x4b\x3e\x3f\x9e\x9c\x7b\x4f\xa4\xc5\x64\xf4\x2a\x6c\xd7\x43\
-\x81\x05\x2f\x04\xcd\xab\x69\xa6\x48\x9b\xc9\xf9\xea\xa2\xdd\xcf\
-\xfc\x95\x98\xe4\x21\x0e\x34\x92\x66\x18\x92\xb0\xe0\x07\xfb\xb5\
-\x15\xfb\x9f\x8b\x0e\x33\xa7\xfa\x0c\x06\x0b\xfd\x0c\x95\xae\x8a\
-\x85\x3a\x51\x36\xb3\xe9\x60\x5a\xce\xab\x0d\x3e\x5d\x3a\x96\x64\
-\xc2\x70\xad\x20\x42\x01\x01\x01\x81\x12\x8a\x12\xa5\x11\xea\x64\
-\x68\xaa\x31\x69\xf1\x57\xc7\xcf\x1a\x46\x47\x46\x85\x69\xee\xbc\
-\x13\xd1\x02\x49\x0b\x6e\x6a\x6c\x98\xd5\x30\x7d\xc7\xc9\x47\x5f\
-\x5e\x96\xb0\x18\x43\x9f\xc4\x81\xa1\x88\x8d\x01\x7e\x18\x3a\x7d\
-\x69\x45\xc2\xc6\xe9\xcb\x13\x1e\x88\xb5\x98\x0c\x6e\x4c\x48\xe6\
-\xd7\xf4\x40\x82\x5a\x34\x91\xe0\xe1\xb4\x9c\x71\x75\x26\x2e\x7e\
-\x85\x64\xc1\x49\x36\x82\x04\x05\x04\x04\x04\x4a\x30\x4a\xe4\x3e\
-\x42\x22\x20\xb6\x47\xf0\xd0\xf5\x8d\x87\xd7\xea\x5c\xe3\xeb\x54\
-\xa7\xcf\x6c\x92\x24\xac\xee\x94\x89\xab\x7c\x11\x56\x93\xe9\x78\
-\xba\xeb\xf5\xea\x9f\x2c\x7c\x09\xc4\x49\x61\xf3\xed\xf7\xc3\xea\
-\x53\x7a\x03\x90\xbc\xfa\x90\x28\x87\x64\xa4\xb0\x14\xff\xe0\xc3\
-\xdd\xc7\xd6\x88\x0d\x7f\x3b\xcb\xad\xf8\x64\xa3\x01\x8b\x71\x88\
-\x04\x35\x43\x94\xcd\x64\xdc\x9f\x9c\xf3\x64\x83\xc9\x4b\xc6\x23\
-\x5d\x93\x51\x52\x40\x8e\x79\xb1\x05\x04\x04\x04\x04\x4a\x22\x4a\
-\x24\x11\x02\x92\x6c\x34\x6b\x8a\xea\x5d\xd2\xb9\xee\xd0\x4e\x3d\
-\x1a\x4c\x75\xe5\x7a\xcc\xa4\xc2\x79\xcd\x46\xa3\xe5\x4c\xb6\x6b\
-\x66\xad\x4f\x16\x0f\xd7\x35\xb6\x7c\xa7\xc6\x40\x3b\x84\xa2\x07\
-\x06\x34\x1a\x24\xff\xfc\x20\x07\x8f\x73\xe8\xd1\x1e\x53\xca\x87\
-\x5b\xee\x53\x54\xc9\xeb\x53\x55\x39\xca\x66\x36\xee\x4b\xcd\x7e\
-\xac\xd1\xa4\xa5\x9f\x84\x22\x57\x01\x01\x01\x01\x81\x92\x89\xab\
-\x76\x68\x14\x9b\xd5\xb1\x79\x5e\xff\x59\x00\x20\x41\xb3\x49\x36\
-\x5d\xbf\x6a\xff\xf7\xaf\x2d\xd9\x3b\x2a\xca\x61\x76\x92\xb3\xc5\
-\x62\x94\x37\x0e\x9e\xbd\xf9\x21\x84\x21\x8d\x2d\x1f\xc9\x59\x4d\
-\x58\x1d\xaa\xaa\xf7\xb4\xa8\x14\xfb\x7f\x4d\x2a\xc4\xe2\xda\x4c\
-\x6e\xba\x37\x43\x9e\x66\x29\x49\x83\x67\x6f\x79\xc2\x62\xb2\x2f\
-\xf1\xa9\x8a\x39\xd2\x66\x96\x0e\xa7\x7a\x1e\x29\x0e\x09\x42\x66\
-\xb1\xd1\x5e\x40\x40\x40\xa0\xe4\xe0\xaa\x24\x42\xcc\xd7\x61\x51\
-\x0a\x19\xb5\x28\x32\xf4\xfa\x14\x1f\x91\x9b\xe9\x7f\x2b\xf7\xff\
-\x30\x76\xd1\x9e\x7b\xa2\x23\xac\x07\xff\x6f\xe5\x81\x51\xdb\xce\
-\xa4\x67\x80\x8c\x02\x87\x2d\xe9\xb7\xe4\x51\x34\xad\x5a\x94\x5d\
-\x7e\xba\x63\xbd\x19\x2f\x74\x69\x30\xab\x7e\xa4\xdd\x0c\x75\x2f\
-\x30\x0f\xaf\xaa\x6a\x26\x52\x15\xb7\x9d\x49\x73\xbe\xb6\x7a\xff\
-\xa8\xd8\x68\xfb\x9e\xc4\x73\xee\x31\xb5\x27\xfd\x39\xa9\x38\x24\
-\x08\x99\x21\x7b\x51\xdb\x35\x04\x04\x04\x04\x04\xae\x1e\x5c\x75\
-\x43\xa3\x44\x36\x6c\xbf\xe0\xa2\x91\x1d\xee\x59\x79\x34\xf5\xc0\
-\xab\x2b\x12\x56\xb0\x6f\x0d\x6a\x06\xa5\xb0\x55\x9f\xd8\x30\x8f\
-\x8d\xef\x2d\xcb\x47\x85\x6f\x3b\x9b\x99\xe1\x51\x54\xb6\xf1\x5e\
-\xf7\x36\x98\xc9\xdb\xa7\x69\x48\x57\xd9\xff\xe8\xf5\x53\x6a\x44\
-\x39\xee\x73\x91\xfb\xc9\xf4\xdc\x6f\xeb\x4f\x5c\x32\x0a\x79\x92\
-\xf6\xa8\x05\x12\x27\x25\x68\x54\x29\x8d\x6e\xd5\xe2\xa3\x8f\xa4\
-\x3b\x73\x8e\x66\xe6\x10\x8d\x86\x5e\x70\xc3\xb6\x65\x48\x06\x19\
-\x87\x80\xbf\xdc\xb5\x5e\xd7\x2e\x55\x63\xea\xde\x30\x7d\xdd\x17\
-\x94\xae\x58\x51\x2a\x20\x20\x20\x70\x95\xe3\xaa\x22\x42\x0b\x69\
-\x71\x44\x62\xca\xf8\xde\x8d\xba\x8e\xe9\x52\xef\x53\x4f\xb6\x33\
-\x67\xed\x69\xe5\xd5\xeb\xa6\xfe\xf5\x3b\x71\x8a\x8c\xa1\xce\x40\
-\xb2\x0a\x84\xfe\x29\x25\x15\x9c\x44\x84\x94\x2f\x0c\xc5\x65\x9a\
-\x5c\xc2\x23\xdd\x5f\xa9\x13\x13\xfe\x72\xba\xdb\xe7\x83\xba\x16\
-\x69\x35\x99\x0e\xa6\x65\x7d\x58\x77\xe2\xb2\xa7\x78\x98\xbc\x18\
-\x79\x80\x86\xe7\xa3\xa4\xc0\xb2\xc1\x73\x89\x1c\xd0\x34\x29\x0c\
-\x23\xde\xa5\x77\xde\xd0\xbf\x53\x45\xf3\xcb\x96\x30\x7b\xd8\x87\
-\xab\xf6\x3f\xf8\xe4\x82\x5d\x2b\x79\x99\xf4\xe0\x02\x02\x02\x02\
-\x02\x57\x19\xae\x1a\x22\x24\xce\x91\x88\x6c\xb4\x67\x3a\xd6\xad\
-\xf0\x4e\xf7\x3a\x53\x33\x5c\xbe\x78\xc9\x60\xf0\x45\x87\x59\x6d\
-\x87\xd2\x73\x3e\xae\x35\x61\xf1\x14\x22\x2b\x23\x11\x8b\x21\xd4\
-\x57\xe4\x01\x90\x52\x30\x51\xf2\x95\xa0\x87\xee\xed\xf6\x70\xb5\
-\x8a\x91\x13\x33\x73\xbd\x8a\x45\x96\xd8\x1c\x9e\x47\xd1\x7c\x51\
-\x36\x22\xc3\xe4\xdc\xb1\xf5\x26\x2f\x7e\xb7\x10\x32\x2c\x90\x26\
-\x87\x95\xd8\x97\x48\x8e\x6d\xeb\x38\xf8\xd8\xf5\x0f\xd6\x8e\x09\
-\x7f\x24\x3d\xc7\xe3\xd2\x0c\x9a\x29\xca\x6a\x3e\xfb\xdc\xba\x84\
-\xbb\xde\x59\x72\xe0\x0c\x25\x21\xce\x23\x15\x10\x28\x04\xf4\xdc\
-\xc5\x92\x85\x95\xe0\x67\xf3\x5c\x4a\x37\xa8\x3e\xf0\xb1\x00\x7c\
-\x3c\xfc\x2c\xd5\x89\x87\x39\xfe\xc3\x40\xdf\x47\x56\x05\x32\x49\
-\x94\xa7\x9b\x39\x96\x22\x5c\x35\xf3\x58\x9c\x27\x5e\xed\x52\xf7\
-\x39\xb7\x4f\xad\x4c\x04\xe4\x21\x63\x48\xcb\x71\x3b\x6b\x84\xdb\
-\x9f\x3c\xf6\xf8\x0d\xaf\xd6\x8b\x0b\xb7\x80\x04\x2d\x41\x0b\x5c\
-\x38\x82\x09\x0b\xf3\x74\x20\xc1\xaf\xaf\xab\x77\x6b\xad\xf2\x11\
-\x13\xd2\x9d\x5e\x8d\x48\xd0\x88\x40\x30\x20\xc4\x34\x97\x57\xa9\
-\x57\x3e\xfc\x9d\xaf\xfa\x37\x19\x01\x12\x24\x42\xce\x97\x76\x61\
-\x24\x08\x19\x20\x0b\xc9\x64\x3d\xfe\xd8\x0d\x6f\xd4\x8c\x70\x8c\
-\x81\xac\x66\x59\x02\x79\x7a\xc8\xaf\xea\x2b\x9d\xeb\xfe\x07\x61\
-\x43\xa7\x50\xb2\x40\x0f\x0a\x60\xd2\x8d\x98\xff\x14\xb8\x24\xf0\
-\x36\x44\xf6\xcd\x64\x6d\x27\xb3\x83\xae\xef\xd2\xdd\xae\xc9\xf6\
-\x85\x72\x91\xe1\xcf\x50\xbe\x53\xae\xf8\x6f\xb2\xa2\xc9\xfa\x85\
-\xcc\x1e\x32\xf8\xb6\x6a\xa4\xee\x9e\x2f\xfc\xe5\x00\x4f\x93\xac\
-\x30\xb2\x7e\x20\x83\x3c\xe7\xd0\x6f\xbc\x98\xfc\x23\x79\x5e\xad\
-\xb8\x2a\x1a\x1c\xd5\x37\xe6\xef\xb4\xb5\xf7\x74\x19\x6e\x35\x6a\
-\x3d\xbd\xaa\x96\x45\x77\x00\x5a\x9b\x64\x25\x36\xcb\xf4\xf8\x32\
-\x2a\x47\xd8\x6e\xff\xfd\xf6\xd6\xef\xf5\xae\x55\x25\xda\xe3\x53\
-\x55\xcc\xe1\xe5\xc5\x0e\x0d\xf8\x13\x87\xa9\xaf\x77\xab\xdf\xe3\
-\x8e\xeb\xea\x7d\x91\xe6\xf1\xc9\x56\x23\x29\xc0\x94\xa6\x1e\x04\
-\x64\x88\xf4\x8d\x69\x39\x1e\xc3\x1d\xcd\xab\x4d\x7e\xbd\x5b\xbd\
-\x5e\x18\x02\x2d\x4e\xda\x90\xa1\x77\xed\x2a\xd1\xf3\x6f\x6f\xfd\
-\x7e\xa5\x08\xfb\x2d\x24\x63\x3a\x64\x25\x6f\xb4\x1e\xd9\xab\x69\
-\x59\x16\x8f\xa1\xf7\x9a\xd1\x1d\x86\xa2\x6c\x28\x63\x5e\xec\x12\
-\x0b\x8c\x1e\xf8\x60\xe8\x1a\xe5\x29\x35\x0f\x89\xc0\xe5\x05\xda\
-\x0e\xb5\x23\xac\xce\xc6\x33\xfe\x32\x99\xca\x64\xca\x92\x79\x9d\
-\xdc\x1c\xba\xdf\x35\xd5\xbe\xf4\xf2\x50\xd1\xfc\xcf\x50\x30\xd1\
-\xf0\xfe\x61\x04\x99\x7e\x64\x70\xba\xd5\x20\x32\xb7\x91\x01\xfe\
-\x89\x95\xe8\x3c\xcf\xc1\x64\x6e\x21\x83\x3c\xfb\x92\x19\x4e\x06\
-\x28\xe9\x7d\x56\xb1\xf1\xaf\x17\xd4\x08\xad\x8d\x1a\xfe\xb8\xce\
-\xb5\x1b\xb5\x29\x17\xf9\x90\xd3\xa7\x38\x03\x0f\xd3\x06\x59\x59\
-\x8c\x92\x29\xdb\xed\x4b\xaf\x10\x66\xed\xf1\xe7\xc8\x0e\x9f\xbc\
-\x75\x7d\xe3\xf2\x58\xc8\x82\xd7\x2b\x3d\x58\x01\x70\xc2\xbb\xb9\
-\x41\xd9\xfa\xb2\xaa\x45\xe9\x9f\x62\x2a\x50\x5e\x0a\x04\x76\xf4\
-\x12\x87\x85\xdf\x5c\xbf\x62\x7d\xb8\x05\x92\x65\x30\x90\x27\xf2\
-\x7e\xa3\x7b\xa3\x72\x24\xcb\xc4\xf2\x61\xd6\xee\xd9\x1e\x6f\x3a\
-\x64\x0c\x8c\x87\x32\x38\x15\x25\xb7\x4d\xf9\xd8\x87\xc7\x75\xae\
-\xd3\x08\x65\x44\x59\x75\xef\x92\x08\x0b\x15\xfd\x49\x32\x13\xe9\
-\xba\x19\x9e\x68\xba\x2e\xb4\x9e\x04\x04\x8a\x01\x74\xbc\x31\x79\
-\x97\x6c\x90\x26\x9c\x8c\x8d\xfd\xba\x86\x80\xe7\x04\xcf\x0b\x5d\
-\x36\xa1\xcb\x09\x64\x5e\xa5\xeb\x32\x41\xcf\x10\xb7\xe3\x75\x9b\
-\xaf\x2b\x80\x86\xf8\x4f\x03\x2f\x21\x00\x9f\x72\x8a\xd3\xed\x52\
-\x83\x7f\xbd\x63\xe6\x33\x67\xb7\x34\xac\xd8\xca\x64\x32\x55\xf4\
-\xa9\x9a\x2f\xb8\x77\x45\x10\x22\x2a\x93\xa2\x49\x19\x29\x99\xe9\
-\x2d\x9e\xeb\x56\xf3\x8b\x27\xda\x54\x8b\x23\x42\xd2\x30\x87\x97\
-\x17\x2a\x3f\xc8\x4b\x41\x23\x6b\xf2\xe9\x8a\x89\x7b\x93\xb3\x5e\
-\x8f\xb1\x5b\xcc\x5e\x45\x2d\x90\xb6\x57\xd1\x7c\xb1\x76\xb3\x79\
-\xef\xb9\xac\x37\x9b\x4c\x5e\x8a\x46\x8a\x46\x1b\x72\x71\x0b\xf2\
-\x42\x9e\x8f\xb7\xad\x15\x3b\xee\xfa\xda\x5f\xa4\x66\xa4\x35\x87\
-\x4c\x90\x4d\x2f\x86\x1f\xc8\xc7\xa7\x1a\x14\xb3\x59\xae\x34\xb8\
-\x51\xe5\xd6\x70\xe3\x65\x2d\xa1\xf8\x9c\xcc\x07\x64\x1e\x26\xf3\
-\x23\x55\x53\x1c\x55\x85\x20\x43\x81\x4b\x01\x9e\x08\xfe\x54\xa0\
-\x1d\xc1\x94\xec\xa7\x24\x08\x7a\x7f\x82\xe7\xa4\x22\xfd\xfc\x83\
-\xcc\x63\x64\x5e\x22\xf3\x1d\x19\xa6\x22\xc2\x0e\x00\x27\x23\xde\
-\x37\x5f\x89\xfa\xe0\xfd\x1d\xcf\xb3\xd4\x2d\xee\xbb\x0a\x88\x30\
-\x6f\x18\xa4\xf5\x94\x15\xd3\x36\x9f\x4c\x79\x35\xc6\x6e\x0e\x73\
-\xf9\x54\xc8\x55\x60\x41\x0c\x36\x29\xd8\x4c\x46\x4d\x71\x99\x4f\
-\xac\x38\x9e\x95\x09\xb7\xa2\xe6\xdf\xf4\x06\x68\x6c\x34\x79\xd9\
-\x4b\x7b\xce\x65\x4e\x24\x32\x34\x79\x89\x68\x75\x6f\x9c\x31\xea\
-\xb3\xd9\xcd\xa6\x9d\xe7\x32\x3f\x6f\x3c\x79\xd9\x38\x84\x0d\xd1\
-\x30\xfd\xe0\x79\xad\x38\x96\x96\xe9\x73\x9a\x8e\x5b\x4d\xb2\xc6\
-\x36\x4e\x14\x84\xe2\xf2\x29\x72\x8c\xc3\x14\xb6\xe5\x74\xfa\xcb\
-\xad\x3e\x5b\x3a\x15\x65\x44\x59\x75\xff\x92\x88\x3b\xc8\xe0\x01\
-\xc1\xe4\x7d\x1d\x32\xb5\xc9\x00\xff\x7a\x1b\x12\x28\xb1\xe0\xe4\
-\xc7\x11\xea\x59\x2a\xe9\xe0\xcf\x47\x47\x32\x20\xc3\x1c\x32\xe8\
-\x83\xda\x50\x97\xc0\x9e\x21\xf4\x3b\xb0\x75\xfc\x1b\x75\x10\x9c\
-\xe7\xb5\x78\x1f\x8a\xc4\x55\xd1\x89\xe9\x84\x25\xb5\xfa\x72\xd5\
-\xb4\x4d\x29\x99\xff\x89\x8d\x76\x68\xa4\xa9\x59\x88\x77\x02\xdf\
-\x4c\x70\xde\xa7\xcd\x6e\x32\x9e\x7a\x65\x75\xc2\xab\x5b\xcf\xa4\
-\x62\x38\x93\xad\x34\xd5\xfd\x43\xc2\x04\xa6\xca\x23\xc3\x47\x77\
-\x25\x65\x7c\x4f\x44\x6a\x22\xad\x0e\xe3\xf4\x8a\xd1\x24\x9b\x8c\
-\xe7\xb2\xe6\xde\xf2\xdd\xfa\x87\x90\x3f\xc2\x16\x05\xe4\x85\x3c\
-\xb7\x9d\x49\xf5\xbd\xbc\x2a\xe1\x35\xbb\x45\x3e\x4d\xc4\x8a\xa1\
-\x1c\x3f\xc1\x91\x30\x3e\xaf\xaa\xda\x62\xa3\x22\xbc\x9b\xce\x38\
-\x9f\x6a\xf9\xf9\x8a\xe9\x48\x1b\x65\xd4\x83\x94\x54\xa0\x8c\x68\
-\x2f\x58\xd1\x06\x94\x64\x52\x17\x10\xb8\x52\xe0\xcf\xfd\x5e\x32\
-\x38\xfd\x0a\x0b\x53\xb0\x42\xf3\x18\x99\x13\x64\x80\x92\xde\x37\
-\x94\x78\x5c\x35\x6f\xf3\x18\xe1\x04\x17\xb5\xfe\x74\xc5\xef\xdf\
-\xcf\xdf\xf1\x90\xc5\x6a\x4a\xa6\xe6\x61\x23\xfa\x60\x1a\x9c\x57\
-\x51\xa5\xe8\x48\x9b\xef\xeb\xbd\x67\x5f\x7b\x7d\xf9\xae\xd3\xd8\
-\x9f\x17\xb8\x25\x01\x04\x05\x37\xfd\xa7\x1f\x14\x4f\xb5\xe8\x04\
-\xf7\xc6\x8f\x9b\xef\xb2\x1b\xa4\x05\x94\xa0\x49\x51\x0d\x72\x84\
-\x55\x5b\xf6\xfc\xb2\xdd\x23\x0e\x64\x39\x15\x93\x2c\x61\x9b\x44\
-\x81\xce\xdd\x4c\x69\x92\xf1\xd7\x13\xf2\x44\x3e\xff\x5b\xb1\xeb\
-\xcc\xd7\x3b\x4e\xbd\x1a\x1d\x6e\xc3\x09\x38\x2c\x03\xc8\x4a\xde\
-\x8e\x08\xab\xe9\xd4\x13\xf3\xb7\xdd\xdb\xfa\xf3\xc5\x7f\x91\x58\
-\x26\x94\xed\x1a\x00\xea\xa0\xd4\xbd\x29\x0a\x08\x5c\x0a\xe8\xfd\
-\x97\x8d\x78\x91\xbd\x9b\x7e\x8e\x22\xb3\x96\x0c\x86\x48\xef\x24\
-\x37\x17\x79\x15\x39\x0a\x25\x70\x65\x70\xd5\x10\x21\x36\xc1\x13\
-\x7c\x44\x3a\xa6\xa1\xeb\x0e\x6d\x1c\xb3\x60\xe7\x83\xe1\x56\x39\
-\x91\x98\x29\x5c\xd1\x34\xb7\xdd\x6c\x0c\xdf\x7e\x2a\x7d\xda\x3d\
-\x73\x36\xaf\x42\xe3\x09\xdc\xa4\x8e\x3d\x88\x18\x60\x80\x1b\xb6\
-\x3f\xe4\xfd\xfe\x1b\xf8\x2c\x13\x08\x6d\x66\x5a\xb6\xfb\xf1\x25\
-\x7b\x86\xc7\x59\x4d\xbb\x62\x1c\xe6\xfd\x8f\x2d\xd8\x3d\xe4\x83\
-\x7d\x49\xd9\xf0\xc3\x51\x6b\x7a\x70\x3f\x90\x16\x91\x9c\x02\xd1\
-\x40\xb4\xba\xb3\x01\xf9\x40\x86\x7b\xe6\x6e\x5d\x45\x32\x4d\xb5\
-\x9b\x65\x26\xa3\x6a\xd0\xc2\x89\x04\x13\x1e\x5e\xb0\xf3\x81\x8f\
-\xd6\x1f\xda\x89\xb2\x50\x54\x5f\xf0\x06\x7f\x01\x01\x81\xd2\x03\
-\x74\x6c\x3a\x19\xce\x26\xd3\x91\x4c\x3f\x32\xdb\x74\x3f\x31\xb2\
-\x72\x15\xe0\x5f\x21\x42\x34\x8a\x40\x62\x09\x04\x11\x8f\xcf\x6a\
-\x92\xe5\x29\x5b\x8e\x1e\x7c\x90\x08\x25\x32\xcc\xb2\xd5\x2c\x49\
-\xd5\x25\xa3\xbc\x61\xd8\xcf\x9b\x71\xde\x27\x36\xe3\xf8\x89\xc5\
-\x62\xca\xdb\x88\x3f\xb2\x69\x85\x72\x3b\xef\xbf\x6e\x08\x5d\xd3\
-\x2f\x8d\x2d\x6c\xd1\x83\x30\x80\xd0\x70\xfa\xcc\x84\xf5\x89\x69\
-\xff\x59\xbc\xf7\xd6\xb1\x8b\x76\xdf\xfc\xf1\xba\x23\xe7\xa0\xdd\
-\xc1\x4f\x0f\xe6\x07\xb2\x41\x5a\x3b\xfa\x37\x1f\xf0\x62\xb7\xfa\
-\x0d\x41\x86\x14\xdf\x5f\x5f\x90\x01\xb2\x0c\x9b\x43\x32\x99\x8c\
-\x1b\x48\xc6\x1a\x91\x76\xcb\x16\x92\xf9\xa1\xcf\x36\x1f\x3b\x86\
-\x32\xa0\x2c\x7a\xf0\x7c\x40\xd9\xa9\x10\x57\xcd\x4b\x88\x80\x80\
-\xc0\x3f\x0b\x22\x3c\xf4\x17\x32\x7b\xf2\xf3\xec\x7f\x62\x3b\x84\
-\xc0\x45\xe2\x8a\x77\xc6\xd4\x00\xd8\x7c\x19\x74\x24\x22\x84\x90\
-\xf9\xbb\x7d\x8a\x42\x04\x27\x4f\xde\x74\x34\xe9\xee\xdf\xb6\x3f\
-\x62\x8f\x0e\xff\xf6\xb9\x45\x7b\xdf\xdd\x73\x2e\xcb\x8b\x73\x3d\
-\x41\x7c\x7a\x50\xac\xfa\x64\xf6\x7f\x3b\xd7\x7b\xa6\x49\xc5\x98\
-\x0f\x8e\x8d\xe9\xf5\x14\xd2\xc7\xd1\x68\xc1\x64\x48\x9a\x99\x42\
-\x6e\xc6\x77\xd6\x1e\xda\xff\xee\xda\xc4\x7d\xb8\x0e\x75\xfc\x19\
-\x1a\x2b\x44\x3c\xfd\xe4\x80\x3b\x9a\xb6\xaa\xf6\xe1\x6b\xdd\x1b\
-\xbd\x7a\x4f\xcb\x86\x11\x14\x5f\xb5\xca\x32\x4b\x13\x32\x10\x07\
-\x4b\x90\xe9\xf9\x85\xbb\xdf\xb5\xc7\x86\x4f\xbd\x7b\xfe\xce\x47\
-\x3f\xdb\x74\x34\xd9\x42\x24\x88\x32\xb0\xc4\x82\x00\x12\x64\xca\
-\xaf\x7a\xed\xed\x95\x12\x10\x10\x28\x1c\xf4\xd4\xa3\x4f\x40\xf7\
-\x84\x73\x8b\x43\xf6\x0f\x02\xff\x0e\xae\x28\x11\x72\x12\x5c\x32\
-\xaa\x57\xab\xce\x55\xa2\x2b\x10\x21\xb0\x21\x4b\xdd\x3b\x1f\x3c\
-\x3e\xd2\xe0\x8c\x46\xe3\xd4\x6d\xc7\xb2\x0c\xe3\x66\x3d\xf7\xf1\
-\xe6\xc3\xbb\x89\x03\x25\xaf\xf2\xf7\xf1\x6a\x3a\x61\x69\x27\xc6\
-\xf4\x19\x53\x23\xca\x71\x63\x72\x46\xee\xf1\x4a\x61\x96\x87\xce\
-\x3c\xd5\xfb\x95\xc6\xf1\x11\x38\x03\x34\x94\x66\xa8\x82\xc0\xc8\
-\xb0\x2f\x45\xe8\xce\x0c\x08\xab\xcb\xa8\x9e\x7e\xa6\xcf\x13\x65\
-\x1d\xca\x8b\xc9\xd9\xce\x64\x57\x6e\x6e\xe3\x97\x3a\x95\xc7\xc6\
-\x5f\x83\x47\xcd\x9b\x0f\x04\x10\x1f\x32\x4d\xd8\x74\x74\xb7\xe1\
-\xb9\x59\xcf\x4f\xdb\x7a\x2c\x0b\xe9\x7a\x0a\x21\x41\xf2\x62\xf3\
-\x9a\x9f\xdd\xdc\xb9\xfe\x9a\x1e\x8d\x3a\x43\x76\x29\x68\x18\xb7\
-\xa4\x03\xf7\x04\x75\xa8\xff\xbc\x20\x20\x1e\x81\x9d\x5c\x93\x77\
-\x99\x0f\x70\x2b\x70\x22\x47\x71\xa0\xc7\x05\x0a\xc8\xc6\x5c\xff\
-\x7e\x53\x0f\xc6\x45\xe7\x19\x0c\x3d\x2d\xe4\xc3\xa0\x3b\x17\x0a\
-\x0a\x72\x49\xcf\x26\xe2\x93\x29\xac\x2e\x2f\x5a\x23\xc9\x8b\xee\
-\x4f\xb3\x80\x8c\x70\x23\xc3\xea\x2c\x00\x2c\xbc\x1e\xe4\x82\x40\
-\xd1\x98\xac\x88\x1f\x04\x7f\xf9\xf4\xa0\xc5\x86\x1e\x17\xb8\x68\
-\xb9\x02\xc1\x52\x0a\x48\x53\x77\x2e\x00\xee\x07\x1b\x01\x99\xe3\
-\x65\x06\xd2\x25\x5c\xf6\x3a\x3b\x1f\xf4\xb4\x91\x27\xaf\x87\x40\
-\x30\x79\xf4\xa0\xc5\x46\x5e\xd4\xc2\xeb\x15\x6e\x64\x82\xdb\x38\
-\xbb\xd6\x83\x14\x1b\x97\xbd\x42\x0a\x03\x48\x06\x1d\xff\xb0\x46\
-\x95\xe2\xaf\xaf\x1d\xf6\xe1\xdc\xdb\xdb\x7d\xfa\x76\xcf\x3a\x35\
-\x31\x2c\x49\x92\x87\xac\x24\x1f\x4e\x79\xa1\xf2\x92\x3f\x3b\x16\
-\x8d\x8d\x79\xea\x80\x36\x07\xc2\xfa\x7a\x50\xab\xfe\x95\x63\xac\
-\xf7\xa5\x3b\xbd\x19\x0e\x8b\x6c\xca\x72\xfb\x52\xe3\x6d\xa6\x11\
-\x8b\x86\x77\x78\xbd\x51\x99\xc2\xc9\x10\xf9\xea\x3f\x19\x10\x06\
-\x61\x21\xe3\xa9\x67\xfa\x3c\x57\xd6\x22\x3f\x9a\xe5\x56\x33\x1d\
-\xa4\xdd\x11\x29\x67\x54\x89\x0a\x1f\x70\xec\xd1\xeb\x1e\x40\x9e\
-\xa8\x6c\x3d\x1a\x93\x09\x42\x41\x46\xc9\xa0\x21\x8d\x50\x73\x8d\
-\xe0\x3b\x23\x79\x29\x13\xfb\x36\x6d\xf7\x40\xf3\xb8\x2f\x3a\x5e\
-\x57\xeb\xb5\x61\x4d\x2a\xc4\x6a\x94\x40\xb0\x7c\x25\x19\xa8\x1f\
-\xfd\xb2\xd8\xd0\x1b\x2f\x7b\xa9\x21\x60\x45\x2f\x6a\x35\x18\x70\
-\x83\x1f\xdb\x12\x43\xa6\xd8\x75\xa6\xc7\x05\x98\x0d\x37\x3d\x0d\
-\x7c\x84\x19\x60\x5f\x16\xc9\xbb\xcc\x87\x8b\xce\x33\x10\x88\xab\
-\xa7\x85\x7c\x18\x74\xaf\x42\x41\x41\x2e\x6a\xee\x88\xcb\x89\xf8\
-\x64\x0a\xab\x4b\xa6\x91\x20\x1c\xe1\x82\x3a\xa8\xbc\xe8\xfe\x34\
-\xf3\xbd\x94\x22\x31\xb8\x91\x61\x75\x16\x00\x16\x5e\x0f\x5a\x5c\
-\xb0\x8e\x9c\xa2\x31\x59\x11\x3f\x08\xfe\xf2\x21\x1c\xa1\xd8\x7d\
-\x99\x1e\x17\xb8\x18\xb9\x0a\x80\xa5\x14\x90\xa6\xee\x5c\x00\xf0\
-\xcb\x0b\x72\x79\xf2\x0d\x84\x5e\x07\x81\xed\xf9\x7c\x75\x86\xfa\
-\xba\xe4\xfe\x1f\xe9\xc0\xe8\x69\x23\x4f\x5e\xc6\x40\x30\x79\xf4\
-\xf0\xec\xbe\xb2\xc8\xc5\x00\xc5\xf3\xd7\x19\x8f\x47\x56\x60\x9e\
-\xc1\x6d\x9c\x5d\xb3\xc8\x17\x00\x34\x34\xfd\xf2\x9f\x05\x17\x3c\
-\xf1\x91\xde\x2f\x56\x08\x37\x8e\x20\xbd\xce\x1b\x1e\x69\xcd\xfe\
-\x7a\xed\xa1\x97\x46\xcf\xdf\xb9\x88\x8a\x46\xaa\xa1\xa4\x15\xf6\
-\xa9\xa5\x40\x10\x6f\xb0\xe3\xd3\xde\xe8\x51\xbf\xee\xb8\x8e\x75\
-\xbe\x49\xcf\xf5\xd8\x89\x4c\xfc\x27\xc7\x60\xaf\x60\xb8\xc5\x14\
-\x97\xec\xf6\xce\xea\xf9\xed\xda\xff\xee\x4c\xca\xc4\x22\x9a\xf3\
-\x6e\xb5\x00\x4e\x3d\xdd\xe7\xb9\x72\x56\xd3\x3d\x59\x1e\x5f\xaa\
-\x99\xf2\x21\x27\x54\xbe\xe6\x56\x34\x43\xac\xcd\x64\xf9\x66\xed\
-\xa1\xc7\xee\x5a\xb2\x77\x05\x97\x81\x45\x2a\x02\x20\x6c\x9d\x60\
-\xd5\x5d\x0f\xf6\x1f\xd1\xa0\x8c\x61\x6c\x96\x53\x51\x6c\x16\xd9\
-\x7e\x2a\x39\x7b\x5a\xcd\xcf\x97\xbf\xc9\xeb\x46\x8f\x72\x55\x82\
-\x64\x0c\xae\xbb\x43\x64\xb0\x27\x2a\xf0\x61\x42\x98\x05\x64\x5e\
-\xa2\xf2\x60\x45\x1c\x7b\xf9\x61\x3e\x85\x00\x65\x27\x0b\xc1\x40\
-\x36\x38\x55\xa3\x3b\x99\xf6\x64\x1a\x90\x89\x20\x03\xa4\x91\xc1\
-\x39\x88\xab\xc9\xac\xa0\xa0\xe9\x48\x9b\xae\x59\xc7\x4b\x76\x48\
-\x20\x6d\xf8\x93\x7d\x37\xfd\xc4\x41\x00\xab\xc8\x3c\x47\x6e\x7c\
-\xb5\x1e\xfc\x70\xae\x62\x37\x32\xd8\xe7\x85\x3c\xa3\xc8\x40\x66\
-\xec\x53\x45\x9e\x6b\xc8\x2c\xa7\xb0\xa9\x14\xf6\xbc\x79\x06\x23\
-\x20\x9f\x32\xf4\x13\xc7\x65\x5d\x4f\x06\x47\x8a\x61\x19\x7d\x61\
-\x1d\x02\xd2\xff\x91\xcc\x1b\x14\xf7\xbc\x6d\x16\x08\x96\x8d\x7e\
-\xd6\x25\x0b\x75\xd9\x86\x4c\x4d\x32\x38\xc5\x05\x7e\xa7\xc9\x60\
-\xa1\xc6\x0a\x32\xeb\x29\xbc\x0f\x32\xd2\x35\xb2\x2a\x34\x2f\xa4\
-\x0f\x7f\xb2\x1c\xf4\xf3\x0d\x32\x9d\xc9\x4c\x26\x27\x7c\x6e\x0c\
-\x64\xca\x3a\x20\xba\xae\x45\xd7\x28\x23\xcf\x17\xf7\x70\x23\x99\
-\xe7\xc9\x3b\x0b\xe9\xd0\x35\xcb\x8c\x2e\xed\x74\x89\x6d\x05\xd5\
-\xe0\x46\x40\x9d\xd7\x24\xaf\x14\xfc\xd0\xd3\xc5\x61\x14\xb8\x3f\
-\xcd\xc9\x60\x1f\x1e\xdc\xb0\x97\xf5\x08\x19\xa4\xbb\x94\xc2\xef\
-\x23\x9b\xd5\x35\x59\x48\x3a\x64\x39\x90\x37\xfc\xc8\x7a\x94\x7e\
-\x8e\x26\xb3\x90\x0c\xda\xaa\x87\xfb\x21\x5c\x71\x11\x90\x1e\xda\
-\xcc\x3b\x64\x20\xe3\x78\x72\x9a\x19\x98\x1e\x5d\xf2\x36\x80\x36\
-\x86\xba\x4b\x22\x83\x29\x9c\x13\x3c\x1c\x59\xec\xc0\x7f\xb2\x31\
-\xf2\xf4\x0a\x19\x1c\x7c\x6d\x25\xf3\x34\xb9\x7f\xc0\xfd\xe9\x77\
-\x01\x90\x5f\xe0\x33\x84\x76\xd5\x81\x4c\x57\x32\x4d\xc8\xa0\xdd\
-\xa1\xce\x73\xc9\xec\x27\xb3\x8e\xcc\x32\x0a\x8a\xbc\x79\x9e\x4f\
-\x91\xdb\xfb\x64\x50\xaf\x68\x27\xa8\x13\x1c\x77\x07\x62\x2d\x74\
-\x08\x37\x28\xdf\x1a\x74\xcd\xef\x3b\xf6\x47\xf2\x6d\x65\x28\xeb\
-\x0e\x32\xcb\xc9\xac\xa5\xa0\xac\xae\xe9\x9a\x45\x84\x1d\x0c\xf8\
-\xeb\x69\x62\xab\x16\x0e\x1f\xc0\x91\x73\xdf\x92\xd3\x78\x72\x0b\
-\xcc\xb3\x0a\x5d\x23\x4f\xf4\x17\x68\x6b\xb8\x0f\x68\x0b\xa8\xdb\
-\x54\xb2\x8b\x0d\x64\xa8\x5f\xfe\x73\xc0\x10\x27\xb4\xbb\x4f\x07\
-\xb4\x6e\xf1\x50\xeb\xaa\x5f\xa5\x67\xe6\x80\x98\x7c\xf4\x9a\x60\
-\x8b\xb6\x9a\xcd\x67\x92\x33\x3e\x29\xff\xd9\x8a\x4f\x51\x01\x26\
-\x52\x8e\x48\x5b\x2b\x54\x28\x4e\x68\x4d\xcb\x45\x46\x6f\xbc\xbb\
-\xcb\x67\x8a\xa2\x36\xa4\xda\xce\xa5\x9a\xcd\xf7\x66\xab\x93\x61\
-\x6c\x8a\xdb\xfb\xcb\x8d\x33\xd7\xbf\xbc\xf1\x54\xba\xb3\x28\x32\
-\x6c\x55\x31\x46\x9e\x3f\xa2\xfd\xb8\x32\x66\xe3\x1d\x59\x1e\x25\
-\x3d\x80\x04\x39\x54\xb7\xaa\x59\x62\x23\x1d\x69\xf7\xce\xd9\x72\
-\xef\x17\x5b\x8f\x1c\x02\xc9\x41\xbb\xd4\xfd\x0b\x80\xfb\xb7\xaa\
-\x10\x6d\x5b\x30\xac\xfd\x73\xf1\x61\xe6\x61\xa4\xb9\x66\x51\xda\
-\x0a\xc9\x27\x47\xdb\xcc\xd2\xa4\xd5\xfb\xee\x7e\x78\xe9\x81\xed\
-\xbc\x8e\xf4\xa8\x57\x1d\xe8\xd6\x14\xa7\xa1\xe0\xa1\xc1\x7d\x40\
-\x43\xfc\x90\xe2\x9c\xef\x41\x62\xfe\x64\x97\xa3\x9f\xcf\x92\xc1\
-\xf2\x72\x90\x21\xf2\x0a\xac\x7b\x80\xbb\x9d\x24\xf3\x19\x99\x8f\
-\x28\x6e\x66\x61\x79\x90\x3b\xef\x7c\xd0\x91\xe2\xe1\x47\x5c\xdc\
-\x53\x74\xc8\x6f\x91\x3b\xf2\x79\x82\xcc\x3d\x64\x70\xd2\x7f\x51\
-\x79\x9e\x21\x83\x93\x75\xd0\xc9\x81\x10\x8b\x2c\x17\x47\x80\x0c\
-\x38\xc7\xf1\x13\x32\x38\xdd\x3f\x54\x3e\xc1\x40\x3b\x80\xac\xa3\
-\x28\xfe\xb7\xe7\xcb\x8f\xfc\x91\x1e\x9e\x65\xe4\xd5\x92\xae\xff\
-\x4b\xa6\x0f\x19\x74\x46\x85\xe5\x87\x3c\x70\xd8\xf5\xdb\x14\xef\
-\x87\xc0\x34\xe0\x19\x0c\xf2\xe6\xf7\x0a\x07\xc9\xbf\x45\x06\xf2\
-\x40\xc6\xf6\xe4\xbe\x81\xdc\x9b\xd1\xf5\x38\x32\x03\xc8\x80\xe0\
-\x78\xbe\x08\x87\x36\xf1\x3a\x85\x7b\x09\xe9\xd0\x35\x27\xcd\x60\
-\x22\xcc\x22\x53\x9d\xbc\x50\xc7\x38\x67\xf3\x39\x32\xad\xc8\xe4\
-\x7b\xb6\x75\xf0\xf4\xf1\x69\x51\x10\xda\xff\xe9\x72\xf8\x3b\x4a\
-\xb2\xfd\x40\xbe\xe4\x04\xf9\xaf\xa3\x9f\xcb\xc8\x70\xb9\x1e\x21\
-\x77\x2c\xc2\x2b\xd6\x3d\x0d\x04\xc5\xe1\x44\xf2\x26\xfd\x84\xac\
-\xc8\x13\x7b\x05\x5b\x93\xfb\x5e\x72\xf7\xcb\x42\xd7\x78\x21\xd8\
-\x4a\x06\x2f\x0a\xc0\x4f\xe4\x7c\x2b\xc2\x90\x8d\xfb\x76\x51\x44\
-\x18\x10\x1f\x04\x76\x3f\x19\xb4\x69\x7e\xd8\x45\x30\x78\x9d\x65\
-\x90\xc1\x8b\xd6\xbb\x14\xf7\x00\xc5\x7d\x06\xd7\x64\x8a\x45\x84\
-\xe4\x8e\x34\x90\x2f\xea\x13\x2f\x8f\x68\x6f\x03\xc9\x80\x84\x79\
-\x1e\xc1\x80\x3b\x5e\x2c\x41\xb8\x20\x35\xf6\x02\x46\x76\x81\xf6\
-\xc6\xf3\x25\x1b\xcf\xe6\x17\x64\x50\x6e\xec\xbd\xec\x43\xee\x7f\
-\x92\x7b\x3d\xba\x46\x3b\xbc\x95\x0c\xea\x95\xe7\xc9\xef\xe9\x14\
-\x0a\xf7\x00\xd9\xc5\x06\x6e\xd4\x3f\x0e\xde\xc1\xdf\x5e\x3f\xf6\
-\xe1\xac\xec\x5c\x33\x11\x84\x4a\x7c\x67\x22\x42\x70\xa7\xb8\x3c\
-\x59\xd1\x65\x22\x1f\x4f\x79\xa6\xd7\xbb\x44\x18\xe1\x20\x41\x10\
-\x16\x8b\x18\x02\xb2\x7e\x92\xcb\x80\x7a\x15\xeb\x5b\x1d\xd6\x46\
-\x4e\x9f\xe2\x26\x87\x02\xe5\xb0\x10\x91\x65\x3a\x3d\x59\xe5\x22\
-\x6c\x5d\x1b\x95\x8b\x60\x67\xe9\x85\x4a\x95\x64\x61\xae\x8d\xe3\
-\x23\xa2\xca\x59\xe5\x6e\x19\x2e\x9f\x93\xe2\xc2\x2d\x38\xb4\x44\
-\x4a\x37\x3d\x74\x5a\xb5\x72\xe1\xe6\x46\xcc\xa1\x60\x18\x3f\xa0\
-\xbb\x83\x04\x3f\xec\xdb\xbe\xd2\xb2\x51\x9d\x3f\x0b\x33\x4b\xb7\
-\xa7\xe5\x7a\xa1\x65\xe2\xa6\xc9\x20\x43\xd2\x3a\xad\x43\xdb\xd7\
-\x7e\x10\xe1\xaf\x66\x12\x2c\x04\x68\x74\x68\xa0\x81\x86\x3f\x34\
-\x20\xb6\x22\x11\xd0\xd8\xd1\x71\xa2\x83\x78\x9a\x0c\xde\x5e\xf1\
-\x30\xa2\x13\x80\x86\xcf\xd3\xc5\x35\xdc\x70\x0d\xad\xe0\x35\x32\
-\x1b\x29\x6e\x07\x3d\x8d\x50\x1d\x25\x6f\x13\xe8\x64\xe1\x8f\x37\
-\x62\xa0\x36\x85\x47\xe7\x8a\x3c\x5f\x20\x03\x59\x79\xfa\xc1\x79\
-\x42\x16\xd8\x08\x83\x87\x7d\x33\xc5\xbd\xbe\x88\x3c\xfd\x20\x7f\
-\xde\x41\xa1\x73\xfa\x89\x0c\x48\x90\xa7\xc9\xf3\x28\xca\x00\x28\
-\x2b\x50\x68\x3b\xa3\xf4\xb9\x1f\x3a\x5b\xbc\x3d\x63\x9f\x1a\xbe\
-\xe8\x80\x4e\x94\x97\x29\xb8\x5c\x70\x47\x3b\x84\x06\x83\x2f\x1c\
-\xcc\x23\xbb\x9c\x2e\x6f\x61\x7d\x02\xc2\x03\xbc\x93\x45\x39\x90\
-\x77\x35\x8a\x83\x36\x0c\xed\x6c\x08\x19\x90\x6f\x70\xbe\x00\x3f\
-\xcf\xb2\x28\x20\x7c\x14\xa5\x37\x93\xec\x9f\xc9\x40\xbb\x00\x90\
-\x5e\x60\xbd\xf1\xb4\xe1\x8e\x72\xa2\x0d\xad\xa6\x78\xff\x23\x9b\
-\xd5\x07\x5d\x07\xd7\x19\xff\x0d\x4d\x19\x00\x81\x02\x38\x25\xe9\
-\x62\xc1\x9f\x59\x5e\x27\x48\x13\x1a\x33\xb4\x23\x00\x79\xf2\x7c\
-\x71\xa6\x2a\xb4\x16\x94\x03\x68\x8c\x3f\xa8\x73\xf6\xeb\x22\x40\
-\x45\xc4\x33\x84\x7b\x06\x32\xc2\x68\xc7\xc7\x64\x40\xb4\xa8\x23\
-\xc8\xc2\xeb\x9f\xd7\x19\xf2\x86\xc1\x17\x2d\xee\x23\xb3\x85\xe2\
-\xe2\xc0\x6d\xfe\x6c\x9c\x17\xbc\x5e\xf5\x67\x00\x9a\xe4\x16\x32\
-\xc3\xc8\xa0\xdc\x3c\x7d\x9e\x27\xcf\x17\xf7\x09\xe5\x6c\x48\xe6\
-\x2b\x32\x20\x33\xbc\xf0\x14\xd5\xde\x00\x76\xf6\x33\x81\xd7\x59\
-\x25\x0a\x3f\x94\x6c\xe4\x09\x8d\x1e\x67\xd3\xc2\x8f\xb7\x07\xe4\
-\x07\x54\xd5\xed\x62\xe3\x1f\x27\x42\x22\x35\x96\xc7\x27\x7d\x1a\
-\xdf\x18\x6b\xb5\xb5\x27\x7d\x2c\x70\x38\x4d\xb6\xc9\x46\xd9\xed\
-\xf2\xa6\xdb\x65\x53\xff\x65\x23\xdb\x4f\x19\xdf\xa7\x61\x55\x68\
-\x6d\x20\x12\x3d\x4c\x3e\x78\xc8\x13\x95\xf7\xbf\x15\xfb\xd6\xad\
-\x4d\x4c\x1e\x17\x17\x6e\xb3\x11\xe1\xa0\x53\xe2\x0f\x2a\x80\x55\
-\xa3\x52\x6c\x84\xdd\xba\x3e\x35\xf3\xc5\x6f\xb6\x1e\x3f\x8a\x38\
-\x20\x59\xdd\xdf\x0f\xb8\x61\x5b\xc4\xd4\xed\xc7\x52\x3f\xd9\x7c\
-\xec\xb9\xd8\x18\x87\xe6\xf1\x15\x4c\x8f\xc2\x19\xe2\x22\xac\x31\
-\xeb\x8e\x26\xbd\xfb\xbf\x95\x07\xe6\x52\x7a\x6c\xdf\xa2\xee\x9f\
-\x0f\x90\x1d\xaf\xbc\x13\xfb\x37\x6a\xf9\x64\xfb\x72\x5f\x6b\x8a\
-\xaf\x25\xa9\xbf\xe9\x56\x99\xa9\xfa\xbc\x5c\xf8\x90\x70\x4e\xac\
-\x6c\xea\xf4\x69\xbf\x66\xfd\x99\x83\x5e\x57\x25\x04\xa8\x23\xbc\
-\xa5\x71\x83\xdf\x78\x9b\xc4\xc6\xe1\xc9\x64\x80\x02\xf5\x0d\xe0\
-\x5e\xe8\x0f\x12\x86\xa8\xe6\x92\x01\x49\xa0\x41\xa3\x3e\x91\x06\
-\x3a\x53\xd4\x15\x4f\x1b\xd7\x70\xc3\x35\x7f\xb8\xd0\xa1\x2d\xa5\
-\x34\x6e\xd3\xd3\x2a\x8c\x98\xf8\x3d\x42\x87\x09\xdc\x40\x66\x11\
-\x99\x4a\x64\xf8\xc3\xc3\xd3\x0f\xce\x13\x71\x60\xf3\x3c\xab\x93\
-\xc1\x43\x8c\xcd\xd0\x85\xe6\x49\xee\x9c\x04\xa1\x9d\x41\x13\x04\
-\x90\x06\xd2\x45\x9a\x3c\x8f\x50\x86\xd7\x23\x86\x64\xbf\x24\x03\
-\x84\x6c\x67\x94\x3e\x1b\x42\xa2\x4b\xc8\x38\x9d\x0c\x0e\x73\x46\
-\x7c\xde\xf1\x20\x2f\xa4\x15\xaa\x5c\x68\x6b\xbc\xfc\x68\x7f\x2b\
-\x28\xb9\x7a\xba\xdc\x45\xb5\x43\x7e\x4f\x91\x2e\xe4\x7a\x9d\x0c\
-\xca\x88\x74\x83\xf3\x45\x7e\xb8\x3e\x4c\x66\x12\x19\x20\x64\x9b\
-\xd0\x81\x7b\xf0\x17\x19\x74\x76\x48\x1b\xf2\x41\x96\xc0\xf4\x78\
-\x19\xf0\x1b\xee\xc8\x0f\x6d\x07\xcf\x15\x34\x52\x7c\x4e\xc8\x86\
-\x7a\x41\xfd\xd0\x75\x30\x90\x26\x80\x34\x80\xa2\xe4\x29\x2e\x38\
-\x99\xf1\x34\x51\xa7\xc1\x40\x3e\x08\xc7\xc3\x70\x39\x2e\x0a\x54\
-\x34\xfe\x22\x89\x21\x50\x4c\x19\xe0\xa5\x81\xb7\x53\xd4\x51\x61\
-\xed\x99\xdf\x37\xd4\x19\x88\x04\xed\x66\x0c\x19\xa0\xc8\xfe\x27\
-\xb0\x3e\xe9\x12\xcf\x38\xb4\x3b\xa4\x87\xb4\x50\x36\x7e\x4f\x78\
-\x9e\x81\xf9\xf2\xf6\x06\x83\xe1\x4c\xb4\xb7\x56\xe7\x69\x6f\xbc\
-\x8e\x10\x1f\x18\x4b\xe6\x1b\x32\x9c\x74\x51\x0e\xe4\x09\x83\xbc\
-\x10\x0e\xdf\xb4\xfc\x3f\x32\x17\x84\x22\x0b\x7e\x39\x40\xbc\xc5\
-\x1a\xc9\xad\x4d\x2a\xdf\xeb\xf1\xf9\x48\x11\xf2\x37\x1a\x0e\x1c\
-\xbd\x62\xf6\x29\x6a\x86\xe2\x53\x1b\x8f\xe9\x54\xff\x9b\x67\x3b\
-\xd6\xa9\x00\x22\xe1\xda\x5a\x30\xf4\xca\x93\x3b\x7c\xbd\x62\xee\
-\xba\x63\x29\xff\x8d\x0e\xb3\x9a\xbd\x8a\x86\xb2\xb0\x46\xad\x90\
-\xbf\xdd\x6c\x8c\xda\x74\x32\x65\x72\xbb\x09\x4b\x17\xa1\xa2\x11\
-\x07\x7e\xa1\x80\x6d\x11\x08\xf3\xe8\x1f\x3b\x36\x6e\x38\x9a\x3c\
-\x3e\x3c\xcc\x1a\x4e\xfc\xc8\x1f\x10\x46\x82\x94\x47\xe4\xba\x13\
-\x69\xe3\xdb\x7f\xb9\x9a\x0d\xe1\x52\x7a\x21\x1f\x20\x0c\x87\x42\
-\xf6\xb1\x1d\x6b\xd7\x7b\xa4\x6d\xdd\x29\xc9\xe9\xce\x78\x0a\x9e\
-\x4d\x45\x31\x87\x88\xa0\x7a\x7c\x8a\xe3\x96\x06\xe5\xf1\x46\x55\
-\xe8\x57\xf0\xaf\x32\xf0\x62\x40\x66\xbc\x7d\x62\x48\x0c\x73\x11\
-\x4d\xc9\xe0\x2d\xb7\x13\x15\x1f\xf3\x37\x21\xdf\x76\xa9\x2e\xf8\
-\x5b\x2c\x86\x2e\xf0\x06\xcb\x1f\x0e\xfe\xe0\x60\x3e\x01\xda\x17\
-\x08\x8b\xa7\x8b\x4f\xc3\x60\x6e\xe5\x20\x19\x3c\x58\xe8\xec\xf1\
-\x20\x20\xfc\x0c\x4a\xeb\x66\x4a\xb3\x30\x62\xe2\x6d\x88\xdb\xd0\
-\x10\xd1\x01\xf0\x3c\x91\x1e\xc8\x1b\x43\x52\xbd\xc8\xf0\x3c\x7b\
-\x93\xc1\x10\x15\x86\xee\x78\x9e\xfc\xc1\xfc\x86\xf2\x1a\x52\x44\
-\x9e\x1c\x2f\x92\x41\x5c\x9e\x17\x86\xa4\xf0\x30\x23\x7d\xe4\x13\
-\xca\xc0\x0f\x23\x0e\xbd\x29\xfd\x64\xb2\xd9\xd8\x1a\xec\x22\x00\
-\xc2\xc4\xa7\x73\xa0\x05\x20\x2c\x3a\x04\xd8\x98\xaf\x7d\x88\x0c\
-\xe6\x8c\x90\x26\x88\xf9\x76\x32\x18\x6e\xc2\xbc\x2b\x3a\x10\xd4\
-\x0b\x08\x0c\x9a\xd1\x7c\x2a\x4f\x35\xca\xee\x7c\x64\x08\x20\x7d\
-\x94\x1d\x2f\x24\xb8\xcf\xe8\x84\x91\x2f\xd2\xc3\x50\x25\xe6\x64\
-\x31\x8f\x88\x36\x81\x0e\x0f\xdf\x1b\x2c\x74\xe8\x95\x00\x77\x74\
-\x70\x68\x53\xb8\xb7\x00\xe4\x43\x9d\x7d\x4d\x06\xed\x0d\x9a\x3c\
-\xca\x81\xf2\x40\xd3\x86\x26\xcb\x3b\x43\xc8\x83\x72\x40\xc3\xc1\
-\x70\x72\xc8\xbe\x83\x10\xec\x5e\x58\xb8\x0b\x41\x70\x5d\x15\x27\
-\xef\x8b\xce\x17\xf7\x86\xea\x11\x6d\x0f\xf5\x80\x17\x49\x68\x9b\
-\xa8\x33\xc8\x81\xba\xc0\xf4\xc1\x87\x64\x30\x5c\x89\xe7\x13\xf7\
-\x00\x43\xc2\xd0\xe0\xf0\x82\xc5\xdb\x3d\xee\x19\xee\x61\xb1\xb5\
-\x62\xca\x17\xf5\x8c\x17\x1f\x3c\xbf\xfc\xc5\x07\x79\x22\xef\xa5\
-\x64\x1e\x27\x83\xfb\x8e\xfb\xd4\x82\x0c\xee\xc7\xa7\x64\xce\x91\
-\xe1\xe1\x10\x0f\xf3\x7b\xbf\x51\x19\x1a\xa0\x4d\xa0\x4c\xf4\x3b\
-\x18\xc1\x75\x84\x21\x51\x84\x83\xdc\x48\x0b\xb2\x63\xae\xfb\x49\
-\x32\x7c\x4e\xb4\x29\xa5\x87\x17\x83\x0b\x42\xa8\xcc\x2f\x2b\xa8\
-\x80\xac\x30\xdf\x6c\x3b\xfe\x06\x95\xf6\x28\x11\x42\x0c\x69\x6b\
-\x68\xbc\xf9\x60\x34\x4a\x32\x11\xa2\x21\x2b\xc7\x79\xe0\xb7\xfd\
-\x67\x30\xc1\x7a\xbe\x03\xb5\x15\x8a\x63\x6e\xff\xcd\xea\x39\x2b\
-\x8f\x9c\x7b\x31\x3a\x9c\x7d\x5d\x02\xab\x4b\xbd\x16\xd9\x18\xe5\
-\x93\xe4\x3f\x5a\x7f\xb9\xea\x13\xca\x9e\x75\xbc\x7a\x34\x06\xc8\
-\x04\xe8\x3f\x19\xf4\x9b\x21\xb7\xfd\x62\xe5\x54\xcf\x99\x8c\x59\
-\x26\x8b\x29\x8a\xdc\x7c\x3a\x09\x46\xac\x3a\x96\xf2\x6e\xfb\x2f\
-\x57\x7e\x4a\x79\x9a\x30\x8f\x59\x18\x48\x66\x26\xf5\xdc\xfd\x67\
-\x0e\x66\xb9\x5c\x1b\x1d\x66\x93\x99\x72\x0a\xee\x2c\xa1\xb1\xaa\
-\x0e\xab\x39\xce\x64\x91\xd7\x10\x01\x63\x48\x8b\xcd\x7f\x32\xdf\
-\x92\x81\x43\x54\x3f\x89\x64\xef\x26\x7b\x97\x6e\x40\x28\x58\x10\
-\x11\x92\x1c\xc8\x9d\x3f\xc0\x58\x34\xf0\x11\x19\xb4\x03\x94\x19\
-\x0f\x25\xe6\x56\x1e\x21\xd3\x96\xc2\xe0\x8d\x6e\x89\x9e\xe6\x4e\
-\xba\xfe\x93\x6c\x0c\x63\xe2\xc1\x02\x49\xf2\xce\x0f\xf7\x15\x0f\
-\xf5\xe7\x94\x66\x6d\x3d\xed\xf3\xb5\x69\xc4\x09\xcc\x13\x6f\xc3\
-\x98\xd3\xc1\x70\xeb\x22\x9e\x27\x99\xbf\xc8\x40\xc3\x02\x79\x60\
-\x0e\x05\x64\x86\x38\x1c\x9f\x51\x5e\x78\xe8\xf2\xe5\x89\x6b\x72\
-\x43\x5b\xc2\x83\xde\x25\xcf\x95\xc9\x08\x40\x93\xc4\x5c\x4c\x60\
-\x9d\x85\x32\x98\x4b\x71\x16\x55\x16\x3d\x1f\x68\x3d\x98\x9b\xc2\
-\x81\xe8\xe8\x08\x21\x1f\xf2\x42\xfc\x1b\xc8\x1b\x2f\x10\x9f\x91\
-\xbd\x0e\x69\x92\xc1\x70\xf0\x2c\xb2\x31\x2c\x86\x72\x61\x9e\x08\
-\xf7\x0a\xf1\x10\x1f\x43\x77\x18\xba\xe2\xcf\x43\x71\xda\x23\xea\
-\x13\x72\x22\x5f\xbc\xa8\x80\xc0\x7b\x91\xf9\x94\xcc\x1a\x32\x68\
-\x13\x19\x94\x14\x9e\xc3\x22\x9e\x68\x76\x4f\xe0\xcf\xef\x29\xe4\
-\x9a\x43\x06\x24\x8a\xc5\x4e\x3f\x90\xbd\x85\x0c\xca\x81\x39\xdf\
-\x2f\xc8\xc6\x90\x28\x16\x04\xe1\xe5\x09\x71\x60\x50\x0e\x74\xbe\
-\x98\xe7\x42\xfd\xfc\xe3\x7d\xdc\x95\x04\xee\x09\x15\x0b\xf7\x06\
-\xe4\x07\xed\x08\x0b\x44\x78\xdb\x44\x59\xc7\x93\x41\xbb\x04\xe9\
-\xcd\x23\x7b\x07\x19\xb4\x37\x2c\x32\x03\x39\xa2\x4d\x62\x08\x1b\
-\x7d\x2c\xea\x0b\x71\x0a\xf4\xc7\xc1\xe0\xf7\x8f\x6c\x10\x20\x5e\
-\x72\x50\xcf\xbc\xce\xd1\x0f\x80\x74\x7b\x50\x90\x8f\xc9\xac\x26\
-\x83\xfb\x84\x45\x59\x73\xc8\x46\x78\x10\x32\xe4\x0d\x6c\x6f\x18\
-\x09\xc2\x4b\x65\x18\x85\x29\x4e\x7b\x83\x9c\xbc\xad\xe1\x9c\x56\
-\xcc\xbd\x77\xa3\xb8\x98\xbb\x5f\x45\x66\x17\xfd\x4e\x86\xac\x64\
-\x5f\x10\xfe\xf1\x46\x42\xc2\xb1\x39\xbf\xe7\x16\xee\xde\x30\x7a\
-\xee\xd6\x3b\xed\x56\xeb\x32\x22\x00\x90\x21\x6f\xf4\x00\x76\x11\
-\xc8\x0e\xab\x29\xf7\xc5\x65\xfb\x3f\xda\x97\x9c\x85\xc5\x34\x38\
-\xd9\x85\x3d\x38\x44\x9e\x92\x39\x04\xfb\x90\x37\x0e\xde\x36\x77\
-\x99\xb6\xf6\xd7\x15\xc7\x52\x5f\x89\x0e\xb7\x9a\xdd\x3e\x35\x52\
-\x96\x0d\x07\x9f\x5c\xb8\x1d\xf3\x05\x06\x7d\x4e\xce\x0f\x2c\xbc\
-\x85\x4c\x40\x70\xc5\x63\xee\x12\x6e\x4f\xac\x39\xf0\xb6\xc3\x22\
-\x6f\x23\x2d\x33\x92\x48\x30\x6c\xcd\xf1\xd4\xf1\x9d\xbf\x59\xfd\
-\x05\x48\x50\x96\x24\x9c\x2d\x9a\x2f\x4d\x94\x8f\x6b\xaf\x90\x19\
-\xb2\xef\x4b\xce\x56\x5e\x58\xba\x6f\x82\xdd\x6a\xca\x81\x13\x79\
-\xf1\x38\xaa\x47\x51\xe5\x28\xbb\x39\x62\x77\x72\xe6\xd4\x9b\x66\
-\x6d\x7a\x60\xd6\x9e\xd3\x89\x48\x83\x97\xb7\x84\x80\x37\x36\xec\
-\xe3\xf1\x1b\x38\x50\xd5\x16\x78\xb0\x50\xaf\xe4\x8e\xfa\x05\x81\
-\x61\x48\x05\xda\x03\xef\xf4\xf0\xb6\x88\xb9\x37\x0c\x9f\x21\x0c\
-\xfc\x02\xd3\x84\x0d\x37\x17\x85\x01\x49\x62\x0e\x0c\xda\x0f\x1e\
-\x28\x74\x02\x98\x5b\xc4\xaa\x3d\xe0\x7c\x75\x88\xfb\x04\xd9\xa1\
-\x11\xf5\xa5\xf4\x40\xc8\x98\xb8\xcf\x97\x27\x19\x7a\x81\x61\xb2\
-\x62\x79\x36\xe4\xbd\x91\x0c\x56\x35\x42\x1e\xe4\x89\xef\xc4\xc1\
-\x3d\x98\x34\xb8\x0d\x4d\x09\x72\xe1\xed\x15\x6e\x58\xa9\x87\x21\
-\x75\xf6\x26\x4b\x76\x60\x5e\x05\x0c\x85\xc1\xc0\x02\x7f\x3e\xf2\
-\x81\xfc\x39\xd9\xa2\x73\xc1\x4b\x14\xc2\xa1\x4c\x30\x78\x2b\xef\
-\x42\xfe\xcb\xc9\x1f\x79\xa1\x1c\x81\xe9\xc2\x46\x59\x8f\x51\x18\
-\x68\x87\x18\xda\xe4\x9d\x0b\xca\x75\x3d\xf9\xe3\x53\x41\x40\x71\
-\xfa\x07\x5e\x9f\xd0\x34\x70\x7c\x18\x46\x60\xf0\xed\x4a\x18\x9e\
-\x67\xc8\x36\x11\x04\xdc\x37\xa4\x05\x83\x7c\xb1\x90\x03\x1d\xdd\
-\x61\x4a\x03\xf2\x06\x97\x83\xdd\x1f\x0a\x83\x7c\xa1\x0d\x60\x48\
-\x95\xd7\x01\xea\xe3\x05\xf2\xc7\x4b\x15\xea\xe9\x1f\xef\xe7\xae\
-\x20\x78\x59\x30\x5a\x81\x36\xc6\x09\x09\xf5\x76\x2f\x95\x17\xda\
-\x11\x56\x55\x07\xb7\x67\x18\xd6\xf6\x28\xcc\x2c\xb2\xa1\xb5\x61\
-\x15\x29\xea\x0b\x71\x0b\x05\xc5\xe3\x2f\xb0\x78\xb9\x43\x7b\x01\
-\x20\x07\xe2\x6e\x20\xd3\x95\xfc\xa1\x9d\x23\x0f\xab\x9e\x17\x33\
-\xba\x1b\xf2\x4d\xa2\x30\x98\xd7\xc3\xa2\x38\xc4\xe5\x64\xd8\x96\
-\x0c\x16\xbe\x00\xe7\xbb\x4f\xbc\xad\x81\xf0\x90\x27\xbe\xe4\xcf\
-\xd2\x27\xc3\xda\x07\xc2\x40\x56\xb2\x2f\x08\x57\xa4\x81\xa0\x83\
-\xb7\x9b\x4d\xa6\xef\xf7\x9c\x3e\x3b\x78\xd6\xae\xc7\xf6\x9c\xcb\
-\x9d\x14\x69\x37\x39\x3c\xaa\x86\xca\x20\x5f\x4d\x8d\xb0\x9a\xc2\
-\xb7\x9c\xcd\xfc\xee\xa3\x75\x87\xf6\x50\x81\xe4\xc0\x61\x42\x50\
-\xa6\x4f\xd1\x18\x21\xea\x4e\x7e\x10\x27\x79\xc1\x43\x5d\xbf\x5e\
-\xf5\xf3\xb2\xc4\x94\x37\xe3\x2a\x46\x3a\x27\x6d\x3e\xf2\xf2\xe4\
-\x8d\xc7\x92\x70\x3a\x0d\xe6\x14\xf5\xa0\x79\x37\x94\x32\xdb\x79\
-\xdf\x75\x8f\x6c\x7c\xa0\xd3\xa3\x54\x61\xf9\xde\x18\x3d\x94\x09\
-\x36\xc4\x7f\xbe\xfb\x54\xd6\xfd\x73\xb7\xbd\x14\x13\x1f\x9e\xb9\
-\xea\x68\xf2\xa4\x8e\x5f\xaf\x9a\x5c\x38\x09\xb2\xf9\x40\x36\xd7\
-\xc8\xe5\x83\xec\x28\xc3\x84\x75\x87\xf7\xa2\x4c\x28\x1b\xca\x48\
-\xc1\x14\x45\xd3\xec\x31\x31\xe1\xde\xc5\x47\x93\x9f\x6b\xfe\xd9\
-\xf2\xff\xcd\xdb\x77\xc6\x83\xe3\xd8\x4a\x18\x09\x02\xbc\xb1\x81\
-\x28\x02\x4d\xc8\xce\x9b\xc0\xeb\x19\x9d\x1b\x96\x3b\xf3\xb7\x58\
-\x10\xc5\x48\x8a\x87\x15\x7f\x98\xd7\xc0\x9e\x23\x37\x19\xaf\x9e\
-\x1e\x0c\xae\xd9\x30\x0c\xc2\xd0\xf5\x7c\xba\xc6\x5b\x26\x80\xc6\
-\x0f\x59\x06\x91\x1f\x1e\x0e\xdc\x53\x3c\x2c\xa1\xc0\x3b\x5b\x60\
-\x34\x05\xc5\x3c\x05\xf2\xa4\x7b\x13\x32\x4f\x3c\xa8\xe8\x00\x90\
-\x27\xe6\x15\xef\x45\x44\x02\xe4\x46\x9e\x37\x90\x1f\x96\x76\x03\
-\xc1\xcf\x12\x3a\x22\x80\xd7\x07\x56\x9e\x02\xc8\x2b\x30\x9f\xc2\
-\x4c\x71\xda\x03\x86\xa1\xb0\xf2\x92\x0f\x71\xa1\x63\x1b\x4a\x51\
-\xb1\xea\x12\x24\xe1\xd1\x4d\x60\xba\xbc\x2e\x41\xc6\x08\x03\x22\
-\x85\x16\x08\xf9\x79\xdd\x3c\x4e\x7e\x11\xe4\x87\xb2\x17\x78\xe6\
-\x02\x80\xb2\x21\x1e\x34\x82\xdb\x29\xfc\x39\x0a\x6e\x25\x3b\x38\
-\xdf\xc2\xda\x44\x30\x50\xa7\x48\x6f\x26\xc5\x19\x4b\x69\xa1\x9e\
-\xd1\x71\xe3\xde\x04\x97\x83\xe5\x41\x61\x50\x06\x0c\x9f\x62\xe8\
-\x14\xa3\x07\xa8\x07\xd4\x07\xe2\x62\x05\xe5\x35\x03\x2a\x2b\x27\
-\x24\x0c\x1f\x83\x54\x00\x94\x17\xf7\xe8\xbf\xe4\xf7\x25\xf9\xa1\
-\x3d\x83\x0c\x82\xdb\x33\xab\x33\xf2\xc3\x4b\x1f\xda\x33\xb4\x77\
-\x68\x86\xd8\x66\x80\x3a\x2f\xaa\xbd\xf1\xb6\x8d\x39\x7d\xac\xb6\
-\xc6\xb3\x8b\xe7\x0e\x5b\x71\x70\xdf\x4f\x52\x9a\x68\xef\xc8\x03\
-\xf9\x06\xe6\xc9\x9f\x23\x0a\xc2\xda\xc6\x7b\x74\x0d\xcd\x14\x32\
-\xf3\x74\xef\x25\xbf\x8a\xe4\x97\x6f\x74\x25\x08\x90\x0f\x7e\xd8\
-\x5a\x83\x75\x01\xfc\x05\x89\x95\x8b\x0c\x2f\xeb\x05\x93\x20\x50\
-\x58\xa6\x97\x1d\x4e\xaf\xcf\x67\x21\xb5\x67\xce\xbe\x43\x5a\xb3\
-\x29\x8b\xc7\x2f\x4a\x4c\x7d\x26\x26\xcc\xea\x22\x7e\xb3\xe1\x93\
-\x4b\x54\xa8\x84\x89\x1b\x8f\x62\x2e\x00\x9f\x4e\x62\x0f\x0e\x27\
-\x96\xfa\x71\xe1\x15\x47\xb6\xa9\x52\x09\xf3\x76\xa1\x2a\x8a\x38\
-\xc4\x4b\xee\xf2\xb0\x39\x9b\x67\x4d\x5a\xbc\xf7\xf6\x0f\xd7\x25\
-\x6e\xa3\xdf\x12\x4e\xa7\xd1\x83\x18\x24\xd9\xc8\x86\x48\x13\x6f\
-\x6f\x33\xac\x51\xe5\xe8\x07\x5a\xc7\x45\x3e\x90\xf8\xc4\x80\x11\
-\x70\x43\x5c\x3d\x18\x08\x4d\xa1\x1e\xc2\x48\xa4\xbd\xff\xe3\x15\
-\x07\x87\x0f\xf9\x79\x0b\x86\xdd\x8c\xa1\x48\x10\x8b\x6c\x20\x53\
-\xf3\x72\x51\xe5\x46\x34\xac\x54\x55\x97\x8f\xc9\xcc\xcb\x30\x71\
-\xed\xa1\xaf\xc9\x65\xbf\x47\xd1\xac\x44\xa6\x11\xb2\xc9\x70\xec\
-\xb3\xb5\xa7\xef\xed\x41\x5a\x2c\x15\xcf\x6c\x95\x8d\x5a\x61\xc7\
-\xb1\x5d\x63\xe0\x75\x37\x52\xb7\xf9\x6f\x0c\x71\x61\x01\x0a\xe6\
-\x87\xf0\x80\xa1\x0a\xd1\x49\x17\x30\xf0\x43\x18\xba\xc6\x83\x8c\
-\xb6\x82\xb7\x50\xb8\xf1\xfa\xc3\x10\x61\x51\xe0\x1d\xf2\x57\x14\
-\xff\x57\x4a\x07\x9d\x28\xb4\xcc\x42\x3b\x6a\xf2\x03\xb0\xef\x10\
-\x61\xf1\x26\x3d\x35\xcf\xc7\x9f\x27\xe6\xe6\x42\x21\x9d\x0c\xca\
-\x88\x0e\x03\x68\x4e\x69\x60\x08\x08\x1d\x11\xde\x62\x43\x96\x91\
-\x0c\xfc\x0a\x7d\x2e\xc9\x8f\x6b\xd6\x58\x85\x09\x2d\x15\xe0\x79\
-\xfc\x87\xfc\x92\xc8\xcf\x4c\x36\x3a\x9f\x42\x01\x39\xc8\x82\x01\
-\x30\xec\x7c\x8a\x0c\xd2\x81\x1b\x56\x41\xb2\x05\x5c\x84\xa2\xfa\
-\x08\xd6\xd6\x09\xd8\x9b\x89\x7d\x69\xa8\x23\x90\xec\xc5\x00\x75\
-\x85\x7b\x8c\xd1\x81\xe7\xe1\x40\xc0\x4b\x03\x97\x31\x24\x50\x4e\
-\xbd\xbc\xe8\xd0\xa1\x6d\x00\x20\x41\xa0\x1f\xf9\x55\x21\x3f\xdc\
-\x5f\x2e\x6b\x49\x06\xbf\x17\x58\x4c\x84\x6d\x03\x78\x5e\x50\x67\
-\xd0\xca\xde\xa1\xb2\xe2\xfe\x81\x88\x0a\xed\x4f\xc8\x0f\x40\x7b\
-\x06\x29\x61\xfb\x0c\xd7\xf0\x42\x3e\x03\x14\x0e\xed\x0d\x6d\x16\
-\x23\x20\x78\x89\x05\x78\x5d\x62\x4b\xcc\x11\xf2\xe3\x2f\x63\xd4\
-\xa5\x85\x6c\xd3\xbc\x7f\xe5\x7d\x2d\xa6\x21\xb0\x0f\x19\xf2\xa2\
-\x9d\x62\x88\x94\xb7\xb7\xc2\xee\x13\x97\xef\x35\xca\x73\x1f\xa5\
-\xc3\xda\x1a\x99\x7c\x7d\xf2\xc5\xe2\x1f\x23\x42\x22\xbd\x02\x05\
-\x42\x87\x4f\x72\xfb\x24\xa3\xd1\xd8\xf3\xbb\x35\x7f\x8c\x9f\xb5\
-\x71\xa4\x62\x32\x26\xc4\x96\x8d\x88\x9e\xb0\xf9\xc8\xf8\xaf\xb6\
-\x1e\xc9\x32\xe7\x1d\x82\xcd\x0a\xc7\x69\x67\xd1\x1d\xed\x5f\x9e\
-\x76\x5b\xdb\xe9\x53\x06\xb5\xac\x4b\xf1\x55\xe2\x1f\x5e\xb1\x7e\
-\x90\xbb\x92\x94\xeb\x56\x1e\xfe\x63\xd7\xa1\xa3\x19\x6e\x3c\x40\
-\xfe\x0a\xc2\x1e\x3d\x8d\x08\xee\xd3\x7e\xcd\x6e\xae\x59\xb7\xc2\
-\x0b\xd9\x59\x6e\x4f\x96\x57\x73\xd5\x0c\x57\x9f\x9f\xdc\xaf\xc9\
-\x60\xc4\x45\x18\x3d\x38\x5b\x6c\x93\xe9\xf2\x68\x8f\xfd\xb1\x3d\
-\xf1\x54\x96\x0b\x95\x8d\x93\x68\xf2\x55\x38\x64\xc0\x22\x9b\xcf\
-\x07\x76\xae\xbc\xee\xee\xeb\x3e\x9f\x36\xb8\xe5\x7b\x2d\x2b\x44\
-\xa3\x71\x91\x56\x69\xc4\xd6\x09\x2c\xf6\x91\xbf\xda\x79\x3c\xeb\
-\xe3\x4d\x47\x26\xc4\x95\x8b\x88\x92\xcc\xc6\x85\xa3\x7e\xd9\x3e\
-\xe2\x81\xdf\xd7\xe0\xcb\x14\x58\x54\xe3\x75\x51\x22\x7a\x92\x0c\
-\xe4\xec\x1f\x66\xbd\x56\x40\x8d\x96\x0f\xe5\x61\x3b\x00\xe6\xa6\
-\x00\x0c\x97\xa0\xd3\xc4\xdb\x21\x00\x42\x42\xfb\x38\xaf\xa1\xb0\
-\xe8\x00\x00\x3e\x1c\xca\xdb\x43\x07\xca\xc3\xa1\x87\x09\x55\x87\
-\x08\x87\xfb\x38\x91\xfd\xfa\x9b\x08\x8a\x03\xde\xb9\x60\x0f\x23\
-\xee\x19\xef\x6c\x3b\x52\x9e\x31\xc8\x93\x6c\xe4\xc9\xef\x27\x86\
-\x6f\x40\x2e\x68\x57\x88\x8b\xa5\xe0\xec\x98\x3e\x42\xc8\x72\xe9\
-\x06\x6f\xb5\xa8\x2b\x20\xd4\xf3\xc9\xdd\x3a\x91\x01\x19\xa2\x2e\
-\xe0\x86\xce\x10\x8b\x5d\xd0\x71\xf1\xfa\x29\x12\x7a\x3e\x20\x11\
-\x68\xab\xec\x25\x94\xc0\xeb\x04\x2b\xfb\x8a\x02\xca\x89\xf2\x62\
-\x1e\x88\xad\xa2\xa6\x74\x8a\x24\xdf\xf3\x80\xd7\x1b\xf6\x98\x61\
-\x95\x37\xf6\xcd\x15\xda\xa1\x07\x82\xc2\xe1\xe5\x08\x75\x80\x45\
-\x3a\xd8\xb8\x0d\xb9\x50\x07\xe8\xbc\x31\x6c\x0a\x84\xaa\xcb\x92\
-\x06\x5e\x1f\xbc\x4c\xbc\x4f\x9a\xc4\xeb\x9e\xec\x7c\xfd\x54\x11\
-\xe0\xf7\x6a\x06\x19\xb4\x53\xfe\x6c\x04\x83\xd7\x1b\x16\xa2\xe0\
-\x05\x09\xed\x03\x04\x86\x8d\xeb\xbc\xcd\x14\xf7\xd9\x65\xed\x92\
-\x6c\xbc\x24\xf2\x55\xc4\x1c\xd8\xf7\x5a\x18\xd0\x36\x20\x1f\x16\
-\xe1\xb1\x2f\xfb\x13\x8a\xd5\xc6\x8b\x0b\x34\x5e\xfd\xf2\xf2\x03\
-\x0f\x87\x89\x9a\xa4\x97\x7a\x7c\xdd\xc9\x0f\x10\x01\x91\x85\x3a\
-\xa8\x41\xc5\xb2\x03\xea\xc4\xf7\x78\x61\x69\xc2\xec\xd3\x59\x2e\
-\x7f\xe1\xd0\xb0\x49\x36\xf5\xc0\x63\x03\x47\xd5\x8a\x54\x9e\x4b\
-\xcb\xf1\x7a\xe3\xa2\x1d\x59\x5f\x6f\x3d\x32\x76\xf4\xaf\xdb\xd6\
-\x80\x88\x28\xfa\x79\x1f\x14\x7a\x45\x91\x29\x7b\xe5\xd3\xbe\x8d\
-\xbb\x3f\xd4\xae\xd6\x07\x59\xd9\x6e\x8d\xb8\x86\xc5\x23\x6a\x93\
-\x23\xc2\xad\xc6\xc9\xeb\x13\x9f\x7a\x70\xfe\x8e\x25\x3c\x2c\x8b\
-\x58\x04\x78\xde\x5f\xdc\xd8\xac\xf1\xbd\x6d\x6b\x7e\x98\x99\x99\
-\x5b\xce\x6a\x36\x99\x13\x73\x9c\x53\x1a\x4c\x58\x82\x8d\xe4\x4c\
-\x76\x3d\xb8\xa1\x42\xb8\xcd\xf6\x46\xaf\xfa\x37\xcc\x3f\x9a\xbc\
-\x64\xd6\xe6\x13\xb9\x16\x93\x4c\xda\xaa\x7e\x5a\x78\x00\xf2\x86\
-\x59\x2f\xa8\x31\x5f\x31\x50\x99\xb8\x4c\xb0\xd1\xd1\x60\xfe\x05\
-\x7b\xf9\xa0\x69\x17\x59\x67\x3c\x0c\xd9\x98\xa8\xc7\x2a\x2f\x84\
-\x47\xc3\xc6\x84\x3d\x56\x30\xe2\x37\xd2\x2c\x2e\x10\x16\x0f\x24\
-\xde\x8a\xb1\x7a\x10\xab\x40\x01\x3c\xdc\x4d\x28\xaf\xfd\x94\x17\
-\xde\x18\xa1\x2d\x60\x63\x36\xf6\xa4\xc1\x0f\xe4\xbb\x89\x0c\xf6\
-\x1f\xe2\x2d\x17\xed\xff\x82\xeb\x9a\xa2\x81\xe4\xb0\x2a\x0e\xf7\
-\x18\x1d\x45\x63\x4a\x66\x37\xb9\x73\xc2\xe7\xe5\xc5\x4a\x57\x68\
-\x37\x68\xd7\xe8\x3c\x20\x37\xf2\x47\x87\x1d\x5c\x67\xf0\x43\x38\
-\x0c\x37\x6d\xa6\xf8\x9b\x99\x63\x50\x5b\x0a\x48\x1b\x5a\x1c\xe6\
-\x4b\x31\x57\x8a\xe1\xb0\xff\x91\xfb\x8b\xe4\x1e\x72\xe3\x75\x61\
-\xe0\xe9\x93\x8d\xce\x15\x24\xc2\xcb\x84\x05\x29\x58\x01\xcc\x48\
-\x99\xae\x51\x57\xb8\x9e\x42\xd7\x58\x6c\xc3\xf3\xc5\x86\xfc\xe7\
-\xc8\xbd\xd8\xf9\x22\x3d\x0a\x8b\xd1\x93\xc0\x0d\xf5\x3c\x5f\x2c\
-\xb4\x59\x48\x7e\xe7\x6d\x57\x81\xe0\xf9\x93\x8d\xc5\x43\xd8\xe0\
-\xce\xe5\x7b\x8b\xdc\x9f\x27\x77\xbc\xa4\xba\xc9\xc6\x90\x22\x86\
-\x82\x79\x7b\xc0\x42\x8b\x27\x2f\x34\x3f\x80\xe2\xf0\xba\xc3\x48\
-\x01\x36\x77\x73\x92\xe0\x1b\xbf\x19\xb9\xe8\x61\x30\xbf\x86\x8e\
-\x9c\xd5\x25\x19\x2c\x60\x61\x7b\x09\x01\xf2\xe7\xf2\x17\xb6\xa1\
-\x1e\x2f\x2c\x20\xfc\x38\x72\xc3\xa2\x27\xa4\x07\x60\xae\xbb\x05\
-\xf9\xb1\x2d\x62\x64\xfb\xdb\xca\xf9\x40\xe1\x79\x5b\xfa\x9e\x7e\
-\x62\xbe\x98\xe7\xe9\xdf\x50\x4f\xd7\x28\x00\xc2\x60\x18\x9e\xcd\
-\xa7\x93\x41\x19\x71\xdf\x40\x4a\x18\xc9\x29\x76\x9e\x04\x94\x1d\
-\xf9\x60\x2b\x12\x16\x41\xf1\xbe\x00\x0b\xbc\x9a\x53\x5e\x28\x23\
-\xaf\x0b\x7e\x50\x01\xbf\x57\xd3\xc9\x7d\x24\xe4\x82\x4c\xf4\xfb\
-\xf2\x81\x12\xbc\xec\xa6\x61\x7c\x59\xf9\xe9\x0e\x75\xea\xb7\xaf\
-\x11\x06\x81\x31\x4c\x88\x1b\x54\x20\x1c\x91\x24\x23\xe2\x60\x43\
-\x35\xc5\xc2\x7f\x7c\x53\x93\x06\xea\xf3\x7d\xd7\x65\x3c\xd3\x7b\
-\x4b\xf6\xb3\x7d\xd6\xa7\x3f\xdd\x6b\xbb\xf6\xf2\x80\x2d\x5f\x0f\
-\x6c\x36\x40\x0f\xc7\xd2\x2f\xcc\xf0\x74\x26\xf5\x69\xd4\x82\xe2\
-\x51\xfc\xde\xdb\x28\x9d\x0d\x64\x36\xe9\x66\x23\xb9\x6d\xd5\x5e\
-\x19\xb8\x7e\x52\xbf\x26\x2d\x03\xe3\x14\x66\x40\x96\xb0\xbf\xba\
-\xb1\x79\x17\x4a\x73\x2d\xc5\xdf\x01\xd9\x32\x9e\xee\xbd\x49\x1b\
-\xd7\x7f\xdb\xf8\xde\x8d\x40\x10\xd4\xc8\x0a\xa6\x43\x69\x4b\xa4\
-\xeb\x85\x2c\x33\xaf\xa3\x8e\x95\x62\xa2\x47\x37\xaf\x8e\x63\xa6\
-\x0a\x84\xf9\x37\x0d\x9a\x8a\x6e\xd0\xe8\x61\xb7\xd1\xdd\x8b\xbc\
-\x07\x30\x3c\x0c\x01\x43\x2b\xb8\x40\x87\x0f\xfb\x72\x1a\x3c\x18\
-\xb0\xdb\xe9\x79\x81\x08\x61\x83\x08\x71\x81\x15\xa2\xb0\xf1\x4d\
-\x38\xb2\x0c\x78\xd8\x42\xca\x5b\x98\x21\xb0\x7b\x44\xc0\x6a\x46\
-\x5c\xf0\x72\x60\x85\x26\x59\xfe\x72\xb2\x7b\x4c\xc0\xca\x3e\x0c\
-\x3f\xe1\x07\x1e\x66\x5e\x77\xe7\x33\xe8\x6c\xfe\x24\xd3\x28\x30\
-\x5d\xfd\x9a\xcb\x80\x7d\x5c\xb8\x40\xba\xb0\xef\x08\x0e\x5b\x1c\
-\x43\xe0\xb2\xe2\xd0\x00\x74\xaa\xf8\x01\x73\x98\x0c\x86\x72\xc9\
-\x42\xd3\xf5\xe7\x0b\x22\xc4\x05\x3a\x33\xd8\x58\xa0\x41\x56\xf1\
-\xeb\x93\xc0\xf3\x04\x11\x82\x1c\xf0\x03\x06\x7b\x8c\xab\x06\x86\
-\x29\xae\x21\x04\xb7\x31\x5e\x2f\xd3\x74\x77\x10\x09\x6c\x10\x21\
-\x2e\xb8\xfc\x1f\x06\xc6\xbf\x10\x43\xe0\x75\x02\x22\xc4\x05\x6f\
-\x0f\x58\x39\x4b\x16\xeb\xe0\x79\x18\x10\x17\xda\x28\x6f\x03\x58\
-\x1d\x1c\x98\x16\xab\x3f\x02\x88\x10\x17\x7c\x2b\x0c\x4e\x69\x22\
-\xcb\x2f\x3f\x36\x8b\xf3\xb6\x0c\x93\xc0\xd3\xb8\x50\x43\xe0\x79\
-\x62\x75\x34\x2e\x78\x9e\x98\x6f\x24\x8b\xc9\xcf\xc3\x60\xf4\x05\
-\x17\x68\x9b\xb0\x2f\x97\xe1\xcf\x2d\xb6\x7c\x94\xd7\xf3\xe2\x65\
-\x05\x11\xe2\x82\xdf\xab\xb1\x5c\x2e\xd8\x97\xd3\x5c\xd6\xe1\x02\
-\x59\xff\x44\xd1\xd3\xd5\xa3\xaa\xbd\x77\x4b\xf3\xff\xfc\x3a\xb4\
-\xe3\x83\x8f\x56\x2b\x13\x05\xcd\x0f\xc3\xa1\x2c\x50\x00\xb8\xa6\
-\x08\xed\x90\x39\xe8\x20\x67\xb5\x55\xa5\x18\xe9\xfe\x66\xd5\x9e\
-\x76\xf9\x0c\x91\x44\x3e\x68\x60\xb2\xc9\x68\xf4\x64\x64\x7b\x0c\
-\x77\xb5\xac\xfe\xe6\x37\x03\x5b\x0c\x87\xf6\x46\xfc\xc1\xf2\x0c\
-\x06\x86\x17\x91\xce\xb3\x1d\x6b\x55\x7f\xa8\x53\x9d\x09\x69\x59\
-\x6e\x2b\x91\x0d\x1e\x8e\xc0\xbc\x70\xa4\x9b\x37\x2d\xd3\x65\x7d\
-\xa8\x63\xed\x8f\xc7\x76\xaa\x53\x03\x71\x82\xe5\xe1\x20\x39\xb0\
-\xb2\x53\xf9\xe6\xa6\x16\xfd\x46\xb7\xaa\xfa\x51\x66\xb6\xc7\x4e\
-\xf1\xd1\x78\x28\x86\xa4\xe6\x7a\x15\xd3\x43\xad\xaa\x3d\xdb\xba\
-\x52\xb4\x43\x55\xd9\x10\xae\x5f\x36\xa4\x49\x69\x6b\x98\x47\xd4\
-\x9d\x18\x20\x27\x81\x69\xc7\xd3\x7b\xb5\xa8\xb1\x70\x58\xdb\xb1\
-\x5f\x8d\xee\xfe\xf0\xe8\xbe\xdd\xf8\x62\x8b\x6b\x09\xe8\xf8\x02\
-\x81\xba\xc0\xbd\xbd\x14\x83\x8e\x85\x1b\x80\x0f\x59\x06\x83\xdf\
-\x8b\x6c\xdd\xbe\x14\x60\x71\x06\xc0\xef\x25\xde\x8a\xfd\xa0\xdb\
-\xcc\xe6\xb2\xc9\x02\xb1\x40\x53\xc0\x22\x16\xc8\x85\xf0\x78\xf0\
-\x43\x95\x03\x06\x0f\x3c\xda\x28\x64\xc5\x9e\xc6\xb5\x94\x0e\x48\
-\x16\x6f\xe4\xec\xed\x3c\x00\xc1\xed\x03\xc7\x93\x5d\x0a\x70\xba\
-\x48\xe0\x5b\x36\xde\xc0\x8b\xea\x1f\x78\x7d\x62\x25\x2d\x90\xaf\
-\x5d\x5f\x24\x90\xff\xa5\xde\x1f\x1e\x9f\xcb\x07\xad\x30\x10\xc1\
-\x72\xfa\x9f\xd1\x12\x02\x68\x63\xb8\xf7\xbc\xbd\xa3\xff\xb9\x58\
-\xf0\xba\xe0\xf7\xb0\xa8\xba\x08\x55\x8f\xa1\xda\xf0\x85\x98\xc0\
-\xe7\x16\xe5\x82\x29\x0a\x5c\xce\xcb\x8e\xa2\x1a\xfa\x05\x83\x2f\
-\xf4\xec\xde\x34\xfe\xfa\xac\xe4\x4c\xa3\x55\x91\xdb\x7c\x32\xb2\
-\xdd\x8b\x33\x6f\x6a\xde\x54\xcb\x5b\x49\x29\x05\x92\x03\x07\x48\
-\x40\xbf\x24\x95\x29\x8f\x84\x7e\x68\x53\xe3\x1e\xc9\x67\xe8\xe4\
-\x53\xd5\x2c\x8a\xc0\x3b\x01\x10\x97\x92\x95\xed\x76\x8f\x68\x5c\
-\xe1\xc5\x63\x63\x6e\x7e\x88\xf8\x26\xe4\x03\xc8\xe9\x26\x21\x39\
-\x3b\x59\x73\x79\x13\x88\x70\xd8\xfc\x5d\x9e\xeb\xdf\x20\x17\xcc\
-\xe5\x59\x15\xb7\x77\xff\x3e\x0a\xcb\xdc\xfe\x6e\x20\x7e\x80\xae\
-\x40\x64\x5f\x0d\x68\x31\xec\xae\x96\x55\xdf\xca\xc8\x76\x63\x28\
-\x13\x37\x93\xc9\x4b\x32\x1a\x15\x4d\xcb\x31\x6a\x52\xe3\x6f\x6f\
-\x69\x8e\xfd\x70\x20\x74\x58\x0c\x81\x65\xe4\x00\x39\x92\xbb\xd6\
-\xb8\x6c\x84\xe1\xd7\xdb\xdb\xf4\xbf\xa3\x53\xe5\xe7\x5d\x06\xad\
-\x9c\x7a\xf6\x4c\x7c\x07\x29\x09\x9b\x65\xc1\xb0\x97\xf5\x1e\xfd\
-\xcb\x08\x3e\xca\x09\x6d\x01\x04\x71\x29\x86\xd7\x0f\x1e\x22\xac\
-\x1a\xc4\x9e\x32\xa0\xc0\x3d\xd4\x51\x98\xfb\xa5\xa0\x40\x9b\xa6\
-\xa6\xc2\xda\x3b\xd9\x07\xe8\x27\x96\xaa\x63\x5e\x12\x9d\x34\x7b\
-\xcb\x26\x13\xaa\x2c\xe8\xe0\x40\x40\x48\x0f\xa4\x80\xa1\x5f\x1c\
-\x81\x06\xcd\x10\x64\x18\xd8\x16\xa0\x15\x04\x02\xfb\xc9\x2e\x05\
-\xc8\x2b\xb0\x23\x42\x07\x1b\x48\x8c\x85\xe1\x72\xd6\x27\xf2\xc7\
-\xf1\x5f\x97\x02\x1e\x9f\xcb\x15\xdc\xe6\xf8\x6f\x7e\xcf\x82\xc3\
-\x17\x0b\xb8\xb7\x64\xf1\x38\xa8\xbb\x2b\x05\x68\x64\x78\x61\xe2\
-\x6d\xc1\xae\xcb\x72\x31\xe0\xf1\x30\x97\x0a\x14\x55\x07\xc1\xed\
-\x0d\x71\x43\xb5\xe1\x0b\x31\x28\x03\x97\x01\x07\xdb\xb3\x43\xc8\
-\xe9\xba\x30\x39\x2e\xe8\x1e\x5d\x08\x2e\x5b\x27\x0b\xcd\x86\x0a\
-\xa2\x8d\x6c\x5a\xa5\x72\x8d\xca\x71\x2d\x15\x45\x73\xd3\x2b\xb1\
-\x33\xcd\xab\xc4\xde\xda\xa4\xd2\x98\x83\x63\x7a\xdd\xde\xa5\x46\
-\xbc\x99\xf8\x40\x33\x13\xab\xe8\xd1\x0a\x82\xd2\x80\x15\x5e\xaf\
-\x42\x1d\x52\x01\x6d\xf4\x03\x32\x06\x56\x00\x74\x40\x25\xdb\xa3\
-\x7a\xaa\x96\x31\xdc\xf3\x66\xf3\x2a\x38\x2a\xab\xc0\xe2\x1c\x22\
-\x50\xb6\x7f\x71\xee\xfe\xb3\xd9\x43\xe7\x6c\x79\xca\x61\x33\x6f\
-\x21\x4e\x89\x26\x72\xf2\x3f\xdc\xe8\x5c\x88\x58\xa3\x1c\x76\xd3\
-\xce\xe1\x3f\x6f\x79\x6a\x6e\xc2\xe9\x2c\xc4\xf1\x05\x2d\x8c\x21\
-\x27\x46\x82\x71\xe1\x36\xeb\x90\xe6\x95\x1f\x70\xe6\x78\x8c\x3a\
-\x09\x06\x95\x83\x7e\x6a\x9a\x35\xce\x62\x65\x27\x35\xa0\x3e\x98\
-\x73\x10\x90\x07\x81\x69\x81\x8f\x34\xaf\x53\x66\xf9\x5d\x1d\x9f\
-\x1a\x58\xaf\xfc\xd0\x74\xd2\x76\xa9\x6e\x3c\xb9\x8a\xa6\x0e\x6d\
-\x56\xbd\x7b\xb3\xf2\x51\x26\x0a\x52\x80\x40\x4b\x30\xd8\x41\x09\
-\x04\x5e\x6f\x98\x0f\xc3\xdc\x03\x4e\x3f\xc1\x76\x88\x8b\x35\xd8\
-\xf7\x86\xb9\x42\xcc\xcd\xe0\x20\x6e\xa4\x1f\xb2\xee\xaf\x24\x70\
-\xff\x75\x59\x92\xe9\x12\x4b\xcf\xb1\xef\xeb\x26\x32\x78\x51\x0a\
-\x55\x0e\xec\x01\xc3\x7c\x26\x64\x07\x61\xa2\xd3\xc3\x9c\x10\x5f\
-\xd9\x07\x77\xfe\xcc\x1e\xd7\x6d\xde\x9e\x71\xde\x24\x10\xd4\x26\
-\xcf\x0b\x9e\x1e\x16\xf3\x80\x4c\x79\x7a\xa7\x49\xe6\x62\x9f\x41\
-\x79\x19\x80\x76\x8e\x11\x03\x9c\x47\x09\x5c\x68\xdf\xc4\xcb\xcd\
-\xcf\xa7\xe4\xe5\xc0\xc6\x6b\x80\xfb\xf3\x7a\xe3\x2f\xd7\x17\x7d\
-\xe6\xa7\x7e\x7f\x51\x67\x38\xf1\x04\xb8\x6c\xfd\x69\x11\x80\xe6\
-\x8f\x63\xc4\x38\xb0\x60\x8a\x1d\xe4\x4d\xb2\x5c\x68\xfe\xfc\x19\
-\xe1\x6d\x27\x14\x78\x98\x63\xba\xcd\x7f\x63\x91\x14\xe6\xf8\xd0\
-\xae\x43\xb5\xe5\xe2\x18\x3c\xf7\xd8\xe2\x32\x82\xcc\x5d\x64\x38\
-\x78\x1e\x57\x0c\x97\xed\xc6\xe1\x6c\x4f\xd8\x63\x3b\xd6\xec\xea\
-\xf3\x2a\x11\xf4\xf8\x2b\xd4\xf4\x8c\xf4\x8a\xe7\xcd\xf5\xf8\x3c\
-\x55\xed\xc6\x81\x8b\x47\x5f\x37\x6e\xc6\x98\x11\x55\x31\x24\x5a\
-\xd8\x07\x69\xd1\xb8\x60\x3f\x34\x7b\xd3\x73\xca\x89\xd4\x49\xf6\
-\x30\x4b\x34\x71\x1a\xe4\xf4\x57\x0e\x96\x1f\x45\x59\x4d\x8e\xa5\
-\x09\x67\x3e\x7c\x7e\xdb\x71\xec\x61\xc1\x97\xe6\x0b\x54\x1e\x23\
-\x5d\x62\xac\x1f\x76\x9f\xca\x1c\x32\x6b\xd3\x18\xab\xd9\x84\x13\
-\xe1\x23\x28\x20\x1e\x12\x92\x58\x0a\x37\x5a\xe4\xc4\xdb\x7f\xdc\
-\xf4\xf8\x0f\xbb\x4e\xa6\x41\x43\x43\x9c\xbc\xd8\x7f\x83\x9c\xd8\
-\x50\x57\x4a\xb6\xcb\xbd\xe6\x68\xca\x07\x76\x93\x6c\x82\x93\xee\
-\x0d\x60\x93\xa0\x6a\x35\x19\xe2\x14\xb3\xf4\xd3\xdd\xf3\xb6\xa2\
-\x73\x67\x84\xc7\x7c\x83\x40\x61\xd9\x83\xf7\xe3\xe0\x56\xed\x27\
-\xde\xd6\xec\x65\x93\x41\x6b\x9a\xe1\xf4\xe4\xe0\x5d\x82\xbc\x41\
-\x90\xae\x48\x8b\x5c\xfd\xf1\xb6\x35\x71\x92\xca\xb5\xa0\x15\xf2\
-\x4e\x06\x4b\xa6\xf9\x0a\x35\x00\x1b\xce\x17\x52\x5d\x60\xbe\x0b\
-\x27\xa0\xe0\x34\x92\x8b\x31\x58\x35\x87\xaf\x43\x9c\xa6\xfb\xc4\
-\x5e\xc8\x90\xf8\xd5\x00\x2e\x0b\xda\x0f\x5d\x9e\x25\x33\x97\x4c\
-\xa8\x32\xe0\x18\xaa\x09\x64\xe3\x54\x14\x76\x10\x3b\x81\xd7\xd3\
-\x8d\x14\x1f\x27\xe7\x20\x2d\xde\xa6\xb0\x58\x01\xe0\x5a\x5c\x2f\
-\x0a\x83\x79\x51\xb6\x08\x48\x77\xbb\x10\xe0\x48\x39\x00\x2f\x78\
-\x00\x4e\x84\x81\xdc\x98\x8f\xb9\x12\xf5\xc9\x89\x8b\xcb\x51\x6c\
-\xa0\xbc\x01\xe5\xc6\x69\x3a\x00\xaf\x3b\x2c\xc2\x00\x78\x19\xa0\
-\xa1\x63\xd5\x22\x7f\xa6\x9a\x52\x34\x1c\x6b\x77\xa1\x44\xc2\xc3\
-\x62\x43\x38\x16\x7e\xa0\x8d\x5f\x4c\xbd\x17\x17\xec\xa5\x8a\xca\
-\x89\xe1\x76\x7e\xef\x31\x8c\x0e\x22\xc6\xf1\x69\x40\xb1\xf3\xd7\
-\xd3\xc2\x28\x03\xe6\x86\xf9\x09\x48\x45\x95\x1f\xc4\x17\x08\x2c\
-\x50\xfb\x91\xd2\xc0\x48\x07\x3e\xc7\x15\xb2\x4d\x9f\xc7\x20\xde\
-\x44\x32\x33\xc8\xb0\x97\x2e\xb2\xff\x95\x67\xf7\xb2\x74\xb0\xba\
-\x36\xa8\x8e\x68\x5a\x29\xb6\x49\xb9\xc8\xb6\xd9\x1e\x9f\x0b\x3a\
-\x8f\xee\x8d\xc3\x5c\x24\x97\x6a\xc8\x74\x66\x66\x54\x1f\x1e\x95\
-\xf6\xc2\x0f\xb7\xb6\xec\x8d\xa3\x64\x74\xff\x90\x98\x9b\x98\x24\
-\x99\xbf\x5c\xf9\xee\x5f\xfb\xcf\xbe\x16\x11\x6e\x73\x60\xaf\x3b\
-\x39\x23\x92\x62\x36\x1a\xa3\xb2\x55\x6d\x71\xf7\x6f\xd7\x7d\xa7\
-\xdf\x50\xd6\xd1\x92\x18\x0c\xb0\xf1\x1b\xc0\xd0\x23\x08\x6e\xf6\
-\xde\x53\xe7\x86\xfd\xb2\xe9\xc9\x70\xbb\x39\x99\x58\xcb\x8a\xcd\
-\xfc\x11\x36\x73\xfa\x07\x73\xb6\x8e\x99\xb5\xf7\xf4\x19\x2b\x85\
-\x09\x1e\xbe\x44\x5a\xfa\x25\x23\x2e\xfc\xee\x35\x6d\xcd\xdc\x74\
-\xcd\xf7\x87\x85\x64\x80\x2c\xf0\x02\x29\x5a\x2d\x72\x8c\x64\x8c\
-\xf8\x62\xe8\xec\xed\x63\xe7\x25\x24\xb9\x40\x82\xc1\xa4\x8a\x6d\
-\x15\xb0\x7b\x54\x8f\x0a\x3b\x3e\xa6\xfb\xdd\x37\x37\xac\xf0\x70\
-\x5a\x7a\xa6\x5d\x32\x48\x20\x41\x7f\x5e\x74\x6d\xc8\x76\x79\xd5\
-\x5b\x1b\x94\xc7\x77\xd8\xd8\x06\x7d\xe6\x51\x42\x81\xc6\x4d\x55\
-\x07\x22\xc0\x32\x7d\x9c\x1c\x0f\xe0\x21\xc6\xf0\x08\xdf\xfb\xc5\
-\xf6\xcf\x15\xd3\xf8\x87\xf0\xe8\x1a\xc0\x5e\x25\xa4\xcf\xa0\x7b\
-\x5d\x35\xd0\xc5\x62\xf7\x30\x4f\xdc\x90\x65\xc2\xb3\x48\x16\x23\
-\x1e\x90\x3a\x56\x96\xa2\x4d\x40\x2b\x44\x3d\xf1\x6d\x27\xbc\x7c\
-\x2b\xc9\x60\x73\x31\xea\x02\xed\x10\xfe\x38\x71\x07\xe0\x24\x50\
-\x24\x90\x27\xe5\x85\xce\x10\xa3\x2a\xfc\x8d\x1c\x79\x01\xc8\xff\
-\x4a\x82\xf7\x45\x58\x15\x88\xc5\x62\xc1\x43\xc1\x45\xc1\xff\xc2\
-\x40\x06\xc7\xf7\xa1\xae\x51\x0e\x68\x4f\xf8\xe4\x12\x80\xf4\xd0\
-\x57\x60\xfa\x03\xa7\xef\x00\x18\x62\xc4\x70\x34\xb4\x1a\xc0\xff\
-\x0c\x16\x05\xa4\x43\x16\xbf\x0f\xfc\xc0\xea\x2b\xf1\x8c\xf2\x72\
-\xf2\x32\x71\x79\x1f\x21\x91\xb0\xb7\x96\x95\x51\x77\x3b\x1f\xf8\
-\x33\x74\x27\x19\x68\x95\x68\x43\xa1\xe2\xf2\x72\x61\xca\x21\x81\
-\x0c\xe2\xe1\x65\x09\x5b\x29\xf8\x01\x13\xd8\x07\x1e\xb2\x4d\x07\
-\x99\xc0\x3d\x85\xa8\x47\xbe\xcf\xf0\xb2\xf0\xd0\xa5\xe0\x72\x09\
-\xc0\x2a\xb0\x4c\x44\x58\x5d\x83\xc3\x5a\xc9\xa3\x28\x68\x25\xf9\
-\x3a\x24\x0a\x60\x24\x2d\xd0\x99\xe5\xd2\xac\xfd\x1b\x54\xec\x53\
-\x21\xca\x81\xb9\x10\x36\xec\xc8\x02\x04\x81\xb4\x3e\x95\xaa\xce\
-\xd8\x7f\xe6\xfa\x6f\xff\x38\x70\xea\xe9\xa8\x48\x2b\xbe\xfe\x8e\
-\x37\x5e\x13\x91\x4e\xda\x23\x7f\xec\xc0\x99\x8d\xec\x78\x0c\x16\
-\x81\x80\x85\x28\x79\x60\x64\xe2\x77\x07\xc1\x51\x3e\xc6\x1f\x77\
-\x9d\x3a\xbc\x30\xf1\xd4\x33\x11\x61\x16\x63\x4c\x98\xd5\xb4\x34\
-\x31\xed\x99\xe7\x76\x9d\xd8\x8f\x7c\xdc\x41\x24\x88\xbb\x96\x97\
-\xd2\xdf\x79\x90\x0d\xcb\xf0\xe8\xfc\x9d\x1f\xd8\x6c\xa6\xb3\x54\
-\x42\x1c\x16\x6e\x24\xa2\x0e\x5f\x94\x98\xfc\x96\xf9\x7f\x3f\xbe\
-\x35\x77\xdf\x29\x16\x28\x98\x04\x01\x2e\xd2\x8d\x8d\xea\xc7\x55\
-\x29\x5f\xe6\xba\xcc\x5c\xb7\x8b\xc8\x11\x1d\x5d\xfe\xfb\x40\x31\
-\x3d\xaa\x2a\x45\xc5\x3a\xea\x3d\xde\xae\x16\xfb\x14\x0f\x5e\x36\
-\x98\xdf\xbf\x07\x5e\x3f\xbc\x5c\x7e\x32\xe2\xa0\x6a\x02\x58\x59\
-\xb8\x1d\x00\x2e\x3f\x3b\xcb\x92\x80\x07\x02\x69\xdd\x4d\x61\x07\
-\x51\x55\x83\x18\x41\x02\xb8\x8b\x21\x8d\x1e\x1e\xf7\x05\x6f\xff\
-\xf8\x24\x0b\x3a\x7f\xc4\xc1\x20\xc1\x95\xe8\x88\x2e\x19\x24\x27\
-\x10\xb2\x7c\x64\xb8\x56\x04\x60\x5f\x20\xc0\xcb\xe5\xff\x8c\x11\
-\xea\x96\xc2\x82\x04\x71\x56\x28\xc0\xe3\x61\x53\x35\x36\x90\xa3\
-\x7e\x8a\x24\x43\xa4\xa1\x5f\x02\x1f\x90\xe1\x7b\x12\x11\x0f\x7b\
-\xc4\x7e\x27\x03\x5c\xa9\x7a\x45\xfb\x40\x39\xb0\xd2\x16\xcb\xf4\
-\x19\x82\xe4\x2c\x00\x94\x53\x2f\x2f\x36\x65\xb3\x23\xef\x08\x78\
-\xa6\x00\x7c\xf3\xef\x14\xd2\x20\x1b\xe5\xe0\x69\xf1\xbd\x68\x9c\
-\xf4\xef\xa3\x30\x37\x51\x18\x10\x09\x5e\xc8\x0a\x7d\xd6\x74\x3f\
-\xd6\x4e\xe9\x12\x43\x7b\x38\x59\x08\x69\x17\x59\xdf\x97\x09\xfc\
-\x5e\x60\xef\x1f\xb4\x5a\xc8\x8f\xb2\x62\xe4\x08\x5b\x2e\x00\x74\
-\x57\x45\xf6\x15\xe4\x8d\x95\xa0\xd8\xa6\xd0\x8e\x7e\xe2\xec\x5e\
-\x20\x64\x3d\x53\x38\xbc\xc4\x22\x3c\x5e\x2a\x66\xe7\xb9\xfa\xf1\
-\x0a\xf9\xe1\x8b\x25\x6c\xce\x92\xec\x50\x6d\x9a\x19\xf2\xc7\xb3\
-\x8b\x6b\xd4\x71\x1d\x32\x38\x6c\x1b\xcf\xed\x55\xf1\xec\x16\xd9\
-\xc8\x8a\x0b\xae\x49\xad\x3e\x9c\xbd\x7e\xe9\xee\xa4\x8f\xcb\xc6\
-\x46\x62\xa2\x1d\x5f\x70\xc8\x57\x40\x2a\xb1\xc1\x61\x91\xe5\x8d\
-\x47\x52\xe7\x9f\xce\xc8\xc5\x1e\x2f\x23\x86\x1d\xe1\x07\x42\x0c\
-\x24\x2f\x80\xaa\x50\x25\x27\x63\xdf\xef\x36\xcc\x9f\x73\x20\xe9\
-\xfe\x28\x87\x35\x2b\xc2\x6a\x8e\x5f\x71\x26\x6d\xe2\xb7\xdb\x8e\
-\x27\x52\x7c\x19\xdf\xf1\xe3\x43\x87\x5f\xdc\xdc\xa2\x5d\xfa\xd3\
-\xbd\x3f\xe8\x5a\x2d\xce\x06\x52\x0c\x24\x0f\xca\x87\xa5\xd5\xf3\
-\xdb\x4d\x1b\x96\x1e\x4e\x7e\x79\xd9\xa1\x94\x57\xba\x4f\x5f\x89\
-\x55\x79\x38\x76\xcd\x2f\x27\x8f\xd3\xb9\x4a\x8c\x31\xfd\x99\xbe\
-\x6f\x7d\x35\xa0\x45\x1f\xdc\x29\xe4\x81\x79\x47\xe4\x39\x7d\xfb\
-\xc9\xe3\x0b\x0e\x9c\x79\x2f\xdc\x22\x47\x47\x45\xd8\x8c\x73\xf7\
-\x9e\x7a\xb6\xdf\xcc\xf5\x38\xde\xc8\xa8\xa8\xc1\x1b\xe4\xc9\x95\
-\x80\x6b\x7a\x41\x60\x9a\xd1\x98\x79\xeb\x8e\xae\x3d\x78\x66\x41\
-\xb4\xdd\x62\x47\xcb\x60\x01\xf3\xc0\x5a\x8d\x6c\x36\x44\xc6\xda\
-\x6c\x27\x7f\x5c\x79\xec\xbd\x09\xeb\x0f\x61\x28\x91\x69\xb6\x2c\
-\xc4\xbf\x07\x3e\xd7\xc2\xcb\x87\x0d\xb6\x00\x7b\xa3\x23\xc3\x3a\
-\x02\xde\xa8\x61\xf3\x72\xeb\xe0\xf1\x70\x3e\x20\xf6\xab\x21\x3c\
-\xef\xc0\x71\xf0\x6e\x77\x8a\xc3\x36\x46\xeb\x86\xa7\x0b\xc3\x4f\
-\x5b\x01\x09\xe2\x41\xc2\x9e\x27\x0c\x79\x61\xaf\x9d\xff\x4b\x03\
-\xdc\xbe\x9a\x40\x22\xf1\x32\x14\xc7\xa0\x4e\x78\x19\xf8\x17\x01\
-\xf8\x6f\xbe\x1a\x32\xb0\x1d\x4c\x20\x03\x77\xbc\x54\xa2\x2e\xb1\
-\x1f\xef\x67\x4a\x07\xdf\x16\x64\xda\x01\x01\xf5\x18\x5c\x97\x6c\
-\x14\x45\xbf\x47\x38\xa4\x19\x47\x6d\xe1\xfe\xf0\xbc\xde\x23\x3f\
-\x1c\xfa\x8d\x0e\xff\x4a\xb6\x3b\x94\x1f\x72\x60\x28\x18\xc3\x66\
-\x5c\x46\x20\x70\xc4\x80\x97\x89\xb7\x07\x0c\xb1\xe3\x9b\x8f\xa8\
-\x33\xd4\x03\xea\x03\x7d\x10\xca\x16\x08\xde\x06\x31\x0f\x8b\xfd\
-\xac\x68\x53\x9c\x34\xa7\x51\x3a\x68\x83\xf8\x8d\xa4\x79\x3e\x81\
-\x79\xf2\x36\x08\xe2\xc5\xe9\x2e\xa8\x7f\xe0\x8a\xb4\x3b\xbd\x2e\
-\x70\x4f\x30\xcf\x89\x83\x1d\x38\x70\x8f\xfe\x43\x7e\x63\x74\xf9\
-\x79\xbb\x0b\x55\x67\x20\x2c\xc8\x8f\xe7\x17\x75\x86\x21\xce\xc0\
-\x7b\x1f\x0a\xfc\x39\xc5\xd7\x62\xd0\x1f\x81\x80\xe1\x86\x45\x36\
-\x68\x6f\xf8\xb6\x20\xd2\x04\xfc\x75\xa5\x1b\xde\xde\x18\xe8\x12\
-\xdb\x43\xf0\xa2\x85\xa3\x34\xd9\x01\x13\x64\x5f\x16\x1e\xba\x14\
-\x5c\x56\x01\x36\x9f\x3e\x6d\xe8\x3e\x6d\xc5\x8a\x97\xfe\x4a\x7c\
-\xd5\xab\x19\x36\x44\x3b\xac\x61\xa4\x31\xc9\x74\x97\x50\xd1\x1a\
-\xfd\x23\x15\xda\x70\xfa\xd3\xad\x87\x71\x50\x2e\x48\xc2\xff\x90\
-\x81\x10\x41\x5e\xc1\x1a\x22\x39\x41\x9b\x93\x07\x4d\x5f\xbb\x61\
-\xee\xb1\xa4\x27\x35\x8b\x61\xe6\xf8\x4d\x89\xd8\x00\x8a\x86\x81\
-\x61\x52\x0c\x41\xaa\x4f\x57\x2f\x53\xf6\xde\x26\x95\x5f\x0a\xb3\
-\x9b\x6f\x9b\x37\xac\xdd\xbb\xd7\x57\x2f\xe3\xd0\x87\x45\xfd\xe9\
-\x21\x2d\xdc\x94\xee\xd3\xd6\xcc\xe9\x36\x7d\xd5\x4f\xb8\xa6\x34\
-\xf8\xc3\xc1\x48\x10\x71\xae\xab\x56\xc6\x32\x6f\x44\xfb\xb7\x23\
-\x2c\xd2\xd0\xbb\xdb\xd5\x18\x37\xb5\x7d\xcd\xda\xc8\x03\x9f\xc7\
-\x40\x9e\x08\xdb\x67\xc6\x86\xb9\x19\x5e\x75\xe6\x9c\xbd\xa7\x9e\
-\x1b\xf8\xfd\x86\xdf\x48\x6c\xfe\xd6\xe9\x07\x48\x10\x65\x02\x74\
-\x27\x7f\x99\xc7\xaf\x4b\x5c\x44\xc9\xa5\x52\x9d\x40\xb3\x42\x00\
-\x95\xae\xcd\x0e\x8b\xc9\xe2\xce\x35\xff\xd1\x7b\xfa\x86\xff\x1b\
-\x32\x6f\xe3\xbe\xe0\xfa\xf8\x17\xc1\x8f\x16\xe3\xc0\xe6\x6d\xec\
-\xf9\x82\x26\xc7\xee\x05\x59\x68\xf4\xf8\x0a\xf9\x1a\x32\xd8\xff\
-\xe4\x2f\x37\xae\xc9\x0d\x75\x04\x37\x4c\x90\xa3\x03\xe7\xc3\x7a\
-\x58\xb9\xb7\x00\x71\xc9\xc6\xea\x5e\xd4\x23\x6a\x8e\x19\x84\xd1\
-\x6d\x7c\xb4\x15\x0f\x23\xee\x3f\xe2\xc0\x0d\x1d\x12\x3e\x30\x0b\
-\x5c\x2d\x75\xe5\x07\x2f\x43\x71\x4c\x5e\x70\xd6\xa1\x60\xce\x87\
-\x1f\x67\xc5\x35\x6f\x3e\x47\x83\x30\x68\xc7\xa8\x4b\x74\x28\xf8\
-\x06\x1f\x07\xea\x12\x5f\xe4\xc7\x41\x07\x03\x11\x90\xae\x91\x36\
-\xab\x3f\x18\x84\x81\x3b\xf9\xd7\x27\x83\xe1\x4f\xdc\x0b\xb8\xc3\
-\x20\xaf\xdf\xc8\x9b\x7f\x07\x11\x6e\x57\x0a\xb8\x77\x90\x17\x36\
-\xf2\x7d\x80\xe4\x5b\x46\x06\x2b\x66\xe1\xee\x2f\x03\x19\x94\x13\
-\x36\xca\x81\x39\x41\x7c\x14\x18\xab\xac\xd9\xb3\xa9\x03\x7b\xe1\
-\xb6\x93\xbf\xff\xb9\xd4\xc3\xf3\x36\x88\xaf\x33\x84\x6a\x83\xa8\
-\x4f\x8c\x3c\xb1\x3a\x81\x1d\x78\x4d\x76\x04\x85\x01\xc1\x42\x2b\
-\xe3\xc4\x7d\x25\xc1\xf3\xc3\xde\x3f\xfe\xd5\x0d\xb8\xa1\x4c\x38\
-\xcc\xe3\x5b\xb2\xb1\x1f\x0f\x6e\xf9\xea\x0c\x86\xdc\x28\x08\xfb\
-\x58\x34\x3e\xe4\x8b\x21\x71\x84\x2b\xf2\xb9\xa1\x78\xa8\x37\x10\
-\x30\x16\xe9\xf0\x03\xb2\x01\xc4\xc5\xe2\xa6\xf5\xe4\xcf\x8e\x37\
-\xa4\x30\x3c\x2f\x5e\x5f\xbc\xbd\xd5\x22\x83\x23\x11\xa1\xb9\x42\
-\x56\x60\x34\xb9\x45\x23\x1c\xd9\xff\xea\xb3\x0b\x22\xd0\x2f\x2f\
-\x0f\x48\xe1\x93\xa0\xf9\xe0\x7a\xc9\xa8\xce\xdd\xaf\xaf\x13\x37\
-\x24\x33\xc7\xed\x20\xa7\xec\x28\x9b\x39\x72\xed\xa9\xf4\x9f\x3a\
-\x7d\xb9\xea\x17\x2a\xb7\xbf\x81\xb6\xae\x18\x13\xf6\xeb\x6d\x6d\
-\x6e\xbd\x6f\xfe\xf6\x3f\xe6\x1f\x38\x9b\x44\x84\x14\x72\xbe\xce\
-\x61\x33\x19\x1c\xb2\xd1\x70\x2e\xdb\x5d\x40\xe8\xd4\xb1\x7d\x27\
-\xda\x8c\xd2\x0d\x3e\x9f\x9a\x62\x35\xcb\xf1\x3e\x83\xb6\xb0\xdf\
-\x77\xeb\x9e\x5a\x7e\x2c\xd5\xc5\x09\x4e\x0f\xea\x1f\x36\x05\x49\
-\x31\x07\x02\x0f\x43\xda\xa4\x75\x3e\x91\xa0\x45\x33\xdc\xe8\xf2\
-\x2a\x49\x54\x9c\x68\x9b\x4f\xdb\xd5\xed\x87\x0d\xa3\x57\x9e\x48\
-\xcd\xc1\x3c\x1f\x34\x43\xc4\x89\x0f\xb3\xc9\x39\x5e\x9f\xea\xf4\
-\x2a\xac\xb1\xb0\x84\x74\x98\x8d\x92\xd1\x4b\x9a\x66\xaf\x5a\xf1\
-\xd1\xf3\x86\xb4\xbf\xe9\xf1\x45\x87\xe6\x4d\xde\xb8\x27\x05\xf5\
-\xe3\x55\x55\x46\xc0\xcb\x46\x75\x1a\xd1\xa5\x6a\x74\x9f\x74\x97\
-\x37\xd3\x22\x1b\xa3\x22\x1c\x96\xa4\x19\x3b\x4f\x4e\x1b\x3e\x7b\
-\xf3\x36\x8a\x4e\x25\xd6\xf2\xc9\xf8\x6f\x82\x84\x81\xb6\x01\x0d\
-\x0c\xab\x18\xf1\x40\xa1\x13\xc0\x66\x68\x0c\x47\xe1\xa4\x15\x4c\
-\xba\x63\x35\x24\x26\xde\xb9\xff\x2d\x54\xce\x39\x14\x17\x0f\x11\
-\xeb\xa4\xf8\x35\xd9\x38\xa3\x13\x1f\x05\x05\x70\xaf\xd9\xdb\x36\
-\x19\xac\x4e\xc3\x06\x65\xe4\x85\x55\xa5\x48\x07\xc3\xc3\x98\xfb\
-\xc1\x42\x12\x1c\xfa\x8b\xf0\xa8\x17\xf8\xe1\x6c\x4a\x9c\xac\xc1\
-\x16\x4d\xa1\x5e\xe9\x37\xf2\xc1\x70\x0e\x48\x85\x9f\x2c\xc3\xe7\
-\x83\xbe\x21\x77\x3c\x80\xcc\x9f\x7e\x17\x1b\x3c\x7d\xb2\xf1\x39\
-\x19\xcc\xad\x60\x28\x11\x6f\xc7\xf8\x1e\x22\xce\x2e\xf5\x97\x13\
-\xa0\xdf\x58\x05\x89\x2f\x44\x20\xdf\xe2\xdc\x47\x94\x07\x1d\x3a\
-\x3e\xfb\x84\x21\x42\xc8\x87\x8e\x6e\x25\xa5\xcb\x8e\xd5\xa2\x34\
-\xd9\xdb\xb5\x7e\xcd\xe5\xc1\x82\x05\xac\xc2\xe3\x79\xf3\xba\xc4\
-\xf0\x2a\x36\xff\x83\x30\x71\x16\x67\x18\x19\x6c\xc8\xc6\x82\x14\
-\x10\x08\xf6\x86\xa1\xbe\x60\x90\x0f\x3a\xd6\x9e\x94\x26\xce\x2b\
-\xf5\xe7\x03\x04\xe4\xc5\x4f\x96\xe1\x65\xc7\x77\x19\x67\x91\x7b\
-\xbe\xb2\x17\x05\x9e\x36\x59\xa1\x4e\x96\x01\xd8\x3d\x24\xe0\x37\
-\xee\x1b\xbe\xab\x88\x03\x06\x8e\x92\x01\x79\xc5\x92\xc1\x0a\x5c\
-\xcc\x89\xa2\xbe\x20\x27\x8f\x83\x3a\xfc\x9a\x92\xc7\x90\xbb\xbf\
-\x3d\x04\x82\xcb\x4a\x36\xda\x20\x86\x49\x79\x7c\xd4\x19\xf2\x44\
-\xbb\xc6\x30\x20\xe6\xb3\x31\xaf\x8d\x34\xcb\x93\xc1\x61\xf1\xd8\
-\x17\x8a\xb6\xce\xd3\x45\x1c\x18\x5e\x57\xb8\xfe\x27\x4e\x96\xf1\
-\xb7\x57\xba\xe6\xf7\x02\x5a\x1d\x5e\x66\x20\x0f\xfc\x20\x3b\x0c\
-\xf6\xb9\xe2\xbe\x43\xeb\xc5\x48\x0e\xee\x15\xb4\x66\x2c\x0a\x82\
-\xfc\x58\x25\x0a\x79\x61\xb8\x3c\x00\x6f\x6f\xfe\x93\x65\xc8\x0e\
-\x6c\xcf\x3c\x5f\x7c\xd9\x07\x2f\x0c\x3c\x4f\x9e\x06\x0e\x8f\x80\
-\x96\x89\x85\x56\x98\x8b\xc5\xfd\xc5\xbd\xed\x41\x06\xf3\xb7\xfc\
-\x14\x1a\x18\xe4\x83\xef\x06\xe2\x4b\x29\x68\x0b\x81\xed\x9a\xdf\
-\x9f\xe0\x93\x65\x1e\x24\x77\x7c\xfe\xac\xd8\x6d\xad\xb8\x40\xe6\
-\xfa\xe5\xe5\x03\x48\xc5\x47\x5c\x41\x69\x6b\x4f\xb4\xab\x5d\xfe\
-\xc5\x2e\xb5\xef\x8c\xb2\xca\x4d\x8d\x06\x2d\xf5\xb6\x9f\xb6\xbe\
-\x32\x67\xdf\xe9\x14\x10\x0a\xa9\x40\x12\x86\x2c\x7f\x1a\xdc\xb6\
-\xf7\xe0\xe6\x15\xef\xf3\xb8\xbd\x47\xe6\x1f\x38\xfd\xc5\xcd\x3f\
-\x6c\xc1\xa1\xaa\x05\x1a\x31\x08\x0c\x14\x84\x74\xf1\x9b\xc2\xb0\
-\xca\x3b\xf5\xf4\x0d\x4f\x96\xb7\xda\x1e\x26\x52\x4a\xa5\x20\xec\
-\x98\x34\xb3\x2c\xc7\xaa\x92\x61\xf1\x4d\x3f\x6c\x7c\x72\x61\x62\
-\x92\x33\xd4\xe2\x15\x0e\xee\xd7\xb3\x66\x59\xdb\xaf\x43\xdb\xbe\
-\x4f\xb5\xdc\xdb\xe3\x53\x52\x90\x16\x25\xaf\x18\x4d\x94\x96\x2c\
-\xcd\x0a\xff\xbf\x79\xe3\x78\x9e\x88\x87\x6b\xe8\x9b\xc1\x64\x65\
-\xa4\x04\x55\x4a\xf0\xe7\xc7\x47\xd4\x1a\x58\xd6\x7d\xaf\xc9\x95\
-\x5b\x6f\x6f\x6e\xee\xcc\x06\x1f\x2c\x43\x87\x61\xc4\xa7\xa1\xb0\
-\xca\xf5\x8d\xeb\xeb\x56\x1e\xd7\xb5\xde\x4b\x1e\xc5\x60\x73\x79\
-\x94\x55\x37\xfd\xb0\xee\xfb\xa5\x47\x52\x33\xa9\x9c\x68\x5c\x05\
-\x36\xdf\xff\xdb\x20\xd9\xb1\xb0\x05\x27\x4c\xe0\x01\xc0\x43\x0e\
-\xf0\x87\x88\x03\xf7\x0c\x0f\x1e\x1e\xe2\xfb\xa9\xaa\x70\x68\x79\
-\x61\x0f\xd4\x28\xfa\x89\x39\x43\xa4\x85\x34\x91\x16\x4f\xb7\x30\
-\x04\x86\x43\xa7\x88\xaf\x2d\xfc\xce\xd3\xa4\xdf\x0c\xf4\x9b\x77\
-\x2c\xe8\x2c\xd1\x29\x5c\x11\x22\xa4\x6b\xba\x6b\xec\xc1\x86\x3b\
-\xf2\xc5\x61\xc2\x90\x0b\xf7\xb4\xb8\xc0\x7d\x87\x41\x39\x61\xf7\
-\xa3\x24\x59\xc7\x4a\x76\x60\x3d\x72\x42\x41\x38\x9c\xdd\x88\xd5\
-\xa6\xc8\x8b\xe7\x77\xbe\x3c\x03\xeb\x12\x9d\x3e\xca\x71\x9c\x92\
-\x2b\xf0\xec\x71\x37\xb2\x2f\x27\x11\x82\x88\x41\x84\x58\x75\x09\
-\xe0\x7e\x62\x65\x31\x5e\x1e\x78\x39\xd0\x61\x16\x85\xe0\xf2\xe2\
-\xde\xe0\xb4\x1b\x36\x34\x8c\x7c\xe8\x77\x01\x90\x17\x93\x97\x6c\
-\x2c\x12\x42\x99\x50\x16\x2e\xff\xf9\xda\x60\x60\x38\x10\x0d\x86\
-\x61\xb1\x78\x84\xcb\x71\x29\x44\x88\x51\x11\x68\x7b\xc1\x44\x58\
-\xd8\x33\x84\x8f\x15\x63\xba\xa1\x32\x19\xf8\xa3\xbc\xe7\xab\xb3\
-\xc0\x70\x38\xcd\x07\x75\x0e\x92\x44\x7b\x28\x94\x08\x01\x72\xe3\
-\xf7\xee\x2d\xfa\x09\xed\x10\xe9\x20\xcc\xf9\xda\x1b\x0f\xc7\xdb\
-\x1b\x56\xef\x62\x5e\x16\x2b\xf9\x83\x9f\x5d\x7e\x6f\xae\x18\x11\
-\x16\x25\xf8\x45\x03\x9a\x15\x80\xbd\x7d\x1f\xad\x3f\x78\x66\xc8\
-\xac\x8d\xef\x65\xba\x9d\xf3\xcf\x64\x9b\x56\x83\x04\xa9\x20\xd0\
-\x77\xd8\xbc\xdd\x98\xe6\x75\x62\x06\x37\xad\xd8\x27\x39\x23\x37\
-\x95\xc8\x20\xe6\xe6\xc6\x55\x9f\xfe\xe5\xb6\xd6\xf8\x9c\x8e\x2a\
-\x9b\xcc\xf8\xea\x03\x2a\x8e\x41\x4f\x96\x35\x6c\x24\x81\xeb\x6f\
-\x6f\x6e\x71\x63\x05\x9b\xed\xee\x6c\x8f\x2f\x83\xd2\x64\xe5\x01\
-\x81\x79\x15\x25\x95\x6a\xbb\x07\x11\xdb\xdb\x3d\x6a\x96\xb1\x80\
-\xe8\x40\x78\xf0\x0f\x04\x27\xc1\xeb\x6b\xc6\x99\x7f\x19\xde\xf6\
-\x4d\xaa\x61\x3f\x09\xc2\x1f\x95\xee\xf5\x28\x69\xe1\xb2\x3c\x68\
-\xee\x1d\xed\xf1\x61\x55\x0c\xdf\xb2\x7c\x70\x1d\x4c\x56\x90\x0b\
-\x24\xf8\xdb\x90\xb6\x9d\x6e\x89\x4e\x1f\x9b\x9b\x91\x59\x3e\xd5\
-\xad\x24\x35\x88\x8c\xec\xfe\x78\x9b\x6a\x95\x28\x8a\xff\x86\x8f\
-\x5b\xb2\xff\xc4\xd9\x1c\xd7\xea\x25\x87\x52\xa6\x47\xbe\x3d\x7f\
-\xca\xb2\xa3\x69\x38\x74\x1c\xc3\xa9\x94\xc4\xd5\x45\x82\x00\xc9\
-\x8e\x05\x4a\x98\x9b\xc0\xc3\x02\xf9\x50\x16\x34\x52\x5c\xe3\x21\
-\x42\xe7\x08\xe0\x01\x86\x36\xc2\x17\x73\xf8\xcb\x0c\xa0\x0e\x50\
-\xaf\x64\x4f\xa3\x9f\x78\x5b\xc4\x67\x7c\x90\x26\xea\x15\x69\x21\
-\x4d\xa4\x85\x6b\xfe\x9b\xe7\x83\xfb\x02\x83\x8e\x1b\x67\x61\x16\
-\x20\xc1\x20\xb0\xfb\x48\xe0\xa4\x87\x0e\xef\x52\xc1\xd3\xe4\x0f\
-\x63\xe0\x73\xc4\xaf\x51\x2e\x4e\x82\x05\xda\x5d\x21\xe0\x65\x85\
-\x8d\x38\x30\xcf\x50\xd9\xd0\xa9\xa2\x8c\xf9\x1e\x7e\xfa\x8d\x70\
-\x0c\x74\x89\x85\x1b\xd8\xb6\x83\x4e\x19\x75\x89\xb8\xc8\x1b\x1d\
-\x2a\xe2\x21\x2c\xff\xcd\xeb\x82\xd7\x25\xb4\x22\x7c\x0f\x32\x24\
-\x09\x06\x81\x97\x85\xcb\xc2\xeb\xe2\x62\x80\xba\x0a\xbc\x1f\xb8\
-\xe7\xd0\x54\xb1\x9d\x06\x7e\x81\xf7\x0e\x72\x43\x2e\x94\x03\x79\
-\xf3\x72\x41\x1e\x94\x17\x71\x9f\x25\xd9\x71\x84\x1a\xda\x57\xa1\
-\x24\x08\x90\x17\x3a\x5a\x94\x15\xc4\xd9\x93\x0c\xda\x20\xf2\x2b\
-\xac\x0d\xe2\x9a\xdf\x1b\x2e\x1b\x34\x20\x8c\x80\xf0\x2f\xa2\xc3\
-\x1f\x08\x55\x27\x90\x13\xf1\xce\xd7\x0e\xb9\x3b\x0f\xc7\xc1\xeb\
-\x9d\x81\xe4\x46\x19\x21\x3f\x46\x4e\x70\x00\xfb\x62\x32\x5c\x7e\
-\x20\x50\x5e\x18\x5e\x87\x5c\x7e\xd4\x19\x46\x09\xb0\xaf\x95\xcf\
-\x37\x22\x0e\x90\x2f\xaf\x40\x50\x7e\x20\x41\xe4\x0b\x82\xc2\x3e\
-\x42\x2c\xa2\x09\x6e\x6f\x5c\x76\xfc\xe6\xf5\x08\x7f\xc8\x07\x03\
-\xe2\x86\x26\x08\x12\xc4\x7d\x2a\xac\xbd\x21\x5d\x80\xb7\xb5\x42\
-\xe5\xba\x54\xf0\x4a\xbb\x24\x80\xd5\x42\x91\x0c\xb4\x1e\x13\x75\
-\xec\x4b\x8f\xa6\x28\xf5\x26\xad\x9c\xd1\xe2\x8b\xc5\x18\xf2\x62\
-\x95\x89\xe1\x41\x5c\xdf\xd3\xa1\x72\x0f\x97\xdb\x13\x67\x36\x1a\
-\xa9\x61\x1a\xbc\x19\xd9\x2e\xad\x4f\xcd\x98\xbb\x93\xde\x7b\xf0\
-\xb6\x9e\x75\xab\x4a\x18\x60\x46\xb8\x10\x60\xee\x7d\x6a\x97\xef\
-\xe4\xd3\x34\x07\x55\x11\x2a\xdf\x2f\x03\x44\x22\x42\x4b\xa5\xd7\
-\xac\xbe\xb3\x06\xb7\x66\x2b\xaa\x42\x71\x0b\x77\x9b\x7d\x6b\xdb\
-\x57\xcc\x8a\xd6\x3f\x90\x04\x39\x8c\xa4\xca\x7a\x3d\x3e\x73\xc7\
-\x72\xd1\xec\xb4\x17\x10\x38\xf3\x08\x01\xdc\xd4\xbf\x86\xb7\x1b\
-\x34\xa0\x5e\xb9\x7b\xd3\x5c\x54\x24\xa3\xd1\x2d\x4b\x06\xcd\xe3\
-\xf1\x85\x3f\xda\xae\x3a\xdb\x23\xe5\x0d\x50\x4c\x1b\x4f\x5a\x31\
-\x7d\xd0\xac\xf5\x38\x64\x98\xbd\x1c\x04\x0e\xe1\x06\x22\x54\xfd\
-\x5e\x69\xe8\x8d\x16\x5a\x07\x36\xb0\x63\xf8\x05\xf5\x84\x07\x17\
-\xb2\xa1\xd1\xe2\x1a\x75\x83\x07\x0b\x47\x83\xe1\xcb\xe4\x21\x3b\
-\x24\x72\xe2\x1d\x11\x16\xce\x40\x03\xc0\x70\x20\xbe\x91\x86\xb4\
-\x90\x0e\x4f\x17\x06\x6f\x83\x30\x00\x86\xef\xee\x21\xd3\x9e\xe2\
-\xee\xd0\xd3\x0f\x75\x3f\xb8\x1b\xde\x3c\x41\x0e\xfc\x18\x34\xbe\
-\x1a\x33\x64\x3d\x9f\x07\xfc\x1e\xf0\x2d\x20\x20\x7c\xbc\x51\xf3\
-\x7d\x5d\x48\x93\xa7\x8b\x61\x3c\x74\x12\x17\xf2\x8c\xf1\xb2\x23\
-\x0e\x16\x44\x60\x68\xb9\xc0\x21\xee\xc1\x20\x3f\xde\x39\x61\xfe\
-\x14\xc3\x65\xd8\x93\xc8\xbf\x33\x87\x7a\xc3\x7d\x42\xda\xf8\x0d\
-\x99\x71\xaf\xd0\x41\x61\xb8\x11\x04\x88\xf9\x1d\x76\x10\x41\x11\
-\xf9\xf0\xb2\xf3\x93\x7b\x90\x0e\x4e\x1b\xc1\xb0\x38\x50\xec\xfa\
-\xd4\xe5\x45\x5e\xd8\x3b\x16\xb8\x3f\x0d\xcb\xf3\xb1\xd7\x12\xa4\
-\x0e\x82\xc1\x9c\x12\x27\x76\xe4\x07\xf9\x21\x07\xca\xc3\xcb\x85\
-\xd5\x93\xd0\xe8\x70\xd8\xfa\x7b\x7a\x3d\x30\x90\x5b\x91\xa0\x20\
-\x9c\x4c\x78\x1b\x7c\x9a\x0c\xb4\x23\xe4\x81\xf4\x03\xdb\x20\xae\
-\x83\xdb\x20\x0e\x6f\x87\x96\x77\x18\x8e\x04\x68\xb8\xa8\xf7\x50\
-\xed\x01\x43\xf8\x18\x32\x44\x3a\xc0\x7a\xfc\x41\xfe\xec\xd7\xdf\
-\xe1\xd8\x61\xeb\x04\x7e\x1c\x21\xdb\xcf\x49\x28\x50\x1e\x5d\x7e\
-\xd4\x23\x3e\xb2\x7c\x03\x39\xdd\x46\x06\xe9\xe2\x1e\x72\x79\xb9\
-\xfc\xa8\x43\xfe\x1b\x5a\x2c\x3e\x85\x84\x95\x9b\x20\x50\x3c\x77\
-\x00\xea\x18\xe0\xf7\x38\x24\xf4\x7c\x51\x6f\xf8\xfa\x04\x86\x59\
-\xb1\xea\x18\x87\x65\xf0\xf6\xc6\x09\x8c\xff\x86\x2c\x20\x43\x6c\
-\x5b\xc1\xe8\x06\xa6\x2b\x0a\x0c\xbf\x87\x00\xaf\x0b\x2e\x17\xaf\
-\x8b\xcb\x0e\x08\xa2\x5f\x5e\x3a\xb8\x76\xa5\xff\xcc\x07\xea\xe4\
-\xd9\xe9\x2c\xb8\xe6\xf3\x71\xf7\xb5\xa9\x56\xf6\xf3\xfe\xcd\x5e\
-\x48\xcb\x71\x3b\x70\x74\x1a\x79\xe1\x26\x69\x48\xc1\xa2\xf9\xc2\
-\x24\xa3\x75\xd3\xe0\x9f\x37\x7f\xf5\xfb\x81\x33\xec\xc4\x97\xc0\
-\xb4\xff\xd6\xe4\xca\x5a\x7f\x1b\xd2\x9a\x34\x39\x43\x7f\x22\x57\
-\xbf\x56\x08\x10\x41\xaa\x51\x66\x53\xf8\xa2\xfd\x67\xdf\xbf\x61\
-\xf6\x46\xb6\xaa\x93\x44\xc8\xf7\xa0\x73\xb7\x45\x43\x5a\xdf\x73\
-\x43\x9d\xf2\x4f\x67\x78\x7c\xd9\xa6\x80\x34\x48\x66\x85\xc8\x3c\
-\x9a\x32\x5e\x3a\xf0\xfb\x8d\xcf\x2c\x3a\x72\x2e\xbb\x30\x59\xfa\
-\xd6\x2e\x6b\xfb\x65\x44\x9b\xbb\x64\xd5\xd0\x31\xdb\xed\xcb\x25\
-\x6d\x16\xde\xec\x0f\x0e\x1c\x88\x09\xb3\xaa\x8f\xfc\xbe\xe3\xed\
-\x89\x1b\x8f\x1c\xe6\x75\x80\xc6\x80\x70\x7c\xde\x31\x18\x45\xd5\
-\xe9\xbf\x01\x5e\x5f\x64\x63\xde\x0e\x0b\x3a\xb0\x85\x01\xf3\x86\
-\x20\x04\xcc\x45\x61\xc3\x38\xfb\x1e\x24\x5d\xb3\x4e\x0f\x76\x61\
-\x08\x0c\x47\x97\x98\xc3\xc2\x5c\x20\x0c\x86\x92\x30\x17\x84\xfb\
-\x85\xad\x02\xe8\x6c\x56\x92\xd9\x44\x41\xf1\x15\x81\xf3\xa6\x8f\
-\x30\x7a\xba\x98\x5b\xc4\xdb\xeb\x5a\x32\xf8\x5a\x02\x56\xa7\x9e\
-\xef\x21\x2c\x80\x80\xf4\xd0\xe1\xe1\x8d\xb8\x0d\x99\x29\xe4\x84\
-\x61\x51\x7f\x7a\x01\xe1\x30\x2c\x1b\x78\x62\xc6\xf9\x80\xf8\x98\
-\x5b\x81\x9c\x73\x28\x89\x34\x4a\xa3\x40\x9b\x2d\x0c\x08\x4b\x16\
-\xb2\x46\xde\x98\x37\xc2\x3e\x54\x2c\xad\xc7\xbd\xc2\x62\x10\x90\
-\x0a\x3a\x64\x74\xd4\xe8\x94\xf6\xe9\x61\x2f\xa4\x2e\xd1\xa9\x61\
-\x48\x0c\x2f\x85\x98\x8b\x9b\xcd\xfd\x10\xae\xb8\x08\x48\xaf\x06\
-\xfd\xc4\x12\x7e\xd4\x29\xff\xd6\x9c\x7f\xe8\x8b\xae\x31\x17\xd8\
-\x9d\x0c\xbe\xf6\x81\x2d\x1e\x08\x87\x17\x0c\xcc\x1f\x83\x44\x97\
-\x52\x58\x76\x90\x02\x5d\x23\xcd\x62\xd5\x55\x20\x28\x6a\x60\xbd\
-\xe1\x85\x09\x1a\x16\xe6\x03\x31\x64\xcb\x8f\x1f\x43\x1b\x84\xd6\
-\x88\x45\x26\xeb\x29\x28\x5b\xe1\x8c\xfc\xc8\x86\x4c\x28\x03\x86\
-\x17\x71\xb8\xc3\x1f\xe4\xe6\xaf\x93\x80\x70\x58\xd4\x85\xaf\x91\
-\xe0\x1e\xa0\xac\x21\xc9\x80\x9c\x30\xd7\x3e\x80\x0c\xb6\x7f\x60\
-\x6a\xa1\xc8\xfa\x85\x3f\x6c\x84\xa1\x4b\x90\x10\xf2\xc1\x9c\x32\
-\x56\xd1\xe2\xd9\xc4\x3d\xc3\x0b\x03\x08\x10\x44\x89\x39\x67\xf6\
-\x92\x4a\xd7\xac\xce\xe8\x12\xc3\xdd\x78\x9e\x7f\xa7\xdf\x9f\x90\
-\x7d\x5e\x50\x1c\x7f\xdb\xa4\x6b\xe4\x83\xf6\x86\xa1\x5a\x2c\xc2\
-\x41\x7b\x03\xf9\x81\x20\xd1\x2f\xe0\x65\x03\x07\x8d\x43\x46\x7f\
-\x7d\x93\x5d\x28\xf4\x70\x58\xcc\x85\x73\x77\xbf\xa7\xe0\x53\xc9\
-\xad\xc8\xba\xb8\x58\x20\x51\xfd\xf2\xc2\xc0\x3b\xf2\x7b\x5b\xd7\
-\xaa\xf3\x79\x8b\xca\xad\x07\xff\xb9\xeb\xb7\x9f\x8f\xa5\x10\x49\
-\x90\xf4\x54\xbf\x85\x69\x36\x00\x0a\x48\xf9\xaa\x27\x9f\xec\x31\
-\x34\x3e\xcc\x36\x28\xd7\xed\x4b\xa6\x78\xfc\x2d\x82\x41\x35\x48\
-\xaa\xc5\x68\x88\x50\x34\x69\x4f\xb5\x09\x8b\xdf\x4c\xc9\x2d\xb8\
-\x40\x86\x93\x44\xcf\x1a\x65\xcc\xbf\x0e\x6b\xf7\x3f\x52\x1f\x07\
-\x12\xa1\x80\x0c\xf3\xc6\x98\xcd\x72\xb4\xec\x55\x7e\xb6\xbd\xbb\
-\x00\x9f\x61\x29\xb4\x02\xb9\x9f\xeb\x99\xde\x6f\x13\xeb\xdd\xac\
-\x29\x5a\x3a\x15\x81\xcd\x35\x32\x12\x94\xa4\xa5\x37\xfd\xb0\xf1\
-\xa9\x85\x89\x49\xb9\x45\x11\x53\xf6\x7f\xfa\x3e\x4e\x7a\x5b\x3b\
-\xd2\x84\x33\xa8\x3c\xf9\xb4\x4a\xd2\x6c\x7d\xc4\xf6\x31\x67\x73\
-\x3d\x2b\xaa\x8c\x5f\x3c\xb9\x28\x79\x00\x36\x44\x4a\xde\x94\x95\
-\x76\x5d\xb5\x38\xdb\x3b\xbd\x1b\x0d\xd8\xb7\xed\xf8\xbe\x3b\x37\
-\x1c\xde\xc9\xe7\x20\xf5\xa0\x57\x1c\x24\x7a\x91\x9d\x33\xfc\xc9\
-\x42\xf1\x0a\x2d\x5f\x30\xce\x97\x26\x07\xea\x0d\x56\x71\xc2\x96\
-\x74\x14\xb7\x4e\x02\x71\x21\xf5\x73\x35\xd7\x25\xca\x0e\xbb\x98\
-\xe5\xb8\xe0\xf6\x16\x0a\x48\xa7\xb8\x75\x71\x21\x61\xaf\x14\x2e\
-\xa4\x1e\x02\xe5\xa7\xeb\x22\xfb\xa2\xa2\x80\xb8\x64\x21\x2d\x3e\
-\x7c\x59\x28\xf4\xb0\xc5\x6e\x6f\x08\x7f\xb1\x72\x5d\x28\x58\x63\
-\xbb\x18\xf0\x23\xd5\x9e\x6a\x5e\xb3\x8e\x56\x29\xf2\xd6\x19\xa3\
-\x3a\xfc\x77\xe1\x88\x0e\xdd\xba\x55\xaa\xc0\x3e\xac\x0b\xc2\x00\
-\x29\xb2\xc0\x05\xc1\x0a\xf7\xf1\xea\xd3\x2b\xb3\xdc\xde\x9d\x36\
-\x8b\x29\x12\xda\x1b\x77\x07\xf0\xd3\x22\x1b\xd5\x4d\xa7\xd3\x13\
-\x41\x82\x7a\x25\x32\x82\x60\x01\x08\x20\x24\xfc\x5e\x78\x38\xd9\
-\x7b\xd3\x8f\x1b\xc6\xa9\xb2\xf6\xa7\x39\xef\x3c\x51\x2f\x45\x08\
-\xb3\xfb\xd4\xdd\xb7\xcf\xdd\x86\x49\x5d\xff\x66\x78\x00\x72\x05\
-\xca\xc6\xfd\x86\xce\xdd\xf9\xb6\xc3\x64\xdd\xa7\x19\x34\x07\xd2\
-\x00\x09\xd2\xdd\x58\x31\xe8\xc7\x8d\x4f\x83\x04\x19\x39\x05\x90\
-\x20\x97\x85\x44\x63\xf5\xb8\xf1\x74\xe6\x61\xab\xd9\x88\xa3\xe5\
-\xfe\xce\x8c\x40\xd5\xa1\xca\x92\x21\xc2\x6c\xb2\x25\x2e\x3f\xe6\
-\x62\x27\x76\x04\x05\xf1\x83\xc9\x86\x95\xa5\x14\xa9\x7b\xa7\x0e\
-\xd2\x82\x3b\xba\xb4\xff\x6b\x44\xbb\x17\xdb\x55\x8c\xbe\xfd\xba\
-\x16\x55\xf1\x56\x9c\xa7\x32\xff\x8b\xe0\x0d\x99\xca\x8d\x29\x5c\
-\x92\x98\x01\x36\xdf\x33\x44\xd5\x77\x61\x0d\x38\x20\x4d\x9e\x0e\
-\x4f\x17\x40\x3e\x81\xfb\x91\x8a\xf5\x20\x71\x50\x34\xa4\xc5\x8c\
-\xee\x74\xc9\x28\x4e\x9a\xba\xff\x85\x02\x65\x65\x2f\x51\x17\x5a\
-\x4e\x20\xaf\x7a\xf2\xdd\x9f\x50\x75\x09\x73\x51\x75\x09\x50\xd4\
-\xf3\x96\xbd\xb8\x80\x1c\x48\x47\x37\xfe\x87\x02\x72\x71\xd9\xc8\
-\xd9\x7f\xff\x75\x20\x2c\x7e\xfb\xeb\x09\x05\xc1\xf5\xa5\x20\x20\
-\x3f\x7f\xfa\x64\x38\xfc\x32\x04\x86\xe5\xd0\xfd\x8b\xac\x13\xee\
-\xaf\x9b\xd0\x1d\x00\x21\x30\x9c\xee\x54\x2c\xf0\x7a\x40\xda\x04\
-\xc8\x13\x28\x3f\xd2\x63\x6d\x81\x87\x65\x91\x08\x7a\x9c\x8b\xcd\
-\x13\xe0\xda\xbb\x3f\x0f\x32\x00\x6c\xbf\x1c\x7a\xd8\x62\xb7\x37\
-\x04\xd6\xd3\xb8\x60\xb9\x2e\x14\x17\x9d\x38\x2f\x90\xcd\xae\x34\
-\xf4\xb8\x7d\x19\x2e\xb7\x37\xb6\x47\xcd\xb8\xd1\xbf\xde\xd1\xf2\
-\xb9\xd7\xba\xd5\x6d\x0c\xc2\x40\x7f\x0d\x42\x64\x11\x02\x80\x02\
-\xc2\x7e\x6b\xc3\x9e\x93\x83\x66\x6f\x79\xd7\xe9\xf2\x2c\x8c\x32\
-\xcb\x76\x22\x43\xc8\x03\x3f\xb0\xac\xd9\x20\x19\xcf\x7e\xb0\xee\
-\xf0\x1f\x08\xab\x73\x0e\xd3\x34\x51\x2b\xec\x07\x01\xbf\x19\x19\
-\x1e\x3c\xe7\xbb\x69\xe6\xa6\xe7\x49\x83\x5c\x46\x41\xe3\x22\x1c\
-\x56\xe7\xaf\xeb\x13\x5f\xff\x35\xe1\x4c\x86\x4c\x42\xf0\xa1\x47\
-\x8a\x4a\x64\x46\x77\x8e\x0c\xae\xe1\x06\x3f\xba\x53\xc6\x5f\xf6\
-\x9f\x4a\xfd\x75\x7f\xca\x6b\x11\x36\xd9\x45\x5e\x71\x54\xc0\x55\
-\x03\x67\x6e\x7c\xea\xcf\x43\x49\x39\x94\x07\xfb\x52\x04\xc2\x03\
-\x90\x81\xff\xa6\xec\x99\xfd\xfe\xfa\xc4\x45\x06\xcd\x88\xa3\x65\
-\x30\x2e\xce\xca\x81\x20\x91\x76\x8b\x43\x95\xcc\x6b\x7a\x7c\xbb\
-\xfa\xcd\x3b\x7e\x5e\x7d\x08\x71\xf3\x6a\x27\x3f\x40\x82\x78\xbf\
-\x50\x14\x45\x7b\xa5\x73\x9d\xda\xbf\xf4\xaa\xfc\x4c\xef\xda\xb1\
-\x0f\x3a\xbd\xbe\xf2\x99\xb9\x9e\xf4\xf0\x28\x7b\xbd\xe6\x15\x62\
-\x18\xd1\xe8\x51\xfe\x55\x90\x1c\x7c\xbf\x10\x00\x1b\x5f\x57\x2f\
-\x50\xae\x0b\x41\x40\x3a\x3c\x5d\x00\xf9\x5c\x74\xda\x14\x0d\x69\
-\x31\xa3\x3b\x5d\x32\x8a\x93\xa6\xee\x7f\xa1\x40\x59\xcf\xfb\x76\
-\x5d\x1c\xe8\x69\x85\xaa\x4b\x98\x8b\xbe\x4f\x14\xf5\xbc\x65\x2f\
-\x2e\x20\x07\xd2\xd1\x4d\x48\x99\xc8\xd9\x7f\xff\x75\x20\x2c\x7e\
-\x5f\x96\x7a\x0a\x46\x60\xfa\x64\x38\xfc\x32\xe8\xc1\xf2\x41\xf7\
-\x2f\xb2\x4e\xb8\xbf\x6e\x0a\xad\xff\xc0\x70\xba\xd3\x05\x01\x69\
-\x13\x20\x4f\xa0\xfc\x48\x8f\xb5\x05\x3d\x58\x3e\xe8\xfe\x17\x9d\
-\x27\xa0\xc7\x67\x79\x90\x01\x60\xfb\xe5\xd0\x83\x5d\x10\xf4\x34\
-\x2e\x49\xae\xe2\xe0\xa2\x88\x90\x6b\x42\xa3\x9b\x56\x8e\xa8\x19\
-\x13\x56\xd1\x49\x4c\x42\x4e\x4a\xa6\xdb\x9b\xab\xaa\xde\x5a\xff\
-\xbd\xae\xde\x53\xa9\x4f\xf5\x7e\x60\x48\x83\x8a\x65\x40\x88\xc4\
-\x85\x7e\xe2\x0a\x04\x56\x95\xae\x3c\x9a\xea\x89\x79\x7f\xe1\xb4\
-\xdf\x77\x9e\xfa\x22\x26\xcc\x8a\x0a\xb3\x90\xb6\xa9\x44\x58\x4d\
-\xd6\x25\x87\xd3\x16\xcf\x4d\x38\x9d\x41\xf1\x8d\xf8\x22\x84\xc3\
-\x62\x32\xbe\xda\xb9\x5e\xd3\xfe\xd5\x2a\xb0\xc9\x53\x6c\xa6\x87\
-\xcd\xc9\x70\xd1\xe1\x73\xb9\xfd\xbe\x5f\xff\x6c\x98\xdd\xb2\x6d\
-\x51\xe2\xd9\xaf\x07\x2d\x4f\xd8\x4a\xce\x46\x45\x1f\x46\x44\x3a\
-\x94\xbe\xb6\x60\x78\x87\x01\x0b\x86\xb7\xc7\xc7\x7d\x41\xaa\xac\
-\x0e\x28\x63\x94\xc1\x78\xf3\x8f\x2b\x36\xff\x75\x38\xf9\xab\x70\
-\x9b\x79\x7b\xbf\x99\xeb\x9f\x5a\x78\x24\x09\x2b\x39\xfd\xfb\x1a\
-\x79\x9e\xfd\xaa\x55\xb0\xbc\xd2\xb9\x7e\x33\xc8\x04\xd9\x90\xf6\
-\xbc\x84\xd3\xce\xc5\x87\x53\xfe\x8a\xb4\x9a\x2d\xe4\xa4\x78\x14\
-\xd5\x14\x6d\xb7\x18\xe7\xee\x3f\x3b\x23\xea\xad\x79\x93\x97\x1c\
-\x4e\xca\xc1\xe2\x21\xdc\x55\xa4\x11\x08\x23\x25\x40\x71\xb4\x61\
-\x8d\xaa\x45\x65\xfd\x67\xd0\xa8\x97\x7a\xd4\xfd\x8f\x96\x99\xd6\
-\x30\x23\xc7\x85\xad\x1f\x3e\xaa\x62\xb5\x4c\xb8\x25\xbe\x73\x95\
-\x28\xec\x67\xca\xa7\x19\x0b\x08\x08\x08\x08\x5c\x3c\x2e\x56\x23\
-\x64\x9d\xb0\xc3\x62\xae\x4d\x6a\x4c\x1c\x71\x1d\x5b\x76\x0b\xad\
-\x4a\x32\x48\xee\xf4\x5c\x8f\xc7\x66\x35\x76\x9a\x79\x6b\xcb\x97\
-\x17\x8c\x68\x7f\x03\xf9\x87\x7c\x1b\xc0\xaa\x52\x1c\xbe\x0d\x32\
-\x1a\x30\x77\xdb\xaa\xc9\x9b\x8f\xbd\x67\xb3\x5a\xcf\x50\x3a\xd1\
-\x3e\x4d\x3a\xf9\xf1\xc6\x83\x2b\x11\x8e\xf3\xe8\x57\x37\x36\xae\
-\xfb\x72\xef\x46\xcf\xcc\x18\xd5\x6a\x64\xff\xba\x15\x4d\x5e\x8a\
-\xcb\x09\x81\x93\xe1\xf2\x63\xc9\x99\xbd\xbf\x5b\xf7\xd0\x5b\x6b\
-\x13\xd9\x99\x96\xe4\xcc\x08\x0c\xb2\x51\x70\xf5\x97\x11\x9d\x9b\
-\xf7\xa9\x55\xe6\xe5\x3e\x75\xca\xbd\xfc\xcb\xb0\x56\xcd\x20\x01\
-\x11\x4d\x1e\x19\xea\x61\xdf\x5a\x7d\xe0\xeb\xde\xdf\xad\x79\x70\
-\xf9\xd1\x94\x0c\xa4\xe9\x27\x41\x5c\x53\x22\x37\x36\x2c\x6f\x9e\
-\x79\x67\xcb\x91\xaf\xf4\x6e\xf8\xcc\x57\x03\x1a\xb3\x4f\xb0\x70\
-\x19\x3f\xda\x78\x68\x15\x11\xf9\x11\xaa\xa1\x98\xb8\x68\x47\xe6\
-\x37\xdb\x4e\x7e\x74\xf3\xf7\x1b\xfe\x44\x19\x29\x9f\x02\x9f\x78\
-\x02\xa0\x99\x12\xcf\x69\x7f\x0c\x6f\xd7\xe9\xdb\x41\x8d\x5e\x96\
-\x25\xe7\x0d\x19\xb9\x3e\x95\x62\xb8\x28\x4b\xc8\x86\xc4\xbd\xc4\
-\xd6\xd1\x5e\x9f\x56\x93\x45\xd2\xef\x81\x80\x80\x80\x80\xc0\xa5\
-\xe1\x62\x89\x90\x21\xc3\xed\xcd\xa1\xce\xf9\x9c\xdd\x6e\x76\x04\
-\x1c\xa5\x86\x8f\xe7\x52\x87\xaf\x65\x39\x3d\xde\x98\x8e\x15\xa2\
-\xd8\x99\x94\xe8\xec\x61\x03\xb2\x4e\x5e\x1c\x20\x23\xd2\xb4\x8c\
-\x0f\xce\xdd\x76\xa8\xeb\xd7\xab\xde\xb4\x5b\x8d\x3b\x56\x9d\x48\
-\x5f\x39\x37\xe1\x0c\x1b\x92\xa4\xb4\xd5\x1e\xd5\xe3\x6c\xb7\x35\
-\xaa\x38\x2c\x25\x23\xdb\x27\xb9\xbd\x9d\xe7\xdc\xd6\xe2\xb1\xc1\
-\x0d\x2b\x84\x71\x02\x44\x3a\xb8\xa6\x4b\xe9\xaf\x43\xe7\x52\x17\
-\x1d\x38\x8b\x15\x72\x0c\x66\xca\x10\x1a\xdf\xcd\xf5\x2b\x54\x1b\
-\x58\x2b\xf6\xbd\x2c\xa7\xd7\x94\x95\xe3\x36\x0d\xac\x5d\xe1\xbd\
-\x41\xf5\x2b\x54\xa5\xe4\xf3\x7d\x95\x7e\xc9\xe1\x54\xd7\x5f\x89\
-\x29\xa9\x48\x0b\x69\xc2\x4d\x27\x44\x6d\x50\xbd\x0a\xe1\x3f\x0f\
-\x6a\xf5\xb8\xe4\xf2\x75\x21\x59\xbc\x24\xd3\xed\x3d\x6a\xc6\xd9\
-\x20\x23\x85\x91\x7f\xdf\x7f\xd6\xb3\xe2\x64\xca\x22\xb3\xc9\x94\
-\xf0\xe8\xaf\x9b\xdf\xb8\x6b\xee\x96\x5d\x20\x41\x94\x91\x82\xf8\
-\x49\x10\xe9\x05\xd4\x09\xb3\xdb\x55\x8c\x6d\xec\xf2\x2a\xe5\xbd\
-\xaa\x21\x8b\xea\x90\xb9\xa3\x4e\x29\x5b\x23\x29\x9e\xe1\x06\xbb\
-\x29\xd5\xa5\x28\xf8\x0c\x8b\x80\x80\x80\x80\xc0\x65\x02\xe6\x9b\
-\xf4\xcb\x8b\x43\xc7\x72\x51\x8e\xef\x3a\xd6\xee\x5a\xb5\x45\x8d\
-\x1b\xbc\xce\x9c\xb2\x4e\x9f\xea\xa4\x3e\x9e\xcd\x8d\xc5\x84\x5b\
-\x6d\x1f\xac\x3b\xfc\xe5\x53\x7f\xec\x5c\x09\xa2\x81\x66\x55\xc6\
-\x6e\x91\x92\x9d\x1e\x36\x3f\x87\xa1\x49\x3d\x19\x06\x4e\x36\x37\
-\xd4\x8c\xb3\x9a\x8c\xb2\xb6\xe0\x60\x92\x87\x9c\x8c\xe4\xa4\xce\
-\x1b\xd6\xee\xa6\x7e\xb5\xe3\x6f\xcd\x74\x7b\xb3\x41\x11\xb2\x2c\
-\x85\x59\x64\x53\xc2\xd0\xd9\x9b\x27\xfe\xbc\xef\x74\x3a\x8f\x9b\
-\x97\xd2\xdf\x80\x16\x06\x02\xba\xb1\x6e\xb9\xf0\x1f\x07\xb7\x9a\
-\xa2\x29\x5a\x0b\x0a\x84\xe5\xd7\x60\x9f\x70\x52\xd3\xb6\xde\x3a\
-\x6b\xf3\x03\xbf\x1f\x3c\x53\x60\x5b\x04\x07\x4f\xfb\x96\xfa\x15\
-\x63\xbf\x1f\xdc\xf2\x11\x8f\xe2\xab\x43\x3f\x73\x10\x30\xd2\x6a\
-\x0e\xff\xe3\xd0\xb9\xd9\xfd\x67\xac\xff\x15\xc3\xa3\x14\x5d\xed\
-\xd1\xa0\xac\x49\xf3\x18\xcc\x4b\x0e\x25\x39\x79\xb9\xf3\x52\xca\
-\x03\x85\xc3\x89\x3a\xfe\x7c\x78\x98\xf7\xfb\x35\xee\xf0\x74\xbb\
-\x9a\xf7\xa7\x65\xbb\xdd\x20\x42\x04\xb1\xca\xb2\xdd\x6a\x35\xa6\
-\x1d\x38\xe5\x5d\x3e\x61\x6b\xc2\xd2\x4f\x36\x1e\xc1\x32\x68\x01\
-\x01\x01\x01\x81\xcb\x84\x4b\xd2\x08\x81\xb5\x49\x99\xce\x1a\x73\
-\x36\x2f\x78\x6a\x7e\xc2\xeb\x47\x33\x9d\x0b\x62\x22\xac\xd0\x08\
-\x1d\xa4\x81\x49\x06\xb7\x92\x93\x7b\x28\x99\x6d\x2e\x45\x47\xdf\
-\xae\x6a\xb4\xf9\xd0\x83\xd7\x3d\xf4\x67\xf7\xfa\x38\x1b\x52\x23\
-\xde\x28\xf0\xed\x40\xfc\x5e\x7c\x38\xd5\x03\x12\x04\x01\x81\x04\
-\xc7\xb4\xaf\x53\xfe\xc6\x06\x15\x7a\xa4\x3b\x3d\x2e\x2c\x3f\x82\
-\x86\xa5\x28\x5a\x8e\xd7\xe7\xab\x3b\x73\x70\xab\xa7\x06\xd6\x2d\
-\x1f\x9f\x17\x37\xbf\xa6\x09\x80\xd8\x7a\xd7\xaa\x2e\xfd\x74\x6b\
-\xfb\x17\x24\x55\x6b\x45\x34\x97\x49\x81\x10\x10\x5a\x5a\x16\xb1\
-\x4d\xeb\x9f\x87\xb6\x79\xa1\x4f\xe3\xf2\xec\xa3\xbc\x98\xc3\xd3\
-\xa3\x32\x20\x4d\xa4\x3d\xb0\x5e\xf9\xf8\x99\x83\x5b\x3e\xe9\x55\
-\x94\xda\x20\x41\xc8\x00\x59\x20\x53\xff\xfa\x15\x6e\x18\xd3\xbe\
-\x76\x05\x90\x20\x64\x5e\xbc\x37\xc9\x07\x12\x44\x7c\x94\x9b\x25\
-\x44\x80\x1f\x00\x12\x7c\xb7\x77\xa3\x26\xbb\x1e\xe8\x3a\x22\xc2\
-\x6a\x42\xfa\x2c\x8c\x3b\x31\xe9\x80\xc1\xed\xcd\x55\x88\xa3\x49\
-\x0a\x5b\x84\xdd\x62\x39\x99\xe5\x5c\xf9\xf0\x1f\x3b\xff\xaf\xee\
-\x94\x3f\xe7\x4c\xdc\x74\x14\x9b\xd8\x05\x04\x04\x04\x04\x2e\x23\
-\x2e\x99\x08\x19\xa3\x10\x26\xac\xdf\x95\x59\x6f\xe2\xb2\x19\xf7\
-\xce\xd9\xf2\x6a\x9a\x5b\xd9\x52\x26\xd2\x1e\xed\x34\x68\xa7\x27\
-\x9f\x49\x67\x47\xaa\x21\xec\x0d\xd5\xcb\x36\x8c\x8a\x0b\xeb\xd4\
-\xa9\x73\xcd\x27\x3c\x2f\xdc\x3a\x7a\x54\xb3\x2a\xf8\x54\x93\x46\
-\x8c\xe2\x97\x03\xbf\x01\x5c\xf3\x2d\x1a\xff\xed\x5c\xf3\x46\xb7\
-\xcb\x5d\x8e\x48\x09\xa7\x61\x30\x37\x10\x11\xf9\xe7\x10\x31\x55\
-\xfb\x65\x68\xeb\xe7\xfb\xd7\x29\x5b\x8d\x11\x59\x00\x19\x5a\x28\
-\x02\xec\x36\x15\xed\xad\xac\x56\x69\xb0\xcb\xa7\x66\x92\xaf\x7f\
-\x7f\x1f\xa5\x21\xbb\x7c\x4a\xa6\xd5\x22\x0f\x6e\x13\x17\x89\x8d\
-\xa0\xa8\x10\x7f\x7c\xa4\x85\x34\xfb\xd6\x2e\x57\xf5\x97\xa1\x6d\
-\x9e\xf7\x2a\xbe\xaa\x3e\x55\x65\x24\xa8\x07\x01\x91\x7b\xb2\x5d\
-\x9e\xf8\x17\xba\xd5\xc4\xa1\xb2\x90\x99\x79\x04\x03\x24\x08\x42\
-\xed\x5d\xa7\xac\x75\xd3\x7d\x5d\x86\x3d\xdb\xa9\xf6\x53\x8d\x2b\
-\x46\xf7\xbc\xbf\x45\x35\x76\xce\x22\xea\x68\xd2\xa9\xac\x14\x97\
-\x24\x9d\x8e\x0b\xb3\xc6\xc8\x26\xd3\xbe\xf1\x6b\x0e\xbf\x59\xeb\
-\x93\xa5\x5f\x7c\xba\xfe\x68\x32\x28\x54\x1f\x2e\x15\x10\x10\x10\
-\x10\xb8\x8c\xb8\x64\x22\x04\x71\xa9\x04\x74\xd2\x50\x78\xbe\xd8\
-\x7a\xe2\x64\xa5\x0f\xfe\x1a\xff\xeb\xee\xe3\x5f\x2d\x49\x3c\xbb\
-\xf5\x44\xa6\x13\xcc\xc0\xf2\x19\xdd\xb4\x52\x7b\x57\x8e\xdb\xe7\
-\x73\x2a\x4e\xaf\x92\x75\xfd\xd7\x37\x35\xfb\xef\xa2\x51\xd7\x37\
-\x57\x15\xec\xb3\x23\x56\x0a\xd2\xe8\xc8\x89\xb1\xca\xec\x7d\x59\
-\x7f\x98\x4c\xd6\x04\x93\x2c\x45\x22\x3b\xe6\x49\x00\x91\x79\x7c\
-\x4a\xb6\xd1\x24\x57\xea\x54\xab\x2c\xdb\x63\x47\x29\xf8\xcb\xe4\
-\x21\x16\x03\xc1\xfc\xdf\xca\xbd\x9b\x4e\x67\x64\x4f\x8a\xb4\x5a\
-\xa2\x31\x57\xa8\x7b\x63\xa5\xa8\x12\x69\x35\x47\x9d\xce\xc8\x9a\
-\xf4\xfa\xf2\xfd\xf8\x74\x8d\x84\x38\xba\x37\x23\x5b\xd8\x9d\x6a\
-\xc5\x37\x30\xca\xc6\x4a\x6e\x9f\x9a\x8d\x3c\x99\x27\x01\xb2\xc8\
-\x26\x63\x44\xb8\x26\x27\xce\xdd\x92\x84\x13\xf2\x0b\xac\x60\x01\
-\x99\x02\x20\xc1\xb7\x7a\x35\xaa\xf7\xf3\xad\xad\x5e\x68\x5e\x3e\
-\xaa\x5f\x72\x86\xd3\xe5\xf1\x28\xc6\xfb\x5b\x56\xc6\xe9\x24\x80\
-\x11\x75\xb5\xf8\x50\xd2\xd6\xdf\xf7\x9c\x99\xd6\x72\xca\x8a\xb7\
-\x9f\x5a\xb8\xeb\x00\xea\x84\xaf\x34\x45\x1a\x7a\x58\x01\x01\x01\
-\x01\x81\xcb\x84\x4b\x9e\x23\x0c\x06\x34\x1f\x68\x45\x5c\xab\x43\
-\x27\x8e\x95\x92\x0f\x75\xa8\x1c\xf3\x69\xff\x96\x2f\xa7\xa6\xbb\
-\xc3\xcc\xb2\x84\xef\x34\x69\xc4\x24\x16\xab\xdd\x64\x54\x4f\x66\
-\x2c\xbd\x77\xc5\xc1\xd9\xdf\x1d\x38\x53\xe0\xe4\x16\xf0\x08\x86\
-\x12\x3b\x55\x89\x8b\xf8\x7d\x78\xbb\x07\x6d\x26\x43\x33\xb7\x47\
-\xc9\x22\x77\x90\x14\x36\x98\x58\xec\x56\xcb\xd9\x7e\xdf\xad\xff\
-\xbf\x45\x89\x49\xf9\x3e\x93\x14\x8c\xf4\xb1\x7d\x3f\xb4\x18\x0d\
-\xfd\x55\xc5\x90\x86\xec\x8d\x66\x39\xc6\xa3\x1a\xe6\x45\xbf\xf5\
-\x3b\xbe\x4d\x56\x00\x3c\xad\xeb\x6b\x96\xb1\x2e\x1e\xd5\xe1\xc5\
-\xac\x5c\x6f\x65\x62\x3a\x17\x91\x1d\x5b\x7c\xe3\x30\xc9\x11\x69\
-\x8a\xb6\xe7\xf5\xe9\x1b\x26\x7d\x72\x32\x25\x1d\x63\xb6\x10\x48\
-\x8f\xee\xc7\x8d\x8d\x63\x4c\x2f\xb5\x6f\x70\x63\xdb\xaa\x65\xfb\
-\x67\x64\x3b\x4d\x14\x80\x0d\xf1\x92\x97\xd9\x28\xc9\x67\x7a\xcf\
-\x5c\xff\xea\xaa\xa3\xc9\xfc\xc0\x5e\x3f\x82\xeb\x42\x40\x40\x40\
-\x40\xe0\xf2\xe3\xa2\x35\x42\x10\x1e\x8c\xfe\xd3\x0f\x68\x2d\x00\
-\xd7\xee\xa0\x0f\xc1\xb6\x6a\xd6\x3a\x06\x55\xad\x40\x04\x02\xa6\
-\xc0\x98\x27\xa6\x08\xbd\x2e\xa7\xcf\xa3\x56\x8c\xee\xf5\xdd\xc8\
-\x76\x2f\xdd\xd6\xa0\x7c\x75\x74\xfc\x81\xf3\x74\x20\x41\xe4\xb3\
-\xfa\x78\x4a\x56\x9f\xef\xd6\x7d\xe4\x56\x0d\xab\x6c\x66\x99\x69\
-\x86\x44\xb8\x5a\x94\xc3\x6a\x5a\x78\x2c\xf9\x37\x90\x20\xe5\xe5\
-\xdf\x38\x1f\x08\x2e\xcb\xcd\xb3\x36\xbd\x62\xb3\xda\x71\xde\x9d\
-\x43\xc3\xe7\x0d\xdd\xea\x8e\x5b\x66\xae\x67\x5f\x49\xe6\x61\x02\
-\x81\xb4\x90\xe6\x92\xc4\x64\xf7\x77\x3b\xce\xcc\x89\xb4\xca\xd0\
-\xcc\x70\xf4\x99\x6a\x23\x12\xcc\x55\xd5\xf5\x37\x4d\x5f\xf7\x01\
-\x48\x10\x32\x06\x92\x20\x1f\xa2\xbd\xa9\x6e\xb9\x4a\xf3\x6e\xeb\
-\xf8\x5c\xf3\x0a\xb1\xb7\xa6\x65\x3a\xf1\x95\x7c\x37\xb6\x72\xe0\
-\x1d\xc4\x43\x9a\x70\x58\xb4\xb5\x46\xdb\xea\x71\x38\x4f\xd1\x60\
-\xa1\x82\xc3\xe6\xb2\x84\x22\xc1\xc2\xea\x5d\x40\x40\x40\x40\xe0\
-\xe2\x70\xd1\x44\x08\xc2\xe3\x43\x75\xa1\x3a\x66\xde\x89\x7b\x48\
-\x1d\x84\xbd\xec\x54\xe6\xe6\x43\xf6\xaa\x53\xe2\xec\x26\x0f\xf5\
-\xf7\x6c\x6e\x90\x9c\x25\xf4\xf9\x6e\xa7\x27\x8b\x22\x54\x68\x51\
-\x21\x1a\x87\xd7\x42\xa8\x7c\xe9\x21\x1f\xe4\xb1\xfe\x64\x9a\x37\
-\xea\xcd\xf9\x93\xb3\x7d\xca\x7c\xab\x2c\xe3\x80\x66\x7b\x46\xae\
-\x67\x67\xff\xa9\x6b\xd9\x17\xef\x41\x8e\xb0\x23\x4d\x16\xa9\x42\
-\x98\xcd\x3f\x84\x09\x59\x28\xba\x71\xd9\xe1\x73\x19\x53\xb7\x9f\
-\x7a\x36\x22\xcc\x9c\x13\x11\x65\xcb\x99\xba\x76\xdf\xd8\x25\x47\
-\x93\xb3\xf0\xe5\xf9\x40\xd2\xa9\x10\x61\x37\x45\xda\xec\x4c\x06\
-\xa4\x89\xa1\xcd\x3b\x7e\xde\xb8\xe5\x58\x86\x77\x0b\xc9\x66\x27\
-\x22\x0e\x77\x2a\xca\xa2\x1e\xdf\xac\xf9\x64\xdd\xc9\x34\x97\x95\
-\x12\x0f\x1e\xb6\xe4\x2f\x00\x5d\xeb\x54\xa8\x46\x35\xd4\x38\x33\
-\xd7\x93\x69\x92\x99\x13\xfb\xa2\x86\x51\x53\xc2\xa2\x2c\x06\xdf\
-\xa1\x83\xd9\xd3\x16\xef\x39\x8b\x53\xf7\xfd\x75\x15\x8a\x00\x39\
-\x39\x06\xd6\xbb\x80\x80\x80\x80\xc0\xa5\xe3\xa2\x89\xf0\xe5\xeb\
-\xea\xd6\xff\xb8\x57\x13\x7c\xed\x9a\x75\xce\xb0\x43\x69\x55\x1c\
-\xdb\x4f\xa4\xa8\xb5\x9e\x9d\xb4\xf8\xce\x5f\xb6\xbf\x9a\xea\x54\
-\x36\x46\x87\xdb\xc2\xbc\x2a\xdb\x7b\xa8\x58\x64\xa3\x3d\xd3\x6d\
-\xd8\x3d\x6e\xc9\x3e\x9c\x52\xce\xe6\xf6\x58\x24\x02\x25\xe9\x27\
-\x00\xcc\x43\x82\x94\xe2\xde\xf9\xf3\xbb\x14\x59\xf9\x35\x26\x3e\
-\x52\x7e\x7d\xe5\xa1\xb9\xf0\xc7\xc2\x18\x4e\xc8\x4f\xb7\xa9\x5d\
-\xfd\xf4\xb3\xbd\x9f\xb9\xb5\x61\x85\x28\xfc\x86\x3b\x45\x57\x49\
-\x4b\x33\x8e\xfe\x65\xdd\xa1\x99\x3b\x4e\xbd\xf2\xfd\x96\x63\xaf\
-\x8c\x5e\x73\x38\x91\xa2\x19\x15\x22\x20\x1e\x97\xe2\x54\x3c\x3d\
-\xb6\xdf\x7f\x9f\x6d\x5f\x17\x5f\x3f\xa0\xb8\xb2\x64\xd6\x8b\xf5\
-\xc9\xe6\x83\xbf\x47\x96\x8d\x32\xa4\xba\x95\x79\x31\x6f\xff\xf9\
-\xcd\x96\xb3\x59\x2c\x6d\xb7\x5e\x7e\x2e\x2b\xa0\x1a\xf2\xb4\xc3\
-\xdf\x77\x9f\xde\xec\xf6\x29\x89\x16\x59\xb2\x12\x07\x52\xc1\x24\
-\x63\x84\xc5\x18\x66\x8a\x8b\xdf\x3e\xe9\x94\xf5\xb5\x5a\x5f\xfc\
-\xb5\x60\x67\x6a\x56\xf0\xb7\xc7\xfc\xe0\x7b\x2e\x41\x8e\x75\xca\
-\x44\x4a\x1f\xdc\xd0\xa8\x06\xd5\x3d\x4e\x95\x17\x10\x10\x10\x10\
-\xb8\x0c\xb8\xe8\x39\xc2\x93\xcf\xf4\xbe\xb9\x52\x4c\x78\xb5\x8c\
-\xf4\x9c\xe3\xbf\x1d\x3a\x9b\xb0\xe4\x6c\xea\xc1\xaf\x56\x1f\xc5\
-\x47\x19\x19\x21\x16\xa6\xd5\x70\xf7\x6f\x06\xb4\xe8\x70\x57\x9b\
-\xaa\x43\x33\x73\xdc\x91\x76\x62\xb8\x85\xfb\x33\xa6\xf5\x9b\xb5\
-\x7a\x09\xf1\x9c\xb1\x8c\xc3\xa2\x6d\xbe\xb7\xeb\x5d\x8b\x0e\x9f\
-\xd9\x72\xf7\xdc\x9d\xdb\xe1\x46\x72\xfa\xc9\x11\x68\x55\x39\xd2\
-\xd8\xa6\x5c\x6c\xcd\xaf\xb6\x1d\x3f\xe2\x51\x14\x3f\x91\x0c\xa8\
-\x59\xc5\xf8\xd3\xd0\x66\xcf\xf8\x0c\x4a\x5b\xbb\xd9\xb4\x71\xc4\
-\x4f\x5b\x26\xcc\xd8\x75\xd2\xc9\xe7\xfb\x02\x65\xc0\x3c\x1d\xb4\
-\x33\xee\x76\x47\x93\x2a\x91\xdf\xde\xd2\xfc\x69\xa7\xc7\xd7\xd0\
-\x62\xf4\x6d\xb8\x65\xf6\xd6\xf7\xe6\x26\x24\xfb\xcb\x61\x31\x19\
-\xe5\xbb\x9b\x56\xaf\xb1\xf1\x44\xd6\xe1\xcd\x49\xe7\xf2\x9d\x73\
-\xc8\x65\xfc\x72\x40\xd3\xa6\x3d\x6b\xc6\xb7\x6a\xfd\xc5\xca\xa9\
-\xe7\x72\xbd\xec\xac\xbc\x63\xc3\xda\xde\x1a\x57\xbb\xec\x40\xd5\
-\xe5\x51\x22\x6c\xa6\xec\xa9\x3b\x4e\xcf\xba\xf3\xd7\xad\x2b\x10\
-\x8f\xcd\x15\xd2\xff\x50\xf5\xc5\x31\xa2\x5e\x39\xfb\xb8\xa1\xfd\
-\xeb\xd4\xd6\xd2\xea\x5a\x4d\x5a\xe5\x93\x99\xce\x03\x95\xde\xfb\
-\x13\x1f\xa4\x2d\xb0\x17\x53\x40\x40\x40\x40\xe0\xc2\x70\xd1\x1a\
-\x61\x7a\xb6\xdb\xeb\xcc\xcc\xf5\x12\x87\x95\x1f\xde\xb4\x5a\x8f\
-\xaf\x7a\x37\x1b\xb2\xf3\xfe\xce\x6d\x6f\x6f\x58\x29\xa2\xb0\x4e\
-\x1d\xee\xd0\xa0\x40\x1a\x77\xfd\xb6\x75\xed\xb0\xef\x37\xbf\x9a\
-\xe2\xf2\x6c\x33\x47\x85\x7b\xd7\x1e\xcb\x60\x1f\x83\x04\x71\x3c\
-\xd0\xaa\x6a\x8d\xaa\xb1\xf6\x6e\x77\xb7\xad\xfd\xf8\xaa\xbb\x3a\
-\xe2\x03\xaf\xaa\x6c\xb1\xb2\x23\xcc\x59\x42\x84\xad\x27\xb3\xb4\
-\xc9\x9b\x8f\x1c\xe4\x24\x88\x34\x61\x3f\xdb\xb5\x5a\x7f\x8b\x49\
-\x6a\x4a\x9c\x73\x26\xc7\xe5\x6b\x32\xe3\xb6\x56\xf7\x0d\xaa\x5f\
-\xd6\x3f\x77\x08\x19\x20\x02\x4c\x1e\x09\xe2\x10\x6e\x55\xbb\xbd\
-\x59\x55\xf3\xd4\xc1\xcd\xef\xcf\x71\xfb\x6a\xb9\xbc\xea\x59\x93\
-\x6c\x6b\xf6\x74\x87\x86\xfd\x10\x87\xa7\xed\xf1\xa9\xca\xe4\x2d\
-\x89\x07\xb7\x9e\x4b\xf6\x93\x32\x64\x82\x6c\x90\x71\xc5\xa8\xf6\
-\x3d\xee\x69\x57\xeb\xf1\xaa\xb1\x8e\x6e\x0f\xb4\xae\x5a\x03\x6e\
-\x08\x33\xeb\x78\xfa\xf6\x30\x93\x26\x69\x11\x31\x3b\xc7\x9f\x30\
-\xbf\x0e\x12\x34\x92\xa6\xc9\x08\x98\x02\x15\x56\x5f\xc3\x1a\x57\
-\x8e\xda\x7a\x5f\xe7\x0e\xdf\x0d\xeb\x30\xa4\x8e\xeb\xc4\x75\x3e\
-\x67\x6e\x59\x67\xae\xc7\x9b\x91\x9d\xf7\x49\x2a\x8a\x2a\x48\x50\
-\x40\x40\x40\xe0\x12\x71\xd1\x44\x88\x01\x3b\xd2\xb2\x70\x82\x8c\
-\x27\x33\xdb\xe5\x4c\xcf\xf0\x84\xd5\x89\x8b\x6a\xf7\xc3\x90\xd6\
-\x43\xd6\xdc\xd5\xa9\x8b\xcd\x24\xfb\xe7\xe8\x02\x81\x21\x4e\x10\
-\x04\x11\xa2\x71\xe6\x9e\x13\xa9\x37\xcd\xdc\x34\xe9\xa1\x1f\x37\
-\xbc\xff\xfe\xd6\x84\x74\xe2\x14\x46\x74\xa3\x9b\x55\xec\xe0\x76\
-\xfb\xa4\x94\x8c\x5c\x4f\xab\xb2\x61\x77\x2a\x1f\x3f\x7a\xcf\x88\
-\xa6\x35\xd9\x89\xdc\x56\xb3\x89\x85\x41\x2a\x48\x03\xd7\x20\x57\
-\xa4\xf9\x46\x8f\xba\x55\xba\xd6\x8e\xeb\x9b\x92\xeb\xc6\x27\x93\
-\x4c\x44\x7e\x99\x8a\x57\x69\xf3\x4c\xa7\xda\xb7\x23\x1c\x4f\x1f\
-\x22\xc0\xf0\x6b\xd8\x5f\xf4\x6b\x3d\xca\xe5\xf2\x34\xa3\xdf\x99\
-\x66\x59\x32\xa7\xe4\xba\x72\xaf\xab\x1d\xdf\xf7\x7f\xd7\xb7\xac\
-\xa4\xcb\xcb\xe2\xc2\x46\xde\xb8\xc6\xdc\x20\x64\x1a\xd6\xb8\xba\
-\xd5\x37\xe1\x91\x7b\xda\x54\x88\xb8\x93\x64\xf6\xba\x5c\x8a\x61\
-\x74\xf3\xea\xf8\xb8\x2c\xc3\x1f\x5b\x8f\x9c\x38\x7c\xca\xf0\xc9\
-\x75\x9f\x2d\x9e\x30\xe6\xeb\x5f\x93\x2c\x38\x81\x46\x51\xfc\x04\
-\x68\x36\x81\x4e\xff\x26\xf9\x7e\x75\xca\x46\xec\x7c\xa0\xeb\xf5\
-\x33\x6f\x69\x79\x5b\xc3\xf8\xe8\xd6\xe9\xd9\x2e\x9b\x4b\x33\xb9\
-\x54\xc9\xe8\x31\x49\x92\xca\x54\x48\x01\x01\x01\x01\x81\xcb\x82\
-\x8b\x26\xc2\x70\xab\x59\x32\x9b\x8c\x76\x7d\x0b\xa0\x84\x2d\x11\
-\x6e\x9f\xe2\xca\xcc\x71\x9b\x9b\x97\x8f\x6e\x52\x26\xcc\xca\x16\
-\xbe\xc4\xda\x2d\xfe\x4e\x9b\xaf\xa4\x04\x88\x10\x19\xb9\xec\x3c\
-\x97\xe5\xfb\x74\xd3\x91\x7d\x1e\x1f\x31\x03\xa1\x4f\xed\x72\x11\
-\x15\xc3\xc3\x9b\x53\x5a\x1e\x22\x0c\xc9\x23\xc9\xd9\x39\x87\xf7\
-\x74\x9b\xda\xbb\xe6\x33\xa3\x9b\x55\x8d\x73\x7b\x7d\x6c\x28\x93\
-\xa7\xa1\xdb\x8c\x50\xee\x6c\x5c\x65\x78\x76\xb6\x27\x8c\xd2\xc5\
-\xb0\x25\xb4\x3e\x39\xd3\xed\xcb\xe9\x54\x39\xae\x0f\x69\x6b\x3d\
-\x91\x7e\x20\xe1\xf0\xeb\xa5\xa3\x3a\x0c\xb1\x4a\xce\xeb\xbc\xaa\
-\x21\x9b\x52\x66\x04\x6e\x96\x65\x5f\x76\x56\x4e\xe4\xfd\x2d\xe3\
-\x19\x89\xf2\x8d\xf2\x3c\x2f\xc8\x80\xb9\xc1\xd1\x2d\xaa\xc5\x7e\
-\xdb\xaf\xce\x53\xb9\x47\xf6\x76\xf3\x68\x72\x0e\x93\x59\x55\x3d\
-\x15\xec\xe6\xe6\xfd\xea\x94\xc1\x57\x9a\x0d\xcb\x9c\x3e\x57\x8d\
-\xcf\x7e\x5f\xbf\xed\x54\x8a\x42\x32\x91\x7f\xfe\x61\x5e\xaf\x4f\
-\xd1\x6a\xc6\x44\x1a\x62\x1d\x16\x76\x3f\xfa\xd4\x29\x5f\xbe\x49\
-\x95\x32\x4d\x93\xb3\x5d\x46\x2a\xaf\x8b\xca\x43\x94\xa9\x41\x2d\
-\x35\xa1\xce\xc3\xac\xa6\x8b\xbe\x6f\x02\x02\x02\x02\x02\xf9\x71\
-\xd1\x1d\xea\x8c\x5d\xc7\x36\x1d\xcb\x70\x6d\x74\xd8\x22\x32\x23\
-\x6d\xb2\x8c\xc5\x20\xa4\x27\xc9\xa4\xad\x80\x10\xdd\xa4\xa2\xb1\
-\x70\x77\x35\xad\x12\x73\xfa\xc9\x1b\xba\x0d\x6b\x54\x31\x96\x0f\
-\x4f\x72\x42\xd4\xb5\x43\xa6\xd9\x11\x25\x31\xb7\x5a\x31\x8e\x78\
-\x7b\x84\x35\x8a\xfc\x8c\x14\x18\x1f\x28\x34\x1a\xcc\xd6\xac\x6c\
-\xd5\x50\x7b\x52\xef\xba\xcf\x4f\xbe\x7f\x70\x6d\x68\x52\x81\x84\
-\xc6\x91\xab\xaa\x47\x31\xdf\x08\x6f\xdd\x89\x08\x4b\x52\x73\x48\
-\xbb\xac\x15\x1b\xde\x40\x77\xf2\x03\x79\xc3\xae\x17\x1b\x5e\xd9\
-\x47\x51\x20\x84\x0e\x4d\x51\x14\x39\xdc\x2c\xf9\x66\xed\x39\xb3\
-\x0d\x0e\x81\x99\x61\xa9\x2b\x64\x98\xdc\xa2\x6a\xad\x49\x03\x9a\
-\x3e\x9f\xe3\xf5\xd5\x85\x8c\x54\x2a\x26\xb3\xc7\xa7\x1a\xed\x11\
-\xb6\xc8\x5a\x31\x11\x65\x11\x1e\x95\x42\x69\xb3\x4f\x40\xa1\xc8\
-\x70\x0b\xdc\x22\xf2\xc5\xfd\x43\xcb\x1e\x7a\xb8\x7b\xaf\x91\x4d\
-\x2a\x96\xc1\x6f\x22\xbf\x5c\x62\xc7\x5c\x2a\x22\x55\x98\x24\x9b\
-\x25\xcd\x16\x6d\x35\x1a\xd3\x3c\xbe\xd4\x23\xe9\xee\x75\xdf\xef\
-\x4e\xdb\xc8\x22\x0a\x08\x08\x08\x08\x5c\x32\x2e\x9a\x08\xff\xb3\
-\x28\xe1\x4c\xd5\x09\x0b\x57\xde\x36\x6b\xf3\xac\x49\x9b\xcf\xcd\
-\x3b\x91\xad\xed\xb4\x5b\xcd\xb9\x11\x76\x33\xf6\xc8\x43\x31\x62\
-\x1d\xbd\x4b\x55\xa2\x2a\xc4\x45\x36\x9b\x7e\x4b\xab\x5b\xb6\xdf\
-\xd7\xb5\xeb\x1d\x8d\x2b\x47\x72\x42\xe4\x80\x66\x07\x03\x3a\x9c\
-\xb8\xf1\x70\xe2\xf8\xa5\x7b\x3f\x8c\x8b\x09\x4b\x26\xaa\x70\x50\
-\x48\x55\x32\x68\x32\x31\x93\x53\x91\x4c\x71\xa3\x2a\x28\x8f\x95\
-\x09\xb7\xdb\x40\x2a\x8c\x3e\x03\x50\xe7\xe3\xa5\xdf\x27\xe7\x2a\
-\x0b\xec\x16\x39\x4c\x27\x1c\x8d\xf2\x32\x87\xd9\x2d\x19\xef\xac\
-\x3e\x3a\x1b\x61\xb0\xf2\x94\x03\x1a\x29\xec\xb7\x36\x1c\x9e\xe9\
-\xb0\x9b\xd3\x7d\x8a\x6a\xa2\x9f\x9a\x57\x51\xa4\x98\xe8\x48\xcb\
-\xf7\x27\xdc\x33\x1e\x9e\xbf\x7d\x09\x78\x9a\x0f\x87\x22\x4f\x7c\
-\x3a\x2a\xce\x66\xb6\x8d\xea\xd5\xe0\x71\xc5\xe3\x8b\x27\x3f\x27\
-\x64\x24\x1b\xfb\x04\x1d\x65\x62\xec\x69\x1f\x2c\x4f\x18\xff\xf1\
-\x86\xc3\x07\x11\x9e\x34\x47\x8a\x91\x5f\x0b\xc4\x21\x03\x23\x9a\
-\x54\x8e\xde\xf9\xf0\xf5\xdd\xef\xa9\xe2\xbb\xd9\x60\xf4\x35\x90\
-\x34\x29\x02\x7e\x66\x93\x41\x25\x41\x2d\x91\x76\x8b\xcd\x66\xd6\
-\x72\x8e\x1b\x1c\xdb\xbe\x48\xb2\xcd\xed\xf4\xf9\x92\x9f\xaa\x7f\
-\xfc\xd7\x9a\xb1\x8b\x36\x9d\x61\x89\x08\x08\x08\x08\x08\x5c\x32\
-\x2e\x9a\x08\x31\xc4\x07\xcc\x4d\x38\xe2\x7b\x64\xfe\xfa\xe3\x35\
-\x3e\xfe\x63\xf9\x90\x1f\x36\xff\xf8\xc9\xc6\xc3\x8b\x8f\x67\xb9\
-\x4e\x7a\xf2\xb6\xc4\x51\x06\x46\x07\x31\x9d\x92\x96\xe3\x96\xea\
-\xc7\x47\x36\x9d\x3e\xb8\xc5\x6d\xbb\x1f\xbc\xbe\xf5\x1d\x4d\xea\
-\x99\x59\x80\x00\x80\x2d\x90\xe6\x98\x85\x7b\xf7\x0e\xfe\x7e\xf3\
-\xff\xa5\xba\xbc\x9b\xa2\x6c\x26\x90\x5a\xde\xac\x18\xb1\x8d\x2b\
-\xdb\x95\x42\x2a\x1f\xfb\xfe\x21\xc2\x73\x32\x03\x10\xb7\xdc\x07\
-\x0b\x66\x64\x7a\xd4\x25\x20\x43\x92\x41\x89\xb5\x5b\xac\xb3\x76\
-\x9d\xf8\xe3\xa3\x8d\x07\x4e\x11\x29\xe5\xfb\xca\x3c\xae\xe1\x36\
-\x61\xcd\xc1\xd3\xb3\x77\x9d\xfc\x2d\xd6\x61\xb1\x62\xeb\x46\x98\
-\x49\xb6\xa7\xba\x7c\x3f\x0f\xfd\x66\xc9\x22\x4a\xd2\xbf\xc7\x10\
-\x79\x21\x4f\x5c\x93\x56\xe8\x71\x29\x52\x12\xf1\x26\xf6\x19\x1a\
-\xf0\x9d\x42\x87\xd9\x18\x9e\xea\xf6\xed\x18\x32\x63\xfd\xff\x9e\
-\xfa\x6b\xcf\x6e\xc8\xc3\xc3\x07\x62\x44\xd3\x0a\x96\xed\xf7\x77\
-\x6e\xf7\xdd\x2d\xad\x06\xd7\x89\xb2\x37\x4a\x4e\xc9\x50\x0d\x46\
-\xd9\xa7\x68\x06\x3b\xfc\xcf\x66\x2a\x5a\x5a\x86\xeb\xc4\xa4\x0d\
-\x89\x8b\x86\xfc\xb4\x79\x56\xad\xb7\x7e\x5a\x79\xef\x94\x9f\x4e\
-\x1d\xcd\x21\x86\x26\xa0\xee\x59\x42\x02\x02\x02\x02\x02\x97\x8c\
-\x8b\xde\x3e\x11\x08\x5d\x63\xca\xb7\x8a\x11\xc3\x9d\xd0\xf2\x1e\
-\x6b\x53\xbd\xe9\xc7\x37\x36\xbb\xe1\x6c\x86\x2b\xc3\x2a\xcb\x14\
-\x48\x35\x3b\xac\x66\xd2\x18\x0d\xc9\xb3\xf6\x9c\xd8\xf8\xdc\x92\
-\x84\x43\x47\xd3\x73\x59\x3c\x0c\x17\x42\x53\xe2\x71\xe1\xb6\xfe\
-\xee\xae\xbd\x9b\x97\x0f\x1f\x9c\xe1\xf2\xaa\x71\x0e\x8b\x65\xf6\
-\x9e\xa4\x99\xb7\xff\xbc\x71\x21\x71\x81\x91\x82\xb3\xcd\xe5\xc4\
-\x0d\x46\x93\x4c\xd7\xbe\xbc\x21\xd3\x46\x65\x22\x0c\x7f\xde\xd1\
-\xee\xbe\x30\x9b\xa9\xbb\x51\x95\x76\xf4\x9e\xbe\xf6\x9d\xb5\x27\
-\xd3\xd8\x76\x07\xf8\x97\x75\x60\xde\x52\x32\x24\xe5\xba\x21\x32\
-\xcb\xbb\x43\xd5\x18\x69\xc1\x90\x56\xff\x31\x9b\x4c\xcd\xd3\x9c\
-\xda\xcf\x95\x3e\xfa\xf3\x47\xa4\x4b\xde\xaa\x85\xd4\x48\xaf\xa2\
-\xb1\x05\x39\x20\x43\x64\x49\xe5\x55\x7f\x18\xd4\xb2\xdb\x6d\x8d\
-\x2a\x8c\xa2\x74\xdc\xe5\xc3\x1d\xe6\xe3\x39\xca\xbc\x9e\xd3\x96\
-\xcf\xdd\x77\x2e\x5b\xa5\xb2\xb0\xef\x28\x22\x3c\x27\xdf\xaa\xd1\
-\x0e\xf9\x7f\xdd\xea\xd5\x1b\xda\xb8\x52\x2b\x83\x26\x45\xe7\xb8\
-\xbd\x6e\x45\xd3\xf0\xf5\x79\x63\xb9\x98\xb0\xc8\x31\xbf\xef\x58\
-\x38\x7e\x7d\xe2\xce\xc0\xf2\x03\x90\x59\x26\xee\x0b\xd6\xa4\x05\
-\x04\x04\x04\x04\x2e\x1d\x97\x65\xd1\x05\x34\x26\x4e\x28\x20\x45\
-\x80\x2e\xd9\xef\x73\x6e\xeb\xe1\xdc\x14\xef\xb6\x32\xb2\x6a\x90\
-\x14\x8f\x8d\xc2\x2a\xb9\x6e\x5f\x4e\xa6\xd3\x13\x35\xac\x6d\xad\
-\xbe\x0f\xb7\xaa\xce\xbe\xb8\x6e\xa7\xde\x1f\x49\xd8\xcc\xb2\x0c\
-\x12\x00\x81\x50\x5a\xc6\x76\x5f\xad\xf8\x73\xc2\xc6\xa3\x13\xca\
-\x86\xdb\x9c\xe0\x96\x35\x27\x53\xd8\x9c\x1d\x94\x22\x10\xcc\x97\
-\x37\x36\x6b\xfa\x50\xdb\x8a\x51\x20\x41\x2b\xb1\x0f\x86\x3e\x77\
-\x9d\xcb\xd4\xfa\x4d\x5f\x3f\x2d\x5a\xd1\xb6\xfe\xbe\xf5\xd8\x02\
-\x90\x20\x88\x89\xc4\x62\xf3\x74\x0b\x46\x75\xee\x4b\xa6\x1f\xae\
-\xe1\x66\x92\x65\xe3\xda\x63\x69\xda\x9f\xe9\xd2\x5f\x06\x93\x6d\
-\xa9\x4e\x82\x8c\xf8\x6c\xe4\xe7\xa1\xb4\x1f\x6a\x54\x2d\xf2\xf3\
-\x1b\x9b\x37\x45\x9e\x94\x10\x2b\xdb\x8a\xb3\x99\xdb\x29\xb2\x3b\
-\x3e\xcc\xea\xfb\x6c\xd3\x89\x4f\xab\xbc\xff\xfb\x2f\x09\xc9\x39\
-\x38\x2a\x0d\x84\x0e\x32\x94\xc1\x81\x54\x36\xa6\xc1\x3d\xda\xba\
-\x46\xf5\x91\xed\x6b\xf7\xcc\x74\x7a\xc3\x32\x5d\x9e\x1c\xf2\xd3\
-\xc2\x2d\x26\x7b\x5c\x98\xcd\xbb\xe1\x58\xca\xda\x3f\x0f\x9d\x3b\
-\x84\x70\x28\x3f\xf2\x87\xc8\xf8\x0d\x39\x05\x09\x0a\x08\x08\x08\
-\xfc\x33\xb8\x2c\x44\x18\x08\x4e\x8a\x20\x0c\xfc\xfe\x7e\x47\x42\
-\x96\x63\xc2\xfc\x25\x13\x8f\xcb\x73\x7c\x95\xeb\xec\x89\x0d\xb7\
-\x93\x1a\xea\xb3\x79\x55\xcd\xab\x65\xbb\x5d\x2e\x45\xc9\x1b\xe6\
-\xa4\xd0\xd5\xa2\x1d\x66\x17\x26\xe8\xc0\x80\xc4\x36\x94\x16\xe6\
-\x0d\x8d\xcf\x2e\xdc\xbd\xeb\x8d\xd5\x87\x3f\xdc\x76\x26\xfd\xaf\
-\xa9\xdb\x8f\xa7\x20\x3c\x11\x83\x3a\xb0\x6e\x05\xc7\x3d\x6d\x6a\
-\xde\x33\xe9\xa6\xe6\xf7\xdc\xd5\xb6\x26\x86\x35\xd9\xbe\x40\xf8\
-\x6f\x3f\x97\xe9\x1a\xf9\xd5\xaa\x4f\xde\x59\x9e\xc0\xf6\x27\x42\
-\xa3\x22\xb1\xd4\xf1\x23\xfb\x55\x6b\x51\x35\x6e\x60\x8b\xaa\x31\
-\x03\xc7\x8f\xea\x57\x1d\x6e\x94\x1d\x82\x18\xde\xdf\x9c\xb4\xad\
-\xcb\xb7\xeb\xbf\xc6\x35\xca\x60\x33\x9b\x8d\x6e\x2a\xcf\x23\x6d\
-\x2a\x9b\x27\xdd\xda\xf8\xee\xfb\xda\x56\xbf\xf7\xa6\xba\xe5\xc3\
-\x38\x29\x7d\xb7\xe5\x68\xfa\xb6\x13\x19\x8b\xdf\x5b\x7d\xe4\xc3\
-\x07\xe6\x6f\xd9\x0c\x59\x89\x88\xb1\x52\x07\x3c\x06\x8d\x50\xa9\
-\x13\x17\x6e\x25\xb1\x98\x4c\x4e\x9f\xc7\xa9\x66\x39\x73\x48\xbb\
-\xf4\x85\x5b\x64\x5b\x4c\xb8\xc5\xbd\xf9\x4c\xfa\x86\x21\xb3\x37\
-\xcf\x6e\xfb\xc5\xca\xb5\x7b\x93\xb3\x72\x11\x0e\x40\xfe\xa8\x4b\
-\xfd\xa7\x80\x80\x80\x80\xc0\x3f\x84\xcb\x32\x34\x5a\x14\x18\x23\
-\x10\x09\xf1\x4e\xfd\xe3\x41\xdd\x63\x87\xd7\x8a\x68\x1e\x69\xd5\
-\x6a\x9b\x6d\x26\xd3\xf8\x95\x07\x67\x8e\xf9\x6b\x67\xda\xa0\x06\
-\x15\x6c\x3f\x0e\x6a\xd5\x7f\xe6\xce\xe3\xbb\x46\xfd\xb6\x9d\x9d\
-\xbd\x09\x2d\x8e\x74\x22\xac\xb4\xf4\xef\xf7\x03\x90\x24\xc9\xad\
-\xfe\x35\xba\x6b\xb7\xee\x15\xc3\xef\xca\x72\xa9\x52\x54\xb8\x75\
-\xc7\x5d\x7f\xed\x98\xf8\xed\xda\xc3\x2e\x8b\xd9\x64\xf4\x90\x8a\
-\x88\xbc\x41\x28\x7a\x34\xc3\x90\xc6\x75\xe5\x99\xfd\x6a\x3c\x97\
-\xa9\xaa\xb5\x31\xdf\x18\x61\x90\x12\xef\x98\xb3\xef\xad\xef\x0f\
-\x1e\xf3\x9f\x4c\xc3\xe3\x20\x6f\xe4\xf9\x70\x8b\x2a\xe6\x89\x37\
-\x37\x7d\x30\x25\xcb\xdb\x2a\xd2\x6c\x32\x2c\x4b\xce\xf8\xa6\xe7\
-\x94\x55\x4b\xb9\x0c\x7a\x34\xb6\x12\x96\xe2\x60\x11\x0c\x36\xef\
-\x2b\x0d\xca\x84\x49\xd3\x06\x76\x6e\xd4\xa6\xba\xb5\xe1\xc0\x59\
-\xab\x7f\x99\xbb\x33\xc5\xf3\x61\xff\x16\x91\x4f\x76\xac\x39\xc2\
-\x9d\xe3\x72\x6d\x3a\x99\xb9\xe7\xfd\x8d\x07\x77\xfd\xbc\xe7\x74\
-\x0e\xe2\x43\x5d\xc5\x2b\x04\x4b\x4c\x40\x40\x40\x40\xe0\x8a\xe1\
-\xb2\x6b\x84\xc1\x00\xa9\x80\x04\x49\x53\x92\x40\x6b\x8f\xcd\x59\
-\x9a\x1a\xf7\xde\xdc\x25\x9f\x6e\x3e\x32\x67\xdf\xa9\xd4\x7d\x3f\
-\xed\x3e\xc5\x8e\x65\xab\x13\x13\x16\x66\xb6\xc8\x71\x43\x5a\x54\
-\xeb\x65\x78\xa8\x7b\xdf\xb1\x2d\xaa\xc7\x62\x78\xd1\xab\x18\x24\
-\x33\xc5\x33\x83\x29\x08\x7a\x9a\x6a\xcd\x58\x87\xdc\x22\xce\xde\
-\xd1\xed\x53\x15\x59\x36\x64\xe7\xba\xdc\x2d\xa6\xf5\x6b\xfa\xc8\
-\xe3\xed\xeb\x58\x41\x82\xd0\x0c\x91\x37\xc2\x53\x34\x56\xce\x27\
-\xda\x95\xed\x25\xd9\xac\xf5\x49\x10\x97\x24\xc9\x2e\xa3\xcd\x5a\
-\xef\x89\xeb\xaa\xf5\x0e\x0c\xc3\xe3\x20\xef\x27\xae\xbf\xce\x34\
-\xb1\x77\xab\x07\xd3\x73\x7c\x6d\xcd\x92\x94\xed\x56\x14\xa5\x79\
-\x84\xa3\x63\x8d\x98\x30\x19\x32\x20\x1c\x64\x82\x6c\x28\x9f\xdb\
-\xa7\xe0\x18\x37\xe5\x3f\x1d\x6a\x96\xd9\xfb\x48\xf7\x01\xf5\xca\
-\x18\xaf\x37\x28\x5a\x78\xfd\xc8\x68\x2b\xc2\xfe\xb6\x27\xd9\xbb\
-\xfa\x60\xd2\xf6\x21\x3f\x6d\x9e\xdd\x69\xea\xca\xf5\x20\x41\x14\
-\x0b\x7e\x82\x04\x05\x04\x04\x04\xfe\x1d\xfc\xe3\x44\xc8\x81\x4f\
-\x26\x61\x13\x01\x69\x4d\xe0\x0e\xe9\xf1\x05\x3b\xcf\xd5\xff\x74\
-\xf9\x92\x75\x67\xd2\x9c\xf0\xf7\xf8\x54\x87\xc1\x67\x30\xa6\x67\
-\x38\x73\x32\xa3\x1d\x35\xdf\x19\xd4\xe2\x96\x6d\xf7\x77\x6d\xda\
-\x28\xde\x6a\x70\x11\x2b\xf9\xf2\x86\x36\xfd\xab\x44\x7b\xd6\x88\
-\x8b\x8d\x8f\xb4\x56\x72\x12\xf3\x90\x0b\x26\xed\x32\x33\xd3\xb3\
-\x5b\x4c\x18\xdc\xf5\xbe\x3b\xfa\xf5\xc2\xdc\x1c\x23\x16\xe4\x07\
-\xd2\x1a\xd9\xb4\x72\xd9\x0e\x15\x23\xfb\x67\x38\xdd\x4e\x99\x48\
-\x4f\x96\x0c\x72\x86\xcb\xe3\x6c\x5f\x31\xa2\xff\x1d\x4d\x2b\x97\
-\x43\x18\x84\x45\x1c\xa0\x76\x85\x78\xe3\xdb\x37\x35\xbc\x37\x4b\
-\xc9\x6a\x63\x34\x48\x59\x94\xbd\x44\x79\x29\xf1\x51\xf6\x4a\x3d\
-\x6b\xc6\xc7\x21\x0c\x64\x81\x4c\x3e\x8a\x05\x19\x1b\x95\x8d\x31\
-\x6c\xbb\xbb\x5b\xf3\xb7\x7b\x35\x1b\x94\x91\xab\x54\x76\x7a\xd4\
-\x6c\x83\x64\xb4\x7a\x15\x8d\x6d\xac\x5f\x79\xec\xa4\xab\xd3\xd7\
-\x2b\xd7\xfc\x9a\x70\x86\xd2\x13\x04\x28\x20\x20\x20\x70\x35\xe0\
-\x8a\x11\x21\x07\xf1\x05\xb8\x83\x9d\x0e\x03\xd0\x5f\xe6\x9e\xea\
-\xf4\x64\x1a\x1c\xbe\x94\x32\x61\xd6\x30\xd5\xe3\xf3\xa6\x66\xe4\
-\x4a\xf5\xe3\xa2\xbb\xee\x7a\xb8\x63\xbf\x67\xdb\x56\x89\x62\xe3\
-\xa3\x04\xb6\x58\x85\x22\x7d\xb6\xf9\xf8\xb9\x37\x96\x1f\x98\x4c\
-\xc4\xe4\xf5\xaa\x2a\xd3\xb8\x14\x49\xce\x30\xe4\x26\x75\xa9\xef\
-\x39\xc9\xb4\x3c\x8b\x2c\x93\xe6\x86\x2b\x83\xe1\x50\x9a\x2b\x5d\
-\x93\xec\x27\x88\x00\x2d\xf4\x13\xda\x9c\x8a\x6b\x4d\xb2\x9d\x48\
-\x24\x3f\x84\x41\x58\x8b\x6c\x64\x27\xcb\xdc\x51\x3b\xba\xb7\xf5\
-\xec\xa1\x6e\x5e\x4d\xce\x82\x8f\x57\xd5\xac\xf1\x91\x76\xdf\x9b\
-\xcb\x0e\x4c\x9e\xb2\xf9\x48\x12\x64\x80\x2c\xd8\x5c\xaf\x29\x9a\
-\x36\xb6\x7d\xed\xe8\x5d\x0f\xf7\xec\x5f\xbf\xbc\xbd\x4b\x5a\x76\
-\x2e\x48\x5b\x29\x17\x6e\x0e\xcb\x74\x7a\x4e\x9e\xcc\x72\x66\x22\
-\x4d\x70\x1f\x4a\xad\x93\xb3\x20\x40\x01\x01\x01\x81\xab\x00\x57\
-\x9c\x08\x39\x30\x5c\x0a\xb8\xb1\x7b\x8e\x30\x6d\xe7\x89\x8c\x9b\
-\xa6\x2d\x9f\xb3\xfe\x4c\xea\x8a\x48\x87\xc5\x17\x66\x96\xad\x39\
-\x6e\x97\x2b\x2d\xc7\x56\xf5\xdd\xfe\xad\x6e\x7b\xab\x69\xe5\xca\
-\x08\x47\x44\xc5\xf6\xe6\x99\x49\xad\x1b\xb7\x78\xef\xce\x37\x97\
-\xef\x1f\x1f\x1b\x6e\xcf\xa5\x64\x18\x19\x1a\x34\x29\x57\xf3\x7a\
-\x93\xd8\x35\xd1\x11\xf2\x01\x69\xad\x39\x9e\xec\x19\xbf\x36\x71\
-\x5a\xa4\xcd\x9c\x45\x39\x92\xc6\x68\x90\xe9\x3a\x7b\xc2\xfa\xa3\
-\xd3\xc8\xcf\x8d\x30\x08\x4b\x74\xc5\xe4\x91\xcd\xe6\x34\x83\xd5\
-\xee\x84\x8c\x58\x90\x1a\x1b\x61\xcb\xa5\xbc\x3e\x7c\x7e\xc9\x9e\
-\x1d\x18\xaa\x85\x0c\x90\x05\x9b\xeb\xdf\x6c\x5a\xa5\xd2\x3b\x7d\
-\x1b\x0d\x4e\xcb\x4e\xaf\x92\xe3\x52\x9d\x0e\x8b\xc9\x1a\xe9\x90\
-\x9d\x1b\x4f\x2b\x7f\xb5\xf9\x72\xed\xbc\x1f\x77\x9f\x26\x32\x65\
-\xdf\x1b\xc4\xb7\x7b\x35\xbc\x0c\xe0\xb7\x80\x80\x80\x80\xc0\xbf\
-\x8f\x7f\x8d\x08\x43\x61\xde\xfe\x5c\xa5\xd3\x57\x6b\xb6\xbf\xb6\
-\xe2\xe4\x6c\xa7\x66\x4e\x88\x0b\xb7\x59\x7d\x3e\xaf\x42\xac\x69\
-\x71\xc7\x47\xe0\x43\xbc\x7e\x68\x9a\x64\xb0\x9a\x8c\xf2\xf3\x8b\
-\xf7\xee\x7f\x63\xc5\x81\xf7\x63\x23\xad\xa4\x75\x49\x91\x39\x4e\
-\xdf\x91\xdf\x0e\x24\xb1\x2d\x16\x44\x78\x6c\x5f\x21\x56\x8c\x62\
-\x6f\xde\xd3\x0b\xb7\x9e\xfa\x76\xc7\xc9\x9f\xc3\xcd\x46\x4b\xb8\
-\x55\xb2\x7c\xbb\xf3\xe4\xcf\x63\xfe\xdc\x7c\x02\x7e\xc4\x83\x4c\
-\x5b\x03\xf1\x21\xee\xbc\x84\xd3\x5b\x73\x72\xdd\x27\x49\x5f\x8d\
-\x20\x12\xcc\x7e\x63\xf9\xfe\x0f\x9e\x5f\xb2\x77\x3f\xe5\x69\xfc\
-\xfb\x00\xb7\x3c\x90\x6c\xe1\x94\x19\xc9\x6a\x50\xe2\xa2\x6c\x96\
-\x63\x59\xb9\xbb\xfb\xcd\x58\x3f\xab\xcd\x97\x7f\x24\xec\x4f\xc9\
-\x10\xa4\x27\x20\x20\x20\x70\x15\xe3\xaa\x22\x42\x68\x64\x18\x32\
-\x7d\x65\xf9\x96\xcc\xe8\xb7\x7f\x5d\xf8\xe1\x86\xc3\xbf\xc7\x47\
-\x59\xb3\x0d\x56\x59\xb6\x6a\x6a\x06\xc2\xe0\x48\xd2\x26\xf1\x0e\
-\x39\x9e\x68\xd1\x43\x0a\x96\xdd\x62\x92\xc7\x2d\xde\x73\xe4\xcd\
-\xa5\xfb\xde\x8f\x8d\xb1\xbb\x8e\x78\x5c\x09\x1b\x4e\xa5\xfb\x88\
-\xd3\xd8\x89\x30\xf5\xca\x44\xe0\xfc\x4f\xff\xde\xbc\x91\xbf\x6c\
-\x5d\x6a\x94\x6d\xfb\x8d\x46\xdb\x81\x91\x73\xb6\xe2\xfb\x87\xa0\
-\x35\x46\x56\x75\xe3\x1c\x46\x9c\x10\x83\xb8\xeb\x4f\xa6\xb9\x4f\
-\x64\x39\xf7\xc5\x46\x87\xb9\xdf\x5c\xbe\xef\x7d\xd2\x3e\x0f\x23\
-\x2f\x0f\xa9\x74\xf1\x14\xb6\x49\x5c\x38\xf1\x6b\x1e\x23\x5a\x35\
-\x43\x06\xb1\xb2\x5c\x26\xca\x92\xf3\xd1\xea\x03\xf3\xeb\x7c\xb2\
-\x74\xe9\x82\x83\xc9\xd8\xf7\x28\x86\x40\x05\x04\x04\x04\xae\x72\
-\x5c\x55\x44\x08\x70\x32\x04\x9e\x5c\xb0\xf3\x48\xdf\xe9\x6b\x7f\
-\xda\x72\x24\x75\xfb\x89\x1c\xb7\x07\xfe\x6e\x45\xd1\xd6\xde\xd5\
-\xae\xf5\xca\xd1\xad\x9b\x83\x64\x5c\xc4\x70\x76\xb3\x2c\x3f\xbf\
-\x74\xff\x89\x09\xab\xf6\xbf\xf5\xd5\xda\xa3\x1b\x58\x42\x3a\xb9\
-\x6d\xb9\xb7\x4b\xe7\x27\xda\xd4\xac\x84\x6b\x0b\x54\x43\xc2\x27\
-\x1b\x8e\xce\x24\x33\x83\xbb\x61\xae\xef\xb1\xb6\x35\x2b\xee\xbe\
-\xbf\x6b\x17\xb8\x11\x58\xdc\x29\x5b\x8e\xaf\x9d\xb0\xea\xe0\xdb\
-\xcf\x2f\x4e\x38\x86\x3c\x90\x17\xc6\x36\x57\xde\xd6\xa2\xe9\xba\
-\x91\xed\xda\xf0\x61\xdd\x93\x59\xb9\xee\xcd\x47\x52\xb6\xf7\xfb\
-\x6e\xed\xec\x27\xfe\xda\x73\x04\xb2\x63\x21\x4d\xde\x50\xab\x80\
-\x80\x80\x80\xc0\xd5\x0c\x68\x2c\xfa\xe5\xd5\x07\x10\x62\x28\x32\
-\x39\xf4\x68\xcf\xde\xb5\xe2\x23\x1b\x6e\x3f\x7e\x7a\xfd\xa8\x95\
-\x49\xeb\xb6\x27\x1c\x54\xf1\x8d\x3f\xfe\x79\x23\x2c\x46\xc1\x3c\
-\xdc\xed\x0d\xca\x47\x4e\xbf\xb9\xd5\x70\x73\x98\x25\x6d\xe4\xbc\
-\x2d\x3f\x7f\xbb\xee\x28\xdb\xbc\x1f\x8c\x51\xcd\x2a\x5a\xa6\x0d\
-\x6e\x3b\xc8\xe0\xf2\xc5\xfd\xf7\xd7\x2d\x33\x5e\xdf\x7d\x2a\x1d\
-\xf3\x7f\xd8\xa0\x0f\x7f\x9e\x76\xb3\x7a\xb5\xa5\xa9\x9d\xcb\xb7\
-\x6b\x5e\xb3\x5c\x87\x43\x67\x33\xf7\xd6\x9a\xb0\x70\x01\x4b\x20\
-\x00\x85\xc9\x2c\x20\x20\x20\x20\x70\x75\xe2\xaa\xd3\x08\x03\x01\
-\x42\x81\x66\x05\xe8\x4e\x0c\x36\xc9\xeb\xc8\xc8\xcc\x76\xd7\x89\
-\x89\x68\xb9\xfd\xc9\x3e\x7d\xc7\x0d\x68\x69\x03\x51\x59\x4c\x32\
-\x86\x2b\x89\x88\xf2\x66\xf1\x9e\x69\x55\xaf\x86\x64\x34\xc8\xae\
-\x6c\x4f\xfc\x73\x2d\x6b\xb5\x83\x1b\xfc\xd9\xe6\x77\x32\xf8\x0d\
-\x8c\xed\x54\xaf\x93\x3b\xd7\x1b\xef\x31\x68\x52\x9f\x4e\x75\xd9\
-\x91\x6f\x5e\xe2\x32\x84\xa5\x34\x19\x09\x8e\xbb\xa1\xa1\x6d\xfb\
-\x13\xbd\xfa\xd5\x8d\x0b\x6b\x9d\x91\x9a\xed\xb6\xab\x1e\x07\x8b\
-\xac\x03\x61\x85\x16\x28\x20\x20\x20\x50\xf2\x70\x55\x13\x21\x80\
-\xd1\x48\x00\xd7\xd8\x6c\x01\x3b\xd5\x1e\x7b\x20\xaa\x4c\x8c\xe2\
-\xf4\xa9\xde\xe4\xbd\x7b\xaa\xbe\xd1\xa2\x72\xbf\xb1\xed\x6b\x87\
-\xe3\xe3\xbe\x18\xfd\xa4\xe0\x4c\x33\xac\x5c\xce\x56\xdd\xe3\xd3\
-\xd4\x5c\xaf\xcf\xdd\xa8\x6c\x54\xc3\xc9\x7d\x5b\x57\x64\x69\x21\
-\x15\x9d\x06\x27\xf5\x6d\x54\xb5\x71\xd9\xc8\x7a\x39\x5e\x9f\x0b\
-\x9f\x06\xae\x13\x6e\xa9\x06\x77\x84\xc3\x02\x1a\x4a\x53\x7d\xb2\
-\x63\xcd\x88\x37\x3a\xd6\xe8\x9f\x92\xb0\xaf\x6a\xae\x57\xf3\x46\
-\x95\x89\x52\xd2\x1c\xe5\x0f\x20\x1c\x08\x90\x87\x87\xac\xb8\x16\
-\x10\x10\x10\x10\x28\x39\xb8\xea\x89\x30\x10\xc4\x6f\x6c\x15\x68\
-\x93\x77\x7e\xde\xf5\xc6\xca\x03\x73\xe3\x22\xec\xd9\x0e\x9b\xdd\
-\x70\x2e\xdb\x55\xee\x9d\xbe\x4d\x6e\xba\xab\x69\xe5\x68\x9c\x03\
-\x8a\xe1\x49\x84\x3f\x9b\xe5\xcc\xb2\xc8\x92\x4c\xda\x9f\x9a\x99\
-\xe3\x34\x0d\x6b\x1c\xdf\xb1\x79\xf9\x18\x9c\x01\xca\xb6\x30\x34\
-\x8f\x8f\x95\x46\x34\xaa\xd6\x2e\x33\xc7\x8d\x93\x61\xb0\x25\xc3\
-\x78\x32\xd3\xc3\xb6\x3a\xf0\x21\xce\xbb\x9a\x54\x8e\xfe\xb0\x77\
-\x93\x81\xe7\xb2\x95\xb2\x76\xbb\x5d\x2a\x13\x6e\xc9\x7a\x73\xf9\
-\xa1\xb9\x8d\xde\xf9\x61\x27\x64\x01\x01\x22\xbc\x80\x80\x80\x80\
-\x40\xc9\x44\x89\x22\x42\x00\xc4\x63\x22\x96\x1a\x37\x7f\xf3\xe9\
-\xb1\xeb\xf6\xcf\xc9\xd1\x7c\xc7\x1d\xb2\xc9\x60\xf0\xf9\x62\x6b\
-\x97\x09\xaf\x8a\x30\x98\xdf\x83\x3d\x69\xe5\x89\x35\x26\xc9\x74\
-\xce\xab\x2a\xd8\x76\x88\x2f\x5a\x98\x41\x76\xf0\x03\xcc\x46\x23\
-\x91\xa4\x41\xff\x9c\x93\xc1\x6c\xb2\x4a\xa9\x9f\xee\x4a\x58\x03\
-\x3f\xbe\xb0\x86\xa5\xe9\x55\x63\x1d\x26\x49\xca\xf1\x1a\x8e\x3c\
-\xbf\xe4\xd8\x9c\xe7\x17\x6c\x3e\x0d\x19\x04\x09\x0a\x08\x08\x08\
-\x94\x7c\x94\x38\x22\x04\x48\x9b\x53\xf1\xc9\xa5\x77\xfe\xda\x97\
-\xdb\x66\xca\xca\xf9\xc7\x72\x73\x77\x60\xfb\x42\x96\xdb\xc7\x56\
-\x96\x42\x2b\xc4\x82\x99\x29\x7b\x13\x5d\x5f\x6e\x4f\x5a\x1d\x17\
-\x1e\x46\x9a\xa4\xc1\xbc\x3f\x25\xeb\xd8\xc6\x93\xa9\xd8\x5a\xc1\
-\xb0\xf1\x6c\xb2\x2f\x21\x2d\xe3\x98\x64\x90\xcc\x71\x91\x56\xc3\
-\x57\x5b\x4e\xad\x99\xb2\xee\x74\x2e\xe2\xfa\xf4\x51\xce\x2c\x8f\
-\x4f\x35\x38\x4c\xf2\xf1\xac\x9c\x2d\x6d\xbf\x5c\xfa\xc7\x9b\xab\
-\x77\x38\x91\x37\x64\x60\x01\x04\x04\x04\x04\x04\x4a\x34\x4a\x24\
-\x11\x02\x6e\x62\x22\xab\xc9\x28\x1d\xcd\x70\x1a\x1a\x4c\x5c\xb6\
-\x3a\xd3\x9b\xbb\x26\x2e\xcc\xc6\xbe\xf0\x4e\xaa\x1c\x5b\x35\x0a\
-\xb2\xbb\x67\xde\xda\x13\x7b\x92\xb2\xf6\x3b\xc2\xac\xf2\xac\xbd\
-\x67\x92\xe1\x8f\x03\xb2\x61\x70\x3d\x6b\x4f\x52\xaa\x23\xc2\x26\
-\xef\x4b\xca\x3c\x78\xf7\xaf\x5b\xd8\xd6\x07\x16\x17\x9e\x84\x32\
-\x36\xab\x2d\x2b\xd5\xbb\xa6\xfe\xa7\x2b\xd6\x1d\xc9\x70\x4a\xc8\
-\x13\x79\xeb\xde\x02\x02\x02\x02\x02\x25\x1c\x25\x96\x08\x01\x37\
-\xa9\x6d\x98\xdb\x03\x79\xb5\xfd\x62\xed\xa6\xa9\xdb\x8f\xed\x83\
-\xbb\x47\xd7\xd6\xc8\x0f\x96\xe1\x8d\x55\x09\xdb\x0c\x16\x13\xe6\
-\xfe\xb2\x99\x43\xde\x3e\x41\xa6\xf2\x11\x1d\x66\x1b\xbc\x9e\x9c\
-\xd7\x96\xed\x67\xa7\xd1\xf0\x38\x3c\x8d\x6f\xb6\x1f\xdf\xd5\xf6\
-\xf3\x15\x9b\x90\x07\xf2\x42\x9e\x2c\x80\x80\x80\x80\x80\xc0\x35\
-\x81\x12\x4d\x84\x00\x5f\x55\x7a\xe0\x74\xb6\xb6\xfb\x6c\x26\xfb\
-\x92\x05\x07\xfc\x8c\x92\x51\x9a\xbe\xf3\x78\xda\xc1\x13\x29\x87\
-\x48\x9b\xd3\x7d\xfe\x86\x84\xef\x07\x46\x94\x3b\x3c\x63\xcf\x49\
-\xa6\x2d\x06\xaf\xfc\xdc\x9d\x9c\xe9\xda\x9f\x95\xcd\xf2\x10\xab\
-\x42\x05\x04\x04\x04\xae\x3d\x94\x78\x22\xe4\xc0\x0a\x4f\xfd\x32\
-\x1f\x64\xbd\x84\x0b\x0e\x9d\x3b\x1a\x1f\x66\xc6\x97\x27\x02\x77\
-\x4f\x18\xe2\xc3\x4c\x96\x3f\x12\xcf\x1d\xc6\x35\x36\x21\x32\xc7\
-\x20\x14\x96\xb6\x80\x80\x80\x80\x40\xc9\xc7\x35\x43\x84\x85\x81\
-\x6b\x71\xfb\x53\x4e\x9e\xd9\x93\x94\xc6\xbe\x06\x8f\x31\x4f\x3e\
-\xc9\x77\x30\xd5\x93\xf5\xe7\x8a\x9d\xa7\x70\xad\x90\xd6\xc7\x1c\
-\x05\x04\x04\x04\x04\x4a\x0d\xae\xea\x23\xd6\x04\x04\x04\x04\x04\
-\x04\xfe\x69\x5c\xf3\x1a\xa1\x80\x80\x80\x80\x80\x40\x51\x10\x44\
-\x28\x20\x20\x20\x20\x50\xaa\x21\x88\x50\x40\x40\x40\x40\xa0\x54\
-\x43\x10\xa1\x80\x80\x80\x80\x40\xa9\x86\x20\x42\x01\x01\x01\x01\
-\x81\x52\x0d\x41\x84\x02\x02\x02\x02\x02\xa5\x1a\x82\x08\x05\x04\
-\x04\x04\x04\x4a\x35\x04\x11\x0a\x08\x08\x08\x08\x94\x6a\x08\x22\
-\x14\x10\x10\x10\x10\x28\xd5\x10\x44\x28\x20\x20\x20\x20\x50\xaa\
-\x21\x88\x50\x40\x40\x40\x40\xa0\x54\x43\x10\xa1\x80\x80\x80\x80\
-\x40\xa9\x86\x20\x42\x01\x01\x01\x01\x81\x52\x0d\x41\x84\x02\x02\
-\x02\x02\x02\xa5\x1a\x82\x08\x05\x04\x04\x04\x04\x4a\x35\x04\x11\
-\x0a\x08\x08\x08\x08\x94\x6a\x08\x22\x14\x10\x10\x10\x10\x28\xc5\
-\x30\x18\xfe\x1f\xfe\x04\x3c\x9f\x01\x46\x76\xae\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0d\x60\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\x4d\x00\x00\x0e\x4d\x01\x46\xd5\
-\x68\x09\x00\x00\x0c\xf5\x49\x44\x41\x54\x78\x5e\xed\x9d\x6b\xa8\
-\xa5\x65\x19\x86\xd7\xa8\x99\xa6\x8e\x14\xa5\x76\xa0\x90\x26\x32\
-\x8c\xa0\x31\x83\x28\x22\xfd\xa3\x14\x41\x51\x64\x89\x15\x41\xf4\
-\xa7\xd2\x4e\x96\x65\x81\x93\x49\x16\x98\x04\xfd\xe9\x47\x10\x91\
-\x9d\x29\xfa\xa3\x25\x43\x0e\xa3\x64\x47\xc1\xca\xc4\x1c\x09\xb3\
-\xd2\x2c\x6b\x6c\x14\x0f\x79\xe8\x7e\xf6\xfa\xbe\x99\xb5\x67\x3f\
-\xef\x9e\x75\xf8\x0e\xcf\xfb\xbe\xd7\x05\x17\x6b\xed\xe5\x3e\x2c\
-\xf7\x7c\xf7\xb5\xf7\x5a\x7b\xaf\xb5\x27\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x0c\x5b\x9a\x53\xa8\x87\
-\x23\xe5\xb1\x33\x1a\x0f\x36\x3e\x20\x1f\xb6\x0b\xa0\x0e\x08\x40\
-\xb9\x3c\x55\x9e\x2e\x5f\x2d\x5f\x22\x5f\x28\xb7\xc9\x93\xe4\x66\
-\xdc\x2b\xef\x90\x7b\xe4\xad\xf2\x06\xf9\x6b\x49\x18\x00\x82\x73\
-\xb2\xfc\xb8\xdc\x2d\x1f\x92\x4f\x76\xa4\x8d\xff\x7a\x69\xef\xdb\
-\x3e\x06\x00\x04\xe1\x38\x79\xbe\xfc\xa5\xf4\xc6\xdb\x87\xf6\xb1\
-\x3e\x28\xdb\x9b\x10\x00\x30\x30\xcf\x93\x5f\x94\xff\x91\xde\x48\
-\x87\xd0\x3e\xf6\xe5\xf2\xb9\x12\x00\x06\x60\xab\xb4\xe1\x3f\x22\
-\xbd\x51\x8e\xa1\xdd\x44\xb0\x10\xd8\x75\x03\x80\x1e\xb0\x3b\x6c\
-\xdf\x23\xef\x96\xde\x08\x23\x78\x8f\x7c\xaf\xe4\xce\x65\x80\x0e\
-\x39\x51\x5e\x2d\xbd\xd1\x45\xf4\x1a\x69\xd7\x19\x00\x56\xe4\x6c\
-\x69\x5f\x59\xbd\xa1\x45\xd6\xae\xf3\x59\x12\x00\x96\xe4\x23\xf2\
-\x09\xe9\x0d\x2c\x07\x1f\x97\x1f\x96\x10\x14\x6e\xab\xc5\xc4\xfe\
-\x5d\xec\x8e\xbe\x8f\xad\xbd\x94\x3f\x57\xc8\x0b\xa5\x45\x21\x22\
-\xf6\xf9\x7e\xa5\x3c\x43\xda\x4f\x34\x9e\x23\x9f\x26\xed\xbb\x98\
-\xbf\xcb\x5b\xa4\xdd\x04\xdb\x2b\x01\x7a\xe5\x70\xf9\x75\x79\xf0\
-\x57\xd3\xdc\xfd\xa6\x3c\x42\x46\xc2\xee\xa7\xf8\x92\xfc\x9b\xf4\
-\xae\xf3\xac\x8f\xca\x6b\xe5\xeb\x25\x40\x2f\xd8\xf8\x6d\x28\xde\
-\x01\x58\x82\xdf\x91\x11\x22\x70\x94\xdc\x21\xf7\x49\xef\x7a\x1e\
-\xca\x5d\xf2\x34\x09\xd0\x19\xa5\x8f\xbf\x75\xec\x08\xd8\x63\x21\
-\x6e\x94\xde\x75\x5b\x44\xfb\xdd\x87\x77\x4b\x80\x95\xa9\x65\xfc\
-\xad\x63\x45\xe0\x14\x79\x97\xf4\xae\xd3\xb2\x5e\x2a\x01\x96\xa6\
-\xb6\xf1\xb7\x0e\x1d\x81\x67\xc8\xdb\xa5\x77\x5d\x56\xf5\x7d\x12\
-\x60\x61\x6a\x1d\x7f\xeb\x50\x11\x38\x4c\xee\x94\xde\x75\xe8\x42\
-\xbb\x83\xf0\x35\x12\x60\x6e\x6a\x1f\x7f\xeb\x10\x11\x38\x4f\x7a\
-\x1f\xbb\x4b\x6f\x96\x16\x1a\x80\x43\xc2\xf8\xd7\xdb\x67\x04\xec\
-\x89\x51\xfe\x2c\xbd\x8f\xdb\xb5\xef\x92\x00\x9b\xc2\xf8\x7d\xfb\
-\x8a\x80\x8d\xd2\xfb\x78\x7d\xf8\x47\x09\x90\xc4\xc6\x7f\x95\xf4\
-\x0e\x1e\xec\x27\x02\x3f\x92\xde\xc7\xea\xcb\x17\x4b\x80\x0d\x30\
-\xfe\xf9\xec\x32\x02\x47\x4b\x7b\xb2\x53\xef\xe3\xf4\xa5\x3d\x6d\
-\x1a\xc0\x3a\x18\xff\x62\x76\x15\x81\xed\xd2\x7b\xff\x7d\xfa\x5d\
-\x99\x0d\xdc\x6b\xd9\x3f\x36\xfe\x6f\xc8\x73\xd7\x5e\x82\x79\x38\
-\x47\xda\xfd\x24\xab\x46\xe0\xd9\xcd\xe9\x90\xd8\x03\x89\xb2\x81\
-\x00\xf4\x0b\xe3\x5f\x9e\x2e\x22\x30\xc6\x18\xc7\x88\xce\xd2\x10\
-\x80\xfe\x60\xfc\xab\xb3\x6a\x04\x8e\x69\x4e\x87\x24\xab\x67\x4a\
-\x26\x00\xfd\xc0\xf8\xbb\xa3\xab\x9b\x03\xe0\x40\x00\xba\x87\xf1\
-\x77\x0f\x11\xe8\x09\x02\xd0\x2d\x8c\xbf\x3f\x88\x40\x0f\x10\x80\
-\xee\xc8\x71\xfc\xf6\xe7\xc3\xcc\x5c\x20\x02\x1d\x43\x00\xba\x21\
-\x97\xf1\xdb\xcf\xa9\x7f\x20\xdf\x2c\xed\xe1\xb1\xf6\xbc\x77\xa6\
-\x9d\x7f\x93\xfc\x9e\xb4\x27\x21\x8d\x0c\x11\x80\x50\xd8\xf8\x73\
-\xf8\x25\x1f\xfb\x6b\xbf\xf6\x8b\x31\x87\xe2\xe5\xb2\xaf\xc7\xcd\
-\x77\xe9\x3c\xbf\x2c\xf4\x21\xe9\xbd\x6d\x9f\xda\x13\x89\x42\x25\
-\xe4\x32\xfe\x5f\x48\xfb\x2a\x3f\x2f\x4f\x97\xf6\x36\xde\xfb\x8a\
-\xe4\xa1\x22\x40\x00\xa0\x37\x72\x1a\xff\xf1\x72\x51\xec\x6d\x72\
-\x8f\x00\x01\x80\x5e\x28\x7d\xfc\x2d\xb9\x47\x80\x00\x40\xe7\xd4\
-\x32\xfe\x96\x9c\x23\x40\x00\xa0\x53\x6a\x1b\x7f\x4b\xae\x11\x20\
-\x00\xd0\x19\xb5\x8e\xbf\x25\xc7\x08\x10\x00\xe8\x84\xda\xc7\xdf\
-\x92\x5b\x04\x08\x00\xac\x8c\x8d\xff\x5b\xd2\xfb\xc7\x8e\x64\xdf\
-\xe3\x6f\xc9\x29\x02\xf6\xc7\x55\xbd\xff\xd6\xa7\x04\xa0\x20\x18\
-\xbf\x4f\x2e\x11\xf8\x97\x73\x59\xdf\x12\x80\x42\x60\xfc\x9b\x93\
-\x4b\x04\x86\x96\x00\x14\x00\xe3\x9f\x0f\x22\xb0\x51\x02\x90\x39\
-\x8c\x7f\x31\x88\xc0\x7a\x09\x40\xc6\x30\xfe\xe5\x20\x02\x07\x24\
-\x00\x99\xc2\xf8\x57\x83\x08\x4c\x25\x00\x19\xc2\xf8\xbb\x81\x08\
-\x10\x80\xec\x60\xfc\xdd\x52\x7b\x04\x08\x40\x46\x30\xfe\x7e\xa8\
-\x39\x02\x04\x20\x13\x18\x7f\xbf\xd4\x1a\x01\x02\x90\x01\x8c\x7f\
-\x18\x6a\x8c\x00\x01\x08\x0e\xe3\x1f\x96\xda\x22\x40\x00\x02\xc3\
-\xf8\xc7\xa1\xa6\x08\x10\x80\xa0\x30\xfe\x71\xa9\x25\x02\x04\x20\
-\x20\x8c\x3f\x06\x35\x44\x80\x00\x04\x83\xf1\xc7\xa2\xf4\x08\x10\
-\x80\x40\x30\xfe\x98\x94\x1c\x01\x02\x10\x04\xc6\x1f\x9b\x52\x23\
-\x40\x00\x02\xc0\xf8\xd3\x9c\x28\x3f\x2b\x6f\x92\x7b\x1b\xed\xfc\
-\x0e\x79\x82\x1c\x92\x12\x23\x40\x00\x46\x26\x97\xf1\xdf\x28\x87\
-\x1e\xff\x3b\xe5\x3e\xe9\x5d\x1f\xd3\xfe\x9b\xbd\xce\x90\x94\x16\
-\x01\x02\x30\x22\x8c\x3f\xcd\x45\xd2\xbb\x2e\x9e\xf6\xba\x43\x52\
-\x52\x04\x08\xc0\x48\x30\xfe\x34\x8b\x8c\xbf\x95\x08\x2c\x27\x01\
-\x18\x01\xc6\x9f\x66\x99\xf1\xb7\x12\x81\xc5\x25\x00\x03\xc3\xf8\
-\xd3\xac\x32\xfe\x56\x22\xb0\x98\x04\x60\x40\x18\x7f\x9a\x2e\xc6\
-\xdf\x4a\x04\xe6\x97\x00\x0c\x04\xe3\x4f\xd3\xe5\xf8\x5b\x89\xc0\
-\x7c\x12\x80\x01\x60\xfc\x69\xfa\x18\x7f\x2b\x11\x38\xb4\x04\xa0\
-\x67\x18\x7f\x9a\x3e\xc7\xdf\x4a\x04\x36\x97\x00\xf4\x88\xfd\xc5\
-\x57\xc6\xef\x33\xc4\xf8\x5b\x89\x40\x5a\x02\xd0\x13\x8c\x3f\xcd\
-\x90\xe3\x6f\x25\x02\xbe\xf7\x49\x3b\x56\xa1\x43\x18\x7f\x9a\x31\
-\xc6\xdf\x4a\x04\x7c\xed\x4f\x93\x13\x81\x8e\x60\xfc\x69\xc6\x1c\
-\x7f\x2b\x11\xf0\x25\x02\x1d\xc0\xf8\xd3\x44\x18\x7f\x2b\x11\xf0\
-\x25\x02\x2b\xc0\xf8\xd3\x44\x1a\x7f\x2b\x11\xf0\x25\x02\x4b\x60\
-\x9f\xb0\x6f\x4b\xef\x13\x1a\x49\xc6\xbf\x5e\x22\xe0\x4b\x04\x16\
-\x80\xf1\xa7\x89\x3c\xfe\x56\x22\xe0\x4b\x04\xe6\x80\xf1\xa7\xc9\
-\x61\xfc\xad\x44\xc0\x97\x08\x6c\x42\x4e\xe3\xdf\x2a\x87\xe4\x93\
-\xd2\xbb\x2e\x91\xb5\xeb\x3c\x24\x44\x20\x63\x18\x7f\x9a\x1c\xc7\
-\xdf\x4a\x04\x7c\x89\xc0\x0c\x8c\x3f\x4d\xce\xe3\x6f\x25\x02\xbe\
-\x44\x40\x30\xfe\x34\x25\x8c\xbf\x95\x08\xf8\x56\x1d\x01\xc6\x9f\
-\xa6\xa4\xf1\xb7\x12\x01\xdf\x2a\x23\xc0\xf8\xd3\x94\x38\xfe\x56\
-\x22\xe0\x5b\x55\x04\x18\x7f\x9a\x92\xc7\xdf\x4a\x04\x7c\xab\x88\
-\x00\xe3\x4f\x53\xc3\xf8\x5b\x89\x80\x6f\xd1\x11\x60\xfc\x69\x6a\
-\x1a\x7f\x2b\x11\xf0\x2d\x32\x02\x8c\x3f\x4d\x8d\xe3\x6f\x25\x02\
-\xbe\x45\x45\x80\xf1\xa7\xa9\x79\xfc\xad\x44\xc0\xb7\x88\x08\x30\
-\xfe\x34\x8c\xff\x80\x44\xc0\x37\xeb\x08\x30\xfe\x34\x8c\x7f\xa3\
-\x44\xc0\x37\xcb\x08\x30\xfe\x34\x8c\x3f\x2d\x11\xf0\xcd\x2a\x02\
-\x8c\x3f\x0d\xe3\x3f\xb4\x44\xc0\x37\x8b\x08\x30\xfe\x34\x8c\x7f\
-\x7e\x89\x80\x6f\xe8\x08\x30\xfe\x34\x8c\x7f\x71\x89\x80\x6f\xc8\
-\x08\x30\xfe\x34\x8c\x7f\x79\x89\x80\x6f\xa8\x08\xe4\x32\xfe\x9f\
-\x4b\xc6\x9f\x9f\x44\xc0\x37\x44\x04\x18\x7f\x1a\xc6\xdf\x9d\x44\
-\xc0\x77\xd4\x08\x30\xfe\x34\x8c\xbf\x7b\x89\x80\xef\x28\x11\x60\
-\xfc\x69\x18\x7f\x7f\x12\x01\xdf\x41\x23\xc0\xf8\xd3\x7c\x4a\x7a\
-\xd7\x05\xbb\xd3\x3e\xc7\x43\x42\x04\x66\x60\xfc\x69\x18\xff\x70\
-\x12\x01\xdf\x5e\x23\xc0\xf8\xd3\x30\xfe\xe1\x25\x02\xbe\xbd\x44\
-\x80\xf1\xa7\x61\xfc\xe3\x49\x04\x7c\x3b\x8d\x00\xe3\x4f\xc3\xf8\
-\xc7\x97\x08\xf8\x76\x12\x01\x7b\x07\xf6\x8e\xbc\x0f\x10\x49\xc6\
-\x5f\xb7\x44\xc0\x77\xa5\x08\x30\xfe\x34\x8c\x3f\x9e\x44\xc0\x77\
-\xa9\x08\x30\xfe\x34\x8c\x3f\xae\x44\xc0\x77\xa1\x08\x30\xfe\x34\
-\x8c\x3f\xbe\x44\xc0\x77\xae\x08\x6c\x91\x57\x49\xef\x1d\x44\x92\
-\xf1\xe3\x66\x12\x01\x5f\xdb\xb6\x6d\x3c\xc9\x67\xa4\xf7\x86\x91\
-\x64\xfc\x38\x8f\x44\xc0\xd7\x36\xee\xf2\x46\xf9\xb8\xf4\xde\x28\
-\x8a\x8c\x1f\x17\x91\x08\x6c\xd4\x36\x6e\x5b\x5f\xc7\xd1\xf2\x2e\
-\xe9\xbd\x41\x14\x19\x3f\x2e\x23\x11\xd8\xa8\x6d\xdd\x36\xbf\x9f\
-\x8f\x4a\xef\x15\xa3\xc8\xf8\x71\x15\x89\xc0\x46\x6d\xf3\x6b\x3c\
-\x45\xfe\x53\x7a\xaf\x14\x41\xc6\x8f\x5d\x48\x04\xd6\x6b\x9b\xb7\
-\xed\x4f\xce\x68\x2e\x88\x28\xe3\xc7\x2e\x25\x02\xeb\xb5\xed\x4f\
-\xae\x98\xb9\x20\x92\x8c\x1f\xfb\x90\x08\x1c\xd0\xb6\x3f\xb9\x61\
-\xe6\x82\x28\x32\x7e\xec\x53\x22\x30\xd5\xb6\x3f\xb9\x63\xe6\x82\
-\x08\x32\x7e\x1c\x42\x22\x30\xdd\xfe\xe4\xc1\x99\x0b\xc6\x96\xf1\
-\xe3\x90\xd6\x1e\x01\xdb\xfe\xe4\xfe\x99\x0b\xc6\x94\xf1\xe3\x18\
-\xd6\x1c\x01\xdb\xfe\xe4\xb6\x99\x0b\xc6\x92\xf1\xe3\x98\xd6\x1a\
-\x01\xdb\xfe\xe4\xba\x99\x0b\xc6\x90\xf1\x63\x04\x6b\x8c\x80\x6d\
-\x7f\x72\xc9\xcc\x05\x43\x3b\xc6\xf8\x2f\x96\xde\x75\x41\xb4\x63\
-\x63\x48\xc6\x8e\x80\x6d\x7f\xf2\x8a\x99\x0b\x86\x94\xf1\x63\x44\
-\x6b\x8a\x80\x6d\x7f\xed\xf1\xc1\x7b\x9a\x0b\x86\x92\xf1\x63\x64\
-\x6b\x88\x80\x6d\x7e\xff\x73\x03\x9c\x27\xbd\x57\xea\x43\xc6\x8f\
-\x39\x58\x7a\x04\x6c\xf3\xfb\x39\x4c\xfe\x5e\x7a\xaf\xd8\xa5\x8c\
-\x1f\x73\xb2\xd4\x08\xd8\xd6\x6d\xf3\xeb\xd8\x2e\xfb\xfc\xa5\x20\
-\xc6\x8f\x39\x5a\x5a\x04\x6c\xe3\xb6\x75\x97\xb7\x4b\xef\x8d\x56\
-\x95\xf1\x63\xce\x96\x14\x01\xdb\xf8\xa6\x5c\x20\x1f\x93\xde\x1b\
-\x2f\xe3\x4f\x24\xe3\xc7\xdc\x1d\x23\x02\xd7\x4a\xef\xba\x2c\xa3\
-\x6d\xda\xb6\x3d\x17\x67\xcb\xbd\xd2\x7b\x47\x8b\x68\x0f\x37\x3c\
-\x5c\x0e\x09\xe3\xc7\xbe\x1c\x3a\x02\xf6\x34\xde\x57\x4a\xef\xba\
-\x2c\xa2\x6d\xd9\x36\xbd\x10\x27\x4b\x7b\x1a\xe1\x65\x9e\x28\xf4\
-\x77\xf2\x0d\x72\x68\x18\x3f\xf6\xed\xd0\x11\x30\x6c\x4b\x37\x4b\
-\xef\xfa\x6c\xa6\x6d\xd7\x36\x6c\x5b\x5e\x9a\x97\xc9\xaf\xc9\x7b\
-\xa4\xf7\x41\x5a\x1f\x91\x3f\x95\xe7\xca\x0d\xf7\x30\x0e\x00\xe3\
-\xc7\xa1\x1c\x23\x02\xb6\xa9\x77\xc8\x6b\xe4\x43\xd2\xbb\x5e\xad\
-\x77\x4b\xdb\xac\x6d\x77\x53\x36\xfd\x23\x01\x07\x61\x57\xe0\x74\
-\xf9\x52\x79\x92\x3c\x41\xee\x93\x16\x86\x3b\xe5\xae\xe6\xe5\x31\
-\xb0\x7f\x90\xcf\x4d\xcf\x02\x0c\xc2\xa7\xe5\x65\xd3\xb3\x83\x73\
-\x8c\x7c\xad\x7c\x81\xb4\x2d\x1e\x27\xef\x95\xb6\xc5\x3f\xc8\x9b\
-\xa4\x85\xa0\x0a\xf8\xca\x8f\x63\x39\xc6\x77\x02\x9d\x32\xf4\x1d\
-\x74\x5d\xc3\x57\x7e\x18\x93\x33\xa5\xdd\xbb\x7e\xfd\xda\x4b\x19\
-\x92\x73\x00\x18\x3f\x44\x20\xeb\x08\xe4\x1a\x00\xc6\x0f\x91\xc8\
-\x36\x02\x39\x06\x80\xf1\x43\x44\xb2\x8c\x40\x6e\x01\x60\xfc\x10\
-\x99\xec\x22\x90\x53\x00\x18\x3f\xe4\x40\x56\x11\xc8\x25\x00\x8c\
-\x1f\x72\x22\x9b\x08\xe4\x10\x00\xc6\x0f\x39\x92\x45\x04\xa2\x07\
-\x80\xf1\x43\xce\x84\x8f\x40\xe4\x00\xd8\xaf\x5a\x32\x7e\xc8\x1d\
-\x8b\x80\x3d\x28\x67\xf7\xda\x4b\xc1\x88\x1a\x80\x0b\xe5\xe7\xa7\
-\x67\x01\xb2\xc7\x22\x60\xcf\xc4\x63\x4f\x8c\x13\x8a\x45\x1e\x0c\
-\x34\x14\x67\xc9\xab\xe5\x18\x8f\x28\x04\xe8\x8b\x27\xa4\x1d\xdb\
-\x3b\xd7\x5e\x0a\x42\xb4\x00\xd8\xf5\xb1\x27\x2c\x3c\x75\xed\x25\
-\x80\xb2\xb0\x47\xea\xd9\x43\x74\xed\x81\x44\x21\x88\xf6\x55\xf6\
-\x34\xc9\xf8\xa1\x54\xec\xa1\xf4\x76\x8c\x87\x21\x5a\x00\x5e\xd5\
-\x9c\x02\x94\x4a\xa8\x63\x3c\x5a\x00\x4e\x6c\x4e\x01\x4a\x25\xd4\
-\x31\x1e\x2d\x00\xf6\x24\x88\x00\x25\x13\xea\x18\xe7\x9e\x76\x80\
-\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\x54\x0c\x01\x00\
-\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\x40\xc5\x10\x00\
-\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\x54\x0c\x01\
-\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\x40\xc5\x10\
-\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\x54\x0c\
-\x01\x00\xa8\x98\x68\x7f\x19\xe8\x72\xf9\x89\xe9\x59\x68\xf8\xad\
-\x7c\x78\x7a\x36\x3b\x8e\x96\xdb\xa7\x67\xa1\xe1\x0b\xf2\xa2\xe9\
-\x59\x38\x18\x0b\x80\xfd\xd9\x24\x3c\xe0\x36\x99\x2b\xa7\x48\xef\
-\xff\xa9\x66\xed\x18\x0f\x03\x37\x01\x00\x2a\x86\x00\x00\x54\x0c\
-\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\x40\xc5\
-\x10\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\x54\
-\x0c\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\x40\
-\xc5\x10\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\
-\x54\x0c\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\
-\x40\xc5\x10\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\
-\x00\x54\x0c\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\
-\x00\x40\xc5\x10\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\
-\x00\x00\x54\x0c\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\
-\xa2\x05\xe0\xc9\xe6\x14\xa0\x54\x42\x1d\xe3\xd1\x02\xf0\x70\x73\
-\x0a\x50\x2a\x0f\x35\xa7\x21\x88\x16\x80\x07\x9a\x53\x80\x52\xd9\
-\xd7\x9c\x86\x20\x5a\x00\xf6\x36\xa7\x00\xa5\xf2\xef\xe6\x34\x04\
-\xd1\x02\x70\x7b\x73\x0a\x50\x2a\xa1\x8e\xf1\x68\x01\xb8\xad\x39\
-\x05\x28\x95\x50\xc7\x78\xb4\x00\xfc\x43\xfe\x75\x7a\x16\xa0\x38\
-\xee\x94\xf7\x4d\xcf\xc6\x20\x5a\x00\x8c\x9f\x35\xa7\x00\xa5\x71\
-\x5d\x73\x1a\x86\x88\x01\xd8\xd9\x9c\x02\x94\x46\xb8\x2f\x6e\x11\
-\x03\xf0\x63\x19\xea\x67\xa5\x00\x1d\x60\xc7\xb4\x1d\xdb\xa1\x88\
-\x18\x80\xff\xca\x70\x9f\x28\x80\x15\xb1\x63\xda\x8e\xed\x50\x44\
-\x0c\x80\x71\xa5\xe4\xd7\x82\xa1\x14\xec\x58\xb6\x63\x3a\x1c\x51\
-\x03\xf0\x2b\xf9\xfd\xe9\x59\x80\xec\xb1\x63\xd9\x8e\xe9\x70\x44\
-\x0d\x80\x71\xb1\xfc\xdf\xf4\x2c\x40\xb6\xd8\x31\x6c\xc7\x72\x48\
-\x22\x07\x60\x8f\xfc\xea\xf4\x2c\x40\xb6\xd8\x31\x6c\xc7\x32\x2c\
-\xc1\x09\xf2\x5e\x69\xb7\xa1\x6a\x75\x9b\xcc\x95\x53\xa4\xf7\xff\
-\x54\x8b\x76\xec\xda\x31\x1c\x96\xc8\xdf\x01\x18\xf6\x09\x7c\xab\
-\xe4\xa6\x00\xe4\xc6\xa3\xf2\x2d\xd2\x8e\xe1\xb0\x44\x0f\x80\xb1\
-\x5b\x7e\x60\x7a\x16\x20\x1b\xde\x2f\xaf\x9f\x9e\x85\x2e\xf8\x8a\
-\xf4\xbe\xcd\x2a\x5d\x6e\x02\xe4\xe7\x97\x25\x74\xcc\x11\xf2\x87\
-\xd2\xfb\x84\x97\x2c\x01\xc8\x4b\xfb\x91\x9f\x1d\xab\x59\x90\xc3\
-\x4d\x80\x96\xc7\xa4\xdd\x1f\x70\x99\xb4\x4f\x34\x40\x24\xec\x98\
-\xbc\x54\xbe\x4d\xda\xb1\x0a\x3d\x72\x8e\x7c\x50\xce\x96\xb7\x54\
-\xf9\x0e\x20\xbe\x76\x2c\xda\xf0\x61\x40\xb6\xcb\x3f\x49\xef\x1f\
-\xa4\x24\x09\x40\x6c\xed\x18\xb4\x63\x31\x4b\x72\xba\x09\x70\x30\
-\x37\xc9\x53\xa5\xfd\x84\x20\xf4\x8f\x5a\xa0\x48\xec\xc9\x6b\xec\
-\xd8\xb3\x63\xd0\x8e\x45\x18\x91\xe3\xe4\x0e\x69\xcf\x2a\xec\x55\
-\x3a\x67\xf9\x0e\x20\x96\xf6\xac\xbe\x97\xc8\x63\x25\x04\xe3\x59\
-\xf2\x02\xf9\x1b\xe9\xfd\xe3\xe5\x28\x01\x88\xa1\x1d\x53\xe7\xcb\
-\x67\xca\x62\xd8\xd2\x9c\x96\xc8\xf3\xe5\x99\xf2\x75\xd2\xbe\x4d\
-\x7b\x91\x3c\x5e\xe6\x86\x5d\xef\x5c\x7f\x97\xdc\x02\x70\xeb\xf4\
-\x6c\x56\xdc\x2f\xed\xd9\x7b\x6f\x91\xbb\xa4\x3d\x93\xcf\x5f\x64\
-\x71\x94\x1c\x00\x0f\x0b\xc0\x56\x69\x37\x19\x8e\xb4\x0b\x32\xc0\
-\x06\xf4\xc8\xf4\x6c\x76\x1c\x25\x2d\x02\x39\x60\xbf\xba\x6b\xdf\
-\xde\xdb\x93\x76\x58\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x32\x62\x32\xf9\x3f\x24\xc8\x97\x4a\x74\
-\xe8\xd7\x66\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x1a\x21\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x13\x00\x00\x00\x28\x08\x06\x00\x00\x00\xdd\x63\x1e\x62\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x19\xb6\x49\x44\x41\x54\x78\x5e\xed\x9d\x0b\x94\
-\x55\xd5\x79\xc7\xef\x9d\x19\x04\xb1\x80\x46\xd3\x26\x16\xeb\x23\
-\x56\xd3\x24\x0a\x44\x4d\xb5\xa9\x98\xa8\x35\x51\xa3\x29\xb1\xc6\
-\x1a\x4c\xf3\x10\x64\x44\x1b\x15\xa1\x09\x71\x14\x9b\x6a\x5c\x8a\
-\x8a\xc3\x7b\x06\x75\x00\x5b\x7c\x54\x89\x69\x4a\x0d\x5a\x34\x84\
-\x28\x3a\x62\x02\x83\x29\x82\x55\x5e\xc6\x1a\x1d\x84\xc1\x61\x66\
-\x64\x5e\xf9\xff\x0e\xe7\xbb\x6b\xdf\x33\xfb\x9e\x7b\x2f\x33\x30\
-\xc3\xea\xf9\xaf\xf5\x5f\xe7\x9e\xfd\xfc\xf6\xeb\xdb\xdf\x7e\x9c\
-\x99\x74\x67\x67\x67\xaa\x18\xa4\xd3\xe9\xf0\x57\xdf\x47\xb1\x65\
-\x4b\x90\x20\xc1\xde\xa3\x24\x7c\x26\x48\x90\x20\x41\xb7\xd0\xeb\
-\xca\x64\xec\xd8\xb1\x07\x8e\xa9\x93\x20\x41\x82\x9c\xe8\x55\x65\
-\x32\x6e\xdc\xb8\x74\x75\x75\x75\x03\xcf\xd0\x29\x41\x82\x04\x07\
-\x28\x7a\x4d\x99\xc8\x22\x49\xcd\x9a\x35\x6b\x6b\x6b\x6b\xeb\x20\
-\x9e\xbc\x27\x48\x90\xe0\xc0\x45\xaf\x28\x93\x31\x63\xc6\xa4\xee\
-\xba\xeb\xae\x5f\x74\x74\x74\xfc\x29\xef\x3c\xf5\xfe\x02\xee\x09\
-\x12\x24\x38\x30\xd1\x2b\xca\xe4\xfe\xfb\xef\x4f\xdd\x7b\xef\xbd\
-\xe7\xea\x67\x3b\xef\x9d\x9d\x9d\xed\xd3\xa6\x4d\xfb\x02\xee\x09\
-\x12\x24\x38\x30\xd1\xab\x47\xc3\x4b\x97\x2e\x3d\x7c\xe4\xc8\x91\
-\xf5\x2b\x56\xac\xf8\xd8\x79\xe7\x9d\xf7\xfb\xd0\xb9\xc7\x90\x1c\
-\x0d\x1f\xf8\x50\x7f\xfb\x33\x3d\x3e\x2d\xbe\xa4\xf6\x7c\x3f\x70\
-\xec\xe3\x90\xcc\x0c\x92\x13\xc5\x63\xc4\x5f\x49\xee\x46\xdc\xf7\
-\x16\x4a\x6e\x80\x1e\x7f\x2d\x32\x46\x5e\x55\x7a\x7d\xb3\x63\x23\
-\x57\x31\xec\x0e\x16\x2e\x5c\x78\x68\x73\x73\x73\xfb\x5b\x6f\xbd\
-\x75\x4a\xe8\x94\x85\x45\x8b\x16\x1d\x2b\xff\xb6\xda\xda\x5a\x3a\
-\x50\xb7\xe1\x93\x3f\x8e\x82\x29\xd7\xe0\x99\xb0\x77\x49\x3b\x88\
-\xcf\x89\x1f\x8a\x98\xad\x25\xbe\x70\xbd\x49\x21\xab\xaf\x20\xa3\
-\x78\xa4\xf8\x1b\xf1\x03\xf1\x7b\xae\xff\xde\x50\xf8\x07\x71\xa7\
-\xf8\xba\x78\xac\xd8\xe7\xea\x01\xee\xb7\x65\xce\x98\x31\x63\xd2\
-\x97\x5f\x7e\xf9\xb6\xd2\xd2\xd2\x92\x23\x8e\x38\xa2\x76\xc9\x92\
-\x25\x9f\x0a\xbd\x02\x3c\xf2\xc8\x23\x43\x2f\xb9\xe4\x92\xff\x95\
-\x7f\xe9\xb0\x61\xc3\x36\xf6\xd2\xfe\xc9\x51\x9a\x05\xe6\xe8\x39\
-\x59\xcf\xb2\x3d\x4e\x09\x7a\x11\xfd\x44\x66\x78\x9e\x7f\x2e\x96\
-\x8a\x7d\x06\xea\x23\xc8\x34\x5f\xcf\x9b\xc5\x83\xf7\xb8\x06\x0a\
-\x70\xb0\xf8\x27\xe2\x41\xe2\x71\xf2\xdb\x6b\x73\x3e\x8c\x4b\x1d\
-\x60\x9d\x7c\x54\x3c\x54\xec\x93\xe8\x95\x3d\x93\x92\x92\x92\xf4\
-\x99\x67\x9e\x39\x05\x05\xc3\x3b\x8a\xe3\xfc\xf3\xcf\xff\x81\x55\
-\xba\xfc\x79\xf4\x06\xbe\x2f\x72\xac\x74\xb3\x78\xbc\xc9\x93\xa0\
-\xd7\x41\x3b\xf4\xc5\xb6\xf8\xae\xf8\x75\x71\x92\x38\x02\x87\x10\
-\x81\x39\x21\x20\xb3\xfd\xee\x0e\x48\xa3\xef\xf7\x45\x9f\xb9\x12\
-\xc7\xee\x60\xec\xd8\xb1\xa5\x6d\x6d\x6d\xbb\x9b\x9a\x9a\x36\x38\
-\x8a\x24\xd0\x1c\xbc\xef\xda\xb5\x6b\x75\x6b\x6b\x6b\x87\xb9\x75\
-\x17\x3e\xf9\xe3\x28\x3c\x24\x76\x84\x3c\x59\x4c\x96\x3b\xbd\x48\
-\x81\x99\xfd\x6d\x91\x97\x15\x62\x3f\x5f\xb8\xde\xa2\xf0\x6d\xb1\
-\x5e\xfc\xad\x78\x74\xe8\x86\xf5\xf4\x49\x11\xb9\x77\x8b\xd3\xc4\
-\xbd\xee\x47\xc4\x15\x6f\x13\x5b\xc5\x1d\x22\x4a\xab\x4f\x2e\x73\
-\xbc\x8e\x71\x2c\x16\xaf\xbd\xf6\xda\xd0\xab\xae\xba\x2a\xa3\x55\
-\xa5\x50\x4a\xec\xd6\x2b\x0a\xa4\xa3\xa3\xa3\x53\xcf\xc0\x8f\xe7\
-\x75\xd7\x5d\x97\x31\x65\x89\xa7\xf8\xac\x11\xf7\x0a\x3e\xf9\xe3\
-\x28\xfc\xab\x98\x28\x93\x3e\x42\xa1\xaf\x2b\x13\x96\x1e\x27\x89\
-\xf4\xd1\xa0\xaf\x08\x89\x32\x29\x94\xc5\x00\xe5\xb0\x7b\xf7\xee\
-\xba\x96\x96\x96\x5f\x57\x54\x54\xb0\xee\xcd\x00\x85\x22\x2b\xa4\
-\x4d\xfe\x9d\x62\xbb\x29\x18\x03\xe1\x3f\xfc\xf0\xc3\xdf\xc8\x6f\
-\x8d\x29\x9b\x62\xe1\x93\x3f\x8e\x42\xa2\x4c\xfa\x10\x85\x3e\xad\
-\x4c\xa0\x40\xbf\xcd\x0c\x6e\xe1\xff\xad\x32\xd9\x67\x9b\x13\x28\
-\x80\xa9\x53\xa7\x4e\xd1\xcf\x0f\x4b\x4a\x4a\x3a\x6e\xba\xe9\xa6\
-\x95\x0f\x3f\xfc\xf0\x1f\xed\xf1\x0d\x06\x3a\x35\x15\x28\x90\x74\
-\x9a\xba\x0e\xde\x03\x28\xdc\x40\x85\x7f\x51\xee\xdc\x43\xd9\x7d\
-\xcf\x3d\xf7\xfc\x78\x6f\x15\x4a\x4f\xa1\x98\xfd\x13\x05\xcd\xaa\
-\xd7\xe8\x7b\x2e\x90\x07\x08\x5f\x03\x84\x4e\x19\xb7\xf0\xb5\xa8\
-\x76\x0b\xe3\xe4\x94\x3f\xce\x2f\x0a\x05\x2d\x71\xc3\xf3\x5b\xe8\
-\x91\xf2\xd9\x33\x1f\x82\x08\x42\xf8\x5a\x94\x0c\x80\xc0\xe1\xcf\
-\x82\x50\x40\xf8\x4c\xdf\xdd\x1b\x20\xbb\x9b\x07\xbf\x85\xa2\xda\
-\xd8\x05\x71\x49\x20\x7c\xed\xf2\x9e\x0b\x84\x01\xe1\x6b\x00\xbd\
-\x66\xe2\x46\xfd\xba\x80\x31\x5c\x0c\x8b\x81\x14\x40\x7a\xf3\xe6\
-\xcd\x57\xc8\xc2\x78\xa9\xb9\xb9\xf9\x7e\x96\x2d\xb2\x40\x42\xdf\
-\x54\xea\xce\x3b\xef\x2c\x95\x7b\x67\x4d\x4d\x0d\x33\x50\x00\x85\
-\x09\x96\x37\x4d\x4d\x4d\xb3\x88\xb7\x65\xcb\x96\xd1\xa4\x13\x7a\
-\x17\x05\x9f\xfc\x71\x14\x5c\xcb\xe4\x72\xf1\x34\xf1\xd4\x90\xdc\
-\x19\x88\x9d\x61\xf0\x17\xb1\xc0\xb8\xd9\x8b\xf9\x3b\x5c\xfc\x4c\
-\xf8\xce\xe9\x50\xbe\xf8\x98\xcb\x27\x10\x2e\x24\x1d\xea\xb0\xd0\
-\x6d\x58\xc8\xe3\x45\x76\xf4\x0b\x9a\x9d\x04\xd2\xe9\x2f\x12\x8f\
-\x59\xcd\xca\xe3\x72\xa8\x2f\xae\x4b\x21\x90\x5d\x70\xe5\xa1\x7c\
-\xa4\x3b\x44\xcc\x3b\xfb\x0a\x1c\xf9\x73\x8a\x97\xa9\x0b\x61\x90\
-\xf8\x09\x91\xf4\x38\xb5\x70\x67\xf9\x2e\x96\x89\x48\x9d\x70\x72\
-\x72\xb4\x68\x75\xfc\x17\x22\xa7\x27\xb1\x75\x2c\x70\xca\xf2\x59\
-\xf1\x50\x9f\x7f\x2e\x0a\x1f\x11\xc9\x67\x50\xc4\x1d\x79\xb8\x03\
-\x73\x94\x68\xe5\x29\xd8\x32\xc1\x5d\xa4\x3c\x47\x88\xc4\x21\x0f\
-\x2c\xe2\xe3\x44\x26\x5e\xeb\x07\x05\x59\x26\x02\x61\x91\xe9\x63\
-\x22\xf5\x4c\x7a\xd4\x11\x75\xc5\x92\x2c\xb6\xcf\x08\x94\x83\x78\
-\xa5\xe1\x3b\xe9\x21\x87\xb5\x0f\xf5\x1c\xf8\xf9\xe8\x75\x8c\x63\
-\x21\xc0\x8a\xb0\x65\xcb\xb8\x71\xe3\x52\xdb\xb6\x6d\x3b\x15\x25\
-\x01\xea\xeb\xeb\x4f\xdb\xb1\x63\xc7\x39\xf6\xee\x2a\x8a\x0f\x3e\
-\xf8\x60\x84\x94\xc8\x28\xe2\xe0\xaf\x70\x67\xd8\x47\x80\x28\xa1\
-\x62\xad\x13\x9f\xfc\x71\x14\x50\x26\xfc\x80\x4d\x22\xf7\x04\xb8\
-\x70\xc4\x19\xff\xff\x88\x1c\x05\x76\x69\x10\xc1\x3a\xd2\x99\xe2\
-\x7f\x8a\xdc\x07\x60\x63\x8e\xc6\xe7\xb9\x41\xfc\xa9\xf8\x57\x22\
-\xe5\xc9\xea\x5c\xa1\x1b\x8a\x64\xa3\xf8\x3b\x91\x74\x18\x64\x15\
-\xe2\x2b\xe2\x5b\xe2\xf6\x90\x5b\xc5\x97\x45\x4e\x10\x06\x8a\xde\
-\x8e\x0a\xf1\x13\xe9\xa4\x4f\x89\xc4\x6b\x10\xad\x4c\x46\xca\x56\
-\x27\x32\xd0\xe3\x3a\x29\x03\xea\x47\x22\xf2\x20\xa3\xc9\x83\x6c\
-\xb8\x21\x0f\x1d\xb9\x8b\x3c\x02\x03\x06\x65\xfc\x6b\xf1\x1d\xf1\
-\x3c\xf1\x10\xf1\x1f\xc5\x17\xc5\x2d\x22\x17\xd2\x18\x80\x17\x88\
-\x56\x9f\x3e\x65\x72\x91\xf8\xb4\x48\x5d\x6d\x13\xa9\x63\x2e\x73\
-\xd1\x3e\xdc\x45\xa1\xe3\x67\xc9\xc0\xbb\xc8\x20\xbf\x47\x44\xe6\
-\x99\xe6\xee\x86\x8b\xd2\xfc\x85\x07\x45\xe2\xfd\x58\x24\x1d\x73\
-\xff\xb2\xf8\x7f\xe2\x4a\x91\x63\x5b\xcb\xa7\x50\x65\x42\x1c\xfc\
-\xd7\x8a\xa4\x43\x59\xa8\x87\xcd\xe2\xaf\x44\x06\x09\x6d\x7c\xbb\
-\x18\xab\x4c\x04\xf2\xa6\xec\xf3\xc5\xd7\x44\xea\x84\xf0\xd4\xd1\
-\x46\xf1\xe7\xe2\x85\x22\xe1\xb2\xe4\x11\x68\x1f\xda\x7f\x8d\x88\
-\x1c\xe7\x8b\xb4\xcf\x78\xf1\x05\xd1\xda\x87\xb6\x1b\xe5\xc6\x75\
-\xe9\x75\x8c\x63\x3e\x30\xe0\xa5\x04\xa6\xc9\xaa\x58\x14\xb5\x28\
-\x9e\x7a\xea\xa9\x41\xb2\x44\x5e\x69\x69\x69\xa9\xdd\xb9\x73\xe7\
-\x45\xae\x95\xd2\xd8\xd8\x38\x12\x77\xf9\xbf\xfc\xec\xb3\xcf\x7e\
-\x3c\x74\x0e\xa0\x74\x4a\x5a\x5b\x5b\x17\x2b\xdd\xe9\xc5\x28\x14\
-\x9f\xfc\x71\x14\x5c\x65\xd2\x26\xd2\x80\x46\x1a\x07\xed\xec\x6b\
-\x48\x66\xe6\xc9\x22\x83\x93\xa5\x19\x97\xac\xdc\xb8\x74\x2a\xd2\
-\x63\xe0\xde\x20\x46\x67\x38\x1a\xf3\x4b\x22\x61\x89\x3f\x43\xa4\
-\x83\xf1\x1b\x37\x37\x3d\xd2\xb2\x70\xb5\x22\x32\x75\xe9\xac\xb8\
-\x89\xcc\x70\xeb\xc4\x60\xb9\x28\x12\x2f\x5a\x2e\x88\x72\x60\x00\
-\x74\x99\x75\x04\xd2\x61\xb6\x42\x81\x99\x3c\x6e\x5a\x56\x36\x57\
-\x9e\xac\x3a\x12\x48\xe3\x73\x22\x03\x92\xb2\x30\xa8\x7f\x22\x12\
-\xcf\xd2\x80\xcd\xe2\x15\x62\x10\x5f\x70\x95\x09\x8a\x08\x65\x41\
-\x3e\xc4\x89\xd6\x09\xc4\x0f\x85\x39\x5a\xcc\xc8\xc0\x6f\x91\xb4\
-\x96\x8a\xbb\xc4\x5f\x9a\x5c\x16\x26\x8e\x02\x79\x23\xdb\x12\x11\
-\x2b\xcf\xe4\xbb\x5e\x24\x5f\x06\xed\xb1\xa1\x5b\x5e\x65\x22\xa0\
-\x14\x51\xa8\x0c\x72\xb7\x4e\x29\x17\xbf\x29\x9b\xd5\xcd\xc3\xe2\
-\x2c\x11\x77\xaf\x32\x11\xc8\xf3\x4a\xb1\x45\x24\x3d\xab\x0f\xab\
-\x1f\x4b\x0f\x3f\xfa\x56\x96\x25\x29\x50\x3f\x7f\x29\x32\xd1\x10\
-\xf6\x5e\xf1\x71\xd1\x64\xb0\xf4\xf0\x2b\x77\xf3\x76\xe9\x75\x8c\
-\x63\x3e\x48\x11\x0c\x96\x42\x78\x69\xf7\xee\xdd\x2f\x8b\x2f\xb9\
-\x83\xff\xcd\x37\xdf\x1c\x2a\xbf\x55\xa1\xdf\x6c\x53\x36\x58\x21\
-\x52\x2e\xb7\xe3\x8e\x32\xd9\xb4\x69\x13\xa6\x63\x00\xe2\x87\xe1\
-\x57\x91\xee\xf2\xe5\xcb\x99\x21\x0b\x82\x4f\xfe\x38\x0a\xee\x32\
-\x07\xab\x80\x9b\x87\x1c\xff\x7d\x4b\xfc\xbc\x98\x35\xd8\x04\xe4\
-\xa7\x21\xac\xb1\x21\x0d\xb6\x4c\x9c\x20\x12\x77\xa2\xf8\x0b\x91\
-\x46\xc1\x9f\x46\x99\x29\xd2\xb9\x83\x06\x15\x48\xe3\x6f\x44\xe2\
-\x92\x37\x1d\x97\x70\xbc\x33\xf3\x57\x8a\x54\x24\x33\x15\x71\x99\
-\x3d\x2c\xbd\x4d\x22\xa6\x7b\x97\x81\x21\x2c\x14\xad\x43\x60\x9d\
-\x20\x4f\x94\x94\x8d\x81\x9e\xd5\x41\x9d\x34\xce\x12\x99\x91\x4c\
-\x1e\x66\x29\x06\x08\xf2\x40\x2e\xf9\x31\xfb\x91\x07\x9d\x6d\xbd\
-\x78\x42\x24\x0d\xea\x89\x25\x23\xca\x84\x70\x58\x7d\x96\x1e\x33\
-\x5e\xb5\x38\x4e\xc4\x2a\x19\xe0\xc4\x33\x65\x42\x38\xca\xca\x60\
-\xb1\xf8\x4f\x88\xdf\x13\x29\x03\x7b\x73\xab\x44\xfc\x08\xc7\xa0\
-\xfb\xbe\x93\x8e\x29\x13\xea\x00\x19\xf7\x46\x99\x90\x2e\x56\x27\
-\xe9\x98\x32\xb9\x4e\x44\x36\xca\x55\x8c\x32\xf9\xaa\x88\xc5\x6a\
-\x75\xf0\x86\x78\x87\xf8\x1d\xf1\x6a\xb1\x46\xb4\xba\x22\x0c\xe5\
-\xe5\x77\x2e\x65\xc2\xfd\x28\xfc\x90\x91\xf4\xa8\x8b\x5b\x44\xfa\
-\x2f\x0a\x0f\xc5\x8d\x12\xb5\x3a\xfc\x6f\x91\xe5\xaa\xdb\xff\xe8\
-\x03\x28\x13\xe2\xbb\xed\x43\xdb\x3e\x20\x96\x8b\x58\x85\x07\xbb\
-\x79\xbb\xf4\x3a\xc6\x31\x1f\xb0\x36\x14\x6e\x91\x06\x7f\xad\xac\
-\x93\x97\x79\x77\x2d\x90\x37\xde\x78\xe3\x68\x59\x20\x2b\x6d\x99\
-\x63\x50\x98\xb4\xc2\x2f\x97\xc2\x39\xc9\xfc\x78\x12\x37\x54\x26\
-\xb5\xdb\xb7\x6f\x9f\xe1\xa6\x95\x0f\x51\xd9\xf3\x51\x70\x95\x49\
-\xd6\x0c\xeb\xfe\x76\xdc\x18\x24\x74\x66\x2a\x9e\xc6\xde\x28\xfe\
-\xad\xe8\xee\x09\x10\x86\x99\xe8\xef\x45\x06\xa2\x35\xe8\x65\x4e\
-\x3a\x34\x26\x33\x15\x8d\x47\xde\x3c\x09\xc7\xbd\x17\x33\x9f\x5d\
-\xb2\x07\xb3\x58\xb4\xce\x43\x67\x67\xcf\xc0\xcd\x93\x2b\xdd\x58\
-\x42\xa4\xf7\xaa\x48\x3a\xe4\x93\xd5\xb1\x2d\x7f\x8f\x1b\x69\xb0\
-\xc7\x40\xc7\x64\x00\xd2\x19\xa9\x1f\xac\x46\x1b\x4c\x26\xcf\x1f\
-\x8b\x8f\x88\xc8\x03\x59\x36\xb1\xaf\xe3\xca\xe3\x2a\x13\x48\x1d\
-\x30\xb8\xd9\x73\xb1\x74\x02\x3a\x32\x98\x32\xb1\x3a\x81\x5c\x53\
-\x47\xb1\x67\xc2\x86\xbf\xb1\x18\x50\xdc\xe4\x41\x7b\x20\x2f\xcb\
-\x10\xfc\x4c\x99\x60\xea\x53\x96\x15\x16\xcf\xf2\x8a\xa3\xd0\x23\
-\xca\x84\xa7\xc8\x52\x19\xe5\x4c\x7a\xc8\x78\x97\xc8\x92\x22\x5a\
-\x1e\x26\x54\x26\x21\xeb\x5b\x5d\x94\x09\x4f\x91\xfe\x46\xfd\x90\
-\x1e\x72\x20\x53\x34\x2d\x78\x8e\xc8\x72\x9b\x70\xc8\x7c\xa7\xe8\
-\xa6\xe3\x2a\x13\xf2\xa2\x9e\x9e\x11\xd9\xc7\xb2\x34\xbc\xfd\xc7\
-\xe8\x75\x8c\x63\x1c\x4c\x09\x60\x4d\xac\x5f\xbf\xfe\x5c\x59\x29\
-\x6c\x00\xa5\x1a\x1a\x1a\x86\xbf\xf0\xc2\x0b\x99\xa5\x8b\x59\x2b\
-\xb2\x32\x8e\x97\x62\x79\x59\x4f\x36\x76\xb2\xa0\xf0\x87\x35\x35\
-\x35\x9d\x8d\xf2\x50\x3a\xc3\xde\x79\xe7\x9d\xd3\x2c\x7d\x14\x4f\
-\xf0\x23\x0f\x7c\xf2\xc7\x51\xc8\xa9\x4c\xa2\xc4\x4f\x64\x20\x60\
-\x56\x53\xf9\x34\xd2\x48\x11\xc5\x91\xa9\x74\x9e\xe1\x3b\xee\x34\
-\x28\x1d\x88\xf0\xcc\x4c\x43\x45\xfc\xa0\x29\x13\x48\xfe\x98\x9a\
-\x6c\x7e\xd1\x39\xad\x31\x8d\x84\x67\xa0\xcf\x13\x09\x4b\xc3\x5f\
-\x13\x91\x8d\x4e\x87\x1f\xe9\x61\xda\xe2\x16\xc4\xb7\x70\xf9\x28\
-\xd8\xc6\x1f\xe9\x60\x1d\xa1\x24\x03\x79\x42\x7f\x93\x07\x37\x94\
-\xc7\xa3\x22\x65\x23\xfc\x0f\x44\x37\x9c\x29\x13\x4b\xef\x67\x22\
-\xb3\x63\xa0\x78\xa1\x9b\x77\x18\xcf\x94\x89\xd5\x0b\x8a\x84\x3a\
-\xcb\xd4\x89\x93\x3e\x24\x2d\x66\x4f\xda\x84\x41\xb8\x34\xf4\x27\
-\x7c\xaf\x2a\x13\x91\xfa\x47\xe1\xfd\xbb\x68\xed\x82\xf5\x80\x22\
-\xc9\x6a\x9b\xf0\x37\x65\x61\x63\x96\x01\x4d\xf8\x2c\x65\x12\x92\
-\x4d\x55\xac\x60\x64\x63\x89\xcd\x52\x99\x7e\x16\x4d\x0b\x22\x17\
-\x75\xc7\xbe\x08\x72\xa1\xd0\xd8\x98\xc5\x8f\xb4\x4c\x99\x58\xfb\
-\xb1\xa4\x8b\x6d\x9f\x28\xbd\x8e\x71\xcc\x05\x06\x7a\x47\x47\x07\
-\x4b\x97\xd0\x65\x0f\x6e\xbb\xed\x36\x2c\x8b\x35\x52\x1a\xab\xa4\
-\x20\xce\x08\x9d\x53\x8f\x3f\xfe\x78\xb0\x7f\x12\x2e\x5f\x56\x3d\
-\xf1\xc4\x13\xac\xe3\x02\xac\x5c\xb9\xf2\xd3\xb2\x52\x58\x0e\xad\
-\x56\x7c\x2a\x21\x03\xd2\x6f\x6f\x6f\x47\x9b\xe7\x85\x4f\xfe\x38\
-\x0a\xae\x32\x89\xbd\x67\x82\x9f\xc8\x06\x15\x61\x69\xcc\x1f\x8a\
-\xc8\x6a\x0d\xed\x23\xfe\xcc\x08\xd6\x60\x98\xf6\xe6\x67\xca\x04\
-\x3f\x6e\x54\x32\xdb\xe7\xde\x39\xdf\x93\x16\x9b\x9a\x6f\x8a\xe4\
-\xcf\x46\xa6\xed\xc2\x93\x1e\x7e\xb6\x86\x7e\x5e\x44\xf9\x78\xe5\
-\xf3\xa4\x4d\xd9\x0e\x17\x59\x82\x10\x9f\x4e\x4c\xc7\x8b\x93\x87\
-\x38\x28\x14\x36\x0f\xe9\xac\x6c\x20\xba\x27\x12\xae\x32\x41\xa1\
-\x72\xca\x90\x33\x3d\x28\x98\x32\xa1\x4e\x88\xc3\xf2\x20\xae\x4d\
-\x28\x0f\x71\x16\x89\xd4\x2f\xcb\xc5\xe0\x04\x42\xec\x6d\x65\x82\
-\x3b\x1b\xa4\x66\x9d\xae\x10\x83\x81\xea\xe6\xe5\x32\xf4\x67\xcc\
-\x20\x33\x71\xa2\x96\x09\x7b\x59\x58\x9f\xf8\x55\x3b\x71\xba\xb4\
-\x71\x48\x64\x60\x59\x4b\x7d\x12\x87\xe5\xa1\xc9\x66\xca\x04\x77\
-\xea\x8d\xf7\x32\x57\x9e\x7c\x24\x83\x1e\xc1\xad\xb7\xde\x3a\xa8\
-\xb5\xb5\x35\x3d\x6b\xd6\xac\xea\xcd\x9b\x37\x63\x72\x07\x18\x3c\
-\x78\x30\xdf\xda\xf4\xe3\x7b\x9b\x11\x23\x46\xdc\x28\x65\x80\xf0\
-\xa9\xa7\x9f\x7e\xfa\x03\x29\x0b\x66\xdf\xf6\xb6\xb6\xb6\x79\x4b\
-\x97\x2e\x65\x36\x41\x59\xa4\x87\x0f\x1f\x3e\x91\x23\x6d\xb1\xdf\
-\x90\x21\x43\x82\x1a\x02\xab\x56\xad\xfa\xe4\xcc\x99\x33\xab\x15\
-\x6f\xd0\xf3\xcf\x3f\xcf\x2e\x77\xaf\x20\x3c\x6f\x87\x7c\xfd\x4c\
-\xa7\xa5\xd3\xd0\x10\x34\x94\xbb\x1f\x11\x25\xfe\x36\x40\x01\x9b\
-\x5e\x96\x96\x81\x36\xe1\x4b\xd9\x7a\x35\x90\x85\xeb\x82\xd0\x8f\
-\x13\x9a\x97\x44\x3a\x03\x56\xe0\x91\xc8\x26\x3f\x64\xc2\xef\xbf\
-\x44\xea\x8f\x81\x8c\xa2\x64\x4d\xee\xca\xc3\x46\x25\x47\xc3\x56\
-\x26\x03\xbf\x19\x84\x28\x07\xd2\x22\xee\xd6\x38\x79\x80\xfc\xe9\
-\xec\xcc\x68\xc4\x47\x99\x1d\x22\xb7\x4c\xfb\x85\xe0\x1d\xb9\x7e\
-\x9b\x2f\x3d\x07\xa4\xc7\x3e\x11\x9b\xc0\xae\x9c\x59\x50\x7a\xc8\
-\x4a\x9a\xec\xa7\x00\x66\x69\x4e\x26\xfa\x02\x90\x0d\x85\x8c\x92\
-\xa6\x0e\x6a\x24\x6f\x9b\xa7\x7e\x32\xc0\x5f\x0f\xca\xcc\x69\x91\
-\x1b\x8e\xe6\xa2\x1e\xf8\x9b\x40\xc1\x89\x9e\xb8\x5b\x4e\x6c\xc2\
-\xda\x3e\x5f\x2e\x32\x36\xa9\x23\xe2\x04\xca\x59\x8c\x82\x89\xe0\
-\x95\x30\xff\xc2\x41\x59\x8a\x61\x2e\xd4\xd5\xd5\x0d\x94\x35\x31\
-\x5f\x03\xbd\x0a\x25\x81\x52\x30\xc5\xc1\x53\x71\x5f\xe1\xc9\x12\
-\x45\xcb\x9e\xcb\xb0\x64\xf4\xce\x72\x68\x14\xee\xbc\x37\x36\x36\
-\x5e\x88\x7f\x18\xfe\x55\x9e\x16\x1f\x2a\xfd\x69\xa4\x2f\xe5\xb3\
-\xf0\xc5\x17\x5f\xc4\x64\x8c\x85\x2b\x77\x21\x14\x0a\xb2\x4c\x70\
-\x17\x19\xc0\x6c\x6c\xa1\xc9\xad\x13\x17\x4a\xc2\xd3\x50\x1c\x17\
-\x33\xd3\x91\x16\x96\x09\x6e\xf8\xb3\x69\x16\x3b\x6b\x43\x01\x39\
-\xf8\x28\xd1\xf2\x3f\x5d\xcc\x58\x1a\x02\xeb\x5d\x5b\x27\xe7\x92\
-\x91\x3c\x97\x8b\xee\x8c\x47\xba\x5f\x13\x4d\x4e\xf6\x7b\x72\xce\
-\xa0\x2e\x85\x6b\x45\xd2\x45\xb9\x1e\x1f\xba\x91\x9e\x6b\x99\xdc\
-\x84\x5b\x34\x6e\x94\x82\x59\x26\xbc\x30\xa0\x32\x9b\xb3\xb9\x28\
-\xa0\x8c\x59\xa2\x5a\x79\xd9\x20\xc6\x8d\xb4\x6c\x03\xb6\x37\x2c\
-\x13\x78\x99\x48\x78\xac\xac\x33\xdc\x3c\x72\x51\x20\x1e\x93\x2e\
-\x69\x99\x65\x42\x1e\xb8\xb3\x19\x4f\x7a\x94\x35\x57\xfb\xfa\x68\
-\x61\x51\xd0\x58\xac\x58\x33\xae\x65\xf2\x2f\x62\x41\x75\xe3\xb2\
-\xc7\x2c\x93\x93\x4f\x3e\xb9\xe9\x9a\x6b\xae\xf9\xb6\x96\x3a\x6f\
-\xcf\x9b\x37\xef\x56\xdc\xf4\x5c\x28\x25\xc0\x5f\x56\xeb\x94\x92\
-\x60\x06\xec\x94\x65\x31\x77\xc0\x80\x01\x37\x56\x56\x56\x7e\x03\
-\xe5\x7a\xe2\x89\x27\xfe\x44\xcf\x4e\xbd\x8f\xea\xd7\xaf\xdf\x94\
-\x39\x73\xe6\xb0\xee\x26\xfc\x49\x61\x3c\xd2\xe1\xec\x3c\xb5\x6c\
-\xd9\xb2\xdb\x15\xf6\xf5\xab\xaf\xbe\xfa\x5b\xa7\x9f\x7e\x3a\x9d\
-\xe2\x40\x05\xbd\x84\xce\xb0\x51\xf4\x69\xff\x62\xca\xc6\x52\x26\
-\xe8\x75\x02\x1d\xdd\x05\xf7\x5d\xe8\xc0\xcf\x8a\xbe\x7c\x00\x72\
-\xb0\xa1\x49\xbd\x0f\x55\xfd\xf2\x0e\x2c\x4d\x60\x6e\x85\xc0\xfa\
-\x14\xf1\xdd\x34\x5c\x34\xab\xf3\xe5\xf2\xcb\x85\x62\x64\x70\xc3\
-\x32\x70\x00\xf9\x31\x80\x40\xb4\x9e\xf2\xa1\xd8\xf0\x3d\x8d\x62\
-\xca\x5e\x0c\xb8\x9b\xc3\xc9\x4d\xb4\x2d\x70\x2b\x1a\x3d\xa6\x4c\
-\x18\xf4\xfc\xd9\xc5\x6b\xaf\xbd\xf6\x9f\xd7\xac\x59\xb3\xf3\xe6\
-\x9b\x6f\xfe\xac\x96\x3d\xbb\xb4\xec\x99\x37\x7d\xfa\xf4\x01\x28\
-\x06\xfa\xa9\x96\x3b\x87\xe9\x59\x52\x56\x56\x36\xc9\xfa\x93\x9e\
-\x69\xbd\xdf\x82\xbb\x5e\x07\x12\x8e\xf0\xf7\xdd\x77\x5f\x3f\xe2\
-\x2b\x9d\x96\x8a\x8a\x8a\xb3\x9f\x7c\xf2\xc9\xfa\xf1\xe3\xc7\xdf\
-\x2d\xe5\x12\x28\x99\x5e\x06\xc2\x73\x6c\x46\x43\x53\xf9\x98\x97\
-\xa3\x0a\x24\xb3\x3e\x26\x66\x85\xca\x4e\x67\x2f\x76\x60\x15\x04\
-\xd2\x16\xd9\xb4\xe4\xc8\x95\x19\x2d\x2a\x07\xcb\x1c\x66\x6b\xea\
-\x9d\xf5\x3c\xb3\x38\xb3\x1e\x7c\x57\x04\xc8\xc6\xc6\x72\x6c\x87\
-\x56\x9b\x99\x3f\xa7\x10\x94\x89\x65\x2b\xeb\xf9\x9e\x00\xe9\x71\
-\x1a\x75\x78\xd8\x47\xf2\x81\x1b\xba\x00\xd9\x51\xa8\xc8\x86\x22\
-\x79\x4f\x64\x16\x3e\x5a\xe9\xf8\x96\x60\x5d\xa0\x70\x9c\x8a\xd9\
-\x46\x79\x77\x41\x9d\xa2\xfc\x51\x4e\xec\x19\x15\x02\xda\x22\x58\
-\x8a\x7a\xc0\x1d\x22\xca\x40\xfd\xb0\x17\x77\x89\x48\xdf\x8a\xb6\
-\x73\x94\x9c\x00\xb1\x51\x7d\xb1\xaa\x80\x49\x26\x5a\x0f\x79\xeb\
-\xc5\x0b\xea\xb3\x18\xfa\xb0\x7d\xfb\xf6\xc9\xb2\x48\xe6\x61\x85\
-\x18\xa6\x4e\x9d\x9a\x6e\x6f\x6f\x7f\x50\x4b\x93\x2a\x59\x23\x99\
-\xfd\x0d\x96\x33\x5a\xaa\xfc\x6c\xf9\xf2\xe5\xc1\x1f\x93\x36\x48\
-\x01\x1d\x29\xf7\x9f\xcb\x3f\xd3\x69\x67\xcc\x98\xc1\xc7\x7e\x2c\
-\x6b\x1e\xbc\xfb\xee\xbb\xa9\xd4\x00\xe4\x23\x59\xe6\x34\x37\x37\
-\x73\xda\x90\x13\x51\xd9\xf3\x51\x28\x76\x03\x96\x3b\x01\x84\xa5\
-\x41\xd8\xcc\xa2\xc3\xe1\x9e\x93\x4e\xdc\x4c\xda\x02\xf1\xdc\x65\
-\x0e\xe9\x16\xba\xcc\xe1\xe6\x29\x71\x20\x83\x3e\xb3\xcc\x89\x52\
-\xc8\x92\x45\x24\x5f\x36\xbe\x51\x38\xc4\x67\xf0\x73\x13\x97\x01\
-\xc7\x7d\x1e\xcc\x6a\xdc\x51\x0c\xb8\xe7\xdb\x80\x25\x0e\x7b\x35\
-\x98\xca\xbf\x14\x33\x47\x9e\xa2\xbb\xcc\x99\xe0\x4b\x23\x4a\x81\
-\x41\x67\x1b\xb0\x28\xec\xaf\xf9\xc2\x19\x05\xca\x43\x1c\x8e\xa9\
-\x91\x9b\x81\xeb\x7e\x9e\x70\x8d\x48\x7b\x21\x03\xf7\x88\x62\x4d\
-\x79\xfc\x45\x96\x29\x56\xbf\xdd\xdd\x80\xe5\x12\x21\x1b\xd4\xe4\
-\xcf\xb2\x2d\x76\x83\x53\x20\x0e\x7f\xae\x31\xd7\x06\x2c\xf9\xd8\
-\xc9\xd5\x03\x4e\x1c\x2b\x6f\x94\x16\x2f\xe8\xa7\x4e\x3e\xbc\xbb\
-\xcb\x9c\xcc\x49\x5c\x31\x24\x91\x6e\x81\xc1\x3f\x64\xc8\x90\x8f\
-\x6a\xc0\xb7\xc9\x8a\x98\xc3\x40\xc7\x6a\x98\x34\x69\x52\x67\x79\
-\x79\xf9\x95\x52\x32\x6b\xea\xea\xea\x9a\x65\x5d\xdc\x25\xc5\xf0\
-\x15\xe2\xc8\xba\xb8\xf8\xac\xb3\xce\xfa\x9d\xc2\x0f\x6e\x69\x69\
-\x59\xad\xe7\x90\x61\xc3\x86\xbd\x2d\x77\x36\xcb\x3a\xa5\x24\xbe\
-\xac\xf0\x53\xd7\xae\x5d\x4b\xb2\xab\x49\x67\xe2\xc4\x89\xed\xec\
-\x9b\x90\xbe\xc2\x57\xc9\x3f\xd5\xbf\x7f\xff\x43\x5d\xe5\xd3\x03\
-\xa0\x51\x0c\xac\x25\x33\x69\x3b\x33\xaf\x81\x77\x66\x75\x1a\x93\
-\xdf\x28\x93\xb3\x45\x1a\xac\x0b\xc2\x30\x27\x29\x19\x36\xc9\x3e\
-\x1e\xba\xed\x57\x04\x82\x64\x83\x81\x85\x02\xa1\x63\xf3\x9b\x8e\
-\x48\xb9\xf1\x63\xa3\x98\x9b\xaa\xb8\x73\xb5\x9f\x8b\x51\xde\x0f\
-\xc6\x42\x37\x94\x12\xcb\x51\xae\x00\x90\x0e\xfb\x41\x4d\x24\xa4\
-\x67\x77\x41\xfa\xec\x91\xdd\xa6\xac\xb0\x2a\xba\xc8\x10\x02\x77\
-\x66\x5d\xae\x8d\x33\xc8\x97\x29\xfb\x0d\xa1\x0c\xf8\xd1\x5e\x94\
-\x97\x7e\xcf\x52\xfc\x8b\x4a\xca\x3b\x06\x42\x77\xfa\x23\x97\xb5\
-\x40\xae\x3c\x0b\x05\x32\x70\x01\x91\x93\x35\xea\x87\xc1\xfb\x23\
-\xe5\xe3\x3d\x48\x08\xf3\xe7\x68\x98\xab\xf4\x76\xdc\x9b\x81\xfc\
-\x79\xe7\xc2\x22\x1b\xf0\xfc\x1e\x2d\x27\xac\x5d\x6f\xff\x03\xf2\
-\xe3\x2f\x09\x72\xc3\xf8\x98\xf0\xbd\x67\x41\x9a\xc5\xd0\x07\x29\
-\x8f\xf4\x82\x05\x0b\xca\xa4\x38\x16\x30\xd8\xf5\x7c\xa8\xa6\xa6\
-\xc6\xfe\x8c\x5d\xaa\xa9\xa9\xe9\x68\x29\x92\xd9\xe2\x9c\x86\x86\
-\x86\x2b\x51\x36\x28\x01\x29\x84\xb5\xb2\x46\x38\x02\xae\xe3\x1d\
-\x77\x59\x39\xdf\x24\x1c\xe1\xa5\x68\xb8\xc7\x11\xa0\xb2\xb2\x92\
-\xcf\xcf\x6b\xc2\xf4\x6b\x9e\x79\xe6\x99\xfe\xe4\x1b\x7a\x7b\x11\
-\x95\x3d\x1f\x05\x06\x3a\x83\x87\x8e\xc8\xe6\x2a\x65\x20\x0f\x1a\
-\x96\xbf\xaa\x75\xbd\x27\x0e\x7f\x69\x0b\x25\xc4\xec\xc9\xac\xcc\
-\x89\x0d\x33\xbb\x6b\x85\x30\x9b\xd1\x29\xb9\xb6\x4e\xda\x55\x62\
-\x30\x83\x84\x61\x48\x7f\x9f\x5b\x26\x51\x12\x56\xc4\x84\xe7\xce\
-\x01\xf1\x19\x68\x98\xf5\xb8\x93\x36\x47\xbb\x1c\x39\x23\x17\xc7\
-\x85\xd4\x09\xdf\x70\xb8\xb3\x1a\xe1\x48\x03\xe5\xc1\xac\x46\x58\
-\xae\xd5\x67\xae\x6c\xf3\x14\xbb\x63\x99\xd0\x26\xd6\x2e\x1c\x9b\
-\x9f\x1b\x09\x47\xfa\x28\x1b\x14\x04\x65\x40\x06\xee\x5d\x70\xaf\
-\x27\x6b\x86\x15\x18\x4c\xd6\x5e\x1c\xd3\xb2\xd4\x73\xdb\x82\xb4\
-\x18\xbc\x1c\xdb\x93\x37\x79\x5a\xfe\x3d\x71\x69\x8d\xfa\x43\xa9\
-\x90\x3f\xd6\xd6\x6c\x31\x7a\xbd\x9d\x70\x9c\x14\x52\xf7\xd4\x17\
-\x79\x10\x3e\x6a\x99\xd0\x4e\x2c\x61\x91\x0d\x7f\xca\xfe\x43\x4b\
-\xc7\xd2\x0a\x9f\x17\x8b\xdc\xb4\x25\x2d\xda\xe7\x20\x27\x0c\xe9\
-\x74\xdb\x32\xf1\x3a\xc6\x31\x0a\x29\x81\xf0\xd7\x9e\x7d\x93\x47\
-\x1f\x7d\x74\xa0\x94\x47\x95\x94\xc1\x5c\x3d\xaf\xc5\x1f\x4a\x49\
-\x9c\x20\xe5\x30\x67\xdd\xba\x75\xac\xcd\x03\x68\xe9\x72\x90\xdc\
-\xd6\x6a\x49\x44\x03\x05\xa8\xad\xad\x1d\x4a\xb8\xfa\xfa\xfa\x61\
-\xc4\x23\xcd\x5d\xbb\x76\xa1\x60\xe6\xca\x62\xa9\x5a\xbc\x78\xf1\
-\x40\xdc\x0c\x6e\xfe\x51\xf8\xe4\x8f\xa3\x40\xa3\x72\x5b\x94\x86\
-\xa1\x52\xff\x43\xe4\x5b\x9a\x27\x45\xeb\xcc\xcc\x7c\x6e\xe7\x80\
-\xae\x29\x4c\x38\x66\x0b\x76\xc4\x39\x95\x61\x29\xc6\x2d\x52\xeb\
-\x10\x90\xd3\x8c\xcc\xa0\xe7\xb7\xc8\x75\x7a\xfc\x08\xd7\x23\xca\
-\x44\xe0\x83\x41\x4e\x57\xf8\xa0\xce\xc8\x15\x74\xfb\xcd\x8d\x51\
-\x4e\x2a\xac\x6c\x55\x9e\xf4\xb9\xe7\x80\x12\x34\xd9\xd8\x77\xe0\
-\xb2\x1c\xf9\xfe\x93\xc8\xd2\x90\xd3\x09\xfc\x08\xc3\xed\xd7\xe0\
-\xaf\x8e\x45\xd2\xe9\x8e\x32\x21\x6d\x06\x26\xe4\x37\x69\xf0\xb1\
-\x1f\x97\xbe\x18\xd0\x58\x50\x5c\xe3\x37\x19\xc8\x87\x72\x67\x0d\
-\x08\xde\x45\x06\xfb\x74\x91\x70\x90\xb2\x63\x99\xf1\x11\x23\x6d\
-\x4d\xbb\xd9\x77\x48\x10\x25\xca\x32\x83\xdf\x85\x2a\x13\x4e\xd1\
-\xba\x28\x13\x47\x0e\x26\x0e\xfb\x24\x82\xf8\xfc\x46\xa9\xf0\x09\
-\x06\xdf\x78\xf1\x5d\x8c\x7d\xe7\x45\x18\xbb\xe8\x98\xa5\x4c\x9c\
-\xf4\x58\xbe\xd9\x92\x14\x72\x82\x77\xb7\x48\x1b\xa3\x60\xb9\xd8\
-\x66\x0a\x94\xb2\x2c\x88\xc4\xef\x1b\xca\xa4\xb1\xb1\x71\x80\xc8\
-\x66\x4e\x16\xda\xdb\xdb\x67\x6a\x79\x33\x5c\x4a\x61\x28\xd6\x04\
-\x98\x3f\x7f\x3e\x26\x74\x4a\x16\xc9\x08\x29\x87\x2f\x99\x52\x08\
-\x15\xc6\xf9\x8a\x43\x81\x52\xb2\x6a\xb8\xdf\x10\xec\x8d\xbc\xfb\
-\xee\xbb\xc7\x6d\xde\xbc\xf9\x0c\x2d\x77\xa8\xec\x20\xac\x41\x16\
-\xca\x45\xca\x9b\x75\xb9\x17\x3e\xf9\xf3\x51\xe0\xbe\x06\xeb\x5a\
-\x1a\x85\x8a\xa5\xb3\xf1\xb4\x46\x3f\xce\x13\x87\x65\x00\x83\x94\
-\x25\x8f\x75\x00\x8b\x6b\x8d\x88\x3b\x4b\x07\x2c\x14\x36\xff\xdc\
-\xf8\x34\xa6\xfb\xa1\x1f\x03\xa1\x50\x65\xc2\xf2\xc3\xf2\xfc\x82\
-\x48\x5a\x90\x6b\xdb\x74\x72\xfc\x08\xec\xa3\xc5\xe3\xc9\xf1\x70\
-\xe6\x0a\x7c\x24\x1f\xd2\xe2\x92\x15\xe1\xa0\x0d\x2e\x48\xf9\x4c\
-\x19\x71\x3f\x86\x59\x39\xda\xd9\x91\x93\xb6\x45\x1e\xc2\x4f\x74\
-\xfd\x73\x51\x60\xe0\xf2\x81\x25\x2f\x28\x64\x6e\xe1\x92\x97\xb5\
-\x09\xb2\x47\xeb\x98\x4d\x71\x36\x22\x73\x0e\x06\x81\xf6\x42\x11\
-\x30\x93\x13\x87\xb8\x6e\x5b\x5b\x5a\xb4\x17\x7f\x8a\x62\xb5\x48\
-\x99\xb9\x43\x83\x05\x64\xca\x84\xc9\x82\xf0\xc1\x9e\x52\xe8\x66\
-\x96\x09\x7d\x05\x45\xe4\x53\x26\x58\xae\x28\x7a\xfb\x08\xd3\xca\
-\xc0\x93\xbc\xf9\x6d\x72\xf1\x5d\x0c\x37\x98\x71\xcb\xa5\x4c\xc8\
-\xf3\x1b\xa2\x29\x20\xe8\xa6\x67\x65\x83\x6c\xd4\xfa\x3e\x34\xe5\
-\x5a\x01\xca\x84\x72\xa2\xd0\xf6\xbf\x32\xd1\xb2\xa5\xbf\x2c\x86\
-\xab\x64\x4d\x8c\x9d\x34\x69\x52\x66\x69\xa3\x41\x1f\x2c\x5b\xa4\
-\x38\xa6\xc9\xaf\x5a\x0a\x02\x93\x39\x80\x96\x35\xf7\xcb\x6d\xee\
-\xeb\xaf\xbf\x4e\x27\x4d\x6d\xd8\xb0\xe1\x53\x58\x1e\xb8\x3b\x8a\
-\xe7\x10\xa5\xcb\x49\x4e\x25\xe9\xc8\x9d\x0e\x99\x9a\x3c\x79\x72\
-\xea\xb9\xe7\x9e\xe3\x83\xc1\xb1\x8a\x33\x6e\xc7\x8e\x1d\x3d\xaa\
-\x4c\xa0\xc0\x87\x73\x68\x73\x94\x0a\x33\x31\xcb\x17\x06\xdb\xe7\
-\x7c\xe1\x8d\x02\xf7\x1b\xfe\x4d\xa4\x93\x30\x33\xb1\x7b\xcf\xac\
-\xce\x11\xdc\x02\xf1\x33\x39\xe2\x51\x36\xfe\x96\x04\x9f\x8e\xb3\
-\x0e\xe6\x32\x5b\x56\x87\xf1\x51\x20\x1e\x1f\xe2\x61\xae\x63\x51\
-\x05\xdf\xe7\x84\xe4\xf4\x83\x8d\x55\x64\xa0\x0c\x3e\xe2\x87\xe9\
-\x8b\x75\xc1\xf2\xc6\xdb\x81\x70\x17\x6d\x00\xb2\xe6\x47\x46\x06\
-\x39\xdc\x28\xf2\x99\x3a\x0d\xe7\xdd\x50\x14\xe8\xac\x94\x0f\xb3\
-\x9d\x3a\x1d\xe9\x0b\xe7\xa3\xc0\xf7\x49\x2c\xc3\xa6\x84\xef\x0c\
-\x42\x96\x5b\xcc\xbe\x0c\x58\xca\x40\xfb\x60\x11\x61\xa1\xf0\xb7\
-\x3c\x0a\x1a\x08\x02\x13\x07\x5f\xe5\xba\xed\xc5\x93\xf6\xe2\x63\
-\xbb\xa0\xbd\x04\x4e\xb9\xa8\x2f\x2c\x21\xca\x12\xa4\x2f\xb0\x8c\
-\xa2\x3c\xf4\x0d\x2e\xa3\x59\xdd\xb3\x11\xcd\xc7\x74\xa4\x95\xf9\
-\x06\x2b\x4a\x81\xc9\x95\x7b\x42\x58\x87\xb4\x21\xf5\x49\x59\x69\
-\x13\x2c\xaf\xbf\x13\x51\xa8\x2c\x65\x58\x1a\x51\x7f\xb4\xb1\xb7\
-\x6f\x84\x7e\x28\x5c\xfa\x02\x75\x82\xcc\xd4\x11\x75\xc5\x35\x7e\
-\xef\xdd\x16\x81\x32\x71\x20\x82\xc2\x26\xde\xd9\xbe\x70\xf9\xe8\
-\x75\x8c\x63\x14\x66\x29\xf0\x57\xd4\x26\x4c\x98\x70\xb0\xac\x8b\
-\xf1\x52\x00\x5c\x72\x0a\x50\x55\x55\x55\x26\xab\xa2\x46\x03\x1f\
-\xed\x1a\x40\xcb\x9f\x13\xa5\x38\xaa\x4d\x71\xa0\x28\xf4\x3e\x4f\
-\xe1\x32\x4b\x20\x85\xbf\x8f\x78\x73\xe7\xce\x65\xfd\x1a\x40\x61\
-\x2e\x93\xdb\x78\x2d\x75\x3e\xf2\xd8\x63\x8f\x05\x56\x8e\x6b\xa9\
-\x44\xe1\x93\xbf\x10\x0a\x74\x08\xbe\x7b\x60\xf7\x9d\xa3\x4e\xe4\
-\x0a\x4e\x26\x7c\xe1\x5d\x0a\x34\x0c\x8d\xca\x29\x02\xd7\x9d\x79\
-\xf2\x5e\x88\xa5\xc1\x80\x0b\x66\xb8\x42\x29\x20\x2b\x72\x1e\xe9\
-\xf1\x63\x60\x21\xbf\x4b\xfe\x58\x93\xfd\x46\x3e\xd6\xf0\x05\x5d\
-\x9b\x16\x4c\xa9\x70\xb2\xc3\x0d\x59\xe2\x73\xab\xb3\xd0\xba\x41\
-\x61\xb1\x0f\x96\xb7\x2e\x8c\x02\x4b\x4f\x66\xfa\xfe\xe1\x3b\x32\
-\x30\xc0\xe8\xfc\x2c\x27\x28\x07\x69\xb2\x59\x59\x70\xba\x46\xc1\
-\xd7\x5e\x7c\xca\x40\x3e\xa6\x34\x90\x81\x7c\x06\x46\xe2\x62\x61\
-\x10\x9e\x0d\xf5\x68\xba\x28\x73\xe4\x8b\xfd\x53\x93\x02\xf9\x60\
-\x11\xd2\x86\xe4\x4f\x59\x69\x13\xfa\x9f\xe5\x8f\xe5\x11\xf4\xa3\
-\x68\xfc\x28\xc3\xb0\xd4\x05\x75\x82\xcc\xc8\x40\xbd\x53\x67\xb1\
-\x6d\x24\xb0\x79\xee\xfd\x9b\x3d\x85\xd0\xeb\x18\xc7\x7c\xa8\xad\
-\xad\x2d\x95\x42\x19\x2b\xcb\xe3\x92\xeb\xaf\xbf\xbe\x54\x83\xbd\
-\x04\x65\xb1\x65\xcb\x96\xd3\x67\xcc\x98\x51\x2a\x45\x73\x41\x79\
-\x79\x79\xfa\x8e\x3b\xee\x38\x88\x3f\x7c\xa4\x34\xab\xf4\xce\xff\
-\x1e\x2e\xc3\x5d\xca\xe2\x6c\x85\x2b\x53\xf8\x53\x88\x47\xfc\x1b\
-\x6f\xbc\x91\xbf\xc8\x76\xb1\x96\x35\xdf\x99\x3d\x7b\x36\x8d\x5f\
-\x10\xa2\xb2\x17\x4b\xc1\x1a\xb3\xa8\xca\x25\xbc\x1b\x17\x46\xc3\
-\xf8\x48\x1c\xe8\xf3\x8b\x63\xae\x78\x85\xa4\x25\x14\x5b\x36\xf2\
-\xca\x2a\x5f\x34\x4c\x2e\x12\xc7\xe2\x15\x43\x5f\x1c\x21\x5a\xc7\
-\x45\xa7\x6b\x0c\xe3\x07\xe5\x08\x7f\xfb\xf2\xf3\xa6\x8f\x7b\xae\
-\xf0\x3e\x77\x1f\xc3\xb0\x96\x7f\xe6\xb7\x27\x4c\x8f\xa5\xe7\x63\
-\x18\xb6\xa0\x3c\x7c\xf4\x3a\xc6\xb1\x10\x48\x01\x04\xd7\xe3\xd7\
-\xaf\x5f\x3f\x5c\xca\xa1\xfc\x96\x5b\x6e\x09\xde\xeb\xeb\xeb\xcf\
-\x91\x75\x31\x5b\xca\xe6\x8b\xbc\x6b\x89\xf2\x55\xbd\x57\xed\xdc\
-\xb9\xf3\xeb\xbc\x2b\xec\x19\xf8\xbf\xff\xfe\xfb\x17\xf0\x3e\x65\
-\xca\x14\x2c\x96\xf2\x4d\x9b\x36\x9d\xc2\xbb\x59\x32\x85\xc2\x27\
-\x7f\xc2\x84\x09\xf7\x0d\xbd\x8e\x71\x2c\x06\x2c\x41\x64\x61\x1c\
-\x25\xab\x62\x1c\xca\x40\x4c\xbf\xf7\xde\x7b\x17\xc8\x6a\xb9\x08\
-\xab\x83\x77\xa5\x39\x3f\x54\x14\xfc\xdf\x9c\x0b\xa5\x48\x46\xe1\
-\x8e\x9b\xc2\x95\xaf\x5b\xb7\x2e\xb3\x81\x5b\x2c\xa2\xb2\x27\x4c\
-\x98\x70\xdf\xd1\xeb\x18\xc7\xee\x40\xca\xe1\x9b\x28\x09\x28\xa5\
-\x71\xea\x43\x0f\x3d\x84\x49\x99\x7a\xe0\x81\x07\x4a\x64\x9d\x7c\
-\xde\xfc\xa4\x7c\xd8\x41\xef\x36\x7c\xf2\x27\x4c\x98\x70\xdf\x30\
-\x18\xcc\xfb\x03\x58\x17\x5a\xd6\xac\xad\xac\xac\xbc\x92\x8c\xcb\
-\xca\xca\x8e\xb9\xf4\xd2\x4b\xf9\x9e\x25\x35\x7a\xf4\xe8\x2b\xd2\
-\xe9\x74\xf0\x17\xd2\xa7\x4f\x9f\xfe\xdd\xc6\xc6\x46\xfe\xe3\x5f\
-\x10\x2f\x41\x82\x04\x07\x06\xf6\x9b\x32\xe1\x23\xc0\x29\x53\xa6\
-\xac\xee\xdf\xbf\xff\x4f\xb9\x09\x3c\x61\xc2\x84\xc7\xb5\xac\x79\
-\x5f\x96\x48\x49\x43\x43\xc3\xb6\x1b\x6e\xb8\xe1\xd1\x3d\x37\x84\
-\x53\x4b\x2a\x2a\x2a\x5e\x21\x7c\x82\x04\x09\x0e\x1c\xec\x37\x65\
-\x02\xaa\xaa\xaa\xf8\x6a\xb8\xbe\xba\xba\x3a\xf8\xe7\xe4\x75\x75\
-\x75\xfc\x05\xf6\xce\xad\x5b\xb7\x72\xbf\x22\x85\xfb\x80\x01\x03\
-\x7e\x4f\xb8\x04\x09\x12\x1c\x48\x48\xa5\xfe\x00\xc4\xe2\x5d\x7c\
-\xcf\xb9\xd1\x11\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x4b\x08\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x70\x00\x00\x00\x70\x08\x06\x00\x00\x00\xc6\xe0\xf4\x4b\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x4a\x9d\x49\x44\x41\x54\x78\x5e\xed\x7d\x05\x80\
-\x5c\xd5\xd5\xff\x7b\x6f\xdc\x76\x66\x67\x5d\xb2\x92\xb5\xac\x65\
-\xe3\xb6\x71\x62\xc4\x21\x21\x8a\x94\x0f\xe8\x87\x5b\xa1\x1f\x5a\
-\xa1\x2d\x50\xda\xc2\x87\x53\x28\xa5\x58\x08\x04\x0d\xc4\x5d\x88\
-\x67\x93\xec\x6e\xd6\xdd\x6d\xdc\x9f\xfe\xcf\xb9\x33\xb3\xec\x26\
-\x41\x8b\x84\xfe\xbf\x93\xcc\xbe\x37\x57\xce\xbd\xf7\xfc\xce\x39\
-\xf7\xdc\xfb\x64\xa8\xff\x70\xa2\xf5\x2a\x19\x65\x50\x31\xe4\x9c\
-\xa4\xfc\x1f\x5d\xfc\x14\x42\x4a\xa6\x57\x6a\xa8\xc3\xd7\x4f\x5e\
-\x74\xf8\xba\xc9\x8b\xf0\x1c\xd3\xfe\xd3\x50\x94\x85\x8e\xff\x51\
-\xa4\x90\x31\x32\x51\x92\x84\x3f\xcc\x28\x1a\xbf\xb2\x20\xf9\xe3\
-\x64\x93\x7e\x99\x82\x56\xec\xda\xd1\xd0\xd9\x16\xca\x93\x42\x45\
-\x7f\xf6\xf4\x1f\x07\xa0\x9c\xa1\x19\x5e\x94\xc4\x55\xf9\x89\xb9\
-\x8f\xce\xc8\xd8\xe4\x09\xb0\xd1\x7e\x96\x53\x4d\x4a\xd6\xcf\x6f\
-\xb0\xf9\x36\x9f\xe9\x76\xf6\x62\x19\x51\xa2\xfe\x23\x40\xfc\x8f\
-\x02\x70\x00\x78\x29\x6f\x5d\x36\x72\x33\x2b\x50\x69\x90\x2c\xd2\
-\x34\x0d\x60\xd1\xc6\x95\xf9\x49\xb3\x6a\x2d\xee\x4f\x4a\x7b\x5c\
-\x8e\xff\x14\x10\xff\x63\x00\x64\x00\x25\x01\x5c\xe3\xea\xfc\xa4\
-\xa8\xb7\x2e\x1f\xbd\xd9\xc3\x0a\x05\xe0\x28\x05\x9a\x26\xf3\x1e\
-\x8d\xe7\xac\x28\xc6\xae\x2a\x48\x9a\x52\x6f\x71\x6d\x38\xd3\xe3\
-\xf2\x31\x34\xa4\x87\xea\xff\x5c\xe9\x3f\x02\x40\x19\x80\x87\xf3\
-\xda\xd5\x39\xa9\xca\x37\x97\x8d\x7c\xdf\xcd\xf2\x93\xc1\xb6\x78\
-\x00\x4f\x1e\x2a\x42\xc1\x39\x83\x69\xac\x28\x0d\x59\x59\x98\x38\
-\xbc\xd1\x1e\x78\xff\x4c\xb7\x43\x00\x74\x7f\xd6\x20\xfe\xec\x83\
-\x32\x00\x86\xc2\x90\x64\x88\x5e\x43\x55\xdc\x70\xc9\x3a\x5a\x25\
-\xae\xe6\x05\x91\x07\x8b\xec\x07\x6f\x20\x81\xdb\xe4\xe5\x0c\x25\
-\x97\x68\xcd\xba\xbc\x17\xb6\xad\x6d\x75\x7a\xfa\x79\xfc\x1c\xe9\
-\x67\x6d\x81\x21\xc1\xd3\x09\x00\xde\xbb\xcb\x47\x3d\x93\x18\xa9\
-\xba\xee\xab\xc0\x43\x42\x4b\x14\x10\x44\x9a\x2b\x2a\x1e\x12\x19\
-\xbd\xb5\xae\x77\x8b\x8b\x05\x63\xfd\x99\xaa\x32\x59\xe1\xfe\x5c\
-\x09\xbc\x1f\x39\x26\x18\x54\x54\x41\x8c\x21\x46\x14\x28\x0a\xc0\
-\x11\xbf\x0a\x0b\xcc\x83\xb9\x52\x14\x61\xe8\x05\x31\x11\xb1\x09\
-\x3a\x25\x26\x4b\x61\x5e\x3f\x37\xfa\x99\xea\xdd\x17\x84\xc1\x0b\
-\xce\x7f\x05\xb1\x11\xf2\x1d\x6b\xc7\x6f\x30\xa9\x94\x4b\xfd\xbc\
-\xc0\xc9\x18\x5a\x11\x2a\x32\x88\x00\x3c\x4e\xab\x90\x2b\xac\xbe\
-\xc0\xa6\x39\x6f\x1d\xb9\xbc\xac\xd7\xc5\x86\x79\x84\x8a\xfc\xac\
-\xe8\x67\x0f\x20\x12\x2c\x09\x68\x58\x3e\x48\x79\xd1\x7a\xdd\x96\
-\xb5\x13\x36\x46\xaa\x15\x33\x45\x51\xe2\x20\x79\x10\x88\x00\x11\
-\x07\x23\x06\xf0\xd8\x83\x0b\xd7\x1f\x9b\x7f\xb6\xd7\xe5\x0a\xd7\
-\x0d\x15\xf9\xd9\xd1\xcf\xce\x85\x82\xbc\xc9\x67\x20\x21\x00\xb8\
-\xae\xab\xe8\x73\x7b\x2e\x7b\xf7\xc4\x4a\xa5\x24\x3b\x09\xc1\x8a\
-\x02\x50\xe1\x43\x45\x90\xf8\x80\xc0\x2b\x22\x74\xda\xf2\x27\x0e\
-\x75\x5d\x81\xe0\x29\x65\x0c\xae\x1b\xcf\x03\x4f\xfe\x33\x52\xeb\
-\x9f\x55\x10\x03\xcb\x05\x00\x0f\x96\x06\x70\x00\x10\x07\x89\x1e\
-\x17\xe5\xe0\x36\x65\x1d\x2e\xbf\x27\x9a\xd1\x6c\x9b\x3e\x2c\x7a\
-\x81\xcb\xcf\xc5\x00\xb0\x30\x33\x52\x12\x2b\x88\xf2\x68\x83\xa6\
-\xf9\x6f\x7b\xab\xe7\x3f\x7a\xb8\xa2\x15\x78\xc9\x70\xd1\x1f\xac\
-\xfd\x05\x29\x18\x5a\x0e\x8b\x47\x19\x43\x96\x8e\x17\x3f\xfd\x6c\
-\x00\x44\xa3\x03\x90\x98\x58\x9d\x52\x30\x28\x65\xa2\x33\x20\xc8\
-\x00\xb0\x41\x33\x17\x9c\x4b\x08\xcc\x96\xe6\x2e\x9b\x4e\x26\xdb\
-\x35\x3b\x3b\x7e\x99\xc7\xcf\x47\x60\xbd\x28\x83\xba\xef\xaf\x9f\
-\xd7\xce\xbf\x77\x77\x45\x25\xf0\x92\x41\x1a\x02\xdb\x4f\x68\x74\
-\xb0\x26\x94\x81\x6a\x08\x99\x4a\xb9\xe8\xe0\x05\x5a\x3a\xc7\xd2\
-\xff\x8f\xbe\x23\x85\xe4\x28\x37\xa9\x14\xd4\xa9\x1b\xa6\x3e\x50\
-\x7f\xdb\x94\x1b\x62\x75\x64\xa5\xa0\x00\x0b\x23\x99\x61\x0a\x02\
-\x41\x13\xc5\xfc\xcb\x25\xb9\xc5\xd2\xef\x16\xbb\xa5\xdf\x2f\xf1\
-\xfd\x65\xd6\xb0\x69\x98\x86\x56\x7a\x2e\x2c\xf8\x5d\x21\x0b\xce\
-\x97\x77\x4c\x18\x3a\xdb\x7f\xfd\x94\xff\x4d\x52\x93\xaf\x60\xe9\
-\x78\xf8\x3f\xfa\xce\x44\x00\x01\xb7\x86\x67\x9f\xaf\x9c\xb2\x54\
-\xfa\xcd\x22\x89\x7f\x78\x11\x7f\xf6\x86\x29\xab\xe2\xd4\x2a\x2c\
-\xa2\x90\x9f\x63\x29\xa4\x4e\x08\xc4\x67\xe7\x15\x5c\xf1\xec\xdc\
-\x82\x95\x78\x8e\x69\x17\xc2\x23\x0c\xde\xad\x63\xd2\x8a\xa5\x87\
-\x17\xf5\xb2\xbf\x5d\x2c\x1d\xfa\xaf\xc9\xf7\x40\x30\x84\xc9\xe7\
-\xb2\xbf\xa8\xe8\x22\xee\x5a\x90\xc0\xc2\x70\xae\x12\x6e\x18\x99\
-\x52\xf8\xe2\x82\xa2\xbd\x30\xaf\x99\xd1\xfd\x99\xb5\x4a\xa9\xa2\
-\xdd\x71\xe5\xcc\x77\x8f\xbe\xdb\xed\xf1\x23\x88\x1c\x3f\xc0\x9f\
-\xe2\xc0\x40\xf0\xb8\x61\x4d\xe6\x39\xb0\x24\x06\xb2\xe1\xeb\x60\
-\x42\xf0\x38\x41\xe2\x00\xbc\xa9\xcf\x2e\x28\xfa\xd8\xe1\x63\x23\
-\x45\x5e\xe4\x23\x4d\x5a\xf9\xe7\x7b\xab\x16\x4c\xde\x5d\xb9\x19\
-\x7c\xb5\x5c\x14\x44\xfe\x62\x9c\x13\x2f\xea\x39\x10\x23\x4b\x0c\
-\x34\x6e\x1a\x93\x12\xf3\xd2\xa2\xa2\x8d\xae\x00\x9f\x0a\xc1\x8b\
-\x00\x16\xc9\x78\x38\x9e\x49\x89\xd2\x2d\x5b\x98\x95\x58\xfb\x51\
-\x79\xe7\x19\x07\xcf\x41\xfc\x01\x81\x4d\xa8\x6e\x88\x24\x04\x0e\
-\x80\xc4\x88\xe4\x42\xe0\xc9\x01\x3c\xfe\x8e\x71\xe9\x97\x3c\xb3\
-\xa0\x68\xa3\xc3\xcb\x1a\x01\x78\x51\x06\xa6\xea\xf5\x73\x74\x66\
-\x5a\xd4\x9c\x5e\x2f\xbb\xe9\x58\xbb\xbd\x1b\x15\x09\x18\x5c\x74\
-\x18\x5e\xb4\x00\x82\xd4\xf1\xea\x02\x9d\x62\xd4\x4a\x9f\xac\x9a\
-\xb0\x9e\xe3\xc4\x29\x10\x76\x86\xb7\xc9\xc0\x17\xd2\x92\x87\x15\
-\xe8\x64\xa3\xea\xb2\x45\x69\xe9\x55\x1f\x97\x36\x94\x39\x24\x51\
-\x01\xeb\xa2\x41\x40\xc1\x39\xda\xe5\x79\x82\x0f\x83\x77\xd7\xf8\
-\xa1\xd3\x9f\x9a\x3f\xfc\x13\xbb\x87\x35\x60\x5d\xb4\x5a\xc8\x46\
-\xcc\x85\x80\x48\xe9\x97\x15\x24\x4c\xea\xf3\x48\xef\x1d\x6d\xb7\
-\x78\x41\x19\x2e\xba\x8d\xef\x8b\x12\x40\x9c\x73\x40\xea\x4c\x8c\
-\x4e\x29\x7e\xb0\x7c\xcc\xef\x12\x74\xca\x5f\xb2\xa2\x28\x00\x68\
-\x03\xf7\x38\x69\x70\x9b\x92\x8b\x13\x64\x43\x22\x99\x05\x5a\x3f\
-\x77\x66\x53\x9b\xad\x0a\x00\x66\x2e\x04\xd8\x40\x42\xab\x14\x44\
-\x4a\x00\xcb\x1b\xff\xd4\x9c\x82\x8f\x6c\x5e\x36\x12\xac\x9a\x5c\
-\x7a\x0a\x15\x21\xee\x17\xfa\xc0\x73\xbc\x90\x74\x49\x7a\xc2\x90\
-\x75\x65\x6d\x1f\xda\x03\xdc\x45\xb7\x67\x7a\xd1\x01\x88\xf2\x01\
-\xe9\x33\xb0\x0e\x13\x77\x2e\x9b\x74\xd5\xb8\x34\xe3\xd3\x5e\x56\
-\xe4\x31\x7a\x0c\x65\x0f\x24\x04\x51\xf4\xf2\x92\x72\x6c\x76\xec\
-\x7c\x70\x81\x25\x47\x3b\xec\xf5\x64\xbe\xfb\x12\x10\x11\x60\x30\
-\x51\xf1\x96\xb1\x69\x63\x9e\x99\x57\xf8\x91\xcd\xcf\xc5\x13\xf0\
-\x2e\x20\x0b\x04\x51\x94\x68\x5e\xc1\xf0\x45\x13\x93\x4c\xf2\x7f\
-\x95\xb5\xef\x46\xc5\x42\xfd\x0a\x15\xf9\xc9\xe9\xa2\xdd\x89\x41\
-\x29\x99\x8d\x72\x35\xae\xc5\x20\x0a\x09\xe1\x7a\x41\x62\xc0\x2c\
-\x79\xbf\x9f\x37\x3d\xbb\x64\xe4\x13\xb3\xd3\x63\x94\x08\x10\x58\
-\xeb\xb9\x60\x13\x84\xc0\x0d\x8b\x97\x42\x74\xf9\xdc\x9c\x82\x3f\
-\x5b\xfd\x7c\x12\x84\xa5\xec\x85\xc0\x0b\x91\x24\x88\x22\xa5\x91\
-\x2b\xa8\x68\x9d\x2a\x78\x6f\xdb\x45\x04\x1e\xd2\x45\x67\x81\x48\
-\x60\x25\x12\xcc\x7f\xcc\xa6\x86\x9e\x93\x4b\x87\xc6\xb5\xc6\xea\
-\x55\x4b\x7c\x1c\x0f\xcb\x09\x34\xac\xf3\xac\x50\xe2\x24\x49\x66\
-\x54\xcb\x7d\x8f\xec\xad\xba\xf6\x9f\xa7\x5b\xeb\x82\x96\x73\xbe\
-\xa0\x49\x65\xc8\xab\x85\xc8\x08\xc0\xa8\x9c\x93\x13\xb7\xcc\xcb\
-\x09\x7a\x00\x1b\x23\xd5\x73\xf9\x8a\x1c\xa0\x67\x54\x2b\xe4\xf5\
-\x36\xef\xef\xe7\xac\x3b\xf2\xa0\x1d\x02\x1b\x50\x2c\x9c\x53\x2f\
-\x1a\xba\x28\x01\x44\x01\x21\x88\x36\x1f\x27\xdf\x58\xde\x0d\x20\
-\xa6\x37\xc5\xc6\xa9\x17\x7b\x7c\x2c\x0d\xd1\xe0\x40\x10\xa5\x00\
-\x08\x39\x4a\xaf\x66\xde\x3c\xd3\x76\xe3\x9d\xdb\xcf\x7e\x48\xe6\
-\xc0\xd0\xd2\xe1\x4b\x88\x44\xa6\x7b\x9a\x2d\xed\x19\x34\xd5\x30\
-\x21\x2d\x66\x85\x8b\x17\x45\x45\xd0\x62\xc3\x7c\x11\x3c\xc9\x04\
-\xe0\x35\xda\x3c\x0f\xcc\x79\xfb\xc8\x1f\x9b\x1d\x3e\xf0\xb4\xb4\
-\x38\x28\x42\xba\x08\xe8\xa2\x04\x10\x09\xe5\x04\x60\x89\x56\x8e\
-\x53\x6c\xac\xed\x2a\x59\xcc\xf2\x75\xc9\x19\x51\x8b\x3d\x9c\x88\
-\xfb\x94\x24\x5a\x04\x19\x0b\x68\x21\x2d\x56\xdf\x1f\x7e\xf9\xd9\
-\x99\x27\x2d\x7e\x0e\xa6\x44\x08\x5e\x83\x2c\x08\x81\xd0\x31\x62\
-\x65\x00\xd1\xfe\x64\xa8\x0b\xf1\x2d\x25\x3f\xdb\x62\x2b\xbf\x34\
-\x2f\xc1\x97\x60\x50\xcf\xf1\xf3\x92\x80\xc0\x42\x36\x80\x27\x51\
-\xc0\x57\x56\xd3\xe7\xb9\x6b\xee\xba\x23\x7f\x6d\x76\xfa\xe4\xd8\
-\x17\xf0\x0a\x41\x06\x17\x11\x5d\xb4\x00\x22\xa1\xb6\x63\x90\x62\
-\xe5\x59\xc5\xd6\xc6\x9e\x33\xf9\x82\x54\x97\x91\x13\xbf\x98\xe7\
-\x04\x39\x00\xc2\x29\x64\x8c\xa2\xcd\xe9\x7b\x67\xde\x3b\x47\x6e\
-\xad\xb5\x79\xd0\x42\x00\xd3\x2f\x84\x8c\xd6\x08\xb8\x91\xdd\x6c\
-\x04\x12\x72\x48\x26\xfe\x41\x6b\xb2\x88\x92\x6c\x4b\x7d\xef\xc1\
-\x85\x59\x71\x49\x46\xb5\x6c\x2c\x04\x2c\x1c\x18\x23\x03\xe0\x31\
-\x55\x56\xf7\x6d\xc0\xf7\x99\x16\xa7\x1f\xc1\xe3\xc1\xeb\x62\xd5\
-\x8b\x8e\x7e\x72\x00\x31\x58\xc1\x08\x13\x05\x7c\xa1\x79\x0b\x7d\
-\x21\x5a\x9c\x5d\xc6\xc8\xff\xd5\x6c\x29\x15\x05\xb1\x76\x7e\x76\
-\xdc\x02\x3f\x2f\xaa\x35\x32\xf9\xf1\x59\x6f\x1f\x59\x59\xd1\xe7\
-\x0a\x80\x90\xf1\x62\x6d\xb0\x12\x90\x52\x16\xdc\x04\xb8\x7e\x54\
-\x52\xd4\xe5\x31\x7a\xcd\xae\x6e\x97\x47\x0e\x69\xe1\x36\xf0\x0f\
-\x28\x07\xd5\x07\x6e\x79\x5f\x8b\x6d\xe7\x4d\x63\xb2\x26\xfa\xb9\
-\x40\x66\x84\x5a\x49\x35\x59\xd9\x5b\xe7\xbe\x73\xf8\xf9\x56\x07\
-\xb1\xbc\x2f\x05\x0f\xf2\xf0\xaa\x08\x5a\xed\x45\x68\x9b\x3f\x12\
-\x85\xdc\x16\xa1\x90\x40\x42\xdf\x06\x13\x16\x02\x50\xc8\x3a\xf0\
-\xde\x49\x19\xab\xa4\x47\x96\xd4\xfe\x66\xf2\xb0\x61\xf8\x1d\xea\
-\x0d\x52\x44\xf8\x4e\xe6\xb3\x94\x08\xb5\xac\xea\xd6\x99\xdb\xa5\
-\x5b\x66\xee\xc9\x31\x84\x36\x36\xa1\x0d\x3c\x86\x49\xce\x20\x6b\
-\x9a\x7a\x68\x7a\x7e\x92\xf4\x87\x25\x67\xab\x7f\x39\xfb\xf6\x54\
-\x83\x8e\x64\x41\x59\x52\xe6\x5c\x42\xf6\x03\xf9\x0c\x1c\xc3\xff\
-\x37\x14\xc2\x89\x49\x8e\x50\x53\x3b\xae\x9c\x70\xdd\x6f\xa6\x64\
-\x4f\xc5\x04\x30\x45\x30\x94\x2f\x41\x11\x08\xe7\x33\x10\x9e\x7c\
-\x5c\xa2\xc9\xa4\x84\xc2\x90\x34\x18\x90\x60\x5d\xd9\x90\x08\x0d\
-\x55\x7d\xcb\x8c\x97\xd9\x07\x16\x48\x4e\xf8\x54\xde\x3c\xe3\x8d\
-\x54\x23\x79\x3e\x02\xeb\x0f\xe2\x0f\x5f\x18\x64\x35\x2d\x25\xda\
-\x94\x1a\xa1\x43\xa0\xc9\xf7\x0b\x11\xf6\x0d\xfb\x88\xe7\xd8\xe7\
-\x1d\x6b\xc7\x5f\x9f\x1c\xe4\xfb\x15\xbd\xfe\xe1\xe8\x27\x73\xa1\
-\x8a\xe0\xde\xa2\xf8\xfb\x69\xd9\x53\xd7\x8c\x4a\xfb\x53\x71\x9c\
-\x61\xc6\xac\x8c\xf4\x8e\x43\xed\x96\xea\x5e\x8f\x5f\x86\xda\x7f\
-\x21\xcf\x05\x49\xb0\x34\xa4\xe9\x76\xa7\xdf\x8f\x92\x07\xdf\xd5\
-\x5f\x0a\x71\x01\x37\x2a\x1f\x62\xd4\x08\x3b\xae\x1c\xff\xbb\xac\
-\x48\xfd\xdd\x4e\x56\xe0\x21\x51\x4c\xd4\xab\x47\x2e\xc8\x8a\x31\
-\x7e\x52\xdd\xbd\xd5\xee\xe7\x11\xc3\x81\xec\xf1\x3a\x22\xd3\x68\
-\xf7\x06\x5c\x2c\x8f\xfc\x21\xda\x3c\xbf\x71\xac\x84\xdb\x7b\xd9\
-\x51\x46\x61\xc3\xf2\xc9\x0b\xd6\xe6\x47\x3f\x9a\x95\x68\x9e\x0a\
-\xa5\xcb\xb6\xd5\xf7\x36\x87\xc6\x74\x81\x5e\xff\x70\xf4\x93\x00\
-\x08\x72\x40\x41\x88\xbf\x9a\x98\x95\xf0\x50\x71\xc6\x53\x76\x77\
-\x40\x0d\xf3\x8c\x34\x2c\x46\x3d\xef\xd2\xcc\x68\x61\x4b\x5d\xcf\
-\x89\x3e\x2f\xcb\xa0\x85\x41\xb9\xf3\x04\x82\xa0\x11\x61\x0e\x90\
-\x32\x9a\xa1\x08\x9e\x6d\x28\x4d\xf3\xbb\xd6\x4e\xba\x39\x3d\x2e\
-\xe2\x09\x87\x8f\x17\xd0\xed\x42\x51\x06\xa2\x57\x3e\xc1\xa0\x29\
-\x5e\x98\x11\xef\xdd\x54\xdd\x71\xd0\xc6\x22\x88\x5f\xe8\x08\x0a\
-\x1e\x13\xe0\x20\x5d\x48\x71\xf0\xf6\x0b\x0e\xa2\x9c\x2c\xb3\x56\
-\xdc\xb4\x7a\xec\x8d\xa3\xe3\x75\x0f\xb8\xfc\x82\xe0\xf3\xb3\xd2\
-\xb4\x21\x51\xa3\x7c\x0a\x69\xe7\x81\x46\xab\x0b\x58\xfc\xa8\xfb\
-\xa5\x3f\x3a\x80\x20\x4c\xdc\x0d\xa1\xc1\x3a\xa8\xf5\x97\x8d\xfe\
-\x93\x28\x8a\x23\x01\x4f\xb2\xc8\xf2\x04\x78\x2e\x5e\xab\x9a\xb6\
-\x74\x58\x7c\x2c\x44\x87\x87\x7b\x3c\x01\x88\x34\x2f\xfc\x0c\xc3\
-\xb9\x42\x06\xb6\xb8\xfe\x13\xfe\x36\x35\x7b\xf9\xcc\xfc\xc4\x57\
-\xad\x7e\x9e\x56\x81\x59\x41\x31\xe2\xd8\x10\x45\x37\x2c\xee\x52\
-\xcc\xda\xb9\x06\x05\x53\xb7\xb1\xb6\xe7\x0c\xb4\x3b\x68\xcb\x0d\
-\x79\x9e\xc3\x96\x10\xf6\x01\x96\x16\x62\x0e\x2c\x38\x77\xae\x99\
-\xf0\x48\xaa\x41\x73\xad\xdd\xc7\x7a\x50\xc1\x60\xd2\x86\xc0\x55\
-\x8a\x9d\x3e\x34\x3a\x7e\x43\x45\xc7\x36\x8b\x17\x17\xfb\xa8\x08\
-\x3f\x0e\xfd\xe8\x00\xc2\xc0\xd0\x58\xa4\xcf\xd6\x8c\x5b\x93\xa2\
-\x57\x5d\x0b\x0b\x71\xd0\xda\xe0\x3e\x27\x5a\x80\x97\x17\x7d\x31\
-\x5a\xe5\x98\xf9\x99\x31\x99\x55\x16\xfe\x50\x93\xc3\xeb\x03\x9b\
-\x20\x75\xb0\xfe\x85\x08\xe7\x30\xc8\x14\x1f\x99\x96\x73\xc9\xcd\
-\xd3\x72\xde\x76\x06\x78\x8d\x32\xb8\xe0\x1f\x38\x3f\x12\x53\xf4\
-\xb2\x02\x3d\x26\x29\x72\x0e\xe4\x9f\xdc\xdd\x64\xa9\xc3\xba\x90\
-\xf7\x95\xbc\x61\xca\x13\x67\x0d\x4d\x34\xbd\xb3\xa4\xe0\x89\x94\
-\x08\xdd\x7c\x27\xcb\xdb\x55\x60\x91\x98\x8d\xf9\xbc\x24\xf9\xd5\
-\x12\x93\x37\x36\x29\xc2\xf2\xcf\xd3\x6d\xe5\xe1\x31\x12\x06\x3f\
-\x30\x0d\x1c\xe0\x0f\x4e\x68\x25\x70\x10\xef\x2f\xce\xc8\x1f\x1b\
-\x17\x71\x13\x78\x38\x1f\xce\x3d\xc1\x5c\x32\x62\x1a\x04\x2b\x77\
-\x07\x78\x7b\x82\x4e\x75\xc9\xb6\xab\x26\x3e\xf7\xc8\xd4\x9c\x78\
-\x48\xc7\x9b\x75\xe1\xff\xf9\x84\x89\x58\x0f\x56\xf7\xd4\xd2\xdc\
-\xd8\x61\x30\x09\x19\xc1\x07\x72\x90\x7c\xde\xd8\x90\x07\x58\x29\
-\xde\x33\xaa\x5f\x3a\x2c\x71\x18\x2e\x23\xb0\xee\x05\x19\x03\x91\
-\xf2\xd0\xf6\xef\xa6\x66\xc7\x41\x5f\x9e\x8f\xd7\xa9\x66\xb8\x59\
-\xce\x8e\x7d\xc4\x7a\xa1\x62\x24\xb0\xf2\x09\x82\x77\x6c\xbc\xf9\
-\xe6\xfb\x8b\x33\xf3\x21\x29\x7c\x59\xea\x07\xa7\x1f\xa5\x91\x30\
-\x85\x67\xac\xcb\xf3\x12\x47\xcb\xe5\xf2\x44\x98\xf7\xf8\x73\x85\
-\x87\x45\x30\xca\x13\x24\xda\x61\x71\xda\x47\xde\x37\x7d\xe8\x3f\
-\x6e\x1f\x93\x12\x05\xe9\x64\xde\x0b\x96\xfa\x82\xb0\x3c\xa4\x0a\
-\x82\x48\xd1\x73\xde\x3c\xf6\x7c\x65\x9f\xeb\x0f\x91\x1a\xa5\x02\
-\xbc\xe5\x79\xbc\xf1\xfa\x9f\x59\xa3\x50\x54\xf6\xba\x1e\x9b\xfd\
-\xd6\xe1\x67\xc0\x72\xc0\x8b\x42\x88\x13\xca\x1f\x48\xd8\x16\xb6\
-\x79\xdb\xd8\xa1\xe6\x07\x66\x66\xfe\xc3\xea\xb0\x8d\xc0\x3e\x61\
-\xdf\xce\x2d\x8f\xed\xf0\x22\x25\x28\x14\xb2\xa4\x65\xf9\xc9\x63\
-\x30\xed\x8b\xd9\xf9\x87\xa5\x1f\x15\x40\x10\x16\xd9\x34\x9e\xf7\
-\xd6\xd1\x37\x4e\xb6\x5b\x7e\x1f\xa9\x51\xe8\x60\x41\x8e\x7d\x38\
-\x6f\xef\x12\x83\x01\xb5\x9c\x91\x04\xbf\xa2\x6d\x7f\xab\xcb\x89\
-\x69\x17\x0a\x2e\x90\x50\x58\x28\xef\x2e\x4f\x80\x99\xfd\xf6\x91\
-\xdf\x54\xf4\x3a\x9f\x07\x10\xe5\x10\x74\xf4\xdf\x17\x0a\xf3\x14\
-\xaf\xd6\x28\xe4\x65\xbd\xce\x57\xe6\xbe\x7d\xe4\x81\x6e\x28\x8b\
-\x75\xbe\x4c\xd0\xe1\xb6\xf6\xb7\xd8\x9c\xbc\x4f\xde\xaa\x92\xcb\
-\x70\x0f\xf5\x3c\x05\x02\x12\xfc\xbc\x20\x8b\xd4\xca\x75\x25\x9d\
-\xf6\xdf\xce\x7d\xf3\xd0\xeb\x90\x86\x8a\x71\xde\x98\x7e\x08\xfa\
-\x09\x82\x18\x8a\xf2\x72\x02\xfd\x41\x65\xe7\x99\x99\x39\xb1\xcd\
-\x19\x31\xc6\xe9\x5e\x1f\xa7\x00\x69\x72\x90\x15\x56\x28\xdc\x8f\
-\x54\xeb\x95\x4c\xd7\xef\x3e\x6f\xb8\xf3\xbd\x8a\x16\x07\x0a\xef\
-\x42\xc1\x4c\x98\x30\x03\xad\x06\xe6\x3f\xfa\xa3\xea\xae\x4d\x73\
-\x87\x46\x0f\x8b\xd5\xa9\x86\xa3\x95\x63\x36\x23\x97\xc9\xe5\x16\
-\xf7\xc6\x69\x6f\x1f\xbd\xba\xd9\x1d\x08\x2f\x09\xbe\x92\x1f\xb6\
-\xd9\xe5\xf6\x8b\x02\xcd\x9c\x9c\x33\x34\x72\xb6\x8f\x13\x8d\xe0\
-\x2e\x91\x1f\x01\x12\xca\xf0\x10\xc1\x68\x22\x23\x0c\xec\x89\x0e\
-\xf7\x7d\xf3\xd6\x7d\xfe\x91\xc5\x17\xba\x62\xf1\xa5\x9c\xbf\x5f\
-\xfa\x29\x82\x18\x74\x91\x34\x84\xf5\xf2\xcd\x15\xdd\xd5\x89\x4e\
-\xdf\xa9\xbc\xac\xb8\x49\x92\x20\x19\x21\x8b\x05\xcd\x85\x88\x4f\
-\xa4\x4c\x11\x1a\xe9\x9f\xe5\x1d\xf7\xdf\xb3\xad\xb4\x02\xd7\x57\
-\xf8\xd0\x0a\x61\x00\x84\x82\x05\x00\xb0\xef\x83\xe4\x84\x00\xc3\
-\xfc\x44\x3b\x02\xbc\x64\xab\xef\xfb\x6c\xd5\x98\xf4\x31\x1e\x49\
-\xca\x86\x9a\x8c\x51\x4b\xef\xfd\xf5\x67\xa7\x97\x6f\xee\x74\x06\
-\x70\x4b\x0d\xb7\xd9\x42\xd5\x08\x41\xb5\xf3\xb6\xf4\xf0\x0f\xb6\
-\xbd\xaf\xb9\xc7\x95\x62\xd2\x35\x4e\x4a\x8d\x9e\xe7\xf5\x73\x78\
-\x03\x31\xce\xa5\xe0\x35\x25\xad\x5e\x25\xef\xb8\x6b\x5b\xf9\x6d\
-\x77\x6f\xaf\x3a\x6c\xf7\x03\x6b\x08\x9e\xbe\xcc\x53\xfc\x10\xf4\
-\xa3\x03\x88\x84\x52\x07\x19\x88\x5e\x41\x90\x6f\x68\xb3\xb5\xf5\
-\x7a\x02\x87\x96\xe5\xc6\x8f\xf5\x0b\x52\x02\xc8\xce\x03\xae\xd3\
-\x78\xb6\xd7\xfd\xea\x8d\x5b\xce\x6e\x70\xf8\x58\xb0\xca\x2f\x16\
-\xdd\x28\x60\xf4\x50\xb8\x8e\xc4\x65\x00\x7e\x1d\x28\x2f\x00\x1a\
-\xe7\x4a\x59\xa9\x8f\xe5\xac\x2c\xbf\x79\x59\x4e\xfc\x02\x8d\x52\
-\x66\xbf\x6d\x5b\xf9\xa5\xcf\x9c\xe9\xb0\x63\xde\x85\xc0\xc3\x03\
-\xf2\x0c\xf6\x6d\xe0\x5a\x0e\xb1\xa2\x98\xd3\xdd\xce\xe6\x99\x29\
-\x51\xea\x04\xbd\x6a\x12\xb8\x66\x37\xa4\x45\x18\x54\xf2\xaa\x9b\
-\xb6\x96\xdd\xf6\xc2\x89\xe6\x5a\x98\x5e\xe5\x50\x16\x97\xb3\xa1\
-\x7a\xff\x39\x84\x2e\x85\x48\xe8\x5c\x42\xc1\xc1\x5a\x8a\x28\xd1\
-\x7f\x8f\x4e\x89\x95\x7e\xbb\xf8\x4d\xef\xbd\xf3\xda\x03\xf7\x2f\
-\x78\x3d\x37\x5a\x8f\x5b\x5a\x41\x84\x42\x04\xeb\x31\x72\x7e\x4d\
-\x51\x62\x42\xe9\x0d\x53\x57\xe4\x46\xe9\xf1\x2b\x59\x1e\xe0\xc9\
-\x40\x42\x6b\xc2\xe3\xaf\x27\x66\xe4\xdc\x3b\x71\x68\x2e\x9e\xa3\
-\x35\xe1\x71\x20\x41\x5d\x3c\x30\x85\x06\x13\x75\x66\x7e\xd1\xa2\
-\x87\xa7\x0f\xc3\x28\x12\xeb\xf7\xc7\x07\xa1\x3e\xd0\xd8\xa7\xc0\
-\x83\x0b\x5e\x87\x3e\x76\x48\x0f\x2f\x7a\xe3\x97\xa3\x53\xa2\x31\
-\x1f\xc7\x70\x81\x2e\x90\x41\x93\xb1\xff\x8c\xf7\x4a\xc3\xa3\x42\
-\x10\x83\xa2\xba\x00\x01\x30\x44\xb0\xd7\x8e\x4a\x8d\x90\xfe\xb4\
-\xfc\xf1\xbb\xc6\x0e\x2d\xc0\xef\x72\x86\xac\xb5\x08\x85\x04\x44\
-\x67\x46\xea\xa8\xba\x5b\x66\xfc\x4d\xfa\xed\x92\xb6\xe6\x3b\x66\
-\xdf\x9d\x1b\x6d\x20\xe9\x17\x02\x11\xd2\xb0\x3e\xa6\x63\xfe\x79\
-\x42\x0c\x83\x97\x17\xa3\xa5\x3a\xee\x5c\x78\xa5\xf4\xf0\xe2\x3a\
-\xe9\xf7\xcb\xde\xff\xaf\x91\xb9\x84\xa9\x12\x26\x66\x3c\x22\x85\
-\xeb\xdf\x3d\x2e\xad\x40\x7a\x6c\xf9\x63\xd7\x8e\x4e\x8b\xc0\xef\
-\xf8\xda\x12\x3c\x9e\x4b\x58\x91\x80\xf7\x05\x0d\x3c\xff\xde\xe8\
-\x07\x61\x1a\x22\x5a\x21\x93\x4b\x5b\xd7\xcc\x18\xfd\xdb\xbd\xc7\
-\x3b\x0f\xb6\xda\x3b\x40\x08\x32\x70\x52\xc2\xa0\x87\x12\x42\x84\
-\x6b\x29\x09\xbc\x61\x56\xb4\x41\xaa\xef\x73\xa1\x8b\x44\x57\x4b\
-\xfc\x11\x62\x03\xae\x89\x19\x16\x65\x10\x77\x5c\x39\xe9\xce\x44\
-\x9d\xfc\x26\xab\x97\xb5\x46\x6a\x95\xd1\xbd\x3e\xee\x6d\x58\x12\
-\x3c\x52\xde\xeb\x22\x5b\x61\xe7\xfa\xb0\x90\xe0\xd1\xb7\x0d\x6a\
-\x16\xd2\x31\x8d\xca\x8b\x8d\x90\x76\x5e\x35\xf1\x8e\x58\x15\x73\
-\x93\xcd\xc7\xdb\xf5\x4a\xb9\xa9\xdb\xe3\xff\x6c\xce\xba\xe3\xf7\
-\xd4\x58\xdd\x18\xa9\xf6\xef\x8b\x42\x37\xf0\xe2\x30\x95\x01\x7d\
-\xac\xeb\x73\x43\x6f\x45\xe8\xe7\x85\x22\x68\x8c\x62\x28\x19\x74\
-\x5f\x78\x69\x49\xf1\xb0\x42\x97\x2d\x7a\xea\xee\x8a\x83\x02\xf1\
-\xf7\x83\xfb\xf7\xef\xd2\x05\xb5\xe7\xdf\x25\x14\x0e\x06\x02\x2b\
-\x72\xe3\x63\xee\x9d\x9a\xfe\xcf\xcb\xb2\xe2\x2e\x89\xd4\xd2\xc7\
-\xb6\xd7\x5b\xad\x90\x1d\x8a\x01\x06\x13\x7c\x27\x1b\xca\x7d\xee\
-\x00\x0c\x93\x6c\x52\xf6\x17\x41\x77\x06\xdf\xc5\x27\xe6\x16\x2c\
-\x98\x96\x6e\xbe\xcf\xe6\x66\x5d\x30\xaf\xc9\x20\x2a\xf4\x46\xaa\
-\xe4\xe3\x97\x0f\x4b\x8a\xdb\x52\xdf\xb3\x07\x96\x06\xe1\xb6\xfb\
-\x09\xf9\x0c\xe4\x85\xd4\x0f\x5e\x8c\x41\xda\x71\xf5\xa4\xfb\xe2\
-\x94\xb2\x1b\x5d\xac\xe8\x50\xe3\x7e\xa7\x20\xf9\x63\xf4\x9a\xa2\
-\xa5\x59\x66\x6e\xcb\xc9\xe6\x13\x7d\x12\xde\x21\xf7\x45\xb0\x84\
-\x9d\x83\x3e\xa2\x6d\x7e\x19\x78\x30\x7f\x4a\x64\x67\xe8\xb9\x79\
-\x85\xe3\x6f\x1a\x93\xf8\xfc\x90\xf4\xc8\xa9\x95\x7d\xce\x4f\xcb\
-\x7b\xdc\xbe\x73\xfb\xf7\xef\xd2\xf7\x0e\x60\x50\xf8\x12\x93\x69\
-\x8e\x92\x5e\x5b\x38\xe2\x6e\x35\x2d\x4c\xa0\x25\x3a\x62\x66\x76\
-\xc2\xc2\x54\xb5\xa2\xb9\xbc\xae\xa7\xde\x0a\xee\x14\x35\xf9\xdc\
-\x71\xa0\xa0\x61\x80\x92\x30\x60\x84\x20\x28\x7c\xa6\x5d\xfc\xd3\
-\xcc\x9c\xec\xdb\x47\xa7\x3d\x69\x07\xe1\x29\xe5\x78\x87\x04\xe1\
-\xc1\xf8\x78\xd1\x63\x52\x2b\xc6\x2e\x2f\x48\x8c\xdf\x56\xd7\xb3\
-\x17\xd6\x82\x62\x50\x88\x17\x26\xc8\x23\x17\x7e\x01\x3c\x6a\xc7\
-\x55\x00\x9e\x4a\x7e\x9d\x8b\x15\xac\x30\x3f\x12\x4b\xc5\xba\x1e\
-\x56\x08\xc4\xeb\x35\x13\xf4\x32\x59\xc5\x27\x4d\x7d\x4d\x50\xa5\
-\x7f\xcf\x14\x91\xc4\x3e\x9e\x6b\xe9\xe8\xca\x20\x1d\x03\x21\x7a\
-\x6c\x42\x8c\xb8\x6d\xed\xf4\xb5\x97\x66\x1a\x1f\x77\x7a\x38\x39\
-\xd4\x8c\x1c\x67\x36\x28\x36\x9f\x6a\x3e\x88\x0a\x01\x65\xbf\xac\
-\x7b\xdf\x9a\xbe\x77\x00\x89\x2b\x04\x2c\xfe\x78\x49\xde\xc8\x39\
-\x59\x31\xf7\x7b\x7c\x2c\x9a\x54\xc0\xe7\xe7\x35\x13\x93\xa3\x16\
-\xac\xc8\x8d\x93\x76\x75\xd9\x8f\x43\x34\x4f\xe6\xad\x73\x4d\x71\
-\xa0\x76\xa2\x30\x11\xd4\xc2\x58\x83\x09\x94\xe1\x49\x96\x13\x92\
-\x41\xc2\x7e\x10\x40\x7f\xbf\xb1\x3d\x3f\x82\xa8\x52\x8c\xbe\x22\
-\x3f\x31\x79\x6f\x53\xdf\xc1\x76\x97\x1f\x9f\xce\x3d\x0f\x44\x04\
-\x0f\xe5\x3e\x2a\xc1\x24\xdb\x7e\xd5\xa4\x87\x62\x95\xb2\x6b\x00\
-\x3c\x5b\x18\xbc\x60\x29\x32\x5f\x4a\x6e\x5e\x94\x4d\xcc\x49\x9c\
-\xd0\x66\xf7\x1d\x2c\xe9\x72\x58\x11\x1c\xec\x0b\x16\x18\xd8\x47\
-\x24\xac\x88\x5e\x02\x40\x15\x47\xc5\x1b\x55\x5b\x56\x8f\x7d\x28\
-\xdd\x24\xbf\xd5\xe9\xe7\x7d\x30\xbf\xf3\xac\x20\xf2\x09\x26\x6d\
-\x3e\xe8\xdd\xd1\xcd\x4d\xd6\xae\x90\x8c\xce\xed\xde\x77\x22\x32\
-\x31\x7f\x5f\x84\x02\xc2\x50\x1c\xa2\x35\x6a\xe5\x30\xf3\xcd\x2e\
-\xb7\x57\x01\x93\x3c\x58\x04\x25\x07\x21\x05\x2c\x7e\xd6\x65\x8a\
-\x8e\xb8\x7d\xe7\xaa\xf1\x7f\x19\x9d\x60\xd2\xa3\x16\x83\x9c\xc3\
-\x82\x3b\x8f\xf0\x1d\x2e\x78\x5c\x94\x93\x38\x4c\xa5\x55\xe5\xfb\
-\x78\x21\x00\x09\xe7\xf5\x19\xd6\x7e\x8c\xd3\xc7\xba\xe2\x0c\xea\
-\xa9\xf9\x71\x86\x58\x4c\x43\x35\x3f\x97\xd0\xed\xe1\xb1\x20\xc6\
-\x60\x8c\x53\xc9\xa6\x3b\x40\xc0\xb8\x6e\x84\xa4\x73\x4b\xe3\x62\
-\xce\x0f\x32\x4e\x8d\xd3\x2b\x48\x54\x0a\x05\x2e\xc0\xb1\x9f\xd0\
-\x25\x8b\x4f\xce\x1b\x9f\xb4\xf7\xea\xc9\x7f\xd7\x29\xe8\x95\x36\
-\x2f\x87\x56\x8d\x20\xc9\xe0\x28\xb8\x58\x5e\xb5\x6a\x42\xe6\x8d\
-\x68\xf9\x28\xa3\x60\xb3\xff\x3e\x7d\xaf\x16\x08\x58\x10\xcd\xfa\
-\xed\x94\xac\x85\xd3\x52\x62\x7e\xe1\xe7\x05\x2f\x74\x34\xdc\x06\
-\xb9\x12\xce\x71\x82\x57\x25\x97\x17\x5e\x53\x94\x3c\x2e\x56\xaf\
-\x38\xbe\xb5\xae\xd7\xf1\x65\xc2\x01\x63\x41\x01\x30\x67\xba\x9c\
-\xad\xd3\x93\xcd\x6d\xd9\x31\xfa\xb9\x5e\x58\xa4\x83\xb6\xa3\x0b\
-\x0d\xd7\x41\x97\x4b\x9b\xf4\x6a\xf5\x51\x9b\xf3\xd7\x77\x6c\x2e\
-\x3b\x05\xab\x3c\xbc\xb4\x74\x9e\x86\xa3\xe5\xa0\xa5\x9c\xee\x72\
-\x78\xa3\x75\xea\xca\x69\xd9\x71\x8b\x3c\x5e\x16\x57\xef\x58\xb6\
-\x9f\x1f\x6e\x24\x98\x0d\x2a\xd3\x91\xd6\xbe\x27\xef\xd8\x7a\xf6\
-\xed\x80\x20\x62\x81\xf3\xe6\x3b\x24\xec\x3b\xe4\x49\xcf\xcd\xcf\
-\x1b\x75\xfb\xf8\x94\xe7\x02\x7e\x2e\x1b\xda\x71\x2a\x83\x8f\xac\
-\x85\x79\xe2\x1d\x74\x81\x48\xa5\x62\x28\x34\xdf\xb2\xa9\xae\xbb\
-\x36\x2c\xab\x50\xfe\x77\xa6\xef\x15\x40\xec\x10\x58\x1c\xf5\xca\
-\x92\x91\x4f\x28\x29\x29\x0e\x0c\xcc\x07\x1d\x1d\xd8\x06\x5e\x3f\
-\x93\xc1\x60\xbc\x10\xda\x25\x4f\xcf\x4e\x9c\xe3\xf1\xf3\xdb\x0f\
-\xb5\x59\xc9\xcb\x06\xce\x75\x4d\x48\xa0\xa8\x78\xef\xa7\xec\xc3\
-\xaa\xce\xaa\x69\x43\x22\x3b\x33\x63\x0c\xb3\xbc\x98\x10\x12\x3a\
-\x6a\xb3\x46\xc1\x98\x4e\x75\xd9\x9f\x5f\xf4\xd6\xf1\xf5\xee\x00\
-\x8f\xc6\x77\x21\x56\x41\x0a\x29\x45\x49\xa7\xa3\x7d\xea\x90\x48\
-\x7f\xaa\x59\x7f\x09\xb8\x66\x3f\x34\x8f\xc2\x26\xe0\x99\x74\xaa\
-\x88\x23\xed\xb6\xff\x9d\xbf\xee\xd8\x8b\xf6\x00\x79\x87\xcc\x05\
-\x63\xc7\xb0\x5b\xbd\x17\xd6\x9a\x0f\x4e\xcb\xfb\x57\x9f\xdd\xab\
-\x97\xcb\x18\x2f\xf4\x8d\xdc\x7f\x33\x90\xa0\x9c\x00\xae\xc3\x94\
-\x6e\xd6\x45\x3e\x7d\xac\xf1\xc3\x81\x17\xa3\xff\x1d\xfa\x5e\x5d\
-\x28\x10\x89\xee\xfe\x75\xba\xf5\x51\x91\xa6\x9b\x61\x20\x91\xf0\
-\xfd\xbc\x55\x03\x82\x08\x03\xa5\x5c\x1e\x5f\xed\xa7\x35\x5d\x3d\
-\x98\xf6\x65\x12\xc7\x61\x82\xa0\x04\x7b\x80\x53\xcc\x7b\xe7\xe8\
-\x47\x07\x9a\x7a\x1f\x32\xe9\xc9\xd5\x06\xd4\x60\x0e\x16\xd1\x46\
-\x9e\x96\x6d\x59\xfe\x41\xc9\x73\x3d\x1e\x3f\x3e\x19\xd6\xcf\x2a\
-\xe4\x46\xf1\x2f\xae\x43\x09\x61\x1e\xea\x0a\x44\xac\xb2\x15\x6f\
-\x1f\x7b\x9d\xed\x72\x6c\x90\x2b\xe5\x46\x40\x88\x0f\x81\x67\x38\
-\xd8\x62\xf9\xcb\xdc\xb7\x8f\x00\x78\x1c\xb9\xb1\xe9\xcb\x44\x8d\
-\xe0\xe1\x71\x63\x4d\x57\x9d\xcb\xef\x3f\x8e\xaf\x2f\x01\xb0\xcf\
-\x35\x0a\x0c\x78\x44\xad\x4a\x11\x25\x57\xca\x0e\xdd\xba\xa5\xf4\
-\x37\xd8\x4e\x48\x61\xfe\x6d\xfa\x5e\x2d\x10\x09\x3b\xb6\xb3\xa1\
-\xb7\xbd\xde\xea\xde\xb9\xaa\x30\x35\x0d\x40\xcc\x0b\xf0\x44\xc3\
-\x71\xb0\x44\xcb\xc1\xfa\x64\x7a\xb5\x22\xf0\xeb\xdd\x55\xf7\x6f\
-\xae\xed\xee\x81\x3c\xd0\xe4\xa0\x98\x70\x9e\x1a\x84\x02\x10\x9e\
-\x83\x20\x45\x30\x3c\xc5\x86\xaa\xae\x8a\xe2\x94\xa8\xee\x9c\x18\
-\xc3\x25\x2e\x08\x8c\x34\x4a\xa6\xe1\x8e\x1d\x65\xf7\xec\x6a\xb4\
-\x78\x60\xae\xa1\xf9\x01\xb6\x12\x7a\x7b\x0f\xf9\x0e\x7f\xfa\x05\
-\x86\x09\xe8\x29\xac\x1c\x4f\xf7\xf8\xd9\xe3\xcb\x86\x27\x8f\x03\
-\x4f\x90\x12\xa9\x57\x29\x0f\xb5\x5a\x9f\x9e\xbf\xfe\xd8\xcb\x30\
-\x67\xe1\xcd\x55\x02\xce\xd3\xc1\x5a\x41\xc2\xf1\xc1\x98\x48\xff\
-\x30\x03\xfb\xde\xe7\x65\x45\x37\xc7\x37\x2c\xca\x4e\x58\x10\xe0\
-\x04\x74\x26\x98\x85\xed\x89\xf8\x72\x05\x93\x56\xa9\x2b\xeb\x75\
-\xbe\xf9\xcb\x2d\x65\x0f\x7e\x5c\xd5\xd5\x8b\x3c\xc2\xe3\xfd\x77\
-\xe9\x7b\x07\x10\x7b\xa5\x96\xcb\xe4\xa7\xbb\x9d\xae\xd2\x1e\x7e\
-\x5b\x7e\xb4\x8e\x4e\x31\xa9\x26\x78\x38\x11\x23\x46\xf4\x1c\x92\
-\x41\x25\x8f\x28\xe9\x71\xbd\x7a\xe3\xa6\xd2\xcf\xe0\x3b\xf6\x81\
-\xcc\x2f\x68\x25\x30\x2c\x22\x1c\x04\x12\xd3\xc2\x84\x69\x20\x38\
-\x02\xe2\x07\x95\x5d\x67\x27\x26\x46\xda\xf3\xb2\xa2\xc7\x3e\xf7\
-\x79\xed\xaf\xfe\x74\xa0\xbe\x0e\x77\x73\xb8\xd0\x1e\x27\x94\x43\
-\x3e\xcc\x98\xb4\x48\x69\xeb\xf2\x71\xb7\x5c\x3b\x26\x69\xfc\xc9\
-\x4e\xfb\xb1\x4e\x17\x8b\x4b\x0f\x22\x39\xc4\x05\x24\x2d\x3b\xd1\
-\xe3\xf2\x77\x38\x7d\x65\x2b\xc6\xa6\xcd\x3f\x58\xdf\xf3\xea\x82\
-\xf5\xc7\x5e\xb8\x10\x78\xd8\x19\xec\x13\x01\x0e\x2c\x0f\xcf\x43\
-\x99\x78\x90\x81\x4b\xee\x59\x90\x1d\xaf\x4d\x8b\x50\x4f\x86\x3e\
-\xfa\xa0\x06\x74\x46\xd2\x9a\x4c\xfa\xc0\xae\x86\xee\xdf\xce\x7d\
-\xfb\xe8\x2b\xe5\xdd\x4e\x09\xef\xad\x41\x8b\x0c\x56\xfd\xf7\xe9\
-\x7b\x07\x10\x09\x3b\x88\xfb\x83\x67\x7b\xad\xd4\x5b\xe5\xad\x87\
-\xc6\x26\x98\x1b\xf3\xe3\x23\x8a\xfd\x9c\xa0\xe5\x05\x89\xd1\x2a\
-\xe5\x0d\x0f\xed\xad\x79\x18\x84\xca\xa2\x8b\x0a\x03\x86\xc7\xdc\
-\x28\x7d\xd2\xa5\x05\x71\x11\x15\x3d\x6e\x27\xa0\x0d\xca\x4a\x04\
-\x44\x08\xf3\xd1\x12\x21\x1a\x95\x6d\xab\xef\xa9\xd0\x0a\xe2\x8e\
-\xbf\x1d\xa9\xaf\x72\x04\x04\x2c\x44\x84\x42\xd4\x1e\x8c\x44\x05\
-\x6b\xc7\xbd\x73\x0a\x56\x67\x67\xc4\xdc\x99\xa4\x94\x8f\x99\x9d\
-\x35\xd4\xf9\xf2\xc9\xa6\x52\x8e\x3c\x66\x18\xe4\x49\x80\x80\xa6\
-\x6b\x6c\x5e\x8b\x9e\x91\xed\xbe\x63\x5b\xf9\xde\x3e\x1f\x87\x6b\
-\x51\xf1\x3c\xf0\x42\xf3\xdd\x88\x38\x63\xfc\xcc\x94\x28\x73\x79\
-\xaf\xcb\x01\x05\x88\x92\xe1\x18\xa0\x3c\xc5\xb1\x42\xc5\xd2\x61\
-\xf1\xd3\xdd\xac\x60\x86\xb5\xaa\x96\x96\x49\xcd\xaf\x9d\xb4\xdc\
-\x7e\xe3\x96\xd3\xfb\x9d\x7e\x56\xa1\x82\x88\x1c\x2c\xf2\x7b\x03\
-\xef\x7b\x21\x94\x30\xba\x2e\x3c\x9e\x4b\x28\x29\x88\x42\x18\x23\
-\x1c\x9f\xca\x4d\xc8\xb4\xde\x37\x7f\x83\xf4\xd8\xb2\xc6\xa7\xe7\
-\x15\xcc\xc4\x7c\xb4\x00\x3c\x86\xea\xd2\xf9\x31\x11\x54\xfb\x1d\
-\xb3\x5e\x96\x9e\x58\xb6\xf7\xef\x4b\x47\x66\x87\xf2\x08\x9b\x73\
-\x09\x01\x0f\x9d\xf6\xe7\xe2\x09\x14\x26\xf3\xfa\x0b\x97\x0e\x5f\
-\x2a\x3d\xb4\xa8\xdc\xf1\xab\xb9\x27\x1c\xf7\xcc\x3d\x2e\x3d\x30\
-\xbf\xfc\xc5\x4b\x0b\x96\x61\x1e\x96\x19\xc8\x32\xfc\x05\x8f\x03\
-\xd3\x91\xb0\x6d\xec\x03\x9e\xbf\xbc\xa8\x38\xd9\x7f\xff\xe2\x4f\
-\xf9\x87\x16\xbe\x37\x12\xd6\x7b\x98\x06\xbc\x48\x95\xf0\x58\x9e\
-\x99\x9b\x3f\x5b\x7a\x7c\x59\xa3\xf7\xc1\x05\x4f\x5f\x3e\x2c\xde\
-\x14\xca\xbb\x60\xac\x01\x7c\x2f\xb8\x87\xfb\x6d\xe8\xdf\xb6\x40\
-\x6c\x5d\x00\x55\x44\x6d\x94\xa3\x15\x05\x93\x09\x85\x54\x18\x9f\
-\x1a\x61\xb6\xf4\xba\x2c\xd5\x7d\xee\x7d\x5e\xaf\xbf\xf1\xf7\xfb\
-\x6b\xb6\x82\x96\xa2\x8e\x93\x22\xf0\x07\x96\x18\x72\xe9\xc0\xb5\
-\xb3\xae\x4e\x31\x30\x6b\xac\x16\x9f\x72\x4a\x5a\xf4\xa5\xa9\x46\
-\x75\xd5\xc7\xd5\x5d\x2d\x44\x80\x03\x2c\x11\x09\xbf\xa0\xe6\xa3\
-\x55\x86\x09\xfa\x22\x83\xf6\xc5\x17\xe6\xe5\xcf\xb8\x69\xfc\xd0\
-\xc7\x5c\x5e\x16\x9f\xa7\x27\x6b\xae\x00\x84\xab\xc5\x43\x63\xa6\
-\xc7\x6b\x94\x35\x9f\xd6\x76\x37\x60\x59\xa8\x12\x6e\x9f\xf0\xc2\
-\x71\x0c\x24\x1c\x1b\x4e\x79\xd0\x51\xe1\x95\x05\xc3\x0b\x6e\x18\
-\x9b\xfc\xa2\xd7\xeb\x4b\x02\x7e\x09\x33\xb3\x62\x98\xbf\x9f\x68\
-\x3e\x02\x6c\x11\x1c\x9c\xd1\x48\xed\x53\x5d\xce\x8e\x28\x35\x53\
-\xfd\xc4\x89\x86\x7f\x7c\x50\xd6\xe9\x82\xb9\x16\x03\xbb\x41\x9c\
-\x91\x2f\x34\x47\x3c\x0e\x5a\x75\x30\xf5\xbb\xd1\x77\x06\x10\x85\
-\x82\x2d\xe7\xc6\xc4\xca\xae\x2e\x4a\xcc\x91\x14\x01\x5b\x8b\x8d\
-\x13\x51\xdb\xc2\x83\x09\x13\x76\x12\xc1\xc5\x57\x61\x6d\xac\xe9\
-\x2e\x47\xf0\x42\x59\x38\x18\x14\x80\xf8\xf4\xe2\xfc\xdc\x79\xc9\
-\xfa\x3f\xb9\x61\x22\x03\xf7\xc3\xfa\x02\x9c\x6e\x42\x6a\xd4\xa5\
-\x69\x46\x4d\x07\x80\x58\x85\x02\x87\x36\x07\x49\xe2\x1c\xf0\xc8\
-\x0e\x10\x80\x37\x12\xc0\xfb\x5f\x87\x9b\xc5\x8b\xab\xe1\x9b\x9b\
-\xd0\x4e\x44\x1f\x2c\x31\x26\x0f\x8d\x9e\x11\xa7\x55\x96\x6c\xaa\
-\xed\xe9\x08\xb5\x4d\xb8\x0c\xe4\x85\x84\x42\x0e\x83\xf7\xcf\x85\
-\x23\xa6\x5c\x37\x26\xe5\x59\x87\x2b\x10\x29\x67\x18\x1f\x44\x91\
-\x7c\xb2\x56\x35\xca\xa8\x51\x94\x6c\xad\xef\x6d\x03\xde\xfd\x6b\
-\x3a\x37\x27\xf0\x9f\x54\x75\xd7\x54\x76\xba\x70\x3d\x33\xf8\x69\
-\x1b\x20\x74\x27\xe8\x8e\x41\x59\xa4\x49\x49\x91\xa6\x59\x19\xf1\
-\x89\xa5\x16\xaf\x4d\xc2\x57\x2d\x7e\x07\xfa\xce\x00\xe2\x82\x0e\
-\xd5\xee\xf1\xfc\xc4\xf4\xff\x59\x3e\xe2\x81\xc5\x19\x31\x89\xbe\
-\x16\x47\xcd\x19\xbb\xd7\x0f\x2b\x27\xc8\xc5\x29\xe6\x0b\x42\xc4\
-\x20\x8d\x2c\xa4\xc3\x5a\x17\x52\x02\x69\x54\xa2\x89\x7e\x71\xfe\
-\xf0\xc7\x38\x56\xca\x04\xc9\xf9\x42\x60\x09\xbe\x80\xc0\x4c\x48\
-\x8b\x9e\x9b\x66\xd0\xd8\x3f\xae\xe9\x2a\x45\x91\x62\xbd\x73\x09\
-\xdd\x10\xf2\xbc\x67\xe2\xd0\xb4\x07\x2e\xc9\x7b\xc5\xe6\xf0\x6b\
-\x41\xf3\x59\xc8\x1a\xe8\xba\xd0\xcd\x0b\x1e\x3f\xa7\x9a\x92\x1d\
-\x3f\x0b\x7a\xb9\xe7\xf3\x56\xab\x0d\x15\x2e\xdc\x9f\x81\x04\x0d\
-\x61\x90\x22\xbe\xb6\x78\xc4\xfc\x6b\x47\xa5\xfc\xc5\xe9\x66\x41\
-\xaf\xe8\x00\x64\xa1\xd7\xc4\x39\x52\x35\x3e\x39\x32\x7b\x4b\x7d\
-\xcf\xa6\x0e\x57\x80\xbc\xf1\x30\xcc\x04\x79\xc2\xe1\xbc\x2b\xf3\
-\xd8\x4f\xb4\x58\xe4\xfb\xe6\xec\x11\xe9\x8f\xcd\xca\xb9\x7d\xf9\
-\xb4\xe1\x13\x9a\x04\xfd\xbe\xd3\x75\xcd\x02\x2e\xad\xce\xc1\xfb\
-\x6b\x69\xe0\x00\xbf\x15\x89\x30\x17\xe3\xa2\x67\xc6\xf0\x98\x99\
-\xae\x3e\x27\xa3\x12\x64\x63\x9f\xbb\x6a\xfc\x43\xff\x5c\x5c\x34\
-\x9c\x64\x43\x34\x89\x83\x1a\x28\x71\x1c\x10\x06\x38\x78\x8e\xe9\
-\x70\x82\x8f\x47\x53\xef\x8e\x4d\xbf\x8e\xe6\xa9\x62\x5e\x14\x5d\
-\x08\x1e\xe6\x03\xe1\xfc\x20\xb8\xdc\x81\xc0\xda\x82\x84\x87\x9a\
-\xef\x58\x72\xd3\xe4\x8c\x04\x32\x3a\xe0\x4b\x0a\x84\x29\x3c\x66\
-\x70\xd1\x7d\x92\x9f\xab\x06\xf0\x54\xa0\x5c\xe7\x49\x02\x52\x70\
-\xa3\x41\x25\x04\xb8\x9a\x2a\x28\x4b\xd2\xc8\xff\xc1\x14\x02\x4f\
-\x7a\x75\xe1\x88\xd5\xbf\x18\x95\xf2\xb8\xc3\x1d\x40\x8d\xea\xbf\
-\x55\x11\xf2\x71\xd3\xda\xc3\x48\x74\xc1\x9b\x97\x8f\xb8\x05\xf2\
-\x88\xe0\xc3\xbd\xc2\x31\x0e\x04\x0f\xd3\x11\x54\x74\xa5\x05\xb1\
-\x06\xea\xa3\x2b\xc6\x2c\xb8\xb2\x38\xf9\x7e\x3f\x6e\x76\x74\x77\
-\xc5\x4c\xa4\x7b\x26\x62\x39\xa8\xf4\xad\xf1\xf8\x4e\x00\xa2\x26\
-\xc1\x41\x5a\x59\x90\x94\x9c\x9e\x1c\x35\x4a\x10\xa4\x00\xf8\x4d\
-\x9f\x8d\x13\xcc\xcb\x0b\x93\xee\xac\xbd\x7d\xd6\xca\x29\xe9\x31\
-\x0a\x91\x92\x4b\xb8\x9f\x79\x61\xbb\x01\x02\x21\xcb\xe4\x0c\xa5\
-\xcf\x49\xc8\x82\xa3\x1a\xc6\x4c\x34\x37\x98\x49\x08\xa3\x0d\xc1\
-\xcd\x8a\x6c\x4a\x34\x75\xdd\xa5\x7a\x26\x09\x13\xc3\x7b\xa4\x61\
-\x02\x61\x62\xb8\x4a\x7f\x5a\xdb\xe3\x5e\xf5\x51\xc9\xdd\x5a\xb5\
-\xa2\x84\x61\x18\x13\xba\xbf\x50\x11\x6c\x0a\x17\x68\x46\xad\x46\
-\x5e\xb6\xe6\xc3\x92\xbb\x3f\xad\xe9\xc2\x1b\x8a\xcf\x73\x71\xd0\
-\x57\x02\x9e\x59\xa7\x52\xad\x18\x91\xfc\xdf\x3e\x0f\x2c\x3d\x82\
-\xe0\x9d\x33\x0a\xf8\x2a\x49\xaa\x28\xa5\x2a\x0b\xef\x2f\x05\x1a\
-\xc4\x27\x4c\xd8\x06\x8e\x4b\x0e\xd3\xf3\xcd\x45\x99\xd1\xfb\x7e\
-\x31\xe9\xee\xc5\x39\xf1\xab\xec\x6e\x16\x83\x3f\xd6\x2b\x48\xe2\
-\xaa\xa2\xb4\x19\xc3\xe3\x22\xe4\xd0\x95\x6f\xbd\x47\xfa\x9d\x5c\
-\x28\x68\x17\xb6\x23\xbd\xb5\x74\xc4\xc2\x28\x95\x22\x9f\x13\x45\
-\xbc\xe2\x80\xd7\xcd\x04\x98\xde\x84\x68\x25\x33\xfc\x9a\x71\xd9\
-\xf9\xc3\x86\x0f\x6f\x78\xff\x48\x99\x03\x21\xbc\x50\xb7\x90\x09\
-\x68\x25\x55\xdf\xe9\xd8\xb5\xdc\xac\x55\x28\xa2\xf5\xc5\x10\x8a\
-\xb3\xc1\x31\x07\x05\x06\xe0\x88\x11\xb0\x6e\xdc\xdb\xd0\xf3\xf8\
-\x8d\x3b\x2a\x3f\x07\x49\x5e\x70\x9f\x13\x13\x50\xb1\xca\x7a\x5c\
-\x81\xb3\x3d\xae\x03\xab\x0a\x92\x27\x82\x45\x27\x42\x32\x5e\xbd\
-\xc0\x27\x62\xf4\x0a\x95\xbc\x69\xf5\x86\x13\x37\x6e\xa8\xec\xec\
-\x43\x8b\x40\xe0\xb1\xee\x40\x0a\xf5\x93\x81\xa5\x0a\x3f\x3d\x35\
-\xca\x3a\xcc\xa4\x9b\xeb\x17\x44\xe2\x22\x83\x59\xe8\x1a\x01\x39\
-\x39\x1d\x25\x2a\x98\x0f\xd7\x7e\x74\xf2\xd7\x95\x7d\x1e\x7c\x7f\
-\x4d\xbf\x0b\x0d\x13\x69\x37\x74\x78\xfb\xb2\x11\x13\x7e\x3d\x6b\
-\xd8\x6d\x5c\x20\x90\x0a\xcb\x29\xdc\x6e\x23\x45\x60\xfc\x9c\x49\
-\xad\x88\x51\xca\x64\xad\x1b\x6b\xba\x3a\x80\xcd\xb7\xda\x23\xfd\
-\xd6\x00\xa2\x90\x40\xe6\xd2\x9a\xc2\x44\xf3\x4d\x63\xd2\xd6\x38\
-\xfd\x1c\x6a\x28\x36\x88\x3d\x82\xf6\x71\x37\x84\xf2\xf3\x7e\x7f\
-\xcc\x18\x03\x3b\x29\x37\xda\xc0\xbd\x5f\xd1\x59\x87\x75\xc3\x12\
-\x08\x53\xb8\x97\x35\x36\x0f\xf3\x6c\x69\xeb\xe7\x45\xf1\x46\x7b\
-\x41\x62\xe4\x4c\x1f\xde\x2c\x8a\xcf\xb5\x80\xae\x40\xd0\x60\xf4\
-\x53\xd4\xee\x59\x6f\x1e\x79\xcc\x1a\x7c\xb7\x35\x91\x3a\x8c\x1f\
-\x1b\x45\x0b\xed\x17\x1c\xba\x2d\x04\xe6\x6c\xaf\xcb\x53\x69\x75\
-\x1d\x5d\x3b\x7c\xc8\xdc\x00\x2b\xe8\x38\x50\x38\xa3\x46\xe9\xfa\
-\xcb\x47\xa7\x6e\x7a\xb6\xb2\xb3\x19\xaf\x5e\x84\x17\xfd\x48\x28\
-\xcb\x10\x2f\x42\xd8\x06\xfc\xa3\x77\x37\xf6\x56\x5f\x37\x36\x25\
-\x43\x45\x31\x85\x50\x18\xe7\x66\x18\xbb\x44\xab\x94\x32\x13\xe8\
-\xc3\xab\x2b\x3f\x3c\xf1\xbb\x4f\xab\xbb\x08\x78\x08\x6a\xb0\x76\
-\x90\xc8\x44\x09\xc7\x4b\xd2\x8c\xfa\x7d\xd7\x4c\xbc\x72\x4c\xb2\
-\xf9\x0a\xa7\xdb\xcb\xc8\x68\x06\x77\xa5\xfa\x3d\x1f\x14\x93\x38\
-\x5e\x94\xe5\xc6\x18\x74\x9f\xd5\xf6\x1e\xea\xf6\xf8\x07\x2f\x7e\
-\xbf\x86\xbe\x8b\x0b\x25\xc3\x8c\x36\xe8\xb2\x29\xad\x2a\x89\x15\
-\xc8\x22\x7a\x50\x7b\x50\x00\x44\xc4\xf8\x5c\x7e\x49\xb5\x20\x37\
-\x71\x5e\x7c\x84\x86\xbc\x98\x1a\x32\x42\x22\x3a\x87\x60\xac\x36\
-\xf0\xff\x97\xbf\x77\xe2\xcd\x2d\xb5\x1d\xbf\x32\x46\xa8\x50\x33\
-\x95\x20\x13\x39\x08\xcb\x76\xcb\x96\xd2\xbf\xb4\xbb\xfc\x44\x28\
-\x44\x4c\xc0\x05\x95\x08\xce\x88\xd8\x10\x44\xc2\x07\x08\xe7\x1f\
-\x18\x3f\xb3\xe1\x6c\x67\xe3\x8e\x86\x8e\x7b\x0c\x3a\x25\x13\xa9\
-\x53\xc9\xf7\x34\xd8\xee\xf9\xe3\xd9\xf6\x1a\x28\x79\x3e\x78\xc1\
-\xe9\x8b\x04\x1d\x70\x42\xda\xc0\x68\x11\x82\x13\xea\xd6\xcd\x65\
-\x4f\xaa\xd5\xf2\x6e\x68\x4d\xc1\x0b\x22\x63\xd0\xab\xf5\x3b\x1b\
-\xfa\x1e\x8f\x7f\xea\xb3\xc7\x37\x56\x75\x10\xd0\xcf\x05\x0f\x09\
-\x41\x40\x5a\x98\x3f\x2c\x6a\x48\x7c\xf4\x34\xa7\x37\xe0\x07\x65\
-\xc4\x7b\x4a\x07\xcb\x1c\x6a\xb2\xa2\x48\x1b\xcd\xda\x9c\x19\x69\
-\x51\xe8\x31\x06\x8d\xe7\xeb\xe8\x3b\xb8\xd0\xa0\x0c\x79\x5e\xd5\
-\x9e\x65\x50\x75\x15\x24\x47\xe6\x04\x58\x2e\x02\x26\xe0\x00\x6a\
-\x62\xb0\x4c\x70\x5e\xd2\xab\xe4\xea\xc3\x4d\xd6\xf7\x9f\x3f\xde\
-\x58\x0b\x49\x64\x7e\x23\x5a\x0e\x1d\xc4\x4e\x86\x47\x8d\x47\xa8\
-\x89\xae\x89\x79\xf7\x6c\x67\x4d\x61\x62\x64\xc9\x88\x58\xe3\x74\
-\x95\x8c\x49\xdc\xd7\x6d\x7b\xfc\x57\x5b\xce\xee\x83\x22\xd8\x57\
-\x9c\x23\x88\x0b\x7d\x65\xc9\x88\xf1\x6f\x2c\x18\xfe\xab\xc3\x1d\
-\xf6\xfd\x4d\x76\x1f\x17\xf2\x0c\x61\x92\xa0\x19\xe6\x9d\xb3\x9d\
-\x6d\x53\x86\x44\x75\x35\x5b\xfd\xfb\xe6\xbc\x73\x78\x7b\x00\xa7\
-\xca\xa0\xa1\x12\xc2\x3a\x68\xe6\x53\x86\x44\xca\xce\xdc\x30\xfd\
-\xb1\xec\x28\xbd\xfc\x93\x9a\xae\xba\x60\x1b\x64\x98\xb2\xb2\x6e\
-\x97\x7d\x42\xa2\xd1\x92\x17\x6d\x58\xaa\xd6\x28\xd9\x8d\x55\x9d\
-\x0f\x5c\xb6\xe1\xc4\x7a\x0f\x87\xd7\x8c\x49\xb0\xd6\x4f\xa1\x31\
-\x11\x19\x84\x30\x65\x0e\x34\xf5\xd9\x67\x0e\x31\x6a\x32\x22\xb5\
-\x79\x30\xbd\xe0\xf4\x10\x96\x11\x8e\x97\x92\x2b\xe8\x08\xa3\x42\
-\xd5\xfa\xde\xd1\xf6\x97\xee\xdd\x7f\xb6\x11\x85\x11\xac\xfa\xcd\
-\xe8\x5b\x03\x88\xbc\xb1\x07\x1d\x6e\x37\x0d\x73\x49\x73\x20\x20\
-\x3f\x3e\x36\x59\x6f\x36\x6b\x55\x69\xde\x00\x27\x01\x32\xf8\xd6\
-\x23\xec\x84\x52\xad\x90\xf5\xdc\xb7\xa7\xe2\xad\x8a\x5e\x37\x3e\
-\x50\x42\x3a\x86\xfd\x57\xc0\x6c\x09\xc1\x03\x82\xd6\x3f\x1a\x24\
-\xf8\x82\x45\x64\xef\x97\x77\xb4\x8d\x48\x33\x95\x65\x47\x6b\xc5\
-\xbb\x76\x57\x3c\x53\xdd\xe5\x26\x97\x8f\x18\x28\x81\x8a\x71\x77\
-\x6a\x54\xec\xfd\xb3\xf3\x9f\x82\xc0\x67\xe6\xca\xfc\xa4\x94\x23\
-\xad\xd6\xbd\x0d\x76\xef\x20\x10\x81\x2f\x5a\x14\xfd\x7e\x65\x67\
-\xe5\xba\xb3\x6d\x95\x01\x01\x0d\xf3\x0b\xd9\x60\x59\x8c\x0a\xa7\
-\xa6\x44\x29\x3f\x5b\x3b\xfe\x71\xbd\x9c\x5e\x31\x3a\x3d\x66\x78\
-\xba\x37\x70\xe0\xa3\x36\x9b\x05\xe6\x05\x06\x4a\x13\x4b\xdd\xd9\
-\x68\xa9\xbe\x61\x74\x5a\xec\x96\xba\xee\x57\x97\xbf\x7f\x72\x33\
-\x46\x8b\xc0\x0c\xe5\x4f\x08\xc7\x80\xe0\x41\x7b\x92\x46\x8e\x22\
-\x0d\x2e\x07\x70\xcc\xf8\x7c\xa9\x8b\xe5\xbb\x57\xe6\x27\x8e\x0d\
-\x70\x82\x0a\xc6\x8f\x5d\x94\x00\x69\xa5\x46\x29\x97\x7b\xbd\xf2\
-\x1d\x4b\xdf\x3b\xfe\xf7\x3f\x1f\xaf\xed\x02\x3e\x03\xc5\xf1\x8d\
-\xe8\x3b\x58\x60\x90\x70\x04\x20\x4b\x7a\x4f\x73\x97\xf7\x50\xab\
-\xff\x58\x9a\x49\x65\xcf\x4b\x8c\xc8\x85\x4e\x6a\x01\x9c\x80\x51\
-\xad\xd0\x82\x75\x6c\xbf\x6f\x47\x65\x19\x48\x01\xa4\x11\xb4\xdc\
-\x51\x09\x26\xdd\x91\x5f\x4c\x5e\x53\x69\x71\x77\xd6\x5a\x3d\x1e\
-\x9c\xb3\x20\x23\x2c\x57\x02\x22\x0c\x9e\xde\x58\xdd\xd5\xf9\xbf\
-\x87\x1b\x76\x96\xb6\x39\x09\x26\x50\x1f\xad\x9a\x9a\x98\x68\xa4\
-\x5e\x5a\x3d\xfe\x09\x68\x7b\x0c\xcb\x0a\x5d\x4a\x19\x33\x7c\x55\
-\x61\x52\xe6\xc1\x66\xcb\xae\x46\x87\x6f\xd0\xa3\xb7\x28\x0d\x7c\
-\x80\x05\x80\xc2\xd3\xb0\xbc\xfb\xc1\x9b\x92\x62\x56\x6d\x5e\x3b\
-\xe1\x09\x15\x45\x2f\xf6\x71\x62\x17\xcf\xf1\xe6\x51\xc9\x51\x85\
-\xbb\x5b\xac\x9b\x9b\x1d\x3e\x96\xb8\x6c\x28\x0f\x53\x32\xf5\xca\
-\xa9\x96\x7d\xeb\xcf\x76\xd4\x81\x15\x0d\x52\x04\xfc\x02\x51\x31\
-\x23\xd0\x2a\x69\x76\x7a\xa4\xa9\xf4\x86\x19\x2b\xbb\x7d\x4c\xdb\
-\xc9\x8e\x3e\x9f\x1c\xb4\x19\x9a\x61\x6a\x60\x9c\xe0\x09\xa2\xb2\
-\xa2\xb4\xc3\x3c\x9c\x00\xae\x94\x8e\x00\xd7\x6e\x7d\xb7\xa2\xf3\
-\xe5\x59\x6f\x1e\xde\x5e\x65\x75\xe1\x2b\x4e\x50\x40\x61\xb6\xdf\
-\x98\xbe\x33\x80\xd8\x12\x6a\x19\x0a\xa3\xc9\xe1\xa4\xdf\xad\x68\
-\x6f\xec\x75\x71\x27\x8b\x87\x98\x93\x0c\x2a\x79\x2a\x0c\xd1\x76\
-\xd7\xb6\x8a\x37\x2a\xfa\xdc\xf8\x08\x19\xac\xf9\x82\x5b\x4e\xcf\
-\xce\x29\x9c\x39\x7e\xa8\x79\xf5\x15\xc3\xe2\xf3\x47\x27\xe8\x5b\
-\xde\xaf\xec\xee\x05\x60\x20\x66\x09\x02\x1c\x26\x01\x04\xe5\x61\
-\x85\x7e\x13\x05\x25\xa0\x0d\x4a\x19\xb5\xff\xbf\x26\xdd\x15\xad\
-\x54\xae\x0a\xf0\x82\x0d\x34\x5c\x01\x91\xa6\x17\x04\x55\x00\x01\
-\x4b\xce\xb1\x76\xfb\xae\x3a\x9b\x67\xd0\xfd\x30\x78\x1c\xc8\x17\
-\xf3\xd0\x8a\x67\xa5\xc7\xa8\x37\xad\x99\xf0\xa4\x5c\xa2\xe6\xb3\
-\xbc\x60\x41\x5e\x90\xec\x17\x15\xb2\xa1\x6b\x47\xa5\x44\x1d\xec\
-\xb6\xee\x6a\xb2\x78\xf1\xd2\x11\x51\x1c\x2f\x27\x90\xf1\x02\xaf\
-\x7e\x76\x98\x07\xd1\x2d\x23\x93\x28\x71\xc3\xad\x2b\x33\x1e\x99\
-\x9c\x7c\xbb\x42\x64\x8b\x33\x12\x95\x9e\x57\x4b\x5a\x2b\x58\x88\
-\xc5\xf0\xb6\x0a\x98\x73\xa9\xec\x28\xb5\x6d\x5a\x7a\x4c\xb1\x5c\
-\x26\xd7\xf1\x02\x75\x60\xde\x5b\x87\x9e\x7b\xf2\x70\x63\x33\x79\
-\x3d\x0d\x8c\x11\xad\x37\xc4\xf6\x5b\xd1\x77\x06\x30\x4c\xa8\xed\
-\xd8\x03\xe8\x03\x7d\xb8\xcd\xea\x3e\xde\x6e\x3b\xb2\x24\x27\x4a\
-\x65\xf7\xab\x9b\x7f\xb3\xaf\xfa\x38\xcc\x15\xb0\x20\x07\x97\x09\
-\xd2\xb9\xa3\x28\x33\xf2\xee\xe9\x19\xd7\xf5\x39\x71\xf5\x43\x69\
-\x8b\x86\x44\x4d\x2c\x34\xeb\x1c\x9f\xb6\xb8\x9a\x30\x40\x20\x17\
-\x60\x42\x7c\xcf\x39\x12\xf0\xff\xb1\xb0\x68\x61\x71\xa2\xf9\x5e\
-\x37\xcb\x93\x97\xc2\x40\x1a\xc0\x01\xcb\x01\x00\x11\xdc\x72\xfe\
-\xca\xc2\xe4\xb4\x23\xed\xd6\x5d\x0d\x36\x2f\x4a\xa5\x1f\xc4\x30\
-\x61\x1a\x80\x20\xcd\x48\x37\x2b\x36\xae\x99\xf0\x67\x58\x78\x11\
-\xf0\x20\x9d\xc8\x01\x79\xf1\xbc\xe8\x8b\x50\x2b\x8a\xa2\x34\x2a\
-\xf7\xfa\xb2\xf6\xd3\x58\x0d\x3e\x84\xd5\x40\x7e\xa8\x94\xa8\x78\
-\x0a\xf0\x9c\x1f\x5c\x31\xb6\x78\x69\xb2\xec\x66\xb7\xdb\x67\xf4\
-\x08\x92\x33\xc5\xa0\x4b\xeb\x71\xfa\x4e\x1f\xeb\x70\x38\xd1\x8a\
-\x51\x46\x35\x36\xaf\x73\x2d\x44\xee\x87\x9b\x1d\x87\xae\xfb\xac\
-\xea\xbd\xcf\x5b\x7b\xf1\x4a\x0c\xce\xc1\x83\x14\xf7\xdb\x52\x48\
-\xbf\xbf\x05\x01\x56\xe8\xce\x50\x10\xa1\x94\x7e\x42\xa1\x62\x7a\
-\xa4\x1a\x9d\x87\x92\xb1\xfb\xfd\x02\x58\x08\x66\x31\x4a\xb9\x4c\
-\x3c\x71\xfd\x94\xe5\x59\x91\x9a\xc5\x01\x5e\xf4\x90\x39\x03\xd2\
-\x55\x94\xa0\x74\xc6\x64\x6c\xba\xfa\x9f\x3b\x3e\xdc\x56\xd9\x40\
-\xd4\x11\x35\x3d\x4c\xd8\x41\xf8\x46\xc3\xdc\x22\x35\xdf\x31\xfb\
-\x31\x93\x92\x59\xe1\xe3\x84\x5e\x10\x0c\x79\x53\x44\x98\xa0\x8e\
-\xa0\x92\xcb\xcc\x6e\x5e\xd8\x90\xf6\xcc\xce\x07\x5c\x2c\xbe\x3d\
-\x72\x80\xab\x83\x0f\xf2\x31\x28\xe5\x52\xd3\x1d\xb3\xfe\xa4\x97\
-\x31\x57\xa0\x15\x87\xc1\x0b\x13\xf2\x51\xcb\x65\x51\x0e\x56\xd8\
-\x99\xf2\xec\xce\x1b\xa1\xad\x70\xdd\x7e\x82\xbe\x13\xc5\x2d\x4e\
-\x31\x52\xbf\x29\xce\xb9\x6c\x4e\x46\xec\x62\x5b\x80\xe3\xe4\x24\
-\xa8\x91\x70\x1e\xd4\x35\x39\x3d\x7b\x47\xbc\x7c\xf0\x9f\xe0\x9a\
-\x49\x75\xec\x4c\x94\x46\x29\x03\xe5\x13\xd1\x25\x87\xc6\x39\x90\
-\x2d\x21\x54\x0c\xec\x27\xf4\xfc\x8b\x50\xf9\x2b\x68\x70\x48\xfb\
-\x35\x84\xc1\x87\x81\x21\x01\x1a\xd9\xf9\xc0\xc6\x06\x12\xee\x6a\
-\x60\x8a\xcd\xc7\x53\x7d\x5e\x2f\x01\x0f\xb5\x0c\x92\xc4\xab\x47\
-\x24\xc5\x16\xc6\x19\xa6\x80\x40\x20\x5a\x25\x32\xc1\xc5\x90\x18\
-\x90\x64\x7e\x43\x77\xdd\xe2\x8f\x17\x0d\xbb\x75\x7e\x66\x9c\x01\
-\x58\x10\x4b\x41\x7e\x48\x38\x42\x64\x01\x0b\x6b\x6a\xe5\x87\x27\
-\x7f\xc7\x8a\xd2\x27\x4a\x86\x89\x84\x72\x83\xc6\x87\x2e\x56\x49\
-\xd3\x5c\x49\xa3\xa5\x1e\xc0\xc3\xa4\x41\x16\x18\x3a\xa7\x21\xa0\
-\xa0\x4a\x9a\x7a\x1b\x60\x2d\x08\x62\x24\xfd\xe8\x27\xe0\x89\xfb\
-\x91\x26\x4e\x92\x76\xae\xfa\xe0\xe4\x3d\x08\x1e\xf6\x65\x20\x1f\
-\xfc\x8e\xe0\xcd\xcb\x88\x51\xef\xfa\x45\xf1\x8d\x33\x33\xa2\x2f\
-\xb3\x07\xd8\x00\x82\x07\xd9\xa0\xb8\xf8\x42\x05\xc1\x9f\x1d\x6d\
-\x1c\x77\x6d\xd1\x90\x74\x48\x23\x0f\xa6\x22\x54\x78\xe5\x1e\x5f\
-\xe3\x85\x5f\xcf\x05\x0f\x63\x26\xe4\x8d\xee\x5a\x21\xa3\x25\x19\
-\x4c\xac\xdf\x84\xbe\x11\x80\x21\x10\xa8\xab\x47\xa6\x65\x39\xae\
-\x9d\xbc\x7a\xe9\x10\xb3\x1e\x3b\x00\xd6\x4f\xae\x67\x0d\x6c\x0a\
-\x07\x17\xfc\x1f\x94\x0e\x06\x10\x30\x0f\x50\xbf\x9b\x9c\x39\x13\
-\xdc\x55\x3c\xa4\xe1\x26\x73\xb8\x0a\x59\x4e\xb0\x8c\xc2\x2d\x31\
-\xe2\xd8\x77\x97\x8d\xba\xcd\xac\x51\x12\x2b\x1e\xc8\x14\xbf\x63\
-\x33\x7b\x1a\x7b\x03\x4b\xdf\x3d\xf6\x3f\xa2\x8c\xfe\x04\xdc\x72\
-\x04\x0a\x1c\xf3\x21\x5b\x90\x2b\x64\x46\x3f\xc7\x7f\xf2\xd7\xcd\
-\x67\x5e\x85\x24\x50\x2e\x22\xd0\x41\x14\x4a\xa3\xff\xba\xa9\xf4\
-\x55\x7f\x80\xfb\x14\xc0\x32\xc2\x20\x08\x0f\xe4\x85\xe0\x41\xc3\
-\x7b\x96\xbc\x77\xe2\xee\x5d\xcd\x7d\x6e\x6c\x13\xdb\xc6\x7c\x24\
-\xec\x13\x7e\x37\xab\x15\xd4\x86\x65\xa3\x7f\x29\x04\xc4\x29\x6e\
-\x3f\xef\x46\x37\x89\xd9\xc1\x52\xa4\x1c\xc7\xc2\xd2\xea\xbe\xe2\
-\x8c\xb9\x78\xeb\x06\xc8\x20\x9c\x89\x6f\x61\x24\xcb\x87\x81\x84\
-\x32\xc4\xe5\x2b\xf2\x9e\x9a\x62\x56\xef\xbb\xb6\xf8\x8a\x57\x46\
-\xa5\x16\x62\x1e\x08\xe8\x2b\x31\xfa\x46\x00\x22\x08\x10\x68\x51\
-\x77\x8f\x18\x9a\x25\x25\x45\x2c\x5f\x77\xf5\xc4\x87\xb7\xaf\x99\
-\x30\x7d\x7a\x52\x02\x3e\xaa\x05\x99\xa0\x76\x41\xab\x1a\x44\xa1\
-\x6e\x42\x87\x69\xea\xd9\xcf\x3b\x0f\xb8\x02\x5c\x99\x5a\x29\x8f\
-\x80\xc8\x10\x05\xd9\x3f\x0a\xfc\x0a\xd1\xa4\x78\xa2\xd3\xde\x60\
-\xf5\xb1\x98\x4e\xfc\x08\x0e\x0c\xfe\x93\x32\x38\x38\xfc\xbe\xb3\
-\xc9\xc2\x2d\x79\xef\xd8\x03\xa2\x4c\xda\x06\x1e\x01\xf7\x3b\x61\
-\xed\x42\xeb\x34\xbc\x78\x76\xe5\xc6\xd3\x8f\x6f\xf3\x71\xa1\xf9\
-\x29\x28\x51\xec\x17\x7e\xf0\x1c\xd3\x30\x6f\x9b\x97\xa3\x56\x6d\
-\x2c\xfb\xb3\x56\xae\xaa\x02\x25\xd4\x22\x0f\x04\x0f\x4a\xed\xbf\
-\xec\xbd\xe3\xbf\xda\xd9\xd8\xeb\x0d\x0a\x35\x28\x69\xec\x03\x7e\
-\x0f\xf5\x98\xb1\xfa\x39\xea\x78\xa7\xb3\x51\xa5\x60\xd0\xbf\x0e\
-\x1a\x37\x78\x21\xd0\x2f\xca\xa0\x90\xab\x1b\xf6\xb5\xf8\x77\xe0\
-\x0d\x4c\x58\x24\x58\x75\x30\x91\xbe\x41\xf8\x86\x32\x9c\x51\x3c\
-\x91\xde\xb2\x76\xf2\x84\xed\x6b\xc7\x3f\x34\x3e\xd1\xb4\x72\xda\
-\xc8\x94\x7c\x34\x42\x5c\x0b\x7d\x15\x7d\x6d\x10\x13\xea\x9d\xa4\
-\x56\xd0\xd4\x1d\x13\x52\x96\x68\x65\x4c\x84\x9f\x13\xd4\xb9\x31\
-\xfa\x31\xcb\x0b\x12\xf2\xd4\x32\xca\x7a\xb6\xc7\xd5\xe3\xe6\x04\
-\x14\xf6\xa0\xc1\x84\x09\x53\x0f\xb6\xf7\xba\x0e\x77\x38\x8e\x2e\
-\xcf\x8a\xd5\x18\x55\xf2\x6c\x1f\x44\x1e\x50\x3e\xdc\x3b\x05\x2c\
-\x89\xfa\xee\xdc\x56\xf1\xcf\x1a\x8b\x3b\x10\x0a\x50\x88\xc0\x81\
-\x10\x00\x22\x00\x1c\x0b\x0a\xb2\xce\xea\x15\x8f\xb6\xd9\xf7\xaf\
-\xcc\x4b\x1e\x06\x2c\xf2\xf4\x5a\xb5\xfb\xe3\x83\xb5\xf7\x3e\x52\
-\xd2\xd2\x04\xf2\x20\x37\x48\x21\x03\x28\x4e\xc3\x7c\x46\x1e\x7a\
-\x81\x48\x90\x30\x45\xcd\x01\xad\x65\xaa\xac\x3e\xef\x88\xf8\xe8\
-\xda\xa2\x78\xf5\x3c\xf0\x94\x91\xd0\xc9\x83\x4b\xd6\x9f\xb8\x6b\
-\x47\x53\xaf\x1b\xca\x93\x2b\x07\x50\x14\x85\x8c\x13\x29\x80\x19\
-\xdc\x84\x08\x5f\x27\xeb\xf3\x73\xad\xab\xf3\x92\x46\x73\x82\x10\
-\x01\xc3\x26\x56\x0c\xe0\xd1\x11\x1a\xa5\x26\x20\x32\x87\xe7\xaf\
-\x3b\xf2\xfc\x93\x47\xea\xba\xa1\x34\x0e\x92\xf0\x0a\x13\xf6\x03\
-\xd8\x00\x4f\x9a\x8a\xd5\x6a\xa4\x7b\xc6\xa5\x66\x3e\x33\x37\xe7\
-\xba\xbc\x48\xe5\xa5\x6e\x3f\xab\xc5\x69\x52\xa6\x56\x28\xb6\xd6\
-\x5b\xf6\x77\xbb\xbf\x7a\x6b\xed\x6b\x01\x0c\x6a\x22\x45\x5d\x99\
-\x9f\x68\xb8\x76\x64\xca\x62\x98\x43\xf0\xba\x18\x3e\x17\xce\x81\
-\x38\x62\x67\x67\xc6\x4d\xbc\xae\x70\x48\x7c\x93\xc3\xd7\x5c\xde\
-\xeb\xf2\x40\x5b\xd8\xbf\x41\x84\x8d\xe3\x6d\x17\x8d\x76\x9f\xb0\
-\xf3\x68\xe3\x99\x44\xa3\xb6\xaf\x28\x35\xaa\x20\xc0\xf2\x2a\x00\
-\x89\x8d\x50\xcb\x75\xbb\x1b\xed\x9f\x3c\xbc\xb7\xf2\x2c\xd4\x27\
-\xd7\xe7\xd4\xe0\x7b\x1e\x9a\x98\x55\xa8\x67\x94\x8e\x6a\xbb\x9b\
-\xc7\x57\x68\xa1\xf0\xc3\x20\xd6\xdb\xbc\xdc\xc1\x56\xeb\xfe\x5f\
-\x8e\x4d\x1b\xb7\xb3\xb1\xe7\xe3\x85\x9f\x9e\xf9\x14\x84\x82\x75\
-\x89\xeb\x44\x3e\x50\x4c\xda\xb8\x72\xdc\x22\x58\x44\xe7\xbc\x53\
-\xd1\x51\x0d\x1d\x41\x8f\x83\xf2\x07\xa1\xe0\xae\x4f\x4b\xc7\xc4\
-\x21\x91\xf2\xdc\x98\x08\xed\xec\xb7\x0e\xdf\xb2\xa7\xc5\xe2\x0c\
-\x81\x47\x78\x60\x9b\xa8\x44\x0b\x52\x13\x54\x6b\x0a\x92\x0a\x8e\
-\x76\xda\x7b\xf1\x46\x02\xe4\x0d\x8a\xc6\x15\x0f\x89\x12\xf3\x40\
-\x91\x61\xae\x84\xb8\x44\x52\x9a\xb5\x2a\xfa\x93\x9a\xee\x77\xaf\
-\xda\x78\xe6\xdd\x63\x6d\x16\x0e\xbc\x27\x01\x1e\x79\x0d\x24\x60\
-\x4b\xd6\x7c\xab\xf3\xd3\x4c\xdb\xd7\x16\xaf\x98\x9d\x6d\x5a\xc3\
-\xba\x3d\xf1\x60\x18\x3e\x98\x0b\x25\x8c\x1d\xa2\x0c\x2a\x75\x79\
-\xb7\xe3\xd4\xf1\x0e\x87\x3b\x18\x1c\x86\x2a\x9f\x43\x5f\x0b\x20\
-\xd4\x25\x02\x9d\x34\x24\x2a\x7f\xc1\xb0\xf8\x99\x5e\x3f\x47\x2c\
-\x84\xfc\xa7\x68\xde\xcb\x0a\x82\x5a\xc9\x64\xc0\x62\x7a\xe2\xc4\
-\xe4\x48\x76\xfd\xd9\xce\x06\x54\xde\x73\x51\xc4\x0e\x40\x1d\xaa\
-\x13\xa6\xb3\x77\x6a\xba\x9b\xe3\x0d\x9a\xaa\xb1\x49\x51\xd9\xa2\
-\x20\xc6\x33\x32\x59\xdb\x3d\x3b\xca\xdf\xac\xb1\x78\x70\xc7\x86\
-\x0c\xee\xcd\x25\xc3\x73\x6e\x9d\x9c\xf3\x3f\x8b\x0a\xe3\x4c\x67\
-\x3a\x5d\xa5\xd5\x16\x17\x5e\xed\x27\x03\xc1\x0f\x9e\x37\x3a\xbc\
-\x81\xc3\x6d\xb6\xdd\x07\xda\xec\xc7\x1a\xad\xe4\x8a\x00\x82\x43\
-\x2c\x0c\xa4\x2c\x7e\xb8\x7a\xd2\x88\x85\x19\x51\x4f\x66\x46\x1b\
-\xa6\x17\xc5\xeb\x8e\xae\x2f\xef\xec\x82\x32\x64\xb7\x1f\xcb\x22\
-\x4a\xed\x2e\x6f\xf9\xba\xf2\xb6\xed\xbb\x9b\xc8\xc5\x5d\xe2\xce\
-\xb0\xbf\xe4\x1c\x2c\x79\x41\x6e\x9c\xe2\x9d\x35\xa3\xaf\x9e\x9b\
-\x1d\xbf\x26\xc3\xa8\xa8\xfc\xa0\xb2\xbb\x2f\xdc\x47\xab\x9f\x6d\
-\x5f\x91\x97\x58\xc4\x89\x62\xa2\xd9\xa8\xb5\xfc\xeb\x64\xdb\x4b\
-\xab\x3f\x3c\x79\xb8\xd7\xed\x47\xe5\x21\x6e\x1f\x79\x85\x29\x24\
-\x13\x8c\x09\xa4\xcf\x56\x8d\x2b\xbe\x77\x52\xda\xcd\xa2\xc8\x16\
-\x78\x20\xb6\xc1\x9b\xd5\xa0\x0e\x2a\x18\x8c\x51\xe2\x21\x92\x35\
-\x7d\x52\xd5\x5d\x7f\xb2\xcb\xd1\x8a\xe9\x88\x41\xb0\xfa\x60\xfa\
-\x46\x73\x20\x92\x23\xc0\x79\xc0\xa7\xf5\x6a\x34\x0a\x2d\xac\xd9\
-\x60\xed\x1a\x0c\x08\xc8\x40\x05\xc9\xe5\x63\xb9\xc8\x49\x09\xc6\
-\xc2\x28\x0d\xb9\x29\x19\x01\xc6\x23\x31\x83\x30\x98\x21\x60\x45\
-\xd0\x6c\xe6\xa6\x4f\xcf\xd4\x4f\x7d\xed\xe0\x63\x1a\x15\x53\x7a\
-\xb0\xcd\x7e\xe0\xd3\x9a\x6e\xb2\x2b\x83\x73\xc8\xcc\x54\xb3\xfa\
-\x8a\xfc\xc4\xd5\x16\x87\x9b\xa7\x03\xdc\xe4\x8f\xae\x18\x79\xdb\
-\xe5\xb9\xf1\x3a\x14\x2e\xb6\x87\xbc\xf0\x1c\x35\x68\x7b\x7d\xaf\
-\x75\x4f\x7d\x0f\xb9\x64\x84\x11\x1c\x04\x37\xf8\xe8\x92\xb8\x24\
-\x3b\x2e\x75\x71\x86\xf9\xaf\x2e\x1f\x27\x77\x79\x02\xf2\xc5\x99\
-\x09\x7f\x5d\x9a\x13\x9f\x02\xd5\xc8\x6d\x1f\x58\x16\xeb\xec\x6b\
-\xb6\xf9\xb7\x37\x58\xac\x44\x1b\xb1\x83\x40\x64\x4c\x70\xbe\x34\
-\x3b\x5e\xff\xe1\x65\xa3\x6f\xa7\xfd\xfc\x14\xe8\x0b\x07\x7d\x5a\
-\x39\x33\xdd\xac\xc6\x3e\x42\x19\xd9\xe6\xda\x1e\x76\x7f\xbb\x65\
-\xa7\x42\x2e\xaf\xbe\xf5\x93\x93\x8f\xde\xb8\xe5\x4c\x39\xf0\xc4\
-\x11\x93\xe5\x04\xf2\x42\x0a\xf5\x39\xec\x9b\x68\x93\x5a\x49\x8d\
-\x4f\x34\x17\x80\xc5\xc5\x73\x22\x85\x77\xa5\x93\x74\x94\x29\xf0\
-\xc6\xa7\xaf\xf4\x94\x46\x6e\xf5\x0b\x82\x8d\xd4\xf8\x0a\xfa\x5a\
-\x0b\x44\xe4\x91\x7d\x69\x8f\xcb\xb2\xbd\xaa\xeb\xe0\x5c\xb5\xd2\
-\x15\x9b\x16\x9f\x44\x0b\x5c\x24\x2b\x48\x78\x7d\x87\xbc\xdf\x3a\
-\x42\xa7\x62\x9e\x3f\xd5\xba\xe9\xc3\xca\xce\x96\x90\x80\xa4\x28\
-\x98\x38\xd1\x1f\x41\xd8\xd9\x3f\x8f\xe1\x07\x04\x4c\x80\x68\x75\
-\xfa\x02\x87\x5a\xad\x27\x0e\xb7\xda\xea\xc1\x25\xe2\x3c\x02\xa5\
-\x68\xe9\x99\x4b\x0b\x17\x64\x9b\xf5\xc5\xa0\xd9\x3e\x28\x0f\x41\
-\x8a\x94\xb2\x32\x3f\x39\x0b\xe6\xda\xb2\x8a\x3e\x37\x6e\x45\x11\
-\x4b\x44\x5e\x61\xd9\x84\xce\xc9\x2e\xcb\x82\xac\x58\xfd\xfa\xcb\
-\x47\x3d\xcd\x71\x42\x36\xf8\x2b\xbc\xbd\x5f\x00\x25\x8b\x5e\x9e\
-\x97\x98\x7f\xaa\xd3\xb9\xbd\xda\xea\x26\x1b\xef\x58\x07\x0e\xe4\
-\x83\xfc\x90\x90\x37\x82\x77\x59\x4e\x82\xf9\xdd\xe5\xa3\x6f\x07\
-\x07\x93\x07\x3c\xbd\xc8\x43\x2d\x93\xc7\xc7\xe8\xd4\xec\x3b\x67\
-\x3b\xaa\x43\x62\x91\xda\x02\x6c\xfb\xba\xd2\x8e\x23\xef\x9d\xed\
-\x72\x42\x02\x71\xe1\x21\x56\x24\x60\x0a\xc2\x46\x4b\x26\x50\x6c\
-\x3f\xa0\x85\xfc\x61\x2d\x28\xc5\x9a\x54\xca\x69\x69\xd1\x45\x3e\
-\xdc\xae\x21\xed\x4b\x94\x4a\x26\xd3\xea\x34\x72\x67\x73\x8f\xb0\
-\xed\xb7\xbb\xcb\x5f\x7b\xbd\xb4\xad\x15\x99\xc1\x27\xcc\xf2\x3c\
-\xfa\x5a\x00\x07\x52\x9b\x27\xc0\xbf\x5a\xdb\x53\xd7\xe3\xa1\x8f\
-\x66\x47\x29\x98\x64\xb3\x2e\x5d\x10\x44\x0d\xcc\x0b\xbc\x96\xa2\
-\x03\xbb\x3e\xaf\xdf\xb0\xc7\xea\xf6\x62\x83\xe3\x86\x18\x15\x27\
-\xae\x9e\xf4\xdf\x93\xd4\x0a\xfe\xb3\x5e\x5f\xa7\x9f\xe5\x89\xcf\
-\x0d\xb1\x22\xa3\xc4\xef\x0d\x36\x9f\xd0\x68\xf7\xe2\xdd\x63\x64\
-\x57\xe2\x8e\xf1\x99\xf1\xb7\x4f\x1a\x7a\x8d\xcd\xe3\xc7\x1d\x1c\
-\x8c\x70\x19\x50\x67\x16\x66\xae\xf8\x15\xf9\xc9\x79\x67\xba\x9c\
-\xe5\x55\x16\xb7\x27\x0c\x40\xf8\x83\xc2\x42\x21\xcc\x19\x9a\x4a\
-\x7f\xbc\x62\xcc\xef\x41\x97\x2f\x01\x7e\xf8\x7a\x12\x0c\xe6\xd0\
-\x2d\xf9\x61\x4a\x1a\xba\xaa\x28\x39\xe6\xb8\xd5\xb1\xa7\xae\xc7\
-\x4d\xde\x36\x81\x75\xc2\xd2\x41\x9e\xa8\x00\x8b\xb2\xe3\x62\x00\
-\xbc\x3b\x79\x41\x48\x07\x8b\xc0\x07\x74\x88\x4b\xf4\x82\xb0\x8b\
-\x92\xcc\x29\x30\xfd\x9e\x3e\xd2\x66\x23\xcf\x73\x34\xf6\x79\xc4\
-\x46\x9b\x97\xbc\x39\x2f\x6c\xc1\x48\x98\x07\xbc\x68\xa3\x5a\x21\
-\x3d\x32\x33\xa7\xf0\xd1\x69\xd9\xb3\xdf\x28\x6b\x2f\x0f\x40\x21\
-\xcc\x9f\x26\xa3\xfc\x53\xb2\xe3\x26\x7b\x44\x49\x06\x6b\x52\xb5\
-\x0e\xe6\xa1\x16\xbb\xf7\xf3\x07\xf7\x55\xbf\x7c\xcb\xd6\xb2\x92\
-\xcf\xdb\xac\x81\x60\xc9\xaf\xa6\x6f\x05\x20\x0a\x1c\x82\x7c\xe6\
-\x68\x5b\x4f\xe0\xef\x25\x2d\x65\xcd\x56\x77\xc9\x84\x21\xd1\xe6\
-\x78\xa3\x26\x0b\x16\xda\xf5\xd7\xec\xae\xda\x06\x41\x0e\x01\xe9\
-\x9a\xa2\x94\xc2\xf9\x85\x49\xab\xe3\x93\x22\xc6\xde\x37\x3e\x2f\
-\xb2\xc5\xe9\xae\x3b\xdd\xe5\x0e\xc0\x0c\xd4\xbf\xb1\x8d\x1f\x14\
-\x0c\x5a\x00\xba\x0e\x8c\x18\x3f\x59\x31\x7a\x95\x4c\x12\x87\x43\
-\xa8\xe0\x82\x64\xd2\x3f\xc8\x47\x61\x04\xa0\x7c\xcc\x55\x45\xc9\
-\xa3\x4f\x74\xd8\xab\x6a\xac\x1e\x3b\xae\xbf\xc2\x63\x04\x81\x91\
-\x79\x62\x55\x7e\xc2\x98\x39\xd9\xd1\x0f\xbb\x7d\x1c\x09\x48\x42\
-\xd9\xc8\x83\x09\x08\x62\x40\xaf\x53\x8e\xac\xee\x72\x1e\xde\xdf\
-\x6c\xed\x40\x57\x8e\x75\x30\x1f\x79\x81\xfc\xa5\x79\x19\xb1\x29\
-\x9f\xae\x19\x77\x6f\x80\xe3\x13\xa0\x4f\xa8\x28\x61\x19\x41\x09\
-\x8a\x03\xf9\x47\x4f\x4c\x35\x2a\x9e\x3b\xd6\x5c\x82\x1b\xdb\x18\
-\x95\xe2\x3f\xe8\x1f\x29\x84\x8a\x84\x8a\x81\x60\xce\xcd\x8a\x55\
-\xff\x6b\x71\xd1\x15\x57\x14\x24\x5d\x19\x6b\x50\x67\x58\xdc\xec\
-\x99\xc3\xed\x36\x3b\xf2\xaa\x66\x45\xdf\xcd\xe3\xd3\x47\x1a\xd4\
-\xca\x34\x58\x68\x94\x3d\x7b\xa4\xe9\xe5\x85\xef\x1e\xdf\x79\xb2\
-\xc3\xe1\x85\xa5\x07\x4e\x4d\x5f\x98\xf2\x57\xd0\xb7\x02\x30\xc4\
-\x8f\xb8\x3f\xe8\x1f\x5d\xd2\xe5\x72\x7e\x56\xdb\x75\x24\x45\xaf\
-\x70\x35\xdb\x3d\x3d\x7f\x3f\xd5\x5a\x03\xf9\x32\x83\x9a\x91\x5e\
-\xba\xb4\x70\xa9\x96\xa6\x93\xd8\x80\xe8\x03\xd8\x73\xae\xc8\x4f\
-\x1a\x35\x39\x25\xa1\x77\x4b\x65\x73\xa7\x4f\x40\xc3\x1a\x60\x41\
-\xf0\x07\xa5\x83\xd1\xd7\x50\x73\x6c\xf7\x98\x24\x63\x9a\x28\x09\
-\xf1\x20\xc0\xe0\xf3\xd6\x40\x70\xc0\xf7\xc7\xf8\xb5\x1a\x65\x7c\
-\xb3\x87\xed\xd8\x5d\xdf\x5b\x0b\xfd\xe8\x7f\x3f\x67\xc8\x90\xe8\
-\x93\x9d\xd6\x8e\xff\x2a\x4a\x92\x99\xd5\xea\xa9\x01\x41\xf0\x41\
-\x57\x49\x7d\x10\xb0\x60\x50\x2a\x4c\xdd\x1e\xcf\x0b\xab\xdf\x3f\
-\xf5\x21\x2e\x2b\x42\x75\x08\x81\xb5\xe3\x2d\x84\xd2\x35\x63\xd3\
-\x26\x4c\x4b\x8d\x9a\x06\x73\xa7\x1d\xd2\xfa\xb7\xeb\x20\x4f\x94\
-\xc1\xdc\xa4\x97\xe4\xcd\xeb\x4b\x3a\xd7\x7f\x58\xdb\x89\x2e\xb3\
-\xdf\x95\x23\xa1\x12\x84\xad\xee\xb7\x33\x86\xe5\x3c\x39\x2b\xf7\
-\xd6\xa4\x08\xcd\x58\xf0\xd8\x5e\x50\x16\x55\x46\xa4\xda\xf3\x52\
-\x49\xcb\x59\xa8\x23\x73\x81\x2a\x4c\x4c\x34\x1a\x6a\x7a\x3c\xa5\
-\xcb\x3f\x38\xf9\xda\xdb\xe5\x6d\xb8\x27\x8b\xb1\x03\xf2\xfc\xba\
-\xe5\x5f\x3f\x91\xc1\x7d\x57\x42\x20\xd1\x23\xc0\x91\x2c\xb2\xe0\
-\x94\xdc\x24\x74\xe3\x84\xa4\xc8\x17\x17\x8c\xfa\xad\xd5\x1e\xd0\
-\x29\x64\xe8\x19\x61\x8c\x10\x66\xab\x34\x72\x46\x6c\x77\xec\xb9\
-\x7e\x7f\xdd\xfb\xeb\xea\xba\xd1\x35\x11\xad\x0f\xb1\x03\x90\xd0\
-\x34\x69\x69\x52\x72\xa4\x61\xd3\x9a\xf1\x37\xaa\xe5\x54\x51\x80\
-\x15\x5c\xa0\xe5\x24\xfc\x87\xb2\x4a\x8d\x4a\xd9\x3d\xff\xed\xa3\
-\x7f\xdc\xd5\xd8\xeb\x09\x09\xac\xbf\x3e\xf0\x23\x6e\x74\x4a\x72\
-\x14\xb5\x71\xf5\xd8\xa7\x94\x0c\xb5\x40\x14\x28\x08\x04\xc0\x6d\
-\x28\x64\x91\xac\x48\x7d\xb6\xe8\x9d\xc3\x77\x1f\x6c\xb1\xf5\x97\
-\x0d\x53\x98\xd7\x8c\xf4\x28\xd5\xae\xab\x27\x3e\xe4\xf2\x72\xc9\
-\x20\x1d\x0c\x8e\x70\x3e\x17\xb5\x72\x99\xc1\x26\x48\x15\x7f\x78\
-\xeb\xd8\x0b\xaf\x76\x58\xed\x90\x81\x13\xef\x80\xb6\x83\xd3\xc2\
-\x82\x7c\x93\xfc\x37\x13\x72\x17\x8e\x4b\x89\x5d\xe0\x70\xfb\xf0\
-\xbd\x6a\x7e\xe4\x0d\x45\x20\xf8\x94\x75\xcd\x7d\xe7\xe8\xef\x3f\
-\x6f\xb1\xe0\x3d\x36\xc4\xb7\x23\x03\x94\xe1\xb9\xb2\xf8\xa6\xf4\
-\x8d\x2c\x10\x81\x0a\x36\x10\x4a\x08\x11\x7e\xc7\x8e\xc0\x01\x1b\
-\xc7\xfd\x3c\x70\x49\x92\x54\x9c\x14\x33\x7c\x5e\x66\xf4\x1c\xb7\
-\x5f\xf0\x83\x3b\xc1\xdd\x5c\xac\x2e\x70\x10\x95\xd0\x91\xba\xdc\
-\x55\x23\x87\x8c\x3c\xdb\x65\xaf\x3b\xdb\xe7\xb6\x87\x42\xf2\x7e\
-\xc2\xb6\x9a\x1d\xbe\xc0\xde\x26\xcb\x89\xd5\xc3\x93\xa3\xd4\x32\
-\x26\x1b\xaa\xf9\x51\x0b\x4c\x3a\x95\x7a\x6b\x73\xdf\xba\x3f\xed\
-\xab\xc1\x3b\xab\xfb\x7f\x4a\x00\xa5\x13\x16\x20\x36\xd4\xec\xf4\
-\x52\x47\x3a\xec\x47\xae\x1b\x9d\x31\x89\x65\xb9\x78\x48\x54\x68\
-\x39\xa9\x62\xc1\x7b\xc7\xee\xdc\xdf\x62\x0d\xff\x6a\x35\xa9\x13\
-\x26\x64\x84\x3c\x61\xad\xca\x67\x9a\x23\x1c\x63\x13\x0c\x13\x7c\
-\xbc\x48\x94\x0f\x5c\xbb\xc1\x27\x8a\x47\x17\xbe\x75\xf4\xf9\x8f\
-\x3a\x6c\x6e\x6c\x04\xda\x22\x6d\x23\x21\x40\xd8\xf6\xe2\xac\xd8\
-\xa4\x4f\x57\x8d\xbf\x2d\x46\xa7\x9d\xea\xf4\x04\x58\x18\x5b\x68\
-\x69\x40\x4b\x10\xf0\xd1\x46\xb3\x26\xb6\xbc\xcf\x5d\x71\xa4\xd9\
-\xd2\x23\xc7\x75\x03\x01\x0c\x2a\x9f\xa3\x4c\x61\xfa\x32\xb9\x0f\
-\xa4\x6f\xb4\x8c\x40\x7f\x8e\x1f\x3c\x27\x4c\x07\x8c\x1c\x93\xe1\
-\x43\xba\x02\xd6\x87\x4b\x0b\x6a\x6f\x87\xf3\x64\xbd\x26\xe5\xe5\
-\x28\x8d\x1c\x6f\x8f\xd6\xa3\x55\x42\x32\xa9\x17\xf0\xb1\x2e\x28\
-\x98\x30\x32\xc1\xa4\xc6\xb2\x38\x3a\x3c\x02\x5f\x3c\x90\xb6\xb0\
-\x8d\xa3\xed\x36\x6e\xc6\x6b\x87\x5e\x72\xf3\xc2\x66\x88\xce\xf0\
-\x2d\xe4\x1a\x87\x97\x2d\x7b\x62\x5f\xf5\x21\x2c\x87\xe3\xc2\xa3\
-\x41\xa6\xa0\xe3\xb4\x2a\x5c\xd6\xa0\x05\x93\xbe\x00\x2b\x66\x5f\
-\x93\xd5\xf1\xfa\x99\x8e\x7b\x0d\x3a\x85\xc7\x60\x54\x7b\x5e\x3f\
-\x5c\xf5\x6b\x58\xa8\xbb\xf0\x4a\x3b\x96\xc1\xb2\x58\x27\x4e\xaf\
-\x96\xc3\x9a\x39\x3c\x20\xe4\x49\xdf\xbc\xe9\x74\x49\x8b\x83\x2b\
-\x81\xbe\x69\xd4\x0a\x99\xde\x27\x08\x3b\x2f\xf9\xd7\xa1\xe7\x8e\
-\x76\xd8\xfd\xf8\x48\xf6\x00\x59\xe0\x81\x28\x0d\x1e\xa7\x66\x25\
-\xa4\x82\xa1\x15\x38\xbd\xac\x53\x8e\xe6\x05\xbc\xd0\xaa\x19\x49\
-\xd0\x19\x95\x14\x5f\x5f\xe7\x7e\x63\x57\x45\x77\x35\x66\xa0\xac\
-\x90\x0b\xf6\x25\xc4\x8e\x10\x28\x43\x3f\xbf\x81\x72\xff\x32\xfa\
-\x5a\x0b\x44\x4f\xf1\x9b\xa9\x59\xc3\x96\x65\x27\x6a\x6b\x6c\x1e\
-\x87\xc5\x87\x01\x61\xb0\xd3\xf0\xf9\x42\x0d\x81\xc2\xe7\xdd\x2e\
-\x1f\xf5\xdc\xfe\xf2\x86\xfa\x1e\xc7\xf1\xe2\x94\x18\x73\x6c\x84\
-\x3a\xcd\x13\xe0\x30\x5c\xc6\x68\x4d\xeb\x17\x64\x15\x57\x7e\x7c\
-\xea\x13\x0f\x4b\xde\x1b\x27\x45\x6b\x55\xe4\x82\x29\x36\x86\x3d\
-\x47\x8d\x43\x10\x3b\xdc\x7e\x7a\x6b\x63\x6f\xe9\xe5\xa3\x93\x98\
-\x58\x73\x44\xde\x43\xdb\x2a\x5f\x59\x7f\xb6\xc3\x02\xbe\x08\x9b\
-\x26\xe5\x1e\x18\x9f\x93\xfe\xe9\xd5\xe3\x6e\x28\xeb\x76\x94\x57\
-\xf4\xba\xf1\xe7\x07\xd0\x67\xe3\xfd\xa8\xcc\xc7\x55\x6d\xd6\x9c\
-\x48\x7d\xdb\xd9\x2e\xc7\xde\xab\x77\x54\x1e\x87\x2c\x8c\x68\xfb\
-\x37\x04\x96\xe5\xc6\x27\x1e\xbb\x71\xe6\xdd\x3c\x47\xd7\xef\x69\
-\xee\x76\xc0\x9c\x87\x9b\xe0\x14\x58\x1e\xa5\x90\x4b\x7d\x0b\xc7\
-\x0c\x9d\xd6\xe3\xf0\x6d\x9a\xbb\xee\xf0\xdb\xa7\xba\x5c\x64\xcd\
-\x0b\x73\x27\x59\x3f\x40\xfb\x70\xa0\xa9\x68\xad\x92\xf2\xf2\x02\
-\x91\x09\xc7\x4a\x3d\xab\x0a\x13\x8b\x28\x51\x34\x42\x53\xc0\x85\
-\x96\x19\x94\xb4\x96\x32\x45\x9f\x79\xa9\x51\x78\x6e\xfe\x6b\x5b\
-\x4e\xf7\xf8\x39\xe8\xdd\x00\xf3\x0d\x11\x02\x87\xa3\x42\xbc\xb4\
-\x91\x51\x54\xaa\x4e\x4e\x3f\x38\x29\x33\x7d\xc2\x10\x53\x0c\x78\
-\x0d\x7c\x3d\xcb\x05\xe9\x6b\x01\x04\x9e\xd4\x5b\xcb\x47\x4f\x9e\
-\x35\x2c\x61\xc2\x35\x79\x09\x49\xf9\x71\x06\xc6\x64\x56\x3a\x2b\
-\x3a\x9c\x3c\x5e\x69\x86\x7c\x1c\xcf\x20\x22\x8a\x29\x08\xf4\x99\
-\x1e\x97\xe7\xa3\xca\xee\xa3\x26\x85\xac\x6b\x62\x7a\x74\x4e\x80\
-\x13\x40\xdf\x19\x7a\x6f\x9d\x7d\xcb\xcb\xa7\x9b\x1a\xb1\x68\x14\
-\x08\xe0\xe4\xf5\x53\xaf\x2d\x88\xd5\x4a\x87\xda\xec\x5d\x1e\x4e\
-\x20\xcf\xf0\x81\xe6\x12\x0d\xef\x74\x05\xa8\xbd\x0d\x3d\xd5\xa7\
-\x9a\x6c\xa5\x2f\x9d\x6c\x6e\x84\x01\x82\x4b\x0e\xe6\x2f\x4c\x4f\
-\x66\x9e\x5d\x94\x7b\x43\x40\xe0\xc7\xad\x29\x4c\x4e\xac\xe9\x73\
-\x97\xc0\x7a\x95\x43\x97\x46\x34\x1f\x8e\xef\x57\x75\xd6\x7d\x50\
-\xd9\x59\x47\xfc\x18\xe8\x18\xa6\x61\xde\xda\x82\xe4\x88\x77\x96\
-\x8f\xba\xcd\xe7\x0f\xe4\x4d\x4f\xd5\x44\x9e\xee\x76\x1c\xae\xea\
-\xf3\x62\x74\x45\xc0\x38\xde\xe1\x70\xb6\xf7\x78\x4b\xff\x7a\xa0\
-\xf9\xd0\xa9\x6e\x3b\xd9\x4f\x05\x6b\x20\x82\x06\x33\x65\x62\xb4\
-\x4a\xe9\xe9\xb9\x79\xc3\xff\x7c\x49\xee\xfc\x37\x4b\xdb\xce\x78\
-\x39\x91\x76\x3a\x3c\xfc\x95\x89\xc6\x48\x5d\x6c\x44\x9e\xc4\xf1\
-\xb2\x08\x95\xcc\xfb\x66\x59\xd7\x9b\x2b\xd6\x1f\x5d\xff\xce\xb1\
-\x2a\x37\x43\x6e\x98\xfb\x42\xd1\x91\x08\x70\xc8\x13\x1a\x55\xc8\
-\x19\x6a\x65\x66\x8c\xe6\x8d\xeb\x16\xe5\x3d\x34\x36\x61\xca\x94\
-\x74\xf3\xb8\xec\x68\x3d\xfd\xbf\x87\x1b\x6a\xa1\xce\x79\x72\x46\
-\xfa\x7a\x0b\x04\xe6\xd7\x16\x26\x67\x18\x68\xca\x00\xe7\xfa\x51\
-\xc9\x51\x99\x4b\xb3\xe2\x32\x96\x64\x44\xab\x2d\x3e\xc1\x59\x67\
-\x83\xc5\x21\xaa\xf3\x00\xc2\x6f\xf8\x41\x8d\xb5\xfa\x59\x66\x63\
-\x4d\x77\x6b\x55\xb7\xfb\xd8\xa4\x54\x53\x5c\x54\x8c\x29\xfa\x8d\
-\x23\x6d\xeb\xf6\x83\x74\xb0\xd8\x5d\x13\xd2\x87\x5e\x96\x9f\xf0\
-\x8b\x91\x43\xa2\xc7\x4e\x8c\x8f\xf0\x6e\xef\x66\xeb\x5d\xf8\x3b\
-\x7d\xa2\x80\x96\x44\x94\xa1\xd3\xc9\x52\x27\x3a\x1d\xd6\x20\x78\
-\xc4\xcf\x31\x5a\x05\x2d\xbd\xb0\xb0\x70\xe1\xd0\x48\xcd\x25\x2e\
-\x3f\xd7\x07\x01\x6c\xea\xea\x11\xc9\xf1\x67\x3a\x6d\xc7\x2b\xfb\
-\x3c\x44\xe0\x08\x32\x1c\x70\x08\x04\x3c\x3c\x42\x57\xa5\x15\xc3\
-\x87\x28\xde\xba\x7c\xc4\x2d\xde\x00\x9f\x07\x9d\xb7\xe8\x54\xaa\
-\xb4\xc4\x88\x88\xc0\x7b\x15\xdd\xb5\xac\x00\xd3\x16\x94\x45\x2b\
-\x3e\xd9\x65\xb7\x76\x79\xbd\xa4\x0f\xa4\x2f\x28\x44\x85\x92\x4e\
-\x8c\x89\x92\xde\x5d\x94\x7b\xc9\x65\x45\x29\xd7\x1b\xd5\xb2\x0c\
-\x67\x80\x2b\xdd\xdf\x6c\xb3\xfa\xa0\x6f\xc9\x46\x1d\x37\x2d\xcb\
-\x3c\x3d\xa0\x32\x9e\x79\xb1\x45\x7a\xee\xa6\x77\xf7\x55\xe0\xef\
-\x0e\x22\x78\xd0\x6f\xd4\x8d\x41\x84\xdf\x95\x00\xdc\x15\xb9\x89\
-\xc6\xd7\x16\x16\x8e\xba\x65\x52\xce\x54\x93\xdf\x92\xc3\x73\xbc\
-\x56\x10\x24\xb1\xcb\xe9\xb7\xbd\x78\xb2\x19\x01\xbc\x20\x7d\x03\
-\x00\x29\xea\x96\x31\x69\xd9\xd1\x1a\x95\x11\xd6\x3d\x1c\x2c\xc8\
-\x79\xbf\x5f\x50\xc5\x19\x34\x29\xab\x8b\x92\xb3\x67\xa6\x98\xf5\
-\x6f\x97\xb7\xb7\xa3\x56\x63\x79\xb4\x58\xfc\xe0\x17\xc4\x15\xce\
-\x61\xc1\x4c\x31\xa5\xbd\x4e\xef\xee\x06\x4b\x49\x69\x9b\xb5\xea\
-\xc5\x33\x8d\x1d\xb0\x64\x90\x94\xe0\xaf\xfe\xb1\xb0\x60\xbe\x4e\
-\x26\xcf\x84\xf9\xcd\x9f\xaa\x57\x8c\xbb\x67\xe1\x54\x73\x43\x97\
-\xbd\xe2\x4c\x67\x1f\xaf\x84\x89\x04\xaf\xba\xa2\x00\x21\x20\x20\
-\x6b\x36\x54\x0a\x3c\xfe\x6e\x7a\xd6\x90\x2b\x47\xa7\x5c\x6b\x71\
-\xf9\x05\x25\x64\xc2\x9c\xe2\x57\xd0\x74\x7a\x4a\xa4\x56\xf5\x5e\
-\x79\x47\x39\x44\x3d\xd8\xf5\x7e\x65\xc2\x2f\xd8\xc3\x44\x83\x96\
-\xda\xbe\x76\xea\xb5\x02\xef\x9f\x20\x04\xb7\xb1\xe4\x6e\x96\xe3\
-\x73\x13\xcd\x43\x29\x41\x71\x66\x77\x53\x17\xae\x1f\x89\x8b\xc5\
-\x23\xd4\x24\x21\x3d\x99\xfb\xa0\xdd\x35\x45\x19\xea\xbd\xb7\x2d\
-\xbc\x26\x5e\x72\x2f\x71\xfa\x79\x3f\x44\x52\x8a\xcc\x28\x03\xf7\
-\x8f\x92\x96\x52\xf4\x48\x82\xc5\xe5\x9b\x92\x9e\xd1\x7c\xe9\x3b\
-\x07\x3e\x7e\xfd\x40\x99\x0b\xf4\x8c\xec\xbd\xa2\x85\xa1\x26\x41\
-\x4c\x80\x6e\x92\x5c\x0c\xc7\x7e\x5d\x9a\x19\x63\x78\xef\xf2\x51\
-\x93\x6f\x1e\x9b\x3e\xd9\xac\x51\xa5\xba\x7d\x2c\x2d\xd0\x32\x0e\
-\x0a\x0b\x4a\x08\x0a\x6d\x7e\xde\xf9\xc2\x57\x00\xf8\xb5\x41\x0c\
-\x36\xaa\x57\x29\x68\x30\x6f\x0d\x28\x04\x7a\x27\x1a\x97\x06\xf8\
-\xdc\x3b\x44\x5a\x8a\x11\xf1\xa6\xc2\x68\x88\x0e\xb1\x6c\xa4\x5a\
-\x41\x47\x6a\xe4\x44\xf3\xb1\x20\x71\x37\x70\x0e\x16\x4a\xe6\x9d\
-\xb2\x5e\x17\x0f\x6e\xb0\x8a\xe5\xc9\xeb\xd2\xa4\x19\x69\x31\x86\
-\x44\xbd\x7e\x04\xf0\x62\x51\x40\x2c\x2d\x73\x7b\x1a\x2b\xa6\xbf\
-\x3e\x77\xe8\x3d\xbf\x18\x3e\x24\x0a\xca\x91\xfd\x4e\x14\x20\xf2\
-\x40\x40\x70\x52\x87\xb5\x09\x75\x4d\xc1\x90\x35\x6e\x37\x0b\xa7\
-\x0c\xd9\x82\x03\xb9\xc8\x9c\x01\xde\x53\x9c\x1c\x35\x6f\xd3\xaa\
-\xb1\xb3\x43\x78\x21\x02\xc4\xf7\x84\xe4\x47\xbd\xb5\x74\xf8\x0a\
-\x15\xed\x9b\xc6\x89\x94\x1b\x78\x13\x05\x56\xc8\x64\xbc\xdb\xe5\
-\x89\xf8\xe5\xa8\x98\x95\x7a\xa5\x9c\xb8\xca\x70\x5b\xd8\x7f\xe8\
-\x1a\xcd\xc2\xc9\x2f\x46\xa4\x98\xdf\x9c\x9f\x75\xb7\xb7\xa9\x72\
-\x3a\x2b\xc9\x3c\xa4\xcf\xa2\xc8\x26\x68\x14\x23\xa6\xa5\x9a\xc8\
-\xcb\xef\xf6\xfa\x78\x7f\xc6\xcb\x5b\x8f\x9e\xee\xb0\x08\x78\x87\
-\x25\xcc\x78\xb8\x2f\x4a\x5c\x25\xf4\x02\xbe\x50\xd2\xd0\xc8\x08\
-\x2a\x02\xe6\x12\x2c\x3f\x2f\x2b\x3e\xbe\x70\x48\xf4\xf0\x3e\xb7\
-\x9f\x09\x70\xbc\x1f\xc6\x83\xe5\x31\x74\x95\xa3\xcc\x75\xaa\xa0\
-\x1a\x7d\x19\x7d\x25\x80\xc4\x75\xc0\x60\xd6\x95\xb7\x9c\x68\x71\
-\xf8\x8f\x6b\xd5\x06\x67\x84\x5a\x26\x03\xcb\x51\x91\x3e\x41\x90\
-\x05\xc2\x0f\x84\xd7\x01\x20\xf4\xc8\xb2\x5f\x4e\x9d\xbe\x2a\x2f\
-\xc1\x0c\x65\xc8\x3c\x15\x06\x12\x85\x01\xfc\xd0\x82\xb0\x43\xa4\
-\x4b\x19\x91\xda\x18\x8d\x41\x65\x84\x05\x7a\xf0\x0a\x01\xf6\x47\
-\xa1\x72\xb9\x45\x2a\xf3\x85\xb9\xd9\xf7\xbf\x78\xc3\xe5\x99\xea\
-\x08\x13\x32\x07\x2e\x5f\x8c\x22\x00\xfe\xcc\x2b\x8a\xcd\xb0\xac\
-\xc4\x5d\xe3\xfe\x0c\x54\x6e\x70\xe8\x74\x86\x59\x9f\xab\x57\x9e\
-\xe7\x5c\x24\x2d\x00\x9f\x63\xd6\x27\xf3\x50\x65\x80\x54\x24\x41\
-\x10\x64\x7a\x05\xcd\x6f\xa8\xe8\x3a\xed\x86\xc0\x0a\x73\x48\xa3\
-\x98\x0b\x0d\xab\xc1\xbb\xbc\x38\x62\x48\xc6\x0b\x8b\x86\xdf\xef\
-\xe1\xf8\x6c\xec\x23\x8c\x85\xf4\x19\xb7\x32\x35\x06\x75\x44\x46\
-\x64\xf0\x05\x43\x28\x14\xf0\x3d\x18\x70\xa3\xe5\xe2\xfb\xdf\xc8\
-\xce\x0c\xca\x22\x21\x2e\x86\xfa\xfb\xf5\x57\xc4\xd6\xdf\x3c\x63\
-\xce\x55\x85\x89\xe4\x55\x95\x00\x9a\x97\x82\x0f\x34\x83\x6a\x03\
-\x31\xb5\xa4\x36\xa9\xc0\xf2\x58\xde\xda\x64\x0f\x1c\x59\x7f\xd6\
-\x76\x1c\x31\xf8\x32\x14\xbf\xd2\x85\x06\x61\x21\x37\xb6\xba\x9f\
-\x3b\xd1\xdc\x72\xaa\xcb\x53\x65\xf3\xd3\x9d\x71\x7a\x0d\x67\xd6\
-\x29\x74\x5a\xa5\x4c\x07\xe0\x31\xcf\x9f\x68\x2e\x75\x04\x78\x76\
-\x64\x42\x44\xfc\xaa\x91\x69\xd3\x2e\xcb\x8e\xcb\x5c\x9c\x19\xab\
-\x77\x05\x04\x5b\xad\x1d\x16\x44\xe0\xab\x40\xd6\x64\x1e\xc1\x41\
-\xe1\x07\x41\x3c\xde\x61\xb7\x99\x18\xaa\x6e\xe6\xb0\x84\x1c\x8e\
-\xe3\x23\x21\x1d\xd6\x68\x14\xbe\xd1\x10\x5c\x08\x13\x31\x22\x52\
-\x36\xe2\xb9\xcf\xab\xf6\xfa\x38\x9e\xc7\xf2\xd8\x1f\x1c\x08\x0a\
-\x63\x5f\x53\x5f\xf9\xb2\xdc\x64\x90\x9d\x2c\x0f\x84\x48\x16\xc6\
-\xe0\x96\xe5\x46\x9d\xda\xf3\xf0\xae\xba\x97\x0f\xb4\x5a\x06\xbd\
-\x7b\x06\xcf\x61\xbe\xa3\x38\x86\x6e\x5a\x9c\x1b\x3f\x16\x9f\x13\
-\x44\xc0\x39\x08\xb6\xcc\xa6\x08\xe5\xfa\x26\xf7\xba\xff\x7a\xff\
-\xe8\x2e\x28\x46\xe6\x4b\xac\x83\x6d\xc2\x19\xbe\x94\x41\xfd\xfa\
-\xda\x71\x0f\x81\xb2\x98\x41\x0f\x7d\x90\x8e\xbb\x36\x22\xac\x48\
-\xb4\x26\xa3\xda\xf2\xe4\xfe\x9a\x97\xfe\x78\xa0\xae\x1a\xcb\xe3\
-\xdc\x09\x55\x89\x4a\x07\xc7\x2c\x51\x2a\x39\x4d\xad\xc8\x4b\x32\
-\xbd\x34\x37\x77\xe2\xbc\x24\x55\x31\xac\x0a\x13\xb7\xd5\xf5\x36\
-\xc1\xb2\xc4\x36\x3f\x3b\x46\x3f\x21\x35\xba\x50\x41\x33\xe0\x5d\
-\x05\x57\x9b\xa4\xab\xfa\xb0\x4f\x7e\xe4\x9a\x7f\x6d\x39\xfe\xc8\
-\xe7\x0d\x2d\xe0\xd2\xdd\xc8\x32\x34\x8c\xf3\xe8\x6b\xe7\x40\x24\
-\xe8\x07\x6a\x10\x5d\x63\x71\x88\x9b\xeb\x3a\x9c\xcf\x9f\x68\x68\
-\x3e\xdd\xee\xac\xb6\xf8\x03\xb6\x18\x9d\x4a\xf1\x8f\x53\x2d\x8d\
-\x6e\x4e\x60\xc7\x27\x9a\x93\xe6\x67\xc4\xa4\x5a\x61\x05\x9f\x64\
-\xd4\x26\xad\x28\x48\xc8\x5e\x9a\x95\x28\x73\x04\x94\xbd\x67\xba\
-\x2d\x64\xd7\xfd\x9c\x8e\xd0\xdb\x9b\x2c\xbd\xa5\xdd\xee\xa3\xd3\
-\x52\x22\x63\xe3\x74\xaa\x34\x1f\x07\x51\x44\x70\x67\x47\x16\xf0\
-\xf3\x9d\xcf\x1d\x6f\xdc\x0b\x61\x3a\x99\xd0\x10\x04\xac\x8f\xe7\
-\x5d\x1e\x96\xde\xd9\xd8\x53\xb6\xa2\x20\xd9\x04\xd6\x96\x83\x17\
-\x55\x21\xa2\xd5\x6e\xa8\xe8\xf8\xf8\x9e\x9d\x67\x4b\xa0\x0c\xb9\
-\x61\x18\xfa\x4e\xca\x23\x90\x98\x76\xb4\xd5\xe6\x2a\x88\xd1\xf3\
-\xa3\x13\x8c\xa3\xc0\xda\x02\x7a\xb9\x4c\xe7\x14\x99\x0f\x6e\xdc\
-\xdf\xb1\xb5\x13\xdf\x78\x82\x1b\xe8\xd0\x06\x5a\x0d\x54\x21\xdd\
-\xd5\x2a\xe5\xe2\x4d\x63\xd2\x47\xc1\x5c\x1e\x09\x5c\x04\x0e\xfc\
-\x20\xb4\xa9\xef\xf5\xf3\x67\x6e\xf8\xb8\xe4\x99\xa7\x8f\x35\xb5\
-\x20\x7b\x28\x4a\xca\x23\x61\xbb\xa8\xb0\x6b\x0a\xe3\x95\xaf\x2d\
-\x2c\x1a\x73\xf3\xb8\x8c\xe9\x46\x85\x2c\xd1\xee\xf4\x72\x3a\x8d\
-\x8a\xd9\x54\xd3\xdd\x7e\xac\xc3\xde\x33\x32\xd6\xac\x1f\x1d\x63\
-\x88\xf8\x47\x49\xf3\xb1\x27\x0e\xd7\x1d\xba\x63\xf3\xe9\x86\x4f\
-\x4e\xd7\xb9\xf0\xb5\xd1\xc0\x06\xd5\x89\x8c\xf9\xcb\xe8\x1b\x01\
-\x18\x66\x80\x1a\x05\x44\xc0\xac\xb6\xb9\xf9\x2d\x75\x3d\x7d\xcf\
-\x1e\x6f\xaa\xf6\x0b\xf8\xc0\x2a\x25\x8d\x4f\x34\x26\xcc\xcf\x89\
-\xcf\x02\xcb\xf3\x43\x11\x08\x78\x04\x45\xbc\x41\x9d\x76\xd9\xb0\
-\xa8\xb4\xdc\x68\xad\xff\x58\x87\xc3\x06\x1d\x23\x02\x45\x01\x01\
-\x63\xf2\x8a\xc9\xb3\x3d\x4e\xff\xf6\x86\x9e\x63\x63\xe2\xcd\xde\
-\x21\x46\x75\x1e\xba\xb1\x08\x95\x42\xf6\x59\x6d\xdf\x96\x37\xca\
-\x5a\xc9\x8f\x73\x40\x79\xd4\x66\x0c\x95\x18\xbc\x63\x0b\xe5\xdb\
-\xe1\x0e\xd0\x9b\x6b\x7a\x4e\x2f\xcb\x4d\x88\x56\xa9\xe4\x60\x89\
-\xd4\xd9\x5b\x36\x95\xbd\xd1\xe6\xf2\xa3\xab\x46\x4b\xa7\x21\xdc\
-\x87\x88\x55\x4e\xc3\xf2\x04\xdb\x24\xa1\x56\xab\xcb\xd7\x78\x45\
-\x76\x6c\x8e\x4a\x2e\x4b\xb7\xfa\xa4\x4f\xa6\xbf\xba\xff\xa3\xb2\
-\xa6\x36\xd0\x1b\x9a\xfc\xba\x24\xb8\x2c\xe2\x1e\xd1\xfd\x63\x7b\
-\xa0\x40\xe2\xa8\xb8\x08\xd9\x88\xf8\x88\x22\x88\x28\x85\x18\x9d\
-\x46\xd1\xe1\xa3\x3e\x99\xf3\xe6\xc1\xd7\xf7\xb7\xd8\x7c\x50\x91\
-\x6c\xd0\x87\x40\x27\x94\x6c\xd4\xc8\x9e\x9b\x57\x90\xfb\xd0\x94\
-\x9c\xd9\x31\x5a\x4d\x86\xcb\xc7\xe2\x2b\x52\xf0\x7d\x1a\xb4\x1e\
-\x14\x6d\x7b\x5d\x4f\xc3\xd1\x76\x7b\xcf\x91\x76\xab\xf7\xb1\x43\
-\x75\x95\x5b\x1b\x7a\xfb\xaa\x2d\x5e\x8c\xed\xf0\xa5\xaa\xd0\x72\
-\x50\xee\x61\x7e\x5f\x46\x5f\x1b\xc4\x0c\x24\x44\x09\x5c\x07\xe1\
-\x8b\x60\x42\x7f\x11\x51\xfc\x90\x76\x7a\x03\xaa\x46\xaf\x85\x3b\
-\x1d\x2d\x83\x25\xac\xc0\xaa\x05\x51\x14\x20\x54\xf7\x38\x7d\xac\
-\x71\xf5\xb8\x8c\x4b\x6f\x1e\x9d\x36\x14\xcb\xe1\xaf\x9e\x20\x1b\
-\x08\x9f\x65\x50\x93\x04\x38\xb0\x06\x63\x26\xbc\x76\x60\xdb\x33\
-\xc7\x9b\x9f\x89\xd5\xab\xf1\xd6\x02\xfe\x50\xbb\x05\x6f\xac\x25\
-\x6e\x13\xab\xbc\x32\x7f\xf8\xf0\x9b\xc6\x25\x1a\xc1\x20\x71\x3d\
-\x87\xef\x5e\xa3\xce\xf6\xb9\xa4\xf9\x6f\x1d\x7d\xc3\x24\x48\xa7\
-\x36\x9d\x6a\xd9\x7a\xa4\xc3\x8e\x97\xa6\xf0\x32\x24\x63\x8e\x8d\
-\x93\xb6\x5e\x3d\xf9\x52\xf8\xcc\xc7\x73\x04\x06\xf8\x30\x47\x5a\
-\xed\xd2\x36\x3b\xbd\x9d\x92\xab\xf7\xcc\x7e\xfb\xe0\x7b\x55\x36\
-\x37\x0d\xfe\x0b\x7f\x86\x15\xdf\x17\x2a\xdd\x94\x9f\x1a\xf1\xf7\
-\xf9\x45\xc3\x11\xf0\x30\x26\xfb\xbb\x9d\x67\xc0\xc9\x05\xc0\xe3\
-\xf0\x7f\x3f\xd1\xf6\xe2\xb4\xd7\x8e\x7c\x5c\xdd\xe7\xc1\x17\x06\
-\xc1\xa4\x0e\x2b\x1b\xe8\x22\xce\x55\xe8\x97\xb1\xfc\xad\x63\xd2\
-\xd3\xae\x9a\x90\x39\xdb\xe9\xe3\x74\x4e\x3f\xeb\x81\x3c\x09\x02\
-\x24\x4d\x94\x4e\xcd\x1d\x6b\xb1\x1c\xde\x56\xdf\x5b\x8f\xe5\x50\
-\xa4\x70\xc0\xc0\x80\x5c\x81\x00\xc2\xd8\x01\x95\xef\x1b\xd1\x37\
-\xb2\xc0\x0b\x11\x36\x10\x6e\x03\xcf\x51\x13\xca\xfb\xec\xec\xdb\
-\x47\x6b\x1a\xe5\x43\xb2\x9a\x0b\x72\x33\x18\xb3\xe8\x37\xb3\x6c\
-\x40\xc5\x8a\x14\xab\x03\x8f\xb2\xab\xb9\xaf\x66\x6f\xb3\xc5\x81\
-\x9d\x1d\x62\xd4\x28\xec\x7e\x9c\xdc\xfa\x7f\x0e\x8e\xb0\xd9\xd1\
-\xd0\xdb\xad\x94\x2b\x2a\x0d\x4a\xda\x7f\xd7\xf6\x8a\x12\xd0\x5a\
-\xd4\x18\x69\x7e\x46\x9c\xf6\x2f\xf3\x0a\xef\x5d\x90\x17\x93\xd1\
-\xe4\xe2\x4f\x96\xb4\xd9\x04\x14\x1e\xae\xad\xfa\x20\x72\xa9\xad\
-\xee\x3a\xf5\x51\x4d\x77\x47\x17\x94\xc7\xdf\x30\x00\x21\x88\x8f\
-\x5e\x36\x35\xf5\xb2\x4c\xd3\xf5\x09\x46\xf5\x30\x95\x31\xba\x6c\
-\x5b\x69\x9d\x0d\x22\x4e\xb0\x30\x51\x6a\x91\xf4\xdd\xaf\x1e\xad\
-\x29\x2d\xeb\xb2\x01\xe0\x0c\x78\x17\x86\x09\xc0\xc2\xeb\xe6\x31\
-\x49\x8a\x17\x96\x0e\xbf\x71\x74\xb2\x79\xe6\xf1\x56\xdb\xfe\x2a\
-\x8b\x1b\x6f\x83\xa4\x6a\x7a\x5d\x81\x79\x69\xb1\xea\x37\x4b\x3b\
-\x3e\xba\x73\x47\x59\x85\x23\xe0\xc3\x7e\x23\xc0\x34\x80\x4e\xc7\
-\x6a\xf5\x62\x62\x84\x52\x6d\x05\x4b\x83\x81\x48\x93\x53\x8c\x9a\
-\xa9\x71\xc6\x34\xf0\x46\xa2\x51\x2d\x57\x81\xd1\xfa\x8e\x77\xd8\
-\xce\xc0\x98\xf6\xdd\xb3\xa3\xb2\xa1\xcf\xc7\xe2\x53\xbf\xfd\x32\
-\xc4\xe3\x37\x05\x6d\x20\x7d\x67\x00\xcf\x25\xd2\x36\xf8\x4d\x17\
-\x0c\x68\x4b\x79\x9d\xef\xbd\x46\x67\x93\x4c\x52\x36\xe5\x9b\x75\
-\x72\x93\x46\x16\x2d\x53\xcb\x15\xa7\xdb\x1d\x27\xb7\x35\xf4\xf8\
-\x17\xe5\xc4\xa9\xf6\x5f\x35\x69\xe1\x50\xa3\x5a\x6c\x68\xb7\xf7\
-\x75\xfa\xc9\x4f\xbe\xf5\x3f\x28\xba\xab\xb1\xd7\xf1\xf7\x92\x96\
-\x0a\x04\x0f\xbe\xa3\x6e\x48\xcf\x2e\x1e\x59\x9c\xa2\x95\x4d\x70\
-\xb8\xc4\xb8\x15\xf9\x89\xa9\x0d\x81\x40\xc9\xa9\x16\x1b\x07\x80\
-\x90\xab\xff\xa5\x5e\x8e\xef\x06\x64\xc2\x11\xef\x15\xf9\x59\xb2\
-\x27\x46\x19\x6f\x76\x78\x7d\x31\x7e\xbf\x9f\x99\xa2\x97\x86\xd4\
-\x74\x73\x87\x4a\x2d\x60\xa1\x50\xa6\xbd\xbb\x5b\xea\x74\xb8\x61\
-\x5e\xc6\x89\x86\xfc\xd4\x81\x74\xf3\xc8\x21\x8a\xe7\x97\x14\xdd\
-\x64\x71\x73\x23\x15\x12\xa5\x8e\x8d\xd5\xf5\xbe\x59\xd2\xda\x84\
-\x7d\xc0\x9b\x99\x5e\x3a\xd5\x5c\xb1\xb3\xa9\xd7\x86\xae\x15\xda\
-\xc5\xf5\x01\xee\xab\x8a\x39\x51\x5a\x6a\xc3\xe5\xc5\x05\x8f\xcd\
-\xcd\x9c\x7c\xbc\xb7\xb7\xa6\xa6\xc7\x27\x2c\xce\x4f\xa1\x27\x0d\
-\x8d\x19\xa1\xa0\x24\xee\x44\x87\xab\xf4\xae\x9d\xe5\xfb\x7e\xbd\
-\xab\xb2\xa9\xb2\xcf\x8d\xbf\x8f\x81\x56\xdb\x0f\xde\xbf\x43\xdf\
-\x1b\x80\x61\x42\x53\x82\xce\xd1\x76\xab\x95\xde\x52\xd5\xe4\x7b\
-\xe7\x6c\x6f\xa3\x52\x26\xb6\x18\xe5\x94\xec\xcf\x07\xeb\x9b\x5b\
-\x5c\x3e\x6e\x51\x56\x9c\x71\x5e\x76\xdc\xe8\x9c\x78\x63\xce\x6d\
-\x99\xb1\x51\x1e\x5e\xb2\x9e\xb6\xb9\xf0\x27\x19\xc8\x4f\xce\xe1\
-\xe4\x08\x96\x15\x1e\xa4\x94\x1e\xa9\x91\x3d\x5c\x9c\xb1\x1a\xbe\
-\x9a\xa0\x01\x98\x92\x84\xb4\x95\xf9\x49\x43\xac\x5e\xa1\xe4\x70\
-\xab\x05\xb7\x4e\x70\xa9\x42\x02\x1d\x08\x1c\x08\xe0\x2f\x2f\xca\
-\x9d\x37\xc4\x6c\x98\x01\x82\x87\x10\x9d\xe1\xd5\x6a\x65\x62\x72\
-\x94\xda\xff\xea\xa9\x16\x5c\x14\xa3\x2b\x25\xe5\xd1\xbc\xf1\xed\
-\x94\x77\xcc\x9c\xaa\x78\x76\xda\xd0\x9b\xec\x2c\x3b\x4e\x4e\xd1\
-\x2e\x00\x46\x16\xad\x90\xeb\x37\x54\x76\x1d\x02\x4f\x41\x80\x86\
-\xa2\xe4\x5d\x38\xb8\x67\x0a\xca\x45\xeb\xe4\x2a\xf1\x8e\x71\x29\
-\xd1\x1f\xaf\x1e\x37\xcb\xa0\xa4\x46\x82\xfb\xa4\x4e\xb5\xbb\xaa\
-\x0f\xb5\xda\x58\x96\x93\x33\x99\x11\x0a\xfa\xce\xed\xe5\x7b\xef\
-\xdb\x53\xd9\x50\xd9\x1b\x04\x0e\xdd\x24\xaa\x25\xfc\xff\x5e\xe8\
-\x7b\x07\x10\x3b\x86\x1f\xf0\x48\x41\x20\xfd\x3e\x7a\x6b\x7d\x8f\
-\x07\x96\x1a\x8d\x1d\x1e\xbc\xfb\x8e\xa2\xc6\x26\x98\xa2\xe7\xa5\
-\xc7\xe5\xf4\x39\x7d\x7e\xd1\xa0\x8e\x5d\x58\x98\x9c\x3d\x3f\x3d\
-\x9a\x3f\xd8\xda\xdd\xd3\xe3\xe5\xc4\xe0\xcb\xc1\x21\x88\x00\x2c\
-\xb1\xfc\x8a\xbc\xf8\xe8\x95\x45\xc9\x8b\x1d\x3e\x8e\x51\xc8\x48\
-\x52\x20\xe0\xf5\xa7\x5d\x36\xae\x28\xae\x4e\x1e\x7d\xb2\xb4\xb6\
-\x41\x84\x95\x3c\x36\x8f\x41\x87\x74\x65\x61\x52\xec\x6d\x63\x53\
-\x6e\x70\x80\x46\xa0\x7b\x86\x7e\xe0\xcb\x5d\xf8\xcc\x48\x75\x66\
-\x9d\xcd\x77\xa2\xac\xc7\x85\x8b\x78\x12\x12\x63\x5f\x33\xe2\xa3\
-\x98\x8f\xae\x9f\xfe\x4b\x9f\xa3\x73\x02\xac\x5a\xdd\x08\x2c\xf4\
-\x94\x8e\x31\x6a\x74\x15\x3d\xae\x63\x25\x9d\x0e\xf2\x30\x0d\x34\
-\x8c\xbf\xa3\x06\xb9\x8c\x94\x17\x63\xa2\x3f\x5b\x3e\xba\xe8\xaa\
-\x51\x69\x97\x38\xbc\x5c\x24\x60\xec\xd5\x6b\x14\xaa\xcd\xb5\xdd\
-\x4d\x47\xda\xed\xae\x36\xa7\x4b\x80\xe8\xbc\xb5\xda\xe2\x21\x77\
-\xa2\x87\x81\xc3\xcf\xf7\x49\xdf\x2a\x88\xf9\x36\x84\xaf\x21\xc1\
-\xe9\x0b\xc6\x4d\xe6\x09\x48\xc2\x89\x9a\xe4\xc1\x3c\xe1\xa4\xb4\
-\xbc\x25\x5a\xa7\xd2\x89\x2c\xcf\x59\x1d\x5e\x7a\x58\x94\x69\x6a\
-\xf9\xcd\x93\xe6\xdf\x35\x3a\xd9\x88\xf7\xed\xa3\x98\xb0\x3e\x54\
-\xa1\x5f\x2e\x69\xeb\x7d\x74\x5f\xed\x4b\x20\x50\xbc\xa4\x48\x5e\
-\x71\x25\xd0\x32\x07\xe5\xed\x99\x32\x8c\x6d\x9f\x8b\xdf\x21\x6c\
-\x94\xa1\x35\x21\xd5\xdb\xfc\x76\x89\xd6\xb4\x41\xb0\x8a\x8f\x76\
-\x63\x90\x80\x77\x4b\x2b\x25\x5a\xdd\xd6\x00\x79\x58\x06\xcb\x42\
-\x1a\x51\xe0\x2b\x33\x4d\x73\x55\xdd\xf5\xd3\x39\x49\xe6\xc2\x1c\
-\x4e\x94\x54\x31\x11\x1a\xfe\xb1\xbd\xb5\x2f\xbd\x52\xd2\xdc\x83\
-\x7d\xc0\xbe\x60\x50\xaf\x17\x29\xe9\xee\xb1\x69\xa6\xf2\x9b\x67\
-\x2f\x18\x16\xaf\x99\x62\x73\x7b\xa1\x86\x24\xc4\xe9\x15\x3a\x08\
-\xd6\xda\xdb\x5d\x3e\xf2\x3b\x4f\x38\x64\x18\x02\x79\xb3\x21\x36\
-\x47\x34\xf7\x07\xa0\xef\xdd\x02\xcf\x25\xec\x76\xb8\xeb\x30\x57\
-\xc1\x5f\x9a\x2a\xeb\x75\x06\x4a\xda\x3a\x6a\xd2\x22\x23\x7c\x99\
-\x51\x86\x78\xe8\x84\xc6\xc3\xb2\xfe\x00\xaf\x32\x2f\x2e\x48\x1e\
-\xc6\x58\xdc\x3d\xbb\xba\x5d\x4e\xbc\x19\x18\x08\x14\x80\xa2\x77\
-\x36\xf4\x75\xab\x18\xba\x76\x4e\x56\xfc\x28\x30\x64\xfc\xd1\x5a\
-\x5e\xa3\x54\x50\xfb\xea\x7b\xf6\xee\x69\xb6\x76\xe0\x0e\x08\x88\
-\x0a\x5b\xa0\x5b\x9d\x7e\x21\x42\xa9\x6a\x98\x91\x6e\x1a\xe7\xe3\
-\x45\x05\x24\x32\x10\x33\xf9\x9e\x3e\xda\xf6\xfc\x3f\x4e\x35\xd8\
-\x50\xb6\xc4\xe5\x42\x15\xc0\x45\xba\x24\x23\x2e\x7a\x5a\x66\xfc\
-\x08\x6f\x80\xc3\xfb\xfa\xd5\x66\x83\xda\xfb\xd8\xbe\x9a\xa7\x1f\
-\xd8\x53\x55\x81\x37\xf7\xa2\x12\xe2\xbc\x87\x65\x7f\x57\x98\x9c\
-\xf4\xc8\xe2\xa2\xc5\x36\xb7\xdb\xcc\x72\x52\x40\x07\x8b\x7c\xad\
-\x9a\xf1\x9c\xe8\x10\xf7\x5f\xfa\xce\xe1\x23\x07\x5a\x2c\x78\xc7\
-\x1b\xd9\xc1\x42\x22\x43\xfe\x01\xe9\x07\x07\xf0\xcb\xa8\xd6\xca\
-\x4b\xaf\x9e\x6a\xed\xa2\x29\x5d\xfd\x98\xe4\x48\xb5\x59\x2b\x8f\
-\x73\xc3\xc2\x51\xa7\x90\x29\x76\x59\xdc\x6d\x7b\x1b\xfb\x2c\x28\
-\x34\xd4\x5c\x14\x34\xbe\x4e\x72\x7b\x43\x5f\x9f\x92\x61\x2a\xe7\
-\xe4\xc4\x8e\xf4\x05\x84\x48\x51\xa0\x1a\x40\xc8\x1b\x60\x3d\x88\
-\x53\x26\x2a\x08\x71\x55\xf8\x7f\x6b\x7d\x97\x33\x23\x52\xe7\x1f\
-\x1d\x1f\x31\x5a\x09\xf3\xef\xdb\xe5\x9d\xeb\x6f\xdc\x74\xea\x0c\
-\xe4\xa3\x5a\x60\x00\x42\x4c\x03\xcd\xd3\xc3\xf2\xbd\x6b\xf2\x12\
-\x46\x81\xd0\x63\xcc\x11\x1a\xe7\xa3\xfb\x6a\x9e\x7a\x70\x4f\x55\
-\xbd\x12\x7f\x3d\x14\xf2\x11\x8c\x20\x80\x14\x35\xb9\x20\x29\x71\
-\x7a\xb2\x39\xcb\xed\x17\x84\x68\x93\x5a\xd1\x68\x73\x57\x5c\xf9\
-\x51\xc9\xf6\x07\xf6\x94\x75\xf5\x79\xf1\x45\x4e\x5f\x28\xec\x8f\
-\x41\x3f\x98\x0b\xfd\x3a\xc2\x35\x35\x4a\xf2\xf7\xfb\x4f\x39\xf3\
-\x5e\xda\xb9\xe3\xa9\x63\x8d\x9b\x62\x8c\x2a\x37\xde\x1c\xa9\x92\
-\x44\x07\x96\x01\xe0\xa8\x82\x68\x8d\x2c\x06\xd6\x20\xac\x20\x89\
-\x6a\x08\xfd\x1e\xdc\x5d\xd9\xf4\xd8\x9e\xaa\xbf\x99\x23\x35\xfe\
-\x26\xd6\x5f\x5d\x6a\x71\x93\x37\x3f\x00\x30\x52\x4e\xb4\x01\x17\
-\xe0\x48\x28\x77\xfa\xc9\xa3\xcd\x7b\x18\x99\xba\x86\x61\xd4\xb5\
-\x4f\x1d\x6d\xda\x8d\x69\xf0\x21\x45\xb2\xa3\xb4\xf8\x03\xe4\x78\
-\xce\x94\xf6\x38\x03\x6d\x2e\x5f\x95\xd9\xa4\x0b\x3c\xb6\xaf\xea\
-\x6f\x0f\xee\xae\x6a\xc4\xb6\x70\x03\x3b\x06\x0a\x14\x98\x75\x88\
-\x1f\x56\xa3\x54\x12\xe5\xa0\x54\x72\x59\xb4\x51\xe9\x79\xfa\xf3\
-\xda\xcd\x33\x5f\xff\x7c\xcf\xb6\x7a\x0b\xbe\x1f\x14\xe7\xda\x1f\
-\x13\xbb\x8b\x83\x88\x39\xc0\xe8\x61\xf0\xd4\xbc\x8c\x28\xf5\xc9\
-\xeb\xa7\x4e\xbd\x65\x5c\xaa\x19\xf3\xf0\xaa\x83\xeb\x9e\xe9\xe3\
-\x6b\x6f\x1b\x3b\x32\x41\x4f\x2e\x78\xe0\x6f\x0a\x12\xaf\xf1\xf4\
-\xbc\xdc\x8c\xbb\xc7\x0f\x25\x1b\x03\x40\xb4\x41\x25\xa7\x3c\xf7\
-\xcd\x9f\x76\xf7\xf8\x8c\x64\x4c\x40\xeb\x41\xbc\x9e\x9e\x3b\x2a\
-\xfd\xe9\xb9\x23\xd3\xf1\x3c\x98\x46\x51\x77\x4e\xc8\x48\xe2\xef\
-\x9f\x37\x3d\x43\x45\x58\x11\x64\xee\x9e\x30\x34\xf3\xe9\xb9\x05\
-\x99\x78\x1e\x6a\x83\x8e\x8f\x50\x53\xb5\x2b\x47\x15\xb9\xef\x98\
-\x39\x41\x17\xda\x1c\xbf\x65\x4c\x6a\xe4\x09\xe8\xe3\xbc\xcc\x28\
-\x35\xf6\x19\x08\xad\x3e\x78\xf6\x13\xd0\x4f\xd6\xf0\x40\x0a\x8d\
-\x9f\xcc\x31\xe4\x04\x3e\x78\x82\x57\x5c\xca\xff\x7b\xe6\xdc\x8c\
-\x98\x88\xbc\x33\xad\x9d\x47\xaf\x3e\xd0\x73\xa4\xa2\xb9\x5d\xa4\
-\x59\x3f\x83\x97\x69\xb0\x2c\x06\x09\x18\x60\xac\x18\x16\x17\xf1\
-\xd6\xd2\xd1\x6b\x14\x3a\xa5\xed\xaa\xcf\x4a\x3e\x7c\xeb\x68\x0b\
-\xbe\x4f\x1b\x2c\x97\x14\xc3\xc7\xd7\xc8\xf9\x55\xc3\x13\x94\x6f\
-\x2c\x1b\x77\x19\x84\x99\x51\x0f\x7f\x52\xb2\xee\x8f\x15\x9d\x76\
-\x9c\x6b\xf1\x56\x09\x2c\xa7\x00\xf7\x2b\x29\xd5\x62\x5e\x6a\x12\
-\xfd\xfa\xe4\xf8\xf1\x23\x86\xc6\x4d\xac\xef\x76\x56\x16\xbc\xb8\
-\x7b\x2b\x3e\x59\x1b\xee\x1b\x52\x48\xf9\xa4\x50\xd5\x9f\x84\x7e\
-\x32\x17\x3a\x90\x50\x00\x08\x5e\x48\x93\x09\x9a\x48\xb8\x14\x51\
-\xd3\x9c\xd6\xe1\x74\x07\xb2\x22\x0d\xa3\xce\xdc\x35\xef\xd2\x7b\
-\x67\xe7\xaa\x11\x3c\x45\xf0\x47\xa7\x10\x3c\xa8\x44\x53\xf7\x8c\
-\xce\x49\x07\xfb\x92\xf9\xdd\x6c\xcc\x7d\xa3\x32\xc6\x27\x1b\x0c\
-\x08\x18\x06\x2b\xe4\x83\xe0\x25\xc2\x62\xed\xd7\xc5\x39\xc5\x01\
-\x2f\x17\xc3\x52\x12\x3d\xaf\x38\x7b\x28\xe4\xe1\xa3\x67\xd8\x1c\
-\xcc\xb3\x0c\x51\x8c\x7b\x27\xa7\xab\xcf\xdc\x31\x67\x7e\x76\x94\
-\x6e\x8c\xc3\xea\x0e\x68\x44\x56\x8b\x7d\x19\x40\xc4\xea\xb0\xcf\
-\x3f\x25\x78\x48\x17\x05\x80\x61\xc2\x1d\x14\x38\x84\x24\x42\xd3\
-\x7e\x96\xa7\xac\x1a\x73\xad\x31\x3a\x52\x80\x68\x92\xeb\xab\xac\
-\x48\x79\x74\x64\xf2\xfc\x7b\xc7\x67\xe8\x39\x21\xf8\xee\x64\x20\
-\x51\x0f\xae\x30\x39\x4e\x9d\xc6\xf2\x92\xe8\xe5\xf8\x40\x7e\xac\
-\x31\xef\xc1\xe2\x6c\x7c\xeb\x11\x59\x8e\x84\x55\xe2\xc1\xe2\xcc\
-\x94\x82\xd8\x88\x1c\x0f\xc7\x43\x08\x22\x49\x59\x7a\x65\x6a\xc8\
-\x35\xe2\x7c\x4c\x01\x4f\xf1\xce\x89\xe9\x86\x47\x27\xa5\x2f\xb0\
-\x54\x57\xa5\x78\x39\x89\x33\x46\x1b\x05\x9b\x36\xbe\x16\xfb\x02\
-\x14\x56\xae\xaf\xbd\x5b\xec\xc7\xa2\x8b\x0a\xc0\x30\xa1\x64\x40\
-\x9e\x78\x8f\x22\x3d\xfb\xdd\x53\xe5\x8f\x1e\xa8\xdd\x18\x65\xd0\
-\xb8\xb5\x6a\x0d\xd5\xeb\xf6\xc7\x3d\x71\x69\xe1\x92\x6b\x0a\x93\
-\x4c\xb8\x85\x86\x6e\xcc\xcb\x0a\x78\x27\x9c\x0b\xe6\x38\x99\x9c\
-\x61\x44\xa7\xc7\x27\x5f\x5d\x10\x33\xa9\x28\xce\x84\x4f\x3b\xe1\
-\x26\xb6\x54\x14\x1d\x49\xaf\xcd\x4f\x1d\xef\xf4\x90\x9f\xfc\x91\
-\x20\xaa\x65\xda\x9d\xac\x0b\xef\x86\x43\x1e\x50\x44\xba\xa6\x20\
-\xc9\xf4\xd4\xdc\xc2\xc5\xbd\x6e\x21\x56\xa3\xd1\xd0\xd1\x7a\xa5\
-\xeb\xb1\x7d\xf5\x1b\x2f\x79\xf7\x18\xbe\xeb\x06\x4a\xe1\x3e\xc1\
-\xc5\x45\x17\x25\x80\x48\x38\x1d\x82\xba\x4b\x7d\x6d\xcd\xcc\x83\
-\x5b\x4a\x3a\x7f\x7d\xa4\xe6\x23\x8f\xc4\xb7\x6a\x65\x72\x30\x55\
-\xde\x9c\x19\xad\x4f\xc1\x72\xe4\x7e\x18\x28\xfb\xc2\x81\xb6\x43\
-\x72\x5a\xde\xcb\x89\x02\x60\x43\xa3\x8b\x55\x20\x48\x84\x19\x90\
-\x82\x61\x00\x5c\x72\x59\x4a\x02\xcc\x14\x72\x15\x6d\x7d\xb1\xbc\
-\xfa\x10\x2e\x53\x00\x78\x62\x59\x84\x27\x27\xc2\x8a\x06\x7f\x22\
-\x96\x6a\xba\x7f\x77\xcb\x47\x0f\x6c\x2b\xe9\xc4\x3e\x60\x5f\xb0\
-\x4f\x17\x1b\x5d\xb4\x00\x22\xa1\xb8\x00\x46\x7c\x03\x3e\xf3\x97\
-\x1d\xd5\xde\xb1\x2f\x1f\xd8\xdc\xe2\xf5\x96\x62\x18\xef\x0a\xf0\
-\xe4\x2a\x01\x5e\x40\xc3\x40\xe6\x95\xaa\x46\xff\xab\x67\x7a\x3e\
-\x8f\xd2\xeb\x70\x52\x54\xd4\x58\x5c\x2d\xa5\xdd\xf6\xf0\x0f\x16\
-\xd3\xa5\x16\x2b\x5f\x6d\x73\xb4\xc0\x7c\xa9\x88\x8a\x50\x51\xff\
-\x2c\xe9\x38\xf4\xca\xd1\x2e\x7c\xed\x23\x59\x6b\x22\xb9\x58\x88\
-\x52\xb4\x72\x59\xab\xcb\x53\x32\xee\xd5\x3d\x5b\x1e\x3f\x54\xe6\
-\xc3\xb6\xb1\x0f\x17\x1f\x74\x41\xba\xa8\x01\x44\xc2\x2d\x39\x08\
-\x40\x00\x44\x72\xcb\x3d\x35\xfb\xad\xc3\x9f\x3b\x39\xef\xa1\x28\
-\x1d\xf8\x53\x20\x40\x07\xa5\x8b\xf2\xa5\x1f\x3f\x5c\xd3\x56\xd1\
-\xe3\xaa\xd1\xea\x54\xb2\x0d\x95\x5d\x7d\xb0\x76\x24\x57\xf1\xf1\
-\x83\xe7\x1b\x2a\x7a\xac\x5a\x83\x5a\x56\xd5\xe3\xac\x7b\xfc\x60\
-\x2d\x5e\x65\x20\xae\x93\x98\x1f\x50\xb4\x5a\xa5\x76\x59\xb9\x43\
-\xb3\xd6\x1d\x3b\xd2\xe4\xf0\xd1\xd8\x26\xb6\x8d\x7d\xf8\x3f\xfa\
-\x1e\x28\x1c\xa5\xe6\x24\x1a\x98\xbc\x58\x43\x10\xc0\x90\xf4\x43\
-\x79\xd4\xda\x82\xe4\x48\xe9\xb1\x65\xd7\x3d\x50\x9c\x45\xde\xee\
-\x1b\x06\x10\xcf\xef\x2f\xce\x4c\x92\x7e\xb3\xe0\x86\xd5\xb9\xc1\
-\x1b\x8a\xc2\xe9\x61\x1e\x79\x51\x06\xf5\xb0\x08\x03\x2a\xf5\x4f\
-\xba\xb6\xfb\x36\x74\xd1\x5b\xe0\x40\xc2\xc8\x0f\xe4\x2a\xd5\x76\
-\xba\x25\xb0\x34\xbc\x8f\xb6\x7f\xaf\x11\xf3\x70\xcb\xed\x9d\xb3\
-\xed\xb6\xba\x36\x4b\xbd\x2a\x78\xd7\xde\x20\x82\x35\x07\xc3\x1b\
-\xe2\x1a\x3f\x6d\xb1\x93\xf7\x65\x87\x23\xc9\x30\x8f\x0a\x8b\xcb\
-\x5f\xe3\x72\x93\x36\xc2\x79\x17\x3b\xfd\xac\x00\x44\x22\x72\x85\
-\x08\xf5\x42\x06\x82\x57\x94\x30\x7f\x6b\x7d\x6f\x73\x8c\x4e\x41\
-\x5e\x32\x8b\xa5\xc2\x25\x63\x74\x72\xe5\x96\x86\xde\x46\xb7\x27\
-\x80\x03\x3f\x8f\x41\x88\xe7\x4f\xbe\xb6\xfb\x36\x14\xdc\x1f\xfa\
-\x99\x11\xca\xf7\x42\x22\x46\xf9\x63\x5e\x66\x24\x17\xe8\xf5\x08\
-\xf4\xb1\x0e\x7c\xed\x09\x98\x13\xe4\x91\x74\x93\x41\x51\xdf\xd0\
-\x63\x39\xde\x6b\xc3\xc7\xbe\xce\xe3\x41\xca\x05\x4f\x7f\x26\x44\
-\x51\xff\x0f\xf2\x1d\xe7\x53\x7f\xcb\xdd\x0d\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x1a\x73\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x1a\x08\x49\x44\x41\x54\x78\x5e\xed\x9d\x09\xb0\
-\x25\x55\x79\xc7\x07\xa1\x28\x98\xb2\x88\xa1\x28\x02\x08\xc4\x10\
-\x32\x20\x01\x24\x48\x28\xb0\x40\x1d\x64\x90\x65\x58\x44\x43\x52\
-\x5a\x2c\xc1\x05\x32\x6c\x03\x22\x41\x0c\xb1\xa8\x04\x95\xe0\x30\
-\x0c\xa8\x40\x80\xe0\x68\x05\x34\x48\x0c\x01\x4d\x64\xc9\x88\xe3\
-\xc8\x22\xfb\x40\x40\x40\x6a\x10\x59\x04\x63\xc8\x84\x6d\x18\x26\
-\x2f\xff\x7f\xf7\xb9\xf0\xe6\x4d\xdf\xf7\xee\xbd\x7d\x96\xef\x9c\
-\xfe\xff\xaa\xfe\x75\xba\x1b\xe6\xdd\xd3\xa7\xfb\xfb\xfa\xac\xdf\
-\x99\x26\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\xb0\xca\x5a\x2e\x15\xc2\x22\x6f\x81\x36\
-\x86\xde\x06\xbd\x06\x3d\x0d\xbd\x0a\x09\x4f\xc8\x01\x88\xd4\xac\
-\x07\x6d\x0f\xed\x08\xed\x00\xbd\xc3\x69\x73\x68\xc3\xb5\xd6\x5a\
-\x8b\x4e\xa0\x62\x6c\x6c\xec\x75\x24\xf7\x42\xdf\x84\x2e\x83\x5e\
-\x86\x84\x10\x19\xf1\x56\x68\x7f\xe8\x5c\xe8\x56\x68\x05\x8c\x7c\
-\x6c\x58\xe1\xdf\x3d\x09\xed\x03\x09\x21\x8c\xb3\x25\x34\x17\x5a\
-\x04\x8d\x64\xf0\x4d\xc2\xdf\x5a\x05\x1d\x0d\x09\x21\x8c\xb1\x21\
-\x34\x07\xba\xbd\xc9\x78\x7d\x09\x7f\x7f\x25\xb4\x37\x24\x84\x30\
-\xc0\x2e\x10\xdb\xe8\xaf\x34\x19\x6c\x08\xe1\xb7\x9e\x80\xd8\x97\
-\x20\x84\x48\xc4\xbe\xd0\xe2\x26\x03\x8d\x21\xfc\xf6\xb1\x55\x2e\
-\x84\x10\x51\x61\x87\xde\x4f\x9b\x8c\x32\xa6\x90\x87\xc5\x55\x6e\
-\x84\x10\x51\xd8\x15\x5a\xd4\x64\x8c\x29\x84\xbc\xac\x80\xd6\x65\
-\xc6\xc4\xe0\xbc\x31\xc6\x2a\xc4\x80\x70\x7c\x7e\x21\x74\x2b\x0c\
-\xef\xfd\xd5\x15\x03\x20\x2f\x34\xfe\xcd\xea\x33\x31\x28\x72\x00\
-\x62\x50\xf8\xae\xb0\x57\x7f\x29\x8c\xed\x08\xc8\xe2\xbb\xa3\x1a\
-\xc0\x90\x68\x26\xa0\x18\x84\xad\xa0\x8b\x60\xf4\xa6\x27\xde\x8c\
-\x8d\x8d\xfd\x36\x92\x17\xea\x33\x31\x08\xaa\x01\x88\xa9\x38\x14\
-\xba\x2b\x03\xe3\x7f\x1c\x89\x8c\x7f\x48\xe4\x00\x44\x3f\x58\x9d\
-\xe6\x57\xff\x1a\x88\x8b\x71\xac\xf3\x2f\x2e\x15\x43\xa0\x26\x80\
-\x68\x62\x13\xe8\x5a\x18\x3e\x7b\xfa\xcd\x83\xaf\x3f\x57\x0a\x6e\
-\x03\x2d\xab\x2e\x88\x81\x51\x0d\x40\x4c\x84\x46\xcf\x2a\x7f\x16\
-\xc6\xef\x38\x1f\x92\xf1\x8f\x80\x6a\x00\x62\x3c\xb3\xa1\x6f\xc3\
-\xf8\xa7\xd7\xa7\xf6\xc1\xd7\xff\x87\x48\x3e\x08\xb1\x16\x20\x86\
-\x44\x35\x00\xd1\xe3\x53\x10\xab\xfd\x39\x19\xff\x6d\x48\x0e\x84\
-\x64\xfc\x42\xb4\xe0\x54\x18\x7e\xe3\x0c\x3b\xab\x42\x9e\x19\x4b\
-\x60\x83\x2a\xf7\x42\x88\x91\xc9\xd1\xf8\x7f\x0a\xc9\xf8\x85\x68\
-\xc9\xf1\x4d\x06\x66\x59\xc8\xb3\x8c\xdf\x23\xea\x04\xec\x2e\x87\
-\x41\x57\xc1\xa8\xb2\xe9\x07\x42\x9b\xff\x6e\x24\xb3\xa0\xdf\x54\
-\x17\x44\x6b\xe4\x00\xba\x09\x23\xe8\x7c\x0f\xc6\x9f\xcd\xdc\x79\
-\x18\xff\x03\x48\x66\x42\xbf\xae\x2e\x08\x2f\xc8\x01\x74\x8f\x6d\
-\x21\xae\xe4\xcb\x61\x76\x5f\x05\x8c\xff\x61\x24\x34\xfe\x67\xab\
-\x0b\xc2\x1b\x6b\xbb\x34\x36\x0c\x03\xcd\x25\xa5\xaf\x40\x0f\xf1\
-\x82\x88\x02\xdb\xce\x37\xc0\xf8\xb7\xa8\x4f\xed\x03\xe3\x7f\x04\
-\xc9\x5e\xd0\x33\xd5\x05\x91\x3d\x34\xfe\x5f\xb1\x43\x87\xc2\xf1\
-\x7d\x10\x17\x9c\x88\xb0\xb0\xad\xcf\x71\xfe\x35\x3a\xd6\xac\x0a\
-\xf9\x7d\x14\x62\xfc\x01\x51\x08\xdb\x41\xcf\xf7\x79\xd8\x74\x04\
-\x0c\x2f\x25\xc2\x70\x5a\x53\xb9\x5b\x15\xf2\xcb\x40\x9f\x32\xfe\
-\x82\xe0\x97\xbf\xd1\xf8\xc7\x0b\xff\x8f\x6a\x04\xfe\xe1\xbc\xfe\
-\x95\x4d\xe5\x6d\x51\xc8\x2b\x8d\x9f\xbb\x03\x89\x42\xe8\xfb\xe5\
-\xef\x27\xfc\xff\x74\x04\x9c\x9b\x2e\xda\xc1\x70\xd9\x0f\x35\x95\
-\xb1\x45\x21\xaf\x4f\x41\x0c\x40\x22\x0a\x61\xa0\x2f\x7f\x3f\xe1\
-\xdf\xaa\x46\xd0\x0e\xae\xe9\x6f\x2c\x5b\x6b\x42\x5e\x7f\x05\xcd\
-\xa8\x72\x2d\x8a\x60\xb5\x0e\xbf\x36\xc2\xdf\xe1\x0c\x30\x39\x82\
-\xe1\x78\x2f\xb4\xaa\xa9\x3c\xad\x09\xf9\xe4\x88\xd0\x7b\x98\x69\
-\x51\x06\xdc\xed\xd5\x8b\xf1\x8f\x17\xfe\x26\x1d\xc1\x47\x20\xad\
-\x64\x9c\x9c\x75\x20\x06\xf0\x6c\x2c\x47\x6b\x42\x5e\x8f\xaa\x72\
-\x2d\x8a\x80\x5f\xfe\xff\x6a\x7a\xd0\xbe\x84\xbf\xbf\x14\x3a\x88\
-\x3f\x26\x1a\x99\xdb\x54\x6e\x16\x85\xbc\x72\x4e\x88\x28\x84\xe0\
-\xc6\x3f\x5e\xf8\x2d\x39\x82\x35\x61\x48\xaf\xff\x6d\x2a\x2f\x6b\
-\x42\x3e\xb9\xcd\xb7\x16\xf7\x24\xc2\x77\x35\x7a\x27\xe8\x16\x3c\
-\x58\xee\x0c\x1b\x05\xfc\xd6\xf6\xd0\xb5\x38\xa4\x23\x50\xd3\xa0\
-\xe6\x4c\x94\x09\xf7\xe1\xcf\x81\xe3\xa0\xe5\xf5\xa1\xc8\x19\x1a\
-\xbf\xf7\x36\xff\xb0\x42\x1e\xee\x82\xba\xec\x08\x38\x7e\xee\x6d\
-\x0f\xfe\x90\x42\x3e\x6f\xac\x72\x2c\xb2\x27\x6a\xb5\x7f\x10\x21\
-\x3f\xac\x11\x1c\xc2\xcc\x75\x8c\xcb\x9b\xca\xc3\xa2\x90\x57\x6e\
-\x25\x2e\x12\xe2\x63\x35\x20\x8d\x3f\x6a\xb5\x7f\x18\xdc\x32\xd2\
-\x33\xa1\x2e\xc4\x8d\xe7\x04\x9a\x9f\xe1\x59\x70\x04\xc0\x34\x78\
-\x2e\xdf\x47\x72\x40\x7d\x26\x52\xe1\xa3\x9a\xbc\x87\x55\xe3\x27\
-\xc8\x1b\xfb\x08\xbe\x8b\xc3\xdd\xea\x2b\x45\x73\x52\x0e\xc6\xef\
-\x98\xe7\x52\x91\x10\x1f\x35\x00\x06\x95\x78\x14\x2f\xde\x96\xf5\
-\xa9\x4d\xf0\xc5\xd9\x1d\x09\xa3\xc8\x96\x0a\x7b\xd2\x9f\xc4\x73\
-\x30\xdf\xa3\xee\xd6\xf7\xbf\xb3\x3e\x13\x29\xf1\x51\x03\x60\x48\
-\xe6\x2f\xd6\x87\x22\x21\x47\xe7\x60\xfc\x8e\x2b\x5c\x2a\x12\xe3\
-\xab\xa7\xfc\x1f\xe0\xd5\x7f\xe9\x8e\x45\x1a\x4e\x70\x69\x0e\x7c\
-\xc7\xa5\x22\x31\xbe\x1c\x00\x6b\x01\x67\xd7\x87\x22\x01\xec\x87\
-\xc9\x62\x05\x9d\xeb\x94\xe5\x4e\xbe\xc2\x00\x3e\xc7\xca\x59\x0b\
-\xf8\x85\x3b\x16\x71\x39\xd2\xa5\x39\x70\x83\x4b\x85\x01\x7c\x3a\
-\x00\xd6\x02\xce\xa9\x0f\x45\x44\xb8\xde\x9f\x13\x9f\x72\x61\xb1\
-\x4b\x85\x01\x7c\x3a\x00\xa2\xbe\x80\xf8\xec\x83\xea\x7f\x36\x11\
-\x7e\xc1\x1d\x2e\x15\x06\xf0\xed\x00\x5e\x85\xd4\x17\x10\x97\x83\
-\x5d\x6a\x1e\x7c\x1c\x18\xd3\xff\xe9\xfa\x4c\x58\xc0\xb7\x03\x20\
-\x5f\x57\x2d\x20\x2a\xfb\xba\x34\x07\x18\xe2\x5b\x18\x22\x84\x03\
-\x60\x2d\x40\xf3\x02\xe2\xb0\x13\xaa\xff\x9b\xb9\xe3\x1c\x50\x27\
-\xb1\x31\x42\x38\x00\x62\xb1\x2f\x20\x97\x29\xb2\xc3\xb0\x8f\x4b\
-\x73\x41\x3b\xfb\x18\x23\x94\x03\xb0\x58\x0b\xb8\x04\xda\xa8\x3e\
-\x2c\x86\x3d\x5d\x9a\x0b\xff\xed\x52\x61\x84\x50\x0e\x80\x5c\x66\
-\xa9\x16\x80\xaa\x32\x43\x93\xdf\x02\x6d\x5c\x5d\xc8\x1f\x3e\xbb\
-\xdc\x82\x68\xf2\xc3\x20\x0c\x11\xd2\x01\x98\x5b\x23\xe0\x9c\xc0\
-\xcd\x50\x09\x4e\x60\x06\xee\xc7\xec\x2a\xcc\x3e\xbc\xee\x52\x61\
-\x84\x90\x0e\x80\x98\xeb\x0b\x80\xd1\x30\x7e\x41\x09\x4e\x20\xc7\
-\xe5\xcd\xd9\x6c\x47\xde\x15\x42\x3b\x00\x93\x23\x02\xce\x09\x30\
-\x1c\x55\xce\x4e\xe0\x0f\x5d\x9a\x13\xbf\xe5\x52\x61\x84\xd0\x0e\
-\x80\x98\xea\x0b\xe8\x01\x27\xc0\x7d\x0b\x16\x41\xb9\x76\x0c\x72\
-\x9f\xff\xdc\x28\xa5\xff\xa5\x18\x62\x38\x00\xb3\xf1\x02\x5c\x9f\
-\x40\xae\x1d\x83\xcc\x7b\x6e\x68\xc3\x4f\x63\xf8\x88\x08\x34\x08\
-\x5c\xb0\xf2\x73\x18\x9c\xc9\x49\x2b\xa8\xa1\xdc\x8b\x64\x16\xc4\
-\xa9\xaa\x39\xc0\xf2\x7c\x09\xe5\x19\xc3\x81\x7b\xc3\xd5\x04\xb7\
-\xa8\xcf\x84\x05\x62\xbd\x40\xa6\x67\x07\xc2\x90\x18\xd2\x3c\xa7\
-\xe6\xc0\x26\xb9\x19\x3f\x41\x9e\xb9\xdf\x7f\x69\x73\x31\xb2\x26\
-\xe6\x4b\xf4\xf7\x16\xfb\x02\x7a\xe0\xe5\xac\xa2\x1b\x43\x39\x34\
-\x07\x72\x9a\xfe\x3b\x11\x6d\x00\x6a\x88\x98\x0e\xc0\x7c\xbc\x00\
-\x38\x01\xb6\xab\x73\x18\x1d\xe0\xd6\x5f\xb9\x32\xd3\xa5\xc2\x00\
-\xb1\xfa\x00\x7a\x98\xee\x0b\xe8\xe1\xfa\x04\x3e\x00\xfd\xa6\xba\
-\x60\x8f\x39\x28\xc3\xaf\xba\xe3\xac\x40\xd9\x3e\x86\xe4\x0f\xea\
-\x33\x31\x0e\xae\x55\xe1\x76\xee\x7b\x40\xdb\xb8\xf3\x17\xa0\x7b\
-\x20\xee\xa1\x50\xcc\x42\xaa\xe3\xf1\xf2\x36\xee\x14\x63\x49\xc8\
-\x27\x0b\xde\xea\x4c\xbb\xd3\x9b\xf2\x9c\x8b\x90\x7f\xf6\xb9\x88\
-\x37\x39\x02\x7a\xa2\xa9\xac\x28\xfc\xb7\x55\x10\xf7\xb6\x98\x01\
-\x79\x25\x45\x47\x12\xe7\x05\x98\x0f\x0a\x81\x82\xe7\x4b\xca\x19\
-\x83\x16\x9d\xc0\xfa\x2e\xcd\x95\xc3\x5d\xda\x75\xb8\x81\xeb\x75\
-\x78\xd7\x16\x42\x7d\xf7\xd5\xc0\x7f\x7b\x0b\xc4\x6d\xee\xf8\x51\
-\xfa\x68\x75\xd1\x13\x29\x1c\x40\x36\xf1\x02\x9c\x13\x60\xc7\xa0\
-\x35\x27\x30\xdd\xa5\xb9\x72\x34\x94\xfb\x3d\xb4\x85\x7b\x38\x2c\
-\xc2\x3b\x36\xbb\x3e\x9d\x1a\xfc\xbf\xd3\xa1\x7f\xc4\x21\x6b\x0c\
-\x5e\x48\x35\x94\xc4\x5a\xc0\x32\xe8\xd5\x41\xe5\xfe\x5d\x74\x50\
-\xe0\xbd\xb5\x03\x96\x9c\x00\xfb\x52\xb2\x05\x65\xca\x18\x86\x47\
-\xd5\x67\x9d\x84\xf7\x7f\x33\xca\x61\xd4\xcd\x51\xb9\xb4\xdd\xcb\
-\x4c\xd0\x54\x0e\x80\x06\xfd\x7b\x10\xab\xb2\x03\x09\x4e\xe0\xd3\
-\x48\x93\x80\x07\x65\xb9\x39\x90\x2b\x9f\x81\xba\xb8\x38\x88\xef\
-\x50\x1b\xe3\xe7\xfb\xc8\x0f\x80\x97\x11\xb5\x54\x0e\x60\x14\xce\
-\x83\x13\x38\xd9\x1d\x47\xc7\x39\x01\x4e\x16\xb2\xe0\x04\x38\xa4\
-\x9a\x35\x28\x4f\x4e\x0b\x3e\xb6\x3e\xeb\x0c\x9c\x04\xc5\x9d\xb4\
-\x77\xae\x4f\x5b\xc1\xa6\x43\xeb\xa9\xd5\x39\x39\x00\x72\x3e\x9c\
-\xc0\x49\xee\x38\x3a\x78\x70\xbd\x05\x44\xa9\x9d\x40\xb2\x26\x91\
-\x67\xce\x82\xba\xb2\x40\x88\xf7\x49\xe3\x67\x93\xb2\x35\xf8\x3b\
-\xb4\xdd\xd6\x01\x61\x73\x73\x00\xe4\x02\x39\x81\x69\x2b\x5c\x9a\
-\x35\x28\x4b\xb6\x85\x2f\xac\xcf\x8a\x86\x13\xb7\x16\xe3\x7e\x7d\
-\x2f\xe0\x6a\xbd\xc3\x72\x8e\x0e\x80\x54\x4e\x00\xfa\x3f\x77\x1e\
-\x15\xe7\x04\x38\x63\x30\xd5\xbc\xf6\xe5\x2e\xcd\x1e\x94\xe5\x61\
-\x48\x38\xc4\x55\x2a\x1c\xde\xe3\x97\xdf\xfb\x18\x3e\x68\xbd\x21\
-\x4c\xae\x0e\x80\x5c\x00\x9d\x9c\xd0\x09\xb0\x1d\xf7\x03\x28\x85\
-\x13\x78\xce\xa5\xa5\x70\x39\x54\xe2\x52\x61\x6e\xd8\xca\x0e\xbf\
-\x10\xc6\x4f\x5a\x87\x58\xcb\xd9\x01\x10\x3a\x81\x94\xcd\x01\x3a\
-\x01\xd6\x04\x62\x37\x07\x8a\x0a\xaf\x8d\x72\x64\xf9\x5d\x0d\x95\
-\x34\x2a\x40\x87\xc6\x71\xfe\xad\xeb\xd3\x20\xb4\x5e\xbe\x9e\xbb\
-\x03\x20\x5f\x41\x2d\xe0\xb8\x84\x35\x81\xde\x10\x61\xcc\x9a\x40\
-\x69\x35\x00\x96\x23\x87\xc5\x38\xc9\xa5\x84\x77\x92\x5f\xfc\x25\
-\xb8\xa7\xbe\xb3\xfb\x3c\xf1\xbc\x4b\x47\xa6\x84\xc2\x26\x5f\x83\
-\x52\xf6\x09\xd0\x09\xc4\x6c\x0e\x98\x5d\x56\xdd\x06\x94\x23\x77\
-\x39\x9e\x5f\x9f\x65\x4b\x15\x79\x1a\xf7\x12\x63\xc1\x5b\xeb\x29\
-\xf5\xa5\x38\x00\xf2\x15\x28\xe5\x64\xa1\x5e\x9f\x40\x8c\x9d\x7a\
-\x5f\x80\xb3\x2b\xae\x16\x40\x50\x8e\x27\x22\xe1\xf0\x60\x8e\x70\
-\x76\x1e\x8d\x9f\x81\x4f\x62\xf0\xb8\x4b\x47\xa6\x24\x07\x40\x38\
-\x4f\xe0\x04\x77\x1c\x1d\xe7\x04\x38\x44\x18\xc3\x09\x3c\xec\xd2\
-\xe2\x40\x39\xfe\x35\x12\x76\x0c\xe6\xb4\x9d\x1b\xc3\xb4\xdf\x8a\
-\xbc\xc7\x8c\xd5\xb0\xcc\xa5\x23\x53\x9a\x03\x20\xec\x13\x48\x3d\
-\x63\x90\x7d\x02\xa1\x9d\x40\xd1\x3b\xed\xa2\x1c\xb9\x60\xe8\x5a\
-\x28\x86\x33\x6d\x0b\x9b\x2e\xfc\xf2\x47\xcb\x2b\xde\x71\xc6\x0a\
-\x68\xdd\x19\x5c\xa2\x03\x20\xa9\x67\x0c\xf6\x46\x07\x42\xbe\x10\
-\x0f\xba\xb4\x58\x50\x8e\xfb\x23\xb9\x0b\x62\x79\x5a\x84\xa3\x16\
-\xf3\xa0\x6f\x23\xaf\xb1\x57\x37\x3e\xe0\xd2\x56\x94\xea\x00\x48\
-\xea\x19\x83\xec\xd5\x0e\xe9\x04\xee\x70\x69\xd1\xa0\x1c\x39\x96\
-\xbe\x04\x3a\x1d\xb2\xd4\x24\xe0\x94\x5e\x56\xf9\x4f\x81\x52\xd8\
-\xd1\xfd\x2e\x6d\x45\xc9\x0e\x80\xd0\x09\xa4\xec\x13\xa0\x13\x08\
-\xd5\x27\x70\x37\xee\x2d\xfb\x45\x41\x83\x80\x72\x5c\x0f\x62\x0c\
-\x89\xa5\x50\xea\xa0\xa2\x7c\x96\x0c\xc7\x76\x1f\xf2\x94\xb2\x66\
-\x72\xbb\x4b\x5b\x51\xba\x03\x20\xec\x13\x48\x59\x13\x60\x9f\x40\
-\x88\x9a\x00\x17\x04\x31\x76\x61\x67\x40\x59\xb2\x97\x7d\x31\xc4\
-\x49\x43\xb1\x37\x46\xe1\xf3\x3b\x03\x62\x4c\x4b\xc6\x64\x4c\x6d\
-\x3b\xb7\xb9\xb4\x15\x5d\x70\x00\xa4\xd4\xe6\x40\x2e\x1b\x99\x78\
-\x83\x86\x07\xb1\xd3\x8d\xb5\x01\x3a\x82\xf7\xf3\x7a\x40\xb8\xee\
-\x83\x5f\xfc\x27\xf1\xbb\x67\x43\xc9\x97\x83\xe3\x5d\xe6\x10\xb0\
-\x97\x4e\xe0\xd8\x51\x81\x53\x73\x22\x1e\xe0\x02\x77\x1c\x1d\x3c\
-\xb8\x3b\x91\x70\x07\x22\xf6\xe0\xb6\xe5\x5c\xdc\xcb\xa9\xee\xb8\
-\xd3\xa0\x5c\x39\x1e\xfe\x2d\x88\xa3\x06\x2c\xe3\x36\x13\xc2\xf8\
-\x51\xdc\x15\xda\x0f\x3a\x04\x65\x4c\x07\x60\x0a\xdc\xef\x95\x48\
-\x3e\x56\x9f\xb5\xa3\x6b\x0e\x80\x94\xe0\x04\x64\xfc\x7d\x40\xf9\
-\x32\x94\x3b\xab\xc7\x6c\x23\xb3\xa3\x8c\x63\xe5\x1c\x2e\x63\x6d\
-\x69\xfc\xe2\x19\x46\xd5\xe1\x1a\x7d\x4e\xd7\x65\x47\x23\x77\x5b\
-\x66\x9b\x7e\x17\x94\x6d\x88\x3e\x1b\x6f\xe0\x1e\x8f\x44\xf2\x8d\
-\xfa\xac\x1d\x5d\x74\x00\xe4\x78\x68\x01\x1e\x74\x92\x26\x90\x73\
-\x02\x1f\x84\x46\xd9\x77\x60\x1e\xf2\x7d\x8a\x3b\x16\x43\x80\x72\
-\x67\xa7\x29\x6b\x07\x6c\x46\x64\xb9\xf0\x08\xf7\x40\x27\xb6\x29\
-\xe4\xa5\xf9\xd7\x95\x3e\x80\x89\x70\xda\x70\xca\x05\x44\xec\x13\
-\x18\x25\xc6\xe0\x7c\x19\xff\xe8\xd0\xe8\x21\x8e\x28\xe4\xbc\xea\
-\xf0\xc7\x90\xb7\xbe\x9f\xae\x3a\x00\x72\x31\x94\x72\x88\x70\xd8\
-\xd1\x01\x56\xfb\xe7\xba\x63\xd1\x5d\xae\x71\xa9\x17\xba\xda\x04\
-\x18\x0f\x03\x53\x7e\x15\xc6\x95\xaa\x39\x70\x37\x12\x6e\x43\x36\
-\x59\x9f\x00\xbf\xfc\x32\xfe\x8e\xe3\x9a\x30\x6f\x87\x54\x03\xf0\
-\x08\x6b\x02\x29\x9b\x03\xec\x78\x9a\x6c\xed\x80\x8c\x5f\xf4\xe0\
-\x1e\x81\x5e\x87\x7e\xe5\x00\x6a\xaa\xe6\x40\x62\x27\xd0\xb4\x94\
-\x58\xd5\x7e\x31\x9e\x2b\x5c\xea\x0d\x35\x01\x56\xc7\x52\x73\x40\
-\xbd\xfd\xe2\x0d\xf0\x6e\x70\xae\x03\x77\x55\xf6\xfa\x91\x5a\xdb\
-\xa5\xa2\x86\xc3\x73\xbf\x86\xe1\x1d\x50\x9f\xc6\x05\xbf\xcb\xe1\
-\x9d\xbd\xa1\xed\x70\x9c\x6c\x49\xb3\x30\xc9\x17\x20\x2e\x8a\xf2\
-\x8a\x6a\x00\xcd\xcc\x81\x2e\x4c\x55\x13\x10\x62\x3c\xf8\xfa\xb3\
-\x46\xc8\xad\xf4\x7c\xcc\x20\x5d\x0d\xbd\xe0\xcd\x30\xc6\x60\xb2\
-\x8e\x41\x21\x26\xc0\x79\x2b\xde\x8d\x9f\xa8\x09\xd0\x1f\x36\x07\
-\x9e\x43\x2d\x60\xe0\xed\x9b\x85\xf0\x0d\x3e\x42\x2f\x22\xf9\x53\
-\xe8\x95\xea\x82\x67\x54\x03\x98\x9c\x8b\xf1\x00\x8e\x51\x4d\x40\
-\x24\x84\xbb\x00\x8f\x32\x65\x7c\x20\xd4\x07\x30\x18\x8c\x4f\x77\
-\xa9\xfa\x04\x44\x4c\xf0\xe1\x61\xd8\x6f\xf6\xfc\xbf\x5c\x5d\x08\
-\x80\x9a\x00\x83\x71\x0f\xc4\x15\x65\x07\xc0\x09\xc8\x69\x8a\x58\
-\x70\x0e\x48\xd0\xd0\x6f\x7a\x99\x87\x43\x35\x01\x11\x05\x7c\xfd\
-\xb9\xe8\x67\xcf\xfa\x2c\x1c\xaa\x01\x0c\x87\x6a\x02\x22\x38\x30\
-\x7e\x2e\xf9\xfd\x10\x14\x7c\x0f\x48\x39\x80\xe1\x61\x98\x6a\x6e\
-\xcd\x75\xa0\x9c\x80\x08\x04\x27\xfd\x5c\x55\x1f\x86\x45\x0e\x60\
-\x34\x58\x13\x90\x13\x10\xde\xc1\xd7\x9f\xf1\xfe\x19\xee\x6b\x55\
-\x75\x21\x30\x72\x00\xa3\xa3\xe6\x80\xf0\x0a\x8c\x9f\x91\x9e\x39\
-\x0d\xfd\xa9\xea\x42\x04\xe4\x00\xda\xa1\xe6\x80\xf0\x09\x03\xd4\
-\x5c\x5f\x1f\xc6\x41\x0e\xa0\x3d\xac\x09\x70\xbc\x76\xb6\x9c\x80\
-\x18\x15\x7c\xfd\xff\x09\x09\x77\x3f\x8a\x8a\x1c\x80\x1f\xb8\x8c\
-\x57\x35\x01\x31\x12\x30\x7e\xbe\x3f\x07\x43\x2b\xab\x0b\x11\x91\
-\x03\xf0\x87\x6a\x02\x62\x68\x60\xfc\x8c\xf0\xb3\x17\xe4\x35\xd2\
-\xcf\xa0\xc8\x01\xf8\x85\x9e\xfc\x69\xd8\xff\x41\xf5\xa9\x10\xfd\
-\x81\xf1\x73\x8a\xef\x3e\xd0\x7f\x56\x17\x12\xa0\x19\x6d\xfe\x79\
-\xb7\x4b\x85\xe8\x0b\x8c\x9f\x93\x7d\xfe\x04\x4a\xba\xcb\xb3\x1c\
-\x80\x5f\x18\x44\x84\x61\xc5\x84\xe8\x0b\x8c\x9f\xab\x4b\x3f\x09\
-\x31\xc8\x67\x52\xd4\x56\xf5\xc7\x45\x32\x7e\x31\x15\xce\xf8\x3f\
-\x0e\x7d\xbd\xba\x90\x18\xd5\x00\xfc\xa0\x2f\xbf\x98\x12\x57\xed\
-\xe7\x97\xdf\x84\xf1\x13\xd5\x00\xda\xa3\x2f\xbf\x98\x12\xd7\xe1\
-\xc7\xc8\x3e\x51\x27\xfa\x4c\x85\x1c\x40\x3b\x64\xfc\x62\x4a\x60\
-\xfc\x8c\xe7\xc7\x71\xfe\x1f\x55\x17\x0c\xa1\x26\xc0\xe8\xa8\xda\
-\x2f\xa6\x04\xc6\xcf\x78\xfe\x33\x21\x73\xc6\x4f\xe4\x00\x46\x83\
-\x9b\x87\x70\x8b\x71\x21\xfa\x02\xe3\xbf\x01\xc9\x1f\x43\xf7\x56\
-\x17\x0c\x22\x07\x30\x3c\xfc\xf2\x73\xdf\x00\x21\xfa\x02\xe3\x3f\
-\x0f\xc9\x7e\x50\xb0\x80\x9e\x3e\x50\x1f\xc0\x70\xf0\xcb\x2f\xe3\
-\x17\x7d\x81\xe1\x73\x3a\x38\x87\xf9\xfe\xbd\xba\x60\x1c\xd5\x00\
-\x06\x47\xc6\x2f\x26\x05\xc6\xff\xcf\x48\xde\x05\x65\x61\xfc\x44\
-\x0e\x60\x30\x16\xc8\xf8\x45\x3f\x60\xf8\xcf\x42\x7f\x8e\xc3\x0f\
-\x43\x49\x16\xf5\x8c\x8a\x9a\x00\x53\xa3\x2f\xbf\x68\x04\x46\xcf\
-\x89\x3d\xdc\x46\xee\xf3\x50\x90\xad\xbb\x42\x23\x07\x30\x39\xec\
-\xf0\x53\x6f\xbf\x58\x03\x18\xff\x6d\x48\x8e\x81\xee\xaf\x2e\x64\
-\x8a\x9a\x00\xfd\xd1\x50\x9f\x58\x03\x18\xfe\x9d\xd0\x2c\x1c\xee\
-\x0e\x65\x6d\xfc\x44\x0e\xa0\x19\xb5\xf9\xc5\x6a\xc0\xe8\xef\x87\
-\x38\x9b\x8f\xe3\xfa\x37\x55\x17\x0b\x40\x4d\x80\x35\x51\x9b\x5f\
-\x54\xc0\xe0\xd9\xc6\x67\xcf\xfe\x02\xe8\x27\xbc\x56\x1a\x72\x00\
-\xab\xc3\x2f\xff\x89\xee\x58\x74\x14\x18\x3e\xa7\xef\x5e\x09\x2d\
-\x84\x1e\xe3\xb5\x52\x91\x03\x78\x13\x19\x7f\x87\x81\xd1\x2f\x47\
-\xf2\xaf\xd0\xa5\x10\xf7\xe5\xeb\xc4\x96\xf0\x72\x00\x35\x32\xfe\
-\x0e\x02\xa3\xe7\x2e\x3c\x5c\x9e\x7b\x0d\xc4\x78\x8e\x9d\x30\xfa\
-\xf1\xc8\x01\x4c\x9b\x36\x0f\xc6\x7f\x8a\x3b\x16\x11\x80\xe1\x71\
-\xdc\x9c\xb3\xe5\x76\x83\xd8\x9b\xbe\x2b\x9e\xc1\x56\x48\x83\x81\
-\xdf\x7c\x11\x09\x17\xe5\xb0\x2d\xbf\xc4\xa5\x59\x4d\xda\x09\x41\
-\xd7\x1d\x80\xbe\xfc\x91\x81\x21\x7e\x0e\x09\x37\xbf\x9c\xc8\x74\
-\x88\x4e\x60\x5b\x68\x07\x68\x6b\x68\x63\x68\x13\x97\x6e\x84\x67\
-\xd5\x38\x6a\x85\xbf\xc9\x2f\x37\x03\x6e\xd0\xa0\x39\x17\x9f\x5b\
-\xb6\x51\x4b\xa1\x47\x20\x46\xdd\x0d\xbe\xd3\x6e\x8e\x74\xd9\x01\
-\xcc\xc7\x0b\x35\xd7\x1d\x8b\x08\x4c\x62\xfc\x83\xb2\x0e\x44\x47\
-\xb1\xae\x3b\x66\x2f\x3d\x0d\x9f\x12\x23\xd0\x55\x07\xa0\x19\x7e\
-\x91\x81\xf1\x7f\x16\xc9\x97\xea\x33\x61\x85\x2e\x4e\x04\xe2\x97\
-\x5f\xc6\x1f\x11\x19\xbf\x5d\xba\x56\x03\x50\xb5\x3f\x32\x32\x7e\
-\xdb\x74\xc9\x01\xc8\xf8\x23\x23\xe3\xb7\x4f\x57\x1c\x80\x8c\x3f\
-\x32\x32\xfe\x3c\xe8\x82\x03\x90\xf1\x47\x46\xc6\x9f\x0f\xa5\x3b\
-\x00\x19\x7f\x64\x64\xfc\x79\x51\xb2\x03\xd0\x0c\xbf\xc8\xc0\xf8\
-\x39\x09\x87\x93\x78\x4c\x47\xc2\x15\x6f\x52\xea\x30\x20\xbf\xfc\
-\x32\xfe\xc8\xa0\xcc\x37\x43\x72\x33\xb4\x51\x75\x41\x98\xa7\xc4\
-\x1a\x80\xaa\xfd\x89\x41\x4d\x80\x73\xee\x19\x35\xa7\xf3\x73\xed\
-\xad\x53\x9a\x03\x90\xf1\x1b\x41\x4e\x20\x0f\x4a\x72\x00\x32\x7e\
-\x63\xc8\x09\xd8\xa7\x14\x07\x20\xe3\x37\x0a\x9c\x00\x03\x67\x7e\
-\x00\x92\x13\x30\x48\x09\x0e\x40\xc6\x6f\x1c\x39\x01\xbb\xe4\xee\
-\x00\x64\xfc\x99\x20\x27\x60\x93\x9c\x1d\x80\x8c\x3f\x33\xe4\x04\
-\xec\x91\xab\x03\x90\xf1\x67\x0a\x9c\x00\xa3\xf3\xcc\x84\x9e\xab\
-\x2e\x88\xa4\xe4\xe8\x00\x64\xfc\x99\x23\x27\x60\x87\xdc\x1c\x80\
-\x8c\xbf\x10\xe4\x04\x6c\x90\x93\x03\x90\xf1\x17\x86\x9c\x40\x7a\
-\x72\x71\x00\x32\xfe\x42\x91\x13\x48\x4b\x0e\x0e\x40\xc6\x5f\x38\
-\x72\x02\xe9\xb0\xee\x00\xce\x81\xf1\x9f\xe6\x8e\x45\xc1\xc0\x09\
-\xf4\x86\x08\x19\xe2\x7b\x27\x68\x7b\xe8\x77\xa1\xf1\x2b\x0b\xb9\
-\x7d\xd7\x33\x10\xf7\xeb\xe3\xff\xbf\x0c\x12\x2d\xb0\xec\x00\x64\
-\xfc\x91\x81\x11\x7e\x07\xc9\xa1\x28\xf7\x24\xcb\xc4\xf1\xfb\x8c\
-\x23\xb0\x01\x7e\x9f\x31\xff\xa7\x04\xff\xff\x2f\x91\x70\x87\xa1\
-\xab\x21\x6e\xd9\xdd\xb9\xad\xbd\xda\xb2\xb6\x4b\xad\x21\xe3\x8f\
-\x0c\x8c\xe9\x33\x48\x4e\x86\x68\x54\x07\xa2\xfc\xa3\x7f\x1c\xf0\
-\x93\xeb\x43\x03\x3b\x1f\xfc\xbf\x74\x16\x3b\x43\x87\xe3\xf4\xe3\
-\xd0\xfa\x10\x77\x03\x7a\x15\x12\x03\x60\xd1\x01\x9c\x8b\x07\xca\
-\x97\x51\x44\x02\xc6\xff\x69\x24\xf3\xea\xb3\x69\xf7\x40\xc9\x9c\
-\xc0\xa8\x20\xab\x74\x06\x6c\x42\x7c\x0a\x62\x4d\xe0\x0e\x97\x8a\
-\x49\xb0\xe6\x00\x68\xfc\xa7\xba\x63\x11\x01\x67\xfc\xe7\xd5\x67\
-\x6f\x90\xa5\x13\x20\xc8\x2e\x6b\x11\xfb\xe0\x70\x36\x44\x27\xa0\
-\x3d\x01\x27\xc1\x92\x03\x90\xf1\x47\xa6\x8f\xf1\xf7\xc8\xd6\x09\
-\x10\x64\x79\x53\x24\x47\x41\xec\x34\xe4\xbd\x88\x06\xac\x38\x00\
-\x19\x7f\x64\xa6\x30\xfe\x1e\xb9\x3b\x81\x75\xa0\x83\x71\xb8\x1e\
-\xc4\x58\x85\x62\x02\x16\x1c\x80\x8c\x3f\x32\x03\x1a\x7f\x8f\xac\
-\x9d\x00\x41\xb6\xf7\x40\xc2\x80\xa5\xdf\x87\xc6\x78\x4d\xd4\xa4\
-\x76\x00\x0c\xdd\xcd\x97\x51\x44\x02\xc6\x7f\x12\x92\xf3\xeb\xb3\
-\x81\xa1\x13\xf8\x05\x74\x50\xc6\x4e\xe0\xdd\x48\xb6\x80\xae\x87\
-\xe4\x04\x1c\x29\x1d\x80\xe2\xf6\x47\xc6\x19\xff\x05\xf5\xd9\xd0\
-\x30\xbe\x5f\xee\x4e\xe0\x8f\x90\xc8\x09\x8c\x23\x95\x03\x90\xf1\
-\x47\x06\xc6\xcf\x31\xfe\x05\xf5\xd9\xc8\xc8\x09\x14\x46\x0a\x07\
-\x20\xe3\x8f\x8c\x33\xfe\x61\xab\xfd\xfd\x90\x13\x28\x88\xd8\x0e\
-\x40\xc6\x1f\x19\xcf\xc6\xdf\x83\x4e\x20\xf7\x8e\x41\x39\x01\x10\
-\xd3\x01\xc8\xf8\x23\x13\xc8\xf8\x7b\x94\x30\x3a\xd0\x79\x27\x10\
-\xcb\x01\x7c\x11\x85\xad\xe9\xbd\x11\x81\xf1\x73\x74\x65\x7e\x7d\
-\x16\x0c\x3a\x01\x6e\x08\x3a\x3b\x73\x27\xc0\x49\x43\x9d\x1c\x22\
-\x8c\xe1\x00\x4e\x43\x21\x9f\xe5\x8e\x45\x04\x9c\xf1\x0f\x3a\xce\
-\xdf\x96\xbb\xa1\xdc\x9d\x00\x87\x08\x3b\xe9\x04\x42\x3b\x80\x3f\
-\x43\xe1\x5e\xec\x8e\x45\x04\x22\x1b\x7f\x8f\x52\x9c\xc0\xdb\xa1\
-\xeb\xaa\x0b\x1d\x21\xa4\x03\xd8\x16\xba\x0e\x05\xbb\x6e\x7d\x2a\
-\x42\x03\xe3\xff\x4b\x24\x5f\xae\xcf\xa2\x43\x27\xb0\x03\x9e\xf7\
-\x76\xf5\x69\x7e\x20\xef\x3b\x23\xd9\x04\xfa\x5e\x75\xa1\x03\x84\
-\x0a\xfc\xc0\x80\x0e\x57\xa1\x40\xdf\x5a\x9f\x8a\xd0\xb8\x2f\xff\
-\xdf\xd5\x67\xc9\xc8\xd6\xf8\x7b\xe0\x9d\x3d\x16\xc9\xa5\xf5\x59\
-\xf9\x84\x72\x00\xa7\xa3\x20\x19\xd6\x49\x44\x00\xc6\xcf\x0e\xd6\
-\xd8\xd5\xfe\x89\x4c\x87\x58\xeb\xcb\x1e\xbc\xbb\x9f\x40\x72\x09\
-\x94\x24\x32\x52\x4c\x42\xb4\xd7\xb6\x82\x1e\x44\x21\x72\x05\x96\
-\x08\x8c\xab\xf6\xa7\xfe\xf2\x93\x1d\xf1\xcc\xef\x73\xc7\x45\x80\
-\xb2\x65\xff\xd5\x5f\xd4\x67\x65\x12\xc2\xc3\x71\x75\x9f\x8c\x3f\
-\x02\x46\xaa\xfd\x3d\x36\x77\x69\x31\xe0\x3d\x2e\xbe\x39\xe0\xdb\
-\x01\x30\x3e\xdb\xa1\xee\x58\x04\x04\xc6\xcf\x49\x3e\xa9\xab\xfd\
-\xe3\xd9\xc0\xa5\x45\x81\xf7\x99\xcd\x81\xcb\xa1\x22\x9b\x03\xbe\
-\x47\x01\xce\x43\x81\x31\x9c\x73\x34\x60\x08\x2f\x20\xb9\x13\xfa\
-\x09\xd4\x9b\xa7\xce\x58\x70\x1b\x22\x2f\x59\x0e\x49\x4d\x85\xab\
-\xf6\xf7\x62\xf8\x59\x81\xce\xff\x43\xee\xb8\x28\x70\x5f\x9c\x2c\
-\xf4\x3b\x50\x67\x46\x07\x46\x81\x01\x17\x56\xa2\xb0\xc6\x42\x8b\
-\xbf\x03\x2d\x84\x76\x83\xfa\x79\x66\xc6\x93\x9f\x03\x3d\xda\xf4\
-\x37\x72\x15\xee\xc7\x6a\xb4\x64\xce\xf9\x68\xcc\x73\x29\xc2\x3d\
-\x5e\x54\xdf\x6a\x39\xf8\xac\xd6\x1c\x81\x42\x1a\x28\x9e\x7b\x1b\
-\xf0\xf5\xfb\x11\x92\x1d\xa0\x23\xa1\xdb\xa0\x7e\x91\x5f\xb9\x07\
-\xfd\xd7\xa0\x77\xb2\xba\x0c\x65\x1f\x2a\x1a\xf7\xf0\x59\x24\x56\
-\xda\xfc\x13\x61\x4c\xff\xa2\xc1\xfb\xcd\x3e\x81\xa2\x9c\x80\x4f\
-\x07\x40\x83\x0c\x0a\x0c\x80\x0b\x5b\xb8\x85\xd4\xc3\xd5\x85\xc1\
-\x78\x1d\xe2\xbf\xdb\x1d\xff\x9e\xb3\xd5\xb2\x04\x79\xe7\x50\xdf\
-\x97\xea\x33\x93\x64\x5b\xb6\xc3\xe0\x9c\x40\x31\x43\x84\xbe\xda\
-\xc8\xdb\xa2\x60\x1e\x72\xc7\x41\x80\x01\xf0\x6b\x7e\x5c\x7d\x36\
-\x32\x9c\xa8\xb2\x04\x79\x7d\x5b\x7d\x9a\x07\xee\xcb\x6f\xd9\xf8\
-\x09\x47\x7e\x5e\x42\xd9\x16\xd9\x59\x36\x11\x3c\x93\x22\x86\x08\
-\x7d\x3d\xac\x7d\x5d\x1a\x04\x14\xf6\x8f\x91\x9c\x50\x9f\xb5\x82\
-\x9b\x50\x72\x17\x99\x6c\xc8\xe0\xcb\xdf\x83\x4d\xac\x07\xea\xc3\
-\xf2\x71\x35\x81\xec\x87\x08\x7d\x39\x00\xee\xc8\x12\x04\x18\xc0\
-\x6b\x48\x3e\x09\xf9\xda\xe5\xe5\x7a\xfc\xcd\x6f\xb9\x63\xd3\x20\
-\x9f\xfc\xf2\xa7\x9a\xdb\x3f\x0a\xec\x9f\xe9\x0c\x70\x02\x1c\x22\
-\xcc\xba\x4f\xc0\x97\x03\xd8\xd5\xa5\x21\xa0\xb1\x0e\xd3\xe6\x1f\
-\x84\xcf\xc3\xb8\x4c\x6f\x1b\xe5\x8c\x3f\x87\x2f\xff\x78\x3a\x37\
-\x4c\xe6\x6a\x02\x17\xd6\x67\xf9\xe1\xc3\x01\x6c\x8e\x42\xd8\xd8\
-\x1d\x87\x20\x44\x35\xeb\x11\x88\xcd\x0a\x93\xc0\xf8\x73\xa9\xf6\
-\x4f\xe4\x26\xe4\x9d\xa3\x2f\x9d\x02\xef\xff\xf1\x48\xce\xa8\xcf\
-\xf2\xc2\x87\x03\x08\xb6\x02\x0c\x2f\x13\x27\xf9\x70\x82\x4f\x08\
-\x4c\x7e\xad\xdc\x97\x3f\xa7\x6a\xff\x78\x38\xe2\xf2\x8d\xfa\xb0\
-\x5b\xc0\x09\x9c\x8d\xe4\x90\xfa\x2c\x1f\x7c\x38\x80\x77\xb8\x34\
-\x04\xf7\x43\xa1\xaa\xea\x5c\xbf\x6e\x8a\x8c\xbf\xfc\xe3\xb9\x10\
-\xf7\x41\x47\xd0\x45\xae\x80\xb6\xac\x0f\xf3\xc0\x87\x03\x60\x14\
-\x95\x50\x30\xe8\x64\x28\x4c\x8d\x5b\x3b\xe3\xcf\xf5\xcb\x3f\x9e\
-\x65\xd0\x65\xf5\x61\xb7\x40\x2d\x80\xc3\xcb\x5c\x37\x90\x0d\x3e\
-\x1c\xc0\x86\x2e\x0d\x41\xc8\x2f\x09\x47\x17\x4c\x90\x79\xb5\xbf\
-\x89\xb3\x70\x4f\xcb\xdd\x71\xa7\x80\x13\xd8\x1b\x49\x36\x4d\x01\
-\x1f\x0e\x20\x64\xd4\x9f\x90\x13\x76\x42\x3a\xae\x81\x29\xa4\xda\
-\x3f\x11\xee\xc9\xcf\x05\x4b\x5d\xe5\x1c\xc8\x87\x6d\x05\xc7\x47\
-\x26\x43\xce\xff\x9f\xe1\xd2\x10\x84\xfc\xdb\x03\x01\xe3\x4f\x19\
-\xc3\x2f\x34\x17\xe3\xfe\x18\x6f\xbf\x73\xa0\x16\xc0\x77\x2b\x8b\
-\x65\xf1\x3e\x1c\x40\xc8\x6a\x3a\x0b\x92\x41\x1a\x43\xf0\x3e\x97\
-\x26\x01\xc6\xf1\x39\x24\x56\x17\xf6\xf8\xe2\x70\xdc\x27\x87\x5c\
-\xbb\x48\xdb\x69\xeb\x51\xf0\xe1\x00\x5e\x76\xa9\x77\xe0\x49\x99\
-\xbf\xc3\xea\x33\xaf\x30\x52\x71\x32\x0f\xed\x8c\xff\x0b\xf5\x59\
-\xd1\x70\x18\x77\x3f\xdc\x6f\x27\x16\x0a\x4d\xe0\xbd\x90\xf9\x28\
-\x49\x3e\x1c\x40\xe8\x89\x1f\xdc\xd2\xda\x77\x33\xe3\x28\x38\x97\
-\x24\x7d\x00\x1d\x32\xfe\x1e\x8f\x43\xb3\x70\xdf\xcf\xd5\xa7\xdd\
-\xc0\x7d\xbc\xcc\x77\x06\xfa\x70\x00\x4f\xb9\x34\x08\x28\x48\x06\
-\x19\x9d\x5b\x9f\x79\x81\x1d\x8b\x7f\x53\x1f\xc6\x05\x46\xc0\x36\
-\x7f\x97\x8c\xbf\x07\x17\x61\xed\xd9\x35\x27\x00\x82\xad\x91\xf1\
-\x85\x0f\x07\x40\x0f\x1f\x1a\x1a\x2c\x37\x6d\x68\x0b\xef\xf7\x72\
-\x38\x95\x90\x53\x97\x1b\x71\x5f\xfe\xd2\xdb\xfc\x93\xc1\xbe\x80\
-\x99\x1d\x73\x02\x7b\xb8\xd4\x2c\x3e\x1c\x40\xf0\x25\xa0\x30\x58\
-\xae\x35\xff\x37\x68\xc7\xea\xc2\x68\xf0\x5e\x2f\xc1\xdf\x8a\xde\
-\xf6\xef\xf0\x97\x7f\x22\xac\x09\xd0\x09\x74\x25\x78\x08\xc3\xd2\
-\x51\x66\xf1\xe1\x00\x9e\xc5\x03\xe5\xb8\x6f\x50\xdc\x57\x7b\x11\
-\x34\xbb\xba\x30\x1c\xac\xf6\x5f\x83\xbf\xc1\xe5\x9b\x51\xd1\x97\
-\x7f\x0d\xe8\x04\xba\xd4\x27\xb0\xb5\x4b\x4d\xe2\xc3\x01\x90\x28\
-\x2b\xeb\x60\xc0\x8c\xf4\xcb\xcd\x1b\xaf\x86\x06\x59\x84\xc4\xde\
-\x7e\x2e\xd7\xfc\x19\xfe\x5d\xf4\x0e\x19\x67\xfc\xfa\xf2\xaf\x49\
-\xaf\x26\xd0\x05\x27\x60\xba\x06\xe0\x2b\x24\xd8\x27\x60\x60\x51\
-\xa3\xa3\xe0\xe5\xe1\x22\x21\x3a\x9e\x1f\x40\x0c\x0b\xce\x70\xe0\
-\x9c\x93\xc0\xaf\x3d\x9d\xc3\x9e\xd0\x21\xc8\x57\x92\x07\x20\xe3\
-\x1f\x08\x3e\xa7\x45\x78\x46\xd1\xfb\x64\x62\x81\xf7\xe0\x63\x48\
-\xae\xac\xcf\xec\xe1\xcb\x01\x30\x24\xf8\x93\x78\x90\xbe\x6a\x14\
-\x59\x83\x87\x9e\x63\x30\x8f\x54\xd0\x09\xdc\x88\x77\x87\xef\x50\
-\x71\x58\x77\x00\xbe\x0c\x96\x9d\x3a\xa1\xd6\xed\x67\x85\x8c\x7f\
-\x68\x4a\x6f\x0e\xbc\xe8\x52\x93\xf8\xfc\x62\x73\x2d\x74\xa7\xc1\
-\x4b\xcc\x6a\xbf\x8c\x7f\x78\x38\x44\xf8\x3e\x94\x5f\x89\xa3\x03\
-\xa6\x23\x24\xf9\xdc\x3a\x8b\xdb\x43\xb3\x19\x60\x62\x95\x5d\x6c\
-\x9c\xf1\xab\xcd\xdf\x0e\x6e\x2f\x7e\x73\x49\xcd\x01\xbc\x17\x9b\
-\x22\x09\x3e\x4a\x36\x2a\x3e\x6b\x00\x5c\x13\xc0\x58\xe9\x9d\x03\
-\x0f\xf9\x4c\x24\x32\xfe\xf6\x30\xf8\x2b\x87\x08\xcd\x1a\xcc\x30\
-\xe0\x3e\xb8\x16\xc2\xf4\xbd\xf8\xee\xb4\x9b\xe7\x6e\xba\x33\xe0\
-\x7e\xd9\xe6\xff\xdb\xfa\x4c\x78\x80\x7d\x02\xa5\x34\x07\xcc\x06\
-\x9e\xed\xe1\xdb\x01\x70\x7f\xb8\x73\xeb\xc3\xf2\xc1\x4b\xca\x2f\
-\xbf\xda\xfc\xfe\x61\x9f\x40\x09\x35\x81\x5b\x5c\x6a\x96\x10\xdb\
-\x67\x73\xda\xee\x52\xb4\xe3\x4c\xcf\x80\x6a\x0b\x5e\x4e\xb5\xf9\
-\xc3\x93\x6d\x9f\x00\xde\x0f\xce\x53\xf9\x7d\x88\x31\x12\xcd\xe2\
-\xbb\x06\x40\xb8\x45\xd4\x31\xf5\x61\x99\xc8\xf8\xa3\xc1\x3e\x01\
-\x0e\x11\xe6\x58\x13\xe0\xce\xd5\xa6\x8d\x9f\x84\x70\x00\xe4\x3f\
-\xf0\xd0\xb8\x23\x6f\x71\xe0\xbe\xd8\xe6\x97\xf1\xc7\x23\xd7\x21\
-\xc2\xf9\x2e\x35\x4d\x88\x26\x40\x0f\x36\x05\x16\xa3\xfa\xb6\x4b\
-\x7d\x9a\x3f\x78\x09\xd9\xe6\x57\x87\x5f\x1a\x38\x63\x90\xcd\x81\
-\x50\x21\xe2\xbc\x81\xf7\x84\x4b\xe4\xb7\x81\xcc\xef\x8f\x10\xaa\
-\x06\x40\xd8\x14\xf8\x30\x0a\x83\x73\xf4\xb3\x07\xf7\xc1\x6a\xbf\
-\x8c\x3f\x1d\x39\x2d\x25\x66\xa4\xe7\x2c\x36\x47\x09\x59\x03\xe8\
-\xc1\x8e\x1c\xee\xc9\x9f\xed\x04\x21\x67\xfc\xaa\xf6\xdb\x80\x81\
-\x62\x6f\xb1\x5a\x13\xc0\xbb\x72\x13\x92\x59\xf5\x99\x7d\x62\x38\
-\x00\xc2\xdd\x83\xb9\xe0\x63\x83\xfa\x34\x1f\x64\xfc\x26\x31\xe9\
-\x04\xf0\xae\x70\x18\xfc\x5d\x50\xc8\x1d\xad\xb2\x65\x7b\xe8\x19\
-\x3c\xb4\xb1\x5c\x84\xfc\x9e\x5a\xe5\x5c\x58\x84\x4e\xc0\xcc\xfb\
-\x84\xbc\xac\x82\xf6\x67\xc6\x44\x7f\xb8\x91\xe8\xa3\x4d\x05\x68\
-\x49\xc8\xe3\x0a\xe8\xa3\xcc\xb0\x30\x8d\x19\x27\x80\x7c\xcc\xa9\
-\x72\x24\xa6\x84\x01\x3b\xae\x6d\x2a\x44\x0b\x42\xde\x9e\x80\xd8\
-\x64\x11\x79\xc0\x3e\xa6\x27\x9a\x9e\x65\x2c\xe1\xf7\xff\xaa\xca\
-\x89\x18\x0a\x86\xea\x7a\xa9\xa9\x40\x53\x09\xf9\xf9\x26\x94\x5d\
-\x3f\x85\xa8\x02\xd2\x3c\xd8\xf4\x4c\x43\x0a\xbf\xc9\x6a\x7f\xf4\
-\x38\x93\x25\xc1\x26\x41\xf2\xda\x00\xf2\xb0\x14\xe2\xae\xae\x22\
-\x5f\xb8\x49\xed\xc2\xa6\xe7\x1b\x42\xf8\x2d\xee\x87\xb1\x17\x7f\
-\x58\xb4\x87\xc6\xc7\xa1\xc2\xc6\xc2\x0e\x25\xfc\xe6\xcf\xa1\xa3\
-\xa1\x90\xf3\x21\x44\x5c\x18\xf6\x3d\x58\x93\x00\x7f\x9b\x5f\x7d\
-\xd6\x14\x4d\x07\xfb\xcc\x15\xee\xa7\xf6\x5d\x68\x45\x53\xe1\xfb\
-\x10\xfe\x36\x1f\x20\x57\x69\x7d\x04\x0a\xb9\xb3\xb1\x48\x07\x83\
-\xd3\x9c\x0e\x3d\xdf\xf4\x0e\x8c\x2a\xfc\x3d\x86\xa5\x7f\x0f\x24\
-\x02\xc3\x28\xb1\xec\x23\xb8\x11\x6a\xed\x0c\xf0\x37\x56\x42\xb7\
-\x43\x67\x40\xdc\x6a\x4c\x74\x03\x3a\x02\xf6\xce\x2f\x86\x56\x35\
-\xbd\x1b\x53\x09\xff\xee\x7f\xa0\x85\xd0\x6e\x50\x71\xc4\x9a\x08\
-\xd4\x06\x76\xca\xd1\xeb\xee\x0e\x71\x2e\x01\x97\x19\x6f\x89\x87\
-\xc3\xd1\x84\x35\x18\x1b\x1b\x63\x10\x46\xae\xc2\xe2\x22\x12\x4e\
-\x1f\x5d\x02\x31\x60\xe9\x72\x48\x74\x17\x76\x14\xb2\xa9\x39\x13\
-\xe2\x0e\x53\x33\xf0\x0e\xb1\xdf\xe0\x0d\xf0\xee\x70\xfa\x2e\xa7\
-\xae\x3f\x06\xdd\x01\xf1\xdd\xf9\x21\xc4\x69\xed\x45\x92\x83\x03\
-\xe8\x07\x37\xfd\xa0\x13\xe8\xb5\xdf\xb9\xfe\x9a\xd1\x88\x5e\xab\
-\xce\x84\x98\x1a\xd6\x10\xe8\x04\xf8\x0e\x31\xa4\x1d\x95\xc5\x1c\
-\x7e\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x94\xca\xb4\x69\xff\x0f\x53\x28\
-\x6a\x03\x74\xad\xe6\x62\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x63\x9f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x2c\x00\x00\x00\xa5\x08\x06\x00\x00\x00\xe6\xb5\xc0\xd1\
-\x00\x00\x63\x66\x49\x44\x41\x54\x78\x9c\xec\x5d\x07\x9c\x55\xc5\
-\xd5\x9f\x99\x7b\x5f\xd9\xde\xfb\xb2\x2c\x2c\xbb\x94\xa5\xf7\x0e\
-\xa2\x02\xd2\x44\x41\x41\xec\x9f\x31\xb1\x1b\x8d\x26\xc6\x18\x4d\
-\xcc\x97\x68\x4c\x3e\x93\xa8\x49\x8c\x46\x4d\xec\xbd\x2b\x22\x16\
-\x54\x94\x26\x48\x67\xe9\x2c\x2c\xdb\xfb\xeb\xb7\xcc\x7c\xbf\x7b\
-\xdf\x19\x18\x2e\xef\x6d\x01\xd4\x5d\xbc\xff\x1f\xef\xf7\xd8\xfb\
-\xee\x9d\x76\x67\xfe\x73\xe6\xcc\x39\x67\x08\xb2\x61\xe3\xdb\x43\
-\x2a\x42\x28\xeb\xfb\x2e\x44\x17\x82\x03\x21\xd4\x03\x21\xe4\xfc\
-\x0e\xf3\x94\x21\x4f\xd7\x77\x98\xe7\xb7\x0a\x0c\x95\x32\x3e\x36\
-\x81\xd9\x38\x59\xf0\x3e\x34\x1f\x21\x74\x08\x21\x54\x83\x10\xba\
-\xc2\xf2\xdb\xe9\x06\x22\x8c\x21\x6c\xf9\x8d\xff\x9d\x8c\x10\x7a\
-\x0f\x21\xe4\x41\x08\xbd\x8e\x10\x4a\xb4\xfc\x7e\x2a\xc1\xd3\x8c\
-\x43\x08\xbd\x06\x79\xbe\x0f\x13\xc8\xb7\x95\xe7\x77\x06\xb1\x13\
-\xe1\xee\x5e\x19\x1b\xdf\x2b\x78\xdf\x91\x10\x42\xdf\x20\x84\x18\
-\x7c\x0c\xe2\x8a\xb5\xdc\x73\xba\xc0\x3a\x66\xac\x7f\x4b\xf0\x7d\
-\x3d\xb4\x45\x08\xbe\xaf\x82\xeb\xf2\xb7\x50\x26\x9e\xe7\x65\x96\
-\x3c\x6f\xb0\xfc\xde\xed\x40\x40\x3c\xbd\x05\x21\xf4\x77\x84\xd0\
-\x10\xa8\xd8\xe9\xd6\xa9\x6c\x7c\xb7\x30\xfa\x54\x0a\xfc\xdf\xe8\
-\x4f\xf1\x08\x21\xf7\xf7\x5c\xa6\x6f\x03\x18\xea\x37\x08\x21\xf4\
-\x10\x42\xe8\xb7\x08\xa1\x74\xcb\x18\xe2\xdf\x19\xf0\xad\xc3\x77\
-\xf2\x77\x50\xbe\x4c\xf8\xa6\xf0\x9d\xf6\x1d\xe4\xf9\xad\xc2\x60\
-\xf7\xc7\x11\x42\x97\xc0\xdf\x67\x23\x84\xc6\x21\x84\x1a\x84\x97\
-\x61\xc3\x46\x67\xc1\x84\xbe\x83\x4f\xd3\xbe\xc4\xeb\x94\x8b\x10\
-\x5a\x0a\xdf\x08\xc6\xcf\xf4\x08\xf5\xe5\xa4\xc1\x57\x34\xdf\x45\
-\x7b\xe8\x96\x3c\xf5\xef\x20\xcf\x6f\x15\x04\xc8\xca\xa8\x88\x82\
-\x10\x2a\x46\x08\xf5\x11\x7e\xb3\x61\xe3\x44\x10\x69\x99\x74\xba\
-\x81\x8f\x8f\xf1\x40\x56\x3e\x84\x90\x86\x10\x1a\x15\x65\x0c\x7d\
-\x1f\x6d\x10\x4d\x9f\xd6\x6d\x21\x03\xf3\x13\xa1\x71\xe9\xf7\x5c\
-\x26\x1b\x36\xba\x03\xb8\x84\xb4\x03\x21\x14\x00\x05\xb7\x81\x83\
-\x08\xa1\x0a\xcb\x3d\x36\x4e\x11\x38\x51\x75\x7b\xe6\xb5\x61\xe3\
-\x3b\x06\x85\x71\xb3\x0d\x94\xdb\xab\x60\x69\x78\x39\x42\x28\x08\
-\xe3\xca\x26\xac\x53\x8c\x6f\x63\x87\xc2\x86\x8d\x1f\x0a\xb8\x72\
-\xfd\x55\xf8\x88\xb0\x57\x2a\xdf\x02\x6c\xc2\xb2\x61\xe3\xe4\xc0\
-\xc0\x4c\x40\xdc\x19\xec\xf6\xca\xed\xae\x0a\x9b\xb0\x6c\xd8\x38\
-\x79\xe8\x40\x56\xb6\x54\xf5\x2d\xa3\x33\x84\x45\x2c\xdb\xd5\x9d\
-\x01\x86\x59\x88\x46\x78\x1e\x43\xda\xfa\x09\xa4\x4d\x84\x99\xcd\
-\x5a\x36\xdc\x46\x99\x4f\x26\xcf\x48\x65\x10\x3b\x6b\x7b\xe9\x91\
-\x93\xec\xd8\x44\x48\xc3\x9a\xd7\xc9\x6c\x5f\x8b\xe6\x07\x91\x06\
-\x1f\x11\xda\x4c\x7c\xe6\x44\xfb\x04\x37\x5e\xb4\xe6\x83\x85\xfa\
-\x75\xb6\x9d\xda\xea\x0f\x27\x82\xf6\xda\xc4\x9a\xef\xc9\x8c\x91\
-\x8e\x94\x25\xda\xc6\xd8\xc9\xb4\x59\x7b\x20\x6d\xb4\xe7\x89\xf6\
-\xb7\x8e\xf6\x35\x6a\x31\x8f\x61\x9d\x21\x2c\x7a\x02\xca\x79\xb1\
-\x81\xb5\x28\xf7\x30\x8b\x8d\x4a\x67\x5e\x78\x24\x92\xe0\x0d\xac\
-\xb7\xd1\x90\x27\x93\x27\xb2\xe4\xd5\xd9\x0e\x72\xa2\x1d\x8a\x08\
-\xe5\x8e\x96\x06\xaf\x2f\x8e\x40\x2e\xed\x41\x6c\x03\x6b\x7b\x46\
-\xcb\xf7\x44\x89\xaa\xa3\xef\x06\x77\x52\x72\xe9\xe8\xa4\xd1\x51\
-\x44\x6b\x93\x6f\x3b\x5f\x11\xe2\xbb\xec\x68\x7f\xee\xec\xbb\x8f\
-\x84\x8e\x58\x0d\x88\x79\x44\x13\x48\xa2\x41\x6c\x33\x2c\x10\x3e\
-\x6a\xab\xaf\x89\x84\xc5\xc9\xe8\x05\xb0\x29\x21\x96\x9b\x3f\x40\
-\x08\xdd\x0d\x3b\x20\x1d\x31\x04\x14\x89\x20\x03\x21\x74\x06\x42\
-\x68\x2c\x42\xa8\x3f\x42\x28\x01\xee\x69\x42\x08\x6d\x47\x08\x7d\
-\x89\x10\xfa\x1c\x21\xd4\x6c\x99\x2d\xda\x4a\xdb\xf8\xfd\x7f\x10\
-\x42\xd7\x21\x84\x56\x22\x84\xee\x80\xb2\x21\x68\xc8\x54\x84\xd0\
-\x54\xb0\x93\x31\xf2\x4c\x82\xb2\xb4\x42\x9e\x5f\x21\x84\x3e\x43\
-\x08\x35\x76\x30\xcf\x68\x65\x48\x47\x08\x5d\x80\x10\x9a\x86\x10\
-\xca\x87\xed\xed\x68\xc4\x6e\xdc\xff\x32\x42\xe8\x0f\x9d\x78\xb1\
-\xd6\x41\x5b\x02\x6d\x39\x0a\x21\xd4\x1b\xac\xca\x8d\xdf\xaa\x10\
-\x42\x1b\xa1\x1d\xd7\xc0\x04\xd1\x11\x32\xe6\xef\x32\x16\xca\x35\
-\x11\x21\xf4\x28\x42\xe8\xdf\x96\x4e\x58\x04\x75\xe4\xf9\x1a\xef\
-\x70\x1d\x42\xe8\x97\xe0\xab\xd6\xde\x64\xc6\xfb\x93\x06\xe9\x8e\
-\x84\xf7\x33\x14\xec\x98\x24\xb0\x05\x3c\x00\xe9\x7e\x8a\x10\x2a\
-\xeb\xa0\xe4\x82\x05\xd7\x93\x2b\x11\x42\xcb\xa1\xaf\x2a\x27\x68\
-\xb4\xca\x9f\x31\xfa\xcc\x03\x50\xc6\xbf\xc2\xd8\x10\xd3\xe3\x7d\
-\x60\x3c\xb4\x5d\x2d\x42\xe8\x56\x30\x6b\x38\x15\xc6\xb2\xbc\xde\
-\x3a\xf4\xab\x71\x08\xa1\xc9\x60\x59\x9f\x0e\x79\xf8\x11\x42\xbb\
-\x10\x42\xab\x11\x42\x2b\x20\xef\x93\xb5\xa1\x14\xdb\xbb\x97\xf0\
-\xde\xfb\x80\xc7\x02\x85\xba\x6e\x86\x31\xb4\x4a\x68\xeb\xb6\xea\
-\xcd\x7f\x93\xe1\xfd\xcc\x42\x08\x3d\x03\x6d\x2b\xe6\xd9\x03\xf2\
-\x1c\x0b\x7d\x2d\x09\xfa\x82\xd1\xb6\x47\x6e\x6a\xeb\xa3\xc1\xf7\
-\x2d\x90\x71\x7b\xbe\x48\xfc\xf7\x2c\x84\xd0\x9f\xa1\x72\x4c\xe8\
-\xfc\xe2\x87\x5f\x33\x1a\xfa\xd7\x82\x53\x68\xb4\x3c\xf8\xcb\x18\
-\x09\xe5\xe2\xcb\xba\x3b\xe0\xba\x41\x8e\xff\x0b\x03\xb8\xbd\x3c\
-\x8d\x7b\xee\x15\x9c\x42\x3b\xea\x63\xc5\xcb\x70\x3e\x42\xa8\xb2\
-\x8d\x7c\xac\x1f\x5e\xd6\x4b\x3b\x98\x9f\xb8\x0c\x18\x8e\x10\x7a\
-\x03\x6c\x7e\xda\xca\xcf\xc8\x63\x03\x42\x68\x51\x84\x34\x22\x81\
-\x97\xe1\x17\xc2\xbb\x36\xd2\x1e\x0d\xd7\x87\x20\x84\x5e\x82\x81\
-\x21\xe6\xcb\xfb\xc4\xbd\x42\x3a\x9c\xb4\x62\x80\x78\x98\x30\x49\
-\xf0\x36\x3e\x4f\x20\xd4\x48\xe5\xe7\xe9\x1b\xf5\x7c\x5b\x28\x47\
-\x34\xf3\x1b\x5e\xfe\x29\x96\x72\x5d\xd7\xc1\x36\x8e\x04\x3e\x91\
-\xdf\x27\x94\xc9\x07\x13\x9f\xb5\x2c\x06\x71\xef\x11\xca\xff\xaa\
-\x70\x8f\x98\xd6\x3d\xf0\x7b\x10\xbe\x6f\xb5\xfc\x6e\x05\x7f\xde\
-\x09\x44\xbc\xbb\x8d\x7e\xc5\xdb\xcc\x98\xf0\x1f\x03\x03\x70\x03\
-\xb7\xc1\x75\xee\x4b\xf8\xeb\x76\xda\x04\x0b\xbf\x19\x75\x7d\x1e\
-\x21\xe4\x6d\xa7\xbf\x19\xd7\xb7\xc2\x44\x21\x5b\xca\x6e\x05\x4f\
-\xfb\x2a\x78\x56\x85\xef\x19\x70\xbd\x2f\x42\xe8\x49\xe8\x2f\x91\
-\xfa\xda\xbf\x50\x14\x72\x52\x2d\x1f\x5e\xe1\xfb\xdb\xa9\xb0\xf8\
-\xdb\x5c\xcb\x60\x0e\x41\x27\x54\x84\x74\x15\xb8\xa6\x0a\x85\xdb\
-\x09\x33\x49\xb4\x7c\x78\xa3\x2c\x80\xfb\x3d\xf0\x6d\x48\x04\x23\
-\x80\xf8\x78\x9e\x4a\x94\x3c\x83\xf0\xcd\xf3\xdc\x0f\x8c\xde\x5e\
-\xdd\xc4\x97\xf1\x63\xa1\xcd\x78\x9a\xd6\x76\x8b\xd6\x8e\xbf\xb0\
-\xd4\x25\x12\xb0\xf0\xb9\x5b\x78\x96\x42\x5e\xa1\x28\xf5\xd2\x84\
-\x7a\xbd\x8b\x10\xca\xb6\x94\x3b\x5a\x7d\x1e\x87\x67\x38\x31\x19\
-\x52\xe3\x35\x90\x6e\xa4\x7c\xf9\xc0\x7b\x54\x68\xb7\x68\x84\xd5\
-\x00\x33\xf5\x0b\x42\x5a\x9a\x90\x9e\x58\x87\x10\x5c\xa7\x42\xa7\
-\xfe\xbd\x90\xbe\x95\xb4\x78\x1b\x5e\x0d\xf7\xf3\x01\xf6\x97\x0e\
-\xbe\xcf\xb6\xda\xe4\x15\x4b\x9b\xcc\x12\xd2\xe4\xf7\x14\x08\xfd\
-\x9b\x81\x24\x10\xa9\x7c\x9d\x21\x2c\x91\x34\xd6\x0a\x6d\xa6\xb6\
-\xd1\x9f\x43\x42\x9b\x79\x60\x7c\x5c\xd7\x09\xc2\x12\xdb\xf6\x56\
-\xcb\xc4\x18\x8a\xd0\xbf\x23\xf5\xb7\x8f\x11\x42\x85\x96\x36\x8c\
-\x54\xaf\x3f\xc1\xfd\x3e\xf8\x36\x56\x4a\x8b\x85\xbf\x79\x9e\xd6\
-\xbe\xb6\x14\x75\x40\x2a\xe0\x85\xd9\xda\x4e\x61\xc4\xeb\x37\x08\
-\xcf\x87\x04\x26\x6d\xeb\xa3\x08\x83\x23\x08\x03\x26\x52\xe3\xf2\
-\x17\x3c\x5f\x78\x8e\xc1\x00\x69\x8a\x90\x56\x47\xf3\x54\xc1\xe8\
-\x2f\xda\x0b\x45\x16\x69\x47\x7c\xae\x23\xd2\x15\xbf\xe7\x4b\x10\
-\xe7\x51\x1b\xcb\x28\x7e\xdd\x98\x5d\x9f\x13\x26\x92\x60\x1b\x92\
-\x09\xb3\xbc\x6c\xde\xe6\xbb\x60\xe6\x8a\xf6\xde\xf8\xb5\xc7\x84\
-\x7c\x34\x18\x78\x9a\xf0\x3e\xb4\x08\x75\xd9\x87\x10\x1a\x2c\xa4\
-\x13\x8d\xb0\x7c\x82\x84\xa0\x59\x06\x57\xb4\x0f\xbf\x8f\xe7\xfb\
-\x2a\xa4\x6b\x6d\x37\xde\x1f\xae\xb0\x0c\xce\x07\xdb\x79\x97\x6d\
-\x81\xb7\xc9\x4b\x16\x49\x60\xba\x90\x26\xbf\xa7\x87\x65\xd0\x6e\
-\xb1\xa4\xd5\x59\xc2\xe2\xe5\x9d\x0c\xea\x0a\x66\x99\xec\xda\xfa\
-\x88\xf7\x05\xe0\xdd\x8b\xe5\x8f\x46\x58\xe2\xe4\xf8\x28\xdc\xab\
-\x5b\xda\xbf\xbd\xfe\xc6\xc7\xc3\x41\x10\x1c\x50\x84\xfe\xc6\xf3\
-\xfd\x83\xf0\x8e\x39\xc9\x07\xa3\xf0\x05\x6f\xd7\x6a\x84\xd0\x04\
-\xb1\xb1\x18\x14\xf8\x22\x60\xf5\x78\x8b\x62\xcc\x90\x5c\x5a\xe0\
-\xef\x48\xba\x1e\xae\x4c\xfd\x09\x42\xe8\x61\xc8\x14\x09\x71\xb6\
-\x36\xc3\x8c\xb5\x0a\x62\x24\x19\x79\xe5\x21\x84\x26\x21\x84\x2e\
-\x84\xf5\x31\x97\x8a\x64\x10\x47\x8d\x34\xde\x14\xd2\xb6\x36\xb2\
-\xf8\xdd\x53\x90\x0e\x65\xc1\x0a\xf9\x65\xc8\xb3\x0a\xae\xe5\x80\
-\x04\xb7\x08\x66\x30\x3e\x73\x19\xbf\xfd\x07\x5e\xf4\xcb\x51\xf2\
-\xe4\xb8\x0b\x82\xb1\xa9\xf0\xdd\x0c\x2f\xe1\x03\x68\xab\x68\xa0\
-\xf0\x42\xbd\x42\xbb\xb6\x85\x27\x10\x42\x4b\xe0\x65\xca\x10\x84\
-\x4d\x83\x7c\xde\x02\x9d\x55\x2b\x5c\x2f\x06\xe7\xf5\xf3\x61\xf9\
-\xc5\x3b\x5c\x31\xc4\x42\x32\x24\xc8\xf2\x0e\xe8\xea\x18\xe4\x55\
-\x22\x74\x28\x17\x3c\xb3\x1c\x96\xa5\x9b\xa0\x2f\x54\xc2\x24\x81\
-\xdb\xd8\x94\xa1\xa0\x1f\x2b\x82\x77\x2b\x01\x11\x37\x43\x5a\x1f\
-\xc2\xc0\x0a\x82\x3a\x60\x10\x42\x68\x1e\x90\x83\x53\x20\xae\x05\
-\x90\xde\x05\x51\xca\xfd\x6d\xf8\xcd\x59\x07\x5c\x7b\x13\xcc\xc9\
-\xe6\xcb\x95\xe5\xe3\x60\x39\x9c\x24\x8c\x07\xe3\x73\x18\xfa\xe6\
-\xa7\xf0\x2e\x75\x88\xc0\x60\x10\xc4\x42\xd0\xa5\x31\x41\x4f\x58\
-\xdc\x89\xbc\x19\x44\x6c\xf9\x09\xb4\x37\x7f\x4f\x0c\xf2\x7b\x03\
-\x54\x0d\x4d\x70\xbd\x37\x42\xe8\x2c\x78\x2f\x99\x42\x7f\x33\x08\
-\xfc\x1d\x84\xd0\x99\xe0\xb6\x14\xa9\xbf\x59\xdb\xa8\x2f\x8c\x25\
-\x4d\xc8\xf3\x73\xc8\xf3\x6b\xe8\x2b\xb5\xf0\x39\x8e\xc9\x46\x41\
-\x22\x56\x16\x26\x1d\x90\x3c\xc6\x0b\xb3\x31\x67\x49\x2f\x88\xa6\
-\xae\x08\x85\xe5\xff\x8f\x07\x12\x50\x2c\x52\x53\x5d\x04\x47\x52\
-\x4e\xb2\xe7\x59\x66\x0f\x5d\x18\x60\xc6\x8c\x7e\xb3\x10\xd2\x24\
-\x52\x27\x32\x7e\xfb\x99\xc0\xec\x3c\x9d\x26\x8b\xd4\x60\xad\x63\
-\x0f\x28\x97\xd8\x66\xf3\x22\xdc\x1f\x0d\x52\x3b\xf7\xf1\xdf\xee\
-\x10\x66\x1c\x5e\xaf\x6d\xa0\xab\x89\x54\x27\x91\xb8\x5f\xb2\xcc\
-\x92\x0c\xc4\x75\xeb\xbd\x28\x82\x84\xa5\x5a\x24\x2d\x06\xd2\xd1\
-\x59\x51\xca\x2a\x45\x48\x57\x94\xb0\xa8\xb0\x04\xe4\x3a\xbc\xd7\
-\xa1\xc3\xb7\x55\x8f\xf1\x40\x8c\xa2\xb4\xc5\x40\x52\x41\x11\xfa\
-\xc3\x95\x16\x09\xeb\x54\x2e\x09\xad\xba\x16\xab\x84\xa5\x5b\x56\
-\x22\x22\x3a\x2a\x61\xf1\x7a\xa7\x80\x5a\x84\x59\xd4\x16\x7f\x69\
-\x27\x00\x1f\x01\x32\xaf\x8e\xf0\xfe\xda\x92\xb0\xf8\xff\x7f\x12\
-\xa1\xbf\xed\x45\x08\xcd\x89\x92\x1f\xbf\x96\x8d\x10\x7a\x2a\x42\
-\x7f\x5b\x23\xf8\x57\x62\x4b\x5e\xf7\x59\x24\x2c\xb1\xac\x87\x60\
-\xf5\x64\xcd\xf3\x48\x5f\xb3\x12\xd6\x58\xb8\xc1\x25\x30\x7b\x5b\
-\xd1\x48\xc5\xe5\xcb\x2a\x0b\xe1\xd4\x0a\x4a\x53\x07\xa4\xe9\x10\
-\xd2\x74\x08\xf9\x20\xd0\x11\x04\x2c\x69\xbc\x6e\xc9\x27\x1a\x61\
-\xf1\xf2\x37\x82\x38\x8d\x04\xa9\xc4\x9a\xa7\x53\x48\xe7\x2c\x90\
-\x16\xc4\x3c\x97\x47\xa8\x1f\x6f\xec\x33\x2d\xf9\x7e\x2a\xd4\xdf\
-\x61\x69\xb3\x48\x9f\xb6\x66\x60\xde\xc6\x43\x40\x6f\x22\x92\xf0\
-\x27\x42\x87\x75\x0a\x75\xb0\xb6\x25\x4f\xff\x5e\xa1\x13\xf1\x7a\
-\xdd\x68\xa9\x0b\x6a\x83\xb0\x38\xb9\x7c\x29\xc4\x72\xb2\xe6\x1b\
-\x4d\x02\x11\x09\x4b\xb7\x7c\x3f\x20\xdc\xeb\x8a\x50\x0f\xa7\x10\
-\x42\xd8\x90\x30\x96\x09\x9d\x9a\xd7\x45\x54\xc4\x9f\x2e\x84\xc5\
-\xcb\xf9\x37\xa1\x1e\x3c\xcd\xab\x84\x72\x59\xfb\xb3\x2c\xf4\x3d\
-\x04\x13\xfc\x4e\x4b\x9b\x47\x23\x2c\xb1\x0e\xb5\x96\x7b\xd7\xc0\
-\x0a\x08\x59\xc6\xa9\x75\x1c\xf1\x34\x6e\xb3\x2c\x11\x99\x65\x43\
-\x06\xb5\x41\x58\xba\xb0\x9c\xee\x25\xe4\x29\x8e\xa9\x23\xef\xb1\
-\xa3\x12\x56\x34\xf0\xfb\x16\x5b\x06\xbd\x2a\xbc\x60\x77\x07\xa4\
-\x0a\x2e\x0d\x5d\x29\x94\x87\x57\x68\xb2\x90\x57\x24\xc2\x12\xf5\
-\x21\xe7\x76\x30\x4f\x2c\xe4\x79\x81\xf0\x3c\xcf\x73\x96\xa5\x7e\
-\xfc\x7b\x96\x65\x60\xbc\x00\xd7\x4f\x85\xd7\x00\x2f\xef\x13\x96\
-\x3c\x76\x0a\xc1\xd8\xda\x8b\x07\x2e\x0b\xf7\x3c\x61\xe9\x84\xbb\
-\x05\x93\x12\x6c\xc9\x53\x24\x2c\x5d\x98\x61\xf3\xe1\xf7\x8e\xc4\
-\x04\x8f\x46\x58\xbc\x4d\x9f\x87\xdf\x1d\x1d\x68\x2f\x5e\x87\x54\
-\x50\x27\x88\xed\xf1\x9c\x50\xf6\xd3\x81\xb0\x78\x5a\x45\xc2\x0e\
-\x19\x6f\xb3\xbb\xe0\x37\x77\x3b\x75\x11\xfb\xf3\x10\xd8\xe8\x60\
-\x82\xca\x23\x12\x61\xf1\xb2\xfd\xd1\x32\x76\x2b\x05\x7d\xb5\xab\
-\x9d\x49\x56\x12\xfa\xc6\x83\x96\xf6\xaa\x14\xe2\x84\x91\x28\x84\
-\xc5\xdb\xad\x1e\x21\xd4\xaf\xbd\x3c\x4f\x45\xcc\x2b\x06\xdf\x97\
-\x5a\xfe\xfe\x37\xcc\x8e\xb1\x82\x8e\x48\x8a\xf2\xc1\x70\x8f\x1b\
-\xc4\xcb\x77\x05\xe3\x4f\x24\x04\x18\x8c\x06\xbe\x46\x7e\x12\x74\
-\x3b\x4e\x61\xa7\xa9\xad\x72\x07\xe1\x5e\xa3\x63\xfe\x17\xae\xf3\
-\x3c\x97\x44\x79\xae\x19\x9e\xe5\x2f\x7b\x28\x88\xbe\x9a\x30\x13\
-\x44\xfa\xb4\x17\x33\x9f\xeb\x81\x32\x41\x0c\x47\x42\x1e\xbf\x80\
-\x19\xd0\x01\x9d\xaa\x2d\x68\x82\x91\xee\xaf\xa0\xd3\xc8\x70\xcd\
-\x98\x7d\x67\xc3\x6f\xed\x95\x05\xc1\xb2\xb4\x02\xda\x28\xd4\x4e\
-\xbe\xd1\xc0\xa0\xfe\x75\x60\xb3\x85\xda\x31\x24\xe6\x50\xa0\xbe\
-\x86\xc4\x7c\x3b\x5c\xe3\x52\xc4\x2c\x20\x8a\x13\x31\x66\xee\x8a\
-\xe0\xef\x62\x31\x4c\x28\x2a\xb4\xd9\x5a\x90\x48\x65\x68\xff\xb6\
-\x8c\x41\x79\x7f\x76\xc1\x52\xfa\x77\x70\x3d\xda\x18\xc0\xf0\x0e\
-\x92\x41\xef\x89\x84\xb6\xfc\x1d\x4c\x38\x31\x82\x3d\x5f\xb4\x7e\
-\xcd\xf3\x90\x40\xa2\xda\x0b\xe5\x55\x40\x5f\x3c\xdb\x92\xb6\x15\
-\xbc\x7c\xf7\x82\xf2\xdd\x29\x4c\x3a\x51\x1b\xea\x44\xc1\x15\x6a\
-\xb9\xb0\x73\x86\x84\x0c\xf9\x0c\x17\x14\xac\x74\xdb\xfb\x70\x45\
-\x3d\x5f\x36\xf0\x06\x19\x07\xc4\xa7\xb7\x61\x8b\xc3\x40\x69\x88\
-\x3a\x30\x18\x44\xf0\x4e\xf0\x2f\xa8\x0b\x1f\x14\xe3\x41\x9f\x60\
-\xf5\x13\xdb\x0a\x24\xc0\x15\xa4\xfd\x04\xbd\x4a\x5b\x75\xd3\x84\
-\x01\xd6\xd6\x6e\xdd\x04\x20\x2d\x15\xae\xad\x05\xa5\x39\x16\xda\
-\xa7\x3d\xf0\x7a\x54\xc3\x04\x20\xb6\xc9\xb4\x0e\x3c\x8b\x41\xa1\
-\xff\x36\xfc\xbf\x3d\x92\x6c\x2f\x3d\x04\x06\x82\xe5\xd0\x99\x3b\
-\x6a\x85\xcd\xdb\x60\x39\x18\x28\xf2\x36\x48\x16\xa4\xee\x53\x31\
-\xe9\x7e\xdf\xe0\xed\xc1\xeb\xc4\x07\xeb\x3f\x84\xb6\x8f\x38\x80\
-\x23\x80\xdf\xff\x3c\xf4\x53\x29\xca\xb3\xbc\xdd\x06\xc1\x44\xc6\
-\x27\xdc\x32\xa1\xcf\x74\x74\xec\xf2\x7e\xd9\x0c\x65\x16\x31\xb3\
-\x8d\xb2\x72\xa2\x3b\x20\x48\xcd\x6d\xf6\xf1\x93\x5d\xc6\x70\xf2\
-\x28\x02\xe5\x9b\x0e\x05\x68\x01\x13\x81\x68\x04\xd3\x56\x7a\x1a\
-\xcc\x32\x5e\x50\xc6\x23\xd8\xb1\xca\x87\xdd\x24\x6b\x7a\x7c\x40\
-\xac\x87\xa5\x03\xea\xc4\xcb\x45\x42\x67\x59\x05\xbb\x1a\xa5\x90\
-\x66\x2f\x20\x62\x71\x17\x4c\x02\x91\xfd\x69\x90\x16\x28\xbc\xf8\
-\xdb\xc1\xfa\x7c\x79\x94\xdd\x4c\x15\x76\x29\xd7\xc3\x87\xb5\xb1\
-\x5b\x37\x40\x28\x97\x03\xd2\x54\x04\x29\xa9\xb3\xf5\xfa\x10\x24\
-\x2d\xbe\xc4\x1a\x24\x90\x6d\xb4\x5d\x3d\x04\xd2\x71\xe8\x04\xf2\
-\xb5\x82\x4f\x3a\x1f\xc0\x77\x67\xde\x0d\x82\xb2\xf2\x9d\xd1\x29\
-\x42\xbb\x0c\x3c\x89\x32\x75\x25\x70\xeb\xef\x34\xc1\x30\xd5\x09\
-\xfd\x6e\x05\xfc\xdd\x19\x0f\x0c\x2e\xd1\x1a\x12\xf9\x17\xb0\x1b\
-\xde\xd6\xf3\xc3\x22\x3c\xff\x33\x10\x10\x3a\x93\x2f\x86\xfe\xc2\
-\x97\x92\xfc\xbd\xf7\x13\x76\xd4\xad\x7c\xc3\xfb\xc2\x4a\x58\xc2\
-\xb6\xb5\x33\x6f\xe2\x54\x45\x6b\xc8\xb0\x14\xc0\x90\x10\xee\x3c\
-\x45\x69\x53\xcb\xa1\x06\x91\x7e\x47\x30\x7b\x6b\x27\x38\xc0\x38\
-\x79\xec\x16\x08\x8b\x80\x48\xbb\x4d\x18\xd8\x3c\xaf\x3f\x81\xa8\
-\x3b\x58\x78\x11\x23\xe1\xd3\x16\x74\xd8\xad\xbb\x15\xd2\x15\x5f\
-\x10\x6f\xbb\x1e\xf0\xcd\x5f\x78\x99\xe5\xf7\x8e\x82\xdf\xbf\x13\
-\x66\x3e\x7e\xe8\x41\x36\x88\xfa\xbe\x36\xda\x02\x81\xf5\xf6\xa9\
-\x00\x81\x0d\x84\x9d\xf0\x77\x67\x7d\x29\x79\x3d\x76\xc1\x37\x6f\
-\x97\xbc\x13\x4c\xaf\xab\x22\x4e\x18\x47\x08\x96\xd0\xe5\xf0\xff\
-\xce\xd6\x91\xf7\xd7\x9d\x1d\xb8\x27\xdf\xf2\x77\x7f\xf0\x14\x39\
-\x59\xf0\xf4\x92\x81\x8c\xab\xdb\x10\x5e\xac\xb6\x6b\x51\x71\xaa\
-\x08\x2b\xc6\xf2\x37\x3b\xc9\x59\x19\x59\xd6\xc7\x44\x58\xaa\x59\
-\xc1\x1b\xc1\x7b\x92\xf9\x21\xc1\xce\x8c\x0f\x92\x58\xcb\xef\x5c\
-\x32\x6a\x02\xbb\x97\x77\x41\xfa\xa3\xed\x38\x25\xf3\x65\x96\x0c\
-\xf6\x45\xab\x40\x6f\xf0\x51\x84\x59\xc5\xaa\xdc\xf6\x9c\x64\x9d\
-\xfc\x96\xf4\x9d\x1d\xd4\x5f\xb5\xc2\x77\x67\x89\x32\x12\xf4\x53\
-\xf0\x7e\xf8\xf3\xbc\x7c\xd6\x53\x78\xac\xe5\xec\x6e\xba\x2d\x59\
-\xb0\x77\x23\x82\x5f\xec\x89\x80\xb7\x05\x7f\x87\x6d\xb5\x45\xa4\
-\x76\x3c\x15\x63\x97\x0a\x9b\x22\xed\xf1\x4c\x6b\x47\x13\x3e\x55\
-\xeb\x7f\xbf\xe5\x6f\x0c\x04\x73\x32\x1f\xd1\xce\x66\x4b\x07\x96\
-\x7b\xa7\x62\x60\x59\x11\x6d\xc9\x84\x41\x1a\x9b\x08\x7a\x33\xaf\
-\xa0\x58\x8f\x54\x17\xbe\x7d\xcf\x37\x12\x8c\x25\xef\x8b\x20\xcd\
-\xe9\x96\xf7\x10\xb0\xe4\x97\x74\x92\x75\x48\xb0\x74\x98\x60\x07\
-\x75\x48\xa7\xb2\x3d\x65\xc1\x47\xf4\x44\xc1\x9f\xe7\xe5\xb2\xf6\
-\x39\xfe\x37\x8e\x72\x7f\x47\x21\x3a\xef\x26\x9c\x40\x39\x4f\x14\
-\xdc\xd6\x8c\xf7\x85\x98\x93\x20\x5d\x51\xba\x41\xed\xb4\x81\xb5\
-\xbf\x9d\xaa\xb1\xcb\xcb\xf0\x59\x07\x9c\xc1\x3b\xfc\x8e\x4e\x95\
-\x84\x55\x0b\xdf\xbc\x90\x55\xb0\x75\xa9\x9e\xe4\x4c\xc7\xf5\x3f\
-\xef\x01\x0b\x9f\x0a\x0f\xf8\x53\x01\x06\x65\xa9\x07\x37\xa4\xdf\
-\x21\x84\xc6\x08\xcb\x14\x2b\x5c\x60\xd1\x3f\x1f\x88\x4d\x03\x31\
-\xf9\x77\x20\x69\x31\x61\x56\x3a\x04\xcf\x70\x5d\x0d\xd7\x6b\x74\
-\xb6\x1d\xc5\x4d\x81\x24\x41\xbf\x58\x15\x61\xb0\x7f\x9b\xa0\x30\
-\xf8\x06\x80\x72\xb5\xb3\xa1\x4f\x78\xbd\xf9\x96\x37\x6f\x97\x0a\
-\xcb\xef\xbc\xdd\xb8\x64\x3e\x50\xc8\xbf\xb3\x60\xd0\x66\x6d\xb9\
-\x34\x9d\x6a\x78\xc0\x03\xa4\x27\xfc\x9d\x09\xba\xe1\x3d\x27\x10\
-\x49\x84\x8f\x91\xfe\x1d\xb8\xe7\xa0\xe5\xef\x8d\x70\xc6\x62\x67\
-\x75\x58\xd6\xb4\x25\x58\x89\xbc\x19\x21\xcf\x13\xc6\xc9\x12\x16\
-\xaf\xd0\x5e\x8b\xcd\x45\x3a\x28\x8b\xcb\x4e\x30\x66\x94\x15\xed\
-\x85\xad\xf8\x3e\xc0\x84\x1d\xbf\x1a\xd8\x51\x8b\x06\x02\x21\x34\
-\xae\x06\x7b\x27\x3e\xa8\xe6\xc0\x0e\xcd\x1e\x61\xe0\xed\x80\x6f\
-\xfe\x6e\xa6\xc3\x2e\xe4\x89\x86\x4a\xe1\xb6\x43\x7c\xab\x7c\x1b\
-\xfc\x2d\x9d\xc0\xa6\xc8\x89\x80\x4b\x90\x33\x60\xb7\xb3\x33\xe0\
-\x9b\x30\xc6\xf7\x39\x70\x8d\xb7\xdd\x76\xf8\xe6\xed\xb1\xdb\xa2\
-\xab\x1b\x0c\x9f\xcd\x9d\xec\x83\x9c\x50\x47\x83\x02\xf9\xdb\x36\
-\x9d\xe0\xfd\xa8\x09\xde\x7d\x4f\x78\xd7\x49\xb0\xc9\xb0\xe7\x04\
-\x36\xae\x74\x88\x94\x32\x09\xae\xb5\x45\xb8\x1b\x2d\x7f\xc7\x83\
-\xfb\x8f\xef\x14\x8f\xb9\x53\x92\xce\xc9\xce\x1c\x5c\xa7\x53\x0d\
-\x7e\x46\x48\xb0\x9f\xe1\xb6\x33\xb2\x10\x54\xac\xbd\x8f\x35\x3e\
-\x97\xd4\xc1\x98\x4e\xdf\x17\x98\x30\x10\x70\x1b\xf5\xe2\x75\x79\
-\x1c\x88\x9c\x0f\x44\x87\x60\x0e\xc2\xeb\xf7\x05\xec\x98\xf0\xed\
-\xff\xe1\x20\x99\xa1\x4e\x86\xbf\xd1\x41\xe2\xbb\x02\xae\x71\x1d\
-\xe0\xf2\x53\x54\xf7\x8e\x82\xf7\xb1\x4b\xc1\x1d\xc7\xba\x04\x6e\
-\x0b\x22\xb1\x8f\x17\xcc\x35\x3c\xc2\x0e\x9a\x2e\x48\xbb\xdc\xeb\
-\x20\x04\x52\x2d\x3f\x9a\xbd\xa3\x03\x5e\x1c\xa0\x3f\x85\xef\xef\
-\x42\xa9\xcf\xeb\xb9\x42\x28\x07\x82\xe3\xed\xdd\x9d\x9c\x58\xf8\
-\x18\xba\x5c\xf0\xf1\x6b\x6b\x37\x78\x33\x28\xe7\x65\x98\xd4\x8c\
-\x09\xf4\x47\xf0\x9b\xb3\x83\xe3\x56\x8a\xe0\xee\xd3\x9e\x0b\xda\
-\x09\x81\x58\x1c\x9c\x51\x14\xa9\x4b\xb4\x1d\x8a\xe6\x8e\xf1\xa4\
-\x50\x58\x06\x21\x23\xce\x13\x1c\x5e\x69\x1b\x1f\x26\x0c\xe2\x3c\
-\x18\xa4\x92\x60\x41\xdc\x1d\xc0\xda\xa8\x9f\xb8\x04\x5a\x0b\xdf\
-\xbc\x5e\x99\xc2\x6f\x04\xc8\xea\x65\xf8\x9b\x3f\xf7\x80\x10\x15\
-\xa0\xa3\xe1\x6f\x10\x58\x1e\x67\x0a\xd2\x55\x19\x2c\xaf\xd1\x77\
-\xd8\xae\x7c\xc6\x4f\x01\xb7\x93\x48\xe5\x8c\x04\xbe\x74\xce\x41\
-\x08\xfd\x1f\x5c\xe3\xca\xe0\xd7\x04\x5b\x38\x2a\xa4\xc5\x6d\x79\
-\x38\x39\x5f\x0d\x9e\x0f\x7a\x07\xdc\xa2\xb0\xd0\x4f\xaf\x05\xe3\
-\x54\x7a\x82\x96\xf2\x9d\x05\x7f\x17\xcf\x83\x94\xe8\x80\xba\x0e\
-\x43\x08\xfd\x06\x7e\x93\x3a\x40\x5a\x9c\x74\xc6\x08\x56\xed\xd1\
-\xda\x99\x1b\x3f\x7b\x22\x9c\xf8\xf3\x1b\x58\x0e\x87\x84\x36\x6e\
-\x6b\xec\xf2\x3e\x5e\x0c\xcb\x50\xfd\xdb\x1a\xbb\x44\xd0\x05\xf0\
-\xc4\x07\xc1\xb7\x64\x31\xa7\xa7\xc2\xb7\xd8\x70\xfc\xfa\x9b\xa0\
-\x60\x13\x77\xbd\xfe\x03\xf6\x49\xaa\x85\x8d\x45\x89\x8a\x08\x9d\
-\x7a\x11\x88\xfa\xeb\xc1\xd0\x90\xe7\xd3\x15\x77\x7c\x3a\x2a\x35\
-\x12\x4b\x67\xe3\x1e\xf4\xd6\xdd\x4d\x51\x82\x7c\x08\xae\x3b\xa1\
-\x5d\x7a\x82\x4f\x65\x96\x30\x63\x4a\x11\xda\x12\x0b\x1d\xe9\xaf\
-\x10\x05\x43\x7c\x5f\x7f\x06\x25\x6b\x34\x63\xc2\x6f\x0b\x9c\x08\
-\xe6\x40\xf8\x12\x6a\xd9\x39\xb5\xce\xd4\xbc\x3f\xa4\x03\x39\x15\
-\xc3\xdf\xdc\x83\xe1\xaf\x96\xf4\x79\x1f\x7c\x1d\xbc\xfc\x89\x40\
-\x6e\x4f\x43\x1f\xd4\x84\x89\x57\x8a\xd0\x1f\xf9\x84\xb9\x18\xda\
-\x1f\x7d\x87\xfd\x8e\x13\xe3\x21\x1e\xa4\x0e\xc0\xc0\xcb\xe1\xa7\
-\x42\x7d\x48\x94\x36\xe3\x75\x1e\x04\x6d\x16\xdf\x81\xe5\x2c\x1f\
-\xa7\x0f\xc3\x04\xe0\x80\x6b\xc9\xd0\x96\x85\x6d\xb4\x9b\x2c\x48\
-\xa4\x0c\xd4\x16\x65\x30\x7e\xad\x0e\xea\xa7\x14\xf7\x5a\xfc\x7f\
-\x0e\x42\x50\x32\x31\x43\x07\x04\x91\xfb\x4a\xf0\x81\x12\xc1\xef\
-\x1b\x22\x04\xd4\xd3\x04\xdf\xae\xbb\xa3\xc4\x32\x12\x3d\xd4\x1f\
-\x16\x2a\xcf\x7d\xd9\x86\x59\xd2\x47\x11\x7c\x09\xb9\x6f\xd6\x53\
-\x96\xdf\x3b\x03\x9e\xfe\x7f\x2c\x3e\x55\xdc\x2f\xf1\x64\x67\x59\
-\x9e\xfe\x94\x08\xce\xda\x43\x2d\xf7\xf0\xef\x1b\x85\x76\xd4\x84\
-\x77\xc3\x23\x43\x44\x8b\x72\xd0\x0f\x96\x7d\x4c\xb0\x42\x66\x16\
-\x1d\x1b\x8e\x50\xb6\xc7\x2c\x75\x8f\x16\x8f\xac\x2d\x44\xf2\x25\
-\xb4\x4a\x9a\x0c\x96\x3e\xa5\xed\xd4\xe3\x1c\x08\xac\x68\x6d\x83\
-\xdb\x2c\xe5\xb6\xd6\x63\x44\x94\x3e\x78\x67\x94\xe8\x1d\xfc\xff\
-\x49\x40\x84\x62\x59\xad\x92\xc4\x77\x11\xad\x21\xc6\x12\xa5\x82\
-\xa7\xfb\x0c\x48\x9b\x91\xda\x8c\x97\xe9\xc7\x82\x23\xbf\x58\xa6\
-\x8e\x44\x6b\xb8\x44\xc8\x93\xbf\xa7\x1a\xb8\x1e\x29\x3f\xd1\x68\
-\xfc\x5d\x4b\x7b\x1f\x10\x74\x89\x38\x42\x5e\xf7\x59\xfc\x3e\x7f\
-\x12\xa1\x5c\x11\x21\x83\x83\xec\x75\xb0\x6b\xa5\xc3\x0b\xf8\x0c\
-\xc4\xf0\xad\x30\xab\x5f\x0f\x0a\x3c\x1e\xab\x67\x3f\xc4\xaa\x11\
-\x97\x6d\x12\x34\xb4\x91\xf9\xb3\x82\x1e\xc5\x20\xbb\xdf\x82\xc7\
-\xf9\x2b\x20\x3d\x55\xc1\xfd\xb9\xa0\x9b\x58\x00\x46\x73\xd4\xe2\
-\x7b\x56\xdb\x5e\x05\xbe\x27\xc4\x00\x39\xbb\x3a\x28\xa9\x48\xd0\
-\x6e\xb7\x09\x86\xad\x32\xe8\xab\xb8\xd2\x93\xa7\xc3\x97\x38\x0f\
-\x03\xf9\x5c\x27\x88\xd8\xf9\xe0\x2b\xb9\x16\xda\xbf\x0c\x7c\xed\
-\xe2\x60\x92\x99\x01\x03\xdd\x2d\x0c\x34\x19\xf4\x14\x5c\x2f\xf1\
-\x5d\x6f\x5e\x30\x61\x70\x73\x02\x9b\x02\xfd\xe0\x03\xb0\xa8\x2f\
-\x07\x89\x32\x15\xec\xda\xe6\x43\x7b\x31\x41\x0a\x90\x60\x52\xfa\
-\x73\x14\x25\x3a\xef\x83\xeb\xa1\x0f\x3e\x27\xf4\x41\x19\xa2\x96\
-\x5e\x0d\xcb\x9f\x0d\xa0\x77\x95\xc0\x90\x76\x2c\xd8\xd5\x65\x59\
-\x74\x92\xdf\x65\x5b\xf1\x76\x0a\x00\x49\x2c\x87\xf2\x70\x5f\xbe\
-\x4b\x20\x8a\xef\x1b\x20\x45\x56\x00\x11\xa5\xc3\xe6\xc2\x42\x58\
-\x8e\x31\x41\xb2\xea\x88\x84\xc8\x75\x8a\xcf\xc2\xf3\x77\x0a\xd2\
-\x5c\x06\x10\xe5\x6d\x20\xb5\x6d\x03\x5d\x61\x0c\x48\xfd\x67\x82\
-\xd4\x1c\x2b\x8c\x5d\x64\x89\x9d\xf7\xad\xe0\x76\x81\x89\xa9\x25\
-\xfa\x81\x28\xf5\xf0\xd9\xe1\x6a\x78\x2e\x52\xcc\x2c\x04\x47\x77\
-\x8b\xb1\x78\xda\x8b\x5a\x68\xbd\xcf\xd3\x86\x93\xae\x35\xe2\xe8\
-\x77\x25\x61\xf1\x97\xef\x10\x66\x14\xbd\x03\xf5\x12\x3f\xe2\xcc\
-\xad\x5b\x66\x6c\x11\xe2\x52\xf8\x9f\x16\x69\xa9\x23\x79\x8a\x6d\
-\xb9\x5e\xb0\x9e\x8f\x24\xa2\x7f\x1b\x12\x96\x5b\x90\x8e\xf8\xfb\
-\xdc\x18\x41\xea\x6b\xeb\x63\xad\xef\x53\x42\x59\xda\x1a\x88\xfc\
-\x9e\x2b\x84\xba\x68\x1d\xec\x83\xd6\xb8\x4c\xbb\x2d\xef\xf9\x64\
-\x24\xac\xbb\xa3\x48\x58\xd1\xc6\xd0\x08\x28\x03\xb3\xc4\x97\x6b\
-\xaf\xfc\x62\x1c\xba\x4d\x1d\x90\xb0\xac\xef\xee\x7e\xa1\xaf\x76\
-\xa4\xbf\x51\x4b\x7f\xdb\x65\x89\x7d\x1f\xe9\xdd\x9c\xb0\x84\xc5\
-\x13\xfc\x13\xac\x9d\x65\xa1\x10\x8a\xa5\x11\x10\x48\x14\x6b\x05\
-\xa5\x70\xb4\x59\xee\x69\x60\xdf\x7d\xc2\x7a\x9b\x09\xb1\xa8\x99\
-\xf0\xb7\x22\x48\x55\x12\xcc\x7e\x13\x40\x39\xdc\xd6\x76\x34\xaf\
-\x1c\x9f\x0d\xa2\x59\xc2\x77\x06\x3c\x4d\xdd\xd2\x3e\xe2\xff\xcf\
-\x04\x32\xed\xcc\x76\xb7\x48\x04\x7c\xe6\xbb\x0d\xa4\x8b\x48\x76\
-\x49\xe2\xac\x7e\x2d\x42\xe8\x26\x21\xea\x28\xd7\x53\x85\x84\xce\
-\x44\x85\xc0\x6b\x48\x68\xcb\xe7\xc0\xd9\xf9\x50\x07\xb6\xf6\xb1\
-\xa5\xee\x27\xb3\x0c\x26\x96\xf7\xa1\x82\xe4\xf7\xa8\x45\x2f\x6a\
-\x0d\x97\xac\x0b\xf5\xc2\x82\x12\xf9\x76\x08\x1f\x43\x3b\x20\xf5\
-\x70\x89\xe1\x3f\x10\x81\x75\x9f\x65\xb7\xd9\xda\x07\x55\xe1\xdd\
-\x10\x61\xa5\x30\x09\x62\x81\x21\xc1\xa1\x38\xda\x40\x27\x1d\xe8\
-\x87\x0e\xa1\xce\xd6\xe7\x45\x70\x09\x7b\x3d\x8c\x83\x8f\x2d\x04\
-\xa9\x5a\xc2\x7f\x8b\xc1\x0d\xb9\x6e\xa9\x11\x26\xdb\x7f\x09\xcf\
-\x44\xca\x4b\x04\x7f\xfe\x0e\xd8\x30\xf3\x44\xe8\x6f\x9a\x50\x46\
-\x25\x42\x14\x96\x37\xa1\xdd\x76\x08\xcf\x45\x02\x27\x71\xbd\x03\
-\xe5\x8a\x08\xfe\xc0\x0d\x42\x1c\x69\xab\x94\xa5\x42\x87\xb3\xc6\
-\x53\x8a\x04\xde\xb8\xf1\xe0\x48\xb9\x2b\x4a\x9a\x22\x4b\x6f\x84\
-\x86\x72\xb4\x93\x3e\x4f\x7b\x30\x88\xcf\x3c\xcd\x9b\xe0\xfa\x89\
-\x0c\x34\xfe\xcc\x2d\x42\x79\xbc\x82\xb1\x22\x11\xf2\xed\x1f\xe1\
-\x54\x8f\x8e\x4a\x57\x0c\x96\x3f\xe7\x59\xea\xd2\x16\xf8\x3d\xbd\
-\xc1\x13\xbe\xbe\x9d\xbc\x43\x10\xac\xff\x0c\x78\xae\xbd\xa5\x01\
-\xaf\xfb\x8d\x42\xba\x7e\xc1\xf0\xb2\xb3\x8a\x53\x9e\xd7\xbb\x42\
-\x99\x56\x09\xe9\x4c\x04\x7d\x5a\xa0\x9d\x76\x6a\x84\x01\x57\x7c\
-\x82\xe5\x10\xfb\xe0\xad\xed\x9c\x3a\x63\xed\x83\x5c\xdf\x7a\x8f\
-\xf0\x7b\x83\x10\x5c\x8e\x58\x74\x4e\x5b\x85\xfb\x9e\xb6\xe4\xcf\
-\xdb\x77\x7e\x1b\xd2\x5a\x5b\xed\x88\x60\xb9\xf7\x55\x1b\xd2\x0e\
-\x6f\xb3\x83\xa0\x7e\xe1\x3b\xcf\xd3\x2d\x79\x76\xc4\x3c\x86\x97\
-\x3b\x17\xd4\x42\xd5\xed\xf4\x37\x05\x48\xf5\x1c\xa1\xdc\xd1\xfa\
-\x1b\xcf\x77\xb1\xa5\x5c\x93\x3a\x50\xae\xe3\x1a\x85\xcf\xc0\xb9\
-\x60\x7d\x3d\x1c\xf4\x5a\x3e\xd0\x95\xbc\x0d\x2f\x94\x3f\xd3\xd6\
-\x2c\x87\x2c\xf7\xc5\x81\xae\x6a\x3c\x88\xd0\xa9\x90\x57\x03\x2c\
-\x1d\xbe\x80\xd8\xcd\xa1\x0e\xa6\xcf\x67\xd9\x05\xd0\xc1\x56\x41\
-\x10\x32\xf5\x04\xf5\x0e\xfc\x19\x37\xcc\x30\xa3\x60\x89\xf4\x96\
-\x25\x3d\x2c\xbc\xf8\x2b\x3a\x91\x3e\x03\xa2\x59\x05\x3a\x88\xa6\
-\x0e\x48\x3c\x22\x44\x5b\xb4\x2c\x38\xcf\x6f\x18\xbc\xab\x44\x90\
-\xbe\xea\x60\x66\x13\xcf\xf3\xeb\x4c\x5b\x3a\x60\x47\x6a\x1c\x2c\
-\xbf\x5e\x3d\xc9\xb6\xec\x05\x4b\x10\xb7\x10\xeb\x48\xdc\x41\xe6\
-\xe7\x2b\x96\xc2\x00\x73\xc3\xac\xce\xcf\x57\xfc\x54\x88\xc3\xdf\
-\xd6\x6c\xdd\xd1\x76\x8b\x05\x89\x65\x2c\xec\x7e\x71\xa5\x70\x03\
-\x48\x61\x2b\x21\xca\xa6\x2a\xbc\x1b\x37\xd4\x61\x30\x4c\x16\x4b\
-\x2d\x6d\xc2\xef\x1b\x0a\xd1\x3b\xea\xa0\xae\xb5\x51\xda\xee\x7a\
-\xd0\x43\xbd\x06\x36\x79\xed\xb5\xaf\xf8\xfe\x64\xc8\x67\x32\x90\
-\x78\x9a\x70\x9e\x40\x05\x94\xfd\x0b\xd0\x1d\x89\x6d\x76\x35\x8c\
-\x67\x63\xc5\xf2\x48\x27\xda\x8d\xb7\x77\x1a\xf4\xb7\x11\x60\x72\
-\x94\x08\x6d\x54\x0b\xef\xf4\x33\x81\xb0\xc5\xf6\x6e\x2f\xfd\x9b\
-\x81\x50\x5f\x84\x58\x74\x27\xa4\x2f\x6c\x6f\x16\x23\x27\xe8\x22\
-\xd2\x11\xe0\x6f\x6b\x1b\xb4\x0b\xe2\x44\xea\xd9\x99\xf6\xe9\xca\
-\x6d\x49\x3a\x51\xb6\x13\xe9\x6f\xd1\xd2\xf9\x36\xee\xfd\xae\xd0\
-\x99\x76\x10\xcb\x7f\x32\x6d\x87\x3b\xb1\x5a\xe9\x6c\x7f\x3b\xe1\
-\x72\xb5\x25\xba\x31\x61\x96\x26\x82\xf8\x76\xa2\x20\x02\x73\x8b\
-\x33\x14\x3e\x89\xb4\xc5\x46\x3a\x55\x46\x6a\x1d\x49\x93\x9c\x40\
-\x79\x79\xba\x9d\xf1\xa3\x8b\x06\x49\x98\x41\x99\x25\x7d\x7a\x12\
-\xef\xe9\x54\xb6\x27\xb6\x48\x08\x91\xca\x24\xda\x5c\x21\xa1\xaf\
-\xb1\x53\xd4\x4e\x56\x10\x21\x7d\x2a\x5c\x6b\xab\x0f\x8a\x36\x6b\
-\x6d\xf5\x07\x8e\xb6\x24\x8c\x93\x6d\x5f\x6c\x79\xcf\xe2\x35\x1a\
-\x25\xcd\x53\xf1\x4e\xad\x63\x57\x7c\xb7\x27\xda\xdf\xbe\x8d\xb1\
-\x6b\xc3\x86\x0d\x1b\x5d\x07\x5d\x51\xfc\xb5\x61\xc3\x86\x8d\x88\
-\xb0\x09\xcb\x86\x0d\x1b\xdd\x06\x36\x61\xd9\xb0\x61\xa3\xdb\xc0\
-\x26\x2c\x1b\x36\x6c\x74\x1b\xd8\x84\x65\xc3\x86\x8d\x6e\x03\x9b\
-\xb0\x6c\xd8\xb0\xd1\x6d\x60\x13\x96\x0d\x1b\x36\xba\x0d\x6c\xc2\
-\xb2\x61\xc3\x46\xb7\x81\x4d\x58\x36\x6c\xd8\xe8\x36\xb0\x09\xcb\
-\x86\x0d\x1b\xdd\x06\x36\x61\xd9\xb0\x61\xa3\xdb\xe0\x54\x1d\xa4\
-\x6a\xc3\x86\x09\xd3\x2b\x16\x87\x1d\x63\x19\x33\xfe\xd9\xb0\x71\
-\xea\x60\x4b\x58\x36\x4e\x29\x18\x42\x38\xd6\x29\xb1\x38\x27\x31\
-\xc8\xaa\x2b\x9e\x76\x64\xc3\x86\x8d\x1f\x3a\x80\x99\xa4\x78\x67\
-\x0c\x5a\xf5\xa3\x89\x73\x57\x5d\x35\x71\xae\xf1\x7f\xe3\x9a\xcd\
-\x5a\x36\x4e\x15\xbe\x8b\x43\x22\x6d\xfc\x00\xe0\x90\x88\x44\x19\
-\xd3\x7f\x77\xc6\x90\x31\x8b\x06\xe6\xbf\x99\x9f\x1c\xbf\xc0\x81\
-\x1d\x1f\x2f\xdf\x57\x55\x01\xbf\xd9\xab\x43\x1b\x27\x0d\x9b\xb0\
-\x6c\x9c\x34\x64\x82\x89\x46\x19\x5d\x5c\x9a\xdb\xff\x0f\x67\x14\
-\xbd\xe7\x0b\x29\xe9\x41\x45\x75\x8d\xcf\x8f\x9f\xb5\xaf\x29\xf0\
-\xfe\xa6\x9a\xd6\x3a\xe3\x1e\xca\x4e\x2a\x00\xa4\x0d\x1b\x36\x61\
-\xd9\x38\x39\x08\x64\x55\xf0\xec\x79\xc3\xde\x57\x74\x33\x5e\x3a\
-\xc5\x18\x33\x84\x70\xd2\xa2\xd2\xbc\xb3\x76\x37\x78\xdf\xda\x5c\
-\xeb\x69\xb1\x49\xcb\xc6\xc9\xc2\x26\x2c\x1b\x27\x0c\x82\x31\xd6\
-\x19\x63\x17\x95\xe6\xa5\x3d\x7b\xfe\x88\xf7\x7d\x8a\x3e\x90\x31\
-\xa4\x63\x6c\xea\xad\xb0\xf1\x7f\x85\xd2\xcc\xc5\x03\xf3\x26\xed\
-\x6d\xf0\xbc\xb2\xa9\xd6\x13\x20\x18\x61\x9b\xb1\x6c\x9c\x28\x6c\
-\xc2\xb2\x71\x42\x90\x30\xc6\x94\x31\x76\x59\xdf\x9e\xce\x67\x16\
-\x0c\x7b\xd5\xab\x68\x13\x11\x43\x1a\xc6\x47\x4d\x65\x30\x46\xc4\
-\xb8\xa6\x50\xd6\x63\xd1\xa0\xdc\xc1\xfb\x9b\x43\xaf\x6e\xaa\x69\
-\xd1\x25\x9b\xb4\x6c\x9c\x20\xec\x0d\x1c\x1b\x9d\x06\xc6\xa6\x8d\
-\x15\xea\x11\x1f\x83\xb6\x5f\x7d\xe6\xf3\xd8\x45\x2f\xd2\x74\xaa\
-\x11\x8c\x23\xda\xf5\x51\x86\x34\x99\x20\x99\xe1\x98\xe7\x07\xfc\
-\x63\xd9\xc5\x87\x5a\x7d\x47\xd2\xb0\x61\xa3\x33\xb0\x25\x2c\x1b\
-\x9d\x02\x10\x0d\xce\x89\x8f\x41\x2f\x2d\x1c\xfe\x50\x6e\x8a\xeb\
-\xaa\xb6\xc8\x0a\x9e\x21\xba\x41\x5a\x58\x1d\x32\xa1\x47\x4a\xfa\
-\x07\x7b\xea\x96\x7a\x14\x0d\x63\x7b\xba\xb4\xd1\x49\xd8\x86\xa3\
-\x36\x3a\x05\x30\x62\x47\x39\x09\x2e\x34\x30\x23\x21\x83\xea\x08\
-\xe9\x0c\xd1\xb6\xb8\xc7\x3c\x43\x8b\x31\x4a\x11\x41\x03\x33\x12\
-\x33\x73\xe2\x9c\xc6\x65\x86\x6d\x01\xdf\x46\x27\x61\xf7\x18\x1b\
-\x9d\x06\x01\xfd\xd5\xc0\xcc\x44\x79\xf9\xc5\x63\x5e\x49\x76\x39\
-\xe7\x07\x35\x5d\x95\x08\x76\x44\xba\x5f\x67\x4c\x8d\x75\xc8\x8e\
-\xc6\x40\xe8\xbd\xe9\xcf\xae\x3e\x7f\x4b\x9d\x47\xe1\x69\x7c\xf7\
-\xa5\xb7\xd1\x9d\x61\x13\x96\x8d\x13\x82\x4c\x30\xd6\x28\x63\x03\
-\xd2\xe3\xe3\x96\x5e\x3c\xf6\xed\x14\xb7\x63\x1a\xa5\x4c\x25\xf8\
-\x58\xd2\x62\x0c\xa9\x08\x23\x47\x63\x40\x59\x39\xe7\xc5\xb5\xb3\
-\xb6\xd5\x79\x3c\xfc\xd9\xef\xaf\xf4\x36\xba\x2b\xec\x25\xa1\x8d\
-\x76\x41\x30\x36\x3f\x22\x0c\xc2\x91\x09\x26\xdb\xeb\xbd\xbe\xf3\
-\x5e\xfa\x7a\x91\x93\x49\xeb\x29\x43\x0e\x86\x90\x26\xde\x16\xd2\
-\x35\x47\x62\x5c\xec\xd6\x07\xbe\xaa\xbe\xc0\x20\x2b\xa7\x44\x48\
-\x24\xb2\x92\xed\xa9\xd3\x46\x07\x60\x2b\xdd\x6d\xb4\x09\xc9\x24\
-\x2b\x24\x23\x8c\x08\x31\x57\x71\x47\x7f\xa3\x0c\x31\x89\x60\xa9\
-\xd2\x13\xf4\xa5\x93\x98\x65\x53\xfb\xa5\xcf\xf6\x04\xd5\x0c\x99\
-\x60\xf3\xd8\x77\x45\xa7\x72\x7a\x42\x4c\xf9\xff\xad\xd8\x39\xeb\
-\x0f\xab\xb6\x1f\x92\x30\x96\x34\xca\x8e\x3b\x96\xdc\x41\xb0\xac\
-\x63\x2c\x11\xd3\x74\xcb\x86\x8d\xe8\xb0\x09\xcb\x46\x54\x18\x42\
-\x15\x65\x88\x64\xc6\x39\xf5\x04\xa7\x44\x5b\x43\xba\x24\x11\x7c\
-\x8c\xe6\x89\x19\xa4\x85\xb1\xb4\xb4\xbc\xba\x29\x4e\x92\x3e\x3e\
-\xbb\x24\x7b\x81\x2f\xa8\x25\x1a\xcf\xa5\x25\xb8\xeb\xff\xfc\xe5\
-\xee\x59\xb7\x7f\xb2\x7d\x07\xc6\x48\xa2\x0c\xe9\xc7\xa4\x1f\xf6\
-\x8c\x96\x10\x21\x7a\x1f\xa7\x4c\x5b\x34\x1d\x33\x7b\xeb\xd0\x86\
-\x0d\x1b\x9d\x05\xf0\x86\x9c\xec\x72\xa0\x6f\xae\x9e\x7c\xe7\xde\
-\x1b\x27\x5d\x9d\x19\x67\x5a\x2e\x38\x64\x72\x2c\xa9\x84\x89\x07\
-\x9b\x93\xdf\x9f\xce\xec\x3f\x81\xfd\x66\x9e\x97\xfd\xf6\xdc\xc0\
-\x9f\xce\xea\x37\xc5\xb8\x66\x48\x61\x56\x1a\xc2\xa6\xc3\x74\x58\
-\xdf\x75\xf3\xd8\xde\x67\x07\x7f\x34\xe9\xaf\x79\x6e\xf3\x4f\x42\
-\x6c\xce\xb2\x61\xc3\x46\x47\x81\xc3\x24\x23\x1b\xff\xfb\x72\xd1\
-\xa4\xf9\xec\xee\xb9\x4c\xfb\xf5\x5c\x6d\xdb\xd5\x93\x16\x67\xb9\
-\x5d\xc8\x24\x2d\x1c\x9d\xb4\x1e\x9e\x39\xf0\x82\x87\x67\x0c\x5c\
-\x84\xe0\x5a\x24\xfe\xe1\x64\x75\xc3\xc8\xc2\x09\xec\xd7\x73\xeb\
-\x94\x7b\xe6\xb1\xaf\xfe\x67\xe2\x6d\x29\x61\xd2\xb2\x26\x6f\xc3\
-\x86\x09\xbb\x5b\xd8\x38\x0e\x32\x31\x75\x4d\xfa\xd5\xc3\x0a\x06\
-\xfd\x73\xf6\x90\x15\x9e\xa0\x9a\x6a\x2c\xe7\x52\x63\x9d\x6c\xfb\
-\xe1\x96\x4b\xa6\xbd\xb4\xe6\xa5\x1a\x5f\xd0\x20\x2d\x55\x13\xd6\
-\x87\x10\x6d\x94\x50\x86\x4c\x3d\x15\xc1\x88\x30\x66\xac\x2a\x8f\
-\x85\x41\x56\xaa\xce\xd4\x1b\x46\x16\x4e\x7e\x78\xf6\x90\x37\x5b\
-\x02\x4a\x0a\xd5\xa8\x96\x92\x1c\x2b\x7f\xb9\xa2\x6c\xf6\xc4\x4f\
-\x76\xbc\x2f\x49\x44\xa6\x3a\xd5\x6c\x9d\x96\x0d\x11\xb6\x0e\xcb\
-\xc6\x31\xe0\xd1\x17\xae\x1d\x59\x90\xf1\xe8\xdc\x21\x6f\x7b\x42\
-\x5a\x4f\x82\xb1\x2e\x11\x4c\x7c\xaa\x46\x0a\xd2\xe2\x16\xcc\x29\
-\xce\xdd\xfd\xc6\xd6\xaa\x4d\x2d\x9a\xea\x30\x15\xf1\xc7\x26\xc1\
-\x48\x78\x53\x11\x47\x21\x2b\x59\xd5\x99\x76\xf3\xe8\x5e\x67\x3e\
-\x34\x7b\xc8\xdb\x2d\x7e\x25\x09\x23\x44\x25\x09\x63\x7f\x50\xc5\
-\x7d\x0a\xd3\xa6\xd7\xf9\x95\xf7\xd6\x1e\x6e\xae\x31\x88\xd3\x8e\
-\xee\x60\x43\x84\x4d\x58\x36\x8e\x00\xa2\x2f\xe0\x82\xa4\x58\xf6\
-\xd6\xe2\xb1\x2f\xaa\x2a\x9d\x44\x19\xe3\x6e\x37\x58\xc2\x98\xf9\
-\x14\x1d\xe7\x27\xb9\xce\x9b\x5b\xd8\xab\xec\xcd\xcd\xfb\xb6\xb4\
-\x30\xea\x20\xe8\x58\x62\x62\x61\x37\xc1\xe3\x88\x86\x93\xd5\x2d\
-\x63\x7a\x4f\xfd\xcb\xac\xc1\x6f\x35\xfb\x94\x04\x62\x86\xa2\x31\
-\xcd\x6b\x0c\x8e\xd3\x43\x14\xc5\x2f\x18\x98\x33\xbe\xde\xc7\x5e\
-\x5e\x73\xb8\xc1\x6f\x47\x77\xb0\x21\xc2\x26\x2c\x1b\x26\xc0\x47\
-\x90\x64\xc4\x39\xe9\x6b\x0b\x47\xfe\x26\x27\xce\xf9\x63\x85\x52\
-\x5d\x3a\xd6\x47\x10\xcb\x18\x33\x8f\xaa\x4b\x3d\x52\xc8\xec\xd8\
-\xa0\xba\xe9\xbd\x8a\xa6\x32\x82\x31\x89\x44\x50\x22\x0c\xa9\x4b\
-\xa7\x48\xbf\x79\x74\xaf\x31\x7f\x99\x3e\xf0\x8d\x26\xbf\x92\x22\
-\x11\x6c\x86\xa2\x11\xca\x60\x2c\x21\x35\x55\xd3\xf3\xce\xec\x95\
-\xd3\xe3\xf9\x2d\x15\xaf\x37\x87\x54\xdb\xe7\xd0\xc6\x11\xd8\x84\
-\x65\xc3\xd4\x3d\x31\x84\x08\x41\x98\x7e\xb4\x60\xfc\xa5\xa3\x0b\
-\x93\xfe\xe6\x57\xa8\x26\x11\x53\x89\x7e\xdc\x06\x9f\x8c\x31\xf5\
-\x6b\xcc\x39\xaa\x24\x73\x56\x8b\x5f\xd9\xb0\xa6\xb2\x79\xaf\xa9\
-\xaf\x8a\x42\x5a\x06\xa1\x51\x86\xe8\xf5\xa3\x0a\x47\x3e\x34\x73\
-\xd0\x1b\x4d\x41\x35\xdb\x24\xab\x08\xfd\x2f\xac\x03\xc3\x9a\x83\
-\x68\x43\xc6\xe5\x25\xcb\xff\xd9\x72\xf8\x13\x83\x48\x71\x3b\x84\
-\x68\xe3\x87\x01\xdb\xd2\xdd\xc6\x11\x18\xac\x90\x9a\x24\xbb\x19\
-\xc6\x88\x1e\xe1\xb1\xc8\xb7\xca\x08\x69\xc1\xa0\x96\xfc\xf0\xb9\
-\xc3\x1e\x38\xbb\x57\x86\xd3\x20\x24\x29\x82\x2c\x24\x99\x06\xa6\
-\x8c\x9e\xe3\x76\xa0\x47\xa6\x0f\xfc\x63\x63\x50\xcb\x93\x30\x52\
-\x22\x91\x15\x80\xe9\x94\xa2\x18\xd9\x81\xd2\xe3\x5c\x2e\xe8\xa0\
-\x36\x59\xd9\x30\x61\x4b\x58\x36\x4c\x10\x8c\x99\xce\x18\x79\x6f\
-\x5f\xed\xfa\xf9\xbd\xb3\x0e\x65\xc6\xbb\xce\x0d\xa8\x1a\x92\x88\
-\x21\x38\x1d\x27\x65\x31\x95\x31\x29\xc9\x2d\x07\xee\x5d\x51\x76\
-\xe5\x93\x1b\x0f\xed\x81\xdd\xc1\xe3\x88\x85\x81\xd4\xb4\x5b\xa3\
-\x8c\x20\xb4\x63\x7a\xdf\xac\x05\x7e\x55\x8f\x97\x30\xa6\x11\xd2\
-\xa5\xaa\x4e\x69\x92\xdb\x21\xef\x6d\xf2\xff\x76\xfa\xf3\xab\x7f\
-\xd5\x1c\x54\x31\xc1\x76\xe8\x2c\x1b\x61\xd8\x84\x65\xc3\x04\x03\
-\xd2\x6a\x0a\xa8\xf2\xdb\x5b\x6b\xd6\xcf\xef\xdd\xeb\x40\x66\x96\
-\x7b\x9e\x2f\xa0\x60\x99\x60\x91\xb4\x58\x48\xa7\x34\x2d\xde\x4d\
-\x9e\xd9\x54\x71\xcd\x4f\x3f\xdc\xf6\xba\xa9\xc3\x02\x53\x86\x68\
-\xc9\x1b\x4b\xc6\x4f\xcb\x1b\x0e\x17\x61\xb4\x6f\x6c\x61\xc6\x85\
-\x1e\x8d\x52\x47\x58\x22\xe3\xe9\x1a\x64\xc5\x92\xdd\x0e\x79\x7f\
-\x93\xef\xce\xe9\xcf\xad\xfe\xdf\xf2\x96\x80\x44\x30\xa6\xc7\x6d\
-\x35\xda\xf8\xc1\xc2\x26\x2c\x1b\x47\xc0\xc2\x66\x0d\xb4\x51\x55\
-\x1d\x6f\xef\xae\xde\x30\x4f\xd1\xf6\xe4\x17\xa5\xcd\xf3\xa9\x54\
-\x22\x08\x9b\xbb\x79\x3a\x65\xba\x21\x01\x1d\x6c\x0c\xfc\xee\xc7\
-\xef\x6e\x7a\xb0\x21\xa8\xca\xe6\xe6\xa2\x90\x0e\xc1\x18\x4b\x18\
-\x13\x2a\x2c\xe5\xb0\x21\x25\x61\x24\x6f\x3b\xd8\xb4\xf5\x9c\x01\
-\x39\x81\x9c\x04\xf7\xf4\xa0\xc6\x74\x12\xde\x21\xa4\xaa\xce\x50\
-\x92\xdb\x21\xed\xaa\xf7\xdd\x32\xe3\xf9\xd5\x7f\x2e\x6f\x0d\xc8\
-\x46\x59\x74\x5b\xb6\xb2\x21\xc0\x26\x2c\x1b\xc7\xc0\x90\x66\x64\
-\x8c\x69\xa3\xa6\x38\x3e\xd8\x5f\xbb\xa9\x54\x67\x7b\x8a\xfa\x66\
-\xcf\xd3\x54\x5d\xa6\x08\xa9\x0e\x89\x38\x2a\x5a\x03\x2f\xcc\x7c\
-\x61\xf5\x0d\xbb\x9b\x7c\x86\x04\xa4\x8b\x1e\xd1\x86\xb4\x85\x10\
-\x33\xbd\x9f\x49\xf8\xe8\x1c\xf3\x47\x90\xe0\x68\x03\x65\xd2\xd2\
-\xbd\x75\x2b\xe7\x14\x67\xe5\x25\xb9\xa5\x51\x94\x61\x55\xa3\x94\
-\x24\xb9\x1d\xa4\xac\xd1\x7b\xe3\xcc\x17\x56\x3f\x74\xb0\x35\x68\
-\x90\x95\xa6\xd9\xa2\x95\x0d\x0b\x6c\xc2\xfa\x01\x82\xe0\xb0\x7f\
-\x5f\x38\x88\xde\xf1\x7a\x27\x6a\xee\xc6\x60\xda\x2c\x11\xf9\x3f\
-\xe5\x0d\x9b\xa9\x4e\x77\xcf\x2a\xc9\x9a\x1d\xd4\xa8\x3b\x46\x92\
-\xd7\x9d\xf5\xdc\xea\x45\xdb\xeb\x3d\x21\x99\x60\x24\x4a\x40\x4e\
-\x29\x6c\x74\xfa\xa3\xe1\x79\x69\xe7\x67\xc4\xc7\x7c\x5c\xe3\xf1\
-\xc9\xd2\xd1\xa3\xbd\x18\xf8\xdc\xd4\x07\x14\xfc\xd9\xc1\xa6\x8f\
-\xae\x1d\x59\x3c\x2e\xa8\x86\xfa\x24\xba\x9d\xe8\x40\xa3\x72\xc3\
-\x8c\x17\x56\xfd\xfd\x50\x4b\xa0\x4d\xb2\x92\x09\x26\x61\x52\xb4\
-\xf5\x5a\x36\x6c\xfc\x20\x00\xcb\x30\x13\x40\x00\x91\xef\x0b\x93\
-\x90\x69\x87\x75\xfb\xf8\xa2\xc5\xec\xde\x73\x77\xdf\x3d\xb1\x5f\
-\x3f\x78\xee\x98\xc9\x4e\x0e\x27\x82\x0b\x12\xdd\x52\xd9\x0d\xd3\
-\x3e\x64\xd7\x4f\xfb\xb4\x6f\x02\x38\x06\x12\x4c\x8e\xbd\xd7\x48\
-\x1a\xa3\xbb\xa6\x96\xe6\xb1\xdf\x9d\xbb\x6d\xe7\x8f\xcf\xbe\xa9\
-\x67\x42\x9c\xf9\x93\xd5\xb1\xfa\x68\x99\xf1\x31\xe9\x88\x75\xb0\
-\x61\xc3\xc6\x69\x08\xe0\x25\x92\x9f\xe8\x46\xcb\x2f\x19\x7b\xd5\
-\xdd\x93\x4a\x26\x23\x70\x74\x8e\x64\x92\xc0\x21\x61\x4c\x64\x82\
-\xe5\xd1\xb9\xc9\xc9\x4e\xc9\x64\x94\x63\x09\x28\xfc\xac\xd4\x23\
-\x31\x06\xed\xbc\xfe\x8c\xc7\x94\x3b\x67\xb3\xd6\x3b\x67\xb3\x1d\
-\xd7\x9d\xf1\x74\xcf\xa4\x18\x33\x4f\xd9\xc2\x8a\x18\x21\x62\x24\
-\x35\xa5\x20\x3d\xb9\x67\x62\x9c\x41\x6c\x44\x8a\x42\x56\x46\xd9\
-\xc2\xce\xd8\x08\x19\x65\x5e\x7e\xf1\x98\x1f\xe5\x87\xd3\xb5\x8d\
-\x4a\x7f\x60\xb0\x97\x84\x3f\x20\x38\xc2\xbe\x79\xf4\xb7\x53\x4a\
-\x26\x2f\x19\x5e\xf8\xfb\x09\x59\x09\x67\x9c\x55\xd4\xab\xf2\xab\
-\xc3\x0d\x3b\xeb\x7c\x41\xc9\x90\x6e\x22\xad\xc4\x18\x42\x0c\x63\
-\x8c\x0f\xb7\x06\x83\x28\x6c\x11\x7f\xe4\x2e\x83\x87\x74\xc6\xe4\
-\x1e\x49\x31\xfa\xf2\x4b\xc6\xfc\xa6\x38\x25\xfe\xd6\x56\x45\xd7\
-\x90\xce\x68\x6e\xbc\x7b\xd8\xec\xe2\x8c\xa4\xb7\x76\xd6\x7c\xd0\
-\x1c\xd4\x64\x8b\xdf\x21\x33\x88\x70\x7f\xb3\x3f\xe4\x51\x34\x23\
-\x7d\x1a\x29\x6a\xb2\xf1\x90\xce\x18\x2e\x49\x4b\xd2\x5f\x59\x38\
-\x71\xf6\xc5\xa5\xe9\x7f\x28\xce\x4d\x9d\x8c\x29\xdd\xb2\x6c\x6f\
-\x5d\xb9\xc3\xf6\x37\xfc\x41\xc1\x26\xac\x1f\x08\xc0\x4f\x90\xfe\
-\x6c\x5c\x71\xce\x5d\x13\x8a\xfe\xd2\xec\x0d\xb9\x35\xca\x58\xbf\
-\x0c\xf7\xcc\x73\xfa\xa4\xeb\x4b\xf7\xd4\x7e\x5d\xef\x57\x88\x21\
-\x41\xe9\x11\x0e\x87\x30\x48\x4a\xb6\x68\xd8\xcd\xed\x3d\x8c\xe4\
-\xde\x18\x6b\x1f\x5f\x3c\xfe\xba\x5e\x59\x89\x0f\xb4\x04\x34\xdd\
-\x58\x46\x12\x8c\x89\x4f\xa5\x5a\x4e\x42\xcc\x84\x39\x45\xd9\xfe\
-\xf7\x76\x56\xae\x6c\x52\xb4\x63\x38\x91\x86\xd3\x44\x0c\x31\x16\
-\x89\x28\x9d\x12\x21\x2a\x65\xb8\x38\x35\x96\xbe\x77\xd1\xa8\x6b\
-\x46\x64\xc7\xdd\xe9\x09\xea\x7a\x20\xa8\xb0\x29\x3d\xd2\x86\x07\
-\x1c\xec\xa3\x2f\xf6\x37\x7a\x6c\x7f\xc3\x1f\x0e\x6c\xc2\xfa\x01\
-\xc0\x90\x82\x28\x63\xb8\x38\x25\x1e\xbd\x78\xde\x88\xdf\x53\x4a\
-\x87\x61\x8c\x4d\x23\x27\x5f\x48\x53\xb3\x63\x5d\x53\xe6\xf7\xcb\
-\xce\x5c\xba\xb7\x6e\x55\xad\x2f\xa4\x3a\x04\x45\xb9\x08\x2b\xa9\
-\x80\xef\x9f\xfe\x7f\x93\x4b\x16\x4e\x2b\xcd\x7d\xa2\x31\xa8\x61\
-\x97\x64\xee\x0c\x9a\x0b\x35\x83\xb5\xbc\xaa\x4e\x0b\x52\x63\x67\
-\x24\x38\xc8\x9e\xb7\x77\xd7\x6e\xc2\x16\xbf\x43\x1a\xc5\x9f\xc7\
-\x28\x83\xaa\x33\xda\x37\x2d\xde\xfd\xd1\x92\xb1\xf7\xf6\x4c\x88\
-\xb9\xb2\x39\xa0\xf8\x0c\x42\x25\x04\x6b\x94\xb2\xcc\xa9\xbd\xd3\
-\xb3\x5f\xd9\x5e\xb9\xac\xc1\xaf\x62\xa3\x8e\x36\x69\x9d\xfe\xb0\
-\x09\xeb\x07\x00\x16\x16\x86\xd8\xbb\x4b\x46\x2f\x29\x88\x77\x5d\
-\x19\xd2\xa9\x87\x84\x83\xed\x19\xa2\x10\xf2\x6b\x34\x90\x11\xeb\
-\x1c\x39\xab\x4f\x46\x9f\xb2\x06\xed\xab\x03\x2d\xfe\x00\x63\x94\
-\xb4\xe5\x12\x83\x91\xe9\x3b\x48\xef\x9d\xd2\xf7\xcc\xeb\xa6\xf4\
-\x7d\xae\x35\xa4\xc5\x38\xc3\x06\xa6\xa2\x7e\xcb\x14\xb5\xfc\x8a\
-\x8e\x47\xe6\xa5\x4c\x77\x12\xbc\xfe\x93\x03\x0d\x7b\x30\x94\xa7\
-\xad\xb4\x09\x96\xe9\x59\xbd\x73\x93\x5f\x38\x77\xe0\x03\x05\x89\
-\x71\xb3\x5a\x15\xad\xd9\x25\x11\x88\xea\x80\x88\xc6\x58\xd0\xcd\
-\xc8\x80\x51\x79\x89\x0d\x4f\x6e\xac\xd8\xca\xda\x49\xd3\xc6\xe9\
-\x01\x7b\xa7\xe5\x34\x07\x84\x6e\xa1\xbf\x9c\x50\x54\x3a\x2a\x2b\
-\xf1\xda\x80\xa6\x07\x24\x7c\x74\xb7\xcd\x90\x86\x9c\x04\xcb\xde\
-\x90\xd6\x9c\x13\xe7\x3a\x73\xd9\xa5\xe3\x1e\xb9\x77\x72\xdf\x6c\
-\x66\xae\xf6\x22\x07\x78\x04\x27\x43\x2c\x11\x84\xe6\xf7\xcf\xec\
-\x27\x51\x96\xc4\x28\x53\x23\xf5\x27\x23\x0d\xc6\x90\x2a\x11\x1c\
-\x3f\xbf\x5f\x6e\x3f\x39\x2c\x09\x45\xd5\x95\x9b\xf7\x23\x44\x7f\
-\x33\xb9\x24\x6b\xd9\xa5\xe3\xfe\x9e\x1d\xe7\x3a\xc3\xab\xa8\xcd\
-\x46\x19\x99\x50\x1e\xa3\x0e\x01\x5d\xf7\x8f\xca\x4e\xbd\xee\x97\
-\x13\xfa\x94\xa2\xa3\x61\x6a\x6c\x9c\xc6\xb0\x5f\xf0\x69\x0e\xae\
-\x71\x3a\x7f\x40\xee\x08\x59\x96\x73\x35\xca\xb4\xe3\x1c\x03\x61\
-\xa7\x50\x67\xb8\xa5\xa1\xb5\x79\xd8\x1d\x53\x7b\xff\xfb\xa6\x91\
-\x05\x69\xc6\x6a\xcd\xba\xbb\x87\x8e\xfa\x07\xea\x3a\x45\x78\xfa\
-\x33\x6b\xff\xbe\xa3\xde\xf3\xbb\x94\x18\xa7\x43\xd5\xe9\x71\x69\
-\xab\x3a\xd3\x52\x63\x1c\x8e\x1d\x75\x9e\xfb\xce\x7e\x76\xd5\x43\
-\x1a\x63\xd8\xd4\xd3\x47\x28\xab\x91\x97\x91\xe7\x8d\xa3\x7a\xa7\
-\xde\x39\xad\xcf\xbf\x1b\x5b\x9a\x86\x1a\x65\x92\xc2\x64\x75\x0c\
-\xb0\x79\xd4\x18\xd2\x1d\x0e\x29\x6f\x41\x69\xfe\x48\x64\x1b\x66\
-\xfd\x20\x60\x13\xd6\x69\x8e\x70\xe0\x05\x84\x67\x3e\xbb\xe6\xe9\
-\xf5\x87\x1b\x7e\x9b\x12\xe3\x88\x0b\x6a\xe6\x72\xef\x38\xdf\x3f\
-\x82\x11\x76\xcb\x84\xe9\x41\x47\xc5\xe7\x87\x3c\xad\x28\x82\xde\
-\x8a\xc3\x20\x07\x83\x5f\xaa\x7d\x21\x72\xf6\x73\xab\xef\xde\x5e\
-\xd7\xfa\xf7\x94\x18\xa7\xac\x52\x76\xe4\x5c\x42\x4a\x99\xe6\x8e\
-\x71\xc8\x5b\xea\x5a\x1f\x9f\xf1\xdc\xea\x3b\x6b\x7c\x21\x62\x3c\
-\x13\x8d\x58\x78\x5e\x9f\x1f\x6c\x6a\xd5\x02\xf2\x21\x97\x2c\x31\
-\x12\xf9\x3c\x7b\x3d\xa8\xe9\x52\x4a\xac\x1c\xb7\xa1\xaa\xf9\x9e\
-\x19\xcf\x7c\xf5\x5f\x30\x71\x68\xcb\x9f\xd1\xc6\x69\x00\x5b\x87\
-\xf5\x03\x00\xc1\x08\xf9\x55\x1d\xbf\xb6\xa3\x6a\xd3\xb4\xbe\x99\
-\xe5\x45\x19\x49\x53\xfd\x01\xd5\x41\x08\x56\xf1\xd1\x49\x8b\xaa\
-\x3a\x73\xc7\x3b\x49\xf5\x6f\xbe\xdc\xf7\xd3\x97\xb7\x1f\x6c\x31\
-\xc8\xa2\x2d\x93\x01\xf0\x3d\xc4\xad\x21\x0d\xbf\xb1\xb3\xfa\xbd\
-\x19\xbd\xd3\xfb\x65\xc6\xb9\x06\x6b\x61\xd2\x62\x44\x96\x64\xb9\
-\xc1\xfb\xf6\x94\xe7\xd6\x5c\x56\xee\x0d\x71\x13\x85\x36\xd3\x33\
-\xf2\xac\xf6\x06\xa9\x8e\xc9\xfa\xe9\xbd\x53\xce\x0e\xa8\x34\x49\
-\xc2\x58\xe3\x4e\xd2\x0c\x21\x4d\xa3\x34\x26\x25\x31\x41\xf9\xba\
-\xd2\x7b\xc7\xcc\xe7\xbf\x7c\xa3\x21\x00\x11\x1d\x6c\x09\xeb\xb4\
-\x87\x4d\x58\x3f\x00\xc0\x92\x0f\xfb\x54\x2a\xbf\xbf\xbd\x66\x67\
-\x6e\x6b\xe0\x9b\x01\xc5\x59\xe3\x99\xce\x92\x10\x42\x0a\xc6\x88\
-\xa8\x3a\x45\xc9\x89\x31\xec\xc9\xad\x95\xbf\xbc\x6d\xd9\xe6\xed\
-\x0e\x82\x25\x5d\x88\xc0\x60\x10\x09\x58\xb7\x1f\xc3\x0b\x06\xa1\
-\x39\x09\xc6\x2d\x21\x8d\x35\xed\xad\x7f\x77\xf1\xc8\x5e\x23\x7d\
-\x8c\x95\x20\x8a\x48\x52\x2c\x5e\xf1\xf3\x77\x37\x2e\x7c\xbf\xaa\
-\x35\x24\x83\xdb\x8e\x58\x2e\x63\xb5\x69\x75\x11\x62\x60\x2f\xf6\
-\x59\x79\xad\xa7\x20\x39\x6e\xff\xf8\x9e\xe9\x33\xfd\x41\x95\x49\
-\xa6\x68\x66\xac\x02\x59\x6c\xbc\x4b\xae\xbc\x65\xd9\xd6\x1b\x6f\
-\xfd\xb0\x6c\x55\x73\x30\x24\x4b\x04\x47\x34\x8b\xb0\x71\xfa\xc1\
-\x26\xac\x1f\x08\x60\x09\x47\xfd\xba\x2e\xbf\x52\xd1\x54\x51\xe7\
-\x0b\x7d\xb5\xa0\x7f\xf6\xa8\xa0\xce\x72\x18\x62\x3e\xb7\x4c\x92\
-\xb6\xd5\x79\x9f\xb8\x66\xe9\xb6\x57\x5a\x02\x0a\x41\xe8\xa8\x91\
-\x27\x31\xed\xc9\xc3\x76\x5c\x18\x63\xf3\x4f\x91\x1f\xf4\xb0\x3d\
-\x95\xb4\x39\xa0\xa8\x8d\x8a\xf6\xfe\x82\xbe\xd9\xb3\x63\x9c\x52\
-\xf3\x8d\xcb\xb6\x9e\xf3\xd0\xa6\xca\x66\x38\x85\xe7\x38\xb2\x32\
-\xbe\x8c\x34\xc3\x65\x13\x6d\xa9\xcc\x13\xa0\xc9\xc6\x9a\xd6\xf2\
-\x69\x05\x69\xee\x9c\x78\xd7\x78\x95\x32\x2f\x43\x28\x31\xc1\x25\
-\x97\x5d\xfb\xc1\x96\x1b\xff\xf1\x75\xf9\x6e\x9d\x69\x32\x42\x38\
-\xd2\xc9\xf7\x36\x6c\xd8\xe8\x46\xc0\x51\x74\x3f\x26\x51\x38\x25\
-\x62\x4e\x54\x3f\x19\x51\x90\xc9\xee\x99\xf7\x8c\xff\xf6\x99\x87\
-\x43\xbf\x9c\xfd\xdf\xfe\xe9\xf1\x8e\xf0\xb3\x47\x15\xed\x0e\x29\
-\xfc\xff\xcb\x87\xe4\xe6\x6c\xbe\x7a\xf2\x85\xfd\xd3\xe2\x11\x37\
-\x57\xb0\xa6\x0d\x21\x95\xd1\xcf\xc7\x15\xf5\xbd\x7d\x5c\xef\xfe\
-\x08\xa4\x25\xeb\x7d\xe0\x2f\x48\x06\x25\x24\xa3\x4d\xb3\x86\xcc\
-\xfd\xf5\xd4\x7e\xa5\xf0\xbc\xe0\x2b\x18\xf6\x4d\x34\xca\x14\xfa\
-\xd5\xec\xff\xfa\x6f\x9f\x59\xc9\x7e\x3d\xf7\xe9\x1f\x8f\x28\x48\
-\x47\x61\xa3\x52\x29\x92\x0f\x24\x06\x69\x10\xd9\x3b\x86\x36\x6c\
-\x74\x0b\xf0\x51\x8c\xcd\xe3\xb6\xa2\xdc\xe4\x90\xc2\x44\x72\xe5\
-\xf0\x9e\x89\xec\xf7\x0b\xef\xbf\x65\x54\xef\x81\xc8\x24\x13\x22\
-\x92\x86\x99\x4e\x9f\x94\x38\xb4\xe7\xfa\x33\xfe\x8f\xdd\x73\x6e\
-\x45\xf9\xcd\x67\xdf\xda\x3f\x3d\x01\x45\x23\x2d\x70\x50\xc6\xf0\
-\xfb\x71\xa4\xc1\xc9\x6a\x40\x46\x2c\xaa\xfc\xe9\x9c\x4b\xd8\xaf\
-\xe7\xed\x61\xbf\x5d\xf0\xea\xff\x0c\xeb\x6f\x26\xea\x14\xce\x7d\
-\xe6\xcf\xdf\x3a\xba\x70\x20\xbb\x6f\xe1\x7d\x57\x8e\x28\x4c\x0c\
-\x97\x9d\x44\x5c\x19\x1c\x21\xab\xe3\xdb\xc2\xc6\x69\x02\xfb\x85\
-\x9e\x5e\xc0\x0e\x49\x66\x1f\x2c\x39\x63\xc4\x3d\x2b\xd6\x55\xad\
-\x3c\xd4\x5c\x69\x2c\xc7\x18\x65\xba\x1e\xe1\x66\x09\x63\xc2\x30\
-\x62\xc5\xe9\x09\x6c\x6f\xbd\xc7\x58\xf2\x1d\xf1\x13\x04\xeb\x78\
-\xd2\x2f\x2d\x81\x2e\xbf\x64\xfc\x4f\x73\xe3\xe4\x6b\x1b\xfd\x4a\
-\x63\x4a\xac\x33\xbd\x2e\xa0\x3e\x77\xf6\xb3\xab\xee\xdd\x5a\xe7\
-\x31\x5d\x6b\xac\x6b\x32\x4e\x5a\x1a\x65\xba\xe5\xba\x71\x0d\x0d\
-\xc8\x4c\x64\x1f\x5d\x3a\xee\xe6\x4c\x17\xb9\xb6\x29\xa0\x35\xc7\
-\x3b\xe5\xe4\x1a\x5f\xf0\xdd\xe9\xcf\xaf\xbb\x6d\x57\xa3\x97\x10\
-\xc1\xaf\x10\x63\xf3\x78\x31\x54\x94\x9e\xc0\xf6\xd4\x7b\x31\x62\
-\x14\xeb\x11\xa2\x9b\x9a\x96\xee\x0c\x49\x0c\x31\xfd\xd1\x73\x27\
-\xf4\x1b\xe4\x69\x4a\x9f\xfc\xc9\xf6\x95\xba\xb9\x7e\xb5\xd7\x8c\
-\xa7\x0b\x6c\x1d\xd6\x69\x02\xf0\x2c\x66\x17\xf6\xcf\xce\xb8\x7d\
-\x72\xaf\x27\xcf\x2b\xce\x3a\x33\x25\x16\xaf\xfd\x70\x6f\x63\x23\
-\xe8\xdc\x8f\x1b\xb5\x0c\x1c\x90\xeb\xbd\x21\x6c\xda\x04\x08\x3b\
-\x82\xc6\xf2\x8c\x32\x44\x1f\x98\x31\x70\xf6\x94\x5e\xa9\x77\x34\
-\x79\x15\x4f\x8c\x53\x92\x02\x2a\xf5\xa7\xb8\xe4\x31\x0b\xfb\xe5\
-\x65\x2d\xdd\x5b\xfb\x69\x8d\x2f\x84\xac\x5e\xcd\x46\x3a\xd6\xdd\
-\xc5\x23\x64\x95\x91\xc0\x96\x5f\x36\xfe\x8e\x2c\xa7\x74\x8d\x47\
-\xa1\x2d\x6e\x89\x10\x55\x67\xc1\x8c\xf8\x98\x21\xf3\x8b\x53\xd5\
-\xa5\xeb\xcb\xbf\xae\x67\xc8\x10\xf3\x8e\x94\xd7\x28\x5c\xbd\x37\
-\x64\xc8\x5e\xd1\xc8\x0a\x33\xc4\x4c\xcb\xfb\x47\x66\x0e\x1a\x73\
-\xed\xc8\xdc\xbf\xf7\xe8\x95\x32\x79\x47\x7d\xeb\x3b\x5b\x6b\xbd\
-\x01\x6b\xf9\x6c\x74\x5f\xd8\x84\x75\x1a\x00\x83\x34\xd4\x27\x35\
-\x8d\x3d\x35\x67\xe8\xad\x6e\xac\x8f\xc5\x0c\x27\x4e\x2b\xc9\x99\
-\xd3\xd3\xed\x28\xdf\xba\xa7\x76\x6f\x23\x46\x44\x8a\xe0\x6f\x07\
-\x0e\xc8\x4c\xa7\x62\xd4\x50\x44\x0c\x62\xf8\xfd\xb4\xbe\x25\x37\
-\x8d\x28\x7c\xb0\xd9\x1b\x22\x4e\x99\x98\x71\xfd\x4c\x0b\x73\x8d\
-\xfa\x92\xdd\x8e\x51\x0b\x07\xe6\x66\x2f\xdb\x53\xbb\xa2\xda\x17\
-\xa2\x10\x5d\x34\x22\x20\xa2\x83\x41\x56\x68\xf9\xa5\xe3\xef\xc8\
-\x72\xc9\x57\x79\x14\xbd\xd1\x01\x92\x98\xf1\xac\x4f\xd1\x43\xd9\
-\xf1\x31\x63\xe3\x25\x69\xfb\x5b\x07\xea\x0f\x60\xe1\xd8\x30\x83\
-\xb9\x8c\x32\x5a\x25\x39\x0c\xd2\x9c\xce\x18\x1e\x95\x93\x41\x97\
-\x5d\x3c\xf5\xe2\x73\xfa\x24\xdd\xdf\xea\x53\x65\xc4\x50\xca\xe8\
-\xd4\x04\xc7\xfb\xdf\x94\xaf\xac\xb7\x8f\x09\x3b\x6d\x60\x13\xd6\
-\x69\x00\x29\xec\x50\x4c\xff\xf7\xcc\x01\xc3\xa6\x17\x67\xfc\xd2\
-\x17\x50\x0c\x91\x29\x14\x08\x6a\x31\xe3\xf2\xd3\x66\x5f\xd8\x3f\
-\x8b\x7d\x5c\xdd\xbc\xae\xaa\x35\x64\xea\x9d\xac\xa2\x96\x28\x7d\
-\x70\x13\x83\x41\x99\x09\xc9\x4f\xcd\x19\xfa\xa0\xa2\xea\xf9\x98\
-\xe0\xa0\x78\x2c\x97\x91\x5f\xd0\x20\x2d\x97\x63\xc4\x05\xa5\xb9\
-\xf9\x2b\x0e\xd4\xaf\x3c\xec\x09\xaa\x91\x48\x0b\x96\x96\x68\x78\
-\x4e\xb2\xf4\xe1\xa5\xe3\xef\xca\x74\x4a\x97\x7b\x14\xbd\xc9\x71\
-\x54\xd7\x85\x40\xdf\xc5\xbc\x1a\x95\xc6\xf5\xcd\x1d\x5b\xd1\x1c\
-\x58\xb9\xa1\xba\xa5\x51\x26\x47\x9d\xb0\x8f\x73\xbc\x06\x29\x50\
-\xa3\x8c\x0e\xcf\x4e\x72\x2d\xbd\x68\xd4\x5d\xbd\x92\xe5\x1b\x5a\
-\x83\x5a\xc0\x21\x61\x4d\xd1\xa9\x96\x93\x1c\x5b\x2a\x13\xba\xe6\
-\xfd\x03\x8d\xd5\x52\x07\x0e\x7b\xb5\xd1\xf5\x61\xef\xa4\x74\x73\
-\x80\xf4\x42\xfb\xa7\xc7\xa3\x45\xfd\x52\xaf\xf3\x78\xfd\x0e\x87\
-\x44\x28\xc1\x48\x76\x10\x1c\x6a\x08\x2a\x9e\xe4\xf4\xc4\x9b\x3e\
-\x5a\x3c\xe6\x4f\x23\x72\x92\xe3\x0d\x29\x05\xb7\x19\xac\x2f\x4c\
-\x22\x73\xfb\xe6\xf6\x73\xc5\xba\x4a\x03\x9a\x1e\xc2\x11\xfa\x89\
-\x93\x60\xd2\x1a\x50\x3c\x59\x09\xee\xc9\xa5\x59\x09\x99\x08\x0c\
-\x54\x8f\x2f\x5f\x38\xbd\x81\x19\x09\x49\x59\x2e\x69\x6a\x4b\x50\
-\x0b\x38\xc9\x31\xa7\xe5\x70\x60\x46\x59\x10\x21\xd6\x33\x2b\xde\
-\x61\xee\x1a\x46\xf3\x65\xe4\xf7\x1b\x64\xf5\xe0\xcc\x31\x79\x2b\
-\x2e\x9b\xf8\xaf\x38\x07\x5e\xd4\xe4\x57\x0d\xa9\xcd\x34\x3b\x73\
-\x10\xac\x7b\x14\xcd\xb5\x78\x6c\x9f\x6b\x0c\xc9\xce\x68\xa3\x68\
-\x91\x55\x6d\x74\x1f\xd8\x12\x56\x37\x07\x0f\xd7\x72\xcf\xa4\xe2\
-\x39\x53\x0a\x32\xae\x08\x6a\xba\x1f\x22\x31\x20\x1e\xe9\x53\x55\
-\x75\xbf\x4b\x96\x07\x5d\x3e\x24\x7f\x74\x66\xbc\x63\xdd\x07\x7b\
-\xea\x5a\xa2\x91\x01\x28\xdd\xc9\xa6\xea\xd6\x43\x53\xf3\x53\x2b\
-\x4a\x32\xe2\x67\xf8\x43\x1a\x93\xc8\x31\xe7\x08\x1a\x4b\x48\x9c\
-\x1c\xef\x76\xaf\x69\x6a\xfd\xf9\xcd\xef\x6f\xf9\x86\x51\x33\xd4\
-\x4c\xc4\x90\x34\x86\x24\xb4\xb1\xba\xc5\x9f\x1e\xe7\xde\x31\xa5\
-\x24\x6b\xae\xcf\xaf\x60\xc9\x72\x74\x98\xaa\x53\x94\x9a\xe0\x4a\
-\x5e\x7d\xa8\xfe\xc1\x9b\x3f\xd8\xf6\x5c\x48\xa7\xa6\x13\x74\xc4\
-\x3a\x87\x1d\xa4\xd9\x23\xb3\x06\x0c\xbf\x69\x4c\xc1\x23\xa1\xa0\
-\x5a\x42\x19\x6a\x75\x4a\xd8\x21\xa4\x49\x74\xca\x42\x29\x4e\x47\
-\x6f\x82\xc9\xc1\xf7\xf6\xd4\xec\xb6\x86\xb6\xb1\xd1\xfd\x60\x13\
-\x56\x37\x87\x31\x00\x1d\x12\x41\x8f\x9f\x3b\xec\x01\x27\x62\x59\
-\x94\xb1\x00\xc6\xc7\xd8\x3e\x61\x42\xb0\xa4\x53\xe6\xa7\x94\xe5\
-\x4f\x2d\xc9\x9d\xee\x0b\x6a\x1f\x7e\x55\xd1\xe8\x89\xa6\x8c\xc6\
-\xd8\x3c\x7b\x50\x7a\xbd\xac\xaa\x6c\x4a\x8f\x94\xaa\x3e\x19\x09\
-\x67\xf9\x8d\x0b\x40\x32\x86\xb4\x12\xe3\x20\xc9\xdf\x54\x37\xff\
-\x7d\xee\xb3\xeb\x5e\xf4\x86\x34\x43\xb8\x8a\xae\xd7\x06\x12\xdc\
-\x50\xd5\x72\x78\x72\x8f\x94\x60\xcf\xd4\xf8\x33\x15\x55\x0f\x82\
-\xad\x95\x49\x56\xc9\x71\xae\xc4\xd5\x87\x9b\xfe\x3a\xeb\xf9\xb5\
-\xff\x6c\x0e\x69\x51\xf7\xf6\xf8\x32\xf1\xf6\x71\x45\x7d\x7f\x35\
-\x65\xc0\x7f\xea\x9b\xfd\xf1\xb2\x44\xfc\x12\x31\xc9\xea\x18\x50\
-\x86\x74\x82\x50\x72\xaf\xd4\xb8\x94\xbf\xad\xdd\xff\xba\x6e\x5b\
-\x98\x76\x7b\xd8\x4b\xc2\xee\x0f\x73\xf7\xed\x3f\x1b\x0f\xfd\x81\
-\x62\x5c\x2e\x11\x9c\x62\x35\x27\x30\x60\x90\x96\x2c\x11\xe4\xf1\
-\x05\x76\xbf\xb3\xab\xba\x16\xb5\xe3\xd8\x2c\x13\xac\x37\x87\x54\
-\xc7\xcc\x17\xd6\xbc\xf1\xc5\x81\xba\xbb\x92\xe3\xcd\x68\x0c\x86\
-\x84\xa2\x3a\x25\x92\xa4\x61\x69\xe9\xc2\xd7\x36\x3c\x52\xeb\x0b\
-\x4a\x12\x16\xad\xe2\xc3\x65\x02\x3b\xb0\x70\x7a\x70\xc4\x57\x8d\
-\x2f\x24\x5d\xf8\xdc\xda\xff\x2a\xd5\x2d\xaf\xc8\x4e\x39\x89\x31\
-\xa6\x01\x59\x25\xac\x3c\xd8\xf0\xa7\x19\xcf\xad\xfe\x67\x73\x48\
-\x35\x0f\xa2\x68\xc3\x41\xda\xfc\xe5\xed\x5d\xd5\x7b\x3c\xc1\xe0\
-\xba\x58\x87\xec\xc0\xf8\xb8\x89\x97\x19\xcb\xc5\x58\x97\x23\x4d\
-\x76\x4a\x5f\xdd\xb0\x74\xf3\xdd\x46\x3e\xc4\x8e\x00\xdf\xed\x61\
-\x4b\x58\xa7\x01\x8c\x81\xf8\xd1\xbe\xba\xc3\x7b\x1b\xbd\x1f\x2d\
-\x1e\xd4\xb3\x50\x22\x78\x40\x48\x33\x25\x18\xbe\xec\x62\x94\x32\
-\x29\xde\xed\x08\xfd\xfc\x93\xb2\x5f\xbe\xbf\xbb\xa6\x96\x60\x43\
-\x52\x61\x60\x73\x85\xf0\x31\xac\xc3\xcf\x27\x24\x98\x86\x74\xea\
-\x78\xa5\xac\x7a\xfb\x84\x82\xb4\x9a\xbe\x19\x09\x67\x7a\x82\x5a\
-\x4c\x8c\x93\xec\xbb\x79\xf9\x96\xdb\x3e\xde\xdf\xe0\x73\x10\x8c\
-\x35\x41\x16\x62\x98\x87\xcb\x0a\xc7\xcc\x3a\x72\x3d\x6c\xf0\x89\
-\x1a\x55\x0d\xd7\x06\x95\x75\x0b\x06\xe7\x8f\xf6\x05\xb5\x82\x94\
-\x78\x97\xf3\xab\x43\x8d\x7f\x9b\xf5\xe2\xda\xc7\x3c\x8a\x26\x4b\
-\x18\xeb\xd6\xdd\x40\x12\x3e\x84\x02\xf3\xe8\xa4\x46\xd9\xeb\xfd\
-\x0a\xf5\xaa\xda\xbe\xb9\x25\x39\xb3\x43\xaa\x2e\x0b\x75\xa5\x8a\
-\x4e\xe5\xe4\x58\x67\xdc\x96\xba\xd6\x67\x7e\xbc\x74\xcb\xaf\xde\
-\x2c\xab\xae\x0b\x6f\x26\xd8\x12\x56\x77\x87\x4d\x58\xa7\x01\x8c\
-\x51\xe8\x96\x25\x79\x63\x4d\xab\x67\x73\xad\xb6\xac\x34\x3d\x0e\
-\x17\x24\xbb\xc6\xfa\x54\x8a\xa4\x70\x18\x76\x96\xe0\x92\x13\x37\
-\xd4\x7a\x9e\xb8\xe6\xbd\xcd\xef\x52\xc6\x24\x1e\x5e\x86\x84\x0f\
-\x95\x30\xc9\xc0\xea\xce\x03\xfa\x27\x93\xb4\x5e\xdb\x51\xbd\x6d\
-\x5c\x6e\x4a\xf3\x80\xe2\xf4\x51\x8f\x7c\xb9\xfb\x67\xbf\xff\x62\
-\xef\x1e\x87\x84\x25\x15\x7c\x04\xa5\xb0\x54\x44\x46\x16\xa6\xb0\
-\x0f\x16\x8e\xbe\xfe\xca\x91\x79\x63\xd6\x57\x35\xaf\xad\xf2\x28\
-\x44\x82\x8d\x49\x83\x87\x64\x82\xa5\xaf\x6b\x3d\xc1\xca\xd6\xc0\
-\x96\x0b\x47\x15\xce\x5a\xb9\xb7\xf6\x89\xd9\x2f\xae\xfd\x47\x24\
-\xb2\xe2\x96\xeb\x26\x51\x31\xf3\xb8\x7b\xbe\x0b\x69\x2a\xd6\x37\
-\x54\xb5\xd4\xce\x2e\xc9\x8e\x2d\x4c\x74\x4f\x0c\xe9\x34\x60\xea\
-\xed\x11\x8b\x4d\x4e\x8e\x0f\x7d\xbc\xaf\xe6\x9e\x19\xcf\xad\x79\
-\x7c\x6b\x4d\x2b\x73\x4a\xe4\x38\xc7\x6b\x1b\xdd\x13\x36\x61\x9d\
-\x26\x30\x06\xa4\x53\x22\xd2\xb6\xba\x46\xf4\xec\xd6\x43\x5f\x8d\
-\xca\x49\xdd\x5f\x9a\x9d\x38\x21\xa8\xea\xb1\x9a\xce\x48\xac\x53\
-\xde\x77\xd7\x8a\x5d\xbf\x5e\x5f\xd5\xac\xf0\x93\x20\x38\x19\xf4\
-\x4f\x8b\xcf\x3b\x67\x60\x56\xe2\xf6\x5a\x6f\xab\x4e\xd9\x31\xe1\
-\xd1\xb9\xa4\x15\xd0\x74\x69\xd9\xde\xda\xed\xb1\x3a\x5d\xfe\x7f\
-\xab\xf7\x96\xb5\x84\x74\xc4\x95\xe2\x38\x1c\xee\x53\x72\x31\x44\
-\x57\x4c\x1f\x78\x51\x49\x51\xc6\x4f\xf3\x9c\xf2\xc8\xb3\x8b\x7b\
-\xb7\x3e\xb6\xfe\xc0\x66\x95\xea\x47\x4c\xc0\x4c\xe2\x41\x88\xec\
-\x6a\xf2\x37\xc4\x13\xe9\x93\x9b\x97\x6d\x5d\x51\x1f\x50\x99\x91\
-\xc7\x71\x64\x05\xfa\xaa\xa1\x59\x49\xd9\xd3\x0a\xd2\x52\xb7\xd6\
-\x79\x5a\x84\x78\xf1\x46\x9d\x91\xaa\xe8\xdb\xe7\xf7\xcb\x9e\xea\
-\x55\xf4\x54\xa7\x4c\x62\xb1\xc4\xca\x9f\x5a\xdf\x70\xd3\x35\x4b\
-\x37\x7e\xde\x1a\x54\x1c\x2e\x89\x18\x12\x97\x4d\x56\x36\x6c\x7c\
-\x5f\x30\x18\xc5\x58\x8a\x45\xda\xa6\x97\xc2\x81\x15\x48\x12\xc6\
-\xe8\x2f\xfd\x73\xfa\x34\xde\x31\xeb\x15\x76\xdf\x82\xfd\x7f\x9b\
-\x39\x70\x1a\x12\x0e\x40\xe5\x7e\x82\xa5\x19\x89\xe8\xf0\xcd\x67\
-\x3d\xc6\x1e\x58\xb0\xe2\x5f\xf3\x87\x95\xc0\x6f\x52\x24\x6d\x8f\
-\x20\x81\x1d\xf9\x15\x83\x5d\x96\xf1\xff\x7f\x9c\x33\x78\x3e\xbb\
-\x6b\xee\xd6\x96\x9f\xcd\xf8\xba\xe5\xb6\x19\xeb\xd8\x9d\xb3\xb6\
-\xfe\xf3\x9c\x81\x0b\xa0\x5c\xc7\x58\x3d\xf0\x3f\x48\x84\xed\x4a\
-\x33\x68\x3b\x6c\x1c\x3c\x36\x77\x42\x7e\xf0\x97\xf3\xde\xd1\xee\
-\x9a\xf3\xf2\xb0\xec\x24\x17\xa4\x85\xc5\xba\x3c\x34\xa3\xf4\x6c\
-\x76\xff\x82\xfd\xfe\x5f\xcd\xfe\xdb\xf9\xfd\xb2\x93\x51\x84\xc3\
-\x5b\x85\xb6\x8b\xe8\x03\x69\xa3\x7b\xc0\x96\xb0\xba\x21\x70\x38\
-\xa4\x8b\xa9\x23\x92\x0d\x29\x49\xf8\x8d\x2f\x99\x74\x82\xc9\xd2\
-\x3a\x4f\xc3\xce\x7a\xef\x67\x7e\x7f\x70\xff\x6f\x3f\xdf\xf5\x81\
-\x57\x31\xf7\xc9\xb8\x7e\x89\xc8\x44\x66\x5f\x5c\x79\xd6\x65\x05\
-\x09\x64\x49\x63\x43\xc0\x39\xa9\x30\xfd\x9c\x9e\x49\xee\xb2\x37\
-\x77\x56\x1f\x34\x09\xc3\x62\x18\x0f\x01\xfb\x8e\x51\xd6\x63\x84\
-\x24\x8a\x10\xfd\xc7\xcc\xd2\x33\xae\x1d\xd3\xfb\x3e\x8f\x5f\xd1\
-\x8d\x65\xa4\xc1\x09\x21\x9d\xb1\x09\xbd\x33\xa6\x66\xc7\x38\x77\
-\xbd\xb3\xbb\x66\x1f\x18\x9f\x32\x31\x2d\x6b\xac\x64\x1c\x36\xd5\
-\x90\x28\x63\xfa\xe3\xb3\x07\x0f\xbc\x7a\x54\xfe\x3f\xfd\xfe\x40\
-\x1e\xc1\x38\x67\x5a\x71\x06\xf9\xd7\xd7\xe5\xab\x75\xc6\xc2\x47\
-\xd5\x43\x5d\xbe\xa9\x6e\xad\x4c\x73\x93\x9d\x0f\x7c\xbd\xef\xdf\
-\xaf\x6d\xa9\xf2\x38\x24\x72\x5c\xcc\x19\x71\x79\x69\x9f\x63\xd8\
-\x7d\x61\x13\x56\x37\x02\x5f\xab\xf5\xcf\xc8\x94\x2e\x1b\x92\xdb\
-\x97\x39\x42\x4d\x07\x9b\x54\x6a\x48\x13\x56\x1b\x28\xd3\xe5\x06\
-\x23\xbc\xbd\xde\xeb\x7b\x7b\x57\xcd\x56\x83\xac\xf8\x6f\x60\x08\
-\x4a\xff\x36\xaf\xb4\xff\xcc\xfc\xf8\xdf\x7b\x55\xca\x9c\x32\x51\
-\x02\x21\x35\x6e\x6c\xcf\xb4\x73\x0a\x93\x62\x2a\xdf\xdc\x59\x5d\
-\x86\x23\xf8\x20\x5a\xc8\xca\xb4\xb0\xff\xc7\xcc\xd2\x61\xd7\x8e\
-\xe9\xfd\xd7\x16\xaf\x22\x4b\x04\xf3\xc3\x28\x4c\x8f\xa1\x40\x48\
-\x23\x13\x7b\xa7\x9f\x91\x15\xeb\xdc\xf0\xde\xee\xda\x4a\xf1\xc4\
-\x9c\x48\xd6\xeb\x9c\xac\x9e\x9c\x33\x74\xd2\x55\x23\x0b\x1e\x6e\
-\xf1\x84\x52\x64\x42\x02\xaa\x4e\xb5\xfc\x58\xd7\xf0\xa4\x18\xc7\
-\x86\x0f\xf6\xd6\x55\x88\xae\x3b\x5e\x55\xd7\xde\x2a\xab\xd9\xb5\
-\xa3\xca\xa3\x99\xfe\x86\x16\xb2\x32\xc4\x45\x62\xba\xf0\x20\x36\
-\x3e\x2f\x25\xf9\xac\xa2\xec\xdc\xcd\x0d\xfe\x26\x46\x23\xb9\x84\
-\xdb\xe8\xca\xb0\x09\xab\x1b\x01\x13\x62\x06\x44\xbf\xbf\x34\xb7\
-\xd7\x2f\x16\x0e\xbd\x73\x5e\x51\x46\x6e\xe0\x60\xcb\xae\x4d\xcd\
-\xfe\xa0\x86\x8d\x5f\x2d\xd1\x40\x61\xc9\x25\x09\x2e\x2e\x40\x7a\
-\x6c\x78\x6e\x32\xfe\xe7\xac\xc1\xf7\xa9\x0a\xeb\x83\x30\x0a\x00\
-\x39\xe9\x81\x90\x4e\xc6\x16\xa6\xcf\x28\x4c\x88\x69\x7e\x73\x57\
-\xf5\xe6\x68\x07\xdc\x70\x67\xeb\xdb\xc6\xf5\x2e\xbc\xf3\xcc\x01\
-\x8f\x37\xb5\x04\x63\x1d\x12\x51\xac\xc7\x7c\x19\x69\xfa\x82\xaa\
-\x6b\x52\x49\xf6\x59\xfe\xa0\xf6\xe9\x97\x87\x1a\x9b\x44\x97\x9b\
-\x63\xea\x07\x27\xe6\x3c\x35\x6f\xe8\xac\x2b\x87\x17\xfc\xa9\xd5\
-\xab\x38\x65\x82\x43\xb0\x0a\xa4\x1a\x65\xae\x31\xf9\x29\x25\x4b\
-\xf7\xd6\xbe\x57\xe9\x09\x29\xa2\x2b\x10\x2c\x01\x8f\x8b\x3c\x0a\
-\x61\x99\x4d\x62\x7d\xe6\xec\xa1\xbd\xee\x3b\xab\xef\x4d\x0b\xa7\
-\x0c\x1e\x7b\x40\x8f\xff\x6c\xe3\x9e\x72\x5d\x96\x08\xb2\xcd\xb3\
-\xba\x0f\x6c\x3b\xac\x6e\x04\x4a\x29\x72\x60\x8c\xce\x18\x9c\x31\
-\xcd\x53\xdf\x4a\x5c\xba\x34\xea\x91\x4b\xc7\xdc\xf5\xe4\xbc\x21\
-\x83\xc3\x67\x3e\x84\x1d\x89\x45\x86\x31\x06\x30\xdf\x21\xc3\x61\
-\x12\x23\x32\x42\xe8\xa5\x51\xbd\xae\xc2\x1a\x9a\xa0\x51\xea\x11\
-\xfc\x04\xb1\x4c\xb0\xee\xf1\x86\x42\x17\x0f\xcc\xb9\xab\xfc\xe6\
-\x73\xaf\x9d\x58\x94\x73\x84\xe8\x44\xf0\x31\xbe\xb3\xde\x5b\xcf\
-\x82\xea\x4e\x87\x44\x5c\x2c\xca\x89\xd1\xc6\x6f\x7a\x48\xdd\x55\
-\x56\xef\xad\x47\x60\xec\x6a\xbd\x8f\x5b\xaf\x3f\x31\x67\xe8\x45\
-\x57\x0c\x2f\xb8\xbf\xc5\x1b\x42\x82\xb4\x66\x4a\x73\x3a\x63\x3e\
-\xc2\xf0\xc0\x67\xce\x1f\x7a\xbd\x44\xc2\x3e\x8a\xbc\x54\x46\x1d\
-\x2d\xd2\x9f\x49\x62\xc6\xd2\x70\x60\x66\x02\x7a\xe3\x82\x91\xb3\
-\x2f\x99\x90\xff\xcb\x20\x62\x59\xb4\xa6\x3a\x63\x1c\xae\x1d\x17\
-\x6e\x53\x66\x8f\x81\x6e\x04\xfb\x65\x75\x13\x80\xa2\x98\x2d\x1a\
-\x98\x97\xdf\x2b\x3f\x6d\xb8\xae\xb3\x10\x61\x2c\xd0\xa4\xea\xa9\
-\x0b\x07\xe5\xfd\x74\xf7\x4d\x67\x2d\x9a\xd4\x2b\xc3\x41\x91\xcc\
-\x24\x8c\xa2\x9b\x48\x32\xc6\x24\x99\xa0\xf8\xbe\x39\xc5\x92\x4c\
-\xdc\x11\x0e\x20\xc5\x04\x23\xdd\xab\x50\xa5\x20\x1d\x5d\x75\x4e\
-\x3c\xc9\x43\x82\x8f\x21\x87\xce\x18\x33\xc8\xf1\x9d\xdd\xb5\xde\
-\xc5\x6f\x6c\xb8\x35\xd6\xed\xd8\x40\x08\x49\x36\x96\x73\x42\x56\
-\xba\x4c\x70\x52\x6c\x8c\xbc\x65\xc9\xeb\x1b\x6e\x7d\x67\x57\xb5\
-\xc7\x3c\x32\xdf\xaa\x5f\x0a\x9b\x2b\xb0\xd4\x38\x97\xeb\xc2\xa1\
-\xf9\x3f\x09\xf8\x14\x02\x64\x65\xa9\x85\x69\x83\xe1\x4a\x73\xba\
-\x8a\x65\xcc\xcf\xa4\x38\x1e\x20\x79\x11\x19\x49\xf4\xba\x21\x7d\
-\xd2\x3f\xbb\x62\xfc\xad\xf3\xfa\x66\x2f\x6e\xf6\x2a\xc8\x41\xb0\
-\xe2\xd7\x19\x5d\x3c\xa4\xf0\x8c\xc1\x59\x89\x32\xb5\x7d\x0c\xbb\
-\x15\xec\x25\x61\x37\x01\x65\xe1\xd5\xdc\xb3\xf3\x87\xce\x49\x73\
-\x39\x4a\x55\x4a\x43\xd8\x58\x06\x22\xa4\x2b\x3a\xd5\xd3\x9d\x64\
-\xf0\xe5\xa3\x4b\x4a\xfb\x0d\x1e\xbc\xef\xd5\xd5\x5b\x5a\x50\x14\
-\x0f\x67\x23\x11\x8d\x32\xb4\xb7\xaa\xe5\xe3\x85\xa9\xb1\x0e\x47\
-\x7a\xfc\x04\x55\xd1\x15\x7c\xd4\xf0\xd2\x74\x14\x4e\x74\xc9\x89\
-\x2b\xf6\xd5\xde\x7f\xcd\xf2\x1d\x5f\xaa\x28\xb2\x9f\x20\x3f\x35\
-\x67\x4b\xad\x27\xb4\xad\xd6\xf3\xc5\xe2\x81\xf9\xe3\x34\x4a\x73\
-\x11\x42\x41\x93\x5d\x31\x8e\x77\xb8\xe4\x03\x17\xbd\xf2\xf5\x35\
-\xaf\xec\xa8\xaa\x87\x50\x30\x91\xa4\x2b\xb3\x68\x01\x4d\xd7\xa6\
-\xf6\x4c\x6b\xec\x97\x1c\x37\x23\xa8\x53\x45\xb0\x4c\x67\x94\x31\
-\xe6\x92\x71\x1a\x75\x90\xd7\x2f\x7e\x63\xfd\xcf\x77\xd4\xfb\xb4\
-\x48\xd1\x21\xf0\x51\x83\x55\xf6\xdc\x79\x43\xc7\xfe\xfc\xac\x7e\
-\x37\xaa\xa1\x50\xcf\xa0\xaa\xfb\xa5\xf0\xd6\x24\xd6\x28\x53\x93\
-\xdd\x8e\x0c\xa7\x24\x1d\x7a\x7b\x57\x75\xa5\xed\x63\xd8\x7d\x60\
-\x13\x56\x37\x00\xd7\x17\x2d\x19\x94\x9b\x7a\xed\xc8\xc2\x25\xad\
-\x41\x95\x08\xce\xc3\x06\x35\x61\x8d\xa1\xa0\x16\x0c\x66\x8c\x4c\
-\x50\xc6\xf7\x4f\x4f\x50\x5f\xdd\x5e\xb5\x07\x45\x08\x89\xc0\x47\
-\xe5\xae\x26\x1f\x79\x78\xf3\xa1\x2f\x87\x64\x27\x35\x0f\xcc\x4d\
-\x99\x16\x08\x6a\x94\x10\xac\x33\x84\xa8\x4c\x48\x52\x10\xa1\x4f\
-\xce\x7a\x66\xf5\x7d\x8d\x0a\xf8\xf5\xa1\x23\x07\x45\x60\xf1\xc0\
-\x08\xb0\xd3\x22\xdb\xea\x3c\xbe\x1d\x8d\x9e\x35\x17\x0f\xee\x31\
-\x23\xa4\xe8\x71\x2a\x43\x24\x29\xc6\xe9\xf9\xd3\x1b\xdf\x5c\xfb\
-\xf0\x8e\xaa\x72\x27\xc1\x44\x15\x8c\x37\x21\x40\xd5\x11\x5b\x07\
-\x53\xb5\xc6\x10\xfe\x64\x7f\xdd\xce\xab\x46\x15\x14\xb9\x10\x19\
-\x44\x91\xa9\x5b\xc3\x94\x31\xec\x72\x4a\xc9\x18\xc7\x3f\xb1\xe8\
-\xf5\xaf\x7f\xf3\xce\xce\x6a\x2d\x92\xe5\xba\xa9\xe8\x42\x08\x9d\
-\x59\x98\x14\xff\xd9\xe5\xe3\x2e\x19\x99\x9f\x7a\x41\xab\xd7\x4f\
-\x24\x4c\x82\x44\x38\xed\xda\xe0\x39\x55\xa3\x52\xff\x8c\x84\xb8\
-\x77\x77\xd7\x7d\x55\xe3\x0b\x1e\x6b\x7c\x66\xa3\xcb\xc2\x5e\x12\
-\x76\x0f\x98\xc3\x3a\x3d\x21\xae\x04\xc5\xba\xf2\x14\x5d\x3f\x4e\
-\x0f\x64\x9a\x2e\x11\x12\xf0\x04\x99\x6b\x76\xff\xdc\x99\xd9\x89\
-\x31\x4e\xf8\x21\xf2\x7a\x07\x63\xda\x44\x19\x39\xff\xe5\xaf\x9f\
-\x59\xba\xbb\xf2\x67\x49\x89\x2e\x43\xf2\x70\x32\xc6\x64\x97\x53\
-\x6a\xba\x7e\xe9\xe6\x3f\x1d\xf6\x04\x4d\x12\x60\x40\x8d\xa0\x28\
-\x67\xcc\x62\x15\xaf\x51\x66\x1e\x13\xff\xca\xb6\xaa\xfd\xcb\xf7\
-\x55\xde\x96\x10\xe7\x24\x29\x71\x2e\xf9\xd3\x7d\x4d\xb7\xfd\xef\
-\xb6\xc3\xbb\x10\x46\xc7\x93\x15\x03\x97\x21\x76\xe4\x38\x7b\x73\
-\x37\xaf\xd2\x13\x42\x37\xbc\xbf\xe5\x41\xb7\x5b\xae\x41\x0c\x39\
-\x34\x9d\x92\x84\x78\x77\xfc\x47\xfb\xea\xef\xcf\xfe\xcb\xbb\xf7\
-\xbf\x5d\x56\x89\xc3\x9e\xd6\xc7\x4b\x6a\x7c\x69\x37\xa7\xb4\x5f\
-\x5a\x8f\xec\xf4\x29\xad\xfe\x50\x50\x26\x44\x3b\xae\x9f\x33\x84\
-\x14\x4a\x71\x52\x6a\x6c\xdf\x33\x0a\xd3\x72\xd1\xf1\xb1\xe0\x6d\
-\x74\x51\xd8\x12\x56\xb7\x40\x98\x33\x34\xcd\x75\xb8\x38\xc1\x55\
-\x3d\x30\x3f\xa5\x6f\x48\x51\x13\x29\x65\x21\xd1\xa1\xd7\x58\x6e\
-\xc5\xbb\x64\xf7\xaa\x03\x8d\xaf\xfe\x7d\xdd\xfe\xdd\x30\x50\x19\
-\x09\x47\x9f\x3a\x46\x32\x82\xe3\xe6\x8d\xa5\x16\x79\x69\x5b\xd5\
-\xae\x41\xb9\x29\x1b\x86\x66\x26\x4d\x75\x49\x24\xf7\xb3\x9a\xa6\
-\xfb\x7f\xb6\x74\xdb\x67\xd0\x3f\xa8\x21\x9d\x18\x4b\xc2\xc7\xcf\
-\x1d\x3a\xe6\xe9\xd9\x83\x7f\xb6\xaa\xb2\xf9\xf3\x03\xcd\x01\xd5\
-\x12\xed\x81\x19\xa4\xf9\xc2\xb6\xaa\x8a\x49\x3d\xd2\xaa\xcb\x1b\
-\x83\x9f\x4d\x7f\x61\xd5\x87\x21\xc6\x8e\x89\xe4\x10\xde\xb5\x43\
-\x68\x52\x8f\x14\x69\xd3\xd5\x53\xef\x2b\x49\x8b\x97\xdf\xda\x55\
-\xbd\x27\x9c\x87\x59\x4d\x69\x4b\x8d\xa7\x79\x6c\x6e\x52\xc3\x80\
-\xf4\x84\xf9\xee\x18\xa7\xf2\x76\x59\xd5\x9d\xe7\xbd\xf2\xf5\x8b\
-\x3e\x55\x35\xe3\x01\x1e\x1b\x70\x30\x2c\xf5\x21\xce\xa4\x08\x91\
-\x2f\x0e\xd4\x37\x4f\xeb\x91\x14\x53\x94\x12\x3b\x40\xd1\xa9\x82\
-\x8f\x5d\x5a\x22\xd9\x81\x13\x93\x1c\xae\x43\x2f\xaf\x39\xfc\xe8\
-\xed\x9f\x6f\xdb\x8f\x98\x7d\xcc\x7d\x77\x81\x4d\x58\xdd\x00\x7c\
-\xed\x57\xe9\xf5\xe2\x57\x76\x54\x95\x87\x42\xf2\xba\x51\xf9\xf1\
-\xa9\xa9\xb1\xae\x42\x7f\x48\x65\x98\x60\x1d\x87\x77\xe4\x9c\x6e\
-\x87\x54\x7b\xc7\xa7\xdb\x9f\xdd\x5e\xe7\x55\xc1\xbf\xcf\xd4\xc0\
-\x3b\x08\x41\x3a\x65\xa6\x82\xfb\x98\x63\x65\xc2\xb7\x48\xaf\x6e\
-\xad\xac\x18\x5a\x98\xbc\xa5\x24\x3d\x96\xde\xf2\xc9\xf6\x87\x76\
-\x56\x7b\xcd\x70\x32\x24\x7c\x1e\x21\xbb\xb5\x67\x5a\xe6\x2f\xcf\
-\x2e\xfd\x8b\x24\x93\x69\x8b\x4a\xf3\x0a\x56\x1f\x6a\x5c\xb1\xaf\
-\xd9\x7f\x0c\x69\xe1\xb0\xc4\x84\x5f\xdd\x51\xb5\xe3\xf9\x6d\x15\
-\x3b\x42\xba\x21\x78\x1d\xe5\x02\x88\xeb\xce\x26\x17\xa4\x39\xdf\
-\xbd\x78\xcc\xfd\xf1\x32\xbe\x70\x44\xaf\x8c\xc1\xbd\xfc\xa1\x2f\
-\xde\xa8\x68\x6a\x20\x12\x21\x88\x85\x25\xb1\x8f\xf6\x37\xec\xbc\
-\x7a\x44\x61\xe6\xd2\x3d\x35\x4f\x2c\x7c\x75\xfd\xfb\x34\xec\x32\
-\x74\x44\x5d\x2f\x18\x82\xb2\x18\x59\x32\xb9\xd9\xf8\xd1\xa8\xb3\
-\xa2\x6b\xc8\xa3\x68\x35\x8b\x4a\x73\x47\x85\x54\xdd\x85\xc1\x6f\
-\x1a\x33\xe4\x8c\x71\xca\xb2\xdf\x2f\x2f\x9f\xff\xf2\xba\x7f\xfd\
-\x71\xdd\xee\xea\x76\x82\x04\xda\xe8\x62\xb0\x09\xab\x1b\x21\x7c\
-\x32\x0c\xc3\x9f\x96\x57\xfb\xbf\x3a\x14\x5c\x5b\x98\xec\x6a\x1e\
-\x90\x9b\xd8\x3f\xa4\xea\xb1\x3a\x65\xa1\x24\xb7\x23\x76\x55\x65\
-\xf3\x87\x77\x2c\xdf\xb1\x85\x22\x44\x08\x48\x66\xc3\x73\x92\xe3\
-\x56\x5f\x31\x71\xc9\x8e\x06\x6f\xd5\xee\x46\x9f\xcf\x6a\x68\x0a\
-\x92\x16\x7e\x7b\x67\x75\xd5\x5f\x57\xed\xfb\x68\x73\x45\xab\xc9\
-\x41\x04\x85\x63\xb1\x8f\xcb\x4d\x42\x8f\x5e\x34\xe6\x01\xc6\xd8\
-\x48\x45\xd1\xab\x9d\x12\x19\xbc\x78\x50\x5e\x9f\x95\xe5\x0d\x1f\
-\xef\x6f\x09\x68\x16\xd2\x42\x1a\x63\x06\x31\x61\x14\x81\xac\x26\
-\x15\xa4\xba\xde\xbf\x78\xec\x03\x2e\x84\xe7\x05\x54\x5a\xad\xa9\
-\x5a\xea\xf0\xfc\xb4\x41\x9f\x1c\x6c\x7c\xbf\xbc\x25\xa0\x48\xa0\
-\x48\x0f\x6a\x14\x3d\xfe\xcd\xc1\xcf\x5e\xdc\x56\xb9\x47\xb1\x10\
-\x9f\xf1\x87\x84\x11\xd1\xb1\x8b\x9d\xdd\x2b\x25\x79\xf3\xd5\x67\
-\x2c\xaa\x09\x90\x8a\xf5\x95\xf5\x01\x19\x13\x6c\x48\x8d\xbb\x1a\
-\x7d\xbe\x49\x3d\xd2\xd2\x8a\xd3\x62\xfb\xf9\x54\x3d\x28\x13\x9c\
-\x98\x10\xe7\x6c\x7c\x69\x7b\xd5\x63\x67\x3d\xb3\xea\xc3\xb2\x46\
-\x8f\x6e\x4a\x67\xb6\xd5\x7b\xb7\x82\x4d\x58\xdd\x08\x42\xc4\x03\
-\x7c\xa0\xa5\x15\xbf\xb4\xfd\xf0\xfe\x3a\x8f\xba\x7e\x42\x8f\xd4\
-\xbc\x04\x97\xdc\x13\x31\xd6\x74\xcb\xb2\xed\x4f\x6f\xaf\xf7\x06\
-\x24\x43\x1c\x41\x61\x17\x96\x87\xa7\x0f\x9a\x36\xa6\x77\xea\x45\
-\x17\xf4\xcb\x2e\x1d\x91\x13\x7f\xf0\xd5\x1d\x35\x75\x3a\x63\xc4\
-\x6a\xc5\xae\xeb\x14\xfb\x14\xfd\x88\x08\x46\x11\xc2\x09\x4e\x09\
-\x7d\xfe\x3f\xe3\x6f\x49\x77\x3a\x17\x87\x34\xbd\x49\x22\xd8\xa1\
-\x51\xea\x97\x31\x19\x78\xf1\xe0\x1e\x7d\xd7\x1e\x6e\xfe\x78\x4f\
-\x93\xef\x98\x78\xee\xcc\x62\x6f\x60\x9a\x32\x30\xc6\xce\xea\x95\
-\xe1\x7e\x6f\xc9\xd8\x07\x65\x86\x66\x29\x9a\xde\x60\xa4\xc5\x18\
-\x0b\x52\x87\xd4\xfb\xe2\xe1\x05\x69\x2b\x6b\x1a\x3f\x3e\xd0\xe0\
-\xc7\x12\x09\x13\xa5\x5f\xd5\x11\xf8\x12\x89\xa7\xf9\x20\x86\x31\
-\x91\x18\xa2\xaf\xdc\xb0\xa8\xe8\xde\x89\xf9\x37\x39\xa8\x32\xa1\
-\x28\xd7\xe9\x7b\x62\xc3\xa1\xed\x8a\x46\x89\x83\x60\xa6\x52\x86\
-\x4a\xd2\xdc\x4d\x53\x7a\x65\x4c\x90\x25\x39\x4e\xd3\xd1\x17\x33\
-\x9f\xfd\xea\x91\x07\x57\xed\x2f\xd7\x98\x6e\xaa\xbb\x6c\x17\x9d\
-\xee\x07\x9b\xb0\xba\x21\xc2\x91\x16\x4c\x2d\x31\x5e\x55\xd1\xe8\
-\x5d\x77\xb8\x69\xf5\xb9\x7d\xd3\x5c\xcd\x41\x77\xf9\xdd\x9f\xed\
-\x5c\xe7\x53\x55\x2c\x1b\x4b\x40\xc6\xd8\xcd\x43\xfa\xa4\xdc\x3a\
-\xb5\xe8\xaa\xfa\x56\xbf\xce\x28\x8a\x1d\xd2\x23\x6d\xdc\xa0\xd4\
-\xb8\x96\x77\x0e\x7a\x0e\x68\x3a\x25\x66\x40\x16\x48\xd7\xf2\x6d\
-\x92\xdd\xbf\xe7\x0c\x99\x33\x21\x37\xf5\x76\xaf\xa2\xf9\xe0\xa8\
-\x65\x8c\x31\x26\x3a\xa5\x7e\x07\x21\xa5\x8b\x06\xe5\x17\xae\x3e\
-\xdc\xf8\xf1\xbe\x26\xbf\x1e\xe5\x10\x0a\x73\x37\xef\x8c\x5e\xa9\
-\x8e\xb7\x97\x8c\xfd\xa3\x4c\x99\x49\x56\xdc\xb9\xd9\x48\x4b\xd3\
-\x68\x20\xd1\xed\x18\x92\x16\xe3\xf2\xbe\xb8\xe5\xf0\x46\x24\xd8\
-\x86\x89\xe9\x49\xe1\xf8\xf5\xc4\x81\x30\x7d\xed\x82\x51\x13\xe6\
-\xe7\x4b\xd7\x79\xbd\x81\x24\x9f\xce\x5a\x0b\x12\xe2\x0a\x6b\x5b\
-\x03\x1b\xd7\x56\xb6\xb4\x4a\xb0\x06\xdc\xd5\xe4\x6f\xbd\x78\x50\
-\x6e\xea\xaa\xf2\x96\xaf\xae\x7a\xb7\xec\xe5\x2f\x0f\xd5\x29\xa0\
-\x43\xb3\x55\x56\xdd\x14\xf6\xfa\xbd\x3b\x00\x23\x6c\x2c\xcf\x22\
-\xed\x8c\x85\x03\xdb\x31\x96\xe2\x36\x16\x43\x4e\xd2\x1c\x0c\xea\
-\x5a\x38\x9a\x0a\x71\xca\x12\xfd\xfa\x47\x93\x16\x16\xa7\xc4\xcc\
-\x0b\x69\xd4\x47\xc2\x8e\xd2\xc4\x85\x74\x67\x6b\x46\xd1\x7b\x97\
-\x3d\xb9\xfc\xf5\x65\x3b\xf6\xe9\xc7\x28\x87\x04\x5b\xa6\x18\x59\
-\x62\xe5\x37\x9f\x7d\x5f\xb2\x93\x5c\x18\x50\xf5\x3a\x09\x63\x59\
-\xcc\x9b\x32\xa6\xbb\x64\x29\xd5\xab\xe9\xaf\x14\x3e\xf4\xd1\x9d\
-\x1e\x45\x3f\x76\xe9\x06\xe9\x24\x38\x65\x76\xe0\xe6\xb3\x7e\x1f\
-\x2f\x91\x0b\x0c\x29\x8d\x1c\x1b\xc2\xd9\x4c\xc7\x2d\x4b\x69\x2d\
-\x8a\xfe\x51\xc1\xc3\x1f\x5d\x13\x50\xf5\xa3\x51\x00\x01\x5c\x73\
-\x3f\xa1\x20\x09\xdd\x3d\xa1\xef\x79\xd3\x8b\x32\xe7\x35\x85\x54\
-\x55\x36\x95\xf0\x8c\xc5\xc8\x52\xdc\x81\x56\xdf\x8a\xa1\x8f\xad\
-\x7c\x32\xa0\x52\x30\x03\x43\x28\x2d\xc6\x29\x79\x15\x8d\x1a\x4b\
-\x4c\xa8\xe7\xf1\x6d\x18\x36\x69\x30\xd7\xdb\x76\x1c\x9a\xae\x0d\
-\xdb\xac\xa1\x8b\xc3\x41\x08\x4a\x20\xe6\x06\x9a\x69\x59\x6e\x8d\
-\xfb\xa2\x53\x66\x2a\x8b\x9a\x02\x1a\xaa\xf7\xfb\x4d\xb2\x02\xab\
-\x78\x7a\xd9\xd0\xbc\xcc\x41\x59\x09\x93\x02\xaa\x1e\x82\x6d\x7b\
-\x4c\x10\xa2\x21\x26\x05\x13\x6a\xf6\xcc\x7b\x73\x6e\xbf\x1b\x66\
-\xf5\xc9\x4a\x30\xc8\x4a\xdc\x6d\x84\xa8\x9e\x28\xa0\xe9\x68\xd1\
-\xeb\xeb\x7f\xa3\x50\xf6\x96\x93\x90\x14\x6a\x19\xcf\xc6\x92\xd1\
-\x89\xb1\xba\x61\x7f\xc3\x5e\x8f\x62\x1a\xb8\x1f\x23\x61\x71\xb5\
-\x96\x47\xd1\xd0\x86\x03\x75\xfb\x9c\x04\x6b\x14\x59\x83\x04\x32\
-\x5d\x96\x48\xb2\xca\xd8\x47\x8b\x5f\x5b\x7f\x9b\x41\x56\x56\x49\
-\x0d\x8e\x1e\x43\x33\x8b\x32\xdc\x1f\x5f\x31\xe1\x9a\x69\x45\xe9\
-\xe7\x35\x87\x94\x90\x41\x56\xe0\xaf\x48\x7c\xaa\x1e\x2c\x49\x4f\
-\x1a\x7d\xe5\x90\x1e\xbd\x8c\xac\xf9\x71\x66\xf5\x7e\x85\xaa\xba\
-\x59\x3f\x76\x9c\xdd\x16\x21\x7c\xb9\x8a\x1c\x12\x66\x92\x64\xcf\
-\xdf\x5d\x1d\x36\x61\x75\x51\xf0\x98\x4d\x97\x0d\x2b\x2c\x6e\xb9\
-\x72\xe2\x45\xf3\x7b\xa4\xc6\x53\x73\xdf\x9f\x99\xf1\x9c\xac\xfe\
-\x82\x5c\xcf\x83\xc3\x76\x51\xd8\x41\x30\xfa\xcd\xc4\x3e\xd3\x14\
-\x4d\xcf\xc6\x08\x29\xe2\x19\x80\x06\x79\x29\xc4\xe1\x65\x84\x8e\
-\x7a\x69\xc1\xf0\x1b\x53\x63\x9c\xa6\x94\x26\x26\x4a\x81\x20\x3f\
-\xdd\x5f\x17\x9a\xff\xd2\xda\x5f\x50\x09\xbf\x25\x13\x92\xc8\x5d\
-\x6f\x4c\xb7\x1b\x87\x94\x14\x54\xb5\xb7\xfe\xfc\xfe\xa6\x27\x8c\
-\x74\x25\x7c\xfc\x29\x37\x70\x0d\xff\xf9\xbd\xcd\x4f\x04\x43\xea\
-\x3b\xb2\x44\x92\x18\x43\x3a\x12\xc8\x8a\x61\xfc\xe9\xb9\x2f\x7f\
-\x7d\xeb\xc7\xe5\xf5\x5e\xab\x41\x28\x06\x9b\xab\x54\xb7\x03\xbd\
-\xb2\x60\xc4\x8f\xf5\x10\x9d\xe4\x0d\x6a\x5e\x88\x89\x85\x85\xfb\
-\x54\x45\x51\x13\xef\x98\x50\x34\xc3\x21\x11\xd3\x9a\x9f\x87\x94\
-\x37\x96\xc6\x56\x07\xe7\xf0\x46\x01\x35\xf3\x9a\x5c\x90\xea\xfe\
-\xec\xca\x09\x17\x3c\x3e\xbc\xe7\x20\x68\x20\x7b\x5c\x74\x51\xd8\
-\x2f\xa6\x8b\xc2\x20\x1d\x8c\x08\xba\x75\x68\xef\x62\x96\x97\xb8\
-\xf0\xf9\xcb\xc6\xfd\xfa\xc3\x25\x63\xa7\x4e\xcd\xcb\x91\xf8\xd9\
-\x82\x91\x8c\x1d\x79\x3c\x2c\xca\x30\x7a\xf8\xcb\xaa\x2f\x3c\x21\
-\x75\x8b\xdb\x29\x27\x6a\x61\xe9\xe8\x68\xec\x75\x46\x91\x53\x22\
-\xf4\xeb\xaa\xe6\x7d\x8d\x01\x25\x6c\x39\x11\xb6\x5a\x3f\x12\x18\
-\xd0\x18\xcc\xc6\xdf\x1f\x1d\x68\x50\xcf\x7d\x79\xed\x9d\x54\x62\
-\xcb\x1c\x61\x7f\x41\x95\x61\x1c\x17\xa3\xd1\x6d\x8b\xde\xde\x78\
-\xff\xb2\x80\x0a\xfa\xa5\xa3\xe6\x06\x04\xcc\x27\x74\x30\x08\x5d\
-\xe6\x57\xd1\xe2\xb7\xb7\xfc\x31\x56\x76\x95\x31\xc4\x62\x8d\x34\
-\x0c\xb2\x42\x18\x7f\x7e\xde\xcb\xeb\x7e\xf6\xd1\xfe\x3a\xbf\x4c\
-\x8e\x92\x95\x51\x06\xf9\xa8\xf9\x39\x69\x0c\xaa\x68\x5d\x55\xeb\
-\x7e\x97\x83\xe8\x56\x63\x58\x9d\x32\x2a\x61\x94\xe0\x90\xdd\xfb\
-\x3e\x3b\x18\x5c\xae\xea\xd4\xbc\x25\x92\x9e\xca\x2c\x1b\x09\xc7\
-\xcb\x3a\x63\xc2\x38\xbc\xf4\xe2\x89\x63\x3f\xbc\x78\xcc\x5d\x63\
-\x72\x93\x17\x4d\x19\x56\x50\x2a\xe1\x08\x21\x1f\x6c\x74\x19\xd8\
-\x4a\xf7\x2e\x08\x2e\x19\xb8\x1d\x18\xdd\x3c\xb6\xe0\xdc\x58\x89\
-\x24\x06\x55\xdd\xdd\x3f\x23\x7e\xe4\xc2\x81\x39\x03\xdc\x12\x6a\
-\xdc\x56\xeb\xa9\xf5\xaa\x3a\x8e\x76\x12\x8c\x71\x75\xe5\xe1\x3a\
-\xcf\xaa\xca\x96\x35\x0b\x8b\x33\x63\x92\x5c\x72\x49\x40\xa7\x94\
-\x1c\x5d\x6d\x39\x9c\xb2\x5c\xff\xd3\x65\xdb\x9f\xdc\xd5\xe0\x0d\
-\x81\x42\x9d\x07\xd4\xc3\xfc\x6c\x77\x70\xbd\xc1\x7b\x1a\xfd\x74\
-\x4d\x45\xf3\xe7\x8b\x06\xe4\xf7\xc3\x98\x0d\x88\x8f\x75\x7b\xdf\
-\x5c\xb9\xfb\xf6\x7b\x37\x1c\x3c\x10\x0e\x65\x1c\x5e\x9a\x1a\x9c\
-\xe5\x96\x25\x83\xe8\x90\x4a\xc3\x42\x1b\x0d\xcf\x8c\xa4\xac\x31\
-\xe0\x1f\x9a\x9d\xbe\x7b\x48\xb6\x7b\xa6\xaa\xa3\x14\x84\xf1\xca\
-\x73\x5f\xfc\xfa\x96\xe5\x07\xea\xbc\x3c\xb2\x02\x3a\x36\xce\xbc\
-\x69\x75\xca\xe3\xe6\xd4\x07\xd5\x43\x17\x0d\xc8\x1b\xa1\xea\x7a\
-\xa2\xb1\x92\x43\x61\xb2\xc2\x89\x31\xce\x98\x10\x25\xab\x66\x3d\
-\xbf\xfa\xef\x0f\xae\xde\x53\x83\x4d\x93\xab\xe3\x3c\x01\xc0\x6e\
-\x0b\xa3\xcc\xd8\x18\x76\xdb\xe8\x9e\x7d\x1e\x9a\xd1\xf7\xaa\x01\
-\x29\xce\x73\xbc\x41\x25\x56\xd1\x68\x50\x72\x3b\x1c\x1f\xec\x6d\
-\xf8\xbc\xc6\x6b\xbb\xea\x74\x55\xd8\x84\xd5\x05\xc1\xed\x9a\x2e\
-\x29\xcd\x4d\xb8\x72\x58\xc1\x3c\x8f\xa2\x39\x65\x82\xf5\xa0\xa6\
-\xab\x08\xd1\xcc\xb3\xfb\x64\x8d\xbb\x6a\x50\x8f\xec\x03\x2d\x81\
-\xf2\xad\x75\x1e\x1f\x8e\x22\x69\x39\x08\xc6\xfb\x9b\x03\xfa\x47\
-\x6b\xf6\x6f\xca\x4d\x8a\xad\x1f\xd2\x33\x6d\x60\x48\xd1\x5c\x3a\
-\x43\x4a\xa2\x5b\x8e\xfb\x64\x7f\xf3\x5b\xbf\x5e\xb1\x63\x9b\x21\
-\xca\x19\xe4\xe0\x76\x48\xe4\xae\x71\xc5\x83\xe2\x89\xb3\x65\x67\
-\xb3\x57\x93\xc1\x37\x8f\x93\xd6\xde\x26\xbf\xba\xf2\x50\xe3\xe7\
-\x3f\x1e\x55\x38\xfa\xa3\xfd\xb5\x6f\xce\x79\x67\xd3\x3b\x24\xfc\
-\x6c\x38\x7c\x8d\x19\x27\x0f\xb3\xb7\x17\x8d\x9e\xbb\xa8\x34\xb7\
-\xef\x0b\xdb\x2b\x77\x22\x16\xde\xf1\x63\xa6\xc5\x3d\x23\x2f\x6d\
-\x3b\x58\x39\xae\x47\x8a\xdc\x3f\x23\x31\xf6\xec\x67\x57\x5d\xff\
-\xe9\xc1\x86\x56\x20\x2b\x33\x0d\x19\x87\x2d\xe1\x67\xf7\xcc\x71\
-\x2d\x19\x98\x37\x70\x4d\x55\x73\x9d\xa2\x87\xc5\xcd\x5d\x0d\x5e\
-\x75\x42\x8f\x34\x3a\x20\x23\x7e\x64\x40\xd5\x83\x1a\x65\xce\xd4\
-\x58\x17\x7e\x6b\x57\xcd\x4b\x97\xbe\xbd\xe9\xa5\xb5\x15\x0d\xaa\
-\x44\xc2\x44\x67\x6d\x0f\x1c\x76\x31\x62\x17\x95\x16\x26\x7f\x78\
-\xf1\x84\x0b\xcf\x2e\x49\x5e\xa2\x78\x7d\xd9\x41\x55\x0f\x48\x84\
-\x30\x8d\x52\x94\x96\xe0\x72\x6f\xad\x69\xf9\x66\x5d\x65\x8b\x57\
-\x8a\x72\x66\xa3\x8d\xef\x17\x36\x61\x75\x41\x84\x8f\xe0\x42\x6c\
-\x7c\x8f\xb4\xd2\xd9\xfd\xb2\xa7\xf9\x83\xaa\x29\x01\x91\xf0\x2a\
-\x50\xf3\x2b\xba\xee\x76\x92\xa2\xc5\x83\xf2\xc6\x8d\xcb\x4f\x51\
-\x5e\xdc\x56\xb5\x4f\x8c\x0d\xc5\xc1\xcd\x1f\xaa\x18\x23\x2f\xec\
-\xaa\x29\xcf\x4e\x88\x29\x1b\x95\x97\x56\x42\x75\x9a\x4d\x24\xa9\
-\xe2\xb6\xe5\x5b\x9f\xd9\xd5\xe0\x53\x21\xac\x28\x7b\xe6\xdc\xc1\
-\x7d\x6f\x98\xd8\xf7\x17\x73\x07\x65\x25\x6f\xaa\xf2\x6c\xde\xd9\
-\xe0\xa1\x9c\x3c\x39\x69\xed\x6f\xf1\x87\x56\x55\x34\x7d\xf2\x45\
-\x45\xf3\xda\xfd\x8d\x66\xc4\x84\xb0\x63\x34\x42\x84\x61\x4c\x5f\
-\xbf\x68\xfc\xd0\x39\x45\x69\x0f\xf6\x49\x4f\x98\x3a\x24\x3b\x6e\
-\xcd\x8b\x5b\xab\xaa\x09\x44\x43\x30\x15\xdf\x08\xa1\xc3\x1e\xff\
-\xd6\xe7\xb7\x56\x7c\xf8\xc9\x01\x33\x98\xdf\x91\x70\xc6\x32\x1c\
-\x19\x36\xbb\x7f\x96\xe3\x85\x25\x23\x2e\x9b\x51\x92\xbd\xa4\x28\
-\xc9\xb1\xe3\xb5\x1d\x35\xf5\xbc\x8c\x8d\x41\xe5\xf0\x85\x03\x72\
-\x87\xa8\x94\xe6\xa6\x26\xc5\x36\xfc\x67\x7d\xc5\xa3\x17\xbd\xbe\
-\x7e\x55\x9d\x37\x48\x22\xed\x02\x72\xdf\x6a\x07\xc1\xec\xdd\xc5\
-\xa3\x27\xdc\x3e\xbe\xf0\x3a\x4a\x95\x81\x3e\x85\xaa\x12\x21\x1a\
-\x38\x45\x1b\x4b\x51\x2d\x46\x96\x92\xdf\x2a\xab\xd9\xbb\xbe\xba\
-\xe5\x10\x7f\x07\xdf\xdd\x5b\xb7\xd1\x11\xd8\x3a\xac\x2e\x8c\x96\
-\x90\xea\x43\x3a\xab\x8b\x89\x71\xc4\x6a\x3a\x95\xe0\x94\x1a\x53\
-\xe9\xae\xe9\xcc\x13\x50\xd4\x94\xf1\x39\x49\x83\xd2\x62\xcc\x43\
-\x8f\x8f\xe8\x9e\x88\xb0\x4e\x04\x22\xa3\x32\xc6\xe4\xda\x77\x36\
-\xed\x9d\xfc\xd4\xca\xfb\x62\x5c\x64\xf3\xca\x8a\xe6\x2f\xde\xd9\
-\x55\x63\x5a\xbd\xeb\x94\xd1\x69\x3d\x53\xdd\x17\x94\xe6\x5e\xd4\
-\xd0\xe2\xd5\x70\x48\x9d\xf8\xc6\x05\xc3\x6e\x3c\xbf\x7f\x76\x9c\
-\x41\x26\x7c\x03\xc0\xf8\xbf\xc1\x98\x1f\xee\xad\x6b\xfc\x74\x6f\
-\x6d\x30\xac\xa3\x62\x48\x26\x84\x50\x84\xe8\xb9\x25\x59\x3d\xe7\
-\x15\xa5\xfe\xd9\x13\x50\x65\x8f\x2f\x24\xcf\xeb\x93\xf3\xe7\xf9\
-\x7d\xb3\x0b\x28\x63\x14\x42\xcb\x98\x04\xf2\x59\x79\x53\xf0\xc3\
-\x7d\x0d\x8d\x26\xfb\x8a\x64\x45\x19\x9b\x5f\x92\x1d\xff\xfa\x79\
-\x23\x6e\xc2\x41\x6d\x52\x43\x8b\x57\xbd\xa0\x34\x77\xd1\xb4\x5e\
-\xa9\x6e\xa3\x8c\x32\xc1\xd2\xfb\xbb\x6b\x95\xcf\x0f\x37\x7c\xe4\
-\x90\xe5\x9d\x37\xbc\xb5\xfe\x0f\xd7\x2c\xdd\xb4\x15\xc3\x46\xa2\
-\x48\x56\x50\x66\x2e\x7b\xe2\x64\xb7\x13\x8d\xc9\x4d\x1d\x18\x54\
-\xf5\x6c\x95\x22\x8f\x0c\xa1\x66\x8c\x36\xd5\x29\x23\x4e\x99\xc4\
-\xa3\x18\xb9\x31\xa8\xeb\x4d\xdf\xfd\x9b\xb6\xd1\x51\xd8\x12\x56\
-\x17\x84\x31\xb3\x1b\xc3\x69\x73\xad\xa7\xe1\xc3\xb2\xea\x95\x33\
-\xdc\x4e\x4f\x66\x61\x76\x1e\xd6\xd5\x14\x45\x67\x9a\xb1\xba\xd1\
-\x19\x23\x89\x71\x2e\xf2\xf7\x6f\x0e\xbd\xf7\xfa\x8e\xaa\x83\x3c\
-\xd6\x54\x9a\xdb\x61\xae\xaf\x14\x41\x0f\xc5\xc2\x7a\x24\x93\x78\
-\x0e\xb5\x06\x42\x5f\x1d\x6a\xfc\x7a\xd5\xa1\xa6\xbd\x7b\x9b\xfc\
-\x3a\x0f\xf6\xf9\xd0\x39\x83\x66\x97\xa4\xc6\x4f\x50\x29\x0d\x30\
-\x84\x54\x86\x59\xc1\xa2\xd2\xfc\xe2\x6d\xb5\x9e\x2d\xdb\xeb\xbd\
-\x41\xf9\xd8\x83\x4c\xb9\x8e\xfe\x88\x15\xfb\xec\xe2\xcc\xf8\x17\
-\xcf\x1f\xfe\x37\x55\xd5\x4b\x10\xc6\x01\xe3\xb2\xa6\xb3\xf4\x85\
-\x03\x72\x4b\xbf\xa9\x6a\xfd\x70\x67\xa3\x37\xc4\xcd\x15\x30\x0e\
-\x47\x18\xe4\x4b\x2e\x4e\x56\xe7\xf5\xcd\x49\x7d\x69\xe1\x88\x9b\
-\x14\x5d\x1f\xa0\x33\xe6\x37\xd2\x70\x4b\x72\x76\x46\x9c\x5b\x79\
-\x61\x5b\xe5\x4e\x68\x16\x56\x11\x52\x0e\x3f\xbf\xb9\x72\xf5\xcb\
-\xdb\xaa\x5b\x0d\xb2\x32\x96\xa4\x9c\xa9\xc2\xa7\x06\x85\xeb\x94\
-\x1c\xe3\x40\x41\x35\x6c\xe6\xe1\x55\x34\x96\x99\xec\x72\x4e\x29\
-\x4c\x1f\x12\x50\x34\xca\x6d\xcf\x5c\x92\x14\x1b\x17\x23\xb7\x96\
-\xd7\xea\xcb\xee\xf9\x64\xeb\x53\xff\xdd\x5c\x71\xc8\x3e\xa8\xa2\
-\xeb\xc2\x26\xac\x2e\x8e\x0a\x5f\x48\x7b\x62\x77\xed\x9e\x5a\x1f\
-\x5e\x53\x92\xe6\x20\xf9\xa9\x71\xbd\x74\x9d\xc6\x28\x3a\xd5\x62\
-\x11\x0e\x7d\xfc\xe5\xde\x57\x3e\x6d\xf4\xfa\x8d\x01\x36\xba\x47\
-\x92\xe3\xeb\xcb\xc6\xff\x64\xbc\xdb\xa1\xbd\x5b\x17\xa8\x0a\x2a\
-\xda\x31\x3b\x89\xfc\x2c\xc2\x7d\x4d\x01\x7d\x7f\xb3\x5f\x97\xc0\
-\xea\xfb\xe6\x31\x7d\xb2\x6f\x1a\xdf\xfb\xf2\x26\x5f\x10\xcb\xc4\
-\x58\xd9\x61\x42\x0d\xce\x63\x2c\xfb\xc2\xd2\xfc\x01\x9b\xaa\x5b\
-\xb7\x96\x35\x78\x7d\x9c\x70\xf8\x47\x82\x41\x3f\xbd\x77\x4f\xfc\
-\xe6\x85\x23\x7f\x8b\xa8\x7e\xa6\xce\x50\x0b\xc1\x48\x82\x38\x56\
-\x41\x82\x70\xef\xc5\x43\xf2\x33\xd6\x35\xb6\x7c\xba\xa7\xd6\xcb\
-\xc0\xd0\xf5\x08\x1b\x70\xc2\x9b\x5b\x92\x95\xf1\xd2\xc2\x11\x3f\
-\xd5\x74\xbd\x97\x4e\x99\x9f\x98\x31\xea\x31\xf2\x2b\x1a\x1d\x92\
-\x97\x5a\xd0\xe4\x57\x37\xae\xae\x68\xf2\x98\xcb\xd2\x7a\x1f\xdd\
-\xdf\xe4\xd7\xe0\x6c\xc2\x63\xa4\x2a\x9d\x31\x9c\xe4\x76\xb0\x7b\
-\xa7\xf5\x1d\xf4\x87\x29\x25\x67\x3f\xbd\xe5\xf0\xd6\x90\x16\xe6\
-\xb3\x29\x12\x0a\x4e\x2a\xc9\x9a\xe8\xa3\x4c\x72\x12\xec\x8e\x73\
-\x3b\xc9\xc1\x66\xff\x97\xbf\xfa\x6c\xe7\x63\xd7\x7f\xb0\x65\xc3\
-\x97\x15\x8d\x21\x5b\x6f\xd5\xb5\x61\x13\x56\x17\x87\x69\x33\xc5\
-\x10\x59\x53\x51\x1b\xfa\xd7\x86\x83\x5b\xca\x1b\xbd\x1b\xc6\xf6\
-\x48\x4f\xcd\x4e\x8a\x29\x0e\x68\xfa\xde\xcb\x3f\x29\x5b\xe6\x51\
-\x34\x93\x94\x2e\x1f\x52\x30\x68\xd6\xa0\xbc\x8b\xb2\xf3\x12\x47\
-\xdd\x31\x66\x40\xca\xc1\x56\xef\x9e\x8d\xd5\xde\x10\x26\xec\x88\
-\x23\x34\x97\x90\x0c\x09\xc7\x58\x0a\xb9\x65\x89\xbd\x75\xe1\x88\
-\xc5\x12\xa3\x83\x29\xc3\x1e\x8c\x11\x77\x99\x31\x06\x7f\x88\x21\
-\x94\x71\xe9\x90\xfc\x11\x5f\x57\x36\x97\xed\x6a\xf4\x35\x4b\x96\
-\x83\x1f\x0c\xa2\x5c\x5c\x9a\x33\x72\x7a\x49\xfa\xaf\xbd\x01\xb5\
-\x55\x3c\x0f\xd0\x20\xbe\x90\x4e\x43\xf1\x71\xce\x61\x3b\xab\x5b\
-\x57\x7d\x5e\xde\x58\x29\x0b\xba\x21\x09\x6c\xae\x66\x16\x65\x16\
-\xbc\xb3\x64\xf4\xed\x21\x55\xcb\xd1\x29\xf3\x09\x96\xf0\x46\x31\
-\x55\x8d\xb2\xf4\x71\x3d\x93\x1c\x8f\xac\x2d\xdf\xa0\xe8\xd4\x3c\
-\x6d\x03\x83\x63\x36\xa4\x63\x5a\xfc\x1b\xe4\x35\xa3\x38\xd3\xfd\
-\x9f\x79\x43\x2e\xb8\x60\x60\xde\x25\x99\x09\xee\xa2\x06\xaf\xb2\
-\x69\xd5\xe1\xa6\x66\x23\xad\x9d\x0a\x0d\x5c\x37\xa6\xd7\xb0\x04\
-\xb7\xb3\x90\x22\xbc\xe5\xe1\xd5\x07\x1e\x9b\xf3\xd2\xba\x8f\xd6\
-\x57\xb6\xf8\x55\x9d\x62\xeb\x11\x66\x36\xba\x1e\x6c\xc2\xea\xe2\
-\xe0\x76\x55\x60\xa3\x84\x37\x54\x7b\x5a\xdf\xdd\x5d\xbd\xba\x20\
-\xde\xe1\x29\x6f\xf6\xd5\xfe\xeb\x9b\x43\xbb\x8c\xf7\x98\xe0\x26\
-\xec\xd1\x73\x06\xcd\x8f\xc5\x38\x4f\x09\xd1\x00\xc2\x4a\xdf\x0b\
-\x4a\xf3\x86\x4f\x2c\xc8\xa9\x5b\xba\xa3\xbc\x2a\xa0\x9b\xa6\x5b\
-\x47\x25\x24\x08\x3b\xa3\x51\x8a\x7a\xa7\x66\xd6\x8c\xcc\x4b\x2a\
-\xa4\x4c\xcf\xd6\x29\x0b\xf1\xf8\x51\x06\xe1\xa8\x3a\x0d\xc6\xc6\
-\x38\xb3\xcb\x7d\x4a\xe5\x27\x7b\xeb\x76\xcb\x04\x4b\x9c\x70\x40\
-\x50\xc2\xeb\xab\x1a\x2b\xff\x67\x48\x9e\x94\xea\x76\x4f\x0e\xe9\
-\x7a\x80\xab\xd0\x74\xc6\xf4\x04\xa7\x23\xb9\xc6\xe7\xfb\xc7\x45\
-\xaf\x7e\xf3\xba\x4a\xd9\x31\xd1\x11\x64\x42\x24\x83\xb0\x2e\x1f\
-\x55\x38\x76\x4a\xcf\xb4\x29\x9e\x80\xda\x2c\x13\x72\xc4\xfd\x87\
-\x32\x46\x25\x99\xc4\xc7\x33\xb9\xfc\xc5\x0d\x55\x2f\xbe\xbe\xbb\
-\xaa\x35\x2c\xb9\x1d\xb5\x59\x90\xf0\x51\xa9\xea\x9e\x33\xfa\xf5\
-\x7d\xf0\xac\xfe\x37\xe4\x25\xc6\x8c\x6a\xf4\x86\xfc\x32\xc6\xae\
-\xa2\x14\xb7\xef\xd1\x0d\x07\xb7\x51\x86\x24\x8f\xaa\xd1\x71\xb9\
-\x49\x09\xbb\x6a\x7d\x9b\x17\xbe\xb6\xfe\xa9\xe7\xb6\x56\x34\x10\
-\xd3\x9e\x2d\x1c\xd1\xd5\x26\xab\xae\x0f\xdb\x17\xa1\x9b\x01\xf4\
-\x3d\xc6\x37\x83\x88\x03\xe6\xa1\x0e\xd7\x8c\xcd\x4b\xf9\xe7\xec\
-\xe1\xf7\x34\x36\x87\xe2\x1c\x12\x0e\x9f\xb3\x4a\x99\xd3\x15\x23\
-\x13\x7a\xb8\xe5\xd3\x1f\x7d\xbe\xe7\xd5\xe7\xf7\xd4\xf8\x23\x58\
-\x92\x63\xc6\x30\x1b\x9f\x9f\x92\xf0\xde\x92\x31\xd7\xb8\x65\x34\
-\x24\xa4\xe8\x1e\x72\xe4\xd8\x2c\xe6\x8c\x71\x39\x6b\x66\x3d\xb7\
-\xe6\x7f\x3f\xde\x5f\xe7\x03\x82\x38\xf2\x3c\xd7\x05\x4d\xca\x4f\
-\x43\x6f\x5f\x34\xea\x2f\x4e\x82\x66\x53\x1d\x35\x19\xd9\x13\x87\
-\x94\xa2\x50\xf4\xee\xdc\x17\x56\xdd\xba\xf2\x60\x13\xb2\xfa\x2c\
-\xf2\xb4\xce\xe8\x95\xe6\xfa\xf8\xb2\x71\x77\x79\xfc\x6a\x3e\xc2\
-\x66\x3c\x78\xa2\x33\x46\x63\x65\x29\xa1\x49\x67\xdb\x7f\xf7\xec\
-\xda\x7f\x3c\x51\xd9\xd8\x1c\x0c\x5b\x83\x0a\x79\x87\x97\xb9\xb3\
-\x4b\x93\xe5\xbb\xc7\xf6\x9f\x33\xba\x20\x73\x76\x8b\x37\x20\x33\
-\x84\x82\x60\x09\xef\x20\x58\xaa\x9e\xf1\xc2\x9a\xdf\x7e\x79\xb0\
-\x41\x31\xf2\x97\x40\xaf\xa7\x85\x83\xe4\x1f\x17\x66\xd9\x46\xd7\
-\x86\x2d\x61\x75\x51\x80\xc5\xf9\x71\xb6\x40\xdc\x54\x81\x85\x75\
-\x44\x48\x22\xc4\x34\xda\x9c\x90\x97\x31\x78\x66\x9f\xf4\xe9\xde\
-\xa0\x1e\x94\x08\xa6\xb0\x73\xa6\xab\x2a\xa5\x38\x25\xae\xff\xe2\
-\x61\x3d\x86\x6d\xab\x6e\xde\xb3\xad\xde\xdb\x6c\x3d\x1d\xd5\xc8\
-\xab\xbc\x25\x10\x5a\x71\xa0\xe1\xeb\x8b\x06\xe7\xa7\xb9\x25\x52\
-\xa2\x52\x1a\x34\x58\x2f\x39\xce\xe5\xfe\xa0\xbc\xfe\xf9\xdf\x7f\
-\xb6\x6b\x9f\xa9\xe0\x16\x5c\x80\x38\x61\x18\x19\x95\xb7\xfa\xd1\
-\xea\xca\xe6\xd5\x57\x8d\x28\x1a\xaf\x28\x6a\x36\x22\xd8\x11\xab\
-\xb2\xed\xb3\x5f\x5e\xfb\xd3\xcf\x0f\x36\x2a\x40\x0e\x48\x3c\xaf\
-\x1e\x02\x13\x92\xfd\xcd\x01\xad\x4f\x6a\x62\xcb\xa8\x9c\x84\xb1\
-\x01\x8d\x9a\x64\xeb\x96\xa5\x84\x00\xa5\x6b\xe6\x3c\xbb\xe6\xef\
-\x6f\x54\x36\x79\x11\xc4\xb5\xe7\xcf\xf2\x88\x0c\xf3\x8a\x33\xf3\
-\xde\x59\x3c\xe6\xc6\x8c\xb8\xd8\xc9\xad\xbe\x90\x22\x11\x0c\xa6\
-\x0a\x98\x29\x3a\xc3\x49\xa9\x31\x99\x5b\xeb\xbd\xdb\x57\x97\x37\
-\xd4\xca\x12\x21\x1a\x03\xd9\xd2\x42\x9e\xed\xb5\xbb\x8d\xae\x01\
-\xdb\xac\xa1\x8b\x42\xa3\x8c\x89\x5b\xfe\x44\x18\xe9\xc6\x65\xd3\
-\xaf\x90\x85\xdd\x52\x8c\x6b\x2b\x2a\x5b\xd7\xef\x8d\x29\x78\x2c\
-\x2d\x46\x56\x64\x89\xc4\xc3\x51\x5a\xe6\x73\xa1\x80\xe2\x41\x3a\
-\xcd\x19\x96\x93\xec\x46\xe1\x97\x8e\x21\xdd\x23\x79\x19\x79\xac\
-\x39\xdc\xa4\x9e\xf1\xd4\x57\x8f\x7a\x35\xfd\x7d\x97\x24\xc5\x21\
-\x84\x62\x5a\xfc\xca\x96\x07\x3e\xdb\xf9\x15\x0a\x2f\x11\xcd\xbc\
-\x12\x24\x07\xce\x8a\x75\x49\x4c\xf0\xf5\x23\x18\x91\xcf\x0e\x34\
-\xb6\xfc\x77\x53\xe5\xed\x09\x71\x0e\x5f\x42\x92\xdb\xf7\xdf\x55\
-\x65\x3f\xff\xf4\x60\x83\x87\x48\x61\x52\xc5\x20\xdd\x64\xc5\xbb\
-\xe5\x04\x97\xfb\x88\xe5\x85\x91\xcc\x75\xef\x6d\xdc\x70\xb0\x45\
-\xdd\x40\x10\x8a\x71\x3b\xa4\xf8\x80\xae\x7f\x74\xe6\x7f\xbe\x7a\
-\x64\x4d\x65\x73\xd0\x79\xac\xad\x96\xf9\x10\x5f\x76\x4e\x2e\xce\
-\xe9\x89\x90\x63\x60\xab\x5f\x69\x95\xc3\xce\xcb\xa6\xd4\x46\x98\
-\x1e\x97\xe4\x44\xda\xde\x3d\xde\xa7\x3f\xde\x5e\xb3\x13\x81\x0b\
-\x0f\x63\xe1\xf2\x5a\x24\xbd\x23\xe9\x89\xed\x6e\xa3\xeb\xc1\x96\
-\xb0\xba\x20\x8c\x95\xcf\xdd\x93\x8b\xfb\x2d\x28\xc9\x8d\xdd\xd5\
-\xe4\x6b\x69\x08\x28\x88\x81\x24\x63\x75\x19\xe1\xff\xaf\xf1\x04\
-\xd0\x23\x9f\x6f\xdd\xb7\xb7\xb6\x65\xdd\x84\x82\x8c\xd4\xcc\x44\
-\x77\xa1\x2f\xa4\x52\x63\xac\xcb\x04\xc7\x06\x75\x69\xfb\x25\x6f\
-\x7e\xf3\x96\x4f\xd1\x4c\xf3\xa3\xf4\x58\x97\x19\x20\x0f\x81\xcf\
-\x1f\x37\x0c\xad\xf4\x06\xf1\x07\xfb\xeb\x36\x9f\x3f\x22\x8f\x64\
-\xa6\x26\x0e\xb8\x6b\xd9\x8e\xc7\x5f\xdc\x56\xd9\xe0\x20\x98\x07\
-\xbd\x43\x77\x8e\xe9\xdb\xeb\x9d\xcb\x46\x5f\xbd\xa5\xa6\x65\xeb\
-\xf6\x3a\x6f\x88\xc7\x98\x92\x30\x22\x6f\x96\x55\x34\xf6\x4d\x89\
-\xaf\xd8\x56\xdd\xb2\xe2\xb2\xe5\x3b\xd6\x91\xf0\x8e\xe3\x11\x03\
-\xd4\x05\xfd\xb3\x73\xd7\x5e\x33\xed\x56\x4d\xc5\x7b\x3f\x2d\xaf\
-\x69\x91\x09\xc1\x06\xcf\x04\x34\x8a\x1c\x32\xab\x9f\x33\xb2\xf7\
-\x94\xda\x96\xc0\x7b\x33\x9e\x5f\xf5\xdc\x37\xd5\x1e\xd3\xe6\x4c\
-\x85\x88\x14\x10\x02\x0c\xa5\xc7\x3a\x91\x5f\xd3\xcd\x36\x51\x15\
-\x56\xbb\x78\x50\xee\x10\x44\x69\x12\xc6\x44\xa3\x08\x4b\x09\x4e\
-\x1c\x8b\x92\xd3\x37\x3d\xba\x5f\x7f\x64\xd6\x53\x4b\x37\xd6\x06\
-\x55\x86\x22\x84\x16\x35\x88\x0a\xc3\xae\x65\x6c\x4a\x1a\xea\x19\
-\x27\xe3\x5f\x8d\xef\xd3\x6b\x6c\x8f\xe4\x8c\xcf\x0f\x36\x36\x7e\
-\x87\xaf\xdc\x46\x07\x61\x13\x56\x17\x84\xc1\x0c\xcf\x2e\x1c\x31\
-\xf1\xac\x7e\x39\x63\x2f\x1f\x90\x93\x57\x9a\x95\x40\x92\x53\x9d\
-\xad\xdb\x2b\x5b\x35\x95\x1e\x1b\x0a\xe6\xe8\x33\x66\xc8\x50\xbc\
-\xa9\xd6\xe3\x7b\x63\x47\xcd\x9a\x64\x87\x54\x3d\xae\x57\x7a\xdf\
-\x90\xaa\xc7\xbb\x65\x82\x57\xec\x69\x5e\xfa\xd8\xc6\x03\xfb\x8d\
-\x5b\xd3\x62\x9d\x68\xfd\x8f\x26\x5f\x39\x30\x33\x96\x7d\x55\xd1\
-\x5c\xed\x53\x75\x22\x85\x6d\xbb\x4c\x09\xa6\xca\x13\x42\x2b\xf6\
-\xd5\xee\xfc\xe6\x40\xd3\xe6\x47\xd7\x97\xef\xa7\x8c\x51\x8c\xc2\
-\xbf\xcf\xe9\x95\x4f\x1e\x9e\xdb\xff\xea\x90\xae\x8d\x5e\x32\x28\
-\x3f\x77\x57\xbd\x77\xc3\xe6\x5a\x8f\xca\xf5\x51\x46\xd9\x5e\x2d\
-\xab\xda\xf3\xda\x8e\xaa\x3d\x04\x4e\x73\xe6\xa6\x0b\x17\x0f\xcc\
-\x4f\x7c\x61\xe1\xf0\x1b\x03\xc1\xd0\x80\xa9\x3d\x63\x52\x36\xd6\
-\xb4\xac\x2a\xab\xf7\x33\x7e\x8e\xd8\xba\xca\x96\xd6\xc3\xb5\xfe\
-\xcd\x7f\xfe\xa2\xfc\xab\x6f\x6a\x9a\x19\x98\x2d\x84\xcd\x27\x10\
-\x22\x19\xb1\x4e\xf6\xb7\x19\x03\x06\xff\xf1\xcc\xfe\xb3\x9e\xd9\
-\x5c\xb1\xc9\xaf\x52\xdc\xda\xe2\xd3\x2e\xc9\x4d\x4a\x89\xcb\x4c\
-\x1c\xc0\x54\x4d\x4a\x74\x49\xfe\x67\xb6\x54\x3f\x73\xe1\x8b\x6b\
-\x5e\x7c\x61\x6d\x99\x97\x98\x07\xfa\x1c\x1f\x08\x90\x2f\x09\x1d\
-\x32\x41\x8b\xfa\x64\xc4\x3c\x7d\xd5\xdc\x01\x77\x8d\xca\x99\x34\
-\xa9\x57\xea\xe8\x92\xf4\x78\xfc\xd7\x55\xfb\x76\x33\x5b\xc7\xdb\
-\xe5\x60\x13\x56\x17\x84\x31\x98\xae\x1c\x94\x5f\x94\x80\x51\x02\
-\xc6\x38\x7e\x78\x7e\x5a\x9f\xf9\xc5\x59\x45\xe7\x16\xa5\xbb\x1b\
-\x02\x7a\xeb\x9e\x26\x1f\x37\x2d\x3a\x02\x26\x1c\x6c\xda\x18\x54\
-\xc8\xdb\xbb\x6a\x0e\x95\xd5\x78\xd7\x8e\xef\x99\x9c\x95\x96\x91\
-\x9c\xfe\xf4\xea\x8a\xe7\x3f\x3f\x5c\xeb\x37\x6e\xbb\x65\x6c\xaf\
-\xde\xe7\x95\xe6\x5c\x31\xac\x47\xfa\xa8\x71\xd9\x89\xfe\x0f\x6b\
-\x94\xbd\x9e\x90\x8a\x31\xd5\x4d\x6d\xbd\x41\x7e\x55\xad\x0a\xfa\
-\xba\xaa\xa5\x31\x4c\x56\xe1\x23\xee\x63\x1d\x98\xfd\x63\xce\xa0\
-\x39\xbd\x53\x62\xce\xf4\x04\xd5\x7a\x4a\x51\xcf\x8b\x86\xe6\x67\
-\x6f\xaa\x6a\x5a\xb7\xa3\xde\x67\x12\x8c\x1e\xd6\x53\x61\x7e\x9a\
-\x33\x86\x83\x22\x2e\x1c\xdc\xc3\xf1\xec\xf9\x43\xaf\xf7\x87\xb4\
-\x01\x21\x8d\x36\xc4\xb9\x5c\x85\xb9\x89\x89\xa1\x97\xb7\xd7\xec\
-\x56\x74\xcd\xb4\x71\x35\xa4\xb4\xf5\xd5\xcd\x8d\xd5\x7e\xbf\x59\
-\x06\x9d\xc1\xf2\xd5\xe1\xc4\xb9\x19\x69\xec\xa5\xb9\xfd\xcf\x3c\
-\x6f\x48\xc1\x8f\x92\xdc\x52\x51\x6b\x48\xdd\xfc\x79\x79\x53\x63\
-\x00\x21\x94\x9f\x14\xa7\x4e\x29\x4e\x9d\x1a\x72\x25\x6d\xfa\xe7\
-\x41\xf6\xc8\xb5\x2f\x7d\xb6\xbd\x39\xa4\x62\x83\xac\x68\x84\x03\
-\x71\x8c\xbf\x9d\x32\x41\x17\xf4\xcf\x4d\x7a\x6a\xce\xa0\xe1\xd7\
-\x8f\xef\x3b\x39\x39\xd8\xd0\x57\x53\xb5\x58\x5d\x67\xb4\xba\x35\
-\xd8\xf4\xcf\xf5\xe5\xbb\xed\x75\x61\xd7\x83\x4d\x58\x5d\x10\x86\
-\x48\x70\xfd\xc8\xc2\x92\xf4\x18\x57\x92\xa2\x53\x35\xa8\x68\x5a\
-\x30\xa8\xbb\xb2\x12\x62\x0a\x2e\x1a\x92\x5f\x32\xad\x20\x35\xfe\
-\xb9\xad\x87\x0f\xeb\x42\x28\x16\xbe\x54\x04\x25\x38\x93\x08\x22\
-\x9b\xeb\x5a\xfd\x9f\xec\x6b\xd8\xb0\xb9\xa2\xb1\xec\x9f\x9b\xf6\
-\x57\x6a\x94\x32\xa7\x84\xd1\xbf\xe7\x0c\x9c\x15\x27\xc9\x7d\x5a\
-\xfc\x4a\xb0\x67\xbc\x63\xf4\x6d\x73\x26\xa7\xee\xab\x6e\xde\xbe\
-\xa9\xaa\x5e\x73\xca\x92\x19\x65\xcf\x20\x0c\x09\xec\xac\xf8\x41\
-\xae\xbf\x99\x5a\xdc\xe3\x92\x11\x05\x57\x36\x78\x82\xba\x53\x22\
-\x58\xa7\x2c\xe8\xc0\xb8\x57\x41\x4a\xac\xeb\xe5\xad\x95\x5b\x83\
-\x3a\x3b\x22\xcd\x70\xfd\x96\x51\xc2\xdc\x84\x58\xf4\xe1\xc5\x93\
-\xaf\xd4\xb5\xe0\x58\x3d\xec\x16\x23\x7b\x15\x55\xeb\x9f\x9b\xda\
-\x1b\xe9\x8e\x4d\x9f\x1c\xa8\x6e\xe5\x4b\xc6\xb0\x4b\x0d\x36\x4d\
-\x0c\x4c\xdd\x15\x43\x6c\xc9\x90\x22\xf7\x8a\x1b\xe7\x5c\x9e\xcd\
-\xbc\xe7\xb6\x06\xb5\x20\xa1\xc8\xd1\x27\x2d\x41\xfd\xf7\x86\x83\
-\x9b\x0d\x89\x53\x6f\xf0\x04\x26\xf5\x2a\x2a\x3f\xe7\x85\x2f\xde\
-\xfc\xef\x17\x5b\x3c\x0e\xcc\x4c\xdf\x45\xd3\x2d\x09\x63\x24\x4b\
-\xe6\xc1\x14\x18\x22\x8b\xa2\x73\xfa\x64\x24\xbc\x7c\xfe\xf0\x89\
-\xd7\x8d\xea\x35\x31\x35\xc6\xd5\xd3\x1b\x50\xb0\x8e\x25\x15\x61\
-\xac\x3b\x09\x21\x4d\x41\xad\xf5\x1f\x36\x61\x75\x49\xd8\x4a\xf7\
-\x2e\x08\x63\x90\xc5\xbb\x1c\xd8\x21\x93\x18\x9d\x51\x63\xb5\x85\
-\x1d\x12\xd6\x43\x9a\x1e\x6c\xf5\x85\x1c\x43\xb3\x93\x07\xa5\xc7\
-\xb9\x4c\x05\x7a\x8a\xdb\x81\x53\x62\x64\x53\xb2\x91\x20\x22\xa9\
-\x31\x50\x35\xd0\x1b\x6d\xa9\xf3\x68\x8f\xae\x2f\x2f\x53\x34\x5d\
-\x37\x78\xe4\x8c\xc2\x8c\x84\xdc\xf8\xf8\xa1\x21\x4d\x57\x0c\x42\
-\x50\xb0\xe4\xf5\xed\xdf\x3e\xf5\xbf\x33\x7a\xdf\x76\xc5\xe0\x1e\
-\x69\x8a\xa6\x33\x38\x3e\x2b\x7c\x40\x2a\x28\xa2\xe3\x1c\x12\xba\
-\x7c\x60\x8f\x25\x5e\xaf\x12\xe7\x90\x88\xe9\xd2\x23\x11\x2c\xb5\
-\x86\x34\xdf\x84\xfc\xb4\x99\xef\x2d\x1e\x75\x36\xe6\xe6\x5d\x3c\
-\x3c\x72\x98\x2f\xd0\xb3\xf3\x07\x5f\xe8\xc2\x81\x29\x2a\x45\x5e\
-\x02\x86\xa9\x0e\x49\xd2\xbc\x1e\x5f\xe2\x8f\x87\x67\x2c\x8a\x77\
-\xca\x47\x02\xee\x19\x79\xf1\x08\xa8\x0a\x65\xec\x8a\xa1\x05\xa9\
-\xcf\xcc\x2a\xbe\xd5\x7f\x60\xc7\x54\x85\x49\x3e\xb3\xcc\x94\x2a\
-\x39\x31\x8e\xa1\x53\x7a\x26\x27\x1a\x69\xad\x08\x68\xc1\xa2\xc7\
-\x3e\x58\xb3\xb1\xb2\x41\x27\x58\xc7\x2a\x33\xc3\x26\x87\xdd\x74\
-\x90\xf1\x07\x62\xbd\x53\x12\x51\xa2\x5b\x36\xfb\xfb\xcc\xe2\xec\
-\xec\x41\x3d\xd2\x07\xd7\x7b\x83\x24\xa4\x6a\x41\x87\x44\x8c\xfb\
-\x31\xf9\x7f\xf6\xae\x3c\x38\x8e\xea\xcc\xbf\xf7\xba\x7b\xa6\xe7\
-\x96\x46\x33\x3a\x2c\xd9\x96\xac\xcb\x92\xe5\x43\xbe\x63\x1b\xe3\
-\x38\x31\x16\x22\x38\x71\x48\x48\x38\x0c\x5b\x59\xc8\x06\xb3\x14\
-\x47\x01\x05\x38\x6c\x65\x53\x94\xcd\x86\x4a\x28\x73\x1a\x88\x93\
-\xe5\x32\x24\xde\x8d\xc3\xe9\x03\xdf\xc6\xb2\x65\x1b\xc9\x96\x64\
-\xdd\xf7\xad\xd1\x8c\xe6\x9e\xe9\xf3\xbd\xad\x3e\x46\x08\xc8\x6e\
-\xe0\x8f\xad\xf8\xe8\x5f\x15\x54\x7b\xba\xdd\xfd\x5a\xe3\xfe\xe9\
-\xfb\xbe\xfe\xbe\xdf\x0f\x00\x5a\xf9\x99\xdb\xcc\xa9\xe9\x49\x03\
-\x97\x1a\x0c\xc2\xba\xc4\xa0\xa6\x42\x98\x80\x5d\x4d\xfd\xe7\xfa\
-\xc3\xdc\x59\x2b\xeb\x88\x38\x59\x8a\x32\x51\xd0\xac\x3e\x83\x40\
-\x25\x2e\x3e\xd5\x97\xf0\x4f\xf3\xa6\xa7\x37\xfe\x7c\xf5\x9a\x9f\
-\x96\xe7\xb8\x4d\x94\x56\x67\x4a\x11\x97\x3e\xac\xac\x44\x48\x28\
-\x25\x41\x53\x98\x6e\xf5\x5a\x1c\x66\x97\x28\x63\x4d\x41\x41\xf9\
-\x37\xc0\x98\xa3\x31\x0c\x8a\x5e\x5a\x5f\xf2\xf8\xcb\x77\xff\xb0\
-\x88\x75\xa6\xe9\x23\x7f\x9f\x3f\xb5\xbc\x4c\x40\x02\xe3\x3e\x0b\
-\x8d\x20\xd6\x2c\xbc\x54\x28\xc1\x4b\x9c\x97\x60\xa1\xdb\x5e\x66\
-\x37\x7d\x25\x60\x27\x56\x86\x02\xa5\x6e\x7b\x9e\x44\x20\x98\xc2\
-\x02\x44\x96\x65\xca\xce\x40\x69\x77\xf3\xe8\xf9\x98\x20\x4d\x6a\
-\xb8\xa7\x3a\x56\x59\x42\xc8\xcb\x0b\xa6\x17\xbe\x74\xe3\xbc\xc7\
-\xe3\xa2\x54\xa2\xac\x11\x41\xa0\xae\x59\x90\x30\xb2\x38\x58\x67\
-\x61\xba\x23\x13\x68\xaa\xa6\x10\x00\xac\xca\x66\x61\xb5\xf8\xaf\
-\x75\xbe\x2b\x3f\x8b\x9c\x2c\x2f\x78\xe5\xae\x1f\x67\x76\x6d\xfe\
-\xf6\x75\x9b\xe6\x4e\xf3\xa8\xf7\x22\x4a\x09\x20\x4a\x09\xad\x7b\
-\x01\x52\x0c\x24\x6c\x9a\x19\xa1\xa0\x20\x4d\xf4\x86\xf8\xd3\xef\
-\x5e\x0c\x9e\x95\xb5\x5a\xe1\xff\xf7\xd7\x6d\xe0\x1b\xc2\x48\x09\
-\x2f\x31\xa4\xd2\x90\x83\x3d\x81\xd8\x0b\xe7\xfa\xfa\xeb\x47\xe3\
-\xad\x41\x0e\x8e\x64\xd9\x2d\xa2\xdb\xc6\xd8\xac\x26\xca\x06\x09\
-\x41\x2f\x9e\xeb\x6b\x08\xf3\x92\x50\x99\xe3\xcc\xfe\x69\x65\xfe\
-\xb5\x1b\x4b\xb2\x8a\x36\x14\x65\xda\xa3\xbc\x1c\xec\x08\xc5\x79\
-\x41\x56\x87\x7e\xd5\x3a\x90\xde\xc5\xad\xd6\x93\xce\x0e\x87\x82\
-\x69\x08\x74\xae\x9d\x9d\x53\x2a\x8a\x52\x3a\x26\x40\x50\xa2\x1e\
-\x82\x89\x08\x20\x72\x2e\x48\xa7\x16\xbc\x70\xb2\xf5\x68\x52\x94\
-\x24\xbd\x0e\xa5\x3e\xb8\xca\xc3\x7f\xac\xd7\xdf\x74\x53\x59\x9e\
-\xc5\xc1\x52\xe5\x82\x84\xd5\x46\x4c\x09\x63\xda\x65\x63\xe3\x4f\
-\x1e\xea\x7c\xf5\xc4\x40\x20\x3a\xd5\xa3\x50\xd9\xe6\x25\x0c\x44\
-\x04\x7b\x37\x94\x65\x2f\x89\x73\xa2\x59\x21\x38\x51\x96\xa1\x3b\
-\xcd\x69\x7a\xb7\x37\xb6\xeb\x67\xff\x55\x7b\x48\x9f\x51\xd4\xfa\
-\xbb\xf4\xe6\x50\x87\x99\x66\x5f\xbf\x6d\xe9\x2f\x31\x26\x6e\x4c\
-\x48\x52\xe1\x20\xb5\xf3\x1d\x21\x6b\x9a\x8b\x0d\xfc\xee\x78\xfb\
-\x8e\xa7\x4e\x74\xb6\x29\xc7\xcb\x64\xb2\x79\x1f\xa4\xea\x68\x66\
-\x1a\x82\x9b\xcb\x73\xd3\x76\xac\x2f\xfb\x56\x55\xae\x79\x25\x24\
-\xc2\xb4\xfd\x9d\xe3\xbd\xb5\xc3\xa1\x60\x75\x89\xd7\xbe\x7c\xa6\
-\x67\x2e\x03\x11\x4d\x21\x39\x3a\x48\x6c\xad\x7f\xf1\xd3\xa7\xef\
-\xfc\xcf\xbd\x67\x7f\x7d\xb2\xbb\xff\x70\xef\x68\x8c\x00\x63\xfa\
-\xf9\x52\x04\xfd\x8f\x5e\x80\x81\xbf\x0d\x4d\x7a\x45\x06\x1f\xb4\
-\xf7\x49\x1f\xb4\xf7\x0f\xd0\x08\x0e\x54\x17\x64\xb1\xeb\x8a\x33\
-\x0a\xd6\xcf\xf2\x16\x2b\x84\xa4\x1e\x07\x90\x15\x88\xb2\x1c\x8c\
-\xf3\x70\xb6\xd7\x39\xef\xad\x9b\x2a\x8b\x2f\x8e\xc5\x2f\x6c\x3b\
-\x39\x74\xe1\xed\xa6\x76\x71\x6a\x77\x79\x6a\x94\xe6\xa1\xc3\x6d\
-\x2d\x27\x46\x62\x4f\x3d\xfb\xdd\x92\x3b\x67\x38\x2d\x4b\x42\x49\
-\x31\x49\x21\xb5\x63\x80\x70\x31\x2e\x00\x31\x16\xf5\x65\x4c\xd6\
-\xaf\x94\xdd\x0d\xbe\x18\xac\xda\x55\xb3\xeb\xc0\xa6\x15\x66\xa7\
-\x89\x5a\x1b\xe3\xa5\x48\x86\xd5\x64\xdd\xdd\x34\xb8\xe7\xb9\x73\
-\x9d\xc3\x10\x02\x55\xaa\x26\xd5\x32\xa6\x1a\x64\x40\x80\x9e\x3f\
-\xd5\x35\xb2\x3a\x2f\xed\x83\x1f\xcd\xce\xde\x14\x48\x08\x31\x3b\
-\x4d\xd9\x27\x38\x69\xf7\x33\xe7\xfd\x07\x35\xbf\x56\x88\x91\x7e\
-\xcf\xa9\xba\x1c\x44\x48\xe0\x64\xe8\x33\xd1\xc4\xa1\x0e\x14\x62\
-\x4c\x1c\x26\xca\x3e\x92\x90\xce\xff\xec\xfd\xfa\x3f\xfc\x77\xeb\
-\x58\x50\xf7\xf0\xff\x42\xe7\xbb\x92\x5a\xde\x3a\x37\xdb\xf4\xe8\
-\xf2\xc2\xca\xf9\x39\x19\x15\x9c\x20\x59\xfc\x81\x30\xe7\x4d\xb3\
-\x4a\x32\x01\x16\xe5\xb8\xb1\x88\x4c\x82\x61\x6e\xf0\x8d\x86\x81\
-\xd6\xc3\x7d\xbe\xde\x8f\xbb\x83\x9c\xa4\xfc\xee\x96\x34\x1d\xc2\
-\xbf\xe1\x30\x66\xe0\x12\x81\x11\x61\x5d\xa2\x98\x32\x60\x0c\xf4\
-\x66\x48\xd8\x16\x8c\x49\x7b\x3b\x7d\xfe\xe7\xcf\xf6\xb6\x71\x32\
-\x56\x9e\x4d\xb2\x6c\x9a\x2b\xa7\xba\x34\xbb\x38\xca\xcb\x1c\x21\
-\x50\xe4\x04\x99\xc9\x76\xb0\xf9\x1b\x67\x67\xe4\x97\x79\xac\xdc\
-\x99\xe1\x70\x30\xcc\x4b\x9a\x5b\xb2\x56\x99\x57\x52\x26\x74\xd1\
-\x17\xe1\x0e\x74\xfb\xce\x2c\xce\x76\x27\xa6\xbb\xd8\x72\x25\x2d\
-\x73\x9a\x19\xea\xc3\x0e\xff\xde\x37\x1a\x07\x3a\x21\x00\x48\x37\
-\x34\x55\x28\x04\x51\x94\x9a\xd2\x91\xe1\x18\x0f\x3f\x6e\xf7\x9d\
-\xbf\xa9\x2c\xc7\x63\x36\xd3\xe5\x82\x04\x2e\xde\xfb\x51\xe3\x1b\
-\x83\x51\x4e\x21\x37\xd5\xaa\xde\x6b\x35\x21\x2b\x43\xc3\xb8\x28\
-\x2b\xd7\x54\x29\x68\x20\x9a\xec\xf9\x71\x49\x66\xa9\x99\xa6\x0a\
-\x26\x92\xe4\xbd\x35\x3b\x8f\xef\x69\xec\x1d\x44\x0a\x1f\x52\x48\
-\x1d\x2f\x52\xd3\x3d\x4a\x53\x06\x45\x09\x49\xc6\x0b\xb3\x9c\xd4\
-\x82\x6c\xe7\xfc\x10\x2f\xca\x5e\x9b\x85\x19\x4e\x82\xf7\xae\x7b\
-\xf3\xd3\xd7\x8f\xf7\x07\x93\x08\x41\x75\xa0\x9b\x9a\xa2\xf9\x9c\
-\xe7\xb2\x50\x2f\x54\x55\x94\xfd\xf2\x9a\xd2\x75\x5e\xab\xa5\x30\
-\x9a\x14\x30\x2f\x63\x5e\x06\x04\xda\xad\x26\xeb\x81\x4e\x5f\x77\
-\xed\x50\xc8\x77\x7a\x68\x22\xb1\xad\xa6\xb3\x65\x5f\xf7\xb8\xbf\
-\x2d\x90\x90\x94\x14\x97\x22\x18\x42\xf8\x55\x13\x58\x03\x97\x16\
-\x8c\x1a\xd6\x25\x0e\x09\x93\x94\x8a\xa6\xda\x36\x80\x3e\x77\x8b\
-\x51\x9f\xab\x71\xde\xdc\x93\x08\x88\xe7\x3d\x14\x06\x50\x16\x58\
-\x19\x63\x39\xc1\x4b\xf1\x48\x52\x70\xdd\xb2\xb4\xf0\xfa\xcd\x8b\
-\xf2\x67\x29\xc7\x99\x29\xd5\x2b\x0c\x98\x68\x44\x01\x02\xd4\x82\
-\x7c\xab\x3f\x81\x96\xff\xf1\xc4\xfe\xe7\xce\xf6\x3d\x97\x69\x67\
-\x93\x14\x42\x52\xcd\x50\xe0\x3c\xd0\xd3\x40\xe5\xaf\xbc\x56\x3d\
-\x6f\xde\x3d\x4b\xa7\xb9\x24\x59\xed\xb1\x42\xca\x1a\x2e\xfa\xa3\
-\xa4\xfa\xad\xda\x37\xd2\x64\x52\xff\x51\x7d\xff\xbe\xd3\xc3\x21\
-\x99\xd2\x64\x8e\x91\x3b\x33\x8b\xec\xbb\x63\xd5\xf5\xfb\xee\x58\
-\x55\xad\x6c\x2b\x44\x44\x21\x84\x4e\x0f\x84\xc8\xfe\x10\x3c\x00\
-\x68\xf6\xc8\xba\xb7\x3f\xfd\x73\x6b\x30\x06\x69\x0a\x61\x46\x1d\
-\xb0\x26\xe4\x9e\x39\x33\x9d\xaf\x54\xcf\x9f\xa7\x10\x5c\x8a\x83\
-\x8e\x8f\x45\x2e\x20\x9a\xe2\xbd\x36\xb3\xf4\xca\xb9\xc1\x97\xaf\
-\xfd\xe3\xe9\xbf\xb6\xf9\xe3\x80\x51\x2e\x06\x01\x06\x10\x50\x32\
-\x26\xca\xbd\xa9\xac\xfe\xaf\x8b\x0b\xf2\x37\x2d\x2f\x5a\x17\x49\
-\x8a\xb6\x08\x27\xc4\x95\x08\xcf\x6e\xa2\x2d\x19\x36\x56\x3c\xd3\
-\x1f\x38\xb5\xbf\x6b\xbc\x0b\x68\x6f\x52\x53\xf6\x60\x50\xff\x85\
-\xa0\x3b\xeb\xfc\x23\xbf\x69\x03\x5f\x07\x46\x84\x75\x19\x61\xaa\
-\x4a\x01\xd6\x7a\x94\x40\x93\x3f\x24\xbc\x5d\xdb\xde\x43\x4f\x2f\
-\xee\xab\x28\x2b\x44\x6e\xcc\xb9\x05\x81\x37\x0b\x18\x08\x36\x00\
-\xe4\x43\x7d\xfe\xf6\xa3\x7d\x81\xb0\xf2\x70\x4e\x77\x59\x98\x10\
-\x27\x4a\x12\x04\x28\xe5\x5d\xa8\x9c\xe6\x93\xee\xf1\x31\x13\xcd\
-\xb4\x38\x4c\x90\x7b\xf0\x40\x73\x1d\xaf\xcd\xf5\x90\xea\xc2\x2c\
-\xeb\x33\x55\x73\x1f\xb9\xa1\xdc\x5b\xd8\x1b\x95\x3e\xab\x1b\x0c\
-\xca\x0a\x59\x60\x00\x88\x3f\xce\x4b\x1d\x6d\xa3\xf5\x7b\xda\xc7\
-\x86\x47\x65\x4c\x18\x84\x94\x28\x10\x6f\xdd\xb8\x7a\xe6\xc6\xa2\
-\xb4\xbb\x72\x5c\xec\x6c\xb3\xcb\xd3\xb8\xbf\xa1\x33\xc8\x50\x14\
-\x94\x31\x26\xfd\xc4\x3e\xb6\xb3\xb6\xbd\xa1\x71\x34\x28\x53\x08\
-\xa9\x4a\xa5\xbc\x2c\x93\xcd\x8b\x73\x99\x97\x7e\x30\xef\x17\x8b\
-\xf2\xdc\x6b\xcf\x0e\x04\x8f\xb7\x06\x62\x82\x72\x8f\xed\xe3\x51\
-\xbe\x2a\x3f\x93\x7d\xb3\x61\x78\xcf\x03\x9f\x34\x36\x87\xf9\xa4\
-\xb2\x6e\xb5\x11\x55\x94\x09\xcc\xb4\xda\xf1\x34\xa7\x89\x9d\x48\
-\x0a\x58\x89\x36\x57\xcd\x70\x59\x56\x67\xb9\xf2\xa3\xbc\x8c\x5d\
-\x2c\x6d\xb6\x59\x98\xe4\xd9\xe1\xe0\x85\x07\x0f\x34\x1f\x7b\xf8\
-\x93\x96\x6e\x7f\x52\x50\x53\xdd\xd4\xcf\x30\xd5\x06\x62\xe0\xf2\
-\x81\x41\x58\x97\x31\x74\x8d\x17\x18\x85\x10\xee\x6d\xea\x4c\xfe\
-\xb9\x27\xd2\x4b\x11\x53\xef\x1c\xb7\x8d\x4e\xb3\x50\x1e\x8a\xa5\
-\x99\xf3\x43\xe1\xcf\xf6\x77\xfb\xb8\x1b\x4b\xb3\xcc\xc7\x37\xad\
-\xf8\xde\x2c\x17\x8b\xbb\x87\x42\xfe\x11\x4e\x52\x85\xfa\x94\x88\
-\x46\x89\x36\x0e\xf5\x8c\x87\x5f\xa9\xeb\x6f\x56\xc8\x2a\x65\x15\
-\xff\xfc\x86\xca\x95\x33\xac\xd4\xf2\x70\x14\x67\xdd\x3c\x67\xda\
-\xcc\x6e\x9e\xaf\xab\xef\x0f\x8a\x0c\x45\xa9\xea\xa6\x0d\x09\x51\
-\x1a\x93\x31\x4e\xbd\x91\xfc\xf1\x9c\x62\xea\x37\x0b\x5d\x9b\xc3\
-\x89\xa4\x97\xe3\x38\x74\x8d\x9d\x4c\x6f\x1f\x13\x6b\x1a\x02\x21\
-\x59\x39\x66\x68\x6c\x8c\x8c\x84\x63\x6a\x8d\x0b\x42\x80\x44\x19\
-\x93\xcd\x95\xd3\x99\x17\xbf\x3f\xff\x9e\x40\x4c\xac\x64\x08\x60\
-\x33\x33\x6d\xe3\x6f\xd6\x0d\xf4\x2a\x6b\x10\x64\x4c\x76\xd4\xf7\
-\x35\x1f\xec\x1d\x0f\x52\x6a\x6b\x07\x05\x30\x26\x08\x13\x82\x4b\
-\x33\xac\x60\xf7\x0f\x57\x56\x6c\x5b\x5f\xb4\xea\xec\xf8\x78\x7b\
-\xbb\x2f\x29\x6f\x98\x33\x03\xae\x98\xe5\x5d\xc0\x00\x22\x9e\x1b\
-\x8e\x36\x3c\x78\xb0\xe9\xd8\xa3\x87\x5a\x7a\x5b\xfc\x31\x11\x4e\
-\x51\x60\x35\x70\xf9\xc2\x20\xac\x2b\x00\x29\x0b\xab\xd0\xc4\x04\
-\xdc\xdb\xda\x9b\x7c\xe7\xe2\x78\x8f\x89\xc2\xfd\x2e\x1a\x50\xff\
-\xf1\x69\x57\x5f\x7f\x34\x29\xde\x58\x9c\xe5\xaa\x2a\xc9\x5a\x54\
-\x9a\xed\x2a\xbd\xaf\x28\x33\x23\x2e\x91\x89\xf3\xc1\x68\x82\x13\
-\x09\x32\xe9\xc5\x2d\xfc\xf9\x43\x4d\x0a\xd2\x2d\xd4\x93\x2b\x0b\
-\x6f\x81\x00\xa4\x01\x08\x12\x92\x2c\xe7\xff\x64\x4e\xee\xf4\x89\
-\x84\x5c\x77\x6a\x20\x20\x29\xd7\xa3\xa0\x26\x71\x23\xeb\xce\x38\
-\xaf\xde\x58\x56\x35\xdd\xed\xf8\xb6\x20\xe3\x04\x84\x48\x62\x59\
-\xd3\xb4\xbc\x0c\x96\xdb\x59\xdf\xdf\x41\xd4\x9a\x18\x22\xa9\x66\
-\x52\x0c\x10\xb9\x7f\xed\x6a\xe6\xf9\x6b\x67\xdd\x13\x12\x84\xa5\
-\x34\x80\x51\x4c\x08\xe5\x61\x68\xfb\xee\x96\xd1\x9a\x10\x27\x62\
-\x7d\x2d\x90\x86\x00\xd2\x08\x41\x5e\xc6\xd0\x46\x9b\xf1\xfd\x4b\
-\x67\x78\xfe\x7a\xcb\xd2\xef\x3a\x4c\xa0\xd2\x4c\x21\x50\x3f\x14\
-\x6d\xab\x19\x08\x0a\x82\x48\xa3\x22\x27\x03\x1f\x38\xd0\x74\xf4\
-\xb1\x23\x2d\xdd\x2d\xe3\x1a\x51\xa5\x84\xf9\x0c\xb2\xba\xfc\x61\
-\x10\xd6\x15\x80\x49\x25\x51\xd5\x7a\x1d\xc0\x10\x97\x84\xfb\xba\
-\x7c\xf1\x17\xcf\xf5\xf5\x0c\xc7\x39\x75\x8a\x67\x49\x4e\x9a\xa7\
-\xaa\x20\xab\xd4\x1f\x49\x72\xd8\xc1\x66\x7e\x6f\x6e\x5e\x49\x75\
-\x81\x47\xfa\x74\x60\xcc\xe7\x4b\x88\x58\x86\x7a\x41\x5e\x6f\x4b\
-\xb8\xb9\x3c\xdb\xf3\x93\xf9\x79\x1b\xc2\x49\x11\x31\x94\xfa\x11\
-\xcf\x27\xb8\xfc\x8d\x4b\xe7\x67\x75\xd2\x9e\xcf\x1a\x3a\xba\x31\
-\xa4\xd4\x12\xa8\xfa\xa6\xee\xf6\xb9\xb9\x99\xf7\x2d\x99\x71\x77\
-\x98\x13\x89\x26\xd1\x02\x50\x52\x94\xa5\xa2\x74\xb6\xa8\x33\x98\
-\x3c\xd7\xe8\x8b\xc6\x90\xee\x6e\xaa\xac\xb5\x30\x3b\x03\xed\xb9\
-\x6b\xcd\xcf\x93\xe1\x91\xe5\x10\x52\x31\x85\xc8\x38\x09\x43\xaf\
-\xcb\x62\x6b\xf6\x45\xcf\xd4\x8d\x84\xe3\xfa\x5a\x08\x46\xaa\x0a\
-\x0d\x29\xf7\xa6\xc1\x0f\x7f\xb4\x68\xfe\xa6\x85\xf9\xdf\x09\x27\
-\xc4\x74\x4e\xc4\x09\xbb\x85\x31\x7f\xdc\x31\xd6\x7b\x7a\x28\x14\
-\x1d\x8c\x44\xe5\xdf\xd7\xf7\x0f\xb4\x05\xe2\x02\x98\x42\x54\x46\
-\xda\x77\xe5\xc0\x28\xba\x5f\x41\xc0\x18\xab\xad\x04\x08\x6a\x75\
-\x9e\xa9\x4e\x3a\x13\x49\x21\x02\xac\x52\xc0\x63\x33\xdb\xb0\x20\
-\x89\x13\xe1\x04\x9c\x9d\x91\xb6\xba\x69\xf3\x8a\xea\x07\x17\xe5\
-\xb9\xec\xba\xbd\x8e\xde\x8a\x00\x5f\xad\x1b\x1c\xdf\x7a\xac\x63\
-\x87\xd7\x65\x11\x45\x8c\xcd\xca\x39\x64\x48\x85\x41\xc2\x77\xcd\
-\x6c\x61\x68\xbd\xf2\x67\x44\x00\x95\x1a\xd4\xeb\x0a\x72\x21\x02\
-\x2d\x83\x14\x04\x26\x5d\x32\x06\x2b\xdb\x04\xb2\x83\xdd\x41\x2e\
-\x04\xf4\x46\x29\x4a\xef\x74\xbf\xbd\x28\x6d\xbd\x79\xac\x6b\x8d\
-\x48\xa8\xa8\xb2\x47\xc4\xc4\xec\x75\x5a\xa4\x6d\x47\x3b\x76\xbc\
-\x56\xd7\xe7\x53\xfb\xab\xf4\xd9\x1a\x3b\x06\xe4\xa1\x25\xf9\x69\
-\x4d\x9b\xd7\xdd\x30\x3b\xdb\x72\x4d\x30\x96\x50\xad\xf2\xb3\xec\
-\x8c\x2d\x92\x14\x86\x86\xa2\xc9\x08\x48\x99\x5b\x68\x1d\xf8\xea\
-\x4b\x89\x2f\xcf\x5b\x1a\xb8\xfc\x61\x44\x58\x57\x20\xa6\xbe\x9a\
-\xd7\x74\xcf\x21\x68\x1c\x8f\xf0\x75\x83\xc3\xed\xf9\xe9\xce\x64\
-\x51\x86\x23\x9b\x02\xc0\x12\x17\x04\x8e\x97\xcc\xee\x0d\x15\x79\
-\xb3\x51\x20\xe6\x3b\x34\x16\x8d\x30\x48\x53\x52\x56\xa2\xa1\x83\
-\xdd\xfe\x31\x33\x82\x1d\xd7\x15\x67\x2f\x8c\x73\x92\x05\x00\x20\
-\x59\x4c\x0c\x38\xd6\xe5\x3b\x7a\xa4\x6f\x62\x98\xd2\x86\x9c\xd5\
-\x71\x9c\x81\x08\x27\x3b\x4d\xe6\xee\x6f\x17\xa4\x2d\x4d\x4a\x98\
-\x21\x04\x20\x97\x85\x49\x6e\xaf\x1d\x7c\xf1\xf7\xf5\xdd\x41\x98\
-\x4a\x21\x81\xa6\xf2\xf9\x9d\xc2\x2c\xcf\xb5\x45\xd9\x0b\x12\xbc\
-\x28\x10\x00\x58\xb7\x83\x4d\x6c\x3b\xd6\xbe\xfd\x89\x23\xad\xcd\
-\xb4\x26\xa3\x43\x52\x9a\xef\xbf\x9a\x9b\x97\xfb\xeb\x0d\xf3\x37\
-\x04\x63\x31\xb7\x20\x12\xde\x66\xa6\x59\x2b\x8b\xe2\xe7\x86\xf1\
-\xf1\xeb\xdf\x39\x75\xfa\x44\x7f\x80\x47\x9a\x46\xbd\x76\xff\x06\
-\x4f\x5d\xb1\x30\x08\xeb\x2a\x42\xc7\x84\x44\x76\xd6\x0f\x8c\x42\
-\x60\xeb\x5a\x9c\x97\xce\xba\xad\x74\x56\x8c\x13\x64\x1b\x43\x31\
-\x87\x02\xb1\xc1\xa3\x3d\xfe\x80\x42\x12\xda\x5c\x9f\x3a\xbf\x48\
-\x1d\xe8\xf6\xfb\x4d\x08\xb5\x5c\x57\x9a\x59\x99\xe4\xe5\x74\x2c\
-\x83\xee\x27\x8e\xb4\xee\x1e\x8e\xf1\x18\x68\x46\x10\x50\x6b\xb7\
-\x00\x68\x5f\xd7\x68\xa4\x30\xdd\xc6\x2d\xca\x76\x2e\x32\xd1\x80\
-\x7a\xbb\x69\xe4\xdd\x5f\x7c\x54\x7f\x41\x1b\x0d\x82\x00\x4f\xb1\
-\xae\x8f\x0b\xd2\xf8\xad\xe5\x39\x0b\x65\x4c\xbc\x6e\xa7\x25\xb2\
-\xf5\x58\xfb\xb3\x5b\x8e\xb4\x76\x99\x28\x88\xb0\xd6\x74\x3a\xa9\
-\x2a\xba\xaa\x22\x77\xda\x9a\x3c\x77\x71\x8c\x93\x65\x4f\x1a\xcb\
-\xf4\x04\x63\xcd\xb7\xef\xa9\x3b\xf0\xc4\x91\xc6\x51\x7f\x82\x57\
-\xef\xcd\xe0\xa8\xab\x03\x46\x4a\x78\x15\x01\x41\x4d\xaf\xea\xdf\
-\x8f\xd7\x47\xca\x77\x1c\xfc\xe4\xd9\x33\x3d\x1f\x79\x5d\xe6\x18\
-\x30\x53\x94\x99\xe0\x30\xd0\xc5\x03\x2b\x3c\x16\xca\x6b\x03\x40\
-\x90\x09\x66\x19\x8a\xda\x72\xb8\xa5\x77\xdb\x91\xd6\xdf\xba\xd3\
-\x2d\x5c\xaf\xc0\xb5\x35\x04\x62\x92\x72\x3a\x1a\x41\x52\xea\x71\
-\x20\x9d\x2c\xd4\xde\xa6\xdf\xd5\xf6\x1d\x41\x14\xdb\x8e\x10\xdb\
-\xf1\x6c\x6d\xef\xe1\xa9\x3d\x63\x25\x19\x56\x04\x90\x56\x6e\x6b\
-\xf0\x45\xf8\xc1\x68\xb2\xd5\x9d\x66\xe3\xb7\x1d\x6b\xfd\xed\x96\
-\xc3\xad\x3d\xca\xb5\x04\x4c\x88\x17\x00\x50\xe1\xb6\x51\xa9\x59\
-\x46\x33\x01\x61\x60\xa6\x29\x8f\xcb\x14\xdf\x7e\xb2\xe3\xe3\xb5\
-\xaf\x9f\x3c\xb2\xbf\x2b\x90\x54\x92\x40\x04\x0d\xae\x32\x60\xe0\
-\x8a\xc6\xe7\xf5\x2d\x00\xaa\x0a\x33\xd8\xcf\xee\x5a\xbd\xfa\xde\
-\xa5\x33\xdd\xca\x3e\x1b\x43\x81\xe8\xc3\x6b\x96\x75\xdc\xb7\xa4\
-\x32\xc7\xae\x0a\x42\x40\x96\x46\x6a\x24\xbe\xbd\xaa\xac\xf0\xa1\
-\x65\xb3\x66\xe9\xa7\x81\x0e\x33\x0d\xe2\x8f\x55\x5f\xfb\xd0\xb2\
-\xc2\x3c\xe5\x03\x25\x3a\x52\xf8\x69\xfb\xfa\x85\x05\xdb\xd7\x57\
-\x16\x28\xdb\xda\x67\x00\x3c\xb0\xbc\x30\x57\x7a\xbc\x6a\x4d\xa1\
-\x59\x73\x11\x53\xfe\xf7\xd0\xf2\x59\x45\xdb\xd7\x57\x14\x29\xdb\
-\xfa\x35\x60\xb6\x93\x05\x1d\x3f\x59\x38\x3f\x76\xff\xda\xe5\x36\
-\x7d\x98\xfa\xde\xc5\x33\xd3\xcf\xdd\xb5\x7a\x75\x55\x51\x06\xab\
-\x8f\xfd\x40\x43\x4f\xe1\xea\x84\xf1\xa5\x5f\xa5\xd0\x9f\xf7\x49\
-\xd7\x98\x54\x18\xc4\xd2\x08\x34\xfd\xcb\xda\xf5\x85\x5e\x67\xf9\
-\x85\x81\x91\xda\x3b\x4e\xf8\x4e\x37\xf7\x0d\x61\x28\x70\x48\xd4\
-\x3a\xc4\x35\x25\x04\x4c\xc8\xcd\xb3\xb3\x9c\x6f\xfd\x60\xd1\xad\
-\x8c\xcd\x14\xdc\xf4\x61\xdd\x5f\xde\xaa\xed\x17\x4d\x14\x02\xa9\
-\x39\xc7\xd4\xf6\xa6\x79\x39\xa6\x37\x6e\x5a\xba\x11\x70\x52\xc6\
-\x93\xef\xd5\xed\x7a\xaa\x79\x24\xc4\xe8\xd2\xc7\xca\x71\x0c\x04\
-\x88\x98\x58\x5c\x3e\x33\x17\xbe\xbe\x2a\x7b\xd9\x82\x59\x59\xdf\
-\xea\x1a\x8b\xb4\x54\xbc\x7c\x78\x1f\x27\x61\x30\x55\x31\x54\x27\
-\x5b\x62\xc8\xae\x5f\x9d\x30\x52\xc2\xab\x14\x29\x23\x0b\x1a\x4d\
-\x8e\xfa\xa8\x40\x08\x01\x16\x8a\xd6\x70\x24\xc6\x17\xa7\x3b\x16\
-\x5e\x78\xb0\xea\xfa\x47\xd6\x95\xb1\x0a\x59\x31\x94\x16\x05\xc9\
-\x6a\x2d\x0a\x82\x87\x17\x95\x16\x40\x04\x28\x2e\x26\x78\x1f\x5b\
-\x58\xb8\x2c\xcf\xe1\x50\x08\x0a\xea\xf2\x36\x50\x21\xab\x69\x0e\
-\x13\x78\x74\x65\xe9\x4a\x3e\x21\x7a\x05\x40\x60\xd5\xca\x92\x59\
-\x94\x3a\xcc\xac\xf1\x24\x43\x21\x95\x08\x1f\x59\x55\xc0\x5e\xb8\
-\xff\xba\xea\x92\x0c\xdb\xe2\xf0\x44\x8c\xb7\x60\xc1\xaa\xac\x65\
-\x0a\xa0\xee\xcd\x68\x90\xd5\x55\x0c\x83\xb0\xae\x72\xe8\x0e\x31\
-\x3a\x03\x40\xc8\x09\x12\x98\xb0\xb8\x3b\x5c\x9e\x74\x39\x29\x61\
-\xd1\xdf\xd2\x3c\x63\x6b\x65\x5e\xf5\x23\xcb\x0a\xed\xa2\x8c\x65\
-\x4d\x14\x0f\x60\xbb\x99\x02\x79\x59\x6c\xbe\x20\x11\x9c\x10\x25\
-\x7e\x4e\xa6\xab\x7c\xcb\xca\x92\x69\xea\xb9\xa6\x50\xe0\x96\x95\
-\x45\x33\x2a\x32\x9d\xa5\x71\x51\xe2\x64\x99\x90\x62\xbb\x69\xa6\
-\x9e\xea\x11\x85\x2b\x45\x19\xe3\x07\xbe\x55\xe0\xd8\xba\xa2\xe0\
-\x86\x40\x5b\xeb\x8c\x84\x48\x44\x97\xc7\x25\x07\xad\xd9\x1d\x9c\
-\x6a\x98\x31\x49\xa6\x86\x9b\x8d\x01\x83\xb0\x0c\x68\xd0\x25\x8d\
-\x09\x06\x00\xae\xfb\x53\x7d\xd3\xd6\x13\x1d\xef\x67\x38\x2c\x31\
-\x2b\x6b\x01\xe3\x31\x2e\xeb\x37\xd7\xcf\xfd\xfe\x9d\x73\x73\xd3\
-\x52\x46\x13\x09\x41\x06\x63\xd1\x64\xd4\x44\x41\x8a\x46\x08\x47\
-\xe2\x49\xfa\x96\x0a\xef\x8a\xf9\x59\x69\x48\x49\x17\x95\xff\xe6\
-\x7b\xd2\xe1\x6d\x73\x66\x2e\x8b\xc4\x79\x25\x3a\x22\x0c\x05\xd1\
-\x50\x44\x88\x26\x44\x79\xd2\xc4\xf4\xce\x8a\xdc\xb4\x67\xd7\xcf\
-\xdd\x30\x1e\x93\x33\x2d\x16\x0b\xf4\xd8\x4d\xd1\x6d\xc7\xba\xde\
-\xff\xce\x9f\xce\x34\x62\x4d\x44\xd0\x60\x29\x03\x93\x30\x08\xcb\
-\xc0\x24\x88\xd6\x3b\x4a\xfc\x83\x7d\x68\xcb\xde\xba\x91\x47\x4f\
-\xb7\xef\x89\x13\x69\xc0\x4a\xd1\x00\x48\x92\xbb\xc8\x63\x9f\x01\
-\xb4\xda\x94\xaa\xe6\xf9\xd2\x89\xc1\x1a\x1a\xd2\xe3\x22\x96\x19\
-\x0a\x42\x25\x65\x64\x18\xbd\xc8\x0e\x54\xdb\x65\x44\xd1\x48\x95\
-\xa9\x21\xa2\x0c\x18\xda\x0c\x27\x5e\x6e\x6a\xab\x91\x30\x01\x26\
-\x3d\x54\x53\xcf\x29\x62\xb7\x95\x86\x30\x2e\x82\xde\xc7\x0f\xf7\
-\xef\x79\x62\x7f\xdd\x88\xb2\x06\x75\x8a\xc7\xa0\x2b\x03\x53\x60\
-\x10\x96\x81\x2f\x40\xcb\x0f\x21\x36\x51\x08\x3d\xf3\x49\x5b\x62\
-\xc9\xab\x27\x3e\xee\x4f\x24\x1a\x80\x99\xa6\xa2\xbc\xa4\xaa\x28\
-\x48\x18\xab\x23\x3c\xaf\xb5\xf6\x70\x3b\x2f\xf8\x4e\x66\xd8\x6d\
-\x04\x42\xc0\xb4\x07\xa2\xfd\x0d\x63\x21\x49\x4f\xe3\x60\x43\x60\
-\x42\x6a\x0b\x86\xfb\x21\x80\x4c\x86\xd3\x0c\xfe\x50\x37\x5c\xf3\
-\x5a\xed\x68\x82\xd2\xed\xf6\x15\x44\x05\x09\x03\x2b\x4d\x0d\x44\
-\xe3\x75\x4b\x77\x1e\xd9\xfb\x74\x4d\x63\x52\xb9\x36\x01\x86\xf9\
-\xb2\x81\xaf\xc2\x20\x2c\x03\x5f\x01\xc6\x18\x08\x32\xc6\x4a\x14\
-\xd4\x17\x4e\x82\x75\x6f\x9d\x3a\x19\x11\x13\x35\x19\x36\x56\x55\
-\xec\x84\x00\xa4\x6c\xe3\xe1\xd3\xa7\xda\x07\x9b\x7d\xd1\x76\xab\
-\xcd\x4c\xed\x6e\x19\xf5\x0b\xb2\xea\x6d\xa8\x16\xc8\x95\xed\xdd\
-\xcd\xbe\x09\xab\x83\xa5\x5a\x7d\x91\xce\xa7\x3f\xed\xe8\x4d\xbd\
-\x99\x4c\x15\xa6\x3c\xac\x99\x8d\x4e\x88\x35\xdf\xdd\x75\xe6\x74\
-\x6f\x38\x09\x95\x6b\x2a\xd7\x56\xd6\x60\xc0\x80\x01\x03\xdf\x08\
-\xa9\xb7\x88\xa5\xd3\x1c\xa8\x3c\xd3\xa1\x11\x16\xfc\xc2\x3e\x70\
-\x5b\x45\x5e\x3a\xd9\x76\xd3\x3f\x3f\xb1\xb2\x38\x37\xf5\x79\x6a\
-\xdf\xe3\x2b\x8b\x72\xc9\xbf\xdd\x70\xf7\x2d\x65\x9a\x01\x44\xea\
-\xf3\xd4\x39\xca\x33\x1c\xec\x6c\xa7\x03\x19\xbd\x55\x06\xbe\x0e\
-\x0c\x4d\x77\x03\xff\x27\x34\xe7\x1d\x08\x3a\x46\x62\x00\x13\x92\
-\x04\x53\x66\xf5\x24\xd5\x42\x1e\xc2\x77\x2e\x0e\x05\x7f\x35\x18\
-\xe8\x32\xd3\x5f\x0d\xd8\xa1\x8c\x91\xe4\xc8\xea\xf9\xa0\x3f\xe4\
-\x07\x9f\xbf\x95\x9c\x3c\x47\x73\x20\xca\xe9\x16\xfc\xc6\xb0\xb2\
-\x81\xbf\x0b\x23\x25\x34\xf0\x77\xa1\x72\x0c\xd4\xda\x10\xbe\x0c\
-\x0a\x69\xfb\xf7\x75\x8d\xf7\x79\x6d\x8c\x09\xa4\x0a\x58\xfa\x7e\
-\xaf\x8d\x36\xed\xed\x1e\xef\x89\xc5\x79\xcd\xc5\xf9\x4b\xd0\xcf\
-\x69\xf4\x56\x19\xf8\x5a\x30\x22\x2c\x03\x5f\x0b\xf8\x7f\x89\x7e\
-\x88\x1e\x2b\xb5\x07\x86\x46\x09\xb1\x39\x80\x3e\x54\x98\x42\xe7\
-\x84\x10\xed\x3c\xde\x18\x05\x40\x06\xaa\x9b\xd7\x97\x88\xc9\x20\
-\x2a\x03\xdf\x04\xff\x13\x00\x00\xff\xff\xb5\x91\x5b\xe1\x9b\x65\
-\x42\xdb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x1d\x66\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
 \x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
 \x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
 \x09\x70\x48\x59\x73\x00\x00\x12\x74\x00\x00\x12\x74\x01\xde\x66\
@@ -7473,6 +532,6899 @@ qt_resource_data = b"\
 \xbd\xf2\xa1\x72\xe7\xe2\x9e\x20\x08\x82\x20\x18\xcb\xbe\x7d\xff\
 \x07\xa8\x9a\xab\x65\x5b\xc2\x00\x93\x00\x00\x00\x00\x49\x45\x4e\
 \x44\xae\x42\x60\x82\
+\x00\x00\x6d\x69\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\xc2\x00\x00\x00\x96\x08\x06\x00\x00\x00\x4d\x70\x88\x10\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
+\xa8\x64\x00\x00\x6c\xfe\x49\x44\x41\x54\x78\x5e\xed\x5d\x07\x60\
+\x14\x45\xdb\xbe\xbd\xbd\x9e\x9e\x10\x7a\xef\xbd\xf7\x26\x88\x74\
+\x41\x11\x45\x8a\xa0\xd8\xbb\xd8\xf8\x14\xfd\xac\xff\x67\x2f\x88\
+\x82\x88\x15\x44\x50\x41\x51\x44\x44\xe9\xbd\xf7\x1a\x4a\xe8\x2d\
+\xa4\xb7\xab\xbb\xfb\xbf\xcf\x64\xe7\xbc\x5c\x2e\x21\x14\x91\x90\
+\x79\x60\x32\x7b\x53\xdf\x99\x9d\x9d\x67\xdf\x69\x2b\x69\x9a\x66\
+\x10\x10\x10\x10\x10\x10\x28\xad\x30\xea\xb6\x80\x80\x80\x80\x80\
+\x40\xa9\x84\x20\x42\x01\x01\x01\x01\x81\x52\x0d\x41\x84\x02\x02\
+\x02\x02\x02\xa5\x1a\x82\x08\x05\x04\x04\x04\x04\x4a\x35\x04\x11\
+\x0a\x08\x08\x08\x08\x94\x6a\x08\x22\x14\x10\x10\x10\x10\x28\xd5\
+\x10\x44\x28\x20\x20\x20\x20\x50\xaa\x21\x88\x50\x40\x40\x40\x40\
+\xa0\x54\x43\x10\xa1\x80\x80\x80\x80\x40\xa9\x86\x20\x42\x01\x01\
+\x01\x01\x81\x52\x0d\x41\x84\x02\x02\x02\x02\x02\xa5\x1a\x82\x08\
+\x05\x04\x04\x04\x04\x4a\x35\x04\x11\x0a\x08\x08\x08\x08\x94\x6a\
+\x08\x22\x14\x10\x10\x10\x10\x28\xd5\x10\x44\x28\x20\x20\x20\x20\
+\x50\xaa\x21\x88\x50\x40\x40\x40\x40\xa0\x54\x43\x10\xa1\x80\x80\
+\x80\x80\x40\xa9\x86\x20\x42\x01\x01\x01\x01\x81\x52\x8d\x52\x49\
+\x84\xb2\x51\x92\x60\xf4\x9f\x02\x02\x02\x02\x02\xa5\x18\x92\xa6\
+\x69\xfa\x65\xe9\x80\x44\xa0\x32\xb3\x42\x07\x5e\x0b\x08\x08\x08\
+\x08\x94\x4e\x94\x2a\x8d\x90\x78\x4f\x06\xf1\xad\xbb\xaf\xcb\x80\
+\x75\xf7\x76\x19\x80\x6b\xb8\xe9\xde\x02\x02\x02\x02\x02\xa5\x10\
+\xa5\x86\x08\x2d\x26\x19\x24\xa8\xbc\xd3\xb3\x75\xbb\xf6\x95\xcb\
+\x7d\xd7\xbe\x6a\xb9\xef\xde\xed\xd9\xba\x2d\xdc\xe0\xa7\x07\x13\
+\x10\x10\x10\x10\x28\x65\x28\x15\x44\x68\x96\x8d\x46\x8f\x4f\x51\
+\x86\x35\xae\xd4\xe0\xb1\xd6\x65\x7f\x4e\xcf\xc9\x89\x48\xcf\xce\
+\x89\x78\x94\xae\x87\x37\xae\x5c\x1f\x7e\x08\xa3\x07\x17\x10\x10\
+\x10\x10\x28\x45\xb8\xe6\x3b\x7f\x10\x9c\x57\x51\x55\x22\xc1\xaa\
+\xd3\x07\xb5\xf8\x45\xd1\xa4\x8a\x46\x49\x52\x61\xe8\xba\xd2\xf4\
+\x41\x2d\xe7\x0c\x6f\x5c\xa9\x32\xc2\x08\x32\x14\x10\x10\x10\x28\
+\x7d\xb8\xa6\x17\xcb\x10\xaf\x49\xc4\x6f\x1a\x69\x7d\x71\xdf\xde\
+\xd2\x72\x61\x8e\xdb\xd7\xc2\xa0\x19\x14\x49\x32\xb0\xa1\x50\x2a\
+\xba\x62\xa0\xeb\x70\x8b\xbc\x71\xd4\x9c\xcd\xbd\xa6\xef\x3a\x95\
+\x8e\xd5\xa4\x8a\x2a\x16\xd0\x08\x08\x08\x08\x94\x16\x5c\xb3\x1a\
+\x90\x49\x27\xc1\x3b\xeb\x57\xb7\x7c\x37\xa8\xd5\x77\x3a\x09\xfa\
+\x38\x09\x02\xec\x9a\xdc\xb2\x3d\x4a\x9b\x69\xb7\xb4\xfc\x6e\x54\
+\xb3\x6a\x16\x90\xa0\x49\x6c\xad\x10\x10\x10\x10\x28\x35\xb8\xe6\
+\xb7\x4f\x64\x3f\x35\x60\x86\x64\x55\x87\xf9\x14\xd5\x47\xfc\x66\
+\xd2\x9d\xf3\x41\x25\x32\x34\x19\x0d\x26\x4d\xb2\xcf\x08\x7f\xf3\
+\xa7\x11\xba\xb3\x80\x80\x80\x80\x40\x29\xc0\x35\xa9\x11\x62\x7f\
+\x20\xec\xd5\xa3\x3b\x4f\x30\xda\x8a\x26\x41\xc0\x28\x19\x4c\x3e\
+\xd5\xe0\x33\x6a\xb9\xc3\x57\xdf\xd5\xe9\x63\xb8\xf1\x34\x04\x04\
+\x04\x04\x04\xae\x6d\x5c\xd3\x8b\x43\x1a\xc7\x47\xc4\xab\x8a\xc1\
+\xa0\x68\x06\xb5\x28\x56\x83\x9f\xa2\x69\xaa\x4a\xd5\xd1\x38\x3e\
+\xb2\x2c\xdc\x48\x53\x16\xf3\x84\x02\x02\x02\x02\xa5\x00\xd7\x24\
+\x11\xf2\x29\xbe\xce\x53\xd7\x8c\xcc\xf6\x7a\x7f\x71\x98\x64\x8b\
+\x4f\xd5\xbc\xcc\x31\x04\x7c\x9a\xe6\x0d\xb7\x98\x2c\xd9\x1e\xef\
+\xef\x5d\xa6\xae\x1e\x09\x37\x2c\xb4\x61\x9e\x02\x02\x02\x02\x02\
+\xd7\x34\xae\xd9\x39\x42\xb3\x6c\x94\xbc\x8a\xaa\x35\x8a\x8f\x08\
+\xfb\x63\x44\xfb\xb9\x31\x36\xf3\xf5\x2a\x91\x21\x91\xa4\x59\x0f\
+\xc2\x40\xc5\xf7\x92\x4a\x68\x4e\x75\x7a\x56\xdd\xf8\xfd\x86\x7e\
+\xbb\x92\x32\xb3\x78\x5c\x3d\x88\x80\x80\x80\x80\xc0\x35\x8c\x6b\
+\x76\x68\x14\x44\x86\x7d\x81\xbb\xcf\x65\xe5\x0c\xfa\x61\xd3\xed\
+\x16\x4d\xde\x4c\xd4\x66\x26\x76\xf3\xe9\x41\x00\x9f\x5b\xf1\x99\
+\x23\xc3\x1c\xbb\xde\x59\x73\xe6\x36\x90\xa0\xd5\x24\x63\xdf\xa1\
+\x20\x41\x01\x01\x01\x81\x52\x82\x6b\x82\x08\x89\xf0\x4c\xc4\x5f\
+\x05\x16\xc3\x60\x93\x3c\xb9\xcb\x9b\x4f\xa7\x25\x4f\x5e\x7b\x7c\
+\x70\x4c\xb8\xf5\x80\x47\x51\x11\x4e\x81\xc1\x75\x7c\x84\xe3\xe8\
+\xfb\x4b\xf7\xde\x3c\x69\xd3\xae\x33\x26\xa3\x51\x76\xfb\x14\x95\
+\x45\x0e\x80\x85\xd2\x36\xca\x46\xf0\xaa\x18\x2e\x15\x10\x10\x10\
+\xb8\xc6\x50\xe2\x87\x46\x25\x49\x32\x52\x19\x18\x79\xd1\x35\x3b\
+\x4f\x94\x79\x04\x00\x04\xe7\x53\x55\xe5\xdd\x1b\x1a\x35\x7c\xb6\
+\x6b\xdd\xc5\xa9\x99\xae\xf2\x70\x8f\x8d\xb0\x26\xbf\xb7\xea\xc0\
+\x0d\xcf\x2c\xdc\xbd\x9d\x38\x4e\x56\xd5\x50\x71\x25\x8a\x9b\xe7\
+\x6e\xa1\x0c\x3c\x62\x11\x8d\x80\x80\x80\xc0\x35\x85\x12\xad\x11\
+\x12\x2f\x99\x40\x82\xdb\xee\xbf\x6e\x5c\xe2\xe3\x5d\xef\x03\x09\
+\x92\x5b\xbe\x39\x40\x00\x24\x08\x32\x7c\x76\xd1\xee\x3d\xef\xad\
+\x48\xb8\x35\x36\xc2\x92\x13\x1b\x69\x75\xbd\xb7\x2a\xe1\x56\x90\
+\x20\xb4\xc6\x50\x24\x68\x31\x19\xcd\x20\xc1\x31\x1d\x6a\xf5\x74\
+\xdf\xd7\x75\x3c\x48\x10\xc4\xab\x7b\x0b\x08\x08\x08\x08\x5c\x03\
+\x28\xb1\x1a\x21\x86\x42\xb1\x3f\x70\xcd\xd0\xae\x37\x77\xac\x17\
+\x3d\x47\xd1\x0c\x4a\xc2\x99\xf4\x3b\x1a\x4e\x59\xf1\x3d\xc8\x90\
+\xca\x55\x60\x95\x28\xd7\x0c\x3f\xe9\xdb\xe4\x36\x83\x66\x30\x3e\
+\xba\x60\xe7\x0f\xdc\x4d\x0f\xe2\x07\x48\xd0\xe3\x53\xbd\x8f\xb5\
+\xa9\xd1\xe9\xe3\xbe\x4d\x7e\xf1\x1a\xa5\x32\x9b\x8e\xa7\x3e\xdb\
+\xe1\xcb\x95\xef\xe9\x04\x1c\x38\xd7\x28\x20\x20\x20\x20\x50\x42\
+\x51\x22\x89\xd0\x4c\x1a\x9c\x57\x51\x95\xfb\x5b\x56\x6b\xf2\x69\
+\xff\x66\xcb\xb2\x5c\xde\x58\x95\x88\x30\xd6\x61\xd1\xf6\x9c\xcc\
+\xb8\xa3\xe1\x97\xcb\x7e\x28\x8c\x0c\x65\xa3\x64\x54\xd4\xbc\xa1\
+\xd4\xc0\xeb\x40\x04\x90\x60\xd7\x8f\xfb\x37\xfb\x25\xc3\xe9\x89\
+\x51\x7d\xaa\x2f\x26\xda\x61\x5a\xbd\x6c\x5f\xff\x4e\x8b\xf7\xcc\
+\x37\x99\x64\x93\xcf\xa7\x08\x32\x14\x10\x10\x10\x28\xe1\x28\x71\
+\xc3\x7c\x58\xb1\x02\x12\x7c\xb8\x4d\xb5\xf8\x29\x03\x9b\xcd\xc8\
+\xf6\xf8\x62\x71\xac\xa8\x59\x96\x8c\xa9\x4e\xb7\xdc\xb0\x72\xd4\
+\x8c\x7d\x0f\xf7\x1a\x06\x12\x0c\x35\x4c\x0a\xe2\x03\x01\x16\x41\
+\x82\x26\x90\xe0\x98\x76\x35\x7b\x7c\x7c\x63\xb3\x79\x19\xb9\x9e\
+\x18\x49\x33\xa8\x26\x52\x1d\xd3\x32\x9d\x86\x0e\x1d\x6a\x7e\xf3\
+\x70\xeb\xea\x0d\x41\x82\x20\x64\x3d\x9a\x80\x80\x80\x80\x40\x09\
+\x45\x89\xd2\x08\xb1\x6a\x53\xd5\x34\xc8\xac\xe6\x8c\x1b\x30\xd7\
+\xa0\xaa\x03\x7c\x6a\xbe\xe3\xd3\x54\xaf\xaa\x49\x31\x76\xb3\x7a\
+\xe0\xa4\x36\xbc\xee\x97\xbf\xfd\x28\x19\x49\x33\x2c\x62\x33\x7d\
+\x20\x74\x12\xf4\x3d\xd5\xbe\x56\xb7\x0f\xfa\x36\x99\x9b\x9e\xe3\
+\x89\xa0\x37\x05\x55\x92\xf2\x5e\x18\xa8\xaa\x14\x4d\x92\xe4\x28\
+\x87\xbc\xf5\xd1\xdf\xf7\xf5\xf8\x64\xc3\xfe\x34\x22\x54\xf1\xb5\
+\x0a\x01\x01\x01\x81\x12\x8c\x12\xa5\x11\x72\x12\x5c\x7b\x77\x97\
+\x57\x8c\x9a\x3a\xc0\xab\xaa\x4a\xd0\x19\xa2\x46\x8b\x51\xd2\x52\
+\x9c\x5e\xb9\x6e\x45\xc3\xd7\x93\xdb\xd7\xee\x0f\x12\x24\x65\xee\
+\xbc\xe5\x84\x86\x08\x12\x24\x4d\xb0\xdd\x07\x3d\x1b\xfd\x98\x96\
+\xed\x8e\x30\x4a\xec\x93\x4d\xfe\xb8\x74\x2d\x13\x1b\xfa\xb2\x72\
+\xbd\x2d\xde\xe8\xde\xf0\x13\xb8\x89\x1d\x87\x02\x02\x02\x02\x25\
+\x1b\x25\x86\x08\xb1\x5a\x13\x24\xb8\x6e\x58\xd7\x91\x6d\x2b\x45\
+\xbd\xec\x26\xd2\x92\x43\xac\xe0\x24\x5e\x32\x5a\x49\x71\x4c\x73\
+\x2b\x8e\xbb\x7a\x36\x98\xfe\x58\x9b\x1a\x3d\x49\x6b\x64\xc3\xa1\
+\x7a\x90\x02\x20\x4d\x93\x0d\x93\x3e\xda\xb6\x46\xeb\xf1\xbd\x1b\
+\xff\x94\xe6\xf2\xc6\x53\x78\x45\x22\x2f\x3d\x88\x1f\x38\xa0\x9b\
+\x94\x4e\x9f\x49\x72\x0f\x5f\x39\xaa\xe3\xeb\x24\x93\x58\x49\x2a\
+\x20\x20\x20\x50\x82\x51\xe2\x3a\xf0\xd8\x28\x93\x8d\x98\xc7\xa0\
+\x12\x37\xd2\xcf\xc2\xf4\x31\xec\xae\xf7\xb9\x5c\xbe\xe8\x8f\x6f\
+\x6a\xf1\x4e\xaf\x9a\x65\xf1\x9d\x41\x95\x34\xc3\x90\x1b\xe2\x15\
+\x22\x4a\xd8\x9f\xf4\x6a\xfc\x76\xaa\xcb\x57\x49\x96\x0c\x9e\x50\
+\x24\xa8\x43\xa3\xf0\x06\xbb\xc9\x6c\x28\x13\x66\xb5\x72\x37\xdd\
+\x16\x10\x10\x10\x10\x28\x61\x28\x31\x44\x08\x6d\x10\x9a\x57\xdd\
+\xc9\x4b\x3e\x3f\x9e\x9c\x7b\x4f\xa4\xc5\x64\xf4\x2a\x6c\xd7\x43\
+\x81\x05\x2f\x04\xcd\xab\x69\xa6\x48\x9b\xc9\xf9\xea\xa2\xdd\xcf\
+\xfc\x95\x98\xe4\x21\x0e\x34\x92\x66\x18\x92\xb0\xe0\x07\xfb\xb5\
+\x15\xfb\x9f\x8b\x0e\x33\xa7\xfa\x0c\x06\x0b\xfd\x0c\x95\xae\x8a\
+\x85\x3a\x51\x36\xb3\xe9\x60\x5a\xce\xab\x0d\x3e\x5d\x3a\x96\x64\
+\xc2\x70\xad\x20\x42\x01\x01\x01\x81\x12\x8a\x12\xa5\x11\xea\x64\
+\x68\xaa\x31\x69\xf1\x57\xc7\xcf\x1a\x46\x47\x46\x85\x69\xee\xbc\
+\x13\xd1\x02\x49\x0b\x6e\x6a\x6c\x98\xd5\x30\x7d\xc7\xc9\x47\x5f\
+\x5e\x96\xb0\x18\x43\x9f\xc4\x81\xa1\x88\x8d\x01\x7e\x18\x3a\x7d\
+\x69\x45\xc2\xc6\xe9\xcb\x13\x1e\x88\xb5\x98\x0c\x6e\x4c\x48\xe6\
+\xd7\xf4\x40\x82\x5a\x34\x91\xe0\xe1\xb4\x9c\x71\x75\x26\x2e\x7e\
+\x85\x64\xc1\x49\x36\x82\x04\x05\x04\x04\x04\x4a\x30\x4a\xe4\x3e\
+\x42\x22\x20\xb6\x47\xf0\xd0\xf5\x8d\x87\xd7\xea\x5c\xe3\xeb\x54\
+\xa7\xcf\x6c\x92\x24\xac\xee\x94\x89\xab\x7c\x11\x56\x93\xe9\x78\
+\xba\xeb\xf5\xea\x9f\x2c\x7c\x09\xc4\x49\x61\xf3\xed\xf7\xc3\xea\
+\x53\x7a\x03\x90\xbc\xfa\x90\x28\x87\x64\xa4\xb0\x14\xff\xe0\xc3\
+\xdd\xc7\xd6\x88\x0d\x7f\x3b\xcb\xad\xf8\x64\xa3\x01\x8b\x71\x88\
+\x04\x35\x43\x94\xcd\x64\xdc\x9f\x9c\xf3\x64\x83\xc9\x4b\xc6\x23\
+\x5d\x93\x51\x52\x40\x8e\x79\xb1\x05\x04\x04\x04\x04\x4a\x22\x4a\
+\x24\x11\x02\x92\x6c\x34\x6b\x8a\xea\x5d\xd2\xb9\xee\xd0\x4e\x3d\
+\x1a\x4c\x75\xe5\x7a\xcc\xa4\xc2\x79\xcd\x46\xa3\xe5\x4c\xb6\x6b\
+\x66\xad\x4f\x16\x0f\xd7\x35\xb6\x7c\xa7\xc6\x40\x3b\x84\xa2\x07\
+\x06\x34\x1a\x24\xff\xfc\x20\x07\x8f\x73\xe8\xd1\x1e\x53\xca\x87\
+\x5b\xee\x53\x54\xc9\xeb\x53\x55\x39\xca\x66\x36\xee\x4b\xcd\x7e\
+\xac\xd1\xa4\xa5\x9f\x84\x22\x57\x01\x01\x01\x01\x81\x92\x89\xab\
+\x76\x68\x14\x9b\xd5\xb1\x79\x5e\xff\x59\x00\x20\x41\xb3\x49\x36\
+\x5d\xbf\x6a\xff\xf7\xaf\x2d\xd9\x3b\x2a\xca\x61\x76\x92\xb3\xc5\
+\x62\x94\x37\x0e\x9e\xbd\xf9\x21\x84\x21\x8d\x2d\x1f\xc9\x59\x4d\
+\x58\x1d\xaa\xaa\xf7\xb4\xa8\x14\xfb\x7f\x4d\x2a\xc4\xe2\xda\x4c\
+\x6e\xba\x37\x43\x9e\x66\x29\x49\x83\x67\x6f\x79\xc2\x62\xb2\x2f\
+\xf1\xa9\x8a\x39\xd2\x66\x96\x0e\xa7\x7a\x1e\x29\x0e\x09\x42\x66\
+\xb1\xd1\x5e\x40\x40\x40\xa0\xe4\xe0\xaa\x24\x42\xcc\xd7\x61\x51\
+\x0a\x19\xb5\x28\x32\xf4\xfa\x14\x1f\x91\x9b\xe9\x7f\x2b\xf7\xff\
+\x30\x76\xd1\x9e\x7b\xa2\x23\xac\x07\xff\x6f\xe5\x81\x51\xdb\xce\
+\xa4\x67\x80\x8c\x02\x87\x2d\xe9\xb7\xe4\x51\x34\xad\x5a\x94\x5d\
+\x7e\xba\x63\xbd\x19\x2f\x74\x69\x30\xab\x7e\xa4\xdd\x0c\x75\x2f\
+\x30\x0f\xaf\xaa\x6a\x26\x52\x15\xb7\x9d\x49\x73\xbe\xb6\x7a\xff\
+\xa8\xd8\x68\xfb\x9e\xc4\x73\xee\x31\xb5\x27\xfd\x39\xa9\x38\x24\
+\x08\x99\x21\x7b\x51\xdb\x35\x04\x04\x04\x04\x04\xae\x1e\x5c\x75\
+\x43\xa3\x44\x36\x6c\xbf\xe0\xa2\x91\x1d\xee\x59\x79\x34\xf5\xc0\
+\xab\x2b\x12\x56\xb0\x6f\x0d\x6a\x06\xa5\xb0\x55\x9f\xd8\x30\x8f\
+\x8d\xef\x2d\xcb\x47\x85\x6f\x3b\x9b\x99\xe1\x51\x54\xb6\xf1\x5e\
+\xf7\x36\x98\xc9\xdb\xa7\x69\x48\x57\xd9\xff\xe8\xf5\x53\x6a\x44\
+\x39\xee\x73\x91\xfb\xc9\xf4\xdc\x6f\xeb\x4f\x5c\x32\x0a\x79\x92\
+\xf6\xa8\x05\x12\x27\x25\x68\x54\x29\x8d\x6e\xd5\xe2\xa3\x8f\xa4\
+\x3b\x73\x8e\x66\xe6\x10\x8d\x86\x5e\x70\xc3\xb6\x65\x48\x06\x19\
+\x87\x80\xbf\xdc\xb5\x5e\xd7\x2e\x55\x63\xea\xde\x30\x7d\xdd\x17\
+\x94\xae\x58\x51\x2a\x20\x20\x20\x70\x95\xe3\xaa\x22\x42\x0b\x69\
+\x71\x44\x62\xca\xf8\xde\x8d\xba\x8e\xe9\x52\xef\x53\x4f\xb6\x33\
+\x67\xed\x69\xe5\xd5\xeb\xa6\xfe\xf5\x3b\x71\x8a\x8c\xa1\xce\x40\
+\xb2\x0a\x84\xfe\x29\x25\x15\x9c\x44\x84\x94\x2f\x0c\xc5\x65\x9a\
+\x5c\xc2\x23\xdd\x5f\xa9\x13\x13\xfe\x72\xba\xdb\xe7\x83\xba\x16\
+\x69\x35\x99\x0e\xa6\x65\x7d\x58\x77\xe2\xb2\xa7\x78\x98\xbc\x18\
+\x79\x80\x86\xe7\xa3\xa4\xc0\xb2\xc1\x73\x89\x1c\xd0\x34\x29\x0c\
+\x23\xde\xa5\x77\xde\xd0\xbf\x53\x45\xf3\xcb\x96\x30\x7b\xd8\x87\
+\xab\xf6\x3f\xf8\xe4\x82\x5d\x2b\x79\x99\xf4\xe0\x02\x02\x02\x02\
+\x02\x57\x19\xae\x1a\x22\x24\xce\x91\x88\x6c\xb4\x67\x3a\xd6\xad\
+\xf0\x4e\xf7\x3a\x53\x33\x5c\xbe\x78\xc9\x60\xf0\x45\x87\x59\x6d\
+\x87\xd2\x73\x3e\xae\x35\x61\xf1\x14\x22\x2b\x23\x11\x8b\x21\xd4\
+\x57\xe4\x01\x90\x52\x30\x51\xf2\x95\xa0\x87\xee\xed\xf6\x70\xb5\
+\x8a\x91\x13\x33\x73\xbd\x8a\x45\x96\xd8\x1c\x9e\x47\xd1\x7c\x51\
+\x36\x22\xc3\xe4\xdc\xb1\xf5\x26\x2f\x7e\xb7\x10\x32\x2c\x90\x26\
+\x87\x95\xd8\x97\x48\x8e\x6d\xeb\x38\xf8\xd8\xf5\x0f\xd6\x8e\x09\
+\x7f\x24\x3d\xc7\xe3\xd2\x0c\x9a\x29\xca\x6a\x3e\xfb\xdc\xba\x84\
+\xbb\xde\x59\x72\xe0\x0c\x25\x21\xce\x23\x15\x10\x28\x04\xf4\xdc\
+\xc5\x92\x85\x95\xe0\x67\xf3\x5c\x4a\x37\xa8\x3e\xf0\xb1\x00\x7c\
+\x3c\xfc\x2c\xd5\x89\x87\x39\xfe\xc3\x40\xdf\x47\x56\x05\x32\x49\
+\x94\xa7\x9b\x39\x96\x22\x5c\x35\xf3\x58\x9c\x27\x5e\xed\x52\xf7\
+\x39\xb7\x4f\xad\x4c\x04\xe4\x21\x63\x48\xcb\x71\x3b\x6b\x84\xdb\
+\x9f\x3c\xf6\xf8\x0d\xaf\xd6\x8b\x0b\xb7\x80\x04\x2d\x41\x0b\x5c\
+\x38\x82\x09\x0b\xf3\x74\x20\xc1\xaf\xaf\xab\x77\x6b\xad\xf2\x11\
+\x13\xd2\x9d\x5e\x8d\x48\xd0\x88\x40\x30\x20\xc4\x34\x97\x57\xa9\
+\x57\x3e\xfc\x9d\xaf\xfa\x37\x19\x01\x12\x24\x42\xce\x97\x76\x61\
+\x24\x08\x19\x20\x0b\xc9\x64\x3d\xfe\xd8\x0d\x6f\xd4\x8c\x70\x8c\
+\x81\xac\x66\x59\x02\x79\x7a\xc8\xaf\xea\x2b\x9d\xeb\xfe\x07\x61\
+\x43\xa7\x50\xb2\x40\x0f\x0a\x60\xd2\x8d\x98\xff\x14\xb8\x24\xf0\
+\x36\x44\xf6\xcd\x64\x6d\x27\xb3\x83\xae\xef\xd2\xdd\xae\xc9\xf6\
+\x85\x72\x91\xe1\xcf\x50\xbe\x53\xae\xf8\x6f\xb2\xa2\xc9\xfa\x85\
+\xcc\x1e\x32\xf8\xb6\x6a\xa4\xee\x9e\x2f\xfc\xe5\x00\x4f\x93\xac\
+\x30\xb2\x7e\x20\x83\x3c\xe7\xd0\x6f\xbc\x98\xfc\x23\x79\x5e\xad\
+\xb8\x2a\x1a\x1c\xd5\x37\xe6\xef\xb4\xb5\xf7\x74\x19\x6e\x35\x6a\
+\x3d\xbd\xaa\x96\x45\x77\x00\x5a\x9b\x64\x25\x36\xcb\xf4\xf8\x32\
+\x2a\x47\xd8\x6e\xff\xfd\xf6\xd6\xef\xf5\xae\x55\x25\xda\xe3\x53\
+\x55\xcc\xe1\xe5\xc5\x0e\x0d\xf8\x13\x87\xa9\xaf\x77\xab\xdf\xe3\
+\x8e\xeb\xea\x7d\x91\xe6\xf1\xc9\x56\x23\x29\xc0\x94\xa6\x1e\x04\
+\x64\x88\xf4\x8d\x69\x39\x1e\xc3\x1d\xcd\xab\x4d\x7e\xbd\x5b\xbd\
+\x5e\x18\x02\x2d\x4e\xda\x90\xa1\x77\xed\x2a\xd1\xf3\x6f\x6f\xfd\
+\x7e\xa5\x08\xfb\x2d\x24\x63\x3a\x64\x25\x6f\xb4\x1e\xd9\xab\x69\
+\x59\x16\x8f\xa1\xf7\x9a\xd1\x1d\x86\xa2\x6c\x28\x63\x5e\xec\x12\
+\x0b\x8c\x1e\xf8\x60\xe8\x1a\xe5\x29\x35\x0f\x89\xc0\xe5\x05\xda\
+\x0e\xb5\x23\xac\xce\xc6\x33\xfe\x32\x99\xca\x64\xca\x92\x79\x9d\
+\xdc\x1c\xba\xdf\x35\xd5\xbe\xf4\xf2\x50\xd1\xfc\xcf\x50\x30\xd1\
+\xf0\xfe\x61\x04\x99\x7e\x64\x70\xba\xd5\x20\x32\xb7\x91\x01\xfe\
+\x89\x95\xe8\x3c\xcf\xc1\x64\x6e\x21\x83\x3c\xfb\x92\x19\x4e\x06\
+\x28\xe9\x7d\x56\xb1\xf1\xaf\x17\xd4\x08\xad\x8d\x1a\xfe\xb8\xce\
+\xb5\x1b\xb5\x29\x17\xf9\x90\xd3\xa7\x38\x03\x0f\xd3\x06\x59\x59\
+\x8c\x92\x29\xdb\xed\x4b\xaf\x10\x66\xed\xf1\xe7\xc8\x0e\x9f\xbc\
+\x75\x7d\xe3\xf2\x58\xc8\x82\xd7\x2b\x3d\x58\x01\x70\xc2\xbb\xb9\
+\x41\xd9\xfa\xb2\xaa\x45\xe9\x9f\x62\x2a\x50\x5e\x0a\x04\x76\xf4\
+\x12\x87\x85\xdf\x5c\xbf\x62\x7d\xb8\x05\x92\x65\x30\x90\x27\xf2\
+\x7e\xa3\x7b\xa3\x72\x24\xcb\xc4\xf2\x61\xd6\xee\xd9\x1e\x6f\x3a\
+\x64\x0c\x8c\x87\x32\x38\x15\x25\xb7\x4d\xf9\xd8\x87\xc7\x75\xae\
+\xd3\x08\x65\x44\x59\x75\xef\x92\x08\x0b\x15\xfd\x49\x32\x13\xe9\
+\xba\x19\x9e\x68\xba\x2e\xb4\x9e\x04\x04\x8a\x01\x74\xbc\x31\x79\
+\x97\x6c\x90\x26\x9c\x8c\x8d\xfd\xba\x86\x80\xe7\x04\xcf\x0b\x5d\
+\x36\xa1\xcb\x09\x64\x5e\xa5\xeb\x32\x41\xcf\x10\xb7\xe3\x75\x9b\
+\xaf\x2b\x80\x86\xf8\x4f\x03\x2f\x21\x00\x9f\x72\x8a\xd3\xed\x52\
+\x83\x7f\xbd\x63\xe6\x33\x67\xb7\x34\xac\xd8\xca\x64\x32\x55\xf4\
+\xa9\x9a\x2f\xb8\x77\x45\x10\x22\x2a\x93\xa2\x49\x19\x29\x99\xe9\
+\x2d\x9e\xeb\x56\xf3\x8b\x27\xda\x54\x8b\x23\x42\xd2\x30\x87\x97\
+\x17\x2a\x3f\xc8\x4b\x41\x23\x6b\xf2\xe9\x8a\x89\x7b\x93\xb3\x5e\
+\x8f\xb1\x5b\xcc\x5e\x45\x2d\x90\xb6\x57\xd1\x7c\xb1\x76\xb3\x79\
+\xef\xb9\xac\x37\x9b\x4c\x5e\x8a\x46\x8a\x46\x1b\x72\x71\x0b\xf2\
+\x42\x9e\x8f\xb7\xad\x15\x3b\xee\xfa\xda\x5f\xa4\x66\xa4\x35\x87\
+\x4c\x90\x4d\x2f\x86\x1f\xc8\xc7\xa7\x1a\x14\xb3\x59\xae\x34\xb8\
+\x51\xe5\xd6\x70\xe3\x65\x2d\xa1\xf8\x9c\xcc\x07\x64\x1e\x26\xf3\
+\x23\x55\x53\x1c\x55\x85\x20\x43\x81\x4b\x01\x9e\x08\xfe\x54\xa0\
+\x1d\xc1\x94\xec\xa7\x24\x08\x7a\x7f\x82\xe7\xa4\x22\xfd\xfc\x83\
+\xcc\x63\x64\x5e\x22\xf3\x1d\x19\xa6\x22\xc2\x0e\x00\x27\x23\xde\
+\x37\x5f\x89\xfa\xe0\xfd\x1d\xcf\xb3\xd4\x2d\xee\xbb\x0a\x88\x30\
+\x6f\x18\xa4\xf5\x94\x15\xd3\x36\x9f\x4c\x79\x35\xc6\x6e\x0e\x73\
+\xf9\x54\xc8\x55\x60\x41\x0c\x36\x29\xd8\x4c\x46\x4d\x71\x99\x4f\
+\xac\x38\x9e\x95\x09\xb7\xa2\xe6\xdf\xf4\x06\x68\x6c\x34\x79\xd9\
+\x4b\x7b\xce\x65\x4e\x24\x32\x34\x79\x89\x68\x75\x6f\x9c\x31\xea\
+\xb3\xd9\xcd\xa6\x9d\xe7\x32\x3f\x6f\x3c\x79\xd9\x38\x84\x0d\xd1\
+\x30\xfd\xe0\x79\xad\x38\x96\x96\xe9\x73\x9a\x8e\x5b\x4d\xb2\xc6\
+\x36\x4e\x14\x84\xe2\xf2\x29\x72\x8c\xc3\x14\xb6\xe5\x74\xfa\xcb\
+\xad\x3e\x5b\x3a\x15\x65\x44\x59\x75\xff\x92\x88\x3b\xc8\xe0\x01\
+\xc1\xe4\x7d\x1d\x32\xb5\xc9\x00\xff\x7a\x1b\x12\x28\xb1\xe0\xe4\
+\xc7\x11\xea\x59\x2a\xe9\xe0\xcf\x47\x47\x32\x20\xc3\x1c\x32\xe8\
+\x83\xda\x50\x97\xc0\x9e\x21\xf4\x3b\xb0\x75\xfc\x1b\x75\x10\x9c\
+\xe7\xb5\x78\x1f\x8a\xc4\x55\xd1\x89\xe9\x84\x25\xb5\xfa\x72\xd5\
+\xb4\x4d\x29\x99\xff\x89\x8d\x76\x68\xa4\xa9\x59\x88\x77\x02\xdf\
+\x4c\x70\xde\xa7\xcd\x6e\x32\x9e\x7a\x65\x75\xc2\xab\x5b\xcf\xa4\
+\x62\x38\x93\xad\x34\xd5\xfd\x43\xc2\x04\xa6\xca\x23\xc3\x47\x77\
+\x25\x65\x7c\x4f\x44\x6a\x22\xad\x0e\xe3\xf4\x8a\xd1\x24\x9b\x8c\
+\xe7\xb2\xe6\xde\xf2\xdd\xfa\x87\x90\x3f\xc2\x16\x05\xe4\x85\x3c\
+\xb7\x9d\x49\xf5\xbd\xbc\x2a\xe1\x35\xbb\x45\x3e\x4d\xc4\x8a\xa1\
+\x1c\x3f\xc1\x91\x30\x3e\xaf\xaa\xda\x62\xa3\x22\xbc\x9b\xce\x38\
+\x9f\x6a\xf9\xf9\x8a\xe9\x48\x1b\x65\xd4\x83\x94\x54\xa0\x8c\x68\
+\x2f\x58\xd1\x06\x94\x64\x52\x17\x10\xb8\x52\xe0\xcf\xfd\x5e\x32\
+\x38\xfd\x0a\x0b\x53\xb0\x42\xf3\x18\x99\x13\x64\x80\x92\xde\x37\
+\x94\x78\x5c\x35\x6f\xf3\x18\xe1\x04\x17\xb5\xfe\x74\xc5\xef\xdf\
+\xcf\xdf\xf1\x90\xc5\x6a\x4a\xa6\xe6\x61\x23\xfa\x60\x1a\x9c\x57\
+\x51\xa5\xe8\x48\x9b\xef\xeb\xbd\x67\x5f\x7b\x7d\xf9\xae\xd3\xd8\
+\x9f\x17\xb8\x25\x01\x04\x05\x37\xfd\xa7\x1f\x14\x4f\xb5\xe8\x04\
+\xf7\xc6\x8f\x9b\xef\xb2\x1b\xa4\x05\x94\xa0\x49\x51\x0d\x72\x84\
+\x55\x5b\xf6\xfc\xb2\xdd\x23\x0e\x64\x39\x15\x93\x2c\x61\x9b\x44\
+\x81\xce\xdd\x4c\x69\x92\xf1\xd7\x13\xf2\x44\x3e\xff\x5b\xb1\xeb\
+\xcc\xd7\x3b\x4e\xbd\x1a\x1d\x6e\xc3\x09\x38\x2c\x03\xc8\x4a\xde\
+\x8e\x08\xab\xe9\xd4\x13\xf3\xb7\xdd\xdb\xfa\xf3\xc5\x7f\x91\x58\
+\x26\x94\xed\x1a\x00\xea\xa0\xd4\xbd\x29\x0a\x08\x5c\x0a\xe8\xfd\
+\x97\x8d\x78\x91\xbd\x9b\x7e\x8e\x22\xb3\x96\x0c\x86\x48\xef\x24\
+\x37\x17\x79\x15\x39\x0a\x25\x70\x65\x70\xd5\x10\x21\x36\xc1\x13\
+\x7c\x44\x3a\xa6\xa1\xeb\x0e\x6d\x1c\xb3\x60\xe7\x83\xe1\x56\x39\
+\x91\x98\x29\x5c\xd1\x34\xb7\xdd\x6c\x0c\xdf\x7e\x2a\x7d\xda\x3d\
+\x73\x36\xaf\x42\xe3\x09\xdc\xa4\x8e\x3d\x88\x18\x60\x80\x1b\xb6\
+\x3f\xe4\xfd\xfe\x1b\xf8\x2c\x13\x08\x6d\x66\x5a\xb6\xfb\xf1\x25\
+\x7b\x86\xc7\x59\x4d\xbb\x62\x1c\xe6\xfd\x8f\x2d\xd8\x3d\xe4\x83\
+\x7d\x49\xd9\xf0\xc3\x51\x6b\x7a\x70\x3f\x90\x16\x91\x9c\x02\xd1\
+\x40\xb4\xba\xb3\x01\xf9\x40\x86\x7b\xe6\x6e\x5d\x45\x32\x4d\xb5\
+\x9b\x65\x26\xa3\x6a\xd0\xc2\x89\x04\x13\x1e\x5e\xb0\xf3\x81\x8f\
+\xd6\x1f\xda\x89\xb2\x50\x54\x5f\xf0\x06\x7f\x01\x01\x81\xd2\x03\
+\x74\x6c\x3a\x19\xce\x26\xd3\x91\x4c\x3f\x32\xdb\x74\x3f\x31\xb2\
+\x72\x15\xe0\x5f\x21\x42\x34\x8a\x40\x62\x09\x04\x11\x8f\xcf\x6a\
+\x92\xe5\x29\x5b\x8e\x1e\x7c\x90\x08\x25\x32\xcc\xb2\xd5\x2c\x49\
+\xd5\x25\xa3\xbc\x61\xd8\xcf\x9b\x71\xde\x27\x36\xe3\xf8\x89\xc5\
+\x62\xca\xdb\x88\x3f\xb2\x69\x85\x72\x3b\xef\xbf\x6e\x08\x5d\xd3\
+\x2f\x8d\x2d\x6c\xd1\x83\x30\x80\xd0\x70\xfa\xcc\x84\xf5\x89\x69\
+\xff\x59\xbc\xf7\xd6\xb1\x8b\x76\xdf\xfc\xf1\xba\x23\xe7\xa0\xdd\
+\xc1\x4f\x0f\xe6\x07\xb2\x41\x5a\x3b\xfa\x37\x1f\xf0\x62\xb7\xfa\
+\x0d\x41\x86\x14\xdf\x5f\x5f\x90\x01\xb2\x0c\x9b\x43\x32\x99\x8c\
+\x1b\x48\xc6\x1a\x91\x76\xcb\x16\x92\xf9\xa1\xcf\x36\x1f\x3b\x86\
+\x32\xa0\x2c\x7a\xf0\x7c\x40\xd9\xa9\x10\x57\xcd\x4b\x88\x80\x80\
+\xc0\x3f\x0b\x22\x3c\xf4\x17\x32\x7b\xf2\xf3\xec\x7f\x62\x3b\x84\
+\xc0\x45\xe2\x8a\x77\xc6\xd4\x00\xd8\x7c\x19\x74\x24\x22\x84\x90\
+\xf9\xbb\x7d\x8a\x42\x04\x27\x4f\xde\x74\x34\xe9\xee\xdf\xb6\x3f\
+\x62\x8f\x0e\xff\xf6\xb9\x45\x7b\xdf\xdd\x73\x2e\xcb\x8b\x73\x3d\
+\x41\x7c\x7a\x50\xac\xfa\x64\xf6\x7f\x3b\xd7\x7b\xa6\x49\xc5\x98\
+\x0f\x8e\x8d\xe9\xf5\x14\xd2\xc7\xd1\x68\xc1\x64\x48\x9a\x99\x42\
+\x6e\xc6\x77\xd6\x1e\xda\xff\xee\xda\xc4\x7d\xb8\x0e\x75\xfc\x19\
+\x1a\x2b\x44\x3c\xfd\xe4\x80\x3b\x9a\xb6\xaa\xf6\xe1\x6b\xdd\x1b\
+\xbd\x7a\x4f\xcb\x86\x11\x14\x5f\xb5\xca\x32\x4b\x13\x32\x10\x07\
+\x4b\x90\xe9\xf9\x85\xbb\xdf\xb5\xc7\x86\x4f\xbd\x7b\xfe\xce\x47\
+\x3f\xdb\x74\x34\xd9\x42\x24\x88\x32\xb0\xc4\x82\x00\x12\x64\xca\
+\xaf\x7a\xed\xed\x95\x12\x10\x10\x28\x1c\xf4\xd4\xa3\x4f\x40\xf7\
+\x84\x73\x8b\x43\xf6\x0f\x02\xff\x0e\xae\x28\x11\x72\x12\x5c\x32\
+\xaa\x57\xab\xce\x55\xa2\x2b\x10\x21\xb0\x21\x4b\xdd\x3b\x1f\x3c\
+\x3e\xd2\xe0\x8c\x46\xe3\xd4\x6d\xc7\xb2\x0c\xe3\x66\x3d\xf7\xf1\
+\xe6\xc3\xbb\x89\x03\x25\xaf\xf2\xf7\xf1\x6a\x3a\x61\x69\x27\xc6\
+\xf4\x19\x53\x23\xca\x71\x63\x72\x46\xee\xf1\x4a\x61\x96\x87\xce\
+\x3c\xd5\xfb\x95\xc6\xf1\x11\x38\x03\x34\x94\x66\xa8\x82\xc0\xc8\
+\xb0\x2f\x45\xe8\xce\x0c\x08\xab\xcb\xa8\x9e\x7e\xa6\xcf\x13\x65\
+\x1d\xca\x8b\xc9\xd9\xce\x64\x57\x6e\x6e\xe3\x97\x3a\x95\xc7\xc6\
+\x5f\x83\x47\xcd\x9b\x0f\x04\x10\x1f\x32\x4d\xd8\x74\x74\xb7\xe1\
+\xb9\x59\xcf\x4f\xdb\x7a\x2c\x0b\xe9\x7a\x0a\x21\x41\xf2\x62\xf3\
+\x9a\x9f\xdd\xdc\xb9\xfe\x9a\x1e\x8d\x3a\x43\x76\x29\x68\x18\xb7\
+\xa4\x03\xf7\x04\x75\xa8\xff\xbc\x20\x20\x1e\x81\x9d\x5c\x93\x77\
+\x99\x0f\x70\x2b\x70\x22\x47\x71\xa0\xc7\x05\x0a\xc8\xc6\x5c\xff\
+\x7e\x53\x0f\xc6\x45\xe7\x19\x0c\x3d\x2d\xe4\xc3\xa0\x3b\x17\x0a\
+\x0a\x72\x49\xcf\x26\xe2\x93\x29\xac\x2e\x2f\x5a\x23\xc9\x8b\xee\
+\x4f\xb3\x80\x8c\x70\x23\xc3\xea\x2c\x00\x2c\xbc\x1e\xe4\x82\x40\
+\xd1\x98\xac\x88\x1f\x04\x7f\xf9\xf4\xa0\xc5\x86\x1e\x17\xb8\x68\
+\xb9\x02\xc1\x52\x0a\x48\x53\x77\x2e\x00\xee\x07\x1b\x01\x99\xe3\
+\x65\x06\xd2\x25\x5c\xf6\x3a\x3b\x1f\xf4\xb4\x91\x27\xaf\x87\x40\
+\x30\x79\xf4\xa0\xc5\x46\x5e\xd4\xc2\xeb\x15\x6e\x64\x82\xdb\x38\
+\xbb\xd6\x83\x14\x1b\x97\xbd\x42\x0a\x03\x48\x06\x1d\xff\xb0\x46\
+\x95\xe2\xaf\xaf\x1d\xf6\xe1\xdc\xdb\xdb\x7d\xfa\x76\xcf\x3a\x35\
+\x31\x2c\x49\x92\x87\xac\x24\x1f\x4e\x79\xa1\xf2\x92\x3f\x3b\x16\
+\x8d\x8d\x79\xea\x80\x36\x07\xc2\xfa\x7a\x50\xab\xfe\x95\x63\xac\
+\xf7\xa5\x3b\xbd\x19\x0e\x8b\x6c\xca\x72\xfb\x52\xe3\x6d\xa6\x11\
+\x8b\x86\x77\x78\xbd\x51\x99\xc2\xc9\x10\xf9\xea\x3f\x19\x10\x06\
+\x61\x21\xe3\xa9\x67\xfa\x3c\x57\xd6\x22\x3f\x9a\xe5\x56\x33\x1d\
+\xa4\xdd\x11\x29\x67\x54\x89\x0a\x1f\x70\xec\xd1\xeb\x1e\x40\x9e\
+\xa8\x6c\x3d\x1a\x93\x09\x42\x41\x46\xc9\xa0\x21\x8d\x50\x73\x8d\
+\xe0\x3b\x23\x79\x29\x13\xfb\x36\x6d\xf7\x40\xf3\xb8\x2f\x3a\x5e\
+\x57\xeb\xb5\x61\x4d\x2a\xc4\x6a\x94\x40\xb0\x7c\x25\x19\xa8\x1f\
+\xfd\xb2\xd8\xd0\x1b\x2f\x7b\xa9\x21\x60\x45\x2f\x6a\x35\x18\x70\
+\x83\x1f\xdb\x12\x43\xa6\xd8\x75\xa6\xc7\x05\x98\x0d\x37\x3d\x0d\
+\x7c\x84\x19\x60\x5f\x16\xc9\xbb\xcc\x87\x8b\xce\x33\x10\x88\xab\
+\xa7\x85\x7c\x18\x74\xaf\x42\x41\x41\x2e\x6a\xee\x88\xcb\x89\xf8\
+\x64\x0a\xab\x4b\xa6\x91\x20\x1c\xe1\x82\x3a\xa8\xbc\xe8\xfe\x34\
+\xf3\xbd\x94\x22\x31\xb8\x91\x61\x75\x16\x00\x16\x5e\x0f\x5a\x5c\
+\xb0\x8e\x9c\xa2\x31\x59\x11\x3f\x08\xfe\xf2\x21\x1c\xa1\xd8\x7d\
+\x99\x1e\x17\xb8\x18\xb9\x0a\x80\xa5\x14\x90\xa6\xee\x5c\x00\xf0\
+\xcb\x0b\x72\x79\xf2\x0d\x84\x5e\x07\x81\xed\xf9\x7c\x75\x86\xfa\
+\xba\xe4\xfe\x1f\xe9\xc0\xe8\x69\x23\x4f\x5e\xc6\x40\x30\x79\xf4\
+\xf0\xec\xbe\xb2\xc8\xc5\x00\xc5\xf3\xd7\x19\x8f\x47\x56\x60\x9e\
+\xc1\x6d\x9c\x5d\xb3\xc8\x17\x00\x34\x34\xfd\xf2\x9f\x05\x17\x3c\
+\xf1\x91\xde\x2f\x56\x08\x37\x8e\x20\xbd\xce\x1b\x1e\x69\xcd\xfe\
+\x7a\xed\xa1\x97\x46\xcf\xdf\xb9\x88\x8a\x46\xaa\xa1\xa4\x15\xf6\
+\xa9\xa5\x40\x10\x6f\xb0\xe3\xd3\xde\xe8\x51\xbf\xee\xb8\x8e\x75\
+\xbe\x49\xcf\xf5\xd8\x89\x4c\xfc\x27\xc7\x60\xaf\x60\xb8\xc5\x14\
+\x97\xec\xf6\xce\xea\xf9\xed\xda\xff\xee\x4c\xca\xc4\x22\x9a\xf3\
+\x6e\xb5\x00\x4e\x3d\xdd\xe7\xb9\x72\x56\xd3\x3d\x59\x1e\x5f\xaa\
+\x99\xf2\x21\x27\x54\xbe\xe6\x56\x34\x43\xac\xcd\x64\xf9\x66\xed\
+\xa1\xc7\xee\x5a\xb2\x77\x05\x97\x81\x45\x2a\x02\x20\x6c\x9d\x60\
+\xd5\x5d\x0f\xf6\x1f\xd1\xa0\x8c\x61\x6c\x96\x53\x51\x6c\x16\xd9\
+\x7e\x2a\x39\x7b\x5a\xcd\xcf\x97\xbf\xc9\xeb\x46\x8f\x72\x55\x82\
+\x64\x0c\xae\xbb\x43\x64\xb0\x27\x2a\xf0\x61\x42\x98\x05\x64\x5e\
+\xa2\xf2\x60\x45\x1c\x7b\xf9\x61\x3e\x85\x00\x65\x27\x0b\xc1\x40\
+\x36\x38\x55\xa3\x3b\x99\xf6\x64\x1a\x90\x89\x20\x03\xa4\x91\xc1\
+\x39\x88\xab\xc9\xac\xa0\xa0\xe9\x48\x9b\xae\x59\xc7\x4b\x76\x48\
+\x20\x6d\xf8\x93\x7d\x37\xfd\xc4\x41\x00\xab\xc8\x3c\x47\x6e\x7c\
+\xb5\x1e\xfc\x70\xae\x62\x37\x32\xd8\xe7\x85\x3c\xa3\xc8\x40\x66\
+\xec\x53\x45\x9e\x6b\xc8\x2c\xa7\xb0\xa9\x14\xf6\xbc\x79\x06\x23\
+\x20\x9f\x32\xf4\x13\xc7\x65\x5d\x4f\x06\x47\x8a\x61\x19\x7d\x61\
+\x1d\x02\xd2\xff\x91\xcc\x1b\x14\xf7\xbc\x6d\x16\x08\x96\x8d\x7e\
+\xd6\x25\x0b\x75\xd9\x86\x4c\x4d\x32\x38\xc5\x05\x7e\xa7\xc9\x60\
+\xa1\xc6\x0a\x32\xeb\x29\xbc\x0f\x32\xd2\x35\xb2\x2a\x34\x2f\xa4\
+\x0f\x7f\xb2\x1c\xf4\xf3\x0d\x32\x9d\xc9\x4c\x26\x27\x7c\x6e\x0c\
+\x64\xca\x3a\x20\xba\xae\x45\xd7\x28\x23\xcf\x17\xf7\x70\x23\x99\
+\xe7\xc9\x3b\x0b\xe9\xd0\x35\xcb\x8c\x2e\xed\x74\x89\x6d\x05\xd5\
+\xe0\x46\x40\x9d\xd7\x24\xaf\x14\xfc\xd0\xd3\xc5\x61\x14\xb8\x3f\
+\xcd\xc9\x60\x1f\x1e\xdc\xb0\x97\xf5\x08\x19\xa4\xbb\x94\xc2\xef\
+\x23\x9b\xd5\x35\x59\x48\x3a\x64\x39\x90\x37\xfc\xc8\x7a\x94\x7e\
+\x8e\x26\xb3\x90\x0c\xda\xaa\x87\xfb\x21\x5c\x71\x11\x90\x1e\xda\
+\xcc\x3b\x64\x20\xe3\x78\x72\x9a\x19\x98\x1e\x5d\xf2\x36\x80\x36\
+\x86\xba\x4b\x22\x83\x29\x9c\x13\x3c\x1c\x59\xec\xc0\x7f\xb2\x31\
+\xf2\xf4\x0a\x19\x1c\x7c\x6d\x25\xf3\x34\xb9\x7f\xc0\xfd\xe9\x77\
+\x01\x90\x5f\xe0\x33\x84\x76\xd5\x81\x4c\x57\x32\x4d\xc8\xa0\xdd\
+\xa1\xce\x73\xc9\xec\x27\xb3\x8e\xcc\x32\x0a\x8a\xbc\x79\x9e\x4f\
+\x91\xdb\xfb\x64\x50\xaf\x68\x27\xa8\x13\x1c\x77\x07\x62\x2d\x74\
+\x08\x37\x28\xdf\x1a\x74\xcd\xef\x3b\xf6\x47\xf2\x6d\x65\x28\xeb\
+\x0e\x32\xcb\xc9\xac\xa5\xa0\xac\xae\xe9\x9a\x45\x84\x1d\x0c\xf8\
+\xeb\x69\x62\xab\x16\x0e\x1f\xc0\x91\x73\xdf\x92\xd3\x78\x72\x0b\
+\xcc\xb3\x0a\x5d\x23\x4f\xf4\x17\x68\x6b\xb8\x0f\x68\x0b\xa8\xdb\
+\x54\xb2\x8b\x0d\x64\xa8\x5f\xfe\x73\xc0\x10\x27\xb4\xbb\x4f\x07\
+\xb4\x6e\xf1\x50\xeb\xaa\x5f\xa5\x67\xe6\x80\x98\x7c\xf4\x9a\x60\
+\x8b\xb6\x9a\xcd\x67\x92\x33\x3e\x29\xff\xd9\x8a\x4f\x51\x01\x26\
+\x52\x8e\x48\x5b\x2b\x54\x28\x4e\x68\x4d\xcb\x45\x46\x6f\xbc\xbb\
+\xcb\x67\x8a\xa2\x36\xa4\xda\xce\xa5\x9a\xcd\xf7\x66\xab\x93\x61\
+\x6c\x8a\xdb\xfb\xcb\x8d\x33\xd7\xbf\xbc\xf1\x54\xba\xb3\x28\x32\
+\x6c\x55\x31\x46\x9e\x3f\xa2\xfd\xb8\x32\x66\xe3\x1d\x59\x1e\x25\
+\x3d\x80\x04\x39\x54\xb7\xaa\x59\x62\x23\x1d\x69\xf7\xce\xd9\x72\
+\xef\x17\x5b\x8f\x1c\x02\xc9\x41\xbb\xd4\xfd\x0b\x80\xfb\xb7\xaa\
+\x10\x6d\x5b\x30\xac\xfd\x73\xf1\x61\xe6\x61\xa4\xb9\x66\x51\xda\
+\x0a\xc9\x27\x47\xdb\xcc\xd2\xa4\xd5\xfb\xee\x7e\x78\xe9\x81\xed\
+\xbc\x8e\xf4\xa8\x57\x1d\xe8\xd6\x14\xa7\xa1\xe0\xa1\xc1\x7d\x40\
+\x43\xfc\x90\xe2\x9c\xef\x41\x62\xfe\x64\x97\xa3\x9f\xcf\x92\xc1\
+\xf2\x72\x90\x21\xf2\x0a\xac\x7b\x80\xbb\x9d\x24\xf3\x19\x99\x8f\
+\x28\x6e\x66\x61\x79\x90\x3b\xef\x7c\xd0\x91\xe2\xe1\x47\x5c\xdc\
+\x53\x74\xc8\x6f\x91\x3b\xf2\x79\x82\xcc\x3d\x64\x70\xd2\x7f\x51\
+\x79\x9e\x21\x83\x93\x75\xd0\xc9\x81\x10\x8b\x2c\x17\x47\x80\x0c\
+\x38\xc7\xf1\x13\x32\x38\xdd\x3f\x54\x3e\xc1\x40\x3b\x80\xac\xa3\
+\x28\xfe\xb7\xe7\xcb\x8f\xfc\x91\x1e\x9e\x65\xe4\xd5\x92\xae\xff\
+\x4b\xa6\x0f\x19\x74\x46\x85\xe5\x87\x3c\x70\xd8\xf5\xdb\x14\xef\
+\x87\xc0\x34\xe0\x19\x0c\xf2\xe6\xf7\x0a\x07\xc9\xbf\x45\x06\xf2\
+\x40\xc6\xf6\xe4\xbe\x81\xdc\x9b\xd1\xf5\x38\x32\x03\xc8\x80\xe0\
+\x78\xbe\x08\x87\x36\xf1\x3a\x85\x7b\x09\xe9\xd0\x35\x27\xcd\x60\
+\x22\xcc\x22\x53\x9d\xbc\x50\xc7\x38\x67\xf3\x39\x32\xad\xc8\xe4\
+\x7b\xb6\x75\xf0\xf4\xf1\x69\x51\x10\xda\xff\xe9\x72\xf8\x3b\x4a\
+\xb2\xfd\x40\xbe\xe4\x04\xf9\xaf\xa3\x9f\xcb\xc8\x70\xb9\x1e\x21\
+\x77\x2c\xc2\x2b\xd6\x3d\x0d\x04\xc5\xe1\x44\xf2\x26\xfd\x84\xac\
+\xc8\x13\x7b\x05\x5b\x93\xfb\x5e\x72\xf7\xcb\x42\xd7\x78\x21\xd8\
+\x4a\x06\x2f\x0a\xc0\x4f\xe4\x7c\x2b\xc2\x90\x8d\xfb\x76\x51\x44\
+\x18\x10\x1f\x04\x76\x3f\x19\xb4\x69\x7e\xd8\x45\x30\x78\x9d\x65\
+\x90\xc1\x8b\xd6\xbb\x14\xf7\x00\xc5\x7d\x06\xd7\x64\x8a\x45\x84\
+\xe4\x8e\x34\x90\x2f\xea\x13\x2f\x8f\x68\x6f\x03\xc9\x80\x84\x79\
+\x1e\xc1\x80\x3b\x5e\x2c\x41\xb8\x20\x35\xf6\x02\x46\x76\x81\xf6\
+\xc6\xf3\x25\x1b\xcf\xe6\x17\x64\x50\x6e\xec\xbd\xec\x43\xee\x7f\
+\x92\x7b\x3d\xba\x46\x3b\xbc\x95\x0c\xea\x95\xe7\xc9\xef\xe9\x14\
+\x0a\xf7\x00\xd9\xc5\x06\x6e\xd4\x3f\x0e\xde\xc1\xdf\x5e\x3f\xf6\
+\xe1\xac\xec\x5c\x33\x11\x84\x4a\x7c\x67\x22\x42\x70\xa7\xb8\x3c\
+\x59\xd1\x65\x22\x1f\x4f\x79\xa6\xd7\xbb\x44\x18\xe1\x20\x41\x10\
+\x16\x8b\x18\x02\xb2\x7e\x92\xcb\x80\x7a\x15\xeb\x5b\x1d\xd6\x46\
+\x4e\x9f\xe2\x26\x87\x02\xe5\xb0\x10\x91\x65\x3a\x3d\x59\xe5\x22\
+\x6c\x5d\x1b\x95\x8b\x60\x67\xe9\x85\x4a\x95\x64\x61\xae\x8d\xe3\
+\x23\xa2\xca\x59\xe5\x6e\x19\x2e\x9f\x93\xe2\xc2\x2d\x38\xb4\x44\
+\x4a\x37\x3d\x74\x5a\xb5\x72\xe1\xe6\x46\xcc\xa1\x60\x18\x3f\xa0\
+\xbb\x83\x04\x3f\xec\xdb\xbe\xd2\xb2\x51\x9d\x3f\x0b\x33\x4b\xb7\
+\xa7\xe5\x7a\xa1\x65\xe2\xa6\xc9\x20\x43\xd2\x3a\xad\x43\xdb\xd7\
+\x7e\x10\xe1\xaf\x66\x12\x2c\x04\x68\x74\x68\xa0\x81\x86\x3f\x34\
+\x20\xb6\x22\x11\xd0\xd8\xd1\x71\xa2\x83\x78\x9a\x0c\xde\x5e\xf1\
+\x30\xa2\x13\x80\x86\xcf\xd3\xc5\x35\xdc\x70\x0d\xad\xe0\x35\x32\
+\x1b\x29\x6e\x07\x3d\x8d\x50\x1d\x25\x6f\x13\xe8\x64\xe1\x8f\x37\
+\x62\xa0\x36\x85\x47\xe7\x8a\x3c\x5f\x20\x03\x59\x79\xfa\xc1\x79\
+\x42\x16\xd8\x08\x83\x87\x7d\x33\xc5\xbd\xbe\x88\x3c\xfd\x20\x7f\
+\xde\x41\xa1\x73\xfa\x89\x0c\x48\x90\xa7\xc9\xf3\x28\xca\x00\x28\
+\x2b\x50\x68\x3b\xa3\xf4\xb9\x1f\x3a\x5b\xbc\x3d\x63\x9f\x1a\xbe\
+\xe8\x80\x4e\x94\x97\x29\xb8\x5c\x70\x47\x3b\x84\x06\x83\x2f\x1c\
+\xcc\x23\xbb\x9c\x2e\x6f\x61\x7d\x02\xc2\x03\xbc\x93\x45\x39\x90\
+\x77\x35\x8a\x83\x36\x0c\xed\x6c\x08\x19\x90\x6f\x70\xbe\x00\x3f\
+\xcf\xb2\x28\x20\x7c\x14\xa5\x37\x93\xec\x9f\xc9\x40\xbb\x00\x90\
+\x5e\x60\xbd\xf1\xb4\xe1\x8e\x72\xa2\x0d\xad\xa6\x78\xff\x23\x9b\
+\xd5\x07\x5d\x07\xd7\x19\xff\x0d\x4d\x19\x00\x81\x02\x38\x25\xe9\
+\x62\xc1\x9f\x59\x5e\x27\x48\x13\x1a\x33\xb4\x23\x00\x79\xf2\x7c\
+\x71\xa6\x2a\xb4\x16\x94\x03\x68\x8c\x3f\xa8\x73\xf6\xeb\x22\x40\
+\x45\xc4\x33\x84\x7b\x06\x32\xc2\x68\xc7\xc7\x64\x40\xb4\xa8\x23\
+\xc8\xc2\xeb\x9f\xd7\x19\xf2\x86\xc1\x17\x2d\xee\x23\xb3\x85\xe2\
+\xe2\xc0\x6d\xfe\x6c\x9c\x17\xbc\x5e\xf5\x67\x00\x9a\xe4\x16\x32\
+\xc3\xc8\xa0\xdc\x3c\x7d\x9e\x27\xcf\x17\xf7\x09\xe5\x6c\x48\xe6\
+\x2b\x32\x20\x33\xbc\xf0\x14\xd5\xde\x00\x76\xf6\x33\x81\xd7\x59\
+\x25\x0a\x3f\x94\x6c\xe4\x09\x8d\x1e\x67\xd3\xc2\x8f\xb7\x07\xe4\
+\x07\x54\xd5\xed\x62\xe3\x1f\x27\x42\x22\x35\x96\xc7\x27\x7d\x1a\
+\xdf\x18\x6b\xb5\xb5\x27\x7d\x2c\x70\x38\x4d\xb6\xc9\x46\xd9\xed\
+\xf2\xa6\xdb\x65\x53\xff\x65\x23\xdb\x4f\x19\xdf\xa7\x61\x55\x68\
+\x6d\x20\x12\x3d\x4c\x3e\x78\xc8\x13\x95\xf7\xbf\x15\xfb\xd6\xad\
+\x4d\x4c\x1e\x17\x17\x6e\xb3\x11\xe1\xa0\x53\xe2\x0f\x2a\x80\x55\
+\xa3\x52\x6c\x84\xdd\xba\x3e\x35\xf3\xc5\x6f\xb6\x1e\x3f\x8a\x38\
+\x20\x59\xdd\xdf\x0f\xb8\x61\x5b\xc4\xd4\xed\xc7\x52\x3f\xd9\x7c\
+\xec\xb9\xd8\x18\x87\xe6\xf1\x15\x4c\x8f\xc2\x19\xe2\x22\xac\x31\
+\xeb\x8e\x26\xbd\xfb\xbf\x95\x07\xe6\x52\x7a\x6c\xdf\xa2\xee\x9f\
+\x0f\x90\x1d\xaf\xbc\x13\xfb\x37\x6a\xf9\x64\xfb\x72\x5f\x6b\x8a\
+\xaf\x25\xa9\xbf\xe9\x56\x99\xa9\xfa\xbc\x5c\xf8\x90\x70\x4e\xac\
+\x6c\xea\xf4\x69\xbf\x66\xfd\x99\x83\x5e\x57\x25\x04\xa8\x23\xbc\
+\xa5\x71\x83\xdf\x78\x9b\xc4\xc6\xe1\xc9\x64\x80\x02\xf5\x0d\xe0\
+\x5e\xe8\x0f\x12\x86\xa8\xe6\x92\x01\x49\xa0\x41\xa3\x3e\x91\x06\
+\x3a\x53\xd4\x15\x4f\x1b\xd7\x70\xc3\x35\x7f\xb8\xd0\xa1\x2d\xa5\
+\x34\x6e\xd3\xd3\x2a\x8c\x98\xf8\x3d\x42\x87\x09\xdc\x40\x66\x11\
+\x99\x4a\x64\xf8\xc3\xc3\xd3\x0f\xce\x13\x71\x60\xf3\x3c\xab\x93\
+\xc1\x43\x8c\xcd\xd0\x85\xe6\x49\xee\x9c\x04\xa1\x9d\x41\x13\x04\
+\x90\x06\xd2\x45\x9a\x3c\x8f\x50\x86\xd7\x23\x86\x64\xbf\x24\x03\
+\x84\x6c\x67\x94\x3e\x1b\x42\xa2\x4b\xc8\x38\x9d\x0c\x0e\x73\x46\
+\x7c\xde\xf1\x20\x2f\xa4\x15\xaa\x5c\x68\x6b\xbc\xfc\x68\x7f\x2b\
+\x28\xb9\x7a\xba\xdc\x45\xb5\x43\x7e\x4f\x91\x2e\xe4\x7a\x9d\x0c\
+\xca\x88\x74\x83\xf3\x45\x7e\xb8\x3e\x4c\x66\x12\x19\x20\x64\x9b\
+\xd0\x81\x7b\xf0\x17\x19\x74\x76\x48\x1b\xf2\x41\x96\xc0\xf4\x78\
+\x19\xf0\x1b\xee\xc8\x0f\x6d\x07\xcf\x15\x34\x52\x7c\x4e\xc8\x86\
+\x7a\x41\xfd\xd0\x75\x30\x90\x26\x80\x34\x80\xa2\xe4\x29\x2e\x38\
+\x99\xf1\x34\x51\xa7\xc1\x40\x3e\x08\xc7\xc3\x70\x39\x2e\x0a\x54\
+\x34\xfe\x22\x89\x21\x50\x4c\x19\xe0\xa5\x81\xb7\x53\xd4\x51\x61\
+\xed\x99\xdf\x37\xd4\x19\x88\x04\xed\x66\x0c\x19\xa0\xc8\xfe\x27\
+\xb0\x3e\xe9\x12\xcf\x38\xb4\x3b\xa4\x87\xb4\x50\x36\x7e\x4f\x78\
+\x9e\x81\xf9\xf2\xf6\x06\x83\xe1\x4c\xb4\xb7\x56\xe7\x69\x6f\xbc\
+\x8e\x10\x1f\x18\x4b\xe6\x1b\x32\x9c\x74\x51\x0e\xe4\x09\x83\xbc\
+\x10\x0e\xdf\xb4\xfc\x3f\x32\x17\x84\x22\x0b\x7e\x39\x40\xbc\xc5\
+\x1a\xc9\xad\x4d\x2a\xdf\xeb\xf1\xf9\x48\x11\xf2\x37\x1a\x0e\x1c\
+\xbd\x62\xf6\x29\x6a\x86\xe2\x53\x1b\x8f\xe9\x54\xff\x9b\x67\x3b\
+\xd6\xa9\x00\x22\xe1\xda\x5a\x30\xf4\xca\x93\x3b\x7c\xbd\x62\xee\
+\xba\x63\x29\xff\x8d\x0e\xb3\x9a\xbd\x8a\x86\xb2\xb0\x46\xad\x90\
+\xbf\xdd\x6c\x8c\xda\x74\x32\x65\x72\xbb\x09\x4b\x17\xa1\xa2\x11\
+\x07\x7e\xa1\x80\x6d\x11\x08\xf3\xe8\x1f\x3b\x36\x6e\x38\x9a\x3c\
+\x3e\x3c\xcc\x1a\x4e\xfc\xc8\x1f\x10\x46\x82\x94\x47\xe4\xba\x13\
+\x69\xe3\xdb\x7f\xb9\x9a\x0d\xe1\x52\x7a\x21\x1f\x20\x0c\x87\x42\
+\xf6\xb1\x1d\x6b\xd7\x7b\xa4\x6d\xdd\x29\xc9\xe9\xce\x78\x0a\x9e\
+\x4d\x45\x31\x87\x88\xa0\x7a\x7c\x8a\xe3\x96\x06\xe5\xf1\x46\x55\
+\xe8\x57\xf0\xaf\x32\xf0\x62\x40\x66\xbc\x7d\x62\x48\x0c\x73\x11\
+\x4d\xc9\xe0\x2d\xb7\x13\x15\x1f\xf3\x37\x21\xdf\x76\xa9\x2e\xf8\
+\x5b\x2c\x86\x2e\xf0\x06\xcb\x1f\x0e\xfe\xe0\x60\x3e\x01\xda\x17\
+\x08\x8b\xa7\x8b\x4f\xc3\x60\x6e\xe5\x20\x19\x3c\x58\xe8\xec\xf1\
+\x20\x20\xfc\x0c\x4a\xeb\x66\x4a\xb3\x30\x62\xe2\x6d\x88\xdb\xd0\
+\x10\xd1\x01\xf0\x3c\x91\x1e\xc8\x1b\x43\x52\xbd\xc8\xf0\x3c\x7b\
+\x93\xc1\x10\x15\x86\xee\x78\x9e\xfc\xc1\xfc\x86\xf2\x1a\x52\x44\
+\x9e\x1c\x2f\x92\x41\x5c\x9e\x17\x86\xa4\xf0\x30\x23\x7d\xe4\x13\
+\xca\xc0\x0f\x23\x0e\xbd\x29\xfd\x64\xb2\xd9\xd8\x1a\xec\x22\x00\
+\xc2\xc4\xa7\x73\xa0\x05\x20\x2c\x3a\x04\xd8\x98\xaf\x7d\x88\x0c\
+\xe6\x8c\x90\x26\x88\xf9\x76\x32\x18\x6e\xc2\xbc\x2b\x3a\x10\xd4\
+\x0b\x08\x0c\x9a\xd1\x7c\x2a\x4f\x35\xca\xee\x7c\x64\x08\x20\x7d\
+\x94\x1d\x2f\x24\xb8\xcf\xe8\x84\x91\x2f\xd2\xc3\x50\x25\xe6\x64\
+\x31\x8f\x88\x36\x81\x0e\x0f\xdf\x1b\x2c\x74\xe8\x95\x00\x77\x74\
+\x70\x68\x53\xb8\xb7\x00\xe4\x43\x9d\x7d\x4d\x06\xed\x0d\x9a\x3c\
+\xca\x81\xf2\x40\xd3\x86\x26\xcb\x3b\x43\xc8\x83\x72\x40\xc3\xc1\
+\x70\x72\xc8\xbe\x83\x10\xec\x5e\x58\xb8\x0b\x41\x70\x5d\x15\x27\
+\xef\x8b\xce\x17\xf7\x86\xea\x11\x6d\x0f\xf5\x80\x17\x49\x68\x9b\
+\xa8\x33\xc8\x81\xba\xc0\xf4\xc1\x87\x64\x30\x5c\x89\xe7\x13\xf7\
+\x00\x43\xc2\xd0\xe0\xf0\x82\xc5\xdb\x3d\xee\x19\xee\x61\xb1\xb5\
+\x62\xca\x17\xf5\x8c\x17\x1f\x3c\xbf\xfc\xc5\x07\x79\x22\xef\xa5\
+\x64\x1e\x27\x83\xfb\x8e\xfb\xd4\x82\x0c\xee\xc7\xa7\x64\xce\x91\
+\xe1\xe1\x10\x0f\xf3\x7b\xbf\x51\x19\x1a\xa0\x4d\xa0\x4c\xf4\x3b\
+\x18\xc1\x75\x84\x21\x51\x84\x83\xdc\x48\x0b\xb2\x63\xae\xfb\x49\
+\x32\x7c\x4e\xb4\x29\xa5\x87\x17\x83\x0b\x42\xa8\xcc\x2f\x2b\xa8\
+\x80\xac\x30\xdf\x6c\x3b\xfe\x06\x95\xf6\x28\x11\x42\x0c\x69\x6b\
+\x68\xbc\xf9\x60\x34\x4a\x32\x11\xa2\x21\x2b\xc7\x79\xe0\xb7\xfd\
+\x67\x30\xc1\x7a\xbe\x03\xb5\x15\x8a\x63\x6e\xff\xcd\xea\x39\x2b\
+\x8f\x9c\x7b\x31\x3a\x9c\x7d\x5d\x02\xab\x4b\xbd\x16\xd9\x18\xe5\
+\x93\xe4\x3f\x5a\x7f\xb9\xea\x13\xca\x9e\x75\xbc\x7a\x34\x06\xc8\
+\x04\xe8\x3f\x19\xf4\x9b\x21\xb7\xfd\x62\xe5\x54\xcf\x99\x8c\x59\
+\x26\x8b\x29\x8a\xdc\x7c\x3a\x09\x46\xac\x3a\x96\xf2\x6e\xfb\x2f\
+\x57\x7e\x4a\x79\x9a\x30\x8f\x59\x18\x48\x66\x26\xf5\xdc\xfd\x67\
+\x0e\x66\xb9\x5c\x1b\x1d\x66\x93\x99\x72\x0a\xee\x2c\xa1\xb1\xaa\
+\x0e\xab\x39\xce\x64\x91\xd7\x10\x01\x63\x48\x8b\xcd\x7f\x32\xdf\
+\x92\x81\x43\x54\x3f\x89\x64\xef\x26\x7b\x97\x6e\x40\x28\x58\x10\
+\x11\x92\x1c\xc8\x9d\x3f\xc0\x58\x34\xf0\x11\x19\xb4\x03\x94\x19\
+\x0f\x25\xe6\x56\x1e\x21\xd3\x96\xc2\xe0\x8d\x6e\x89\x9e\xe6\x4e\
+\xba\xfe\x93\x6c\x0c\x63\xe2\xc1\x02\x49\xf2\xce\x0f\xf7\x15\x0f\
+\xf5\xe7\x94\x66\x6d\x3d\xed\xf3\xb5\x69\xc4\x09\xcc\x13\x6f\xc3\
+\x98\xd3\xc1\x70\xeb\x22\x9e\x27\x99\xbf\xc8\x40\xc3\x02\x79\x60\
+\x0e\x05\x64\x86\x38\x1c\x9f\x51\x5e\x78\xe8\xf2\xe5\x89\x6b\x72\
+\x43\x5b\xc2\x83\xde\x25\xcf\x95\xc9\x08\x40\x93\xc4\x5c\x4c\x60\
+\x9d\x85\x32\x98\x4b\x71\x16\x55\x16\x3d\x1f\x68\x3d\x98\x9b\xc2\
+\x81\xe8\xe8\x08\x21\x1f\xf2\x42\xfc\x1b\xc8\x1b\x2f\x10\x9f\x91\
+\xbd\x0e\x69\x92\xc1\x70\xf0\x2c\xb2\x31\x2c\x86\x72\x61\x9e\x08\
+\xf7\x0a\xf1\x10\x1f\x43\x77\x18\xba\xe2\xcf\x43\x71\xda\x23\xea\
+\x13\x72\x22\x5f\xbc\xa8\x80\xc0\x7b\x91\xf9\x94\xcc\x1a\x32\x68\
+\x13\x19\x94\x14\x9e\xc3\x22\x9e\x68\x76\x4f\xe0\xcf\xef\x29\xe4\
+\x9a\x43\x06\x24\x8a\xc5\x4e\x3f\x90\xbd\x85\x0c\xca\x81\x39\xdf\
+\x2f\xc8\xc6\x90\x28\x16\x04\xe1\xe5\x09\x71\x60\x50\x0e\x74\xbe\
+\x98\xe7\x42\xfd\xfc\xe3\x7d\xdc\x95\x04\xee\x09\x15\x0b\xf7\x06\
+\xe4\x07\xed\x08\x0b\x44\x78\xdb\x44\x59\xc7\x93\x41\xbb\x04\xe9\
+\xcd\x23\x7b\x07\x19\xb4\x37\x2c\x32\x03\x39\xa2\x4d\x62\x08\x1b\
+\x7d\x2c\xea\x0b\x71\x0a\xf4\xc7\xc1\xe0\xf7\x8f\x6c\x10\x20\x5e\
+\x72\x50\xcf\xbc\xce\xd1\x0f\x80\x74\x7b\x50\x90\x8f\xc9\xac\x26\
+\x83\xfb\x84\x45\x59\x73\xc8\x46\x78\x10\x32\xe4\x0d\x6c\x6f\x18\
+\x09\xc2\x4b\x65\x18\x85\x29\x4e\x7b\x83\x9c\xbc\xad\xe1\x9c\x56\
+\xcc\xbd\x77\xa3\xb8\x98\xbb\x5f\x45\x66\x17\xfd\x4e\x86\xac\x64\
+\x5f\x10\xfe\xf1\x46\x42\xc2\xb1\x39\xbf\xe7\x16\xee\xde\x30\x7a\
+\xee\xd6\x3b\xed\x56\xeb\x32\x22\x00\x90\x21\x6f\xf4\x00\x76\x11\
+\xc8\x0e\xab\x29\xf7\xc5\x65\xfb\x3f\xda\x97\x9c\x85\xc5\x34\x38\
+\xd9\x85\x3d\x38\x44\x9e\x92\x39\x04\xfb\x90\x37\x0e\xde\x36\x77\
+\x99\xb6\xf6\xd7\x15\xc7\x52\x5f\x89\x0e\xb7\x9a\xdd\x3e\x35\x52\
+\x96\x0d\x07\x9f\x5c\xb8\x1d\xf3\x05\x06\x7d\x4e\xce\x0f\x2c\xbc\
+\x85\x4c\x40\x70\xc5\x63\xee\x12\x6e\x4f\xac\x39\xf0\xb6\xc3\x22\
+\x6f\x23\x2d\x33\x92\x48\x30\x6c\xcd\xf1\xd4\xf1\x9d\xbf\x59\xfd\
+\x05\x48\x50\x96\x24\x9c\x2d\x9a\x2f\x4d\x94\x8f\x6b\xaf\x90\x19\
+\xb2\xef\x4b\xce\x56\x5e\x58\xba\x6f\x82\xdd\x6a\xca\x81\x13\x79\
+\xf1\x38\xaa\x47\x51\xe5\x28\xbb\x39\x62\x77\x72\xe6\xd4\x9b\x66\
+\x6d\x7a\x60\xd6\x9e\xd3\x89\x48\x83\x97\xb7\x84\x80\x37\x36\xec\
+\xe3\xf1\x1b\x38\x50\xd5\x16\x78\xb0\x50\xaf\xe4\x8e\xfa\x05\x81\
+\x61\x48\x05\xda\x03\xef\xf4\xf0\xb6\x88\xb9\x37\x0c\x9f\x21\x0c\
+\xfc\x02\xd3\x84\x0d\x37\x17\x85\x01\x49\x62\x0e\x0c\xda\x0f\x1e\
+\x28\x74\x02\x98\x5b\xc4\xaa\x3d\xe0\x7c\x75\x88\xfb\x04\xd9\xa1\
+\x11\xf5\xa5\xf4\x40\xc8\x98\xb8\xcf\x97\x27\x19\x7a\x81\x61\xb2\
+\x62\x79\x36\xe4\xbd\x91\x0c\x56\x35\x42\x1e\xe4\x89\xef\xc4\xc1\
+\x3d\x98\x34\xb8\x0d\x4d\x09\x72\xe1\xed\x15\x6e\x58\xa9\x87\x21\
+\x75\xf6\x26\x4b\x76\x60\x5e\x05\x0c\x85\xc1\xc0\x02\x7f\x3e\xf2\
+\x81\xfc\x39\xd9\xa2\x73\xc1\x4b\x14\xc2\xa1\x4c\x30\x78\x2b\xef\
+\x42\xfe\xcb\xc9\x1f\x79\xa1\x1c\x81\xe9\xc2\x46\x59\x8f\x51\x18\
+\x68\x87\x18\xda\xe4\x9d\x0b\xca\x75\x3d\xf9\xe3\x53\x41\x40\x71\
+\xfa\x07\x5e\x9f\xd0\x34\x70\x7c\x18\x46\x60\xf0\xed\x4a\x18\x9e\
+\x67\xc8\x36\x11\x04\xdc\x37\xa4\x05\x83\x7c\xb1\x90\x03\x1d\xdd\
+\x61\x4a\x03\xf2\x06\x97\x83\xdd\x1f\x0a\x83\x7c\xa1\x0d\x60\x48\
+\x95\xd7\x01\xea\xe3\x05\xf2\xc7\x4b\x15\xea\xe9\x1f\xef\xe7\xae\
+\x20\x78\x59\x30\x5a\x81\x36\xc6\x09\x09\xf5\x76\x2f\x95\x17\xda\
+\x11\x56\x55\x07\xb7\x67\x18\xd6\xf6\x28\xcc\x2c\xb2\xa1\xb5\x61\
+\x15\x29\xea\x0b\x71\x0b\x05\xc5\xe3\x2f\xb0\x78\xb9\x43\x7b\x01\
+\x20\x07\xe2\x6e\x20\xd3\x95\xfc\xa1\x9d\x23\x0f\xab\x9e\x17\x33\
+\xba\x1b\xf2\x4d\xa2\x30\x98\xd7\xc3\xa2\x38\xc4\xe5\x64\xd8\x96\
+\x0c\x16\xbe\x00\xe7\xbb\x4f\xbc\xad\x81\xf0\x90\x27\xbe\xe4\xcf\
+\xd2\x27\xc3\xda\x07\xc2\x40\x56\xb2\x2f\x08\x57\xa4\x81\xa0\x83\
+\xb7\x9b\x4d\xa6\xef\xf7\x9c\x3e\x3b\x78\xd6\xae\xc7\xf6\x9c\xcb\
+\x9d\x14\x69\x37\x39\x3c\xaa\x86\xca\x20\x5f\x4d\x8d\xb0\x9a\xc2\
+\xb7\x9c\xcd\xfc\xee\xa3\x75\x87\xf6\x50\x81\xe4\xc0\x61\x42\x50\
+\xa6\x4f\xd1\x18\x21\xea\x4e\x7e\x10\x27\x79\xc1\x43\x5d\xbf\x5e\
+\xf5\xf3\xb2\xc4\x94\x37\xe3\x2a\x46\x3a\x27\x6d\x3e\xf2\xf2\xe4\
+\x8d\xc7\x92\x70\x3a\x0d\xe6\x14\xf5\xa0\x79\x37\x94\x32\xdb\x79\
+\xdf\x75\x8f\x6c\x7c\xa0\xd3\xa3\x54\x61\xf9\xde\x18\x3d\x94\x09\
+\x36\xc4\x7f\xbe\xfb\x54\xd6\xfd\x73\xb7\xbd\x14\x13\x1f\x9e\xb9\
+\xea\x68\xf2\xa4\x8e\x5f\xaf\x9a\x5c\x38\x09\xb2\xf9\x40\x36\xd7\
+\xc8\xe5\x83\xec\x28\xc3\x84\x75\x87\xf7\xa2\x4c\x28\x1b\xca\x48\
+\xc1\x14\x45\xd3\xec\x31\x31\xe1\xde\xc5\x47\x93\x9f\x6b\xfe\xd9\
+\xf2\xff\xcd\xdb\x77\xc6\x83\xe3\xd8\x4a\x18\x09\x02\xbc\xb1\x81\
+\x28\x02\x4d\xc8\xce\x9b\xc0\xeb\x19\x9d\x1b\x96\x3b\xf3\xb7\x58\
+\x10\xc5\x48\x8a\x87\x15\x7f\x98\xd7\xc0\x9e\x23\x37\x19\xaf\x9e\
+\x1e\x0c\xae\xd9\x30\x0c\xc2\xd0\xf5\x7c\xba\xc6\x5b\x26\x80\xc6\
+\x0f\x59\x06\x91\x1f\x1e\x0e\xdc\x53\x3c\x2c\xa1\xc0\x3b\x5b\x60\
+\x34\x05\xc5\x3c\x05\xf2\xa4\x7b\x13\x32\x4f\x3c\xa8\xe8\x00\x90\
+\x27\xe6\x15\xef\x45\x44\x02\xe4\x46\x9e\x37\x90\x1f\x96\x76\x03\
+\xc1\xcf\x12\x3a\x22\x80\xd7\x07\x56\x9e\x02\xc8\x2b\x30\x9f\xc2\
+\x4c\x71\xda\x03\x86\xa1\xb0\xf2\x92\x0f\x71\xa1\x63\x1b\x4a\x51\
+\xb1\xea\x12\x24\xe1\xd1\x4d\x60\xba\xbc\x2e\x41\xc6\x08\x03\x22\
+\x85\x16\x08\xf9\x79\xdd\x3c\x4e\x7e\x11\xe4\x87\xb2\x17\x78\xe6\
+\x02\x80\xb2\x21\x1e\x34\x82\xdb\x29\xfc\x39\x0a\x6e\x25\x3b\x38\
+\xdf\xc2\xda\x44\x30\x50\xa7\x48\x6f\x26\xc5\x19\x4b\x69\xa1\x9e\
+\xd1\x71\xe3\xde\x04\x97\x83\xe5\x41\x61\x50\x06\x0c\x9f\x62\xe8\
+\x14\xa3\x07\xa8\x07\xd4\x07\xe2\x62\x05\xe5\x35\x03\x2a\x2b\x27\
+\x24\x0c\x1f\x83\x54\x00\x94\x17\xf7\xe8\xbf\xe4\xf7\x25\xf9\xa1\
+\x3d\x83\x0c\x82\xdb\x33\xab\x33\xf2\xc3\x4b\x1f\xda\x33\xb4\x77\
+\x68\x86\xd8\x66\x80\x3a\x2f\xaa\xbd\xf1\xb6\x8d\x39\x7d\xac\xb6\
+\xc6\xb3\x8b\xe7\x0e\x5b\x71\x70\xdf\x4f\x52\x9a\x68\xef\xc8\x03\
+\xf9\x06\xe6\xc9\x9f\x23\x0a\xc2\xda\xc6\x7b\x74\x0d\xcd\x14\x32\
+\xf3\x74\xef\x25\xbf\x8a\xe4\x97\x6f\x74\x25\x08\x90\x0f\x7e\xd8\
+\x5a\x83\x75\x01\xfc\x05\x89\x95\x8b\x0c\x2f\xeb\x05\x93\x20\x50\
+\x58\xa6\x97\x1d\x4e\xaf\xcf\x67\x21\xb5\x67\xce\xbe\x43\x5a\xb3\
+\x29\x8b\xc7\x2f\x4a\x4c\x7d\x26\x26\xcc\xea\x22\x7e\xb3\xe1\x93\
+\x4b\x54\xa8\x84\x89\x1b\x8f\x62\x2e\x00\x9f\x4e\x62\x0f\x0e\x27\
+\x96\xfa\x71\xe1\x15\x47\xb6\xa9\x52\x09\xf3\x76\xa1\x2a\x8a\x38\
+\xc4\x4b\xee\xf2\xb0\x39\x9b\x67\x4d\x5a\xbc\xf7\xf6\x0f\xd7\x25\
+\x6e\xa3\xdf\x12\x4e\xa7\xd1\x83\x18\x24\xd9\xc8\x86\x48\x13\x6f\
+\x6f\x33\xac\x51\xe5\xe8\x07\x5a\xc7\x45\x3e\x90\xf8\xc4\x80\x11\
+\x70\x43\x5c\x3d\x18\x08\x4d\xa1\x1e\xc2\x48\xa4\xbd\xff\xe3\x15\
+\x07\x87\x0f\xf9\x79\x0b\x86\xdd\x8c\xa1\x48\x10\x8b\x6c\x20\x53\
+\xf3\x72\x51\xe5\x46\x34\xac\x54\x55\x97\x8f\xc9\xcc\xcb\x30\x71\
+\xed\xa1\xaf\xc9\x65\xbf\x47\xd1\xac\x44\xa6\x11\xb2\xc9\x70\xec\
+\xb3\xb5\xa7\xef\xed\x41\x5a\x2c\x15\xcf\x6c\x95\x8d\x5a\x61\xc7\
+\xb1\x5d\x63\xe0\x75\x37\x52\xb7\xf9\x6f\x0c\x71\x61\x01\x0a\xe6\
+\x87\xf0\x80\xa1\x0a\xd1\x49\x17\x30\xf0\x43\x18\xba\xc6\x83\x8c\
+\xb6\x82\xb7\x50\xb8\xf1\xfa\xc3\x10\x61\x51\xe0\x1d\xf2\x57\x14\
+\xff\x57\x4a\x07\x9d\x28\xb4\xcc\x42\x3b\x6a\xf2\x03\xb0\xef\x10\
+\x61\xf1\x26\x3d\x35\xcf\xc7\x9f\x27\xe6\xe6\x42\x21\x9d\x0c\xca\
+\x88\x0e\x03\x68\x4e\x69\x60\x08\x08\x1d\x11\xde\x62\x43\x96\x91\
+\x0c\xfc\x0a\x7d\x2e\xc9\x8f\x6b\xd6\x58\x85\x09\x2d\x15\xe0\x79\
+\xfc\x87\xfc\x92\xc8\xcf\x4c\x36\x3a\x9f\x42\x01\x39\xc8\x82\x01\
+\x30\xec\x7c\x8a\x0c\xd2\x81\x1b\x56\x41\xb2\x05\x5c\x84\xa2\xfa\
+\x08\xd6\xd6\x09\xd8\x9b\x89\x7d\x69\xa8\x23\x90\xec\xc5\x00\x75\
+\x85\x7b\x8c\xd1\x81\xe7\xe1\x40\xc0\x4b\x03\x97\x31\x24\x50\x4e\
+\xbd\xbc\xe8\xd0\xa1\x6d\x00\x20\x41\xa0\x1f\xf9\x55\x21\x3f\xdc\
+\x5f\x2e\x6b\x49\x06\xbf\x17\x58\x4c\x84\x6d\x03\x78\x5e\x50\x67\
+\xd0\xca\xde\xa1\xb2\xe2\xfe\x81\x88\x0a\xed\x4f\xc8\x0f\x40\x7b\
+\x06\x29\x61\xfb\x0c\xd7\xf0\x42\x3e\x03\x14\x0e\xed\x0d\x6d\x16\
+\x23\x20\x78\x89\x05\x78\x5d\x62\x4b\xcc\x11\xf2\xe3\x2f\x63\xd4\
+\xa5\x85\x6c\xd3\xbc\x7f\xe5\x7d\x2d\xa6\x21\xb0\x0f\x19\xf2\xa2\
+\x9d\x62\x88\x94\xb7\xb7\xc2\xee\x13\x97\xef\x35\xca\x73\x1f\xa5\
+\xc3\xda\x1a\x99\x7c\x7d\xf2\xc5\xe2\x1f\x23\x42\x22\xbd\x02\x05\
+\x42\x87\x4f\x72\xfb\x24\xa3\xd1\xd8\xf3\xbb\x35\x7f\x8c\x9f\xb5\
+\x71\xa4\x62\x32\x26\xc4\x96\x8d\x88\x9e\xb0\xf9\xc8\xf8\xaf\xb6\
+\x1e\xc9\x32\xe7\x1d\x82\xcd\x0a\xc7\x69\x67\xd1\x1d\xed\x5f\x9e\
+\x76\x5b\xdb\xe9\x53\x06\xb5\xac\x4b\xf1\x55\xe2\x1f\x5e\xb1\x7e\
+\x90\xbb\x92\x94\xeb\x56\x1e\xfe\x63\xd7\xa1\xa3\x19\x6e\x3c\x40\
+\xfe\x0a\xc2\x1e\x3d\x8d\x08\xee\xd3\x7e\xcd\x6e\xae\x59\xb7\xc2\
+\x0b\xd9\x59\x6e\x4f\x96\x57\x73\xd5\x0c\x57\x9f\x9f\xdc\xaf\xc9\
+\x60\xc4\x45\x18\x3d\x38\x5b\x6c\x93\xe9\xf2\x68\x8f\xfd\xb1\x3d\
+\xf1\x54\x96\x0b\x95\x8d\x93\x68\xf2\x55\x38\x64\xc0\x22\x9b\xcf\
+\x07\x76\xae\xbc\xee\xee\xeb\x3e\x9f\x36\xb8\xe5\x7b\x2d\x2b\x44\
+\xa3\x71\x91\x56\x69\xc4\xd6\x09\x2c\xf6\x91\xbf\xda\x79\x3c\xeb\
+\xe3\x4d\x47\x26\xc4\x95\x8b\x88\x92\xcc\xc6\x85\xa3\x7e\xd9\x3e\
+\xe2\x81\xdf\xd7\xe0\xcb\x14\x58\x54\xe3\x75\x51\x22\x7a\x92\x0c\
+\xe4\xec\x1f\x66\xbd\x56\x40\x8d\x96\x0f\xe5\x61\x3b\x00\xe6\xa6\
+\x00\x0c\x97\xa0\xd3\xc4\xdb\x21\x00\x42\x42\xfb\x38\xaf\xa1\xb0\
+\xe8\x00\x00\x3e\x1c\xca\xdb\x43\x07\xca\xc3\xa1\x87\x09\x55\x87\
+\x08\x87\xfb\x38\x91\xfd\xfa\x9b\x08\x8a\x03\xde\xb9\x60\x0f\x23\
+\xee\x19\xef\x6c\x3b\x52\x9e\x31\xc8\x93\x6c\xe4\xc9\xef\x27\x86\
+\x6f\x40\x2e\x68\x57\x88\x8b\xa5\xe0\xec\x98\x3e\x42\xc8\x72\xe9\
+\x06\x6f\xb5\xa8\x2b\x20\xd4\xf3\xc9\xdd\x3a\x91\x01\x19\xa2\x2e\
+\xe0\x86\xce\x10\x8b\x5d\xd0\x71\xf1\xfa\x29\x12\x7a\x3e\x20\x11\
+\x68\xab\xec\x25\x94\xc0\xeb\x04\x2b\xfb\x8a\x02\xca\x89\xf2\x62\
+\x1e\x88\xad\xa2\xa6\x74\x8a\x24\xdf\xf3\x80\xd7\x1b\xf6\x98\x61\
+\x95\x37\xf6\xcd\x15\xda\xa1\x07\x82\xc2\xe1\xe5\x08\x75\x80\x45\
+\x3a\xd8\xb8\x0d\xb9\x50\x07\xe8\xbc\x31\x6c\x0a\x84\xaa\xcb\x92\
+\x06\x5e\x1f\xbc\x4c\xbc\x4f\x9a\xc4\xeb\x9e\xec\x7c\xfd\x54\x11\
+\xe0\xf7\x6a\x06\x19\xb4\x53\xfe\x6c\x04\x83\xd7\x1b\x16\xa2\xe0\
+\x05\x09\xed\x03\x04\x86\x8d\xeb\xbc\xcd\x14\xf7\xd9\x65\xed\x92\
+\x6c\xbc\x24\xf2\x55\xc4\x1c\xd8\xf7\x5a\x18\xd0\x36\x20\x1f\x16\
+\xe1\xb1\x2f\xfb\x13\x8a\xd5\xc6\x8b\x0b\x34\x5e\xfd\xf2\xf2\x03\
+\x0f\x87\x89\x9a\xa4\x97\x7a\x7c\xdd\xc9\x0f\x10\x01\x91\x85\x3a\
+\xa8\x41\xc5\xb2\x03\xea\xc4\xf7\x78\x61\x69\xc2\xec\xd3\x59\x2e\
+\x7f\xe1\xd0\xb0\x49\x36\xf5\xc0\x63\x03\x47\xd5\x8a\x54\x9e\x4b\
+\xcb\xf1\x7a\xe3\xa2\x1d\x59\x5f\x6f\x3d\x32\x76\xf4\xaf\xdb\xd6\
+\x80\x88\x28\xfa\x79\x1f\x14\x7a\x45\x91\x29\x7b\xe5\xd3\xbe\x8d\
+\xbb\x3f\xd4\xae\xd6\x07\x59\xd9\x6e\x8d\xb8\x86\xc5\x23\x6a\x93\
+\x23\xc2\xad\xc6\xc9\xeb\x13\x9f\x7a\x70\xfe\x8e\x25\x3c\x2c\x8b\
+\x58\x04\x78\xde\x5f\xdc\xd8\xac\xf1\xbd\x6d\x6b\x7e\x98\x99\x99\
+\x5b\xce\x6a\x36\x99\x13\x73\x9c\x53\x1a\x4c\x58\x82\x8d\xe4\x4c\
+\x76\x3d\xb8\xa1\x42\xb8\xcd\xf6\x46\xaf\xfa\x37\xcc\x3f\x9a\xbc\
+\x64\xd6\xe6\x13\xb9\x16\x93\x4c\xda\xaa\x7e\x5a\x78\x00\xf2\x86\
+\x59\x2f\xa8\x31\x5f\x31\x50\x99\xb8\x4c\xb0\xd1\xd1\x60\xfe\x05\
+\x7b\xf9\xa0\x69\x17\x59\x67\x3c\x0c\xd9\x98\xa8\xc7\x2a\x2f\x84\
+\x47\xc3\xc6\x84\x3d\x56\x30\xe2\x37\xd2\x2c\x2e\x10\x16\x0f\x24\
+\xde\x8a\xb1\x7a\x10\xab\x40\x01\x3c\xdc\x4d\x28\xaf\xfd\x94\x17\
+\xde\x18\xa1\x2d\x60\x63\x36\xf6\xa4\xc1\x0f\xe4\xbb\x89\x0c\xf6\
+\x1f\xe2\x2d\x17\xed\xff\x82\xeb\x9a\xa2\x81\xe4\xb0\x2a\x0e\xf7\
+\x18\x1d\x45\x63\x4a\x66\x37\xb9\x73\xc2\xe7\xe5\xc5\x4a\x57\x68\
+\x37\x68\xd7\xe8\x3c\x20\x37\xf2\x47\x87\x1d\x5c\x67\xf0\x43\x38\
+\x0c\x37\x6d\xa6\xf8\x9b\x99\x63\x50\x5b\x0a\x48\x1b\x5a\x1c\xe6\
+\x4b\x31\x57\x8a\xe1\xb0\xff\x91\xfb\x8b\xe4\x1e\x72\xe3\x75\x61\
+\xe0\xe9\x93\x8d\xce\x15\x24\xc2\xcb\x84\x05\x29\x58\x01\xcc\x48\
+\x99\xae\x51\x57\xb8\x9e\x42\xd7\x58\x6c\xc3\xf3\xc5\x86\xfc\xe7\
+\xc8\xbd\xd8\xf9\x22\x3d\x0a\x8b\xd1\x93\xc0\x0d\xf5\x3c\x5f\x2c\
+\xb4\x59\x48\x7e\xe7\x6d\x57\x81\xe0\xf9\x93\x8d\xc5\x43\xd8\xe0\
+\xce\xe5\x7b\x8b\xdc\x9f\x27\x77\xbc\xa4\xba\xc9\xc6\x90\x22\x86\
+\x82\x79\x7b\xc0\x42\x8b\x27\x2f\x34\x3f\x80\xe2\xf0\xba\xc3\x48\
+\x01\x36\x77\x73\x92\xe0\x1b\xbf\x19\xb9\xe8\x61\x30\xbf\x86\x8e\
+\x9c\xd5\x25\x19\x2c\x60\x61\x7b\x09\x01\xf2\xe7\xf2\x17\xb6\xa1\
+\x1e\x2f\x2c\x20\xfc\x38\x72\xc3\xa2\x27\xa4\x07\x60\xae\xbb\x05\
+\xf9\xb1\x2d\x62\x64\xfb\xdb\xca\xf9\x40\xe1\x79\x5b\xfa\x9e\x7e\
+\x62\xbe\x98\xe7\xe9\xdf\x50\x4f\xd7\x28\x00\xc2\x60\x18\x9e\xcd\
+\xa7\x93\x41\x19\x71\xdf\x40\x4a\x18\xc9\x29\x76\x9e\x04\x94\x1d\
+\xf9\x60\x2b\x12\x16\x41\xf1\xbe\x00\x0b\xbc\x9a\x53\x5e\x28\x23\
+\xaf\x0b\x7e\x50\x01\xbf\x57\xd3\xc9\x7d\x24\xe4\x82\x4c\xf4\xfb\
+\xf2\x81\x12\xbc\xec\xa6\x61\x7c\x59\xf9\xe9\x0e\x75\xea\xb7\xaf\
+\x11\x06\x81\x31\x4c\x88\x1b\x54\x20\x1c\x91\x24\x23\xe2\x60\x43\
+\x35\xc5\xc2\x7f\x7c\x53\x93\x06\xea\xf3\x7d\xd7\x65\x3c\xd3\x7b\
+\x4b\xf6\xb3\x7d\xd6\xa7\x3f\xdd\x6b\xbb\xf6\xf2\x80\x2d\x5f\x0f\
+\x6c\x36\x40\x0f\xc7\xd2\x2f\xcc\xf0\x74\x26\xf5\x69\xd4\x82\xe2\
+\x51\xfc\xde\xdb\x28\x9d\x0d\x64\x36\xe9\x66\x23\xb9\x6d\xd5\x5e\
+\x19\xb8\x7e\x52\xbf\x26\x2d\x03\xe3\x14\x66\x40\x96\xb0\xbf\xba\
+\xb1\x79\x17\x4a\x73\x2d\xc5\xdf\x01\xd9\x32\x9e\xee\xbd\x49\x1b\
+\xd7\x7f\xdb\xf8\xde\x8d\x40\x10\xd4\xc8\x0a\xa6\x43\x69\x4b\xa4\
+\xeb\x85\x2c\x33\xaf\xa3\x8e\x95\x62\xa2\x47\x37\xaf\x8e\x63\xa6\
+\x0a\x84\xf9\x37\x0d\x9a\x8a\x6e\xd0\xe8\x61\xb7\xd1\xdd\x8b\xbc\
+\x07\x30\x3c\x0c\x01\x43\x2b\xb8\x40\x87\x0f\xfb\x72\x1a\x3c\x18\
+\xb0\xdb\xe9\x79\x81\x08\x61\x83\x08\x71\x81\x15\xa2\xb0\xf1\x4d\
+\x38\xb2\x0c\x78\xd8\x42\xca\x5b\x98\x21\xb0\x7b\x44\xc0\x6a\x46\
+\x5c\xf0\x72\x60\x85\x26\x59\xfe\x72\xb2\x7b\x4c\xc0\xca\x3e\x0c\
+\x3f\xe1\x07\x1e\x66\x5e\x77\xe7\x33\xe8\x6c\xfe\x24\xd3\x28\x30\
+\x5d\xfd\x9a\xcb\x80\x7d\x5c\xb8\x40\xba\xb0\xef\x08\x0e\x5b\x1c\
+\x43\xe0\xb2\xe2\xd0\x00\x74\xaa\xf8\x01\x73\x98\x0c\x86\x72\xc9\
+\x42\xd3\xf5\xe7\x0b\x22\xc4\x05\x3a\x33\xd8\x58\xa0\x41\x56\xf1\
+\xeb\x93\xc0\xf3\x04\x11\x82\x1c\xf0\x03\x06\x7b\x8c\xab\x06\x86\
+\x29\xae\x21\x04\xb7\x31\x5e\x2f\xd3\x74\x77\x10\x09\x6c\x10\x21\
+\x2e\xb8\xfc\x1f\x06\xc6\xbf\x10\x43\xe0\x75\x02\x22\xc4\x05\x6f\
+\x0f\x58\x39\x4b\x16\xeb\xe0\x79\x18\x10\x17\xda\x28\x6f\x03\x58\
+\x1d\x1c\x98\x16\xab\x3f\x02\x88\x10\x17\x7c\x2b\x0c\x4e\x69\x22\
+\xcb\x2f\x3f\x36\x8b\xf3\xb6\x0c\x93\xc0\xd3\xb8\x50\x43\xe0\x79\
+\x62\x75\x34\x2e\x78\x9e\x98\x6f\x24\x8b\xc9\xcf\xc3\x60\xf4\x05\
+\x17\x68\x9b\xb0\x2f\x97\xe1\xcf\x2d\xb6\x7c\x94\xd7\xf3\xe2\x65\
+\x05\x11\xe2\x82\xdf\xab\xb1\x5c\x2e\xd8\x97\xd3\x5c\xd6\xe1\x02\
+\x59\xff\x44\xd1\xd3\xd5\xa3\xaa\xbd\x77\x4b\xf3\xff\xfc\x3a\xb4\
+\xe3\x83\x8f\x56\x2b\x13\x05\xcd\x0f\xc3\xa1\x2c\x50\x00\xb8\xa6\
+\x08\xed\x90\x39\xe8\x20\x67\xb5\x55\xa5\x18\xe9\xfe\x66\xd5\x9e\
+\x76\xf9\x0c\x91\x44\x3e\x68\x60\xb2\xc9\x68\xf4\x64\x64\x7b\x0c\
+\x77\xb5\xac\xfe\xe6\x37\x03\x5b\x0c\x87\xf6\x46\xfc\xc1\xf2\x0c\
+\x06\x86\x17\x91\xce\xb3\x1d\x6b\x55\x7f\xa8\x53\x9d\x09\x69\x59\
+\x6e\x2b\x91\x0d\x1e\x8e\xc0\xbc\x70\xa4\x9b\x37\x2d\xd3\x65\x7d\
+\xa8\x63\xed\x8f\xc7\x76\xaa\x53\x03\x71\x82\xe5\xe1\x20\x39\xb0\
+\xb2\x53\xf9\xe6\xa6\x16\xfd\x46\xb7\xaa\xfa\x51\x66\xb6\xc7\x4e\
+\xf1\xd1\x78\x28\x86\xa4\xe6\x7a\x15\xd3\x43\xad\xaa\x3d\xdb\xba\
+\x52\xb4\x43\x55\xd9\x10\xae\x5f\x36\xa4\x49\x69\x6b\x98\x47\xd4\
+\x9d\x18\x20\x27\x81\x69\xc7\xd3\x7b\xb5\xa8\xb1\x70\x58\xdb\xb1\
+\x5f\x8d\xee\xfe\xf0\xe8\xbe\xdd\xf8\x62\x8b\x6b\x09\xe8\xf8\x02\
+\x81\xba\xc0\xbd\xbd\x14\x83\x8e\x85\x1b\x80\x0f\x59\x06\x83\xdf\
+\x8b\x6c\xdd\xbe\x14\x60\x71\x06\xc0\xef\x25\xde\x8a\xfd\xa0\xdb\
+\xcc\xe6\xb2\xc9\x02\xb1\x40\x53\xc0\x22\x16\xc8\x85\xf0\x78\xf0\
+\x43\x95\x03\x06\x0f\x3c\xda\x28\x64\xc5\x9e\xc6\xb5\x94\x0e\x48\
+\x16\x6f\xe4\xec\xed\x3c\x00\xc1\xed\x03\xc7\x93\x5d\x0a\x70\xba\
+\x48\xe0\x5b\x36\xde\xc0\x8b\xea\x1f\x78\x7d\x62\x25\x2d\x90\xaf\
+\x5d\x5f\x24\x90\xff\xa5\xde\x1f\x1e\x9f\xcb\x07\xad\x30\x10\xc1\
+\x72\xfa\x9f\xd1\x12\x02\x68\x63\xb8\xf7\xbc\xbd\xa3\xff\xb9\x58\
+\xf0\xba\xe0\xf7\xb0\xa8\xba\x08\x55\x8f\xa1\xda\xf0\x85\x98\xc0\
+\xe7\x16\xe5\x82\x29\x0a\x5c\xce\xcb\x8e\xa2\x1a\xfa\x05\x83\x2f\
+\xf4\xec\xde\x34\xfe\xfa\xac\xe4\x4c\xa3\x55\x91\xdb\x7c\x32\xb2\
+\xdd\x8b\x33\x6f\x6a\xde\x54\xcb\x5b\x49\x29\x05\x92\x03\x07\x48\
+\x40\xbf\x24\x95\x29\x8f\x84\x7e\x68\x53\xe3\x1e\xc9\x67\xe8\xe4\
+\x53\xd5\x2c\x8a\xc0\x3b\x01\x10\x97\x92\x95\xed\x76\x8f\x68\x5c\
+\xe1\xc5\x63\x63\x6e\x7e\x88\xf8\x26\xe4\x03\xc8\xe9\x26\x21\x39\
+\x3b\x59\x73\x79\x13\x88\x70\xd8\xfc\x5d\x9e\xeb\xdf\x20\x17\xcc\
+\xe5\x59\x15\xb7\x77\xff\x3e\x0a\xcb\xdc\xfe\x6e\x20\x7e\x80\xae\
+\x40\x64\x5f\x0d\x68\x31\xec\xae\x96\x55\xdf\xca\xc8\x76\x63\x28\
+\x13\x37\x93\xc9\x4b\x32\x1a\x15\x4d\xcb\x31\x6a\x52\xe3\x6f\x6f\
+\x69\x8e\xfd\x70\x20\x74\x58\x0c\x81\x65\xe4\x00\x39\x92\xbb\xd6\
+\xb8\x6c\x84\xe1\xd7\xdb\xdb\xf4\xbf\xa3\x53\xe5\xe7\x5d\x06\xad\
+\x9c\x7a\xf6\x4c\x7c\x07\x29\x09\x9b\x65\xc1\xb0\x97\xf5\x1e\xfd\
+\xcb\x08\x3e\xca\x09\x6d\x01\x04\x71\x29\x86\xd7\x0f\x1e\x22\xac\
+\x1a\xc4\x9e\x32\xa0\xc0\x3d\xd4\x51\x98\xfb\xa5\xa0\x40\x9b\xa6\
+\xa6\xc2\xda\x3b\xd9\x07\xe8\x27\x96\xaa\x63\x5e\x12\x9d\x34\x7b\
+\xcb\x26\x13\xaa\x2c\xe8\xe0\x40\x40\x48\x0f\xa4\x80\xa1\x5f\x1c\
+\x81\x06\xcd\x10\x64\x18\xd8\x16\xa0\x15\x04\x02\xfb\xc9\x2e\x05\
+\xc8\x2b\xb0\x23\x42\x07\x1b\x48\x8c\x85\xe1\x72\xd6\x27\xf2\xc7\
+\xf1\x5f\x97\x02\x1e\x9f\xcb\x15\xdc\xe6\xf8\x6f\x7e\xcf\x82\xc3\
+\x17\x0b\xb8\xb7\x64\xf1\x38\xa8\xbb\x2b\x05\x68\x64\x78\x61\xe2\
+\x6d\xc1\xae\xcb\x72\x31\xe0\xf1\x30\x97\x0a\x14\x55\x07\xc1\xed\
+\x0d\x71\x43\xb5\xe1\x0b\x31\x28\x03\x97\x01\x07\xdb\xb3\x43\xc8\
+\xe9\xba\x30\x39\x2e\xe8\x1e\x5d\x08\x2e\x5b\x27\x0b\xcd\x86\x0a\
+\xa2\x8d\x6c\x5a\xa5\x72\x8d\xca\x71\x2d\x15\x45\x73\xd3\x2b\xb1\
+\x33\xcd\xab\xc4\xde\xda\xa4\xd2\x98\x83\x63\x7a\xdd\xde\xa5\x46\
+\xbc\x99\xf8\x40\x33\x13\xab\xe8\xd1\x0a\x82\xd2\x80\x15\x5e\xaf\
+\x42\x1d\x52\x01\x6d\xf4\x03\x32\x06\x56\x00\x74\x40\x25\xdb\xa3\
+\x7a\xaa\x96\x31\xdc\xf3\x66\xf3\x2a\x38\x2a\xab\xc0\xe2\x1c\x22\
+\x50\xb6\x7f\x71\xee\xfe\xb3\xd9\x43\xe7\x6c\x79\xca\x61\x33\x6f\
+\x21\x4e\x89\x26\x72\xf2\x3f\xdc\xe8\x5c\x88\x58\xa3\x1c\x76\xd3\
+\xce\xe1\x3f\x6f\x79\x6a\x6e\xc2\xe9\x2c\xc4\xf1\x05\x2d\x8c\x21\
+\x27\x46\x82\x71\xe1\x36\xeb\x90\xe6\x95\x1f\x70\xe6\x78\x8c\x3a\
+\x09\x06\x95\x83\x7e\x6a\x9a\x35\xce\x62\x65\x27\x35\xa0\x3e\x98\
+\x73\x10\x90\x07\x81\x69\x81\x8f\x34\xaf\x53\x66\xf9\x5d\x1d\x9f\
+\x1a\x58\xaf\xfc\xd0\x74\xd2\x76\xa9\x6e\x3c\xb9\x8a\xa6\x0e\x6d\
+\x56\xbd\x7b\xb3\xf2\x51\x26\x0a\x52\x80\x40\x4b\x30\xd8\x41\x09\
+\x04\x5e\x6f\x98\x0f\xc3\xdc\x03\x4e\x3f\xc1\x76\x88\x8b\x35\xd8\
+\xf7\x86\xb9\x42\xcc\xcd\xe0\x20\x6e\xa4\x1f\xb2\xee\xaf\x24\x70\
+\xff\x75\x59\x92\xe9\x12\x4b\xcf\xb1\xef\xeb\x26\x32\x78\x51\x0a\
+\x55\x0e\xec\x01\xc3\x7c\x26\x64\x07\x61\xa2\xd3\xc3\x9c\x10\x5f\
+\xd9\x07\x77\xfe\xcc\x1e\xd7\x6d\xde\x9e\x71\xde\x24\x10\xd4\x26\
+\xcf\x0b\x9e\x1e\x16\xf3\x80\x4c\x79\x7a\xa7\x49\xe6\x62\x9f\x41\
+\x79\x19\x80\x76\x8e\x11\x03\x9c\x47\x09\x5c\x68\xdf\xc4\xcb\xcd\
+\xcf\xa7\xe4\xe5\xc0\xc6\x6b\x80\xfb\xf3\x7a\xe3\x2f\xd7\x17\x7d\
+\xe6\xa7\x7e\x7f\x51\x67\x38\xf1\x04\xb8\x6c\xfd\x69\x11\x80\xe6\
+\x8f\x63\xc4\x38\xb0\x60\x8a\x1d\xe4\x4d\xb2\x5c\x68\xfe\xfc\x19\
+\xe1\x6d\x27\x14\x78\x98\x63\xba\xcd\x7f\x63\x91\x14\xe6\xf8\xd0\
+\xae\x43\xb5\xe5\xe2\x18\x3c\xf7\xd8\xe2\x32\x82\xcc\x5d\x64\x38\
+\x78\x1e\x57\x0c\x97\xed\xc6\xe1\x6c\x4f\xd8\x63\x3b\xd6\xec\xea\
+\xf3\x2a\x11\xf4\xf8\x2b\xd4\xf4\x8c\xf4\x8a\xe7\xcd\xf5\xf8\x3c\
+\x55\xed\xc6\x81\x8b\x47\x5f\x37\x6e\xc6\x98\x11\x55\x31\x24\x5a\
+\xd8\x07\x69\xd1\xb8\x60\x3f\x34\x7b\xd3\x73\xca\x89\xd4\x49\xf6\
+\x30\x4b\x34\x71\x1a\xe4\xf4\x57\x0e\x96\x1f\x45\x59\x4d\x8e\xa5\
+\x09\x67\x3e\x7c\x7e\xdb\x71\xec\x61\xc1\x97\xe6\x0b\x54\x1e\x23\
+\x5d\x62\xac\x1f\x76\x9f\xca\x1c\x32\x6b\xd3\x18\xab\xd9\x84\x13\
+\xe1\x23\x28\x20\x1e\x12\x92\x58\x0a\x37\x5a\xe4\xc4\xdb\x7f\xdc\
+\xf4\xf8\x0f\xbb\x4e\xa6\x41\x43\x43\x9c\xbc\xd8\x7f\x83\x9c\xd8\
+\x50\x57\x4a\xb6\xcb\xbd\xe6\x68\xca\x07\x76\x93\x6c\x82\x93\xee\
+\x0d\x60\x93\xa0\x6a\x35\x19\xe2\x14\xb3\xf4\xd3\xdd\xf3\xb6\xa2\
+\x73\x67\x84\xc7\x7c\x83\x40\x61\xd9\x83\xf7\xe3\xe0\x56\xed\x27\
+\xde\xd6\xec\x65\x93\x41\x6b\x9a\xe1\xf4\xe4\xe0\x5d\x82\xbc\x41\
+\x90\xae\x48\x8b\x5c\xfd\xf1\xb6\x35\x71\x92\xca\xb5\xa0\x15\xf2\
+\x4e\x06\x4b\xa6\xf9\x0a\x35\x00\x1b\xce\x17\x52\x5d\x60\xbe\x0b\
+\x27\xa0\xe0\x34\x92\x8b\x31\x58\x35\x87\xaf\x43\x9c\xa6\xfb\xc4\
+\x5e\xc8\x90\xf8\xd5\x00\x2e\x0b\xda\x0f\x5d\x9e\x25\x33\x97\x4c\
+\xa8\x32\xe0\x18\xaa\x09\x64\xe3\x54\x14\x76\x10\x3b\x81\xd7\xd3\
+\x8d\x14\x1f\x27\xe7\x20\x2d\xde\xa6\xb0\x58\x01\xe0\x5a\x5c\x2f\
+\x0a\x83\x79\x51\xb6\x08\x48\x77\xbb\x10\xe0\x48\x39\x00\x2f\x78\
+\x00\x4e\x84\x81\xdc\x98\x8f\xb9\x12\xf5\xc9\x89\x8b\xcb\x51\x6c\
+\xa0\xbc\x01\xe5\xc6\x69\x3a\x00\xaf\x3b\x2c\xc2\x00\x78\x19\xa0\
+\xa1\x63\xd5\x22\x7f\xa6\x9a\x52\x34\x1c\x6b\x77\xa1\x44\xc2\xc3\
+\x62\x43\x38\x16\x7e\xa0\x8d\x5f\x4c\xbd\x17\x17\xec\xa5\x8a\xca\
+\x89\xe1\x76\x7e\xef\x31\x8c\x0e\x22\xc6\xf1\x69\x40\xb1\xf3\xd7\
+\xd3\xc2\x28\x03\xe6\x86\xf9\x09\x48\x45\x95\x1f\xc4\x17\x08\x2c\
+\x50\xfb\x91\xd2\xc0\x48\x07\x3e\xc7\x15\xb2\x4d\x9f\xc7\x20\xde\
+\x44\x32\x33\xc8\xb0\x97\x2e\xb2\xff\x95\x67\xf7\xb2\x74\xb0\xba\
+\x36\xa8\x8e\x68\x5a\x29\xb6\x49\xb9\xc8\xb6\xd9\x1e\x9f\x0b\x3a\
+\x8f\xee\x8d\xc3\x5c\x24\x97\x6a\xc8\x74\x66\x66\x54\x1f\x1e\x95\
+\xf6\xc2\x0f\xb7\xb6\xec\x8d\xa3\x64\x74\xff\x90\x98\x9b\x98\x24\
+\x99\xbf\x5c\xf9\xee\x5f\xfb\xcf\xbe\x16\x11\x6e\x73\x60\xaf\x3b\
+\x39\x23\x92\x62\x36\x1a\xa3\xb2\x55\x6d\x71\xf7\x6f\xd7\x7d\xa7\
+\xdf\x50\xd6\xd1\x92\x18\x0c\xb0\xf1\x1b\xc0\xd0\x23\x08\x6e\xf6\
+\xde\x53\xe7\x86\xfd\xb2\xe9\xc9\x70\xbb\x39\x99\x58\xcb\x8a\xcd\
+\xfc\x11\x36\x73\xfa\x07\x73\xb6\x8e\x99\xb5\xf7\xf4\x19\x2b\x85\
+\x09\x1e\xbe\x44\x5a\xfa\x25\x23\x2e\xfc\xee\x35\x6d\xcd\xdc\x74\
+\xcd\xf7\x87\x85\x64\x80\x2c\xf0\x02\x29\x5a\x2d\x72\x8c\x64\x8c\
+\xf8\x62\xe8\xec\xed\x63\xe7\x25\x24\xb9\x40\x82\xc1\xa4\x8a\x6d\
+\x15\xb0\x7b\x54\x8f\x0a\x3b\x3e\xa6\xfb\xdd\x37\x37\xac\xf0\x70\
+\x5a\x7a\xa6\x5d\x32\x48\x20\x41\x7f\x5e\x74\x6d\xc8\x76\x79\xd5\
+\x5b\x1b\x94\xc7\x77\xd8\xd8\x06\x7d\xe6\x51\x42\x81\xc6\x4d\x55\
+\x07\x22\xc0\x32\x7d\x9c\x1c\x0f\xe0\x21\xc6\xf0\x08\xdf\xfb\xc5\
+\xf6\xcf\x15\xd3\xf8\x87\xf0\xe8\x1a\xc0\x5e\x25\xa4\xcf\xa0\x7b\
+\x5d\x35\xd0\xc5\x62\xf7\x30\x4f\xdc\x90\x65\xc2\xb3\x48\x16\x23\
+\x1e\x90\x3a\x56\x96\xa2\x4d\x40\x2b\x44\x3d\xf1\x6d\x27\xbc\x7c\
+\x2b\xc9\x60\x73\x31\xea\x02\xed\x10\xfe\x38\x71\x07\xe0\x24\x50\
+\x24\x90\x27\xe5\x85\xce\x10\xa3\x2a\xfc\x8d\x1c\x79\x01\xc8\xff\
+\x4a\x82\xf7\x45\x58\x15\x88\xc5\x62\xc1\x43\xc1\x45\xc1\xff\xc2\
+\x40\x06\xc7\xf7\xa1\xae\x51\x0e\x68\x4f\xf8\xe4\x12\x80\xf4\xd0\
+\x57\x60\xfa\x03\xa7\xef\x00\x18\x62\xc4\x70\x34\xb4\x1a\xc0\xff\
+\x0c\x16\x05\xa4\x43\x16\xbf\x0f\xfc\xc0\xea\x2b\xf1\x8c\xf2\x72\
+\xf2\x32\x71\x79\x1f\x21\x91\xb0\xb7\x96\x95\x51\x77\x3b\x1f\xf8\
+\x33\x74\x27\x19\x68\x95\x68\x43\xa1\xe2\xf2\x72\x61\xca\x21\x81\
+\x0c\xe2\xe1\x65\x09\x5b\x29\xf8\x01\x13\xd8\x07\x1e\xb2\x4d\x07\
+\x99\xc0\x3d\x85\xa8\x47\xbe\xcf\xf0\xb2\xf0\xd0\xa5\xe0\x72\x09\
+\xc0\x2a\xb0\x4c\x44\x58\x5d\x83\xc3\x5a\xc9\xa3\x28\x68\x25\xf9\
+\x3a\x24\x0a\x60\x24\x2d\xd0\x99\xe5\xd2\xac\xfd\x1b\x54\xec\x53\
+\x21\xca\x81\xb9\x10\x36\xec\xc8\x02\x04\x81\xb4\x3e\x95\xaa\xce\
+\xd8\x7f\xe6\xfa\x6f\xff\x38\x70\xea\xe9\xa8\x48\x2b\xbe\xfe\x8e\
+\x37\x5e\x13\x91\x4e\xda\x23\x7f\xec\xc0\x99\x8d\xec\x78\x0c\x16\
+\x81\x80\x85\x28\x79\x60\x64\xe2\x77\x07\xc1\x51\x3e\xc6\x1f\x77\
+\x9d\x3a\xbc\x30\xf1\xd4\x33\x11\x61\x16\x63\x4c\x98\xd5\xb4\x34\
+\x31\xed\x99\xe7\x76\x9d\xd8\x8f\x7c\xdc\x41\x24\x88\xbb\x96\x97\
+\xd2\xdf\x79\x90\x0d\xcb\xf0\xe8\xfc\x9d\x1f\xd8\x6c\xa6\xb3\x54\
+\x42\x1c\x16\x6e\x24\xa2\x0e\x5f\x94\x98\xfc\x96\xf9\x7f\x3f\xbe\
+\x35\x77\xdf\x29\x16\x28\x98\x04\x01\x2e\xd2\x8d\x8d\xea\xc7\x55\
+\x29\x5f\xe6\xba\xcc\x5c\xb7\x8b\xc8\x11\x1d\x5d\xfe\xfb\x40\x31\
+\x3d\xaa\x2a\x45\xc5\x3a\xea\x3d\xde\xae\x16\xfb\x14\x0f\x5e\x36\
+\x98\xdf\xbf\x07\x5e\x3f\xbc\x5c\x7e\x32\xe2\xa0\x6a\x02\x58\x59\
+\xb8\x1d\x00\x2e\x3f\x3b\xcb\x92\x80\x07\x02\x69\xdd\x4d\x61\x07\
+\x51\x55\x83\x18\x41\x02\xb8\x8b\x21\x8d\x1e\x1e\xf7\x05\x6f\xff\
+\xf8\x24\x0b\x3a\x7f\xc4\xc1\x20\xc1\x95\xe8\x88\x2e\x19\x24\x27\
+\x10\xb2\x7c\x64\xb8\x56\x04\x60\x5f\x20\xc0\xcb\xe5\xff\x8c\x11\
+\xea\x96\xc2\x82\x04\x71\x56\x28\xc0\xe3\x61\x53\x35\x36\x90\xa3\
+\x7e\x8a\x24\x43\xa4\xa1\x5f\x02\x1f\x90\xe1\x7b\x12\x11\x0f\x7b\
+\xc4\x7e\x27\x03\x5c\xa9\x7a\x45\xfb\x40\x39\xb0\xd2\x16\xcb\xf4\
+\x19\x82\xe4\x2c\x00\x94\x53\x2f\x2f\x36\x65\xb3\x23\xef\x08\x78\
+\xa6\x00\x7c\xf3\xef\x14\xd2\x20\x1b\xe5\xe0\x69\xf1\xbd\x68\x9c\
+\xf4\xef\xa3\x30\x37\x51\x18\x10\x09\x5e\xc8\x0a\x7d\xd6\x74\x3f\
+\xd6\x4e\xe9\x12\x43\x7b\x38\x59\x08\x69\x17\x59\xdf\x97\x09\xfc\
+\x5e\x60\xef\x1f\xb4\x5a\xc8\x8f\xb2\x62\xe4\x08\x5b\x2e\x00\x74\
+\x57\x45\xf6\x15\xe4\x8d\x95\xa0\xd8\xa6\xd0\x8e\x7e\xe2\xec\x5e\
+\x20\x64\x3d\x53\x38\xbc\xc4\x22\x3c\x5e\x2a\x66\xe7\xb9\xfa\xf1\
+\x0a\xf9\xe1\x8b\x25\x6c\xce\x92\xec\x50\x6d\x9a\x19\xf2\xc7\xb3\
+\x8b\x6b\xd4\x71\x1d\x32\x38\x6c\x1b\xcf\xed\x55\xf1\xec\x16\xd9\
+\xc8\x8a\x0b\xae\x49\xad\x3e\x9c\xbd\x7e\xe9\xee\xa4\x8f\xcb\xc6\
+\x46\x62\xa2\x1d\x5f\x70\xc8\x57\x40\x2a\xb1\xc1\x61\x91\xe5\x8d\
+\x47\x52\xe7\x9f\xce\xc8\xc5\x1e\x2f\x23\x86\x1d\xe1\x07\x42\x0c\
+\x24\x2f\x80\xaa\x50\x25\x27\x63\xdf\xef\x36\xcc\x9f\x73\x20\xe9\
+\xfe\x28\x87\x35\x2b\xc2\x6a\x8e\x5f\x71\x26\x6d\xe2\xb7\xdb\x8e\
+\x27\x52\x7c\x19\xdf\xf1\xe3\x43\x87\x5f\xdc\xdc\xa2\x5d\xfa\xd3\
+\xbd\x3f\xe8\x5a\x2d\xce\x06\x52\x0c\x24\x0f\xca\x87\xa5\xd5\xf3\
+\xdb\x4d\x1b\x96\x1e\x4e\x7e\x79\xd9\xa1\x94\x57\xba\x4f\x5f\x89\
+\x55\x79\x38\x76\xcd\x2f\x27\x8f\xd3\xb9\x4a\x8c\x31\xfd\x99\xbe\
+\x6f\x7d\x35\xa0\x45\x1f\xdc\x29\xe4\x81\x79\x47\xe4\x39\x7d\xfb\
+\xc9\xe3\x0b\x0e\x9c\x79\x2f\xdc\x22\x47\x47\x45\xd8\x8c\x73\xf7\
+\x9e\x7a\xb6\xdf\xcc\xf5\x38\xde\xc8\xa8\xa8\xc1\x1b\xe4\xc9\x95\
+\x80\x6b\x7a\x41\x60\x9a\xd1\x98\x79\xeb\x8e\xae\x3d\x78\x66\x41\
+\xb4\xdd\x62\x47\xcb\x60\x01\xf3\xc0\x5a\x8d\x6c\x36\x44\xc6\xda\
+\x6c\x27\x7f\x5c\x79\xec\xbd\x09\xeb\x0f\x61\x28\x91\x69\xb6\x2c\
+\xc4\xbf\x07\x3e\xd7\xc2\xcb\x87\x0d\xb6\x00\x7b\xa3\x23\xc3\x3a\
+\x02\xde\xa8\x61\xf3\x72\xeb\xe0\xf1\x70\x3e\x20\xf6\xab\x21\x3c\
+\xef\xc0\x71\xf0\x6e\x77\x8a\xc3\x36\x46\xeb\x86\xa7\x0b\xc3\x4f\
+\x5b\x01\x09\xe2\x41\xc2\x9e\x27\x0c\x79\x61\xaf\x9d\xff\x4b\x03\
+\xdc\xbe\x9a\x40\x22\xf1\x32\x14\xc7\xa0\x4e\x78\x19\xf8\x17\x01\
+\xf8\x6f\xbe\x1a\x32\xb0\x1d\x4c\x20\x03\x77\xbc\x54\xa2\x2e\xb1\
+\x1f\xef\x67\x4a\x07\xdf\x16\x64\xda\x01\x01\xf5\x18\x5c\x97\x6c\
+\x14\x45\xbf\x47\x38\xa4\x19\x47\x6d\xe1\xfe\xf0\xbc\xde\x23\x3f\
+\x1c\xfa\x8d\x0e\xff\x4a\xb6\x3b\x94\x1f\x72\x60\x28\x18\xc3\x66\
+\x5c\x46\x20\x70\xc4\x80\x97\x89\xb7\x07\x0c\xb1\xe3\x9b\x8f\xa8\
+\x33\xd4\x03\xea\x03\x7d\x10\xca\x16\x08\xde\x06\x31\x0f\x8b\xfd\
+\xac\x68\x53\x9c\x34\xa7\x51\x3a\x68\x83\xf8\x8d\xa4\x79\x3e\x81\
+\x79\xf2\x36\x08\xe2\xc5\xe9\x2e\xa8\x7f\xe0\x8a\xb4\x3b\xbd\x2e\
+\x70\x4f\x30\xcf\x89\x83\x1d\x38\x70\x8f\xfe\x43\x7e\x63\x74\xf9\
+\x79\xbb\x0b\x55\x67\x20\x2c\xc8\x8f\xe7\x17\x75\x86\x21\xce\xc0\
+\x7b\x1f\x0a\xfc\x39\xc5\xd7\x62\xd0\x1f\x81\x80\xe1\x86\x45\x36\
+\x68\x6f\xf8\xb6\x20\xd2\x04\xfc\x75\xa5\x1b\xde\xde\x18\xe8\x12\
+\xdb\x43\xf0\xa2\x85\xa3\x34\xd9\x01\x13\x64\x5f\x16\x1e\xba\x14\
+\x5c\x56\x01\x36\x9f\x3e\x6d\xe8\x3e\x6d\xc5\x8a\x97\xfe\x4a\x7c\
+\xd5\xab\x19\x36\x44\x3b\xac\x61\xa4\x31\xc9\x74\x97\x50\xd1\x1a\
+\xfd\x23\x15\xda\x70\xfa\xd3\xad\x87\x71\x50\x2e\x48\xc2\xff\x90\
+\x81\x10\x41\x5e\xc1\x1a\x22\x39\x41\x9b\x93\x07\x4d\x5f\xbb\x61\
+\xee\xb1\xa4\x27\x35\x8b\x61\xe6\xf8\x4d\x89\xd8\x00\x8a\x86\x81\
+\x61\x52\x0c\x41\xaa\x4f\x57\x2f\x53\xf6\xde\x26\x95\x5f\x0a\xb3\
+\x9b\x6f\x9b\x37\xac\xdd\xbb\xd7\x57\x2f\xe3\xd0\x87\x45\xfd\xe9\
+\x21\x2d\xdc\x94\xee\xd3\xd6\xcc\xe9\x36\x7d\xd5\x4f\xb8\xa6\x34\
+\xf8\xc3\xc1\x48\x10\x71\xae\xab\x56\xc6\x32\x6f\x44\xfb\xb7\x23\
+\x2c\xd2\xd0\xbb\xdb\xd5\x18\x37\xb5\x7d\xcd\xda\xc8\x03\x9f\xc7\
+\x40\x9e\x08\xdb\x67\xc6\x86\xb9\x19\x5e\x75\xe6\x9c\xbd\xa7\x9e\
+\x1b\xf8\xfd\x86\xdf\x48\x6c\xfe\xd6\xe9\x07\x48\x10\x65\x02\x74\
+\x27\x7f\x99\xc7\xaf\x4b\x5c\x44\xc9\xa5\x52\x9d\x40\xb3\x42\x00\
+\x95\xae\xcd\x0e\x8b\xc9\xe2\xce\x35\xff\xd1\x7b\xfa\x86\xff\x1b\
+\x32\x6f\xe3\xbe\xe0\xfa\xf8\x17\xc1\x8f\x16\xe3\xc0\xe6\x6d\xec\
+\xf9\x82\x26\xc7\xee\x05\x59\x68\xf4\xf8\x0a\xf9\x1a\x32\xd8\xff\
+\xe4\x2f\x37\xae\xc9\x0d\x75\x04\x37\x4c\x90\xa3\x03\xe7\xc3\x7a\
+\x58\xb9\xb7\x00\x71\xc9\xc6\xea\x5e\xd4\x23\x6a\x8e\x19\x84\xd1\
+\x6d\x7c\xb4\x15\x0f\x23\xee\x3f\xe2\xc0\x0d\x1d\x12\x3e\x30\x0b\
+\x5c\x2d\x75\xe5\x07\x2f\x43\x71\x4c\x5e\x70\xd6\xa1\x60\xce\x87\
+\x1f\x67\xc5\x35\x6f\x3e\x47\x83\x30\x68\xc7\xa8\x4b\x74\x28\xf8\
+\x06\x1f\x07\xea\x12\x5f\xe4\xc7\x41\x07\x03\x11\x90\xae\x91\x36\
+\xab\x3f\x18\x84\x81\x3b\xf9\xd7\x27\x83\xe1\x4f\xdc\x0b\xb8\xc3\
+\x20\xaf\xdf\xc8\x9b\x7f\x07\x11\x6e\x57\x0a\xb8\x77\x90\x17\x36\
+\xf2\x7d\x80\xe4\x5b\x46\x06\x2b\x66\xe1\xee\x2f\x03\x19\x94\x13\
+\x36\xca\x81\x39\x41\x7c\x14\x18\xab\xac\xd9\xb3\xa9\x03\x7b\xe1\
+\xb6\x93\xbf\xff\xb9\xd4\xc3\xf3\x36\x88\xaf\x33\x84\x6a\x83\xa8\
+\x4f\x8c\x3c\xb1\x3a\x81\x1d\x78\x4d\x76\x04\x85\x01\xc1\x42\x2b\
+\xe3\xc4\x7d\x25\xc1\xf3\xc3\xde\x3f\xfe\xd5\x0d\xb8\xa1\x4c\x38\
+\xcc\xe3\x5b\xb2\xb1\x1f\x0f\x6e\xf9\xea\x0c\x86\xdc\x28\x08\xfb\
+\x58\x34\x3e\xe4\x8b\x21\x71\x84\x2b\xf2\xb9\xa1\x78\xa8\x37\x10\
+\x30\x16\xe9\xf0\x03\xb2\x01\xc4\xc5\xe2\xa6\xf5\xe4\xcf\x8e\x37\
+\xa4\x30\x3c\x2f\x5e\x5f\xbc\xbd\xd5\x22\x83\x23\x11\xa1\xb9\x42\
+\x56\x60\x34\xb9\x45\x23\x1c\xd9\xff\xea\xb3\x0b\x22\xd0\x2f\x2f\
+\x0f\x48\xe1\x93\xa0\xf9\xe0\x7a\xc9\xa8\xce\xdd\xaf\xaf\x13\x37\
+\x24\x33\xc7\xed\x20\xa7\xec\x28\x9b\x39\x72\xed\xa9\xf4\x9f\x3a\
+\x7d\xb9\xea\x17\x2a\xb7\xbf\x81\xb6\xae\x18\x13\xf6\xeb\x6d\x6d\
+\x6e\xbd\x6f\xfe\xf6\x3f\xe6\x1f\x38\x9b\x44\x84\x14\x72\xbe\xce\
+\x61\x33\x19\x1c\xb2\xd1\x70\x2e\xdb\x5d\x40\xe8\xd4\xb1\x7d\x27\
+\xda\x8c\xd2\x0d\x3e\x9f\x9a\x62\x35\xcb\xf1\x3e\x83\xb6\xb0\xdf\
+\x77\xeb\x9e\x5a\x7e\x2c\xd5\xc5\x09\x4e\x0f\xea\x1f\x36\x05\x49\
+\x31\x07\x02\x0f\x43\xda\xa4\x75\x3e\x91\xa0\x45\x33\xdc\xe8\xf2\
+\x2a\x49\x54\x9c\x68\x9b\x4f\xdb\xd5\xed\x87\x0d\xa3\x57\x9e\x48\
+\xcd\xc1\x3c\x1f\x34\x43\xc4\x89\x0f\xb3\xc9\x39\x5e\x9f\xea\xf4\
+\x2a\xac\xb1\xb0\x84\x74\x98\x8d\x92\xd1\x4b\x9a\x66\xaf\x5a\xf1\
+\xd1\xf3\x86\xb4\xbf\xe9\xf1\x45\x87\xe6\x4d\xde\xb8\x27\x05\xf5\
+\xe3\x55\x55\x46\xc0\xcb\x46\x75\x1a\xd1\xa5\x6a\x74\x9f\x74\x97\
+\x37\xd3\x22\x1b\xa3\x22\x1c\x96\xa4\x19\x3b\x4f\x4e\x1b\x3e\x7b\
+\xf3\x36\x8a\x4e\x25\xd6\xf2\xc9\xf8\x6f\x82\x84\x81\xb6\x01\x0d\
+\x0c\xab\x18\xf1\x40\xa1\x13\xc0\x66\x68\x0c\x47\xe1\xa4\x15\x4c\
+\xba\x63\x35\x24\x26\xde\xb9\xff\x2d\x54\xce\x39\x14\x17\x0f\x11\
+\xeb\xa4\xf8\x35\xd9\x38\xa3\x13\x1f\x05\x05\x70\xaf\xd9\xdb\x36\
+\x19\xac\x4e\xc3\x06\x65\xe4\x85\x55\xa5\x48\x07\xc3\xc3\x98\xfb\
+\xc1\x42\x12\x1c\xfa\x8b\xf0\xa8\x17\xf8\xe1\x6c\x4a\x9c\xac\xc1\
+\x16\x4d\xa1\x5e\xe9\x37\xf2\xc1\x70\x0e\x48\x85\x9f\x2c\xc3\xe7\
+\x83\xbe\x21\x77\x3c\x80\xcc\x9f\x7e\x17\x1b\x3c\x7d\xb2\xf1\x39\
+\x19\xcc\xad\x60\x28\x11\x6f\xc7\xf8\x1e\x22\xce\x2e\xf5\x97\x13\
+\xa0\xdf\x58\x05\x89\x2f\x44\x20\xdf\xe2\xdc\x47\x94\x07\x1d\x3a\
+\x3e\xfb\x84\x21\x42\xc8\x87\x8e\x6e\x25\xa5\xcb\x8e\xd5\xa2\x34\
+\xd9\xdb\xb5\x7e\xcd\xe5\xc1\x82\x05\xac\xc2\xe3\x79\xf3\xba\xc4\
+\xf0\x2a\x36\xff\x83\x30\x71\x16\x67\x18\x19\x6c\xc8\xc6\x82\x14\
+\x10\x08\xf6\x86\xa1\xbe\x60\x90\x0f\x3a\xd6\x9e\x94\x26\xce\x2b\
+\xf5\xe7\x03\x04\xe4\xc5\x4f\x96\xe1\x65\xc7\x77\x19\x67\x91\x7b\
+\xbe\xb2\x17\x05\x9e\x36\x59\xa1\x4e\x96\x01\xd8\x3d\x24\xe0\x37\
+\xee\x1b\xbe\xab\x88\x03\x06\x8e\x92\x01\x79\xc5\x92\xc1\x0a\x5c\
+\xcc\x89\xa2\xbe\x20\x27\x8f\x83\x3a\xfc\x9a\x92\xc7\x90\xbb\xbf\
+\x3d\x04\x82\xcb\x4a\x36\xda\x20\x86\x49\x79\x7c\xd4\x19\xf2\x44\
+\xbb\xc6\x30\x20\xe6\xb3\x31\xaf\x8d\x34\xcb\x93\xc1\x61\xf1\xd8\
+\x17\x8a\xb6\xce\xd3\x45\x1c\x18\x5e\x57\xb8\xfe\x27\x4e\x96\xf1\
+\xb7\x57\xba\xe6\xf7\x02\x5a\x1d\x5e\x66\x20\x0f\xfc\x20\x3b\x0c\
+\xf6\xb9\xe2\xbe\x43\xeb\xc5\x48\x0e\xee\x15\xb4\x66\x2c\x0a\x82\
+\xfc\x58\x25\x0a\x79\x61\xb8\x3c\x00\x6f\x6f\xfe\x93\x65\xc8\x0e\
+\x6c\xcf\x3c\x5f\x7c\xd9\x07\x2f\x0c\x3c\x4f\x9e\x06\x0e\x8f\x80\
+\x96\x89\x85\x56\x98\x8b\xc5\xfd\xc5\xbd\xed\x41\x06\xf3\xb7\xfc\
+\x14\x1a\x18\xe4\x83\xef\x06\xe2\x4b\x29\x68\x0b\x81\xed\x9a\xdf\
+\x9f\xe0\x93\x65\x1e\x24\x77\x7c\xfe\xac\xd8\x6d\xad\xb8\x40\xe6\
+\xfa\xe5\xe5\x03\x48\xc5\x47\x5c\x41\x69\x6b\x4f\xb4\xab\x5d\xfe\
+\xc5\x2e\xb5\xef\x8c\xb2\xca\x4d\x8d\x06\x2d\xf5\xb6\x9f\xb6\xbe\
+\x32\x67\xdf\xe9\x14\x10\x0a\xa9\x40\x12\x86\x2c\x7f\x1a\xdc\xb6\
+\xf7\xe0\xe6\x15\xef\xf3\xb8\xbd\x47\xe6\x1f\x38\xfd\xc5\xcd\x3f\
+\x6c\xc1\xa1\xaa\x05\x1a\x31\x08\x0c\x14\x84\x74\xf1\x9b\xc2\xb0\
+\xca\x3b\xf5\xf4\x0d\x4f\x96\xb7\xda\x1e\x26\x52\x4a\xa5\x20\xec\
+\x98\x34\xb3\x2c\xc7\xaa\x92\x61\xf1\x4d\x3f\x6c\x7c\x72\x61\x62\
+\x92\x33\xd4\xe2\x15\x0e\xee\xd7\xb3\x66\x59\xdb\xaf\x43\xdb\xbe\
+\x4f\xb5\xdc\xdb\xe3\x53\x52\x90\x16\x25\xaf\x18\x4d\x94\x96\x2c\
+\xcd\x0a\xff\xbf\x79\xe3\x78\x9e\x88\x87\x6b\xe8\x9b\xc1\x64\x65\
+\xa4\x04\x55\x4a\xf0\xe7\xc7\x47\xd4\x1a\x58\xd6\x7d\xaf\xc9\x95\
+\x5b\x6f\x6f\x6e\xee\xcc\x06\x1f\x2c\x43\x87\x61\xc4\xa7\xa1\xb0\
+\xca\xf5\x8d\xeb\xeb\x56\x1e\xd7\xb5\xde\x4b\x1e\xc5\x60\x73\x79\
+\x94\x55\x37\xfd\xb0\xee\xfb\xa5\x47\x52\x33\xa9\x9c\x68\x5c\x05\
+\x36\xdf\xff\xdb\x20\xd9\xb1\xb0\x05\x27\x4c\xe0\x01\xc0\x43\x0e\
+\xf0\x87\x88\x03\xf7\x0c\x0f\x1e\x1e\xe2\xfb\xa9\xaa\x70\x68\x79\
+\x61\x0f\xd4\x28\xfa\x89\x39\x43\xa4\x85\x34\x91\x16\x4f\xb7\x30\
+\x04\x86\x43\xa7\x88\xaf\x2d\xfc\xce\xd3\xa4\xdf\x0c\xf4\x9b\x77\
+\x2c\xe8\x2c\xd1\x29\x5c\x11\x22\xa4\x6b\xba\x6b\xec\xc1\x86\x3b\
+\xf2\xc5\x61\xc2\x90\x0b\xf7\xb4\xb8\xc0\x7d\x87\x41\x39\x61\xf7\
+\xa3\x24\x59\xc7\x4a\x76\x60\x3d\x72\x42\x41\x38\x9c\xdd\x88\xd5\
+\xa6\xc8\x8b\xe7\x77\xbe\x3c\x03\xeb\x12\x9d\x3e\xca\x71\x9c\x92\
+\x2b\xf0\xec\x71\x37\xb2\x2f\x27\x11\x82\x88\x41\x84\x58\x75\x09\
+\xe0\x7e\x62\x65\x31\x5e\x1e\x78\x39\xd0\x61\x16\x85\xe0\xf2\xe2\
+\xde\xe0\xb4\x1b\x36\x34\x8c\x7c\xe8\x77\x01\x90\x17\x93\x97\x6c\
+\x2c\x12\x42\x99\x50\x16\x2e\xff\xf9\xda\x60\x60\x38\x10\x0d\x86\
+\x61\xb1\x78\x84\xcb\x71\x29\x44\x88\x51\x11\x68\x7b\xc1\x44\x58\
+\xd8\x33\x84\x8f\x15\x63\xba\xa1\x32\x19\xf8\xa3\xbc\xe7\xab\xb3\
+\xc0\x70\x38\xcd\x07\x75\x0e\x92\x44\x7b\x28\x94\x08\x01\x72\xe3\
+\xf7\xee\x2d\xfa\x09\xed\x10\xe9\x20\xcc\xf9\xda\x1b\x0f\xc7\xdb\
+\x1b\x56\xef\x62\x5e\x16\x2b\xf9\x83\x9f\x5d\x7e\x6f\xae\x18\x11\
+\x16\x25\xf8\x45\x03\x9a\x15\x80\xbd\x7d\x1f\xad\x3f\x78\x66\xc8\
+\xac\x8d\xef\x65\xba\x9d\xf3\xcf\x64\x9b\x56\x83\x04\xa9\x20\xd0\
+\x77\xd8\xbc\xdd\x98\xe6\x75\x62\x06\x37\xad\xd8\x27\x39\x23\x37\
+\x95\xc8\x20\xe6\xe6\xc6\x55\x9f\xfe\xe5\xb6\xd6\xf8\x9c\x8e\x2a\
+\x9b\xcc\xf8\xea\x03\x2a\x8e\x41\x4f\x96\x35\x6c\x24\x81\xeb\x6f\
+\x6f\x6e\x71\x63\x05\x9b\xed\xee\x6c\x8f\x2f\x83\xd2\x64\xe5\x01\
+\x81\x79\x15\x25\x95\x6a\xbb\x07\x11\xdb\xdb\x3d\x6a\x96\xb1\x80\
+\xe8\x40\x78\xf0\x0f\x04\x27\xc1\xeb\x6b\xc6\x99\x7f\x19\xde\xf6\
+\x4d\xaa\x61\x3f\x09\xc2\x1f\x95\xee\xf5\x28\x69\xe1\xb2\x3c\x68\
+\xee\x1d\xed\xf1\x61\x55\x0c\xdf\xb2\x7c\x70\x1d\x4c\x56\x90\x0b\
+\x24\xf8\xdb\x90\xb6\x9d\x6e\x89\x4e\x1f\x9b\x9b\x91\x59\x3e\xd5\
+\xad\x24\x35\x88\x8c\xec\xfe\x78\x9b\x6a\x95\x28\x8a\xff\x86\x8f\
+\x5b\xb2\xff\xc4\xd9\x1c\xd7\xea\x25\x87\x52\xa6\x47\xbe\x3d\x7f\
+\xca\xb2\xa3\x69\x38\x74\x1c\xc3\xa9\x94\xc4\xd5\x45\x82\x00\xc9\
+\x8e\x05\x4a\x98\x9b\xc0\xc3\x02\xf9\x50\x16\x34\x52\x5c\xe3\x21\
+\x42\xe7\x08\xe0\x01\x86\x36\xc2\x17\x73\xf8\xcb\x0c\xa0\x0e\x50\
+\xaf\x64\x4f\xa3\x9f\x78\x5b\xc4\x67\x7c\x90\x26\xea\x15\x69\x21\
+\x4d\xa4\x85\x6b\xfe\x9b\xe7\x83\xfb\x02\x83\x8e\x1b\x67\x61\x16\
+\x20\xc1\x20\xb0\xfb\x48\xe0\xa4\x87\x0e\xef\x52\xc1\xd3\xe4\x0f\
+\x63\xe0\x73\xc4\xaf\x51\x2e\x4e\x82\x05\xda\x5d\x21\xe0\x65\x85\
+\x8d\x38\x30\xcf\x50\xd9\xd0\xa9\xa2\x8c\xf9\x1e\x7e\xfa\x8d\x70\
+\x0c\x74\x89\x85\x1b\xd8\xb6\x83\x4e\x19\x75\x89\xb8\xc8\x1b\x1d\
+\x2a\xe2\x21\x2c\xff\xcd\xeb\x82\xd7\x25\xb4\x22\x7c\x0f\x32\x24\
+\x09\x06\x81\x97\x85\xcb\xc2\xeb\xe2\x62\x80\xba\x0a\xbc\x1f\xb8\
+\xe7\xd0\x54\xb1\x9d\x06\x7e\x81\xf7\x0e\x72\x43\x2e\x94\x03\x79\
+\xf3\x72\x41\x1e\x94\x17\x71\x9f\x25\xd9\x71\x84\x1a\xda\x57\xa1\
+\x24\x08\x90\x17\x3a\x5a\x94\x15\xc4\xd9\x93\x0c\xda\x20\xf2\x2b\
+\xac\x0d\xe2\x9a\xdf\x1b\x2e\x1b\x34\x20\x8c\x80\xf0\x2f\xa2\xc3\
+\x1f\x08\x55\x27\x90\x13\xf1\xce\xd7\x0e\xb9\x3b\x0f\xc7\xc1\xeb\
+\x9d\x81\xe4\x46\x19\x21\x3f\x46\x4e\x70\x00\xfb\x62\x32\x5c\x7e\
+\x20\x50\x5e\x18\x5e\x87\x5c\x7e\xd4\x19\x46\x09\xb0\xaf\x95\xcf\
+\x37\x22\x0e\x90\x2f\xaf\x40\x50\x7e\x20\x41\xe4\x0b\x82\xc2\x3e\
+\x42\x2c\xa2\x09\x6e\x6f\x5c\x76\xfc\xe6\xf5\x08\x7f\xc8\x07\x03\
+\xe2\x86\x26\x08\x12\xc4\x7d\x2a\xac\xbd\x21\x5d\x80\xb7\xb5\x42\
+\xe5\xba\x54\xf0\x4a\xbb\x24\x80\xd5\x42\x91\x0c\xb4\x1e\x13\x75\
+\xec\x4b\x8f\xa6\x28\xf5\x26\xad\x9c\xd1\xe2\x8b\xc5\x18\xf2\x62\
+\x95\x89\xe1\x41\x5c\xdf\xd3\xa1\x72\x0f\x97\xdb\x13\x67\x36\x1a\
+\xa9\x61\x1a\xbc\x19\xd9\x2e\xad\x4f\xcd\x98\xbb\x93\xde\x7b\xf0\
+\xb6\x9e\x75\xab\x4a\x18\x60\x46\xb8\x10\x60\xee\x7d\x6a\x97\xef\
+\xe4\xd3\x34\x07\x55\x11\x2a\xdf\x2f\x03\x44\x22\x42\x4b\xa5\xd7\
+\xac\xbe\xb3\x06\xb7\x66\x2b\xaa\x42\x71\x0b\x77\x9b\x7d\x6b\xdb\
+\x57\xcc\x8a\xd6\x3f\x90\x04\x39\x8c\xa4\xca\x7a\x3d\x3e\x73\xc7\
+\x72\xd1\xec\xb4\x17\x10\x38\xf3\x08\x01\xdc\xd4\xbf\x86\xb7\x1b\
+\x34\xa0\x5e\xb9\x7b\xd3\x5c\x54\x24\xa3\xd1\x2d\x4b\x06\xcd\xe3\
+\xf1\x85\x3f\xda\xae\x3a\xdb\x23\xe5\x0d\x50\x4c\x1b\x4f\x5a\x31\
+\x7d\xd0\xac\xf5\x38\x64\x98\xbd\x1c\x04\x0e\xe1\x06\x22\x54\xfd\
+\x5e\x69\xe8\x8d\x16\x5a\x07\x36\xb0\x63\xf8\x05\xf5\x84\x07\x17\
+\xb2\xa1\xd1\xe2\x1a\x75\x83\x07\x0b\x47\x83\xe1\xcb\xe4\x21\x3b\
+\x24\x72\xe2\x1d\x11\x16\xce\x40\x03\xc0\x70\x20\xbe\x91\x86\xb4\
+\x90\x0e\x4f\x17\x06\x6f\x83\x30\x00\x86\xef\xee\x21\xd3\x9e\xe2\
+\xee\xd0\xd3\x0f\x75\x3f\xb8\x1b\xde\x3c\x41\x0e\xfc\x18\x34\xbe\
+\x1a\x33\x64\x3d\x9f\x07\xfc\x1e\xf0\x2d\x20\x20\x7c\xbc\x51\xf3\
+\x7d\x5d\x48\x93\xa7\x8b\x61\x3c\x74\x12\x17\xf2\x8c\xf1\xb2\x23\
+\x0e\x16\x44\x60\x68\xb9\xc0\x21\xee\xc1\x20\x3f\xde\x39\x61\xfe\
+\x14\xc3\x65\xd8\x93\xc8\xbf\x33\x87\x7a\xc3\x7d\x42\xda\xf8\x0d\
+\x99\x71\xaf\xd0\x41\x61\xb8\x11\x04\x88\xf9\x1d\x76\x10\x41\x11\
+\xf9\xf0\xb2\xf3\x93\x7b\x90\x0e\x4e\x1b\xc1\xb0\x38\x50\xec\xfa\
+\xd4\xe5\x45\x5e\xd8\x3b\x16\xb8\x3f\x0d\xcb\xf3\xb1\xd7\x12\xa4\
+\x0e\x82\xc1\x9c\x12\x27\x76\xe4\x07\xf9\x21\x07\xca\xc3\xcb\x85\
+\xd5\x93\xd0\xe8\x70\xd8\xfa\x7b\x7a\x3d\x30\x90\x5b\x91\xa0\x20\
+\x9c\x4c\x78\x1b\x7c\x9a\x0c\xb4\x23\xe4\x81\xf4\x03\xdb\x20\xae\
+\x83\xdb\x20\x0e\x6f\x87\x96\x77\x18\x8e\x04\x68\xb8\xa8\xf7\x50\
+\xed\x01\x43\xf8\x18\x32\x44\x3a\xc0\x7a\xfc\x41\xfe\xec\xd7\xdf\
+\xe1\xd8\x61\xeb\x04\x7e\x1c\x21\xdb\xcf\x49\x28\x50\x1e\x5d\x7e\
+\xd4\x23\x3e\xb2\x7c\x03\x39\xdd\x46\x06\xe9\xe2\x1e\x72\x79\xb9\
+\xfc\xa8\x43\xfe\x1b\x5a\x2c\x3e\x85\x84\x95\x9b\x20\x50\x3c\x77\
+\x00\xea\x18\xe0\xf7\x38\x24\xf4\x7c\x51\x6f\xf8\xfa\x04\x86\x59\
+\xb1\xea\x18\x87\x65\xf0\xf6\xc6\x09\x8c\xff\x86\x2c\x20\x43\x6c\
+\x5b\xc1\xe8\x06\xa6\x2b\x0a\x0c\xbf\x87\x00\xaf\x0b\x2e\x17\xaf\
+\x8b\xcb\x0e\x08\xa2\x5f\x5e\x3a\xb8\x76\xa5\xff\xcc\x07\xea\xe4\
+\xd9\xe9\x2c\xb8\xe6\xf3\x71\xf7\xb5\xa9\x56\xf6\xf3\xfe\xcd\x5e\
+\x48\xcb\x71\x3b\x70\x74\x1a\x79\xe1\x26\x69\x48\xc1\xa2\xf9\xc2\
+\x24\xa3\x75\xd3\xe0\x9f\x37\x7f\xf5\xfb\x81\x33\xec\xc4\x97\xc0\
+\xb4\xff\xd6\xe4\xca\x5a\x7f\x1b\xd2\x9a\x34\x39\x43\x7f\x22\x57\
+\xbf\x56\x08\x10\x41\xaa\x51\x66\x53\xf8\xa2\xfd\x67\xdf\xbf\x61\
+\xf6\x46\xb6\xaa\x93\x44\xc8\xf7\xa0\x73\xb7\x45\x43\x5a\xdf\x73\
+\x43\x9d\xf2\x4f\x67\x78\x7c\xd9\xa6\x80\x34\x48\x66\x85\xc8\x3c\
+\x9a\x32\x5e\x3a\xf0\xfb\x8d\xcf\x2c\x3a\x72\x2e\xbb\x30\x59\xfa\
+\xd6\x2e\x6b\xfb\x65\x44\x9b\xbb\x64\xd5\xd0\x31\xdb\xed\xcb\x25\
+\x6d\x16\xde\xec\x0f\x0e\x1c\x88\x09\xb3\xaa\x8f\xfc\xbe\xe3\xed\
+\x89\x1b\x8f\x1c\xe6\x75\x80\xc6\x80\x70\x7c\xde\x31\x18\x45\xd5\
+\xe9\xbf\x01\x5e\x5f\x64\x63\xde\x0e\x0b\x3a\xb0\x85\x01\xf3\x86\
+\x20\x04\xcc\x45\x61\xc3\x38\xfb\x1e\x24\x5d\xb3\x4e\x0f\x76\x61\
+\x08\x0c\x47\x97\x98\xc3\xc2\x5c\x20\x0c\x86\x92\x30\x17\x84\xfb\
+\x85\xad\x02\xe8\x6c\x56\x92\xd9\x44\x41\xf1\x15\x81\xf3\xa6\x8f\
+\x30\x7a\xba\x98\x5b\xc4\xdb\xeb\x5a\x32\xf8\x5a\x02\x56\xa7\x9e\
+\xef\x21\x2c\x80\x80\xf4\xd0\xe1\xe1\x8d\xb8\x0d\x99\x29\xe4\x84\
+\x61\x51\x7f\x7a\x01\xe1\x30\x2c\x1b\x78\x62\xc6\xf9\x80\xf8\x98\
+\x5b\x81\x9c\x73\x28\x89\x34\x4a\xa3\x40\x9b\x2d\x0c\x08\x4b\x16\
+\xb2\x46\xde\x98\x37\xc2\x3e\x54\x2c\xad\xc7\xbd\xc2\x62\x10\x90\
+\x0a\x3a\x64\x74\xd4\xe8\x94\xf6\xe9\x61\x2f\xa4\x2e\xd1\xa9\x61\
+\x48\x0c\x2f\x85\x98\x8b\x9b\xcd\xfd\x10\xae\xb8\x08\x48\xaf\x06\
+\xfd\xc4\x12\x7e\xd4\x29\xff\xd6\x9c\x7f\xe8\x8b\xae\x31\x17\xd8\
+\x9d\x0c\xbe\xf6\x81\x2d\x1e\x08\x87\x17\x0c\xcc\x1f\x83\x44\x97\
+\x52\x58\x76\x90\x02\x5d\x23\xcd\x62\xd5\x55\x20\x28\x6a\x60\xbd\
+\xe1\x85\x09\x1a\x16\xe6\x03\x31\x64\xcb\x8f\x1f\x43\x1b\x84\xd6\
+\x88\x45\x26\xeb\x29\x28\x5b\xe1\x8c\xfc\xc8\x86\x4c\x28\x03\x86\
+\x17\x71\xb8\xc3\x1f\xe4\xe6\xaf\x93\x80\x70\x58\xd4\x85\xaf\x91\
+\xe0\x1e\xa0\xac\x21\xc9\x80\x9c\x30\xd7\x3e\x80\x0c\xb6\x7f\x60\
+\x6a\xa1\xc8\xfa\x85\x3f\x6c\x84\xa1\x4b\x90\x10\xf2\xc1\x9c\x32\
+\x56\xd1\xe2\xd9\xc4\x3d\xc3\x0b\x03\x08\x10\x44\x89\x39\x67\xf6\
+\x92\x4a\xd7\xac\xce\xe8\x12\xc3\xdd\x78\x9e\x7f\xa7\xdf\x9f\x90\
+\x7d\x5e\x50\x1c\x7f\xdb\xa4\x6b\xe4\x83\xf6\x86\xa1\x5a\x2c\xc2\
+\x41\x7b\x03\xf9\x81\x20\xd1\x2f\xe0\x65\x03\x07\x8d\x43\x46\x7f\
+\x7d\x93\x5d\x28\xf4\x70\x58\xcc\x85\x73\x77\xbf\xa7\xe0\x53\xc9\
+\xad\xc8\xba\xb8\x58\x20\x51\xfd\xf2\xc2\xc0\x3b\xf2\x7b\x5b\xd7\
+\xaa\xf3\x79\x8b\xca\xad\x07\xff\xb9\xeb\xb7\x9f\x8f\xa5\x10\x49\
+\x90\xf4\x54\xbf\x85\x69\x36\x00\x0a\x48\xf9\xaa\x27\x9f\xec\x31\
+\x34\x3e\xcc\x36\x28\xd7\xed\x4b\xa6\x78\xfc\x2d\x82\x41\x35\x48\
+\xaa\xc5\x68\x88\x50\x34\x69\x4f\xb5\x09\x8b\xdf\x4c\xc9\x2d\xb8\
+\x40\x86\x93\x44\xcf\x1a\x65\xcc\xbf\x0e\x6b\xf7\x3f\x52\x1f\x07\
+\x12\xa1\x80\x0c\xf3\xc6\x98\xcd\x72\xb4\xec\x55\x7e\xb6\xbd\xbb\
+\x00\x9f\x61\x29\xb4\x02\xb9\x9f\xeb\x99\xde\x6f\x13\xeb\xdd\xac\
+\x29\x5a\x3a\x15\x81\xcd\x35\x32\x12\x94\xa4\xa5\x37\xfd\xb0\xf1\
+\xa9\x85\x89\x49\xb9\x45\x11\x53\xf6\x7f\xfa\x3e\x4e\x7a\x5b\x3b\
+\xd2\x84\x33\xa8\x3c\xf9\xb4\x4a\xd2\x6c\x7d\xc4\xf6\x31\x67\x73\
+\x3d\x2b\xaa\x8c\x5f\x3c\xb9\x28\x79\x00\x36\x44\x4a\xde\x94\x95\
+\x76\x5d\xb5\x38\xdb\x3b\xbd\x1b\x0d\xd8\xb7\xed\xf8\xbe\x3b\x37\
+\x1c\xde\xc9\xe7\x20\xf5\xa0\x57\x1c\x24\x7a\x91\x9d\x33\xfc\xc9\
+\x42\xf1\x0a\x2d\x5f\x30\xce\x97\x26\x07\xea\x0d\x56\x71\xc2\x96\
+\x74\x14\xb7\x4e\x02\x71\x21\xf5\x73\x35\xd7\x25\xca\x0e\xbb\x98\
+\xe5\xb8\xe0\xf6\x16\x0a\x48\xa7\xb8\x75\x71\x21\x61\xaf\x14\x2e\
+\xa4\x1e\x02\xe5\xa7\xeb\x22\xfb\xa2\xa2\x80\xb8\x64\x21\x2d\x3e\
+\x7c\x59\x28\xf4\xb0\xc5\x6e\x6f\x08\x7f\xb1\x72\x5d\x28\x58\x63\
+\xbb\x18\xf0\x23\xd5\x9e\x6a\x5e\xb3\x8e\x56\x29\xf2\xd6\x19\xa3\
+\x3a\xfc\x77\xe1\x88\x0e\xdd\xba\x55\xaa\xc0\x3e\xac\x0b\xc2\x00\
+\x29\xb2\xc0\x05\xc1\x0a\xf7\xf1\xea\xd3\x2b\xb3\xdc\xde\x9d\x36\
+\x8b\x29\x12\xda\x1b\x77\x07\xf0\xd3\x22\x1b\xd5\x4d\xa7\xd3\x13\
+\x41\x82\x7a\x25\x32\x82\x60\x01\x08\x20\x24\xfc\x5e\x78\x38\xd9\
+\x7b\xd3\x8f\x1b\xc6\xa9\xb2\xf6\xa7\x39\xef\x3c\x51\x2f\x45\x08\
+\xb3\xfb\xd4\xdd\xb7\xcf\xdd\x86\x49\x5d\xff\x66\x78\x00\x72\x05\
+\xca\xc6\xfd\x86\xce\xdd\xf9\xb6\xc3\x64\xdd\xa7\x19\x34\x07\xd2\
+\x00\x09\xd2\xdd\x58\x31\xe8\xc7\x8d\x4f\x83\x04\x19\x39\x05\x90\
+\x20\x97\x85\x44\x63\xf5\xb8\xf1\x74\xe6\x61\xab\xd9\x88\xa3\xe5\
+\xfe\xce\x8c\x40\xd5\xa1\xca\x92\x21\xc2\x6c\xb2\x25\x2e\x3f\xe6\
+\x62\x27\x76\x04\x05\xf1\x83\xc9\x86\x95\xa5\x14\xa9\x7b\xa7\x0e\
+\xd2\x82\x3b\xba\xb4\xff\x6b\x44\xbb\x17\xdb\x55\x8c\xbe\xfd\xba\
+\x16\x55\xf1\x56\x9c\xa7\x32\xff\x8b\xe0\x0d\x99\xca\x8d\x29\x5c\
+\x92\x98\x01\x36\xdf\x33\x44\xd5\x77\x61\x0d\x38\x20\x4d\x9e\x0e\
+\x4f\x17\x40\x3e\x81\xfb\x91\x8a\xf5\x20\x71\x50\x34\xa4\xc5\x8c\
+\xee\x74\xc9\x28\x4e\x9a\xba\xff\x85\x02\x65\x65\x2f\x51\x17\x5a\
+\x4e\x20\xaf\x7a\xf2\xdd\x9f\x50\x75\x09\x73\x51\x75\x09\x50\xd4\
+\xf3\x96\xbd\xb8\x80\x1c\x48\x47\x37\xfe\x87\x02\x72\x71\xd9\xc8\
+\xd9\x7f\xff\x75\x20\x2c\x7e\xfb\xeb\x09\x05\xc1\xf5\xa5\x20\x20\
+\x3f\x7f\xfa\x64\x38\xfc\x32\x04\x86\xe5\xd0\xfd\x8b\xac\x13\xee\
+\xaf\x9b\xd0\x1d\x00\x21\x30\x9c\xee\x54\x2c\xf0\x7a\x40\xda\x04\
+\xc8\x13\x28\x3f\xd2\x63\x6d\x81\x87\x65\x91\x08\x7a\x9c\x8b\xcd\
+\x13\xe0\xda\xbb\x3f\x0f\x32\x00\x6c\xbf\x1c\x7a\xd8\x62\xb7\x37\
+\x04\xd6\xd3\xb8\x60\xb9\x2e\x14\x17\x9d\x38\x2f\x90\xcd\xae\x34\
+\xf4\xb8\x7d\x19\x2e\xb7\x37\xb6\x47\xcd\xb8\xd1\xbf\xde\xd1\xf2\
+\xb9\xd7\xba\xd5\x6d\x0c\xc2\x40\x7f\x0d\x42\x64\x11\x02\x80\x02\
+\xc2\x7e\x6b\xc3\x9e\x93\x83\x66\x6f\x79\xd7\xe9\xf2\x2c\x8c\x32\
+\xcb\x76\x22\x43\xc8\x03\x3f\xb0\xac\xd9\x20\x19\xcf\x7e\xb0\xee\
+\xf0\x1f\x08\xab\x73\x0e\xd3\x34\x51\x2b\xec\x07\x01\xbf\x19\x19\
+\x1e\x3c\xe7\xbb\x69\xe6\xa6\xe7\x49\x83\x5c\x46\x41\xe3\x22\x1c\
+\x56\xe7\xaf\xeb\x13\x5f\xff\x35\xe1\x4c\x86\x4c\x42\xf0\xa1\x47\
+\x8a\x4a\x64\x46\x77\x8e\x0c\xae\xe1\x06\x3f\xba\x53\xc6\x5f\xf6\
+\x9f\x4a\xfd\x75\x7f\xca\x6b\x11\x36\xd9\x45\x5e\x71\x54\xc0\x55\
+\x03\x67\x6e\x7c\xea\xcf\x43\x49\x39\x94\x07\xfb\x52\x04\xc2\x03\
+\x90\x81\xff\xa6\xec\x99\xfd\xfe\xfa\xc4\x45\x06\xcd\x88\xa3\x65\
+\x30\x2e\xce\xca\x81\x20\x91\x76\x8b\x43\x95\xcc\x6b\x7a\x7c\xbb\
+\xfa\xcd\x3b\x7e\x5e\x7d\x08\x71\xf3\x6a\x27\x3f\x40\x82\x78\xbf\
+\x50\x14\x45\x7b\xa5\x73\x9d\xda\xbf\xf4\xaa\xfc\x4c\xef\xda\xb1\
+\x0f\x3a\xbd\xbe\xf2\x99\xb9\x9e\xf4\xf0\x28\x7b\xbd\xe6\x15\x62\
+\x18\xd1\xe8\x51\xfe\x55\x90\x1c\x7c\xbf\x10\x00\x1b\x5f\x57\x2f\
+\x50\xae\x0b\x41\x40\x3a\x3c\x5d\x00\xf9\x5c\x74\xda\x14\x0d\x69\
+\x31\xa3\x3b\x5d\x32\x8a\x93\xa6\xee\x7f\xa1\x40\x59\xcf\xfb\x76\
+\x5d\x1c\xe8\x69\x85\xaa\x4b\x98\x8b\xbe\x4f\x14\xf5\xbc\x65\x2f\
+\x2e\x20\x07\xd2\xd1\x4d\x48\x99\xc8\xd9\x7f\xff\x75\x20\x2c\x7e\
+\x5f\x96\x7a\x0a\x46\x60\xfa\x64\x38\xfc\x32\xe8\xc1\xf2\x41\xf7\
+\x2f\xb2\x4e\xb8\xbf\x6e\x0a\xad\xff\xc0\x70\xba\xd3\x05\x01\x69\
+\x13\x20\x4f\xa0\xfc\x48\x8f\xb5\x05\x3d\x58\x3e\xe8\xfe\x17\x9d\
+\x27\xa0\xc7\x67\x79\x90\x01\x60\xfb\xe5\xd0\x83\x5d\x10\xf4\x34\
+\x2e\x49\xae\xe2\xe0\xa2\x88\x90\x6b\x42\xa3\x9b\x56\x8e\xa8\x19\
+\x13\x56\xd1\x49\x4c\x42\x4e\x4a\xa6\xdb\x9b\xab\xaa\xde\x5a\xff\
+\xbd\xae\xde\x53\xa9\x4f\xf5\x7e\x60\x48\x83\x8a\x65\x40\x88\xc4\
+\x85\x7e\xe2\x0a\x04\x56\x95\xae\x3c\x9a\xea\x89\x79\x7f\xe1\xb4\
+\xdf\x77\x9e\xfa\x22\x26\xcc\x8a\x0a\xb3\x90\xb6\xa9\x44\x58\x4d\
+\xd6\x25\x87\xd3\x16\xcf\x4d\x38\x9d\x41\xf1\x8d\xf8\x22\x84\xc3\
+\x62\x32\xbe\xda\xb9\x5e\xd3\xfe\xd5\x2a\xb0\xc9\x53\x6c\xa6\x87\
+\xcd\xc9\x70\xd1\xe1\x73\xb9\xfd\xbe\x5f\xff\x6c\x98\xdd\xb2\x6d\
+\x51\xe2\xd9\xaf\x07\x2d\x4f\xd8\x4a\xce\x46\x45\x1f\x46\x44\x3a\
+\x94\xbe\xb6\x60\x78\x87\x01\x0b\x86\xb7\xc7\xc7\x7d\x41\xaa\xac\
+\x0e\x28\x63\x94\xc1\x78\xf3\x8f\x2b\x36\xff\x75\x38\xf9\xab\x70\
+\x9b\x79\x7b\xbf\x99\xeb\x9f\x5a\x78\x24\x09\x2b\x39\xfd\xfb\x1a\
+\x79\x9e\xfd\xaa\x55\xb0\xbc\xd2\xb9\x7e\x33\xc8\x04\xd9\x90\xf6\
+\xbc\x84\xd3\xce\xc5\x87\x53\xfe\x8a\xb4\x9a\x2d\xe4\xa4\x78\x14\
+\xd5\x14\x6d\xb7\x18\xe7\xee\x3f\x3b\x23\xea\xad\x79\x93\x97\x1c\
+\x4e\xca\xc1\xe2\x21\xdc\x55\xa4\x11\x08\x23\x25\x40\x71\xb4\x61\
+\x8d\xaa\x45\x65\xfd\x67\xd0\xa8\x97\x7a\xd4\xfd\x8f\x96\x99\xd6\
+\x30\x23\xc7\x85\xad\x1f\x3e\xaa\x62\xb5\x4c\xb8\x25\xbe\x73\x95\
+\x28\xec\x67\xca\xa7\x19\x0b\x08\x08\x08\x08\x5c\x3c\x2e\x56\x23\
+\x64\x9d\xb0\xc3\x62\xae\x4d\x6a\x4c\x1c\x71\x1d\x5b\x76\x0b\xad\
+\x4a\x32\x48\xee\xf4\x5c\x8f\xc7\x66\x35\x76\x9a\x79\x6b\xcb\x97\
+\x17\x8c\x68\x7f\x03\xf9\x87\x7c\x1b\xc0\xaa\x52\x1c\xbe\x0d\x32\
+\x1a\x30\x77\xdb\xaa\xc9\x9b\x8f\xbd\x67\xb3\x5a\xcf\x50\x3a\xd1\
+\x3e\x4d\x3a\xf9\xf1\xc6\x83\x2b\x11\x8e\xf3\xe8\x57\x37\x36\xae\
+\xfb\x72\xef\x46\xcf\xcc\x18\xd5\x6a\x64\xff\xba\x15\x4d\x5e\x8a\
+\xcb\x09\x81\x93\xe1\xf2\x63\xc9\x99\xbd\xbf\x5b\xf7\xd0\x5b\x6b\
+\x13\xd9\x99\x96\xe4\xcc\x08\x0c\xb2\x51\x70\xf5\x97\x11\x9d\x9b\
+\xf7\xa9\x55\xe6\xe5\x3e\x75\xca\xbd\xfc\xcb\xb0\x56\xcd\x20\x01\
+\x11\x4d\x1e\x19\xea\x61\xdf\x5a\x7d\xe0\xeb\xde\xdf\xad\x79\x70\
+\xf9\xd1\x94\x0c\xa4\xe9\x27\x41\x5c\x53\x22\x37\x36\x2c\x6f\x9e\
+\x79\x67\xcb\x91\xaf\xf4\x6e\xf8\xcc\x57\x03\x1a\xb3\x4f\xb0\x70\
+\x19\x3f\xda\x78\x68\x15\x11\xf9\x11\xaa\xa1\x98\xb8\x68\x47\xe6\
+\x37\xdb\x4e\x7e\x74\xf3\xf7\x1b\xfe\x44\x19\x29\x9f\x02\x9f\x78\
+\x02\xa0\x99\x12\xcf\x69\x7f\x0c\x6f\xd7\xe9\xdb\x41\x8d\x5e\x96\
+\x25\xe7\x0d\x19\xb9\x3e\x95\x62\xb8\x28\x4b\xc8\x86\xc4\xbd\xc4\
+\xd6\xd1\x5e\x9f\x56\x93\x45\xd2\xef\x81\x80\x80\x80\x80\xc0\xa5\
+\xe1\x62\x89\x90\x21\xc3\xed\xcd\xa1\xce\xf9\x9c\xdd\x6e\x76\x04\
+\x1c\xa5\x86\x8f\xe7\x52\x87\xaf\x65\x39\x3d\xde\x98\x8e\x15\xa2\
+\xd8\x99\x94\xe8\xec\x61\x03\xb2\x4e\x5e\x1c\x20\x23\xd2\xb4\x8c\
+\x0f\xce\xdd\x76\xa8\xeb\xd7\xab\xde\xb4\x5b\x8d\x3b\x56\x9d\x48\
+\x5f\x39\x37\xe1\x0c\x1b\x92\xa4\xb4\xd5\x1e\xd5\xe3\x6c\xb7\x35\
+\xaa\x38\x2c\x25\x23\xdb\x27\xb9\xbd\x9d\xe7\xdc\xd6\xe2\xb1\xc1\
+\x0d\x2b\x84\x71\x02\x44\x3a\xb8\xa6\x4b\xe9\xaf\x43\xe7\x52\x17\
+\x1d\x38\x8b\x15\x72\x0c\x66\xca\x10\x1a\xdf\xcd\xf5\x2b\x54\x1b\
+\x58\x2b\xf6\xbd\x2c\xa7\xd7\x94\x95\xe3\x36\x0d\xac\x5d\xe1\xbd\
+\x41\xf5\x2b\x54\xa5\xe4\xf3\x7d\x95\x7e\xc9\xe1\x54\xd7\x5f\x89\
+\x29\xa9\x48\x0b\x69\xc2\x4d\x27\x44\x6d\x50\xbd\x0a\xe1\x3f\x0f\
+\x6a\xf5\xb8\xe4\xf2\x75\x21\x59\xbc\x24\xd3\xed\x3d\x6a\xc6\xd9\
+\x20\x23\x85\x91\x7f\xdf\x7f\xd6\xb3\xe2\x64\xca\x22\xb3\xc9\x94\
+\xf0\xe8\xaf\x9b\xdf\xb8\x6b\xee\x96\x5d\x20\x41\x94\x91\x82\xf8\
+\x49\x10\xe9\x05\xd4\x09\xb3\xdb\x55\x8c\x6d\xec\xf2\x2a\xe5\xbd\
+\xaa\x21\x8b\xea\x90\xb9\xa3\x4e\x29\x5b\x23\x29\x9e\xe1\x06\xbb\
+\x29\xd5\xa5\x28\xf8\x0c\x8b\x80\x80\x80\x80\xc0\x65\x02\xe6\x9b\
+\xf4\xcb\x8b\x43\xc7\x72\x51\x8e\xef\x3a\xd6\xee\x5a\xb5\x45\x8d\
+\x1b\xbc\xce\x9c\xb2\x4e\x9f\xea\xa4\x3e\x9e\xcd\x8d\xc5\x84\x5b\
+\x6d\x1f\xac\x3b\xfc\xe5\x53\x7f\xec\x5c\x09\xa2\x81\x66\x55\xc6\
+\x6e\x91\x92\x9d\x1e\x36\x3f\x87\xa1\x49\x3d\x19\x06\x4e\x36\x37\
+\xd4\x8c\xb3\x9a\x8c\xb2\xb6\xe0\x60\x92\x87\x9c\x8c\xe4\xa4\xce\
+\x1b\xd6\xee\xa6\x7e\xb5\xe3\x6f\xcd\x74\x7b\xb3\x41\x11\xb2\x2c\
+\x85\x59\x64\x53\xc2\xd0\xd9\x9b\x27\xfe\xbc\xef\x74\x3a\x8f\x9b\
+\x97\xd2\xdf\x80\x16\x06\x02\xba\xb1\x6e\xb9\xf0\x1f\x07\xb7\x9a\
+\xa2\x29\x5a\x0b\x0a\x84\xe5\xd7\x60\x9f\x70\x52\xd3\xb6\xde\x3a\
+\x6b\xf3\x03\xbf\x1f\x3c\x53\x60\x5b\x04\x07\x4f\xfb\x96\xfa\x15\
+\x63\xbf\x1f\xdc\xf2\x11\x8f\xe2\xab\x43\x3f\x73\x10\x30\xd2\x6a\
+\x0e\xff\xe3\xd0\xb9\xd9\xfd\x67\xac\xff\x15\xc3\xa3\x14\x5d\xed\
+\xd1\xa0\xac\x49\xf3\x18\xcc\x4b\x0e\x25\x39\x79\xb9\xf3\x52\xca\
+\x03\x85\xc3\x89\x3a\xfe\x7c\x78\x98\xf7\xfb\x35\xee\xf0\x74\xbb\
+\x9a\xf7\xa7\x65\xbb\xdd\x20\x42\x04\xb1\xca\xb2\xdd\x6a\x35\xa6\
+\x1d\x38\xe5\x5d\x3e\x61\x6b\xc2\xd2\x4f\x36\x1e\xc1\x32\x68\x01\
+\x01\x01\x01\x81\xcb\x84\x4b\xd2\x08\x81\xb5\x49\x99\xce\x1a\x73\
+\x36\x2f\x78\x6a\x7e\xc2\xeb\x47\x33\x9d\x0b\x62\x22\xac\xd0\x08\
+\x1d\xa4\x81\x49\x06\xb7\x92\x93\x7b\x28\x99\x6d\x2e\x45\x47\xdf\
+\xae\x6a\xb4\xf9\xd0\x83\xd7\x3d\xf4\x67\xf7\xfa\x38\x1b\x52\x23\
+\xde\x28\xf0\xed\x40\xfc\x5e\x7c\x38\xd5\x03\x12\x04\x01\x81\x04\
+\xc7\xb4\xaf\x53\xfe\xc6\x06\x15\x7a\xa4\x3b\x3d\x2e\x2c\x3f\x82\
+\x86\xa5\x28\x5a\x8e\xd7\xe7\xab\x3b\x73\x70\xab\xa7\x06\xd6\x2d\
+\x1f\x9f\x17\x37\xbf\xa6\x09\x80\xd8\x7a\xd7\xaa\x2e\xfd\x74\x6b\
+\xfb\x17\x24\x55\x6b\x45\x34\x97\x49\x81\x10\x10\x5a\x5a\x16\xb1\
+\x4d\xeb\x9f\x87\xb6\x79\xa1\x4f\xe3\xf2\xec\xa3\xbc\x98\xc3\xd3\
+\xa3\x32\x20\x4d\xa4\x3d\xb0\x5e\xf9\xf8\x99\x83\x5b\x3e\xe9\x55\
+\x94\xda\x20\x41\xc8\x00\x59\x20\x53\xff\xfa\x15\x6e\x18\xd3\xbe\
+\x76\x05\x90\x20\x64\x5e\xbc\x37\xc9\x07\x12\x44\x7c\x94\x9b\x25\
+\x44\x80\x1f\x00\x12\x7c\xb7\x77\xa3\x26\xbb\x1e\xe8\x3a\x22\xc2\
+\x6a\x42\xfa\x2c\x8c\x3b\x31\xe9\x80\xc1\xed\xcd\x55\x88\xa3\x49\
+\x0a\x5b\x84\xdd\x62\x39\x99\xe5\x5c\xf9\xf0\x1f\x3b\xff\xaf\xee\
+\x94\x3f\xe7\x4c\xdc\x74\x14\x9b\xd8\x05\x04\x04\x04\x04\x2e\x23\
+\x2e\x99\x08\x19\xa3\x10\x26\xac\xdf\x95\x59\x6f\xe2\xb2\x19\xf7\
+\xce\xd9\xf2\x6a\x9a\x5b\xd9\x52\x26\xd2\x1e\xed\x34\x68\xa7\x27\
+\x9f\x49\x67\x47\xaa\x21\xec\x0d\xd5\xcb\x36\x8c\x8a\x0b\xeb\xd4\
+\xa9\x73\xcd\x27\x3c\x2f\xdc\x3a\x7a\x54\xb3\x2a\xf8\x54\x93\x46\
+\x8c\xe2\x97\x03\xbf\x01\x5c\xf3\x2d\x1a\xff\xed\x5c\xf3\x46\xb7\
+\xcb\x5d\x8e\x48\x09\xa7\x61\x30\x37\x10\x11\xf9\xe7\x10\x31\x55\
+\xfb\x65\x68\xeb\xe7\xfb\xd7\x29\x5b\x8d\x11\x59\x00\x19\x5a\x28\
+\x02\xec\x36\x15\xed\xad\xac\x56\x69\xb0\xcb\xa7\x66\x92\xaf\x7f\
+\x7f\x1f\xa5\x21\xbb\x7c\x4a\xa6\xd5\x22\x0f\x6e\x13\x17\x89\x8d\
+\xa0\xa8\x10\x7f\x7c\xa4\x85\x34\xfb\xd6\x2e\x57\xf5\x97\xa1\x6d\
+\x9e\xf7\x2a\xbe\xaa\x3e\x55\x65\x24\xa8\x07\x01\x91\x7b\xb2\x5d\
+\x9e\xf8\x17\xba\xd5\xc4\xa1\xb2\x90\x99\x79\x04\x03\x24\x08\x42\
+\xed\x5d\xa7\xac\x75\xd3\x7d\x5d\x86\x3d\xdb\xa9\xf6\x53\x8d\x2b\
+\x46\xf7\xbc\xbf\x45\x35\x76\xce\x22\xea\x68\xd2\xa9\xac\x14\x97\
+\x24\x9d\x8e\x0b\xb3\xc6\xc8\x26\xd3\xbe\xf1\x6b\x0e\xbf\x59\xeb\
+\x93\xa5\x5f\x7c\xba\xfe\x68\x32\x28\x54\x1f\x2e\x15\x10\x10\x10\
+\x10\xb8\x8c\xb8\x64\x22\x04\x71\xa9\x04\x74\xd2\x50\x78\xbe\xd8\
+\x7a\xe2\x64\xa5\x0f\xfe\x1a\xff\xeb\xee\xe3\x5f\x2d\x49\x3c\xbb\
+\xf5\x44\xa6\x13\xcc\xc0\xf2\x19\xdd\xb4\x52\x7b\x57\x8e\xdb\xe7\
+\x73\x2a\x4e\xaf\x92\x75\xfd\xd7\x37\x35\xfb\xef\xa2\x51\xd7\x37\
+\x57\x15\xec\xb3\x23\x56\x0a\xd2\xe8\xc8\x89\xb1\xca\xec\x7d\x59\
+\x7f\x98\x4c\xd6\x04\x93\x2c\x45\x22\x3b\xe6\x49\x00\x91\x79\x7c\
+\x4a\xb6\xd1\x24\x57\xea\x54\xab\x2c\xdb\x63\x47\x29\xf8\xcb\xe4\
+\x21\x16\x03\xc1\xfc\xdf\xca\xbd\x9b\x4e\x67\x64\x4f\x8a\xb4\x5a\
+\xa2\x31\x57\xa8\x7b\x63\xa5\xa8\x12\x69\x35\x47\x9d\xce\xc8\x9a\
+\xf4\xfa\xf2\xfd\xf8\x74\x8d\x84\x38\xba\x37\x23\x5b\xd8\x9d\x6a\
+\xc5\x37\x30\xca\xc6\x4a\x6e\x9f\x9a\x8d\x3c\x99\x27\x01\xb2\xc8\
+\x26\x63\x44\xb8\x26\x27\xce\xdd\x92\x84\x13\xf2\x0b\xac\x60\x01\
+\x99\x02\x20\xc1\xb7\x7a\x35\xaa\xf7\xf3\xad\xad\x5e\x68\x5e\x3e\
+\xaa\x5f\x72\x86\xd3\xe5\xf1\x28\xc6\xfb\x5b\x56\xc6\xe9\x24\x80\
+\x11\x75\xb5\xf8\x50\xd2\xd6\xdf\xf7\x9c\x99\xd6\x72\xca\x8a\xb7\
+\x9f\x5a\xb8\xeb\x00\xea\x84\xaf\x34\x45\x1a\x7a\x58\x01\x01\x01\
+\x01\x81\xcb\x84\x4b\x9e\x23\x0c\x06\x34\x1f\x68\x45\x5c\xab\x43\
+\x27\x8e\x95\x92\x0f\x75\xa8\x1c\xf3\x69\xff\x96\x2f\xa7\xa6\xbb\
+\xc3\xcc\xb2\x84\xef\x34\x69\xc4\x24\x16\xab\xdd\x64\x54\x4f\x66\
+\x2c\xbd\x77\xc5\xc1\xd9\xdf\x1d\x38\x53\xe0\xe4\x16\xf0\x08\x86\
+\x12\x3b\x55\x89\x8b\xf8\x7d\x78\xbb\x07\x6d\x26\x43\x33\xb7\x47\
+\xc9\x22\x77\x90\x14\x36\x98\x58\xec\x56\xcb\xd9\x7e\xdf\xad\xff\
+\xbf\x45\x89\x49\xf9\x3e\x93\x14\x8c\xf4\xb1\x7d\x3f\xb4\x18\x0d\
+\xfd\x55\xc5\x90\x86\xec\x8d\x66\x39\xc6\xa3\x1a\xe6\x45\xbf\xf5\
+\x3b\xbe\x4d\x56\x00\x3c\xad\xeb\x6b\x96\xb1\x2e\x1e\xd5\xe1\xc5\
+\xac\x5c\x6f\x65\x62\x3a\x17\x91\x1d\x5b\x7c\xe3\x30\xc9\x11\x69\
+\x8a\xb6\xe7\xf5\xe9\x1b\x26\x7d\x72\x32\x25\x1d\x63\xb6\x10\x48\
+\x8f\xee\xc7\x8d\x8d\x63\x4c\x2f\xb5\x6f\x70\x63\xdb\xaa\x65\xfb\
+\x67\x64\x3b\x4d\x14\x80\x0d\xf1\x92\x97\xd9\x28\xc9\x67\x7a\xcf\
+\x5c\xff\xea\xaa\xa3\xc9\xfc\xc0\x5e\x3f\x82\xeb\x42\x40\x40\x40\
+\x40\xe0\xf2\xe3\xa2\x35\x42\x10\x1e\x8c\xfe\xd3\x0f\x68\x2d\x00\
+\xd7\xee\xa0\x0f\xc1\xb6\x6a\xd6\x3a\x06\x55\xad\x40\x04\x02\xa6\
+\xc0\x98\x27\xa6\x08\xbd\x2e\xa7\xcf\xa3\x56\x8c\xee\xf5\xdd\xc8\
+\x76\x2f\xdd\xd6\xa0\x7c\x75\x74\xfc\x81\xf3\x74\x20\x41\xe4\xb3\
+\xfa\x78\x4a\x56\x9f\xef\xd6\x7d\xe4\x56\x0d\xab\x6c\x66\x99\x69\
+\x86\x44\xb8\x5a\x94\xc3\x6a\x5a\x78\x2c\xf9\x37\x90\x20\xe5\xe5\
+\xdf\x38\x1f\x08\x2e\xcb\xcd\xb3\x36\xbd\x62\xb3\xda\x71\xde\x9d\
+\x43\xc3\xe7\x0d\xdd\xea\x8e\x5b\x66\xae\x67\x5f\x49\xe6\x61\x02\
+\x81\xb4\x90\xe6\x92\xc4\x64\xf7\x77\x3b\xce\xcc\x89\xb4\xca\xd0\
+\xcc\x70\xf4\x99\x6a\x23\x12\xcc\x55\xd5\xf5\x37\x4d\x5f\xf7\x01\
+\x48\x10\x32\x06\x92\x20\x1f\xa2\xbd\xa9\x6e\xb9\x4a\xf3\x6e\xeb\
+\xf8\x5c\xf3\x0a\xb1\xb7\xa6\x65\x3a\xf1\x95\x7c\x37\xb6\x72\xe0\
+\x1d\xc4\x43\x9a\x70\x58\xb4\xb5\x46\xdb\xea\x71\x38\x4f\xd1\x60\
+\xa1\x82\xc3\xe6\xb2\x84\x22\xc1\xc2\xea\x5d\x40\x40\x40\x40\xe0\
+\xe2\x70\xd1\x44\x08\xc2\xe3\x43\x75\xa1\x3a\x66\xde\x89\x7b\x48\
+\x1d\x84\xbd\xec\x54\xe6\xe6\x43\xf6\xaa\x53\xe2\xec\x26\x0f\xf5\
+\xf7\x6c\x6e\x90\x9c\x25\xf4\xf9\x6e\xa7\x27\x8b\x22\x54\x68\x51\
+\x21\x1a\x87\xd7\x42\xa8\x7c\xe9\x21\x1f\xe4\xb1\xfe\x64\x9a\x37\
+\xea\xcd\xf9\x93\xb3\x7d\xca\x7c\xab\x2c\xe3\x80\x66\x7b\x46\xae\
+\x67\x67\xff\xa9\x6b\xd9\x17\xef\x41\x8e\xb0\x23\x4d\x16\xa9\x42\
+\x98\xcd\x3f\x84\x09\x59\x28\xba\x71\xd9\xe1\x73\x19\x53\xb7\x9f\
+\x7a\x36\x22\xcc\x9c\x13\x11\x65\xcb\x99\xba\x76\xdf\xd8\x25\x47\
+\x93\xb3\xf0\xe5\xf9\x40\xd2\xa9\x10\x61\x37\x45\xda\xec\x4c\x06\
+\xa4\x89\xa1\xcd\x3b\x7e\xde\xb8\xe5\x58\x86\x77\x0b\xc9\x66\x27\
+\x22\x0e\x77\x2a\xca\xa2\x1e\xdf\xac\xf9\x64\xdd\xc9\x34\x97\x95\
+\x12\x0f\x1e\xb6\xe4\x2f\x00\x5d\xeb\x54\xa8\x46\x35\xd4\x38\x33\
+\xd7\x93\x69\x92\x99\x13\xfb\xa2\x86\x51\x53\xc2\xa2\x2c\x06\xdf\
+\xa1\x83\xd9\xd3\x16\xef\x39\x8b\x53\xf7\xfd\x75\x15\x8a\x00\x39\
+\x39\x06\xd6\xbb\x80\x80\x80\x80\xc0\xa5\xe3\xa2\x89\xf0\xe5\xeb\
+\xea\xd6\xff\xb8\x57\x13\x7c\xed\x9a\x75\xce\xb0\x43\x69\x55\x1c\
+\xdb\x4f\xa4\xa8\xb5\x9e\x9d\xb4\xf8\xce\x5f\xb6\xbf\x9a\xea\x54\
+\x36\x46\x87\xdb\xc2\xbc\x2a\xdb\x7b\xa8\x58\x64\xa3\x3d\xd3\x6d\
+\xd8\x3d\x6e\xc9\x3e\x9c\x52\xce\xe6\xf6\x58\x24\x02\x25\xe9\x27\
+\x00\xcc\x43\x82\x94\xe2\xde\xf9\xf3\xbb\x14\x59\xf9\x35\x26\x3e\
+\x52\x7e\x7d\xe5\xa1\xb9\xf0\xc7\xc2\x18\x4e\xc8\x4f\xb7\xa9\x5d\
+\xfd\xf4\xb3\xbd\x9f\xb9\xb5\x61\x85\x28\xfc\x86\x3b\x45\x57\x49\
+\x4b\x33\x8e\xfe\x65\xdd\xa1\x99\x3b\x4e\xbd\xf2\xfd\x96\x63\xaf\
+\x8c\x5e\x73\x38\x91\xa2\x19\x15\x22\x20\x1e\x97\xe2\x54\x3c\x3d\
+\xb6\xdf\x7f\x9f\x6d\x5f\x17\x5f\x3f\xa0\xb8\xb2\x64\xd6\x8b\xf5\
+\xc9\xe6\x83\xbf\x47\x96\x8d\x32\xa4\xba\x95\x79\x31\x6f\xff\xf9\
+\xcd\x96\xb3\x59\x2c\x6d\xb7\x5e\x7e\x2e\x2b\xa0\x1a\xf2\xb4\xc3\
+\xdf\x77\x9f\xde\xec\xf6\x29\x89\x16\x59\xb2\x12\x07\x52\xc1\x24\
+\x63\x84\xc5\x18\x66\x8a\x8b\xdf\x3e\xe9\x94\xf5\xb5\x5a\x5f\xfc\
+\xb5\x60\x67\x6a\x56\xf0\xb7\xc7\xfc\xe0\x7b\x2e\x41\x8e\x75\xca\
+\x44\x4a\x1f\xdc\xd0\xa8\x06\xd5\x3d\x4e\x95\x17\x10\x10\x10\x10\
+\xb8\x0c\xb8\xe8\x39\xc2\x93\xcf\xf4\xbe\xb9\x52\x4c\x78\xb5\x8c\
+\xf4\x9c\xe3\xbf\x1d\x3a\x9b\xb0\xe4\x6c\xea\xc1\xaf\x56\x1f\xc5\
+\x47\x19\x19\x21\x16\xa6\xd5\x70\xf7\x6f\x06\xb4\xe8\x70\x57\x9b\
+\xaa\x43\x33\x73\xdc\x91\x76\x62\xb8\x85\xfb\x33\xa6\xf5\x9b\xb5\
+\x7a\x09\xf1\x9c\xb1\x8c\xc3\xa2\x6d\xbe\xb7\xeb\x5d\x8b\x0e\x9f\
+\xd9\x72\xf7\xdc\x9d\xdb\xe1\x46\x72\xfa\xc9\x11\x68\x55\x39\xd2\
+\xd8\xa6\x5c\x6c\xcd\xaf\xb6\x1d\x3f\xe2\x51\x14\x3f\x91\x0c\xa8\
+\x59\xc5\xf8\xd3\xd0\x66\xcf\xf8\x0c\x4a\x5b\xbb\xd9\xb4\x71\xc4\
+\x4f\x5b\x26\xcc\xd8\x75\xd2\xc9\xe7\xfb\x02\x65\xc0\x3c\x1d\xb4\
+\x33\xee\x76\x47\x93\x2a\x91\xdf\xde\xd2\xfc\x69\xa7\xc7\xd7\xd0\
+\x62\xf4\x6d\xb8\x65\xf6\xd6\xf7\xe6\x26\x24\xfb\xcb\x61\x31\x19\
+\xe5\xbb\x9b\x56\xaf\xb1\xf1\x44\xd6\xe1\xcd\x49\xe7\xf2\x9d\x73\
+\xc8\x65\xfc\x72\x40\xd3\xa6\x3d\x6b\xc6\xb7\x6a\xfd\xc5\xca\xa9\
+\xe7\x72\xbd\xec\xac\xbc\x63\xc3\xda\xde\x1a\x57\xbb\xec\x40\xd5\
+\xe5\x51\x22\x6c\xa6\xec\xa9\x3b\x4e\xcf\xba\xf3\xd7\xad\x2b\x10\
+\x8f\xcd\x15\xd2\xff\x50\xf5\xc5\x31\xa2\x5e\x39\xfb\xb8\xa1\xfd\
+\xeb\xd4\xd6\xd2\xea\x5a\x4d\x5a\xe5\x93\x99\xce\x03\x95\xde\xfb\
+\x13\x1f\xa4\x2d\xb0\x17\x53\x40\x40\x40\x40\xe0\xc2\x70\xd1\x1a\
+\x61\x7a\xb6\xdb\xeb\xcc\xcc\xf5\x12\x87\x95\x1f\xde\xb4\x5a\x8f\
+\xaf\x7a\x37\x1b\xb2\xf3\xfe\xce\x6d\x6f\x6f\x58\x29\xa2\xb0\x4e\
+\x1d\xee\xd0\xa0\x40\x1a\x77\xfd\xb6\x75\xed\xb0\xef\x37\xbf\x9a\
+\xe2\xf2\x6c\x33\x47\x85\x7b\xd7\x1e\xcb\x60\x1f\x83\x04\x71\x3c\
+\xd0\xaa\x6a\x8d\xaa\xb1\xf6\x6e\x77\xb7\xad\xfd\xf8\xaa\xbb\x3a\
+\xe2\x03\xaf\xaa\x6c\xb1\xb2\x23\xcc\x59\x42\x84\xad\x27\xb3\xb4\
+\xc9\x9b\x8f\x1c\xe4\x24\x88\x34\x61\x3f\xdb\xb5\x5a\x7f\x8b\x49\
+\x6a\x4a\x9c\x73\x26\xc7\xe5\x6b\x32\xe3\xb6\x56\xf7\x0d\xaa\x5f\
+\xd6\x3f\x77\x08\x19\x20\x02\x4c\x1e\x09\xe2\x10\x6e\x55\xbb\xbd\
+\x59\x55\xf3\xd4\xc1\xcd\xef\xcf\x71\xfb\x6a\xb9\xbc\xea\x59\x93\
+\x6c\x6b\xf6\x74\x87\x86\xfd\x10\x87\xa7\xed\xf1\xa9\xca\xe4\x2d\
+\x89\x07\xb7\x9e\x4b\xf6\x93\x32\x64\x82\x6c\x90\x71\xc5\xa8\xf6\
+\x3d\xee\x69\x57\xeb\xf1\xaa\xb1\x8e\x6e\x0f\xb4\xae\x5a\x03\x6e\
+\x08\x33\xeb\x78\xfa\xf6\x30\x93\x26\x69\x11\x31\x3b\xc7\x9f\x30\
+\xbf\x0e\x12\x34\x92\xa6\xc9\x08\x98\x02\x15\x56\x5f\xc3\x1a\x57\
+\x8e\xda\x7a\x5f\xe7\x0e\xdf\x0d\xeb\x30\xa4\x8e\xeb\xc4\x75\x3e\
+\x67\x6e\x59\x67\xae\xc7\x9b\x91\x9d\xf7\x49\x2a\x8a\x2a\x48\x50\
+\x40\x40\x40\xe0\x12\x71\xd1\x44\x88\x01\x3b\xd2\xb2\x70\x82\x8c\
+\x27\x33\xdb\xe5\x4c\xcf\xf0\x84\xd5\x89\x8b\x6a\xf7\xc3\x90\xd6\
+\x43\xd6\xdc\xd5\xa9\x8b\xcd\x24\xfb\xe7\xe8\x02\x81\x21\x4e\x10\
+\x04\x11\xa2\x71\xe6\x9e\x13\xa9\x37\xcd\xdc\x34\xe9\xa1\x1f\x37\
+\xbc\xff\xfe\xd6\x84\x74\xe2\x14\x46\x74\xa3\x9b\x55\xec\xe0\x76\
+\xfb\xa4\x94\x8c\x5c\x4f\xab\xb2\x61\x77\x2a\x1f\x3f\x7a\xcf\x88\
+\xa6\x35\xd9\x89\xdc\x56\xb3\x89\x85\x41\x2a\x48\x03\xd7\x20\x57\
+\xa4\xf9\x46\x8f\xba\x55\xba\xd6\x8e\xeb\x9b\x92\xeb\xc6\x27\x93\
+\x4c\x44\x7e\x99\x8a\x57\x69\xf3\x4c\xa7\xda\xb7\x23\x1c\x4f\x1f\
+\x22\xc0\xf0\x6b\xd8\x5f\xf4\x6b\x3d\xca\xe5\xf2\x34\xa3\xdf\x99\
+\x66\x59\x32\xa7\xe4\xba\x72\xaf\xab\x1d\xdf\xf7\x7f\xd7\xb7\xac\
+\xa4\xcb\xcb\xe2\xc2\x46\xde\xb8\xc6\xdc\x20\x64\x1a\xd6\xb8\xba\
+\xd5\x37\xe1\x91\x7b\xda\x54\x88\xb8\x93\x64\xf6\xba\x5c\x8a\x61\
+\x74\xf3\xea\xf8\xb8\x2c\xc3\x1f\x5b\x8f\x9c\x38\x7c\xca\xf0\xc9\
+\x75\x9f\x2d\x9e\x30\xe6\xeb\x5f\x93\x2c\x38\x81\x46\x51\xfc\x04\
+\x68\x36\x81\x4e\xff\x26\xf9\x7e\x75\xca\x46\xec\x7c\xa0\xeb\xf5\
+\x33\x6f\x69\x79\x5b\xc3\xf8\xe8\xd6\xe9\xd9\x2e\x9b\x4b\x33\xb9\
+\x54\xc9\xe8\x31\x49\x92\xca\x54\x48\x01\x01\x01\x01\x81\xcb\x82\
+\x8b\x26\xc2\x70\xab\x59\x32\x9b\x8c\x76\x7d\x0b\xa0\x84\x2d\x11\
+\x6e\x9f\xe2\xca\xcc\x71\x9b\x9b\x97\x8f\x6e\x52\x26\xcc\xca\x16\
+\xbe\xc4\xda\x2d\xfe\x4e\x9b\xaf\xa4\x04\x88\x10\x19\xb9\xec\x3c\
+\x97\xe5\xfb\x74\xd3\x91\x7d\x1e\x1f\x31\x03\xa1\x4f\xed\x72\x11\
+\x15\xc3\xc3\x9b\x53\x5a\x1e\x22\x0c\xc9\x23\xc9\xd9\x39\x87\xf7\
+\x74\x9b\xda\xbb\xe6\x33\xa3\x9b\x55\x8d\x73\x7b\x7d\x6c\x28\x93\
+\xa7\xa1\xdb\x8c\x50\xee\x6c\x5c\x65\x78\x76\xb6\x27\x8c\xd2\xc5\
+\xb0\x25\xb4\x3e\x39\xd3\xed\xcb\xe9\x54\x39\xae\x0f\x69\x6b\x3d\
+\x91\x7e\x20\xe1\xf0\xeb\xa5\xa3\x3a\x0c\xb1\x4a\xce\xeb\xbc\xaa\
+\x21\x9b\x52\x66\x04\x6e\x96\x65\x5f\x76\x56\x4e\xe4\xfd\x2d\xe3\
+\x19\x89\xf2\x8d\xf2\x3c\x2f\xc8\x80\xb9\xc1\xd1\x2d\xaa\xc5\x7e\
+\xdb\xaf\xce\x53\xb9\x47\xf6\x76\xf3\x68\x72\x0e\x93\x59\x55\x3d\
+\x15\xec\xe6\xe6\xfd\xea\x94\xc1\x57\x9a\x0d\xcb\x9c\x3e\x57\x8d\
+\xcf\x7e\x5f\xbf\xed\x54\x8a\x42\x32\x91\x7f\xfe\x61\x5e\xaf\x4f\
+\xd1\x6a\xc6\x44\x1a\x62\x1d\x16\x76\x3f\xfa\xd4\x29\x5f\xbe\x49\
+\x95\x32\x4d\x93\xb3\x5d\x46\x2a\xaf\x8b\xca\x43\x94\xa9\x41\x2d\
+\x35\xa1\xce\xc3\xac\xa6\x8b\xbe\x6f\x02\x02\x02\x02\x02\xf9\x71\
+\xd1\x1d\xea\x8c\x5d\xc7\x36\x1d\xcb\x70\x6d\x74\xd8\x22\x32\x23\
+\x6d\xb2\x8c\xc5\x20\xa4\x27\xc9\xa4\xad\x80\x10\xdd\xa4\xa2\xb1\
+\x70\x77\x35\xad\x12\x73\xfa\xc9\x1b\xba\x0d\x6b\x54\x31\x96\x0f\
+\x4f\x72\x42\xd4\xb5\x43\xa6\xd9\x11\x25\x31\xb7\x5a\x31\x8e\x78\
+\x7b\x84\x35\x8a\xfc\x8c\x14\x18\x1f\x28\x34\x1a\xcc\xd6\xac\x6c\
+\xd5\x50\x7b\x52\xef\xba\xcf\x4f\xbe\x7f\x70\x6d\x68\x52\x81\x84\
+\xc6\x91\xab\xaa\x47\x31\xdf\x08\x6f\xdd\x89\x08\x4b\x52\x73\x48\
+\xbb\xac\x15\x1b\xde\x40\x77\xf2\x03\x79\xc3\xae\x17\x1b\x5e\xd9\
+\x47\x51\x20\x84\x0e\x4d\x51\x14\x39\xdc\x2c\xf9\x66\xed\x39\xb3\
+\x0d\x0e\x81\x99\x61\xa9\x2b\x64\x98\xdc\xa2\x6a\xad\x49\x03\x9a\
+\x3e\x9f\xe3\xf5\xd5\x85\x8c\x54\x2a\x26\xb3\xc7\xa7\x1a\xed\x11\
+\xb6\xc8\x5a\x31\x11\x65\x11\x1e\x95\x42\x69\xb3\x4f\x40\xa1\xc8\
+\x70\x0b\xdc\x22\xf2\xc5\xfd\x43\xcb\x1e\x7a\xb8\x7b\xaf\x91\x4d\
+\x2a\x96\xc1\x6f\x22\xbf\x5c\x62\xc7\x5c\x2a\x22\x55\x98\x24\x9b\
+\x25\xcd\x16\x6d\x35\x1a\xd3\x3c\xbe\xd4\x23\xe9\xee\x75\xdf\xef\
+\x4e\xdb\xc8\x22\x0a\x08\x08\x08\x08\x5c\x32\x2e\x9a\x08\xff\xb3\
+\x28\xe1\x4c\xd5\x09\x0b\x57\xde\x36\x6b\xf3\xac\x49\x9b\xcf\xcd\
+\x3b\x91\xad\xed\xb4\x5b\xcd\xb9\x11\x76\x33\xf6\xc8\x43\x31\x62\
+\x1d\xbd\x4b\x55\xa2\x2a\xc4\x45\x36\x9b\x7e\x4b\xab\x5b\xb6\xdf\
+\xd7\xb5\xeb\x1d\x8d\x2b\x47\x72\x42\xe4\x80\x66\x07\x03\x3a\x9c\
+\xb8\xf1\x70\xe2\xf8\xa5\x7b\x3f\x8c\x8b\x09\x4b\x26\xaa\x70\x50\
+\x48\x55\x32\x68\x32\x31\x93\x53\x91\x4c\x71\xa3\x2a\x28\x8f\x95\
+\x09\xb7\xdb\x40\x2a\x8c\x3e\x03\x50\xe7\xe3\xa5\xdf\x27\xe7\x2a\
+\x0b\xec\x16\x39\x4c\x27\x1c\x8d\xf2\x32\x87\xd9\x2d\x19\xef\xac\
+\x3e\x3a\x1b\x61\xb0\xf2\x94\x03\x1a\x29\xec\xb7\x36\x1c\x9e\xe9\
+\xb0\x9b\xd3\x7d\x8a\x6a\xa2\x9f\x9a\x57\x51\xa4\x98\xe8\x48\xcb\
+\xf7\x27\xdc\x33\x1e\x9e\xbf\x7d\x09\x78\x9a\x0f\x87\x22\x4f\x7c\
+\x3a\x2a\xce\x66\xb6\x8d\xea\xd5\xe0\x71\xc5\xe3\x8b\x27\x3f\x27\
+\x64\x24\x1b\xfb\x04\x1d\x65\x62\xec\x69\x1f\x2c\x4f\x18\xff\xf1\
+\x86\xc3\x07\x11\x9e\x34\x47\x8a\x91\x5f\x0b\xc4\x21\x03\x23\x9a\
+\x54\x8e\xde\xf9\xf0\xf5\xdd\xef\xa9\xe2\xbb\xd9\x60\xf4\x35\x90\
+\x34\x29\x02\x7e\x66\x93\x41\x25\x41\x2d\x91\x76\x8b\xcd\x66\xd6\
+\x72\x8e\x1b\x1c\xdb\xbe\x48\xb2\xcd\xed\xf4\xf9\x92\x9f\xaa\x7f\
+\xfc\xd7\x9a\xb1\x8b\x36\x9d\x61\x89\x08\x08\x08\x08\x08\x5c\x32\
+\x2e\x9a\x08\x31\xc4\x07\xcc\x4d\x38\xe2\x7b\x64\xfe\xfa\xe3\x35\
+\x3e\xfe\x63\xf9\x90\x1f\x36\xff\xf8\xc9\xc6\xc3\x8b\x8f\x67\xb9\
+\x4e\x7a\xf2\xb6\xc4\x51\x06\x46\x07\x31\x9d\x92\x96\xe3\x96\xea\
+\xc7\x47\x36\x9d\x3e\xb8\xc5\x6d\xbb\x1f\xbc\xbe\xf5\x1d\x4d\xea\
+\x99\x59\x80\x00\x80\x2d\x90\xe6\x98\x85\x7b\xf7\x0e\xfe\x7e\xf3\
+\xff\xa5\xba\xbc\x9b\xa2\x6c\x26\x90\x5a\xde\xac\x18\xb1\x8d\x2b\
+\xdb\x95\x42\x2a\x1f\xfb\xfe\x21\xc2\x73\x32\x03\x10\xb7\xdc\x07\
+\x0b\x66\x64\x7a\xd4\x25\x20\x43\x92\x41\x89\xb5\x5b\xac\xb3\x76\
+\x9d\xf8\xe3\xa3\x8d\x07\x4e\x11\x29\xe5\xfb\xca\x3c\xae\xe1\x36\
+\x61\xcd\xc1\xd3\xb3\x77\x9d\xfc\x2d\xd6\x61\xb1\x62\xeb\x46\x98\
+\x49\xb6\xa7\xba\x7c\x3f\x0f\xfd\x66\xc9\x22\x4a\xd2\xbf\xc7\x10\
+\x79\x21\x4f\x5c\x93\x56\xe8\x71\x29\x52\x12\xf1\x26\xf6\x19\x1a\
+\xf0\x9d\x42\x87\xd9\x18\x9e\xea\xf6\xed\x18\x32\x63\xfd\xff\x9e\
+\xfa\x6b\xcf\x6e\xc8\xc3\xc3\x07\x62\x44\xd3\x0a\x96\xed\xf7\x77\
+\x6e\xf7\xdd\x2d\xad\x06\xd7\x89\xb2\x37\x4a\x4e\xc9\x50\x0d\x46\
+\xd9\xa7\x68\x06\x3b\xfc\xcf\x66\x2a\x5a\x5a\x86\xeb\xc4\xa4\x0d\
+\x89\x8b\x86\xfc\xb4\x79\x56\xad\xb7\x7e\x5a\x79\xef\x94\x9f\x4e\
+\x1d\xcd\x21\x86\x26\xa0\xee\x59\x42\x02\x02\x02\x02\x02\x97\x8c\
+\x8b\xde\x3e\x11\x08\x5d\x63\xca\xb7\x8a\x11\xc3\x9d\xd0\xf2\x1e\
+\x6b\x53\xbd\xe9\xc7\x37\x36\xbb\xe1\x6c\x86\x2b\xc3\x2a\xcb\x14\
+\x48\x35\x3b\xac\x66\xd2\x18\x0d\xc9\xb3\xf6\x9c\xd8\xf8\xdc\x92\
+\x84\x43\x47\xd3\x73\x59\x3c\x0c\x17\x42\x53\xe2\x71\xe1\xb6\xfe\
+\xee\xae\xbd\x9b\x97\x0f\x1f\x9c\xe1\xf2\xaa\x71\x0e\x8b\x65\xf6\
+\x9e\xa4\x99\xb7\xff\xbc\x71\x21\x71\x81\x91\x82\xb3\xcd\xe5\xc4\
+\x0d\x46\x93\x4c\xd7\xbe\xbc\x21\xd3\x46\x65\x22\x0c\x7f\xde\xd1\
+\xee\xbe\x30\x9b\xa9\xbb\x51\x95\x76\xf4\x9e\xbe\xf6\x9d\xb5\x27\
+\xd3\xd8\x76\x07\xf8\x97\x75\x60\xde\x52\x32\x24\xe5\xba\x21\x32\
+\xcb\xbb\x43\xd5\x18\x69\xc1\x90\x56\xff\x31\x9b\x4c\xcd\xd3\x9c\
+\xda\xcf\x95\x3e\xfa\xf3\x47\xa4\x4b\xde\xaa\x85\xd4\x48\xaf\xa2\
+\xb1\x05\x39\x20\x43\x64\x49\xe5\x55\x7f\x18\xd4\xb2\xdb\x6d\x8d\
+\x2a\x8c\xa2\x74\xdc\xe5\xc3\x1d\xe6\xe3\x39\xca\xbc\x9e\xd3\x96\
+\xcf\xdd\x77\x2e\x5b\xa5\xb2\xb0\xef\x28\x22\x3c\x27\xdf\xaa\xd1\
+\x0e\xf9\x7f\xdd\xea\xd5\x1b\xda\xb8\x52\x2b\x83\x26\x45\xe7\xb8\
+\xbd\x6e\x45\xd3\xf0\xf5\x79\x63\xb9\x98\xb0\xc8\x31\xbf\xef\x58\
+\x38\x7e\x7d\xe2\xce\xc0\xf2\x03\x90\x59\x26\xee\x0b\xd6\xa4\x05\
+\x04\x04\x04\x04\x2e\x1d\x97\x65\xd1\x05\x34\x26\x4e\x28\x20\x45\
+\x80\x2e\xd9\xef\x73\x6e\xeb\xe1\xdc\x14\xef\xb6\x32\xb2\x6a\x90\
+\x14\x8f\x8d\xc2\x2a\xb9\x6e\x5f\x4e\xa6\xd3\x13\x35\xac\x6d\xad\
+\xbe\x0f\xb7\xaa\xce\xbe\xb8\x6e\xa7\xde\x1f\x49\xd8\xcc\xb2\x0c\
+\x12\x00\x81\x50\x5a\xc6\x76\x5f\xad\xf8\x73\xc2\xc6\xa3\x13\xca\
+\x86\xdb\x9c\xe0\x96\x35\x27\x53\xd8\x9c\x1d\x94\x22\x10\xcc\x97\
+\x37\x36\x6b\xfa\x50\xdb\x8a\x51\x20\x41\x2b\xb1\x0f\x86\x3e\x77\
+\x9d\xcb\xd4\xfa\x4d\x5f\x3f\x2d\x5a\xd1\xb6\xfe\xbe\xf5\xd8\x02\
+\x90\x20\x88\x89\xc4\x62\xf3\x74\x0b\x46\x75\xee\x4b\xa6\x1f\xae\
+\xe1\x66\x92\x65\xe3\xda\x63\x69\xda\x9f\xe9\xd2\x5f\x06\x93\x6d\
+\xa9\x4e\x82\x8c\xf8\x6c\xe4\xe7\xa1\xb4\x1f\x6a\x54\x2d\xf2\xf3\
+\x1b\x9b\x37\x45\x9e\x94\x10\x2b\xdb\x8a\xb3\x99\xdb\x29\xb2\x3b\
+\x3e\xcc\xea\xfb\x6c\xd3\x89\x4f\xab\xbc\xff\xfb\x2f\x09\xc9\x39\
+\x38\x2a\x0d\x84\x0e\x32\x94\xc1\x81\x54\x36\xa6\xc1\x3d\xda\xba\
+\x46\xf5\x91\xed\x6b\xf7\xcc\x74\x7a\xc3\x32\x5d\x9e\x1c\xf2\xd3\
+\xc2\x2d\x26\x7b\x5c\x98\xcd\xbb\xe1\x58\xca\xda\x3f\x0f\x9d\x3b\
+\x84\x70\x28\x3f\xf2\x87\xc8\xf8\x0d\x39\x05\x09\x0a\x08\x08\x08\
+\xfc\x33\xb8\x2c\x44\x18\x08\x4e\x8a\x20\x0c\xfc\xfe\x7e\x47\x42\
+\x96\x63\xc2\xfc\x25\x13\x8f\xcb\x73\x7c\x95\xeb\xec\x89\x0d\xb7\
+\x93\x1a\xea\xb3\x79\x55\xcd\xab\x65\xbb\x5d\x2e\x45\xc9\x1b\xe6\
+\xa4\xd0\xd5\xa2\x1d\x66\x17\x26\xe8\xc0\x80\xc4\x36\x94\x16\xe6\
+\x0d\x8d\xcf\x2e\xdc\xbd\xeb\x8d\xd5\x87\x3f\xdc\x76\x26\xfd\xaf\
+\xa9\xdb\x8f\xa7\x20\x3c\x11\x83\x3a\xb0\x6e\x05\xc7\x3d\x6d\x6a\
+\xde\x33\xe9\xa6\xe6\xf7\xdc\xd5\xb6\x26\x86\x35\xd9\xbe\x40\xf8\
+\x6f\x3f\x97\xe9\x1a\xf9\xd5\xaa\x4f\xde\x59\x9e\xc0\xf6\x27\x42\
+\xa3\x22\xb1\xd4\xf1\x23\xfb\x55\x6b\x51\x35\x6e\x60\x8b\xaa\x31\
+\x03\xc7\x8f\xea\x57\x1d\x6e\x94\x1d\x82\x18\xde\xdf\x9c\xb4\xad\
+\xcb\xb7\xeb\xbf\xc6\x35\xca\x60\x33\x9b\x8d\x6e\x2a\xcf\x23\x6d\
+\x2a\x9b\x27\xdd\xda\xf8\xee\xfb\xda\x56\xbf\xf7\xa6\xba\xe5\xc3\
+\x38\x29\x7d\xb7\xe5\x68\xfa\xb6\x13\x19\x8b\xdf\x5b\x7d\xe4\xc3\
+\x07\xe6\x6f\xd9\x0c\x59\x89\x88\xb1\x52\x07\x3c\x06\x8d\x50\xa9\
+\x13\x17\x6e\x25\xb1\x98\x4c\x4e\x9f\xc7\xa9\x66\x39\x73\x48\xbb\
+\xf4\x85\x5b\x64\x5b\x4c\xb8\xc5\xbd\xf9\x4c\xfa\x86\x21\xb3\x37\
+\xcf\x6e\xfb\xc5\xca\xb5\x7b\x93\xb3\x72\x11\x0e\x40\xfe\xa8\x4b\
+\xfd\xa7\x80\x80\x80\x80\xc0\x3f\x84\xcb\x32\x34\x5a\x14\x18\x23\
+\x10\x09\xf1\x4e\xfd\xe3\x41\xdd\x63\x87\xd7\x8a\x68\x1e\x69\xd5\
+\x6a\x9b\x6d\x26\xd3\xf8\x95\x07\x67\x8e\xf9\x6b\x67\xda\xa0\x06\
+\x15\x6c\x3f\x0e\x6a\xd5\x7f\xe6\xce\xe3\xbb\x46\xfd\xb6\x9d\x9d\
+\xbd\x09\x2d\x8e\x74\x22\xac\xb4\xf4\xef\xf7\x03\x90\x24\xc9\xad\
+\xfe\x35\xba\x6b\xb7\xee\x15\xc3\xef\xca\x72\xa9\x52\x54\xb8\x75\
+\xc7\x5d\x7f\xed\x98\xf8\xed\xda\xc3\x2e\x8b\xd9\x64\xf4\x90\x8a\
+\x88\xbc\x41\x28\x7a\x34\xc3\x90\xc6\x75\xe5\x99\xfd\x6a\x3c\x97\
+\xa9\xaa\xb5\x31\xdf\x18\x61\x90\x12\xef\x98\xb3\xef\xad\xef\x0f\
+\x1e\xf3\x9f\x4c\xc3\xe3\x20\x6f\xe4\xf9\x70\x8b\x2a\xe6\x89\x37\
+\x37\x7d\x30\x25\xcb\xdb\x2a\xd2\x6c\x32\x2c\x4b\xce\xf8\xa6\xe7\
+\x94\x55\x4b\xb9\x0c\x7a\x34\xb6\x12\x96\xe2\x60\x11\x0c\x36\xef\
+\x2b\x0d\xca\x84\x49\xd3\x06\x76\x6e\xd4\xa6\xba\xb5\xe1\xc0\x59\
+\xab\x7f\x99\xbb\x33\xc5\xf3\x61\xff\x16\x91\x4f\x76\xac\x39\xc2\
+\x9d\xe3\x72\x6d\x3a\x99\xb9\xe7\xfd\x8d\x07\x77\xfd\xbc\xe7\x74\
+\x0e\xe2\x43\x5d\xc5\x2b\x04\x4b\x4c\x40\x40\x40\x40\xe0\x8a\xe1\
+\xb2\x6b\x84\xc1\x00\xa9\x80\x04\x49\x53\x92\x40\x6b\x8f\xcd\x59\
+\x9a\x1a\xf7\xde\xdc\x25\x9f\x6e\x3e\x32\x67\xdf\xa9\xd4\x7d\x3f\
+\xed\x3e\xc5\x8e\x65\xab\x13\x13\x16\x66\xb6\xc8\x71\x43\x5a\x54\
+\xeb\x65\x78\xa8\x7b\xdf\xb1\x2d\xaa\xc7\x62\x78\xd1\xab\x18\x24\
+\x33\xc5\x33\x83\x29\x08\x7a\x9a\x6a\xcd\x58\x87\xdc\x22\xce\xde\
+\xd1\xed\x53\x15\x59\x36\x64\xe7\xba\xdc\x2d\xa6\xf5\x6b\xfa\xc8\
+\xe3\xed\xeb\x58\x41\x82\xd0\x0c\x91\x37\xc2\x53\x34\x56\xce\x27\
+\xda\x95\xed\x25\xd9\xac\xf5\x49\x10\x97\x24\xc9\x2e\xa3\xcd\x5a\
+\xef\x89\xeb\xaa\xf5\x0e\x0c\xc3\xe3\x20\xef\x27\xae\xbf\xce\x34\
+\xb1\x77\xab\x07\xd3\x73\x7c\x6d\xcd\x92\x94\xed\x56\x14\xa5\x79\
+\x84\xa3\x63\x8d\x98\x30\x19\x32\x20\x1c\x64\x82\x6c\x28\x9f\xdb\
+\xa7\xe0\x18\x37\xe5\x3f\x1d\x6a\x96\xd9\xfb\x48\xf7\x01\xf5\xca\
+\x18\xaf\x37\x28\x5a\x78\xfd\xc8\x68\x2b\xc2\xfe\xb6\x27\xd9\xbb\
+\xfa\x60\xd2\xf6\x21\x3f\x6d\x9e\xdd\x69\xea\xca\xf5\x20\x41\x14\
+\x0b\x7e\x82\x04\x05\x04\x04\x04\xfe\x1d\xfc\xe3\x44\xc8\x81\x4f\
+\x26\x61\x13\x01\x69\x4d\xe0\x0e\xe9\xf1\x05\x3b\xcf\xd5\xff\x74\
+\xf9\x92\x75\x67\xd2\x9c\xf0\xf7\xf8\x54\x87\xc1\x67\x30\xa6\x67\
+\x38\x73\x32\xa3\x1d\x35\xdf\x19\xd4\xe2\x96\x6d\xf7\x77\x6d\xda\
+\x28\xde\x6a\x70\x11\x2b\xf9\xf2\x86\x36\xfd\xab\x44\x7b\xd6\x88\
+\x8b\x8d\x8f\xb4\x56\x72\x12\xf3\x90\x0b\x26\xed\x32\x33\xd3\xb3\
+\x5b\x4c\x18\xdc\xf5\xbe\x3b\xfa\xf5\xc2\xdc\x1c\x23\x16\xe4\x07\
+\xd2\x1a\xd9\xb4\x72\xd9\x0e\x15\x23\xfb\x67\x38\xdd\x4e\x99\x48\
+\x4f\x96\x0c\x72\x86\xcb\xe3\x6c\x5f\x31\xa2\xff\x1d\x4d\x2b\x97\
+\x43\x18\x84\x45\x1c\xa0\x76\x85\x78\xe3\xdb\x37\x35\xbc\x37\x4b\
+\xc9\x6a\x63\x34\x48\x59\x94\xbd\x44\x79\x29\xf1\x51\xf6\x4a\x3d\
+\x6b\xc6\xc7\x21\x0c\x64\x81\x4c\x3e\x8a\x05\x19\x1b\x95\x8d\x31\
+\x6c\xbb\xbb\x5b\xf3\xb7\x7b\x35\x1b\x94\x91\xab\x54\x76\x7a\xd4\
+\x6c\x83\x64\xb4\x7a\x15\x8d\x6d\xac\x5f\x79\xec\xa4\xab\xd3\xd7\
+\x2b\xd7\xfc\x9a\x70\x86\xd2\x13\x04\x28\x20\x20\x20\x70\x35\xe0\
+\x8a\x11\x21\x07\xf1\x05\xb8\x83\x9d\x0e\x03\xd0\x5f\xe6\x9e\xea\
+\xf4\x64\x1a\x1c\xbe\x94\x32\x61\xd6\x30\xd5\xe3\xf3\xa6\x66\xe4\
+\x4a\xf5\xe3\xa2\xbb\xee\x7a\xb8\x63\xbf\x67\xdb\x56\x89\x62\xe3\
+\xa3\x04\xb6\x58\x85\x22\x7d\xb6\xf9\xf8\xb9\x37\x96\x1f\x98\x4c\
+\xc4\xe4\xf5\xaa\x2a\xd3\xb8\x14\x49\xce\x30\xe4\x26\x75\xa9\xef\
+\x39\xc9\xb4\x3c\x8b\x2c\x93\xe6\x86\x2b\x83\xe1\x50\x9a\x2b\x5d\
+\x93\xec\x27\x88\x00\x2d\xf4\x13\xda\x9c\x8a\x6b\x4d\xb2\x9d\x48\
+\x24\x3f\x84\x41\x58\x8b\x6c\x64\x27\xcb\xdc\x51\x3b\xba\xb7\xf5\
+\xec\xa1\x6e\x5e\x4d\xce\x82\x8f\x57\xd5\xac\xf1\x91\x76\xdf\x9b\
+\xcb\x0e\x4c\x9e\xb2\xf9\x48\x12\x64\x80\x2c\xd8\x5c\xaf\x29\x9a\
+\x36\xb6\x7d\xed\xe8\x5d\x0f\xf7\xec\x5f\xbf\xbc\xbd\x4b\x5a\x76\
+\x2e\x48\x5b\x29\x17\x6e\x0e\xcb\x74\x7a\x4e\x9e\xcc\x72\x66\x22\
+\x4d\x70\x1f\x4a\xad\x93\xb3\x20\x40\x01\x01\x01\x81\xab\x00\x57\
+\x9c\x08\x39\x30\x5c\x0a\xb8\xb1\x7b\x8e\x30\x6d\xe7\x89\x8c\x9b\
+\xa6\x2d\x9f\xb3\xfe\x4c\xea\x8a\x48\x87\xc5\x17\x66\x96\xad\x39\
+\x6e\x97\x2b\x2d\xc7\x56\xf5\xdd\xfe\xad\x6e\x7b\xab\x69\xe5\xca\
+\x08\x47\x44\xc5\xf6\xe6\x99\x49\xad\x1b\xb7\x78\xef\xce\x37\x97\
+\xef\x1f\x1f\x1b\x6e\xcf\xa5\x64\x18\x19\x1a\x34\x29\x57\xf3\x7a\
+\x93\xd8\x35\xd1\x11\xf2\x01\x69\xad\x39\x9e\xec\x19\xbf\x36\x71\
+\x5a\xa4\xcd\x9c\x45\x39\x92\xc6\x68\x90\xe9\x3a\x7b\xc2\xfa\xa3\
+\xd3\xc8\xcf\x8d\x30\x08\x4b\x74\xc5\xe4\x91\xcd\xe6\x34\x83\xd5\
+\xee\x84\x8c\x58\x90\x1a\x1b\x61\xcb\xa5\xbc\x3e\x7c\x7e\xc9\x9e\
+\x1d\x18\xaa\x85\x0c\x90\x05\x9b\xeb\xdf\x6c\x5a\xa5\xd2\x3b\x7d\
+\x1b\x0d\x4e\xcb\x4e\xaf\x92\xe3\x52\x9d\x0e\x8b\xc9\x1a\xe9\x90\
+\x9d\x1b\x4f\x2b\x7f\xb5\xf9\x72\xed\xbc\x1f\x77\x9f\x26\x32\x65\
+\xdf\x1b\xc4\xb7\x7b\x35\xbc\x0c\xe0\xb7\x80\x80\x80\x80\xc0\xbf\
+\x8f\x7f\x8d\x08\x43\x61\xde\xfe\x5c\xa5\xd3\x57\x6b\xb6\xbf\xb6\
+\xe2\xe4\x6c\xa7\x66\x4e\x88\x0b\xb7\x59\x7d\x3e\xaf\x42\xac\x69\
+\x71\xc7\x47\xe0\x43\xbc\x7e\x68\x9a\x64\xb0\x9a\x8c\xf2\xf3\x8b\
+\xf7\xee\x7f\x63\xc5\x81\xf7\x63\x23\xad\xa4\x75\x49\x91\x39\x4e\
+\xdf\x91\xdf\x0e\x24\xb1\x2d\x16\x44\x78\x6c\x5f\x21\x56\x8c\x62\
+\x6f\xde\xd3\x0b\xb7\x9e\xfa\x76\xc7\xc9\x9f\xc3\xcd\x46\x4b\xb8\
+\x55\xb2\x7c\xbb\xf3\xe4\xcf\x63\xfe\xdc\x7c\x02\x7e\xc4\x83\x4c\
+\x5b\x03\xf1\x21\xee\xbc\x84\xd3\x5b\x73\x72\xdd\x27\x49\x5f\x8d\
+\x20\x12\xcc\x7e\x63\xf9\xfe\x0f\x9e\x5f\xb2\x77\x3f\xe5\x69\xfc\
+\xfb\x00\xb7\x3c\x90\x6c\xe1\x94\x19\xc9\x6a\x50\xe2\xa2\x6c\x96\
+\x63\x59\xb9\xbb\xfb\xcd\x58\x3f\xab\xcd\x97\x7f\x24\xec\x4f\xc9\
+\x10\xa4\x27\x20\x20\x20\x70\x15\xe3\xaa\x22\x42\x68\x64\x18\x32\
+\x7d\x65\xf9\x96\xcc\xe8\xb7\x7f\x5d\xf8\xe1\x86\xc3\xbf\xc7\x47\
+\x59\xb3\x0d\x56\x59\xb6\x6a\x6a\x06\xc2\xe0\x48\xd2\x26\xf1\x0e\
+\x39\x9e\x68\xd1\x43\x0a\x96\xdd\x62\x92\xc7\x2d\xde\x73\xe4\xcd\
+\xa5\xfb\xde\x8f\x8d\xb1\xbb\x8e\x78\x5c\x09\x1b\x4e\xa5\xfb\x88\
+\xd3\xd8\x89\x30\xf5\xca\x44\xe0\xfc\x4f\xff\xde\xbc\x91\xbf\x6c\
+\x5d\x6a\x94\x6d\xfb\x8d\x46\xdb\x81\x91\x73\xb6\xe2\xfb\x87\xa0\
+\x35\x46\x56\x75\xe3\x1c\x46\x9c\x10\x83\xb8\xeb\x4f\xa6\xb9\x4f\
+\x64\x39\xf7\xc5\x46\x87\xb9\xdf\x5c\xbe\xef\x7d\xd2\x3e\x0f\x23\
+\x2f\x0f\xa9\x74\xf1\x14\xb6\x49\x5c\x38\xf1\x6b\x1e\x23\x5a\x35\
+\x43\x06\xb1\xb2\x5c\x26\xca\x92\xf3\xd1\xea\x03\xf3\xeb\x7c\xb2\
+\x74\xe9\x82\x83\xc9\xd8\xf7\x28\x86\x40\x05\x04\x04\x04\xae\x72\
+\x5c\x55\x44\x08\x70\x32\x04\x9e\x5c\xb0\xf3\x48\xdf\xe9\x6b\x7f\
+\xda\x72\x24\x75\xfb\x89\x1c\xb7\x07\xfe\x6e\x45\xd1\xd6\xde\xd5\
+\xae\xf5\xca\xd1\xad\x9b\x83\x64\x5c\xc4\x70\x76\xb3\x2c\x3f\xbf\
+\x74\xff\x89\x09\xab\xf6\xbf\xf5\xd5\xda\xa3\x1b\x58\x42\x3a\xb9\
+\x6d\xb9\xb7\x4b\xe7\x27\xda\xd4\xac\x84\x6b\x0b\x54\x43\xc2\x27\
+\x1b\x8e\xce\x24\x33\x83\xbb\x61\xae\xef\xb1\xb6\x35\x2b\xee\xbe\
+\xbf\x6b\x17\xb8\x11\x58\xdc\x29\x5b\x8e\xaf\x9d\xb0\xea\xe0\xdb\
+\xcf\x2f\x4e\x38\x86\x3c\x90\x17\xc6\x36\x57\xde\xd6\xa2\xe9\xba\
+\x91\xed\xda\xf0\x61\xdd\x93\x59\xb9\xee\xcd\x47\x52\xb6\xf7\xfb\
+\x6e\xed\xec\x27\xfe\xda\x73\x04\xb2\x63\x21\x4d\xde\x50\xab\x80\
+\x80\x80\x80\xc0\xd5\x0c\x68\x2c\xfa\xe5\xd5\x07\x10\x62\x28\x32\
+\x39\xf4\x68\xcf\xde\xb5\xe2\x23\x1b\x6e\x3f\x7e\x7a\xfd\xa8\x95\
+\x49\xeb\xb6\x27\x1c\x54\xf1\x8d\x3f\xfe\x79\x23\x2c\x46\xc1\x3c\
+\xdc\xed\x0d\xca\x47\x4e\xbf\xb9\xd5\x70\x73\x98\x25\x6d\xe4\xbc\
+\x2d\x3f\x7f\xbb\xee\x28\xdb\xbc\x1f\x8c\x51\xcd\x2a\x5a\xa6\x0d\
+\x6e\x3b\xc8\xe0\xf2\xc5\xfd\xf7\xd7\x2d\x33\x5e\xdf\x7d\x2a\x1d\
+\xf3\x7f\xd8\xa0\x0f\x7f\x9e\x76\xb3\x7a\xb5\xa5\xa9\x9d\xcb\xb7\
+\x6b\x5e\xb3\x5c\x87\x43\x67\x33\xf7\xd6\x9a\xb0\x70\x01\x4b\x20\
+\x00\x85\xc9\x2c\x20\x20\x20\x20\x70\x75\xe2\xaa\xd3\x08\x03\x01\
+\x42\x81\x66\x05\xe8\x4e\x0c\x36\xc9\xeb\xc8\xc8\xcc\x76\xd7\x89\
+\x89\x68\xb9\xfd\xc9\x3e\x7d\xc7\x0d\x68\x69\x03\x51\x59\x4c\x32\
+\x86\x2b\x89\x88\xf2\x66\xf1\x9e\x69\x55\xaf\x86\x64\x34\xc8\xae\
+\x6c\x4f\xfc\x73\x2d\x6b\xb5\x83\x1b\xfc\xd9\xe6\x77\x32\xf8\x0d\
+\x8c\xed\x54\xaf\x93\x3b\xd7\x1b\xef\x31\x68\x52\x9f\x4e\x75\xd9\
+\x91\x6f\x5e\xe2\x32\x84\xa5\x34\x19\x09\x8e\xbb\xa1\xa1\x6d\xfb\
+\x13\xbd\xfa\xd5\x8d\x0b\x6b\x9d\x91\x9a\xed\xb6\xab\x1e\x07\x8b\
+\xac\x03\x61\x85\x16\x28\x20\x20\x20\x50\xf2\x70\x55\x13\x21\x80\
+\xd1\x48\x00\xd7\xd8\x6c\x01\x3b\xd5\x1e\x7b\x20\xaa\x4c\x8c\xe2\
+\xf4\xa9\xde\xe4\xbd\x7b\xaa\xbe\xd1\xa2\x72\xbf\xb1\xed\x6b\x87\
+\xe3\xe3\xbe\x18\xfd\xa4\xe0\x4c\x33\xac\x5c\xce\x56\xdd\xe3\xd3\
+\xd4\x5c\xaf\xcf\xdd\xa8\x6c\x54\xc3\xc9\x7d\x5b\x57\x64\x69\x21\
+\x15\x9d\x06\x27\xf5\x6d\x54\xb5\x71\xd9\xc8\x7a\x39\x5e\x9f\x0b\
+\x9f\x06\xae\x13\x6e\xa9\x06\x77\x84\xc3\x02\x1a\x4a\x53\x7d\xb2\
+\x63\xcd\x88\x37\x3a\xd6\xe8\x9f\x92\xb0\xaf\x6a\xae\x57\xf3\x46\
+\x95\x89\x52\xd2\x1c\xe5\x0f\x20\x1c\x08\x90\x87\x87\xac\xb8\x16\
+\x10\x10\x10\x10\x28\x39\xb8\xea\x89\x30\x10\xc4\x6f\x6c\x15\x68\
+\x93\x77\x7e\xde\xf5\xc6\xca\x03\x73\xe3\x22\xec\xd9\x0e\x9b\xdd\
+\x70\x2e\xdb\x55\xee\x9d\xbe\x4d\x6e\xba\xab\x69\xe5\x68\x9c\x03\
+\x8a\xe1\x49\x84\x3f\x9b\xe5\xcc\xb2\xc8\x92\x4c\xda\x9f\x9a\x99\
+\xe3\x34\x0d\x6b\x1c\xdf\xb1\x79\xf9\x18\x9c\x01\xca\xb6\x30\x34\
+\x8f\x8f\x95\x46\x34\xaa\xd6\x2e\x33\xc7\x8d\x93\x61\xb0\x25\xc3\
+\x78\x32\xd3\xc3\xb6\x3a\xf0\x21\xce\xbb\x9a\x54\x8e\xfe\xb0\x77\
+\x93\x81\xe7\xb2\x95\xb2\x76\xbb\x5d\x2a\x13\x6e\xc9\x7a\x73\xf9\
+\xa1\xb9\x8d\xde\xf9\x61\x27\x64\x01\x01\x22\xbc\x80\x80\x80\x80\
+\x40\xc9\x44\x89\x22\x42\x00\xc4\x63\x22\x96\x1a\x37\x7f\xf3\xe9\
+\xb1\xeb\xf6\xcf\xc9\xd1\x7c\xc7\x1d\xb2\xc9\x60\xf0\xf9\x62\x6b\
+\x97\x09\xaf\x8a\x30\x98\xdf\x83\x3d\x69\xe5\x89\x35\x26\xc9\x74\
+\xce\xab\x2a\xd8\x76\x88\x2f\x5a\x98\x41\x76\xf0\x03\xcc\x46\x23\
+\x91\xa4\x41\xff\x9c\x93\xc1\x6c\xb2\x4a\xa9\x9f\xee\x4a\x58\x03\
+\x3f\xbe\xb0\x86\xa5\xe9\x55\x63\x1d\x26\x49\xca\xf1\x1a\x8e\x3c\
+\xbf\xe4\xd8\x9c\xe7\x17\x6c\x3e\x0d\x19\x04\x09\x0a\x08\x08\x08\
+\x94\x7c\x94\x38\x22\x04\x48\x9b\x53\xf1\xc9\xa5\x77\xfe\xda\x97\
+\xdb\x66\xca\xca\xf9\xc7\x72\x73\x77\x60\xfb\x42\x96\xdb\xc7\x56\
+\x96\x42\x2b\xc4\x82\x99\x29\x7b\x13\x5d\x5f\x6e\x4f\x5a\x1d\x17\
+\x1e\x46\x9a\xa4\xc1\xbc\x3f\x25\xeb\xd8\xc6\x93\xa9\xd8\x5a\xc1\
+\xb0\xf1\x6c\xb2\x2f\x21\x2d\xe3\x98\x64\x90\xcc\x71\x91\x56\xc3\
+\x57\x5b\x4e\xad\x99\xb2\xee\x74\x2e\xe2\xfa\xf4\x51\xce\x2c\x8f\
+\x4f\x35\x38\x4c\xf2\xf1\xac\x9c\x2d\x6d\xbf\x5c\xfa\xc7\x9b\xab\
+\x77\x38\x91\x37\x64\x60\x01\x04\x04\x04\x04\x04\x4a\x34\x4a\x24\
+\x11\x02\x6e\x62\x22\xab\xc9\x28\x1d\xcd\x70\x1a\x1a\x4c\x5c\xb6\
+\x3a\xd3\x9b\xbb\x26\x2e\xcc\xc6\xbe\xf0\x4e\xaa\x1c\x5b\x35\x0a\
+\xb2\xbb\x67\xde\xda\x13\x7b\x92\xb2\xf6\x3b\xc2\xac\xf2\xac\xbd\
+\x67\x92\xe1\x8f\x03\xb2\x61\x70\x3d\x6b\x4f\x52\xaa\x23\xc2\x26\
+\xef\x4b\xca\x3c\x78\xf7\xaf\x5b\xd8\xd6\x07\x16\x17\x9e\x84\x32\
+\x36\xab\x2d\x2b\xd5\xbb\xa6\xfe\xa7\x2b\xd6\x1d\xc9\x70\x4a\xc8\
+\x13\x79\xeb\xde\x02\x02\x02\x02\x02\x25\x1c\x25\x96\x08\x01\x37\
+\xa9\x6d\x98\xdb\x03\x79\xb5\xfd\x62\xed\xa6\xa9\xdb\x8f\xed\x83\
+\xbb\x47\xd7\xd6\xc8\x0f\x96\xe1\x8d\x55\x09\xdb\x0c\x16\x13\xe6\
+\xfe\xb2\x99\x43\xde\x3e\x41\xa6\xf2\x11\x1d\x66\x1b\xbc\x9e\x9c\
+\xd7\x96\xed\x67\xa7\xd1\xf0\x38\x3c\x8d\x6f\xb6\x1f\xdf\xd5\xf6\
+\xf3\x15\x9b\x90\x07\xf2\x42\x9e\x2c\x80\x80\x80\x80\x80\xc0\x35\
+\x81\x12\x4d\x84\x00\x5f\x55\x7a\xe0\x74\xb6\xb6\xfb\x6c\x26\xfb\
+\x92\x05\x07\xfc\x8c\x92\x51\x9a\xbe\xf3\x78\xda\xc1\x13\x29\x87\
+\x48\x9b\xd3\x7d\xfe\x86\x84\xef\x07\x46\x94\x3b\x3c\x63\xcf\x49\
+\xa6\x2d\x06\xaf\xfc\xdc\x9d\x9c\xe9\xda\x9f\x95\xcd\xf2\x10\xab\
+\x42\x05\x04\x04\x04\xae\x3d\x94\x78\x22\xe4\xc0\x0a\x4f\xfd\x32\
+\x1f\x64\xbd\x84\x0b\x0e\x9d\x3b\x1a\x1f\x66\xc6\x97\x27\x02\x77\
+\x4f\x18\xe2\xc3\x4c\x96\x3f\x12\xcf\x1d\xc6\x35\x36\x21\x32\xc7\
+\x20\x14\x96\xb6\x80\x80\x80\x80\x40\xc9\xc7\x35\x43\x84\x85\x81\
+\x6b\x71\xfb\x53\x4e\x9e\xd9\x93\x94\xc6\xbe\x06\x8f\x31\x4f\x3e\
+\xc9\x77\x30\xd5\x93\xf5\xe7\x8a\x9d\xa7\x70\xad\x90\xd6\xc7\x1c\
+\x05\x04\x04\x04\x04\x4a\x0d\xae\xea\x23\xd6\x04\x04\x04\x04\x04\
+\x04\xfe\x69\x5c\xf3\x1a\xa1\x80\x80\x80\x80\x80\x40\x51\x10\x44\
+\x28\x20\x20\x20\x20\x50\xaa\x21\x88\x50\x40\x40\x40\x40\xa0\x54\
+\x43\x10\xa1\x80\x80\x80\x80\x40\xa9\x86\x20\x42\x01\x01\x01\x01\
+\x81\x52\x0d\x41\x84\x02\x02\x02\x02\x02\xa5\x1a\x82\x08\x05\x04\
+\x04\x04\x04\x4a\x35\x04\x11\x0a\x08\x08\x08\x08\x94\x6a\x08\x22\
+\x14\x10\x10\x10\x10\x28\xd5\x10\x44\x28\x20\x20\x20\x20\x50\xaa\
+\x21\x88\x50\x40\x40\x40\x40\xa0\x54\x43\x10\xa1\x80\x80\x80\x80\
+\x40\xa9\x86\x20\x42\x01\x01\x01\x01\x81\x52\x0d\x41\x84\x02\x02\
+\x02\x02\x02\xa5\x1a\x82\x08\x05\x04\x04\x04\x04\x4a\x35\x04\x11\
+\x0a\x08\x08\x08\x08\x94\x6a\x08\x22\x14\x10\x10\x10\x10\x28\xc5\
+\x30\x18\xfe\x1f\xfe\x04\x3c\x9f\x01\x46\x76\xae\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x1a\x21\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x13\x00\x00\x00\x28\x08\x06\x00\x00\x00\xdd\x63\x1e\x62\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
+\xa8\x64\x00\x00\x19\xb6\x49\x44\x41\x54\x78\x5e\xed\x9d\x0b\x94\
+\x55\xd5\x79\xc7\xef\x9d\x19\x04\xb1\x80\x46\xd3\x26\x16\xeb\x23\
+\x56\xd3\x24\x0a\x44\x4d\xb5\xa9\x98\xa8\x35\x51\xa3\x29\xb1\xc6\
+\x1a\x4c\xf3\x10\x64\x44\x1b\x15\xa1\x09\x71\x14\x9b\x6a\x5c\x8a\
+\x8a\xc3\x7b\x06\x75\x00\x5b\x7c\x54\x89\x69\x4a\x0d\x5a\x34\x84\
+\x28\x3a\x62\x02\x83\x29\x82\x55\x5e\xc6\x1a\x1d\x84\xc1\x61\x66\
+\x64\x5e\xf9\xff\x0e\xe7\xbb\x6b\xdf\x33\xfb\x9e\x7b\x2f\x33\x30\
+\xc3\xea\xf9\xaf\xf5\x5f\xe7\x9e\xfd\xfc\xf6\xeb\xdb\xdf\x7e\x9c\
+\x99\x74\x67\x67\x67\xaa\x18\xa4\xd3\xe9\xf0\x57\xdf\x47\xb1\x65\
+\x4b\x90\x20\xc1\xde\xa3\x24\x7c\x26\x48\x90\x20\x41\xb7\xd0\xeb\
+\xca\x64\xec\xd8\xb1\x07\x8e\xa9\x93\x20\x41\x82\x9c\xe8\x55\x65\
+\x32\x6e\xdc\xb8\x74\x75\x75\x75\x03\xcf\xd0\x29\x41\x82\x04\x07\
+\x28\x7a\x4d\x99\xc8\x22\x49\xcd\x9a\x35\x6b\x6b\x6b\x6b\xeb\x20\
+\x9e\xbc\x27\x48\x90\xe0\xc0\x45\xaf\x28\x93\x31\x63\xc6\xa4\xee\
+\xba\xeb\xae\x5f\x74\x74\x74\xfc\x29\xef\x3c\xf5\xfe\x02\xee\x09\
+\x12\x24\x38\x30\xd1\x2b\xca\xe4\xfe\xfb\xef\x4f\xdd\x7b\xef\xbd\
+\xe7\xea\x67\x3b\xef\x9d\x9d\x9d\xed\xd3\xa6\x4d\xfb\x02\xee\x09\
+\x12\x24\x38\x30\xd1\xab\x47\xc3\x4b\x97\x2e\x3d\x7c\xe4\xc8\x91\
+\xf5\x2b\x56\xac\xf8\xd8\x79\xe7\x9d\xf7\xfb\xd0\xb9\xc7\x90\x1c\
+\x0d\x1f\xf8\x50\x7f\xfb\x33\x3d\x3e\x2d\xbe\xa4\xf6\x7c\x3f\x70\
+\xec\xe3\x90\xcc\x0c\x92\x13\xc5\x63\xc4\x5f\x49\xee\x46\xdc\xf7\
+\x16\x4a\x6e\x80\x1e\x7f\x2d\x32\x46\x5e\x55\x7a\x7d\xb3\x63\x23\
+\x57\x31\xec\x0e\x16\x2e\x5c\x78\x68\x73\x73\x73\xfb\x5b\x6f\xbd\
+\x75\x4a\xe8\x94\x85\x45\x8b\x16\x1d\x2b\xff\xb6\xda\xda\x5a\x3a\
+\x50\xb7\xe1\x93\x3f\x8e\x82\x29\xd7\xe0\x99\xb0\x77\x49\x3b\x88\
+\xcf\x89\x1f\x8a\x98\xad\x25\xbe\x70\xbd\x49\x21\xab\xaf\x20\xa3\
+\x78\xa4\xf8\x1b\xf1\x03\xf1\x7b\xae\xff\xde\x50\xf8\x07\x71\xa7\
+\xf8\xba\x78\xac\xd8\xe7\xea\x01\xee\xb7\x65\xce\x98\x31\x63\xd2\
+\x97\x5f\x7e\xf9\xb6\xd2\xd2\xd2\x92\x23\x8e\x38\xa2\x76\xc9\x92\
+\x25\x9f\x0a\xbd\x02\x3c\xf2\xc8\x23\x43\x2f\xb9\xe4\x92\xff\x95\
+\x7f\xe9\xb0\x61\xc3\x36\xf6\xd2\xfe\xc9\x51\x9a\x05\xe6\xe8\x39\
+\x59\xcf\xb2\x3d\x4e\x09\x7a\x11\xfd\x44\x66\x78\x9e\x7f\x2e\x96\
+\x8a\x7d\x06\xea\x23\xc8\x34\x5f\xcf\x9b\xc5\x83\xf7\xb8\x06\x0a\
+\x70\xb0\xf8\x27\xe2\x41\xe2\x71\xf2\xdb\x6b\x73\x3e\x8c\x4b\x1d\
+\x60\x9d\x7c\x54\x3c\x54\xec\x93\xe8\x95\x3d\x93\x92\x92\x92\xf4\
+\x99\x67\x9e\x39\x05\x05\xc3\x3b\x8a\xe3\xfc\xf3\xcf\xff\x81\x55\
+\xba\xfc\x79\xf4\x06\xbe\x2f\x72\xac\x74\xb3\x78\xbc\xc9\x93\xa0\
+\xd7\x41\x3b\xf4\xc5\xb6\xf8\xae\xf8\x75\x71\x92\x38\x02\x87\x10\
+\x81\x39\x21\x20\xb3\xfd\xee\x0e\x48\xa3\xef\xf7\x45\x9f\xb9\x12\
+\xc7\xee\x60\xec\xd8\xb1\xa5\x6d\x6d\x6d\xbb\x9b\x9a\x9a\x36\x38\
+\x8a\x24\xd0\x1c\xbc\xef\xda\xb5\x6b\x75\x6b\x6b\x6b\x87\xb9\x75\
+\x17\x3e\xf9\xe3\x28\x3c\x24\x76\x84\x3c\x59\x4c\x96\x3b\xbd\x48\
+\x81\x99\xfd\x6d\x91\x97\x15\x62\x3f\x5f\xb8\xde\xa2\xf0\x6d\xb1\
+\x5e\xfc\xad\x78\x74\xe8\x86\xf5\xf4\x49\x11\xb9\x77\x8b\xd3\xc4\
+\xbd\xee\x47\xc4\x15\x6f\x13\x5b\xc5\x1d\x22\x4a\xab\x4f\x2e\x73\
+\xbc\x8e\x71\x2c\x16\xaf\xbd\xf6\xda\xd0\xab\xae\xba\x2a\xa3\x55\
+\xa5\x50\x4a\xec\xd6\x2b\x0a\xa4\xa3\xa3\xa3\x53\xcf\xc0\x8f\xe7\
+\x75\xd7\x5d\x97\x31\x65\x89\xa7\xf8\xac\x11\xf7\x0a\x3e\xf9\xe3\
+\x28\xfc\xab\x98\x28\x93\x3e\x42\xa1\xaf\x2b\x13\x96\x1e\x27\x89\
+\xf4\xd1\xa0\xaf\x08\x89\x32\x29\x94\xc5\x00\xe5\xb0\x7b\xf7\xee\
+\xba\x96\x96\x96\x5f\x57\x54\x54\xb0\xee\xcd\x00\x85\x22\x2b\xa4\
+\x4d\xfe\x9d\x62\xbb\x29\x18\x03\xe1\x3f\xfc\xf0\xc3\xdf\xc8\x6f\
+\x8d\x29\x9b\x62\xe1\x93\x3f\x8e\x42\xa2\x4c\xfa\x10\x85\x3e\xad\
+\x4c\xa0\x40\xbf\xcd\x0c\x6e\xe1\xff\xad\x32\xd9\x67\x9b\x13\x28\
+\x80\xa9\x53\xa7\x4e\xd1\xcf\x0f\x4b\x4a\x4a\x3a\x6e\xba\xe9\xa6\
+\x95\x0f\x3f\xfc\xf0\x1f\xed\xf1\x0d\x06\x3a\x35\x15\x28\x90\x74\
+\x9a\xba\x0e\xde\x03\x28\xdc\x40\x85\x7f\x51\xee\xdc\x43\xd9\x7d\
+\xcf\x3d\xf7\xfc\x78\x6f\x15\x4a\x4f\xa1\x98\xfd\x13\x05\xcd\xaa\
+\xd7\xe8\x7b\x2e\x90\x07\x08\x5f\x03\x84\x4e\x19\xb7\xf0\xb5\xa8\
+\x76\x0b\xe3\xe4\x94\x3f\xce\x2f\x0a\x05\x2d\x71\xc3\xf3\x5b\xe8\
+\x91\xf2\xd9\x33\x1f\x82\x08\x42\xf8\x5a\x94\x0c\x80\xc0\xe1\xcf\
+\x82\x50\x40\xf8\x4c\xdf\xdd\x1b\x20\xbb\x9b\x07\xbf\x85\xa2\xda\
+\xd8\x05\x71\x49\x20\x7c\xed\xf2\x9e\x0b\x84\x01\xe1\x6b\x00\xbd\
+\x66\xe2\x46\xfd\xba\x80\x31\x5c\x0c\x8b\x81\x14\x40\x7a\xf3\xe6\
+\xcd\x57\xc8\xc2\x78\xa9\xb9\xb9\xf9\x7e\x96\x2d\xb2\x40\x42\xdf\
+\x54\xea\xce\x3b\xef\x2c\x95\x7b\x67\x4d\x4d\x0d\x33\x50\x00\x85\
+\x09\x96\x37\x4d\x4d\x4d\xb3\x88\xb7\x65\xcb\x96\xd1\xa4\x13\x7a\
+\x17\x05\x9f\xfc\x71\x14\x5c\xcb\xe4\x72\xf1\x34\xf1\xd4\x90\xdc\
+\x19\x88\x9d\x61\xf0\x17\xb1\xc0\xb8\xd9\x8b\xf9\x3b\x5c\xfc\x4c\
+\xf8\xce\xe9\x50\xbe\xf8\x98\xcb\x27\x10\x2e\x24\x1d\xea\xb0\xd0\
+\x6d\x58\xc8\xe3\x45\x76\xf4\x0b\x9a\x9d\x04\xd2\xe9\x2f\x12\x8f\
+\x59\xcd\xca\xe3\x72\xa8\x2f\xae\x4b\x21\x90\x5d\x70\xe5\xa1\x7c\
+\xa4\x3b\x44\xcc\x3b\xfb\x0a\x1c\xf9\x73\x8a\x97\xa9\x0b\x61\x90\
+\xf8\x09\x91\xf4\x38\xb5\x70\x67\xf9\x2e\x96\x89\x48\x9d\x70\x72\
+\x72\xb4\x68\x75\xfc\x17\x22\xa7\x27\xb1\x75\x2c\x70\xca\xf2\x59\
+\xf1\x50\x9f\x7f\x2e\x0a\x1f\x11\xc9\x67\x50\xc4\x1d\x79\xb8\x03\
+\x73\x94\x68\xe5\x29\xd8\x32\xc1\x5d\xa4\x3c\x47\x88\xc4\x21\x0f\
+\x2c\xe2\xe3\x44\x26\x5e\xeb\x07\x05\x59\x26\x02\x61\x91\xe9\x63\
+\x22\xf5\x4c\x7a\xd4\x11\x75\xc5\x92\x2c\xb6\xcf\x08\x94\x83\x78\
+\xa5\xe1\x3b\xe9\x21\x87\xb5\x0f\xf5\x1c\xf8\xf9\xe8\x75\x8c\x63\
+\x21\xc0\x8a\xb0\x65\xcb\xb8\x71\xe3\x52\xdb\xb6\x6d\x3b\x15\x25\
+\x01\xea\xeb\xeb\x4f\xdb\xb1\x63\xc7\x39\xf6\xee\x2a\x8a\x0f\x3e\
+\xf8\x60\x84\x94\xc8\x28\xe2\xe0\xaf\x70\x67\xd8\x47\x80\x28\xa1\
+\x62\xad\x13\x9f\xfc\x71\x14\x50\x26\xfc\x80\x4d\x22\xf7\x04\xb8\
+\x70\xc4\x19\xff\xff\x88\x1c\x05\x76\x69\x10\xc1\x3a\xd2\x99\xe2\
+\x7f\x8a\xdc\x07\x60\x63\x8e\xc6\xe7\xb9\x41\xfc\xa9\xf8\x57\x22\
+\xe5\xc9\xea\x5c\xa1\x1b\x8a\x64\xa3\xf8\x3b\x91\x74\x18\x64\x15\
+\xe2\x2b\xe2\x5b\xe2\xf6\x90\x5b\xc5\x97\x45\x4e\x10\x06\x8a\xde\
+\x8e\x0a\xf1\x13\xe9\xa4\x4f\x89\xc4\x6b\x10\xad\x4c\x46\xca\x56\
+\x27\x32\xd0\xe3\x3a\x29\x03\xea\x47\x22\xf2\x20\xa3\xc9\x83\x6c\
+\xb8\x21\x0f\x1d\xb9\x8b\x3c\x02\x03\x06\x65\xfc\x6b\xf1\x1d\xf1\
+\x3c\xf1\x10\xf1\x1f\xc5\x17\xc5\x2d\x22\x17\xd2\x18\x80\x17\x88\
+\x56\x9f\x3e\x65\x72\x91\xf8\xb4\x48\x5d\x6d\x13\xa9\x63\x2e\x73\
+\xd1\x3e\xdc\x45\xa1\xe3\x67\xc9\xc0\xbb\xc8\x20\xbf\x47\x44\xe6\
+\x99\xe6\xee\x86\x8b\xd2\xfc\x85\x07\x45\xe2\xfd\x58\x24\x1d\x73\
+\xff\xb2\xf8\x7f\xe2\x4a\x91\x63\x5b\xcb\xa7\x50\x65\x42\x1c\xfc\
+\xd7\x8a\xa4\x43\x59\xa8\x87\xcd\xe2\xaf\x44\x06\x09\x6d\x7c\xbb\
+\x18\xab\x4c\x04\xf2\xa6\xec\xf3\xc5\xd7\x44\xea\x84\xf0\xd4\xd1\
+\x46\xf1\xe7\xe2\x85\x22\xe1\xb2\xe4\x11\x68\x1f\xda\x7f\x8d\x88\
+\x1c\xe7\x8b\xb4\xcf\x78\xf1\x05\xd1\xda\x87\xb6\x1b\xe5\xc6\x75\
+\xe9\x75\x8c\x63\x3e\x30\xe0\xa5\x04\xa6\xc9\xaa\x58\x14\xb5\x28\
+\x9e\x7a\xea\xa9\x41\xb2\x44\x5e\x69\x69\x69\xa9\xdd\xb9\x73\xe7\
+\x45\xae\x95\xd2\xd8\xd8\x38\x12\x77\xf9\xbf\xfc\xec\xb3\xcf\x7e\
+\x3c\x74\x0e\xa0\x74\x4a\x5a\x5b\x5b\x17\x2b\xdd\xe9\xc5\x28\x14\
+\x9f\xfc\x71\x14\x5c\x65\xd2\x26\xd2\x80\x46\x1a\x07\xed\xec\x6b\
+\x48\x66\xe6\xc9\x22\x83\x93\xa5\x19\x97\xac\xdc\xb8\x74\x2a\xd2\
+\x63\xe0\xde\x20\x46\x67\x38\x1a\xf3\x4b\x22\x61\x89\x3f\x43\xa4\
+\x83\xf1\x1b\x37\x37\x3d\xd2\xb2\x70\xb5\x22\x32\x75\xe9\xac\xb8\
+\x89\xcc\x70\xeb\xc4\x60\xb9\x28\x12\x2f\x5a\x2e\x88\x72\x60\x00\
+\x74\x99\x75\x04\xd2\x61\xb6\x42\x81\x99\x3c\x6e\x5a\x56\x36\x57\
+\x9e\xac\x3a\x12\x48\xe3\x73\x22\x03\x92\xb2\x30\xa8\x7f\x22\x12\
+\xcf\xd2\x80\xcd\xe2\x15\x62\x10\x5f\x70\x95\x09\x8a\x08\x65\x41\
+\x3e\xc4\x89\xd6\x09\xc4\x0f\x85\x39\x5a\xcc\xc8\xc0\x6f\x91\xb4\
+\x96\x8a\xbb\xc4\x5f\x9a\x5c\x16\x26\x8e\x02\x79\x23\xdb\x12\x11\
+\x2b\xcf\xe4\xbb\x5e\x24\x5f\x06\xed\xb1\xa1\x5b\x5e\x65\x22\xa0\
+\x14\x51\xa8\x0c\x72\xb7\x4e\x29\x17\xbf\x29\x9b\xd5\xcd\xc3\xe2\
+\x2c\x11\x77\xaf\x32\x11\xc8\xf3\x4a\xb1\x45\x24\x3d\xab\x0f\xab\
+\x1f\x4b\x0f\x3f\xfa\x56\x96\x25\x29\x50\x3f\x7f\x29\x32\xd1\x10\
+\xf6\x5e\xf1\x71\xd1\x64\xb0\xf4\xf0\x2b\x77\xf3\x76\xe9\x75\x8c\
+\x63\x3e\x48\x11\x0c\x96\x42\x78\x69\xf7\xee\xdd\x2f\x8b\x2f\xb9\
+\x83\xff\xcd\x37\xdf\x1c\x2a\xbf\x55\xa1\xdf\x6c\x53\x36\x58\x21\
+\x52\x2e\xb7\xe3\x8e\x32\xd9\xb4\x69\x13\xa6\x63\x00\xe2\x87\xe1\
+\x57\x91\xee\xf2\xe5\xcb\x99\x21\x0b\x82\x4f\xfe\x38\x0a\xee\x32\
+\x07\xab\x80\x9b\x87\x1c\xff\x7d\x4b\xfc\xbc\x98\x35\xd8\x04\xe4\
+\xa7\x21\xac\xb1\x21\x0d\xb6\x4c\x9c\x20\x12\x77\xa2\xf8\x0b\x91\
+\x46\xc1\x9f\x46\x99\x29\xd2\xb9\x83\x06\x15\x48\xe3\x6f\x44\xe2\
+\x92\x37\x1d\x97\x70\xbc\x33\xf3\x57\x8a\x54\x24\x33\x15\x71\x99\
+\x3d\x2c\xbd\x4d\x22\xa6\x7b\x97\x81\x21\x2c\x14\xad\x43\x60\x9d\
+\x20\x4f\x94\x94\x8d\x81\x9e\xd5\x41\x9d\x34\xce\x12\x99\x91\x4c\
+\x1e\x66\x29\x06\x08\xf2\x40\x2e\xf9\x31\xfb\x91\x07\x9d\x6d\xbd\
+\x78\x42\x24\x0d\xea\x89\x25\x23\xca\x84\x70\x58\x7d\x96\x1e\x33\
+\x5e\xb5\x38\x4e\xc4\x2a\x19\xe0\xc4\x33\x65\x42\x38\xca\xca\x60\
+\xb1\xf8\x4f\x88\xdf\x13\x29\x03\x7b\x73\xab\x44\xfc\x08\xc7\xa0\
+\xfb\xbe\x93\x8e\x29\x13\xea\x00\x19\xf7\x46\x99\x90\x2e\x56\x27\
+\xe9\x98\x32\xb9\x4e\x44\x36\xca\x55\x8c\x32\xf9\xaa\x88\xc5\x6a\
+\x75\xf0\x86\x78\x87\xf8\x1d\xf1\x6a\xb1\x46\xb4\xba\x22\x0c\xe5\
+\xe5\x77\x2e\x65\xc2\xfd\x28\xfc\x90\x91\xf4\xa8\x8b\x5b\x44\xfa\
+\x2f\x0a\x0f\xc5\x8d\x12\xb5\x3a\xfc\x6f\x91\xe5\xaa\xdb\xff\xe8\
+\x03\x28\x13\xe2\xbb\xed\x43\xdb\x3e\x20\x96\x8b\x58\x85\x07\xbb\
+\x79\xbb\xf4\x3a\xc6\x31\x1f\xb0\x36\x14\x6e\x91\x06\x7f\xad\xac\
+\x93\x97\x79\x77\x2d\x90\x37\xde\x78\xe3\x68\x59\x20\x2b\x6d\x99\
+\x63\x50\x98\xb4\xc2\x2f\x97\xc2\x39\xc9\xfc\x78\x12\x37\x54\x26\
+\xb5\xdb\xb7\x6f\x9f\xe1\xa6\x95\x0f\x51\xd9\xf3\x51\x70\x95\x49\
+\xd6\x0c\xeb\xfe\x76\xdc\x18\x24\x74\x66\x2a\x9e\xc6\xde\x28\xfe\
+\xad\xe8\xee\x09\x10\x86\x99\xe8\xef\x45\x06\xa2\x35\xe8\x65\x4e\
+\x3a\x34\x26\x33\x15\x8d\x47\xde\x3c\x09\xc7\xbd\x17\x33\x9f\x5d\
+\xb2\x07\xb3\x58\xb4\xce\x43\x67\x67\xcf\xc0\xcd\x93\x2b\xdd\x58\
+\x42\xa4\xf7\xaa\x48\x3a\xe4\x93\xd5\xb1\x2d\x7f\x8f\x1b\x69\xb0\
+\xc7\x40\xc7\x64\x00\xd2\x19\xa9\x1f\xac\x46\x1b\x4c\x26\xcf\x1f\
+\x8b\x8f\x88\xc8\x03\x59\x36\xb1\xaf\xe3\xca\xe3\x2a\x13\x48\x1d\
+\x30\xb8\xd9\x73\xb1\x74\x02\x3a\x32\x98\x32\xb1\x3a\x81\x5c\x53\
+\x47\xb1\x67\xc2\x86\xbf\xb1\x18\x50\xdc\xe4\x41\x7b\x20\x2f\xcb\
+\x10\xfc\x4c\x99\x60\xea\x53\x96\x15\x16\xcf\xf2\x8a\xa3\xd0\x23\
+\xca\x84\xa7\xc8\x52\x19\xe5\x4c\x7a\xc8\x78\x97\xc8\x92\x22\x5a\
+\x1e\x26\x54\x26\x21\xeb\x5b\x5d\x94\x09\x4f\x91\xfe\x46\xfd\x90\
+\x1e\x72\x20\x53\x34\x2d\x78\x8e\xc8\x72\x9b\x70\xc8\x7c\xa7\xe8\
+\xa6\xe3\x2a\x13\xf2\xa2\x9e\x9e\x11\xd9\xc7\xb2\x34\xbc\xfd\xc7\
+\xe8\x75\x8c\x63\x1c\x4c\x09\x60\x4d\xac\x5f\xbf\xfe\x5c\x59\x29\
+\x6c\x00\xa5\x1a\x1a\x1a\x86\xbf\xf0\xc2\x0b\x99\xa5\x8b\x59\x2b\
+\xb2\x32\x8e\x97\x62\x79\x59\x4f\x36\x76\xb2\xa0\xf0\x87\x35\x35\
+\x35\x9d\x8d\xf2\x50\x3a\xc3\xde\x79\xe7\x9d\xd3\x2c\x7d\x14\x4f\
+\xf0\x23\x0f\x7c\xf2\xc7\x51\xc8\xa9\x4c\xa2\xc4\x4f\x64\x20\x60\
+\x56\x53\xf9\x34\xd2\x48\x11\xc5\x91\xa9\x74\x9e\xe1\x3b\xee\x34\
+\x28\x1d\x88\xf0\xcc\x4c\x43\x45\xfc\xa0\x29\x13\x48\xfe\x98\x9a\
+\x6c\x7e\xd1\x39\xad\x31\x8d\x84\x67\xa0\xcf\x13\x09\x4b\xc3\x5f\
+\x13\x91\x8d\x4e\x87\x1f\xe9\x61\xda\xe2\x16\xc4\xb7\x70\xf9\x28\
+\xd8\xc6\x1f\xe9\x60\x1d\xa1\x24\x03\x79\x42\x7f\x93\x07\x37\x94\
+\xc7\xa3\x22\x65\x23\xfc\x0f\x44\x37\x9c\x29\x13\x4b\xef\x67\x22\
+\xb3\x63\xa0\x78\xa1\x9b\x77\x18\xcf\x94\x89\xd5\x0b\x8a\x84\x3a\
+\xcb\xd4\x89\x93\x3e\x24\x2d\x66\x4f\xda\x84\x41\xb8\x34\xf4\x27\
+\x7c\xaf\x2a\x13\x91\xfa\x47\xe1\xfd\xbb\x68\xed\x82\xf5\x80\x22\
+\xc9\x6a\x9b\xf0\x37\x65\x61\x63\x96\x01\x4d\xf8\x2c\x65\x12\x92\
+\x4d\x55\xac\x60\x64\x63\x89\xcd\x52\x99\x7e\x16\x4d\x0b\x22\x17\
+\x75\xc7\xbe\x08\x72\xa1\xd0\xd8\x98\xc5\x8f\xb4\x4c\x99\x58\xfb\
+\xb1\xa4\x8b\x6d\x9f\x28\xbd\x8e\x71\xcc\x05\x06\x7a\x47\x47\x07\
+\x4b\x97\xd0\x65\x0f\x6e\xbb\xed\x36\x2c\x8b\x35\x52\x1a\xab\xa4\
+\x20\xce\x08\x9d\x53\x8f\x3f\xfe\x78\xb0\x7f\x12\x2e\x5f\x56\x3d\
+\xf1\xc4\x13\xac\xe3\x02\xac\x5c\xb9\xf2\xd3\xb2\x52\x58\x0e\xad\
+\x56\x7c\x2a\x21\x03\xd2\x6f\x6f\x6f\x47\x9b\xe7\x85\x4f\xfe\x38\
+\x0a\xae\x32\x89\xbd\x67\x82\x9f\xc8\x06\x15\x61\x69\xcc\x1f\x8a\
+\xc8\x6a\x0d\xed\x23\xfe\xcc\x08\xd6\x60\x98\xf6\xe6\x67\xca\x04\
+\x3f\x6e\x54\x32\xdb\xe7\xde\x39\xdf\x93\x16\x9b\x9a\x6f\x8a\xe4\
+\xcf\x46\xa6\xed\xc2\x93\x1e\x7e\xb6\x86\x7e\x5e\x44\xf9\x78\xe5\
+\xf3\xa4\x4d\xd9\x0e\x17\x59\x82\x10\x9f\x4e\x4c\xc7\x8b\x93\x87\
+\x38\x28\x14\x36\x0f\xe9\xac\x6c\x20\xba\x27\x12\xae\x32\x41\xa1\
+\x72\xca\x90\x33\x3d\x28\x98\x32\xa1\x4e\x88\xc3\xf2\x20\xae\x4d\
+\x28\x0f\x71\x16\x89\xd4\x2f\xcb\xc5\xe0\x04\x42\xec\x6d\x65\x82\
+\x3b\x1b\xa4\x66\x9d\xae\x10\x83\x81\xea\xe6\xe5\x32\xf4\x67\xcc\
+\x20\x33\x71\xa2\x96\x09\x7b\x59\x58\x9f\xf8\x55\x3b\x71\xba\xb4\
+\x71\x48\x64\x60\x59\x4b\x7d\x12\x87\xe5\xa1\xc9\x66\xca\x04\x77\
+\xea\x8d\xf7\x32\x57\x9e\x7c\x24\x83\x1e\xc1\xad\xb7\xde\x3a\xa8\
+\xb5\xb5\x35\x3d\x6b\xd6\xac\xea\xcd\x9b\x37\x63\x72\x07\x18\x3c\
+\x78\x30\xdf\xda\xf4\xe3\x7b\x9b\x11\x23\x46\xdc\x28\x65\x80\xf0\
+\xa9\xa7\x9f\x7e\xfa\x03\x29\x0b\x66\xdf\xf6\xb6\xb6\xb6\x79\x4b\
+\x97\x2e\x65\x36\x41\x59\xa4\x87\x0f\x1f\x3e\x91\x23\x6d\xb1\xdf\
+\x90\x21\x43\x82\x1a\x02\xab\x56\xad\xfa\xe4\xcc\x99\x33\xab\x15\
+\x6f\xd0\xf3\xcf\x3f\xcf\x2e\x77\xaf\x20\x3c\x6f\x87\x7c\xfd\x4c\
+\xa7\xa5\xd3\xd0\x10\x34\x94\xbb\x1f\x11\x25\xfe\x36\x40\x01\x9b\
+\x5e\x96\x96\x81\x36\xe1\x4b\xd9\x7a\x35\x90\x85\xeb\x82\xd0\x8f\
+\x13\x9a\x97\x44\x3a\x03\x56\xe0\x91\xc8\x26\x3f\x64\xc2\xef\xbf\
+\x44\xea\x8f\x81\x8c\xa2\x64\x4d\xee\xca\xc3\x46\x25\x47\xc3\x56\
+\x26\x03\xbf\x19\x84\x28\x07\xd2\x22\xee\xd6\x38\x79\x80\xfc\xe9\
+\xec\xcc\x68\xc4\x47\x99\x1d\x22\xb7\x4c\xfb\x85\xe0\x1d\xb9\x7e\
+\x9b\x2f\x3d\x07\xa4\xc7\x3e\x11\x9b\xc0\xae\x9c\x59\x50\x7a\xc8\
+\x4a\x9a\xec\xa7\x00\x66\x69\x4e\x26\xfa\x02\x90\x0d\x85\x8c\x92\
+\xa6\x0e\x6a\x24\x6f\x9b\xa7\x7e\x32\xc0\x5f\x0f\xca\xcc\x69\x91\
+\x1b\x8e\xe6\xa2\x1e\xf8\x9b\x40\xc1\x89\x9e\xb8\x5b\x4e\x6c\xc2\
+\xda\x3e\x5f\x2e\x32\x36\xa9\x23\xe2\x04\xca\x59\x8c\x82\x89\xe0\
+\x95\x30\xff\xc2\x41\x59\x8a\x61\x2e\xd4\xd5\xd5\x0d\x94\x35\x31\
+\x5f\x03\xbd\x0a\x25\x81\x52\x30\xc5\xc1\x53\x71\x5f\xe1\xc9\x12\
+\x45\xcb\x9e\xcb\xb0\x64\xf4\xce\x72\x68\x14\xee\xbc\x37\x36\x36\
+\x5e\x88\x7f\x18\xfe\x55\x9e\x16\x1f\x2a\xfd\x69\xa4\x2f\xe5\xb3\
+\xf0\xc5\x17\x5f\xc4\x64\x8c\x85\x2b\x77\x21\x14\x0a\xb2\x4c\x70\
+\x17\x19\xc0\x6c\x6c\xa1\xc9\xad\x13\x17\x4a\xc2\xd3\x50\x1c\x17\
+\x33\xd3\x91\x16\x96\x09\x6e\xf8\xb3\x69\x16\x3b\x6b\x43\x01\x39\
+\xf8\x28\xd1\xf2\x3f\x5d\xcc\x58\x1a\x02\xeb\x5d\x5b\x27\xe7\x92\
+\x91\x3c\x97\x8b\xee\x8c\x47\xba\x5f\x13\x4d\x4e\xf6\x7b\x72\xce\
+\xa0\x2e\x85\x6b\x45\xd2\x45\xb9\x1e\x1f\xba\x91\x9e\x6b\x99\xdc\
+\x84\x5b\x34\x6e\x94\x82\x59\x26\xbc\x30\xa0\x32\x9b\xb3\xb9\x28\
+\xa0\x8c\x59\xa2\x5a\x79\xd9\x20\xc6\x8d\xb4\x6c\x03\xb6\x37\x2c\
+\x13\x78\x99\x48\x78\xac\xac\x33\xdc\x3c\x72\x51\x20\x1e\x93\x2e\
+\x69\x99\x65\x42\x1e\xb8\xb3\x19\x4f\x7a\x94\x35\x57\xfb\xfa\x68\
+\x61\x51\xd0\x58\xac\x58\x33\xae\x65\xf2\x2f\x62\x41\x75\xe3\xb2\
+\xc7\x2c\x93\x93\x4f\x3e\xb9\xe9\x9a\x6b\xae\xf9\xb6\x96\x3a\x6f\
+\xcf\x9b\x37\xef\x56\xdc\xf4\x5c\x28\x25\xc0\x5f\x56\xeb\x94\x92\
+\x60\x06\xec\x94\x65\x31\x77\xc0\x80\x01\x37\x56\x56\x56\x7e\x03\
+\xe5\x7a\xe2\x89\x27\xfe\x44\xcf\x4e\xbd\x8f\xea\xd7\xaf\xdf\x94\
+\x39\x73\xe6\xb0\xee\x26\xfc\x49\x61\x3c\xd2\xe1\xec\x3c\xb5\x6c\
+\xd9\xb2\xdb\x15\xf6\xf5\xab\xaf\xbe\xfa\x5b\xa7\x9f\x7e\x3a\x9d\
+\xe2\x40\x05\xbd\x84\xce\xb0\x51\xf4\x69\xff\x62\xca\xc6\x52\x26\
+\xe8\x75\x02\x1d\xdd\x05\xf7\x5d\xe8\xc0\xcf\x8a\xbe\x7c\x00\x72\
+\xb0\xa1\x49\xbd\x0f\x55\xfd\xf2\x0e\x2c\x4d\x60\x6e\x85\xc0\xfa\
+\x14\xf1\xdd\x34\x5c\x34\xab\xf3\xe5\xf2\xcb\x85\x62\x64\x70\xc3\
+\x32\x70\x00\xf9\x31\x80\x40\xb4\x9e\xf2\xa1\xd8\xf0\x3d\x8d\x62\
+\xca\x5e\x0c\xb8\x9b\xc3\xc9\x4d\xb4\x2d\x70\x2b\x1a\x3d\xa6\x4c\
+\x18\xf4\xfc\xd9\xc5\x6b\xaf\xbd\xf6\x9f\xd7\xac\x59\xb3\xf3\xe6\
+\x9b\x6f\xfe\xac\x96\x3d\xbb\xb4\xec\x99\x37\x7d\xfa\xf4\x01\x28\
+\x06\xfa\xa9\x96\x3b\x87\xe9\x59\x52\x56\x56\x36\xc9\xfa\x93\x9e\
+\x69\xbd\xdf\x82\xbb\x5e\x07\x12\x8e\xf0\xf7\xdd\x77\x5f\x3f\xe2\
+\x2b\x9d\x96\x8a\x8a\x8a\xb3\x9f\x7c\xf2\xc9\xfa\xf1\xe3\xc7\xdf\
+\x2d\xe5\x12\x28\x99\x5e\x06\xc2\x73\x6c\x46\x43\x53\xf9\x98\x97\
+\xa3\x0a\x24\xb3\x3e\x26\x66\x85\xca\x4e\x67\x2f\x76\x60\x15\x04\
+\xd2\x16\xd9\xb4\xe4\xc8\x95\x19\x2d\x2a\x07\xcb\x1c\x66\x6b\xea\
+\x9d\xf5\x3c\xb3\x38\xb3\x1e\x7c\x57\x04\xc8\xc6\xc6\x72\x6c\x87\
+\x56\x9b\x99\x3f\xa7\x10\x94\x89\x65\x2b\xeb\xf9\x9e\x00\xe9\x71\
+\x1a\x75\x78\xd8\x47\xf2\x81\x1b\xba\x00\xd9\x51\xa8\xc8\x86\x22\
+\x79\x4f\x64\x16\x3e\x5a\xe9\xf8\x96\x60\x5d\xa0\x70\x9c\x8a\xd9\
+\x46\x79\x77\x41\x9d\xa2\xfc\x51\x4e\xec\x19\x15\x02\xda\x22\x58\
+\x8a\x7a\xc0\x1d\x22\xca\x40\xfd\xb0\x17\x77\x89\x48\xdf\x8a\xb6\
+\x73\x94\x9c\x00\xb1\x51\x7d\xb1\xaa\x80\x49\x26\x5a\x0f\x79\xeb\
+\xc5\x0b\xea\xb3\x18\xfa\xb0\x7d\xfb\xf6\xc9\xb2\x48\xe6\x61\x85\
+\x18\xa6\x4e\x9d\x9a\x6e\x6f\x6f\x7f\x50\x4b\x93\x2a\x59\x23\x99\
+\xfd\x0d\x96\x33\x5a\xaa\xfc\x6c\xf9\xf2\xe5\xc1\x1f\x93\x36\x48\
+\x01\x1d\x29\xf7\x9f\xcb\x3f\xd3\x69\x67\xcc\x98\xc1\xc7\x7e\x2c\
+\x6b\x1e\xbc\xfb\xee\xbb\xa9\xd4\x00\xe4\x23\x59\xe6\x34\x37\x37\
+\x73\xda\x90\x13\x51\xd9\xf3\x51\x28\x76\x03\x96\x3b\x01\x84\xa5\
+\x41\xd8\xcc\xa2\xc3\xe1\x9e\x93\x4e\xdc\x4c\xda\x02\xf1\xdc\x65\
+\x0e\xe9\x16\xba\xcc\xe1\xe6\x29\x71\x20\x83\x3e\xb3\xcc\x89\x52\
+\xc8\x92\x45\x24\x5f\x36\xbe\x51\x38\xc4\x67\xf0\x73\x13\x97\x01\
+\xc7\x7d\x1e\xcc\x6a\xdc\x51\x0c\xb8\xe7\xdb\x80\x25\x0e\x7b\x35\
+\x98\xca\xbf\x14\x33\x47\x9e\xa2\xbb\xcc\x99\xe0\x4b\x23\x4a\x81\
+\x41\x67\x1b\xb0\x28\xec\xaf\xf9\xc2\x19\x05\xca\x43\x1c\x8e\xa9\
+\x91\x9b\x81\xeb\x7e\x9e\x70\x8d\x48\x7b\x21\x03\xf7\x88\x62\x4d\
+\x79\xfc\x45\x96\x29\x56\xbf\xdd\xdd\x80\xe5\x12\x21\x1b\xd4\xe4\
+\xcf\xb2\x2d\x76\x83\x53\x20\x0e\x7f\xae\x31\xd7\x06\x2c\xf9\xd8\
+\xc9\xd5\x03\x4e\x1c\x2b\x6f\x94\x16\x2f\xe8\xa7\x4e\x3e\xbc\xbb\
+\xcb\x9c\xcc\x49\x5c\x31\x24\x91\x6e\x81\xc1\x3f\x64\xc8\x90\x8f\
+\x6a\xc0\xb7\xc9\x8a\x98\xc3\x40\xc7\x6a\x98\x34\x69\x52\x67\x79\
+\x79\xf9\x95\x52\x32\x6b\xea\xea\xea\x9a\x65\x5d\xdc\x25\xc5\xf0\
+\x15\xe2\xc8\xba\xb8\xf8\xac\xb3\xce\xfa\x9d\xc2\x0f\x6e\x69\x69\
+\x59\xad\xe7\x90\x61\xc3\x86\xbd\x2d\x77\x36\xcb\x3a\xa5\x24\xbe\
+\xac\xf0\x53\xd7\xae\x5d\x4b\xb2\xab\x49\x67\xe2\xc4\x89\xed\xec\
+\x9b\x90\xbe\xc2\x57\xc9\x3f\xd5\xbf\x7f\xff\x43\x5d\xe5\xd3\x03\
+\xa0\x51\x0c\xac\x25\x33\x69\x3b\x33\xaf\x81\x77\x66\x75\x1a\x93\
+\xdf\x28\x93\xb3\x45\x1a\xac\x0b\xc2\x30\x27\x29\x19\x36\xc9\x3e\
+\x1e\xba\xed\x57\x04\x82\x64\x83\x81\x85\x02\xa1\x63\xf3\x9b\x8e\
+\x48\xb9\xf1\x63\xa3\x98\x9b\xaa\xb8\x73\xb5\x9f\x8b\x51\xde\x0f\
+\xc6\x42\x37\x94\x12\xcb\x51\xae\x00\x90\x0e\xfb\x41\x4d\x24\xa4\
+\x67\x77\x41\xfa\xec\x91\xdd\xa6\xac\xb0\x2a\xba\xc8\x10\x02\x77\
+\x66\x5d\xae\x8d\x33\xc8\x97\x29\xfb\x0d\xa1\x0c\xf8\xd1\x5e\x94\
+\x97\x7e\xcf\x52\xfc\x8b\x4a\xca\x3b\x06\x42\x77\xfa\x23\x97\xb5\
+\x40\xae\x3c\x0b\x05\x32\x70\x01\x91\x93\x35\xea\x87\xc1\xfb\x23\
+\xe5\xe3\x3d\x48\x08\xf3\xe7\x68\x98\xab\xf4\x76\xdc\x9b\x81\xfc\
+\x79\xe7\xc2\x22\x1b\xf0\xfc\x1e\x2d\x27\xac\x5d\x6f\xff\x03\xf2\
+\xe3\x2f\x09\x72\xc3\xf8\x98\xf0\xbd\x67\x41\x9a\xc5\xd0\x07\x29\
+\x8f\xf4\x82\x05\x0b\xca\xa4\x38\x16\x30\xd8\xf5\x7c\xa8\xa6\xa6\
+\xc6\xfe\x8c\x5d\xaa\xa9\xa9\xe9\x68\x29\x92\xd9\xe2\x9c\x86\x86\
+\x86\x2b\x51\x36\x28\x01\x29\x84\xb5\xb2\x46\x38\x02\xae\xe3\x1d\
+\x77\x59\x39\xdf\x24\x1c\xe1\xa5\x68\xb8\xc7\x11\xa0\xb2\xb2\x92\
+\xcf\xcf\x6b\xc2\xf4\x6b\x9e\x79\xe6\x99\xfe\xe4\x1b\x7a\x7b\x11\
+\x95\x3d\x1f\x05\x06\x3a\x83\x87\x8e\xc8\xe6\x2a\x65\x20\x0f\x1a\
+\x96\xbf\xaa\x75\xbd\x27\x0e\x7f\x69\x0b\x25\xc4\xec\xc9\xac\xcc\
+\x89\x0d\x33\xbb\x6b\x85\x30\x9b\xd1\x29\xb9\xb6\x4e\xda\x55\x62\
+\x30\x83\x84\x61\x48\x7f\x9f\x5b\x26\x51\x12\x56\xc4\x84\xe7\xce\
+\x01\xf1\x19\x68\x98\xf5\xb8\x93\x36\x47\xbb\x1c\x39\x23\x17\xc7\
+\x85\xd4\x09\xdf\x70\xb8\xb3\x1a\xe1\x48\x03\xe5\xc1\xac\x46\x58\
+\xae\xd5\x67\xae\x6c\xf3\x14\xbb\x63\x99\xd0\x26\xd6\x2e\x1c\x9b\
+\x9f\x1b\x09\x47\xfa\x28\x1b\x14\x04\x65\x40\x06\xee\x5d\x70\xaf\
+\x27\x6b\x86\x15\x18\x4c\xd6\x5e\x1c\xd3\xb2\xd4\x73\xdb\x82\xb4\
+\x18\xbc\x1c\xdb\x93\x37\x79\x5a\xfe\x3d\x71\x69\x8d\xfa\x43\xa9\
+\x90\x3f\xd6\xd6\x6c\x31\x7a\xbd\x9d\x70\x9c\x14\x52\xf7\xd4\x17\
+\x79\x10\x3e\x6a\x99\xd0\x4e\x2c\x61\x91\x0d\x7f\xca\xfe\x43\x4b\
+\xc7\xd2\x0a\x9f\x17\x8b\xdc\xb4\x25\x2d\xda\xe7\x20\x27\x0c\xe9\
+\x74\xdb\x32\xf1\x3a\xc6\x31\x0a\x29\x81\xf0\xd7\x9e\x7d\x93\x47\
+\x1f\x7d\x74\xa0\x94\x47\x95\x94\xc1\x5c\x3d\xaf\xc5\x1f\x4a\x49\
+\x9c\x20\xe5\x30\x67\xdd\xba\x75\xac\xcd\x03\x68\xe9\x72\x90\xdc\
+\xd6\x6a\x49\x44\x03\x05\xa8\xad\xad\x1d\x4a\xb8\xfa\xfa\xfa\x61\
+\xc4\x23\xcd\x5d\xbb\x76\xa1\x60\xe6\xca\x62\xa9\x5a\xbc\x78\xf1\
+\x40\xdc\x0c\x6e\xfe\x51\xf8\xe4\x8f\xa3\x40\xa3\x72\x5b\x94\x86\
+\xa1\x52\xff\x43\xe4\x5b\x9a\x27\x45\xeb\xcc\xcc\x7c\x6e\xe7\x80\
+\xae\x29\x4c\x38\x66\x0b\x76\xc4\x39\x95\x61\x29\xc6\x2d\x52\xeb\
+\x10\x90\xd3\x8c\xcc\xa0\xe7\xb7\xc8\x75\x7a\xfc\x08\xd7\x23\xca\
+\x44\xe0\x83\x41\x4e\x57\xf8\xa0\xce\xc8\x15\x74\xfb\xcd\x8d\x51\
+\x4e\x2a\xac\x6c\x55\x9e\xf4\xb9\xe7\x80\x12\x34\xd9\xd8\x77\xe0\
+\xb2\x1c\xf9\xfe\x93\xc8\xd2\x90\xd3\x09\xfc\x08\xc3\xed\xd7\xe0\
+\xaf\x8e\x45\xd2\xe9\x8e\x32\x21\x6d\x06\x26\xe4\x37\x69\xf0\xb1\
+\x1f\x97\xbe\x18\xd0\x58\x50\x5c\xe3\x37\x19\xc8\x87\x72\x67\x0d\
+\x08\xde\x45\x06\xfb\x74\x91\x70\x90\xb2\x63\x99\xf1\x11\x23\x6d\
+\x4d\xbb\xd9\x77\x48\x10\x25\xca\x32\x83\xdf\x85\x2a\x13\x4e\xd1\
+\xba\x28\x13\x47\x0e\x26\x0e\xfb\x24\x82\xf8\xfc\x46\xa9\xf0\x09\
+\x06\xdf\x78\xf1\x5d\x8c\x7d\xe7\x45\x18\xbb\xe8\x98\xa5\x4c\x9c\
+\xf4\x58\xbe\xd9\x92\x14\x72\x82\x77\xb7\x48\x1b\xa3\x60\xb9\xd8\
+\x66\x0a\x94\xb2\x2c\x88\xc4\xef\x1b\xca\xa4\xb1\xb1\x71\x80\xc8\
+\x66\x4e\x16\xda\xdb\xdb\x67\x6a\x79\x33\x5c\x4a\x61\x28\xd6\x04\
+\x98\x3f\x7f\x3e\x26\x74\x4a\x16\xc9\x08\x29\x87\x2f\x99\x52\x08\
+\x15\xc6\xf9\x8a\x43\x81\x52\xb2\x6a\xb8\xdf\x10\xec\x8d\xbc\xfb\
+\xee\xbb\xc7\x6d\xde\xbc\xf9\x0c\x2d\x77\xa8\xec\x20\xac\x41\x16\
+\xca\x45\xca\x9b\x75\xb9\x17\x3e\xf9\xf3\x51\xe0\xbe\x06\xeb\x5a\
+\x1a\x85\x8a\xa5\xb3\xf1\xb4\x46\x3f\xce\x13\x87\x65\x00\x83\x94\
+\x25\x8f\x75\x00\x8b\x6b\x8d\x88\x3b\x4b\x07\x2c\x14\x36\xff\xdc\
+\xf8\x34\xa6\xfb\xa1\x1f\x03\xa1\x50\x65\xc2\xf2\xc3\xf2\xfc\x82\
+\x48\x5a\x90\x6b\xdb\x74\x72\xfc\x08\xec\xa3\xc5\xe3\xc9\xf1\x70\
+\xe6\x0a\x7c\x24\x1f\xd2\xe2\x92\x15\xe1\xa0\x0d\x2e\x48\xf9\x4c\
+\x19\x71\x3f\x86\x59\x39\xda\xd9\x91\x93\xb6\x45\x1e\xc2\x4f\x74\
+\xfd\x73\x51\x60\xe0\xf2\x81\x25\x2f\x28\x64\x6e\xe1\x92\x97\xb5\
+\x09\xb2\x47\xeb\x98\x4d\x71\x36\x22\x73\x0e\x06\x81\xf6\x42\x11\
+\x30\x93\x13\x87\xb8\x6e\x5b\x5b\x5a\xb4\x17\x7f\x8a\x62\xb5\x48\
+\x99\xb9\x43\x83\x05\x64\xca\x84\xc9\x82\xf0\xc1\x9e\x52\xe8\x66\
+\x96\x09\x7d\x05\x45\xe4\x53\x26\x58\xae\x28\x7a\xfb\x08\xd3\xca\
+\xc0\x93\xbc\xf9\x6d\x72\xf1\x5d\x0c\x37\x98\x71\xcb\xa5\x4c\xc8\
+\xf3\x1b\xa2\x29\x20\xe8\xa6\x67\x65\x83\x6c\xd4\xfa\x3e\x34\xe5\
+\x5a\x01\xca\x84\x72\xa2\xd0\xf6\xbf\x32\xd1\xb2\xa5\xbf\x2c\x86\
+\xab\x64\x4d\x8c\x9d\x34\x69\x52\x66\x69\xa3\x41\x1f\x2c\x5b\xa4\
+\x38\xa6\xc9\xaf\x5a\x0a\x02\x93\x39\x80\x96\x35\xf7\xcb\x6d\xee\
+\xeb\xaf\xbf\x4e\x27\x4d\x6d\xd8\xb0\xe1\x53\x58\x1e\xb8\x3b\x8a\
+\xe7\x10\xa5\xcb\x49\x4e\x25\xe9\xc8\x9d\x0e\x99\x9a\x3c\x79\x72\
+\xea\xb9\xe7\x9e\xe3\x83\xc1\xb1\x8a\x33\x6e\xc7\x8e\x1d\x3d\xaa\
+\x4c\xa0\xc0\x87\x73\x68\x73\x94\x0a\x33\x31\xcb\x17\x06\xdb\xe7\
+\x7c\xe1\x8d\x02\xf7\x1b\xfe\x4d\xa4\x93\x30\x33\xb1\x7b\xcf\xac\
+\xce\x11\xdc\x02\xf1\x33\x39\xe2\x51\x36\xfe\x96\x04\x9f\x8e\xb3\
+\x0e\xe6\x32\x5b\x56\x87\xf1\x51\x20\x1e\x1f\xe2\x61\xae\x63\x51\
+\x05\xdf\xe7\x84\xe4\xf4\x83\x8d\x55\x64\xa0\x0c\x3e\xe2\x87\xe9\
+\x8b\x75\xc1\xf2\xc6\xdb\x81\x70\x17\x6d\x00\xb2\xe6\x47\x46\x06\
+\x39\xdc\x28\xf2\x99\x3a\x0d\xe7\xdd\x50\x14\xe8\xac\x94\x0f\xb3\
+\x9d\x3a\x1d\xe9\x0b\xe7\xa3\xc0\xf7\x49\x2c\xc3\xa6\x84\xef\x0c\
+\x42\x96\x5b\xcc\xbe\x0c\x58\xca\x40\xfb\x60\x11\x61\xa1\xf0\xb7\
+\x3c\x0a\x1a\x08\x02\x13\x07\x5f\xe5\xba\xed\xc5\x93\xf6\xe2\x63\
+\xbb\xa0\xbd\x04\x4e\xb9\xa8\x2f\x2c\x21\xca\x12\xa4\x2f\xb0\x8c\
+\xa2\x3c\xf4\x0d\x2e\xa3\x59\xdd\xb3\x11\xcd\xc7\x74\xa4\x95\xf9\
+\x06\x2b\x4a\x81\xc9\x95\x7b\x42\x58\x87\xb4\x21\xf5\x49\x59\x69\
+\x13\x2c\xaf\xbf\x13\x51\xa8\x2c\x65\x58\x1a\x51\x7f\xb4\xb1\xb7\
+\x6f\x84\x7e\x28\x5c\xfa\x02\x75\x82\xcc\xd4\x11\x75\xc5\x35\x7e\
+\xef\xdd\x16\x81\x32\x71\x20\x82\xc2\x26\xde\xd9\xbe\x70\xf9\xe8\
+\x75\x8c\x63\x14\x66\x29\xf0\x57\xd4\x26\x4c\x98\x70\xb0\xac\x8b\
+\xf1\x52\x00\x5c\x72\x0a\x50\x55\x55\x55\x26\xab\xa2\x46\x03\x1f\
+\xed\x1a\x40\xcb\x9f\x13\xa5\x38\xaa\x4d\x71\xa0\x28\xf4\x3e\x4f\
+\xe1\x32\x4b\x20\x85\xbf\x8f\x78\x73\xe7\xce\x65\xfd\x1a\x40\x61\
+\x2e\x93\xdb\x78\x2d\x75\x3e\xf2\xd8\x63\x8f\x05\x56\x8e\x6b\xa9\
+\x44\xe1\x93\xbf\x10\x0a\x74\x08\xbe\x7b\x60\xf7\x9d\xa3\x4e\xe4\
+\x0a\x4e\x26\x7c\xe1\x5d\x0a\x34\x0c\x8d\xca\x29\x02\xd7\x9d\x79\
+\xf2\x5e\x88\xa5\xc1\x80\x0b\x66\xb8\x42\x29\x20\x2b\x72\x1e\xe9\
+\xf1\x63\x60\x21\xbf\x4b\xfe\x58\x93\xfd\x46\x3e\xd6\xf0\x05\x5d\
+\x9b\x16\x4c\xa9\x70\xb2\xc3\x0d\x59\xe2\x73\xab\xb3\xd0\xba\x41\
+\x61\xb1\x0f\x96\xb7\x2e\x8c\x02\x4b\x4f\x66\xfa\xfe\xe1\x3b\x32\
+\x30\xc0\xe8\xfc\x2c\x27\x28\x07\x69\xb2\x59\x59\x70\xba\x46\xc1\
+\xd7\x5e\x7c\xca\x40\x3e\xa6\x34\x90\x81\x7c\x06\x46\xe2\x62\x61\
+\x10\x9e\x0d\xf5\x68\xba\x28\x73\xe4\x8b\xfd\x53\x93\x02\xf9\x60\
+\x11\xd2\x86\xe4\x4f\x59\x69\x13\xfa\x9f\xe5\x8f\xe5\x11\xf4\xa3\
+\x68\xfc\x28\xc3\xb0\xd4\x05\x75\x82\xcc\xc8\x40\xbd\x53\x67\xb1\
+\x6d\x24\xb0\x79\xee\xfd\x9b\x3d\x85\xd0\xeb\x18\xc7\x7c\xa8\xad\
+\xad\x2d\x95\x42\x19\x2b\xcb\xe3\x92\xeb\xaf\xbf\xbe\x54\x83\xbd\
+\x04\x65\xb1\x65\xcb\x96\xd3\x67\xcc\x98\x51\x2a\x45\x73\x41\x79\
+\x79\x79\xfa\x8e\x3b\xee\x38\x88\x3f\x7c\xa4\x34\xab\xf4\xce\xff\
+\x1e\x2e\xc3\x5d\xca\xe2\x6c\x85\x2b\x53\xf8\x53\x88\x47\xfc\x1b\
+\x6f\xbc\x91\xbf\xc8\x76\xb1\x96\x35\xdf\x99\x3d\x7b\x36\x8d\x5f\
+\x10\xa2\xb2\x17\x4b\xc1\x1a\xb3\xa8\xca\x25\xbc\x1b\x17\x46\xc3\
+\xf8\x48\x1c\xe8\xf3\x8b\x63\xae\x78\x85\xa4\x25\x14\x5b\x36\xf2\
+\xca\x2a\x5f\x34\x4c\x2e\x12\xc7\xe2\x15\x43\x5f\x1c\x21\x5a\xc7\
+\x45\xa7\x6b\x0c\xe3\x07\xe5\x08\x7f\xfb\xf2\xf3\xa6\x8f\x7b\xae\
+\xf0\x3e\x77\x1f\xc3\xb0\x96\x7f\xe6\xb7\x27\x4c\x8f\xa5\xe7\x63\
+\x18\xb6\xa0\x3c\x7c\xf4\x3a\xc6\xb1\x10\x48\x01\x04\xd7\xe3\xd7\
+\xaf\x5f\x3f\x5c\xca\xa1\xfc\x96\x5b\x6e\x09\xde\xeb\xeb\xeb\xcf\
+\x91\x75\x31\x5b\xca\xe6\x8b\xbc\x6b\x89\xf2\x55\xbd\x57\xed\xdc\
+\xb9\xf3\xeb\xbc\x2b\xec\x19\xf8\xbf\xff\xfe\xfb\x17\xf0\x3e\x65\
+\xca\x14\x2c\x96\xf2\x4d\x9b\x36\x9d\xc2\xbb\x59\x32\x85\xc2\x27\
+\x7f\xc2\x84\x09\xf7\x0d\xbd\x8e\x71\x2c\x06\x2c\x41\x64\x61\x1c\
+\x25\xab\x62\x1c\xca\x40\x4c\xbf\xf7\xde\x7b\x17\xc8\x6a\xb9\x08\
+\xab\x83\x77\xa5\x39\x3f\x54\x14\xfc\xdf\x9c\x0b\xa5\x48\x46\xe1\
+\x8e\x9b\xc2\x95\xaf\x5b\xb7\x2e\xb3\x81\x5b\x2c\xa2\xb2\x27\x4c\
+\x98\x70\xdf\xd1\xeb\x18\xc7\xee\x40\xca\xe1\x9b\x28\x09\x28\xa5\
+\x71\xea\x43\x0f\x3d\x84\x49\x99\x7a\xe0\x81\x07\x4a\x64\x9d\x7c\
+\xde\xfc\xa4\x7c\xd8\x41\xef\x36\x7c\xf2\x27\x4c\x98\x70\xdf\x30\
+\x18\xcc\xfb\x03\x58\x17\x5a\xd6\xac\xad\xac\xac\xbc\x92\x8c\xcb\
+\xca\xca\x8e\xb9\xf4\xd2\x4b\xf9\x9e\x25\x35\x7a\xf4\xe8\x2b\xd2\
+\xe9\x74\xf0\x17\xd2\xa7\x4f\x9f\xfe\xdd\xc6\xc6\x46\xfe\xe3\x5f\
+\x10\x2f\x41\x82\x04\x07\x06\xf6\x9b\x32\xe1\x23\xc0\x29\x53\xa6\
+\xac\xee\xdf\xbf\xff\x4f\xb9\x09\x3c\x61\xc2\x84\xc7\xb5\xac\x79\
+\x5f\x96\x48\x49\x43\x43\xc3\xb6\x1b\x6e\xb8\xe1\xd1\x3d\x37\x84\
+\x53\x4b\x2a\x2a\x2a\x5e\x21\x7c\x82\x04\x09\x0e\x1c\xec\x37\x65\
+\x02\xaa\xaa\xaa\xf8\x6a\xb8\xbe\xba\xba\x3a\xf8\xe7\xe4\x75\x75\
+\x75\xfc\x05\xf6\xce\xad\x5b\xb7\x72\xbf\x22\x85\xfb\x80\x01\x03\
+\x7e\x4f\xb8\x04\x09\x12\x1c\x48\x48\xa5\xfe\x00\xc4\xe2\x5d\x7c\
+\xcf\xb9\xd1\x11\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x55\xdb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\xc2\x00\x00\x00\x96\x08\x06\x00\x00\x00\x4d\x70\x88\x10\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc2\x00\x00\x0e\xc2\x01\x15\x28\
+\x4a\x80\x00\x00\x55\x70\x49\x44\x41\x54\x78\x5e\xed\x9d\x07\x98\
+\x5d\x49\x75\xe7\xd5\xe1\x75\xce\x52\xb7\x5a\x6a\x85\x96\xd4\x8a\
+\xa3\xd0\xca\x59\x9a\x61\x06\x18\x26\x10\xd6\x18\x93\x8c\xc1\xc0\
+\x1a\x30\xc6\x04\x13\x8c\xb1\x01\x7b\x6d\x8c\x6d\xb0\x61\x8d\x17\
+\x63\x76\xbd\x60\x1b\xe3\xb5\x89\xbb\x80\x03\x26\x68\x94\x46\xa3\
+\xd1\x8c\xa4\x91\x46\xa3\x51\xce\x69\x3a\xe7\xb8\xff\xdf\xd5\x3b\
+\xfd\xdd\xb9\xf3\xde\xeb\xa0\x96\xd4\xad\x39\xff\xef\xab\xee\xfb\
+\xea\x56\x9d\x3a\x55\xb7\x6e\xfd\xeb\x54\xba\x13\x1c\x0e\x87\xc3\
+\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\
+\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\
+\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\
+\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\
+\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\
+\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\
+\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\
+\x31\x56\x91\x16\x77\x0e\x87\xc3\xe1\x70\xbc\xe8\x10\x26\x40\x27\
+\x43\x87\xc3\xe1\x70\xbc\xa8\x90\xc1\x9f\x29\x53\xa6\x3c\x5c\x59\
+\x59\xf9\x70\xe0\x13\xf7\x73\x38\x1c\x0e\x87\xe3\x4e\x87\x11\xde\
+\xda\xcd\x9b\x37\x37\x6d\xd9\xb2\xa5\x49\xd7\x6b\xae\x7b\x39\x19\
+\x3a\x1c\x0e\xc7\x8b\x15\x2f\x96\xa1\xc1\x74\xb9\x3e\xb9\x85\xab\
+\x56\xad\xfa\x71\x4f\x4f\xcf\x54\x3c\x33\x33\x33\xcf\xef\xdd\xbb\
+\xf7\x3e\x5d\x1e\x91\xb3\x30\x0e\x87\xc3\xe1\x78\x11\x81\xc6\xff\
+\x4e\x87\x11\xdc\x8c\xf5\xeb\xd7\x7f\xb7\xbf\xbf\x7f\x6a\x7a\x7a\
+\x7a\x1f\x4e\xd7\x55\xf2\xfb\x8e\xee\x4d\x8b\x87\x79\x31\x94\x87\
+\xc3\xe1\x70\x38\x42\xb8\xd3\x1b\x7e\x2c\x5e\x08\x6e\xe2\x86\x0d\
+\x1b\xbe\xdb\xd9\xd9\x39\xaf\xaf\xaf\xaf\x57\xbf\xc9\x77\x3a\xd7\
+\xf2\x5b\x20\x32\xfc\xb6\x7e\x97\xc4\xc3\xfa\x02\x1a\x87\xc3\xe1\
+\x78\x11\xe1\x4e\x26\x42\x08\xad\x5f\x2e\x4b\x24\xf8\x0f\x1d\x1d\
+\x1d\xcb\x65\x01\xf6\xa4\xa5\xa5\x0d\xcc\x07\x72\x8d\x9f\xc8\x70\
+\x35\x61\xe4\x95\x25\x47\x1c\x27\x43\x87\xc3\xe1\x78\x91\xe0\x8e\
+\x5f\x24\x52\x5b\x5b\xfb\x77\x22\xbb\x57\xcb\xfa\x83\x04\x33\xe3\
+\xde\x03\x90\x5f\x3a\x64\xa8\xfb\xf3\xa7\x4d\x9b\x36\xe7\xc2\x85\
+\x0b\x58\x87\x0e\x87\xc3\xe1\x78\x91\xe0\x4e\x25\xc2\xc0\xa2\xab\
+\xa8\xa8\xf8\x62\x59\x59\xd9\xdb\x7b\x7b\x7b\x13\x92\xa0\xc1\xc8\
+\x50\x97\xcb\x7a\x7a\x7a\x26\xb5\xb5\xb5\xfd\x08\xef\xe0\xa6\xc3\
+\xe1\x70\x38\xee\x68\xdc\xd1\x73\x84\x55\x55\x55\xe5\x22\xc1\x09\
+\xb2\xf6\x06\x5d\x0d\x6a\x61\x14\xa7\x22\xf0\xb8\x3e\x44\xea\x70\
+\x38\x1c\x8e\x3b\x1c\x77\xb4\x45\x78\xe9\xd2\xa5\xef\xc9\x22\x5c\
+\x9a\x93\x93\x73\x97\x08\xb1\x9b\x39\xc1\xe0\x6e\x04\xe2\xc0\x6e\
+\x85\xc9\x92\x25\xf8\x83\x83\x07\x0f\xbe\x5e\x5e\x2c\xa8\x71\x8b\
+\xd0\xe1\x70\x38\x5e\x04\xb8\x93\x1b\x7b\xf2\x86\x55\x97\xbf\x60\
+\xc1\x82\xef\xe7\xe7\xe7\xbf\x04\xc2\x13\x19\xc6\x82\xbb\x71\xf4\
+\xf7\xf7\x07\x7e\x2d\x2d\x2d\xdb\x8f\x1e\x3d\xfa\x80\xbc\x9a\xe5\
+\x2c\xae\xc3\xe1\x70\x38\xee\x70\xdc\xc9\x43\xa3\x10\x19\xf9\x6b\
+\x3d\x72\xe4\xc8\x2f\x89\xec\x1e\x17\xe9\x41\x82\xcc\x05\x1a\x7a\
+\x84\x58\x41\x41\xc1\x53\x22\xc1\x5f\xd4\x6f\x48\x90\x38\x4e\x82\
+\x0e\x87\xc3\xf1\x22\xc1\x9d\x42\x84\x2c\x84\x49\xb4\x18\x86\x79\
+\x3f\x86\x43\xaf\xed\xdd\xbb\xf7\x17\x0a\x0b\x0b\x9f\x15\xf1\x11\
+\x8e\xa1\xcf\x5e\xae\x8b\x8b\x8b\x4f\x6f\xdb\xb6\xed\xd5\xfa\x7d\
+\x29\x1e\x36\xd1\x7c\x22\x71\x20\x51\x1f\x2e\x75\x38\x1c\x8e\x3b\
+\x0c\x77\x42\xc3\x0e\x99\x1b\x79\x41\x64\x90\x5c\x14\xe6\xbf\x68\
+\xf3\xe6\xcd\xff\xd9\xd4\xd4\x54\x89\x67\x51\x51\xd1\xb5\x47\x1e\
+\x79\x84\x23\xd6\xf6\xcb\x0d\x16\x17\xf8\x90\xa9\xc3\xe1\x70\x38\
+\xc6\x14\x02\x2b\x70\xda\xb4\x69\x1f\x9f\x3b\x77\xee\x3b\x03\x9f\
+\xeb\x96\x5b\x22\x40\x68\x60\xe3\xa6\x4d\x9b\x5a\x44\x88\xed\xba\
+\xde\x7a\xdd\x6b\xe0\x5e\x14\x26\xeb\xa5\x0b\x16\x2c\xf8\x8b\xf8\
+\xf5\x9d\x3c\x9c\xec\x70\x38\x1c\x8e\x71\x84\x80\x04\x4b\x4b\x4b\
+\x5f\xbd\x71\xe3\xc6\xfe\x0d\x1b\x36\xf4\xcc\x98\x31\x83\x15\x9f\
+\x60\x30\x32\x64\x3e\xf0\x97\xae\x5f\x0e\x4a\x82\x12\xbf\xf1\xaa\
+\xe4\xf7\x57\x56\x56\xfe\x56\xdc\x2f\xd1\x30\xac\xc3\xe1\x70\x38\
+\xc6\x21\x92\x91\xc0\x58\x07\x7a\x33\x5c\xb9\x64\xf9\xf2\xe5\xdf\
+\x69\x6b\x6b\xcb\xed\xea\xea\xea\x2f\x2f\x2f\x7f\x4d\x7f\x7f\xff\
+\xd1\xa6\xa6\xa6\x03\xba\x07\x91\x45\xe7\xfb\x6c\x01\xcd\xa1\xb8\
+\x0b\x0f\xab\x86\x41\xdc\x6e\xb9\x2d\xb2\x1e\xbf\x2f\xf9\x13\x3b\
+\x3b\x3b\x7b\xaa\xaa\xaa\xee\x3f\x7b\xf6\xec\x63\x4a\xe3\x19\xdd\
+\x83\x0c\x13\xc5\x75\x38\x1c\x0e\xc7\x38\xc2\x78\x24\x42\x23\xaf\
+\x72\x48\xaa\xbd\xbd\x7d\x66\x7a\x7a\x7a\xaf\x5c\xba\xc8\x2a\xbd\
+\xa2\xa2\xe2\x17\x62\xb1\xd8\xb3\xf5\xf5\xf5\xcc\xfb\xa5\x22\x43\
+\xe6\xfb\x12\x11\x19\x04\xc7\xca\xd2\x7b\x37\x6f\xde\xfc\xfd\xd6\
+\xd6\xd6\x62\x5d\xf7\x65\x64\x64\xa4\x75\x74\x74\xa4\x55\x57\x57\
+\xbf\xec\xdc\xb9\x73\x3f\x90\xdf\x65\x39\xca\xcf\xe7\x0c\x1d\x0e\
+\x87\x63\x1c\x63\xbc\x11\x21\xe4\x15\x2c\x58\x59\xbd\x7a\xf5\x37\
+\xbb\xbb\xbb\x37\x73\x34\x5a\xda\xf5\xe3\xd3\xd2\xc4\x85\xfd\x22\
+\xc3\xb4\xb2\xb2\xb2\xd7\xe8\xfa\x48\x63\x63\xe3\x41\xf9\x27\x23\
+\xc3\x44\x04\x66\x24\x78\xb7\x48\xf0\x7b\x2d\x2d\x2d\x85\xba\xee\
+\x93\x7c\x23\xce\x5e\xa1\x60\xce\x9c\x39\x1b\xce\x9c\x39\xf3\x7f\
+\xf4\xbb\x2d\xee\xef\x70\x38\x1c\x8e\x71\x0a\x1a\xf8\xf1\x84\xc0\
+\x8a\x9b\x3c\x79\xf2\xa7\xf4\xff\x61\x58\x29\x4e\x82\x86\x74\x59\
+\x6e\xfd\xb2\xe2\x32\xaa\xaa\xaa\xfe\x56\xbf\x1f\x94\x63\x88\x73\
+\x28\xf9\x24\x0c\x24\xb8\x76\xc3\x86\x0d\xff\xa7\xb9\xb9\xb9\x50\
+\xb2\x91\x3f\x10\x57\xd7\xc1\xd7\x2a\xda\xda\xda\x96\xaf\x58\xb1\
+\xe2\x2f\xe3\xde\x0e\x87\xc3\xe1\x18\xc7\x18\x4f\x16\x21\x84\xd4\
+\x27\x6b\xef\x97\xe7\xce\x9d\xfb\x05\xe6\xec\x64\xf5\xa1\x7f\xd4\
+\x22\xc3\x32\xec\xeb\xea\xea\xca\x9a\x39\x73\xe6\x03\xe7\xcf\x9f\
+\xdf\x27\xbf\xe3\x72\xc4\x4f\x36\x8c\x19\xc8\x96\x5b\xb5\x71\xe3\
+\x46\xe6\x1c\x2b\x25\x83\x39\xc8\x17\x94\x0f\xc4\x08\x19\xea\xfe\
+\x32\xa5\x91\xd9\xde\xde\xfe\x13\x79\xa7\x92\xed\x70\x38\x1c\x8e\
+\x31\x8c\x01\x6b\x67\xbc\xa0\xb8\xb8\x38\x87\xff\x22\xa3\x60\x88\
+\x94\xeb\x04\x48\x17\x61\xf1\x9d\xc1\x92\xad\x5b\xb7\xfe\x89\x7e\
+\xf3\x9d\x41\x88\x2e\xd9\x30\x66\x30\x74\xba\x7e\xfd\xfa\xcf\xca\
+\x9a\xac\x52\xdc\x2e\xfd\x4c\xd6\x49\xe8\xe7\x7c\xee\xac\xac\xac\
+\x09\x85\x85\x85\xd9\xe6\x17\xff\xef\x70\x38\x1c\x8e\x71\x86\xf1\
+\x64\x11\x42\x36\xe9\x0d\x0d\x0d\x8f\xe7\xe4\xe4\x9c\x2d\x2a\x2a\
+\x7a\x95\x2c\xb2\x09\xb2\xcc\xf0\x8f\x12\x1c\x64\x95\x91\x97\x97\
+\xd7\xbe\x7d\xfb\xf6\xb7\xe9\xf7\x31\xb9\xc1\x2c\xc2\xfe\x73\xe7\
+\xce\x3d\x5d\x53\x53\xf3\x0b\x92\x5b\x20\x32\x4c\x44\x9c\x7d\xbd\
+\xbd\xbd\x7d\xb9\xb9\xb9\x99\x57\xaf\x5e\xfd\xf4\xc9\x93\x27\x7f\
+\x47\x7e\xa9\x08\xd9\xe1\x70\x38\x1c\x63\x1c\xe3\x89\x08\x01\x84\
+\x93\x59\x57\x57\xf7\xb8\x2c\xb2\x53\x15\x15\x15\xaf\x6c\x6f\x6f\
+\x0f\x16\xc9\xc8\xdf\x48\xab\xbf\xa7\xa7\xa7\x4f\x44\x99\xbe\x73\
+\xe7\xce\x77\xe9\x37\x1f\xda\xb5\xa1\xcf\x64\x20\x3e\x61\xce\x9f\
+\x39\x73\xe6\xc4\xac\x59\xb3\x5e\x27\x32\xec\x93\x5c\x64\x9a\x5c\
+\x48\xb0\x5f\xe4\x0a\x09\x7e\xfc\xf8\xf1\xe3\xff\x4d\x7e\x94\x5f\
+\x2a\xb9\x0e\x87\xc3\xe1\x18\xe3\x18\x6f\x44\x08\x20\x9e\x98\x2c\
+\xc3\x7d\x22\xa4\x63\x33\x67\xce\x7c\x65\x67\x67\x67\x06\x16\x1c\
+\xf3\x77\xb2\x04\x7b\xe3\x16\xdb\x1f\x88\x30\x3f\xaf\xb0\x2c\xa6\
+\x89\x1e\x9d\x06\xb9\x45\x2d\xc4\x80\x64\xe5\x9e\x12\xc9\xb6\x97\
+\x94\x94\xbc\xac\xbb\xbb\xdb\x16\xcb\x40\x82\x13\x24\x37\xe3\xd2\
+\xa5\x4b\x1f\x90\x25\xf8\x67\xf1\xb0\x4e\x82\x0e\x87\xc3\x31\xce\
+\x31\x1e\x89\x10\x04\x64\x28\xcb\x6f\xff\xd9\xb3\x67\x8f\xcd\x9e\
+\x3d\xfb\x95\x22\xad\xcc\xfe\xfe\xfe\xee\x8c\x8c\x8c\x58\x7d\x7d\
+\xfd\x3f\x1e\x3b\x76\xec\xbd\x0a\x43\xfe\xa2\x24\x08\xb1\x99\x95\
+\xc7\xff\x30\x19\x22\x37\x43\xf1\xb7\xe7\xe4\xe4\x54\x89\xf8\x56\
+\x23\x53\xe4\x9a\xae\xeb\x74\x91\xe0\x6f\x9c\x3a\x75\xea\x8b\x0a\
+\x63\xdb\x2c\x1c\x0e\x87\xc3\x31\xce\x01\x29\x8c\x55\x40\x62\xa9\
+\xf4\x63\x5b\x04\x84\xf4\xcd\x5d\xbb\x76\xbd\x25\x3f\x3f\x9f\xb3\
+\x43\xb3\x32\x33\x33\x1f\x13\x09\xbe\x9b\x00\x42\xd4\x62\x0b\xac\
+\x3b\xb9\xb2\xb8\xe3\x3a\x9a\x06\x7e\x69\x92\xf1\x9b\xb1\x58\xec\
+\x27\xb2\x04\x63\x22\xc1\x34\x59\x98\xbf\x2e\x12\x64\xcb\xc4\x60\
+\x24\x88\xbc\xf1\xda\xc1\x70\x38\x1c\x0e\xc7\x18\x41\x98\x9c\x52\
+\x91\x21\x80\x98\xc0\xeb\xb7\x6c\xd9\xf2\xac\xfe\x2f\xb8\xfe\xf3\
+\x05\x64\x64\xf3\x7d\x19\x35\x35\x35\xff\xbe\x6c\xd9\xb2\x9f\xea\
+\xda\xce\x13\x8d\xa6\x61\xbf\xab\x24\xf3\xd0\xac\x59\xb3\xde\x17\
+\xff\x6d\x69\x25\xc3\x70\xf4\x76\x38\x1c\x0e\x87\x23\x21\x02\x02\
+\x29\x29\x29\x79\xbb\xfe\x6d\xe1\x5a\x80\x80\x6c\x38\x33\x11\x88\
+\x43\x98\x12\x39\xc2\x45\x49\x28\x20\x40\x2e\xe6\xcc\x99\xf3\x95\
+\xb5\x6b\xd7\x72\x32\x4d\xff\xec\xd9\xb3\xbf\x8e\x9f\x40\xf8\xa8\
+\x7c\x93\x81\x4c\x08\x33\x2a\x33\x0c\xe2\x1a\x49\x6e\x91\xee\xef\
+\x88\x5f\xa7\xd2\xd9\xe1\x70\x38\x1c\x63\x00\x63\x6d\x08\x0f\x7d\
+\x18\x9a\xdc\x22\xb2\xfa\xc3\x8a\x8a\x8a\x7b\xba\xba\xba\x2e\xb4\
+\xb5\xb5\x71\xc8\x75\x2a\x5d\x6d\xd5\x68\x47\xf0\xeb\xf9\xf3\x7e\
+\x00\x92\xea\x15\xf1\x7d\x6a\xf2\xe4\xc9\x1f\x6c\x6f\x6f\xef\xe9\
+\x13\x44\x58\xcb\xb3\xb2\xb2\x8a\xeb\xeb\xeb\xff\x35\x1e\x26\x3c\
+\x94\x8a\x0c\xc8\xaf\x33\x7e\x1d\xbe\x17\x06\xe9\xe2\x7a\x27\x4d\
+\x9a\xf4\xe0\x5d\x77\xdd\xf5\x47\xd3\xa7\x4f\xdf\x72\xfa\xf4\x69\
+\x8e\x77\x3b\x2d\x87\xde\x51\x7d\x1c\x0e\x87\xc3\x31\x46\x30\x96\
+\x88\x10\x32\x81\x6c\xa6\xac\x5b\xb7\xee\xcf\x9b\x9b\x9b\x73\xd8\
+\xae\x30\x75\xea\xd4\xfb\x73\x72\x72\x7a\xeb\xea\xea\xf6\xea\x9e\
+\x59\x6e\x89\x88\x05\xbf\x44\xf7\x20\xb8\x9e\x99\x33\x67\xbe\x67\
+\xca\x94\x29\x7f\x22\x52\xed\xcd\xc8\xc8\xc8\x64\x35\xa8\x48\xb6\
+\x47\x64\xb8\x31\x16\x8b\xb5\x35\x34\x34\x6c\x8f\x87\x8d\x92\x61\
+\xf8\x7f\x14\xa6\x4f\x5f\x4d\x4d\xcd\xbb\x94\xc6\xc7\x45\xb2\xbd\
+\x72\xfd\xd5\xd5\xd5\x2b\xce\x9f\x3f\xff\x63\xdd\x6b\x8e\x87\x71\
+\x38\x1c\x89\xc1\x7c\x7d\x91\x5c\x6b\xf0\xcb\xc1\x08\x54\x95\x1c\
+\x1d\xfb\xe8\x62\xbf\x9b\x05\xda\x3e\xd2\xa4\xe3\x7f\xab\xd2\x1c\
+\x33\x48\x35\xdc\x77\x5b\xb0\x72\xe5\xca\x8f\x75\x77\x77\x4f\xcb\
+\xcc\xcc\xec\x92\x9b\x20\x42\x6c\x2f\x2b\x2b\xfb\xc0\xfc\xf9\xf3\
+\x3f\xad\xdb\x76\x42\x4c\x32\xbd\xa3\x84\x45\x38\x16\xb6\xbc\x56\
+\x84\xfa\x45\x91\x60\xbf\x48\x70\x20\xae\xae\x33\x20\xc6\xaa\xaa\
+\x2a\x4e\x9f\x79\x93\x1c\x61\xa3\xb2\x53\x91\x20\xba\x64\x4b\xb7\
+\x3f\x9a\x38\x71\xe2\xfb\xd1\x55\x22\x27\xa0\x7b\x4f\x4f\xcf\x0c\
+\x59\xb5\x1f\x0d\x42\xde\x19\x80\xcc\x79\x59\x70\xc9\xca\xdf\xe1\
+\x18\x2a\xac\x0e\xbd\x5a\x8e\x2f\xc5\xf0\xe9\xb4\xb7\xe2\x21\xdc\
+\xa9\xf5\x8b\x7c\xd9\x3b\x14\xed\x1c\xdb\x6f\xa6\x62\xbe\x2b\x77\
+\x58\xee\x9b\x72\x74\x10\xc0\xcd\xe8\x4c\x9b\xcc\x7c\xb9\x7f\x92\
+\x23\xcd\xef\xc8\xd1\x31\x01\x37\x23\xcd\x31\x89\xb1\x62\x11\x52\
+\x41\xf8\xf0\xed\x1b\x4b\x4b\x4b\xdf\x26\x12\x69\x96\xc5\x86\x6e\
+\x6c\x96\x9f\x20\x62\x6c\x2f\x2c\x2c\x5c\x95\x9d\x9d\x5d\x53\x5f\
+\x5f\xbf\x53\xfe\xac\x10\x0d\xe2\xc8\x25\x03\xf7\x21\xaa\x7b\xd7\
+\xaf\x5f\xff\x0f\xb2\xd2\x72\x45\x52\x84\x0f\xbf\x64\xc8\x4f\xe3\
+\x8b\x15\xb2\xe6\x5e\x26\x0b\xee\x71\xf9\x0d\x76\x0a\x0d\x30\xd9\
+\x25\xb2\x04\xff\x44\x44\xfd\x40\x47\x47\x47\x83\x08\x10\x7f\x2a\
+\x0f\xfb\x19\x3b\x24\x7b\x91\xf2\xf2\x5c\x6b\x6b\xeb\x53\xf1\x38\
+\xa9\x64\x8e\x75\xa0\x3f\x3d\x45\xb3\x98\x5f\x34\x2f\x89\x63\xd4\
+\x41\xdd\xe1\x5d\xe0\x1d\xff\x86\xdc\x3c\x39\x1a\xe3\x55\x72\x7f\
+\x2d\xc7\x11\x87\x77\x5a\xfd\xb2\xfc\xf0\xfe\xe0\xf8\x1d\xce\xa3\
+\x4d\xa1\xb0\x36\xe2\x37\xf1\x10\x16\xcb\x71\x4e\xf2\x13\x72\x90\
+\xa7\xbd\x7b\xa3\x05\x4b\xf3\x0d\x72\x1f\xc7\x43\x60\xb1\xe1\x39\
+\xb9\x3d\x72\x76\xff\x8e\x07\x8d\xdb\xed\x86\x91\xca\x5d\x22\xa3\
+\x77\x43\x7a\x22\x90\xb0\x5e\x69\x22\xb0\x4c\x88\xa6\xb8\xb8\x98\
+\x6f\x04\xb2\x85\xa1\x52\xce\x2a\x53\x32\x04\xf7\x24\x93\x07\x5b\
+\xcc\x7e\x40\xfd\x4f\x94\xdf\x34\xee\x29\xc9\x82\x78\xd8\xc0\x2f\
+\xfe\x3f\x11\xb8\x47\xda\x93\xa5\xcb\x97\x8a\x8a\x8a\xee\x11\x91\
+\x36\xa0\x63\xfc\x5e\x00\xf2\x20\x12\x6c\xab\xae\xae\x7e\x8f\x7e\
+\xde\x25\x47\x9c\xb1\x50\xde\x23\x05\xd6\xf8\x07\xe4\xbe\x24\xb7\
+\x4c\x8e\x17\x24\x55\x39\x39\x1c\x83\x81\x3a\x55\x7a\xfd\x32\xa8\
+\x4f\x05\x72\xc1\x59\xc2\x77\x18\x78\x4f\xc8\xdf\x12\x39\xf6\x21\
+\x33\xba\x35\x29\xee\x67\xef\x90\xfd\x2f\x8f\xff\xb7\xe1\x49\x2c\
+\xc4\x9b\x8d\x8a\xf8\x7f\x23\xda\x89\xf1\xff\x2f\x1a\x8c\x99\x86\
+\xb9\xaa\xaa\x6a\xa5\x2c\xaa\xa9\xbd\xbd\xbd\x09\xf7\xe8\x89\x57\
+\xd8\x30\xdf\xd8\xd0\xd0\xb0\x5c\x04\xf4\x55\x79\xf1\xb0\x52\x35\
+\xc6\x54\xa4\xb4\xd3\xa7\x4f\x7f\xe9\xc2\x85\x0b\x7f\x90\x9f\x9f\
+\x1f\x4b\x24\x1b\x3f\xee\x29\xcc\x67\x14\x96\x4a\x8a\xbc\x64\x63\
+\xe4\x56\xa1\xcb\xb6\x6c\xd9\xf2\x55\xe9\x52\x8b\x4e\xe8\x16\xdc\
+\x8d\x40\xb2\x7b\x63\xb1\x58\xd5\xb4\x69\xd3\xe8\xe9\x8e\x77\xfc\
+\x8d\x1c\x27\xf5\x40\xec\x7c\x8b\x71\xb0\xf2\x77\x38\x06\x03\xf5\
+\x07\x07\xa8\x47\xf6\x7e\xdd\x49\xb0\x3c\x4d\x95\xfb\x91\xdc\x6f\
+\xc8\xfd\x9e\xdc\x3f\xc8\x81\x68\x7e\x8d\x8c\xac\x6d\xbe\x15\xe5\
+\x61\xed\x9d\xa5\x99\xac\xfd\xbb\x63\x31\x16\x88\x30\xb0\xec\xce\
+\x9f\x3f\xff\xf5\x13\x27\x4e\x7c\x5a\xa4\x94\x2f\xab\x10\xbd\xac\
+\x42\x0c\x20\x4d\x10\xb1\xf4\xeb\x3e\xa6\x7b\xd3\x75\xdf\x94\xa0\
+\x12\xa5\x8b\xe0\x7e\x4f\xf2\xbf\x24\xd1\x99\x7d\x7d\x7d\x03\x64\
+\xc8\x75\x4e\x4e\x4e\xe6\xb9\x73\xe7\xfe\x46\x61\x18\x1a\x20\xdd\
+\xa1\x54\xbc\xa6\xae\xae\xae\xb3\xe8\x82\x4e\x71\xbf\x30\x7a\xa5\
+\x63\x46\x41\x41\x41\xfe\xa9\x53\xa7\x3e\x29\xf9\x5f\x93\x1f\xe1\
+\x5e\x90\xa7\x71\x84\x37\xcb\xf1\x82\x30\x6c\x35\x57\xae\x46\x0e\
+\x8c\x85\x3a\xe4\x18\x9f\x30\xf2\x33\x24\x7a\x97\xc6\x3b\xec\xfd\
+\xd8\x20\x07\x19\xb2\x20\x88\x36\x68\xb5\x5c\xa2\x77\xe8\x76\x94\
+\x41\x34\xcd\x3b\xf1\x39\xa4\xc4\x58\x69\xc4\x20\x9f\xb4\x8b\x17\
+\x2f\x7e\x5d\xa4\xf1\xd1\x92\x92\x92\x7e\x19\x53\x0c\x9b\x84\x7b\
+\x26\x9c\xf7\x99\x23\xf2\xb9\xb0\x7b\xf7\x6e\x86\x16\x18\xea\xe4\
+\x81\x0d\x85\xb8\x20\xc3\xf7\x4a\xf6\x37\x15\x1f\xcb\xb2\x47\x2e\
+\x58\x3d\xda\xdc\xdc\xfc\xfd\x33\x67\xce\x70\x12\xcd\x50\x1e\x7e\
+\xa0\xa7\x5c\x8f\x74\xf8\xfd\xac\xac\xac\x8b\xe8\xa4\xdf\x61\x82\
+\xeb\xc1\x4f\x79\xe8\x56\x9a\x1f\x14\x01\xff\xbd\xfc\x86\xaa\xe7\
+\x58\x06\x79\xa4\xbe\xd8\x21\x04\xe3\x99\xd4\x1d\x8e\x5b\x05\x7b\
+\xef\x9f\x96\x63\x6d\x03\x73\xa1\x8c\x20\x9d\x91\xa3\x43\x0f\xc6\
+\x7b\xdb\x30\xee\x31\xd6\x7a\xf3\x99\x67\xcf\x9e\xfd\xc1\x23\x8f\
+\x3c\xf2\x6e\x91\xcc\x35\x91\x55\x0e\xa4\xc5\x8d\x9e\x9e\x9e\xb4\
+\xa2\xa2\xa2\x9e\x47\x1f\x7d\xf4\xf7\xf5\xf3\xa2\x5c\x74\x22\x17\
+\xb2\xc1\x2f\x8a\x81\x06\x5b\x84\xf7\xd6\xf4\xf4\xf4\x7f\x95\x4c\
+\x2c\xc3\x0c\x59\x83\x3f\x3b\x7c\xf8\x30\xab\x45\x21\x5c\xe2\x27\
+\x6a\xdc\x91\x19\x2e\x27\xd2\xc4\xef\x12\x84\x5c\x58\x58\xd8\x8b\
+\x6e\xc1\x0d\xe9\x2a\xb9\x79\xb9\xb9\xb9\x17\x94\x87\x77\x88\x04\
+\xff\x5d\xde\x09\x87\x4d\xc7\x21\x28\x83\x20\x9f\x0e\x87\x63\xc8\
+\xa0\x4d\xe1\xbd\x39\x24\xf7\x16\xb9\x5d\x72\x0c\x91\xfe\x8a\x1c\
+\xdb\x23\x78\xaf\x9c\x08\x6f\x33\xc6\x12\x11\x52\x19\x20\x3d\x88\
+\xe3\x31\xe1\x5d\x22\xaa\x13\x22\x97\x02\x91\x4b\xa7\x88\xb1\xe0\
+\xd4\xa9\x53\x9c\x04\xc3\x7e\x3f\xf4\x0e\x5b\x8b\x54\x34\x1c\x7e\
+\x89\x1a\x6c\x2a\x23\xe4\xd5\x29\x22\x7d\x63\x5e\x5e\xde\x53\x05\
+\x05\x05\x47\x77\xec\xd8\xf1\x3a\xf9\xb5\xc4\xef\x25\x22\x41\x4b\
+\x07\xdd\xc2\x32\x2d\x9d\xed\xb2\xfa\xbe\x86\x6e\xe8\x88\xae\x22\
+\xc1\x67\x44\x90\xbf\xa6\x7b\x6c\xa8\x27\x2f\xe4\xc9\x2b\xba\xc3\
+\xf1\xe2\x85\xb5\x1f\xff\x22\xc7\x10\xe9\x03\x72\x4f\xca\x81\x44\
+\xed\x8e\xe3\x16\xe3\x76\x11\xa1\x11\x57\x22\x40\x1c\x10\xd3\xb1\
+\x5d\xbb\x76\xfd\x9a\x08\xeb\x89\x8c\x8c\x8c\x6a\x59\x72\x7b\x64\
+\x2d\xfe\x95\xfc\x89\x17\x26\x16\xfb\x3d\x79\xfa\xf4\xe9\x10\x9b\
+\x55\xac\xa8\x7c\xc8\x0b\xb9\xf5\x3b\x77\xee\x7c\xad\x48\x90\xfd\
+\x4b\x57\xe3\x7e\x61\x52\x35\x50\x36\x7d\xf9\xf9\xf9\x0f\xeb\xff\
+\x22\x39\xd2\x08\x97\x57\x50\xb9\xd1\x49\xfa\xed\x91\x9b\xa5\xb0\
+\xfb\xa4\x33\xc3\xac\x0c\x7b\x20\x37\xb0\x66\x13\x00\xdd\x6e\x57\
+\xd9\x3b\x1c\x8e\x5b\x0f\xda\x0b\xda\x04\xde\x7b\xfe\xe3\x1c\x2f\
+\x62\x18\x41\x0d\x46\x06\x56\x51\x8a\xee\xbe\xfb\xee\x3f\xd6\x7f\
+\xf6\xd4\x80\x68\x9c\x40\x5e\x4d\x4d\xcd\xe7\x36\x6d\xda\x74\x6e\
+\xc1\x82\x05\x1f\x0c\x7c\xaf\xfb\x5b\x5a\x61\x10\xdf\xee\x25\x4b\
+\x3f\xf0\xbf\xeb\xae\xbb\xde\xbc\x71\xe3\xc6\x63\x5b\xb6\x6c\xa1\
+\x27\x57\x88\x9f\x10\x96\x69\xf1\x17\xdf\x73\xcf\x3d\x9f\xd1\x7f\
+\xdb\xfc\x9a\xaa\x92\x87\xe3\x27\xd2\x6f\xac\x82\x17\x19\x47\x47\
+\x83\xff\x4c\xf6\x03\x7f\xa1\x1d\xc3\x85\xd5\xfb\x5c\xb9\x53\x72\
+\x56\xb7\x1a\xe5\x6c\x3b\xc5\x78\x7a\x37\x86\x83\x64\xf9\xb2\x29\
+\x94\x4f\xca\x51\x16\x0c\x9b\xf2\xdf\xda\xb3\x9b\x31\xc5\x62\xef\
+\x2e\x69\x90\x96\x1d\x27\xf9\xbb\x72\xe0\x45\xf3\x6e\x27\x23\x82\
+\x9b\x05\x2a\x41\xff\xc4\x89\x13\x57\xea\xff\x14\x39\x1b\xb2\x4c\
+\x04\x1b\x7e\x6c\xfe\xd9\xcf\x7e\xf6\x31\xfd\x67\x8c\x9d\xf8\xe1\
+\xa1\x04\xee\xf7\x2f\x5c\xb8\xf0\xfd\x93\x26\x4d\x7a\xa8\xa1\xa1\
+\xe1\x6c\x49\x49\xc9\xbb\x45\x60\x9f\x92\xbf\x55\xb8\x68\xc5\x23\
+\x3e\x7e\xc4\x0d\xcb\x02\xf8\x07\x69\x2c\x5e\xbc\xf8\x37\x65\x8d\
+\x7e\xa2\xa9\xa9\xe9\x5a\x5b\x5b\xdb\xe2\x79\xf3\xe6\x51\x41\x41\
+\x58\x9e\xc9\x3a\xf4\xd3\x9f\xfe\xf4\xb7\xf5\x9f\xe3\xd4\x90\x9b\
+\xc8\xc2\x04\xe4\x95\x8a\xb6\x40\x16\xee\xa6\xf8\x75\x58\xde\x9d\
+\x00\xf2\x3f\xd2\x3c\x11\x8f\x17\xde\x64\x84\x1d\x7e\xdc\xe3\x7a\
+\xb8\x30\x79\x89\x74\xe3\x37\xcf\x65\xb4\xd3\x8c\x02\x59\xa4\x63\
+\xb2\x07\x03\xe1\x6f\x04\xa6\x7b\xa2\x7c\xa1\x47\xb2\xf7\x6e\x30\
+\x10\xdf\x64\x26\xd2\xd1\xd2\x0d\xa7\x67\xe1\x47\x02\xd3\x35\x2c\
+\xcf\x64\x5a\xfe\x86\x0b\xd3\xe7\x46\xf4\x0a\x23\x2c\x2b\x95\x3e\
+\x76\x6f\xb4\xd2\x4d\x04\xe4\xde\x8c\x32\x1b\x0c\xc8\x24\x4d\xcb\
+\x5b\xd8\x99\x3e\xc3\x85\xe9\x6c\xff\xa3\xc0\x2f\x5a\xc7\xed\x7a\
+\x58\x48\x24\xfc\x66\x01\xe5\x68\xf8\xcb\x17\x2d\x5a\xf4\xe7\xcb\
+\x96\x2d\xfb\x1f\xba\x9e\x2d\x67\x43\x96\x89\x10\x26\x2d\x40\x7c\
+\x03\x7e\xdc\x7f\x50\xc4\xfa\xce\xd6\xd6\xd6\xc6\xec\xec\xec\xcc\
+\xf6\xf6\xf6\x3a\x11\xd8\x9b\x44\x86\x7f\xa0\x7b\x56\x20\xd1\x82\
+\x21\x5e\x94\xac\x2c\x4c\xbf\x48\xf0\x63\xf9\xf9\xf9\xef\xed\xe8\
+\xe8\x68\x8a\xc5\x62\x19\x3d\x3d\x3d\x8d\x4a\xe3\xe1\xb9\x73\xe7\
+\x32\xf7\x47\xdc\x70\xb9\x99\x4e\xf6\x00\xb8\x1f\x85\xe5\x81\x34\
+\xd7\xca\x72\xfd\xaa\x2c\x4d\x16\xfd\x70\x94\xd1\x9d\x46\x86\x89\
+\xf2\x3f\x18\x28\x1b\x1c\x65\xc1\x70\x32\x32\xb8\x0e\x3b\xfc\x6c\
+\xbe\xd5\xca\x7a\xa8\x30\x79\xf6\x1f\x20\x83\x7a\xc7\x6f\x9e\xcb\
+\x68\xa7\x19\x06\x71\x91\x45\x3a\x26\x7b\x30\x10\x7e\x24\x30\x3d\
+\x4d\xf7\x44\xf9\x42\x0f\x1c\xe1\x86\xdb\x40\x11\xdf\x64\x86\x75\
+\x8c\xa6\x1b\x4e\xcf\xc2\x0f\x07\xe8\x85\x3c\xd3\x35\x2c\xcf\x64\
+\x5a\xfe\x08\x47\xfa\x43\x85\xe9\x33\x12\xbd\x12\x21\x2c\x8b\xff\
+\xc9\x30\xda\xe9\x86\x61\xcf\x12\xb9\x43\x29\x33\xca\x6b\x38\x65\
+\x96\x0c\x26\x07\x99\xa4\x69\x79\x0b\x3b\xd3\x07\xd8\x73\x1d\x2a\
+\x4c\x1e\xff\x2d\x5e\x38\xcd\x68\x1d\xb7\xeb\x61\x61\x38\x0a\xdd\
+\x28\x02\xc5\x6b\x6a\x6a\x3e\x51\x5c\x5c\xfc\xa6\xbe\xbe\xbe\xee\
+\xc2\xc2\xc2\x96\x6d\xdb\xb6\xb1\xb9\x94\xc3\xa9\xb9\x6f\x99\x19\
+\x0c\x56\x08\xf3\x36\x6c\xd8\xf0\xbf\x5b\x5a\x5a\x72\x33\x33\x33\
+\x07\x4e\x8e\xe9\xed\xed\x65\x7f\xe0\x44\x91\xe3\x3f\x3f\xf5\xd4\
+\x53\x98\xf9\x3c\x04\xf2\x3a\xa8\xec\x38\x09\xbe\x5d\x24\x58\x97\
+\x71\xfd\x5c\xd2\x20\x9e\xc8\x70\x82\xfc\xb3\x76\xed\xda\xc5\x86\
+\xd8\x6d\x72\xa6\xc3\x60\x08\x74\x12\xfa\xaa\xab\xab\xdf\x54\x59\
+\x59\xf9\x11\x0e\xe6\xce\xca\xca\xca\xbd\x7a\xf5\xea\xd7\x4f\x9d\
+\x3a\xc5\x90\xea\x50\x65\xdd\x4e\x44\xcb\x8e\xa3\x9f\xd8\x13\x65\
+\xf9\x03\x84\xe1\x4b\x1e\x3c\x53\x86\x76\x86\x52\xe6\xc4\x27\x0c\
+\x8e\x53\x35\xee\x91\x5b\x27\xb7\x50\xce\x86\xa3\xeb\xe5\x38\x07\
+\x71\x87\x1c\x65\xdf\x20\x87\x6c\x5c\xaa\x72\xb3\x72\xfd\x55\x39\
+\x0e\x02\x60\xa1\x15\xa3\x0b\xb6\x5a\x8f\x7b\x74\x46\xee\x96\x63\
+\x11\x03\x69\x16\xcb\xa1\x0b\xfb\x54\x49\x93\x23\xfd\x7e\x2e\x57\
+\x27\x37\x94\x34\xa3\xb0\x74\x38\x49\xe4\x17\xe5\x5e\x22\x37\x4d\
+\x8e\x65\xf4\xc8\x4a\x04\xc2\x73\x68\xc1\x1f\xc9\x0d\x56\x7e\x86\
+\xa8\x6e\x1c\x5b\x46\x59\x32\x84\x4d\x87\xd3\xce\xe9\x65\xc5\x35\
+\x0b\x35\x28\xc7\x47\xe5\x68\x48\xc2\xcf\x20\x19\x90\xcd\xfd\x3c\
+\x39\xf4\x62\x44\xe3\xcb\x72\x1c\x6e\x41\xe3\x86\x6c\xee\xcf\x91\
+\x23\x8f\x96\x2e\xcf\xf0\x31\x39\x1b\x31\xb1\x3c\x13\x96\xa1\x51\
+\xb6\x15\xcc\xc4\x43\xa0\xcc\x89\xf3\x5c\xf0\xeb\xba\x5c\x0e\xa3\
+\xe0\xf9\xd4\xca\xb1\x0f\x0f\x3f\xf6\xb2\x32\xa4\x8a\x5c\xbe\x2b\
+\x7a\x44\x0e\x0c\x96\x0f\xcb\xc3\x7b\xe5\xde\x26\xf7\x1f\x72\xd4\
+\x55\x3b\xd2\x2d\x59\xbc\x64\xb0\x38\xd4\x19\xce\x2b\x46\xc7\xbf\
+\x90\xfb\x47\xb9\xb0\x3c\xab\x03\xd4\x31\xca\xee\x8a\x1c\xc3\x91\
+\x6c\x9f\xb0\x70\x58\x36\x3c\x0b\x46\x9e\x18\xd1\x62\x98\x32\x5b\
+\xee\x43\x72\x1c\x64\x61\xf7\x13\x21\x9c\x6f\xea\xd5\x7a\x39\x3e\
+\x61\xc7\x49\x36\xd4\x3b\xd2\x68\x93\x3b\x2a\xb7\x5b\xee\x67\x72\
+\xa4\x6d\x32\xd1\xe5\x73\x72\x94\x03\xf5\x84\x32\xc1\x90\xa0\xac\
+\x8d\xc0\x12\x21\x9c\xee\x2c\x39\x7b\xee\xec\x8f\xb4\x6d\x65\xe4\
+\x95\x73\x64\x79\x87\x58\x31\x1b\x3e\x3e\x8f\x78\x89\x60\x65\xc2\
+\x56\x2d\x74\x61\x71\xd1\xdf\xc9\x51\xb6\xe1\x34\xa7\xcb\x91\x26\
+\xed\x05\xf5\x86\xe7\x40\x5d\x20\x3f\xbc\xaf\x43\x86\x29\x74\xb3\
+\x61\x15\x81\x53\x61\xfe\x57\x63\x63\x23\x7b\xf8\xd8\x6a\x90\x93\
+\x97\x97\x17\x13\x21\xfc\xe5\xb1\x63\xc7\xb0\x10\x07\x2b\x20\x60\
+\x85\x54\xb2\x7a\xf5\xea\xbf\x16\xe9\xb1\x90\x85\x87\xcc\x43\x1b\
+\x40\x9c\x0c\xcb\x44\x86\xdf\x15\x19\x52\xb9\xd8\xc3\x63\x71\x13\
+\x21\x63\xe9\xd2\xa5\x1f\xcf\xcd\xcd\x7d\x33\xc7\xb9\x85\x48\xd0\
+\xc0\x3e\xc6\xac\xa2\xa2\xa2\x7a\xb6\x46\xe8\x37\x44\x60\xf9\x4a\
+\x06\xbb\x9f\x03\xc1\x2a\xee\x1b\xa4\x4f\xb3\x64\x4b\x54\x6f\x86\
+\xf2\x9e\x26\x62\xa5\x91\xe6\xd0\xe1\xc1\x64\xdd\x6e\xa4\x7a\x26\
+\x06\x5e\x1a\x9e\x03\x15\xf1\xcf\xe3\xd7\xa9\x5e\x24\xbb\x3f\x59\
+\xee\xc3\x72\x2c\x2f\x87\x0c\x49\x2b\x5a\x37\xcd\xef\xbc\x1c\xe7\
+\x51\x7e\x41\x8e\x86\x33\x59\x1a\x56\x9e\x34\xa4\xbc\xfc\xc4\xc5\
+\x8f\x06\x99\x39\x67\xd2\xe1\x4c\x47\xce\x76\xe4\xc8\xbe\x54\x69\
+\x5e\x92\xe3\x64\x1d\x5e\x44\x5e\xb0\xc1\xf2\x65\x30\x1d\xfe\x8b\
+\x1c\x47\x03\x32\x1d\x90\x28\x9d\x28\x88\x43\x5c\xca\x83\x06\x60\
+\xb0\xf4\x90\x87\x23\xde\x0a\x39\x3a\x7f\xf7\xcb\xd1\x18\x25\x4b\
+\x8f\xb0\xd4\xbb\xcf\xca\x71\xe0\x72\x58\x46\x22\x98\x0e\x1c\x24\
+\x4f\xf9\x71\x8d\x8e\x34\x42\x9c\x4b\xc9\xb1\x7b\x1c\x4a\xc1\xe2\
+\x32\x08\xce\xd2\x25\x1c\x71\x69\x58\x69\xd4\xb8\x26\x0d\xee\x47\
+\x89\x10\xa2\xac\x96\xa3\x8c\x5f\x23\x47\xa7\x85\x69\x14\xe2\x44\
+\x61\xf2\xe9\xd4\x40\x68\xff\x4d\x0e\x3d\xd0\x89\x7b\xb8\x30\x4c\
+\xff\xad\x72\x10\x81\xe9\xf5\xeb\x72\x2c\xc2\xb3\xfb\xc3\x81\x11\
+\x09\x9d\x59\x74\x25\x4d\xda\x19\xea\x1c\xf9\x0a\xeb\x42\x87\x80\
+\x33\x43\xe9\x28\x80\x6f\xc9\xbd\x56\xce\xea\xc8\x48\x89\xd0\xe2\
+\x43\x60\xff\x55\x8e\x3a\x6d\x1b\xf5\xa3\x40\x0f\xca\x8c\xb9\x58\
+\x3a\x5a\x7f\x2a\xc7\xc7\xcc\x7f\x2b\x7e\x3d\x54\x22\x44\x06\xe9\
+\x72\x8f\xce\x23\xf5\xed\x95\x72\x90\xb0\xa5\x11\x05\xfe\x74\x2c\
+\x21\x5c\xea\x34\x79\x31\xdd\xa3\xb0\x74\x79\x37\xe9\x68\x11\x96\
+\xfc\x53\xa7\xff\x4d\x6e\xbe\x1c\xf5\x90\xf2\xa3\x5c\x2d\x4d\x7b\
+\xa6\x5f\x91\x63\xf4\x6e\xc8\x40\x91\x5b\x81\x20\xb3\xcb\x96\x2d\
+\x7b\x8f\xac\xb7\x98\xac\xb7\xbe\xb4\xb4\xb4\x4c\x11\x42\x27\xc4\
+\x50\x56\x56\xf6\x3e\x91\x10\x0f\x82\xb3\x06\x93\x15\xa4\xc1\xee\
+\x2d\x10\x69\xdd\xd5\xdd\xdd\x4d\x85\x79\x41\x3e\x20\xb2\xb6\xb6\
+\xb6\xe6\x92\x92\x12\x7a\x46\x76\x96\x5e\x22\x98\xbc\x62\x59\x7c\
+\x77\x2b\x0e\x5f\x90\xc0\x2f\xaa\x43\x9a\x88\x9b\x97\x8e\x97\x96\
+\xb3\x43\xc1\x60\x7a\x92\xef\xaa\x15\x2b\x56\xfc\x75\x76\x76\xf6\
+\x2f\x29\xef\x58\x99\xe4\x4f\xff\x32\x7a\x45\xb8\xd9\xba\xf7\x2e\
+\x02\x0b\x89\x2a\xc4\x58\x06\x95\x8e\x0a\x1a\x76\xf6\xd2\x40\x6c\
+\x83\xc1\x2a\x3b\x0d\x27\x0d\x04\x2f\x3c\xbd\x57\x5e\x46\x9e\x29\
+\x16\xbe\xc9\xe5\x1a\x3f\xae\xb1\x0a\x18\x56\xc6\x1a\xa0\xe7\x6b\
+\x95\x3f\x0a\xab\x13\x3c\x2f\xee\xd3\x59\x02\x34\x12\x34\xae\xa4\
+\xf9\x3b\x72\xe8\x6a\xf2\xa3\x69\xa2\x0b\xff\x09\xc3\xcb\xce\xa1\
+\xec\xf4\x40\x93\xa5\x19\x86\xbd\xe4\x34\x4e\x34\x7a\x90\xa0\xc9\
+\xb4\x34\x52\x39\x40\x5e\xc1\x60\xf5\x0c\x50\xaf\x68\xc0\xe8\x75\
+\xb3\x22\x9a\x46\xd4\xf2\x14\xcd\x17\xfe\x84\xc7\x82\xe1\x0b\x07\
+\xff\x4f\x8e\x3c\xa2\x6f\xb2\x36\x81\xf0\xc0\x1a\x59\xeb\xd9\x53\
+\xbe\xd4\x61\x9e\x07\xab\xb6\x21\xdf\x68\xba\x20\xd5\x3b\x68\x20\
+\x3c\xbd\x7a\x2c\xaa\x6f\xcb\xd9\x82\x2c\xe4\x85\xcb\xcd\x64\xe3\
+\x4f\x3e\xa9\x43\x8c\x16\xfc\xa1\x9c\x95\x47\xb4\xcc\xec\x37\x96\
+\x32\xe0\x5d\x06\x9c\x92\x34\x52\xd8\x3b\x6b\x65\x82\x4c\x2c\x66\
+\xac\x23\x40\x9a\x96\x2e\x8b\x80\xb0\x5a\xc8\x07\xb0\xc5\x7f\x37\
+\xf2\xde\x53\x07\x89\x0f\x19\x31\xda\xf1\xdf\xe5\x20\x5a\xca\x08\
+\x5d\xac\xfc\xad\xcc\x48\x1b\xc7\xa2\xbe\x77\xca\xed\x93\xfb\x05\
+\x39\x7b\x37\x86\x02\xcb\x0f\xef\x00\x1d\x5e\x64\x70\x68\x37\xf9\
+\x36\xf9\x96\xa6\xa5\xcb\x73\x42\x4f\x8c\x96\xff\x25\x07\x99\xd1\
+\xe1\x49\x55\xdf\x80\x9d\xfd\x6c\x65\xc6\x67\xa2\x5e\x2f\x47\x9a\
+\x58\xf4\xf0\x05\xf7\xac\x3e\x90\x1e\x98\x11\xff\x3f\x64\xa4\x52\
+\x62\xb4\x60\x69\x3c\x24\x0b\x68\x9d\xc8\x24\x3c\x9c\x96\x21\x52\
+\xcc\xe0\xd0\xea\x58\x2c\xf6\xa0\x48\x01\x26\x27\x13\xa9\xc8\xd0\
+\x0a\x6f\xf7\x91\x23\x47\x3e\x2e\x2b\x2b\xa7\xa7\xa7\x87\x0a\x61\
+\x2f\x2a\xe8\x57\x3a\x6c\xc0\xcf\x3e\x7b\xf6\xec\x27\xf4\x9b\x0f\
+\xe4\x12\x27\x1c\xc6\x80\x1f\xf7\xea\x64\x9d\x7d\xac\xb4\xb4\x94\
+\x61\xd0\x17\xc8\x63\x68\x54\xf2\x4a\x9f\x7d\xf6\x59\x08\xfb\xfb\
+\x72\xe8\x67\x0d\x7f\x14\xdc\x23\xfe\x8a\x4d\x9b\x36\xfd\xad\x74\
+\x59\x21\x0b\x90\xaf\x53\x60\xea\x5b\xbe\x32\x28\x0b\x11\xe4\x46\
+\x5d\x3f\x78\xdd\x6b\xa0\x5c\xc6\x03\x28\x23\x7a\x69\xe6\xf8\x4d\
+\x6f\x92\x45\x4d\x0c\x99\x81\x44\xe5\x0d\xc8\x27\x65\xc7\x10\x15\
+\x65\x09\x49\x50\xa1\xf1\x43\x06\x8d\x29\x65\x65\xb2\xb9\xc6\x8f\
+\x6b\x7b\xb9\x68\xd0\x18\x16\x63\xb8\x31\x15\x31\xd9\x33\xa2\xc1\
+\x04\xf7\xc9\x31\x14\xcf\x4b\x65\x2f\x8f\xc9\x8f\xa6\x49\x1c\xfe\
+\x5b\x9a\xbc\xbc\xbc\xc4\x6c\x86\x4e\x95\x26\xf9\xa3\x9e\x62\x9d\
+\x61\x09\x02\x64\x20\x17\x99\x96\x46\x22\x67\xe5\xc8\x90\xec\xff\
+\x94\x03\x96\x87\x28\xac\x9e\xa1\x23\x27\x18\x71\xe2\x12\xf1\xad\
+\xe1\x21\x2d\x64\x25\xca\x17\x3a\x5a\xfe\xa9\x7f\x0c\x95\xd2\xd3\
+\x1e\xac\x71\xb2\x67\x8a\x5c\xf4\xc2\x72\x20\x8f\xc8\x8d\xa6\x4b\
+\x7a\x5c\x9f\x94\xc3\xea\x02\xc9\xea\x04\xe0\x19\x70\x08\x05\x8d\
+\x1d\xb2\xd1\x0f\x5d\xc2\xf2\x2c\x0f\xfc\xc6\x9f\xf4\xa8\x3b\x94\
+\x05\x16\x29\xd6\x2d\x72\x48\xc7\xde\xb5\x30\x90\x09\x90\x01\x52\
+\xe9\x33\x54\xa0\x03\x30\x99\x94\x69\x14\xa4\x43\x38\x0b\x63\x7a\
+\x8c\x14\x3c\x67\xca\x88\x8e\x3e\x9d\x00\x3a\x0d\x56\x4f\x29\xa3\
+\x64\xf5\xd9\x9e\x1b\x65\x06\x91\x50\x6f\xde\x2f\x07\x52\x3d\x77\
+\x10\x2e\x4f\xde\x71\xac\x3b\xe4\x21\x8b\xbc\xd9\x33\xb1\x34\xc3\
+\xe9\x5a\x7d\xc3\xd1\x99\xa4\xbe\xd1\x21\x25\x5e\xb2\x74\xad\x8c\
+\x88\x0f\x3e\x22\xf7\xbf\xe5\x8c\x74\xc9\x07\x69\xe2\x48\x8b\x70\
+\x97\xe5\x18\x1d\x18\x16\x06\xcb\xf8\x68\x20\xa8\x24\x4b\x96\x2c\
+\x79\x87\xc8\x24\x96\x9e\x9e\x6e\x95\xc6\xc0\xd7\x25\x38\x10\xbb\
+\x51\x6e\xf1\x96\x2d\x5b\xc8\xe8\x60\x43\x48\xc8\xc8\xb8\x72\xe5\
+\xca\xf7\x45\x4c\xbf\x5b\x58\x58\x48\x7c\xf2\x12\x54\x6a\x11\x4c\
+\x5f\x56\x56\x56\xf1\x89\x13\x27\xbe\x7c\xfa\xf4\x69\x9b\x7f\x8c\
+\xa6\x1b\x86\x3d\x8c\xc7\x24\xef\x2f\x64\x19\xb2\x41\xde\x5e\x90\
+\x80\x04\x95\x46\xd1\xf1\xe3\xc7\xff\xe2\xd2\xa5\x4b\x36\x84\x9b\
+\xec\x05\x32\x3d\xe6\x6f\xde\xbc\xf9\x2b\x0d\x0d\x0d\xe5\xb2\x7e\
+\x5b\x94\x6f\x7b\x01\xc2\xe8\x93\xec\xbc\xc5\x8b\x17\xd3\xa3\x0a\
+\x7e\xc7\xff\x8f\x65\x58\xbe\xd1\x99\xde\x27\x43\x62\xcc\x45\x2c\
+\x95\xa3\x97\x0b\xb1\x33\x7f\x03\x12\xe5\x87\x17\x18\x7f\x86\x2e\
+\xe8\xc1\xda\xcb\x61\x2f\x0e\xf3\x09\x58\x5f\x10\x96\xc9\x7d\x85\
+\x1c\x73\x2b\x7c\x22\x8b\x72\x44\x06\x2f\x02\xe1\xf9\x8c\x0f\x16\
+\x10\x2f\x05\xfe\x51\x58\x1d\xb2\xff\x58\x30\x34\x00\x96\x26\xf2\
+\x20\x6f\x86\xa4\x5e\x26\x67\x69\xbe\x5c\x8e\x21\x2a\x86\xb8\x2c\
+\x4d\x7b\x31\xa9\xa3\x58\x3f\xc9\xd2\x34\xd0\x09\x23\xae\xa5\xc5\
+\x90\x14\x2f\x33\xf2\x49\x27\x91\xe3\x1e\x23\x0e\xa4\x7f\x4d\x0e\
+\x24\xab\x6b\x06\x08\xf3\x8d\x72\x58\x01\x84\xa5\x41\xe0\x3f\xf3\
+\xb5\xec\x6b\xc5\x72\x46\x26\xc4\xfc\x4b\x72\x0c\x37\x31\xef\x4a\
+\x03\x42\xb9\x40\x60\x58\x46\x3f\x94\xa3\x7c\xec\x7d\x48\x05\xe4\
+\x93\x77\x3a\x24\x84\xa7\x11\x26\x5d\xe4\x31\x54\xc9\x9c\x2c\xf3\
+\x88\xd4\x09\x1a\x3c\x9e\x2b\xf7\x92\xd5\x71\xfc\x69\xe0\xa8\x53\
+\x3c\x5b\x80\x7e\x94\xd9\xdf\xca\x51\xdf\x90\x43\x3e\xc8\x0f\x96\
+\x36\x96\xac\x35\x86\xe8\x43\x3e\xb0\x70\x18\x7a\xb3\xe7\x1d\x45\
+\xd4\x3f\x59\xb8\xe1\x20\x5a\x56\x43\x49\xfb\x46\xd2\x25\x3d\xf2\
+\x4d\x39\xd0\x91\xc4\xda\xa4\xcc\xf0\xa7\x2c\x98\x3e\x60\x6a\x82\
+\xe1\x4a\xde\x4f\x9e\x01\x43\xc2\x58\x70\x74\xb0\xac\xde\xf3\xcc\
+\x78\x86\xc3\xb1\x8a\x29\x67\x3a\x3e\xbc\xbf\xd6\xf1\x21\x4d\xd2\
+\xa6\x63\xfa\x3e\x39\x9e\x3b\xcf\x69\xb9\x1c\xcf\x83\x36\x93\x3d\
+\xdb\x16\x8e\x78\xcc\xef\xfd\x5f\x39\xac\xd9\x64\xf5\x2d\x5a\x46\
+\x74\xd4\x08\x87\xde\xc8\x42\x77\x08\x95\xaf\xe2\xd8\x9c\x28\xef\
+\x0f\x1d\x83\x61\x21\x51\xe2\xa3\x8d\x20\x33\x07\x0f\x1e\xa4\x21\
+\x3b\x2d\x42\x28\x15\x69\xf1\x10\x9f\x07\xf9\x33\x5c\x38\xa1\xb5\
+\xb5\x95\x31\x6b\x26\x58\x07\x03\x32\x62\x22\xc3\xef\xc8\x32\xfc\
+\x44\x41\x41\x41\x4c\xa4\x42\x7e\xba\x65\x79\xf1\xd9\xa5\x1f\x5d\
+\xbc\x78\x91\x07\x46\x61\x45\x5f\x3e\x74\x8a\x16\x32\x61\x32\x14\
+\xe7\x6b\x75\x75\x75\xff\x2c\x0b\x15\x19\x12\x19\x90\x60\xe1\xd1\
+\xa3\x47\xff\x34\x4e\x82\x54\xa2\x54\xa0\xa2\x80\x63\x6d\x6d\x6d\
+\x8f\x89\x90\x63\x22\xc2\x68\x63\xc9\x59\xaa\x7d\x2c\xe8\x51\x3a\
+\x3b\x9f\x7a\xea\x29\x86\xb4\xc0\x8d\xbc\x1c\xb7\x1a\xcc\x91\x9e\
+\x90\x83\x44\xf8\xde\x22\x8e\x6b\xe6\x79\xa2\xf9\x35\xf0\x7c\x78\
+\x6e\x2c\x1a\x60\x8e\x8f\x6b\xf2\xcc\x4b\xc9\xdc\x0a\xf3\x35\x6b\
+\xe4\xe8\xd1\xfd\x44\x0e\x99\x9c\xd0\x83\x15\xc6\x30\x26\x2f\x96\
+\x2d\x7e\xe2\x45\xe0\x99\xf1\x3c\x98\xbf\x63\x78\x0a\xff\xc1\xea\
+\x34\x71\xc2\x69\xd2\x1b\x66\x4e\x87\xe1\x56\x3a\x4d\x96\x26\x96\
+\x09\x16\x16\xe4\xc1\x1c\x0a\x64\x46\x1c\x03\xf3\x94\xbc\x74\xd1\
+\x34\xb9\x26\x0d\x5e\xf4\xcd\x78\x08\x56\x67\xb0\x24\x19\x51\x08\
+\x97\x59\x22\xc7\x5c\x0a\xba\xa5\xca\x0b\xf7\xa8\x6b\xcc\x4d\x71\
+\x20\x3a\x0d\x21\xfa\x91\x16\xf1\xe9\x48\xd0\x81\x40\x4f\xe6\x48\
+\xf1\x63\x38\xf8\x9f\xe5\x18\x16\x23\x5f\xcc\x13\xf1\xac\x88\x47\
+\x7c\x86\xee\x18\xba\x02\x56\x4e\x83\x81\x70\xe8\x42\xba\x74\x54\
+\x20\x70\x3a\x14\xbc\x2b\x34\xba\xe4\x15\x32\x23\x1d\x7b\x37\x12\
+\x81\xb4\xb8\x6f\xcf\x94\xf0\x7c\x24\x16\xf2\x63\x1e\x1d\x4b\x8f\
+\x21\x31\xf2\x41\x7e\x20\x73\x86\x44\x59\x10\x04\xc9\x12\x07\x47\
+\x3e\x68\x7c\x79\xa7\x90\x97\xaa\x0c\xc7\x23\x28\x27\xca\x08\xf2\
+\xa3\x43\xc6\x50\xb2\xd5\x4d\xf2\xca\x3c\x36\xf5\x12\xd2\xa3\xa3\
+\x40\xd9\xf0\x0c\x20\x0c\xc8\x91\x3a\x49\x27\x8e\x36\x96\xf2\x22\
+\x0e\x75\x78\x30\xd8\xf3\x83\x00\xe9\xe4\x50\xce\x56\xe6\xb4\x03\
+\x90\xee\xbd\x72\x74\x6e\x21\x22\x9e\x13\x8b\xb2\x78\x86\x84\x87\
+\x90\xd1\x37\x5c\xdf\x30\x78\xf0\x63\x6e\x71\x28\xf5\xcd\xde\x35\
+\xd2\x64\xb1\x0f\x73\xef\x2c\xa4\x22\xcf\x0c\x0d\xf3\xee\xd0\x79\
+\x24\x8d\x61\xe1\x56\x54\x12\x0a\x8f\x0c\xee\x79\xec\xb1\xc7\x7e\
+\x25\x3b\x3b\xfb\x67\x22\x00\xc8\xd0\x2a\x3d\x60\x28\x93\xb3\x3f\
+\xdb\x1e\x7f\xfc\x71\x6b\x20\xd1\x8d\x30\x80\xf8\x89\x0a\x29\xa8\
+\x00\xcf\x3d\xf7\xdc\xf7\x44\x54\x9f\xc2\x32\xec\xee\xee\x2e\x12\
+\xa1\x1e\x53\x5a\xcc\x17\x00\x93\x61\x40\x0e\x7e\xa6\x57\x18\xc1\
+\xc3\x78\xe6\x99\x67\x3e\x2b\x3d\x9f\x94\x8e\x45\x92\x99\x8f\x95\
+\x78\xf5\xea\x55\x5e\x3c\x1e\x00\xba\x25\x92\x69\xb2\xb8\x17\x54\
+\x2e\xe5\xe5\x8b\xca\x53\x2b\x79\x8b\xfb\x03\xac\xc0\x0c\x59\x9d\
+\x85\x17\x2e\x5c\xf8\xda\xce\x9d\x3b\xa9\x58\x54\x24\xd3\x6b\xbc\
+\xc0\x2a\x9b\xbd\x0c\xe6\x40\xa2\x17\x8b\xfc\x51\xbe\x10\x18\x43\
+\x2a\x58\x0f\xfc\x26\x0e\xbd\x45\x86\x4b\x18\x3e\xc3\x8f\x7b\x51\
+\xb9\xf8\x61\xf1\x40\x92\x58\x80\x5c\xf3\x42\x51\x07\x98\x5b\x64\
+\xd5\x1e\x18\xac\x0c\xd1\x03\xdd\xb1\x88\x20\x0a\xea\x9b\x59\x33\
+\xe1\xf4\x90\x8d\xae\xdc\x43\xdf\x87\xe4\x58\x9c\xc3\x3d\xd2\xe4\
+\x3b\x71\xf8\x83\xa0\xde\x5c\xbf\x1c\xf8\x8f\xa5\x84\x5e\xc4\xc7\
+\x8f\x05\x1a\xf4\xde\xad\x27\x1b\x4e\x2b\x91\x43\x26\x2e\x11\xa8\
+\x5f\xdc\xa3\x71\xa1\xc1\xe7\x1a\x99\x38\x7a\xe5\x34\x76\xac\xd2\
+\x23\x2d\xf2\x11\x95\x4d\x5e\x39\xfd\x08\xeb\x90\xa1\x4d\x6b\x5c\
+\xc8\x17\xcf\x81\x95\xd1\x60\x28\xed\x83\x95\x27\xa4\x47\x07\x87\
+\xce\x04\xe9\xe2\x2c\x3d\x30\x58\x63\xcb\x73\x43\x16\x8e\x74\xe9\
+\x30\xd0\xd0\x31\xac\x8a\xbe\xd1\x7c\xd8\xf3\x21\x5d\xac\x01\x3a\
+\x2e\x56\x06\x94\x07\x1d\x27\x3a\x55\x5c\x0f\x25\x1f\xe3\x05\x96\
+\x17\x46\x2b\xa8\x63\x46\x48\x94\x1b\x8b\xf8\xb0\x8e\x58\x55\x9d\
+\xe8\x1d\xb2\xba\x47\x67\x08\xab\x8d\x55\xa4\xfc\x26\x6e\x2a\x90\
+\x26\xcf\x8f\xce\x1d\xf5\x05\xe0\x47\x5c\x16\x28\x51\xfe\x90\x2e\
+\x69\x24\x4b\x17\xe2\x65\x5e\x8f\x45\x71\xc4\xe5\xf9\xa1\x3b\xcf\
+\x88\x85\x2f\x60\xb0\xe7\x64\x75\x0d\xc2\x23\x4d\xbe\xe4\x6f\xf2\
+\xad\x7e\x10\x66\xb0\xba\x76\x5b\x61\x4a\xc6\xa6\x4f\x9f\xfe\xfe\
+\xf5\xeb\xd7\x1f\x5a\xb6\x6c\xd9\x13\x2b\x56\xac\xd8\xb3\x7c\xf9\
+\xf2\x47\xd7\xad\x5b\xf7\x4c\x55\x55\x15\x66\x35\x20\xb3\x61\x10\
+\xcf\x5c\x22\x50\x08\x13\xca\xca\xca\xde\x70\xdf\x7d\xf7\xed\xd5\
+\x25\xbd\x48\x10\x95\x13\x14\xb4\xd2\xff\x75\xa5\xc5\xfc\x14\x88\
+\x16\xbe\xc5\x99\x7f\xf7\xdd\x77\xef\x9e\x34\x69\x92\x85\x33\xfd\
+\xa3\x08\xeb\x15\xbe\x1f\xc8\x21\x4f\xe4\x8d\x3c\xe2\x6a\x6b\x6b\
+\x0f\x6e\xdd\xba\xf5\xd1\xd2\xd2\xd2\x57\x05\xa1\xae\x87\x8b\xea\
+\x39\x16\x41\x43\x85\xa3\x61\xe1\xbf\x2d\x64\x18\xaa\xee\x16\x8e\
+\xf9\x1f\xe2\xf3\x12\xf0\x9f\xc6\x17\x2b\x02\x30\xaf\x91\xea\x65\
+\xe0\x1e\x61\x00\x2f\x95\xe9\x03\xd9\x70\xcd\xcb\x01\x48\x8b\xe7\
+\x05\x58\x7d\x68\xe9\x98\xee\x38\x2b\xff\xc1\xd2\xe4\x99\x5a\x9a\
+\xcc\x47\x5a\x7c\x4b\x93\xa5\xdd\xc0\xf2\x67\xff\xf1\xe7\x3e\xc3\
+\x40\xfc\x67\x01\x08\x30\xbd\x6e\x04\xa6\x2f\x43\xa2\xe1\x34\x9e\
+\x91\xb3\x45\x29\x34\x0e\xa9\x80\x1e\x16\xc6\xe4\x50\x46\xfc\x67\
+\x54\xc6\xb6\xae\x58\x9d\xb6\x34\x99\xc7\xb7\xb0\xd6\x29\x64\x74\
+\x80\x2d\x21\x80\x86\x70\x30\x98\xcc\xf0\xc9\x32\xc8\xb2\x32\x65\
+\xb8\x1b\x58\xe3\x96\x0a\x96\x07\xb6\xc1\x60\xfd\x10\xdf\xca\xc3\
+\xbe\xf9\x87\xee\x26\xc7\xea\x8d\x85\xc1\x4a\x02\x43\xad\xc7\x61\
+\x58\x99\x40\x2c\xc8\xb2\xf2\xb3\xfa\x8c\x4c\x0b\x03\x89\x90\x47\
+\xab\x83\x34\xe6\x61\x98\x7e\x0c\xd1\x73\xdf\x86\xb9\xb1\xec\x00\
+\xf7\x4d\x16\xc3\xc7\x74\xca\xb8\x6f\x65\xc6\x30\x3c\xa0\xae\xa6\
+\xca\x4b\xb8\x3e\xd3\x91\x62\xab\x0a\xf1\xd1\xcb\xf4\x67\xd4\x05\
+\x98\x1c\xd3\x8d\x15\xc6\xdc\xb7\x77\xf7\x82\x1c\xf3\xe6\x80\xe7\
+\x1e\x6e\xff\xa2\x40\x96\xd5\x0d\x56\xc1\x12\xdf\xd2\x43\x8e\x2d\
+\x0c\x23\x8f\x96\x2e\xab\x71\xb9\x4f\x1e\xad\xdc\xb0\xf8\x6c\x11\
+\xcd\x60\x69\x8e\x59\x90\xc1\xa0\x50\x8b\x8b\x8b\x5f\xb1\x71\xe3\
+\xc6\x5d\x22\x86\x03\x4b\x96\x2c\x79\x42\xc4\x48\x6f\x39\xfa\xf2\
+\xd9\x7f\x16\x36\xd8\x8b\x66\x95\x21\x0a\x93\x4d\x25\xe1\x3a\x5a\
+\x40\x41\xe1\x56\x54\x54\xbc\x61\xd3\xa6\x4d\x07\xd6\xae\x5d\x7b\
+\x70\xfe\xfc\xf9\x7c\x79\x02\x58\xc1\x1b\x48\x83\xf8\x0c\x15\x51\
+\xd8\xf6\x3b\x0a\xd3\x85\xe5\xf7\xb6\x52\x29\xaa\x7b\xa1\xf2\xf6\
+\x7f\x95\xc7\x27\x57\xae\x5c\x79\x78\xd5\xaa\x55\x3f\x90\x1f\x63\
+\xd9\x80\x17\x3d\x59\x7e\xc6\x1a\xa8\x84\x38\xab\x90\xc3\x25\x42\
+\xcb\x27\xf9\x27\xbe\x35\x44\x0c\xa1\x01\xe6\x87\x90\x35\x14\x67\
+\x2f\x32\x73\x0c\x61\x59\x34\xd2\x80\x30\xf6\xf2\x86\x89\xd0\x1a\
+\x0d\x5b\x84\x32\x18\x59\x84\x61\x61\x19\xca\x09\xa7\xc9\x62\x03\
+\x40\x9a\xe1\xff\x58\x47\x94\x95\x91\x05\x73\x8d\x0c\x01\x01\x74\
+\xb3\xbc\x44\x1d\xf7\x52\xd5\x09\xab\x57\x10\x1e\x0b\x03\x90\x6d\
+\x69\x60\x29\x83\xa0\x63\x38\x04\x84\xeb\x2f\xf3\x4a\xc8\xb0\xc6\
+\x89\x0e\x0b\x40\x27\x60\x61\xc3\x44\x68\x75\x81\x0e\x02\x18\x6a\
+\x79\x5a\x1e\xc2\x44\x68\xcf\x06\xcb\x81\x79\x4a\x60\x69\x0f\x06\
+\xcb\x2f\x04\x84\x0c\xd3\x0b\xab\x1f\x02\x02\x16\x66\x3c\x13\xa1\
+\x85\xc1\xda\xe5\x9e\x11\x12\xfb\x41\x29\x7b\xee\x27\x6a\xa7\x12\
+\xc1\x48\x89\xa9\x01\x64\x50\xfe\xa6\x7f\x98\x08\x4d\x1e\x23\x20\
+\x74\x90\xb8\x6f\xe1\x98\x7f\x06\x3c\x47\xc2\x0e\xe6\x78\x06\xfc\
+\x47\x16\xc3\xe8\xc8\xb0\xe7\xc0\x70\x3d\xb0\xb0\x20\x4c\x84\x56\
+\x3f\xcc\x58\x1a\xce\xbb\x3b\x28\x52\xbd\x70\x37\x8a\x44\x0f\xc4\
+\x7a\x7d\xe9\x8d\x8d\x8d\x3f\xda\xb1\x63\xc7\x2f\xa7\xa7\xa7\x3f\
+\x23\xab\xab\x64\xd7\xae\x5d\x8c\xf3\xda\xfc\x12\x19\x1e\xc0\xc2\
+\x85\x0b\x3f\x79\xef\xbd\xf7\xd2\xe0\xd8\xc4\xbc\x15\x54\x18\xc8\
+\xc6\xd1\x3b\xb5\xca\x66\x20\x9f\xdc\x7b\x75\x4d\x4d\xcd\xef\xb4\
+\xb4\xb4\x74\x75\x76\x76\x76\xc8\x2a\x63\x4f\x19\xf3\x09\xdc\x0b\
+\x97\x85\xc5\x67\xc8\x92\x07\x15\x95\x07\xd0\x01\xff\x69\x6b\xd6\
+\xac\xf9\x1b\x91\xdd\x9f\xe9\x9a\xca\x45\x38\xf2\xce\x7f\xc2\x34\
+\x2b\x6f\x5f\x2c\x2f\x2f\x2f\xce\xc8\xc8\xf8\x8f\xbd\x7b\xf7\x42\
+\xbe\xcc\x41\x91\x9e\x35\x26\x61\x10\x77\xa8\x95\x79\xbc\x80\xbc\
+\x92\x4f\x7a\x7d\xcc\x4d\x01\x2a\x32\x65\x6b\x0d\x11\x2f\xbe\x3d\
+\xc3\xc1\x1c\xe5\x06\x6c\x38\xd4\xea\x03\x8b\x07\x20\x54\xc2\x24\
+\x2a\x43\xab\x5b\x5f\x0a\x7e\x5d\xaf\x8b\x43\x05\x32\x01\x73\x6e\
+\xe4\xc5\x1a\x56\x08\x8f\xf9\x1a\x4b\xd3\x9e\x27\x0d\x1d\x3d\x5d\
+\xab\x7b\xf4\x62\x69\xe4\x00\xbf\x93\x39\x74\x42\x06\xb2\xc2\x75\
+\xd2\x60\x7e\x2c\x4a\x82\x0c\x29\x0b\xfc\x18\xa2\x62\xb1\x0b\xf1\
+\xac\x7c\x06\x83\xe5\x83\x7d\x92\x2c\x48\x01\x56\x26\x0c\x91\xa6\
+\x82\xe9\xc8\x3c\x90\xad\xa2\xa6\x61\x1e\x29\xac\xdc\x58\xe8\xc2\
+\x2a\x6f\x1a\x75\xca\x63\x28\xb0\x32\x60\x91\x0e\x43\xc2\x56\x06\
+\x34\xb8\x36\x4a\x90\xa8\x2c\xc7\x1b\xac\x3c\x2c\x4f\xd6\x26\x31\
+\xa5\x60\x65\x1f\x6d\xa7\x92\xc1\xc2\x63\x7d\x53\x4f\xed\xdd\x88\
+\xc2\xca\x8d\xce\x3b\xf3\xf0\xd4\x0f\x9e\x0d\x1b\xd7\xad\xce\x0c\
+\xf5\xdd\xb5\x7a\xc9\xd0\xad\xad\x22\x36\xb0\x47\x30\x19\xa8\x1b\
+\xe8\x47\xa7\xc9\xac\xfc\xa1\xd6\xf1\x21\x81\x0a\x73\x33\x61\xf2\
+\x93\x15\x30\x19\xe4\x65\x66\x92\x95\x83\xad\xc3\x99\x0b\xee\xcf\
+\x9d\x3b\xf7\x2d\x13\x27\x4e\xfc\x98\xc8\xab\xbb\xa4\xa4\xa4\x79\
+\xfb\xf6\xed\xac\xba\x63\x5e\x80\x82\xa1\x70\x07\x83\x85\xbb\x47\
+\x96\xe0\xe7\x25\xa7\x5f\xe4\x1b\xc4\xeb\xef\xef\xe7\x2b\xf2\xe9\
+\x8f\x3c\xf2\x08\xbd\x2e\x16\x67\x0c\x57\xe6\xe2\xcd\x9b\x37\xff\
+\x79\x73\x73\xf3\xe4\x98\x50\x57\x57\xf7\x95\xe3\xc7\x8f\xd3\xb0\
+\x5b\xde\x0c\x58\x30\x2c\x5e\x20\x0d\xf6\xec\x50\x2e\x89\xca\x24\
+\x55\x79\xdd\x6e\x98\x4e\xfc\x47\x4f\xc6\xf6\xd9\x3b\x36\x94\x32\
+\xb3\x30\xcc\x5d\x31\x69\xcf\x35\x7e\xf4\xfe\x99\x7b\xe5\xf7\x70\
+\xea\x22\x61\x79\x21\x19\x41\x60\xf5\x20\xab\x40\x01\x2f\x37\x2f\
+\x2c\x73\x1f\x10\x2d\xbf\xb1\x08\xd9\x93\xc6\x35\x7e\x0c\x9d\x43\
+\x98\xc4\x4f\xf6\x1c\x06\x03\x24\xc7\xaa\x38\x9e\x31\xcf\x9a\x55\
+\x79\x2c\x48\xb0\xe7\x6e\xf9\x65\x81\x18\x9d\x2d\xea\xb5\xf5\xd6\
+\x49\x9f\x06\x3b\x5a\x66\xdc\x23\x1c\x27\xbf\xb0\x5f\x11\x07\xa2\
+\x75\xc9\x64\x63\x15\x30\x5f\x4a\x23\x44\xfd\x62\x4e\x9c\xe1\x31\
+\xd2\x31\x32\x1b\x0a\x4c\x3e\x8d\x2b\x24\x62\x79\x62\x41\x0a\x64\
+\xcb\x6f\x74\xc3\x71\x8d\x45\x48\xef\xdd\xd2\x65\xb8\x8c\x05\x3b\
+\xc3\x49\xd7\xca\x3d\xbc\xa1\xde\xd2\x65\xa1\x0d\xe5\x33\x94\x7a\
+\x15\x86\xa5\x8f\x2e\x58\x12\xa6\x1f\x9b\xff\x79\x06\x74\x52\xe9\
+\x78\x61\x11\xb2\x20\xc8\xea\x03\x1d\x70\xe6\xd5\x86\x9b\x1e\xb0\
+\xb2\xc3\x22\x64\x73\x37\xe9\xa3\x87\x6d\xfc\x46\x26\xf9\x24\x0c\
+\x16\x21\x0d\xb9\x95\x25\xf5\xc5\xf6\x12\x02\xd3\x3f\xd9\x86\x7a\
+\x3a\x2c\xd4\x8f\x89\x72\x2c\x7a\x32\x4b\x17\xab\x97\x45\x64\xb6\
+\x45\x8c\xb4\x86\x0a\xcb\x33\x7b\x49\x99\x2f\xb6\x34\xc3\x1b\xea\
+\x01\x61\xb0\xc4\x6c\x3e\x1d\x5d\x79\x6e\x90\x12\x1d\xcf\xe1\xa4\
+\x49\xde\x49\x87\x21\x55\x16\x41\x21\x9b\x74\x58\x5c\xc3\xbe\x56\
+\x7b\x57\x48\xc7\x0e\x2a\xb0\x67\x85\x31\xf4\xcb\x72\x23\x79\x56\
+\xb7\x05\x28\x4a\x0f\xd8\x0a\x92\x07\x94\x08\x14\x4a\x22\x58\xf8\
+\x85\x6b\xd7\xae\xdd\x5d\x5b\x5b\xbb\x6f\xc5\x8a\x15\x8f\x2e\x5b\
+\xb6\x6c\xbf\xc8\x8c\x95\x63\xac\x16\x03\x26\x3f\x19\x4c\xce\x72\
+\xc5\x23\xfe\x93\xcc\x49\xca\xed\x8d\xbb\xc7\x98\xa7\xe4\x9e\xc2\
+\x98\xa5\x92\x4c\x57\x83\xa5\xb9\x59\xf1\x76\x29\xfe\x01\x74\x93\
+\x8e\x7b\x65\x15\xd2\x3b\x86\x20\x40\x22\x39\xf6\x12\x24\x82\x85\
+\xa7\x17\xcb\x90\xec\x58\x03\x2f\xb4\xbd\xd4\xfc\x1f\xce\xd0\xa8\
+\x85\x61\xf1\x03\x71\xa9\xec\x26\x6f\xb4\x1c\x2f\x06\xff\xd7\xca\
+\x01\x5e\x1c\x60\x43\xa3\xac\xc2\xe4\x3f\x1d\x2e\xc0\xcb\x36\x5c\
+\xd8\x33\x62\x25\x1c\xb2\x2c\x1f\x74\x72\x80\xe5\xd3\x9e\x31\x96\
+\x22\xa7\xb7\x10\x86\x97\xd9\xca\x6e\x30\x47\x23\x40\x43\x0a\xd9\
+\x82\x70\x19\x9b\x0e\xec\xe3\x22\x2c\x72\xf9\xcf\xca\x51\x30\x94\
+\xe7\x11\x86\xe9\xca\x86\x7a\x1a\x55\xd3\x81\x45\x2a\x36\x94\x4b\
+\x18\x4b\xd7\x86\x46\x69\xcc\xf8\xcf\x02\x0d\x30\x9c\xf2\xb4\x34\
+\xc3\x43\xa3\x38\xf6\x18\x47\xa7\x18\x86\x8a\x68\x1d\xb3\x72\xe1\
+\x1b\xa6\x60\xbc\x0f\x8d\x9a\xfe\x94\x8f\xd5\x65\x1c\xf3\xc2\x23\
+\x85\xa5\xc9\xea\xe8\x70\x9a\xe1\xa1\x51\x0b\xc3\xe8\x0b\xf7\xa8\
+\x9b\x96\xf6\x68\x38\x7b\x6f\x19\x9a\x67\x88\x1e\x58\x5e\x6d\x68\
+\xd4\x9e\x15\x46\x10\x18\xc9\xb3\x4a\x09\x7b\x48\xa3\x05\xab\xbc\
+\x33\xef\xbb\xef\xbe\x8f\x2e\x5f\xbe\x9c\x13\x27\x58\xde\xcb\xc3\
+\x4f\x94\x16\x99\x03\xd1\x7b\x84\x4f\x13\xb1\x7c\xa8\xa7\xa7\xa7\
+\x48\x16\x1c\x15\x8c\xed\x15\x5d\xb2\xbe\x26\xc8\x0a\xa3\x80\xd8\
+\x37\x45\x21\x26\x7b\x61\xf0\x47\x4e\xf5\x96\x2d\x5b\xbe\xd8\xd4\
+\xd4\x94\x4d\x7c\xfd\x0e\xa7\xc5\x1e\xc6\x6e\xee\x6d\xdd\xba\x95\
+\x65\xbf\x9c\x08\x91\x4c\x57\x80\x4c\xd2\x7c\x40\x24\xf8\x05\x59\
+\x97\xb9\x8a\x4f\xe5\xc9\x90\x8e\x7d\x9d\x9d\x9d\x99\x22\x6e\x56\
+\x45\x59\x2f\x29\xac\x1b\x32\xc9\xaf\xe5\xd9\x40\x18\xee\x11\x7e\
+\x96\x48\xf5\x23\xaf\x78\xc5\x2b\x58\x6e\x6c\x63\xf8\x77\x12\x68\
+\xf8\xc2\xa0\x2c\x78\xb6\x37\xe2\x28\x37\x73\xc0\x5e\xa2\x28\xec\
+\x59\xf0\x21\xe6\x1b\x05\xdb\x01\x80\x3d\x4b\x9e\x77\x18\xf8\xf3\
+\x4c\x21\x16\x2c\x05\x2c\x54\xf4\xc2\x9f\xfa\x93\x28\x1f\x38\x5e\
+\x78\xea\x28\xba\x62\x19\x71\x4a\x0c\x24\x4b\x9c\xe8\xcb\x1f\xad\
+\x1f\x4c\x2b\xdc\x08\x18\xa9\x20\x1d\x03\x1d\x89\x64\xef\x01\xb0\
+\xf2\x64\xd1\x06\x88\xd6\xeb\x91\x80\xf4\x6f\xf4\xf9\x58\x7c\xd3\
+\xcf\xe6\x93\x0d\x51\x3d\x2d\xdc\x78\x01\xc4\xc4\xb3\xb7\xfa\x4e\
+\xfb\x33\x52\x58\x59\xd8\x33\x4c\x55\x16\x89\xca\x31\x51\x1d\x1e\
+\x8e\x0b\xbf\xb7\xe4\xcb\x48\x37\x19\x4c\xcf\x51\x47\xaa\x8a\x3e\
+\x62\xcc\x9c\x39\xf3\x25\x75\x75\x75\xc8\x5e\x2d\x32\xfb\x44\x5a\
+\x5a\x1a\xfb\x5a\xc8\x30\x05\x9d\xa8\xb0\xad\x30\x40\xa0\x53\x69\
+\x69\xe9\xdb\xfb\xfa\xfa\x36\xf6\xf6\xf6\x86\xf7\xa5\x41\x5c\xbd\
+\x22\xa0\xce\x35\x6b\xd6\x7c\x62\xe1\xc2\x85\x4c\xd6\x0e\xf6\x02\
+\x5e\xeb\xee\xee\x7e\x26\x33\x33\x33\xbb\x5f\x88\xfb\x0d\x00\x3f\
+\xee\x29\x0c\x8d\x55\xaa\x0d\xcc\xe8\x8d\x3f\x8b\x6d\xfe\x18\x42\
+\x8e\x13\xb4\x95\x61\xba\x44\xd1\xa3\x5d\x3c\x67\xce\x1c\xf6\xc3\
+\x45\x11\xce\xa3\x81\xb8\x41\x5a\xb9\xb9\xb9\x0f\x4a\xee\x6f\x2b\
+\xbf\x93\xeb\xeb\xeb\x39\x07\x93\xe1\x3b\x70\x53\x9e\xd1\x6d\x42\
+\xf4\x28\x27\xca\x14\x82\xb8\x11\x67\xe5\xc3\x4b\xc4\xdc\x2b\x2b\
+\x07\x41\xb2\x7a\x91\xcc\xff\x46\x90\xac\x4e\xe3\xcf\x02\x03\x96\
+\xaa\x33\x2f\x49\x23\x6d\xbd\xec\x44\x79\xa1\x81\x83\x80\x88\x07\
+\x29\x30\xf4\xcb\xb0\x15\x96\x21\xbf\xc3\x75\x01\xab\x20\x0c\x3a\
+\x9c\x37\x02\xd2\x0a\x37\x44\x34\xb0\x61\x62\x4c\x86\xd1\x2c\x4f\
+\xd2\xb7\x6f\x7a\x8e\x14\x16\xdf\xf4\x8a\xd6\x39\xfb\x6d\xcf\x2c\
+\x1a\x7e\xa8\x20\xbe\xc5\xb1\x45\x7e\xb7\x02\x58\x64\x74\x98\xac\
+\x2e\xd0\xb9\x4c\x54\xff\x86\x02\x8b\xc7\x28\x14\x48\x55\x06\xd1\
+\xfa\x46\xdc\x44\x75\x78\x38\x8e\x3c\x98\x0e\x0c\xcb\x87\x0f\x21\
+\x4f\x84\xe1\x3e\xa3\x21\x63\x34\x1b\x59\xcb\xc0\xb4\xe9\xd3\xa7\
+\xaf\x10\x89\xf1\xb0\xda\x3b\x3a\x3a\xca\x44\x5a\xef\x9f\x3f\x7f\
+\x3e\x63\xd0\x64\x9e\x30\x96\xf9\x44\x08\x32\x3b\x63\xc6\x8c\xb9\
+\x22\x28\x7a\x21\xe8\x18\x2e\x00\xf1\x6a\x5a\xaf\xac\xaf\xae\xf2\
+\xf2\x72\x0e\x65\x65\x45\x29\x88\xca\xb4\x74\x5a\x76\xed\xda\xf5\
+\xc1\x9c\x9c\x9c\x7d\x22\xae\x12\x91\xd5\xc0\xcb\xcd\xb5\x88\xb5\
+\x58\xf7\x0e\xee\xdc\xb9\x93\x21\x08\x48\x37\xd1\x83\x30\xbf\x6c\
+\xe5\xe5\xd7\xda\xdb\xdb\xd9\xfd\x0f\x09\xbe\x20\x1f\x92\x99\x9d\
+\x97\x97\x67\x27\x35\x44\xe5\x18\x88\x47\xbe\x68\x2c\x27\xd5\xd6\
+\xd6\x7e\x50\xd6\xf3\xeb\x45\xf0\x98\xbd\x5d\x22\xe5\xbe\x95\x2b\
+\x57\xb2\x51\x98\x86\x21\x11\x81\x8e\x57\xd8\x41\x09\x56\x6e\xcc\
+\x87\x31\xf7\x40\x87\x06\x2b\x78\xa4\x8e\x7d\x6f\xcc\x15\x32\x37\
+\x43\xaf\x31\xd1\x33\xbc\x1d\xb0\x3a\x48\x07\x8b\x6d\x38\x2c\xf6\
+\x62\xdb\x06\x1d\xa5\x44\xf9\x60\xae\x8a\xf9\x4c\xe2\x41\x98\x34\
+\x7a\xcc\x09\xd9\xde\x2d\xfc\xed\x9d\x3d\x1b\xff\x6f\xf5\x99\x13\
+\x3a\xc0\x0b\xea\xe4\x20\x30\x79\x4c\x65\x40\xa6\x26\x8f\x67\x13\
+\x25\x91\x9b\x09\xea\x39\x8d\x3a\xe7\x51\x82\xe1\xb6\x4d\x96\x6f\
+\x5b\x5a\x6f\xf9\xa0\x71\x05\x76\xdf\xca\xcd\x3a\xd7\x36\x4f\x37\
+\x92\xf7\x8c\xe7\x41\x99\x71\xe2\x09\x18\xae\xce\x23\x01\x6d\x14\
+\xab\x85\x0d\xac\xb1\x60\xa5\x3c\x18\x6e\xfa\xf6\x8e\x58\xdd\x49\
+\x04\x0b\xc3\xbe\x53\x60\xbf\x99\x06\x62\x8e\x8f\x7a\x9d\xa8\x2e\
+\x0f\xc5\xf1\xde\x73\x48\x38\x0b\x08\xdf\x2a\x67\xb0\x34\x6e\x19\
+\x46\xf3\xc1\x05\x15\x4d\x04\xb6\x45\x0d\x79\x21\x64\x25\x97\x2e\
+\xd7\xdd\x25\x14\x15\x15\xbd\x72\xf3\xe6\xcd\x1f\x9f\x32\x65\xca\
+\x60\x67\x89\x06\x85\xb0\x7f\xff\xfe\x8f\x5d\xbb\x76\xed\xaf\x44\
+\x2a\x25\x22\x55\xf4\x1c\x28\x1c\xfd\xee\x97\x05\x95\x77\xf0\xe0\
+\x41\xc6\xf7\x19\x5b\x7e\xde\xfd\x10\x2c\x9d\x26\x11\xdd\xfb\x63\
+\xb1\xd8\xd3\xd2\x87\xde\x1b\x2f\x09\x15\xbf\x40\x64\x7b\x42\xf7\
+\x68\x8c\x19\xc6\x4a\x25\x87\x7b\x9d\x47\x8f\x1e\xfd\xbc\xe4\x64\
+\x4a\x87\xb0\xfe\xe2\xbf\xfe\x3e\xc9\x9a\x28\xb2\xfd\x96\xf4\xb2\
+\x25\xbe\xc9\xf2\x08\x08\xbf\x6e\xeb\xd6\xad\x9f\x94\x4e\x4b\xdb\
+\xda\xda\x5a\x15\x37\x48\xa7\xa7\xa7\xa7\x43\xe4\xcc\x64\x32\x93\
+\xe0\x60\x34\x9f\xd3\xed\x80\x35\x32\xac\xe8\xb5\x15\x6a\x80\x0d\
+\xe7\x2c\x8c\x60\xbe\x8b\xd5\x98\x6c\xa5\x18\x89\x63\x05\x1a\xa7\
+\xcb\xd0\x78\x53\xe6\x89\x9e\xe1\xed\x82\xe9\xc2\x33\xa4\x01\x63\
+\x85\x65\xa2\x3c\xe0\xbe\x28\xc7\x2a\x66\x3b\x88\xdd\xca\x89\xcd\
+\xfc\xac\xd8\x43\x96\xd5\x29\x16\x2b\x00\xb3\xe2\x18\x4a\xc5\x9a\
+\x84\x3c\x53\xd5\xbb\x64\xb0\x79\x2d\x3a\x78\x80\xc5\x1c\x00\x1d\
+\x6e\x45\x79\x1a\x71\x99\x1e\xc3\x01\xf9\xb5\x7c\x73\x48\x02\xb0\
+\xb2\x63\x11\x06\xb0\x3c\x60\xa1\xb3\x6a\xd1\xde\x29\x46\xab\x70\
+\x60\x38\xef\x99\x85\x65\x4d\x80\x1d\x20\x3d\x92\x72\x1f\x2a\xec\
+\xd9\xd3\x4e\xd9\xb3\x67\x18\x1d\x22\xe6\xf8\x34\x30\x9c\xf4\x09\
+\x4b\x99\x33\x37\x6c\x27\x20\xa5\xca\x3f\xc4\x17\x06\x0b\xd4\x38\
+\x99\x88\x91\x0e\xde\xdf\x44\xf5\x79\x30\x47\x3c\xe2\xb3\x72\xd5\
+\x3a\x5d\xb7\xa2\xae\xbd\x00\xc3\x79\xf0\xa9\x40\xa1\x52\x11\xca\
+\x64\x0d\xae\x61\x6b\x82\x1a\x77\x7b\x28\x5c\xa6\xf5\xf6\xf6\x36\
+\x35\x37\x37\x57\xcf\x9e\x3d\xfb\x77\x44\x00\xb6\xdf\x27\x15\x38\
+\xe1\xe5\x4f\x0f\x1c\x38\xf0\xfb\x05\x05\x05\x79\x8a\x6f\xd6\x51\
+\x60\xc5\x89\x6c\xff\xb3\xbe\xbe\x9e\x55\x4b\x96\x36\xe0\xda\x9c\
+\x81\x74\xc8\xe7\xd5\xdd\xbb\x77\x7f\x40\x04\x7a\x4d\x24\x96\x2d\
+\x79\x31\x91\x6c\x83\xfc\xd8\x47\xc3\xf2\x71\xc2\x98\x1c\x43\x58\
+\x4e\x50\xd1\x1b\x1a\x1a\xbe\x2f\x5e\xff\x91\xf2\x60\xbd\x67\x48\
+\x30\x2d\x2b\x2b\xab\x54\x7a\x7d\x55\xf2\x98\xd0\x65\x58\x89\xb8\
+\xd1\x3c\x9a\xbc\xfc\x05\x0b\x16\xfc\xea\xaa\x55\xab\xde\x23\x79\
+\xb9\x2a\x1e\x48\x70\x20\x2d\xc9\x99\x20\xab\xb3\x4f\x56\x22\xc7\
+\x07\x81\xa8\x5e\xe3\x0d\xf6\x0c\x28\x67\x16\x3b\x01\x5e\x62\x46\
+\x08\x98\x53\x05\x3c\x5f\xc2\x0c\xc5\x59\xe3\x0f\x28\x37\x1a\x3d\
+\xfc\x49\x67\xb0\x7a\x75\x3b\x80\x4e\xe1\x3a\x1a\xcd\x8f\x39\xcb\
+\x0b\xa4\x4e\x07\x81\xdf\x34\xf0\x94\x93\x2d\xe6\xb2\xfc\x3d\x22\
+\xc7\x66\x68\xca\x82\x7a\xc8\x7d\xdb\x47\x68\x24\x30\x18\x48\x93\
+\xb8\x8c\xaa\x58\x8f\x9c\xb4\x00\xe9\xdf\x4a\xa0\x0b\x60\x55\x20\
+\x8b\xc5\xd0\xcb\xfc\x06\x83\xe5\x97\x0e\x83\xed\xdf\x24\x1f\x58\
+\x4f\x9c\xe8\x03\x90\x47\x79\x62\x9d\x73\xfa\x0e\x60\xd4\x8a\xe1\
+\x68\x3b\x34\x83\xfb\x43\x01\xe1\xec\x39\xd8\x81\xd5\xb7\xe2\x1d\
+\xb5\x7c\x5a\x9e\x4c\x5f\x46\x18\x18\x3d\xb3\x3c\x0e\x05\xf6\x0e\
+\x71\xec\x1f\x56\x65\xb2\xb8\x96\x2f\xa6\x1c\x58\x98\x43\x3c\x3a\
+\x4b\x74\xcc\x6c\xa1\x94\xcd\x27\x0f\xe6\xd0\x3f\x5c\x37\xed\x37\
+\xf7\x6e\x2b\x46\x4b\x01\x2b\xc0\x79\xd9\xd9\xd9\x55\x9c\xcf\x29\
+\x44\x1b\x24\xb5\xf5\xe9\x6a\xdf\xdb\xf9\xf4\x10\x43\x58\xb6\xaa\
+\x2f\xd9\x83\xe3\x01\xa4\xb7\xb4\xb4\xfc\x9d\xac\xc3\x0f\x15\x16\
+\x16\x42\xa6\x59\x22\x9d\x4c\x91\x4e\xfd\xe3\x8f\x3f\xce\x11\x4c\
+\x20\x1c\x9f\x34\x2d\xdd\xb0\x7f\x20\x4b\xee\xe4\x53\x4f\x3d\xf5\
+\x5b\xf9\xf9\xf9\xe9\x22\xd7\xcc\xc3\x87\x0f\x73\x86\x24\x73\x83\
+\xdc\x8b\x56\x64\xe2\x27\x92\x35\x61\xdf\xbe\x7d\x9f\x57\x3e\x2f\
+\x4b\x97\xe0\xb0\x6f\xc9\x2a\x38\x74\xe8\xd0\x1f\x8b\x04\x59\xaa\
+\x6d\x61\xa3\xf9\x0f\x63\xa2\x2c\xe3\xad\xad\xad\xad\x1d\x22\x3d\
+\x0a\xeb\x79\xcf\x41\x72\xf9\x9e\x62\x5a\x69\x69\x29\x43\x2e\x76\
+\xe2\xc2\xf3\x74\xb8\x0d\xb0\xf2\xb1\x7c\x85\xc9\xc8\x80\x8e\x96\
+\x97\x68\xdd\x32\xfd\xed\x2c\x4b\x5e\x00\x64\x31\xbc\xc2\xca\x4e\
+\x88\x11\x3f\xd2\x49\xe6\x08\x8f\x1c\xca\x8c\xc6\x9b\xc6\x9f\x38\
+\xbc\xc4\xdc\x1f\x0f\x20\x0f\xd1\x7c\x99\x23\x1f\x06\xf6\x05\x02\
+\xfc\x01\x8d\x95\x81\xb2\x85\x04\xe9\x91\x03\x8b\xc7\xca\x3e\x56\
+\x27\x52\x3e\x94\x4b\x2a\x84\x9f\x0f\xcb\xf3\x6d\x4f\x22\xf1\xd8\
+\x23\xc6\xc1\x07\xc0\xd2\xbf\xd9\xe0\xb9\x92\x0f\x56\xda\xb2\x4c\
+\xdf\x10\xad\x47\x51\xa0\x2f\xf9\xe5\xdc\x4a\x3b\xf2\x2e\x68\x80\
+\x04\x3e\x7f\x65\x7b\x39\xc9\x87\xc9\xb2\xbd\x68\x46\xfa\x6c\x07\
+\x61\xc8\x9a\xf4\xa9\xd7\xa9\xde\x35\xee\x59\x3d\x65\x68\x8f\x13\
+\x84\xb8\x1e\xac\xbc\x47\x03\xf6\x2c\xb0\xa0\xb0\x6a\xd1\x9f\xbc\
+\x32\x72\xc4\x96\x0b\x80\x1e\xa9\xf4\x07\x46\x66\xac\xb0\xb6\x15\
+\xa2\xc9\xca\x99\xfa\x4a\x78\x3a\x15\xb6\xe2\xda\x40\x9a\xb4\x51\
+\x36\x67\x89\x7e\xc9\x9c\xd5\x7b\xca\x98\xa9\x23\x86\x63\xb9\xc6\
+\xe1\x7f\x5b\x31\x58\x25\x1b\x2a\x2c\x23\x8f\x3e\xf9\xe4\x93\xff\
+\x7d\xe2\xc4\x89\x58\x44\x7c\xc1\xe1\x79\x19\xe4\xa7\x08\x24\xe3\
+\xd9\x67\x9f\x65\xe3\xaf\xad\xe0\xa4\x80\x00\x0f\x2f\xfa\x00\x89\
+\x9f\x2e\x4b\xf2\x87\x92\xfb\x5f\xc5\x37\xcd\x39\x39\x39\xe5\x27\
+\x4e\x9c\xc0\x9c\x66\xb3\xbb\x55\x48\xcb\xc7\xda\xa5\x4b\x97\xf2\
+\x52\xd3\x3b\xb2\x46\xd3\x10\x84\x6b\x6c\x6c\xdc\xf3\xf4\xd3\x4f\
+\x7f\x52\x24\xf8\x29\x59\x94\xac\xca\xb3\x07\x68\xb0\x38\xe9\xcb\
+\x96\x2d\x83\xd8\x20\x6d\x64\x99\xae\xa4\x79\x56\x96\xea\x9f\x49\
+\x97\x12\x11\x74\xba\x48\xf9\xc3\x22\x6c\x4e\x2b\x89\xca\x02\xe1\
+\x7c\x99\x9c\xd3\xd2\xe1\x5f\x45\xc8\xb9\x98\x93\xc1\x9d\xeb\xe0\
+\x27\x8b\x77\x8a\x74\xef\xfc\x4f\x7e\xf2\x13\x36\xe9\xf3\x22\x83\
+\x70\xb8\xdb\x01\x9b\x6b\xb1\xfc\xd9\xe9\x38\x94\x07\x79\xb2\x86\
+\xc0\xee\xf3\x3f\x5a\xfe\x80\xf3\x01\x99\x18\x27\x3c\x2f\x01\xe0\
+\xb4\x16\xe6\x44\x79\x39\x91\x65\xf2\xec\x9a\x17\x91\xff\xc8\x23\
+\x0e\xf3\xcd\x0c\x79\xb1\xd7\x2e\xfc\xa5\x81\x70\x7a\x63\x05\x96\
+\x87\xa1\x38\xf2\x6c\x79\xb0\x79\x66\xfb\x6d\xab\x21\xc3\xf5\x80\
+\xa1\x54\xfc\xe9\x54\x52\x2e\xec\xc7\x63\x8e\x91\xe1\x2e\x7e\x13\
+\x17\x99\xd1\xb2\xc4\x9f\xe7\x81\x63\x1f\x1d\x87\x30\x87\x9f\x17\
+\xf5\x8e\xc5\x11\xc4\xbb\x95\xf5\x8e\xf4\xd0\x03\xcb\x8e\x61\x33\
+\xd3\x11\xbd\xac\x0e\x58\x39\xe1\xf0\x27\x9f\x0c\xb1\x43\x7a\x94\
+\x19\xbf\x29\x0f\xda\x20\xf2\x16\x06\xb2\x00\x65\xc4\x7e\x56\x64\
+\x19\x69\xb2\xcd\x82\x3a\xc8\x6f\xe4\x5a\x3a\xe1\x34\xf9\xcf\x3d\
+\xc2\x70\xf2\x0e\xe5\x0f\xac\xdc\x6e\x36\xd0\x1f\x3d\x98\xe7\x64\
+\x2a\xc1\xc0\x33\xe2\xbc\x4e\xac\x53\xcb\x0f\xba\x26\x2a\x33\xae\
+\x09\xc3\xfb\x4b\x99\x31\xc4\x69\x65\x9c\x0c\x94\x29\x60\x65\x3d\
+\xed\x11\x04\x8c\x1f\x8b\x6c\x28\x4b\x86\x86\x93\x95\x9b\xd5\x37\
+\x74\xc4\xb1\x3d\x84\x8e\x16\xef\xaf\x1d\x30\x41\xb8\xdb\x8a\x51\
+\x57\xa0\xae\xae\x6e\xdb\xcf\x7f\xfe\xf3\x4f\xcb\xa2\xd9\xa3\xc6\
+\x3c\x5f\xff\x29\x14\x0a\x9a\x42\xc8\x4a\x4b\x4b\xbb\x28\x02\x62\
+\x43\x3c\x08\xbf\x64\x56\x50\xd1\x07\x12\x3c\x7c\x11\xcd\x1e\x59\
+\x73\x1f\x90\x05\xf5\x8f\x97\x2f\x5f\x66\x25\x1d\xb0\x97\x9d\x30\
+\x15\x1b\x36\x6c\xf8\xbd\xbc\xbc\xbc\x5f\x5c\xb5\x6a\x15\xd6\x22\
+\x4b\xda\xa3\xf2\x82\x07\x2e\x1d\xbf\x23\x1d\xa8\x04\x16\xd7\x60\
+\x0f\x2c\x6b\xe5\xca\x95\x9f\x15\xd1\xbd\x7e\xeb\xd6\xad\x7c\xe3\
+\x8c\x61\x00\xc2\x51\x5e\x41\xa5\x10\x39\x7f\xbf\xa3\xa3\xe3\x1f\
+\xf7\xee\xdd\xfb\xb1\xb6\xb6\x36\x8e\xfa\xe2\x5e\x58\x16\x30\x79\
+\x38\x43\x70\x7d\xe9\xd2\xa5\x1f\x2b\x2f\x75\xf0\x5e\xdc\xaf\x4f\
+\xd7\x31\x59\xbb\x59\x92\xfb\xa3\x9d\x3b\x77\xb2\x59\x9a\x0a\x13\
+\xd6\xff\x76\xe2\x6b\xf1\xff\x06\x36\x6f\x33\xdf\x4b\x87\x06\x50\
+\x2e\xe4\x85\xcd\xb8\x3c\x5f\x16\x1f\x45\xf3\x4d\x19\xf1\x9f\x09\
+\x72\x1a\x70\xc2\x13\x8f\x95\x7b\x7c\x32\x88\xb8\xb6\x34\x3c\xec\
+\x08\xc3\x7f\x86\xa3\x79\x19\x79\xfe\xc4\xc1\x8f\x06\x89\x8d\xb8\
+\x60\xac\x94\x55\x18\xe1\x7c\x0c\xe6\x28\x1b\x1a\x14\xe6\x7c\xd8\
+\x0f\x07\x28\x23\x60\x73\x34\x41\x5d\x91\xa3\x2c\xa9\x1f\xd4\x4f\
+\x03\xe5\xc4\x97\x34\x38\xe8\x80\xaf\x01\x58\x58\x2b\x3f\xbb\xc6\
+\x9f\x45\x25\x0c\x7f\xf2\x2c\xec\x1e\x69\x51\x97\xed\x08\x3a\xfc\
+\x6e\x15\xec\x5d\xe1\x3f\xe9\x72\x18\x3d\x43\x80\xac\x98\xc5\x3f\
+\x9a\x07\xfe\xe3\xcf\x9c\x60\xf8\x23\xcd\x06\x2c\x1d\xf6\x70\x86\
+\xdf\x4b\xc2\x5b\x1d\xa4\x7e\x26\xaa\x83\x94\x27\x44\x6a\x69\x45\
+\x1d\x6b\x0c\x20\x58\xac\x32\x6b\xdb\x6e\x25\x2c\x3d\xf6\xfe\xd9\
+\x57\x37\xf0\x23\x4f\xac\x99\xa0\x63\xc8\x7e\x3c\xfc\xa2\x65\x86\
+\xa3\x7c\x59\x58\xc6\xd7\x1a\x18\x55\xe1\xde\x60\xef\x0d\xb2\xc9\
+\x2b\x73\xdc\x76\x40\x36\x20\x2e\x8b\x9b\xd8\x87\x6d\xfb\x58\x13\
+\xa5\x4b\x7c\x16\xf4\x70\x30\x37\x56\x24\xbf\x01\x7b\x3a\x21\xd3\
+\xa1\xe8\x70\x53\x71\x33\x12\x47\x66\x90\xd1\xb2\xb2\xb2\x7b\x16\
+\x2f\x5e\xfc\x3a\x91\x18\x73\x7c\x2d\x22\xa9\x22\x59\x73\xdf\x12\
+\x91\x61\x15\x84\x2b\x68\xfe\xc2\x85\x0b\x5f\x2b\x2b\xe9\x47\xba\
+\x66\x65\x61\xf8\x9e\x21\xac\xab\x15\xe4\x00\x6a\x6b\x6b\xbf\x24\
+\x4b\xea\xbe\x9e\x9e\x9e\xe7\x62\xb1\x58\xb9\x48\x85\xe3\xcc\xa8\
+\xec\x89\xe6\xeb\x4c\x56\xd4\x8f\xdf\xd9\x22\xd2\xcf\x8a\xb0\x1f\
+\xea\xee\xee\xbe\x22\xb2\x62\xa5\xe9\x53\xfb\xf6\xed\xe3\xa1\xb1\
+\x3d\x22\x2c\x2b\xfc\x22\x44\x75\xb2\x3c\x94\xac\x59\xb3\xe6\x55\
+\x7b\xf6\xec\xa1\x12\x30\x9c\x45\x7c\x5c\x9f\xca\xe7\x4d\xf3\xe6\
+\xcd\xbb\x5f\x44\xda\xc4\x9c\xa3\xca\xe7\xca\xee\xdd\xbb\xbf\xae\
+\x3c\xd0\xe8\x25\xd2\xf1\x76\x02\x6b\x03\x0b\x8c\x55\x8c\x54\x6e\
+\xf2\xce\x66\x68\x86\xa3\xd8\x1c\x8c\x15\xc2\x5c\x05\x13\xef\x76\
+\x9f\xc6\x9c\xcd\xe7\x5c\xe3\x07\xec\x9a\x7d\xa0\x76\x4e\x27\xe5\
+\x44\x79\x91\x67\x56\xa7\xb1\x41\x99\xb4\x58\xfc\x42\x78\x86\x87\
+\x99\xfb\x61\x21\x09\x5b\x4b\x08\x4f\xb9\x70\x8f\x2f\x57\x30\x34\
+\x64\x8b\xa6\xec\x79\xd0\x40\x40\x2a\x76\xb2\x8c\xcd\x07\x61\x7d\
+\xf2\x2c\xed\xfe\x70\x60\xf2\x91\xc1\xdc\x0a\x16\x2c\xbd\x63\xe6\
+\xe6\xbe\x27\x17\xce\x27\x60\x15\x24\x07\x1b\x93\xee\x50\x9e\x23\
+\xf1\x69\xd0\x19\xb2\x67\x88\x10\xfd\xd0\xf3\x11\x39\x3b\x56\x2b\
+\x5c\xff\x4c\x1f\x46\x48\x58\x85\x67\x69\x5b\x59\x32\xbc\x4a\xf9\
+\x43\x98\x75\x72\x6c\x90\xa7\xf3\xc2\x1c\x3d\x04\xc2\xc8\x09\xf1\
+\x71\xa4\x43\xc3\xfa\x52\x39\xde\xc1\x70\x3a\xc0\xd2\xb2\x93\x65\
+\x2c\xef\x58\x93\x3c\xaf\x68\xde\x53\xc1\x64\x53\x3e\xd1\x93\x65\
+\x00\xd7\x80\xdf\x3c\x37\x08\x8a\x03\x06\x38\x3d\x05\xf2\xe2\x80\
+\x6d\x56\xe0\x52\xee\x94\x17\xb2\x2c\x0e\x7a\x70\xf4\x17\x43\xee\
+\xa6\x73\x14\xa6\x2b\x75\x90\x61\x52\x8b\x8f\x5e\xc4\xa1\x5e\x33\
+\x0c\xc8\x7c\x36\xf3\xda\x84\x87\x5c\xd6\xc9\xb1\x2f\xd4\xbe\xe6\
+\x0f\x88\x13\x2e\x2b\xae\x6f\xc6\xc9\x32\xe1\xfa\x6a\xf9\xc2\xaa\
+\xa3\x33\x83\x3e\xdc\xc3\x1f\xc7\x3e\x57\x9e\x3b\x56\x2f\x23\x39\
+\x3c\x2b\xac\x66\x16\x05\xa1\x3f\xc3\x92\xe8\x85\x33\x7d\x80\xd5\
+\xb7\xf0\xc9\x32\xe1\x67\x6a\xe9\x72\x8a\x11\x1d\x06\x4b\xd3\x64\
+\xd0\xf1\xc0\xc0\x20\x6f\xcc\xc5\xf2\x7c\x79\xb6\x9c\x1c\x86\x95\
+\x6f\xfb\xab\x71\xa4\xc3\xe7\x9a\x68\x2f\x4c\x0f\x2b\x43\x4b\x37\
+\x7a\xb2\x0c\x8b\xc8\xb0\x84\xa3\x7a\x8d\x59\x84\x0b\xb7\x72\xe9\
+\xd2\xa5\x1f\x5d\xbb\x76\xed\x3f\xc8\xd1\x9b\xa7\x21\x05\xdc\xa7\
+\x10\x27\xc8\x08\x7a\xf9\x96\x2d\x5b\xfe\x45\xf7\x19\x6e\xb4\xe5\
+\xcf\xc1\xbd\x08\xc2\x72\x41\x70\x7d\xd7\x5d\x77\x7d\x40\x71\x9f\
+\xe5\xeb\x0e\x9c\x18\xc3\x7f\x91\xd9\xb3\x72\x0c\xaf\xf0\x30\x40\
+\x38\x5e\x14\x76\x2f\x67\xf5\xea\xd5\x5f\x92\x3b\x16\x95\x25\x32\
+\xe3\xb8\x2c\x10\x4d\x3f\x91\xdc\x40\xf7\xa9\x53\xa7\xce\x51\xbe\
+\x3e\xb3\x7e\xfd\xfa\x6f\x8b\xf0\xec\x60\x62\xab\x38\x60\xda\xa6\
+\x4d\x9b\xbe\xb2\x6e\xdd\xba\xaf\x2b\x2d\x7a\x69\xb6\xa7\x29\x1c\
+\x66\x2c\x81\x85\x2d\x54\x56\x5e\x2c\xab\xd0\xf6\x42\x99\xa3\x82\
+\xd2\xf9\xe0\x3a\x7c\x90\x6e\x18\xf6\x6c\xdf\x22\xc7\xcb\x44\x58\
+\x64\xda\x75\x2a\x17\x0e\xc7\xbc\x45\xb2\xaf\xfb\xf3\xa2\x01\x1a\
+\x4b\xc2\x9a\x4e\x76\x3e\xa2\xdd\x1f\x0e\x2c\x0d\x3b\x78\x9b\x17\
+\x94\xff\xe1\x2f\x89\xd8\x73\x83\x24\xe8\xfc\x70\x9f\x32\xe1\xff\
+\x50\x1d\xe5\x4a\x1c\xfb\x1f\x3e\xa9\x24\x0c\x4b\x8b\xff\xac\xc2\
+\x23\x2e\xe1\x29\xa3\xa1\xa4\x19\x2e\x4b\x3a\x1e\x76\x6c\x57\xb4\
+\x2c\x81\xf9\xd9\xc9\x32\x96\x77\xab\xd7\x51\xdd\x52\xc1\xf4\x86\
+\x88\x39\xc1\xc6\xf4\xe1\x79\xd2\x09\xe4\xda\xf2\x61\xf7\x92\xb9\
+\x68\x7e\x79\xbe\xa6\x4b\xaa\x77\xc8\xc2\xb0\x48\xc8\xf2\x42\x59\
+\x0c\xa5\x0e\x86\xc3\x31\x4c\x69\x87\x51\x9b\x0e\xe1\xe7\x65\xe5\
+\x36\xd4\x93\x65\x20\x21\xee\x5b\x7d\xb5\x93\x65\xa2\xe5\x6b\x72\
+\xf9\xd2\x0e\x3a\x10\x16\x9d\x86\x52\x66\xe1\x70\x74\x2c\xec\xf4\
+\x23\xf3\x8b\x7e\x7d\x22\x0c\x2b\x53\xa6\x8d\x08\x4b\x7e\xc2\xe5\
+\x9f\xcc\x59\x38\x2b\x37\xd6\x66\xd8\xb6\x8d\x68\x7d\xb3\x74\xa3\
+\x27\xcb\x30\x4a\x00\x12\xe9\x75\x43\x48\x54\xe1\x47\x03\x96\x79\
+\x0a\xed\x12\xf3\x69\xb2\x7a\x7e\xd8\xd4\xd4\x44\x0f\xc0\xac\x22\
+\x40\xe1\x94\x8a\xc4\xee\x6f\x68\x68\xa8\xeb\xea\xea\x2a\x15\xe1\
+\x7c\x28\x3b\x3b\x9b\xde\x2f\xf7\xd0\x2f\x5c\x99\x4d\x2e\xe0\x1e\
+\xd7\x0f\x15\x16\x16\xfe\x6a\x67\x67\x67\xa3\xac\xb8\x20\x3f\xfa\
+\x9f\x21\x0b\xb4\x4e\xff\xef\x15\xa9\x71\x16\x22\xbd\x09\xd3\x27\
+\x0a\xfc\xb8\x17\x53\xda\x14\xfc\xcb\xb1\x2a\x91\x11\xdc\xd4\x7f\
+\x59\x86\xf5\xb2\x32\x5f\xa3\x74\xb0\x02\x08\x6b\xe5\xc6\x35\x2e\
+\x0c\xee\xf5\xe5\xe6\xe6\x6e\xac\xae\xae\xfe\x88\xf2\x5c\xa9\xbc\
+\x5f\xa9\xa8\xa8\x60\xfe\xc1\x86\x22\x0c\xe7\x1a\x1b\x1b\x77\x1c\
+\x3a\x74\xe8\xef\x65\x71\xd2\xc0\xd0\x10\xa0\x0f\x61\xa2\x72\xc7\
+\x02\x18\x72\xa6\x47\xc6\x4b\x8b\x7e\xe8\x19\x6e\x44\xa8\xe8\x80\
+\x9e\x2c\xd6\x88\x2d\xe6\x08\xe7\x19\xf0\x9b\xf2\x65\x5e\x86\xde\
+\x22\xf3\xbd\xc8\xb4\x67\x8a\x4c\x7b\x29\xed\xb7\xa5\x43\x3c\x1c\
+\xbd\x75\xce\xc2\x64\x51\x47\x50\xe6\x72\x89\x60\x2f\x0d\xfa\x01\
+\x08\xea\x46\x61\x32\x79\xf9\x81\xd5\x07\x60\xd7\xe4\x0b\x92\x46\
+\xaf\x44\xf5\x2e\x11\x2c\xaf\xfc\x27\x0e\x0e\xeb\x10\xeb\x02\xb9\
+\x96\x9e\x81\x70\x06\x16\x6e\xb0\x6d\x87\x06\x94\xb2\xb4\x7a\x44\
+\x23\x62\x8d\x94\xfd\xb6\xb2\xb0\xb2\xc4\x2a\xe2\x90\x6d\x1a\xd4\
+\x54\x65\x09\x2c\x2f\xa6\x8b\x95\xc5\x48\x40\x5a\xe1\xe7\xc1\x33\
+\xc7\x52\xa5\x03\xcb\xbd\xf0\xb3\x43\x6f\xf4\x22\x1f\xa4\x6d\xf9\
+\x42\x1f\xf2\x4b\x5c\x3a\x6a\x58\xfb\x56\xe6\xe1\xf2\x89\x82\xb8\
+\xa4\x41\xa7\x06\x2b\xd8\xd6\x1c\xe0\x47\xbc\x68\x1d\xe4\xda\x9e\
+\x8d\xe9\x06\x81\x60\xd1\xd0\xae\x01\xee\x83\x44\x65\x82\x3e\xc4\
+\x1b\xac\x1e\x9a\xbf\x85\x33\x58\xb9\x1b\xc8\x23\xf2\xe8\xc0\xf0\
+\x1e\xfc\xa7\x9c\xe9\x0f\xc2\xfa\xe2\xac\x0c\x4d\x7f\xca\x8c\x51\
+\x02\x3a\x71\x36\xdf\x48\x1c\x10\x4d\x2b\x0c\x8b\x8f\xa5\x86\xd5\
+\x4d\x9b\x15\xad\x6f\xa6\x3b\xbf\xad\x1c\xb9\x8f\x7e\x38\x46\x04\
+\x29\x37\x46\x03\x2c\x5e\x22\x20\x17\x58\x5d\x4b\xa5\xd7\x0d\xc1\
+\x0a\xed\x46\x81\x82\x89\x94\xa4\xd0\xf0\xef\x3d\x78\xf0\xe0\x37\
+\x9e\x7e\xfa\x69\x86\x50\x80\xf9\x73\x0a\xcd\xbd\x1d\x1d\x1d\x13\
+\x33\x32\x32\xd8\x77\xd8\xdd\xdc\xdc\xdc\xbf\x78\xf1\xe2\x5f\xdd\
+\xba\x75\x2b\x3d\x4d\xc2\x10\x36\x11\x02\x7f\x59\x9b\x1b\xfb\xfa\
+\xfa\x30\xb9\x29\xfc\x01\x1d\x20\x30\x11\x1a\x0f\xfa\x15\xcb\x96\
+\x2d\xb3\x15\x55\x49\x51\x5b\x5b\xfb\xa9\xfe\xfe\xfe\x07\xc3\x24\
+\x68\x60\x7f\x9f\xc8\x30\x26\x62\xb3\xd3\x5e\x92\x3d\x38\xd0\x57\
+\x54\x54\xf4\x1a\x59\x92\xef\x10\x01\xa6\x29\x6e\x27\xf1\x45\xf2\
+\x05\x73\xe6\xcc\x79\xc1\x1e\x29\x95\xcb\xdf\x2b\xcf\xb6\x54\x1e\
+\x24\xcb\xef\x40\xde\x6e\x23\xd0\x81\xe1\x09\x36\xb0\xdb\x57\xc7\
+\x79\x71\xf1\xa7\xd2\x72\x4d\xd9\xf0\x62\x71\x34\x18\x61\xb8\x97\
+\x28\x4f\xd6\x10\xb1\x70\x86\xe1\x43\x1a\x7c\x3e\xcd\x42\x78\xe4\
+\x98\x5c\x1c\x1d\x19\x1c\x60\xf8\x8e\x83\x14\x18\xa6\xe2\x9a\xfb\
+\x89\x9e\x87\xf9\xd1\x5b\x87\x1c\xec\x18\x34\x5b\x8d\x99\xac\x9c\
+\x53\x81\xb4\x80\x6d\x01\x81\xf0\x19\x2e\xb7\x7d\x5d\xc8\x34\xb9\
+\x0c\xe3\xd1\x48\x0c\xe7\x1d\xb3\xbc\x13\x07\x52\x62\x68\x39\xd1\
+\x21\xee\x51\x90\x26\x61\x18\x71\x61\xb8\x0c\xeb\x90\xba\x8f\x1f\
+\xe5\xc6\x73\x42\x36\xbf\xd1\x99\x67\x45\x03\x05\xc1\x42\x80\xcc\
+\xef\xd8\x41\x04\xc9\xd2\xb1\xbc\x53\xe6\x00\x39\x2c\xa8\x31\xcb\
+\x66\x38\xe5\x49\x58\xe4\xb1\x77\x2c\xbc\x3f\x8d\xe5\xf9\xcc\x43\
+\x41\xea\x34\x94\x58\xd4\x46\xec\xa4\x87\xfe\xc4\x23\x3f\x96\x2f\
+\x56\x4f\xd2\x89\x24\xdf\x2c\xf2\x21\x4c\xf8\x39\xa4\x02\x79\x25\
+\xbc\xd5\x41\x86\x21\xd9\xeb\x4a\x1a\xc8\x0f\xd7\x41\xae\xa3\x75\
+\x90\xf6\x80\xe1\x4e\xac\x5a\x80\x85\x4b\xb9\x27\xaa\x0f\x0c\xe1\
+\x33\x64\x88\x1c\xc0\xbc\x1a\x20\x7d\x60\xe1\x20\x36\x60\x23\x59\
+\xb6\x9f\x33\x51\x7e\xd0\x1f\xdd\x98\x4e\xe0\x7d\xa3\xcd\x44\x2e\
+\xfe\xa6\xaf\xe9\x4f\x19\xda\x6f\x86\x4b\x7f\x5f\x0e\x8b\x0c\x02\
+\xe5\xbd\x03\x94\x31\xb0\x67\x9c\x0c\x56\x6e\x58\xdf\xc8\x60\xe8\
+\xd6\xa6\xb4\x48\xc3\x08\xcc\x7e\xa3\x0b\x64\xc8\xb6\x15\x56\xd9\
+\x32\x5d\x91\x68\xf8\x3d\x0a\x2b\x0b\xd3\xcb\xca\x62\xd4\x81\x22\
+\xa3\x89\x54\x19\x0b\xdf\xb3\xeb\x8a\x4d\x9b\x36\xfd\x8e\x88\x20\
+\x0f\x22\x34\x7f\x41\xff\x26\xe4\xcb\x6f\xaf\xc0\x72\x7b\xb3\x94\
+\xc2\xb2\xed\x77\xf6\xca\x95\x2b\x3f\x23\xf2\x7a\x50\x56\xe0\x80\
+\x55\x08\x58\xb5\x9a\x93\x93\x53\x20\x8b\xf4\x73\x22\xa5\x64\xab\
+\x3a\x03\xbf\x82\x82\x82\xb7\x2f\x59\xb2\xe4\x43\xed\xed\xed\x2d\
+\xec\xf3\xb8\x7e\x2b\x50\x86\x7d\x8b\x4c\xe8\xfe\x54\xba\xd0\x58\
+\x33\x94\x90\x4c\x97\x9c\xf5\xeb\xd7\xbf\x55\x71\x36\x88\xdc\xdb\
+\xe2\x62\xb8\x17\x6c\x87\x90\x45\xd9\xb7\x7d\xfb\x76\x2c\x54\x5e\
+\x1c\x8b\x13\xdc\x17\xc2\xf2\xc2\x88\xa6\x75\xbb\x61\x65\xc8\xbc\
+\x1d\x0d\x35\x5b\x18\x18\xee\x86\x10\x98\x8b\x62\xc3\xf8\x70\xe6\
+\x38\xc3\xe1\x98\xc3\x62\x2e\x10\xc7\x50\x12\x73\x41\xa4\xc5\x28\
+\x02\x65\xf6\x88\x1c\x5f\x6f\xa0\xd7\x39\x14\xf9\x56\x76\xcc\x2d\
+\xd2\x7b\x65\x95\x30\xe5\x6f\x3d\xd4\xe1\x96\xab\xc5\xa1\xc1\xa3\
+\x47\xcc\xc1\xe3\x34\xc2\xcc\x0f\x86\xe5\xd9\x35\xc3\xb2\xe1\x13\
+\x33\x06\x03\x71\x98\x5b\x41\x4f\xe6\x78\xec\x90\x87\x68\x9d\x4d\
+\x06\xc2\x22\x03\xc7\xbc\x11\xfb\x50\x99\x3f\xe5\x59\x31\xec\x0e\
+\xa9\xd0\x20\xd3\x50\xd3\x28\xf1\xbc\x08\x8b\xbe\x80\xeb\x64\xb0\
+\x3c\xd1\xa8\xb1\x60\x02\x12\xa0\x21\x64\x2e\x2d\x9c\xf7\xa1\xc2\
+\xe2\x70\xbe\x2f\x43\x71\x94\x29\x8d\x33\x3a\x41\x70\x66\x05\x30\
+\x17\xc8\x68\x0a\x8b\x66\xd8\xe2\x41\x38\xda\x03\xe6\x8f\xa9\x67\
+\xe4\xc3\x0e\x52\xc0\x0d\xb5\xac\xc2\x08\x97\x1b\x1d\x26\x2c\x2c\
+\x3a\x5a\xac\x86\xb4\xe3\xc7\xa8\x83\x58\x8d\x2c\x32\x81\x6c\xa8\
+\x43\xf6\x6c\xd0\x89\x3c\x30\x07\xc7\xe1\x0e\xac\x75\x08\x97\x89\
+\x85\x63\x51\x17\x5f\xc2\xe0\x19\x90\xd7\x64\x64\xc0\x5c\x3b\x1f\
+\x16\x60\xbe\x8d\x3d\xa5\x89\xc2\x84\xc1\x7d\x40\x18\x48\x88\x74\
+\x18\x55\x63\x15\x2d\xef\x26\xcf\x8c\x0e\x03\x04\x88\xee\xbc\x47\
+\xd6\x49\xc5\xa1\x1b\xd3\x18\xbc\xcf\x8c\xb0\xfc\xa5\xdc\x50\x10\
+\xae\x9b\xa4\x43\x7d\x63\xa8\x96\x91\x2f\xea\x1b\x65\x44\x1e\x79\
+\xa6\x74\x36\xe8\x34\xa1\x63\xb8\xbc\x53\x81\x70\x2c\xe6\xe2\xb0\
+\x08\x16\xc8\xb1\x60\x6f\xb0\xb2\x18\x11\xac\x00\x47\x02\x53\x68\
+\xee\xa2\x45\x8b\x56\x1d\x3e\x7c\x98\xd5\x66\x46\x12\x20\x95\xb2\
+\x41\x01\x2e\x5c\xb8\xf0\xf5\x58\x4f\x9d\x9d\x9d\xd7\x44\x1a\xd6\
+\x8b\x08\x20\x32\xe9\x13\x01\x15\xea\xff\xe1\xc7\x1f\x7f\xdc\xc6\
+\x8a\xa3\x30\x1d\x62\xab\x57\xaf\xfe\x43\xf1\xde\x2b\xe5\x20\xc3\
+\x0c\x08\x2c\x33\x33\xb3\x44\x04\xf4\xed\x7d\xfb\xf6\x51\xf9\x52\
+\x15\x60\x70\x4f\x56\xdc\x67\xa5\xc7\xab\x25\xa3\xc1\x64\x84\x48\
+\x90\xb1\x7a\x7a\xb0\x49\xe5\xac\x58\xb1\xe2\x7d\x8a\xb7\x16\x42\
+\x96\x1c\x5e\xe6\x01\x48\x66\x0f\x9b\xee\x9b\x9a\x9a\xb6\x1d\x39\
+\x72\x84\xa1\x9f\x54\xfa\x00\xee\x03\xc2\xe4\x4c\x9d\x3a\xf5\xe1\
+\x0b\x17\x2e\x50\xa1\xec\x5b\x86\x23\x79\xe1\x47\x0b\x83\xa5\x3f\
+\xd4\x8a\x1e\xc6\x50\xf3\x44\xb9\xe0\x6e\x67\xfe\x6f\x15\x46\xf2\
+\x9c\x87\x53\x3e\x63\xb9\x2c\xc9\x3b\x18\x8a\x6e\x23\xa9\x6f\x89\
+\x30\x9c\xf2\x1e\xc9\xb3\xb9\xd9\x18\x4e\x39\x84\xf5\xa7\x0e\x8c\
+\xb4\xec\x88\x8b\x2c\xeb\xb8\xa4\xc2\x70\xeb\xdb\x8d\xe8\x35\x2c\
+\x3c\xaf\xb1\x1e\x26\x82\x42\x9f\x31\x63\xc6\xba\xc9\x93\x27\xbf\
+\x59\x0d\xf5\x92\x96\x96\x96\x1e\x91\x1a\xbd\x0e\x32\x6a\x99\x4e\
+\x8a\x6b\xd7\xae\xd5\x4f\x9a\x34\x69\x6a\x7c\x13\x7e\xa7\x48\x04\
+\xef\xe0\x8f\x48\xa8\x5f\xc4\x11\x3b\x71\xe2\xc4\x1e\x59\x69\xf4\
+\x24\x4c\x56\x54\x26\xbf\x7b\x45\x12\x3f\xad\xaa\xaa\x9a\x23\x02\
+\x5a\x2c\xd2\xc1\x3a\x29\xd0\xf5\x11\xf6\xf8\xe9\x3a\x6c\x41\x00\
+\xae\xa3\xbf\xd9\xd2\xb0\xaf\xba\xba\x7a\x93\x74\xa1\xe7\xc9\x66\
+\xf7\x52\xe9\xb4\x2d\x05\x09\x9a\x8c\xa0\x2c\x94\xf7\x0a\x95\xc5\
+\x42\xc5\xef\x56\xbc\x01\xf9\xd2\xa7\x4f\xba\x14\x28\x9f\xa7\x64\
+\x9d\x7e\x4b\x59\xa3\xa7\x1f\x4e\x3f\x0c\xfc\x2d\x9d\xf4\xe2\xe2\
+\xe2\xb5\xcb\x96\x2d\x7b\x87\xca\xe9\x6e\x11\xfb\xb5\xfa\xfa\x7a\
+\x2b\x8b\x5b\x52\x41\x92\xc0\xd2\xa6\xfe\x58\x3e\x28\x03\x7e\x73\
+\x6f\x24\xba\x59\x1c\x93\x63\x40\x3e\xbf\xc3\xb2\x87\x2b\x1f\x99\
+\xe1\x72\x1d\x0d\x0c\x45\x26\x61\x80\x85\x1b\x8a\x23\x9f\xc4\x1b\
+\x49\x3e\x0d\x16\xcf\xca\xcd\x10\x96\x0f\x46\x9a\xc6\x68\x96\x27\
+\x32\x4c\x5e\x18\x61\xdd\x2c\x1f\xfc\xb6\xf0\xfc\xb6\xf4\x6f\x54\
+\x07\x83\xc9\x09\xcb\x07\xfc\x0f\xeb\x00\xa2\x69\x5a\x78\xd3\x29\
+\x11\xc2\xe5\x96\x0a\x23\x2d\x5f\x0b\x4b\x3c\xf4\x41\x0e\xe0\xb7\
+\xe5\x09\x10\x2e\x2a\x77\xa4\x69\x02\x0b\x1f\x4e\x03\xf0\xdb\x1c\
+\x48\x94\xee\x60\xb8\x11\xbd\x86\x8c\xb0\xd2\xc3\x45\xa0\x54\x45\
+\x45\xc5\xab\x62\xb1\x58\x51\x57\x57\x17\x56\xcb\xaa\xca\xca\xca\
+\x45\x22\x25\xc6\xc9\xcd\xec\xc7\x25\x43\xf3\xe5\xcb\x97\x1f\x9d\
+\x38\x71\x62\xae\x30\xaf\xbb\xbb\xbb\x4f\xfc\x61\x99\x95\xd8\xd8\
+\xb5\xa3\x47\x8f\x32\x34\x9a\x88\xc8\xc2\xe0\x77\x9f\xd2\xdd\xa6\
+\xf4\x17\x48\xc6\xa2\xfc\xfc\xfc\x96\xdd\xbb\x77\x43\x82\x8c\xe1\
+\x53\x98\x26\x97\xb0\xe1\x6b\x03\x61\xda\x9e\x7b\xee\xb9\x67\xa7\
+\x4f\x9f\x7e\xbf\xac\x3a\x96\xaf\x6f\x17\x09\x72\x10\x32\x96\x6e\
+\x58\x06\x08\xcb\x09\x20\xc2\x3e\x3b\x6d\xda\xb4\x95\x8a\x5b\x24\
+\x1d\x82\x1e\x92\x38\x30\x2d\x2f\x2f\x2f\x57\xe4\xb8\x6b\xcf\x9e\
+\x3d\x5f\x12\x09\x32\x07\xf2\x82\xb8\x71\x98\x3e\xdc\xab\xd9\xb0\
+\x61\xc3\xdb\x95\x9f\x57\xb4\xb5\xb5\xe5\x29\x7e\x07\x1d\x03\x95\
+\x17\x4b\xa2\x13\xc5\xbd\x1d\x40\x0f\xd3\x85\xff\xa3\xd1\x43\x36\
+\x39\xe1\x3c\xde\xa8\x6c\xe2\x9b\x1b\x2d\x0c\x45\xe6\x48\xd2\x1b\
+\x4c\xe6\x70\x80\x9c\x44\x65\x79\xa3\xf2\x4d\xc6\x8d\xca\x31\x0c\
+\x26\x8b\x7b\xe1\xe7\x6f\xbf\x47\x2b\xfd\x28\x12\xc9\x8f\xea\x10\
+\x05\xf7\xcd\x25\xc3\x50\xc2\x80\xa1\x86\x4b\x85\x68\x7c\xae\x53\
+\x95\x99\x85\x4f\x76\x7f\x28\x88\xa6\x31\x5a\x32\x6f\x54\xc6\xa0\
+\x18\x29\x11\x5a\x83\x5d\xb8\x60\xc1\x82\x57\x76\x74\x74\x64\xc9\
+\x7a\xea\x15\x91\x75\xab\xa1\xaf\x98\x33\x67\xce\xfa\x92\x92\x92\
+\xca\x2b\x57\xae\xb0\x60\xc0\xf6\xde\x25\x02\xfe\xbd\x6a\xdc\xf7\
+\xcb\x1a\xbb\x36\x7b\xf6\xec\xc5\x22\xd4\x6c\x91\x47\x97\x88\x31\
+\xff\xe9\xa7\x9f\xfe\x9e\x64\x33\x41\x6a\x24\xc4\x7f\x26\xc5\x19\
+\xdf\x7e\xde\xe2\x18\x81\xeb\xee\x8b\x17\x2f\x6e\x93\x9c\x35\x87\
+\x0f\x1f\xfe\xae\xe2\x46\x37\xba\x07\x72\x0a\x0b\x0b\x1f\x96\x75\
+\x36\x5f\x69\x31\x39\x6f\xb2\x03\xf9\x22\x9c\x0b\x4d\x4d\x4d\x99\
+\xb2\x2e\xf3\x1e\x7d\xf4\x51\xc6\xea\x59\x44\x10\x96\x61\x69\x32\
+\x81\xcb\x3e\x20\xc6\xfb\x4d\x37\x16\xfb\xf4\x4d\x99\x32\x65\x95\
+\x8a\xa2\x43\x84\x98\x25\x42\x4e\x7b\xe2\x89\x27\xfe\xe9\xec\xd9\
+\xb3\xff\xc4\x7d\x39\xe2\x27\x7a\xa8\xe6\x5f\xb2\x72\xe5\xca\xd7\
+\xcd\x9a\x35\xeb\x8d\x22\xc0\x4a\xe9\xd8\xae\xb2\xed\x97\xac\x09\
+\xb2\x0e\x73\xce\x9c\x39\xc3\xd7\xa9\xc3\x43\xd0\x0e\x87\xc3\xe1\
+\xb8\x01\x8c\x94\x08\x8d\x3c\xee\xe2\xdb\x83\x22\x9c\x4e\x35\xd6\
+\x8c\x06\xf2\xb5\x09\x86\x47\x7b\x65\xbd\xcc\x61\x95\x65\x63\x63\
+\x63\x97\x7e\x33\xc9\x9c\x0a\xe9\x22\xbf\xd3\x6a\xe4\x8f\x28\xce\
+\x3c\x5d\x57\xa6\xa7\xa7\x9f\x3b\x7e\xfc\x38\xa7\x24\x0c\x90\x87\
+\xd2\x98\xbf\x79\xf3\xe6\x8f\xca\x4a\x2a\x39\x7f\xfe\x3c\x2b\x9b\
+\x20\xa7\x30\x21\x70\xdd\x29\xd2\xf9\x89\x74\x62\x75\x20\x64\x69\
+\xa4\x13\x90\x59\x41\x41\x41\x2d\xc7\xb0\x49\xc6\xdd\xb2\xfe\x1e\
+\x15\x61\xd9\x81\xdb\x84\x0b\xc2\x4a\xdf\xa7\x24\xe3\xdf\x75\x69\
+\x43\x98\x26\xc3\xae\x63\x6b\xd7\xae\x7d\x8b\x08\xff\x8d\xe7\xce\
+\x9d\x7b\x5a\xe4\xcf\x02\x87\xe0\x9e\xe2\x9e\x17\x89\x2e\x13\x71\
+\x4d\x15\x71\x3d\xb7\x7d\xfb\xf6\x2f\x63\x0d\xea\x1e\x69\x00\x93\
+\x15\x46\x10\x57\x04\xbd\x51\x24\xf8\x1e\xc5\x5d\x2c\x39\xdd\xca\
+\x6f\x0f\x65\xca\x7d\x95\x09\x73\x8c\x25\xd2\x8b\x55\x6d\xb6\xcc\
+\x3d\x91\x2c\x87\xc3\xe1\x70\x0c\x03\xd6\x38\x8f\x14\xad\x22\x81\
+\xab\xb2\xde\x38\x39\x06\x52\x0d\x88\x09\x52\xd4\xef\x66\x35\xe6\
+\xa5\xb2\xce\xb0\xe0\x00\x8d\xbd\x21\x7c\x0d\x88\x87\x2e\xc7\x77\
+\xef\xde\xfd\x19\x59\x6b\x07\x8e\x1d\x3b\xc6\xca\x26\xac\x49\xfc\
+\xb9\x9f\xb3\x66\xcd\x9a\x37\x34\x34\x34\xf4\x88\xbc\x36\x89\x88\
+\x58\xc2\xcf\x2a\x43\xc8\xc0\xe4\xd9\x35\x43\xb3\xac\x90\x33\x98\
+\x8c\x99\x22\x41\xf6\x34\x66\xb6\xb6\xb6\x66\x2e\x5b\xb6\x8c\xe5\
+\xd6\x9c\xb4\x61\xe9\x1b\x88\x8b\x8c\x80\xa0\xf0\x10\xec\xba\x40\
+\x69\xbf\x4f\x3a\x6c\x96\x2e\xdd\xd2\x89\x73\x2f\x59\x35\x86\x0c\
+\xca\xa0\xeb\xd9\x67\x9f\xfd\x71\x2c\x16\x7b\x66\xdb\xb6\x6d\x6c\
+\xc2\x67\x4e\xcf\xd2\x0f\x13\x17\xf2\x4c\xef\xe0\x7f\xdc\x22\xae\
+\x14\xe9\x35\xab\x0c\xcd\x5f\x3f\xfb\xd2\x25\xaf\x40\x44\x88\x4e\
+\x90\xb3\xc3\xe1\x70\x38\x46\x09\x23\xb5\x08\xad\x41\x7f\x4e\x16\
+\xca\x76\x59\x5f\xcd\xd3\xa6\x4d\xab\x52\x83\x5d\x2a\xeb\xa7\x47\
+\xd6\x5c\x3f\x8d\x77\x7e\x7e\x7e\xfa\x9e\x3d\x7b\x58\x8e\xcb\x3e\
+\x17\xc8\xc0\x88\xca\xfe\x87\x61\x7e\x9d\xb2\xb2\xf6\xb6\xb7\xb7\
+\x63\xf9\x0c\x6c\xa9\x90\xac\x07\x27\x4f\x9e\xcc\x17\xeb\xd9\xbb\
+\xc4\x10\xec\x0c\x3e\xde\x2b\xcb\x90\x55\x94\x10\x57\x54\x9e\xc1\
+\xd2\x2b\x58\xb5\x6a\xd5\x17\x44\x60\xf3\x64\x65\xb5\xcb\x49\x54\
+\xef\x24\xe9\x7d\xd7\x85\x0b\x17\xb0\xfe\xa2\xf3\x90\x61\x98\x8c\
+\x32\x48\x50\x59\x5c\xa4\xf4\xdb\x90\x21\x82\xaa\x14\x21\x8a\xbf\
+\x82\x61\xd6\x20\x9c\x74\x3f\x2f\x99\xbb\x75\x1d\x1d\x56\x35\x98\
+\x3c\x43\xf0\xfb\xf2\xe5\xcb\x59\xb2\x32\x97\xa9\x03\xc1\xe2\x1a\
+\x16\x0c\x4d\xc8\xcc\xcc\xcc\x53\x47\xa3\x49\xf7\xfe\xed\xc9\x27\
+\x9f\x64\xb9\x3a\xd6\x20\x08\xc7\x77\x38\x1c\x0e\xc7\x08\x31\x52\
+\x22\x0c\xa3\x47\x0d\xff\xb1\x33\x67\xce\x3c\x9a\x93\x93\x93\x5e\
+\x5e\x5e\x3e\x4b\x04\x93\x2b\xd7\x23\xab\x06\x52\x63\x13\x3d\x2b\
+\x2e\x69\xb8\x63\x4b\x96\x2c\xf9\xb5\x2b\x57\xae\x30\x64\x19\xde\
+\xfb\x13\x06\xbf\x21\xc0\x01\x12\x94\xab\x5c\xb7\x6e\xdd\xaf\x34\
+\x37\x37\x63\x6d\xf6\x33\x5c\x28\x92\xe8\x92\xab\x9c\x3e\x7d\xfa\
+\x22\x91\x21\x56\x57\xca\xb9\x48\x59\x6e\x9f\x16\x39\xdf\xab\x38\
+\xc1\xf6\x0a\xfc\x74\x0d\x81\xce\x16\xa1\x96\x4b\x06\xfb\x91\x48\
+\x2b\x91\x3e\xf8\x97\x4b\xc6\xfb\x95\xaf\x59\x92\x03\x09\x32\x0c\
+\xcc\x30\x6a\x5f\x75\x75\xf5\x0c\xe5\x9f\x3d\x4d\xe1\x93\x61\xec\
+\x74\x85\x30\x61\x71\xcf\xe4\x2d\x51\xba\x2f\x6d\x6c\x6c\xb4\xbd\
+\x35\xa0\x63\xea\xd4\xa9\x9b\x44\xd6\xca\x66\x86\x8a\x33\x27\xfd\
+\xb9\xe7\x9e\xdb\xb1\x7f\xff\xfe\xaf\x88\x6c\xd9\xc4\x0d\x59\x3b\
+\x1c\x0e\x87\x63\x14\x31\x1a\x44\x48\xc3\x8e\xd5\xd3\x59\x5f\x5f\
+\x7f\x50\x84\xb0\xaf\xa4\xa4\xa4\xac\xb4\xb4\x74\xae\x1a\xf4\xe3\
+\xb2\x8c\x38\xbd\x82\x30\x60\xc9\x82\x05\x0b\xde\x20\xcb\x6e\xb5\
+\x08\xac\x54\x24\xc9\x89\x06\x34\xee\x66\x2d\x46\x11\xf8\x2f\x5d\
+\xba\x94\x2f\x0c\xb0\x59\xb5\x39\x4e\x62\x9c\x1c\x03\x91\x11\xb7\
+\x7c\xd6\xac\x59\x2b\x65\x99\xb2\xc7\x8e\x4d\xa3\x96\x16\x30\xb9\
+\xab\x66\xcf\x9e\xfd\xbb\x6d\x6d\x6d\x4d\x22\x18\xfc\x02\x40\x66\
+\xb2\xee\x3a\x65\x6d\x2e\x97\xde\xcc\xe3\xd9\xb7\xcb\x4c\x17\x23\
+\xad\x19\x1b\x36\x6c\xf8\xb0\xf2\x33\x45\x24\xd8\x6a\x3a\x08\xa8\
+\xd1\x8d\x65\x59\x51\x51\x11\x63\xfb\x05\x7e\xd7\x6f\xbd\x00\x26\
+\x8b\xd5\xb5\xbf\x58\x5b\x5b\xfb\xe6\xe2\xe2\xe2\x39\x4a\x97\x63\
+\x9a\x4c\xef\x76\xdd\x5b\x2e\x0b\x90\x8d\xbc\x07\x77\xef\xde\xfd\
+\x95\xba\xba\xba\x1f\xeb\xda\xb6\x6e\x38\x1c\x0e\x87\x63\x94\x31\
+\x1a\x44\x08\x68\xe0\x69\xa8\x71\x4d\x57\xaf\x5e\xdd\x2d\xd7\x7c\
+\xed\xda\xb5\x2b\x22\x0f\x0e\x57\x25\x9d\xfe\x9a\x9a\x9a\x57\x67\
+\x66\x66\x56\xb1\x12\x52\xbf\xe7\x8b\x9c\x56\xb4\xb6\xb6\x5e\x95\
+\x45\x99\xcc\x3a\x0c\x70\x59\x90\xd5\x55\x8d\x05\x28\x22\x62\xbf\
+\x61\x10\x4e\xff\x20\xb2\x0e\x11\x47\xa5\x08\x05\x12\xe3\x38\xad\
+\x20\x2d\xee\xc7\xff\x13\xf6\x42\x61\x61\x61\x86\x08\x6f\x8b\xc2\
+\x33\x2c\x1a\xc4\x97\xac\x5e\x59\x5d\x25\xb2\xca\xfe\x4a\xfa\xf2\
+\x85\x02\xfc\x2d\x2e\x30\x59\xeb\x94\xfc\x56\x11\x69\x83\x88\x74\
+\x60\xe3\xbf\xf4\x61\xd3\x7f\x81\xdc\xe9\xc7\x1f\x7f\x9c\x93\x0f\
+\xec\x98\xaa\x30\xf8\x6d\x72\xe7\xaf\x5e\xbd\xfa\xbd\xea\x24\xac\
+\x96\x75\xdb\xa6\x78\xd9\x59\x59\x59\xad\xb2\xf6\x58\x19\x4b\x5a\
+\x7d\xba\x2e\x54\xe7\xe1\xc0\xa9\x53\xa7\x18\x06\x0d\x7f\xad\x22\
+\xac\x97\xc3\xe1\x70\x38\x46\x09\xa3\x45\x84\x61\x04\x0d\xb7\x08\
+\xe7\x98\x48\x10\x62\xe2\x37\x43\x85\xa5\x8b\x17\x2f\x7e\xad\x88\
+\x2f\x43\x64\x48\xa3\xce\xbc\x5a\xa1\xac\xc3\xf5\x79\x79\x79\xc5\
+\xec\xdf\x93\x9f\xad\x10\x0d\x83\xdf\x4d\xb2\xf8\xf6\x2a\xec\xf4\
+\x58\x2c\x36\x03\x2b\x2e\x4e\x66\x0c\x93\xe6\xc8\xc9\xb8\x3c\x67\
+\x2b\x4c\x13\x02\x72\x2e\x2f\x2f\x9f\x2d\xf2\x59\x2a\x02\x0b\x86\
+\x6a\x25\x8b\x39\xcd\xff\x77\xe0\xc0\x01\xbe\xed\x95\x0a\xe7\x64\
+\xc1\xde\x25\xcb\x6f\xa2\xd2\x0a\x74\x14\x89\xf6\x89\xc4\x0a\x95\
+\x87\xa7\x45\x82\x7c\x9f\x2c\xd5\xd9\x79\x99\x53\xa6\x4c\x79\xe5\
+\xf2\xe5\xcb\xdf\xda\xd1\xd1\x51\xa2\x34\xdb\x54\x06\xc8\x98\xa0\
+\xbc\x17\x5c\xbc\x78\x91\x63\x9b\x82\xa1\x54\xca\x4c\xf7\xe9\x3c\
+\x80\x64\xf2\x1c\x0e\x87\xc3\x31\x4a\xb8\x11\x22\xa4\x91\xc6\x25\
+\x83\xdd\xb3\xa1\xc6\xa5\x33\x66\xcc\x78\x99\x88\x80\x13\x5b\x20\
+\x46\xe6\xd8\xd8\x7b\xd8\x27\x4b\x6d\xa1\xac\x43\x86\x27\x19\x2a\
+\x8d\x0e\x6f\x02\x7e\x77\x5e\xba\x74\x69\x6f\x65\x65\xe5\x44\x11\
+\xd8\x3c\x91\x52\x07\x44\x52\x50\x50\x90\x73\xe8\xd0\xa1\x6f\x74\
+\x5e\xdf\xa2\x11\x1e\xd6\x0c\x23\x90\xa7\xf8\xbb\x95\xce\x06\x91\
+\x57\xa5\xd2\xe6\xfc\xbd\xc3\xfb\xf6\xed\xe3\xab\xce\x1c\x40\x9c\
+\x2c\x2f\xc8\xec\x39\x7f\xfe\x7c\xe3\xac\x59\xb3\xd6\x29\x6e\xaf\
+\x88\x14\x12\x2d\x14\x61\xf1\x45\x7e\xbe\x05\x97\xec\xfc\x51\x50\
+\xb5\x69\xd3\xa6\xdf\x28\x2a\x2a\xda\xa2\x4e\x40\x57\x7a\x7a\xba\
+\x6d\x89\xe8\x57\xfc\x34\x59\x87\x15\xb2\xfe\xf8\x5a\x33\x44\x6a\
+\xfa\x27\xd3\x05\x70\x2f\xd5\x7d\x87\xc3\xe1\x70\x0c\x03\x34\xbc\
+\x23\x05\x0d\xb6\x35\xfc\x89\x1a\x66\xbb\x67\x2b\x26\x1f\x17\x71\
+\x7d\x45\xa4\xd7\xc5\x70\xa2\xae\x83\x06\x9f\xd5\x91\xac\x3a\xd5\
+\xef\x29\xfa\xcd\x36\x04\x10\x95\x67\xe4\xd0\x2d\xeb\xeb\xcb\x22\
+\xbd\x1f\xca\xa2\x62\xeb\x44\xae\xc8\xe5\x60\x63\x63\xa3\x7d\xf1\
+\xde\xd2\x22\x6c\x98\xe4\x89\x4f\x5e\x1b\x77\xec\xd8\xf1\x61\xe9\
+\xd0\x2a\x62\x6a\x95\xac\x8f\xc8\xcf\xbe\x10\x60\xfa\x02\x86\x3f\
+\x4d\x07\x64\x62\xbd\xed\x93\xd5\xba\x4f\x24\x96\x2b\x4b\xb0\x40\
+\x04\xfe\xe3\x27\x9e\x78\x82\xc3\x69\x6d\xc5\x6a\x38\x3e\xb0\xf8\
+\x33\x15\x67\xb1\xf4\x64\x7e\x92\xdf\xc8\x22\x6c\x7e\x4e\x4e\x4e\
+\xcf\xc9\x93\x27\xf9\x14\x11\x2b\x4e\x81\xe9\x1f\x95\x05\x4c\x1e\
+\xf7\x12\xdd\x77\x38\x1c\x0e\xc7\x08\x70\x23\x16\x21\x1f\xd0\xe5\
+\xa4\x76\x4e\x79\x31\x58\x63\x9d\x10\x67\xcf\x9e\x3d\x71\xee\xdc\
+\xb9\xc7\x58\x4c\x53\x5c\x5c\x5c\x2d\x02\x64\x9b\x00\xdb\x2d\xd8\
+\x87\x78\xf8\xe2\xc5\x8b\x9c\xe2\x0f\xc2\x0d\x7d\x58\x26\xd7\x69\
+\x97\x2f\x5f\x3e\x50\x51\x51\x91\x3e\x71\xe2\xc4\x45\xbb\x76\xed\
+\xe2\x74\x76\xe6\xd2\xc2\xa4\x3e\x4b\x56\xd8\x3b\x65\x61\xb2\x22\
+\xd3\xb6\x45\x20\x93\x30\x75\xb2\xee\x18\x4a\xfd\x99\x08\xe9\xb1\
+\xb8\x5f\x40\x76\x72\x60\xea\x96\x2d\x5b\x3e\x78\xfa\xf4\x69\xb6\
+\x6f\xd8\x09\xed\x01\x44\x84\xd7\x16\x2f\x5e\xbc\xb5\xbe\xbe\xfe\
+\x07\x07\x0e\x1c\xe0\x1b\x6e\x81\x3e\x72\xa6\xef\x40\xd8\x10\xae\
+\x4c\x9d\x3a\x75\x99\x8c\xc8\x62\x11\x62\x8f\xfe\xb3\x1c\x34\x4f\
+\x64\xbc\x5f\x44\xfc\x97\xd7\xae\x5d\xb3\x0f\x91\x26\x43\x58\x26\
+\xd7\x9c\xd6\xcf\x57\xda\xd9\x53\xe8\x70\x38\x1c\x8e\x1b\xc4\x88\
+\x89\x50\x84\xb0\x69\xe1\xc2\x85\xeb\x4a\x4b\x4b\xab\xae\x5c\xb9\
+\xc2\x76\x06\x16\x8a\xd8\x96\x81\x44\x84\x00\xf0\x6f\xbd\x7a\xf5\
+\xea\xa3\x22\xa9\x4b\xf3\xe6\xcd\x9b\x2f\xcb\xaa\x20\x16\x8b\xa5\
+\x1d\x3a\x74\xe8\x47\xba\xe6\x53\x3b\x01\xa1\x2d\x58\xb0\xe0\x6d\
+\x22\x09\x08\x22\x7c\xf2\xcb\x00\x2e\x5d\xba\xf4\x8c\xac\x29\x4e\
+\x97\x21\x0e\x44\x66\xf7\xd3\xd7\xac\x59\xf3\xce\x9e\x9e\x9e\x35\
+\xb3\x66\xcd\x9a\x2a\xf2\x65\x25\x67\xf8\x68\x33\x56\x9b\x1e\x13\
+\x09\xda\xb7\xef\x02\xbf\xf8\xff\xa2\x8d\x1b\x37\xfe\x86\x08\x7a\
+\x11\xab\x5a\x45\x98\xac\x24\x0d\xa7\xdb\x74\xe2\xc4\x89\x03\xca\
+\x2f\x16\x68\xd8\x1f\x98\x8e\x4b\xe7\xcf\x9f\xff\x80\x48\x93\xd5\
+\xa0\xc8\xed\x11\xc9\xab\x98\x4a\x17\x49\xa7\x8c\xdc\xdc\xdc\xb6\
+\xdd\xbb\x77\xff\xdd\xa9\x53\xa7\xbe\xa9\xdf\x43\x3d\x2a\x2d\xb7\
+\xb6\xb6\x76\x91\xf2\xb3\x59\x6e\x8d\xac\xd9\x34\xe9\x60\xf3\xaf\
+\x0e\x87\xc3\xe1\xb8\x01\x8c\x98\x08\xd5\xa0\xcf\xc9\xcc\xcc\x2c\
+\x94\x35\x57\xa0\xc6\xb9\xa6\xba\xba\x7a\x8e\x08\x26\xa7\x49\xd0\
+\xed\x54\xfb\xdd\x68\xbc\x21\x8d\xb3\x22\xc3\x3d\x85\x85\x85\x93\
+\xcb\xcb\xcb\x27\x1d\x3d\x7a\xf4\x1b\xf2\xb3\xfd\x86\xb3\x45\x84\
+\x6f\x95\xcc\xd5\x6d\xd7\x61\x1f\xcb\x8c\x36\xfc\x58\x45\x36\x9c\
+\x18\x10\xd1\xa4\x49\x93\x1e\x92\xbc\x7b\xdb\xdb\xdb\xaf\x89\xec\
+\x66\xce\x99\x33\x87\x15\xa5\x58\x7e\x61\xe2\x32\x59\xf8\xd9\xff\
+\x98\x48\xf0\xd7\x21\x41\x11\xf2\x73\xb2\xda\xaa\x25\xa3\x53\x69\
+\x43\x38\x46\x72\xb8\xa8\x25\x36\x20\x4b\x16\x2a\x5f\xc4\x7f\x47\
+\x5e\x5e\x1e\xdb\x22\x20\xe9\x20\x6c\x4b\x4b\x4b\xb7\xca\x88\xaf\
+\x47\xec\x67\x38\x55\x04\xc8\x9c\x60\x58\x87\x64\x28\xae\xaa\xaa\
+\x5a\xb1\x6c\xd9\xb2\x2d\xca\x0b\x9d\x06\x2c\xe7\x3e\x59\xa4\xf5\
+\x8d\x8d\x8d\xe8\xe5\x70\x38\x1c\x8e\x1b\xc4\x88\x89\x50\x16\xce\
+\x3c\x91\x58\xb1\x1a\xf5\xee\xae\xae\x2e\xce\x17\xcd\x2e\x2e\x2e\
+\x9e\x31\x7b\xf6\xec\x79\x22\x90\x02\x11\xc8\x79\x05\x4b\xd6\xc8\
+\xe3\x0f\xb9\xf0\xb5\x87\x7d\xb2\xec\xd8\x03\xc8\xf6\x87\x20\x7c\
+\x4d\x4d\xcd\x03\x59\x59\x59\x35\xad\xad\xad\x1d\x25\x25\x25\x6b\
+\x64\x0d\x95\x1d\x3b\x76\x0c\xf2\xc0\xe2\x84\x3c\x0c\x46\x50\x46\
+\x28\xd3\x57\xad\x5a\xf5\x36\x71\x31\xdf\x22\x64\x2e\xae\x43\x44\
+\x3d\x4b\x04\x92\x2d\x59\xf6\xf9\xa2\x84\x20\x9e\xf2\xb2\x4e\x71\
+\x38\xde\x2c\x53\x84\xd8\x33\x63\xc6\x8c\xd9\xa7\x4f\x9f\xc6\xb2\
+\x0b\x6f\x8b\x08\x93\x97\x5d\xe7\xdc\x7f\xff\xfd\xbf\x22\x9d\x5f\
+\xa5\xbc\x33\x67\x18\x2b\x28\x28\xe8\x56\xde\xec\x4b\xcf\xed\xb2\
+\x7a\x4f\x1f\x38\x70\xe0\xbb\x4a\x23\xd1\x9c\x24\x72\xc2\xba\x15\
+\x2a\xed\x4d\x58\xdd\xf9\xf9\xf9\x33\x55\x96\xdc\xc3\xaa\x25\x5f\
+\xe9\xfa\xdd\xd4\xd0\xd0\xe0\x44\xe8\x70\x38\x1c\xa3\x00\x1a\xe4\
+\x11\x41\x16\x61\x9a\x1a\xe5\x5c\xe6\xbc\xd2\x04\x91\x07\x2b\x40\
+\x3b\x64\xfd\xc4\x66\xce\x9c\xc9\xf9\xa2\x89\x16\xbe\x84\xaf\x6d\
+\x5e\x0e\x72\x83\x08\x39\x49\x06\x72\x28\x14\xc9\xd6\x4a\x16\x8b\
+\x6a\x18\xc6\x6c\x39\x7f\xfe\xfc\xdd\xeb\xd6\xad\xe3\xeb\xf0\x7c\
+\x05\x99\x30\x26\xe7\x79\x8b\x4b\x64\x45\xbe\x51\x84\x97\x2f\xbd\
+\x82\x53\x69\x44\x82\x19\x22\xa6\x56\x11\xeb\xfd\xb2\xd6\x5e\x1a\
+\x0f\xf7\x02\x7d\xca\xca\xca\x5e\xa7\xb0\x5b\x65\x6d\xb5\x90\x15\
+\xfc\x24\xa3\xa7\xb9\xb9\xb9\x68\xe9\xd2\xa5\x9c\x25\x1a\x86\x11\
+\x18\x71\xb9\x2e\x5b\xbf\x7e\xfd\x07\x2f\x5c\xb8\x70\xb7\x48\xb4\
+\x15\x9d\x25\xa7\xab\xa8\xa8\x88\xaf\x44\xf3\x95\x66\xd0\x71\xfc\
+\xf8\x71\xbe\x0c\x6d\xa7\xe5\x98\xde\x06\x93\x69\xcf\xa3\x52\x16\
+\xe4\x52\x11\x7a\xba\x3a\x19\x1d\xd2\xa5\x4f\xe5\x40\x31\xeb\x32\
+\x33\x97\x13\x67\xe2\xe1\x1c\x0e\x87\xc3\x71\x83\x18\x71\x83\xfa\
+\xf4\xd3\x4f\xef\x95\xc5\xf3\x98\x08\xb1\x49\x8e\xbd\x81\xd9\x71\
+\x52\x84\x10\xc3\x43\xa3\xa5\x8b\x16\x2d\xe2\x13\xfe\x65\x72\x61\
+\x12\x01\xfc\xc6\xa1\x87\xf9\x95\xcb\x0a\xc2\xd2\xc4\x2f\x38\x4e\
+\x4d\xb2\x9b\x25\xb3\x66\xc5\x8a\x15\xbf\x2d\x82\xa9\xc1\x5f\xce\
+\xc2\x0f\x40\x71\x4e\x33\xdf\x28\x42\x1a\xb8\x27\x62\xea\x93\x75\
+\x97\x56\x51\x51\xb1\x30\xee\x15\x46\xa0\xcf\xe4\xc9\x93\xa7\x29\
+\xce\x04\x91\x61\xe0\x29\xb0\xb5\x21\x23\x3b\x3b\xbb\x47\x56\x1c\
+\x8b\x59\xa2\x40\x3e\x71\xe7\x88\xa0\x7f\x5b\xd6\xf0\x3c\x74\x44\
+\x57\xfc\xa5\x2b\xe7\xac\x42\x82\x7c\xe0\x17\x10\x3e\xb8\x17\x77\
+\x60\x40\x47\x59\xbd\x15\x1b\x36\x6c\x78\x99\x2e\x27\x5d\xf7\x99\
+\xd0\xa6\xf4\x39\xc6\x0d\xc2\xcc\x90\x5e\x39\x2a\xe3\x74\x91\x7a\
+\xdd\xb5\x6b\xd7\x76\x1f\x39\x72\x84\xa1\x5e\x87\xc3\xe1\x70\x8c\
+\x02\x6e\x64\xd5\x68\x8b\x88\xf0\xcc\xb9\x73\xe7\x8e\xc8\x5d\x54\
+\xc3\xdf\x5d\x58\x58\x98\x2f\xf2\xc8\x17\x21\xa6\x73\x3a\x8a\xc2\
+\xb0\x3f\xaf\x52\x44\xb8\x75\xea\xd4\xa9\x10\x58\x81\xac\x1c\xbe\
+\x9e\x10\x9d\x43\x34\x82\x80\x1c\xea\x4f\x9d\x3a\x75\x4c\xd6\x1d\
+\x73\x62\xa5\x92\xd5\x25\x42\xc8\xd0\x7f\xbe\xfa\x5e\x54\x59\x59\
+\x59\xcb\x8a\x4f\x85\x8b\x0e\x93\x4e\xa8\xab\xab\x7b\x4a\xa4\x82\
+\xc5\xc4\xc2\x14\xe2\x4d\x90\x75\x96\x29\xdd\x5a\xf7\xed\xdb\xf7\
+\x15\x05\xb1\xb3\x40\x0d\xc1\xb5\xc8\xe5\xd4\x9c\x39\x73\x56\x8b\
+\x68\xb2\x45\x3a\x7d\x8a\xcb\xfe\xbe\xac\xfd\xfb\xf7\x7f\x43\x16\
+\xd9\x7f\xc6\xc3\x85\x09\x8c\xeb\x9c\x95\x2b\x57\x7e\x42\x04\x5a\
+\x26\xdd\x38\xad\x06\x1d\x59\x05\x9b\x27\xb2\x7e\x6e\xdb\xb6\x6d\
+\x5f\x56\x98\x81\x83\xb8\xe3\x2e\x8a\x92\xea\xea\xea\xf5\xf3\xe6\
+\xcd\xdb\x28\x39\x2c\xec\xe1\x23\xc2\x94\x0f\xf3\xae\x4b\x24\x2b\
+\x53\x72\x9b\x45\xe4\x47\x8e\x1d\x3b\xb6\x5b\xf9\x7e\x8c\x32\xd7\
+\x7d\x16\xd9\x38\x1c\x0e\x87\x63\x14\x70\x23\x44\x48\x03\x8f\xc3\
+\x6a\x69\x52\x03\x7d\xfa\xfc\xf9\xf3\xcf\xa8\x31\xaf\x97\xf5\x12\
+\xab\xaf\xaf\x67\x35\x27\x44\x58\x35\x6d\xda\xb4\x99\xcd\xcd\xcd\
+\xbd\x65\x65\x65\x55\x6a\xf8\xe7\xa9\x81\xcf\x68\x6c\x6c\xe4\x83\
+\xb6\xd1\x21\x42\x80\xcc\xab\xa7\x4f\x9f\x7e\xb4\xb8\xb8\xb8\x42\
+\xa4\x52\xcd\x1c\xa4\xe2\x60\x1d\x66\xc8\xfa\xba\x78\xf9\xf2\x65\
+\x88\x30\x4c\x4c\x06\x56\x53\x1e\x9c\x38\x71\x62\x49\xfc\xc3\xbb\
+\x1d\x05\x05\x05\x79\x8f\x3d\xf6\xd8\x77\x45\x88\xac\x1e\x35\xab\
+\x2c\x0c\xfc\xf8\x52\x7e\x8f\x74\x5b\x21\xd2\xe9\xcc\xca\xca\xca\
+\x17\x09\x7f\x4b\x84\xfc\xaf\xf1\xfb\xe1\xb4\xec\xba\x4f\x56\xe6\
+\x0a\xe9\xc5\x97\xec\x25\xbe\x77\x82\xd2\x2c\x68\x69\x69\x61\x5b\
+\xc4\x17\xe5\x07\x61\x85\xc3\x87\x91\xa5\x32\x59\xb5\x64\xc9\x92\
+\xbb\x45\xda\x53\xd5\x39\xe8\xce\xcb\xcb\x4b\x3f\x73\xe6\x0c\xf3\
+\xaa\x6c\xac\x2f\x10\xa1\x17\x49\xce\x1e\x75\x28\x76\x2a\x4f\x27\
+\x94\x6f\x48\x1c\x59\xc8\x0c\xe7\xd9\xe1\x70\x38\x1c\x37\x80\x1b\
+\x21\xc2\x30\xac\x71\xc6\x4a\xbb\x26\x12\xc4\x12\xe2\x9a\x86\x7b\
+\xca\xcc\x99\x33\xe7\x8a\x60\x3a\xb0\xea\x44\x4e\x31\x35\xf2\xd5\
+\xd3\xa7\x4f\xaf\xbe\x78\xf1\x22\x7e\xe1\xef\xeb\x19\x71\x40\x3e\
+\x1d\xb2\xd4\xf6\x88\x90\xda\x44\xa0\x8b\x14\x9d\x79\xc9\x0c\x59\
+\x69\x3f\x92\xf5\xc4\xd6\x07\xc2\x00\x0b\x0f\x02\xa2\x10\xa9\x3d\
+\x29\x12\x9d\x24\x42\xc3\x32\x3c\x24\x4b\x8a\x4d\xeb\xdc\x0b\xee\
+\xcb\x11\xde\xc8\x04\x3f\x98\xec\xa4\xd2\x99\x1f\x8b\xc5\x66\xb5\
+\xb5\xb5\x7d\xef\xc0\x81\x03\xdf\x91\x37\xe1\x20\x6b\x8b\x13\x8e\
+\xdf\x27\xfd\x32\x94\x8f\x65\x0a\xdf\x2b\xc2\x8e\x89\xd0\xbe\x77\
+\xf8\xf0\xe1\xaf\xe9\x1e\x67\xa9\x86\xc3\x1b\x28\xef\x85\xeb\xd6\
+\xad\x7b\xa9\xac\xe7\x39\x8a\x87\xf5\xd9\xa9\x32\x48\x13\x11\xe6\
+\x89\x08\x39\x1d\x07\x22\x6c\x53\x1e\x9e\xd6\x7f\x3e\xf8\x6b\x96\
+\x6f\x58\x8e\xc3\xe1\x70\x38\x46\x09\xa3\x45\x84\x61\x44\x1b\xed\
+\x36\x11\x5f\x86\x48\xa9\x54\x64\x93\xa3\x46\x9f\x7d\x75\x5d\x22\
+\xb8\xfc\x85\x0b\x17\xce\x97\xd5\x45\x63\x0f\x19\x42\x1c\x00\x9d\
+\x06\xc8\x47\x16\xd6\x31\x59\x9a\x27\x6b\x6a\x6a\x96\xc8\x22\xcc\
+\x94\xa5\x68\xdb\x2c\xb8\x0f\xd1\xf0\x55\x0a\x86\x5a\x8d\x7c\x40\
+\xff\xd5\xab\x57\x0f\x61\x89\xca\xaa\xe2\x5b\x83\xf6\x55\x89\x20\
+\xce\x8c\x19\x33\x1e\x10\x51\xce\x93\x55\xca\x99\x9e\x03\xfe\xb2\
+\xba\xda\x64\xe5\x75\x3d\xf9\xe4\x93\x10\xa7\xc9\x37\x42\x2b\x96\
+\x9b\x27\x77\x59\x2e\x80\xf2\xd2\x28\x2b\xf2\x6e\xe5\xad\x67\xe7\
+\xce\x9d\x5f\x55\x9a\x7c\xca\x89\x78\x80\x38\xe4\x25\x4c\x86\xb3\
+\xef\xb9\xe7\x9e\x57\xb0\x08\x46\x04\x48\x27\x20\x4d\x16\x21\xe8\
+\x38\x79\xf2\xe4\x7e\xe5\x15\xf2\x63\x75\xa8\xc5\xb1\x78\x0e\x87\
+\xc3\xe1\xb8\x49\xb8\x19\x44\x18\x45\x97\xac\x9b\x93\x72\xa7\x45\
+\x7c\xe9\x19\x19\x19\x65\x22\xc1\x6c\xc8\x90\x95\xa6\xb2\xd6\x20\
+\x23\x3b\xc1\x85\xf3\x3f\xb1\x80\x8c\x9c\x20\x44\xae\x2f\x9f\x3d\
+\x7b\xf6\x69\x11\x47\x87\x48\x84\x21\x4e\x88\x02\x97\xb7\x79\xf3\
+\xe6\x0f\xcf\x9a\x35\x6b\x8e\x08\xf2\x71\xfd\x0e\x7f\xc3\xb0\xe7\
+\xc2\x85\x0b\x4f\xe8\xbf\x6d\xcb\x08\xe4\xc9\xe2\x9b\x59\x5b\x5b\
+\xfb\x0e\x59\x7f\x0b\x74\xff\xa0\xf4\x80\x84\x83\x38\xb2\x3a\x2f\
+\x8b\x74\x99\xdb\x44\x0e\x30\x12\x64\x8f\xe1\xbb\x44\x7a\x2f\x91\
+\xd5\xb6\x4d\xbf\x19\xf2\x05\x9d\x90\xbb\xac\x40\xac\x47\xb6\x77\
+\x58\x78\xe4\x99\xfe\xf6\xf5\x7a\xfc\x73\x2b\x2b\x2b\xd9\x9f\xd8\
+\x27\xeb\x36\x5b\xae\x1d\x02\x7c\xe6\x99\x67\x7e\x2e\x12\xc4\x1a\
+\x4c\x7a\x68\xb8\xc3\xe1\x70\x38\x6e\x0e\x6e\x05\x11\x06\xa4\x20\
+\x12\x6b\x97\xf5\x77\x8a\x05\x21\x22\x83\xcc\xbc\xbc\x3c\x86\x2e\
+\x63\x71\x02\x63\xef\x5d\xf6\x9a\x35\x6b\x1e\x12\x11\x41\x1a\x58\
+\x89\x10\x47\x98\x58\x1a\x45\x82\x90\xcd\x80\xff\xc4\x89\x13\x37\
+\xca\xb2\x5b\xd7\xdc\xdc\x3c\x79\xce\x9c\x39\x33\x43\xa7\xc8\x58\
+\x3c\x48\x15\x79\x80\xdf\x19\x2b\x56\xac\x78\x8f\x48\xa7\x5c\xa4\
+\x97\x3e\x65\xca\x94\xe9\x17\x2f\x5e\xe4\x94\x18\x23\x3e\xc2\x58\
+\xf8\x01\x12\x14\xd9\xbe\x5b\x69\x2c\xd7\x75\x8e\x48\xfc\x6a\x6b\
+\x6b\x2b\x8b\x5a\x82\xfb\xf2\x47\x27\x23\x53\x80\x7f\x20\x43\xf2\
+\x17\x2f\x5f\xbe\x7c\x93\xc8\x13\xb2\x0f\x48\x5a\x7a\xd6\xa6\xa7\
+\xa7\x77\xab\x28\x0e\x40\x80\x71\x59\x76\xf2\x8d\xc3\xe1\x70\x38\
+\x6e\x31\x6e\x05\x11\x1a\x02\x42\x94\x6b\xc7\x42\x14\xe1\x9d\x61\
+\xf1\x4b\x43\x43\xc3\x69\xf9\x41\x04\xc5\xb2\xec\x56\x4e\x9d\x3a\
+\x75\x7e\x69\x69\xe9\xc4\x2b\x57\xae\x70\x2a\x0b\x43\xa0\x10\x8b\
+\x91\x84\xfd\x0f\x48\x6d\xee\xdc\xb9\x6f\xd0\xff\x12\xc9\x69\x93\
+\x65\x56\x5d\x53\x53\x33\x5d\xa4\x03\x19\xda\xbc\x1a\xe1\x40\x40\
+\x5a\x93\x27\x4f\xbe\xbf\xbc\xbc\xfc\x9e\x9e\xeb\x5b\x13\x7a\x72\
+\x72\x72\xa6\x32\x44\x29\x62\x0c\x9f\x1e\x63\x08\x48\x70\xdd\xba\
+\x75\xef\x96\x05\xb7\x46\xe1\x9b\x45\xe6\x1c\x91\x56\x10\x3f\x62\
+\xcd\x08\xd3\xf2\x65\x0e\xff\x49\xb2\x20\xef\xcb\xce\xce\x5e\x9e\
+\x99\x99\xc9\x19\xab\xcc\x99\x62\x45\xb2\x05\x22\xed\xe8\xd1\xa3\
+\x3f\x6b\x6b\x6b\x33\x0b\x90\x38\x0e\x87\xc3\xe1\xb8\x4d\xa0\xf1\
+\xbf\x55\x80\x58\x70\x46\x18\x57\x65\x15\xfd\x44\xff\x99\xdb\x03\
+\x1c\x1f\x96\xde\xd8\xd8\xd8\x2a\x4b\x71\xb6\xac\xb0\xff\x32\x6d\
+\xda\x34\xe6\xff\x40\xd8\xaa\x33\xe2\xe0\xe0\xee\x2a\x59\x68\x7d\
+\x22\x29\xfc\x9a\x14\x77\xf9\x4b\x5f\xfa\xd2\x77\xea\xda\xe6\xe6\
+\x00\xf7\x88\x5f\x31\x7b\xf6\xec\x07\x65\x81\xb5\xcb\x22\x03\x19\
+\x22\xa3\x76\x91\xef\x83\xba\x37\x39\x1e\xc6\x64\x83\xf4\x97\xbf\
+\xfc\xe5\xef\xe8\xec\xec\x5c\x0d\x09\x92\x86\xd2\xea\x2d\x29\x29\
+\xa9\xd2\x3d\x36\xf6\x03\xc2\x5b\x3a\x81\x8e\x22\xf2\x5a\x91\xe0\
+\x6b\x94\xce\xb4\xae\xae\x2e\x36\xe8\x67\xcb\x7b\x60\x63\x7d\x9c\
+\x44\xc3\xdb\x38\x2c\xbe\xc3\xe1\x70\x38\x6e\x03\x6e\x25\x11\x1a\
+\x68\xf8\x8d\xd0\xc2\xc4\xd3\x24\x02\x7c\xae\xa8\xa8\x88\xad\x0b\
+\xdd\x22\xb5\xb4\x29\x53\xa6\x6c\xd9\xb0\x61\xc3\x03\xba\xc7\x42\
+\x15\x23\x0c\x8b\x7b\xf5\x91\x47\x1e\xf9\xb2\x88\xa9\x5b\x04\x0a\
+\xd9\x80\x46\x59\x5c\x9b\xf5\xff\xe5\xd7\x7f\x3e\xcf\xe2\x6d\x10\
+\x29\x9d\x13\x01\x66\xe9\x1a\xd2\x62\xcf\x5f\x16\x7e\xdc\x23\x40\
+\x1c\x16\xe7\xe5\xd2\x81\xd3\x62\x82\x6d\x0b\xa4\x21\xe2\xed\x21\
+\x4d\xfd\x0e\x7f\x84\xd7\xfe\x97\x88\xbc\x1f\xac\xaa\xaa\xda\xdc\
+\xdc\xdc\xcc\x42\x1a\x56\x92\xe6\x8b\x6c\xd9\x12\xc1\x11\x6d\x06\
+\xcb\xb7\xe5\xc7\xe1\x70\x38\x1c\xb7\x11\xb7\x72\x68\x74\x30\x74\
+\x9e\x3e\x7d\xfa\xa8\x38\xb0\x7d\xf2\xe4\xc9\x7c\x38\x37\x57\xd6\
+\x58\x87\x08\xa8\x6c\xee\xdc\xb9\x0b\xce\x9c\x39\x03\xf9\xd8\x99\
+\x9f\x46\x40\x97\xe5\xff\xac\xee\xaf\x10\x01\xe6\xea\x77\x4f\x76\
+\x76\xf6\x04\xf9\xb1\xcf\x90\x45\x32\xe1\xb0\xbd\x67\xcf\x9e\x3d\
+\x21\xab\x70\x0d\x5b\x38\x44\x54\xe9\x79\x79\x79\xed\x3b\x77\xee\
+\xe4\xc3\xba\x03\x0b\x66\x42\xff\x27\xc9\x5a\xac\xed\xe8\xe8\xe8\
+\x52\xd8\x1c\x91\x5a\xdb\xf6\xed\xdb\xbf\x20\x7f\x3b\x30\x3b\x1c\
+\x96\x8f\xef\xbe\x52\x04\xc8\x42\xa0\xce\xeb\x0b\x41\x73\x5a\x95\
+\x9f\x6d\x47\x8f\x1e\xdd\xad\xfb\xa9\x0e\x21\x77\x38\x1c\x0e\xc7\
+\x6d\xc4\xed\xb0\x08\x53\xa1\xf7\xca\x95\x2b\xfb\x77\xed\xda\xf5\
+\x2f\xb2\xc4\x9e\x11\xf9\x64\xf7\xf4\xf4\xf4\xea\x1a\x2b\x8e\x0f\
+\xf1\x46\x01\x91\x1f\x15\x41\x7d\x4e\xd6\x1a\x24\x59\x24\x42\x64\
+\xf1\x89\x1d\x8b\x66\x64\x05\xc8\xeb\x05\x11\xdf\xb7\x45\x96\x59\
+\x22\xaa\x2c\xa5\xf3\x6d\xf9\x61\x11\x5a\x39\x18\xb1\x81\x27\xe2\
+\xd6\x5c\xa1\xf4\x68\x91\x25\xf8\x79\x5d\xdb\x76\x8b\x28\x0a\x44\
+\x96\xac\x84\xed\x95\x1e\x59\x75\x75\x75\x87\x94\xce\x3f\x5f\xb8\
+\x70\x81\xb9\x41\x93\xe7\x70\x38\x1c\x8e\x31\x88\xb1\x46\x84\x46\
+\x5c\x4d\xfb\xf6\xed\xfb\x8f\x1d\x3b\x76\xfc\xa0\xa4\xa4\xa4\x25\
+\x33\x33\x13\xc2\x0b\x7f\x00\xd8\x2c\x59\x86\x38\xb9\x3e\x25\xa2\
+\xfa\x5c\x69\x69\x29\xdb\x2b\x6c\x33\x3f\x79\x43\x9e\xe5\xd1\xe6\
+\x00\x7f\x9a\x91\x91\x71\x34\x3d\x3d\xfd\x59\x91\x17\x73\x94\x61\
+\xf2\x0b\xc7\xe9\xac\xaf\xaf\x3f\xa2\xf4\x3b\x91\xad\xdf\x9c\x94\
+\x43\x5a\x16\xd6\x74\x00\x8d\xe8\x28\x12\x6c\x15\x29\xff\xf0\xf8\
+\xf1\xe3\xec\x27\x64\xee\x33\x2c\xdb\xe1\x70\x38\x1c\x8e\x21\x03\
+\x02\xc1\x81\x9c\xaa\xaa\xaa\x2d\xfa\xcf\xa1\xdd\x01\x6a\x6b\x6b\
+\xd7\xd6\xd4\xd4\xb0\x9d\x01\x10\xce\x48\x69\x8e\xdc\xec\xeb\x97\
+\xd7\xe3\xaf\x5a\xb5\x6a\xab\xfe\x4d\xe3\x5a\x30\x52\xe4\x2b\xef\
+\x38\x60\x7e\x55\x6b\xd7\xae\xe5\x70\x70\x60\x69\x73\x3e\x2a\x0e\
+\x90\x46\xe0\x5f\x51\x51\xb1\x6c\xe9\xd2\xa5\xeb\xb8\x8e\xa3\x34\
+\xae\x63\xf8\x8b\x1b\x26\xc3\xe1\x70\x38\x1c\x63\x18\x46\x02\x63\
+\x0d\x58\x51\x38\xc8\xa4\xe3\xfc\xf9\xf3\x6c\x62\x1f\xf8\x20\x6e\
+\x4b\x4b\x4b\xc9\x94\x29\x53\xee\x16\xf9\x6c\xd0\x4f\xc2\xb0\x47\
+\x8f\xbc\xf0\x01\x5f\xb6\x25\xe0\x47\xfc\x22\x59\x7e\x0b\xb7\x6c\
+\xd9\xb2\x51\xd7\x6c\xd6\x0f\x56\x76\x0a\x58\x77\x38\x80\x5f\xd6\
+\xe6\xcd\x9b\x37\xa5\xa5\xa5\x2d\xd2\x75\x89\x9c\xa5\xcd\x51\x6e\
+\x76\x9c\x5b\xb0\xd7\x70\xea\xd4\xa9\xeb\x16\x2e\x5c\xf8\x92\x8e\
+\x8e\x0e\xc2\x19\xea\xe3\x3a\xb2\x1f\xd2\xd2\xc6\x39\x1c\x0e\x87\
+\x63\x8c\x63\xac\x12\xa1\xc1\x08\x09\x37\x80\x8c\x8c\x8c\xbc\xa6\
+\xa6\xa6\x4e\x0e\xbd\x7e\xf8\xe1\x87\x5f\x21\x2f\x3b\xbd\xc5\xac\
+\xb6\x20\x7c\x79\x79\xf9\x2c\x91\x1b\xdb\x24\xca\xab\xab\xab\xd7\
+\xe2\x27\xd8\xfd\x01\x99\xba\xb7\x51\xc4\x56\xde\xd7\xd7\xc7\x4a\
+\x55\xb3\x28\x01\x61\x28\x23\x64\xe7\x3c\xf4\xd0\x43\x0f\x54\x56\
+\x56\xae\x6a\x68\x68\x60\xf1\x4b\x9e\x5c\x18\x26\xd3\x09\xd0\xe1\
+\x70\x38\xc6\x11\xc6\x3a\x11\x82\xb0\x75\x15\x90\x17\xf3\x7b\x65\
+\x65\x65\x7c\xf7\xb0\xfb\xf8\xf1\xe3\x33\x36\x6e\xdc\xc8\x16\x8b\
+\x02\x39\x3b\x21\x26\xb0\xfc\x26\x4f\x9e\x5c\xdd\xd3\xd3\xd3\xd7\
+\xd5\xd5\xd5\x39\x6d\xda\x34\xac\xbd\xa9\x72\x51\xa2\x9a\xa1\x7b\
+\xf3\xe3\x2b\x54\x39\xad\x66\x66\xdc\xdf\xc2\x21\xab\x70\xc3\x86\
+\x0d\x0f\x9e\x3c\x79\x72\x86\x64\x75\x93\x76\x66\x66\xa6\x7d\x21\
+\xde\x08\x35\xac\xa7\xc3\xe1\x70\x38\xc6\x09\xc2\x0b\x3e\xc6\x0b\
+\xd2\xae\x5d\xbb\x76\xe5\xd4\xa9\x53\x17\xe6\xce\x9d\x5b\x25\x8b\
+\x2f\xbb\xb5\xb5\xb5\x60\xfe\xfc\xf9\xb3\xce\x9c\x39\x73\x56\xf7\
+\x6d\x78\x72\x42\x56\x56\x56\x55\x49\x49\xc9\x64\x59\x7a\x7c\xf5\
+\x22\x4b\xd6\x5c\xd9\xa5\x4b\x97\xf8\x1a\xfe\x00\xb1\xd6\xd6\xd6\
+\xbe\x4c\xf7\xf2\x25\xa7\x57\xe1\xb3\xae\x5c\xb9\x72\xa1\xb9\xb9\
+\x39\x3c\xbc\x5a\xb2\x69\xd3\xa6\x87\x1b\x1b\x1b\xcb\x72\x73\x73\
+\xf9\x4a\x44\xd3\x23\x8f\x3c\xf2\x6f\x57\xaf\x5e\x65\x18\xd6\x2d\
+\x40\x87\xc3\xe1\x18\xe7\x18\x0f\x16\x61\x14\x10\x0f\x7a\x5f\xdc\
+\xb1\x63\xc7\x77\x64\xf1\x9d\x8d\xc5\x62\x7c\x46\x89\xc5\x34\x33\
+\x08\x20\x04\x44\x78\xee\xdc\xb9\x9d\xb2\x1e\xaf\xea\x5e\x4c\xff\
+\xfb\x64\xc5\x31\x4f\x18\xce\x33\x5f\x7f\xe7\x20\x70\x36\xcc\x4b\
+\x4c\xac\xee\xfc\xf9\xf3\x9c\xfc\x02\xcc\xd2\x9b\x81\x6c\x71\x64\
+\x9a\xac\xc6\x53\x3b\x77\xee\xe4\x80\xed\x8b\x72\xc8\x71\x12\x74\
+\x38\x1c\x8e\x71\x8e\xf1\x48\x84\x80\xe1\x4a\x74\x6f\xdb\xbf\x7f\
+\xff\x0f\x1b\x1a\x1a\x0e\xc4\xb7\x58\xd8\x57\x21\x20\x28\x88\xac\
+\x63\xd7\xae\x5d\x3b\x8a\x8a\x8a\xf8\xa8\x6f\x4c\xd6\x20\x1f\xcb\
+\x0d\x7f\xdf\xaf\xe7\xf2\xe5\xcb\xf8\xc5\x8a\x8b\x8b\x27\x6c\xdf\
+\xbe\x1d\x12\xb4\x4f\x3c\x19\xfa\xb2\xb3\xb3\x33\xea\xea\xea\xf6\
+\x1d\x3c\x78\xf0\x47\xfa\x6d\x9f\x7b\x0a\x86\x5f\x1d\x0e\x87\xc3\
+\x31\xbe\x31\x5e\x89\x10\x40\x44\x01\x61\x9d\x3c\x79\x72\x47\x47\
+\x47\x07\x24\xc6\xe9\x32\x00\x7f\x23\xc3\x73\xb2\xf2\x8e\xe6\xe5\
+\xe5\x65\xc8\x42\xe4\xab\x16\x00\xff\x20\xae\xee\xd5\x15\x14\x14\
+\x64\xe8\x3f\xab\x43\xd9\x8c\x6f\x71\x0d\x39\x22\xda\x9d\xa7\x4e\
+\x9d\xe2\x84\x18\x8b\xe7\x24\xe8\x70\x38\x1c\x8e\x31\x03\x23\x27\
+\x48\xdd\x88\xd0\x80\x3f\x28\xbd\xe7\x9e\x7b\xde\xae\xff\x1c\x98\
+\x0d\x2c\x0e\xa8\xda\xb8\x71\x23\x07\x75\x4f\xba\xfe\x73\xc0\xdf\
+\xc0\x8a\x54\x64\x87\xe3\x38\x1c\x0e\x87\xe3\x0e\xc1\x78\xb6\x08\
+\x0d\x58\x6f\xe6\xec\x4b\x16\x06\xb3\x0a\xeb\xcf\x9e\x3d\xcb\xe2\
+\x96\x44\x48\xcf\xcd\xcd\x65\x4f\xa1\x59\x8b\x61\x6b\x10\xb0\xf8\
+\x26\x9c\x86\xc3\xe1\x70\x38\xee\x20\x8c\xc7\x55\xa3\xc3\x45\x60\
+\xc5\xd5\xd5\xd5\xf1\x9f\xfc\xf2\xa5\x89\xb0\x65\x57\xde\xd6\xd6\
+\xd6\xd0\xd2\xd2\x12\xfe\xb8\xae\xc3\xe1\x70\x38\x1c\x77\x1c\x18\
+\x36\xad\xb8\x7e\x19\x10\x9e\x91\x1e\x7e\xd1\x21\x55\x87\xc3\xe1\
+\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\
+\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\
+\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\
+\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\
+\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\
+\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\
+\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\xe1\x70\x38\x1c\x0e\x87\xc3\x31\
+\x86\x30\x61\xc2\xff\x07\x21\x52\x35\xf7\x65\xd6\x08\x1c\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x4b\x08\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x70\x00\x00\x00\x70\x08\x06\x00\x00\x00\xc6\xe0\xf4\x4b\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
+\xa8\x64\x00\x00\x4a\x9d\x49\x44\x41\x54\x78\x5e\xed\x7d\x05\x80\
+\x5c\xd5\xd5\xff\x7b\x6f\xdc\x76\x66\x67\x5d\xb2\x92\xb5\xac\x65\
+\xe3\xb6\x71\x62\xc4\x21\x21\x8a\x94\x0f\xe8\x87\x5b\xa1\x1f\x5a\
+\xa1\x2d\x50\xda\xc2\x87\x53\x28\xa5\x58\x08\x04\x0d\xc4\x5d\x88\
+\x67\x93\xec\x6e\xd6\xdd\x6d\xdc\x9f\xfe\xcf\xb9\x33\xb3\xec\x26\
+\x41\x8b\x84\xfe\xbf\x93\xcc\xbe\x37\x57\xce\xbd\xf7\xfc\xce\x39\
+\xf7\xdc\xfb\x64\xa8\xff\x70\xa2\xf5\x2a\x19\x65\x50\x31\xe4\x9c\
+\xa4\xfc\x1f\x5d\xfc\x14\x42\x4a\xa6\x57\x6a\xa8\xc3\xd7\x4f\x5e\
+\x74\xf8\xba\xc9\x8b\xf0\x1c\xd3\xfe\xd3\x50\x94\x85\x8e\xff\x51\
+\xa4\x90\x31\x32\x51\x92\x84\x3f\xcc\x28\x1a\xbf\xb2\x20\xf9\xe3\
+\x64\x93\x7e\x99\x82\x56\xec\xda\xd1\xd0\xd9\x16\xca\x93\x42\x45\
+\x7f\xf6\xf4\x1f\x07\xa0\x9c\xa1\x19\x5e\x94\xc4\x55\xf9\x89\xb9\
+\x8f\xce\xc8\xd8\xe4\x09\xb0\xd1\x7e\x96\x53\x4d\x4a\xd6\xcf\x6f\
+\xb0\xf9\x36\x9f\xe9\x76\xf6\x62\x19\x51\xa2\xfe\x23\x40\xfc\x8f\
+\x02\x70\x00\x78\x29\x6f\x5d\x36\x72\x33\x2b\x50\x69\x90\x2c\xd2\
+\x34\x0d\x60\xd1\xc6\x95\xf9\x49\xb3\x6a\x2d\xee\x4f\x4a\x7b\x5c\
+\x8e\xff\x14\x10\xff\x63\x00\x64\x00\x25\x01\x5c\xe3\xea\xfc\xa4\
+\xa8\xb7\x2e\x1f\xbd\xd9\xc3\x0a\x05\xe0\x28\x05\x9a\x26\xf3\x1e\
+\x8d\xe7\xac\x28\xc6\xae\x2a\x48\x9a\x52\x6f\x71\x6d\x38\xd3\xe3\
+\xf2\x31\x34\xa4\x87\xea\xff\x5c\xe9\x3f\x02\x40\x19\x80\x87\xf3\
+\xda\xd5\x39\xa9\xca\x37\x97\x8d\x7c\xdf\xcd\xf2\x93\xc1\xb6\x78\
+\x00\x4f\x1e\x2a\x42\xc1\x39\x83\x69\xac\x28\x0d\x59\x59\x98\x38\
+\xbc\xd1\x1e\x78\xff\x4c\xb7\x43\x00\x74\x7f\xd6\x20\xfe\xec\x83\
+\x32\x00\x86\xc2\x90\x64\x88\x5e\x43\x55\xdc\x70\xc9\x3a\x5a\x25\
+\xae\xe6\x05\x91\x07\x8b\xec\x07\x6f\x20\x81\xdb\xe4\xe5\x0c\x25\
+\x97\x68\xcd\xba\xbc\x17\xb6\xad\x6d\x75\x7a\xfa\x79\xfc\x1c\xe9\
+\x67\x6d\x81\x21\xc1\xd3\x09\x00\xde\xbb\xcb\x47\x3d\x93\x18\xa9\
+\xba\xee\xab\xc0\x43\x42\x4b\x14\x10\x44\x9a\x2b\x2a\x1e\x12\x19\
+\xbd\xb5\xae\x77\x8b\x8b\x05\x63\xfd\x99\xaa\x32\x59\xe1\xfe\x5c\
+\x09\xbc\x1f\x39\x26\x18\x54\x54\x41\x8c\x21\x46\x14\x28\x0a\xc0\
+\x11\xbf\x0a\x0b\xcc\x83\xb9\x52\x14\x61\xe8\x05\x31\x11\xb1\x09\
+\x3a\x25\x26\x4b\x61\x5e\x3f\x37\xfa\x99\xea\xdd\x17\x84\xc1\x0b\
+\xce\x7f\x05\xb1\x11\xf2\x1d\x6b\xc7\x6f\x30\xa9\x94\x4b\xfd\xbc\
+\xc0\xc9\x18\x5a\x11\x2a\x32\x88\x00\x3c\x4e\xab\x90\x2b\xac\xbe\
+\xc0\xa6\x39\x6f\x1d\xb9\xbc\xac\xd7\xc5\x86\x79\x84\x8a\xfc\xac\
+\xe8\x67\x0f\x20\x12\x2c\x09\x68\x58\x3e\x48\x79\xd1\x7a\xdd\x96\
+\xb5\x13\x36\x46\xaa\x15\x33\x45\x51\xe2\x20\x79\x10\x88\x00\x11\
+\x07\x23\x06\xf0\xd8\x83\x0b\xd7\x1f\x9b\x7f\xb6\xd7\xe5\x0a\xd7\
+\x0d\x15\xf9\xd9\xd1\xcf\xce\x85\x82\xbc\xc9\x67\x20\x21\x00\xb8\
+\xae\xab\xe8\x73\x7b\x2e\x7b\xf7\xc4\x4a\xa5\x24\x3b\x09\xc1\x8a\
+\x02\x50\xe1\x43\x45\x90\xf8\x80\xc0\x2b\x22\x74\xda\xf2\x27\x0e\
+\x75\x5d\x81\xe0\x29\x65\x0c\xae\x1b\xcf\x03\x4f\xfe\x33\x52\xeb\
+\x9f\x55\x10\x03\xcb\x05\x00\x0f\x96\x06\x70\x00\x10\x07\x89\x1e\
+\x17\xe5\xe0\x36\x65\x1d\x2e\xbf\x27\x9a\xd1\x6c\x9b\x3e\x2c\x7a\
+\x81\xcb\xcf\xc5\x00\xb0\x30\x33\x52\x12\x2b\x88\xf2\x68\x83\xa6\
+\xf9\x6f\x7b\xab\xe7\x3f\x7a\xb8\xa2\x15\x78\xc9\x70\xd1\x1f\xac\
+\xfd\x05\x29\x18\x5a\x0e\x8b\x47\x19\x43\x96\x8e\x17\x3f\xfd\x6c\
+\x00\x44\xa3\x03\x90\x98\x58\x9d\x52\x30\x28\x65\xa2\x33\x20\xc8\
+\x00\xb0\x41\x33\x17\x9c\x4b\x08\xcc\x96\xe6\x2e\x9b\x4e\x26\xdb\
+\x35\x3b\x3b\x7e\x99\xc7\xcf\x47\x60\xbd\x28\x83\xba\xef\xaf\x9f\
+\xd7\xce\xbf\x77\x77\x45\x25\xf0\x92\x41\x1a\x02\xdb\x4f\x68\x74\
+\xb0\x26\x94\x81\x6a\x08\x99\x4a\xb9\xe8\xe0\x05\x5a\x3a\xc7\xd2\
+\xff\x8f\xbe\x23\x85\xe4\x28\x37\xa9\x14\xd4\xa9\x1b\xa6\x3e\x50\
+\x7f\xdb\x94\x1b\x62\x75\x64\xa5\xa0\x00\x0b\x23\x99\x61\x0a\x02\
+\x41\x13\xc5\xfc\xcb\x25\xb9\xc5\xd2\xef\x16\xbb\xa5\xdf\x2f\xf1\
+\xfd\x65\xd6\xb0\x69\x98\x86\x56\x7a\x2e\x2c\xf8\x5d\x21\x0b\xce\
+\x97\x77\x4c\x18\x3a\xdb\x7f\xfd\x94\xff\x4d\x52\x93\xaf\x60\xe9\
+\x78\xf8\x3f\xfa\xce\x44\x00\x01\xb7\x86\x67\x9f\xaf\x9c\xb2\x54\
+\xfa\xcd\x22\x89\x7f\x78\x11\x7f\xf6\x86\x29\xab\xe2\xd4\x2a\x2c\
+\xa2\x90\x9f\x63\x29\xa4\x4e\x08\xc4\x67\xe7\x15\x5c\xf1\xec\xdc\
+\x82\x95\x78\x8e\x69\x17\xc2\x23\x0c\xde\xad\x63\xd2\x8a\xa5\x87\
+\x17\xf5\xb2\xbf\x5d\x2c\x1d\xfa\xaf\xc9\xf7\x40\x30\x84\xc9\xe7\
+\xb2\xbf\xa8\xe8\x22\xee\x5a\x90\xc0\xc2\x70\xae\x12\x6e\x18\x99\
+\x52\xf8\xe2\x82\xa2\xbd\x30\xaf\x99\xd1\xfd\x99\xb5\x4a\xa9\xa2\
+\xdd\x71\xe5\xcc\x77\x8f\xbe\xdb\xed\xf1\x23\x88\x1c\x3f\xc0\x9f\
+\xe2\xc0\x40\xf0\xb8\x61\x4d\xe6\x39\xb0\x24\x06\xb2\xe1\xeb\x60\
+\x42\xf0\x38\x41\xe2\x00\xbc\xa9\xcf\x2e\x28\xfa\xd8\xe1\x63\x23\
+\x45\x5e\xe4\x23\x4d\x5a\xf9\xe7\x7b\xab\x16\x4c\xde\x5d\xb9\x19\
+\x7c\xb5\x5c\x14\x44\xfe\x62\x9c\x13\x2f\xea\x39\x10\x23\x4b\x0c\
+\x34\x6e\x1a\x93\x12\xf3\xd2\xa2\xa2\x8d\xae\x00\x9f\x0a\xc1\x8b\
+\x00\x16\xc9\x78\x38\x9e\x49\x89\xd2\x2d\x5b\x98\x95\x58\xfb\x51\
+\x79\xe7\x19\x07\xcf\x41\xfc\x01\x81\x4d\xa8\x6e\x88\x24\x04\x0e\
+\x80\xc4\x88\xe4\x42\xe0\xc9\x01\x3c\xfe\x8e\x71\xe9\x97\x3c\xb3\
+\xa0\x68\xa3\xc3\xcb\x1a\x01\x78\x51\x06\xa6\xea\xf5\x73\x74\x66\
+\x5a\xd4\x9c\x5e\x2f\xbb\xe9\x58\xbb\xbd\x1b\x15\x09\x18\x5c\x74\
+\x18\x5e\xb4\x00\x82\xd4\xf1\xea\x02\x9d\x62\xd4\x4a\x9f\xac\x9a\
+\xb0\x9e\xe3\xc4\x29\x10\x76\x86\xb7\xc9\xc0\x17\xd2\x92\x87\x15\
+\xe8\x64\xa3\xea\xb2\x45\x69\xe9\x55\x1f\x97\x36\x94\x39\x24\x51\
+\x01\xeb\xa2\x41\x40\xc1\x39\xda\xe5\x79\x82\x0f\x83\x77\xd7\xf8\
+\xa1\xd3\x9f\x9a\x3f\xfc\x13\xbb\x87\x35\x60\x5d\xb4\x5a\xc8\x46\
+\xcc\x85\x80\x48\xe9\x97\x15\x24\x4c\xea\xf3\x48\xef\x1d\x6d\xb7\
+\x78\x41\x19\x2e\xba\x8d\xef\x8b\x12\x40\x9c\x73\x40\xea\x4c\x8c\
+\x4e\x29\x7e\xb0\x7c\xcc\xef\x12\x74\xca\x5f\xb2\xa2\x28\x00\x68\
+\x03\xf7\x38\x69\x70\x9b\x92\x8b\x13\x64\x43\x22\x99\x05\x5a\x3f\
+\x77\x66\x53\x9b\xad\x0a\x00\x66\x2e\x04\xd8\x40\x42\xab\x14\x44\
+\x4a\x00\xcb\x1b\xff\xd4\x9c\x82\x8f\x6c\x5e\x36\x12\xac\x9a\x5c\
+\x7a\x0a\x15\x21\xee\x17\xfa\xc0\x73\xbc\x90\x74\x49\x7a\xc2\x90\
+\x75\x65\x6d\x1f\xda\x03\xdc\x45\xb7\x67\x7a\xd1\x01\x88\xf2\x01\
+\xe9\x33\xb0\x0e\x13\x77\x2e\x9b\x74\xd5\xb8\x34\xe3\xd3\x5e\x56\
+\xe4\x31\x7a\x0c\x65\x0f\x24\x04\x51\xf4\xf2\x92\x72\x6c\x76\xec\
+\x7c\x70\x81\x25\x47\x3b\xec\xf5\x64\xbe\xfb\x12\x10\x11\x60\x30\
+\x51\xf1\x96\xb1\x69\x63\x9e\x99\x57\xf8\x91\xcd\xcf\xc5\x13\xf0\
+\x2e\x20\x0b\x04\x51\x94\x68\x5e\xc1\xf0\x45\x13\x93\x4c\xf2\x7f\
+\x95\xb5\xef\x46\xc5\x42\xfd\x0a\x15\xf9\xc9\xe9\xa2\xdd\x89\x41\
+\x29\x99\x8d\x72\x35\xae\xc5\x20\x0a\x09\xe1\x7a\x41\x62\xc0\x2c\
+\x79\xbf\x9f\x37\x3d\xbb\x64\xe4\x13\xb3\xd3\x63\x94\x08\x10\x58\
+\xeb\xb9\x60\x13\x84\xc0\x0d\x8b\x97\x42\x74\xf9\xdc\x9c\x82\x3f\
+\x5b\xfd\x7c\x12\x84\xa5\xec\x85\xc0\x0b\x91\x24\x88\x22\xa5\x91\
+\x2b\xa8\x68\x9d\x2a\x78\x6f\xdb\x45\x04\x1e\xd2\x45\x67\x81\x48\
+\x60\x25\x12\xcc\x7f\xcc\xa6\x86\x9e\x93\x4b\x87\xc6\xb5\xc6\xea\
+\x55\x4b\x7c\x1c\x0f\xcb\x09\x34\xac\xf3\xac\x50\xe2\x24\x49\x66\
+\x54\xcb\x7d\x8f\xec\xad\xba\xf6\x9f\xa7\x5b\xeb\x82\x96\x73\xbe\
+\xa0\x49\x65\xc8\xab\x85\xc8\x08\xc0\xa8\x9c\x93\x13\xb7\xcc\xcb\
+\x09\x7a\x00\x1b\x23\xd5\x73\xf9\x8a\x1c\xa0\x67\x54\x2b\xe4\xf5\
+\x36\xef\xef\xe7\xac\x3b\xf2\xa0\x1d\x02\x1b\x50\x2c\x9c\x53\x2f\
+\x1a\xba\x28\x01\x44\x01\x21\x88\x36\x1f\x27\xdf\x58\xde\x0d\x20\
+\xa6\x37\xc5\xc6\xa9\x17\x7b\x7c\x2c\x0d\xd1\xe0\x40\x10\xa5\x00\
+\x08\x39\x4a\xaf\x66\xde\x3c\xd3\x76\xe3\x9d\xdb\xcf\x7e\x48\xe6\
+\xc0\xd0\xd2\xe1\x4b\x88\x44\xa6\x7b\x9a\x2d\xed\x19\x34\xd5\x30\
+\x21\x2d\x66\x85\x8b\x17\x45\x45\xd0\x62\xc3\x7c\x11\x3c\xc9\x04\
+\xe0\x35\xda\x3c\x0f\xcc\x79\xfb\xc8\x1f\x9b\x1d\x3e\xf0\xb4\xb4\
+\x38\x28\x42\xba\x08\xe8\xa2\x04\x10\x09\xe5\x04\x60\x89\x56\x8e\
+\x53\x6c\xac\xed\x2a\x59\xcc\xf2\x75\xc9\x19\x51\x8b\x3d\x9c\x88\
+\xfb\x94\x24\x5a\x04\x19\x0b\x68\x21\x2d\x56\xdf\x1f\x7e\xf9\xd9\
+\x99\x27\x2d\x7e\x0e\xa6\x44\x08\x5e\x83\x2c\x08\x81\xd0\x31\x62\
+\x65\x00\xd1\xfe\x64\xa8\x0b\xf1\x2d\x25\x3f\xdb\x62\x2b\xbf\x34\
+\x2f\xc1\x97\x60\x50\xcf\xf1\xf3\x92\x80\xc0\x42\x36\x80\x27\x51\
+\xc0\x57\x56\xd3\xe7\xb9\x6b\xee\xba\x23\x7f\x6d\x76\xfa\xe4\xd8\
+\x17\xf0\x0a\x41\x06\x17\x11\x5d\xb4\x00\x22\xa1\xb6\x63\x90\x62\
+\xe5\x59\xc5\xd6\xc6\x9e\x33\xf9\x82\x54\x97\x91\x13\xbf\x98\xe7\
+\x04\x39\x00\xc2\x29\x64\x8c\xa2\xcd\xe9\x7b\x67\xde\x3b\x47\x6e\
+\xad\xb5\x79\xd0\x42\x00\xd3\x2f\x84\x8c\xd6\x08\xb8\x91\xdd\x6c\
+\x04\x12\x72\x48\x26\xfe\x41\x6b\xb2\x88\x92\x6c\x4b\x7d\xef\xc1\
+\x85\x59\x71\x49\x46\xb5\x6c\x2c\x04\x2c\x1c\x18\x23\x03\xe0\x31\
+\x55\x56\xf7\x6d\xc0\xf7\x99\x16\xa7\x1f\xc1\xe3\xc1\xeb\x62\xd5\
+\x8b\x8e\x7e\x72\x00\x31\x58\xc1\x08\x13\x05\x7c\xa1\x79\x0b\x7d\
+\x21\x5a\x9c\x5d\xc6\xc8\xff\xd5\x6c\x29\x15\x05\xb1\x76\x7e\x76\
+\xdc\x02\x3f\x2f\xaa\x35\x32\xf9\xf1\x59\x6f\x1f\x59\x59\xd1\xe7\
+\x0a\x80\x90\xf1\x62\x6d\xb0\x12\x90\x52\x16\xdc\x04\xb8\x7e\x54\
+\x52\xd4\xe5\x31\x7a\xcd\xae\x6e\x97\x47\x0e\x69\xe1\x36\xf0\x0f\
+\x28\x07\xd5\x07\x6e\x79\x5f\x8b\x6d\xe7\x4d\x63\xb2\x26\xfa\xb9\
+\x40\x66\x84\x5a\x49\x35\x59\xd9\x5b\xe7\xbe\x73\xf8\xf9\x56\x07\
+\xb1\xbc\x2f\x05\x0f\xf2\xf0\xaa\x08\x5a\xed\x45\x68\x9b\x3f\x12\
+\x85\xdc\x16\xa1\x90\x40\x42\xdf\x06\x13\x16\x02\x50\xc8\x3a\xf0\
+\xde\x49\x19\xab\xa4\x47\x96\xd4\xfe\x66\xf2\xb0\x61\xf8\x1d\xea\
+\x0d\x52\x44\xf8\x4e\xe6\xb3\x94\x08\xb5\xac\xea\xd6\x99\xdb\xa5\
+\x5b\x66\xee\xc9\x31\x84\x36\x36\xa1\x0d\x3c\x86\x49\xce\x20\x6b\
+\x9a\x7a\x68\x7a\x7e\x92\xf4\x87\x25\x67\xab\x7f\x39\xfb\xf6\x54\
+\x83\x8e\x64\x41\x59\x52\xe6\x5c\x42\xf6\x03\xf9\x0c\x1c\xc3\xff\
+\x37\x14\xc2\x89\x49\x8e\x50\x53\x3b\xae\x9c\x70\xdd\x6f\xa6\x64\
+\x4f\xc5\x04\x30\x45\x30\x94\x2f\x41\x11\x08\xe7\x33\x10\x9e\x7c\
+\x5c\xa2\xc9\xa4\x84\xc2\x90\x34\x18\x90\x60\x5d\xd9\x90\x08\x0d\
+\x55\x7d\xcb\x8c\x97\xd9\x07\x16\x48\x4e\xf8\x54\xde\x3c\xe3\x8d\
+\x54\x23\x79\x3e\x02\xeb\x0f\xe2\x0f\x5f\x18\x64\x35\x2d\x25\xda\
+\x94\x1a\xa1\x43\xa0\xc9\xf7\x0b\x11\xf6\x0d\xfb\x88\xe7\xd8\xe7\
+\x1d\x6b\xc7\x5f\x9f\x1c\xe4\xfb\x15\xbd\xfe\xe1\xe8\x27\x73\xa1\
+\x8a\xe0\xde\xa2\xf8\xfb\x69\xd9\x53\xd7\x8c\x4a\xfb\x53\x71\x9c\
+\x61\xc6\xac\x8c\xf4\x8e\x43\xed\x96\xea\x5e\x8f\x5f\x86\xda\x7f\
+\x21\xcf\x05\x49\xb0\x34\xa4\xe9\x76\xa7\xdf\x8f\x92\x07\xdf\xd5\
+\x5f\x0a\x71\x01\x37\x2a\x1f\x62\xd4\x08\x3b\xae\x1c\xff\xbb\xac\
+\x48\xfd\xdd\x4e\x56\xe0\x21\x51\x4c\xd4\xab\x47\x2e\xc8\x8a\x31\
+\x7e\x52\xdd\xbd\xd5\xee\xe7\x11\xc3\x81\xec\xf1\x3a\x22\xd3\x68\
+\xf7\x06\x5c\x2c\x8f\xfc\x21\xda\x3c\xbf\x71\xac\x84\xdb\x7b\xd9\
+\x51\x46\x61\xc3\xf2\xc9\x0b\xd6\xe6\x47\x3f\x9a\x95\x68\x9e\x0a\
+\xa5\xcb\xb6\xd5\xf7\x36\x87\xc6\x74\x81\x5e\xff\x70\xf4\x93\x00\
+\x08\x72\x40\x41\x88\xbf\x9a\x98\x95\xf0\x50\x71\xc6\x53\x76\x77\
+\x40\x0d\xf3\x8c\x34\x2c\x46\x3d\xef\xd2\xcc\x68\x61\x4b\x5d\xcf\
+\x89\x3e\x2f\xcb\xa0\x85\x41\xb9\xf3\x04\x82\xa0\x11\x61\x0e\x90\
+\x32\x9a\xa1\x08\x9e\x6d\x28\x4d\xf3\xbb\xd6\x4e\xba\x39\x3d\x2e\
+\xe2\x09\x87\x8f\x17\xd0\xed\x42\x51\x06\xa2\x57\x3e\xc1\xa0\x29\
+\x5e\x98\x11\xef\xdd\x54\xdd\x71\xd0\xc6\x22\x88\x5f\xe8\x08\x0a\
+\x1e\x13\xe0\x20\x5d\x48\x71\xf0\xf6\x0b\x0e\xa2\x9c\x2c\xb3\x56\
+\xdc\xb4\x7a\xec\x8d\xa3\xe3\x75\x0f\xb8\xfc\x82\xe0\xf3\xb3\xd2\
+\xb4\x21\x51\xa3\x7c\x0a\x69\xe7\x81\x46\xab\x0b\x58\xfc\xa8\xfb\
+\xa5\x3f\x3a\x80\x20\x4c\xdc\x0d\xa1\xc1\x3a\xa8\xf5\x97\x8d\xfe\
+\x93\x28\x8a\x23\x01\x4f\xb2\xc8\xf2\x04\x78\x2e\x5e\xab\x9a\xb6\
+\x74\x58\x7c\x2c\x44\x87\x87\x7b\x3c\x01\x88\x34\x2f\xfc\x0c\xc3\
+\xb9\x42\x06\xb6\xb8\xfe\x13\xfe\x36\x35\x7b\xf9\xcc\xfc\xc4\x57\
+\xad\x7e\x9e\x56\x81\x59\x41\x31\xe2\xd8\x10\x45\x37\x2c\xee\x52\
+\xcc\xda\xb9\x06\x05\x53\xb7\xb1\xb6\xe7\x0c\xb4\x3b\x68\xcb\x0d\
+\x79\x9e\xc3\x96\x10\xf6\x01\x96\x16\x62\x0e\x2c\x38\x77\xae\x99\
+\xf0\x48\xaa\x41\x73\xad\xdd\xc7\x7a\x50\xc1\x60\xd2\x86\xc0\x55\
+\x8a\x9d\x3e\x34\x3a\x7e\x43\x45\xc7\x36\x8b\x17\x17\xfb\xa8\x08\
+\x3f\x0e\xfd\xe8\x00\xc2\xc0\xd0\x58\xa4\xcf\xd6\x8c\x5b\x93\xa2\
+\x57\x5d\x0b\x0b\x71\xd0\xda\xe0\x3e\x27\x5a\x80\x97\x17\x7d\x31\
+\x5a\xe5\x98\xf9\x99\x31\x99\x55\x16\xfe\x50\x93\xc3\xeb\x03\x9b\
+\x20\x75\xb0\xfe\x85\x08\xe7\x30\xc8\x14\x1f\x99\x96\x73\xc9\xcd\
+\xd3\x72\xde\x76\x06\x78\x8d\x32\xb8\xe0\x1f\x38\x3f\x12\x53\xf4\
+\xb2\x02\x3d\x26\x29\x72\x0e\xe4\x9f\xdc\xdd\x64\xa9\xc3\xba\x90\
+\xf7\x95\xbc\x61\xca\x13\x67\x0d\x4d\x34\xbd\xb3\xa4\xe0\x89\x94\
+\x08\xdd\x7c\x27\xcb\xdb\x55\x60\x91\x98\x8d\xf9\xbc\x24\xf9\xd5\
+\x12\x93\x37\x36\x29\xc2\xf2\xcf\xd3\x6d\xe5\xe1\x31\x12\x06\x3f\
+\x30\x0d\x1c\xe0\x0f\x4e\x68\x25\x70\x10\xef\x2f\xce\xc8\x1f\x1b\
+\x17\x71\x13\x78\x38\x1f\xce\x3d\xc1\x5c\x32\x62\x1a\x04\x2b\x77\
+\x07\x78\x7b\x82\x4e\x75\xc9\xb6\xab\x26\x3e\xf7\xc8\xd4\x9c\x78\
+\x48\xc7\x9b\x75\xe1\xff\xf9\x84\x89\x58\x0f\x56\xf7\xd4\xd2\xdc\
+\xd8\x61\x30\x09\x19\xc1\x07\x72\x90\x7c\xde\xd8\x90\x07\x58\x29\
+\xde\x33\xaa\x5f\x3a\x2c\x71\x18\x2e\x23\xb0\xee\x05\x19\x03\x91\
+\xf2\xd0\xf6\xef\xa6\x66\xc7\x41\x5f\x9e\x8f\xd7\xa9\x66\xb8\x59\
+\xce\x8e\x7d\xc4\x7a\xa1\x62\x24\xb0\xf2\x09\x82\x77\x6c\xbc\xf9\
+\xe6\xfb\x8b\x33\xf3\x21\x29\x7c\x59\xea\x07\xa7\x1f\xa5\x91\x30\
+\x85\x67\xac\xcb\xf3\x12\x47\xcb\xe5\xf2\x44\x98\xf7\xf8\x73\x85\
+\x87\x45\x30\xca\x13\x24\xda\x61\x71\xda\x47\xde\x37\x7d\xe8\x3f\
+\x6e\x1f\x93\x12\x05\xe9\x64\xde\x0b\x96\xfa\x82\xb0\x3c\xa4\x0a\
+\x82\x48\xd1\x73\xde\x3c\xf6\x7c\x65\x9f\xeb\x0f\x91\x1a\xa5\x02\
+\xbc\xe5\x79\xbc\xf1\xfa\x9f\x59\xa3\x50\x54\xf6\xba\x1e\x9b\xfd\
+\xd6\xe1\x67\xc0\x72\xc0\x8b\x42\x88\x13\xca\x1f\x48\xd8\x16\xb6\
+\x79\xdb\xd8\xa1\xe6\x07\x66\x66\xfe\xc3\xea\xb0\x8d\xc0\x3e\x61\
+\xdf\xce\x2d\x8f\xed\xf0\x22\x25\x28\x14\xb2\xa4\x65\xf9\xc9\x63\
+\x30\xed\x8b\xd9\xf9\x87\xa5\x1f\x15\x40\x10\x16\xd9\x34\x9e\xf7\
+\xd6\xd1\x37\x4e\xb6\x5b\x7e\x1f\xa9\x51\xe8\x60\x41\x8e\x7d\x38\
+\x6f\xef\x12\x83\x01\xb5\x9c\x91\x04\xbf\xa2\x6d\x7f\xab\xcb\x89\
+\x69\x17\x0a\x2e\x90\x50\x58\x28\xef\x2e\x4f\x80\x99\xfd\xf6\x91\
+\xdf\x54\xf4\x3a\x9f\x07\x10\xe5\x10\x74\xf4\xdf\x17\x0a\xf3\x14\
+\xaf\xd6\x28\xe4\x65\xbd\xce\x57\xe6\xbe\x7d\xe4\x81\x6e\x28\x8b\
+\x75\xbe\x4c\xd0\xe1\xb6\xf6\xb7\xd8\x9c\xbc\x4f\xde\xaa\x92\xcb\
+\x70\x0f\xf5\x3c\x05\x02\x12\xfc\xbc\x20\x8b\xd4\xca\x75\x25\x9d\
+\xf6\xdf\xce\x7d\xf3\xd0\xeb\x90\x86\x8a\x71\xde\x98\x7e\x08\xfa\
+\x09\x82\x18\x8a\xf2\x72\x02\xfd\x41\x65\xe7\x99\x99\x39\xb1\xcd\
+\x19\x31\xc6\xe9\x5e\x1f\xa7\x00\x69\x72\x90\x15\x56\x28\xdc\x8f\
+\x54\xeb\x95\x4c\xd7\xef\x3e\x6f\xb8\xf3\xbd\x8a\x16\x07\x0a\xef\
+\x42\xc1\x4c\x98\x30\x03\xad\x06\xe6\x3f\xfa\xa3\xea\xae\x4d\x73\
+\x87\x46\x0f\x8b\xd5\xa9\x86\xa3\x95\x63\x36\x23\x97\xc9\xe5\x16\
+\xf7\xc6\x69\x6f\x1f\xbd\xba\xd9\x1d\x08\x2f\x09\xbe\x92\x1f\xb6\
+\xd9\xe5\xf6\x8b\x02\xcd\x9c\x9c\x33\x34\x72\xb6\x8f\x13\x8d\xe0\
+\x2e\x91\x1f\x01\x12\xca\xf0\x10\xc1\x68\x22\x23\x0c\xec\x89\x0e\
+\xf7\x7d\xf3\xd6\x7d\xfe\x91\xc5\x17\xba\x62\xf1\xa5\x9c\xbf\x5f\
+\xfa\x29\x82\x18\x74\x91\x34\x84\xf5\xf2\xcd\x15\xdd\xd5\x89\x4e\
+\xdf\xa9\xbc\xac\xb8\x49\x92\x20\x19\x21\x8b\x05\xcd\x85\x88\x4f\
+\xa4\x4c\x11\x1a\xe9\x9f\xe5\x1d\xf7\xdf\xb3\xad\xb4\x02\xd7\x57\
+\xf8\xd0\x0a\x61\x00\x84\x82\x05\x00\xb0\xef\x83\xe4\x84\x00\xc3\
+\xfc\x44\x3b\x02\xbc\x64\xab\xef\xfb\x6c\xd5\x98\xf4\x31\x1e\x49\
+\xca\x86\x9a\x8c\x51\x4b\xef\xfd\xf5\x67\xa7\x97\x6f\xee\x74\x06\
+\x70\x4b\x0d\xb7\xd9\x42\xd5\x08\x41\xb5\xf3\xb6\xf4\xf0\x0f\xb6\
+\xbd\xaf\xb9\xc7\x95\x62\xd2\x35\x4e\x4a\x8d\x9e\xe7\xf5\x73\x78\
+\x03\x31\xce\xa5\xe0\x35\x25\xad\x5e\x25\xef\xb8\x6b\x5b\xf9\x6d\
+\x77\x6f\xaf\x3a\x6c\xf7\x03\x6b\x08\x9e\xbe\xcc\x53\xfc\x10\xf4\
+\xa3\x03\x88\x84\x52\x07\x19\x88\x5e\x41\x90\x6f\x68\xb3\xb5\xf5\
+\x7a\x02\x87\x96\xe5\xc6\x8f\xf5\x0b\x52\x02\xc8\xce\x03\xae\xd3\
+\x78\xb6\xd7\xfd\xea\x8d\x5b\xce\x6e\x70\xf8\x58\xb0\xca\x2f\x16\
+\xdd\x28\x60\xf4\x50\xb8\x8e\xc4\x65\x00\x7e\x1d\x28\x2f\x00\x1a\
+\xe7\x4a\x59\xa9\x8f\xe5\xac\x2c\xbf\x79\x59\x4e\xfc\x02\x8d\x52\
+\x66\xbf\x6d\x5b\xf9\xa5\xcf\x9c\xe9\xb0\x63\xde\x85\xc0\xc3\x03\
+\xf2\x0c\xf6\x6d\xe0\x5a\x0e\xb1\xa2\x98\xd3\xdd\xce\xe6\x99\x29\
+\x51\xea\x04\xbd\x6a\x12\xb8\x66\x37\xa4\x45\x18\x54\xf2\xaa\x9b\
+\xb6\x96\xdd\xf6\xc2\x89\xe6\x5a\x98\x5e\xe5\x50\x16\x97\xb3\xa1\
+\x7a\xff\x39\x84\x2e\x85\x48\xe8\x5c\x42\xc1\xc1\x5a\x8a\x28\xd1\
+\x7f\x8f\x4e\x89\x95\x7e\xbb\xf8\x4d\xef\xbd\xf3\xda\x03\xf7\x2f\
+\x78\x3d\x37\x5a\x8f\x5b\x5a\x41\x84\x42\x04\xeb\x31\x72\x7e\x4d\
+\x51\x62\x42\xe9\x0d\x53\x57\xe4\x46\xe9\xf1\x2b\x59\x1e\xe0\xc9\
+\x40\x42\x6b\xc2\xe3\xaf\x27\x66\xe4\xdc\x3b\x71\x68\x2e\x9e\xa3\
+\x35\xe1\x71\x20\x41\x5d\x3c\x30\x85\x06\x13\x75\x66\x7e\xd1\xa2\
+\x87\xa7\x0f\xc3\x28\x12\xeb\xf7\xc7\x07\xa1\x3e\xd0\xd8\xa7\xc0\
+\x83\x0b\x5e\x87\x3e\x76\x48\x0f\x2f\x7a\xe3\x97\xa3\x53\xa2\x31\
+\x1f\xc7\x70\x81\x2e\x90\x41\x93\xb1\xff\x8c\xf7\x4a\xc3\xa3\x42\
+\x10\x83\xa2\xba\x00\x01\x30\x44\xb0\xd7\x8e\x4a\x8d\x90\xfe\xb4\
+\xfc\xf1\xbb\xc6\x0e\x2d\xc0\xef\x72\x86\xac\xb5\x08\x85\x04\x44\
+\x67\x46\xea\xa8\xba\x5b\x66\xfc\x4d\xfa\xed\x92\xb6\xe6\x3b\x66\
+\xdf\x9d\x1b\x6d\x20\xe9\x17\x02\x11\xd2\xb0\x3e\xa6\x63\xfe\x79\
+\x42\x0c\x83\x97\x17\xa3\xa5\x3a\xee\x5c\x78\xa5\xf4\xf0\xe2\x3a\
+\xe9\xf7\xcb\xde\xff\xaf\x91\xb9\x84\xa9\x12\x26\x66\x3c\x22\x85\
+\xeb\xdf\x3d\x2e\xad\x40\x7a\x6c\xf9\x63\xd7\x8e\x4e\x8b\xc0\xef\
+\xf8\xda\x12\x3c\x9e\x4b\x58\x91\x80\xf7\x05\x0d\x3c\xff\xde\xe8\
+\x07\x61\x1a\x22\x5a\x21\x93\x4b\x5b\xd7\xcc\x18\xfd\xdb\xbd\xc7\
+\x3b\x0f\xb6\xda\x3b\x40\x08\x32\x70\x52\xc2\xa0\x87\x12\x42\x84\
+\x6b\x29\x09\xbc\x61\x56\xb4\x41\xaa\xef\x73\xa1\x8b\x44\x57\x4b\
+\xfc\x11\x62\x03\xae\x89\x19\x16\x65\x10\x77\x5c\x39\xe9\xce\x44\
+\x9d\xfc\x26\xab\x97\xb5\x46\x6a\x95\xd1\xbd\x3e\xee\x6d\x58\x12\
+\x3c\x52\xde\xeb\x22\x5b\x61\xe7\xfa\xb0\x90\xe0\xd1\xb7\x0d\x6a\
+\x16\xd2\x31\x8d\xca\x8b\x8d\x90\x76\x5e\x35\xf1\x8e\x58\x15\x73\
+\x93\xcd\xc7\xdb\xf5\x4a\xb9\xa9\xdb\xe3\xff\x6c\xce\xba\xe3\xf7\
+\xd4\x58\xdd\x18\xa9\xf6\xef\x8b\x42\x37\xf0\xe2\x30\x95\x01\x7d\
+\xac\xeb\x73\x43\x6f\x45\xe8\xe7\x85\x22\x68\x8c\x62\x28\x19\x74\
+\x5f\x78\x69\x49\xf1\xb0\x42\x97\x2d\x7a\xea\xee\x8a\x83\x02\xf1\
+\xf7\x83\xfb\xf7\xef\xd2\x05\xb5\xe7\xdf\x25\x14\x0e\x06\x02\x2b\
+\x72\xe3\x63\xee\x9d\x9a\xfe\xcf\xcb\xb2\xe2\x2e\x89\xd4\xd2\xc7\
+\xb6\xd7\x5b\xad\x90\x1d\x8a\x01\x06\x13\x7c\x27\x1b\xca\x7d\xee\
+\x00\x0c\x93\x6c\x52\xf6\x17\x41\x77\x06\xdf\xc5\x27\xe6\x16\x2c\
+\x98\x96\x6e\xbe\xcf\xe6\x66\x5d\x30\xaf\xc9\x20\x2a\xf4\x46\xaa\
+\xe4\xe3\x97\x0f\x4b\x8a\xdb\x52\xdf\xb3\x07\x96\x06\xe1\xb6\xfb\
+\x09\xf9\x0c\xe4\x85\xd4\x0f\x5e\x8c\x41\xda\x71\xf5\xa4\xfb\xe2\
+\x94\xb2\x1b\x5d\xac\xe8\x50\xe3\x7e\xa7\x20\xf9\x63\xf4\x9a\xa2\
+\xa5\x59\x66\x6e\xcb\xc9\xe6\x13\x7d\x12\xde\x21\xf7\x45\xb0\x84\
+\x9d\x83\x3e\xa2\x6d\x7e\x19\x78\x30\x7f\x4a\x64\x67\xe8\xb9\x79\
+\x85\xe3\x6f\x1a\x93\xf8\xfc\x90\xf4\xc8\xa9\x95\x7d\xce\x4f\xcb\
+\x7b\xdc\xbe\x73\xfb\xf7\xef\xd2\xf7\x0e\x60\x50\xf8\x12\x93\x69\
+\x8e\x92\x5e\x5b\x38\xe2\x6e\x35\x2d\x4c\xa0\x25\x3a\x62\x66\x76\
+\xc2\xc2\x54\xb5\xa2\xb9\xbc\xae\xa7\xde\x0a\xee\x14\x35\xf9\xdc\
+\x71\xa0\xa0\x61\x80\x92\x30\x60\x84\x20\x28\x7c\xa6\x5d\xfc\xd3\
+\xcc\x9c\xec\xdb\x47\xa7\x3d\x69\x07\xe1\x29\xe5\x78\x87\x04\xe1\
+\xc1\xf8\x78\xd1\x63\x52\x2b\xc6\x2e\x2f\x48\x8c\xdf\x56\xd7\xb3\
+\x17\xd6\x82\x62\x50\x88\x17\x26\xc8\x23\x17\x7e\x01\x3c\x6a\xc7\
+\x55\x00\x9e\x4a\x7e\x9d\x8b\x15\xac\x30\x3f\x12\x4b\xc5\xba\x1e\
+\x56\x08\xc4\xeb\x35\x13\xf4\x32\x59\xc5\x27\x4d\x7d\x4d\x50\xa5\
+\x7f\xcf\x14\x91\xc4\x3e\x9e\x6b\xe9\xe8\xca\x20\x1d\x03\x21\x7a\
+\x6c\x42\x8c\xb8\x6d\xed\xf4\xb5\x97\x66\x1a\x1f\x77\x7a\x38\x39\
+\xd4\x8c\x1c\x67\x36\x28\x36\x9f\x6a\x3e\x88\x0a\x01\x65\xbf\xac\
+\x7b\xdf\x9a\xbe\x77\x00\x89\x2b\x04\x2c\xfe\x78\x49\xde\xc8\x39\
+\x59\x31\xf7\x7b\x7c\x2c\x9a\x54\xc0\xe7\xe7\x35\x13\x93\xa3\x16\
+\xac\xc8\x8d\x93\x76\x75\xd9\x8f\x43\x34\x4f\xe6\xad\x73\x4d\x71\
+\xa0\x76\xa2\x30\x11\xd4\xc2\x58\x83\x09\x94\xe1\x49\x96\x13\x92\
+\x41\xc2\x7e\x10\x40\x7f\xbf\xb1\x3d\x3f\x82\xa8\x52\x8c\xbe\x22\
+\x3f\x31\x79\x6f\x53\xdf\xc1\x76\x97\x1f\x9f\xce\x3d\x0f\x44\x04\
+\x0f\xe5\x3e\x2a\xc1\x24\xdb\x7e\xd5\xa4\x87\x62\x95\xb2\x6b\x00\
+\x3c\x5b\x18\xbc\x60\x29\x32\x5f\x4a\x6e\x5e\x94\x4d\xcc\x49\x9c\
+\xd0\x66\xf7\x1d\x2c\xe9\x72\x58\x11\x1c\xec\x0b\x16\x18\xd8\x47\
+\x24\xac\x88\x5e\x02\x40\x15\x47\xc5\x1b\x55\x5b\x56\x8f\x7d\x28\
+\xdd\x24\xbf\xd5\xe9\xe7\x7d\x30\xbf\xf3\xac\x20\xf2\x09\x26\x6d\
+\x3e\xe8\xdd\xd1\xcd\x4d\xd6\xae\x90\x8c\xce\xed\xde\x77\x22\x32\
+\x31\x7f\x5f\x84\x02\xc2\x50\x1c\xa2\x35\x6a\xe5\x30\xf3\xcd\x2e\
+\xb7\x57\x01\x93\x3c\x58\x04\x25\x07\x21\x05\x2c\x7e\xd6\x65\x8a\
+\x8e\xb8\x7d\xe7\xaa\xf1\x7f\x19\x9d\x60\xd2\xa3\x16\x83\x9c\xc3\
+\x82\x3b\x8f\xf0\x1d\x2e\x78\x5c\x94\x93\x38\x4c\xa5\x55\xe5\xfb\
+\x78\x21\x00\x09\xe7\xf5\x19\xd6\x7e\x8c\xd3\xc7\xba\xe2\x0c\xea\
+\xa9\xf9\x71\x86\x58\x4c\x43\x35\x3f\x97\xd0\xed\xe1\xb1\x20\xc6\
+\x60\x8c\x53\xc9\xa6\x3b\x40\xc0\xb8\x6e\x84\xa4\x73\x4b\xe3\x62\
+\xce\x0f\x32\x4e\x8d\xd3\x2b\x48\x54\x0a\x05\x2e\xc0\xb1\x9f\xd0\
+\x25\x8b\x4f\xce\x1b\x9f\xb4\xf7\xea\xc9\x7f\xd7\x29\xe8\x95\x36\
+\x2f\x87\x56\x8d\x20\xc9\xe0\x28\xb8\x58\x5e\xb5\x6a\x42\xe6\x8d\
+\x68\xf9\x28\xa3\x60\xb3\xff\x3e\x7d\xaf\x16\x08\x58\x10\xcd\xfa\
+\xed\x94\xac\x85\xd3\x52\x62\x7e\xe1\xe7\x05\x2f\x74\x34\xdc\x06\
+\xb9\x12\xce\x71\x82\x57\x25\x97\x17\x5e\x53\x94\x3c\x2e\x56\xaf\
+\x38\xbe\xb5\xae\xd7\xf1\x65\xc2\x01\x63\x41\x01\x30\x67\xba\x9c\
+\xad\xd3\x93\xcd\x6d\xd9\x31\xfa\xb9\x5e\x58\xa4\x83\xb6\xa3\x0b\
+\x0d\xd7\x41\x97\x4b\x9b\xf4\x6a\xf5\x51\x9b\xf3\xd7\x77\x6c\x2e\
+\x3b\x05\xab\x3c\xbc\xb4\x74\x9e\x86\xa3\xe5\xa0\xa5\x9c\xee\x72\
+\x78\xa3\x75\xea\xca\x69\xd9\x71\x8b\x3c\x5e\x16\x57\xef\x58\xb6\
+\x9f\x1f\x6e\x24\x98\x0d\x2a\xd3\x91\xd6\xbe\x27\xef\xd8\x7a\xf6\
+\xed\x80\x20\x62\x81\xf3\xe6\x3b\x24\xec\x3b\xe4\x49\xcf\xcd\xcf\
+\x1b\x75\xfb\xf8\x94\xe7\x02\x7e\x2e\x1b\xda\x71\x2a\x83\x8f\xac\
+\x85\x79\xe2\x1d\x74\x81\x48\xa5\x62\x28\x34\xdf\xb2\xa9\xae\xbb\
+\x36\x2c\xab\x50\xfe\x77\xa6\xef\x15\x40\xec\x10\x58\x1c\xf5\xca\
+\x92\x91\x4f\x28\x29\x29\x0e\x0c\xcc\x07\x1d\x1d\xd8\x06\x5e\x3f\
+\x93\xc1\x60\xbc\x10\xda\x25\x4f\xcf\x4e\x9c\xe3\xf1\xf3\xdb\x0f\
+\xb5\x59\xc9\xcb\x06\xce\x75\x4d\x48\xa0\xa8\x78\xef\xa7\xec\xc3\
+\xaa\xce\xaa\x69\x43\x22\x3b\x33\x63\x0c\xb3\xbc\x98\x10\x12\x3a\
+\x6a\xb3\x46\xc1\x98\x4e\x75\xd9\x9f\x5f\xf4\xd6\xf1\xf5\xee\x00\
+\x8f\xc6\x77\x21\x56\x41\x0a\x29\x45\x49\xa7\xa3\x7d\xea\x90\x48\
+\x7f\xaa\x59\x7f\x09\xb8\x66\x3f\x34\x8f\xc2\x26\xe0\x99\x74\xaa\
+\x88\x23\xed\xb6\xff\x9d\xbf\xee\xd8\x8b\xf6\x00\x79\x87\xcc\x05\
+\x63\xc7\xb0\x5b\xbd\x17\xd6\x9a\x0f\x4e\xcb\xfb\x57\x9f\xdd\xab\
+\x97\xcb\x18\x2f\xf4\x8d\xdc\x7f\x33\x90\xa0\x9c\x00\xae\xc3\x94\
+\x6e\xd6\x45\x3e\x7d\xac\xf1\xc3\x81\x17\xa3\xff\x1d\xfa\x5e\x5d\
+\x28\x10\x89\xee\xfe\x75\xba\xf5\x51\x91\xa6\x9b\x61\x20\x91\xf0\
+\xfd\xbc\x55\x03\x82\x08\x03\xa5\x5c\x1e\x5f\xed\xa7\x35\x5d\x3d\
+\x98\xf6\x65\x12\xc7\x61\x82\xa0\x04\x7b\x80\x53\xcc\x7b\xe7\xe8\
+\x47\x07\x9a\x7a\x1f\x32\xe9\xc9\xd5\x06\xd4\x60\x0e\x16\xd1\x46\
+\x9e\x96\x6d\x59\xfe\x41\xc9\x73\x3d\x1e\x3f\x3e\x19\xd6\xcf\x2a\
+\xe4\x46\xf1\x2f\xae\x43\x09\x61\x1e\xea\x0a\x44\xac\xb2\x15\x6f\
+\x1f\x7b\x9d\xed\x72\x6c\x90\x2b\xe5\x46\x40\x88\x0f\x81\x67\x38\
+\xd8\x62\xf9\xcb\xdc\xb7\x8f\x00\x78\x1c\xb9\xb1\xe9\xcb\x44\x8d\
+\xe0\xe1\x71\x63\x4d\x57\x9d\xcb\xef\x3f\x8e\xaf\x2f\x01\xb0\xcf\
+\x35\x0a\x0c\x78\x44\xad\x4a\x11\x25\x57\xca\x0e\xdd\xba\xa5\xf4\
+\x37\xd8\x4e\x48\x61\xfe\x6d\xfa\x5e\x2d\x10\x09\x3b\xb6\xb3\xa1\
+\xb7\xbd\xde\xea\xde\xb9\xaa\x30\x35\x0d\x40\xcc\x0b\xf0\x44\xc3\
+\x71\xb0\x44\xcb\xc1\xfa\x64\x7a\xb5\x22\xf0\xeb\xdd\x55\xf7\x6f\
+\xae\xed\xee\x81\x3c\xd0\xe4\xa0\x98\x70\x9e\x1a\x84\x02\x10\x9e\
+\x83\x20\x45\x30\x3c\xc5\x86\xaa\xae\x8a\xe2\x94\xa8\xee\x9c\x18\
+\xc3\x25\x2e\x08\x8c\x34\x4a\xa6\xe1\x8e\x1d\x65\xf7\xec\x6a\xb4\
+\x78\x60\xae\xa1\xf9\x01\xb6\x12\x7a\x7b\x0f\xf9\x0e\x7f\xfa\x05\
+\x86\x09\xe8\x29\xac\x1c\x4f\xf7\xf8\xd9\xe3\xcb\x86\x27\x8f\x03\
+\x4f\x90\x12\xa9\x57\x29\x0f\xb5\x5a\x9f\x9e\xbf\xfe\xd8\xcb\x30\
+\x67\xe1\xcd\x55\x02\xce\xd3\xc1\x5a\x41\xc2\xf1\xc1\x98\x48\xff\
+\x30\x03\xfb\xde\xe7\x65\x45\x37\xc7\x37\x2c\xca\x4e\x58\x10\xe0\
+\x04\x74\x26\x98\x85\xed\x89\xf8\x72\x05\x93\x56\xa9\x2b\xeb\x75\
+\xbe\xf9\xcb\x2d\x65\x0f\x7e\x5c\xd5\xd5\x8b\x3c\xc2\xe3\xfd\x77\
+\xe9\x7b\x07\x10\x7b\xa5\x96\xcb\xe4\xa7\xbb\x9d\xae\xd2\x1e\x7e\
+\x5b\x7e\xb4\x8e\x4e\x31\xa9\x26\x78\x38\x11\x23\x46\xf4\x1c\x92\
+\x41\x25\x8f\x28\xe9\x71\xbd\x7a\xe3\xa6\xd2\xcf\xe0\x3b\xf6\x81\
+\xcc\x2f\x68\x25\x30\x2c\x22\x1c\x04\x12\xd3\xc2\x84\x69\x20\x38\
+\x02\xe2\x07\x95\x5d\x67\x27\x26\x46\xda\xf3\xb2\xa2\xc7\x3e\xf7\
+\x79\xed\xaf\xfe\x74\xa0\xbe\x0e\x77\x73\xb8\xd0\x1e\x27\x94\x43\
+\x3e\xcc\x98\xb4\x48\x69\xeb\xf2\x71\xb7\x5c\x3b\x26\x69\xfc\xc9\
+\x4e\xfb\xb1\x4e\x17\x8b\x4b\x0f\x22\x39\xc4\x05\x24\x2d\x3b\xd1\
+\xe3\xf2\x77\x38\x7d\x65\x2b\xc6\xa6\xcd\x3f\x58\xdf\xf3\xea\x82\
+\xf5\xc7\x5e\xb8\x10\x78\xd8\x19\xec\x13\x01\x0e\x2c\x0f\xcf\x43\
+\x99\x78\x90\x81\x4b\xee\x59\x90\x1d\xaf\x4d\x8b\x50\x4f\x86\x3e\
+\xfa\xa0\x06\x74\x46\xd2\x9a\x4c\xfa\xc0\xae\x86\xee\xdf\xce\x7d\
+\xfb\xe8\x2b\xe5\xdd\x4e\x09\xef\xad\x41\x8b\x0c\x56\xfd\xf7\xe9\
+\x7b\x07\x10\x09\x3b\x88\xfb\x83\x67\x7b\xad\xd4\x5b\xe5\xad\x87\
+\xc6\x26\x98\x1b\xf3\xe3\x23\x8a\xfd\x9c\xa0\xe5\x05\x89\xd1\x2a\
+\xe5\x0d\x0f\xed\xad\x79\x18\x84\xca\xa2\x8b\x0a\x03\x86\xc7\xdc\
+\x28\x7d\xd2\xa5\x05\x71\x11\x15\x3d\x6e\x27\xa0\x0d\xca\x4a\x04\
+\x44\x08\xf3\xd1\x12\x21\x1a\x95\x6d\xab\xef\xa9\xd0\x0a\xe2\x8e\
+\xbf\x1d\xa9\xaf\x72\x04\x04\x2c\x44\x84\x42\xd4\x1e\x8c\x44\x05\
+\x6b\xc7\xbd\x73\x0a\x56\x67\x67\xc4\xdc\x99\xa4\x94\x8f\x99\x9d\
+\x35\xd4\xf9\xf2\xc9\xa6\x52\x8e\x3c\x66\x18\xe4\x49\x80\x80\xa6\
+\x6b\x6c\x5e\x8b\x9e\x91\xed\xbe\x63\x5b\xf9\xde\x3e\x1f\x87\x6b\
+\x51\xf1\x3c\xf0\x42\xf3\xdd\x88\x38\x63\xfc\xcc\x94\x28\x73\x79\
+\xaf\xcb\x01\x05\x88\x92\xe1\x18\xa0\x3c\xc5\xb1\x42\xc5\xd2\x61\
+\xf1\xd3\xdd\xac\x60\x86\xb5\xaa\x96\x96\x49\xcd\xaf\x9d\xb4\xdc\
+\x7e\xe3\x96\xd3\xfb\x9d\x7e\x56\xa1\x82\x88\x1c\x2c\xf2\x7b\x03\
+\xef\x7b\x21\x94\x30\xba\x2e\x3c\x9e\x4b\x28\x29\x88\x42\x18\x23\
+\x1c\x9f\xca\x4d\xc8\xb4\xde\x37\x7f\x83\xf4\xd8\xb2\xc6\xa7\xe7\
+\x15\xcc\xc4\x7c\xb4\x00\x3c\x86\xea\xd2\xf9\x31\x11\x54\xfb\x1d\
+\xb3\x5e\x96\x9e\x58\xb6\xf7\xef\x4b\x47\x66\x87\xf2\x08\x9b\x73\
+\x09\x01\x0f\x9d\xf6\xe7\xe2\x09\x14\x26\xf3\xfa\x0b\x97\x0e\x5f\
+\x2a\x3d\xb4\xa8\xdc\xf1\xab\xb9\x27\x1c\xf7\xcc\x3d\x2e\x3d\x30\
+\xbf\xfc\xc5\x4b\x0b\x96\x61\x1e\x96\x19\xc8\x32\xfc\x05\x8f\x03\
+\xd3\x91\xb0\x6d\xec\x03\x9e\xbf\xbc\xa8\x38\xd9\x7f\xff\xe2\x4f\
+\xf9\x87\x16\xbe\x37\x12\xd6\x7b\x98\x06\xbc\x48\x95\xf0\x58\x9e\
+\x99\x9b\x3f\x5b\x7a\x7c\x59\xa3\xf7\xc1\x05\x4f\x5f\x3e\x2c\xde\
+\x14\xca\xbb\x60\xac\x01\x7c\x2f\xb8\x87\xfb\x6d\xe8\xdf\xb6\x40\
+\x6c\x5d\x00\x55\x44\x6d\x94\xa3\x15\x05\x93\x09\x85\x54\x18\x9f\
+\x1a\x61\xb6\xf4\xba\x2c\xd5\x7d\xee\x7d\x5e\xaf\xbf\xf1\xf7\xfb\
+\x6b\xb6\x82\x96\xa2\x8e\x93\x22\xf0\x07\x96\x18\x72\xe9\xc0\xb5\
+\xb3\xae\x4e\x31\x30\x6b\xac\x16\x9f\x72\x4a\x5a\xf4\xa5\xa9\x46\
+\x75\xd5\xc7\xd5\x5d\x2d\x44\x80\x03\x2c\x11\x09\xbf\xa0\xe6\xa3\
+\x55\x86\x09\xfa\x22\x83\xf6\xc5\x17\xe6\xe5\xcf\xb8\x69\xfc\xd0\
+\xc7\x5c\x5e\x16\x9f\xa7\x27\x6b\xae\x00\x84\xab\xc5\x43\x63\xa6\
+\xc7\x6b\x94\x35\x9f\xd6\x76\x37\x60\x59\xa8\x12\x6e\x9f\xf0\xc2\
+\x71\x0c\x24\x1c\x1b\x4e\x79\xd0\x51\xe1\x95\x05\xc3\x0b\x6e\x18\
+\x9b\xfc\xa2\xd7\xeb\x4b\x02\x7e\x09\x33\xb3\x62\x98\xbf\x9f\x68\
+\x3e\x02\x6c\x11\x1c\x9c\xd1\x48\xed\x53\x5d\xce\x8e\x28\x35\x53\
+\xfd\xc4\x89\x86\x7f\x7c\x50\xd6\xe9\x82\xb9\x16\x03\xbb\x41\x9c\
+\x91\x2f\x34\x47\x3c\x0e\x5a\x75\x30\xf5\xbb\xd1\x77\x06\x10\x85\
+\x82\x2d\xe7\xc6\xc4\xca\xae\x2e\x4a\xcc\x91\x14\x01\x5b\x8b\x8d\
+\x13\x51\xdb\xc2\x83\x09\x13\x76\x12\xc1\xc5\x57\x61\x6d\xac\xe9\
+\x2e\x47\xf0\x42\x59\x38\x18\x14\x80\xf8\xf4\xe2\xfc\xdc\x79\xc9\
+\xfa\x3f\xb9\x61\x22\x03\xf7\xc3\xfa\x02\x9c\x6e\x42\x6a\xd4\xa5\
+\x69\x46\x4d\x07\x80\x58\x85\x02\x87\x36\x07\x49\xe2\x1c\xf0\xc8\
+\x0e\x10\x80\x37\x12\xc0\xfb\x5f\x87\x9b\xc5\x8b\xab\xe1\x9b\x9b\
+\xd0\x4e\x44\x1f\x2c\x31\x26\x0f\x8d\x9e\x11\xa7\x55\x96\x6c\xaa\
+\xed\xe9\x08\xb5\x4d\xb8\x0c\xe4\x85\x84\x42\x0e\x83\xf7\xcf\x85\
+\x23\xa6\x5c\x37\x26\xe5\x59\x87\x2b\x10\x29\x67\x18\x1f\x44\x91\
+\x7c\xb2\x56\x35\xca\xa8\x51\x94\x6c\xad\xef\x6d\x03\xde\xfd\x6b\
+\x3a\x37\x27\xf0\x9f\x54\x75\xd7\x54\x76\xba\x70\x3d\x33\xf8\x69\
+\x1b\x20\x74\x27\xe8\x8e\x41\x59\xa4\x49\x49\x91\xa6\x59\x19\xf1\
+\x89\xa5\x16\xaf\x4d\xc2\x57\x2d\x7e\x07\xfa\xce\x00\xe2\x82\x0e\
+\xd5\xee\xf1\xfc\xc4\xf4\xff\x59\x3e\xe2\x81\xc5\x19\x31\x89\xbe\
+\x16\x47\xcd\x19\xbb\xd7\x0f\x2b\x27\xc8\xc5\x29\xe6\x0b\x42\xc4\
+\x20\x8d\x2c\xa4\xc3\x5a\x17\x52\x02\x69\x54\xa2\x89\x7e\x71\xfe\
+\xf0\xc7\x38\x56\xca\x04\xc9\xf9\x42\x60\x09\xbe\x80\xc0\x4c\x48\
+\x8b\x9e\x9b\x66\xd0\xd8\x3f\xae\xe9\x2a\x45\x91\x62\xbd\x73\x09\
+\xdd\x10\xf2\xbc\x67\xe2\xd0\xb4\x07\x2e\xc9\x7b\xc5\xe6\xf0\x6b\
+\x41\xf3\x59\xc8\x1a\xe8\xba\xd0\xcd\x0b\x1e\x3f\xa7\x9a\x92\x1d\
+\x3f\x0b\x7a\xb9\xe7\xf3\x56\xab\x0d\x15\x2e\xdc\x9f\x81\x04\x0d\
+\x61\x90\x22\xbe\xb6\x78\xc4\xfc\x6b\x47\xa5\xfc\xc5\xe9\x66\x41\
+\xaf\xe8\x00\x64\xa1\xd7\xc4\x39\x52\x35\x3e\x39\x32\x7b\x4b\x7d\
+\xcf\xa6\x0e\x57\x80\xbc\xf1\x30\xcc\x04\x79\xc2\xe1\xbc\x2b\xf3\
+\xd8\x4f\xb4\x58\xe4\xfb\xe6\xec\x11\xe9\x8f\xcd\xca\xb9\x7d\xf9\
+\xb4\xe1\x13\x9a\x04\xfd\xbe\xd3\x75\xcd\x02\x2e\xad\xce\xc1\xfb\
+\x6b\x69\xe0\x00\xbf\x15\x89\x30\x17\xe3\xa2\x67\xc6\xf0\x98\x99\
+\xae\x3e\x27\xa3\x12\x64\x63\x9f\xbb\x6a\xfc\x43\xff\x5c\x5c\x34\
+\x9c\x64\x43\x34\x89\x83\x1a\x28\x71\x1c\x10\x06\x38\x78\x8e\xe9\
+\x70\x82\x8f\x47\x53\xef\x8e\x4d\xbf\x8e\xe6\xa9\x62\x5e\x14\x5d\
+\x08\x1e\xe6\x03\xe1\xfc\x20\xb8\xdc\x81\xc0\xda\x82\x84\x87\x9a\
+\xef\x58\x72\xd3\xe4\x8c\x04\x32\x3a\xe0\x4b\x0a\x84\x29\x3c\x66\
+\x70\xd1\x7d\x92\x9f\xab\x06\xf0\x54\xa0\x5c\xe7\x49\x02\x52\x70\
+\xa3\x41\x25\x04\xb8\x9a\x2a\x28\x4b\xd2\xc8\xff\xc1\x14\x02\x4f\
+\x7a\x75\xe1\x88\xd5\xbf\x18\x95\xf2\xb8\xc3\x1d\x40\x8d\xea\xbf\
+\x55\x11\xf2\x71\xd3\xda\xc3\x48\x74\xc1\x9b\x97\x8f\xb8\x05\xf2\
+\x88\xe0\xc3\xbd\xc2\x31\x0e\x04\x0f\xd3\x11\x54\x74\xa5\x05\xb1\
+\x06\xea\xa3\x2b\xc6\x2c\xb8\xb2\x38\xf9\x7e\x3f\x6e\x76\x74\x77\
+\xc5\x4c\xa4\x7b\x26\x62\x39\xa8\xf4\xad\xf1\xf8\x4e\x00\xa2\x26\
+\xc1\x41\x5a\x59\x90\x94\x9c\x9e\x1c\x35\x4a\x10\xa4\x00\xf8\x4d\
+\x9f\x8d\x13\xcc\xcb\x0b\x93\xee\xac\xbd\x7d\xd6\xca\x29\xe9\x31\
+\x0a\x91\x92\x4b\xb8\x9f\x79\x61\xbb\x01\x02\x21\xcb\xe4\x0c\xa5\
+\xcf\x49\xc8\x82\xa3\x1a\xc6\x4c\x34\x37\x98\x49\x08\xa3\x0d\xc1\
+\xcd\x8a\x6c\x4a\x34\x75\xdd\xa5\x7a\x26\x09\x13\xc3\x7b\xa4\x61\
+\x02\x61\x62\xb8\x4a\x7f\x5a\xdb\xe3\x5e\xf5\x51\xc9\xdd\x5a\xb5\
+\xa2\x84\x61\x18\x13\xba\xbf\x50\x11\x6c\x0a\x17\x68\x46\xad\x46\
+\x5e\xb6\xe6\xc3\x92\xbb\x3f\xad\xe9\xc2\x1b\x8a\xcf\x73\x71\xd0\
+\x57\x02\x9e\x59\xa7\x52\xad\x18\x91\xfc\xdf\x3e\x0f\x2c\x3d\x82\
+\xe0\x9d\x33\x0a\xf8\x2a\x49\xaa\x28\xa5\x2a\x0b\xef\x2f\x05\x1a\
+\xc4\x27\x4c\xd8\x06\x8e\x4b\x0e\xd3\xf3\xcd\x45\x99\xd1\xfb\x7e\
+\x31\xe9\xee\xc5\x39\xf1\xab\xec\x6e\x16\x83\x3f\xd6\x2b\x48\xe2\
+\xaa\xa2\xb4\x19\xc3\xe3\x22\xe4\xd0\x95\x6f\xbd\x47\xfa\x9d\x5c\
+\x28\x68\x17\xb6\x23\xbd\xb5\x74\xc4\xc2\x28\x95\x22\x9f\x13\x45\
+\xbc\xe2\x80\xd7\xcd\x04\x98\xde\x84\x68\x25\x33\xfc\x9a\x71\xd9\
+\xf9\xc3\x86\x0f\x6f\x78\xff\x48\x99\x03\x21\xbc\x50\xb7\x90\x09\
+\x68\x25\x55\xdf\xe9\xd8\xb5\xdc\xac\x55\x28\xa2\xf5\xc5\x10\x8a\
+\xb3\xc1\x31\x07\x05\x06\xe0\x88\x11\xb0\x6e\xdc\xdb\xd0\xf3\xf8\
+\x8d\x3b\x2a\x3f\x07\x49\x5e\x70\x9f\x13\x13\x50\xb1\xca\x7a\x5c\
+\x81\xb3\x3d\xae\x03\xab\x0a\x92\x27\x82\x45\x27\x42\x32\x5e\xbd\
+\xc0\x27\x62\xf4\x0a\x95\xbc\x69\xf5\x86\x13\x37\x6e\xa8\xec\xec\
+\x43\x8b\x40\xe0\xb1\xee\x40\x0a\xf5\x93\x81\xa5\x0a\x3f\x3d\x35\
+\xca\x3a\xcc\xa4\x9b\xeb\x17\x44\xe2\x22\x83\x59\xe8\x1a\x01\x39\
+\x39\x1d\x25\x2a\x98\x0f\xd7\x7e\x74\xf2\xd7\x95\x7d\x1e\x7c\x7f\
+\x4d\xbf\x0b\x0d\x13\x69\x37\x74\x78\xfb\xb2\x11\x13\x7e\x3d\x6b\
+\xd8\x6d\x5c\x20\x90\x0a\xcb\x29\xdc\x6e\x23\x45\x60\xfc\x9c\x49\
+\xad\x88\x51\xca\x64\xad\x1b\x6b\xba\x3a\x80\xcd\xb7\xda\x23\xfd\
+\xd6\x00\xa2\x90\x40\xe6\xd2\x9a\xc2\x44\xf3\x4d\x63\xd2\xd6\x38\
+\xfd\x1c\x6a\x28\x36\x88\x3d\x82\xf6\x71\x37\x84\xf2\xf3\x7e\x7f\
+\xcc\x18\x03\x3b\x29\x37\xda\xc0\xbd\x5f\xd1\x59\x87\x75\xc3\x12\
+\x08\x53\xb8\x97\x35\x36\x0f\xf3\x6c\x69\xeb\xe7\x45\xf1\x46\x7b\
+\x41\x62\xe4\x4c\x1f\xde\x2c\x8a\xcf\xb5\x80\xae\x40\xd0\x60\xf4\
+\x53\xd4\xee\x59\x6f\x1e\x79\xcc\x1a\x7c\xb7\x35\x91\x3a\x8c\x1f\
+\x1b\x45\x0b\xed\x17\x1c\xba\x2d\x04\xe6\x6c\xaf\xcb\x53\x69\x75\
+\x1d\x5d\x3b\x7c\xc8\xdc\x00\x2b\xe8\x38\x50\x38\xa3\x46\xe9\xfa\
+\xcb\x47\xa7\x6e\x7a\xb6\xb2\xb3\x19\xaf\x5e\x84\x17\xfd\x48\x28\
+\xcb\x10\x2f\x42\xd8\x06\xfc\xa3\x77\x37\xf6\x56\x5f\x37\x36\x25\
+\x43\x45\x31\x85\x50\x18\xe7\x66\x18\xbb\x44\xab\x94\x32\x13\xe8\
+\xc3\xab\x2b\x3f\x3c\xf1\xbb\x4f\xab\xbb\x08\x78\x08\x6a\xb0\x76\
+\x90\xc8\x44\x09\xc7\x4b\xd2\x8c\xfa\x7d\xd7\x4c\xbc\x72\x4c\xb2\
+\xf9\x0a\xa7\xdb\xcb\xc8\x68\x06\x77\xa5\xfa\x3d\x1f\x14\x93\x38\
+\x5e\x94\xe5\xc6\x18\x74\x9f\xd5\xf6\x1e\xea\xf6\xf8\x07\x2f\x7e\
+\xbf\x86\xbe\x8b\x0b\x25\xc3\x8c\x36\xe8\xb2\x29\xad\x2a\x89\x15\
+\xc8\x22\x7a\x50\x7b\x50\x00\x44\xc4\xf8\x5c\x7e\x49\xb5\x20\x37\
+\x71\x5e\x7c\x84\x86\xbc\x98\x1a\x32\x42\x22\x3a\x87\x60\xac\x36\
+\xf0\xff\x97\xbf\x77\xe2\xcd\x2d\xb5\x1d\xbf\x32\x46\xa8\x50\x33\
+\x95\x20\x13\x39\x08\xcb\x76\xcb\x96\xd2\xbf\xb4\xbb\xfc\x44\x28\
+\x44\x4c\xc0\x05\x95\x08\xce\x88\xd8\x10\x44\xc2\x07\x08\xe7\x1f\
+\x18\x3f\xb3\xe1\x6c\x67\xe3\x8e\x86\x8e\x7b\x0c\x3a\x25\x13\xa9\
+\x53\xc9\xf7\x34\xd8\xee\xf9\xe3\xd9\xf6\x1a\x28\x79\x3e\x78\xc1\
+\xe9\x8b\x04\x1d\x70\x42\xda\xc0\x68\x11\x82\x13\xea\xd6\xcd\x65\
+\x4f\xaa\xd5\xf2\x6e\x68\x4d\xc1\x0b\x22\x63\xd0\xab\xf5\x3b\x1b\
+\xfa\x1e\x8f\x7f\xea\xb3\xc7\x37\x56\x75\x10\xd0\xcf\x05\x0f\x09\
+\x41\x40\x5a\x98\x3f\x2c\x6a\x48\x7c\xf4\x34\xa7\x37\xe0\x07\x65\
+\xc4\x7b\x4a\x07\xcb\x1c\x6a\xb2\xa2\x48\x1b\xcd\xda\x9c\x19\x69\
+\x51\xe8\x31\x06\x8d\xe7\xeb\xe8\x3b\xb8\xd0\xa0\x0c\x79\x5e\xd5\
+\x9e\x65\x50\x75\x15\x24\x47\xe6\x04\x58\x2e\x02\x26\xe0\x00\x6a\
+\x62\xb0\x4c\x70\x5e\xd2\xab\xe4\xea\xc3\x4d\xd6\xf7\x9f\x3f\xde\
+\x58\x0b\x49\x64\x7e\x23\x5a\x0e\x1d\xc4\x4e\x86\x47\x8d\x47\xa8\
+\x89\xae\x89\x79\xf7\x6c\x67\x4d\x61\x62\x64\xc9\x88\x58\xe3\x74\
+\x95\x8c\x49\xdc\xd7\x6d\x7b\xfc\x57\x5b\xce\xee\x83\x22\xd8\x57\
+\x9c\x23\x88\x0b\x7d\x65\xc9\x88\xf1\x6f\x2c\x18\xfe\xab\xc3\x1d\
+\xf6\xfd\x4d\x76\x1f\x17\xf2\x0c\x61\x92\xa0\x19\xe6\x9d\xb3\x9d\
+\x6d\x53\x86\x44\x75\x35\x5b\xfd\xfb\xe6\xbc\x73\x78\x7b\x00\xa7\
+\xca\xa0\xa1\x12\xc2\x3a\x68\xe6\x53\x86\x44\xca\xce\xdc\x30\xfd\
+\xb1\xec\x28\xbd\xfc\x93\x9a\xae\xba\x60\x1b\x64\x98\xb2\xb2\x6e\
+\x97\x7d\x42\xa2\xd1\x92\x17\x6d\x58\xaa\xd6\x28\xd9\x8d\x55\x9d\
+\x0f\x5c\xb6\xe1\xc4\x7a\x0f\x87\xd7\x8c\x49\xb0\xd6\x4f\xa1\x31\
+\x11\x19\x84\x30\x65\x0e\x34\xf5\xd9\x67\x0e\x31\x6a\x32\x22\xb5\
+\x79\x30\xbd\xe0\xf4\x10\x96\x11\x8e\x97\x92\x2b\xe8\x08\xa3\x42\
+\xd5\xfa\xde\xd1\xf6\x97\xee\xdd\x7f\xb6\x11\x85\x11\xac\xfa\xcd\
+\xe8\x5b\x03\x88\xbc\xb1\x07\x1d\x6e\x37\x0d\x73\x49\x73\x20\x20\
+\x3f\x3e\x36\x59\x6f\x36\x6b\x55\x69\xde\x00\x27\x01\x32\xf8\xd6\
+\x23\xec\x84\x52\xad\x90\xf5\xdc\xb7\xa7\xe2\xad\x8a\x5e\x37\x3e\
+\x50\x42\x3a\x86\xfd\x57\xc0\x6c\x09\xc1\x03\x82\xd6\x3f\x1a\x24\
+\xf8\x82\x45\x64\xef\x97\x77\xb4\x8d\x48\x33\x95\x65\x47\x6b\xc5\
+\xbb\x76\x57\x3c\x53\xdd\xe5\x26\x97\x8f\x18\x28\x81\x8a\x71\x77\
+\x6a\x54\xec\xfd\xb3\xf3\x9f\x82\xc0\x67\xe6\xca\xfc\xa4\x94\x23\
+\xad\xd6\xbd\x0d\x76\xef\x20\x10\x81\x2f\x5a\x14\xfd\x7e\x65\x67\
+\xe5\xba\xb3\x6d\x95\x01\x01\x0d\xf3\x0b\xd9\x60\x59\x8c\x0a\xa7\
+\xa6\x44\x29\x3f\x5b\x3b\xfe\x71\xbd\x9c\x5e\x31\x3a\x3d\x66\x78\
+\xba\x37\x70\xe0\xa3\x36\x9b\x05\xe6\x05\x06\x4a\x13\x4b\xdd\xd9\
+\x68\xa9\xbe\x61\x74\x5a\xec\x96\xba\xee\x57\x97\xbf\x7f\x72\x33\
+\x46\x8b\xc0\x0c\xe5\x4f\x08\xc7\x80\xe0\x41\x7b\x92\x46\x8e\x22\
+\x0d\x2e\x07\x70\xcc\xf8\x7c\xa9\x8b\xe5\xbb\x57\xe6\x27\x8e\x0d\
+\x70\x82\x0a\xc6\x8f\x5d\x94\x00\x69\xa5\x46\x29\x97\x7b\xbd\xf2\
+\x1d\x4b\xdf\x3b\xfe\xf7\x3f\x1f\xaf\xed\x02\x3e\x03\xc5\xf1\x8d\
+\xe8\x3b\x58\x60\x90\x70\x04\x20\x4b\x7a\x4f\x73\x97\xf7\x50\xab\
+\xff\x58\x9a\x49\x65\xcf\x4b\x8c\xc8\x85\x4e\x6a\x01\x9c\x80\x51\
+\xad\xd0\x82\x75\x6c\xbf\x6f\x47\x65\x19\x48\x01\xa4\x11\xb4\xdc\
+\x51\x09\x26\xdd\x91\x5f\x4c\x5e\x53\x69\x71\x77\xd6\x5a\x3d\x1e\
+\x9c\xb3\x20\x23\x2c\x57\x02\x22\x0c\x9e\xde\x58\xdd\xd5\xf9\xbf\
+\x87\x1b\x76\x96\xb6\x39\x09\x26\x50\x1f\xad\x9a\x9a\x98\x68\xa4\
+\x5e\x5a\x3d\xfe\x09\x68\x7b\x0c\xcb\x0a\x5d\x4a\x19\x33\x7c\x55\
+\x61\x52\xe6\xc1\x66\xcb\xae\x46\x87\x6f\xd0\xa3\xb7\x28\x0d\x7c\
+\x80\x05\x80\xc2\xd3\xb0\xbc\xfb\xc1\x9b\x92\x62\x56\x6d\x5e\x3b\
+\xe1\x09\x15\x45\x2f\xf6\x71\x62\x17\xcf\xf1\xe6\x51\xc9\x51\x85\
+\xbb\x5b\xac\x9b\x9b\x1d\x3e\x96\xb8\x6c\x28\x0f\x53\x32\xf5\xca\
+\xa9\x96\x7d\xeb\xcf\x76\xd4\x81\x15\x0d\x52\x04\xfc\x02\x51\x31\
+\x23\xd0\x2a\x69\x76\x7a\xa4\xa9\xf4\x86\x19\x2b\xbb\x7d\x4c\xdb\
+\xc9\x8e\x3e\x9f\x1c\xb4\x19\x9a\x61\x6a\x60\x9c\xe0\x09\xa2\xb2\
+\xa2\xb4\xc3\x3c\x9c\x00\xae\x94\x8e\x00\xd7\x6e\x7d\xb7\xa2\xf3\
+\xe5\x59\x6f\x1e\xde\x5e\x65\x75\xe1\x2b\x4e\x50\x40\x61\xb6\xdf\
+\x98\xbe\x33\x80\xd8\x12\x6a\x19\x0a\xa3\xc9\xe1\xa4\xdf\xad\x68\
+\x6f\xec\x75\x71\x27\x8b\x87\x98\x93\x0c\x2a\x79\x2a\x0c\xd1\x76\
+\xd7\xb6\x8a\x37\x2a\xfa\xdc\xf8\x08\x19\xac\xf9\x82\x5b\x4e\xcf\
+\xce\x29\x9c\x39\x7e\xa8\x79\xf5\x15\xc3\xe2\xf3\x47\x27\xe8\x5b\
+\xde\xaf\xec\xee\x05\x60\x20\x66\x09\x02\x1c\x26\x01\x04\xe5\x61\
+\x85\x7e\x13\x05\x25\xa0\x0d\x4a\x19\xb5\xff\xbf\x26\xdd\x15\xad\
+\x54\xae\x0a\xf0\x82\x0d\x34\x5c\x01\x91\xa6\x17\x04\x55\x00\x01\
+\x4b\xce\xb1\x76\xfb\xae\x3a\x9b\x67\xd0\xfd\x30\x78\x1c\xc8\x17\
+\xf3\xd0\x8a\x67\xa5\xc7\xa8\x37\xad\x99\xf0\xa4\x5c\xa2\xe6\xb3\
+\xbc\x60\x41\x5e\x90\xec\x17\x15\xb2\xa1\x6b\x47\xa5\x44\x1d\xec\
+\xb6\xee\x6a\xb2\x78\xf1\xd2\x11\x51\x1c\x2f\x27\x90\xf1\x02\xaf\
+\x7e\x76\x98\x07\xd1\x2d\x23\x93\x28\x71\xc3\xad\x2b\x33\x1e\x99\
+\x9c\x7c\xbb\x42\x64\x8b\x33\x12\x95\x9e\x57\x4b\x5a\x2b\x58\x88\
+\xc5\xf0\xb6\x0a\x98\x73\xa9\xec\x28\xb5\x6d\x5a\x7a\x4c\xb1\x5c\
+\x26\xd7\xf1\x02\x75\x60\xde\x5b\x87\x9e\x7b\xf2\x70\x63\x33\x79\
+\x3d\x0d\x8c\x11\xad\x37\xc4\xf6\x5b\xd1\x77\x06\x30\x4c\xa8\xed\
+\xd8\x03\xe8\x03\x7d\xb8\xcd\xea\x3e\xde\x6e\x3b\xb2\x24\x27\x4a\
+\x65\xf7\xab\x9b\x7f\xb3\xaf\xfa\x38\xcc\x15\xb0\x20\x07\x97\x09\
+\xd2\xb9\xa3\x28\x33\xf2\xee\xe9\x19\xd7\xf5\x39\x71\xf5\x43\x69\
+\x8b\x86\x44\x4d\x2c\x34\xeb\x1c\x9f\xb6\xb8\x9a\x30\x40\x20\x17\
+\x60\x42\x7c\xcf\x39\x12\xf0\xff\xb1\xb0\x68\x61\x71\xa2\xf9\x5e\
+\x37\xcb\x93\x97\xc2\x40\x1a\xc0\x01\xcb\x01\x00\x11\xdc\x72\xfe\
+\xca\xc2\xe4\xb4\x23\xed\xd6\x5d\x0d\x36\x2f\x4a\xa5\x1f\xc4\x30\
+\x61\x1a\x80\x20\xcd\x48\x37\x2b\x36\xae\x99\xf0\x67\x58\x78\x11\
+\xf0\x20\x9d\xc8\x01\x79\xf1\xbc\xe8\x8b\x50\x2b\x8a\xa2\x34\x2a\
+\xf7\xfa\xb2\xf6\xd3\x58\x0d\x3e\x84\xd5\x40\x7e\xa8\x94\xa8\x78\
+\x0a\xf0\x9c\x1f\x5c\x31\xb6\x78\x69\xb2\xec\x66\xb7\xdb\x67\xf4\
+\x08\x92\x33\xc5\xa0\x4b\xeb\x71\xfa\x4e\x1f\xeb\x70\x38\xd1\x8a\
+\x51\x46\x35\x36\xaf\x73\x2d\x44\xee\x87\x9b\x1d\x87\xae\xfb\xac\
+\xea\xbd\xcf\x5b\x7b\xf1\x4a\x0c\xce\xc1\x83\x14\xf7\xdb\x52\x48\
+\xbf\xbf\x05\x01\x56\xe8\xce\x50\x10\xa1\x94\x7e\x42\xa1\x62\x7a\
+\xa4\x1a\x9d\x87\x92\xb1\xfb\xfd\x02\x58\x08\x66\x31\x4a\xb9\x4c\
+\x3c\x71\xfd\x94\xe5\x59\x91\x9a\xc5\x01\x5e\xf4\x90\x39\x03\xd2\
+\x55\x94\xa0\x74\xc6\x64\x6c\xba\xfa\x9f\x3b\x3e\xdc\x56\xd9\x40\
+\xd4\x11\x35\x3d\x4c\xd8\x41\xf8\x46\xc3\xdc\x22\x35\xdf\x31\xfb\
+\x31\x93\x92\x59\xe1\xe3\x84\x5e\x10\x0c\x79\x53\x44\x98\xa0\x8e\
+\xa0\x92\xcb\xcc\x6e\x5e\xd8\x90\xf6\xcc\xce\x07\x5c\x2c\xbe\x3d\
+\x72\x80\xab\x83\x0f\xf2\x31\x28\xe5\x52\xd3\x1d\xb3\xfe\xa4\x97\
+\x31\x57\xa0\x15\x87\xc1\x0b\x13\xf2\x51\xcb\x65\x51\x0e\x56\xd8\
+\x99\xf2\xec\xce\x1b\xa1\xad\x70\xdd\x7e\x82\xbe\x13\xc5\x2d\x4e\
+\x31\x52\xbf\x29\xce\xb9\x6c\x4e\x46\xec\x62\x5b\x80\xe3\xe4\x24\
+\xa8\x91\x70\x1e\xd4\x35\x39\x3d\x7b\x47\xbc\x7c\xf0\x9f\xe0\x9a\
+\x49\x75\xec\x4c\x94\x46\x29\x03\xe5\x13\xd1\x25\x87\xc6\x39\x90\
+\x2d\x21\x54\x0c\xec\x27\xf4\xfc\x8b\x50\xf9\x2b\x68\x70\x48\xfb\
+\x35\x84\xc1\x87\x81\x21\x01\x1a\xd9\xf9\xc0\xc6\x06\x12\xee\x6a\
+\x60\x8a\xcd\xc7\x53\x7d\x5e\x2f\x01\x0f\xb5\x0c\x92\xc4\xab\x47\
+\x24\xc5\x16\xc6\x19\xa6\x80\x40\x20\x5a\x25\x32\xc1\xc5\x90\x18\
+\x90\x64\x7e\x43\x77\xdd\xe2\x8f\x17\x0d\xbb\x75\x7e\x66\x9c\x01\
+\x58\x10\x4b\x41\x7e\x48\x38\x42\x64\x01\x0b\x6b\x6a\xe5\x87\x27\
+\x7f\xc7\x8a\xd2\x27\x4a\x86\x89\x84\x72\x83\xc6\x87\x2e\x56\x49\
+\xd3\x5c\x49\xa3\xa5\x1e\xc0\xc3\xa4\x41\x16\x18\x3a\xa7\x21\xa0\
+\xa0\x4a\x9a\x7a\x1b\x60\x2d\x08\x62\x24\xfd\xe8\x27\xe0\x89\xfb\
+\x91\x26\x4e\x92\x76\xae\xfa\xe0\xe4\x3d\x08\x1e\xf6\x65\x20\x1f\
+\xfc\x8e\xe0\xcd\xcb\x88\x51\xef\xfa\x45\xf1\x8d\x33\x33\xa2\x2f\
+\xb3\x07\xd8\x00\x82\x07\xd9\xa0\xb8\xf8\x42\x05\xc1\x9f\x1d\x6d\
+\x1c\x77\x6d\xd1\x90\x74\x48\x23\x0f\xa6\x22\x54\x78\xe5\x1e\x5f\
+\xe3\x85\x5f\xcf\x05\x0f\x63\x26\xe4\x8d\xee\x5a\x21\xa3\x25\x19\
+\x4c\xac\xdf\x84\xbe\x11\x80\x21\x10\xa8\xab\x47\xa6\x65\x39\xae\
+\x9d\xbc\x7a\xe9\x10\xb3\x1e\x3b\x00\xd6\x4f\xae\x67\x0d\x6c\x0a\
+\x07\x17\xfc\x1f\x94\x0e\x06\x10\x30\x0f\x50\xbf\x9b\x9c\x39\x13\
+\xdc\x55\x3c\xa4\xe1\x26\x73\xb8\x0a\x59\x4e\xb0\x8c\xc2\x2d\x31\
+\xe2\xd8\x77\x97\x8d\xba\xcd\xac\x51\x12\x2b\x1e\xc8\x14\xbf\x63\
+\x33\x7b\x1a\x7b\x03\x4b\xdf\x3d\xf6\x3f\xa2\x8c\xfe\x04\xdc\x72\
+\x04\x0a\x1c\xf3\x21\x5b\x90\x2b\x64\x46\x3f\xc7\x7f\xf2\xd7\xcd\
+\x67\x5e\x85\x24\x50\x2e\x22\xd0\x41\x14\x4a\xa3\xff\xba\xa9\xf4\
+\x55\x7f\x80\xfb\x14\xc0\x32\xc2\x20\x08\x0f\xe4\x85\xe0\x41\xc3\
+\x7b\x96\xbc\x77\xe2\xee\x5d\xcd\x7d\x6e\x6c\x13\xdb\xc6\x7c\x24\
+\xec\x13\x7e\x37\xab\x15\xd4\x86\x65\xa3\x7f\x29\x04\xc4\x29\x6e\
+\x3f\xef\x46\x37\x89\xd9\xc1\x52\xa4\x1c\xc7\xc2\xd2\xea\xbe\xe2\
+\x8c\xb9\x78\xeb\x06\xc8\x20\x9c\x89\x6f\x61\x24\xcb\x87\x81\x84\
+\x32\xc4\xe5\x2b\xf2\x9e\x9a\x62\x56\xef\xbb\xb6\xf8\x8a\x57\x46\
+\xa5\x16\x62\x1e\x08\xe8\x2b\x31\xfa\x46\x00\x22\x08\x10\x68\x51\
+\x77\x8f\x18\x9a\x25\x25\x45\x2c\x5f\x77\xf5\xc4\x87\xb7\xaf\x99\
+\x30\x7d\x7a\x52\x02\x3e\xaa\x05\x99\xa0\x76\x41\xab\x1a\x44\xa1\
+\x6e\x42\x87\x69\xea\xd9\xcf\x3b\x0f\xb8\x02\x5c\x99\x5a\x29\x8f\
+\x80\xc8\x10\x05\xd9\x3f\x0a\xfc\x0a\xd1\xa4\x78\xa2\xd3\xde\x60\
+\xf5\xb1\x98\x4e\xfc\x08\x0e\x0c\xfe\x93\x32\x38\x38\xfc\xbe\xb3\
+\xc9\xc2\x2d\x79\xef\xd8\x03\xa2\x4c\xda\x06\x1e\x01\xf7\x3b\x61\
+\xed\x42\xeb\x34\xbc\x78\x76\xe5\xc6\xd3\x8f\x6f\xf3\x71\xa1\xf9\
+\x29\x28\x51\xec\x17\x7e\xf0\x1c\xd3\x30\x6f\x9b\x97\xa3\x56\x6d\
+\x2c\xfb\xb3\x56\xae\xaa\x02\x25\xd4\x22\x0f\x04\x0f\x4a\xed\xbf\
+\xec\xbd\xe3\xbf\xda\xd9\xd8\xeb\x0d\x0a\x35\x28\x69\xec\x03\x7e\
+\x0f\xf5\x98\xb1\xfa\x39\xea\x78\xa7\xb3\x51\xa5\x60\xd0\xbf\x0e\
+\x1a\x37\x78\x21\xd0\x2f\xca\xa0\x90\xab\x1b\xf6\xb5\xf8\x77\xe0\
+\x0d\x4c\x58\x24\x58\x75\x30\x91\xbe\x41\xf8\x86\x32\x9c\x51\x3c\
+\x91\xde\xb2\x76\xf2\x84\xed\x6b\xc7\x3f\x34\x3e\xd1\xb4\x72\xda\
+\xc8\x94\x7c\x34\x42\x5c\x0b\x7d\x15\x7d\x6d\x10\x13\xea\x9d\xa4\
+\x56\xd0\xd4\x1d\x13\x52\x96\x68\x65\x4c\x84\x9f\x13\xd4\xb9\x31\
+\xfa\x31\xcb\x0b\x12\xf2\xd4\x32\xca\x7a\xb6\xc7\xd5\xe3\xe6\x04\
+\x14\xf6\xa0\xc1\x84\x09\x53\x0f\xb6\xf7\xba\x0e\x77\x38\x8e\x2e\
+\xcf\x8a\xd5\x18\x55\xf2\x6c\x1f\x44\x1e\x50\x3e\xdc\x3b\x05\x2c\
+\x89\xfa\xee\xdc\x56\xf1\xcf\x1a\x8b\x3b\x10\x0a\x50\x88\xc0\x81\
+\x10\x00\x22\x00\x1c\x0b\x0a\xb2\xce\xea\x15\x8f\xb6\xd9\xf7\xaf\
+\xcc\x4b\x1e\x06\x2c\xf2\xf4\x5a\xb5\xfb\xe3\x83\xb5\xf7\x3e\x52\
+\xd2\xd2\x04\xf2\x20\x37\x48\x21\x03\x28\x4e\xc3\x7c\x46\x1e\x7a\
+\x81\x48\x90\x30\x45\xcd\x01\xad\x65\xaa\xac\x3e\xef\x88\xf8\xe8\
+\xda\xa2\x78\xf5\x3c\xf0\x94\x91\xd0\xc9\x83\x4b\xd6\x9f\xb8\x6b\
+\x47\x53\xaf\x1b\xca\x93\x2b\x07\x50\x14\x85\x8c\x13\x29\x80\x19\
+\xdc\x84\x08\x5f\x27\xeb\xf3\x73\xad\xab\xf3\x92\x46\x73\x82\x10\
+\x01\xc3\x26\x56\x0c\xe0\xd1\x11\x1a\xa5\x26\x20\x32\x87\xe7\xaf\
+\x3b\xf2\xfc\x93\x47\xea\xba\xa1\x34\x0e\x92\xf0\x0a\x13\xf6\x03\
+\xd8\x00\x4f\x9a\x8a\xd5\x6a\xa4\x7b\xc6\xa5\x66\x3e\x33\x37\xe7\
+\xba\xbc\x48\xe5\xa5\x6e\x3f\xab\xc5\x69\x52\xa6\x56\x28\xb6\xd6\
+\x5b\xf6\x77\xbb\xbf\x7a\x6b\xed\x6b\x01\x0c\x6a\x22\x45\x5d\x99\
+\x9f\x68\xb8\x76\x64\xca\x62\x98\x43\xf0\xba\x18\x3e\x17\xce\x81\
+\x38\x62\x67\x67\xc6\x4d\xbc\xae\x70\x48\x7c\x93\xc3\xd7\x5c\xde\
+\xeb\xf2\x40\x5b\xd8\xbf\x41\x84\x8d\xe3\x6d\x17\x8d\x76\x9f\xb0\
+\xf3\x68\xe3\x99\x44\xa3\xb6\xaf\x28\x35\xaa\x20\xc0\xf2\x2a\x00\
+\x89\x8d\x50\xcb\x75\xbb\x1b\xed\x9f\x3c\xbc\xb7\xf2\x2c\xd4\x27\
+\xd7\xe7\xd4\xe0\x7b\x1e\x9a\x98\x55\xa8\x67\x94\x8e\x6a\xbb\x9b\
+\xc7\x57\x68\xa1\xf0\xc3\x20\xd6\xdb\xbc\xdc\xc1\x56\xeb\xfe\x5f\
+\x8e\x4d\x1b\xb7\xb3\xb1\xe7\xe3\x85\x9f\x9e\xf9\x14\x84\x82\x75\
+\x89\xeb\x44\x3e\x50\x4c\xda\xb8\x72\xdc\x22\x58\x44\xe7\xbc\x53\
+\xd1\x51\x0d\x1d\x41\x8f\x83\xf2\x07\xa1\xe0\xae\x4f\x4b\xc7\xc4\
+\x21\x91\xf2\xdc\x98\x08\xed\xec\xb7\x0e\xdf\xb2\xa7\xc5\xe2\x0c\
+\x81\x47\x78\x60\x9b\xa8\x44\x0b\x52\x13\x54\x6b\x0a\x92\x0a\x8e\
+\x76\xda\x7b\xf1\x46\x02\xe4\x0d\x8a\xc6\x15\x0f\x89\x12\xf3\x40\
+\x91\x61\xae\x84\xb8\x44\x52\x9a\xb5\x2a\xfa\x93\x9a\xee\x77\xaf\
+\xda\x78\xe6\xdd\x63\x6d\x16\x0e\xbc\x27\x01\x1e\x79\x0d\x24\x60\
+\x4b\xd6\x7c\xab\xf3\xd3\x4c\xdb\xd7\x16\xaf\x98\x9d\x6d\x5a\xc3\
+\xba\x3d\xf1\x60\x18\x3e\x98\x0b\x25\x8c\x1d\xa2\x0c\x2a\x75\x79\
+\xb7\xe3\xd4\xf1\x0e\x87\x3b\x18\x1c\x86\x2a\x9f\x43\x5f\x0b\x20\
+\xd4\x25\x02\x9d\x34\x24\x2a\x7f\xc1\xb0\xf8\x99\x5e\x3f\x47\x2c\
+\x84\xfc\xa7\x68\xde\xcb\x0a\x82\x5a\xc9\x64\xc0\x62\x7a\xe2\xc4\
+\xe4\x48\x76\xfd\xd9\xce\x06\x54\xde\x73\x51\xc4\x0e\x40\x1d\xaa\
+\x13\xa6\xb3\x77\x6a\xba\x9b\xe3\x0d\x9a\xaa\xb1\x49\x51\xd9\xa2\
+\x20\xc6\x33\x32\x59\xdb\x3d\x3b\xca\xdf\xac\xb1\x78\x70\xc7\x86\
+\x0c\xee\xcd\x25\xc3\x73\x6e\x9d\x9c\xf3\x3f\x8b\x0a\xe3\x4c\x67\
+\x3a\x5d\xa5\xd5\x16\x17\x5e\xed\x27\x03\xc1\x0f\x9e\x37\x3a\xbc\
+\x81\xc3\x6d\xb6\xdd\x07\xda\xec\xc7\x1a\xad\xe4\x8a\x00\x82\x43\
+\x2c\x0c\xa4\x2c\x7e\xb8\x7a\xd2\x88\x85\x19\x51\x4f\x66\x46\x1b\
+\xa6\x17\xc5\xeb\x8e\xae\x2f\xef\xec\x82\x32\x64\xb7\x1f\xcb\x22\
+\x4a\xed\x2e\x6f\xf9\xba\xf2\xb6\xed\xbb\x9b\xc8\xc5\x5d\xe2\xce\
+\xb0\xbf\xe4\x1c\x2c\x79\x41\x6e\x9c\xe2\x9d\x35\xa3\xaf\x9e\x9b\
+\x1d\xbf\x26\xc3\xa8\xa8\xfc\xa0\xb2\xbb\x2f\xdc\x47\xab\x9f\x6d\
+\x5f\x91\x97\x58\xc4\x89\x62\xa2\xd9\xa8\xb5\xfc\xeb\x64\xdb\x4b\
+\xab\x3f\x3c\x79\xb8\xd7\xed\x47\xe5\x21\x6e\x1f\x79\x85\x29\x24\
+\x13\x8c\x09\xa4\xcf\x56\x8d\x2b\xbe\x77\x52\xda\xcd\xa2\xc8\x16\
+\x78\x20\xb6\xc1\x9b\xd5\xa0\x0e\x2a\x18\x8c\x51\xe2\x21\x92\x35\
+\x7d\x52\xd5\x5d\x7f\xb2\xcb\xd1\x8a\xe9\x88\x41\xb0\xfa\x60\xfa\
+\x46\x73\x20\x92\x23\xc0\x79\xc0\xa7\xf5\x6a\x34\x0a\x2d\xac\xd9\
+\x60\xed\x1a\x0c\x08\xc8\x40\x05\xc9\xe5\x63\xb9\xc8\x49\x09\xc6\
+\xc2\x28\x0d\xb9\x29\x19\x01\xc6\x23\x31\x83\x30\x98\x21\x60\x45\
+\xd0\x6c\xe6\xa6\x4f\xcf\xd4\x4f\x7d\xed\xe0\x63\x1a\x15\x53\x7a\
+\xb0\xcd\x7e\xe0\xd3\x9a\x6e\xb2\x2b\x83\x73\xc8\xcc\x54\xb3\xfa\
+\x8a\xfc\xc4\xd5\x16\x87\x9b\xa7\x03\xdc\xe4\x8f\xae\x18\x79\xdb\
+\xe5\xb9\xf1\x3a\x14\x2e\xb6\x87\xbc\xf0\x1c\x35\x68\x7b\x7d\xaf\
+\x75\x4f\x7d\x0f\xb9\x64\x84\x11\x1c\x04\x37\xf8\xe8\x92\xb8\x24\
+\x3b\x2e\x75\x71\x86\xf9\xaf\x2e\x1f\x27\x77\x79\x02\xf2\xc5\x99\
+\x09\x7f\x5d\x9a\x13\x9f\x02\xd5\xc8\x6d\x1f\x58\x16\xeb\xec\x6b\
+\xb6\xf9\xb7\x37\x58\xac\x44\x1b\xb1\x83\x40\x64\x4c\x70\xbe\x34\
+\x3b\x5e\xff\xe1\x65\xa3\x6f\xa7\xfd\xfc\x14\xe8\x0b\x07\x7d\x5a\
+\x39\x33\xdd\xac\xc6\x3e\x42\x19\xd9\xe6\xda\x1e\x76\x7f\xbb\x65\
+\xa7\x42\x2e\xaf\xbe\xf5\x93\x93\x8f\xde\xb8\xe5\x4c\x39\xf0\xc4\
+\x11\x93\xe5\x04\xf2\x42\x0a\xf5\x39\xec\x9b\x68\x93\x5a\x49\x8d\
+\x4f\x34\x17\x80\xc5\xc5\x73\x22\x85\x77\xa5\x93\x74\x94\x29\xf0\
+\xc6\xa7\xaf\xf4\x94\x46\x6e\xf5\x0b\x82\x8d\xd4\xf8\x0a\xfa\x5a\
+\x0b\x44\xe4\x91\x7d\x69\x8f\xcb\xb2\xbd\xaa\xeb\xe0\x5c\xb5\xd2\
+\x15\x9b\x16\x9f\x44\x0b\x5c\x24\x2b\x48\x78\x7d\x87\xbc\xdf\x3a\
+\x42\xa7\x62\x9e\x3f\xd5\xba\xe9\xc3\xca\xce\x96\x90\x80\xa4\x28\
+\x98\x38\xd1\x1f\x41\xd8\xd9\x3f\x8f\xe1\x07\x04\x4c\x80\x68\x75\
+\xfa\x02\x87\x5a\xad\x27\x0e\xb7\xda\xea\xc1\x25\xe2\x3c\x02\xa5\
+\x68\xe9\x99\x4b\x0b\x17\x64\x9b\xf5\xc5\xa0\xd9\x3e\x28\x0f\x41\
+\x8a\x94\xb2\x32\x3f\x39\x0b\xe6\xda\xb2\x8a\x3e\x37\x6e\x45\x11\
+\x4b\x44\x5e\x61\xd9\x84\xce\xc9\x2e\xcb\x82\xac\x58\xfd\xfa\xcb\
+\x47\x3d\xcd\x71\x42\x36\xf8\x2b\xbc\xbd\x5f\x00\x25\x8b\x5e\x9e\
+\x97\x98\x7f\xaa\xd3\xb9\xbd\xda\xea\x26\x1b\xef\x58\x07\x0e\xe4\
+\x83\xfc\x90\x90\x37\x82\x77\x59\x4e\x82\xf9\xdd\xe5\xa3\x6f\x07\
+\x07\x93\x07\x3c\xbd\xc8\x43\x2d\x93\xc7\xc7\xe8\xd4\xec\x3b\x67\
+\x3b\xaa\x43\x62\x91\xda\x02\x6c\xfb\xba\xd2\x8e\x23\xef\x9d\xed\
+\x72\x42\x02\x71\xe1\x21\x56\x24\x60\x0a\xc2\x46\x4b\x26\x50\x6c\
+\x3f\xa0\x85\xfc\x61\x2d\x28\xc5\x9a\x54\xca\x69\x69\xd1\x45\x3e\
+\xdc\xae\x21\xed\x4b\x94\x4a\x26\xd3\xea\x34\x72\x67\x73\x8f\xb0\
+\xed\xb7\xbb\xcb\x5f\x7b\xbd\xb4\xad\x15\x99\xc1\x27\xcc\xf2\x3c\
+\xfa\x5a\x00\x07\x52\x9b\x27\xc0\xbf\x5a\xdb\x53\xd7\xe3\xa1\x8f\
+\x66\x47\x29\x98\x64\xb3\x2e\x5d\x10\x44\x0d\xcc\x0b\xbc\x96\xa2\
+\x03\xbb\x3e\xaf\xdf\xb0\xc7\xea\xf6\x62\x83\xe3\x86\x18\x15\x27\
+\xae\x9e\xf4\xdf\x93\xd4\x0a\xfe\xb3\x5e\x5f\xa7\x9f\xe5\x89\xcf\
+\x0d\xb1\x22\xa3\xc4\xef\x0d\x36\x9f\xd0\x68\xf7\xe2\xdd\x63\x64\
+\x57\xe2\x8e\xf1\x99\xf1\xb7\x4f\x1a\x7a\x8d\xcd\xe3\xc7\x1d\x1c\
+\x8c\x70\x19\x50\x67\x16\x66\xae\xf8\x15\xf9\xc9\x79\x67\xba\x9c\
+\xe5\x55\x16\xb7\x27\x0c\x40\xf8\x83\xc2\x42\x21\xcc\x19\x9a\x4a\
+\x7f\xbc\x62\xcc\xef\x41\x97\x2f\x01\x7e\xf8\x7a\x12\x0c\xe6\xd0\
+\x2d\xf9\x61\x4a\x1a\xba\xaa\x28\x39\xe6\xb8\xd5\xb1\xa7\xae\xc7\
+\x4d\xde\x36\x81\x75\xc2\xd2\x41\x9e\xa8\x00\x8b\xb2\xe3\x62\x00\
+\xbc\x3b\x79\x41\x48\x07\x8b\xc0\x07\x74\x88\x4b\xf4\x82\xb0\x8b\
+\x92\xcc\x29\x30\xfd\x9e\x3e\xd2\x66\x23\xcf\x73\x34\xf6\x79\xc4\
+\x46\x9b\x97\xbc\x39\x2f\x6c\xc1\x48\x98\x07\xbc\x68\xa3\x5a\x21\
+\x3d\x32\x33\xa7\xf0\xd1\x69\xd9\xb3\xdf\x28\x6b\x2f\x0f\x40\x21\
+\xcc\x9f\x26\xa3\xfc\x53\xb2\xe3\x26\x7b\x44\x49\x06\x6b\x52\xb5\
+\x0e\xe6\xa1\x16\xbb\xf7\xf3\x07\xf7\x55\xbf\x7c\xcb\xd6\xb2\x92\
+\xcf\xdb\xac\x81\x60\xc9\xaf\xa6\x6f\x05\x20\x0a\x1c\x82\x7c\xe6\
+\x68\x5b\x4f\xe0\xef\x25\x2d\x65\xcd\x56\x77\xc9\x84\x21\xd1\xe6\
+\x78\xa3\x26\x0b\x16\xda\xf5\xd7\xec\xae\xda\x06\x41\x0e\x01\xe9\
+\x9a\xa2\x94\xc2\xf9\x85\x49\xab\xe3\x93\x22\xc6\xde\x37\x3e\x2f\
+\xb2\xc5\xe9\xae\x3b\xdd\xe5\x0e\xc0\x0c\xd4\xbf\xb1\x8d\x1f\x14\
+\x0c\x5a\x00\xba\x0e\x8c\x18\x3f\x59\x31\x7a\x95\x4c\x12\x87\x43\
+\xa8\xe0\x82\x64\xd2\x3f\xc8\x47\x61\x04\xa0\x7c\xcc\x55\x45\xc9\
+\xa3\x4f\x74\xd8\xab\x6a\xac\x1e\x3b\xae\xbf\xc2\x63\x04\x81\x91\
+\x79\x62\x55\x7e\xc2\x98\x39\xd9\xd1\x0f\xbb\x7d\x1c\x09\x48\x42\
+\xd9\xc8\x83\x09\x08\x62\x40\xaf\x53\x8e\xac\xee\x72\x1e\xde\xdf\
+\x6c\xed\x40\x57\x8e\x75\x30\x1f\x79\x81\xfc\xa5\x79\x19\xb1\x29\
+\x9f\xae\x19\x77\x6f\x80\xe3\x13\xa0\x4f\xa8\x28\x61\x19\x41\x09\
+\x8a\x03\xf9\x47\x4f\x4c\x35\x2a\x9e\x3b\xd6\x5c\x82\x1b\xdb\x18\
+\x95\xe2\x3f\xe8\x1f\x29\x84\x8a\x84\x8a\x81\x60\xce\xcd\x8a\x55\
+\xff\x6b\x71\xd1\x15\x57\x14\x24\x5d\x19\x6b\x50\x67\x58\xdc\xec\
+\x99\xc3\xed\x36\x3b\xf2\xaa\x66\x45\xdf\xcd\xe3\xd3\x47\x1a\xd4\
+\xca\x34\x58\x68\x94\x3d\x7b\xa4\xe9\xe5\x85\xef\x1e\xdf\x79\xb2\
+\xc3\xe1\x85\xa5\x07\x4e\x4d\x5f\x98\xf2\x57\xd0\xb7\x02\x30\xc4\
+\x8f\xb8\x3f\xe8\x1f\x5d\xd2\xe5\x72\x7e\x56\xdb\x75\x24\x45\xaf\
+\x70\x35\xdb\x3d\x3d\x7f\x3f\xd5\x5a\x03\xf9\x32\x83\x9a\x91\x5e\
+\xba\xb4\x70\xa9\x96\xa6\x93\xd8\x80\xe8\x03\xd8\x73\xae\xc8\x4f\
+\x1a\x35\x39\x25\xa1\x77\x4b\x65\x73\xa7\x4f\x40\xc3\x1a\x60\x41\
+\xf0\x07\xa5\x83\xd1\xd7\x50\x73\x6c\xf7\x98\x24\x63\x9a\x28\x09\
+\xf1\x20\xc0\xe0\xf3\xd6\x40\x70\xc0\xf7\xc7\xf8\xb5\x1a\x65\x7c\
+\xb3\x87\xed\xd8\x5d\xdf\x5b\x0b\xfd\xe8\x7f\x3f\x67\xc8\x90\xe8\
+\x93\x9d\xd6\x8e\xff\x2a\x4a\x92\x99\xd5\xea\xa9\x01\x41\xf0\x41\
+\x57\x49\x7d\x10\xb0\x60\x50\x2a\x4c\xdd\x1e\xcf\x0b\xab\xdf\x3f\
+\xf5\x21\x2e\x2b\x42\x75\x08\x81\xb5\xe3\x2d\x84\xd2\x35\x63\xd3\
+\x26\x4c\x4b\x8d\x9a\x06\x73\xa7\x1d\xd2\xfa\xb7\xeb\x20\x4f\x94\
+\xc1\xdc\xa4\x97\xe4\xcd\xeb\x4b\x3a\xd7\x7f\x58\xdb\x89\x2e\xb3\
+\xdf\x95\x23\xa1\x12\x84\xad\xee\xb7\x33\x86\xe5\x3c\x39\x2b\xf7\
+\xd6\xa4\x08\xcd\x58\xf0\xd8\x5e\x50\x16\x55\x46\xa4\xda\xf3\x52\
+\x49\xcb\x59\xa8\x23\x73\x81\x2a\x4c\x4c\x34\x1a\x6a\x7a\x3c\xa5\
+\xcb\x3f\x38\xf9\xda\xdb\xe5\x6d\xb8\x27\x8b\xb1\x03\xf2\xfc\xba\
+\xe5\x5f\x3f\x91\xc1\x7d\x57\x42\x20\xd1\x23\xc0\x91\x2c\xb2\xe0\
+\x94\xdc\x24\x74\xe3\x84\xa4\xc8\x17\x17\x8c\xfa\xad\xd5\x1e\xd0\
+\x29\x64\xe8\x19\x61\x8c\x10\x66\xab\x34\x72\x46\x6c\x77\xec\xb9\
+\x7e\x7f\xdd\xfb\xeb\xea\xba\xd1\x35\x11\xad\x0f\xb1\x03\x90\xd0\
+\x34\x69\x69\x52\x72\xa4\x61\xd3\x9a\xf1\x37\xaa\xe5\x54\x51\x80\
+\x15\x5c\xa0\xe5\x24\xfc\x87\xb2\x4a\x8d\x4a\xd9\x3d\xff\xed\xa3\
+\x7f\xdc\xd5\xd8\xeb\x09\x09\xac\xbf\x3e\xf0\x23\x6e\x74\x4a\x72\
+\x14\xb5\x71\xf5\xd8\xa7\x94\x0c\xb5\x40\x14\x28\x08\x04\xc0\x6d\
+\x28\x64\x91\xac\x48\x7d\xb6\xe8\x9d\xc3\x77\x1f\x6c\xb1\xf5\x97\
+\x0d\x53\x98\xd7\x8c\xf4\x28\xd5\xae\xab\x27\x3e\xe4\xf2\x72\xc9\
+\x20\x1d\x0c\x8e\x70\x3e\x17\xb5\x72\x99\xc1\x26\x48\x15\x7f\x78\
+\xeb\xd8\x0b\xaf\x76\x58\xed\x90\x81\x13\xef\x80\xb6\x83\xd3\xc2\
+\x82\x7c\x93\xfc\x37\x13\x72\x17\x8e\x4b\x89\x5d\xe0\x70\xfb\xf0\
+\xbd\x6a\x7e\xe4\x0d\x45\x20\xf8\x94\x75\xcd\x7d\xe7\xe8\xef\x3f\
+\x6f\xb1\xe0\x3d\x36\xc4\xb7\x23\x03\x94\xe1\xb9\xb2\xf8\xa6\xf4\
+\x8d\x2c\x10\x81\x0a\x36\x10\x4a\x08\x11\x7e\xc7\x8e\xc0\x01\x1b\
+\xc7\xfd\x3c\x70\x49\x92\x54\x9c\x14\x33\x7c\x5e\x66\xf4\x1c\xb7\
+\x5f\xf0\x83\x3b\xc1\xdd\x5c\xac\x2e\x70\x10\x95\xd0\x91\xba\xdc\
+\x55\x23\x87\x8c\x3c\xdb\x65\xaf\x3b\xdb\xe7\xb6\x87\x42\xf2\x7e\
+\xc2\xb6\x9a\x1d\xbe\xc0\xde\x26\xcb\x89\xd5\xc3\x93\xa3\xd4\x32\
+\x26\x1b\xaa\xf9\x51\x0b\x4c\x3a\x95\x7a\x6b\x73\xdf\xba\x3f\xed\
+\xab\xc1\x3b\xab\xfb\x7f\x4a\x00\xa5\x13\x16\x20\x36\xd4\xec\xf4\
+\x52\x47\x3a\xec\x47\xae\x1b\x9d\x31\x89\x65\xb9\x78\x48\x54\x68\
+\x39\xa9\x62\xc1\x7b\xc7\xee\xdc\xdf\x62\x0d\xff\x6a\x35\xa9\x13\
+\x26\x64\x84\x3c\x61\xad\xca\x67\x9a\x23\x1c\x63\x13\x0c\x13\x7c\
+\xbc\x48\x94\x0f\x5c\xbb\xc1\x27\x8a\x47\x17\xbe\x75\xf4\xf9\x8f\
+\x3a\x6c\x6e\x6c\x04\xda\x22\x6d\x23\x21\x40\xd8\xf6\xe2\xac\xd8\
+\xa4\x4f\x57\x8d\xbf\x2d\x46\xa7\x9d\xea\xf4\x04\x58\x18\x5b\x68\
+\x69\x40\x4b\x10\xf0\xd1\x46\xb3\x26\xb6\xbc\xcf\x5d\x71\xa4\xd9\
+\xd2\x23\xc7\x75\x03\x01\x0c\x2a\x9f\xa3\x4c\x61\xfa\x32\xb9\x0f\
+\xa4\x6f\xb4\x8c\x40\x7f\x8e\x1f\x3c\x27\x4c\x07\x8c\x1c\x93\xe1\
+\x43\xba\x02\xd6\x87\x4b\x0b\x6a\x6f\x87\xf3\x64\xbd\x26\xe5\xe5\
+\x28\x8d\x1c\x6f\x8f\xd6\xa3\x55\x42\x32\xa9\x17\xf0\xb1\x2e\x28\
+\x98\x30\x32\xc1\xa4\xc6\xb2\x38\x3a\x3c\x02\x5f\x3c\x90\xb6\xb0\
+\x8d\xa3\xed\x36\x6e\xc6\x6b\x87\x5e\x72\xf3\xc2\x66\x88\xce\xf0\
+\x2d\xe4\x1a\x87\x97\x2d\x7b\x62\x5f\xf5\x21\x2c\x87\xe3\xc2\xa3\
+\x41\xa6\xa0\xe3\xb4\x2a\x5c\xd6\xa0\x05\x93\xbe\x00\x2b\x66\x5f\
+\x93\xd5\xf1\xfa\x99\x8e\x7b\x0d\x3a\x85\xc7\x60\x54\x7b\x5e\x3f\
+\x5c\xf5\x6b\x58\xa8\xbb\xf0\x4a\x3b\x96\xc1\xb2\x58\x27\x4e\xaf\
+\x96\xc3\x9a\x39\x3c\x20\xe4\x49\xdf\xbc\xe9\x74\x49\x8b\x83\x2b\
+\x81\xbe\x69\xd4\x0a\x99\xde\x27\x08\x3b\x2f\xf9\xd7\xa1\xe7\x8e\
+\x76\xd8\xfd\xf8\x48\xf6\x00\x59\xe0\x81\x28\x0d\x1e\xa7\x66\x25\
+\xa4\x82\xa1\x15\x38\xbd\xac\x53\x8e\xe6\x05\xbc\xd0\xaa\x19\x49\
+\xd0\x19\x95\x14\x5f\x5f\xe7\x7e\x63\x57\x45\x77\x35\x66\xa0\xac\
+\x90\x0b\xf6\x25\xc4\x8e\x10\x28\x43\x3f\xbf\x81\x72\xff\x32\xfa\
+\x5a\x0b\x44\x4f\xf1\x9b\xa9\x59\xc3\x96\x65\x27\x6a\x6b\x6c\x1e\
+\x87\xc5\x87\x01\x61\xb0\xd3\xf0\xf9\x42\x0d\x81\xc2\xe7\xdd\x2e\
+\x1f\xf5\xdc\xfe\xf2\x86\xfa\x1e\xc7\xf1\xe2\x94\x18\x73\x6c\x84\
+\x3a\xcd\x13\xe0\x30\x5c\xc6\x68\x4d\xeb\x17\x64\x15\x57\x7e\x7c\
+\xea\x13\x0f\x4b\xde\x1b\x27\x45\x6b\x55\xe4\x82\x29\x36\x86\x3d\
+\x47\x8d\x43\x10\x3b\xdc\x7e\x7a\x6b\x63\x6f\xe9\xe5\xa3\x93\x98\
+\x58\x73\x44\xde\x43\xdb\x2a\x5f\x59\x7f\xb6\xc3\x02\xbe\x08\x9b\
+\x26\xe5\x1e\x18\x9f\x93\xfe\xe9\xd5\xe3\x6e\x28\xeb\x76\x94\x57\
+\xf4\xba\xf1\xe7\x07\xd0\x67\xe3\xfd\xa8\xcc\xc7\x55\x6d\xd6\x9c\
+\x48\x7d\xdb\xd9\x2e\xc7\xde\xab\x77\x54\x1e\x87\x2c\x8c\x68\xfb\
+\x37\x04\x96\xe5\xc6\x27\x1e\xbb\x71\xe6\xdd\x3c\x47\xd7\xef\x69\
+\xee\x76\xc0\x9c\x87\x9b\xe0\x14\x58\x1e\xa5\x90\x4b\x7d\x0b\xc7\
+\x0c\x9d\xd6\xe3\xf0\x6d\x9a\xbb\xee\xf0\xdb\xa7\xba\x5c\x64\xcd\
+\x0b\x73\x27\x59\x3f\x40\xfb\x70\xa0\xa9\x68\xad\x92\xf2\xf2\x02\
+\x91\x09\xc7\x4a\x3d\xab\x0a\x13\x8b\x28\x51\x34\x42\x53\xc0\x85\
+\x96\x19\x94\xb4\x96\x32\x45\x9f\x79\xa9\x51\x78\x6e\xfe\x6b\x5b\
+\x4e\xf7\xf8\x39\xe8\xdd\x00\xf3\x0d\x11\x02\x87\xa3\x42\xbc\xb4\
+\x91\x51\x54\xaa\x4e\x4e\x3f\x38\x29\x33\x7d\xc2\x10\x53\x0c\x78\
+\x0d\x7c\x3d\xcb\x05\xe9\x6b\x01\x04\x9e\xd4\x5b\xcb\x47\x4f\x9e\
+\x35\x2c\x61\xc2\x35\x79\x09\x49\xf9\x71\x06\xc6\x64\x56\x3a\x2b\
+\x3a\x9c\x3c\x5e\x69\x86\x7c\x1c\xcf\x20\x22\x8a\x29\x08\xf4\x99\
+\x1e\x97\xe7\xa3\xca\xee\xa3\x26\x85\xac\x6b\x62\x7a\x74\x4e\x80\
+\x13\x40\xdf\x19\x7a\x6f\x9d\x7d\xcb\xcb\xa7\x9b\x1a\xb1\x68\x14\
+\x08\xe0\xe4\xf5\x53\xaf\x2d\x88\xd5\x4a\x87\xda\xec\x5d\x1e\x4e\
+\x20\xcf\xf0\x81\xe6\x12\x0d\xef\x74\x05\xa8\xbd\x0d\x3d\xd5\xa7\
+\x9a\x6c\xa5\x2f\x9d\x6c\x6e\x84\x01\x82\x4b\x0e\xe6\x2f\x4c\x4f\
+\x66\x9e\x5d\x94\x7b\x43\x40\xe0\xc7\xad\x29\x4c\x4e\xac\xe9\x73\
+\x97\xc0\x7a\x95\x43\x97\x46\x34\x1f\x8e\xef\x57\x75\xd6\x7d\x50\
+\xd9\x59\x47\xfc\x18\xe8\x18\xa6\x61\xde\xda\x82\xe4\x88\x77\x96\
+\x8f\xba\xcd\xe7\x0f\xe4\x4d\x4f\xd5\x44\x9e\xee\x76\x1c\xae\xea\
+\xf3\x62\x74\x45\xc0\x38\xde\xe1\x70\xb6\xf7\x78\x4b\xff\x7a\xa0\
+\xf9\xd0\xa9\x6e\x3b\xd9\x4f\x05\x6b\x20\x82\x06\x33\x65\x62\xb4\
+\x4a\xe9\xe9\xb9\x79\xc3\xff\x7c\x49\xee\xfc\x37\x4b\xdb\xce\x78\
+\x39\x91\x76\x3a\x3c\xfc\x95\x89\xc6\x48\x5d\x6c\x44\x9e\xc4\xf1\
+\xb2\x08\x95\xcc\xfb\x66\x59\xd7\x9b\x2b\xd6\x1f\x5d\xff\xce\xb1\
+\x2a\x37\x43\x6e\x98\xfb\x42\xd1\x91\x08\x70\xc8\x13\x1a\x55\xc8\
+\x19\x6a\x65\x66\x8c\xe6\x8d\xeb\x16\xe5\x3d\x34\x36\x61\xca\x94\
+\x74\xf3\xb8\xec\x68\x3d\xfd\xbf\x87\x1b\x6a\xa1\xce\x79\x72\x46\
+\xfa\x7a\x0b\x04\xe6\xd7\x16\x26\x67\x18\x68\xca\x00\xe7\xfa\x51\
+\xc9\x51\x99\x4b\xb3\xe2\x32\x96\x64\x44\xab\x2d\x3e\xc1\x59\x67\
+\x83\xc5\x21\xaa\xf3\x00\xc2\x6f\xf8\x41\x8d\xb5\xfa\x59\x66\x63\
+\x4d\x77\x6b\x55\xb7\xfb\xd8\xa4\x54\x53\x5c\x54\x8c\x29\xfa\x8d\
+\x23\x6d\xeb\xf6\x83\x74\xb0\xd8\x5d\x13\xd2\x87\x5e\x96\x9f\xf0\
+\x8b\x91\x43\xa2\xc7\x4e\x8c\x8f\xf0\x6e\xef\x66\xeb\x5d\xf8\x3b\
+\x7d\xa2\x80\x96\x44\x94\xa1\xd3\xc9\x52\x27\x3a\x1d\xd6\x20\x78\
+\xc4\xcf\x31\x5a\x05\x2d\xbd\xb0\xb0\x70\xe1\xd0\x48\xcd\x25\x2e\
+\x3f\xd7\x07\x01\x6c\xea\xea\x11\xc9\xf1\x67\x3a\x6d\xc7\x2b\xfb\
+\x3c\x44\xe0\x08\x32\x1c\x70\x08\x04\x3c\x3c\x42\x57\xa5\x15\xc3\
+\x87\x28\xde\xba\x7c\xc4\x2d\xde\x00\x9f\x07\x9d\xb7\xe8\x54\xaa\
+\xb4\xc4\x88\x88\xc0\x7b\x15\xdd\xb5\xac\x00\xd3\x16\x94\x45\x2b\
+\x3e\xd9\x65\xb7\x76\x79\xbd\xa4\x0f\xa4\x2f\x28\x44\x85\x92\x4e\
+\x8c\x89\x92\xde\x5d\x94\x7b\xc9\x65\x45\x29\xd7\x1b\xd5\xb2\x0c\
+\x67\x80\x2b\xdd\xdf\x6c\xb3\xfa\xa0\x6f\xc9\x46\x1d\x37\x2d\xcb\
+\x3c\x3d\xa0\x32\x9e\x79\xb1\x45\x7a\xee\xa6\x77\xf7\x55\xe0\xef\
+\x0e\x22\x78\xd0\x6f\xd4\x8d\x41\x84\xdf\x95\x00\xdc\x15\xb9\x89\
+\xc6\xd7\x16\x16\x8e\xba\x65\x52\xce\x54\x93\xdf\x92\xc3\x73\xbc\
+\x56\x10\x24\xb1\xcb\xe9\xb7\xbd\x78\xb2\x19\x01\xbc\x20\x7d\x03\
+\x00\x29\xea\x96\x31\x69\xd9\xd1\x1a\x95\x11\xd6\x3d\x1c\x2c\xc8\
+\x79\xbf\x5f\x50\xc5\x19\x34\x29\xab\x8b\x92\xb3\x67\xa6\x98\xf5\
+\x6f\x97\xb7\xb7\xa3\x56\x63\x79\xb4\x58\xfc\xe0\x17\xc4\x15\xce\
+\x61\xc1\x4c\x31\xa5\xbd\x4e\xef\xee\x06\x4b\x49\x69\x9b\xb5\xea\
+\xc5\x33\x8d\x1d\xb0\x64\x90\x94\xe0\xaf\xfe\xb1\xb0\x60\xbe\x4e\
+\x26\xcf\x84\xf9\xcd\x9f\xaa\x57\x8c\xbb\x67\xe1\x54\x73\x43\x97\
+\xbd\xe2\x4c\x67\x1f\xaf\x84\x89\x04\xaf\xba\xa2\x00\x21\x20\x20\
+\x6b\x36\x54\x0a\x3c\xfe\x6e\x7a\xd6\x90\x2b\x47\xa7\x5c\x6b\x71\
+\xf9\x05\x25\x64\xc2\x9c\xe2\x57\xd0\x74\x7a\x4a\xa4\x56\xf5\x5e\
+\x79\x47\x39\x44\x3d\xd8\xf5\x7e\x65\xc2\x2f\xd8\xc3\x44\x83\x96\
+\xda\xbe\x76\xea\xb5\x02\xef\x9f\x20\x04\xb7\xb1\xe4\x6e\x96\xe3\
+\x73\x13\xcd\x43\x29\x41\x71\x66\x77\x53\x17\xae\x1f\x89\x8b\xc5\
+\x23\xd4\x24\x21\x3d\x99\xfb\xa0\xdd\x35\x45\x19\xea\xbd\xb7\x2d\
+\xbc\x26\x5e\x72\x2f\x71\xfa\x79\x3f\x44\x52\x8a\xcc\x28\x03\xf7\
+\x8f\x92\x96\x52\xf4\x48\x82\xc5\xe5\x9b\x92\x9e\xd1\x7c\xe9\x3b\
+\x07\x3e\x7e\xfd\x40\x99\x0b\xf4\x8c\xec\xbd\xa2\x85\xa1\x26\x41\
+\x4c\x80\x6e\x92\x5c\x0c\xc7\x7e\x5d\x9a\x19\x63\x78\xef\xf2\x51\
+\x93\x6f\x1e\x9b\x3e\xd9\xac\x51\xa5\xba\x7d\x2c\x2d\xd0\x32\x0e\
+\x0a\x0b\x4a\x08\x0a\x6d\x7e\xde\xf9\xc2\x57\x00\xf8\xb5\x41\x0c\
+\x36\xaa\x57\x29\x68\x30\x6f\x0d\x28\x04\x7a\x27\x1a\x97\x06\xf8\
+\xdc\x3b\x44\x5a\x8a\x11\xf1\xa6\xc2\x68\x88\x0e\xb1\x6c\xa4\x5a\
+\x41\x47\x6a\xe4\x44\xf3\xb1\x20\x71\x37\x70\x0e\x16\x4a\xe6\x9d\
+\xb2\x5e\x17\x0f\x6e\xb0\x8a\xe5\xc9\xeb\xd2\xa4\x19\x69\x31\x86\
+\x44\xbd\x7e\x04\xf0\x62\x51\x40\x2c\x2d\x73\x7b\x1a\x2b\xa6\xbf\
+\x3e\x77\xe8\x3d\xbf\x18\x3e\x24\x0a\xca\x91\xfd\x4e\x14\x20\xf2\
+\x40\x40\x70\x52\x87\xb5\x09\x75\x4d\xc1\x90\x35\x6e\x37\x0b\xa7\
+\x0c\xd9\x82\x03\xb9\xc8\x9c\x01\xde\x53\x9c\x1c\x35\x6f\xd3\xaa\
+\xb1\xb3\x43\x78\x21\x02\xc4\xf7\x84\xe4\x47\xbd\xb5\x74\xf8\x0a\
+\x15\xed\x9b\xc6\x89\x94\x1b\x78\x13\x05\x56\xc8\x64\xbc\xdb\xe5\
+\x89\xf8\xe5\xa8\x98\x95\x7a\xa5\x9c\xb8\xca\x70\x5b\xd8\x7f\xe8\
+\x1a\xcd\xc2\xc9\x2f\x46\xa4\x98\xdf\x9c\x9f\x75\xb7\xb7\xa9\x72\
+\x3a\x2b\xc9\x3c\xa4\xcf\xa2\xc8\x26\x68\x14\x23\xa6\xa5\x9a\xc8\
+\xcb\xef\xf6\xfa\x78\x7f\xc6\xcb\x5b\x8f\x9e\xee\xb0\x08\x78\x87\
+\x25\xcc\x78\xb8\x2f\x4a\x5c\x25\xf4\x02\xbe\x50\xd2\xd0\xc8\x08\
+\x2a\x02\xe6\x12\x2c\x3f\x2f\x2b\x3e\xbe\x70\x48\xf4\xf0\x3e\xb7\
+\x9f\x09\x70\xbc\x1f\xc6\x83\xe5\x31\x74\x95\xa3\xcc\x75\xaa\xa0\
+\x1a\x7d\x19\x7d\x25\x80\xc4\x75\xc0\x60\xd6\x95\xb7\x9c\x68\x71\
+\xf8\x8f\x6b\xd5\x06\x67\x84\x5a\x26\x03\xcb\x51\x91\x3e\x41\x90\
+\x05\xc2\x0f\x84\xd7\x01\x20\xf4\xc8\xb2\x5f\x4e\x9d\xbe\x2a\x2f\
+\xc1\x0c\x65\xc8\x3c\x15\x06\x12\x85\x01\xfc\xd0\x82\xb0\x43\xa4\
+\x4b\x19\x91\xda\x18\x8d\x41\x65\x84\x05\x7a\xf0\x0a\x01\xf6\x47\
+\xa1\x72\xb9\x45\x2a\xf3\x85\xb9\xd9\xf7\xbf\x78\xc3\xe5\x99\xea\
+\x08\x13\x32\x07\x2e\x5f\x8c\x22\x00\xfe\xcc\x2b\x8a\xcd\xb0\xac\
+\xc4\x5d\xe3\xfe\x0c\x54\x6e\x70\xe8\x74\x86\x59\x9f\xab\x57\x9e\
+\xe7\x5c\x24\x2d\x00\x9f\x63\xd6\x27\xf3\x50\x65\x80\x54\x24\x41\
+\x10\x64\x7a\x05\xcd\x6f\xa8\xe8\x3a\xed\x86\xc0\x0a\x73\x48\xa3\
+\x98\x0b\x0d\xab\xc1\xbb\xbc\x38\x62\x48\xc6\x0b\x8b\x86\xdf\xef\
+\xe1\xf8\x6c\xec\x23\x8c\x85\xf4\x19\xb7\x32\x35\x06\x75\x44\x46\
+\x64\xf0\x05\x43\x28\x14\xf0\x3d\x18\x70\xa3\xe5\xe2\xfb\xdf\xc8\
+\xce\x0c\xca\x22\x21\x2e\x86\xfa\xfb\xf5\x57\xc4\xd6\xdf\x3c\x63\
+\xce\x55\x85\x89\xe4\x55\x95\x00\x9a\x97\x82\x0f\x34\x83\x6a\x03\
+\x31\xb5\xa4\x36\xa9\xc0\xf2\x58\xde\xda\x64\x0f\x1c\x59\x7f\xd6\
+\x76\x1c\x31\xf8\x32\x14\xbf\xd2\x85\x06\x61\x21\x37\xb6\xba\x9f\
+\x3b\xd1\xdc\x72\xaa\xcb\x53\x65\xf3\xd3\x9d\x71\x7a\x0d\x67\xd6\
+\x29\x74\x5a\xa5\x4c\x07\xe0\x31\xcf\x9f\x68\x2e\x75\x04\x78\x76\
+\x64\x42\x44\xfc\xaa\x91\x69\xd3\x2e\xcb\x8e\xcb\x5c\x9c\x19\xab\
+\x77\x05\x04\x5b\xad\x1d\x16\x44\xe0\xab\x40\xd6\x64\x1e\xc1\x41\
+\xe1\x07\x41\x3c\xde\x61\xb7\x99\x18\xaa\x6e\xe6\xb0\x84\x1c\x8e\
+\xe3\x23\x21\x1d\xd6\x68\x14\xbe\xd1\x10\x5c\x08\x13\x31\x22\x52\
+\x36\xe2\xb9\xcf\xab\xf6\xfa\x38\x9e\xc7\xf2\xd8\x1f\x1c\x08\x0a\
+\x63\x5f\x53\x5f\xf9\xb2\xdc\x64\x90\x9d\x2c\x0f\x84\x48\x16\xc6\
+\xe0\x96\xe5\x46\x9d\xda\xf3\xf0\xae\xba\x97\x0f\xb4\x5a\x06\xbd\
+\x7b\x06\xcf\x61\xbe\xa3\x38\x86\x6e\x5a\x9c\x1b\x3f\x16\x9f\x13\
+\x44\xc0\x39\x08\xb6\xcc\xa6\x08\xe5\xfa\x26\xf7\xba\xff\x7a\xff\
+\xe8\x2e\x28\x46\xe6\x4b\xac\x83\x6d\xc2\x19\xbe\x94\x41\xfd\xfa\
+\xda\x71\x0f\x81\xb2\x98\x41\x0f\x7d\x90\x8e\xbb\x36\x22\xac\x48\
+\xb4\x26\xa3\xda\xf2\xe4\xfe\x9a\x97\xfe\x78\xa0\xae\x1a\xcb\xe3\
+\xdc\x09\x55\x89\x4a\x07\xc7\x2c\x51\x2a\x39\x4d\xad\xc8\x4b\x32\
+\xbd\x34\x37\x77\xe2\xbc\x24\x55\x31\xac\x0a\x13\xb7\xd5\xf5\x36\
+\xc1\xb2\xc4\x36\x3f\x3b\x46\x3f\x21\x35\xba\x50\x41\x33\xe0\x5d\
+\x05\x57\x9b\xa4\xab\xfa\xb0\x4f\x7e\xe4\x9a\x7f\x6d\x39\xfe\xc8\
+\xe7\x0d\x2d\xe0\xd2\xdd\xc8\x32\x34\x8c\xf3\xe8\x6b\xe7\x40\x24\
+\xe8\x07\x6a\x10\x5d\x63\x71\x88\x9b\xeb\x3a\x9c\xcf\x9f\x68\x68\
+\x3e\xdd\xee\xac\xb6\xf8\x03\xb6\x18\x9d\x4a\xf1\x8f\x53\x2d\x8d\
+\x6e\x4e\x60\xc7\x27\x9a\x93\xe6\x67\xc4\xa4\x5a\x61\x05\x9f\x64\
+\xd4\x26\xad\x28\x48\xc8\x5e\x9a\x95\x28\x73\x04\x94\xbd\x67\xba\
+\x2d\x64\xd7\xfd\x9c\x8e\xd0\xdb\x9b\x2c\xbd\xa5\xdd\xee\xa3\xd3\
+\x52\x22\x63\xe3\x74\xaa\x34\x1f\x07\x51\x44\x70\x67\x47\x16\xf0\
+\xf3\x9d\xcf\x1d\x6f\xdc\x0b\x61\x3a\x99\xd0\x10\x04\xac\x8f\xe7\
+\x5d\x1e\x96\xde\xd9\xd8\x53\xb6\xa2\x20\xd9\x04\xd6\x96\x83\x17\
+\x55\x21\xa2\xd5\x6e\xa8\xe8\xf8\xf8\x9e\x9d\x67\x4b\xa0\x0c\xb9\
+\x61\x18\xfa\x4e\xca\x23\x90\x98\x76\xb4\xd5\xe6\x2a\x88\xd1\xf3\
+\xa3\x13\x8c\xa3\xc0\xda\x02\x7a\xb9\x4c\xe7\x14\x99\x0f\x6e\xdc\
+\xdf\xb1\xb5\x13\xdf\x78\x82\x1b\xe8\xd0\x06\x5a\x0d\x54\x21\xdd\
+\xd5\x2a\xe5\xe2\x4d\x63\xd2\x47\xc1\x5c\x1e\x09\x5c\x04\x0e\xfc\
+\x20\xb4\xa9\xef\xf5\xf3\x67\x6e\xf8\xb8\xe4\x99\xa7\x8f\x35\xb5\
+\x20\x7b\x28\x4a\xca\x23\x61\xbb\xa8\xb0\x6b\x0a\xe3\x95\xaf\x2d\
+\x2c\x1a\x73\xf3\xb8\x8c\xe9\x46\x85\x2c\xd1\xee\xf4\x72\x3a\x8d\
+\x8a\xd9\x54\xd3\xdd\x7e\xac\xc3\xde\x33\x32\xd6\xac\x1f\x1d\x63\
+\x88\xf8\x47\x49\xf3\xb1\x27\x0e\xd7\x1d\xba\x63\xf3\xe9\x86\x4f\
+\x4e\xd7\xb9\xf0\xb5\xd1\xc0\x06\xd5\x89\x8c\xf9\xcb\xe8\x1b\x01\
+\x18\x66\x80\x1a\x05\x44\xc0\xac\xb6\xb9\xf9\x2d\x75\x3d\x7d\xcf\
+\x1e\x6f\xaa\xf6\x0b\xf8\xc0\x2a\x25\x8d\x4f\x34\x26\xcc\xcf\x89\
+\xcf\x02\xcb\xf3\x43\x11\x08\x78\x04\x45\xbc\x41\x9d\x76\xd9\xb0\
+\xa8\xb4\xdc\x68\xad\xff\x58\x87\xc3\x06\x1d\x23\x02\x45\x01\x01\
+\x63\xf2\x8a\xc9\xb3\x3d\x4e\xff\xf6\x86\x9e\x63\x63\xe2\xcd\xde\
+\x21\x46\x75\x1e\xba\xb1\x08\x95\x42\xf6\x59\x6d\xdf\x96\x37\xca\
+\x5a\xc9\x8f\x73\x40\x79\xd4\x66\x0c\x95\x18\xbc\x63\x0b\xe5\xdb\
+\xe1\x0e\xd0\x9b\x6b\x7a\x4e\x2f\xcb\x4d\x88\x56\xa9\xe4\x60\x89\
+\xd4\xd9\x5b\x36\x95\xbd\xd1\xe6\xf2\xa3\xab\x46\x4b\xa7\x21\xdc\
+\x87\x88\x55\x4e\xc3\xf2\x04\xdb\x24\xa1\x56\xab\xcb\xd7\x78\x45\
+\x76\x6c\x8e\x4a\x2e\x4b\xb7\xfa\xa4\x4f\xa6\xbf\xba\xff\xa3\xb2\
+\xa6\x36\xd0\x1b\x9a\xfc\xba\x24\xb8\x2c\xe2\x1e\xd1\xfd\x63\x7b\
+\xa0\x40\xe2\xa8\xb8\x08\xd9\x88\xf8\x88\x22\x88\x28\x85\x18\x9d\
+\x46\xd1\xe1\xa3\x3e\x99\xf3\xe6\xc1\xd7\xf7\xb7\xd8\x7c\x50\x91\
+\x6c\xd0\x87\x40\x27\x94\x6c\xd4\xc8\x9e\x9b\x57\x90\xfb\xd0\x94\
+\x9c\xd9\x31\x5a\x4d\x86\xcb\xc7\xe2\x2b\x52\xf0\x7d\x1a\xb4\x1e\
+\x14\x6d\x7b\x5d\x4f\xc3\xd1\x76\x7b\xcf\x91\x76\xab\xf7\xb1\x43\
+\x75\x95\x5b\x1b\x7a\xfb\xaa\x2d\x5e\x8c\xed\xf0\xa5\xaa\xd0\x72\
+\x50\xee\x61\x7e\x5f\x46\x5f\x1b\xc4\x0c\x24\x44\x09\x5c\x07\xe1\
+\x8b\x60\x42\x7f\x11\x51\xfc\x90\x76\x7a\x03\xaa\x46\xaf\x85\x3b\
+\x1d\x2d\x83\x25\xac\xc0\xaa\x05\x51\x14\x20\x54\xf7\x38\x7d\xac\
+\x71\xf5\xb8\x8c\x4b\x6f\x1e\x9d\x36\x14\xcb\xe1\xaf\x9e\x20\x1b\
+\x08\x9f\x65\x50\x93\x04\x38\xb0\x06\x63\x26\xbc\x76\x60\xdb\x33\
+\xc7\x9b\x9f\x89\xd5\xab\xf1\xd6\x02\xfe\x50\xbb\x05\x6f\xac\x25\
+\x6e\x13\xab\xbc\x32\x7f\xf8\xf0\x9b\xc6\x25\x1a\xc1\x20\x71\x3d\
+\x87\xef\x5e\xa3\xce\xf6\xb9\xa4\xf9\x6f\x1d\x7d\xc3\x24\x48\xa7\
+\x36\x9d\x6a\xd9\x7a\xa4\xc3\x8e\x97\xa6\xf0\x32\x24\x63\x8e\x8d\
+\x93\xb6\x5e\x3d\xf9\x52\xf8\xcc\xc7\x73\x04\x06\xf8\x30\x47\x5a\
+\xed\xd2\x36\x3b\xbd\x9d\x92\xab\xf7\xcc\x7e\xfb\xe0\x7b\x55\x36\
+\x37\x0d\xfe\x0b\x7f\x86\x15\xdf\x17\x2a\xdd\x94\x9f\x1a\xf1\xf7\
+\xf9\x45\xc3\x11\xf0\x30\x26\xfb\xbb\x9d\x67\xc0\xc9\x05\xc0\xe3\
+\xf0\x7f\x3f\xd1\xf6\xe2\xb4\xd7\x8e\x7c\x5c\xdd\xe7\xc1\x17\x06\
+\xc1\xa4\x0e\x2b\x1b\xe8\x22\xce\x55\xe8\x97\xb1\xfc\xad\x63\xd2\
+\xd3\xae\x9a\x90\x39\xdb\xe9\xe3\x74\x4e\x3f\xeb\x81\x3c\x09\x02\
+\x24\x4d\x94\x4e\xcd\x1d\x6b\xb1\x1c\xde\x56\xdf\x5b\x8f\xe5\x50\
+\xa4\x70\xc0\xc0\x80\x5c\x81\x00\xc2\xd8\x01\x95\xef\x1b\xd1\x37\
+\xb2\xc0\x0b\x11\x36\x10\x6e\x03\xcf\x51\x13\xca\xfb\xec\xec\xdb\
+\x47\x6b\x1a\xe5\x43\xb2\x9a\x0b\x72\x33\x18\xb3\xe8\x37\xb3\x6c\
+\x40\xc5\x8a\x14\xab\x03\x8f\xb2\xab\xb9\xaf\x66\x6f\xb3\xc5\x81\
+\x9d\x1d\x62\xd4\x28\xec\x7e\x9c\xdc\xfa\x7f\x0e\x8e\xb0\xd9\xd1\
+\xd0\xdb\xad\x94\x2b\x2a\x0d\x4a\xda\x7f\xd7\xf6\x8a\x12\xd0\x5a\
+\xd4\x18\x69\x7e\x46\x9c\xf6\x2f\xf3\x0a\xef\x5d\x90\x17\x93\xd1\
+\xe4\xe2\x4f\x96\xb4\xd9\x04\x14\x1e\xae\xad\xfa\x20\x72\xa9\xad\
+\xee\x3a\xf5\x51\x4d\x77\x47\x17\x94\xc7\xdf\x30\x00\x21\x88\x8f\
+\x5e\x36\x35\xf5\xb2\x4c\xd3\xf5\x09\x46\xf5\x30\x95\x31\xba\x6c\
+\x5b\x69\x9d\x0d\x22\x4e\xb0\x30\x51\x6a\x91\xf4\xdd\xaf\x1e\xad\
+\x29\x2d\xeb\xb2\x01\xe0\x0c\x78\x17\x86\x09\xc0\xc2\xeb\xe6\x31\
+\x49\x8a\x17\x96\x0e\xbf\x71\x74\xb2\x79\xe6\xf1\x56\xdb\xfe\x2a\
+\x8b\x1b\x6f\x83\xa4\x6a\x7a\x5d\x81\x79\x69\xb1\xea\x37\x4b\x3b\
+\x3e\xba\x73\x47\x59\x85\x23\xe0\xc3\x7e\x23\xc0\x34\x80\x4e\xc7\
+\x6a\xf5\x62\x62\x84\x52\x6d\x05\x4b\x83\x81\x48\x93\x53\x8c\x9a\
+\xa9\x71\xc6\x34\xf0\x46\xa2\x51\x2d\x57\x81\xd1\xfa\x8e\x77\xd8\
+\xce\xc0\x98\xf6\xdd\xb3\xa3\xb2\xa1\xcf\xc7\xe2\x53\xbf\xfd\x32\
+\xc4\xe3\x37\x05\x6d\x20\x7d\x67\x00\xcf\x25\xd2\x36\xf8\x4d\x17\
+\x0c\x68\x4b\x79\x9d\xef\xbd\x46\x67\x93\x4c\x52\x36\xe5\x9b\x75\
+\x72\x93\x46\x16\x2d\x53\xcb\x15\xa7\xdb\x1d\x27\xb7\x35\xf4\xf8\
+\x17\xe5\xc4\xa9\xf6\x5f\x35\x69\xe1\x50\xa3\x5a\x6c\x68\xb7\xf7\
+\x75\xfa\xc9\x4f\xbe\xf5\x3f\x28\xba\xab\xb1\xd7\xf1\xf7\x92\x96\
+\x0a\x04\x0f\xbe\xa3\x6e\x48\xcf\x2e\x1e\x59\x9c\xa2\x95\x4d\x70\
+\xb8\xc4\xb8\x15\xf9\x89\xa9\x0d\x81\x40\xc9\xa9\x16\x1b\x07\x80\
+\x90\xab\xff\xa5\x5e\x8e\xef\x06\x64\xc2\x11\xef\x15\xf9\x59\xb2\
+\x27\x46\x19\x6f\x76\x78\x7d\x31\x7e\xbf\x9f\x99\xa2\x97\x86\xd4\
+\x74\x73\x87\x4a\x2d\x60\xa1\x50\xa6\xbd\xbb\x5b\xea\x74\xb8\x61\
+\x5e\xc6\x89\x86\xfc\xd4\x81\x74\xf3\xc8\x21\x8a\xe7\x97\x14\xdd\
+\x64\x71\x73\x23\x15\x12\xa5\x8e\x8d\xd5\xf5\xbe\x59\xd2\xda\x84\
+\x7d\xc0\x9b\x99\x5e\x3a\xd5\x5c\xb1\xb3\xa9\xd7\x86\xae\x15\xda\
+\xc5\xf5\x01\xee\xab\x8a\x39\x51\x5a\x6a\xc3\xe5\xc5\x05\x8f\xcd\
+\xcd\x9c\x7c\xbc\xb7\xb7\xa6\xa6\xc7\x27\x2c\xce\x4f\xa1\x27\x0d\
+\x8d\x19\xa1\xa0\x24\xee\x44\x87\xab\xf4\xae\x9d\xe5\xfb\x7e\xbd\
+\xab\xb2\xa9\xb2\xcf\x8d\xbf\x8f\x81\x56\xdb\x0f\xde\xbf\x43\xdf\
+\x1b\x80\x61\x42\x53\x82\xce\xd1\x76\xab\x95\xde\x52\xd5\xe4\x7b\
+\xe7\x6c\x6f\xa3\x52\x26\xb6\x18\xe5\x94\xec\xcf\x07\xeb\x9b\x5b\
+\x5c\x3e\x6e\x51\x56\x9c\x71\x5e\x76\xdc\xe8\x9c\x78\x63\xce\x6d\
+\x99\xb1\x51\x1e\x5e\xb2\x9e\xb6\xb9\xf0\x27\x19\xc8\x4f\xce\xe1\
+\xe4\x08\x96\x15\x1e\xa4\x94\x1e\xa9\x91\x3d\x5c\x9c\xb1\x1a\xbe\
+\x9a\xa0\x01\x98\x92\x84\xb4\x95\xf9\x49\x43\xac\x5e\xa1\xe4\x70\
+\xab\x05\xb7\x4e\x70\xa9\x42\x02\x1d\x08\x1c\x08\xe0\x2f\x2f\xca\
+\x9d\x37\xc4\x6c\x98\x01\x82\x87\x10\x9d\xe1\xd5\x6a\x65\x62\x72\
+\x94\xda\xff\xea\xa9\x16\x5c\x14\xa3\x2b\x25\xe5\xd1\xbc\xf1\xed\
+\x94\x77\xcc\x9c\xaa\x78\x76\xda\xd0\x9b\xec\x2c\x3b\x4e\x4e\xd1\
+\x2e\x00\x46\x16\xad\x90\xeb\x37\x54\x76\x1d\x02\x4f\x41\x80\x86\
+\xa2\xe4\x5d\x38\xb8\x67\x0a\xca\x45\xeb\xe4\x2a\xf1\x8e\x71\x29\
+\xd1\x1f\xaf\x1e\x37\xcb\xa0\xa4\x46\x82\xfb\xa4\x4e\xb5\xbb\xaa\
+\x0f\xb5\xda\x58\x96\x93\x33\x99\x11\x0a\xfa\xce\xed\xe5\x7b\xef\
+\xdb\x53\xd9\x50\xd9\x1b\x04\x0e\xdd\x24\xaa\x25\xfc\xff\x5e\xe8\
+\x7b\x07\x10\x3b\x86\x1f\xf0\x48\x41\x20\xfd\x3e\x7a\x6b\x7d\x8f\
+\x07\x96\x1a\x8d\x1d\x1e\xbc\xfb\x8e\xa2\xc6\x26\x98\xa2\xe7\xa5\
+\xc7\xe5\xf4\x39\x7d\x7e\xd1\xa0\x8e\x5d\x58\x98\x9c\x3d\x3f\x3d\
+\x9a\x3f\xd8\xda\xdd\xd3\xe3\xe5\xc4\xe0\xcb\xc1\x21\x88\x00\x2c\
+\xb1\xfc\x8a\xbc\xf8\xe8\x95\x45\xc9\x8b\x1d\x3e\x8e\x51\xc8\x48\
+\x52\x20\xe0\xf5\xa7\x5d\x36\xae\x28\xae\x4e\x1e\x7d\xb2\xb4\xb6\
+\x41\x84\x95\x3c\x36\x8f\x41\x87\x74\x65\x61\x52\xec\x6d\x63\x53\
+\x6e\x70\x80\x46\xa0\x7b\x86\x7e\xe0\xcb\x5d\xf8\xcc\x48\x75\x66\
+\x9d\xcd\x77\xa2\xac\xc7\x85\x8b\x78\x12\x12\x63\x5f\x33\xe2\xa3\
+\x98\x8f\xae\x9f\xfe\x4b\x9f\xa3\x73\x02\xac\x5a\xdd\x08\x2c\xf4\
+\x94\x8e\x31\x6a\x74\x15\x3d\xae\x63\x25\x9d\x0e\xf2\x30\x0d\x34\
+\x8c\xbf\xa3\x06\xb9\x8c\x94\x17\x63\xa2\x3f\x5b\x3e\xba\xe8\xaa\
+\x51\x69\x97\x38\xbc\x5c\x24\x60\xec\xd5\x6b\x14\xaa\xcd\xb5\xdd\
+\x4d\x47\xda\xed\xae\x36\xa7\x4b\x80\xe8\xbc\xb5\xda\xe2\x21\x77\
+\xa2\x87\x81\xc3\xcf\xf7\x49\xdf\x2a\x88\xf9\x36\x84\xaf\x21\xc1\
+\xe9\x0b\xc6\x4d\xe6\x09\x48\xc2\x89\x9a\xe4\xc1\x3c\xe1\xa4\xb4\
+\xbc\x25\x5a\xa7\xd2\x89\x2c\xcf\x59\x1d\x5e\x7a\x58\x94\x69\x6a\
+\xf9\xcd\x93\xe6\xdf\x35\x3a\xd9\x88\xf7\xed\xa3\x98\xb0\x3e\x54\
+\xa1\x5f\x2e\x69\xeb\x7d\x74\x5f\xed\x4b\x20\x50\xbc\xa4\x48\x5e\
+\x71\x25\xd0\x32\x07\xe5\xed\x99\x32\x8c\x6d\x9f\x8b\xdf\x21\x6c\
+\x94\xa1\x35\x21\xd5\xdb\xfc\x76\x89\xd6\xb4\x41\xb0\x8a\x8f\x76\
+\x63\x90\x80\x77\x4b\x2b\x25\x5a\xdd\xd6\x00\x79\x58\x06\xcb\x42\
+\x1a\x51\xe0\x2b\x33\x4d\x73\x55\xdd\xf5\xd3\x39\x49\xe6\xc2\x1c\
+\x4e\x94\x54\x31\x11\x1a\xfe\xb1\xbd\xb5\x2f\xbd\x52\xd2\xdc\x83\
+\x7d\xc0\xbe\x60\x50\xaf\x17\x29\xe9\xee\xb1\x69\xa6\xf2\x9b\x67\
+\x2f\x18\x16\xaf\x99\x62\x73\x7b\xa1\x86\x24\xc4\xe9\x15\x3a\x08\
+\xd6\xda\xdb\x5d\x3e\xf2\x3b\x4f\x38\x64\x18\x02\x79\xb3\x21\x36\
+\x47\x34\xf7\x07\xa0\xef\xdd\x02\xcf\x25\xec\x76\xb8\xeb\x30\x57\
+\xc1\x5f\x9a\x2a\xeb\x75\x06\x4a\xda\x3a\x6a\xd2\x22\x23\x7c\x99\
+\x51\x86\x78\xe8\x84\xc6\xc3\xb2\xfe\x00\xaf\x32\x2f\x2e\x48\x1e\
+\xc6\x58\xdc\x3d\xbb\xba\x5d\x4e\xbc\x19\x18\x08\x14\x80\xa2\x77\
+\x36\xf4\x75\xab\x18\xba\x76\x4e\x56\xfc\x28\x30\x64\xfc\xd1\x5a\
+\x5e\xa3\x54\x50\xfb\xea\x7b\xf6\xee\x69\xb6\x76\xe0\x0e\x08\x88\
+\x0a\x5b\xa0\x5b\x9d\x7e\x21\x42\xa9\x6a\x98\x91\x6e\x1a\xe7\xe3\
+\x45\x05\x24\x32\x10\x33\xf9\x9e\x3e\xda\xf6\xfc\x3f\x4e\x35\xd8\
+\x50\xb6\xc4\xe5\x42\x15\xc0\x45\xba\x24\x23\x2e\x7a\x5a\x66\xfc\
+\x08\x6f\x80\xc3\xfb\xfa\xd5\x66\x83\xda\xfb\xd8\xbe\x9a\xa7\x1f\
+\xd8\x53\x55\x81\x37\xf7\xa2\x12\xe2\xbc\x87\x65\x7f\x57\x98\x9c\
+\xf4\xc8\xe2\xa2\xc5\x36\xb7\xdb\xcc\x72\x52\x40\x07\x8b\x7c\xad\
+\x9a\xf1\x9c\xe8\x10\xf7\x5f\xfa\xce\xe1\x23\x07\x5a\x2c\x78\xc7\
+\x1b\xd9\xc1\x42\x22\x43\xfe\x01\xe9\x07\x07\xf0\xcb\xa8\xd6\xca\
+\x4b\xaf\x9e\x6a\xed\xa2\x29\x5d\xfd\x98\xe4\x48\xb5\x59\x2b\x8f\
+\x73\xc3\xc2\x51\xa7\x90\x29\x76\x59\xdc\x6d\x7b\x1b\xfb\x2c\x28\
+\x34\xd4\x5c\x14\x34\xbe\x4e\x72\x7b\x43\x5f\x9f\x92\x61\x2a\xe7\
+\xe4\xc4\x8e\xf4\x05\x84\x48\x51\xa0\x1a\x40\xc8\x1b\x60\x3d\x88\
+\x53\x26\x2a\x08\x71\x55\xf8\x7f\x6b\x7d\x97\x33\x23\x52\xe7\x1f\
+\x1d\x1f\x31\x5a\x09\xf3\xef\xdb\xe5\x9d\xeb\x6f\xdc\x74\xea\x0c\
+\xe4\xa3\x5a\x60\x00\x42\x4c\x03\xcd\xd3\xc3\xf2\xbd\x6b\xf2\x12\
+\x46\x81\xd0\x63\xcc\x11\x1a\xe7\xa3\xfb\x6a\x9e\x7a\x70\x4f\x55\
+\xbd\x12\x7f\x3d\x14\xf2\x11\x8c\x20\x80\x14\x35\xb9\x20\x29\x71\
+\x7a\xb2\x39\xcb\xed\x17\x84\x68\x93\x5a\xd1\x68\x73\x57\x5c\xf9\
+\x51\xc9\xf6\x07\xf6\x94\x75\xf5\x79\xf1\x45\x4e\x5f\x28\xec\x8f\
+\x41\x3f\x98\x0b\xfd\x3a\xc2\x35\x35\x4a\xf2\xf7\xfb\x4f\x39\xf3\
+\x5e\xda\xb9\xe3\xa9\x63\x8d\x9b\x62\x8c\x2a\x37\xde\x1c\xa9\x92\
+\x44\x07\x96\x01\xe0\xa8\x82\x68\x8d\x2c\x06\xd6\x20\xac\x20\x89\
+\x6a\x08\xfd\x1e\xdc\x5d\xd9\xf4\xd8\x9e\xaa\xbf\x99\x23\x35\xfe\
+\x26\xd6\x5f\x5d\x6a\x71\x93\x37\x3f\x00\x30\x52\x4e\xb4\x01\x17\
+\xe0\x48\x28\x77\xfa\xc9\xa3\xcd\x7b\x18\x99\xba\x86\x61\xd4\xb5\
+\x4f\x1d\x6d\xda\x8d\x69\xf0\x21\x45\xb2\xa3\xb4\xf8\x03\xe4\x78\
+\xce\x94\xf6\x38\x03\x6d\x2e\x5f\x95\xd9\xa4\x0b\x3c\xb6\xaf\xea\
+\x6f\x0f\xee\xae\x6a\xc4\xb6\x70\x03\x3b\x06\x0a\x14\x98\x75\x88\
+\x1f\x56\xa3\x54\x12\xe5\xa0\x54\x72\x59\xb4\x51\xe9\x79\xfa\xf3\
+\xda\xcd\x33\x5f\xff\x7c\xcf\xb6\x7a\x0b\xbe\x1f\x14\xe7\xda\x1f\
+\x13\xbb\x8b\x83\x88\x39\xc0\xe8\x61\xf0\xd4\xbc\x8c\x28\xf5\xc9\
+\xeb\xa7\x4e\xbd\x65\x5c\xaa\x19\xf3\xf0\xaa\x83\xeb\x9e\xe9\xe3\
+\x6b\x6f\x1b\x3b\x32\x41\x4f\x2e\x78\xe0\x6f\x0a\x12\xaf\xf1\xf4\
+\xbc\xdc\x8c\xbb\xc7\x0f\x25\x1b\x03\x40\xb4\x41\x25\xa7\x3c\xf7\
+\xcd\x9f\x76\xf7\xf8\x8c\x64\x4c\x40\xeb\x41\xbc\x9e\x9e\x3b\x2a\
+\xfd\xe9\xb9\x23\xd3\xf1\x3c\x98\x46\x51\x77\x4e\xc8\x48\xe2\xef\
+\x9f\x37\x3d\x43\x45\x58\x11\x64\xee\x9e\x30\x34\xf3\xe9\xb9\x05\
+\x99\x78\x1e\x6a\x83\x8e\x8f\x50\x53\xb5\x2b\x47\x15\xb9\xef\x98\
+\x39\x41\x17\xda\x1c\xbf\x65\x4c\x6a\xe4\x09\xe8\xe3\xbc\xcc\x28\
+\x35\xf6\x19\x08\xad\x3e\x78\xf6\x13\xd0\x4f\xd6\xf0\x40\x0a\x8d\
+\x9f\xcc\x31\xe4\x04\x3e\x78\x82\x57\x5c\xca\xff\x7b\xe6\xdc\x8c\
+\x98\x88\xbc\x33\xad\x9d\x47\xaf\x3e\xd0\x73\xa4\xa2\xb9\x5d\xa4\
+\x59\x3f\x83\x97\x69\xb0\x2c\x06\x09\x18\x60\xac\x18\x16\x17\xf1\
+\xd6\xd2\xd1\x6b\x14\x3a\xa5\xed\xaa\xcf\x4a\x3e\x7c\xeb\x68\x0b\
+\xbe\x4f\x1b\x2c\x97\x14\xc3\xc7\xd7\xc8\xf9\x55\xc3\x13\x94\x6f\
+\x2c\x1b\x77\x19\x84\x99\x51\x0f\x7f\x52\xb2\xee\x8f\x15\x9d\x76\
+\x9c\x6b\xf1\x56\x09\x2c\xa7\x00\xf7\x2b\x29\xd5\x62\x5e\x6a\x12\
+\xfd\xfa\xe4\xf8\xf1\x23\x86\xc6\x4d\xac\xef\x76\x56\x16\xbc\xb8\
+\x7b\x2b\x3e\x59\x1b\xee\x1b\x52\x48\xf9\xa4\x50\xd5\x9f\x84\x7e\
+\x32\x17\x3a\x90\x50\x00\x08\x5e\x48\x93\x09\x9a\x48\xb8\x14\x51\
+\xd3\x9c\xd6\xe1\x74\x07\xb2\x22\x0d\xa3\xce\xdc\x35\xef\xd2\x7b\
+\x67\xe7\xaa\x11\x3c\x45\xf0\x47\xa7\x10\x3c\xa8\x44\x53\xf7\x8c\
+\xce\x49\x07\xfb\x92\xf9\xdd\x6c\xcc\x7d\xa3\x32\xc6\x27\x1b\x0c\
+\x08\x18\x06\x2b\xe4\x83\xe0\x25\xc2\x62\xed\xd7\xc5\x39\xc5\x01\
+\x2f\x17\xc3\x52\x12\x3d\xaf\x38\x7b\x28\xe4\xe1\xa3\x67\xd8\x1c\
+\xcc\xb3\x0c\x51\x8c\x7b\x27\xa7\xab\xcf\xdc\x31\x67\x7e\x76\x94\
+\x6e\x8c\xc3\xea\x0e\x68\x44\x56\x8b\x7d\x19\x40\xc4\xea\xb0\xcf\
+\x3f\x25\x78\x48\x17\x05\x80\x61\xc2\x1d\x14\x38\x84\x24\x42\xd3\
+\x7e\x96\xa7\xac\x1a\x73\xad\x31\x3a\x52\x80\x68\x92\xeb\xab\xac\
+\x48\x79\x74\x64\xf2\xfc\x7b\xc7\x67\xe8\x39\x21\xf8\xee\x64\x20\
+\x51\x0f\xae\x30\x39\x4e\x9d\xc6\xf2\x92\xe8\xe5\xf8\x40\x7e\xac\
+\x31\xef\xc1\xe2\x6c\x7c\xeb\x11\x59\x8e\x84\x55\xe2\xc1\xe2\xcc\
+\x94\x82\xd8\x88\x1c\x0f\xc7\x43\x08\x22\x49\x59\x7a\x65\x6a\xc8\
+\x35\xe2\x7c\x4c\x01\x4f\xf1\xce\x89\xe9\x86\x47\x27\xa5\x2f\xb0\
+\x54\x57\xa5\x78\x39\x89\x33\x46\x1b\x05\x9b\x36\xbe\x16\xfb\x02\
+\x14\x56\xae\xaf\xbd\x5b\xec\xc7\xa2\x8b\x0a\xc0\x30\xa1\x64\x40\
+\x9e\x78\x8f\x22\x3d\xfb\xdd\x53\xe5\x8f\x1e\xa8\xdd\x18\x65\xd0\
+\xb8\xb5\x6a\x0d\xd5\xeb\xf6\xc7\x3d\x71\x69\xe1\x92\x6b\x0a\x93\
+\x4c\xb8\x85\x86\x6e\xcc\xcb\x0a\x78\x27\x9c\x0b\xe6\x38\x99\x9c\
+\x61\x44\xa7\xc7\x27\x5f\x5d\x10\x33\xa9\x28\xce\x84\x4f\x3b\xe1\
+\x26\xb6\x54\x14\x1d\x49\xaf\xcd\x4f\x1d\xef\xf4\x90\x9f\xfc\x91\
+\x20\xaa\x65\xda\x9d\xac\x0b\xef\x86\x43\x1e\x50\x44\xba\xa6\x20\
+\xc9\xf4\xd4\xdc\xc2\xc5\xbd\x6e\x21\x56\xa3\xd1\xd0\xd1\x7a\xa5\
+\xeb\xb1\x7d\xf5\x1b\x2f\x79\xf7\x18\xbe\xeb\x06\x4a\xe1\x3e\xc1\
+\xc5\x45\x17\x25\x80\x48\x38\x1d\x82\xba\x4b\x7d\x6d\xcd\xcc\x83\
+\x5b\x4a\x3a\x7f\x7d\xa4\xe6\x23\x8f\xc4\xb7\x6a\x65\x72\x30\x55\
+\xde\x9c\x19\xad\x4f\xc1\x72\xe4\x7e\x18\x28\xfb\xc2\x81\xb6\x43\
+\x72\x5a\xde\xcb\x89\x02\x60\x43\xa3\x8b\x55\x20\x48\x84\x19\x90\
+\x82\x61\x00\x5c\x72\x59\x4a\x02\xcc\x14\x72\x15\x6d\x7d\xb1\xbc\
+\xfa\x10\x2e\x53\x00\x78\x62\x59\x84\x27\x27\xc2\x8a\x06\x7f\x22\
+\x96\x6a\xba\x7f\x77\xcb\x47\x0f\x6c\x2b\xe9\xc4\x3e\x60\x5f\xb0\
+\x4f\x17\x1b\x5d\xb4\x00\x22\xa1\xb8\x00\x46\x7c\x03\x3e\xf3\x97\
+\x1d\xd5\xde\xb1\x2f\x1f\xd8\xdc\xe2\xf5\x96\x62\x18\xef\x0a\xf0\
+\xe4\x2a\x01\x5e\x40\xc3\x40\xe6\x95\xaa\x46\xff\xab\x67\x7a\x3e\
+\x8f\xd2\xeb\x70\x52\x54\xd4\x58\x5c\x2d\xa5\xdd\xf6\xf0\x0f\x16\
+\xd3\xa5\x16\x2b\x5f\x6d\x73\xb4\xc0\x7c\xa9\x88\x8a\x50\x51\xff\
+\x2c\xe9\x38\xf4\xca\xd1\x2e\x7c\xed\x23\x59\x6b\x22\xb9\x58\x88\
+\x52\xb4\x72\x59\xab\xcb\x53\x32\xee\xd5\x3d\x5b\x1e\x3f\x54\xe6\
+\xc3\xb6\xb1\x0f\x17\x1f\x74\x41\xba\xa8\x01\x44\xc2\x2d\x39\x08\
+\x40\x00\x44\x72\xcb\x3d\x35\xfb\xad\xc3\x9f\x3b\x39\xef\xa1\x28\
+\x1d\xf8\x53\x20\x40\x07\xa5\x8b\xf2\xa5\x1f\x3f\x5c\xd3\x56\xd1\
+\xe3\xaa\xd1\xea\x54\xb2\x0d\x95\x5d\x7d\xb0\x76\x24\x57\xf1\xf1\
+\x83\xe7\x1b\x2a\x7a\xac\x5a\x83\x5a\x56\xd5\xe3\xac\x7b\xfc\x60\
+\x2d\x5e\x65\x20\xae\x93\x98\x1f\x50\xb4\x5a\xa5\x76\x59\xb9\x43\
+\xb3\xd6\x1d\x3b\xd2\xe4\xf0\xd1\xd8\x26\xb6\x8d\x7d\xf8\x3f\xfa\
+\x1e\x28\x1c\xa5\xe6\x24\x1a\x98\xbc\x58\x43\x10\xc0\x90\xf4\x43\
+\x79\xd4\xda\x82\xe4\x48\xe9\xb1\x65\xd7\x3d\x50\x9c\x45\xde\xee\
+\x1b\x06\x10\xcf\xef\x2f\xce\x4c\x92\x7e\xb3\xe0\x86\xd5\xb9\xc1\
+\x1b\x8a\xc2\xe9\x61\x1e\x79\x51\x06\xf5\xb0\x08\x03\x2a\xf5\x4f\
+\xba\xb6\xfb\x36\x74\xd1\x5b\xe0\x40\xc2\xc8\x0f\xe4\x2a\xd5\x76\
+\xba\x25\xb0\x34\xbc\x8f\xb6\x7f\xaf\x11\xf3\x70\xcb\xed\x9d\xb3\
+\xed\xb6\xba\x36\x4b\xbd\x2a\x78\xd7\xde\x20\x82\x35\x07\xc3\x1b\
+\xe2\x1a\x3f\x6d\xb1\x93\xf7\x65\x87\x23\xc9\x30\x8f\x0a\x8b\xcb\
+\x5f\xe3\x72\x93\x36\xc2\x79\x17\x3b\xfd\xac\x00\x44\x22\x72\x85\
+\x08\xf5\x42\x06\x82\x57\x94\x30\x7f\x6b\x7d\x6f\x73\x8c\x4e\x41\
+\x5e\x32\x8b\xa5\xc2\x25\x63\x74\x72\xe5\x96\x86\xde\x46\xb7\x27\
+\x80\x03\x3f\x8f\x41\x88\xe7\x4f\xbe\xb6\xfb\x36\x14\xdc\x1f\xfa\
+\x99\x11\xca\xf7\x42\x22\x46\xf9\x63\x5e\x66\x24\x17\xe8\xf5\x08\
+\xf4\xb1\x0e\x7c\xed\x09\x98\x13\xe4\x91\x74\x93\x41\x51\xdf\xd0\
+\x63\x39\xde\x6b\xc3\xc7\xbe\xce\xe3\x41\xca\x05\x4f\x7f\x26\x44\
+\x51\xff\x0f\xf2\x1d\xe7\x53\x7f\xcb\xdd\x0d\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x14\x60\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x00\x00\x00\x00\x40\x08\x06\x00\x00\x00\xf5\x5d\xa9\xbe\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
+\x01\xa8\x3f\xa7\x69\x00\x00\x14\x12\x49\x44\x41\x54\x78\x9c\xed\
+\x9d\x7b\x9c\x5c\x45\x95\xc7\xbf\xd5\xef\xe9\x99\xe9\xc9\x24\x99\
+\x89\x99\xcd\x90\x84\x47\x92\x4d\x08\x2e\x06\x02\x41\xf1\x83\x3c\
+\x37\xc9\xf2\x94\x20\x6f\x56\x45\x81\x8f\x64\x41\x54\x7c\xb0\x10\
+\xa2\x0b\x1f\xd6\xc7\x62\x40\x10\x70\x51\x54\x40\x58\x81\x5d\x24\
+\xa0\x22\x12\x14\x90\x47\x8c\x28\x91\x6c\x60\x03\x28\xc9\x2e\x21\
+\x99\x00\x99\x4c\x12\x26\x33\xdd\x77\xff\x38\xdd\xa4\xe7\xf6\x7d\
+\xd4\xbd\x5d\xb7\xbb\x87\x99\xdf\xe7\x53\x9f\xcf\xcc\xed\x5b\xa7\
+\x4e\xdd\x7b\xcf\xa9\xaa\x53\xe7\x9c\x52\x8c\x62\x14\xe1\x91\x02\
+\x2e\x02\xf6\xb4\x5d\x7f\x1b\xb8\x0e\x78\xbd\xe6\x1c\x45\x8c\xbd\
+\xf7\xde\x3b\xdd\xd3\xd3\xf3\xb1\x9d\x3b\x77\x9e\x68\x59\xd6\xdc\
+\x7c\x3e\xdf\x95\xcf\xe7\x8d\xd1\x8f\xc5\x62\x24\x12\x89\xb5\xe9\
+\x74\xfa\xb6\xb6\xb6\xb6\xeb\x36\x6c\xd8\xb0\xd3\x18\xf1\x51\x8c\
+\xc2\x30\x96\x00\x96\x4b\x79\xb4\x8e\x7c\x45\x82\xce\xce\xce\x13\
+\x93\xc9\xe4\x5f\x71\xef\xb3\xd1\x92\x4c\x26\x5f\x9c\x38\x71\xe2\
+\x07\x6a\xd5\xbf\x5a\x61\x1a\x70\x29\xf0\x53\xe0\xc9\x62\xb9\x07\
+\xf8\x62\xf1\xb7\x51\x0c\x1f\x3c\x88\xfb\x07\xbc\xbd\x8e\x7c\x19\
+\x47\x26\x93\x59\xaa\x94\x2a\x50\x23\xe1\x2f\x95\x58\x2c\xd6\x37\
+\x6e\xdc\xb8\x93\x6a\xd3\xcb\x68\xb1\x27\x70\x3f\xe0\xf5\x10\x0b\
+\xc5\x7b\xf6\xaa\x13\x8f\x8d\x8c\x54\xbd\x19\x70\xc0\x6a\xbc\x3f\
+\xe0\xf1\xf5\x63\xcd\x1c\xb2\xd9\xec\x57\xa8\xb1\xe0\x97\x17\xa5\
+\xd4\x60\x73\x73\xf3\x39\x35\xe8\x6a\x64\x98\x0f\xf4\xa2\xdf\xe9\
+\xad\xc0\x02\x0d\xba\x0a\x38\x1c\xb8\xa0\x78\x7f\xc2\x34\xe3\x75\
+\x42\x1a\x38\x11\xb8\x19\xf8\x13\x32\x9a\x16\x80\xdf\x01\x5d\x35\
+\xe2\xa1\x13\x78\x18\x78\x0d\x79\xbe\xe5\xd8\x17\xb8\x0a\xd8\x89\
+\xf7\x7b\xfc\x31\x70\x24\x10\x2b\xab\x7b\x3a\xf0\x2a\xf0\x04\xd0\
+\x1d\x1d\xfb\x66\x30\x76\xec\xd8\x79\x4a\xa9\x41\x9c\x05\x33\x9f\
+\x4a\xa5\xd6\x2b\xa5\x5e\xa8\xb6\xc4\xe3\xf1\x57\xf0\x1e\x1c\x07\
+\x3b\x3a\x3a\x2e\xac\xcb\x43\xa8\x12\xc7\x03\xfd\x04\xd7\x7c\xfd\
+\xc0\x09\x1e\x74\xdb\x81\xc7\x6d\x75\x56\x03\x7b\x44\xd1\x89\x1a\
+\xa1\x0d\x58\x0a\xf4\x28\xa5\x2c\xa7\x02\xdc\x56\x03\x3e\x3a\x81\
+\x3f\x33\xf4\xd9\xfe\x00\x38\x0c\x78\x04\xef\x0f\xd5\xa9\xac\x05\
+\xce\x00\xae\xb5\xd5\x7d\x99\x06\x57\x02\xa9\x54\xea\x49\x1c\x46\
+\xe4\x74\x3a\xfd\x8d\xee\xee\x6e\xa3\xca\xb8\xbd\xbd\xfd\x02\x7b\
+\x5b\xb6\x76\x0b\x6d\x6d\x6d\x9f\x32\xd9\x66\xd4\x08\x2b\xfc\x3a\
+\x4a\xe0\x0e\x97\x3a\x8f\x47\xd3\x95\xc8\x71\x2a\xf0\x86\x9b\xe0\
+\x97\x29\x80\xdf\x46\xcc\x87\x93\xf0\x47\x59\x1a\x56\x09\x74\x74\
+\x74\xec\x4f\x25\xbf\x85\xf6\xf6\xf6\x33\x23\x6a\x52\xa5\x52\xa9\
+\xf5\x0e\x6d\x0e\x99\x09\x24\x93\xc9\xb3\x23\x6a\xdf\x28\xaa\x15\
+\x7e\x2f\x25\x90\xf1\xa1\x3d\x25\xb2\x5e\x99\x47\x02\xb8\xc9\x4f\
+\xf0\xcb\x14\xc0\x45\x11\xf2\xd2\x8a\xff\xba\x3e\x2a\x25\xd0\x11\
+\x61\xbf\x42\x21\x9b\xcd\x5e\x86\x8d\xd7\x6c\x36\x7b\x6f\x94\x6d\
+\xa6\x52\xa9\xe5\xf6\x36\x1d\xca\xe0\x98\x31\x63\x16\x47\xc9\x47\
+\xb5\x30\x25\xfc\x6e\x4a\xe0\x6f\x7c\xee\x9f\x17\x65\xe7\x0c\x22\
+\x05\x2c\x0f\x20\xfc\xdf\x89\x98\x9f\xd3\xa8\xbd\xf0\x97\xca\x67\
+\x22\xee\x5b\x60\x64\x32\x99\xbb\xb0\xf1\xd9\xde\xde\xbe\x30\xca\
+\x36\x53\xa9\xd4\xdd\xf6\x36\x5d\x4a\x21\x9d\x4e\x47\x39\x18\x84\
+\x86\xae\xf0\xbf\x85\xac\x09\xaf\x2d\xfe\x1d\x44\x09\x4c\xf2\xb9\
+\xf7\x10\x43\x7d\x19\x67\x88\x8e\x1b\x7e\x12\x40\xf8\x6f\x46\x8c\
+\x9e\x51\x62\x16\xb0\x8b\xda\x0b\x7f\x1e\x73\xef\xcc\x18\x32\x99\
+\xcc\xa3\xd8\x78\x9d\x3d\x7b\xf6\x8c\x28\xdb\x6c\x6a\x6a\xd2\x55\
+\x00\x0d\xa9\x04\x74\x85\xff\x0d\xe4\x63\x2b\x61\x56\xf1\x9a\xae\
+\x12\xa8\x85\x02\x38\x10\x51\x4c\x8f\x03\x47\x18\xa0\x67\xc7\xe7\
+\x02\x08\xff\xad\x44\x2f\xfc\x25\x5c\x4c\xed\x15\xc0\x95\xb5\xe8\
+\x58\x50\xa4\xd3\xe9\x0a\x05\x30\x6f\xde\xbc\x46\x52\x00\x25\x25\
+\x70\x71\x94\x3c\xe9\x22\xac\xf0\x97\x10\x44\x09\x5c\xe8\x73\x4f\
+\xb5\x0a\xe0\x40\xe0\x2d\x9b\x10\x3e\x8e\x6c\x69\x99\xc0\x0c\xe0\
+\x1d\x4d\xe1\xbf\x9f\xa1\xdb\x68\xb5\xc0\x3d\xd4\x4e\xf8\x9f\xa1\
+\x76\xca\x2d\x10\x86\x89\x02\xb0\x80\xc2\xf8\xf1\xe3\xaf\x88\x92\
+\x2f\x3f\x54\x2b\xfc\x25\xe8\x2a\x81\xbc\xcf\xef\xd5\x28\x80\xb9\
+\xd8\x84\x3f\x02\x45\xa0\xb5\xee\x07\xde\x24\xfa\x65\x88\x13\x56\
+\xa2\xff\xf1\xbd\x05\xfc\x04\xb8\x0c\xf1\xf0\xbc\x09\xd9\xe7\xd7\
+\xad\xbf\x8d\x06\x75\x18\x1a\x46\x0a\xc0\x02\x0a\xad\xad\xad\x97\
+\x46\xc9\x9b\x1b\x4c\x09\x7f\x09\xba\x4a\x20\x2a\x05\xf0\x88\xa6\
+\x70\xfe\x73\x48\xfa\x1f\x00\x0a\x9a\x6d\x7c\xad\x8a\x7e\x84\xc5\
+\xa1\xe8\x3d\xe3\x81\x22\x7f\x2d\x0e\x34\x62\xc0\x99\xc0\x66\x4d\
+\x5a\x97\x45\xd6\x9b\x2a\x30\xcc\x14\x80\x05\x14\x5a\x5a\x5a\x6a\
+\x6a\x4c\x35\x2d\xfc\x25\x54\xab\x04\xaa\x51\x00\x0b\x34\x85\xf3\
+\x5b\x21\xe9\xdf\x12\x60\xed\x3f\xbb\x8a\x7e\x84\xc5\xcd\xf8\x3f\
+\xdf\x5d\xc0\x71\x1a\xb4\xf6\x02\xfe\x57\x83\xde\x1a\xa3\x3d\x30\
+\x84\x61\xa8\x00\x2c\x60\xb0\xad\xad\xed\xe4\x28\x79\x2c\x21\x2a\
+\xe1\x2f\xa1\x1a\x25\x50\xad\x0d\xe0\x99\x88\x14\x40\x1c\x0f\x2f\
+\x3f\x1b\xfd\x3e\x6a\xb3\x36\x8e\x03\xc7\x20\xdb\x70\xff\x0a\x6c\
+\xc2\xec\x88\xfd\x21\xfc\x97\x6c\x16\xf0\x4b\xe0\x16\x24\x28\x6c\
+\x42\x95\x7d\x32\x82\x61\xaa\x00\xac\x58\x2c\xd6\xd7\xde\xde\xbe\
+\x6f\x94\x7c\x9a\x10\xfe\x24\x70\x6e\xb1\x24\x5d\xee\x09\xab\x04\
+\xaa\x55\x00\xbe\xb3\x00\xe0\x0f\x88\xeb\x6e\x10\xcc\x09\x30\xfa\
+\xbf\x52\x65\x1f\x74\x71\x1b\xc1\x9e\xed\xeb\x48\xac\x42\x10\x04\
+\x35\x2a\xae\xaa\xa2\x3f\xc6\x30\x5c\x15\x00\x60\xa5\xd3\xe9\x3f\
+\x2e\x5a\xb4\x28\x1e\x05\x8f\x26\x84\x3f\xcd\xd0\x50\xd2\x07\x71\
+\xff\xa8\xc2\x28\x01\x13\xdb\x80\x3a\xb3\x80\x67\x08\xa6\x04\xce\
+\x0b\xa0\x00\x36\x18\xe8\x83\x0e\x7a\x08\xf6\x6c\xc3\x38\x23\x9d\
+\x1c\xb0\x8d\x42\xe8\xde\x18\x44\x3d\x14\x40\x36\x9b\xbd\xde\xde\
+\x66\xd8\x92\xcb\xe5\x4e\xf5\x6b\x2f\xe8\xf6\xd2\xf1\xc0\x7f\xe0\
+\x1f\x9a\xba\x09\x89\xd2\x7b\xc1\xe1\xb7\x34\x70\x1f\x43\xa3\xfd\
+\x16\x14\xaf\x39\x29\x81\x17\x8a\xb4\x36\x05\xe4\xb5\x5a\x2c\xf5\
+\xbb\x41\x29\x35\x17\x89\x98\xd3\x55\x02\x41\xc2\x9c\x27\x06\xa0\
+\x5b\x0d\x82\x8e\x12\xcf\x87\x68\xe3\x4f\x01\xef\x6f\xc8\x6d\xc1\
+\x5a\xa0\xb9\xb9\x79\x59\x3c\x1e\xdf\x6c\x82\xd6\xc0\xc0\xc0\x47\
+\xfd\xee\x09\x12\x3e\x1b\x95\xf0\x97\x50\x52\x02\x27\x21\x33\x8c\
+\x72\x94\x94\xc0\xa3\x48\xb0\x8a\x1f\x66\x20\xa1\xb3\xd5\xe0\x21\
+\xcb\xb2\x56\x2a\xa5\x0e\xf4\xba\x49\x29\x35\xd7\xb2\xac\x5f\x22\
+\xeb\xe8\xad\x3e\x34\xb5\xb7\xbb\x94\x52\x31\xcb\xb2\xe6\x03\x77\
+\xe9\xd6\x71\x40\x0e\xb8\x01\x79\x76\xcf\x01\xe7\x21\x46\xb9\x6a\
+\x10\x26\x45\xd5\x8e\x2a\xdb\x74\x43\x0e\x89\x21\xd8\xc8\x7b\x24\
+\x01\xc9\xe6\xcd\x9b\xd7\x75\x75\x75\xcd\xdc\xb6\x6d\xdb\x3f\x58\
+\x96\xd5\xe4\x76\x5f\xa1\x50\x20\x9f\xcf\xc7\xe3\xf1\x78\x57\x3e\
+\x9f\xff\x70\x7f\x7f\xff\x21\xd8\x14\xe7\x3b\xef\xbc\x63\x6c\x7b\
+\xf5\x04\xcc\x4f\xfb\xdd\x8a\x89\xe5\x80\x5f\x28\xb1\x2e\xba\x91\
+\x6d\xb1\x43\x91\x6d\xad\xed\x1e\x53\xf6\xa7\xf1\x1f\xb1\x7f\xac\
+\xbb\x04\x28\xd2\x7c\x96\xf0\xa3\x61\x1b\xf0\xb4\x8d\xde\x72\x87\
+\xfb\x74\xdc\xb0\xcb\x4b\x98\xed\xcf\x43\x02\xb6\x61\x79\xd0\x7a\
+\x3f\xf0\x47\x86\xe6\x22\xe8\x01\xfe\x36\x04\x5f\x9e\xa8\xc7\x12\
+\x20\x2c\x5a\x5b\x5b\xaf\xc2\xc6\xab\x52\x6a\x85\x09\xda\xba\xc2\
+\xbf\x11\x6f\xe1\x7f\x48\x83\x46\xa9\x3c\x44\xe3\x28\x81\x72\x1c\
+\x49\x75\x4a\x40\x3b\xea\xaf\x8c\x66\x98\xa8\xaf\xb1\xc0\x4a\x4d\
+\xbb\x82\x8e\xd5\xbf\xbc\xfc\x26\x04\x3f\x4b\x02\xb6\xe1\x35\xcb\
+\xb8\xd7\xa5\xce\x37\x42\xf0\xe5\x89\xe1\xa4\x00\x26\x4f\x9e\x3c\
+\x95\x08\x14\x40\x3d\x84\xbf\xd1\x95\xc0\x11\xf8\x2b\x81\x9c\x4b\
+\xdd\x2b\x42\x28\x80\x7e\x20\x48\x04\xda\x78\xe0\x39\x17\x5a\x4e\
+\x6b\xf1\x6f\x12\xec\xbd\x14\x80\x83\x02\xf0\xd3\x8a\xec\x1c\xe8\
+\xd2\x1f\x00\xbe\xe2\x41\xef\x37\x2e\xf5\x9e\xa0\x72\x37\xe9\x3c\
+\x64\x09\x15\x2a\x96\x63\x38\x29\x80\x96\x96\x96\x0e\x0c\x2b\x80\
+\x7a\x0a\x7f\xa3\x2b\x01\xbf\x99\xc0\x53\x38\x2b\x81\x93\x83\x2a\
+\x80\x22\xbd\x5d\x88\x9b\xad\x9f\xc1\xee\x10\x60\x9d\x07\x9d\xbb\
+\x5d\xea\xcd\x46\x6c\x2f\x17\xa3\x97\x0c\x64\x0d\xfa\x06\xca\xdb\
+\x35\xe8\x6d\x05\x8e\x42\x6c\x37\xd9\x62\xbd\x99\x0c\x75\x83\x56\
+\x88\x22\xf4\x72\x2c\xda\x01\x3c\x80\xec\x3a\x2c\x2b\xbb\x3e\x40\
+\x88\x99\xd4\x48\x56\x00\x8d\x20\xfc\xef\x45\x25\x70\x5a\x18\x05\
+\x50\x46\xf3\xbf\x91\x0f\x79\x3a\x62\xc0\x8d\x21\x76\x8a\x8f\x21\
+\x1f\x7e\xde\xa7\xbe\x4e\xd4\xd8\x79\xe8\xbd\x97\x95\xc0\x64\x0f\
+\x3a\x59\x24\x8d\x98\x0e\xad\xdb\x6d\x75\x6f\x28\x5e\xef\x03\xfe\
+\x09\x38\x18\xf8\xbd\x26\x2d\xaf\x72\x9d\x46\xff\xdf\x85\xae\x02\
+\x98\x34\x69\xd2\xec\x54\x2a\x75\xb7\x52\x6a\x45\xd4\x25\x9b\xcd\
+\xde\x32\x61\xc2\x84\x0a\x43\xb8\x49\x05\xd0\x48\xc2\xdf\xe8\x4a\
+\x20\xc8\x72\x60\x01\xb0\xb3\x1a\x05\x60\xa3\x5d\x40\x33\xa6\xa0\
+\xec\xfe\xbd\x35\xfa\x94\x43\x0e\xf6\xd0\x79\x2f\xdb\x90\x25\xc4\
+\x41\x48\x4c\x40\x0a\x31\xc6\x5d\x02\x04\xc9\x9f\x7f\x68\x59\xfb\
+\x97\x04\xa8\x17\xa6\xbc\x5f\xe3\x19\x00\x7a\x0a\x60\xfa\xf4\xe9\
+\xad\x89\x44\x62\x63\xc4\x3c\x0f\x29\x99\x4c\xe6\x19\x3b\xaf\xa6\
+\x14\x40\x23\x0a\xff\x70\x57\x02\x4f\x21\x23\xb4\x56\xf8\x6f\x54\
+\x05\x59\x23\xeb\xe2\x6a\xcc\xbf\x3f\xb7\xf2\x58\x59\xbb\xc7\x00\
+\x8e\x19\x78\x0d\x95\x77\x90\x5c\x12\x5a\xd0\x51\x00\x9d\x9d\x9d\
+\x47\xd6\xf0\x59\xbd\x5b\x66\xce\x9c\x39\xb6\x9c\x8f\xb0\x0a\xa0\
+\xdc\x11\xe8\x04\x64\x8d\xe8\xb7\xcf\xff\x06\xf2\xd1\xbb\xed\xf3\
+\xff\x27\x92\x06\xdc\x34\xe6\x17\x69\x57\xe3\x2c\x94\x42\xfa\x68\
+\x52\x09\xfc\x1a\x38\xce\xb2\x2c\xc7\xbd\x6e\xa5\xd4\xc1\x4a\xa9\
+\xbb\x94\x52\x41\xdd\x67\x4d\xe3\x9b\x9a\xf7\x65\x89\xe6\xfd\xb9\
+\xa1\x1b\xc9\xf0\x0c\xb2\xbc\x89\xc4\x7d\xb5\x88\xab\x30\xec\x61\
+\x99\xcd\x66\xd7\x29\x49\x1b\x5e\x33\x24\x12\x89\x9e\xa6\xa6\xa6\
+\x6d\x26\x69\x36\xf2\xc8\x3f\x5c\x66\x02\x87\xe3\x31\x13\xa8\xf3\
+\xe8\x1f\x24\x93\xb0\x5b\xb6\xe5\xa8\xdf\x69\x0c\xf1\x31\x88\xb2\
+\x9d\xb9\x01\x9e\x83\xb6\x0d\x20\x97\xcb\x7d\x26\x16\x8b\x6d\xaf\
+\xc5\xb3\x4a\x26\x93\x9b\xdb\xdb\xdb\x2b\x1c\xe9\xc2\xce\x00\x12\
+\xc0\x07\x69\xec\x91\xdf\x8e\xd2\x4c\xe0\x44\xc2\x7b\x0c\x96\x66\
+\x02\x87\x23\x47\x93\x99\xc0\xa3\xc0\xb1\x96\x65\xfd\x4c\x29\xd5\
+\x6c\x88\x66\xd5\x28\xce\x4c\x3e\xad\x79\xfb\x51\xc8\xc1\x1d\xb5\
+\xc6\x7c\xe0\x14\x64\xe9\x31\x0b\x49\x91\xae\x83\xf5\xc0\xff\x21\
+\xef\x7a\x0a\xfe\x4e\x53\x5f\x47\xce\x36\x30\x8a\xde\xde\xde\x1b\
+\xa6\x4c\x99\x72\x6b\x4f\x4f\x4f\xab\x69\xda\xe5\x68\x69\x69\x61\
+\xc6\x8c\x19\x6f\x3d\xf6\xd8\x63\x46\x67\x1c\xbf\x65\x78\x8c\xfc\
+\x51\xcc\x04\xa2\xc8\xb1\xdf\x30\x33\x01\xc4\xf0\x77\x46\x00\xde\
+\x17\x12\xfd\x7b\x73\x2b\xff\x58\xe4\x61\x96\xc6\xbd\x3f\x07\xf6\
+\xb3\xf1\xbe\x0f\xb2\xe7\xef\x57\x57\xdb\x87\x61\xa4\x6c\x03\xfa\
+\x1d\xef\xd4\x88\xc2\x6f\x4a\x09\x44\x71\xf4\xf2\x42\xea\x6c\xf0\
+\x2b\x13\xfe\x2f\x04\xe4\x5d\x21\xc7\x79\xd5\xfa\x3d\x2e\x67\xb7\
+\x13\xcf\xbf\xf8\xdc\xfb\x6d\x9f\x3e\xf8\x9d\xe3\xb7\x03\xb1\x15\
+\x3d\x8f\xe4\x2a\x70\xc5\x48\x51\x00\x1b\xec\x15\xcb\x4a\x23\x0b\
+\xbf\x09\x25\x60\x3a\xe4\xb6\x51\x84\x7f\x17\x70\x7e\xc8\x3e\xc4\
+\x71\x76\xde\x29\x20\xdb\x9a\x3a\xc9\x3d\x9c\xca\x5a\x97\xba\xcb\
+\x19\xfa\xfe\xbc\xf6\xfb\x9f\x46\xcf\x48\xa8\x73\xb8\x86\x85\x4f\
+\xc0\xd8\x48\x50\x00\x09\xc4\x59\xc3\x29\xc0\xa3\x51\xd6\xfc\x7e\
+\xa8\xc6\x26\xf0\x03\x83\x7c\x2c\x04\xee\x55\x75\xb6\xf6\x5b\x96\
+\xf5\x2a\x70\x36\xc1\xb6\xfd\xca\x91\x07\xce\x29\xfe\x5d\x5a\x3e\
+\xec\x40\x1c\x84\x6e\x47\xf6\xd1\x17\x23\xde\x76\x7e\xde\x80\x03\
+\xc0\xaf\x80\x1b\x11\x45\x7d\x1c\xf0\xc3\xb2\x7a\x0f\x02\x1f\x45\
+\x62\x17\xce\x00\x0e\xc0\x7b\x9f\xfe\x9a\x22\x7f\x7e\xb8\x1a\x3d\
+\xf7\xe9\xc9\x1a\xf7\x68\x61\xd1\xa2\x45\xa9\xcd\x9b\x37\xbb\xb9\
+\x80\x87\xc5\xdb\xa6\xd7\xfb\x4e\x48\x02\x77\x32\xf4\xd0\xc6\x17\
+\x71\x8f\xae\x6a\x94\x91\x3f\xc8\x4c\x60\x66\xb1\x4f\xe5\xa3\xd9\
+\x9d\xb8\x67\x22\x0a\x8a\xba\x8f\xfc\x88\x3b\xed\x12\x76\xbb\xd2\
+\x56\x8b\x38\x92\x9e\xeb\xfb\x54\xae\xb7\x01\xde\x87\xf7\xfb\xd8\
+\x05\x8c\x71\xa8\x37\x0d\xf8\x1e\xf0\x55\xe4\x7d\x25\x90\xa3\xc1\
+\x74\xde\x71\xbb\x03\x3d\x37\xde\xfd\x96\xb6\x25\x1e\x5d\xa1\x3b\
+\x03\xc8\x66\xb3\x9f\x48\x24\x12\xdb\x34\xfb\xa0\x5d\xe2\xf1\xf8\
+\x9b\x99\x4c\x46\xeb\x1c\x42\x13\x8e\x40\xfb\x21\x23\xc7\x31\xb8\
+\x0b\x46\xa3\x0a\xbf\x8e\x12\x48\x02\x47\x03\x67\xe1\xfc\x41\x87\
+\x45\xdd\x84\x1f\x71\x9a\x79\x02\xc9\xe7\x67\x7a\xf4\xd1\x81\xd7\
+\xd6\xd7\x5f\x34\x69\x4c\xf0\xa0\x61\x2f\x41\x7c\x04\x74\x33\x12\
+\xbb\x42\x47\x01\x74\x75\x75\x75\x2b\xa5\x22\x3b\x4d\x29\x16\x8b\
+\xf5\xeb\x9c\x42\x5c\xcd\x12\xa0\x84\xe7\xf1\xce\xf6\xd2\x48\xd3\
+\x7e\x37\x78\x2d\x07\x06\x90\xec\x3d\x26\xb1\x10\xb8\x27\x8a\x69\
+\x7f\x71\x2a\xbf\x10\x99\x1e\xcf\x40\x46\xdc\x26\xa4\x5f\x6f\x00\
+\x2f\x21\x79\x09\x7b\x4d\xb7\x1d\x00\xaf\x21\xbc\x39\x61\xbd\x26\
+\x8d\x37\x91\x0f\x56\x27\xef\xc1\x64\xf4\x72\x25\xb6\x22\xcf\xcd\
+\x0f\x15\x2e\xb5\x41\x31\x38\x38\x38\xdd\xb2\x2c\x53\x33\xc9\x0a\
+\x14\x0a\x85\x54\x5f\x5f\xdf\x54\x64\xbb\xb3\x6e\x68\xf4\x91\x3f\
+\xc8\x4c\xc0\x14\x16\x10\xd1\xc8\x8f\x7c\xe4\x7b\x44\xcc\xbf\x09\
+\x54\x24\xa1\x28\x2b\x41\x8e\xab\xda\xe2\x41\xa7\xbc\x7c\x5e\x93\
+\xde\x59\x1e\x34\xfa\x91\x9d\x84\xd3\x71\x3e\xd3\xe0\x5d\xe8\xc6\
+\x02\x14\x53\x78\x45\xf2\x2d\x27\x12\x89\xd7\x67\xce\x9c\xe9\xc9\
+\x27\x98\x99\x01\x78\xe1\x6e\x1a\x7b\xe4\xb7\xa3\x94\x4a\xeb\xc4\
+\x88\xe8\x2f\x00\xee\x8b\x68\xe4\x2f\x20\x5e\x8a\xaf\x99\xa6\x1d\
+\x01\x2e\x03\x1e\xa1\xd2\xc0\xba\x1e\xb1\xb0\xef\x87\x18\xf7\x62\
+\x48\x64\xdf\x6d\x48\x90\x90\x1d\x2f\xa3\x37\x62\x7f\x09\x31\x44\
+\x6e\xf4\xb8\xa7\x0d\xb1\x2f\xb8\xe1\x39\x82\x29\x27\x4f\xbc\xf8\
+\xe2\x8b\xdb\x3a\x3a\x3a\x8e\xea\xed\xed\x5d\x9a\x48\x24\xa6\x7a\
+\xdd\xab\x94\xc2\xb2\x2c\xed\xbf\x07\x06\x06\x5e\x6a\x69\x69\x59\
+\xb2\x66\xcd\x9a\x3e\x53\xfc\x86\x41\x17\xf5\x1f\xd1\xc3\x16\xdf\
+\xb5\x53\x08\x44\x36\xf2\x97\xcd\x00\x74\xd2\x8b\x35\x3a\x9a\xd9\
+\x3d\xbd\x2f\x95\xb5\x2e\xf7\x1e\x88\xec\xd4\xfc\x19\x51\x1e\x5e\
+\xef\xf4\x79\xdc\xad\xf7\x1d\x88\x4d\xc4\xab\xbe\x76\x4a\xb3\x91\
+\xb2\x0d\xe8\x87\x4c\x95\xbc\xd5\x13\xa6\x79\x8f\x6c\xe4\x2f\x87\
+\x52\xea\x20\xcb\xb2\x1e\x46\x8c\x96\x7e\x89\x46\x1b\x15\x33\xa8\
+\xb4\xda\x4f\x2f\x5e\x7b\xcb\x76\x7d\x25\xb2\x5d\x0b\xb2\x7e\x5f\
+\x8f\xbb\x02\x9c\x8d\x28\x81\x1b\x91\x6d\xc4\xd7\x91\x19\xc8\x91\
+\xc8\xf6\x64\x87\x07\x4f\x16\xd5\x25\x59\x1d\x91\xd8\x93\xfa\x8f\
+\xe4\x61\xcb\x9e\x06\x9f\x43\xe4\x23\xbf\xc3\x4c\xe0\x59\x9c\xb7\
+\xd2\x1a\x09\x7b\x01\xab\x91\xdc\x00\x9f\x45\x7c\xf2\xbf\x8d\x18\
+\xad\x9c\xde\xc9\xb3\x48\x6c\x42\x06\x59\x42\xfc\x01\x99\xda\x97\
+\x63\x89\x4b\x5d\x13\xe5\x7e\x34\x97\xbe\x23\x61\x06\xa0\x83\x51\
+\x05\x20\x36\x85\xa8\x0c\x7e\x7f\x05\xfa\x3c\x7e\x5f\x89\x64\xb2\
+\xb9\x1d\x49\x7c\x79\x04\x8d\x93\x37\x7f\x6f\x2a\xa7\xec\xba\x9e\
+\x82\xf6\x7d\xf3\x6b\xca\xe8\x76\x10\x6d\x5e\x00\xdf\x33\x1f\x60\
+\x64\x28\x80\x20\xe7\x02\x8c\x54\xcc\x27\x3a\x83\xdf\x2b\xc0\x47\
+\x80\xbd\x2c\xcb\x7a\x40\x39\x44\x11\x2a\xa5\x0e\x40\x3c\xe4\x4a\
+\xf8\xbc\x65\x59\xbf\x03\x4e\xa3\xfe\x86\xc2\x6b\xa8\x4c\xb0\xa1\
+\x7b\xd8\x8c\xdd\xb2\xfd\x45\x24\x39\xc8\x2f\x10\x01\x8d\x32\x2f\
+\x80\x69\x21\x56\x9d\x9d\x9d\x47\xc7\xe3\xf1\xa9\xb1\x58\xd0\xb3\
+\x76\xf4\xb1\x65\xcb\x96\xde\x31\x63\xc6\xac\xdb\xb8\x71\xe3\xb3\
+\x91\x35\xe2\x80\x91\x3c\x03\x30\x9a\xc6\xcb\x36\xb2\xbf\x8c\x24\
+\xc3\x28\xe1\x23\x78\xcc\x04\x1c\xea\xbf\x46\xb0\x93\x86\xa2\xc0\
+\x6d\x98\x7d\x5f\x67\x22\xc2\x19\x36\xde\x40\xa7\xec\x00\xe6\xe8\
+\x74\x4e\x77\x06\xd0\xd2\xd2\x72\x5f\x84\xfc\xda\x4b\xa1\xa5\xa5\
+\xe5\x4a\x07\x1e\x1a\x7e\x06\x70\x29\xe2\x8c\xa3\x83\x14\x72\x52\
+\x6d\x3d\x31\x1f\xf1\xed\x37\x6e\x04\x2d\x8e\xfc\x87\x31\xd4\x59\
+\x66\x05\x92\x4f\x60\xb9\x52\xca\xd7\x9d\x57\x29\xd5\x6d\x59\xd6\
+\x0a\x44\x71\xbc\x6c\x9a\x47\x4d\x7c\x09\x31\x54\x4e\x34\x40\xeb\
+\x69\xe4\xe4\xa9\x59\x04\x3f\xb2\xce\x0d\x6f\x33\xd4\x86\x52\x40\
+\xc2\x8e\x8d\x1d\x3e\xda\xdd\xdd\x7d\xc0\xfa\xf5\xeb\xa3\xda\x6e\
+\x76\x82\xda\xb1\x63\xc7\x97\xe7\xcc\x99\xf3\xf5\x55\xab\x56\x45\
+\x75\xe2\xd2\x10\x98\x9a\x01\xb8\x1e\x73\xe4\x80\xac\xa1\x36\xc3\
+\xce\x00\x0e\x00\x76\x44\x38\xf2\x7b\x39\xf9\x04\x4a\x1d\x4e\x7d\
+\x67\x02\x4d\xc8\x9e\xbc\xdb\xf3\x7f\x05\x49\xcf\xbd\x14\x11\x6e\
+\x2f\xd7\xe1\x65\x65\x74\xaf\x64\x68\x6c\x8a\x55\xfc\x5f\xd7\x61\
+\x68\x33\x62\x60\xcc\x20\x7e\x08\x9b\x10\x9b\x82\xae\x23\x11\xa0\
+\x9d\x13\x30\xcc\xa9\x47\x55\x95\x58\x2c\x36\x68\x77\x0e\x1a\x0e\
+\x46\xc0\xe1\xa2\x00\xe2\xc0\xea\x3a\x09\x3f\xc0\xb1\x21\xe8\xd6\
+\x4b\x09\x9c\x83\xf3\x73\x2f\x00\x57\x50\x39\xc3\x9c\x84\x24\x49\
+\x75\xaa\xd3\xcb\xd0\x6f\xe4\x0c\x76\x07\xf4\xe4\x91\x1d\x86\x24\
+\xe2\x24\x75\x2b\xee\xc1\x3e\xbf\xa7\x72\xfb\x37\x8d\x7e\x20\xd1\
+\xee\x4a\x1a\x0a\x60\xc9\x92\x25\xb1\x64\x32\xa9\x93\x54\xc7\x58\
+\x69\x6d\x6d\xfd\x77\x3b\xaf\xc3\x61\x09\x30\x5c\x70\xac\x52\x6a\
+\x5f\xfb\x45\xcb\xb2\xfa\x81\xaf\x21\xb1\xe6\xed\xc0\x17\x94\x52\
+\x4e\x87\x9c\x3a\xa2\xcc\xe0\xe7\x67\xb8\x0b\xec\x57\x5e\x87\xe5\
+\xc0\xf1\x48\xd0\xd8\xd1\x2e\xbf\x7f\x07\x67\x6f\xbc\x0d\x48\x7c\
+\xc3\x6a\x2a\x9d\xb4\x5a\x81\xeb\x11\x43\xe0\x3d\x48\x6e\xc2\xb5\
+\x48\x80\xda\xaf\xd8\x7d\xae\xe1\x7f\x15\xcb\x3e\x0c\x4d\x27\x5e\
+\xc2\x26\x24\xfb\x6f\x39\xfa\xa9\x8c\x0d\x31\x82\xa5\x4b\x97\x16\
+\xe6\xcd\x9b\x77\xcc\x9a\x35\x6b\xce\xdc\xb9\x73\x67\x57\x94\x46\
+\xc0\x58\x2c\x46\x32\x99\x7c\x61\xeb\xd6\xad\xf7\x46\xd6\x88\x03\
+\x46\xda\x0c\xe0\x47\x2e\xa3\xec\xc7\x6d\xf7\xc5\x80\x15\x9a\x23\
+\x74\x10\xdf\xfe\x59\x55\xcc\x30\x5e\x0b\xd9\xe7\x20\x98\x47\xe5\
+\xf4\xbc\xbc\x0c\xe0\xed\x8c\x03\x92\xa9\xc8\xeb\xbd\xfd\x54\x83\
+\x8f\x7f\x73\xa9\xfb\xfd\x40\xbd\xf1\xc0\x48\xd8\x06\x8c\x4e\x5d\
+\x0d\x5f\xec\x6f\xbf\x60\x59\xd6\x76\xe0\x47\xb6\xcb\x05\x24\xae\
+\xdd\x13\x65\x06\x3f\xdd\x2d\xbb\x17\x2c\xcb\x5a\xad\x79\xef\x10\
+\x28\xa5\xba\x91\x6d\xb4\x28\x93\x53\xce\xc4\xdb\x0f\x61\x2d\xb2\
+\x06\xf7\x82\x5f\x2e\xc6\x0f\x6a\xf0\x71\x23\xbb\x9f\xe9\x76\x24\
+\xfc\xf8\x21\x34\xf7\xf8\x47\x21\x18\x55\x00\x95\x18\xe7\x70\x2d\
+\x8f\x08\xbc\x1d\x9e\x09\x25\x8a\x21\xbd\x3a\xd3\x7e\x3b\x3e\x6b\
+\x59\x96\x4e\xe6\x9b\x0a\x28\xa5\xf6\x41\x76\x5c\xa2\x82\x89\x65\
+\xa3\x9f\x23\x93\xa5\x41\x63\x1d\x30\x15\x89\x39\x68\x29\xfe\xbd\
+\x10\xe7\x60\xa3\x51\xb8\x60\x54\x01\x54\x62\xbb\xfd\x82\x52\x2a\
+\x07\x1c\xeb\x70\xaf\x6b\xc6\xdd\x2a\x84\x1f\xe4\xb0\x91\x0b\x8a\
+\x91\x81\x61\x70\x76\xc8\x7a\x3a\x58\xe7\xf3\xfb\x0c\xfc\x97\x00\
+\x4e\x6b\xf7\x72\xe8\xc6\xbe\x17\x90\x7d\xfd\x51\x84\xc4\xa8\x02\
+\xa8\x84\x53\x0e\x44\x90\x5c\x76\x67\x21\xfb\xca\x53\x81\x5b\x94\
+\x52\x8e\x87\x8b\x14\x85\xff\x30\xaa\x1b\x8d\xbe\x07\x9c\x1f\x46\
+\x09\x28\xa5\xf6\x20\xba\x68\xc2\x5f\x23\xd6\xff\x3b\x70\x4e\xaa\
+\x9a\x40\x76\x00\xdc\xd0\x0e\x5c\xe4\xf2\xdb\x3a\xc4\xd8\x77\x6e\
+\x35\x0c\x9a\x82\x52\x95\x13\x95\xbe\xbe\xba\x46\xe6\xba\xa2\xab\
+\xab\xab\xe2\x5c\x0f\x53\x06\xc9\x91\x66\x04\xfc\x64\x95\x5b\x7d\
+\xa6\x93\x79\x7c\x0a\x9f\x53\x7f\x5d\xf8\xa8\x45\x38\xf1\xc7\x71\
+\x7e\xee\x05\xe0\x72\x2a\x97\x0b\xdd\x88\xc3\x8f\x53\x9d\xad\x04\
+\xfb\x46\x22\x47\x26\x93\xb9\x1b\x1b\x9f\xb9\x5c\xee\x98\xfa\x72\
+\xe5\x8c\x31\x63\xc6\x1c\x86\x8d\xd7\xa6\xa6\xa6\x9f\x99\xa0\xdd\
+\x6d\x27\x1c\xb2\xd4\x43\x01\x74\xdb\x09\x6b\xa0\x09\xd8\x50\x85\
+\xf0\x4f\x0e\xd1\xa6\x1f\x02\x29\x01\x6a\x17\x23\x90\xc5\x3b\xed\
+\x7a\xc9\x11\xe8\x4a\xc4\x11\x68\x87\xc7\xbd\xcb\x68\x30\x64\xb3\
+\xd9\xcb\xb1\xf1\x99\xc9\x64\xee\xac\x2f\x57\xce\xc8\x66\xb3\x3f\
+\xc4\xc6\x6b\x73\x73\xf3\xd5\x26\x68\x27\xd1\xcb\xb0\xda\x68\x0a\
+\x60\x27\xe1\x0d\x56\x0b\x09\x38\xea\x12\x9d\xf0\x97\x70\xae\x2e\
+\x4f\xc8\xe1\x1a\xb5\xc0\xfe\x48\xa6\x1f\x13\xca\xba\x21\xa6\xfd\
+\xe5\x18\x3f\x7e\xfc\x1c\x6c\x7c\x2a\xa5\x0a\x6d\x6d\x6d\xa7\xd4\
+\x97\xb3\xa1\xe8\xec\xec\x3c\x49\x29\x55\x11\x3f\x31\x76\xec\xd8\
+\x43\x4c\xb5\xf1\x80\x9d\x78\x88\x52\x6b\x05\xf0\x40\xc8\xbe\x96\
+\xf0\x69\x60\x50\x53\xe0\xfe\x87\x68\x85\xbf\x04\x5f\x25\x80\xa4\
+\x3f\x8f\xf4\x8c\xba\x32\xac\xc2\x8c\xf0\x5b\x88\x27\xa0\xd7\x79\
+\x8e\x75\x41\x26\x93\x79\x96\x4a\x25\xb0\xab\xb9\xb9\xf9\xea\x69\
+\xd3\xa6\x8d\xaf\x27\x6f\xd3\xa6\x4d\x1b\x9f\xcd\x66\xaf\x54\x4a\
+\x55\x1c\xec\x9b\x4c\x26\x9f\x43\x23\x6c\x5c\x37\xae\x7c\x2e\xe2\
+\xc2\x59\x8d\x55\x21\x8b\xfe\x51\x5c\x59\x1c\xac\xf1\x01\x50\x40\
+\x1c\x56\xaa\x0d\x9b\x3c\x02\xf8\x6e\x71\x6b\xad\x02\xc5\xad\xba\
+\x3b\x10\x37\xd5\x37\xab\x6c\x4b\x17\xa7\x03\x37\x29\xa5\x2a\x84\
+\xdc\xb2\xac\x55\x48\x1e\x44\xdd\x8c\xbc\xd5\xe2\x25\xc4\x23\xcf\
+\x14\x0e\xc6\x40\xa6\x5e\x93\xe8\xe8\xe8\xf8\x70\x4f\x4f\xcf\x0a\
+\xcb\xb2\x2a\xbe\xfd\x58\x2c\x96\x8f\xc7\xe3\xaf\x12\x91\x97\xa1\
+\x0f\x52\xf9\x7c\x7e\x6a\xa1\x50\xa8\x98\xe5\x2a\xa5\xac\xb1\x63\
+\xc7\x1e\xbd\x65\xcb\x96\x47\x4c\x36\x58\xb1\x1e\x0a\x58\x6a\x39\
+\x03\xb8\x3c\x74\x2f\x2b\x11\x47\xb6\x00\xbf\x8b\x58\xc0\x9f\x00\
+\xee\x43\x22\xe1\xea\x15\x84\x33\x01\xf8\x32\xe2\xf8\xf2\x38\xa2\
+\x84\x4e\x25\xda\x18\x7a\x27\x1c\xce\xd0\x75\x7d\x01\xf1\x8d\x08\
+\xf3\xce\x1e\xa4\x41\x77\xa5\x72\xb9\xdc\x57\x31\x37\xd3\x89\xbc\
+\x34\x37\x37\x47\x16\x49\xbb\x98\xf0\x6b\xbe\x5a\x28\x80\xbe\x22\
+\x8f\xa3\xa8\x1d\x8e\x06\x7a\x10\x63\xe0\x49\x48\x4a\xb0\x65\x54\
+\x26\x04\xb5\x10\x87\xaa\xa7\x90\xe5\xd5\xdf\x23\x7e\xfb\x16\x72\
+\x96\x43\x5d\x8f\x54\xf3\x81\xca\xe5\x72\xd7\xe2\xed\x02\xdd\x10\
+\x25\x9b\xcd\x5e\x4f\x80\x8c\x51\x61\x52\x4b\x4d\x04\x3e\x81\xb8\
+\x6b\x8e\x43\x5f\x6b\x7f\x08\xfd\xa9\x52\x06\x19\xd9\x74\x50\x0a\
+\x13\x7d\x12\xf1\x03\x7f\x5d\xb3\xde\x28\xcc\xa1\xf4\x1d\x59\x65\
+\xd7\x6e\x04\x2e\xb0\xdd\xf7\x30\x12\x44\x54\x42\x2b\xb2\x65\xea\
+\xe6\x7b\xd1\x50\x68\x6b\x6b\x3b\x65\xfb\xf6\xed\xcb\x06\x07\x07\
+\xdf\x57\x6f\x5e\xec\x48\x24\x12\x9b\xb2\xd9\xec\x25\xbd\xbd\xbd\
+\x77\xd4\x9b\x97\x51\x8c\x02\xe0\x42\x2a\x47\xa8\x6f\xd5\x95\x23\
+\x03\x98\x34\x69\x52\x53\x6b\x6b\xeb\x27\xd3\xe9\xf4\xcf\x93\xc9\
+\x64\x4f\xd1\xf0\x5a\xf3\xa2\x94\xb2\x92\xc9\xe4\x96\x74\x3a\xfd\
+\x8b\xb6\xb6\xb6\xf3\x75\x0e\x0f\x71\x42\xa3\x24\x97\x1c\xc5\x7b\
+\x0f\x69\xe4\x94\xde\xbf\x43\x66\x89\x7f\x01\x3e\x47\xed\x8c\xa5\
+\x35\xc1\xe2\xc5\x8b\xd3\xd3\xa7\x4f\x6f\xe9\xed\x95\x13\xda\x72\
+\xb9\x1c\xba\x7f\xe7\x72\x72\x9c\x63\xe9\xef\x20\x34\xfa\xfb\xfb\
+\xb7\x2d\x5d\xba\xd4\x33\x16\x45\x07\xff\x0f\x56\x53\xbd\x0b\x67\
+\x6b\xaa\x49\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0d\x60\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\x4d\x00\x00\x0e\x4d\x01\x46\xd5\
+\x68\x09\x00\x00\x0c\xf5\x49\x44\x41\x54\x78\x5e\xed\x9d\x6b\xa8\
+\xa5\x65\x19\x86\xd7\xa8\x99\xa6\x8e\x14\xa5\x76\xa0\x90\x26\x32\
+\x8c\xa0\x31\x83\x28\x22\xfd\xa3\x14\x41\x51\x64\x89\x15\x41\xf4\
+\xa7\xd2\x4e\x96\x65\x81\x93\x49\x16\x98\x04\xfd\xe9\x47\x10\x91\
+\x9d\x29\xfa\xa3\x25\x43\x0e\xa3\x64\x47\xc1\xca\xc4\x1c\x09\xb3\
+\xd2\x2c\x6b\x6c\x14\x0f\x79\xe8\x7e\xf6\xfa\xbe\x99\xb5\x67\x3f\
+\xef\x9e\x75\xf8\x0e\xcf\xfb\xbe\xd7\x05\x17\x6b\xed\xe5\x3e\x2c\
+\xf7\x7c\xf7\xb5\xf7\x5a\x7b\xaf\xb5\x27\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x0c\x5b\x9a\x53\xa8\x87\
+\x23\xe5\xb1\x33\x1a\x0f\x36\x3e\x20\x1f\xb6\x0b\xa0\x0e\x08\x40\
+\xb9\x3c\x55\x9e\x2e\x5f\x2d\x5f\x22\x5f\x28\xb7\xc9\x93\xe4\x66\
+\xdc\x2b\xef\x90\x7b\xe4\xad\xf2\x06\xf9\x6b\x49\x18\x00\x82\x73\
+\xb2\xfc\xb8\xdc\x2d\x1f\x92\x4f\x76\xa4\x8d\xff\x7a\x69\xef\xdb\
+\x3e\x06\x00\x04\xe1\x38\x79\xbe\xfc\xa5\xf4\xc6\xdb\x87\xf6\xb1\
+\x3e\x28\xdb\x9b\x10\x00\x30\x30\xcf\x93\x5f\x94\xff\x91\xde\x48\
+\x87\xd0\x3e\xf6\xe5\xf2\xb9\x12\x00\x06\x60\xab\xb4\xe1\x3f\x22\
+\xbd\x51\x8e\xa1\xdd\x44\xb0\x10\xd8\x75\x03\x80\x1e\xb0\x3b\x6c\
+\xdf\x23\xef\x96\xde\x08\x23\x78\x8f\x7c\xaf\xe4\xce\x65\x80\x0e\
+\x39\x51\x5e\x2d\xbd\xd1\x45\xf4\x1a\x69\xd7\x19\x00\x56\xe4\x6c\
+\x69\x5f\x59\xbd\xa1\x45\xd6\xae\xf3\x59\x12\x00\x96\xe4\x23\xf2\
+\x09\xe9\x0d\x2c\x07\x1f\x97\x1f\x96\x10\x14\x6e\xab\xc5\xc4\xfe\
+\x5d\xec\x8e\xbe\x8f\xad\xbd\x94\x3f\x57\xc8\x0b\xa5\x45\x21\x22\
+\xf6\xf9\x7e\xa5\x3c\x43\xda\x4f\x34\x9e\x23\x9f\x26\xed\xbb\x98\
+\xbf\xcb\x5b\xa4\xdd\x04\xdb\x2b\x01\x7a\xe5\x70\xf9\x75\x79\xf0\
+\x57\xd3\xdc\xfd\xa6\x3c\x42\x46\xc2\xee\xa7\xf8\x92\xfc\x9b\xf4\
+\xae\xf3\xac\x8f\xca\x6b\xe5\xeb\x25\x40\x2f\xd8\xf8\x6d\x28\xde\
+\x01\x58\x82\xdf\x91\x11\x22\x70\x94\xdc\x21\xf7\x49\xef\x7a\x1e\
+\xca\x5d\xf2\x34\x09\xd0\x19\xa5\x8f\xbf\x75\xec\x08\xd8\x63\x21\
+\x6e\x94\xde\x75\x5b\x44\xfb\xdd\x87\x77\x4b\x80\x95\xa9\x65\xfc\
+\xad\x63\x45\xe0\x14\x79\x97\xf4\xae\xd3\xb2\x5e\x2a\x01\x96\xa6\
+\xb6\xf1\xb7\x0e\x1d\x81\x67\xc8\xdb\xa5\x77\x5d\x56\xf5\x7d\x12\
+\x60\x61\x6a\x1d\x7f\xeb\x50\x11\x38\x4c\xee\x94\xde\x75\xe8\x42\
+\xbb\x83\xf0\x35\x12\x60\x6e\x6a\x1f\x7f\xeb\x10\x11\x38\x4f\x7a\
+\x1f\xbb\x4b\x6f\x96\x16\x1a\x80\x43\xc2\xf8\xd7\xdb\x67\x04\xec\
+\x89\x51\xfe\x2c\xbd\x8f\xdb\xb5\xef\x92\x00\x9b\xc2\xf8\x7d\xfb\
+\x8a\x80\x8d\xd2\xfb\x78\x7d\xf8\x47\x09\x90\xc4\xc6\x7f\x95\xf4\
+\x0e\x1e\xec\x27\x02\x3f\x92\xde\xc7\xea\xcb\x17\x4b\x80\x0d\x30\
+\xfe\xf9\xec\x32\x02\x47\x4b\x7b\xb2\x53\xef\xe3\xf4\xa5\x3d\x6d\
+\x1a\xc0\x3a\x18\xff\x62\x76\x15\x81\xed\xd2\x7b\xff\x7d\xfa\x5d\
+\x99\x0d\xdc\x6b\xd9\x3f\x36\xfe\x6f\xc8\x73\xd7\x5e\x82\x79\x38\
+\x47\xda\xfd\x24\xab\x46\xe0\xd9\xcd\xe9\x90\xd8\x03\x89\xb2\x81\
+\x00\xf4\x0b\xe3\x5f\x9e\x2e\x22\x30\xc6\x18\xc7\x88\xce\xd2\x10\
+\x80\xfe\x60\xfc\xab\xb3\x6a\x04\x8e\x69\x4e\x87\x24\xab\x67\x4a\
+\x26\x00\xfd\xc0\xf8\xbb\xa3\xab\x9b\x03\xe0\x40\x00\xba\x87\xf1\
+\x77\x0f\x11\xe8\x09\x02\xd0\x2d\x8c\xbf\x3f\x88\x40\x0f\x10\x80\
+\xee\xc8\x71\xfc\xf6\xe7\xc3\xcc\x5c\x20\x02\x1d\x43\x00\xba\x21\
+\x97\xf1\xdb\xcf\xa9\x7f\x20\xdf\x2c\xed\xe1\xb1\xf6\xbc\x77\xa6\
+\x9d\x7f\x93\xfc\x9e\xb4\x27\x21\x8d\x0c\x11\x80\x50\xd8\xf8\x73\
+\xf8\x25\x1f\xfb\x6b\xbf\xf6\x8b\x31\x87\xe2\xe5\xb2\xaf\xc7\xcd\
+\x77\xe9\x3c\xbf\x2c\xf4\x21\xe9\xbd\x6d\x9f\xda\x13\x89\x42\x25\
+\xe4\x32\xfe\x5f\x48\xfb\x2a\x3f\x2f\x4f\x97\xf6\x36\xde\xfb\x8a\
+\xe4\xa1\x22\x40\x00\xa0\x37\x72\x1a\xff\xf1\x72\x51\xec\x6d\x72\
+\x8f\x00\x01\x80\x5e\x28\x7d\xfc\x2d\xb9\x47\x80\x00\x40\xe7\xd4\
+\x32\xfe\x96\x9c\x23\x40\x00\xa0\x53\x6a\x1b\x7f\x4b\xae\x11\x20\
+\x00\xd0\x19\xb5\x8e\xbf\x25\xc7\x08\x10\x00\xe8\x84\xda\xc7\xdf\
+\x92\x5b\x04\x08\x00\xac\x8c\x8d\xff\x5b\xd2\xfb\xc7\x8e\x64\xdf\
+\xe3\x6f\xc9\x29\x02\xf6\xc7\x55\xbd\xff\xd6\xa7\x04\xa0\x20\x18\
+\xbf\x4f\x2e\x11\xf8\x97\x73\x59\xdf\x12\x80\x42\x60\xfc\x9b\x93\
+\x4b\x04\x86\x96\x00\x14\x00\xe3\x9f\x0f\x22\xb0\x51\x02\x90\x39\
+\x8c\x7f\x31\x88\xc0\x7a\x09\x40\xc6\x30\xfe\xe5\x20\x02\x07\x24\
+\x00\x99\xc2\xf8\x57\x83\x08\x4c\x25\x00\x19\xc2\xf8\xbb\x81\x08\
+\x10\x80\xec\x60\xfc\xdd\x52\x7b\x04\x08\x40\x46\x30\xfe\x7e\xa8\
+\x39\x02\x04\x20\x13\x18\x7f\xbf\xd4\x1a\x01\x02\x90\x01\x8c\x7f\
+\x18\x6a\x8c\x00\x01\x08\x0e\xe3\x1f\x96\xda\x22\x40\x00\x02\xc3\
+\xf8\xc7\xa1\xa6\x08\x10\x80\xa0\x30\xfe\x71\xa9\x25\x02\x04\x20\
+\x20\x8c\x3f\x06\x35\x44\x80\x00\x04\x83\xf1\xc7\xa2\xf4\x08\x10\
+\x80\x40\x30\xfe\x98\x94\x1c\x01\x02\x10\x04\xc6\x1f\x9b\x52\x23\
+\x40\x00\x02\xc0\xf8\xd3\x9c\x28\x3f\x2b\x6f\x92\x7b\x1b\xed\xfc\
+\x0e\x79\x82\x1c\x92\x12\x23\x40\x00\x46\x26\x97\xf1\xdf\x28\x87\
+\x1e\xff\x3b\xe5\x3e\xe9\x5d\x1f\xd3\xfe\x9b\xbd\xce\x90\x94\x16\
+\x01\x02\x30\x22\x8c\x3f\xcd\x45\xd2\xbb\x2e\x9e\xf6\xba\x43\x52\
+\x52\x04\x08\xc0\x48\x30\xfe\x34\x8b\x8c\xbf\x95\x08\x2c\x27\x01\
+\x18\x01\xc6\x9f\x66\x99\xf1\xb7\x12\x81\xc5\x25\x00\x03\xc3\xf8\
+\xd3\xac\x32\xfe\x56\x22\xb0\x98\x04\x60\x40\x18\x7f\x9a\x2e\xc6\
+\xdf\x4a\x04\xe6\x97\x00\x0c\x04\xe3\x4f\xd3\xe5\xf8\x5b\x89\xc0\
+\x7c\x12\x80\x01\x60\xfc\x69\xfa\x18\x7f\x2b\x11\x38\xb4\x04\xa0\
+\x67\x18\x7f\x9a\x3e\xc7\xdf\x4a\x04\x36\x97\x00\xf4\x88\xfd\xc5\
+\x57\xc6\xef\x33\xc4\xf8\x5b\x89\x40\x5a\x02\xd0\x13\x8c\x3f\xcd\
+\x90\xe3\x6f\x25\x02\xbe\xf7\x49\x3b\x56\xa1\x43\x18\x7f\x9a\x31\
+\xc6\xdf\x4a\x04\x7c\xed\x4f\x93\x13\x81\x8e\x60\xfc\x69\xc6\x1c\
+\x7f\x2b\x11\xf0\x25\x02\x1d\xc0\xf8\xd3\x44\x18\x7f\x2b\x11\xf0\
+\x25\x02\x2b\xc0\xf8\xd3\x44\x1a\x7f\x2b\x11\xf0\x25\x02\x4b\x60\
+\x9f\xb0\x6f\x4b\xef\x13\x1a\x49\xc6\xbf\x5e\x22\xe0\x4b\x04\x16\
+\x80\xf1\xa7\x89\x3c\xfe\x56\x22\xe0\x4b\x04\xe6\x80\xf1\xa7\xc9\
+\x61\xfc\xad\x44\xc0\x97\x08\x6c\x42\x4e\xe3\xdf\x2a\x87\xe4\x93\
+\xd2\xbb\x2e\x91\xb5\xeb\x3c\x24\x44\x20\x63\x18\x7f\x9a\x1c\xc7\
+\xdf\x4a\x04\x7c\x89\xc0\x0c\x8c\x3f\x4d\xce\xe3\x6f\x25\x02\xbe\
+\x44\x40\x30\xfe\x34\x25\x8c\xbf\x95\x08\xf8\x56\x1d\x01\xc6\x9f\
+\xa6\xa4\xf1\xb7\x12\x01\xdf\x2a\x23\xc0\xf8\xd3\x94\x38\xfe\x56\
+\x22\xe0\x5b\x55\x04\x18\x7f\x9a\x92\xc7\xdf\x4a\x04\x7c\xab\x88\
+\x00\xe3\x4f\x53\xc3\xf8\x5b\x89\x80\x6f\xd1\x11\x60\xfc\x69\x6a\
+\x1a\x7f\x2b\x11\xf0\x2d\x32\x02\x8c\x3f\x4d\x8d\xe3\x6f\x25\x02\
+\xbe\x45\x45\x80\xf1\xa7\xa9\x79\xfc\xad\x44\xc0\xb7\x88\x08\x30\
+\xfe\x34\x8c\xff\x80\x44\xc0\x37\xeb\x08\x30\xfe\x34\x8c\x7f\xa3\
+\x44\xc0\x37\xcb\x08\x30\xfe\x34\x8c\x3f\x2d\x11\xf0\xcd\x2a\x02\
+\x8c\x3f\x0d\xe3\x3f\xb4\x44\xc0\x37\x8b\x08\x30\xfe\x34\x8c\x7f\
+\x7e\x89\x80\x6f\xe8\x08\x30\xfe\x34\x8c\x7f\x71\x89\x80\x6f\xc8\
+\x08\x30\xfe\x34\x8c\x7f\x79\x89\x80\x6f\xa8\x08\xe4\x32\xfe\x9f\
+\x4b\xc6\x9f\x9f\x44\xc0\x37\x44\x04\x18\x7f\x1a\xc6\xdf\x9d\x44\
+\xc0\x77\xd4\x08\x30\xfe\x34\x8c\xbf\x7b\x89\x80\xef\x28\x11\x60\
+\xfc\x69\x18\x7f\x7f\x12\x01\xdf\x41\x23\xc0\xf8\xd3\x7c\x4a\x7a\
+\xd7\x05\xbb\xd3\x3e\xc7\x43\x42\x04\x66\x60\xfc\x69\x18\xff\x70\
+\x12\x01\xdf\x5e\x23\xc0\xf8\xd3\x30\xfe\xe1\x25\x02\xbe\xbd\x44\
+\x80\xf1\xa7\x61\xfc\xe3\x49\x04\x7c\x3b\x8d\x00\xe3\x4f\xc3\xf8\
+\xc7\x97\x08\xf8\x76\x12\x01\x7b\x07\xf6\x8e\xbc\x0f\x10\x49\xc6\
+\x5f\xb7\x44\xc0\x77\xa5\x08\x30\xfe\x34\x8c\x3f\x9e\x44\xc0\x77\
+\xa9\x08\x30\xfe\x34\x8c\x3f\xae\x44\xc0\x77\xa1\x08\x30\xfe\x34\
+\x8c\x3f\xbe\x44\xc0\x77\xae\x08\x6c\x91\x57\x49\xef\x1d\x44\x92\
+\xf1\xe3\x66\x12\x01\x5f\xdb\xb6\x6d\x3c\xc9\x67\xa4\xf7\x86\x91\
+\x64\xfc\x38\x8f\x44\xc0\xd7\x36\xee\xf2\x46\xf9\xb8\xf4\xde\x28\
+\x8a\x8c\x1f\x17\x91\x08\x6c\xd4\x36\x6e\x5b\x5f\xc7\xd1\xf2\x2e\
+\xe9\xbd\x41\x14\x19\x3f\x2e\x23\x11\xd8\xa8\x6d\xdd\x36\xbf\x9f\
+\x8f\x4a\xef\x15\xa3\xc8\xf8\x71\x15\x89\xc0\x46\x6d\xf3\x6b\x3c\
+\x45\xfe\x53\x7a\xaf\x14\x41\xc6\x8f\x5d\x48\x04\xd6\x6b\x9b\xb7\
+\xed\x4f\xce\x68\x2e\x88\x28\xe3\xc7\x2e\x25\x02\xeb\xb5\xed\x4f\
+\xae\x98\xb9\x20\x92\x8c\x1f\xfb\x90\x08\x1c\xd0\xb6\x3f\xb9\x61\
+\xe6\x82\x28\x32\x7e\xec\x53\x22\x30\xd5\xb6\x3f\xb9\x63\xe6\x82\
+\x08\x32\x7e\x1c\x42\x22\x30\xdd\xfe\xe4\xc1\x99\x0b\xc6\x96\xf1\
+\xe3\x90\xd6\x1e\x01\xdb\xfe\xe4\xfe\x99\x0b\xc6\x94\xf1\xe3\x18\
+\xd6\x1c\x01\xdb\xfe\xe4\xb6\x99\x0b\xc6\x92\xf1\xe3\x98\xd6\x1a\
+\x01\xdb\xfe\xe4\xba\x99\x0b\xc6\x90\xf1\x63\x04\x6b\x8c\x80\x6d\
+\x7f\x72\xc9\xcc\x05\x43\x3b\xc6\xf8\x2f\x96\xde\x75\x41\xb4\x63\
+\x63\x48\xc6\x8e\x80\x6d\x7f\xf2\x8a\x99\x0b\x86\x94\xf1\x63\x44\
+\x6b\x8a\x80\x6d\x7f\xed\xf1\xc1\x7b\x9a\x0b\x86\x92\xf1\x63\x64\
+\x6b\x88\x80\x6d\x7e\xff\x73\x03\x9c\x27\xbd\x57\xea\x43\xc6\x8f\
+\x39\x58\x7a\x04\x6c\xf3\xfb\x39\x4c\xfe\x5e\x7a\xaf\xd8\xa5\x8c\
+\x1f\x73\xb2\xd4\x08\xd8\xd6\x6d\xf3\xeb\xd8\x2e\xfb\xfc\xa5\x20\
+\xc6\x8f\x39\x5a\x5a\x04\x6c\xe3\xb6\x75\x97\xb7\x4b\xef\x8d\x56\
+\x95\xf1\x63\xce\x96\x14\x01\xdb\xf8\xa6\x5c\x20\x1f\x93\xde\x1b\
+\x2f\xe3\x4f\x24\xe3\xc7\xdc\x1d\x23\x02\xd7\x4a\xef\xba\x2c\xa3\
+\x6d\xda\xb6\x3d\x17\x67\xcb\xbd\xd2\x7b\x47\x8b\x68\x0f\x37\x3c\
+\x5c\x0e\x09\xe3\xc7\xbe\x1c\x3a\x02\xf6\x34\xde\x57\x4a\xef\xba\
+\x2c\xa2\x6d\xd9\x36\xbd\x10\x27\x4b\x7b\x1a\xe1\x65\x9e\x28\xf4\
+\x77\xf2\x0d\x72\x68\x18\x3f\xf6\xed\xd0\x11\x30\x6c\x4b\x37\x4b\
+\xef\xfa\x6c\xa6\x6d\xd7\x36\x6c\x5b\x5e\x9a\x97\xc9\xaf\xc9\x7b\
+\xa4\xf7\x41\x5a\x1f\x91\x3f\x95\xe7\xca\x0d\xf7\x30\x0e\x00\xe3\
+\xc7\xa1\x1c\x23\x02\xb6\xa9\x77\xc8\x6b\xe4\x43\xd2\xbb\x5e\xad\
+\x77\x4b\xdb\xac\x6d\x77\x53\x36\xfd\x23\x01\x07\x61\x57\xe0\x74\
+\xf9\x52\x79\x92\x3c\x41\xee\x93\x16\x86\x3b\xe5\xae\xe6\xe5\x31\
+\xb0\x7f\x90\xcf\x4d\xcf\x02\x0c\xc2\xa7\xe5\x65\xd3\xb3\x83\x73\
+\x8c\x7c\xad\x7c\x81\xb4\x2d\x1e\x27\xef\x95\xb6\xc5\x3f\xc8\x9b\
+\xa4\x85\xa0\x0a\xf8\xca\x8f\x63\x39\xc6\x77\x02\x9d\x32\xf4\x1d\
+\x74\x5d\xc3\x57\x7e\x18\x93\x33\xa5\xdd\xbb\x7e\xfd\xda\x4b\x19\
+\x92\x73\x00\x18\x3f\x44\x20\xeb\x08\xe4\x1a\x00\xc6\x0f\x91\xc8\
+\x36\x02\x39\x06\x80\xf1\x43\x44\xb2\x8c\x40\x6e\x01\x60\xfc\x10\
+\x99\xec\x22\x90\x53\x00\x18\x3f\xe4\x40\x56\x11\xc8\x25\x00\x8c\
+\x1f\x72\x22\x9b\x08\xe4\x10\x00\xc6\x0f\x39\x92\x45\x04\xa2\x07\
+\x80\xf1\x43\xce\x84\x8f\x40\xe4\x00\xd8\xaf\x5a\x32\x7e\xc8\x1d\
+\x8b\x80\x3d\x28\x67\xf7\xda\x4b\xc1\x88\x1a\x80\x0b\xe5\xe7\xa7\
+\x67\x01\xb2\xc7\x22\x60\xcf\xc4\x63\x4f\x8c\x13\x8a\x45\x1e\x0c\
+\x34\x14\x67\xc9\xab\xe5\x18\x8f\x28\x04\xe8\x8b\x27\xa4\x1d\xdb\
+\x3b\xd7\x5e\x0a\x42\xb4\x00\xd8\xf5\xb1\x27\x2c\x3c\x75\xed\x25\
+\x80\xb2\xb0\x47\xea\xd9\x43\x74\xed\x81\x44\x21\x88\xf6\x55\xf6\
+\x34\xc9\xf8\xa1\x54\xec\xa1\xf4\x76\x8c\x87\x21\x5a\x00\x5e\xd5\
+\x9c\x02\x94\x4a\xa8\x63\x3c\x5a\x00\x4e\x6c\x4e\x01\x4a\x25\xd4\
+\x31\x1e\x2d\x00\xf6\x24\x88\x00\x25\x13\xea\x18\xe7\x9e\x76\x80\
+\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\x54\x0c\x01\x00\
+\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\x40\xc5\x10\x00\
+\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\x54\x0c\x01\
+\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\x40\xc5\x10\
+\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\x54\x0c\
+\x01\x00\xa8\x98\x68\x7f\x19\xe8\x72\xf9\x89\xe9\x59\x68\xf8\xad\
+\x7c\x78\x7a\x36\x3b\x8e\x96\xdb\xa7\x67\xa1\xe1\x0b\xf2\xa2\xe9\
+\x59\x38\x18\x0b\x80\xfd\xd9\x24\x3c\xe0\x36\x99\x2b\xa7\x48\xef\
+\xff\xa9\x66\xed\x18\x0f\x03\x37\x01\x00\x2a\x86\x00\x00\x54\x0c\
+\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\x40\xc5\
+\x10\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\x54\
+\x0c\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\x40\
+\xc5\x10\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\x00\
+\x54\x0c\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\x00\
+\x40\xc5\x10\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\x00\
+\x00\x54\x0c\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\x08\
+\x00\x40\xc5\x10\x00\x80\x8a\x21\x00\x00\x15\x43\x00\x00\x2a\x86\
+\x00\x00\x54\x0c\x01\x00\xa8\x18\x02\x00\x50\x31\x04\x00\xa0\x62\
+\xa2\x05\xe0\xc9\xe6\x14\xa0\x54\x42\x1d\xe3\xd1\x02\xf0\x70\x73\
+\x0a\x50\x2a\x0f\x35\xa7\x21\x88\x16\x80\x07\x9a\x53\x80\x52\xd9\
+\xd7\x9c\x86\x20\x5a\x00\xf6\x36\xa7\x00\xa5\xf2\xef\xe6\x34\x04\
+\xd1\x02\x70\x7b\x73\x0a\x50\x2a\xa1\x8e\xf1\x68\x01\xb8\xad\x39\
+\x05\x28\x95\x50\xc7\x78\xb4\x00\xfc\x43\xfe\x75\x7a\x16\xa0\x38\
+\xee\x94\xf7\x4d\xcf\xc6\x20\x5a\x00\x8c\x9f\x35\xa7\x00\xa5\x71\
+\x5d\x73\x1a\x86\x88\x01\xd8\xd9\x9c\x02\x94\x46\xb8\x2f\x6e\x11\
+\x03\xf0\x63\x19\xea\x67\xa5\x00\x1d\x60\xc7\xb4\x1d\xdb\xa1\x88\
+\x18\x80\xff\xca\x70\x9f\x28\x80\x15\xb1\x63\xda\x8e\xed\x50\x44\
+\x0c\x80\x71\xa5\xe4\xd7\x82\xa1\x14\xec\x58\xb6\x63\x3a\x1c\x51\
+\x03\xf0\x2b\xf9\xfd\xe9\x59\x80\xec\xb1\x63\xd9\x8e\xe9\x70\x44\
+\x0d\x80\x71\xb1\xfc\xdf\xf4\x2c\x40\xb6\xd8\x31\x6c\xc7\x72\x48\
+\x22\x07\x60\x8f\xfc\xea\xf4\x2c\x40\xb6\xd8\x31\x6c\xc7\x32\x2c\
+\xc1\x09\xf2\x5e\x69\xb7\xa1\x6a\x75\x9b\xcc\x95\x53\xa4\xf7\xff\
+\x54\x8b\x76\xec\xda\x31\x1c\x96\xc8\xdf\x01\x18\xf6\x09\x7c\xab\
+\xe4\xa6\x00\xe4\xc6\xa3\xf2\x2d\xd2\x8e\xe1\xb0\x44\x0f\x80\xb1\
+\x5b\x7e\x60\x7a\x16\x20\x1b\xde\x2f\xaf\x9f\x9e\x85\x2e\xf8\x8a\
+\xf4\xbe\xcd\x2a\x5d\x6e\x02\xe4\xe7\x97\x25\x74\xcc\x11\xf2\x87\
+\xd2\xfb\x84\x97\x2c\x01\xc8\x4b\xfb\x91\x9f\x1d\xab\x59\x90\xc3\
+\x4d\x80\x96\xc7\xa4\xdd\x1f\x70\x99\xb4\x4f\x34\x40\x24\xec\x98\
+\xbc\x54\xbe\x4d\xda\xb1\x0a\x3d\x72\x8e\x7c\x50\xce\x96\xb7\x54\
+\xf9\x0e\x20\xbe\x76\x2c\xda\xf0\x61\x40\xb6\xcb\x3f\x49\xef\x1f\
+\xa4\x24\x09\x40\x6c\xed\x18\xb4\x63\x31\x4b\x72\xba\x09\x70\x30\
+\x37\xc9\x53\xa5\xfd\x84\x20\xf4\x8f\x5a\xa0\x48\xec\xc9\x6b\xec\
+\xd8\xb3\x63\xd0\x8e\x45\x18\x91\xe3\xe4\x0e\x69\xcf\x2a\xec\x55\
+\x3a\x67\xf9\x0e\x20\x96\xf6\xac\xbe\x97\xc8\x63\x25\x04\xe3\x59\
+\xf2\x02\xf9\x1b\xe9\xfd\xe3\xe5\x28\x01\x88\xa1\x1d\x53\xe7\xcb\
+\x67\xca\x62\xd8\xd2\x9c\x96\xc8\xf3\xe5\x99\xf2\x75\xd2\xbe\x4d\
+\x7b\x91\x3c\x5e\xe6\x86\x5d\xef\x5c\x7f\x97\xdc\x02\x70\xeb\xf4\
+\x6c\x56\xdc\x2f\xed\xd9\x7b\x6f\x91\xbb\xa4\x3d\x93\xcf\x5f\x64\
+\x71\x94\x1c\x00\x0f\x0b\xc0\x56\x69\x37\x19\x8e\xb4\x0b\x32\xc0\
+\x06\xf4\xc8\xf4\x6c\x76\x1c\x25\x2d\x02\x39\x60\xbf\xba\x6b\xdf\
+\xde\xdb\x93\x76\x58\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x32\x62\x32\xf9\x3f\x24\xc8\x97\x4a\x74\
+\xe8\xd7\x66\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x63\x9f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x2c\x00\x00\x00\xa5\x08\x06\x00\x00\x00\xe6\xb5\xc0\xd1\
+\x00\x00\x63\x66\x49\x44\x41\x54\x78\x9c\xec\x5d\x07\x9c\x55\xc5\
+\xd5\x9f\x99\x7b\x5f\xd9\xde\xfb\xb2\x2c\x2c\xbb\x94\xa5\xf7\x0e\
+\xa2\x02\xd2\x44\x41\x41\xec\x9f\x31\xb1\x1b\x8d\x26\xc6\x18\x4d\
+\xcc\x97\x68\x4c\x3e\x93\xa8\x49\x8c\x46\x4d\xec\xbd\x2b\x22\x16\
+\x54\x94\x26\x48\x67\xe9\x2c\x2c\xdb\xfb\xeb\xb7\xcc\x7c\xbf\x7b\
+\xdf\x19\x18\x2e\xef\x6d\x01\xd4\x5d\xbc\xff\x1f\xef\xf7\xd8\xfb\
+\xee\x9d\x76\x67\xfe\x73\xe6\xcc\x39\x67\x08\xb2\x61\xe3\xdb\x43\
+\x2a\x42\x28\xeb\xfb\x2e\x44\x17\x82\x03\x21\xd4\x03\x21\xe4\xfc\
+\x0e\xf3\x94\x21\x4f\xd7\x77\x98\xe7\xb7\x0a\x0c\x95\x32\x3e\x36\
+\x81\xd9\x38\x59\xf0\x3e\x34\x1f\x21\x74\x08\x21\x54\x83\x10\xba\
+\xc2\xf2\xdb\xe9\x06\x22\x8c\x21\x6c\xf9\x8d\xff\x9d\x8c\x10\x7a\
+\x0f\x21\xe4\x41\x08\xbd\x8e\x10\x4a\xb4\xfc\x7e\x2a\xc1\xd3\x8c\
+\x43\x08\xbd\x06\x79\xbe\x0f\x13\xc8\xb7\x95\xe7\x77\x06\xb1\x13\
+\xe1\xee\x5e\x19\x1b\xdf\x2b\x78\xdf\x91\x10\x42\xdf\x20\x84\x18\
+\x7c\x0c\xe2\x8a\xb5\xdc\x73\xba\xc0\x3a\x66\xac\x7f\x4b\xf0\x7d\
+\x3d\xb4\x45\x08\xbe\xaf\x82\xeb\xf2\xb7\x50\x26\x9e\xe7\x65\x96\
+\x3c\x6f\xb0\xfc\xde\xed\x40\x40\x3c\xbd\x05\x21\xf4\x77\x84\xd0\
+\x10\xa8\xd8\xe9\xd6\xa9\x6c\x7c\xb7\x30\xfa\x54\x0a\xfc\xdf\xe8\
+\x4f\xf1\x08\x21\xf7\xf7\x5c\xa6\x6f\x03\x18\xea\x37\x08\x21\xf4\
+\x10\x42\xe8\xb7\x08\xa1\x74\xcb\x18\xe2\xdf\x19\xf0\xad\xc3\x77\
+\xf2\x77\x50\xbe\x4c\xf8\xa6\xf0\x9d\xf6\x1d\xe4\xf9\xad\xc2\x60\
+\xf7\xc7\x11\x42\x97\xc0\xdf\x67\x23\x84\xc6\x21\x84\x1a\x84\x97\
+\x61\xc3\x46\x67\xc1\x84\xbe\x83\x4f\xd3\xbe\xc4\xeb\x94\x8b\x10\
+\x5a\x0a\xdf\x08\xc6\xcf\xf4\x08\xf5\xe5\xa4\xc1\x57\x34\xdf\x45\
+\x7b\xe8\x96\x3c\xf5\xef\x20\xcf\x6f\x15\x04\xc8\xca\xa8\x88\x82\
+\x10\x2a\x46\x08\xf5\x11\x7e\xb3\x61\xe3\x44\x10\x69\x99\x74\xba\
+\x81\x8f\x8f\xf1\x40\x56\x3e\x84\x90\x86\x10\x1a\x15\x65\x0c\x7d\
+\x1f\x6d\x10\x4d\x9f\xd6\x6d\x21\x03\xf3\x13\xa1\x71\xe9\xf7\x5c\
+\x26\x1b\x36\xba\x03\xb8\x84\xb4\x03\x21\x14\x00\x05\xb7\x81\x83\
+\x08\xa1\x0a\xcb\x3d\x36\x4e\x11\x38\x51\x75\x7b\xe6\xb5\x61\xe3\
+\x3b\x06\x85\x71\xb3\x0d\x94\xdb\xab\x60\x69\x78\x39\x42\x28\x08\
+\xe3\xca\x26\xac\x53\x8c\x6f\x63\x87\xc2\x86\x8d\x1f\x0a\xb8\x72\
+\xfd\x55\xf8\x88\xb0\x57\x2a\xdf\x02\x6c\xc2\xb2\x61\xe3\xe4\xc0\
+\xc0\x4c\x40\xdc\x19\xec\xf6\xca\xed\xae\x0a\x9b\xb0\x6c\xd8\x38\
+\x79\xe8\x40\x56\xb6\x54\xf5\x2d\xa3\x33\x84\x45\x2c\xdb\xd5\x9d\
+\x01\x86\x59\x88\x46\x78\x1e\x43\xda\xfa\x09\xa4\x4d\x84\x99\xcd\
+\x5a\x36\xdc\x46\x99\x4f\x26\xcf\x48\x65\x10\x3b\x6b\x7b\xe9\x91\
+\x93\xec\xd8\x44\x48\xc3\x9a\xd7\xc9\x6c\x5f\x8b\xe6\x07\x91\x06\
+\x1f\x11\xda\x4c\x7c\xe6\x44\xfb\x04\x37\x5e\xb4\xe6\x83\x85\xfa\
+\x75\xb6\x9d\xda\xea\x0f\x27\x82\xf6\xda\xc4\x9a\xef\xc9\x8c\x91\
+\x8e\x94\x25\xda\xc6\xd8\xc9\xb4\x59\x7b\x20\x6d\xb4\xe7\x89\xf6\
+\xb7\x8e\xf6\x35\x6a\x31\x8f\x61\x9d\x21\x2c\x7a\x02\xca\x79\xb1\
+\x81\xb5\x28\xf7\x30\x8b\x8d\x4a\x67\x5e\x78\x24\x92\xe0\x0d\xac\
+\xb7\xd1\x90\x27\x93\x27\xb2\xe4\xd5\xd9\x0e\x72\xa2\x1d\x8a\x08\
+\xe5\x8e\x96\x06\xaf\x2f\x8e\x40\x2e\xed\x41\x6c\x03\x6b\x7b\x46\
+\xcb\xf7\x44\x89\xaa\xa3\xef\x06\x77\x52\x72\xe9\xe8\xa4\xd1\x51\
+\x44\x6b\x93\x6f\x3b\x5f\x11\xe2\xbb\xec\x68\x7f\xee\xec\xbb\x8f\
+\x84\x8e\x58\x0d\x88\x79\x44\x13\x48\xa2\x41\x6c\x33\x2c\x10\x3e\
+\x6a\xab\xaf\x89\x84\xc5\xc9\xe8\x05\xb0\x29\x21\x96\x9b\x3f\x40\
+\x08\xdd\x0d\x3b\x20\x1d\x31\x04\x14\x89\x20\x03\x21\x74\x06\x42\
+\x68\x2c\x42\xa8\x3f\x42\x28\x01\xee\x69\x42\x08\x6d\x47\x08\x7d\
+\x89\x10\xfa\x1c\x21\xd4\x6c\x99\x2d\xda\x4a\xdb\xf8\xfd\x7f\x10\
+\x42\xd7\x21\x84\x56\x22\x84\xee\x80\xb2\x21\x68\xc8\x54\x84\xd0\
+\x54\xb0\x93\x31\xf2\x4c\x82\xb2\xb4\x42\x9e\x5f\x21\x84\x3e\x43\
+\x08\x35\x76\x30\xcf\x68\x65\x48\x47\x08\x5d\x80\x10\x9a\x86\x10\
+\xca\x87\xed\xed\x68\xc4\x6e\xdc\xff\x32\x42\xe8\x0f\x9d\x78\xb1\
+\xd6\x41\x5b\x02\x6d\x39\x0a\x21\xd4\x1b\xac\xca\x8d\xdf\xaa\x10\
+\x42\x1b\xa1\x1d\xd7\xc0\x04\xd1\x11\x32\xe6\xef\x32\x16\xca\x35\
+\x11\x21\xf4\x28\x42\xe8\xdf\x96\x4e\x58\x04\x75\xe4\xf9\x1a\xef\
+\x70\x1d\x42\xe8\x97\xe0\xab\xd6\xde\x64\xc6\xfb\x93\x06\xe9\x8e\
+\x84\xf7\x33\x14\xec\x98\x24\xb0\x05\x3c\x00\xe9\x7e\x8a\x10\x2a\
+\xeb\xa0\xe4\x82\x05\xd7\x93\x2b\x11\x42\xcb\xa1\xaf\x2a\x27\x68\
+\xb4\xca\x9f\x31\xfa\xcc\x03\x50\xc6\xbf\xc2\xd8\x10\xd3\xe3\x7d\
+\x60\x3c\xb4\x5d\x2d\x42\xe8\x56\x30\x6b\x38\x15\xc6\xb2\xbc\xde\
+\x3a\xf4\xab\x71\x08\xa1\xc9\x60\x59\x9f\x0e\x79\xf8\x11\x42\xbb\
+\x10\x42\xab\x11\x42\x2b\x20\xef\x93\xb5\xa1\x14\xdb\xbb\x97\xf0\
+\xde\xfb\x80\xc7\x02\x85\xba\x6e\x86\x31\xb4\x4a\x68\xeb\xb6\xea\
+\xcd\x7f\x93\xe1\xfd\xcc\x42\x08\x3d\x03\x6d\x2b\xe6\xd9\x03\xf2\
+\x1c\x0b\x7d\x2d\x09\xfa\x82\xd1\xb6\x47\x6e\x6a\xeb\xa3\xc1\xf7\
+\x2d\x90\x71\x7b\xbe\x48\xfc\xf7\x2c\x84\xd0\x9f\xa1\x72\x4c\xe8\
+\xfc\xe2\x87\x5f\x33\x1a\xfa\xd7\x82\x53\x68\xb4\x3c\xf8\xcb\x18\
+\x09\xe5\xe2\xcb\xba\x3b\xe0\xba\x41\x8e\xff\x0b\x03\xb8\xbd\x3c\
+\x8d\x7b\xee\x15\x9c\x42\x3b\xea\x63\xc5\xcb\x70\x3e\x42\xa8\xb2\
+\x8d\x7c\xac\x1f\x5e\xd6\x4b\x3b\x98\x9f\xb8\x0c\x18\x8e\x10\x7a\
+\x03\x6c\x7e\xda\xca\xcf\xc8\x63\x03\x42\x68\x51\x84\x34\x22\x81\
+\x97\xe1\x17\xc2\xbb\x36\xd2\x1e\x0d\xd7\x87\x20\x84\x5e\x82\x81\
+\x21\xe6\xcb\xfb\xc4\xbd\x42\x3a\x9c\xb4\x62\x80\x78\x98\x30\x49\
+\xf0\x36\x3e\x4f\x20\xd4\x48\xe5\xe7\xe9\x1b\xf5\x7c\x5b\x28\x47\
+\x34\xf3\x1b\x5e\xfe\x29\x96\x72\x5d\xd7\xc1\x36\x8e\x04\x3e\x91\
+\xdf\x27\x94\xc9\x07\x13\x9f\xb5\x2c\x06\x71\xef\x11\xca\xff\xaa\
+\x70\x8f\x98\xd6\x3d\xf0\x7b\x10\xbe\x6f\xb5\xfc\x6e\x05\x7f\xde\
+\x09\x44\xbc\xbb\x8d\x7e\xc5\xdb\xcc\x98\xf0\x1f\x03\x03\x70\x03\
+\xb7\xc1\x75\xee\x4b\xf8\xeb\x76\xda\x04\x0b\xbf\x19\x75\x7d\x1e\
+\x21\xe4\x6d\xa7\xbf\x19\xd7\xb7\xc2\x44\x21\x5b\xca\x6e\x05\x4f\
+\xfb\x2a\x78\x56\x85\xef\x19\x70\xbd\x2f\x42\xe8\x49\xe8\x2f\x91\
+\xfa\xda\xbf\x50\x14\x72\x52\x2d\x1f\x5e\xe1\xfb\xdb\xa9\xb0\xf8\
+\xdb\x5c\xcb\x60\x0e\x41\x27\x54\x84\x74\x15\xb8\xa6\x0a\x85\xdb\
+\x09\x33\x49\xb4\x7c\x78\xa3\x2c\x80\xfb\x3d\xf0\x6d\x48\x04\x23\
+\x80\xf8\x78\x9e\x4a\x94\x3c\x83\xf0\xcd\xf3\xdc\x0f\x8c\xde\x5e\
+\xdd\xc4\x97\xf1\x63\xa1\xcd\x78\x9a\xd6\x76\x8b\xd6\x8e\xbf\xb0\
+\xd4\x25\x12\xb0\xf0\xb9\x5b\x78\x96\x42\x5e\xa1\x28\xf5\xd2\x84\
+\x7a\xbd\x8b\x10\xca\xb6\x94\x3b\x5a\x7d\x1e\x87\x67\x38\x31\x19\
+\x52\xe3\x35\x90\x6e\xa4\x7c\xf9\xc0\x7b\x54\x68\xb7\x68\x84\xd5\
+\x00\x33\xf5\x0b\x42\x5a\x9a\x90\x9e\x58\x87\x10\x5c\xa7\x42\xa7\
+\xfe\xbd\x90\xbe\x95\xb4\x78\x1b\x5e\x0d\xf7\xf3\x01\xf6\x97\x0e\
+\xbe\xcf\xb6\xda\xe4\x15\x4b\x9b\xcc\x12\xd2\xe4\xf7\x14\x08\xfd\
+\x9b\x81\x24\x10\xa9\x7c\x9d\x21\x2c\x91\x34\xd6\x0a\x6d\xa6\xb6\
+\xd1\x9f\x43\x42\x9b\x79\x60\x7c\x5c\xd7\x09\xc2\x12\xdb\xf6\x56\
+\xcb\xc4\x18\x8a\xd0\xbf\x23\xf5\xb7\x8f\x11\x42\x85\x96\x36\x8c\
+\x54\xaf\x3f\xc1\xfd\x3e\xf8\x36\x56\x4a\x8b\x85\xbf\x79\x9e\xd6\
+\xbe\xb6\x14\x75\x40\x2a\xe0\x85\xd9\xda\x4e\x61\xc4\xeb\x37\x08\
+\xcf\x87\x04\x26\x6d\xeb\xa3\x08\x83\x23\x08\x03\x26\x52\xe3\xf2\
+\x17\x3c\x5f\x78\x8e\xc1\x00\x69\x8a\x90\x56\x47\xf3\x54\xc1\xe8\
+\x2f\xda\x0b\x45\x16\x69\x47\x7c\xae\x23\xd2\x15\xbf\xe7\x4b\x10\
+\xe7\x51\x1b\xcb\x28\x7e\xdd\x98\x5d\x9f\x13\x26\x92\x60\x1b\x92\
+\x09\xb3\xbc\x6c\xde\xe6\xbb\x60\xe6\x8a\xf6\xde\xf8\xb5\xc7\x84\
+\x7c\x34\x18\x78\x9a\xf0\x3e\xb4\x08\x75\xd9\x87\x10\x1a\x2c\xa4\
+\x13\x8d\xb0\x7c\x82\x84\xa0\x59\x06\x57\xb4\x0f\xbf\x8f\xe7\xfb\
+\x2a\xa4\x6b\x6d\x37\xde\x1f\xae\xb0\x0c\xce\x07\xdb\x79\x97\x6d\
+\x81\xb7\xc9\x4b\x16\x49\x60\xba\x90\x26\xbf\xa7\x87\x65\xd0\x6e\
+\xb1\xa4\xd5\x59\xc2\xe2\xe5\x9d\x0c\xea\x0a\x66\x99\xec\xda\xfa\
+\x88\xf7\x05\xe0\xdd\x8b\xe5\x8f\x46\x58\xe2\xe4\xf8\x28\xdc\xab\
+\x5b\xda\xbf\xbd\xfe\xc6\xc7\xc3\x41\x10\x1c\x50\x84\xfe\xc6\xf3\
+\xfd\x83\xf0\x8e\x39\xc9\x07\xa3\xf0\x05\x6f\xd7\x6a\x84\xd0\x04\
+\xb1\xb1\x18\x14\xf8\x22\x60\xf5\x78\x8b\x62\xcc\x90\x5c\x5a\xe0\
+\xef\x48\xba\x1e\xae\x4c\xfd\x09\x42\xe8\x61\xc8\x14\x09\x71\xb6\
+\x36\xc3\x8c\xb5\x0a\x62\x24\x19\x79\xe5\x21\x84\x26\x21\x84\x2e\
+\x84\xf5\x31\x97\x8a\x64\x10\x47\x8d\x34\xde\x14\xd2\xb6\x36\xb2\
+\xf8\xdd\x53\x90\x0e\x65\xc1\x0a\xf9\x65\xc8\xb3\x0a\xae\xe5\x80\
+\x04\xb7\x08\x66\x30\x3e\x73\x19\xbf\xfd\x07\x5e\xf4\xcb\x51\xf2\
+\xe4\xb8\x0b\x82\xb1\xa9\xf0\xdd\x0c\x2f\xe1\x03\x68\xab\x68\xa0\
+\xf0\x42\xbd\x42\xbb\xb6\x85\x27\x10\x42\x4b\xe0\x65\xca\x10\x84\
+\x4d\x83\x7c\xde\x02\x9d\x55\x2b\x5c\x2f\x06\xe7\xf5\xf3\x61\xf9\
+\xc5\x3b\x5c\x31\xc4\x42\x32\x24\xc8\xf2\x0e\xe8\xea\x18\xe4\x55\
+\x22\x74\x28\x17\x3c\xb3\x1c\x96\xa5\x9b\xa0\x2f\x54\xc2\x24\x81\
+\xdb\xd8\x94\xa1\xa0\x1f\x2b\x82\x77\x2b\x01\x11\x37\x43\x5a\x1f\
+\xc2\xc0\x0a\x82\x3a\x60\x10\x42\x68\x1e\x90\x83\x53\x20\xae\x05\
+\x90\xde\x05\x51\xca\xfd\x6d\xf8\xcd\x59\x07\x5c\x7b\x13\xcc\xc9\
+\xe6\xcb\x95\xe5\xe3\x60\x39\x9c\x24\x8c\x07\xe3\x73\x18\xfa\xe6\
+\xa7\xf0\x2e\x75\x88\xc0\x60\x10\xc4\x42\xd0\xa5\x31\x41\x4f\x58\
+\xdc\x89\xbc\x19\x44\x6c\xf9\x09\xb4\x37\x7f\x4f\x0c\xf2\x7b\x03\
+\x54\x0d\x4d\x70\xbd\x37\x42\xe8\x2c\x78\x2f\x99\x42\x7f\x33\x08\
+\xfc\x1d\x84\xd0\x99\xe0\xb6\x14\xa9\xbf\x59\xdb\xa8\x2f\x8c\x25\
+\x4d\xc8\xf3\x73\xc8\xf3\x6b\xe8\x2b\xb5\xf0\x39\x8e\xc9\x46\x41\
+\x22\x56\x16\x26\x1d\x90\x3c\xc6\x0b\xb3\x31\x67\x49\x2f\x88\xa6\
+\xae\x08\x85\xe5\xff\x8f\x07\x12\x50\x2c\x52\x53\x5d\x04\x47\x52\
+\x4e\xb2\xe7\x59\x66\x0f\x5d\x18\x60\xc6\x8c\x7e\xb3\x10\xd2\x24\
+\x52\x27\x32\x7e\xfb\x99\xc0\xec\x3c\x9d\x26\x8b\xd4\x60\xad\x63\
+\x0f\x28\x97\xd8\x66\xf3\x22\xdc\x1f\x0d\x52\x3b\xf7\xf1\xdf\xee\
+\x10\x66\x1c\x5e\xaf\x6d\xa0\xab\x89\x54\x27\x91\xb8\x5f\xb2\xcc\
+\x92\x0c\xc4\x75\xeb\xbd\x28\x82\x84\xa5\x5a\x24\x2d\x06\xd2\xd1\
+\x59\x51\xca\x2a\x45\x48\x57\x94\xb0\xa8\xb0\x04\xe4\x3a\xbc\xd7\
+\xa1\xc3\xb7\x55\x8f\xf1\x40\x8c\xa2\xb4\xc5\x40\x52\x41\x11\xfa\
+\xc3\x95\x16\x09\xeb\x54\x2e\x09\xad\xba\x16\xab\x84\xa5\x5b\x56\
+\x22\x22\x3a\x2a\x61\xf1\x7a\xa7\x80\x5a\x84\x59\xd4\x16\x7f\x69\
+\x27\x00\x1f\x01\x32\xaf\x8e\xf0\xfe\xda\x92\xb0\xf8\xff\x7f\x12\
+\xa1\xbf\xed\x45\x08\xcd\x89\x92\x1f\xbf\x96\x8d\x10\x7a\x2a\x42\
+\x7f\x5b\x23\xf8\x57\x62\x4b\x5e\xf7\x59\x24\x2c\xb1\xac\x87\x60\
+\xf5\x64\xcd\xf3\x48\x5f\xb3\x12\xd6\x58\xb8\xc1\x25\x30\x7b\x5b\
+\xd1\x48\xc5\xe5\xcb\x2a\x0b\xe1\xd4\x0a\x4a\x53\x07\xa4\xe9\x10\
+\xd2\x74\x08\xf9\x20\xd0\x11\x04\x2c\x69\xbc\x6e\xc9\x27\x1a\x61\
+\xf1\xf2\x37\x82\x38\x8d\x04\xa9\xc4\x9a\xa7\x53\x48\xe7\x2c\x90\
+\x16\xc4\x3c\x97\x47\xa8\x1f\x6f\xec\x33\x2d\xf9\x7e\x2a\xd4\xdf\
+\x61\x69\xb3\x48\x9f\xb6\x66\x60\xde\xc6\x43\x40\x6f\x22\x92\xf0\
+\x27\x42\x87\x75\x0a\x75\xb0\xb6\x25\x4f\xff\x5e\xa1\x13\xf1\x7a\
+\xdd\x68\xa9\x0b\x6a\x83\xb0\x38\xb9\x7c\x29\xc4\x72\xb2\xe6\x1b\
+\x4d\x02\x11\x09\x4b\xb7\x7c\x3f\x20\xdc\xeb\x8a\x50\x0f\xa7\x10\
+\x42\xd8\x90\x30\x96\x09\x9d\x9a\xd7\x45\x54\xc4\x9f\x2e\x84\xc5\
+\xcb\xf9\x37\xa1\x1e\x3c\xcd\xab\x84\x72\x59\xfb\xb3\x2c\xf4\x3d\
+\x04\x13\xfc\x4e\x4b\x9b\x47\x23\x2c\xb1\x0e\xb5\x96\x7b\xd7\xc0\
+\x0a\x08\x59\xc6\xa9\x75\x1c\xf1\x34\x6e\xb3\x2c\x11\x99\x65\x43\
+\x06\xb5\x41\x58\xba\xb0\x9c\xee\x25\xe4\x29\x8e\xa9\x23\xef\xb1\
+\xa3\x12\x56\x34\xf0\xfb\x16\x5b\x06\xbd\x2a\xbc\x60\x77\x07\xa4\
+\x0a\x2e\x0d\x5d\x29\x94\x87\x57\x68\xb2\x90\x57\x24\xc2\x12\xf5\
+\x21\xe7\x76\x30\x4f\x2c\xe4\x79\x81\xf0\x3c\xcf\x73\x96\xa5\x7e\
+\xfc\x7b\x96\x65\x60\xbc\x00\xd7\x4f\x85\xd7\x00\x2f\xef\x13\x96\
+\x3c\x76\x0a\xc1\xd8\xda\x8b\x07\x2e\x0b\xf7\x3c\x61\xe9\x84\xbb\
+\x05\x93\x12\x6c\xc9\x53\x24\x2c\x5d\x98\x61\xf3\xe1\xf7\x8e\xc4\
+\x04\x8f\x46\x58\xbc\x4d\x9f\x87\xdf\x1d\x1d\x68\x2f\x5e\x87\x54\
+\x50\x27\x88\xed\xf1\x9c\x50\xf6\xd3\x81\xb0\x78\x5a\x45\xc2\x0e\
+\x19\x6f\xb3\xbb\xe0\x37\x77\x3b\x75\x11\xfb\xf3\x10\xd8\xe8\x60\
+\x82\xca\x23\x12\x61\xf1\xb2\xfd\xd1\x32\x76\x2b\x05\x7d\xb5\xab\
+\x9d\x49\x56\x12\xfa\xc6\x83\x96\xf6\xaa\x14\xe2\x84\x91\x28\x84\
+\xc5\xdb\xad\x1e\x21\xd4\xaf\xbd\x3c\x4f\x45\xcc\x2b\x06\xdf\x97\
+\x5a\xfe\xfe\x37\xcc\x8e\xb1\x82\x8e\x48\x8a\xf2\xc1\x70\x8f\x1b\
+\xc4\xcb\x77\x05\xe3\x4f\x24\x04\x18\x8c\x06\xbe\x46\x7e\x12\x74\
+\x3b\x4e\x61\xa7\xa9\xad\x72\x07\xe1\x5e\xa3\x63\xfe\x17\xae\xf3\
+\x3c\x97\x44\x79\xae\x19\x9e\xe5\x2f\x7b\x28\x88\xbe\x9a\x30\x13\
+\x44\xfa\xb4\x17\x33\x9f\xeb\x81\x32\x41\x0c\x47\x42\x1e\xbf\x80\
+\x19\xd0\x01\x9d\xaa\x2d\x68\x82\x91\xee\xaf\xa0\xd3\xc8\x70\xcd\
+\x98\x7d\x67\xc3\x6f\xed\x95\x05\xc1\xb2\xb4\x02\xda\x28\xd4\x4e\
+\xbe\xd1\xc0\xa0\xfe\x75\x60\xb3\x85\xda\x31\x24\xe6\x50\xa0\xbe\
+\x86\xc4\x7c\x3b\x5c\xe3\x52\xc4\x2c\x20\x8a\x13\x31\x66\xee\x8a\
+\xe0\xef\x62\x31\x4c\x28\x2a\xb4\xd9\x5a\x90\x48\x65\x68\xff\xb6\
+\x8c\x41\x79\x7f\x76\xc1\x52\xfa\x77\x70\x3d\xda\x18\xc0\xf0\x0e\
+\x92\x41\xef\x89\x84\xb6\xfc\x1d\x4c\x38\x31\x82\x3d\x5f\xb4\x7e\
+\xcd\xf3\x90\x40\xa2\xda\x0b\xe5\x55\x40\x5f\x3c\xdb\x92\xb6\x15\
+\xbc\x7c\xf7\x82\xf2\xdd\x29\x4c\x3a\x51\x1b\xea\x44\xc1\x15\x6a\
+\xb9\xb0\x73\x86\x84\x0c\xf9\x0c\x17\x14\xac\x74\xdb\xfb\x70\x45\
+\x3d\x5f\x36\xf0\x06\x19\x07\xc4\xa7\xb7\x61\x8b\xc3\x40\x69\x88\
+\x3a\x30\x18\x44\xf0\x4e\xf0\x2f\xa8\x0b\x1f\x14\xe3\x41\x9f\x60\
+\xf5\x13\xdb\x0a\x24\xc0\x15\xa4\xfd\x04\xbd\x4a\x5b\x75\xd3\x84\
+\x01\xd6\xd6\x6e\xdd\x04\x20\x2d\x15\xae\xad\x05\xa5\x39\x16\xda\
+\xa7\x3d\xf0\x7a\x54\xc3\x04\x20\xb6\xc9\xb4\x0e\x3c\x8b\x41\xa1\
+\xff\x36\xfc\xbf\x3d\x92\x6c\x2f\x3d\x04\x06\x82\xe5\xd0\x99\x3b\
+\x6a\x85\xcd\xdb\x60\x39\x18\x28\xf2\x36\x48\x16\xa4\xee\x53\x31\
+\xe9\x7e\xdf\xe0\xed\xc1\xeb\xc4\x07\xeb\x3f\x84\xb6\x8f\x38\x80\
+\x23\x80\xdf\xff\x3c\xf4\x53\x29\xca\xb3\xbc\xdd\x06\xc1\x44\xc6\
+\x27\xdc\x32\xa1\xcf\x74\x74\xec\xf2\x7e\xd9\x0c\x65\x16\x31\xb3\
+\x8d\xb2\x72\xa2\x3b\x20\x48\xcd\x6d\xf6\xf1\x93\x5d\xc6\x70\xf2\
+\x28\x02\xe5\x9b\x0e\x05\x68\x01\x13\x81\x68\x04\xd3\x56\x7a\x1a\
+\xcc\x32\x5e\x50\xc6\x23\xd8\xb1\xca\x87\xdd\x24\x6b\x7a\x7c\x40\
+\xac\x87\xa5\x03\xea\xc4\xcb\x45\x42\x67\x59\x05\xbb\x1a\xa5\x90\
+\x66\x2f\x20\x62\x71\x17\x4c\x02\x91\xfd\x69\x90\x16\x28\xbc\xf8\
+\xdb\xc1\xfa\x7c\x79\x94\xdd\x4c\x15\x76\x29\xd7\xc3\x87\xb5\xb1\
+\x5b\x37\x40\x28\x97\x03\xd2\x54\x04\x29\xa9\xb3\xf5\xfa\x10\x24\
+\x2d\xbe\xc4\x1a\x24\x90\x6d\xb4\x5d\x3d\x04\xd2\x71\xe8\x04\xf2\
+\xb5\x82\x4f\x3a\x1f\xc0\x77\x67\xde\x0d\x82\xb2\xf2\x9d\xd1\x29\
+\x42\xbb\x0c\x3c\x89\x32\x75\x25\x70\xeb\xef\x34\xc1\x30\xd5\x09\
+\xfd\x6e\x05\xfc\xdd\x19\x0f\x0c\x2e\xd1\x1a\x12\xf9\x17\xb0\x1b\
+\xde\xd6\xf3\xc3\x22\x3c\xff\x33\x10\x10\x3a\x93\x2f\x86\xfe\xc2\
+\x97\x92\xfc\xbd\xf7\x13\x76\xd4\xad\x7c\xc3\xfb\xc2\x4a\x58\xc2\
+\xb6\xb5\x33\x6f\xe2\x54\x45\x6b\xc8\xb0\x14\xc0\x90\x10\xee\x3c\
+\x45\x69\x53\xcb\xa1\x06\x91\x7e\x47\x30\x7b\x6b\x27\x38\xc0\x38\
+\x79\xec\x16\x08\x8b\x80\x48\xbb\x4d\x18\xd8\x3c\xaf\x3f\x81\xa8\
+\x3b\x58\x78\x11\x23\xe1\xd3\x16\x74\xd8\xad\xbb\x15\xd2\x15\x5f\
+\x10\x6f\xbb\x1e\xf0\xcd\x5f\x78\x99\xe5\xf7\x8e\x82\xdf\xbf\x13\
+\x66\x3e\x7e\xe8\x41\x36\x88\xfa\xbe\x36\xda\x02\x81\xf5\xf6\xa9\
+\x00\x81\x0d\x84\x9d\xf0\x77\x67\x7d\x29\x79\x3d\x76\xc1\x37\x6f\
+\x97\xbc\x13\x4c\xaf\xab\x22\x4e\x18\x47\x08\x96\xd0\xe5\xf0\xff\
+\xce\xd6\x91\xf7\xd7\x9d\x1d\xb8\x27\xdf\xf2\x77\x7f\xf0\x14\x39\
+\x59\xf0\xf4\x92\x81\x8c\xab\xdb\x10\x5e\xac\xb6\x6b\x51\x71\xaa\
+\x08\x2b\xc6\xf2\x37\x3b\xc9\x59\x19\x59\xd6\xc7\x44\x58\xaa\x59\
+\xc1\x1b\xc1\x7b\x92\xf9\x21\xc1\xce\x8c\x0f\x92\x58\xcb\xef\x5c\
+\x32\x6a\x02\xbb\x97\x77\x41\xfa\xa3\xed\x38\x25\xf3\x65\x96\x0c\
+\xf6\x45\xab\x40\x6f\xf0\x51\x84\x59\xc5\xaa\xdc\xf6\x9c\x64\x9d\
+\xfc\x96\xf4\x9d\x1d\xd4\x5f\xb5\xc2\x77\x67\x89\x32\x12\xf4\x53\
+\xf0\x7e\xf8\xf3\xbc\x7c\xd6\x53\x78\xac\xe5\xec\x6e\xba\x2d\x59\
+\xb0\x77\x23\x82\x5f\xec\x89\x80\xb7\x05\x7f\x87\x6d\xb5\x45\xa4\
+\x76\x3c\x15\x63\x97\x0a\x9b\x22\xed\xf1\x4c\x6b\x47\x13\x3e\x55\
+\xeb\x7f\xbf\xe5\x6f\x0c\x04\x73\x32\x1f\xd1\xce\x66\x4b\x07\x96\
+\x7b\xa7\x62\x60\x59\x11\x6d\xc9\x84\x41\x1a\x9b\x08\x7a\x33\xaf\
+\xa0\x58\x8f\x54\x17\xbe\x7d\xcf\x37\x12\x8c\x25\xef\x8b\x20\xcd\
+\xe9\x96\xf7\x10\xb0\xe4\x97\x74\x92\x75\x48\xb0\x74\x98\x60\x07\
+\x75\x48\xa7\xb2\x3d\x65\xc1\x47\xf4\x44\xc1\x9f\xe7\xe5\xb2\xf6\
+\x39\xfe\x37\x8e\x72\x7f\x47\x21\x3a\xef\x26\x9c\x40\x39\x4f\x14\
+\xdc\xd6\x8c\xf7\x85\x98\x93\x20\x5d\x51\xba\x41\xed\xb4\x81\xb5\
+\xbf\x9d\xaa\xb1\xcb\xcb\xf0\x59\x07\x9c\xc1\x3b\xfc\x8e\x4e\x95\
+\x84\x55\x0b\xdf\xbc\x90\x55\xb0\x75\xa9\x9e\xe4\x4c\xc7\xf5\x3f\
+\xef\x01\x0b\x9f\x0a\x0f\xf8\x53\x01\x06\x65\xa9\x07\x37\xa4\xdf\
+\x21\x84\xc6\x08\xcb\x14\x2b\x5c\x60\xd1\x3f\x1f\x88\x4d\x03\x31\
+\xf9\x77\x20\x69\x31\x61\x56\x3a\x04\xcf\x70\x5d\x0d\xd7\x6b\x74\
+\xb6\x1d\xc5\x4d\x81\x24\x41\xbf\x58\x15\x61\xb0\x7f\x9b\xa0\x30\
+\xf8\x06\x80\x72\xb5\xb3\xa1\x4f\x78\xbd\xf9\x96\x37\x6f\x97\x0a\
+\xcb\xef\xbc\xdd\xb8\x64\x3e\x50\xc8\xbf\xb3\x60\xd0\x66\x6d\xb9\
+\x34\x9d\x6a\x78\xc0\x03\xa4\x27\xfc\x9d\x09\xba\xe1\x3d\x27\x10\
+\x49\x84\x8f\x91\xfe\x1d\xb8\xe7\xa0\xe5\xef\x8d\x70\xc6\x62\x67\
+\x75\x58\xd6\xb4\x25\x58\x89\xbc\x19\x21\xcf\x13\xc6\xc9\x12\x16\
+\xaf\xd0\x5e\x8b\xcd\x45\x3a\x28\x8b\xcb\x4e\x30\x66\x94\x15\xed\
+\x85\xad\xf8\x3e\xc0\x84\x1d\xbf\x1a\xd8\x51\x8b\x06\x02\x21\x34\
+\xae\x06\x7b\x27\x3e\xa8\xe6\xc0\x0e\xcd\x1e\x61\xe0\xed\x80\x6f\
+\xfe\x6e\xa6\xc3\x2e\xe4\x89\x86\x4a\xe1\xb6\x43\x7c\xab\x7c\x1b\
+\xfc\x2d\x9d\xc0\xa6\xc8\x89\x80\x4b\x90\x33\x60\xb7\xb3\x33\xe0\
+\x9b\x30\xc6\xf7\x39\x70\x8d\xb7\xdd\x76\xf8\xe6\xed\xb1\xdb\xa2\
+\xab\x1b\x0c\x9f\xcd\x9d\xec\x83\x9c\x50\x47\x83\x02\xf9\xdb\x36\
+\x9d\xe0\xfd\xa8\x09\xde\x7d\x4f\x78\xd7\x49\xb0\xc9\xb0\xe7\x04\
+\x36\xae\x74\x88\x94\x32\x09\xae\xb5\x45\xb8\x1b\x2d\x7f\xc7\x83\
+\xfb\x8f\xef\x14\x8f\xb9\x53\x92\xce\xc9\xce\x1c\x5c\xa7\x53\x0d\
+\x7e\x46\x48\xb0\x9f\xe1\xb6\x33\xb2\x10\x54\xac\xbd\x8f\x35\x3e\
+\x97\xd4\xc1\x98\x4e\xdf\x17\x98\x30\x10\x70\x1b\xf5\xe2\x75\x79\
+\x1c\x88\x9c\x0f\x44\x87\x60\x0e\xc2\xeb\xf7\x05\xec\x98\xf0\xed\
+\xff\xe1\x20\x99\xa1\x4e\x86\xbf\xd1\x41\xe2\xbb\x02\xae\x71\x1d\
+\xe0\xf2\x53\x54\xf7\x8e\x82\xf7\xb1\x4b\xc1\x1d\xc7\xba\x04\x6e\
+\x0b\x22\xb1\x8f\x17\xcc\x35\x3c\xc2\x0e\x9a\x2e\x48\xbb\xdc\xeb\
+\x20\x04\x52\x2d\x3f\x9a\xbd\xa3\x03\x5e\x1c\xa0\x3f\x85\xef\xef\
+\x42\xa9\xcf\xeb\xb9\x42\x28\x07\x82\xe3\xed\xdd\x9d\x9c\x58\xf8\
+\x18\xba\x5c\xf0\xf1\x6b\x6b\x37\x78\x33\x28\xe7\x65\x98\xd4\x8c\
+\x09\xf4\x47\xf0\x9b\xb3\x83\xe3\x56\x8a\xe0\xee\xd3\x9e\x0b\xda\
+\x09\x81\x58\x1c\x9c\x51\x14\xa9\x4b\xb4\x1d\x8a\xe6\x8e\xf1\xa4\
+\x50\x58\x06\x21\x23\xce\x13\x1c\x5e\x69\x1b\x1f\x26\x0c\xe2\x3c\
+\x18\xa4\x92\x60\x41\xdc\x1d\xc0\xda\xa8\x9f\xb8\x04\x5a\x0b\xdf\
+\xbc\x5e\x99\xc2\x6f\x04\xc8\xea\x65\xf8\x9b\x3f\xf7\x80\x10\x15\
+\xa0\xa3\xe1\x6f\x10\x58\x1e\x67\x0a\xd2\x55\x19\x2c\xaf\xd1\x77\
+\xd8\xae\x7c\xc6\x4f\x01\xb7\x93\x48\xe5\x8c\x04\xbe\x74\xce\x41\
+\x08\xfd\x1f\x5c\xe3\xca\xe0\xd7\x04\x5b\x38\x2a\xa4\xc5\x6d\x79\
+\x38\x39\x5f\x0d\x9e\x0f\x7a\x07\xdc\xa2\xb0\xd0\x4f\xaf\x05\xe3\
+\x54\x7a\x82\x96\xf2\x9d\x05\x7f\x17\xcf\x83\x94\xe8\x80\xba\x0e\
+\x43\x08\xfd\x06\x7e\x93\x3a\x40\x5a\x9c\x74\xc6\x08\x56\xed\xd1\
+\xda\x99\x1b\x3f\x7b\x22\x9c\xf8\xf3\x1b\x58\x0e\x87\x84\x36\x6e\
+\x6b\xec\xf2\x3e\x5e\x0c\xcb\x50\xfd\xdb\x1a\xbb\x44\xd0\x05\xf0\
+\xc4\x07\xc1\xb7\x64\x31\xa7\xa7\xc2\xb7\xd8\x70\xfc\xfa\x9b\xa0\
+\x60\x13\x77\xbd\xfe\x03\xf6\x49\xaa\x85\x8d\x45\x89\x8a\x08\x9d\
+\x7a\x11\x88\xfa\xeb\xc1\xd0\x90\xe7\xd3\x15\x77\x7c\x3a\x2a\x35\
+\x12\x4b\x67\xe3\x1e\xf4\xd6\xdd\x4d\x51\x82\x7c\x08\xae\x3b\xa1\
+\x5d\x7a\x82\x4f\x65\x96\x30\x63\x4a\x11\xda\x12\x0b\x1d\xe9\xaf\
+\x10\x05\x43\x7c\x5f\x7f\x06\x25\x6b\x34\x63\xc2\x6f\x0b\x9c\x08\
+\xe6\x40\xf8\x12\x6a\xd9\x39\xb5\xce\xd4\xbc\x3f\xa4\x03\x39\x15\
+\xc3\xdf\xdc\x83\xe1\xaf\x96\xf4\x79\x1f\x7c\x1d\xbc\xfc\x89\x40\
+\x6e\x4f\x43\x1f\xd4\x84\x89\x57\x8a\xd0\x1f\xf9\x84\xb9\x18\xda\
+\x1f\x7d\x87\xfd\x8e\x13\xe3\x21\x1e\xa4\x0e\xc0\xc0\xcb\xe1\xa7\
+\x42\x7d\x48\x94\x36\xe3\x75\x1e\x04\x6d\x16\xdf\x81\xe5\x2c\x1f\
+\xa7\x0f\xc3\x04\xe0\x80\x6b\xc9\xd0\x96\x85\x6d\xb4\x9b\x2c\x48\
+\xa4\x0c\xd4\x16\x65\x30\x7e\xad\x0e\xea\xa7\x14\xf7\x5a\xfc\x7f\
+\x0e\x42\x50\x32\x31\x43\x07\x04\x91\xfb\x4a\xf0\x81\x12\xc1\xef\
+\x1b\x22\x04\xd4\xd3\x04\xdf\xae\xbb\xa3\xc4\x32\x12\x3d\xd4\x1f\
+\x16\x2a\xcf\x7d\xd9\x86\x59\xd2\x47\x11\x7c\x09\xb9\x6f\xd6\x53\
+\x96\xdf\x3b\x03\x9e\xfe\x7f\x2c\x3e\x55\xdc\x2f\xf1\x64\x67\x59\
+\x9e\xfe\x94\x08\xce\xda\x43\x2d\xf7\xf0\xef\x1b\x85\x76\xd4\x84\
+\x77\xc3\x23\x43\x44\x8b\x72\xd0\x0f\x96\x7d\x4c\xb0\x42\x66\x16\
+\x1d\x1b\x8e\x50\xb6\xc7\x2c\x75\x8f\x16\x8f\xac\x2d\x44\xf2\x25\
+\xb4\x4a\x9a\x0c\x96\x3e\xa5\xed\xd4\xe3\x1c\x08\xac\x68\x6d\x83\
+\xdb\x2c\xe5\xb6\xd6\x63\x44\x94\x3e\x78\x67\x94\xe8\x1d\xfc\xff\
+\x49\x40\x84\x62\x59\xad\x92\xc4\x77\x11\xad\x21\xc6\x12\xa5\x82\
+\xa7\xfb\x0c\x48\x9b\x91\xda\x8c\x97\xe9\xc7\x82\x23\xbf\x58\xa6\
+\x8e\x44\x6b\xb8\x44\xc8\x93\xbf\xa7\x1a\xb8\x1e\x29\x3f\xd1\x68\
+\xfc\x5d\x4b\x7b\x1f\x10\x74\x89\x38\x42\x5e\xf7\x59\xfc\x3e\x7f\
+\x12\xa1\x5c\x11\x21\x83\x83\xec\x75\xb0\x6b\xa5\xc3\x0b\xf8\x0c\
+\xc4\xf0\xad\x30\xab\x5f\x0f\x0a\x3c\x1e\xab\x67\x3f\xc4\xaa\x11\
+\x97\x6d\x12\x34\xb4\x91\xf9\xb3\x82\x1e\xc5\x20\xbb\xdf\x82\xc7\
+\xf9\x2b\x20\x3d\x55\xc1\xfd\xb9\xa0\x9b\x58\x00\x46\x73\xd4\xe2\
+\x7b\x56\xdb\x5e\x05\xbe\x27\xc4\x00\x39\xbb\x3a\x28\xa9\x48\xd0\
+\x6e\xb7\x09\x86\xad\x32\xe8\xab\xb8\xd2\x93\xa7\xc3\x97\x38\x0f\
+\x03\xf9\x5c\x27\x88\xd8\xf9\xe0\x2b\xb9\x16\xda\xbf\x0c\x7c\xed\
+\xe2\x60\x92\x99\x01\x03\xdd\x2d\x0c\x34\x19\xf4\x14\x5c\x2f\xf1\
+\x5d\x6f\x5e\x30\x61\x70\x73\x02\x9b\x02\xfd\xe0\x03\xb0\xa8\x2f\
+\x07\x89\x32\x15\xec\xda\xe6\x43\x7b\x31\x41\x0a\x90\x60\x52\xfa\
+\x73\x14\x25\x3a\xef\x83\xeb\xa1\x0f\x3e\x27\xf4\x41\x19\xa2\x96\
+\x5e\x0d\xcb\x9f\x0d\xa0\x77\x95\xc0\x90\x76\x2c\xd8\xd5\x65\x59\
+\x74\x92\xdf\x65\x5b\xf1\x76\x0a\x00\x49\x2c\x87\xf2\x70\x5f\xbe\
+\x4b\x20\x8a\xef\x1b\x20\x45\x56\x00\x11\xa5\xc3\xe6\xc2\x42\x58\
+\x8e\x31\x41\xb2\xea\x88\x84\xc8\x75\x8a\xcf\xc2\xf3\x77\x0a\xd2\
+\x5c\x06\x10\xe5\x6d\x20\xb5\x6d\x03\x5d\x61\x0c\x48\xfd\x67\x82\
+\xd4\x1c\x2b\x8c\x5d\x64\x89\x9d\xf7\xad\xe0\x76\x81\x89\xa9\x25\
+\xfa\x81\x28\xf5\xf0\xd9\xe1\x6a\x78\x2e\x52\xcc\x2c\x04\x47\x77\
+\x8b\xb1\x78\xda\x8b\x5a\x68\xbd\xcf\xd3\x86\x93\xae\x35\xe2\xe8\
+\x77\x25\x61\xf1\x97\xef\x10\x66\x14\xbd\x03\xf5\x12\x3f\xe2\xcc\
+\xad\x5b\x66\x6c\x11\xe2\x52\xf8\x9f\x16\x69\xa9\x23\x79\x8a\x6d\
+\xb9\x5e\xb0\x9e\x8f\x24\xa2\x7f\x1b\x12\x96\x5b\x90\x8e\xf8\xfb\
+\xdc\x18\x41\xea\x6b\xeb\x63\xad\xef\x53\x42\x59\xda\x1a\x88\xfc\
+\x9e\x2b\x84\xba\x68\x1d\xec\x83\xd6\xb8\x4c\xbb\x2d\xef\xf9\x64\
+\x24\xac\xbb\xa3\x48\x58\xd1\xc6\xd0\x08\x28\x03\xb3\xc4\x97\x6b\
+\xaf\xfc\x62\x1c\xba\x4d\x1d\x90\xb0\xac\xef\xee\x7e\xa1\xaf\x76\
+\xa4\xbf\x51\x4b\x7f\xdb\x65\x89\x7d\x1f\xe9\xdd\x9c\xb0\x84\xc5\
+\x13\xfc\x13\xac\x9d\x65\xa1\x10\x8a\xa5\x11\x10\x48\x14\x6b\x05\
+\xa5\x70\xb4\x59\xee\x69\x60\xdf\x7d\xc2\x7a\x9b\x09\xb1\xa8\x99\
+\xf0\xb7\x22\x48\x55\x12\xcc\x7e\x13\x40\x39\xdc\xd6\x76\x34\xaf\
+\x1c\x9f\x0d\xa2\x59\xc2\x77\x06\x3c\x4d\xdd\xd2\x3e\xe2\xff\xcf\
+\x04\x32\xed\xcc\x76\xb7\x48\x04\x7c\xe6\xbb\x0d\xa4\x8b\x48\x76\
+\x49\xe2\xac\x7e\x2d\x42\xe8\x26\x21\xea\x28\xd7\x53\x85\x84\xce\
+\x44\x85\xc0\x6b\x48\x68\xcb\xe7\xc0\xd9\xf9\x50\x07\xb6\xf6\xb1\
+\xa5\xee\x27\xb3\x0c\x26\x96\xf7\xa1\x82\xe4\xf7\xa8\x45\x2f\x6a\
+\x0d\x97\xac\x0b\xf5\xc2\x82\x12\xf9\x76\x08\x1f\x43\x3b\x20\xf5\
+\x70\x89\xe1\x3f\x10\x81\x75\x9f\x65\xb7\xd9\xda\x07\x55\xe1\xdd\
+\x10\x61\xa5\x30\x09\x62\x81\x21\xc1\xa1\x38\xda\x40\x27\x1d\xe8\
+\x87\x0e\xa1\xce\xd6\xe7\x45\x70\x09\x7b\x3d\x8c\x83\x8f\x2d\x04\
+\xa9\x5a\xc2\x7f\x8b\xc1\x0d\xb9\x6e\xa9\x11\x26\xdb\x7f\x09\xcf\
+\x44\xca\x4b\x04\x7f\xfe\x0e\xd8\x30\xf3\x44\xe8\x6f\x9a\x50\x46\
+\x25\x42\x14\x96\x37\xa1\xdd\x76\x08\xcf\x45\x02\x27\x71\xbd\x03\
+\xe5\x8a\x08\xfe\xc0\x0d\x42\x1c\x69\xab\x94\xa5\x42\x87\xb3\xc6\
+\x53\x8a\x04\xde\xb8\xf1\xe0\x48\xb9\x2b\x4a\x9a\x22\x4b\x6f\x84\
+\x86\x72\xb4\x93\x3e\x4f\x7b\x30\x88\xcf\x3c\xcd\x9b\xe0\xfa\x89\
+\x0c\x34\xfe\xcc\x2d\x42\x79\xbc\x82\xb1\x22\x11\xf2\xed\x1f\xe1\
+\x54\x8f\x8e\x4a\x57\x0c\x96\x3f\xe7\x59\xea\xd2\x16\xf8\x3d\xbd\
+\xc1\x13\xbe\xbe\x9d\xbc\x43\x10\xac\xff\x0c\x78\xae\xbd\xa5\x01\
+\xaf\xfb\x8d\x42\xba\x7e\xc1\xf0\xb2\xb3\x8a\x53\x9e\xd7\xbb\x42\
+\x99\x56\x09\xe9\x4c\x04\x7d\x5a\xa0\x9d\x76\x6a\x84\x01\x57\x7c\
+\x82\xe5\x10\xfb\xe0\xad\xed\x9c\x3a\x63\xed\x83\x5c\xdf\x7a\x8f\
+\xf0\x7b\x83\x10\x5c\x8e\x58\x74\x4e\x5b\x85\xfb\x9e\xb6\xe4\xcf\
+\xdb\x77\x7e\x1b\xd2\x5a\x5b\xed\x88\x60\xb9\xf7\x55\x1b\xd2\x0e\
+\x6f\xb3\x83\xa0\x7e\xe1\x3b\xcf\xd3\x2d\x79\x76\xc4\x3c\x86\x97\
+\x3b\x17\xd4\x42\xd5\xed\xf4\x37\x05\x48\xf5\x1c\xa1\xdc\xd1\xfa\
+\x1b\xcf\x77\xb1\xa5\x5c\x93\x3a\x50\xae\xe3\x1a\x85\xcf\xc0\xb9\
+\x60\x7d\x3d\x1c\xf4\x5a\x3e\xd0\x95\xbc\x0d\x2f\x94\x3f\xd3\xd6\
+\x2c\x87\x2c\xf7\xc5\x81\xae\x6a\x3c\x88\xd0\xa9\x90\x57\x03\x2c\
+\x1d\xbe\x80\xd8\xcd\xa1\x0e\xa6\xcf\x67\xd9\x05\xd0\xc1\x56\x41\
+\x10\x32\xf5\x04\xf5\x0e\xfc\x19\x37\xcc\x30\xa3\x60\x89\xf4\x96\
+\x25\x3d\x2c\xbc\xf8\x2b\x3a\x91\x3e\x03\xa2\x59\x05\x3a\x88\xa6\
+\x0e\x48\x3c\x22\x44\x5b\xb4\x2c\x38\xcf\x6f\x18\xbc\xab\x44\x90\
+\xbe\xea\x60\x66\x13\xcf\xf3\xeb\x4c\x5b\x3a\x60\x47\x6a\x1c\x2c\
+\xbf\x5e\x3d\xc9\xb6\xec\x05\x4b\x10\xb7\x10\xeb\x48\xdc\x41\xe6\
+\xe7\x2b\x96\xc2\x00\x73\xc3\xac\xce\xcf\x57\xfc\x54\x88\xc3\xdf\
+\xd6\x6c\xdd\xd1\x76\x8b\x05\x89\x65\x2c\xec\x7e\x71\xa5\x70\x03\
+\x48\x61\x2b\x21\xca\xa6\x2a\xbc\x1b\x37\xd4\x61\x30\x4c\x16\x4b\
+\x2d\x6d\xc2\xef\x1b\x0a\xd1\x3b\xea\xa0\xae\xb5\x51\xda\xee\x7a\
+\xd0\x43\xbd\x06\x36\x79\xed\xb5\xaf\xf8\xfe\x64\xc8\x67\x32\x90\
+\x78\x9a\x70\x9e\x40\x05\x94\xfd\x0b\xd0\x1d\x89\x6d\x76\x35\x8c\
+\x67\x63\xc5\xf2\x48\x27\xda\x8d\xb7\x77\x1a\xf4\xb7\x11\x60\x72\
+\x94\x08\x6d\x54\x0b\xef\xf4\x33\x81\xb0\xc5\xf6\x6e\x2f\xfd\x9b\
+\x81\x50\x5f\x84\x58\x74\x27\xa4\x2f\x6c\x6f\x16\x23\x27\xe8\x22\
+\xd2\x11\xe0\x6f\x6b\x1b\xb4\x0b\xe2\x44\xea\xd9\x99\xf6\xe9\xca\
+\x6d\x49\x3a\x51\xb6\x13\xe9\x6f\xd1\xd2\xf9\x36\xee\xfd\xae\xd0\
+\x99\x76\x10\xcb\x7f\x32\x6d\x87\x3b\xb1\x5a\xe9\x6c\x7f\x3b\xe1\
+\x72\xb5\x25\xba\x31\x61\x96\x26\x82\xf8\x76\xa2\x20\x02\x73\x8b\
+\x33\x14\x3e\x89\xb4\xc5\x46\x3a\x55\x46\x6a\x1d\x49\x93\x9c\x40\
+\x79\x79\xba\x9d\xf1\xa3\x8b\x06\x49\x98\x41\x99\x25\x7d\x7a\x12\
+\xef\xe9\x54\xb6\x27\xb6\x48\x08\x91\xca\x24\xda\x5c\x21\xa1\xaf\
+\xb1\x53\xd4\x4e\x56\x10\x21\x7d\x2a\x5c\x6b\xab\x0f\x8a\x36\x6b\
+\x6d\xf5\x07\x8e\xb6\x24\x8c\x93\x6d\x5f\x6c\x79\xcf\xe2\x35\x1a\
+\x25\xcd\x53\xf1\x4e\xad\x63\x57\x7c\xb7\x27\xda\xdf\xbe\x8d\xb1\
+\x6b\xc3\x86\x0d\x1b\x5d\x07\x5d\x51\xfc\xb5\x61\xc3\x86\x8d\x88\
+\xb0\x09\xcb\x86\x0d\x1b\xdd\x06\x36\x61\xd9\xb0\x61\xa3\xdb\xc0\
+\x26\x2c\x1b\x36\x6c\x74\x1b\xd8\x84\x65\xc3\x86\x8d\x6e\x03\x9b\
+\xb0\x6c\xd8\xb0\xd1\x6d\x60\x13\x96\x0d\x1b\x36\xba\x0d\x6c\xc2\
+\xb2\x61\xc3\x46\xb7\x81\x4d\x58\x36\x6c\xd8\xe8\x36\xb0\x09\xcb\
+\x86\x0d\x1b\xdd\x06\x36\x61\xd9\xb0\x61\xa3\xdb\xe0\x54\x1d\xa4\
+\x6a\xc3\x86\x09\xd3\x2b\x16\x87\x1d\x63\x19\x33\xfe\xd9\xb0\x71\
+\xea\x60\x4b\x58\x36\x4e\x29\x18\x42\x38\xd6\x29\xb1\x38\x27\x31\
+\xc8\xaa\x2b\x9e\x76\x64\xc3\x86\x8d\x1f\x3a\x80\x99\xa4\x78\x67\
+\x0c\x5a\xf5\xa3\x89\x73\x57\x5d\x35\x71\xae\xf1\x7f\xe3\x9a\xcd\
+\x5a\x36\x4e\x15\xbe\x8b\x43\x22\x6d\xfc\x00\xe0\x90\x88\x44\x19\
+\xd3\x7f\x77\xc6\x90\x31\x8b\x06\xe6\xbf\x99\x9f\x1c\xbf\xc0\x81\
+\x1d\x1f\x2f\xdf\x57\x55\x01\xbf\xd9\xab\x43\x1b\x27\x0d\x9b\xb0\
+\x6c\x9c\x34\x64\x82\x89\x46\x19\x5d\x5c\x9a\xdb\xff\x0f\x67\x14\
+\xbd\xe7\x0b\x29\xe9\x41\x45\x75\x8d\xcf\x8f\x9f\xb5\xaf\x29\xf0\
+\xfe\xa6\x9a\xd6\x3a\xe3\x1e\xca\x4e\x2a\x00\xa4\x0d\x1b\x36\x61\
+\xd9\x38\x39\x08\x64\x55\xf0\xec\x79\xc3\xde\x57\x74\x33\x5e\x3a\
+\xc5\x18\x33\x84\x70\xd2\xa2\xd2\xbc\xb3\x76\x37\x78\xdf\xda\x5c\
+\xeb\x69\xb1\x49\xcb\xc6\xc9\xc2\x26\x2c\x1b\x27\x0c\x82\x31\xd6\
+\x19\x63\x17\x95\xe6\xa5\x3d\x7b\xfe\x88\xf7\x7d\x8a\x3e\x90\x31\
+\xa4\x63\x6c\xea\xad\xb0\xf1\x7f\x85\xd2\xcc\xc5\x03\xf3\x26\xed\
+\x6d\xf0\xbc\xb2\xa9\xd6\x13\x20\x18\x61\x9b\xb1\x6c\x9c\x28\x6c\
+\xc2\xb2\x71\x42\x90\x30\xc6\x94\x31\x76\x59\xdf\x9e\xce\x67\x16\
+\x0c\x7b\xd5\xab\x68\x13\x11\x43\x1a\xc6\x47\x4d\x65\x30\x46\xc4\
+\xb8\xa6\x50\xd6\x63\xd1\xa0\xdc\xc1\xfb\x9b\x43\xaf\x6e\xaa\x69\
+\xd1\x25\x9b\xb4\x6c\x9c\x20\xec\x0d\x1c\x1b\x9d\x06\xc6\xa6\x8d\
+\x15\xea\x11\x1f\x83\xb6\x5f\x7d\xe6\xf3\xd8\x45\x2f\xd2\x74\xaa\
+\x11\x8c\x23\xda\xf5\x51\x86\x34\x99\x20\x99\xe1\x98\xe7\x07\xfc\
+\x63\xd9\xc5\x87\x5a\x7d\x47\xd2\xb0\x61\xa3\x33\xb0\x25\x2c\x1b\
+\x9d\x02\x10\x0d\xce\x89\x8f\x41\x2f\x2d\x1c\xfe\x50\x6e\x8a\xeb\
+\xaa\xb6\xc8\x0a\x9e\x21\xba\x41\x5a\x58\x1d\x32\xa1\x47\x4a\xfa\
+\x07\x7b\xea\x96\x7a\x14\x0d\x63\x7b\xba\xb4\xd1\x49\xd8\x86\xa3\
+\x36\x3a\x05\x30\x62\x47\x39\x09\x2e\x34\x30\x23\x21\x83\xea\x08\
+\xe9\x0c\xd1\xb6\xb8\xc7\x3c\x43\x8b\x31\x4a\x11\x41\x03\x33\x12\
+\x33\x73\xe2\x9c\xc6\x65\x86\x6d\x01\xdf\x46\x27\x61\xf7\x18\x1b\
+\x9d\x06\x01\xfd\xd5\xc0\xcc\x44\x79\xf9\xc5\x63\x5e\x49\x76\x39\
+\xe7\x07\x35\x5d\x95\x08\x76\x44\xba\x5f\x67\x4c\x8d\x75\xc8\x8e\
+\xc6\x40\xe8\xbd\xe9\xcf\xae\x3e\x7f\x4b\x9d\x47\xe1\x69\x7c\xf7\
+\xa5\xb7\xd1\x9d\x61\x13\x96\x8d\x13\x82\x4c\x30\xd6\x28\x63\x03\
+\xd2\xe3\xe3\x96\x5e\x3c\xf6\xed\x14\xb7\x63\x1a\xa5\x4c\x25\xf8\
+\x58\xd2\x62\x0c\xa9\x08\x23\x47\x63\x40\x59\x39\xe7\xc5\xb5\xb3\
+\xb6\xd5\x79\x3c\xfc\xd9\xef\xaf\xf4\x36\xba\x2b\xec\x25\xa1\x8d\
+\x76\x41\x30\x36\x3f\x22\x0c\xc2\x91\x09\x26\xdb\xeb\xbd\xbe\xf3\
+\x5e\xfa\x7a\x91\x93\x49\xeb\x29\x43\x0e\x86\x90\x26\xde\x16\xd2\
+\x35\x47\x62\x5c\xec\xd6\x07\xbe\xaa\xbe\xc0\x20\x2b\xa7\x44\x48\
+\x24\xb2\x92\xed\xa9\xd3\x46\x07\x60\x2b\xdd\x6d\xb4\x09\xc9\x24\
+\x2b\x24\x23\x8c\x08\x31\x57\x71\x47\x7f\xa3\x0c\x31\x89\x60\xa9\
+\xd2\x13\xf4\xa5\x93\x98\x65\x53\xfb\xa5\xcf\xf6\x04\xd5\x0c\x99\
+\x60\xf3\xd8\x77\x45\xa7\x72\x7a\x42\x4c\xf9\xff\xad\xd8\x39\xeb\
+\x0f\xab\xb6\x1f\x92\x30\x96\x34\xca\x8e\x3b\x96\xdc\x41\xb0\xac\
+\x63\x2c\x11\xd3\x74\xcb\x86\x8d\xe8\xb0\x09\xcb\x46\x54\x18\x42\
+\x15\x65\x88\x64\xc6\x39\xf5\x04\xa7\x44\x5b\x43\xba\x24\x11\x7c\
+\x8c\xe6\x89\x19\xa4\x85\xb1\xb4\xb4\xbc\xba\x29\x4e\x92\x3e\x3e\
+\xbb\x24\x7b\x81\x2f\xa8\x25\x1a\xcf\xa5\x25\xb8\xeb\xff\xfc\xe5\
+\xee\x59\xb7\x7f\xb2\x7d\x07\xc6\x48\xa2\x0c\xe9\xc7\xa4\x1f\xf6\
+\x8c\x96\x10\x21\x7a\x1f\xa7\x4c\x5b\x34\x1d\x33\x7b\xeb\xd0\x86\
+\x0d\x1b\x9d\x05\xf0\x86\x9c\xec\x72\xa0\x6f\xae\x9e\x7c\xe7\xde\
+\x1b\x27\x5d\x9d\x19\x67\x5a\x2e\x38\x64\x72\x2c\xa9\x84\x89\x07\
+\x9b\x93\xdf\x9f\xce\xec\x3f\x81\xfd\x66\x9e\x97\xfd\xf6\xdc\xc0\
+\x9f\xce\xea\x37\xc5\xb8\x66\x48\x61\x56\x1a\xc2\xa6\xc3\x74\x58\
+\xdf\x75\xf3\xd8\xde\x67\x07\x7f\x34\xe9\xaf\x79\x6e\xf3\x4f\x42\
+\x6c\xce\xb2\x61\xc3\x46\x47\x81\xc3\x24\x23\x1b\xff\xfb\x72\xd1\
+\xa4\xf9\xec\xee\xb9\x4c\xfb\xf5\x5c\x6d\xdb\xd5\x93\x16\x67\xb9\
+\x5d\xc8\x24\x2d\x1c\x9d\xb4\x1e\x9e\x39\xf0\x82\x87\x67\x0c\x5c\
+\x84\xe0\x5a\x24\xfe\xe1\x64\x75\xc3\xc8\xc2\x09\xec\xd7\x73\xeb\
+\x94\x7b\xe6\xb1\xaf\xfe\x67\xe2\x6d\x29\x61\xd2\xb2\x26\x6f\xc3\
+\x86\x09\xbb\x5b\xd8\x38\x0e\x32\x31\x75\x4d\xfa\xd5\xc3\x0a\x06\
+\xfd\x73\xf6\x90\x15\x9e\xa0\x9a\x6a\x2c\xe7\x52\x63\x9d\x6c\xfb\
+\xe1\x96\x4b\xa6\xbd\xb4\xe6\xa5\x1a\x5f\xd0\x20\x2d\x55\x13\xd6\
+\x87\x10\x6d\x94\x50\x86\x4c\x3d\x15\xc1\x88\x30\x66\xac\x2a\x8f\
+\x85\x41\x56\xaa\xce\xd4\x1b\x46\x16\x4e\x7e\x78\xf6\x90\x37\x5b\
+\x02\x4a\x0a\xd5\xa8\x96\x92\x1c\x2b\x7f\xb9\xa2\x6c\xf6\xc4\x4f\
+\x76\xbc\x2f\x49\x44\xa6\x3a\xd5\x6c\x9d\x96\x0d\x11\xb6\x0e\xcb\
+\xc6\x31\xe0\xd1\x17\xae\x1d\x59\x90\xf1\xe8\xdc\x21\x6f\x7b\x42\
+\x5a\x4f\x82\xb1\x2e\x11\x4c\x7c\xaa\x46\x0a\xd2\xe2\x16\xcc\x29\
+\xce\xdd\xfd\xc6\xd6\xaa\x4d\x2d\x9a\xea\x30\x15\xf1\xc7\x26\xc1\
+\x48\x78\x53\x11\x47\x21\x2b\x59\xd5\x99\x76\xf3\xe8\x5e\x67\x3e\
+\x34\x7b\xc8\xdb\x2d\x7e\x25\x09\x23\x44\x25\x09\x63\x7f\x50\xc5\
+\x7d\x0a\xd3\xa6\xd7\xf9\x95\xf7\xd6\x1e\x6e\xae\x31\x88\xd3\x8e\
+\xee\x60\x43\x84\x4d\x58\x36\x8e\x00\xa2\x2f\xe0\x82\xa4\x58\xf6\
+\xd6\xe2\xb1\x2f\xaa\x2a\x9d\x44\x19\xe3\x6e\x37\x58\xc2\x98\xf9\
+\x14\x1d\xe7\x27\xb9\xce\x9b\x5b\xd8\xab\xec\xcd\xcd\xfb\xb6\xb4\
+\x30\xea\x20\xe8\x58\x62\x62\x61\x37\xc1\xe3\x88\x86\x93\xd5\x2d\
+\x63\x7a\x4f\xfd\xcb\xac\xc1\x6f\x35\xfb\x94\x04\x62\x86\xa2\x31\
+\xcd\x6b\x0c\x8e\xd3\x43\x14\xc5\x2f\x18\x98\x33\xbe\xde\xc7\x5e\
+\x5e\x73\xb8\xc1\x6f\x47\x77\xb0\x21\xc2\x26\x2c\x1b\x26\xc0\x47\
+\x90\x64\xc4\x39\xe9\x6b\x0b\x47\xfe\x26\x27\xce\xf9\x63\x85\x52\
+\x5d\x3a\xd6\x47\x10\xcb\x18\x33\x8f\xaa\x4b\x3d\x52\xc8\xec\xd8\
+\xa0\xba\xe9\xbd\x8a\xa6\x32\x82\x31\x89\x44\x50\x22\x0c\xa9\x4b\
+\xa7\x48\xbf\x79\x74\xaf\x31\x7f\x99\x3e\xf0\x8d\x26\xbf\x92\x22\
+\x11\x6c\x86\xa2\x11\xca\x60\x2c\x21\x35\x55\xd3\xf3\xce\xec\x95\
+\xd3\xe3\xf9\x2d\x15\xaf\x37\x87\x54\xdb\xe7\xd0\xc6\x11\xd8\x84\
+\x65\xc3\xd4\x3d\x31\x84\x08\x41\x98\x7e\xb4\x60\xfc\xa5\xa3\x0b\
+\x93\xfe\xe6\x57\xa8\x26\x11\x53\x89\x7e\xdc\x06\x9f\x8c\x31\xf5\
+\x6b\xcc\x39\xaa\x24\x73\x56\x8b\x5f\xd9\xb0\xa6\xb2\x79\xaf\xa9\
+\xaf\x8a\x42\x5a\x06\xa1\x51\x86\xe8\xf5\xa3\x0a\x47\x3e\x34\x73\
+\xd0\x1b\x4d\x41\x35\xdb\x24\xab\x08\xfd\x2f\xac\x03\xc3\x9a\x83\
+\x68\x43\xc6\xe5\x25\xcb\xff\xd9\x72\xf8\x13\x83\x48\x71\x3b\x84\
+\x68\xe3\x87\x01\xdb\xd2\xdd\xc6\x11\x18\xac\x90\x9a\x24\xbb\x19\
+\xc6\x88\x1e\xe1\xb1\xc8\xb7\xca\x08\x69\xc1\xa0\x96\xfc\xf0\xb9\
+\xc3\x1e\x38\xbb\x57\x86\xd3\x20\x24\x29\x82\x2c\x24\x99\x06\xa6\
+\x8c\x9e\xe3\x76\xa0\x47\xa6\x0f\xfc\x63\x63\x50\xcb\x93\x30\x52\
+\x22\x91\x15\x80\xe9\x94\xa2\x18\xd9\x81\xd2\xe3\x5c\x2e\xe8\xa0\
+\x36\x59\xd9\x30\x61\x4b\x58\x36\x4c\x10\x8c\x99\xce\x18\x79\x6f\
+\x5f\xed\xfa\xf9\xbd\xb3\x0e\x65\xc6\xbb\xce\x0d\xa8\x1a\x92\x88\
+\x21\x38\x1d\x27\x65\x31\x95\x31\x29\xc9\x2d\x07\xee\x5d\x51\x76\
+\xe5\x93\x1b\x0f\xed\x81\xdd\xc1\xe3\x88\x85\x81\xd4\xb4\x5b\xa3\
+\x8c\x20\xb4\x63\x7a\xdf\xac\x05\x7e\x55\x8f\x97\x30\xa6\x11\xd2\
+\xa5\xaa\x4e\x69\x92\xdb\x21\xef\x6d\xf2\xff\x76\xfa\xf3\xab\x7f\
+\xd5\x1c\x54\x31\xc1\x76\xe8\x2c\x1b\x61\xd8\x84\x65\xc3\x04\x03\
+\xd2\x6a\x0a\xa8\xf2\xdb\x5b\x6b\xd6\xcf\xef\xdd\xeb\x40\x66\x96\
+\x7b\x9e\x2f\xa0\x60\x99\x60\x91\xb4\x58\x48\xa7\x34\x2d\xde\x4d\
+\x9e\xd9\x54\x71\xcd\x4f\x3f\xdc\xf6\xba\xa9\xc3\x02\x53\x86\x68\
+\xc9\x1b\x4b\xc6\x4f\xcb\x1b\x0e\x17\x61\xb4\x6f\x6c\x61\xc6\x85\
+\x1e\x8d\x52\x47\x58\x22\xe3\xe9\x1a\x64\xc5\x92\xdd\x0e\x79\x7f\
+\x93\xef\xce\xe9\xcf\xad\xfe\xdf\xf2\x96\x80\x44\x30\xa6\xc7\x6d\
+\x35\xda\xf8\xc1\xc2\x26\x2c\x1b\x47\xc0\xc2\x66\x0d\xb4\x51\x55\
+\x1d\x6f\xef\xae\xde\x30\x4f\xd1\xf6\xe4\x17\xa5\xcd\xf3\xa9\x54\
+\x22\x08\x9b\xbb\x79\x3a\x65\xba\x21\x01\x1d\x6c\x0c\xfc\xee\xc7\
+\xef\x6e\x7a\xb0\x21\xa8\xca\xe6\xe6\xa2\x90\x0e\xc1\x18\x4b\x18\
+\x13\x2a\x2c\xe5\xb0\x21\x25\x61\x24\x6f\x3b\xd8\xb4\xf5\x9c\x01\
+\x39\x81\x9c\x04\xf7\xf4\xa0\xc6\x74\x12\xde\x21\xa4\xaa\xce\x50\
+\x92\xdb\x21\xed\xaa\xf7\xdd\x32\xe3\xf9\xd5\x7f\x2e\x6f\x0d\xc8\
+\x46\x59\x74\x5b\xb6\xb2\x21\xc0\x26\x2c\x1b\xc7\xc0\x90\x66\x64\
+\x8c\x69\xa3\xa6\x38\x3e\xd8\x5f\xbb\xa9\x54\x67\x7b\x8a\xfa\x66\
+\xcf\xd3\x54\x5d\xa6\x08\xa9\x0e\x89\x38\x2a\x5a\x03\x2f\xcc\x7c\
+\x61\xf5\x0d\xbb\x9b\x7c\x86\x04\xa4\x8b\x1e\xd1\x86\xb4\x85\x10\
+\x33\xbd\x9f\x49\xf8\xe8\x1c\xf3\x47\x90\xe0\x68\x03\x65\xd2\xd2\
+\xbd\x75\x2b\xe7\x14\x67\xe5\x25\xb9\xa5\x51\x94\x61\x55\xa3\x94\
+\x24\xb9\x1d\xa4\xac\xd1\x7b\xe3\xcc\x17\x56\x3f\x74\xb0\x35\x68\
+\x90\x95\xa6\xd9\xa2\x95\x0d\x0b\x6c\xc2\xfa\x01\x82\xe0\xb0\x7f\
+\x5f\x38\x88\xde\xf1\x7a\x27\x6a\xee\xc6\x60\xda\x2c\x11\xf9\x3f\
+\xe5\x0d\x9b\xa9\x4e\x77\xcf\x2a\xc9\x9a\x1d\xd4\xa8\x3b\x46\x92\
+\xd7\x9d\xf5\xdc\xea\x45\xdb\xeb\x3d\x21\x99\x60\x24\x4a\x40\x4e\
+\x29\x6c\x74\xfa\xa3\xe1\x79\x69\xe7\x67\xc4\xc7\x7c\x5c\xe3\xf1\
+\xc9\xd2\xd1\xa3\xbd\x18\xf8\xdc\xd4\x07\x14\xfc\xd9\xc1\xa6\x8f\
+\xae\x1d\x59\x3c\x2e\xa8\x86\xfa\x24\xba\x9d\xe8\x40\xa3\x72\xc3\
+\x8c\x17\x56\xfd\xfd\x50\x4b\xa0\x4d\xb2\x92\x09\x26\x61\x52\xb4\
+\xf5\x5a\x36\x6c\xfc\x20\x00\xcb\x30\x13\x40\x00\x91\xef\x0b\x93\
+\x90\x69\x87\x75\xfb\xf8\xa2\xc5\xec\xde\x73\x77\xdf\x3d\xb1\x5f\
+\x3f\x78\xee\x98\xc9\x4e\x0e\x27\x82\x0b\x12\xdd\x52\xd9\x0d\xd3\
+\x3e\x64\xd7\x4f\xfb\xb4\x6f\x02\x38\x06\x12\x4c\x8e\xbd\xd7\x48\
+\x1a\xa3\xbb\xa6\x96\xe6\xb1\xdf\x9d\xbb\x6d\xe7\x8f\xcf\xbe\xa9\
+\x67\x42\x9c\xf9\x93\xd5\xb1\xfa\x68\x99\xf1\x31\xe9\x88\x75\xb0\
+\x61\xc3\xc6\x69\x08\xe0\x25\x92\x9f\xe8\x46\xcb\x2f\x19\x7b\xd5\
+\xdd\x93\x4a\x26\x23\x70\x74\x8e\x64\x92\xc0\x21\x61\x4c\x64\x82\
+\xe5\xd1\xb9\xc9\xc9\x4e\xc9\x64\x94\x63\x09\x28\xfc\xac\xd4\x23\
+\x31\x06\xed\xbc\xfe\x8c\xc7\x94\x3b\x67\xb3\xd6\x3b\x67\xb3\x1d\
+\xd7\x9d\xf1\x74\xcf\xa4\x18\x33\x4f\xd9\xc2\x8a\x18\x21\x62\x24\
+\x35\xa5\x20\x3d\xb9\x67\x62\x9c\x41\x6c\x44\x8a\x42\x56\x46\xd9\
+\xc2\xce\xd8\x08\x19\x65\x5e\x7e\xf1\x98\x1f\xe5\x87\xd3\xb5\x8d\
+\x4a\x7f\x60\xb0\x97\x84\x3f\x20\x38\xc2\xbe\x79\xf4\xb7\x53\x4a\
+\x26\x2f\x19\x5e\xf8\xfb\x09\x59\x09\x67\x9c\x55\xd4\xab\xf2\xab\
+\xc3\x0d\x3b\xeb\x7c\x41\xc9\x90\x6e\x22\xad\xc4\x18\x42\x0c\x63\
+\x8c\x0f\xb7\x06\x83\x28\x6c\x11\x7f\xe4\x2e\x83\x87\x74\xc6\xe4\
+\x1e\x49\x31\xfa\xf2\x4b\xc6\xfc\xa6\x38\x25\xfe\xd6\x56\x45\xd7\
+\x90\xce\x68\x6e\xbc\x7b\xd8\xec\xe2\x8c\xa4\xb7\x76\xd6\x7c\xd0\
+\x1c\xd4\x64\x8b\xdf\x21\x33\x88\x70\x7f\xb3\x3f\xe4\x51\x34\x23\
+\x7d\x1a\x29\x6a\xb2\xf1\x90\xce\x18\x2e\x49\x4b\xd2\x5f\x59\x38\
+\x71\xf6\xc5\xa5\xe9\x7f\x28\xce\x4d\x9d\x8c\x29\xdd\xb2\x6c\x6f\
+\x5d\xb9\xc3\xf6\x37\xfc\x41\xc1\x26\xac\x1f\x08\xc0\x4f\x90\xfe\
+\x6c\x5c\x71\xce\x5d\x13\x8a\xfe\xd2\xec\x0d\xb9\x35\xca\x58\xbf\
+\x0c\xf7\xcc\x73\xfa\xa4\xeb\x4b\xf7\xd4\x7e\x5d\xef\x57\x88\x21\
+\x41\xe9\x11\x0e\x87\x30\x48\x4a\xb6\x68\xd8\xcd\xed\x3d\x8c\xe4\
+\xde\x18\x6b\x1f\x5f\x3c\xfe\xba\x5e\x59\x89\x0f\xb4\x04\x34\xdd\
+\x58\x46\x12\x8c\x89\x4f\xa5\x5a\x4e\x42\xcc\x84\x39\x45\xd9\xfe\
+\xf7\x76\x56\xae\x6c\x52\xb4\x63\x38\x91\x86\xd3\x44\x0c\x31\x16\
+\x89\x28\x9d\x12\x21\x2a\x65\xb8\x38\x35\x96\xbe\x77\xd1\xa8\x6b\
+\x46\x64\xc7\xdd\xe9\x09\xea\x7a\x20\xa8\xb0\x29\x3d\xd2\x86\x07\
+\x1c\xec\xa3\x2f\xf6\x37\x7a\x6c\x7f\xc3\x1f\x0e\x6c\xc2\xfa\x01\
+\xc0\x90\x82\x28\x63\xb8\x38\x25\x1e\xbd\x78\xde\x88\xdf\x53\x4a\
+\x87\x61\x8c\x4d\x23\x27\x5f\x48\x53\xb3\x63\x5d\x53\xe6\xf7\xcb\
+\xce\x5c\xba\xb7\x6e\x55\xad\x2f\xa4\x3a\x04\x45\xb9\x08\x2b\xa9\
+\x80\xef\x9f\xfe\x7f\x93\x4b\x16\x4e\x2b\xcd\x7d\xa2\x31\xa8\x61\
+\x97\x64\xee\x0c\x9a\x0b\x35\x83\xb5\xbc\xaa\x4e\x0b\x52\x63\x67\
+\x24\x38\xc8\x9e\xb7\x77\xd7\x6e\xc2\x16\xbf\x43\x1a\xc5\x9f\xc7\
+\x28\x83\xaa\x33\xda\x37\x2d\xde\xfd\xd1\x92\xb1\xf7\xf6\x4c\x88\
+\xb9\xb2\x39\xa0\xf8\x0c\x42\x25\x04\x6b\x94\xb2\xcc\xa9\xbd\xd3\
+\xb3\x5f\xd9\x5e\xb9\xac\xc1\xaf\x62\xa3\x8e\x36\x69\x9d\xfe\xb0\
+\x09\xeb\x07\x00\x16\x16\x86\xd8\xbb\x4b\x46\x2f\x29\x88\x77\x5d\
+\x19\xd2\xa9\x87\x84\x83\xed\x19\xa2\x10\xf2\x6b\x34\x90\x11\xeb\
+\x1c\x39\xab\x4f\x46\x9f\xb2\x06\xed\xab\x03\x2d\xfe\x00\x63\x94\
+\xb4\xe5\x12\x83\x91\xe9\x3b\x48\xef\x9d\xd2\xf7\xcc\xeb\xa6\xf4\
+\x7d\xae\x35\xa4\xc5\x38\xc3\x06\xa6\xa2\x7e\xcb\x14\xb5\xfc\x8a\
+\x8e\x47\xe6\xa5\x4c\x77\x12\xbc\xfe\x93\x03\x0d\x7b\x30\x94\xa7\
+\xad\xb4\x09\x96\xe9\x59\xbd\x73\x93\x5f\x38\x77\xe0\x03\x05\x89\
+\x71\xb3\x5a\x15\xad\xd9\x25\x11\x88\xea\x80\x88\xc6\x58\xd0\xcd\
+\xc8\x80\x51\x79\x89\x0d\x4f\x6e\xac\xd8\xca\xda\x49\xd3\xc6\xe9\
+\x01\x7b\xa7\xe5\x34\x07\x84\x6e\xa1\xbf\x9c\x50\x54\x3a\x2a\x2b\
+\xf1\xda\x80\xa6\x07\x24\x7c\x74\xb7\xcd\x90\x86\x9c\x04\xcb\xde\
+\x90\xd6\x9c\x13\xe7\x3a\x73\xd9\xa5\xe3\x1e\xb9\x77\x72\xdf\x6c\
+\x66\xae\xf6\x22\x07\x78\x04\x27\x43\x2c\x11\x84\xe6\xf7\xcf\xec\
+\x27\x51\x96\xc4\x28\x53\x23\xf5\x27\x23\x0d\xc6\x90\x2a\x11\x1c\
+\x3f\xbf\x5f\x6e\x3f\x39\x2c\x09\x45\xd5\x95\x9b\xf7\x23\x44\x7f\
+\x33\xb9\x24\x6b\xd9\xa5\xe3\xfe\x9e\x1d\xe7\x3a\xc3\xab\xa8\xcd\
+\x46\x19\x99\x50\x1e\xa3\x0e\x01\x5d\xf7\x8f\xca\x4e\xbd\xee\x97\
+\x13\xfa\x94\xa2\xa3\x61\x6a\x6c\x9c\xc6\xb0\x5f\xf0\x69\x0e\xae\
+\x71\x3a\x7f\x40\xee\x08\x59\x96\x73\x35\xca\xb4\xe3\x1c\x03\x61\
+\xa7\x50\x67\xb8\xa5\xa1\xb5\x79\xd8\x1d\x53\x7b\xff\xfb\xa6\x91\
+\x05\x69\xc6\x6a\xcd\xba\xbb\x87\x8e\xfa\x07\xea\x3a\x45\x78\xfa\
+\x33\x6b\xff\xbe\xa3\xde\xf3\xbb\x94\x18\xa7\x43\xd5\xe9\x71\x69\
+\xab\x3a\xd3\x52\x63\x1c\x8e\x1d\x75\x9e\xfb\xce\x7e\x76\xd5\x43\
+\x1a\x63\xd8\xd4\xd3\x47\x28\xab\x91\x97\x91\xe7\x8d\xa3\x7a\xa7\
+\xde\x39\xad\xcf\xbf\x1b\x5b\x9a\x86\x1a\x65\x92\xc2\x64\x75\x0c\
+\xb0\x79\xd4\x18\xd2\x1d\x0e\x29\x6f\x41\x69\xfe\x48\x64\x1b\x66\
+\xfd\x20\x60\x13\xd6\x69\x8e\x70\xe0\x05\x84\x67\x3e\xbb\xe6\xe9\
+\xf5\x87\x1b\x7e\x9b\x12\xe3\x88\x0b\x6a\xe6\x72\xef\x38\xdf\x3f\
+\x82\x11\x76\xcb\x84\xe9\x41\x47\xc5\xe7\x87\x3c\xad\x28\x82\xde\
+\x8a\xc3\x20\x07\x83\x5f\xaa\x7d\x21\x72\xf6\x73\xab\xef\xde\x5e\
+\xd7\xfa\xf7\x94\x18\xa7\xac\x52\x76\xe4\x5c\x42\x4a\x99\xe6\x8e\
+\x71\xc8\x5b\xea\x5a\x1f\x9f\xf1\xdc\xea\x3b\x6b\x7c\x21\x62\x3c\
+\x13\x8d\x58\x78\x5e\x9f\x1f\x6c\x6a\xd5\x02\xf2\x21\x97\x2c\x31\
+\x12\xf9\x3c\x7b\x3d\xa8\xe9\x52\x4a\xac\x1c\xb7\xa1\xaa\xf9\x9e\
+\x19\xcf\x7c\xf5\x5f\x30\x71\x68\xcb\x9f\xd1\xc6\x69\x00\x5b\x87\
+\xf5\x03\x00\xc1\x08\xf9\x55\x1d\xbf\xb6\xa3\x6a\xd3\xb4\xbe\x99\
+\xe5\x45\x19\x49\x53\xfd\x01\xd5\x41\x08\x56\xf1\xd1\x49\x8b\xaa\
+\x3a\x73\xc7\x3b\x49\xf5\x6f\xbe\xdc\xf7\xd3\x97\xb7\x1f\x6c\x31\
+\xc8\xa2\x2d\x93\x01\xf0\x3d\xc4\xad\x21\x0d\xbf\xb1\xb3\xfa\xbd\
+\x19\xbd\xd3\xfb\x65\xc6\xb9\x06\x6b\x61\xd2\x62\x44\x96\x64\xb9\
+\xc1\xfb\xf6\x94\xe7\xd6\x5c\x56\xee\x0d\x71\x13\x85\x36\xd3\x33\
+\xf2\xac\xf6\x06\xa9\x8e\xc9\xfa\xe9\xbd\x53\xce\x0e\xa8\x34\x49\
+\xc2\x58\xe3\x4e\xd2\x0c\x21\x4d\xa3\x34\x26\x25\x31\x41\xf9\xba\
+\xd2\x7b\xc7\xcc\xe7\xbf\x7c\xa3\x21\x00\x11\x1d\x6c\x09\xeb\xb4\
+\x87\x4d\x58\x3f\x00\xc0\x92\x0f\xfb\x54\x2a\xbf\xbf\xbd\x66\x67\
+\x6e\x6b\xe0\x9b\x01\xc5\x59\xe3\x99\xce\x92\x10\x42\x0a\xc6\x88\
+\xa8\x3a\x45\xc9\x89\x31\xec\xc9\xad\x95\xbf\xbc\x6d\xd9\xe6\xed\
+\x0e\x82\x25\x5d\x88\xc0\x60\x10\x09\x58\xb7\x1f\xc3\x0b\x06\xa1\
+\x39\x09\xc6\x2d\x21\x8d\x35\xed\xad\x7f\x77\xf1\xc8\x5e\x23\x7d\
+\x8c\x95\x20\x8a\x48\x52\x2c\x5e\xf1\xf3\x77\x37\x2e\x7c\xbf\xaa\
+\x35\x24\x83\xdb\x8e\x58\x2e\x63\xb5\x69\x75\x11\x62\x60\x2f\xf6\
+\x59\x79\xad\xa7\x20\x39\x6e\xff\xf8\x9e\xe9\x33\xfd\x41\x95\x49\
+\xa6\x68\x66\xac\x02\x59\x6c\xbc\x4b\xae\xbc\x65\xd9\xd6\x1b\x6f\
+\xfd\xb0\x6c\x55\x73\x30\x24\x4b\x04\x47\x34\x8b\xb0\x71\xfa\xc1\
+\x26\xac\x1f\x08\x60\x09\x47\xfd\xba\x2e\xbf\x52\xd1\x54\x51\xe7\
+\x0b\x7d\xb5\xa0\x7f\xf6\xa8\xa0\xce\x72\x18\x62\x3e\xb7\x4c\x92\
+\xb6\xd5\x79\x9f\xb8\x66\xe9\xb6\x57\x5a\x02\x0a\x41\xe8\xa8\x91\
+\x27\x31\xed\xc9\xc3\x76\x5c\x18\x63\xf3\x4f\x91\x1f\xf4\xb0\x3d\
+\x95\xb4\x39\xa0\xa8\x8d\x8a\xf6\xfe\x82\xbe\xd9\xb3\x63\x9c\x52\
+\xf3\x8d\xcb\xb6\x9e\xf3\xd0\xa6\xca\x66\x38\x85\xe7\x38\xb2\x32\
+\xbe\x8c\x34\xc3\x65\x13\x6d\xa9\xcc\x13\xa0\xc9\xc6\x9a\xd6\xf2\
+\x69\x05\x69\xee\x9c\x78\xd7\x78\x95\x32\x2f\x43\x28\x31\xc1\x25\
+\x97\x5d\xfb\xc1\x96\x1b\xff\xf1\x75\xf9\x6e\x9d\x69\x32\x42\x38\
+\xd2\xc9\xf7\x36\x6c\xd8\xe8\x46\xc0\x51\x74\x3f\x26\x51\x38\x25\
+\x62\x4e\x54\x3f\x19\x51\x90\xc9\xee\x99\xf7\x8c\xff\xf6\x99\x87\
+\x43\xbf\x9c\xfd\xdf\xfe\xe9\xf1\x8e\xf0\xb3\x47\x15\xed\x0e\x29\
+\xfc\xff\xcb\x87\xe4\xe6\x6c\xbe\x7a\xf2\x85\xfd\xd3\xe2\x11\x37\
+\x57\xb0\xa6\x0d\x21\x95\xd1\xcf\xc7\x15\xf5\xbd\x7d\x5c\xef\xfe\
+\x08\xa4\x25\xeb\x7d\xe0\x2f\x48\x06\x25\x24\xa3\x4d\xb3\x86\xcc\
+\xfd\xf5\xd4\x7e\xa5\xf0\xbc\xe0\x2b\x18\xf6\x4d\x34\xca\x14\xfa\
+\xd5\xec\xff\xfa\x6f\x9f\x59\xc9\x7e\x3d\xf7\xe9\x1f\x8f\x28\x48\
+\x47\x61\xa3\x52\x29\x92\x0f\x24\x06\x69\x10\xd9\x3b\x86\x36\x6c\
+\x74\x0b\xf0\x51\x8c\xcd\xe3\xb6\xa2\xdc\xe4\x90\xc2\x44\x72\xe5\
+\xf0\x9e\x89\xec\xf7\x0b\xef\xbf\x65\x54\xef\x81\xc8\x24\x13\x22\
+\x92\x86\x99\x4e\x9f\x94\x38\xb4\xe7\xfa\x33\xfe\x8f\xdd\x73\x6e\
+\x45\xf9\xcd\x67\xdf\xda\x3f\x3d\x01\x45\x23\x2d\x70\x50\xc6\xf0\
+\xfb\x71\xa4\xc1\xc9\x6a\x40\x46\x2c\xaa\xfc\xe9\x9c\x4b\xd8\xaf\
+\xe7\xed\x61\xbf\x5d\xf0\xea\xff\x0c\xeb\x6f\x26\xea\x14\xce\x7d\
+\xe6\xcf\xdf\x3a\xba\x70\x20\xbb\x6f\xe1\x7d\x57\x8e\x28\x4c\x0c\
+\x97\x9d\x44\x5c\x19\x1c\x21\xab\xe3\xdb\xc2\xc6\x69\x02\xfb\x85\
+\x9e\x5e\xc0\x0e\x49\x66\x1f\x2c\x39\x63\xc4\x3d\x2b\xd6\x55\xad\
+\x3c\xd4\x5c\x69\x2c\xc7\x18\x65\xba\x1e\xe1\x66\x09\x63\xc2\x30\
+\x62\xc5\xe9\x09\x6c\x6f\xbd\xc7\x58\xf2\x1d\xf1\x13\x04\xeb\x78\
+\xd2\x2f\x2d\x81\x2e\xbf\x64\xfc\x4f\x73\xe3\xe4\x6b\x1b\xfd\x4a\
+\x63\x4a\xac\x33\xbd\x2e\xa0\x3e\x77\xf6\xb3\xab\xee\xdd\x5a\xe7\
+\x31\x5d\x6b\xac\x6b\x32\x4e\x5a\x1a\x65\xba\xe5\xba\x71\x0d\x0d\
+\xc8\x4c\x64\x1f\x5d\x3a\xee\xe6\x4c\x17\xb9\xb6\x29\xa0\x35\xc7\
+\x3b\xe5\xe4\x1a\x5f\xf0\xdd\xe9\xcf\xaf\xbb\x6d\x57\xa3\x97\x10\
+\xc1\xaf\x10\x63\xf3\x78\x31\x54\x94\x9e\xc0\xf6\xd4\x7b\x31\x62\
+\x14\xeb\x11\xa2\x9b\x9a\x96\xee\x0c\x49\x0c\x31\xfd\xd1\x73\x27\
+\xf4\x1b\xe4\x69\x4a\x9f\xfc\xc9\xf6\x95\xba\xb9\x7e\xb5\xd7\x8c\
+\xa7\x0b\x6c\x1d\xd6\x69\x02\xf0\x2c\x66\x17\xf6\xcf\xce\xb8\x7d\
+\x72\xaf\x27\xcf\x2b\xce\x3a\x33\x25\x16\xaf\xfd\x70\x6f\x63\x23\
+\xe8\xdc\x8f\x1b\xb5\x0c\x1c\x90\xeb\xbd\x21\x6c\xda\x04\x08\x3b\
+\x82\xc6\xf2\x8c\x32\x44\x1f\x98\x31\x70\xf6\x94\x5e\xa9\x77\x34\
+\x79\x15\x4f\x8c\x53\x92\x02\x2a\xf5\xa7\xb8\xe4\x31\x0b\xfb\xe5\
+\x65\x2d\xdd\x5b\xfb\x69\x8d\x2f\x84\xac\x5e\xcd\x46\x3a\xd6\xdd\
+\xc5\x23\x64\x95\x91\xc0\x96\x5f\x36\xfe\x8e\x2c\xa7\x74\x8d\x47\
+\xa1\x2d\x6e\x89\x10\x55\x67\xc1\x8c\xf8\x98\x21\xf3\x8b\x53\xd5\
+\xa5\xeb\xcb\xbf\xae\x67\xc8\x10\xf3\x8e\x94\xd7\x28\x5c\xbd\x37\
+\x64\xc8\x5e\xd1\xc8\x0a\x33\xc4\x4c\xcb\xfb\x47\x66\x0e\x1a\x73\
+\xed\xc8\xdc\xbf\xf7\xe8\x95\x32\x79\x47\x7d\xeb\x3b\x5b\x6b\xbd\
+\x01\x6b\xf9\x6c\x74\x5f\xd8\x84\x75\x1a\x00\x83\x34\xd4\x27\x35\
+\x8d\x3d\x35\x67\xe8\xad\x6e\xac\x8f\xc5\x0c\x27\x4e\x2b\xc9\x99\
+\xd3\xd3\xed\x28\xdf\xba\xa7\x76\x6f\x23\x46\x44\x8a\xe0\x6f\x07\
+\x0e\xc8\x4c\xa7\x62\xd4\x50\x44\x0c\x62\xf8\xfd\xb4\xbe\x25\x37\
+\x8d\x28\x7c\xb0\xd9\x1b\x22\x4e\x99\x98\x71\xfd\x4c\x0b\x73\x8d\
+\xfa\x92\xdd\x8e\x51\x0b\x07\xe6\x66\x2f\xdb\x53\xbb\xa2\xda\x17\
+\xa2\x10\x5d\x34\x22\x20\xa2\x83\x41\x56\x68\xf9\xa5\xe3\xef\xc8\
+\x72\xc9\x57\x79\x14\xbd\xd1\x01\x92\x98\xf1\xac\x4f\xd1\x43\xd9\
+\xf1\x31\x63\xe3\x25\x69\xfb\x5b\x07\xea\x0f\x60\xe1\xd8\x30\x83\
+\xb9\x8c\x32\x5a\x25\x39\x0c\xd2\x9c\xce\x18\x1e\x95\x93\x41\x97\
+\x5d\x3c\xf5\xe2\x73\xfa\x24\xdd\xdf\xea\x53\x65\xc4\x50\xca\xe8\
+\xd4\x04\xc7\xfb\xdf\x94\xaf\xac\xb7\x8f\x09\x3b\x6d\x60\x13\xd6\
+\x69\x00\x29\xec\x50\x4c\xff\xf7\xcc\x01\xc3\xa6\x17\x67\xfc\xd2\
+\x17\x50\x0c\x91\x29\x14\x08\x6a\x31\xe3\xf2\xd3\x66\x5f\xd8\x3f\
+\x8b\x7d\x5c\xdd\xbc\xae\xaa\x35\x64\xea\x9d\xac\xa2\x96\x28\x7d\
+\x70\x13\x83\x41\x99\x09\xc9\x4f\xcd\x19\xfa\xa0\xa2\xea\xf9\x98\
+\xe0\xa0\x78\x2c\x97\x91\x5f\xd0\x20\x2d\x97\x63\xc4\x05\xa5\xb9\
+\xf9\x2b\x0e\xd4\xaf\x3c\xec\x09\xaa\x91\x48\x0b\x96\x96\x68\x78\
+\x4e\xb2\xf4\xe1\xa5\xe3\xef\xca\x74\x4a\x97\x7b\x14\xbd\xc9\x71\
+\x54\xd7\x85\x40\xdf\xc5\xbc\x1a\x95\xc6\xf5\xcd\x1d\x5b\xd1\x1c\
+\x58\xb9\xa1\xba\xa5\x51\x26\x47\x9d\xb0\x8f\x73\xbc\x06\x29\x50\
+\xa3\x8c\x0e\xcf\x4e\x72\x2d\xbd\x68\xd4\x5d\xbd\x92\xe5\x1b\x5a\
+\x83\x5a\xc0\x21\x61\x4d\xd1\xa9\x96\x93\x1c\x5b\x2a\x13\xba\xe6\
+\xfd\x03\x8d\xd5\x52\x07\x0e\x7b\xb5\xd1\xf5\x61\xef\xa4\x74\x73\
+\x80\xf4\x42\xfb\xa7\xc7\xa3\x45\xfd\x52\xaf\xf3\x78\xfd\x0e\x87\
+\x44\x28\xc1\x48\x76\x10\x1c\x6a\x08\x2a\x9e\xe4\xf4\xc4\x9b\x3e\
+\x5a\x3c\xe6\x4f\x23\x72\x92\xe3\x0d\x29\x05\xb7\x19\xac\x2f\x4c\
+\x22\x73\xfb\xe6\xf6\x73\xc5\xba\x4a\x03\x9a\x1e\xc2\x11\xfa\x89\
+\x93\x60\xd2\x1a\x50\x3c\x59\x09\xee\xc9\xa5\x59\x09\x99\x08\x0c\
+\x54\x8f\x2f\x5f\x38\xbd\x81\x19\x09\x49\x59\x2e\x69\x6a\x4b\x50\
+\x0b\x38\xc9\x31\xa7\xe5\x70\x60\x46\x59\x10\x21\xd6\x33\x2b\xde\
+\x61\xee\x1a\x46\xf3\x65\xe4\xf7\x1b\x64\xf5\xe0\xcc\x31\x79\x2b\
+\x2e\x9b\xf8\xaf\x38\x07\x5e\xd4\xe4\x57\x0d\xa9\xcd\x34\x3b\x73\
+\x10\xac\x7b\x14\xcd\xb5\x78\x6c\x9f\x6b\x0c\xc9\xce\x68\xa3\x68\
+\x91\x55\x6d\x74\x1f\xd8\x12\x56\x37\x07\x0f\xd7\x72\xcf\xa4\xe2\
+\x39\x53\x0a\x32\xae\x08\x6a\xba\x1f\x22\x31\x20\x1e\xe9\x53\x55\
+\x75\xbf\x4b\x96\x07\x5d\x3e\x24\x7f\x74\x66\xbc\x63\xdd\x07\x7b\
+\xea\x5a\xa2\x91\x01\x28\xdd\xc9\xa6\xea\xd6\x43\x53\xf3\x53\x2b\
+\x4a\x32\xe2\x67\xf8\x43\x1a\x93\xc8\x31\xe7\x08\x1a\x4b\x48\x9c\
+\x1c\xef\x76\xaf\x69\x6a\xfd\xf9\xcd\xef\x6f\xf9\x86\x51\x33\xd4\
+\x4c\xc4\x90\x34\x86\x24\xb4\xb1\xba\xc5\x9f\x1e\xe7\xde\x31\xa5\
+\x24\x6b\xae\xcf\xaf\x60\xc9\x72\x74\x98\xaa\x53\x94\x9a\xe0\x4a\
+\x5e\x7d\xa8\xfe\xc1\x9b\x3f\xd8\xf6\x5c\x48\xa7\xa6\x13\x74\xc4\
+\x3a\x87\x1d\xa4\xd9\x23\xb3\x06\x0c\xbf\x69\x4c\xc1\x23\xa1\xa0\
+\x5a\x42\x19\x6a\x75\x4a\xd8\x21\xa4\x49\x74\xca\x42\x29\x4e\x47\
+\x6f\x82\xc9\xc1\xf7\xf6\xd4\xec\xb6\x86\xb6\xb1\xd1\xfd\x60\x13\
+\x56\x37\x87\x31\x00\x1d\x12\x41\x8f\x9f\x3b\xec\x01\x27\x62\x59\
+\x94\xb1\x00\xc6\xc7\xd8\x3e\x61\x42\xb0\xa4\x53\xe6\xa7\x94\xe5\
+\x4f\x2d\xc9\x9d\xee\x0b\x6a\x1f\x7e\x55\xd1\xe8\x89\xa6\x8c\xc6\
+\xd8\x3c\x7b\x50\x7a\xbd\xac\xaa\x6c\x4a\x8f\x94\xaa\x3e\x19\x09\
+\x67\xf9\x8d\x0b\x40\x32\x86\xb4\x12\xe3\x20\xc9\xdf\x54\x37\xff\
+\x7d\xee\xb3\xeb\x5e\xf4\x86\x34\x43\xb8\x8a\xae\xd7\x06\x12\xdc\
+\x50\xd5\x72\x78\x72\x8f\x94\x60\xcf\xd4\xf8\x33\x15\x55\x0f\x82\
+\xad\x95\x49\x56\xc9\x71\xae\xc4\xd5\x87\x9b\xfe\x3a\xeb\xf9\xb5\
+\xff\x6c\x0e\x69\x51\xf7\xf6\xf8\x32\xf1\xf6\x71\x45\x7d\x7f\x35\
+\x65\xc0\x7f\xea\x9b\xfd\xf1\xb2\x44\xfc\x12\x31\xc9\xea\x18\x50\
+\x86\x74\x82\x50\x72\xaf\xd4\xb8\x94\xbf\xad\xdd\xff\xba\x6e\x5b\
+\x98\x76\x7b\xd8\x4b\xc2\xee\x0f\x73\xf7\xed\x3f\x1b\x0f\xfd\x81\
+\x62\x5c\x2e\x11\x9c\x62\x35\x27\x30\x60\x90\x96\x2c\x11\xe4\xf1\
+\x05\x76\xbf\xb3\xab\xba\x16\xb5\xe3\xd8\x2c\x13\xac\x37\x87\x54\
+\xc7\xcc\x17\xd6\xbc\xf1\xc5\x81\xba\xbb\x92\xe3\xcd\x68\x0c\x86\
+\x84\xa2\x3a\x25\x92\xa4\x61\x69\xe9\xc2\xd7\x36\x3c\x52\xeb\x0b\
+\x4a\x12\x16\xad\xe2\xc3\x65\x02\x3b\xb0\x70\x7a\x70\xc4\x57\x8d\
+\x2f\x24\x5d\xf8\xdc\xda\xff\x2a\xd5\x2d\xaf\xc8\x4e\x39\x89\x31\
+\xa6\x01\x59\x25\xac\x3c\xd8\xf0\xa7\x19\xcf\xad\xfe\x67\x73\x48\
+\x35\x0f\xa2\x68\xc3\x41\xda\xfc\xe5\xed\x5d\xd5\x7b\x3c\xc1\xe0\
+\xba\x58\x87\xec\xc0\xf8\xb8\x89\x97\x19\xcb\xc5\x58\x97\x23\x4d\
+\x76\x4a\x5f\xdd\xb0\x74\xf3\xdd\x46\x3e\xc4\x8e\x00\xdf\xed\x61\
+\x4b\x58\xa7\x01\x8c\x81\xf8\xd1\xbe\xba\xc3\x7b\x1b\xbd\x1f\x2d\
+\x1e\xd4\xb3\x50\x22\x78\x40\x48\x33\x25\x18\xbe\xec\x62\x94\x32\
+\x29\xde\xed\x08\xfd\xfc\x93\xb2\x5f\xbe\xbf\xbb\xa6\x96\x60\x43\
+\x52\x61\x60\x73\x85\xf0\x31\xac\xc3\xcf\x27\x24\x98\x86\x74\xea\
+\x78\xa5\xac\x7a\xfb\x84\x82\xb4\x9a\xbe\x19\x09\x67\x7a\x82\x5a\
+\x4c\x8c\x93\xec\xbb\x79\xf9\x96\xdb\x3e\xde\xdf\xe0\x73\x10\x8c\
+\x35\x41\x16\x62\x98\x87\xcb\x0a\xc7\xcc\x3a\x72\x3d\x6c\xf0\x89\
+\x1a\x55\x0d\xd7\x06\x95\x75\x0b\x06\xe7\x8f\xf6\x05\xb5\x82\x94\
+\x78\x97\xf3\xab\x43\x8d\x7f\x9b\xf5\xe2\xda\xc7\x3c\x8a\x26\x4b\
+\x18\xeb\xd6\xdd\x40\x12\x3e\x84\x02\xf3\xe8\xa4\x46\xd9\xeb\xfd\
+\x0a\xf5\xaa\xda\xbe\xb9\x25\x39\xb3\x43\xaa\x2e\x0b\x75\xa5\x8a\
+\x4e\xe5\xe4\x58\x67\xdc\x96\xba\xd6\x67\x7e\xbc\x74\xcb\xaf\xde\
+\x2c\xab\xae\x0b\x6f\x26\xd8\x12\x56\x77\x87\x4d\x58\xa7\x01\x8c\
+\x51\xe8\x96\x25\x79\x63\x4d\xab\x67\x73\xad\xb6\xac\x34\x3d\x0e\
+\x17\x24\xbb\xc6\xfa\x54\x8a\xa4\x70\x18\x76\x96\xe0\x92\x13\x37\
+\xd4\x7a\x9e\xb8\xe6\xbd\xcd\xef\x52\xc6\x24\x1e\x5e\x86\x84\x0f\
+\x95\x30\xc9\xc0\xea\xce\x03\xfa\x27\x93\xb4\x5e\xdb\x51\xbd\x6d\
+\x5c\x6e\x4a\xf3\x80\xe2\xf4\x51\x8f\x7c\xb9\xfb\x67\xbf\xff\x62\
+\xef\x1e\x87\x84\x25\x15\x7c\x04\xa5\xb0\x54\x44\x46\x16\xa6\xb0\
+\x0f\x16\x8e\xbe\xfe\xca\x91\x79\x63\xd6\x57\x35\xaf\xad\xf2\x28\
+\x44\x82\x8d\x49\x83\x87\x64\x82\xa5\xaf\x6b\x3d\xc1\xca\xd6\xc0\
+\x96\x0b\x47\x15\xce\x5a\xb9\xb7\xf6\x89\xd9\x2f\xae\xfd\x47\x24\
+\xb2\xe2\x96\xeb\x26\x51\x31\xf3\xb8\x7b\xbe\x0b\x69\x2a\xd6\x37\
+\x54\xb5\xd4\xce\x2e\xc9\x8e\x2d\x4c\x74\x4f\x0c\xe9\x34\x60\xea\
+\xed\x11\x8b\x4d\x4e\x8e\x0f\x7d\xbc\xaf\xe6\x9e\x19\xcf\xad\x79\
+\x7c\x6b\x4d\x2b\x73\x4a\xe4\x38\xc7\x6b\x1b\xdd\x13\x36\x61\x9d\
+\x26\x30\x06\xa4\x53\x22\xd2\xb6\xba\x46\xf4\xec\xd6\x43\x5f\x8d\
+\xca\x49\xdd\x5f\x9a\x9d\x38\x21\xa8\xea\xb1\x9a\xce\x48\xac\x53\
+\xde\x77\xd7\x8a\x5d\xbf\x5e\x5f\xd5\xac\xf0\x93\x20\x38\x19\xf4\
+\x4f\x8b\xcf\x3b\x67\x60\x56\xe2\xf6\x5a\x6f\xab\x4e\xd9\x31\xe1\
+\xd1\xb9\xa4\x15\xd0\x74\x69\xd9\xde\xda\xed\xb1\x3a\x5d\xfe\x7f\
+\xab\xf7\x96\xb5\x84\x74\xc4\x95\xe2\x38\x1c\xee\x53\x72\x31\x44\
+\x57\x4c\x1f\x78\x51\x49\x51\xc6\x4f\xf3\x9c\xf2\xc8\xb3\x8b\x7b\
+\xb7\x3e\xb6\xfe\xc0\x66\x95\xea\x47\x4c\xc0\x4c\xe2\x41\x88\xec\
+\x6a\xf2\x37\xc4\x13\xe9\x93\x9b\x97\x6d\x5d\x51\x1f\x50\x99\x91\
+\xc7\x71\x64\x05\xfa\xaa\xa1\x59\x49\xd9\xd3\x0a\xd2\x52\xb7\xd6\
+\x79\x5a\x84\x78\xf1\x46\x9d\x91\xaa\xe8\xdb\xe7\xf7\xcb\x9e\xea\
+\x55\xf4\x54\xa7\x4c\x62\xb1\xc4\xca\x9f\x5a\xdf\x70\xd3\x35\x4b\
+\x37\x7e\xde\x1a\x54\x1c\x2e\x89\x18\x12\x97\x4d\x56\x36\x6c\x7c\
+\x5f\x30\x18\xc5\x58\x8a\x45\xda\xa6\x97\xc2\x81\x15\x48\x12\xc6\
+\xe8\x2f\xfd\x73\xfa\x34\xde\x31\xeb\x15\x76\xdf\x82\xfd\x7f\x9b\
+\x39\x70\x1a\x12\x0e\x40\xe5\x7e\x82\xa5\x19\x89\xe8\xf0\xcd\x67\
+\x3d\xc6\x1e\x58\xb0\xe2\x5f\xf3\x87\x95\xc0\x6f\x52\x24\x6d\x8f\
+\x20\x81\x1d\xf9\x15\x83\x5d\x96\xf1\xff\x7f\x9c\x33\x78\x3e\xbb\
+\x6b\xee\xd6\x96\x9f\xcd\xf8\xba\xe5\xb6\x19\xeb\xd8\x9d\xb3\xb6\
+\xfe\xf3\x9c\x81\x0b\xa0\x5c\xc7\x58\x3d\xf0\x3f\x48\x84\xed\x4a\
+\x33\x68\x3b\x6c\x1c\x3c\x36\x77\x42\x7e\xf0\x97\xf3\xde\xd1\xee\
+\x9a\xf3\xf2\xb0\xec\x24\x17\xa4\x85\xc5\xba\x3c\x34\xa3\xf4\x6c\
+\x76\xff\x82\xfd\xfe\x5f\xcd\xfe\xdb\xf9\xfd\xb2\x93\x51\x84\xc3\
+\x5b\x85\xb6\x8b\xe8\x03\x69\xa3\x7b\xc0\x96\xb0\xba\x21\x70\x38\
+\xa4\x8b\xa9\x23\x92\x0d\x29\x49\xf8\x8d\x2f\x99\x74\x82\xc9\xd2\
+\x3a\x4f\xc3\xce\x7a\xef\x67\x7e\x7f\x70\xff\x6f\x3f\xdf\xf5\x81\
+\x57\x31\xf7\xc9\xb8\x7e\x89\xc8\x44\x66\x5f\x5c\x79\xd6\x65\x05\
+\x09\x64\x49\x63\x43\xc0\x39\xa9\x30\xfd\x9c\x9e\x49\xee\xb2\x37\
+\x77\x56\x1f\x34\x09\xc3\x62\x18\x0f\x01\xfb\x8e\x51\xd6\x63\x84\
+\x24\x8a\x10\xfd\xc7\xcc\xd2\x33\xae\x1d\xd3\xfb\x3e\x8f\x5f\xd1\
+\x8d\x65\xa4\xc1\x09\x21\x9d\xb1\x09\xbd\x33\xa6\x66\xc7\x38\x77\
+\xbd\xb3\xbb\x66\x1f\x18\x9f\x32\x31\x2d\x6b\xac\x64\x1c\x36\xd5\
+\x90\x28\x63\xfa\xe3\xb3\x07\x0f\xbc\x7a\x54\xfe\x3f\xfd\xfe\x40\
+\x1e\xc1\x38\x67\x5a\x71\x06\xf9\xd7\xd7\xe5\xab\x75\xc6\xc2\x47\
+\xd5\x43\x5d\xbe\xa9\x6e\xad\x4c\x73\x93\x9d\x0f\x7c\xbd\xef\xdf\
+\xaf\x6d\xa9\xf2\x38\x24\x72\x5c\xcc\x19\x71\x79\x69\x9f\x63\xd8\
+\x7d\x61\x13\x56\x37\x02\x5f\xab\xf5\xcf\xc8\x94\x2e\x1b\x92\xdb\
+\x97\x39\x42\x4d\x07\x9b\x54\x6a\x48\x13\x56\x1b\x28\xd3\xe5\x06\
+\x23\xbc\xbd\xde\xeb\x7b\x7b\x57\xcd\x56\x83\xac\xf8\x6f\x60\x08\
+\x4a\xff\x36\xaf\xb4\xff\xcc\xfc\xf8\xdf\x7b\x55\xca\x9c\x32\x51\
+\x02\x21\x35\x6e\x6c\xcf\xb4\x73\x0a\x93\x62\x2a\xdf\xdc\x59\x5d\
+\x86\x23\xf8\x20\x5a\xc8\xca\xb4\xb0\xff\xc7\xcc\xd2\x61\xd7\x8e\
+\xe9\xfd\xd7\x16\xaf\x22\x4b\x04\xf3\xc3\x28\x4c\x8f\xa1\x40\x48\
+\x23\x13\x7b\xa7\x9f\x91\x15\xeb\xdc\xf0\xde\xee\xda\x4a\xf1\xc4\
+\x9c\x48\xd6\xeb\x9c\xac\x9e\x9c\x33\x74\xd2\x55\x23\x0b\x1e\x6e\
+\xf1\x84\x52\x64\x42\x02\xaa\x4e\xb5\xfc\x58\xd7\xf0\xa4\x18\xc7\
+\x86\x0f\xf6\xd6\x55\x88\xae\x3b\x5e\x55\xd7\xde\x2a\xab\xd9\xb5\
+\xa3\xca\xa3\x99\xfe\x86\x16\xb2\x32\xc4\x45\x62\xba\xf0\x20\x36\
+\x3e\x2f\x25\xf9\xac\xa2\xec\xdc\xcd\x0d\xfe\x26\x46\x23\xb9\x84\
+\xdb\xe8\xca\xb0\x09\xab\x1b\x01\x13\x62\x06\x44\xbf\xbf\x34\xb7\
+\xd7\x2f\x16\x0e\xbd\x73\x5e\x51\x46\x6e\xe0\x60\xcb\xae\x4d\xcd\
+\xfe\xa0\x86\x8d\x5f\x2d\xd1\x40\x61\xc9\x25\x09\x2e\x2e\x40\x7a\
+\x6c\x78\x6e\x32\xfe\xe7\xac\xc1\xf7\xa9\x0a\xeb\x83\x30\x0a\x00\
+\x39\xe9\x81\x90\x4e\xc6\x16\xa6\xcf\x28\x4c\x88\x69\x7e\x73\x57\
+\xf5\xe6\x68\x07\xdc\x70\x67\xeb\xdb\xc6\xf5\x2e\xbc\xf3\xcc\x01\
+\x8f\x37\xb5\x04\x63\x1d\x12\x51\xac\xc7\x7c\x19\x69\xfa\x82\xaa\
+\x6b\x52\x49\xf6\x59\xfe\xa0\xf6\xe9\x97\x87\x1a\x9b\x44\x97\x9b\
+\x63\xea\x07\x27\xe6\x3c\x35\x6f\xe8\xac\x2b\x87\x17\xfc\xa9\xd5\
+\xab\x38\x65\x82\x43\xb0\x0a\xa4\x1a\x65\xae\x31\xf9\x29\x25\x4b\
+\xf7\xd6\xbe\x57\xe9\x09\x29\xa2\x2b\x10\x2c\x01\x8f\x8b\x3c\x0a\
+\x61\x99\x4d\x62\x7d\xe6\xec\xa1\xbd\xee\x3b\xab\xef\x4d\x0b\xa7\
+\x0c\x1e\x7b\x40\x8f\xff\x6c\xe3\x9e\x72\x5d\x96\x08\xb2\xcd\xb3\
+\xba\x0f\x6c\x3b\xac\x6e\x04\x4a\x29\x72\x60\x8c\xce\x18\x9c\x31\
+\xcd\x53\xdf\x4a\x5c\xba\x34\xea\x91\x4b\xc7\xdc\xf5\xe4\xbc\x21\
+\x83\xc3\x67\x3e\x84\x1d\x89\x45\x86\x31\x06\x30\xdf\x21\xc3\x61\
+\x12\x23\x32\x42\xe8\xa5\x51\xbd\xae\xc2\x1a\x9a\xa0\x51\xea\x11\
+\xfc\x04\xb1\x4c\xb0\xee\xf1\x86\x42\x17\x0f\xcc\xb9\xab\xfc\xe6\
+\x73\xaf\x9d\x58\x94\x73\x84\xe8\x44\xf0\x31\xbe\xb3\xde\x5b\xcf\
+\x82\xea\x4e\x87\x44\x5c\x2c\xca\x89\xd1\xc6\x6f\x7a\x48\xdd\x55\
+\x56\xef\xad\x47\x60\xec\x6a\xbd\x8f\x5b\xaf\x3f\x31\x67\xe8\x45\
+\x57\x0c\x2f\xb8\xbf\xc5\x1b\x42\x82\xb4\x66\x4a\x73\x3a\x63\x3e\
+\xc2\xf0\xc0\x67\xce\x1f\x7a\xbd\x44\xc2\x3e\x8a\xbc\x54\x46\x1d\
+\x2d\xd2\x9f\x49\x62\xc6\xd2\x70\x60\x66\x02\x7a\xe3\x82\x91\xb3\
+\x2f\x99\x90\xff\xcb\x20\x62\x59\xb4\xa6\x3a\x63\x1c\xae\x1d\x17\
+\x6e\x53\x66\x8f\x81\x6e\x04\xfb\x65\x75\x13\x80\xa2\x98\x2d\x1a\
+\x98\x97\xdf\x2b\x3f\x6d\xb8\xae\xb3\x10\x61\x2c\xd0\xa4\xea\xa9\
+\x0b\x07\xe5\xfd\x74\xf7\x4d\x67\x2d\x9a\xd4\x2b\xc3\x41\x91\xcc\
+\x24\x8c\xa2\x9b\x48\x32\xc6\x24\x99\xa0\xf8\xbe\x39\xc5\x92\x4c\
+\xdc\x11\x0e\x20\xc5\x04\x23\xdd\xab\x50\xa5\x20\x1d\x5d\x75\x4e\
+\x3c\xc9\x43\x82\x8f\x21\x87\xce\x18\x33\xc8\xf1\x9d\xdd\xb5\xde\
+\xc5\x6f\x6c\xb8\x35\xd6\xed\xd8\x40\x08\x49\x36\x96\x73\x42\x56\
+\xba\x4c\x70\x52\x6c\x8c\xbc\x65\xc9\xeb\x1b\x6e\x7d\x67\x57\xb5\
+\xc7\x3c\x32\xdf\xaa\x5f\x0a\x9b\x2b\xb0\xd4\x38\x97\xeb\xc2\xa1\
+\xf9\x3f\x09\xf8\x14\x02\x64\x65\xa9\x85\x69\x83\xe1\x4a\x73\xba\
+\x8a\x65\xcc\xcf\xa4\x38\x1e\x20\x79\x11\x19\x49\xf4\xba\x21\x7d\
+\xd2\x3f\xbb\x62\xfc\xad\xf3\xfa\x66\x2f\x6e\xf6\x2a\xc8\x41\xb0\
+\xe2\xd7\x19\x5d\x3c\xa4\xf0\x8c\xc1\x59\x89\x32\xb5\x7d\x0c\xbb\
+\x15\xec\x25\x61\x37\x01\x65\xe1\xd5\xdc\xb3\xf3\x87\xce\x49\x73\
+\x39\x4a\x55\x4a\x43\xd8\x58\x06\x22\xa4\x2b\x3a\xd5\xd3\x9d\x64\
+\xf0\xe5\xa3\x4b\x4a\xfb\x0d\x1e\xbc\xef\xd5\xd5\x5b\x5a\x50\x14\
+\x0f\x67\x23\x11\x8d\x32\xb4\xb7\xaa\xe5\xe3\x85\xa9\xb1\x0e\x47\
+\x7a\xfc\x04\x55\xd1\x15\x7c\xd4\xf0\xd2\x74\x14\x4e\x74\xc9\x89\
+\x2b\xf6\xd5\xde\x7f\xcd\xf2\x1d\x5f\xaa\x28\xb2\x9f\x20\x3f\x35\
+\x67\x4b\xad\x27\xb4\xad\xd6\xf3\xc5\xe2\x81\xf9\xe3\x34\x4a\x73\
+\x11\x42\x41\x93\x5d\x31\x8e\x77\xb8\xe4\x03\x17\xbd\xf2\xf5\x35\
+\xaf\xec\xa8\xaa\x87\x50\x30\x91\xa4\x2b\xb3\x68\x01\x4d\xd7\xa6\
+\xf6\x4c\x6b\xec\x97\x1c\x37\x23\xa8\x53\x45\xb0\x4c\x67\x94\x31\
+\xe6\x92\x71\x1a\x75\x90\xd7\x2f\x7e\x63\xfd\xcf\x77\xd4\xfb\xb4\
+\x48\xd1\x21\xf0\x51\x83\x55\xf6\xdc\x79\x43\xc7\xfe\xfc\xac\x7e\
+\x37\xaa\xa1\x50\xcf\xa0\xaa\xfb\xa5\xf0\xd6\x24\xd6\x28\x53\x93\
+\xdd\x8e\x0c\xa7\x24\x1d\x7a\x7b\x57\x75\xa5\xed\x63\xd8\x7d\x60\
+\x13\x56\x37\x00\xd7\x17\x2d\x19\x94\x9b\x7a\xed\xc8\xc2\x25\xad\
+\x41\x95\x08\xce\xc3\x06\x35\x61\x8d\xa1\xa0\x16\x0c\x66\x8c\x4c\
+\x50\xc6\xf7\x4f\x4f\x50\x5f\xdd\x5e\xb5\x07\x45\x08\x89\xc0\x47\
+\xe5\xae\x26\x1f\x79\x78\xf3\xa1\x2f\x87\x64\x27\x35\x0f\xcc\x4d\
+\x99\x16\x08\x6a\x94\x10\xac\x33\x84\xa8\x4c\x48\x52\x10\xa1\x4f\
+\xce\x7a\x66\xf5\x7d\x8d\x0a\xf8\xf5\xa1\x23\x07\x45\x60\xf1\xc0\
+\x08\xb0\xd3\x22\xdb\xea\x3c\xbe\x1d\x8d\x9e\x35\x17\x0f\xee\x31\
+\x23\xa4\xe8\x71\x2a\x43\x24\x29\xc6\xe9\xf9\xd3\x1b\xdf\x5c\xfb\
+\xf0\x8e\xaa\x72\x27\xc1\x44\x15\x8c\x37\x21\x40\xd5\x11\x5b\x07\
+\x53\xb5\xc6\x10\xfe\x64\x7f\xdd\xce\xab\x46\x15\x14\xb9\x10\x19\
+\x44\x91\xa9\x5b\xc3\x94\x31\xec\x72\x4a\xc9\x18\xc7\x3f\xb1\xe8\
+\xf5\xaf\x7f\xf3\xce\xce\x6a\x2d\x92\xe5\xba\xa9\xe8\x42\x08\x9d\
+\x59\x98\x14\xff\xd9\xe5\xe3\x2e\x19\x99\x9f\x7a\x41\xab\xd7\x4f\
+\x24\x4c\x82\x44\x38\xed\xda\xe0\x39\x55\xa3\x52\xff\x8c\x84\xb8\
+\x77\x77\xd7\x7d\x55\xe3\x0b\x1e\x6b\x7c\x66\xa3\xcb\xc2\x5e\x12\
+\x76\x0f\x98\xc3\x3a\x3d\x21\xae\x04\xc5\xba\xf2\x14\x5d\x3f\x4e\
+\x0f\x64\x9a\x2e\x11\x12\xf0\x04\x99\x6b\x76\xff\xdc\x99\xd9\x89\
+\x31\x4e\xf8\x21\xf2\x7a\x07\x63\xda\x44\x19\x39\xff\xe5\xaf\x9f\
+\x59\xba\xbb\xf2\x67\x49\x89\x2e\x43\xf2\x70\x32\xc6\x64\x97\x53\
+\x6a\xba\x7e\xe9\xe6\x3f\x1d\xf6\x04\x4d\x12\x60\x40\x8d\xa0\x28\
+\x67\xcc\x62\x15\xaf\x51\x66\x1e\x13\xff\xca\xb6\xaa\xfd\xcb\xf7\
+\x55\xde\x96\x10\xe7\x24\x29\x71\x2e\xf9\xd3\x7d\x4d\xb7\xfd\xef\
+\xb6\xc3\xbb\x10\x46\xc7\x93\x15\x03\x97\x21\x76\xe4\x38\x7b\x73\
+\x37\xaf\xd2\x13\x42\x37\xbc\xbf\xe5\x41\xb7\x5b\xae\x41\x0c\x39\
+\x34\x9d\x92\x84\x78\x77\xfc\x47\xfb\xea\xef\xcf\xfe\xcb\xbb\xf7\
+\xbf\x5d\x56\x89\xc3\x9e\xd6\xc7\x4b\x6a\x7c\x69\x37\xa7\xb4\x5f\
+\x5a\x8f\xec\xf4\x29\xad\xfe\x50\x50\x26\x44\x3b\xae\x9f\x33\x84\
+\x14\x4a\x71\x52\x6a\x6c\xdf\x33\x0a\xd3\x72\xd1\xf1\xb1\xe0\x6d\
+\x74\x51\xd8\x12\x56\xb7\x40\x98\x33\x34\xcd\x75\xb8\x38\xc1\x55\
+\x3d\x30\x3f\xa5\x6f\x48\x51\x13\x29\x65\x21\xd1\xa1\xd7\x58\x6e\
+\xc5\xbb\x64\xf7\xaa\x03\x8d\xaf\xfe\x7d\xdd\xfe\xdd\x30\x50\x19\
+\x09\x47\x9f\x3a\x46\x32\x82\xe3\xe6\x8d\xa5\x16\x79\x69\x5b\xd5\
+\xae\x41\xb9\x29\x1b\x86\x66\x26\x4d\x75\x49\x24\xf7\xb3\x9a\xa6\
+\xfb\x7f\xb6\x74\xdb\x67\xd0\x3f\xa8\x21\x9d\x18\x4b\xc2\xc7\xcf\
+\x1d\x3a\xe6\xe9\xd9\x83\x7f\xb6\xaa\xb2\xf9\xf3\x03\xcd\x01\xd5\
+\x12\xed\x81\x19\xa4\xf9\xc2\xb6\xaa\x8a\x49\x3d\xd2\xaa\xcb\x1b\
+\x83\x9f\x4d\x7f\x61\xd5\x87\x21\xc6\x8e\x89\xe4\x10\xde\xb5\x43\
+\x68\x52\x8f\x14\x69\xd3\xd5\x53\xef\x2b\x49\x8b\x97\xdf\xda\x55\
+\xbd\x27\x9c\x87\x59\x4d\x69\x4b\x8d\xa7\x79\x6c\x6e\x52\xc3\x80\
+\xf4\x84\xf9\xee\x18\xa7\xf2\x76\x59\xd5\x9d\xe7\xbd\xf2\xf5\x8b\
+\x3e\x55\x35\xe3\x01\x1e\x1b\x70\x30\x2c\xf5\x21\xce\xa4\x08\x91\
+\x2f\x0e\xd4\x37\x4f\xeb\x91\x14\x53\x94\x12\x3b\x40\xd1\xa9\x82\
+\x8f\x5d\x5a\x22\xd9\x81\x13\x93\x1c\xae\x43\x2f\xaf\x39\xfc\xe8\
+\xed\x9f\x6f\xdb\x8f\x98\x7d\xcc\x7d\x77\x81\x4d\x58\xdd\x00\x7c\
+\xed\x57\xe9\xf5\xe2\x57\x76\x54\x95\x87\x42\xf2\xba\x51\xf9\xf1\
+\xa9\xa9\xb1\xae\x42\x7f\x48\x65\x98\x60\x1d\x87\x77\xe4\x9c\x6e\
+\x87\x54\x7b\xc7\xa7\xdb\x9f\xdd\x5e\xe7\x55\xc1\xbf\xcf\xd4\xc0\
+\x3b\x08\x41\x3a\x65\xa6\x82\xfb\x98\x63\x65\xc2\xb7\x48\xaf\x6e\
+\xad\xac\x18\x5a\x98\xbc\xa5\x24\x3d\x96\xde\xf2\xc9\xf6\x87\x76\
+\x56\x7b\xcd\x70\x32\x24\x7c\x1e\x21\xbb\xb5\x67\x5a\xe6\x2f\xcf\
+\x2e\xfd\x8b\x24\x93\x69\x8b\x4a\xf3\x0a\x56\x1f\x6a\x5c\xb1\xaf\
+\xd9\x7f\x0c\x69\xe1\xb0\xc4\x84\x5f\xdd\x51\xb5\xe3\xf9\x6d\x15\
+\x3b\x42\xba\x21\x78\x1d\xe5\x02\x88\xeb\xce\x26\x17\xa4\x39\xdf\
+\xbd\x78\xcc\xfd\xf1\x32\xbe\x70\x44\xaf\x8c\xc1\xbd\xfc\xa1\x2f\
+\xde\xa8\x68\x6a\x20\x12\x21\x88\x85\x25\xb1\x8f\xf6\x37\xec\xbc\
+\x7a\x44\x61\xe6\xd2\x3d\x35\x4f\x2c\x7c\x75\xfd\xfb\x34\xec\x32\
+\x74\x44\x5d\x2f\x18\x82\xb2\x18\x59\x32\xb9\xd9\xf8\xd1\xa8\xb3\
+\xa2\x6b\xc8\xa3\x68\x35\x8b\x4a\x73\x47\x85\x54\xdd\x85\xc1\x6f\
+\x1a\x33\xe4\x8c\x71\xca\xb2\xdf\x2f\x2f\x9f\xff\xf2\xba\x7f\xfd\
+\x71\xdd\xee\xea\x76\x82\x04\xda\xe8\x62\xb0\x09\xab\x1b\x21\x7c\
+\x32\x0c\xc3\x9f\x96\x57\xfb\xbf\x3a\x14\x5c\x5b\x98\xec\x6a\x1e\
+\x90\x9b\xd8\x3f\xa4\xea\xb1\x3a\x65\xa1\x24\xb7\x23\x76\x55\x65\
+\xf3\x87\x77\x2c\xdf\xb1\x85\x22\x44\x08\x48\x66\xc3\x73\x92\xe3\
+\x56\x5f\x31\x71\xc9\x8e\x06\x6f\xd5\xee\x46\x9f\xcf\x6a\x68\x0a\
+\x92\x16\x7e\x7b\x67\x75\xd5\x5f\x57\xed\xfb\x68\x73\x45\xab\xc9\
+\x41\x04\x85\x63\xb1\x8f\xcb\x4d\x42\x8f\x5e\x34\xe6\x01\xc6\xd8\
+\x48\x45\xd1\xab\x9d\x12\x19\xbc\x78\x50\x5e\x9f\x95\xe5\x0d\x1f\
+\xef\x6f\x09\x68\x16\xd2\x42\x1a\x63\x06\x31\x61\x14\x81\xac\x26\
+\x15\xa4\xba\xde\xbf\x78\xec\x03\x2e\x84\xe7\x05\x54\x5a\xad\xa9\
+\x5a\xea\xf0\xfc\xb4\x41\x9f\x1c\x6c\x7c\xbf\xbc\x25\xa0\x48\xa0\
+\x48\x0f\x6a\x14\x3d\xfe\xcd\xc1\xcf\x5e\xdc\x56\xb9\x47\xb1\x10\
+\x9f\xf1\x87\x84\x11\xd1\xb1\x8b\x9d\xdd\x2b\x25\x79\xf3\xd5\x67\
+\x2c\xaa\x09\x90\x8a\xf5\x95\xf5\x01\x19\x13\x6c\x48\x8d\xbb\x1a\
+\x7d\xbe\x49\x3d\xd2\xd2\x8a\xd3\x62\xfb\xf9\x54\x3d\x28\x13\x9c\
+\x98\x10\xe7\x6c\x7c\x69\x7b\xd5\x63\x67\x3d\xb3\xea\xc3\xb2\x46\
+\x8f\x6e\x4a\x67\xb6\xd5\x7b\xb7\x82\x4d\x58\xdd\x08\x42\xc4\x03\
+\x7c\xa0\xa5\x15\xbf\xb4\xfd\xf0\xfe\x3a\x8f\xba\x7e\x42\x8f\xd4\
+\xbc\x04\x97\xdc\x13\x31\xd6\x74\xcb\xb2\xed\x4f\x6f\xaf\xf7\x06\
+\x24\x43\x1c\x41\x61\x17\x96\x87\xa7\x0f\x9a\x36\xa6\x77\xea\x45\
+\x17\xf4\xcb\x2e\x1d\x91\x13\x7f\xf0\xd5\x1d\x35\x75\x3a\x63\xc4\
+\x6a\xc5\xae\xeb\x14\xfb\x14\xfd\x88\x08\x46\x11\xc2\x09\x4e\x09\
+\x7d\xfe\x3f\xe3\x6f\x49\x77\x3a\x17\x87\x34\xbd\x49\x22\xd8\xa1\
+\x51\xea\x97\x31\x19\x78\xf1\xe0\x1e\x7d\xd7\x1e\x6e\xfe\x78\x4f\
+\x93\xef\x98\x78\xee\xcc\x62\x6f\x60\x9a\x32\x30\xc6\xce\xea\x95\
+\xe1\x7e\x6f\xc9\xd8\x07\x65\x86\x66\x29\x9a\xde\x60\xa4\xc5\x18\
+\x0b\x52\x87\xd4\xfb\xe2\xe1\x05\x69\x2b\x6b\x1a\x3f\x3e\xd0\xe0\
+\xc7\x12\x09\x13\xa5\x5f\xd5\x11\xf8\x12\x89\xa7\xf9\x20\x86\x31\
+\x91\x18\xa2\xaf\xdc\xb0\xa8\xe8\xde\x89\xf9\x37\x39\xa8\x32\xa1\
+\x28\xd7\xe9\x7b\x62\xc3\xa1\xed\x8a\x46\x89\x83\x60\xa6\x52\x86\
+\x4a\xd2\xdc\x4d\x53\x7a\x65\x4c\x90\x25\x39\x4e\xd3\xd1\x17\x33\
+\x9f\xfd\xea\x91\x07\x57\xed\x2f\xd7\x98\x6e\xaa\xbb\x6c\x17\x9d\
+\xee\x07\x9b\xb0\xba\x21\xc2\x91\x16\x4c\x2d\x31\x5e\x55\xd1\xe8\
+\x5d\x77\xb8\x69\xf5\xb9\x7d\xd3\x5c\xcd\x41\x77\xf9\xdd\x9f\xed\
+\x5c\xe7\x53\x55\x2c\x1b\x4b\x40\xc6\xd8\xcd\x43\xfa\xa4\xdc\x3a\
+\xb5\xe8\xaa\xfa\x56\xbf\xce\x28\x8a\x1d\xd2\x23\x6d\xdc\xa0\xd4\
+\xb8\x96\x77\x0e\x7a\x0e\x68\x3a\x25\x66\x40\x16\x48\xd7\xf2\x6d\
+\x92\xdd\xbf\xe7\x0c\x99\x33\x21\x37\xf5\x76\xaf\xa2\xf9\xe0\xa8\
+\x65\x8c\x31\x26\x3a\xa5\x7e\x07\x21\xa5\x8b\x06\xe5\x17\xae\x3e\
+\xdc\xf8\xf1\xbe\x26\xbf\x1e\xe5\x10\x0a\x73\x37\xef\x8c\x5e\xa9\
+\x8e\xb7\x97\x8c\xfd\xa3\x4c\x99\x49\x56\xdc\xb9\xd9\x48\x4b\xd3\
+\x68\x20\xd1\xed\x18\x92\x16\xe3\xf2\xbe\xb8\xe5\xf0\x46\x24\xd8\
+\x86\x89\xe9\x49\xe1\xf8\xf5\xc4\x81\x30\x7d\xed\x82\x51\x13\xe6\
+\xe7\x4b\xd7\x79\xbd\x81\x24\x9f\xce\x5a\x0b\x12\xe2\x0a\x6b\x5b\
+\x03\x1b\xd7\x56\xb6\xb4\x4a\xb0\x06\xdc\xd5\xe4\x6f\xbd\x78\x50\
+\x6e\xea\xaa\xf2\x96\xaf\xae\x7a\xb7\xec\xe5\x2f\x0f\xd5\x29\xa0\
+\x43\xb3\x55\x56\xdd\x14\xf6\xfa\xbd\x3b\x00\x23\x6c\x2c\xcf\x22\
+\xed\x8c\x85\x03\xdb\x31\x96\xe2\x36\x16\x43\x4e\xd2\x1c\x0c\xea\
+\x5a\x38\x9a\x0a\x71\xca\x12\xfd\xfa\x47\x93\x16\x16\xa7\xc4\xcc\
+\x0b\x69\xd4\x47\xc2\x8e\xd2\xc4\x85\x74\x67\x6b\x46\xd1\x7b\x97\
+\x3d\xb9\xfc\xf5\x65\x3b\xf6\xe9\xc7\x28\x87\x04\x5b\xa6\x18\x59\
+\x62\xe5\x37\x9f\x7d\x5f\xb2\x93\x5c\x18\x50\xf5\x3a\x09\x63\x59\
+\xcc\x9b\x32\xa6\xbb\x64\x29\xd5\xab\xe9\xaf\x14\x3e\xf4\xd1\x9d\
+\x1e\x45\x3f\x76\xe9\x06\xe9\x24\x38\x65\x76\xe0\xe6\xb3\x7e\x1f\
+\x2f\x91\x0b\x0c\x29\x8d\x1c\x1b\xc2\xd9\x4c\xc7\x2d\x4b\x69\x2d\
+\x8a\xfe\x51\xc1\xc3\x1f\x5d\x13\x50\xf5\xa3\x51\x00\x01\x5c\x73\
+\x3f\xa1\x20\x09\xdd\x3d\xa1\xef\x79\xd3\x8b\x32\xe7\x35\x85\x54\
+\x55\x36\x95\xf0\x8c\xc5\xc8\x52\xdc\x81\x56\xdf\x8a\xa1\x8f\xad\
+\x7c\x32\xa0\x52\x30\x03\x43\x28\x2d\xc6\x29\x79\x15\x8d\x1a\x4b\
+\x4c\xa8\xe7\xf1\x6d\x18\x36\x69\x30\xd7\xdb\x76\x1c\x9a\xae\x0d\
+\xdb\xac\xa1\x8b\xc3\x41\x08\x4a\x20\xe6\x06\x9a\x69\x59\x6e\x8d\
+\xfb\xa2\x53\x66\x2a\x8b\x9a\x02\x1a\xaa\xf7\xfb\x4d\xb2\x02\xab\
+\x78\x7a\xd9\xd0\xbc\xcc\x41\x59\x09\x93\x02\xaa\x1e\x82\x6d\x7b\
+\x4c\x10\xa2\x21\x26\x05\x13\x6a\xf6\xcc\x7b\x73\x6e\xbf\x1b\x66\
+\xf5\xc9\x4a\x30\xc8\x4a\xdc\x6d\x84\xa8\x9e\x28\xa0\xe9\x68\xd1\
+\xeb\xeb\x7f\xa3\x50\xf6\x96\x93\x90\x14\x6a\x19\xcf\xc6\x92\xd1\
+\x89\xb1\xba\x61\x7f\xc3\x5e\x8f\x62\x1a\xb8\x1f\x23\x61\x71\xb5\
+\x96\x47\xd1\xd0\x86\x03\x75\xfb\x9c\x04\x6b\x14\x59\x83\x04\x32\
+\x5d\x96\x48\xb2\xca\xd8\x47\x8b\x5f\x5b\x7f\x9b\x41\x56\x56\x49\
+\x0d\x8e\x1e\x43\x33\x8b\x32\xdc\x1f\x5f\x31\xe1\x9a\x69\x45\xe9\
+\xe7\x35\x87\x94\x90\x41\x56\xe0\xaf\x48\x7c\xaa\x1e\x2c\x49\x4f\
+\x1a\x7d\xe5\x90\x1e\xbd\x8c\xac\xf9\x71\x66\xf5\x7e\x85\xaa\xba\
+\x59\x3f\x76\x9c\xdd\x16\x21\x7c\xb9\x8a\x1c\x12\x66\x92\x64\xcf\
+\xdf\x5d\x1d\x36\x61\x75\x51\xf0\x98\x4d\x97\x0d\x2b\x2c\x6e\xb9\
+\x72\xe2\x45\xf3\x7b\xa4\xc6\x53\x73\xdf\x9f\x99\xf1\x9c\xac\xfe\
+\x82\x5c\xcf\x83\xc3\x76\x51\xd8\x41\x30\xfa\xcd\xc4\x3e\xd3\x14\
+\x4d\xcf\xc6\x08\x29\xe2\x19\x80\x06\x79\x29\xc4\xe1\x65\x84\x8e\
+\x7a\x69\xc1\xf0\x1b\x53\x63\x9c\xa6\x94\x26\x26\x4a\x81\x20\x3f\
+\xdd\x5f\x17\x9a\xff\xd2\xda\x5f\x50\x09\xbf\x25\x13\x92\xc8\x5d\
+\x6f\x4c\xb7\x1b\x87\x94\x14\x54\xb5\xb7\xfe\xfc\xfe\xa6\x27\x8c\
+\x74\x25\x7c\xfc\x29\x37\x70\x0d\xff\xf9\xbd\xcd\x4f\x04\x43\xea\
+\x3b\xb2\x44\x92\x18\x43\x3a\x12\xc8\x8a\x61\xfc\xe9\xb9\x2f\x7f\
+\x7d\xeb\xc7\xe5\xf5\x5e\xab\x41\x28\x06\x9b\xab\x54\xb7\x03\xbd\
+\xb2\x60\xc4\x8f\xf5\x10\x9d\xe4\x0d\x6a\x5e\x88\x89\x85\x85\xfb\
+\x54\x45\x51\x13\xef\x98\x50\x34\xc3\x21\x11\xd3\x9a\x9f\x87\x94\
+\x37\x96\xc6\x56\x07\xe7\xf0\x46\x01\x35\xf3\x9a\x5c\x90\xea\xfe\
+\xec\xca\x09\x17\x3c\x3e\xbc\xe7\x20\x68\x20\x7b\x5c\x74\x51\xd8\
+\x2f\xa6\x8b\xc2\x20\x1d\x8c\x08\xba\x75\x68\xef\x62\x96\x97\xb8\
+\xf0\xf9\xcb\xc6\xfd\xfa\xc3\x25\x63\xa7\x4e\xcd\xcb\x91\xf8\xd9\
+\x82\x91\x8c\x1d\x79\x3c\x2c\xca\x30\x7a\xf8\xcb\xaa\x2f\x3c\x21\
+\x75\x8b\xdb\x29\x27\x6a\x61\xe9\xe8\x68\xec\x75\x46\x91\x53\x22\
+\xf4\xeb\xaa\xe6\x7d\x8d\x01\x25\x6c\x39\x11\xb6\x5a\x3f\x12\x18\
+\xd0\x18\xcc\xc6\xdf\x1f\x1d\x68\x50\xcf\x7d\x79\xed\x9d\x54\x62\
+\xcb\x1c\x61\x7f\x41\x95\x61\x1c\x17\xa3\xd1\x6d\x8b\xde\xde\x78\
+\xff\xb2\x80\x0a\xfa\xa5\xa3\xe6\x06\x04\xcc\x27\x74\x30\x08\x5d\
+\xe6\x57\xd1\xe2\xb7\xb7\xfc\x31\x56\x76\x95\x31\xc4\x62\x8d\x34\
+\x0c\xb2\x42\x18\x7f\x7e\xde\xcb\xeb\x7e\xf6\xd1\xfe\x3a\xbf\x4c\
+\x8e\x92\x95\x51\x06\xf9\xa8\xf9\x39\x69\x0c\xaa\x68\x5d\x55\xeb\
+\x7e\x97\x83\xe8\x56\x63\x58\x9d\x32\x2a\x61\x94\xe0\x90\xdd\xfb\
+\x3e\x3b\x18\x5c\xae\xea\xd4\xbc\x25\x92\x9e\xca\x2c\x1b\x09\xc7\
+\xcb\x3a\x63\xc2\x38\xbc\xf4\xe2\x89\x63\x3f\xbc\x78\xcc\x5d\x63\
+\x72\x93\x17\x4d\x19\x56\x50\x2a\xe1\x08\x21\x1f\x6c\x74\x19\xd8\
+\x4a\xf7\x2e\x08\x2e\x19\xb8\x1d\x18\xdd\x3c\xb6\xe0\xdc\x58\x89\
+\x24\x06\x55\xdd\xdd\x3f\x23\x7e\xe4\xc2\x81\x39\x03\xdc\x12\x6a\
+\xdc\x56\xeb\xa9\xf5\xaa\x3a\x8e\x76\x12\x8c\x71\x75\xe5\xe1\x3a\
+\xcf\xaa\xca\x96\x35\x0b\x8b\x33\x63\x92\x5c\x72\x49\x40\xa7\x94\
+\x1c\x5d\x6d\x39\x9c\xb2\x5c\xff\xd3\x65\xdb\x9f\xdc\xd5\xe0\x0d\
+\x81\x42\x9d\x07\xd4\xc3\xfc\x6c\x77\x70\xbd\xc1\x7b\x1a\xfd\x74\
+\x4d\x45\xf3\xe7\x8b\x06\xe4\xf7\xc3\x98\x0d\x88\x8f\x75\x7b\xdf\
+\x5c\xb9\xfb\xf6\x7b\x37\x1c\x3c\x10\x0e\x65\x1c\x5e\x9a\x1a\x9c\
+\xe5\x96\x25\x83\xe8\x90\x4a\xc3\x42\x1b\x0d\xcf\x8c\xa4\xac\x31\
+\xe0\x1f\x9a\x9d\xbe\x7b\x48\xb6\x7b\xa6\xaa\xa3\x14\x84\xf1\xca\
+\x73\x5f\xfc\xfa\x96\xe5\x07\xea\xbc\x3c\xb2\x02\x3a\x36\xce\xbc\
+\x69\x75\xca\xe3\xe6\xd4\x07\xd5\x43\x17\x0d\xc8\x1b\xa1\xea\x7a\
+\xa2\xb1\x92\x43\x61\xb2\xc2\x89\x31\xce\x98\x10\x25\xab\x66\x3d\
+\xbf\xfa\xef\x0f\xae\xde\x53\x83\x4d\x93\xab\xe3\x3c\x01\xc0\x6e\
+\x0b\xa3\xcc\xd8\x18\x76\xdb\xe8\x9e\x7d\x1e\x9a\xd1\xf7\xaa\x01\
+\x29\xce\x73\xbc\x41\x25\x56\xd1\x68\x50\x72\x3b\x1c\x1f\xec\x6d\
+\xf8\xbc\xc6\x6b\xbb\xea\x74\x55\xd8\x84\xd5\x05\xc1\xed\x9a\x2e\
+\x29\xcd\x4d\xb8\x72\x58\xc1\x3c\x8f\xa2\x39\x65\x82\xf5\xa0\xa6\
+\xab\x08\xd1\xcc\xb3\xfb\x64\x8d\xbb\x6a\x50\x8f\xec\x03\x2d\x81\
+\xf2\xad\x75\x1e\x1f\x8e\x22\x69\x39\x08\xc6\xfb\x9b\x03\xfa\x47\
+\x6b\xf6\x6f\xca\x4d\x8a\xad\x1f\xd2\x33\x6d\x60\x48\xd1\x5c\x3a\
+\x43\x4a\xa2\x5b\x8e\xfb\x64\x7f\xf3\x5b\xbf\x5e\xb1\x63\x9b\x21\
+\xca\x19\xe4\xe0\x76\x48\xe4\xae\x71\xc5\x83\xe2\x89\xb3\x65\x67\
+\xb3\x57\x93\xc1\x37\x8f\x93\xd6\xde\x26\xbf\xba\xf2\x50\xe3\xe7\
+\x3f\x1e\x55\x38\xfa\xa3\xfd\xb5\x6f\xce\x79\x67\xd3\x3b\x24\xfc\
+\x6c\x38\x7c\x8d\x19\x27\x0f\xb3\xb7\x17\x8d\x9e\xbb\xa8\x34\xb7\
+\xef\x0b\xdb\x2b\x77\x22\x16\xde\xf1\x63\xa6\xc5\x3d\x23\x2f\x6d\
+\x3b\x58\x39\xae\x47\x8a\xdc\x3f\x23\x31\xf6\xec\x67\x57\x5d\xff\
+\xe9\xc1\x86\x56\x20\x2b\x33\x0d\x19\x87\x2d\xe1\x67\xf7\xcc\x71\
+\x2d\x19\x98\x37\x70\x4d\x55\x73\x9d\xa2\x87\xc5\xcd\x5d\x0d\x5e\
+\x75\x42\x8f\x34\x3a\x20\x23\x7e\x64\x40\xd5\x83\x1a\x65\xce\xd4\
+\x58\x17\x7e\x6b\x57\xcd\x4b\x97\xbe\xbd\xe9\xa5\xb5\x15\x0d\xaa\
+\x44\xc2\x44\x67\x6d\x0f\x1c\x76\x31\x62\x17\x95\x16\x26\x7f\x78\
+\xf1\x84\x0b\xcf\x2e\x49\x5e\xa2\x78\x7d\xd9\x41\x55\x0f\x48\x84\
+\x30\x8d\x52\x94\x96\xe0\x72\x6f\xad\x69\xf9\x66\x5d\x65\x8b\x57\
+\x8a\x72\x66\xa3\x8d\xef\x17\x36\x61\x75\x41\x84\x8f\xe0\x42\x6c\
+\x7c\x8f\xb4\xd2\xd9\xfd\xb2\xa7\xf9\x83\xaa\x29\x01\x91\xf0\x2a\
+\x50\xf3\x2b\xba\xee\x76\x92\xa2\xc5\x83\xf2\xc6\x8d\xcb\x4f\x51\
+\x5e\xdc\x56\xb5\x4f\x8c\x0d\xc5\xc1\xcd\x1f\xaa\x18\x23\x2f\xec\
+\xaa\x29\xcf\x4e\x88\x29\x1b\x95\x97\x56\x42\x75\x9a\x4d\x24\xa9\
+\xe2\xb6\xe5\x5b\x9f\xd9\xd5\xe0\x53\x21\xac\x28\x7b\xe6\xdc\xc1\
+\x7d\x6f\x98\xd8\xf7\x17\x73\x07\x65\x25\x6f\xaa\xf2\x6c\xde\xd9\
+\xe0\xa1\x9c\x3c\x39\x69\xed\x6f\xf1\x87\x56\x55\x34\x7d\xf2\x45\
+\x45\xf3\xda\xfd\x8d\x66\xc4\x84\xb0\x63\x34\x42\x84\x61\x4c\x5f\
+\xbf\x68\xfc\xd0\x39\x45\x69\x0f\xf6\x49\x4f\x98\x3a\x24\x3b\x6e\
+\xcd\x8b\x5b\xab\xaa\x09\x44\x43\x30\x15\xdf\x08\xa1\xc3\x1e\xff\
+\xd6\xe7\xb7\x56\x7c\xf8\xc9\x01\x33\x98\xdf\x91\x70\xc6\x32\x1c\
+\x19\x36\xbb\x7f\x96\xe3\x85\x25\x23\x2e\x9b\x51\x92\xbd\xa4\x28\
+\xc9\xb1\xe3\xb5\x1d\x35\xf5\xbc\x8c\x8d\x41\xe5\xf0\x85\x03\x72\
+\x87\xa8\x94\xe6\xa6\x26\xc5\x36\xfc\x67\x7d\xc5\xa3\x17\xbd\xbe\
+\x7e\x55\x9d\x37\x48\x22\xed\x02\x72\xdf\x6a\x07\xc1\xec\xdd\xc5\
+\xa3\x27\xdc\x3e\xbe\xf0\x3a\x4a\x95\x81\x3e\x85\xaa\x12\x21\x1a\
+\x38\x45\x1b\x4b\x51\x2d\x46\x96\x92\xdf\x2a\xab\xd9\xbb\xbe\xba\
+\xe5\x10\x7f\x07\xdf\xdd\x5b\xb7\xd1\x11\xd8\x3a\xac\x2e\x8c\x96\
+\x90\xea\x43\x3a\xab\x8b\x89\x71\xc4\x6a\x3a\x95\xe0\x94\x1a\x53\
+\xe9\xae\xe9\xcc\x13\x50\xd4\x94\xf1\x39\x49\x83\xd2\x62\xcc\x43\
+\x8f\x8f\xe8\x9e\x88\xb0\x4e\x04\x22\xa3\x32\xc6\xe4\xda\x77\x36\
+\xed\x9d\xfc\xd4\xca\xfb\x62\x5c\x64\xf3\xca\x8a\xe6\x2f\xde\xd9\
+\x55\x63\x5a\xbd\xeb\x94\xd1\x69\x3d\x53\xdd\x17\x94\xe6\x5e\xd4\
+\xd0\xe2\xd5\x70\x48\x9d\xf8\xc6\x05\xc3\x6e\x3c\xbf\x7f\x76\x9c\
+\x41\x26\x7c\x03\xc0\xf8\xbf\xc1\x98\x1f\xee\xad\x6b\xfc\x74\x6f\
+\x6d\x30\xac\xa3\x62\x48\x26\x84\x50\x84\xe8\xb9\x25\x59\x3d\xe7\
+\x15\xa5\xfe\xd9\x13\x50\x65\x8f\x2f\x24\xcf\xeb\x93\xf3\xe7\xf9\
+\x7d\xb3\x0b\x28\x63\x14\x42\xcb\x98\x04\xf2\x59\x79\x53\xf0\xc3\
+\x7d\x0d\x8d\x26\xfb\x8a\x64\x45\x19\x9b\x5f\x92\x1d\xff\xfa\x79\
+\x23\x6e\xc2\x41\x6d\x52\x43\x8b\x57\xbd\xa0\x34\x77\xd1\xb4\x5e\
+\xa9\x6e\xa3\x8c\x32\xc1\xd2\xfb\xbb\x6b\x95\xcf\x0f\x37\x7c\xe4\
+\x90\xe5\x9d\x37\xbc\xb5\xfe\x0f\xd7\x2c\xdd\xb4\x15\xc3\x46\xa2\
+\x48\x56\x50\x66\x2e\x7b\xe2\x64\xb7\x13\x8d\xc9\x4d\x1d\x18\x54\
+\xf5\x6c\x95\x22\x8f\x0c\xa1\x66\x8c\x36\xd5\x29\x23\x4e\x99\xc4\
+\xa3\x18\xb9\x31\xa8\xeb\x4d\xdf\xfd\x9b\xb6\xd1\x51\xd8\x12\x56\
+\x17\x84\x31\xb3\x1b\xc3\x69\x73\xad\xa7\xe1\xc3\xb2\xea\x95\x33\
+\xdc\x4e\x4f\x66\x61\x76\x1e\xd6\xd5\x14\x45\x67\x9a\xb1\xba\xd1\
+\x19\x23\x89\x71\x2e\xf2\xf7\x6f\x0e\xbd\xf7\xfa\x8e\xaa\x83\x3c\
+\xd6\x54\x9a\xdb\x61\xae\xaf\x14\x41\x0f\xc5\xc2\x7a\x24\x93\x78\
+\x0e\xb5\x06\x42\x5f\x1d\x6a\xfc\x7a\xd5\xa1\xa6\xbd\x7b\x9b\xfc\
+\x3a\x0f\xf6\xf9\xd0\x39\x83\x66\x97\xa4\xc6\x4f\x50\x29\x0d\x30\
+\x84\x54\x86\x59\xc1\xa2\xd2\xfc\xe2\x6d\xb5\x9e\x2d\xdb\xeb\xbd\
+\x41\xf9\xd8\x83\x4c\xb9\x8e\xfe\x88\x15\xfb\xec\xe2\xcc\xf8\x17\
+\xcf\x1f\xfe\x37\x55\xd5\x4b\x10\xc6\x01\xe3\xb2\xa6\xb3\xf4\x85\
+\x03\x72\x4b\xbf\xa9\x6a\xfd\x70\x67\xa3\x37\xc4\xcd\x15\x30\x0e\
+\x47\x18\xe4\x4b\x2e\x4e\x56\xe7\xf5\xcd\x49\x7d\x69\xe1\x88\x9b\
+\x14\x5d\x1f\xa0\x33\xe6\x37\xd2\x70\x4b\x72\x76\x46\x9c\x5b\x79\
+\x61\x5b\xe5\x4e\x68\x16\x56\x11\x52\x0e\x3f\xbf\xb9\x72\xf5\xcb\
+\xdb\xaa\x5b\x0d\xb2\x32\x96\xa4\x9c\xa9\xc2\xa7\x06\x85\xeb\x94\
+\x1c\xe3\x40\x41\x35\x6c\xe6\xe1\x55\x34\x96\x99\xec\x72\x4e\x29\
+\x4c\x1f\x12\x50\x34\xca\x6d\xcf\x5c\x92\x14\x1b\x17\x23\xb7\x96\
+\xd7\xea\xcb\xee\xf9\x64\xeb\x53\xff\xdd\x5c\x71\xc8\x3e\xa8\xa2\
+\xeb\xc2\x26\xac\x2e\x8e\x0a\x5f\x48\x7b\x62\x77\xed\x9e\x5a\x1f\
+\x5e\x53\x92\xe6\x20\xf9\xa9\x71\xbd\x74\x9d\xc6\x28\x3a\xd5\x62\
+\x11\x0e\x7d\xfc\xe5\xde\x57\x3e\x6d\xf4\xfa\x8d\x01\x36\xba\x47\
+\x92\xe3\xeb\xcb\xc6\xff\x64\xbc\xdb\xa1\xbd\x5b\x17\xa8\x0a\x2a\
+\xda\x31\x3b\x89\xfc\x2c\xc2\x7d\x4d\x01\x7d\x7f\xb3\x5f\x97\xc0\
+\xea\xfb\xe6\x31\x7d\xb2\x6f\x1a\xdf\xfb\xf2\x26\x5f\x10\xcb\xc4\
+\x58\xd9\x61\x42\x0d\xce\x63\x2c\xfb\xc2\xd2\xfc\x01\x9b\xaa\x5b\
+\xb7\x96\x35\x78\x7d\x9c\x70\xf8\x47\x82\x41\x3f\xbd\x77\x4f\xfc\
+\xe6\x85\x23\x7f\x8b\xa8\x7e\xa6\xce\x50\x0b\xc1\x48\x82\x38\x56\
+\x41\x82\x70\xef\xc5\x43\xf2\x33\xd6\x35\xb6\x7c\xba\xa7\xd6\xcb\
+\xc0\xd0\xf5\x08\x1b\x70\xc2\x9b\x5b\x92\x95\xf1\xd2\xc2\x11\x3f\
+\xd5\x74\xbd\x97\x4e\x99\x9f\x98\x31\xea\x31\xf2\x2b\x1a\x1d\x92\
+\x97\x5a\xd0\xe4\x57\x37\xae\xae\x68\xf2\x98\xcb\xd2\x7a\x1f\xdd\
+\xdf\xe4\xd7\xe0\x6c\xc2\x63\xa4\x2a\x9d\x31\x9c\xe4\x76\xb0\x7b\
+\xa7\xf5\x1d\xf4\x87\x29\x25\x67\x3f\xbd\xe5\xf0\xd6\x90\x16\xe6\
+\xb3\x29\x12\x0a\x4e\x2a\xc9\x9a\xe8\xa3\x4c\x72\x12\xec\x8e\x73\
+\x3b\xc9\xc1\x66\xff\x97\xbf\xfa\x6c\xe7\x63\xd7\x7f\xb0\x65\xc3\
+\x97\x15\x8d\x21\x5b\x6f\xd5\xb5\x61\x13\x56\x17\x87\x69\x33\xc5\
+\x10\x59\x53\x51\x1b\xfa\xd7\x86\x83\x5b\xca\x1b\xbd\x1b\xc6\xf6\
+\x48\x4f\xcd\x4e\x8a\x29\x0e\x68\xfa\xde\xcb\x3f\x29\x5b\xe6\x51\
+\x34\x93\x94\x2e\x1f\x52\x30\x68\xd6\xa0\xbc\x8b\xb2\xf3\x12\x47\
+\xdd\x31\x66\x40\xca\xc1\x56\xef\x9e\x8d\xd5\xde\x10\x26\xec\x88\
+\x23\x34\x97\x90\x0c\x09\xc7\x58\x0a\xb9\x65\x89\xbd\x75\xe1\x88\
+\xc5\x12\xa3\x83\x29\xc3\x1e\x8c\x11\x77\x99\x31\x06\x7f\x88\x21\
+\x94\x71\xe9\x90\xfc\x11\x5f\x57\x36\x97\xed\x6a\xf4\x35\x4b\x96\
+\x83\x1f\x0c\xa2\x5c\x5c\x9a\x33\x72\x7a\x49\xfa\xaf\xbd\x01\xb5\
+\x55\x3c\x0f\xd0\x20\xbe\x90\x4e\x43\xf1\x71\xce\x61\x3b\xab\x5b\
+\x57\x7d\x5e\xde\x58\x29\x0b\xba\x21\x09\x6c\xae\x66\x16\x65\x16\
+\xbc\xb3\x64\xf4\xed\x21\x55\xcb\xd1\x29\xf3\x09\x96\xf0\x46\x31\
+\x55\x8d\xb2\xf4\x71\x3d\x93\x1c\x8f\xac\x2d\xdf\xa0\xe8\xd4\x3c\
+\x6d\x03\x83\x63\x36\xa4\x63\x5a\xfc\x1b\xe4\x35\xa3\x38\xd3\xfd\
+\x9f\x79\x43\x2e\xb8\x60\x60\xde\x25\x99\x09\xee\xa2\x06\xaf\xb2\
+\x69\xd5\xe1\xa6\x66\x23\xad\x9d\x0a\x0d\x5c\x37\xa6\xd7\xb0\x04\
+\xb7\xb3\x90\x22\xbc\xe5\xe1\xd5\x07\x1e\x9b\xf3\xd2\xba\x8f\xd6\
+\x57\xb6\xf8\x55\x9d\x62\xeb\x11\x66\x36\xba\x1e\x6c\xc2\xea\xe2\
+\xe0\x76\x55\x60\xa3\x84\x37\x54\x7b\x5a\xdf\xdd\x5d\xbd\xba\x20\
+\xde\xe1\x29\x6f\xf6\xd5\xfe\xeb\x9b\x43\xbb\x8c\xf7\x98\xe0\x26\
+\xec\xd1\x73\x06\xcd\x8f\xc5\x38\x4f\x09\xd1\x00\xc2\x4a\xdf\x0b\
+\x4a\xf3\x86\x4f\x2c\xc8\xa9\x5b\xba\xa3\xbc\x2a\xa0\x9b\xa6\x5b\
+\x47\x25\x24\x08\x3b\xa3\x51\x8a\x7a\xa7\x66\xd6\x8c\xcc\x4b\x2a\
+\xa4\x4c\xcf\xd6\x29\x0b\xf1\xf8\x51\x06\xe1\xa8\x3a\x0d\xc6\xc6\
+\x38\xb3\xcb\x7d\x4a\xe5\x27\x7b\xeb\x76\xcb\x04\x4b\x9c\x70\x40\
+\x50\xc2\xeb\xab\x1a\x2b\xff\x67\x48\x9e\x94\xea\x76\x4f\x0e\xe9\
+\x7a\x80\xab\xd0\x74\xc6\xf4\x04\xa7\x23\xb9\xc6\xe7\xfb\xc7\x45\
+\xaf\x7e\xf3\xba\x4a\xd9\x31\xd1\x11\x64\x42\x24\x83\xb0\x2e\x1f\
+\x55\x38\x76\x4a\xcf\xb4\x29\x9e\x80\xda\x2c\x13\x72\xc4\xfd\x87\
+\x32\x46\x25\x99\xc4\xc7\x33\xb9\xfc\xc5\x0d\x55\x2f\xbe\xbe\xbb\
+\xaa\x35\x2c\xb9\x1d\xb5\x59\x90\xf0\x51\xa9\xea\x9e\x33\xfa\xf5\
+\x7d\xf0\xac\xfe\x37\xe4\x25\xc6\x8c\x6a\xf4\x86\xfc\x32\xc6\xae\
+\xa2\x14\xb7\xef\xd1\x0d\x07\xb7\x51\x86\x24\x8f\xaa\xd1\x71\xb9\
+\x49\x09\xbb\x6a\x7d\x9b\x17\xbe\xb6\xfe\xa9\xe7\xb6\x56\x34\x10\
+\xd3\x9e\x2d\x1c\xd1\xd5\x26\xab\xae\x0f\xdb\x17\xa1\x9b\x01\xf4\
+\x3d\xc6\x37\x83\x88\x03\xe6\xa1\x0e\xd7\x8c\xcd\x4b\xf9\xe7\xec\
+\xe1\xf7\x34\x36\x87\xe2\x1c\x12\x0e\x9f\xb3\x4a\x99\xd3\x15\x23\
+\x13\x7a\xb8\xe5\xd3\x1f\x7d\xbe\xe7\xd5\xe7\xf7\xd4\xf8\x23\x58\
+\x92\x63\xc6\x30\x1b\x9f\x9f\x92\xf0\xde\x92\x31\xd7\xb8\x65\x34\
+\x24\xa4\xe8\x1e\x72\xe4\xd8\x2c\xe6\x8c\x71\x39\x6b\x66\x3d\xb7\
+\xe6\x7f\x3f\xde\x5f\xe7\x03\x82\x38\xf2\x3c\xd7\x05\x4d\xca\x4f\
+\x43\x6f\x5f\x34\xea\x2f\x4e\x82\x66\x53\x1d\x35\x19\xd9\x13\x87\
+\x94\xa2\x50\xf4\xee\xdc\x17\x56\xdd\xba\xf2\x60\x13\xb2\xfa\x2c\
+\xf2\xb4\xce\xe8\x95\xe6\xfa\xf8\xb2\x71\x77\x79\xfc\x6a\x3e\xc2\
+\x66\x3c\x78\xa2\x33\x46\x63\x65\x29\xa1\x49\x67\xdb\x7f\xf7\xec\
+\xda\x7f\x3c\x51\xd9\xd8\x1c\x0c\x5b\x83\x0a\x79\x87\x97\xb9\xb3\
+\x4b\x93\xe5\xbb\xc7\xf6\x9f\x33\xba\x20\x73\x76\x8b\x37\x20\x33\
+\x84\x82\x60\x09\xef\x20\x58\xaa\x9e\xf1\xc2\x9a\xdf\x7e\x79\xb0\
+\x41\x31\xf2\x97\x40\xaf\xa7\x85\x83\xe4\x1f\x17\x66\xd9\x46\xd7\
+\x86\x2d\x61\x75\x51\x80\xc5\xf9\x71\xb6\x40\xdc\x54\x81\x85\x75\
+\x44\x48\x22\xc4\x34\xda\x9c\x90\x97\x31\x78\x66\x9f\xf4\xe9\xde\
+\xa0\x1e\x94\x08\xa6\xb0\x73\xa6\xab\x2a\xa5\x38\x25\xae\xff\xe2\
+\x61\x3d\x86\x6d\xab\x6e\xde\xb3\xad\xde\xdb\x6c\x3d\x1d\xd5\xc8\
+\xab\xbc\x25\x10\x5a\x71\xa0\xe1\xeb\x8b\x06\xe7\xa7\xb9\x25\x52\
+\xa2\x52\x1a\x34\x58\x2f\x39\xce\xe5\xfe\xa0\xbc\xfe\xf9\xdf\x7f\
+\xb6\x6b\x9f\xa9\xe0\x16\x5c\x80\x38\x61\x18\x19\x95\xb7\xfa\xd1\
+\xea\xca\xe6\xd5\x57\x8d\x28\x1a\xaf\x28\x6a\x36\x22\xd8\x11\xab\
+\xb2\xed\xb3\x5f\x5e\xfb\xd3\xcf\x0f\x36\x2a\x40\x0e\x48\x3c\xaf\
+\x1e\x02\x13\x92\xfd\xcd\x01\xad\x4f\x6a\x62\xcb\xa8\x9c\x84\xb1\
+\x01\x8d\x9a\x64\xeb\x96\xa5\x84\x00\xa5\x6b\xe6\x3c\xbb\xe6\xef\
+\x6f\x54\x36\x79\x11\xc4\xb5\xe7\xcf\xf2\x88\x0c\xf3\x8a\x33\xf3\
+\xde\x59\x3c\xe6\xc6\x8c\xb8\xd8\xc9\xad\xbe\x90\x22\x11\x0c\xa6\
+\x0a\x98\x29\x3a\xc3\x49\xa9\x31\x99\x5b\xeb\xbd\xdb\x57\x97\x37\
+\xd4\xca\x12\x21\x1a\x03\xd9\xd2\x42\x9e\xed\xb5\xbb\x8d\xae\x01\
+\xdb\xac\xa1\x8b\x42\xa3\x8c\x89\x5b\xfe\x44\x18\xe9\xc6\x65\xd3\
+\xaf\x90\x85\xdd\x52\x8c\x6b\x2b\x2a\x5b\xd7\xef\x8d\x29\x78\x2c\
+\x2d\x46\x56\x64\x89\xc4\xc3\x51\x5a\xe6\x73\xa1\x80\xe2\x41\x3a\
+\xcd\x19\x96\x93\xec\x46\xe1\x97\x8e\x21\xdd\x23\x79\x19\x79\xac\
+\x39\xdc\xa4\x9e\xf1\xd4\x57\x8f\x7a\x35\xfd\x7d\x97\x24\xc5\x21\
+\x84\x62\x5a\xfc\xca\x96\x07\x3e\xdb\xf9\x15\x0a\x2f\x11\xcd\xbc\
+\x12\x24\x07\xce\x8a\x75\x49\x4c\xf0\xf5\x23\x18\x91\xcf\x0e\x34\
+\xb6\xfc\x77\x53\xe5\xed\x09\x71\x0e\x5f\x42\x92\xdb\xf7\xdf\x55\
+\x65\x3f\xff\xf4\x60\x83\x87\x48\x61\x52\xc5\x20\xdd\x64\xc5\xbb\
+\xe5\x04\x97\xfb\x88\xe5\x85\x91\xcc\x75\xef\x6d\xdc\x70\xb0\x45\
+\xdd\x40\x10\x8a\x71\x3b\xa4\xf8\x80\xae\x7f\x74\xe6\x7f\xbe\x7a\
+\x64\x4d\x65\x73\xd0\x79\xac\xad\x96\xf9\x10\x5f\x76\x4e\x2e\xce\
+\xe9\x89\x90\x63\x60\xab\x5f\x69\x95\xc3\xce\xcb\xa6\xd4\x46\x98\
+\x1e\x97\xe4\x44\xda\xde\x3d\xde\xa7\x3f\xde\x5e\xb3\x13\x81\x0b\
+\x0f\x63\xe1\xf2\x5a\x24\xbd\x23\xe9\x89\xed\x6e\xa3\xeb\xc1\x96\
+\xb0\xba\x20\x8c\x95\xcf\xdd\x93\x8b\xfb\x2d\x28\xc9\x8d\xdd\xd5\
+\xe4\x6b\x69\x08\x28\x88\x81\x24\x63\x75\x19\xe1\xff\xaf\xf1\x04\
+\xd0\x23\x9f\x6f\xdd\xb7\xb7\xb6\x65\xdd\x84\x82\x8c\xd4\xcc\x44\
+\x77\xa1\x2f\xa4\x52\x63\xac\xcb\x04\xc7\x06\x75\x69\xfb\x25\x6f\
+\x7e\xf3\x96\x4f\xd1\x4c\xf3\xa3\xf4\x58\x97\x19\x20\x0f\x81\xcf\
+\x1f\x37\x0c\xad\xf4\x06\xf1\x07\xfb\xeb\x36\x9f\x3f\x22\x8f\x64\
+\xa6\x26\x0e\xb8\x6b\xd9\x8e\xc7\x5f\xdc\x56\xd9\xe0\x20\x98\x07\
+\xbd\x43\x77\x8e\xe9\xdb\xeb\x9d\xcb\x46\x5f\xbd\xa5\xa6\x65\xeb\
+\xf6\x3a\x6f\x88\xc7\x98\x92\x30\x22\x6f\x96\x55\x34\xf6\x4d\x89\
+\xaf\xd8\x56\xdd\xb2\xe2\xb2\xe5\x3b\xd6\x91\xf0\x8e\xe3\x11\x03\
+\xd4\x05\xfd\xb3\x73\xd7\x5e\x33\xed\x56\x4d\xc5\x7b\x3f\x2d\xaf\
+\x69\x91\x09\xc1\x06\xcf\x04\x34\x8a\x1c\x32\xab\x9f\x33\xb2\xf7\
+\x94\xda\x96\xc0\x7b\x33\x9e\x5f\xf5\xdc\x37\xd5\x1e\xd3\xe6\x4c\
+\x85\x88\x14\x10\x02\x0c\xa5\xc7\x3a\x91\x5f\xd3\xcd\x36\x51\x15\
+\x56\xbb\x78\x50\xee\x10\x44\x69\x12\xc6\x44\xa3\x08\x4b\x09\x4e\
+\x1c\x8b\x92\xd3\x37\x3d\xba\x5f\x7f\x64\xd6\x53\x4b\x37\xd6\x06\
+\x55\x86\x22\x84\x16\x35\x88\x0a\xc3\xae\x65\x6c\x4a\x1a\xea\x19\
+\x27\xe3\x5f\x8d\xef\xd3\x6b\x6c\x8f\xe4\x8c\xcf\x0f\x36\x36\x7e\
+\x87\xaf\xdc\x46\x07\x61\x13\x56\x17\x84\xc1\x0c\xcf\x2e\x1c\x31\
+\xf1\xac\x7e\x39\x63\x2f\x1f\x90\x93\x57\x9a\x95\x40\x92\x53\x9d\
+\xad\xdb\x2b\x5b\x35\x95\x1e\x1b\x0a\xe6\xe8\x33\x66\xc8\x50\xbc\
+\xa9\xd6\xe3\x7b\x63\x47\xcd\x9a\x64\x87\x54\x3d\xae\x57\x7a\xdf\
+\x90\xaa\xc7\xbb\x65\x82\x57\xec\x69\x5e\xfa\xd8\xc6\x03\xfb\x8d\
+\x5b\xd3\x62\x9d\x68\xfd\x8f\x26\x5f\x39\x30\x33\x96\x7d\x55\xd1\
+\x5c\xed\x53\x75\x22\x85\x6d\xbb\x4c\x09\xa6\xca\x13\x42\x2b\xf6\
+\xd5\xee\xfc\xe6\x40\xd3\xe6\x47\xd7\x97\xef\xa7\x8c\x51\x8c\xc2\
+\xbf\xcf\xe9\x95\x4f\x1e\x9e\xdb\xff\xea\x90\xae\x8d\x5e\x32\x28\
+\x3f\x77\x57\xbd\x77\xc3\xe6\x5a\x8f\xca\xf5\x51\x46\xd9\x5e\x2d\
+\xab\xda\xf3\xda\x8e\xaa\x3d\x04\x4e\x73\xe6\xa6\x0b\x17\x0f\xcc\
+\x4f\x7c\x61\xe1\xf0\x1b\x03\xc1\xd0\x80\xa9\x3d\x63\x52\x36\xd6\
+\xb4\xac\x2a\xab\xf7\x33\x7e\x8e\xd8\xba\xca\x96\xd6\xc3\xb5\xfe\
+\xcd\x7f\xfe\xa2\xfc\xab\x6f\x6a\x9a\x19\x98\x2d\x84\xcd\x27\x10\
+\x22\x19\xb1\x4e\xf6\xb7\x19\x03\x06\xff\xf1\xcc\xfe\xb3\x9e\xd9\
+\x5c\xb1\xc9\xaf\x52\xdc\xda\xe2\xd3\x2e\xc9\x4d\x4a\x89\xcb\x4c\
+\x1c\xc0\x54\x4d\x4a\x74\x49\xfe\x67\xb6\x54\x3f\x73\xe1\x8b\x6b\
+\x5e\x7c\x61\x6d\x99\x97\x98\x07\xfa\x1c\x1f\x08\x90\x2f\x09\x1d\
+\x32\x41\x8b\xfa\x64\xc4\x3c\x7d\xd5\xdc\x01\x77\x8d\xca\x99\x34\
+\xa9\x57\xea\xe8\x92\xf4\x78\xfc\xd7\x55\xfb\x76\x33\x5b\xc7\xdb\
+\xe5\x60\x13\x56\x17\x84\x31\x98\xae\x1c\x94\x5f\x94\x80\x51\x02\
+\xc6\x38\x7e\x78\x7e\x5a\x9f\xf9\xc5\x59\x45\xe7\x16\xa5\xbb\x1b\
+\x02\x7a\xeb\x9e\x26\x1f\x37\x2d\x3a\x02\x26\x1c\x6c\xda\x18\x54\
+\xc8\xdb\xbb\x6a\x0e\x95\xd5\x78\xd7\x8e\xef\x99\x9c\x95\x96\x91\
+\x9c\xfe\xf4\xea\x8a\xe7\x3f\x3f\x5c\xeb\x37\x6e\xbb\x65\x6c\xaf\
+\xde\xe7\x95\xe6\x5c\x31\xac\x47\xfa\xa8\x71\xd9\x89\xfe\x0f\x6b\
+\x94\xbd\x9e\x90\x8a\x31\xd5\x4d\x6d\xbd\x41\x7e\x55\xad\x0a\xfa\
+\xba\xaa\xa5\x31\x4c\x56\xe1\x23\xee\x63\x1d\x98\xfd\x63\xce\xa0\
+\x39\xbd\x53\x62\xce\xf4\x04\xd5\x7a\x4a\x51\xcf\x8b\x86\xe6\x67\
+\x6f\xaa\x6a\x5a\xb7\xa3\xde\x67\x12\x8c\x1e\xd6\x53\x61\x7e\x9a\
+\x33\x86\x83\x22\x2e\x1c\xdc\xc3\xf1\xec\xf9\x43\xaf\xf7\x87\xb4\
+\x01\x21\x8d\x36\xc4\xb9\x5c\x85\xb9\x89\x89\xa1\x97\xb7\xd7\xec\
+\x56\x74\xcd\xb4\x71\x35\xa4\xb4\xf5\xd5\xcd\x8d\xd5\x7e\xbf\x59\
+\x06\x9d\xc1\xf2\xd5\xe1\xc4\xb9\x19\x69\xec\xa5\xb9\xfd\xcf\x3c\
+\x6f\x48\xc1\x8f\x92\xdc\x52\x51\x6b\x48\xdd\xfc\x79\x79\x53\x63\
+\x00\x21\x94\x9f\x14\xa7\x4e\x29\x4e\x9d\x1a\x72\x25\x6d\xfa\xe7\
+\x41\xf6\xc8\xb5\x2f\x7d\xb6\xbd\x39\xa4\x62\x83\xac\x68\x84\x03\
+\x71\x8c\xbf\x9d\x32\x41\x17\xf4\xcf\x4d\x7a\x6a\xce\xa0\xe1\xd7\
+\x8f\xef\x3b\x39\x39\xd8\xd0\x57\x53\xb5\x58\x5d\x67\xb4\xba\x35\
+\xd8\xf4\xcf\xf5\xe5\xbb\xed\x75\x61\xd7\x83\x4d\x58\x5d\x10\x86\
+\x48\x70\xfd\xc8\xc2\x92\xf4\x18\x57\x92\xa2\x53\x35\xa8\x68\x5a\
+\x30\xa8\xbb\xb2\x12\x62\x0a\x2e\x1a\x92\x5f\x32\xad\x20\x35\xfe\
+\xb9\xad\x87\x0f\xeb\x42\x28\x16\xbe\x54\x04\x25\x38\x93\x08\x22\
+\x9b\xeb\x5a\xfd\x9f\xec\x6b\xd8\xb0\xb9\xa2\xb1\xec\x9f\x9b\xf6\
+\x57\x6a\x94\x32\xa7\x84\xd1\xbf\xe7\x0c\x9c\x15\x27\xc9\x7d\x5a\
+\xfc\x4a\xb0\x67\xbc\x63\xf4\x6d\x73\x26\xa7\xee\xab\x6e\xde\xbe\
+\xa9\xaa\x5e\x73\xca\x92\x19\x65\xcf\x20\x0c\x09\xec\xac\xf8\x41\
+\xae\xbf\x99\x5a\xdc\xe3\x92\x11\x05\x57\x36\x78\x82\xba\x53\x22\
+\x58\xa7\x2c\xe8\xc0\xb8\x57\x41\x4a\xac\xeb\xe5\xad\x95\x5b\x83\
+\x3a\x3b\x22\xcd\x70\xfd\x96\x51\xc2\xdc\x84\x58\xf4\xe1\xc5\x93\
+\xaf\xd4\xb5\xe0\x58\x3d\xec\x16\x23\x7b\x15\x55\xeb\x9f\x9b\xda\
+\x1b\xe9\x8e\x4d\x9f\x1c\xa8\x6e\xe5\x4b\xc6\xb0\x4b\x0d\x36\x4d\
+\x0c\x4c\xdd\x15\x43\x6c\xc9\x90\x22\xf7\x8a\x1b\xe7\x5c\x9e\xcd\
+\xbc\xe7\xb6\x06\xb5\x20\xa1\xc8\xd1\x27\x2d\x41\xfd\xf7\x86\x83\
+\x9b\x0d\x89\x53\x6f\xf0\x04\x26\xf5\x2a\x2a\x3f\xe7\x85\x2f\xde\
+\xfc\xef\x17\x5b\x3c\x0e\xcc\x4c\xdf\x45\xd3\x2d\x09\x63\x24\x4b\
+\xe6\xc1\x14\x18\x22\x8b\xa2\x73\xfa\x64\x24\xbc\x7c\xfe\xf0\x89\
+\xd7\x8d\xea\x35\x31\x35\xc6\xd5\xd3\x1b\x50\xb0\x8e\x25\x15\x61\
+\xac\x3b\x09\x21\x4d\x41\xad\xf5\x1f\x36\x61\x75\x49\xd8\x4a\xf7\
+\x2e\x08\x63\x90\xc5\xbb\x1c\xd8\x21\x93\x18\x9d\x51\x63\xb5\x85\
+\x1d\x12\xd6\x43\x9a\x1e\x6c\xf5\x85\x1c\x43\xb3\x93\x07\xa5\xc7\
+\xb9\x4c\x05\x7a\x8a\xdb\x81\x53\x62\x64\x53\xb2\x91\x20\x22\xa9\
+\x31\x50\x35\xd0\x1b\x6d\xa9\xf3\x68\x8f\xae\x2f\x2f\x53\x34\x5d\
+\x37\x78\xe4\x8c\xc2\x8c\x84\xdc\xf8\xf8\xa1\x21\x4d\x57\x0c\x42\
+\x50\xb0\xe4\xf5\xed\xdf\x3e\xf5\xbf\x33\x7a\xdf\x76\xc5\xe0\x1e\
+\x69\x8a\xa6\x33\x38\x3e\x2b\x7c\x40\x2a\x28\xa2\xe3\x1c\x12\xba\
+\x7c\x60\x8f\x25\x5e\xaf\x12\xe7\x90\x88\xe9\xd2\x23\x11\x2c\xb5\
+\x86\x34\xdf\x84\xfc\xb4\x99\xef\x2d\x1e\x75\x36\xe6\xe6\x5d\x3c\
+\x3c\x72\x98\x2f\xd0\xb3\xf3\x07\x5f\xe8\xc2\x81\x29\x2a\x45\x5e\
+\x02\x86\xa9\x0e\x49\xd2\xbc\x1e\x5f\xe2\x8f\x87\x67\x2c\x8a\x77\
+\xca\x47\x02\xee\x19\x79\xf1\x08\xa8\x0a\x65\xec\x8a\xa1\x05\xa9\
+\xcf\xcc\x2a\xbe\xd5\x7f\x60\xc7\x54\x85\x49\x3e\xb3\xcc\x94\x2a\
+\x39\x31\x8e\xa1\x53\x7a\x26\x27\x1a\x69\xad\x08\x68\xc1\xa2\xc7\
+\x3e\x58\xb3\xb1\xb2\x41\x27\x58\xc7\x2a\x33\xc3\x26\x87\xdd\x74\
+\x90\xf1\x07\x62\xbd\x53\x12\x51\xa2\x5b\x36\xfb\xfb\xcc\xe2\xec\
+\xec\x41\x3d\xd2\x07\xd7\x7b\x83\x24\xa4\x6a\x41\x87\x44\x8c\xfb\
+\x31\xf9\x7f\xf6\xae\x3c\x38\x8e\xea\xcc\xbf\xf7\xba\x7b\xa6\xe7\
+\x96\x46\x33\x3a\x2c\xd9\x96\xac\xcb\x92\xe5\x43\xbe\x63\x1b\xe3\
+\x38\x31\x16\x22\x38\x71\x48\x48\x38\x0c\x5b\x59\xc8\x06\xb3\x14\
+\x47\x01\x05\x38\x6c\x65\x53\x94\xcd\x86\x4a\x28\x73\x1a\x88\x93\
+\xe5\x32\x24\xde\x8d\xc3\xe9\x03\xdf\xc6\xb2\x65\x1b\xc9\x96\x64\
+\xdd\xf7\xad\xd1\x8c\xe6\x9e\xe9\xf3\xbd\xad\x3e\x46\x08\xc8\x6e\
+\xe0\x8f\xad\xf8\xe8\x5f\x15\x54\x7b\xba\xdd\xfd\x5a\xe3\xfe\xe9\
+\xfb\xbe\xfe\xbe\xdf\x0f\x00\x5a\xf9\x99\xdb\xcc\xa9\xe9\x49\x03\
+\x97\x1a\x0c\xc2\xba\xc4\xa0\xa6\x42\x98\x80\x5d\x4d\xfd\xe7\xfa\
+\xc3\xdc\x59\x2b\xeb\x88\x38\x59\x8a\x32\x51\xd0\xac\x3e\x83\x40\
+\x25\x2e\x3e\xd5\x97\xf0\x4f\xf3\xa6\xa7\x37\xfe\x7c\xf5\x9a\x9f\
+\x96\xe7\xb8\x4d\x94\x56\x67\x4a\x11\x97\x3e\xac\xac\x44\x48\x28\
+\x25\x41\x53\x98\x6e\xf5\x5a\x1c\x66\x97\x28\x63\x4d\x41\x41\xf9\
+\x37\xc0\x98\xa3\x31\x0c\x8a\x5e\x5a\x5f\xf2\xf8\xcb\x77\xff\xb0\
+\x88\x75\xa6\xe9\x23\x7f\x9f\x3f\xb5\xbc\x4c\x40\x02\xe3\x3e\x0b\
+\x8d\x20\xd6\x2c\xbc\x54\x28\xc1\x4b\x9c\x97\x60\xa1\xdb\x5e\x66\
+\x37\x7d\x25\x60\x27\x56\x86\x02\xa5\x6e\x7b\x9e\x44\x20\x98\xc2\
+\x02\x44\x96\x65\xca\xce\x40\x69\x77\xf3\xe8\xf9\x98\x20\x4d\x6a\
+\xb8\xa7\x3a\x56\x59\x42\xc8\xcb\x0b\xa6\x17\xbe\x74\xe3\xbc\xc7\
+\xe3\xa2\x54\xa2\xac\x11\x41\xa0\xae\x59\x90\x30\xb2\x38\x58\x67\
+\x61\xba\x23\x13\x68\xaa\xa6\x10\x00\xac\xca\x66\x61\xb5\xf8\xaf\
+\x75\xbe\x2b\x3f\x8b\x9c\x2c\x2f\x78\xe5\xae\x1f\x67\x76\x6d\xfe\
+\xf6\x75\x9b\xe6\x4e\xf3\xa8\xf7\x22\x4a\x09\x20\x4a\x09\xad\x7b\
+\x01\x52\x0c\x24\x6c\x9a\x19\xa1\xa0\x20\x4d\xf4\x86\xf8\xd3\xef\
+\x5e\x0c\x9e\x95\xb5\x5a\xe1\xff\xf7\xd7\x6d\xe0\x1b\xc2\x48\x09\
+\x2f\x31\xa4\xd2\x90\x83\x3d\x81\xd8\x0b\xe7\xfa\xfa\xeb\x47\xe3\
+\xad\x41\x0e\x8e\x64\xd9\x2d\xa2\xdb\xc6\xd8\xac\x26\xca\x06\x09\
+\x41\x2f\x9e\xeb\x6b\x08\xf3\x92\x50\x99\xe3\xcc\xfe\x69\x65\xfe\
+\xb5\x1b\x4b\xb2\x8a\x36\x14\x65\xda\xa3\xbc\x1c\xec\x08\xc5\x79\
+\x41\x56\x87\x7e\xd5\x3a\x90\xde\xc5\xad\xd6\x93\xce\x0e\x87\x82\
+\x69\x08\x74\xae\x9d\x9d\x53\x2a\x8a\x52\x3a\x26\x40\x50\xa2\x1e\
+\x82\x89\x08\x20\x72\x2e\x48\xa7\x16\xbc\x70\xb2\xf5\x68\x52\x94\
+\x24\xbd\x0e\xa5\x3e\xb8\xca\xc3\x7f\xac\xd7\xdf\x74\x53\x59\x9e\
+\xc5\xc1\x52\xe5\x82\x84\xd5\x46\x4c\x09\x63\xda\x65\x63\xe3\x4f\
+\x1e\xea\x7c\xf5\xc4\x40\x20\x3a\xd5\xa3\x50\xd9\xe6\x25\x0c\x44\
+\x04\x7b\x37\x94\x65\x2f\x89\x73\xa2\x59\x21\x38\x51\x96\xa1\x3b\
+\xcd\x69\x7a\xb7\x37\xb6\xeb\x67\xff\x55\x7b\x48\x9f\x51\xd4\xfa\
+\xbb\xf4\xe6\x50\x87\x99\x66\x5f\xbf\x6d\xe9\x2f\x31\x26\x6e\x4c\
+\x48\x52\xe1\x20\xb5\xf3\x1d\x21\x6b\x9a\x8b\x0d\xfc\xee\x78\xfb\
+\x8e\xa7\x4e\x74\xb6\x29\xc7\xcb\x64\xb2\x79\x1f\xa4\xea\x68\x66\
+\x1a\x82\x9b\xcb\x73\xd3\x76\xac\x2f\xfb\x56\x55\xae\x79\x25\x24\
+\xc2\xb4\xfd\x9d\xe3\xbd\xb5\xc3\xa1\x60\x75\x89\xd7\xbe\x7c\xa6\
+\x67\x2e\x03\x11\x4d\x21\x39\x3a\x48\x6c\xad\x7f\xf1\xd3\xa7\xef\
+\xfc\xcf\xbd\x67\x7f\x7d\xb2\xbb\xff\x70\xef\x68\x8c\x00\x63\xfa\
+\xf9\x52\x04\xfd\x8f\x5e\x80\x81\xbf\x0d\x4d\x7a\x45\x06\x1f\xb4\
+\xf7\x49\x1f\xb4\xf7\x0f\xd0\x08\x0e\x54\x17\x64\xb1\xeb\x8a\x33\
+\x0a\xd6\xcf\xf2\x16\x2b\x84\xa4\x1e\x07\x90\x15\x88\xb2\x1c\x8c\
+\xf3\x70\xb6\xd7\x39\xef\xad\x9b\x2a\x8b\x2f\x8e\xc5\x2f\x6c\x3b\
+\x39\x74\xe1\xed\xa6\x76\x71\x6a\x77\x79\x6a\x94\xe6\xa1\xc3\x6d\
+\x2d\x27\x46\x62\x4f\x3d\xfb\xdd\x92\x3b\x67\x38\x2d\x4b\x42\x49\
+\x31\x49\x21\xb5\x63\x80\x70\x31\x2e\x00\x31\x16\xf5\x65\x4c\xd6\
+\xaf\x94\xdd\x0d\xbe\x18\xac\xda\x55\xb3\xeb\xc0\xa6\x15\x66\xa7\
+\x89\x5a\x1b\xe3\xa5\x48\x86\xd5\x64\xdd\xdd\x34\xb8\xe7\xb9\x73\
+\x9d\xc3\x10\x02\x55\xaa\x26\xd5\x32\xa6\x1a\x64\x40\x80\x9e\x3f\
+\xd5\x35\xb2\x3a\x2f\xed\x83\x1f\xcd\xce\xde\x14\x48\x08\x31\x3b\
+\x4d\xd9\x27\x38\x69\xf7\x33\xe7\xfd\x07\x35\xbf\x56\x88\x91\x7e\
+\xcf\xa9\xba\x1c\x44\x48\xe0\x64\xe8\x33\xd1\xc4\xa1\x0e\x14\x62\
+\x4c\x1c\x26\xca\x3e\x92\x90\xce\xff\xec\xfd\xfa\x3f\xfc\x77\xeb\
+\x58\x50\xf7\xf0\xff\x42\xe7\xbb\x92\x5a\xde\x3a\x37\xdb\xf4\xe8\
+\xf2\xc2\xca\xf9\x39\x19\x15\x9c\x20\x59\xfc\x81\x30\xe7\x4d\xb3\
+\x4a\x32\x01\x16\xe5\xb8\xb1\x88\x4c\x82\x61\x6e\xf0\x8d\x86\x81\
+\xd6\xc3\x7d\xbe\xde\x8f\xbb\x83\x9c\xa4\xfc\xee\x96\x34\x1d\xc2\
+\xbf\xe1\x30\x66\xe0\x12\x81\x11\x61\x5d\xa2\x98\x32\x60\x0c\xf4\
+\x66\x48\xd8\x16\x8c\x49\x7b\x3b\x7d\xfe\xe7\xcf\xf6\xb6\x71\x32\
+\x56\x9e\x4d\xb2\x6c\x9a\x2b\xa7\xba\x34\xbb\x38\xca\xcb\x1c\x21\
+\x50\xe4\x04\x99\xc9\x76\xb0\xf9\x1b\x67\x67\xe4\x97\x79\xac\xdc\
+\x99\xe1\x70\x30\xcc\x4b\x9a\x5b\xb2\x56\x99\x57\x52\x26\x74\xd1\
+\x17\xe1\x0e\x74\xfb\xce\x2c\xce\x76\x27\xa6\xbb\xd8\x72\x25\x2d\
+\x73\x9a\x19\xea\xc3\x0e\xff\xde\x37\x1a\x07\x3a\x21\x00\x48\x37\
+\x34\x55\x28\x04\x51\x94\x9a\xd2\x91\xe1\x18\x0f\x3f\x6e\xf7\x9d\
+\xbf\xa9\x2c\xc7\x63\x36\xd3\xe5\x82\x04\x2e\xde\xfb\x51\xe3\x1b\
+\x83\x51\x4e\x21\x37\xd5\xaa\xde\x6b\x35\x21\x2b\x43\xc3\xb8\x28\
+\x2b\xd7\x54\x29\x68\x20\x9a\xec\xf9\x71\x49\x66\xa9\x99\xa6\x0a\
+\x26\x92\xe4\xbd\x35\x3b\x8f\xef\x69\xec\x1d\x44\x0a\x1f\x52\x48\
+\x1d\x2f\x52\xd3\x3d\x4a\x53\x06\x45\x09\x49\xc6\x0b\xb3\x9c\xd4\
+\x82\x6c\xe7\xfc\x10\x2f\xca\x5e\x9b\x85\x19\x4e\x82\xf7\xae\x7b\
+\xf3\xd3\xd7\x8f\xf7\x07\x93\x08\x41\x75\xa0\x9b\x9a\xa2\xf9\x9c\
+\xe7\xb2\x50\x2f\x54\x55\x94\xfd\xf2\x9a\xd2\x75\x5e\xab\xa5\x30\
+\x9a\x14\x30\x2f\x63\x5e\x06\x04\xda\xad\x26\xeb\x81\x4e\x5f\x77\
+\xed\x50\xc8\x77\x7a\x68\x22\xb1\xad\xa6\xb3\x65\x5f\xf7\xb8\xbf\
+\x2d\x90\x90\x94\x14\x97\x22\x18\x42\xf8\x55\x13\x58\x03\x97\x16\
+\x8c\x1a\xd6\x25\x0e\x09\x93\x94\x8a\xa6\xda\x36\x80\x3e\x77\x8b\
+\x51\x9f\xab\x71\xde\xdc\x93\x08\x88\xe7\x3d\x14\x06\x50\x16\x58\
+\x19\x63\x39\xc1\x4b\xf1\x48\x52\x70\xdd\xb2\xb4\xf0\xfa\xcd\x8b\
+\xf2\x67\x29\xc7\x99\x29\xd5\x2b\x0c\x98\x68\x44\x01\x02\xd4\x82\
+\x7c\xab\x3f\x81\x96\xff\xf1\xc4\xfe\xe7\xce\xf6\x3d\x97\x69\x67\
+\x93\x14\x42\x52\xcd\x50\xe0\x3c\xd0\xd3\x40\xe5\xaf\xbc\x56\x3d\
+\x6f\xde\x3d\x4b\xa7\xb9\x24\x59\xed\xb1\x42\xca\x1a\x2e\xfa\xa3\
+\xa4\xfa\xad\xda\x37\xd2\x64\x52\xff\x51\x7d\xff\xbe\xd3\xc3\x21\
+\x99\xd2\x64\x8e\x91\x3b\x33\x8b\xec\xbb\x63\xd5\xf5\xfb\xee\x58\
+\x55\xad\x6c\x2b\x44\x44\x21\x84\x4e\x0f\x84\xc8\xfe\x10\x3c\x00\
+\x68\xf6\xc8\xba\xb7\x3f\xfd\x73\x6b\x30\x06\x69\x0a\x61\x46\x1d\
+\xb0\x26\xe4\x9e\x39\x33\x9d\xaf\x54\xcf\x9f\xa7\x10\x5c\x8a\x83\
+\x8e\x8f\x45\x2e\x20\x9a\xe2\xbd\x36\xb3\xf4\xca\xb9\xc1\x97\xaf\
+\xfd\xe3\xe9\xbf\xb6\xf9\xe3\x80\x51\x2e\x06\x01\x06\x10\x50\x32\
+\x26\xca\xbd\xa9\xac\xfe\xaf\x8b\x0b\xf2\x37\x2d\x2f\x5a\x17\x49\
+\x8a\xb6\x08\x27\xc4\x95\x08\xcf\x6e\xa2\x2d\x19\x36\x56\x3c\xd3\
+\x1f\x38\xb5\xbf\x6b\xbc\x0b\x68\x6f\x52\x53\xf6\x60\x50\xff\x85\
+\xa0\x3b\xeb\xfc\x23\xbf\x69\x03\x5f\x07\x46\x84\x75\x19\x61\xaa\
+\x4a\x01\xd6\x7a\x94\x40\x93\x3f\x24\xbc\x5d\xdb\xde\x43\x4f\x2f\
+\xee\xab\x28\x2b\x44\x6e\xcc\xb9\x05\x81\x37\x0b\x18\x08\x36\x00\
+\xe4\x43\x7d\xfe\xf6\xa3\x7d\x81\xb0\xf2\x70\x4e\x77\x59\x98\x10\
+\x27\x4a\x12\x04\x28\xe5\x5d\xa8\x9c\xe6\x93\xee\xf1\x31\x13\xcd\
+\xb4\x38\x4c\x90\x7b\xf0\x40\x73\x1d\xaf\xcd\xf5\x90\xea\xc2\x2c\
+\xeb\x33\x55\x73\x1f\xb9\xa1\xdc\x5b\xd8\x1b\x95\x3e\xab\x1b\x0c\
+\xca\x0a\x59\x60\x00\x88\x3f\xce\x4b\x1d\x6d\xa3\xf5\x7b\xda\xc7\
+\x86\x47\x65\x4c\x18\x84\x94\x28\x10\x6f\xdd\xb8\x7a\xe6\xc6\xa2\
+\xb4\xbb\x72\x5c\xec\x6c\xb3\xcb\xd3\xb8\xbf\xa1\x33\xc8\x50\x14\
+\x94\x31\x26\xfd\xc4\x3e\xb6\xb3\xb6\xbd\xa1\x71\x34\x28\x53\x08\
+\xa9\x4a\xa5\xbc\x2c\x93\xcd\x8b\x73\x99\x97\x7e\x30\xef\x17\x8b\
+\xf2\xdc\x6b\xcf\x0e\x04\x8f\xb7\x06\x62\x82\x72\x8f\xed\xe3\x51\
+\xbe\x2a\x3f\x93\x7d\xb3\x61\x78\xcf\x03\x9f\x34\x36\x87\xf9\xa4\
+\xb2\x6e\xb5\x11\x55\x94\x09\xcc\xb4\xda\xf1\x34\xa7\x89\x9d\x48\
+\x0a\x58\x89\x36\x57\xcd\x70\x59\x56\x67\xb9\xf2\xa3\xbc\x8c\x5d\
+\x2c\x6d\xb6\x59\x98\xe4\xd9\xe1\xe0\x85\x07\x0f\x34\x1f\x7b\xf8\
+\x93\x96\x6e\x7f\x52\x50\x53\xdd\xd4\xcf\x30\xd5\x06\x62\xe0\xf2\
+\x81\x41\x58\x97\x31\x74\x8d\x17\x18\x85\x10\xee\x6d\xea\x4c\xfe\
+\xb9\x27\xd2\x4b\x11\x53\xef\x1c\xb7\x8d\x4e\xb3\x50\x1e\x8a\xa5\
+\x99\xf3\x43\xe1\xcf\xf6\x77\xfb\xb8\x1b\x4b\xb3\xcc\xc7\x37\xad\
+\xf8\xde\x2c\x17\x8b\xbb\x87\x42\xfe\x11\x4e\x52\x85\xfa\x94\x88\
+\x46\x89\x36\x0e\xf5\x8c\x87\x5f\xa9\xeb\x6f\x56\xc8\x2a\x65\x15\
+\xff\xfc\x86\xca\x95\x33\xac\xd4\xf2\x70\x14\x67\xdd\x3c\x67\xda\
+\xcc\x6e\x9e\xaf\xab\xef\x0f\x8a\x0c\x45\xa9\xea\xa6\x0d\x09\x51\
+\x1a\x93\x31\x4e\xbd\x91\xfc\xf1\x9c\x62\xea\x37\x0b\x5d\x9b\xc3\
+\x89\xa4\x97\xe3\x38\x74\x8d\x9d\x4c\x6f\x1f\x13\x6b\x1a\x02\x21\
+\x59\x39\x66\x68\x6c\x8c\x8c\x84\x63\x6a\x8d\x0b\x42\x80\x44\x19\
+\x93\xcd\x95\xd3\x99\x17\xbf\x3f\xff\x9e\x40\x4c\xac\x64\x08\x60\
+\x33\x33\x6d\xe3\x6f\xd6\x0d\xf4\x2a\x6b\x10\x64\x4c\x76\xd4\xf7\
+\x35\x1f\xec\x1d\x0f\x52\x6a\x6b\x07\x05\x30\x26\x08\x13\x82\x4b\
+\x33\xac\x60\xf7\x0f\x57\x56\x6c\x5b\x5f\xb4\xea\xec\xf8\x78\x7b\
+\xbb\x2f\x29\x6f\x98\x33\x03\xae\x98\xe5\x5d\xc0\x00\x22\x9e\x1b\
+\x8e\x36\x3c\x78\xb0\xe9\xd8\xa3\x87\x5a\x7a\x5b\xfc\x31\x11\x4e\
+\x51\x60\x35\x70\xf9\xc2\x20\xac\x2b\x00\x29\x0b\xab\xd0\xc4\x04\
+\xdc\xdb\xda\x9b\x7c\xe7\xe2\x78\x8f\x89\xc2\xfd\x2e\x1a\x50\xff\
+\xf1\x69\x57\x5f\x7f\x34\x29\xde\x58\x9c\xe5\xaa\x2a\xc9\x5a\x54\
+\x9a\xed\x2a\xbd\xaf\x28\x33\x23\x2e\x91\x89\xf3\xc1\x68\x82\x13\
+\x09\x32\xe9\xc5\x2d\xfc\xf9\x43\x4d\x0a\xd2\x2d\xd4\x93\x2b\x0b\
+\x6f\x81\x00\xa4\x01\x08\x12\x92\x2c\xe7\xff\x64\x4e\xee\xf4\x89\
+\x84\x5c\x77\x6a\x20\x20\x29\xd7\xa3\xa0\x26\x71\x23\xeb\xce\x38\
+\xaf\xde\x58\x56\x35\xdd\xed\xf8\xb6\x20\xe3\x04\x84\x48\x62\x59\
+\xd3\xb4\xbc\x0c\x96\xdb\x59\xdf\xdf\x41\xd4\x9a\x18\x22\xa9\x66\
+\x52\x0c\x10\xb9\x7f\xed\x6a\xe6\xf9\x6b\x67\xdd\x13\x12\x84\xa5\
+\x34\x80\x51\x4c\x08\xe5\x61\x68\xfb\xee\x96\xd1\x9a\x10\x27\x62\
+\x7d\x2d\x90\x86\x00\xd2\x08\x41\x5e\xc6\xd0\x46\x9b\xf1\xfd\x4b\
+\x67\x78\xfe\x7a\xcb\xd2\xef\x3a\x4c\xa0\xd2\x4c\x21\x50\x3f\x14\
+\x6d\xab\x19\x08\x0a\x82\x48\xa3\x22\x27\x03\x1f\x38\xd0\x74\xf4\
+\xb1\x23\x2d\xdd\x2d\xe3\x1a\x51\xa5\x84\xf9\x0c\xb2\xba\xfc\x61\
+\x10\xd6\x15\x80\x49\x25\x51\xd5\x7a\x1d\xc0\x10\x97\x84\xfb\xba\
+\x7c\xf1\x17\xcf\xf5\xf5\x0c\xc7\x39\x75\x8a\x67\x49\x4e\x9a\xa7\
+\xaa\x20\xab\xd4\x1f\x49\x72\xd8\xc1\x66\x7e\x6f\x6e\x5e\x49\x75\
+\x81\x47\xfa\x74\x60\xcc\xe7\x4b\x88\x58\x86\x7a\x41\x5e\x6f\x4b\
+\xb8\xb9\x3c\xdb\xf3\x93\xf9\x79\x1b\xc2\x49\x11\x31\x94\xfa\x11\
+\xcf\x27\xb8\xfc\x8d\x4b\xe7\x67\x75\xd2\x9e\xcf\x1a\x3a\xba\x31\
+\xa4\xd4\x12\xa8\xfa\xa6\xee\xf6\xb9\xb9\x99\xf7\x2d\x99\x71\x77\
+\x98\x13\x89\x26\xd1\x02\x50\x52\x94\xa5\xa2\x74\xb6\xa8\x33\x98\
+\x3c\xd7\xe8\x8b\xc6\x90\xee\x6e\xaa\xac\xb5\x30\x3b\x03\xed\xb9\
+\x6b\xcd\xcf\x93\xe1\x91\xe5\x10\x52\x31\x85\xc8\x38\x09\x43\xaf\
+\xcb\x62\x6b\xf6\x45\xcf\xd4\x8d\x84\xe3\xfa\x5a\x08\x46\xaa\x0a\
+\x0d\x29\xf7\xa6\xc1\x0f\x7f\xb4\x68\xfe\xa6\x85\xf9\xdf\x09\x27\
+\xc4\x74\x4e\xc4\x09\xbb\x85\x31\x7f\xdc\x31\xd6\x7b\x7a\x28\x14\
+\x1d\x8c\x44\xe5\xdf\xd7\xf7\x0f\xb4\x05\xe2\x02\x98\x42\x54\x46\
+\xda\x77\xe5\xc0\x28\xba\x5f\x41\xc0\x18\xab\xad\x04\x08\x6a\x75\
+\x9e\xa9\x4e\x3a\x13\x49\x21\x02\xac\x52\xc0\x63\x33\xdb\xb0\x20\
+\x89\x13\xe1\x04\x9c\x9d\x91\xb6\xba\x69\xf3\x8a\xea\x07\x17\xe5\
+\xb9\xec\xba\xbd\x8e\xde\x8a\x00\x5f\xad\x1b\x1c\xdf\x7a\xac\x63\
+\x87\xd7\x65\x11\x45\x8c\xcd\xca\x39\x64\x48\x85\x41\xc2\x77\xcd\
+\x6c\x61\x68\xbd\xf2\x67\x44\x00\x95\x1a\xd4\xeb\x0a\x72\x21\x02\
+\x2d\x83\x14\x04\x26\x5d\x32\x06\x2b\xdb\x04\xb2\x83\xdd\x41\x2e\
+\x04\xf4\x46\x29\x4a\xef\x74\xbf\xbd\x28\x6d\xbd\x79\xac\x6b\x8d\
+\x48\xa8\xa8\xb2\x47\xc4\xc4\xec\x75\x5a\xa4\x6d\x47\x3b\x76\xbc\
+\x56\xd7\xe7\x53\xfb\xab\xf4\xd9\x1a\x3b\x06\xe4\xa1\x25\xf9\x69\
+\x4d\x9b\xd7\xdd\x30\x3b\xdb\x72\x4d\x30\x96\x50\xad\xf2\xb3\xec\
+\x8c\x2d\x92\x14\x86\x86\xa2\xc9\x08\x48\x99\x5b\x68\x1d\xf8\xea\
+\x4b\x89\x2f\xcf\x5b\x1a\xb8\xfc\x61\x44\x58\x57\x20\xa6\xbe\x9a\
+\xd7\x74\xcf\x21\x68\x1c\x8f\xf0\x75\x83\xc3\xed\xf9\xe9\xce\x64\
+\x51\x86\x23\x9b\x02\xc0\x12\x17\x04\x8e\x97\xcc\xee\x0d\x15\x79\
+\xb3\x51\x20\xe6\x3b\x34\x16\x8d\x30\x48\x53\x52\x56\xa2\xa1\x83\
+\xdd\xfe\x31\x33\x82\x1d\xd7\x15\x67\x2f\x8c\x73\x92\x05\x00\x20\
+\x59\x4c\x0c\x38\xd6\xe5\x3b\x7a\xa4\x6f\x62\x98\xd2\x86\x9c\xd5\
+\x71\x9c\x81\x08\x27\x3b\x4d\xe6\xee\x6f\x17\xa4\x2d\x4d\x4a\x98\
+\x21\x04\x20\x97\x85\x49\x6e\xaf\x1d\x7c\xf1\xf7\xf5\xdd\x41\x98\
+\x4a\x21\x81\xa6\xf2\xf9\x9d\xc2\x2c\xcf\xb5\x45\xd9\x0b\x12\xbc\
+\x28\x10\x00\x58\xb7\x83\x4d\x6c\x3b\xd6\xbe\xfd\x89\x23\xad\xcd\
+\xb4\x26\xa3\x43\x52\x9a\xef\xbf\x9a\x9b\x97\xfb\xeb\x0d\xf3\x37\
+\x04\x63\x31\xb7\x20\x12\xde\x66\xa6\x59\x2b\x8b\xe2\xe7\x86\xf1\
+\xf1\xeb\xdf\x39\x75\xfa\x44\x7f\x80\x47\x9a\x46\xbd\x76\xff\x06\
+\x4f\x5d\xb1\x30\x08\xeb\x2a\x42\xc7\x84\x44\x76\xd6\x0f\x8c\x42\
+\x60\xeb\x5a\x9c\x97\xce\xba\xad\x74\x56\x8c\x13\x64\x1b\x43\x31\
+\x87\x02\xb1\xc1\xa3\x3d\xfe\x80\x42\x12\xda\x5c\x9f\x3a\xbf\x48\
+\x1d\xe8\xf6\xfb\x4d\x08\xb5\x5c\x57\x9a\x59\x99\xe4\xe5\x74\x2c\
+\x83\xee\x27\x8e\xb4\xee\x1e\x8e\xf1\x18\x68\x46\x10\x50\x6b\xb7\
+\x00\x68\x5f\xd7\x68\xa4\x30\xdd\xc6\x2d\xca\x76\x2e\x32\xd1\x80\
+\x7a\xbb\x69\xe4\xdd\x5f\x7c\x54\x7f\x41\x1b\x0d\x82\x00\x4f\xb1\
+\xae\x8f\x0b\xd2\xf8\xad\xe5\x39\x0b\x65\x4c\xbc\x6e\xa7\x25\xb2\
+\xf5\x58\xfb\xb3\x5b\x8e\xb4\x76\x99\x28\x88\xb0\xd6\x74\x3a\xa9\
+\x2a\xba\xaa\x22\x77\xda\x9a\x3c\x77\x71\x8c\x93\x65\x4f\x1a\xcb\
+\xf4\x04\x63\xcd\xb7\xef\xa9\x3b\xf0\xc4\x91\xc6\x51\x7f\x82\x57\
+\xef\xcd\xe0\xa8\xab\x03\x46\x4a\x78\x15\x01\x41\x4d\xaf\xea\xdf\
+\x8f\xd7\x47\xca\x77\x1c\xfc\xe4\xd9\x33\x3d\x1f\x79\x5d\xe6\x18\
+\x30\x53\x94\x99\xe0\x30\xd0\xc5\x03\x2b\x3c\x16\xca\x6b\x03\x40\
+\x90\x09\x66\x19\x8a\xda\x72\xb8\xa5\x77\xdb\x91\xd6\xdf\xba\xd3\
+\x2d\x5c\xaf\xc0\xb5\x35\x04\x62\x92\x72\x3a\x1a\x41\x52\xea\x71\
+\x20\x9d\x2c\xd4\xde\xa6\xdf\xd5\xf6\x1d\x41\x14\xdb\x8e\x10\xdb\
+\xf1\x6c\x6d\xef\xe1\xa9\x3d\x63\x25\x19\x56\x04\x90\x56\x6e\x6b\
+\xf0\x45\xf8\xc1\x68\xb2\xd5\x9d\x66\xe3\xb7\x1d\x6b\xfd\xed\x96\
+\xc3\xad\x3d\xca\xb5\x04\x4c\x88\x17\x00\x50\xe1\xb6\x51\xa9\x59\
+\x46\x33\x01\x61\x60\xa6\x29\x8f\xcb\x14\xdf\x7e\xb2\xe3\xe3\xb5\
+\xaf\x9f\x3c\xb2\xbf\x2b\x90\x54\x92\x40\x04\x0d\xae\x32\x60\xe0\
+\x8a\xc6\xe7\xf5\x2d\x00\xaa\x0a\x33\xd8\xcf\xee\x5a\xbd\xfa\xde\
+\xa5\x33\xdd\xca\x3e\x1b\x43\x81\xe8\xc3\x6b\x96\x75\xdc\xb7\xa4\
+\x32\xc7\xae\x0a\x42\x40\x96\x46\x6a\x24\xbe\xbd\xaa\xac\xf0\xa1\
+\x65\xb3\x66\xe9\xa7\x81\x0e\x33\x0d\xe2\x8f\x55\x5f\xfb\xd0\xb2\
+\xc2\x3c\xe5\x03\x25\x3a\x52\xf8\x69\xfb\xfa\x85\x05\xdb\xd7\x57\
+\x16\x28\xdb\xda\x67\x00\x3c\xb0\xbc\x30\x57\x7a\xbc\x6a\x4d\xa1\
+\x59\x73\x11\x53\xfe\xf7\xd0\xf2\x59\x45\xdb\xd7\x57\x14\x29\xdb\
+\xfa\x35\x60\xb6\x93\x05\x1d\x3f\x59\x38\x3f\x76\xff\xda\xe5\x36\
+\x7d\x98\xfa\xde\xc5\x33\xd3\xcf\xdd\xb5\x7a\x75\x55\x51\x06\xab\
+\x8f\xfd\x40\x43\x4f\xe1\xea\x84\xf1\xa5\x5f\xa5\xd0\x9f\xf7\x49\
+\xd7\x98\x54\x18\xc4\xd2\x08\x34\xfd\xcb\xda\xf5\x85\x5e\x67\xf9\
+\x85\x81\x91\xda\x3b\x4e\xf8\x4e\x37\xf7\x0d\x61\x28\x70\x48\xd4\
+\x3a\xc4\x35\x25\x04\x4c\xc8\xcd\xb3\xb3\x9c\x6f\xfd\x60\xd1\xad\
+\x8c\xcd\x14\xdc\xf4\x61\xdd\x5f\xde\xaa\xed\x17\x4d\x14\x02\xa9\
+\x39\xc7\xd4\xf6\xa6\x79\x39\xa6\x37\x6e\x5a\xba\x11\x70\x52\xc6\
+\x93\xef\xd5\xed\x7a\xaa\x79\x24\xc4\xe8\xd2\xc7\xca\x71\x0c\x04\
+\x88\x98\x58\x5c\x3e\x33\x17\xbe\xbe\x2a\x7b\xd9\x82\x59\x59\xdf\
+\xea\x1a\x8b\xb4\x54\xbc\x7c\x78\x1f\x27\x61\x30\x55\x31\x54\x27\
+\x5b\x62\xc8\xae\x5f\x9d\x30\x52\xc2\xab\x14\x29\x23\x0b\x1a\x4d\
+\x8e\xfa\xa8\x40\x08\x01\x16\x8a\xd6\x70\x24\xc6\x17\xa7\x3b\x16\
+\x5e\x78\xb0\xea\xfa\x47\xd6\x95\xb1\x0a\x59\x31\x94\x16\x05\xc9\
+\x6a\x2d\x0a\x82\x87\x17\x95\x16\x40\x04\x28\x2e\x26\x78\x1f\x5b\
+\x58\xb8\x2c\xcf\xe1\x50\x08\x0a\xea\xf2\x36\x50\x21\xab\x69\x0e\
+\x13\x78\x74\x65\xe9\x4a\x3e\x21\x7a\x05\x40\x60\xd5\xca\x92\x59\
+\x94\x3a\xcc\xac\xf1\x24\x43\x21\x95\x08\x1f\x59\x55\xc0\x5e\xb8\
+\xff\xba\xea\x92\x0c\xdb\xe2\xf0\x44\x8c\xb7\x60\xc1\xaa\xac\x65\
+\x0a\xa0\xee\xcd\x68\x90\xd5\x55\x0c\x83\xb0\xae\x72\xe8\x0e\x31\
+\x3a\x03\x40\xc8\x09\x12\x98\xb0\xb8\x3b\x5c\x9e\x74\x39\x29\x61\
+\xd1\xdf\xd2\x3c\x63\x6b\x65\x5e\xf5\x23\xcb\x0a\xed\xa2\x8c\x65\
+\x4d\x14\x0f\x60\xbb\x99\x02\x79\x59\x6c\xbe\x20\x11\x9c\x10\x25\
+\x7e\x4e\xa6\xab\x7c\xcb\xca\x92\x69\xea\xb9\xa6\x50\xe0\x96\x95\
+\x45\x33\x2a\x32\x9d\xa5\x71\x51\xe2\x64\x99\x90\x62\xbb\x69\xa6\
+\x9e\xea\x11\x85\x2b\x45\x19\xe3\x07\xbe\x55\xe0\xd8\xba\xa2\xe0\
+\x86\x40\x5b\xeb\x8c\x84\x48\x44\x97\xc7\x25\x07\xad\xd9\x1d\x9c\
+\x6a\x98\x31\x49\xa6\x86\x9b\x8d\x01\x83\xb0\x0c\x68\xd0\x25\x8d\
+\x09\x06\x00\xae\xfb\x53\x7d\xd3\xd6\x13\x1d\xef\x67\x38\x2c\x31\
+\x2b\x6b\x01\xe3\x31\x2e\xeb\x37\xd7\xcf\xfd\xfe\x9d\x73\x73\xd3\
+\x52\x46\x13\x09\x41\x06\x63\xd1\x64\xd4\x44\x41\x8a\x46\x08\x47\
+\xe2\x49\xfa\x96\x0a\xef\x8a\xf9\x59\x69\x48\x49\x17\x95\xff\xe6\
+\x7b\xd2\xe1\x6d\x73\x66\x2e\x8b\xc4\x79\x25\x3a\x22\x0c\x05\xd1\
+\x50\x44\x88\x26\x44\x79\xd2\xc4\xf4\xce\x8a\xdc\xb4\x67\xd7\xcf\
+\xdd\x30\x1e\x93\x33\x2d\x16\x0b\xf4\xd8\x4d\xd1\x6d\xc7\xba\xde\
+\xff\xce\x9f\xce\x34\x62\x4d\x44\xd0\x60\x29\x03\x93\x30\x08\xcb\
+\xc0\x24\x88\xd6\x3b\x4a\xfc\x83\x7d\x68\xcb\xde\xba\x91\x47\x4f\
+\xb7\xef\x89\x13\x69\xc0\x4a\xd1\x00\x48\x92\xbb\xc8\x63\x9f\x01\
+\xb4\xda\x94\xaa\xe6\xf9\xd2\x89\xc1\x1a\x1a\xd2\xe3\x22\x96\x19\
+\x0a\x42\x25\x65\x64\x18\xbd\xc8\x0e\x54\xdb\x65\x44\xd1\x48\x95\
+\xa9\x21\xa2\x0c\x18\xda\x0c\x27\x5e\x6e\x6a\xab\x91\x30\x01\x26\
+\x3d\x54\x53\xcf\x29\x62\xb7\x95\x86\x30\x2e\x82\xde\xc7\x0f\xf7\
+\xef\x79\x62\x7f\xdd\x88\xb2\x06\x75\x8a\xc7\xa0\x2b\x03\x53\x60\
+\x10\x96\x81\x2f\x40\xcb\x0f\x21\x36\x51\x08\x3d\xf3\x49\x5b\x62\
+\xc9\xab\x27\x3e\xee\x4f\x24\x1a\x80\x99\xa6\xa2\xbc\xa4\xaa\x28\
+\x48\x18\xab\x23\x3c\xaf\xb5\xf6\x70\x3b\x2f\xf8\x4e\x66\xd8\x6d\
+\x04\x42\xc0\xb4\x07\xa2\xfd\x0d\x63\x21\x49\x4f\xe3\x60\x43\x60\
+\x42\x6a\x0b\x86\xfb\x21\x80\x4c\x86\xd3\x0c\xfe\x50\x37\x5c\xf3\
+\x5a\xed\x68\x82\xd2\xed\xf6\x15\x44\x05\x09\x03\x2b\x4d\x0d\x44\
+\xe3\x75\x4b\x77\x1e\xd9\xfb\x74\x4d\x63\x52\xb9\x36\x01\x86\xf9\
+\xb2\x81\xaf\xc2\x20\x2c\x03\x5f\x01\xc6\x18\x08\x32\xc6\x4a\x14\
+\xd4\x17\x4e\x82\x75\x6f\x9d\x3a\x19\x11\x13\x35\x19\x36\x56\x55\
+\xec\x84\x00\xa4\x6c\xe3\xe1\xd3\xa7\xda\x07\x9b\x7d\xd1\x76\xab\
+\xcd\x4c\xed\x6e\x19\xf5\x0b\xb2\xea\x6d\xa8\x16\xc8\x95\xed\xdd\
+\xcd\xbe\x09\xab\x83\xa5\x5a\x7d\x91\xce\xa7\x3f\xed\xe8\x4d\xbd\
+\x99\x4c\x15\xa6\x3c\xac\x99\x8d\x4e\x88\x35\xdf\xdd\x75\xe6\x74\
+\x6f\x38\x09\x95\x6b\x2a\xd7\x56\xd6\x60\xc0\x80\x01\x03\xdf\x08\
+\xa9\xb7\x88\xa5\xd3\x1c\xa8\x3c\xd3\xa1\x11\x16\xfc\xc2\x3e\x70\
+\x5b\x45\x5e\x3a\xd9\x76\xd3\x3f\x3f\xb1\xb2\x38\x37\xf5\x79\x6a\
+\xdf\xe3\x2b\x8b\x72\xc9\xbf\xdd\x70\xf7\x2d\x65\x9a\x01\x44\xea\
+\xf3\xd4\x39\xca\x33\x1c\xec\x6c\xa7\x03\x19\xbd\x55\x06\xbe\x0e\
+\x0c\x4d\x77\x03\xff\x27\x34\xe7\x1d\x08\x3a\x46\x62\x00\x13\x92\
+\x04\x53\x66\xf5\x24\xd5\x42\x1e\xc2\x77\x2e\x0e\x05\x7f\x35\x18\
+\xe8\x32\xd3\x5f\x0d\xd8\xa1\x8c\x91\xe4\xc8\xea\xf9\xa0\x3f\xe4\
+\x07\x9f\xbf\x95\x9c\x3c\x47\x73\x20\xca\xe9\x16\xfc\xc6\xb0\xb2\
+\x81\xbf\x0b\x23\x25\x34\xf0\x77\xa1\x72\x0c\xd4\xda\x10\xbe\x0c\
+\x0a\x69\xfb\xf7\x75\x8d\xf7\x79\x6d\x8c\x09\xa4\x0a\x58\xfa\x7e\
+\xaf\x8d\x36\xed\xed\x1e\xef\x89\xc5\x79\xcd\xc5\xf9\x4b\xd0\xcf\
+\x69\xf4\x56\x19\xf8\x5a\x30\x22\x2c\x03\x5f\x0b\xf8\x7f\x89\x7e\
+\x88\x1e\x2b\xb5\x07\x86\x46\x09\xb1\x39\x80\x3e\x54\x98\x42\xe7\
+\x84\x10\xed\x3c\xde\x18\x05\x40\x06\xaa\x9b\xd7\x97\x88\xc9\x20\
+\x2a\x03\xdf\x04\xff\x13\x00\x00\xff\xff\xb5\x91\x5b\xe1\x9b\x65\
+\x42\xdb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 \x00\x00\x62\x69\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -9050,6 +9002,432 @@ qt_resource_data = b"\
 \xf0\xf0\xf0\xf0\xf0\xf0\xf0\xf0\xf0\xf0\xf0\xf0\xf0\x28\x21\x28\
 \x55\xea\xff\x01\x04\x8f\x5a\x66\x4c\x99\x46\x98\x00\x00\x00\x00\
 \x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x1a\x73\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
+\xa8\x64\x00\x00\x1a\x08\x49\x44\x41\x54\x78\x5e\xed\x9d\x09\xb0\
+\x25\x55\x79\xc7\x07\xa1\x28\x98\xb2\x88\xa1\x28\x02\x08\xc4\x10\
+\x32\x20\x01\x24\x48\x28\xb0\x40\x1d\x64\x90\x65\x58\x44\x43\x52\
+\x5a\x2c\xc1\x05\x32\x6c\x03\x22\x41\x0c\xb1\xa8\x04\x95\xe0\x30\
+\x0c\xa8\x40\x80\xe0\x68\x05\x34\x48\x0c\x01\x4d\x64\xc9\x88\xe3\
+\xc8\x22\xfb\x40\x40\x40\x6a\x10\x59\x04\x63\xc8\x84\x6d\x18\x26\
+\x2f\xff\x7f\xf7\xb9\xf0\xe6\x4d\xdf\xf7\xee\xbd\x7d\x96\xef\x9c\
+\xfe\xff\xaa\xfe\x75\xba\x1b\xe6\xdd\xd3\xa7\xfb\xfb\xfa\xac\xdf\
+\x99\x26\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
+\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
+\x84\x10\x42\x08\x21\x84\xb0\xca\x5a\x2e\x15\xc2\x22\x6f\x81\x36\
+\x86\xde\x06\xbd\x06\x3d\x0d\xbd\x0a\x09\x4f\xc8\x01\x88\xd4\xac\
+\x07\x6d\x0f\xed\x08\xed\x00\xbd\xc3\x69\x73\x68\xc3\xb5\xd6\x5a\
+\x8b\x4e\xa0\x62\x6c\x6c\xec\x75\x24\xf7\x42\xdf\x84\x2e\x83\x5e\
+\x86\x84\x10\x19\xf1\x56\x68\x7f\xe8\x5c\xe8\x56\x68\x05\x8c\x7c\
+\x6c\x58\xe1\xdf\x3d\x09\xed\x03\x09\x21\x8c\xb3\x25\x34\x17\x5a\
+\x04\x8d\x64\xf0\x4d\xc2\xdf\x5a\x05\x1d\x0d\x09\x21\x8c\xb1\x21\
+\x34\x07\xba\xbd\xc9\x78\x7d\x09\x7f\x7f\x25\xb4\x37\x24\x84\x30\
+\xc0\x2e\x10\xdb\xe8\xaf\x34\x19\x6c\x08\xe1\xb7\x9e\x80\xd8\x97\
+\x20\x84\x48\xc4\xbe\xd0\xe2\x26\x03\x8d\x21\xfc\xf6\xb1\x55\x2e\
+\x84\x10\x51\x61\x87\xde\x4f\x9b\x8c\x32\xa6\x90\x87\xc5\x55\x6e\
+\x84\x10\x51\xd8\x15\x5a\xd4\x64\x8c\x29\x84\xbc\xac\x80\xd6\x65\
+\xc6\xc4\xe0\xbc\x31\xc6\x2a\xc4\x80\x70\x7c\x7e\x21\x74\x2b\x0c\
+\xef\xfd\xd5\x15\x03\x20\x2f\x34\xfe\xcd\xea\x33\x31\x28\x72\x00\
+\x62\x50\xf8\xae\xb0\x57\x7f\x29\x8c\xed\x08\xc8\xe2\xbb\xa3\x1a\
+\xc0\x90\x68\x26\xa0\x18\x84\xad\xa0\x8b\x60\xf4\xa6\x27\xde\x8c\
+\x8d\x8d\xfd\x36\x92\x17\xea\x33\x31\x08\xaa\x01\x88\xa9\x38\x14\
+\xba\x2b\x03\xe3\x7f\x1c\x89\x8c\x7f\x48\xe4\x00\x44\x3f\x58\x9d\
+\xe6\x57\xff\x1a\x88\x8b\x71\xac\xf3\x2f\x2e\x15\x43\xa0\x26\x80\
+\x68\x62\x13\xe8\x5a\x18\x3e\x7b\xfa\xcd\x83\xaf\x3f\x57\x0a\x6e\
+\x03\x2d\xab\x2e\x88\x81\x51\x0d\x40\x4c\x84\x46\xcf\x2a\x7f\x16\
+\xc6\xef\x38\x1f\x92\xf1\x8f\x80\x6a\x00\x62\x3c\xb3\xa1\x6f\xc3\
+\xf8\xa7\xd7\xa7\xf6\xc1\xd7\xff\x87\x48\x3e\x08\xb1\x16\x20\x86\
+\x44\x35\x00\xd1\xe3\x53\x10\xab\xfd\x39\x19\xff\x6d\x48\x0e\x84\
+\x64\xfc\x42\xb4\xe0\x54\x18\x7e\xe3\x0c\x3b\xab\x42\x9e\x19\x4b\
+\x60\x83\x2a\xf7\x42\x88\x91\xc9\xd1\xf8\x7f\x0a\xc9\xf8\x85\x68\
+\xc9\xf1\x4d\x06\x66\x59\xc8\xb3\x8c\xdf\x23\xea\x04\xec\x2e\x87\
+\x41\x57\xc1\xa8\xb2\xe9\x07\x42\x9b\xff\x6e\x24\xb3\xa0\xdf\x54\
+\x17\x44\x6b\xe4\x00\xba\x09\x23\xe8\x7c\x0f\xc6\x9f\xcd\xdc\x79\
+\x18\xff\x03\x48\x66\x42\xbf\xae\x2e\x08\x2f\xc8\x01\x74\x8f\x6d\
+\x21\xae\xe4\xcb\x61\x76\x5f\x05\x8c\xff\x61\x24\x34\xfe\x67\xab\
+\x0b\xc2\x1b\x6b\xbb\x34\x36\x0c\x03\xcd\x25\xa5\xaf\x40\x0f\xf1\
+\x82\x88\x02\xdb\xce\x37\xc0\xf8\xb7\xa8\x4f\xed\x03\xe3\x7f\x04\
+\xc9\x5e\xd0\x33\xd5\x05\x91\x3d\x34\xfe\x5f\xb1\x43\x87\xc2\xf1\
+\x7d\x10\x17\x9c\x88\xb0\xb0\xad\xcf\x71\xfe\x35\x3a\xd6\xac\x0a\
+\xf9\x7d\x14\x62\xfc\x01\x51\x08\xdb\x41\xcf\xf7\x79\xd8\x74\x04\
+\x0c\x2f\x25\xc2\x70\x5a\x53\xb9\x5b\x15\xf2\xcb\x40\x9f\x32\xfe\
+\x82\xe0\x97\xbf\xd1\xf8\xc7\x0b\xff\x8f\x6a\x04\xfe\xe1\xbc\xfe\
+\x95\x4d\xe5\x6d\x51\xc8\x2b\x8d\x9f\xbb\x03\x89\x42\xe8\xfb\xe5\
+\xef\x27\xfc\xff\x74\x04\x9c\x9b\x2e\xda\xc1\x70\xd9\x0f\x35\x95\
+\xb1\x45\x21\xaf\x4f\x41\x0c\x40\x22\x0a\x61\xa0\x2f\x7f\x3f\xe1\
+\xdf\xaa\x46\xd0\x0e\xae\xe9\x6f\x2c\x5b\x6b\x42\x5e\x7f\x05\xcd\
+\xa8\x72\x2d\x8a\x60\xb5\x0e\xbf\x36\xc2\xdf\xe1\x0c\x30\x39\x82\
+\xe1\x78\x2f\xb4\xaa\xa9\x3c\xad\x09\xf9\xe4\x88\xd0\x7b\x98\x69\
+\x51\x06\xdc\xed\xd5\x8b\xf1\x8f\x17\xfe\x26\x1d\xc1\x47\x20\xad\
+\x64\x9c\x9c\x75\x20\x06\xf0\x6c\x2c\x47\x6b\x42\x5e\x8f\xaa\x72\
+\x2d\x8a\x80\x5f\xfe\xff\x6a\x7a\xd0\xbe\x84\xbf\xbf\x14\x3a\x88\
+\x3f\x26\x1a\x99\xdb\x54\x6e\x16\x85\xbc\x72\x4e\x88\x28\x84\xe0\
+\xc6\x3f\x5e\xf8\x2d\x39\x82\x35\x61\x48\xaf\xff\x6d\x2a\x2f\x6b\
+\x42\x3e\xb9\xcd\xb7\x16\xf7\x24\xc2\x77\x35\x7a\x27\xe8\x16\x3c\
+\x58\xee\x0c\x1b\x05\xfc\xd6\xf6\xd0\xb5\x38\xa4\x23\x50\xd3\xa0\
+\xe6\x4c\x94\x09\xf7\xe1\xcf\x81\xe3\xa0\xe5\xf5\xa1\xc8\x19\x1a\
+\xbf\xf7\x36\xff\xb0\x42\x1e\xee\x82\xba\xec\x08\x38\x7e\xee\x6d\
+\x0f\xfe\x90\x42\x3e\x6f\xac\x72\x2c\xb2\x27\x6a\xb5\x7f\x10\x21\
+\x3f\xac\x11\x1c\xc2\xcc\x75\x8c\xcb\x9b\xca\xc3\xa2\x90\x57\x6e\
+\x25\x2e\x12\xe2\x63\x35\x20\x8d\x3f\x6a\xb5\x7f\x18\xdc\x32\xd2\
+\x33\xa1\x2e\xc4\x8d\xe7\x04\x9a\x9f\xe1\x59\x70\x04\xc0\x34\x78\
+\x2e\xdf\x47\x72\x40\x7d\x26\x52\xe1\xa3\x9a\xbc\x87\x55\xe3\x27\
+\xc8\x1b\xfb\x08\xbe\x8b\xc3\xdd\xea\x2b\x45\x73\x52\x0e\xc6\xef\
+\x98\xe7\x52\x91\x10\x1f\x35\x00\x06\x95\x78\x14\x2f\xde\x96\xf5\
+\xa9\x4d\xf0\xc5\xd9\x1d\x09\xa3\xc8\x96\x0a\x7b\xd2\x9f\xc4\x73\
+\x30\xdf\xa3\xee\xd6\xf7\xbf\xb3\x3e\x13\x29\xf1\x51\x03\x60\x48\
+\xe6\x2f\xd6\x87\x22\x21\x47\xe7\x60\xfc\x8e\x2b\x5c\x2a\x12\xe3\
+\xab\xa7\xfc\x1f\xe0\xd5\x7f\xe9\x8e\x45\x1a\x4e\x70\x69\x0e\x7c\
+\xc7\xa5\x22\x31\xbe\x1c\x00\x6b\x01\x67\xd7\x87\x22\x01\xec\x87\
+\xc9\x62\x05\x9d\xeb\x94\xe5\x4e\xbe\xc2\x00\x3e\xc7\xca\x59\x0b\
+\xf8\x85\x3b\x16\x71\x39\xd2\xa5\x39\x70\x83\x4b\x85\x01\x7c\x3a\
+\x00\xd6\x02\xce\xa9\x0f\x45\x44\xb8\xde\x9f\x13\x9f\x72\x61\xb1\
+\x4b\x85\x01\x7c\x3a\x00\xa2\xbe\x80\xf8\xec\x83\xea\x7f\x36\x11\
+\x7e\xc1\x1d\x2e\x15\x06\xf0\xed\x00\x5e\x85\xd4\x17\x10\x97\x83\
+\x5d\x6a\x1e\x7c\x1c\x18\xd3\xff\xe9\xfa\x4c\x58\xc0\xb7\x03\x20\
+\x5f\x57\x2d\x20\x2a\xfb\xba\x34\x07\x18\xe2\x5b\x18\x22\x84\x03\
+\x60\x2d\x40\xf3\x02\xe2\xb0\x13\xaa\xff\x9b\xb9\xe3\x1c\x50\x27\
+\xb1\x31\x42\x38\x00\x62\xb1\x2f\x20\x97\x29\xb2\xc3\xb0\x8f\x4b\
+\x73\x41\x3b\xfb\x18\x23\x94\x03\xb0\x58\x0b\xb8\x04\xda\xa8\x3e\
+\x2c\x86\x3d\x5d\x9a\x0b\xff\xed\x52\x61\x84\x50\x0e\x80\x5c\x66\
+\xa9\x16\x80\xaa\x32\x43\x93\xdf\x02\x6d\x5c\x5d\xc8\x1f\x3e\xbb\
+\xdc\x82\x68\xf2\xc3\x20\x0c\x11\xd2\x01\x98\x5b\x23\xe0\x9c\xc0\
+\xcd\x50\x09\x4e\x60\x06\xee\xc7\xec\x2a\xcc\x3e\xbc\xee\x52\x61\
+\x84\x90\x0e\x80\x98\xeb\x0b\x80\xd1\x30\x7e\x41\x09\x4e\x20\xc7\
+\xe5\xcd\xd9\x6c\x47\xde\x15\x42\x3b\x00\x93\x23\x02\xce\x09\x30\
+\x1c\x55\xce\x4e\xe0\x0f\x5d\x9a\x13\xbf\xe5\x52\x61\x84\xd0\x0e\
+\x80\x98\xea\x0b\xe8\x01\x27\xc0\x7d\x0b\x16\x41\xb9\x76\x0c\x72\
+\x9f\xff\xdc\x28\xa5\xff\xa5\x18\x62\x38\x00\xb3\xf1\x02\x5c\x9f\
+\x40\xae\x1d\x83\xcc\x7b\x6e\x68\xc3\x4f\x63\xf8\x88\x08\x34\x08\
+\x5c\xb0\xf2\x73\x18\x9c\xc9\x49\x2b\xa8\xa1\xdc\x8b\x64\x16\xc4\
+\xa9\xaa\x39\xc0\xf2\x7c\x09\xe5\x19\xc3\x81\x7b\xc3\xd5\x04\xb7\
+\xa8\xcf\x84\x05\x62\xbd\x40\xa6\x67\x07\xc2\x90\x18\xd2\x3c\xa7\
+\xe6\xc0\x26\xb9\x19\x3f\x41\x9e\xb9\xdf\x7f\x69\x73\x31\xb2\x26\
+\xe6\x4b\xf4\xf7\x16\xfb\x02\x7a\xe0\xe5\xac\xa2\x1b\x43\x39\x34\
+\x07\x72\x9a\xfe\x3b\x11\x6d\x00\x6a\x88\x98\x0e\xc0\x7c\xbc\x00\
+\x38\x01\xb6\xab\x73\x18\x1d\xe0\xd6\x5f\xb9\x32\xd3\xa5\xc2\x00\
+\xb1\xfa\x00\x7a\x98\xee\x0b\xe8\xe1\xfa\x04\x3e\x00\xfd\xa6\xba\
+\x60\x8f\x39\x28\xc3\xaf\xba\xe3\xac\x40\xd9\x3e\x86\xe4\x0f\xea\
+\x33\x31\x0e\xae\x55\xe1\x76\xee\x7b\x40\xdb\xb8\xf3\x17\xa0\x7b\
+\x20\xee\xa1\x50\xcc\x42\xaa\xe3\xf1\xf2\x36\xee\x14\x63\x49\xc8\
+\x27\x0b\xde\xea\x4c\xbb\xd3\x9b\xf2\x9c\x8b\x90\x7f\xf6\xb9\x88\
+\x37\x39\x02\x7a\xa2\xa9\xac\x28\xfc\xb7\x55\x10\xf7\xb6\x98\x01\
+\x79\x25\x45\x47\x12\xe7\x05\x98\x0f\x0a\x81\x82\xe7\x4b\xca\x19\
+\x83\x16\x9d\xc0\xfa\x2e\xcd\x95\xc3\x5d\xda\x75\xb8\x81\xeb\x75\
+\x78\xd7\x16\x42\x7d\xf7\xd5\xc0\x7f\x7b\x0b\xc4\x6d\xee\xf8\x51\
+\xfa\x68\x75\xd1\x13\x29\x1c\x40\x36\xf1\x02\x9c\x13\x60\xc7\xa0\
+\x35\x27\x30\xdd\xa5\xb9\x72\x34\x94\xfb\x3d\xb4\x85\x7b\x38\x2c\
+\xc2\x3b\x36\xbb\x3e\x9d\x1a\xfc\xbf\xd3\xa1\x7f\xc4\x21\x6b\x0c\
+\x5e\x48\x35\x94\xc4\x5a\xc0\x32\xe8\xd5\x41\xe5\xfe\x5d\x74\x50\
+\xe0\xbd\xb5\x03\x96\x9c\x00\xfb\x52\xb2\x05\x65\xca\x18\x86\x47\
+\xd5\x67\x9d\x84\xf7\x7f\x33\xca\x61\xd4\xcd\x51\xb9\xb4\xdd\xcb\
+\x4c\xd0\x54\x0e\x80\x06\xfd\x7b\x10\xab\xb2\x03\x09\x4e\xe0\xd3\
+\x48\x93\x80\x07\x65\xb9\x39\x90\x2b\x9f\x81\xba\xb8\x38\x88\xef\
+\x50\x1b\xe3\xe7\xfb\xc8\x0f\x80\x97\x11\xb5\x54\x0e\x60\x14\xce\
+\x83\x13\x38\xd9\x1d\x47\xc7\x39\x01\x4e\x16\xb2\xe0\x04\x38\xa4\
+\x9a\x35\x28\x4f\x4e\x0b\x3e\xb6\x3e\xeb\x0c\x9c\x04\xc5\x9d\xb4\
+\x77\xae\x4f\x5b\xc1\xa6\x43\xeb\xa9\xd5\x39\x39\x00\x72\x3e\x9c\
+\xc0\x49\xee\x38\x3a\x78\x70\xbd\x05\x44\xa9\x9d\x40\xb2\x26\x91\
+\x67\xce\x82\xba\xb2\x40\x88\xf7\x49\xe3\x67\x93\xb2\x35\xf8\x3b\
+\xb4\xdd\xd6\x01\x61\x73\x73\x00\xe4\x02\x39\x81\x69\x2b\x5c\x9a\
+\x35\x28\x4b\xb6\x85\x2f\xac\xcf\x8a\x86\x13\xb7\x16\xe3\x7e\x7d\
+\x2f\xe0\x6a\xbd\xc3\x72\x8e\x0e\x80\x54\x4e\x00\xfa\x3f\x77\x1e\
+\x15\xe7\x04\x38\x63\x30\xd5\xbc\xf6\xe5\x2e\xcd\x1e\x94\xe5\x61\
+\x48\x38\xc4\x55\x2a\x1c\xde\xe3\x97\xdf\xfb\x18\x3e\x68\xbd\x21\
+\x4c\xae\x0e\x80\x5c\x00\x9d\x9c\xd0\x09\xb0\x1d\xf7\x03\x28\x85\
+\x13\x78\xce\xa5\xa5\x70\x39\x54\xe2\x52\x61\x6e\xd8\xca\x0e\xbf\
+\x10\xc6\x4f\x5a\x87\x58\xcb\xd9\x01\x10\x3a\x81\x94\xcd\x01\x3a\
+\x01\xd6\x04\x62\x37\x07\x8a\x0a\xaf\x8d\x72\x64\xf9\x5d\x0d\x95\
+\x34\x2a\x40\x87\xc6\x71\xfe\xad\xeb\xd3\x20\xb4\x5e\xbe\x9e\xbb\
+\x03\x20\x5f\x41\x2d\xe0\xb8\x84\x35\x81\xde\x10\x61\xcc\x9a\x40\
+\x69\x35\x00\x96\x23\x87\xc5\x38\xc9\xa5\x84\x77\x92\x5f\xfc\x25\
+\xb8\xa7\xbe\xb3\xfb\x3c\xf1\xbc\x4b\x47\xa6\x84\xc2\x26\x5f\x83\
+\x52\xf6\x09\xd0\x09\xc4\x6c\x0e\x98\x5d\x56\xdd\x06\x94\x23\x77\
+\x39\x9e\x5f\x9f\x65\x4b\x15\x79\x1a\xf7\x12\x63\xc1\x5b\xeb\x29\
+\xf5\xa5\x38\x00\xf2\x15\x28\xe5\x64\xa1\x5e\x9f\x40\x8c\x9d\x7a\
+\x5f\x80\xb3\x2b\xae\x16\x40\x50\x8e\x27\x22\xe1\xf0\x60\x8e\x70\
+\x76\x1e\x8d\x9f\x81\x4f\x62\xf0\xb8\x4b\x47\xa6\x24\x07\x40\x38\
+\x4f\xe0\x04\x77\x1c\x1d\xe7\x04\x38\x44\x18\xc3\x09\x3c\xec\xd2\
+\xe2\x40\x39\xfe\x35\x12\x76\x0c\xe6\xb4\x9d\x1b\xc3\xb4\xdf\x8a\
+\xbc\xc7\x8c\xd5\xb0\xcc\xa5\x23\x53\x9a\x03\x20\xec\x13\x48\x3d\
+\x63\x90\x7d\x02\xa1\x9d\x40\xd1\x3b\xed\xa2\x1c\xb9\x60\xe8\x5a\
+\x28\x86\x33\x6d\x0b\x9b\x2e\xfc\xf2\x47\xcb\x2b\xde\x71\xc6\x0a\
+\x68\xdd\x19\x5c\xa2\x03\x20\xa9\x67\x0c\xf6\x46\x07\x42\xbe\x10\
+\x0f\xba\xb4\x58\x50\x8e\xfb\x23\xb9\x0b\x62\x79\x5a\x84\xa3\x16\
+\xf3\xa0\x6f\x23\xaf\xb1\x57\x37\x3e\xe0\xd2\x56\x94\xea\x00\x48\
+\xea\x19\x83\xec\xd5\x0e\xe9\x04\xee\x70\x69\xd1\xa0\x1c\x39\x96\
+\xbe\x04\x3a\x1d\xb2\xd4\x24\xe0\x94\x5e\x56\xf9\x4f\x81\x52\xd8\
+\xd1\xfd\x2e\x6d\x45\xc9\x0e\x80\xd0\x09\xa4\xec\x13\xa0\x13\x08\
+\xd5\x27\x70\x37\xee\x2d\xfb\x45\x41\x83\x80\x72\x5c\x0f\x62\x0c\
+\x89\xa5\x50\xea\xa0\xa2\x7c\x96\x0c\xc7\x76\x1f\xf2\x94\xb2\x66\
+\x72\xbb\x4b\x5b\x51\xba\x03\x20\xec\x13\x48\x59\x13\x60\x9f\x40\
+\x88\x9a\x00\x17\x04\x31\x76\x61\x67\x40\x59\xb2\x97\x7d\x31\xc4\
+\x49\x43\xb1\x37\x46\xe1\xf3\x3b\x03\x62\x4c\x4b\xc6\x64\x4c\x6d\
+\x3b\xb7\xb9\xb4\x15\x5d\x70\x00\xa4\xd4\xe6\x40\x2e\x1b\x99\x78\
+\x83\x86\x07\xb1\xd3\x8d\xb5\x01\x3a\x82\xf7\xf3\x7a\x40\xb8\xee\
+\x83\x5f\xfc\x27\xf1\xbb\x67\x43\xc9\x97\x83\xe3\x5d\xe6\x10\xb0\
+\x97\x4e\xe0\xd8\x51\x81\x53\x73\x22\x1e\xe0\x02\x77\x1c\x1d\x3c\
+\xb8\x3b\x91\x70\x07\x22\xf6\xe0\xb6\xe5\x5c\xdc\xcb\xa9\xee\xb8\
+\xd3\xa0\x5c\x39\x1e\xfe\x2d\x88\xa3\x06\x2c\xe3\x36\x13\xc2\xf8\
+\x51\xdc\x15\xda\x0f\x3a\x04\x65\x4c\x07\x60\x0a\xdc\xef\x95\x48\
+\x3e\x56\x9f\xb5\xa3\x6b\x0e\x80\x94\xe0\x04\x64\xfc\x7d\x40\xf9\
+\x32\x94\x3b\xab\xc7\x6c\x23\xb3\xa3\x8c\x63\xe5\x1c\x2e\x63\x6d\
+\x69\xfc\xe2\x19\x46\xd5\xe1\x1a\x7d\x4e\xd7\x65\x47\x23\x77\x5b\
+\x66\x9b\x7e\x17\x94\x6d\x88\x3e\x1b\x6f\xe0\x1e\x8f\x44\xf2\x8d\
+\xfa\xac\x1d\x5d\x74\x00\xe4\x78\x68\x01\x1e\x74\x92\x26\x90\x73\
+\x02\x1f\x84\x46\xd9\x77\x60\x1e\xf2\x7d\x8a\x3b\x16\x43\x80\x72\
+\x67\xa7\x29\x6b\x07\x6c\x46\x64\xb9\xf0\x08\xf7\x40\x27\xb6\x29\
+\xe4\xa5\xf9\xd7\x95\x3e\x80\x89\x70\xda\x70\xca\x05\x44\xec\x13\
+\x18\x25\xc6\xe0\x7c\x19\xff\xe8\xd0\xe8\x21\x8e\x28\xe4\xbc\xea\
+\xf0\xc7\x90\xb7\xbe\x9f\xae\x3a\x00\x72\x31\x94\x72\x88\x70\xd8\
+\xd1\x01\x56\xfb\xe7\xba\x63\xd1\x5d\xae\x71\xa9\x17\xba\xda\x04\
+\x18\x0f\x03\x53\x7e\x15\xc6\x95\xaa\x39\x70\x37\x12\x6e\x43\x36\
+\x59\x9f\x00\xbf\xfc\x32\xfe\x8e\xe3\x9a\x30\x6f\x87\x54\x03\xf0\
+\x08\x6b\x02\x29\x9b\x03\xec\x78\x9a\x6c\xed\x80\x8c\x5f\xf4\xe0\
+\x1e\x81\x5e\x87\x7e\xe5\x00\x6a\xaa\xe6\x40\x62\x27\xd0\xb4\x94\
+\x58\xd5\x7e\x31\x9e\x2b\x5c\xea\x0d\x35\x01\x56\xc7\x52\x73\x40\
+\xbd\xfd\xe2\x0d\xf0\x6e\x70\xae\x03\x77\x55\xf6\xfa\x91\x5a\xdb\
+\xa5\xa2\x86\xc3\x73\xbf\x86\xe1\x1d\x50\x9f\xc6\x05\xbf\xcb\xe1\
+\x9d\xbd\xa1\xed\x70\x9c\x6c\x49\xb3\x30\xc9\x17\x20\x2e\x8a\xf2\
+\x8a\x6a\x00\xcd\xcc\x81\x2e\x4c\x55\x13\x10\x62\x3c\xf8\xfa\xb3\
+\x46\xc8\xad\xf4\x7c\xcc\x20\x5d\x0d\xbd\xe0\xcd\x30\xc6\x60\xb2\
+\x8e\x41\x21\x26\xc0\x79\x2b\xde\x8d\x9f\xa8\x09\xd0\x1f\x36\x07\
+\x9e\x43\x2d\x60\xe0\xed\x9b\x85\xf0\x0d\x3e\x42\x2f\x22\xf9\x53\
+\xe8\x95\xea\x82\x67\x54\x03\x98\x9c\x8b\xf1\x00\x8e\x51\x4d\x40\
+\x24\x84\xbb\x00\x8f\x32\x65\x7c\x20\xd4\x07\x30\x18\x8c\x4f\x77\
+\xa9\xfa\x04\x44\x4c\xf0\xe1\x61\xd8\x6f\xf6\xfc\xbf\x5c\x5d\x08\
+\x80\x9a\x00\x83\x71\x0f\xc4\x15\x65\x07\xc0\x09\xc8\x69\x8a\x58\
+\x70\x0e\x48\xd0\xd0\x6f\x7a\x99\x87\x43\x35\x01\x11\x05\x7c\xfd\
+\xb9\xe8\x67\xcf\xfa\x2c\x1c\xaa\x01\x0c\x87\x6a\x02\x22\x38\x30\
+\x7e\x2e\xf9\xfd\x10\x14\x7c\x0f\x48\x39\x80\xe1\x61\x98\x6a\x6e\
+\xcd\x75\xa0\x9c\x80\x08\x04\x27\xfd\x5c\x55\x1f\x86\x45\x0e\x60\
+\x34\x58\x13\x90\x13\x10\xde\xc1\xd7\x9f\xf1\xfe\x19\xee\x6b\x55\
+\x75\x21\x30\x72\x00\xa3\xa3\xe6\x80\xf0\x0a\x8c\x9f\x91\x9e\x39\
+\x0d\xfd\xa9\xea\x42\x04\xe4\x00\xda\xa1\xe6\x80\xf0\x09\x03\xd4\
+\x5c\x5f\x1f\xc6\x41\x0e\xa0\x3d\xac\x09\x70\xbc\x76\xb6\x9c\x80\
+\x18\x15\x7c\xfd\xff\x09\x09\x77\x3f\x8a\x8a\x1c\x80\x1f\xb8\x8c\
+\x57\x35\x01\x31\x12\x30\x7e\xbe\x3f\x07\x43\x2b\xab\x0b\x11\x91\
+\x03\xf0\x87\x6a\x02\x62\x68\x60\xfc\x8c\xf0\xb3\x17\xe4\x35\xd2\
+\xcf\xa0\xc8\x01\xf8\x85\x9e\xfc\x69\xd8\xff\x41\xf5\xa9\x10\xfd\
+\x81\xf1\x73\x8a\xef\x3e\xd0\x7f\x56\x17\x12\xa0\x19\x6d\xfe\x79\
+\xb7\x4b\x85\xe8\x0b\x8c\x9f\x93\x7d\xfe\x04\x4a\xba\xcb\xb3\x1c\
+\x80\x5f\x18\x44\x84\x61\xc5\x84\xe8\x0b\x8c\x9f\xab\x4b\x3f\x09\
+\x31\xc8\x67\x52\xd4\x56\xf5\xc7\x45\x32\x7e\x31\x15\xce\xf8\x3f\
+\x0e\x7d\xbd\xba\x90\x18\xd5\x00\xfc\xa0\x2f\xbf\x98\x12\x57\xed\
+\xe7\x97\xdf\x84\xf1\x13\xd5\x00\xda\xa3\x2f\xbf\x98\x12\xd7\xe1\
+\xc7\xc8\x3e\x51\x27\xfa\x4c\x85\x1c\x40\x3b\x64\xfc\x62\x4a\x60\
+\xfc\x8c\xe7\xc7\x71\xfe\x1f\x55\x17\x0c\xa1\x26\xc0\xe8\xa8\xda\
+\x2f\xa6\x04\xc6\xcf\x78\xfe\x33\x21\x73\xc6\x4f\xe4\x00\x46\x83\
+\x9b\x87\x70\x8b\x71\x21\xfa\x02\xe3\xbf\x01\xc9\x1f\x43\xf7\x56\
+\x17\x0c\x22\x07\x30\x3c\xfc\xf2\x73\xdf\x00\x21\xfa\x02\xe3\x3f\
+\x0f\xc9\x7e\x50\xb0\x80\x9e\x3e\x50\x1f\xc0\x70\xf0\xcb\x2f\xe3\
+\x17\x7d\x81\xe1\x73\x3a\x38\x87\xf9\xfe\xbd\xba\x60\x1c\xd5\x00\
+\x06\x47\xc6\x2f\x26\x05\xc6\xff\xcf\x48\xde\x05\x65\x61\xfc\x44\
+\x0e\x60\x30\x16\xc8\xf8\x45\x3f\x60\xf8\xcf\x42\x7f\x8e\xc3\x0f\
+\x43\x49\x16\xf5\x8c\x8a\x9a\x00\x53\xa3\x2f\xbf\x68\x04\x46\xcf\
+\x89\x3d\xdc\x46\xee\xf3\x50\x90\xad\xbb\x42\x23\x07\x30\x39\xec\
+\xf0\x53\x6f\xbf\x58\x03\x18\xff\x6d\x48\x8e\x81\xee\xaf\x2e\x64\
+\x8a\x9a\x00\xfd\xd1\x50\x9f\x58\x03\x18\xfe\x9d\xd0\x2c\x1c\xee\
+\x0e\x65\x6d\xfc\x44\x0e\xa0\x19\xb5\xf9\xc5\x6a\xc0\xe8\xef\x87\
+\x38\x9b\x8f\xe3\xfa\x37\x55\x17\x0b\x40\x4d\x80\x35\x51\x9b\x5f\
+\x54\xc0\xe0\xd9\xc6\x67\xcf\xfe\x02\xe8\x27\xbc\x56\x1a\x72\x00\
+\xab\xc3\x2f\xff\x89\xee\x58\x74\x14\x18\x3e\xa7\xef\x5e\x09\x2d\
+\x84\x1e\xe3\xb5\x52\x91\x03\x78\x13\x19\x7f\x87\x81\xd1\x2f\x47\
+\xf2\xaf\xd0\xa5\x10\xf7\xe5\xeb\xc4\x96\xf0\x72\x00\x35\x32\xfe\
+\x0e\x02\xa3\xe7\x2e\x3c\x5c\x9e\x7b\x0d\xc4\x78\x8e\x9d\x30\xfa\
+\xf1\xc8\x01\x4c\x9b\x36\x0f\xc6\x7f\x8a\x3b\x16\x11\x80\xe1\x71\
+\xdc\x9c\xb3\xe5\x76\x83\xd8\x9b\xbe\x2b\x9e\xc1\x56\x48\x83\x81\
+\xdf\x7c\x11\x09\x17\xe5\xb0\x2d\xbf\xc4\xa5\x59\x4d\xda\x09\x41\
+\xd7\x1d\x80\xbe\xfc\x91\x81\x21\x7e\x0e\x09\x37\xbf\x9c\xc8\x74\
+\x88\x4e\x60\x5b\x68\x07\x68\x6b\x68\x63\x68\x13\x97\x6e\x84\x67\
+\xd5\x38\x6a\x85\xbf\xc9\x2f\x37\x03\x6e\xd0\xa0\x39\x17\x9f\x5b\
+\xb6\x51\x4b\xa1\x47\x20\x46\xdd\x0d\xbe\xd3\x6e\x8e\x74\xd9\x01\
+\xcc\xc7\x0b\x35\xd7\x1d\x8b\x08\x4c\x62\xfc\x83\xb2\x0e\x44\x47\
+\xb1\xae\x3b\x66\x2f\x3d\x0d\x9f\x12\x23\xd0\x55\x07\xa0\x19\x7e\
+\x91\x81\xf1\x7f\x16\xc9\x97\xea\x33\x61\x85\x2e\x4e\x04\xe2\x97\
+\x5f\xc6\x1f\x11\x19\xbf\x5d\xba\x56\x03\x50\xb5\x3f\x32\x32\x7e\
+\xdb\x74\xc9\x01\xc8\xf8\x23\x23\xe3\xb7\x4f\x57\x1c\x80\x8c\x3f\
+\x32\x32\xfe\x3c\xe8\x82\x03\x90\xf1\x47\x46\xc6\x9f\x0f\xa5\x3b\
+\x00\x19\x7f\x64\x64\xfc\x79\x51\xb2\x03\xd0\x0c\xbf\xc8\xc0\xf8\
+\x39\x09\x87\x93\x78\x4c\x47\xc2\x15\x6f\x52\xea\x30\x20\xbf\xfc\
+\x32\xfe\xc8\xa0\xcc\x37\x43\x72\x33\xb4\x51\x75\x41\x98\xa7\xc4\
+\x1a\x80\xaa\xfd\x89\x41\x4d\x80\x73\xee\x19\x35\xa7\xf3\x73\xed\
+\xad\x53\x9a\x03\x90\xf1\x1b\x41\x4e\x20\x0f\x4a\x72\x00\x32\x7e\
+\x63\xc8\x09\xd8\xa7\x14\x07\x20\xe3\x37\x0a\x9c\x00\x03\x67\x7e\
+\x00\x92\x13\x30\x48\x09\x0e\x40\xc6\x6f\x1c\x39\x01\xbb\xe4\xee\
+\x00\x64\xfc\x99\x20\x27\x60\x93\x9c\x1d\x80\x8c\x3f\x33\xe4\x04\
+\xec\x91\xab\x03\x90\xf1\x67\x0a\x9c\x00\xa3\xf3\xcc\x84\x9e\xab\
+\x2e\x88\xa4\xe4\xe8\x00\x64\xfc\x99\x23\x27\x60\x87\xdc\x1c\x80\
+\x8c\xbf\x10\xe4\x04\x6c\x90\x93\x03\x90\xf1\x17\x86\x9c\x40\x7a\
+\x72\x71\x00\x32\xfe\x42\x91\x13\x48\x4b\x0e\x0e\x40\xc6\x5f\x38\
+\x72\x02\xe9\xb0\xee\x00\xce\x81\xf1\x9f\xe6\x8e\x45\xc1\xc0\x09\
+\xf4\x86\x08\x19\xe2\x7b\x27\x68\x7b\xe8\x77\xa1\xf1\x2b\x0b\xb9\
+\x7d\xd7\x33\x10\xf7\xeb\xe3\xff\xbf\x0c\x12\x2d\xb0\xec\x00\x64\
+\xfc\x91\x81\x11\x7e\x07\xc9\xa1\x28\xf7\x24\xcb\xc4\xf1\xfb\x8c\
+\x23\xb0\x01\x7e\x9f\x31\xff\xa7\x04\xff\xff\x2f\x91\x70\x87\xa1\
+\xab\x21\x6e\xd9\xdd\xb9\xad\xbd\xda\xb2\xb6\x4b\xad\x21\xe3\x8f\
+\x0c\x8c\xe9\x33\x48\x4e\x86\x68\x54\x07\xa2\xfc\xa3\x7f\x1c\xf0\
+\x93\xeb\x43\x03\x3b\x1f\xfc\xbf\x74\x16\x3b\x43\x87\xe3\xf4\xe3\
+\xd0\xfa\x10\x77\x03\x7a\x15\x12\x03\x60\xd1\x01\x9c\x8b\x07\xca\
+\x97\x51\x44\x02\xc6\xff\x69\x24\xf3\xea\xb3\x69\xf7\x40\xc9\x9c\
+\xc0\xa8\x20\xab\x74\x06\x6c\x42\x7c\x0a\x62\x4d\xe0\x0e\x97\x8a\
+\x49\xb0\xe6\x00\x68\xfc\xa7\xba\x63\x11\x01\x67\xfc\xe7\xd5\x67\
+\x6f\x90\xa5\x13\x20\xc8\x2e\x6b\x11\xfb\xe0\x70\x36\x44\x27\xa0\
+\x3d\x01\x27\xc1\x92\x03\x90\xf1\x47\xa6\x8f\xf1\xf7\xc8\xd6\x09\
+\x10\x64\x79\x53\x24\x47\x41\xec\x34\xe4\xbd\x88\x06\xac\x38\x00\
+\x19\x7f\x64\xa6\x30\xfe\x1e\xb9\x3b\x81\x75\xa0\x83\x71\xb8\x1e\
+\xc4\x58\x85\x62\x02\x16\x1c\x80\x8c\x3f\x32\x03\x1a\x7f\x8f\xac\
+\x9d\x00\x41\xb6\xf7\x40\xc2\x80\xa5\xdf\x87\xc6\x78\x4d\xd4\xa4\
+\x76\x00\x0c\xdd\xcd\x97\x51\x44\x02\xc6\x7f\x12\x92\xf3\xeb\xb3\
+\x81\xa1\x13\xf8\x05\x74\x50\xc6\x4e\xe0\xdd\x48\xb6\x80\xae\x87\
+\xe4\x04\x1c\x29\x1d\x80\xe2\xf6\x47\xc6\x19\xff\x05\xf5\xd9\xd0\
+\x30\xbe\x5f\xee\x4e\xe0\x8f\x90\xc8\x09\x8c\x23\x95\x03\x90\xf1\
+\x47\x06\xc6\xcf\x31\xfe\x05\xf5\xd9\xc8\xc8\x09\x14\x46\x0a\x07\
+\x20\xe3\x8f\x8c\x33\xfe\x61\xab\xfd\xfd\x90\x13\x28\x88\xd8\x0e\
+\x40\xc6\x1f\x19\xcf\xc6\xdf\x83\x4e\x20\xf7\x8e\x41\x39\x01\x10\
+\xd3\x01\xc8\xf8\x23\x13\xc8\xf8\x7b\x94\x30\x3a\xd0\x79\x27\x10\
+\xcb\x01\x7c\x11\x85\xad\xe9\xbd\x11\x81\xf1\x73\x74\x65\x7e\x7d\
+\x16\x0c\x3a\x01\x6e\x08\x3a\x3b\x73\x27\xc0\x49\x43\x9d\x1c\x22\
+\x8c\xe1\x00\x4e\x43\x21\x9f\xe5\x8e\x45\x04\x9c\xf1\x0f\x3a\xce\
+\xdf\x96\xbb\xa1\xdc\x9d\x00\x87\x08\x3b\xe9\x04\x42\x3b\x80\x3f\
+\x43\xe1\x5e\xec\x8e\x45\x04\x22\x1b\x7f\x8f\x52\x9c\xc0\xdb\xa1\
+\xeb\xaa\x0b\x1d\x21\xa4\x03\xd8\x16\xba\x0e\x05\xbb\x6e\x7d\x2a\
+\x42\x03\xe3\xff\x4b\x24\x5f\xae\xcf\xa2\x43\x27\xb0\x03\x9e\xf7\
+\x76\xf5\x69\x7e\x20\xef\x3b\x23\xd9\x04\xfa\x5e\x75\xa1\x03\x84\
+\x0a\xfc\xc0\x80\x0e\x57\xa1\x40\xdf\x5a\x9f\x8a\xd0\xb8\x2f\xff\
+\xdf\xd5\x67\xc9\xc8\xd6\xf8\x7b\xe0\x9d\x3d\x16\xc9\xa5\xf5\x59\
+\xf9\x84\x72\x00\xa7\xa3\x20\x19\xd6\x49\x44\x00\xc6\xcf\x0e\xd6\
+\xd8\xd5\xfe\x89\x4c\x87\x58\xeb\xcb\x1e\xbc\xbb\x9f\x40\x72\x09\
+\x94\x24\x32\x52\x4c\x42\xb4\xd7\xb6\x82\x1e\x44\x21\x72\x05\x96\
+\x08\x8c\xab\xf6\xa7\xfe\xf2\x93\x1d\xf1\xcc\xef\x73\xc7\x45\x80\
+\xb2\x65\xff\xd5\x5f\xd4\x67\x65\x12\xc2\xc3\x71\x75\x9f\x8c\x3f\
+\x02\x46\xaa\xfd\x3d\x36\x77\x69\x31\xe0\x3d\x2e\xbe\x39\xe0\xdb\
+\x01\x30\x3e\xdb\xa1\xee\x58\x04\x04\xc6\xcf\x49\x3e\xa9\xab\xfd\
+\xe3\xd9\xc0\xa5\x45\x81\xf7\x99\xcd\x81\xcb\xa1\x22\x9b\x03\xbe\
+\x47\x01\xce\x43\x81\x31\x9c\x73\x34\x60\x08\x2f\x20\xb9\x13\xfa\
+\x09\xd4\x9b\xa7\xce\x58\x70\x1b\x22\x2f\x59\x0e\x49\x4d\x85\xab\
+\xf6\xf7\x62\xf8\x59\x81\xce\xff\x43\xee\xb8\x28\x70\x5f\x9c\x2c\
+\xf4\x3b\x50\x67\x46\x07\x46\x81\x01\x17\x56\xa2\xb0\xc6\x42\x8b\
+\xbf\x03\x2d\x84\x76\x83\xfa\x79\x66\xc6\x93\x9f\x03\x3d\xda\xf4\
+\x37\x72\x15\xee\xc7\x6a\xb4\x64\xce\xf9\x68\xcc\x73\x29\xc2\x3d\
+\x5e\x54\xdf\x6a\x39\xf8\xac\xd6\x1c\x81\x42\x1a\x28\x9e\x7b\x1b\
+\xf0\xf5\xfb\x11\x92\x1d\xa0\x23\xa1\xdb\xa0\x7e\x91\x5f\xb9\x07\
+\xfd\xd7\xa0\x77\xb2\xba\x0c\x65\x1f\x2a\x1a\xf7\xf0\x59\x24\x56\
+\xda\xfc\x13\x61\x4c\xff\xa2\xc1\xfb\xcd\x3e\x81\xa2\x9c\x80\x4f\
+\x07\x40\x83\x0c\x0a\x0c\x80\x0b\x5b\xb8\x85\xd4\xc3\xd5\x85\xc1\
+\x78\x1d\xe2\xbf\xdb\x1d\xff\x9e\xb3\xd5\xb2\x04\x79\xe7\x50\xdf\
+\x97\xea\x33\x93\x64\x5b\xb6\xc3\xe0\x9c\x40\x31\x43\x84\xbe\xda\
+\xc8\xdb\xa2\x60\x1e\x72\xc7\x41\x80\x01\xf0\x6b\x7e\x5c\x7d\x36\
+\x32\x9c\xa8\xb2\x04\x79\x7d\x5b\x7d\x9a\x07\xee\xcb\x6f\xd9\xf8\
+\x09\x47\x7e\x5e\x42\xd9\x16\xd9\x59\x36\x11\x3c\x93\x22\x86\x08\
+\x7d\x3d\xac\x7d\x5d\x1a\x04\x14\xf6\x8f\x91\x9c\x50\x9f\xb5\x82\
+\x9b\x50\x72\x17\x99\x6c\xc8\xe0\xcb\xdf\x83\x4d\xac\x07\xea\xc3\
+\xf2\x71\x35\x81\xec\x87\x08\x7d\x39\x00\xee\xc8\x12\x04\x18\xc0\
+\x6b\x48\x3e\x09\xf9\xda\xe5\xe5\x7a\xfc\xcd\x6f\xb9\x63\xd3\x20\
+\x9f\xfc\xf2\xa7\x9a\xdb\x3f\x0a\xec\x9f\xe9\x0c\x70\x02\x1c\x22\
+\xcc\xba\x4f\xc0\x97\x03\xd8\xd5\xa5\x21\xa0\xb1\x0e\xd3\xe6\x1f\
+\x84\xcf\xc3\xb8\x4c\x6f\x1b\xe5\x8c\x3f\x87\x2f\xff\x78\x3a\x37\
+\x4c\xe6\x6a\x02\x17\xd6\x67\xf9\xe1\xc3\x01\x6c\x8e\x42\xd8\xd8\
+\x1d\x87\x20\x44\x35\xeb\x11\x88\xcd\x0a\x93\xc0\xf8\x73\xa9\xf6\
+\x4f\xe4\x26\xe4\x9d\xa3\x2f\x9d\x02\xef\xff\xf1\x48\xce\xa8\xcf\
+\xf2\xc2\x87\x03\x08\xb6\x02\x0c\x2f\x13\x27\xf9\x70\x82\x4f\x08\
+\x4c\x7e\xad\xdc\x97\x3f\xa7\x6a\xff\x78\x38\xe2\xf2\x8d\xfa\xb0\
+\x5b\xc0\x09\x9c\x8d\xe4\x90\xfa\x2c\x1f\x7c\x38\x80\x77\xb8\x34\
+\x04\xf7\x43\xa1\xaa\xea\x5c\xbf\x6e\x8a\x8c\xbf\xfc\xe3\xb9\x10\
+\xf7\x41\x47\xd0\x45\xae\x80\xb6\xac\x0f\xf3\xc0\x87\x03\x60\x14\
+\x95\x50\x30\xe8\x64\x28\x4c\x8d\x5b\x3b\xe3\xcf\xf5\xcb\x3f\x9e\
+\x65\xd0\x65\xf5\x61\xb7\x40\x2d\x80\xc3\xcb\x5c\x37\x90\x0d\x3e\
+\x1c\xc0\x86\x2e\x0d\x41\xc8\x2f\x09\x47\x17\x4c\x90\x79\xb5\xbf\
+\x89\xb3\x70\x4f\xcb\xdd\x71\xa7\x80\x13\xd8\x1b\x49\x36\x4d\x01\
+\x1f\x0e\x20\x64\xd4\x9f\x90\x13\x76\x42\x3a\xae\x81\x29\xa4\xda\
+\x3f\x11\xee\xc9\xcf\x05\x4b\x5d\xe5\x1c\xc8\x87\x6d\x05\xc7\x47\
+\x26\x43\xce\xff\x9f\xe1\xd2\x10\x84\xfc\xdb\x03\x01\xe3\x4f\x19\
+\xc3\x2f\x34\x17\xe3\xfe\x18\x6f\xbf\x73\xa0\x16\xc0\x77\x2b\x8b\
+\x65\xf1\x3e\x1c\x40\xc8\x6a\x3a\x0b\x92\x41\x1a\x43\xf0\x3e\x97\
+\x26\x01\xc6\xf1\x39\x24\x56\x17\xf6\xf8\xe2\x70\xdc\x27\x87\x5c\
+\xbb\x48\xdb\x69\xeb\x51\xf0\xe1\x00\x5e\x76\xa9\x77\xe0\x49\x99\
+\xbf\xc3\xea\x33\xaf\x30\x52\x71\x32\x0f\xed\x8c\xff\x0b\xf5\x59\
+\xd1\x70\x18\x77\x3f\xdc\x6f\x27\x16\x0a\x4d\xe0\xbd\x90\xf9\x28\
+\x49\x3e\x1c\x40\xe8\x89\x1f\xdc\xd2\xda\x77\x33\xe3\x28\x38\x97\
+\x24\x7d\x00\x1d\x32\xfe\x1e\x8f\x43\xb3\x70\xdf\xcf\xd5\xa7\xdd\
+\xc0\x7d\xbc\xcc\x77\x06\xfa\x70\x00\x4f\xb9\x34\x08\x28\x48\x06\
+\x19\x9d\x5b\x9f\x79\x81\x1d\x8b\x7f\x53\x1f\xc6\x05\x46\xc0\x36\
+\x7f\x97\x8c\xbf\x07\x17\x61\xed\xd9\x35\x27\x00\x82\xad\x91\xf1\
+\x85\x0f\x07\x40\x0f\x1f\x1a\x1a\x2c\x37\x6d\x68\x0b\xef\xf7\x72\
+\x38\x95\x90\x53\x97\x1b\x71\x5f\xfe\xd2\xdb\xfc\x93\xc1\xbe\x80\
+\x99\x1d\x73\x02\x7b\xb8\xd4\x2c\x3e\x1c\x40\xf0\x25\xa0\x30\x58\
+\xae\x35\xff\x37\x68\xc7\xea\xc2\x68\xf0\x5e\x2f\xc1\xdf\x8a\xde\
+\xf6\xef\xf0\x97\x7f\x22\xac\x09\xd0\x09\x74\x25\x78\x08\xc3\xd2\
+\x51\x66\xf1\xe1\x00\x9e\xc5\x03\xe5\xb8\x6f\x50\xdc\x57\x7b\x11\
+\x34\xbb\xba\x30\x1c\xac\xf6\x5f\x83\xbf\xc1\xe5\x9b\x51\xd1\x97\
+\x7f\x0d\xe8\x04\xba\xd4\x27\xb0\xb5\x4b\x4d\xe2\xc3\x01\x90\x28\
+\x2b\xeb\x60\xc0\x8c\xf4\xcb\xcd\x1b\xaf\x86\x06\x59\x84\xc4\xde\
+\x7e\x2e\xd7\xfc\x19\xfe\x5d\xf4\x0e\x19\x67\xfc\xfa\xf2\xaf\x49\
+\xaf\x26\xd0\x05\x27\x60\xba\x06\xe0\x2b\x24\xd8\x27\x60\x60\x51\
+\xa3\xa3\xe0\xe5\xe1\x22\x21\x3a\x9e\x1f\x40\x0c\x0b\xce\x70\xe0\
+\x9c\x93\xc0\xaf\x3d\x9d\xc3\x9e\xd0\x21\xc8\x57\x92\x07\x20\xe3\
+\x1f\x08\x3e\xa7\x45\x78\x46\xd1\xfb\x64\x62\x81\xf7\xe0\x63\x48\
+\xae\xac\xcf\xec\xe1\xcb\x01\x30\x24\xf8\x93\x78\x90\xbe\x6a\x14\
+\x59\x83\x87\x9e\x63\x30\x8f\x54\xd0\x09\xdc\x88\x77\x87\xef\x50\
+\x71\x58\x77\x00\xbe\x0c\x96\x9d\x3a\xa1\xd6\xed\x67\x85\x8c\x7f\
+\x68\x4a\x6f\x0e\xbc\xe8\x52\x93\xf8\xfc\x62\x73\x2d\x74\xa7\xc1\
+\x4b\xcc\x6a\xbf\x8c\x7f\x78\x38\x44\xf8\x3e\x94\x5f\x89\xa3\x03\
+\xa6\x23\x24\xf9\xdc\x3a\x8b\xdb\x43\xb3\x19\x60\x62\x95\x5d\x6c\
+\x9c\xf1\xab\xcd\xdf\x0e\x6e\x2f\x7e\x73\x49\xcd\x01\xbc\x17\x9b\
+\x22\x09\x3e\x4a\x36\x2a\x3e\x6b\x00\x5c\x13\xc0\x58\xe9\x9d\x03\
+\x0f\xf9\x4c\x24\x32\xfe\xf6\x30\xf8\x2b\x87\x08\xcd\x1a\xcc\x30\
+\xe0\x3e\xb8\x16\xc2\xf4\xbd\xf8\xee\xb4\x9b\xe7\x6e\xba\x33\xe0\
+\x7e\xd9\xe6\xff\xdb\xfa\x4c\x78\x80\x7d\x02\xa5\x34\x07\xcc\x06\
+\x9e\xed\xe1\xdb\x01\x70\x7f\xb8\x73\xeb\xc3\xf2\xc1\x4b\xca\x2f\
+\xbf\xda\xfc\xfe\x61\x9f\x40\x09\x35\x81\x5b\x5c\x6a\x96\x10\xdb\
+\x67\x73\xda\xee\x52\xb4\xe3\x4c\xcf\x80\x6a\x0b\x5e\x4e\xb5\xf9\
+\xc3\x93\x6d\x9f\x00\xde\x0f\xce\x53\xf9\x7d\x88\x31\x12\xcd\xe2\
+\xbb\x06\x40\xb8\x45\xd4\x31\xf5\x61\x99\xc8\xf8\xa3\xc1\x3e\x01\
+\x0e\x11\xe6\x58\x13\xe0\xce\xd5\xa6\x8d\x9f\x84\x70\x00\xe4\x3f\
+\xf0\xd0\xb8\x23\x6f\x71\xe0\xbe\xd8\xe6\x97\xf1\xc7\x23\xd7\x21\
+\xc2\xf9\x2e\x35\x4d\x88\x26\x40\x0f\x36\x05\x16\xa3\xfa\xb6\x4b\
+\x7d\x9a\x3f\x78\x09\xd9\xe6\x57\x87\x5f\x1a\x38\x63\x90\xcd\x81\
+\x50\x21\xe2\xbc\x81\xf7\x84\x4b\xe4\xb7\x81\xcc\xef\x8f\x10\xaa\
+\x06\x40\xd8\x14\xf8\x30\x0a\x83\x73\xf4\xb3\x07\xf7\xc1\x6a\xbf\
+\x8c\x3f\x1d\x39\x2d\x25\x66\xa4\xe7\x2c\x36\x47\x09\x59\x03\xe8\
+\xc1\x8e\x1c\xee\xc9\x9f\xed\x04\x21\x67\xfc\xaa\xf6\xdb\x80\x81\
+\x62\x6f\xb1\x5a\x13\xc0\xbb\x72\x13\x92\x59\xf5\x99\x7d\x62\x38\
+\x00\xc2\xdd\x83\xb9\xe0\x63\x83\xfa\x34\x1f\x64\xfc\x26\x31\xe9\
+\x04\xf0\xae\x70\x18\xfc\x5d\x50\xc8\x1d\xad\xb2\x65\x7b\xe8\x19\
+\x3c\xb4\xb1\x5c\x84\xfc\x9e\x5a\xe5\x5c\x58\x84\x4e\xc0\xcc\xfb\
+\x84\xbc\xac\x82\xf6\x67\xc6\x44\x7f\xb8\x91\xe8\xa3\x4d\x05\x68\
+\x49\xc8\xe3\x0a\xe8\xa3\xcc\xb0\x30\x8d\x19\x27\x80\x7c\xcc\xa9\
+\x72\x24\xa6\x84\x01\x3b\xae\x6d\x2a\x44\x0b\x42\xde\x9e\x80\xd8\
+\x64\x11\x79\xc0\x3e\xa6\x27\x9a\x9e\x65\x2c\xe1\xf7\xff\xaa\xca\
+\x89\x18\x0a\x86\xea\x7a\xa9\xa9\x40\x53\x09\xf9\xf9\x26\x94\x5d\
+\x3f\x85\xa8\x02\xd2\x3c\xd8\xf4\x4c\x43\x0a\xbf\xc9\x6a\x7f\xf4\
+\x38\x93\x25\xc1\x26\x41\xf2\xda\x00\xf2\xb0\x14\xe2\xae\xae\x22\
+\x5f\xb8\x49\xed\xc2\xa6\xe7\x1b\x42\xf8\x2d\xee\x87\xb1\x17\x7f\
+\x58\xb4\x87\xc6\xc7\xa1\xc2\xc6\xc2\x0e\x25\xfc\xe6\xcf\xa1\xa3\
+\xa1\x90\xf3\x21\x44\x5c\x18\xf6\x3d\x58\x93\x00\x7f\x9b\x5f\x7d\
+\xd6\x14\x4d\x07\xfb\xcc\x15\xee\xa7\xf6\x5d\x68\x45\x53\xe1\xfb\
+\x10\xfe\x36\x1f\x20\x57\x69\x7d\x04\x0a\xb9\xb3\xb1\x48\x07\x83\
+\xd3\x9c\x0e\x3d\xdf\xf4\x0e\x8c\x2a\xfc\x3d\x86\xa5\x7f\x0f\x24\
+\x02\xc3\x28\xb1\xec\x23\xb8\x11\x6a\xed\x0c\xf0\x37\x56\x42\xb7\
+\x43\x67\x40\xdc\x6a\x4c\x74\x03\x3a\x02\xf6\xce\x2f\x86\x56\x35\
+\xbd\x1b\x53\x09\xff\xee\x7f\xa0\x85\xd0\x6e\x50\x71\xc4\x9a\x08\
+\xd4\x06\x76\xca\xd1\xeb\xee\x0e\x71\x2e\x01\x97\x19\x6f\x89\x87\
+\xc3\xd1\x84\x35\x18\x1b\x1b\x63\x10\x46\xae\xc2\xe2\x22\x12\x4e\
+\x1f\x5d\x02\x31\x60\xe9\x72\x48\x74\x17\x76\x14\xb2\xa9\x39\x13\
+\xe2\x0e\x53\x33\xf0\x0e\xb1\xdf\xe0\x0d\xf0\xee\x70\xfa\x2e\xa7\
+\xae\x3f\x06\xdd\x01\xf1\xdd\xf9\x21\xc4\x69\xed\x45\x92\x83\x03\
+\xe8\x07\x37\xfd\xa0\x13\xe8\xb5\xdf\xb9\xfe\x9a\xd1\x88\x5e\xab\
+\xce\x84\x98\x1a\xd6\x10\xe8\x04\xf8\x0e\x31\xa4\x1d\x95\xc5\x1c\
+\x7e\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
+\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
+\x84\x10\x42\x08\x21\x84\x10\x42\x94\xca\xb4\x69\xff\x0f\x53\x28\
+\x6a\x03\x74\xad\xe6\x62\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
 \x00\x00\x22\x10\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -9604,22 +9982,25 @@ qt_resource_name = b"\
 \x07\x03\x7d\xc3\
 \x00\x69\
 \x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x27\
-\x05\xb4\x85\x07\
-\x00\x74\
-\x00\x65\x00\x6e\x00\x73\x00\x6f\x00\x72\x00\x62\x00\x75\x00\x69\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2d\x00\x6c\x00\x6f\x00\x67\
-\x00\x6f\x00\x2d\x00\x68\x00\x6f\x00\x72\x00\x69\x00\x7a\x00\x6f\x00\x6e\x00\x74\x00\x61\x00\x6c\x00\x2d\x00\x62\x00\x6c\x00\x61\
-\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x07\xac\x02\xc3\
+\x00\x73\
+\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x73\
+\x00\x08\
+\x08\x01\x56\xc3\
+\x00\x6d\
+\x00\x61\x00\x69\x00\x6e\x00\x2e\x00\x71\x00\x73\x00\x73\
+\x00\x16\
+\x00\x2b\xcc\x87\
+\x00\x63\
+\x00\x6f\x00\x6e\x00\x66\x00\x69\x00\x67\x00\x75\x00\x72\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x5f\x00\x69\x00\x63\x00\x6f\
+\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x21\
 \x01\x17\x07\x47\
 \x00\x74\
 \x00\x65\x00\x6e\x00\x73\x00\x6f\x00\x72\x00\x62\x00\x75\x00\x69\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2d\x00\x6c\x00\x6f\x00\x67\
 \x00\x6f\x00\x2d\x00\x68\x00\x6f\x00\x72\x00\x69\x00\x7a\x00\x6f\x00\x6e\x00\x74\x00\x61\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \
-\x00\x0d\
-\x08\xa6\x3d\x07\
-\x00\x68\
-\x00\x6f\x00\x6d\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x33\
 \x03\x8d\xa5\xc7\
 \x00\x74\
@@ -9627,31 +10008,40 @@ qt_resource_name = b"\
 \x00\x6f\x00\x2d\x00\x68\x00\x6f\x00\x72\x00\x69\x00\x7a\x00\x6f\x00\x6e\x00\x74\x00\x61\x00\x6c\x00\x2d\x00\x62\x00\x6c\x00\x61\
 \x00\x63\x00\x6b\x00\x2d\x00\x77\x00\x68\x00\x69\x00\x74\x00\x65\x00\x2d\x00\x73\x00\x6d\x00\x61\x00\x6c\x00\x6c\x00\x2e\x00\x70\
 \x00\x6e\x00\x67\
+\x00\x27\
+\x05\xb4\x85\x07\
+\x00\x74\
+\x00\x65\x00\x6e\x00\x73\x00\x6f\x00\x72\x00\x62\x00\x75\x00\x69\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2d\x00\x6c\x00\x6f\x00\x67\
+\x00\x6f\x00\x2d\x00\x68\x00\x6f\x00\x72\x00\x69\x00\x7a\x00\x6f\x00\x6e\x00\x74\x00\x61\x00\x6c\x00\x2d\x00\x62\x00\x6c\x00\x61\
+\x00\x63\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x16\
 \x06\xa6\xfd\x67\
 \x00\x74\
 \x00\x65\x00\x6e\x00\x73\x00\x6f\x00\x72\x00\x62\x00\x75\x00\x69\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2d\x00\x69\x00\x63\x00\x6f\
 \x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x10\
-\x0f\x23\xac\xa7\
-\x00\x62\
-\x00\x75\x00\x69\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x07\x43\xcb\x27\
+\x00\x6e\
+\x00\x61\x00\x76\x00\x62\x00\x61\x00\x72\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x08\xa6\x3d\x07\
+\x00\x68\
+\x00\x6f\x00\x6d\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x16\
 \x09\x29\xfa\xe7\
 \x00\x74\
 \x00\x65\x00\x6e\x00\x73\x00\x6f\x00\x72\x00\x62\x00\x75\x00\x69\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2d\x00\x6c\x00\x6f\x00\x67\
 \x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x16\
-\x00\x2b\xcc\x87\
-\x00\x63\
-\x00\x6f\x00\x6e\x00\x66\x00\x69\x00\x67\x00\x75\x00\x72\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x5f\x00\x69\x00\x63\x00\x6f\
-\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x2d\
 \x0b\xd1\x68\x27\
 \x00\x74\
 \x00\x65\x00\x6e\x00\x73\x00\x6f\x00\x72\x00\x62\x00\x75\x00\x69\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2d\x00\x6c\x00\x6f\x00\x67\
 \x00\x6f\x00\x2d\x00\x68\x00\x6f\x00\x72\x00\x69\x00\x7a\x00\x6f\x00\x6e\x00\x74\x00\x61\x00\x6c\x00\x2d\x00\x62\x00\x6c\x00\x61\
 \x00\x63\x00\x6b\x00\x2d\x00\x77\x00\x68\x00\x69\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x10\
+\x0f\x23\xac\xa7\
+\x00\x62\
+\x00\x75\x00\x69\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x16\
 \x0f\x51\x9b\xe7\
 \x00\x64\
@@ -9660,48 +10050,57 @@ qt_resource_name = b"\
 "
 
 qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x03\
-\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x01\xb3\xfb\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x55\xdf\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\xd0\xb0\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x3a\x00\x00\x00\x00\x00\x01\x00\x00\xea\xd5\
-\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\xc3\x4c\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x01\x50\x58\
-\x00\x00\x01\xf6\x00\x00\x00\x00\x00\x01\x00\x01\xd1\x65\
-\x00\x00\x01\x6c\x00\x00\x00\x00\x00\x01\x00\x01\x35\xe1\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x02\x33\xd2\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
+\x00\x00\x00\x12\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0b\x00\x00\x00\x05\
+\x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x03\x04\
+\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x20\x6e\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x8d\xdb\
+\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\xa8\x00\
+\x00\x00\x01\x74\x00\x00\x00\x00\x00\x01\x00\x00\xfd\xdf\
+\x00\x00\x01\xa6\x00\x00\x00\x00\x00\x01\x00\x01\x48\xeb\
+\x00\x00\x01\xcc\x00\x00\x00\x00\x00\x01\x00\x01\x5d\x4f\
+\x00\x00\x01\xec\x00\x00\x00\x00\x00\x01\x00\x01\x6a\xb3\
+\x00\x00\x02\x1e\x00\x00\x00\x00\x00\x01\x00\x01\xce\x56\
+\x00\x00\x02\x7e\x00\x00\x00\x00\x00\x01\x00\x02\x30\xc3\
+\x00\x00\x02\xa4\x00\x00\x00\x00\x00\x01\x00\x02\x4b\x3a\
 "
 
 qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x12\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x03\
+\x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x41\x7c\x02\x67\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0b\x00\x00\x00\x05\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\xc4\x00\x00\x00\x00\x00\x01\x00\x01\xb3\xfb\
-\x00\x00\x01\x76\x6e\xb1\xe6\x02\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x55\xdf\
-\x00\x00\x01\x76\x64\x54\xef\x20\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\xd0\xb0\
-\x00\x00\x01\x76\x83\x36\xa3\x00\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x76\x64\x74\x9e\x05\
-\x00\x00\x01\x3a\x00\x00\x00\x00\x00\x01\x00\x00\xea\xd5\
-\x00\x00\x01\x76\x64\x1b\xc7\x6c\
-\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\xc3\x4c\
-\x00\x00\x01\x76\x6e\xb1\xc8\x31\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x01\x50\x58\
-\x00\x00\x01\x76\x64\x16\xb6\xb7\
-\x00\x00\x01\xf6\x00\x00\x00\x00\x00\x01\x00\x01\xd1\x65\
-\x00\x00\x01\x76\x64\x75\x56\xfd\
-\x00\x00\x01\x6c\x00\x00\x00\x00\x00\x01\x00\x01\x35\xe1\
-\x00\x00\x01\x76\x6e\xb1\xd4\xd9\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x02\x33\xd2\
-\x00\x00\x01\x76\x6e\xb1\xdd\xd6\
+\x00\x00\x00\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x03\x04\
+\x00\x00\x01\x76\x83\x99\x71\x40\
+\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x20\x6e\
+\x00\x00\x01\x76\x83\x99\x71\x40\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x8d\xdb\
+\x00\x00\x01\x76\x83\x99\x71\x40\
+\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\xa8\x00\
+\x00\x00\x01\x76\x83\x99\x71\x40\
+\x00\x00\x01\x74\x00\x00\x00\x00\x00\x01\x00\x00\xfd\xdf\
+\x00\x00\x01\x76\x83\x99\x71\x40\
+\x00\x00\x01\xa6\x00\x00\x00\x00\x00\x01\x00\x01\x48\xeb\
+\x00\x00\x01\xa1\x41\x7d\xd9\xce\
+\x00\x00\x01\xcc\x00\x00\x00\x00\x00\x01\x00\x01\x5d\x4f\
+\x00\x00\x01\x76\x83\x99\x71\x40\
+\x00\x00\x01\xec\x00\x00\x00\x00\x00\x01\x00\x01\x6a\xb3\
+\x00\x00\x01\x76\x83\x99\x71\x40\
+\x00\x00\x02\x1e\x00\x00\x00\x00\x00\x01\x00\x01\xce\x56\
+\x00\x00\x01\x76\x83\x99\x71\x40\
+\x00\x00\x02\x7e\x00\x00\x00\x00\x00\x01\x00\x02\x30\xc3\
+\x00\x00\x01\x76\x83\x99\x71\x40\
+\x00\x00\x02\xa4\x00\x00\x00\x00\x00\x01\x00\x02\x4b\x3a\
+\x00\x00\x01\x76\x83\x99\x71\x40\
 "
 
 qt_version = [int(v) for v in QtCore.qVersion().split('.')]
@@ -25,20 +25,20 @@ defined by the '__all__' attribute.
 """
 
 
-from __future__ import absolute_import
 from __future__ import annotations
-from __future__ import division
-from __future__ import print_function
 
 
 __all__ = ["UiMainWindow"]
 
 
-from PyQt5.QtCore import QCoreApplication, QMetaObject, QSize, Qt
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Dict, Tuple
+
+from PyQt5.QtCore import QCoreApplication, QFile, QLocale, QSize, Qt, QTimer
 from PyQt5.QtGui import QFont, QIcon, QPixmap
 from PyQt5.QtWidgets import (
     QFrame,
-    QGridLayout,
     QHBoxLayout,
     QLabel,
     QMainWindow,
@@ -52,6 +52,87 @@ from PyQt5.QtWidgets import (
 from . import resources as _
 
 
+_MINIMUM_SIZE = QSize(800, 600)  # Conform to Microsoft standards
+_NAV_ICON_NAMES = ("home", "builder", "configuration", "help")
+_NAV_ICON_SIZE = QSize(20, 20)
+
+# Translated texts of the window, keyed by locale name. Cleared whenever
+# the application language changes
+_TR_CACHE: Dict[str, Tuple[str, ...]] = {}
+_TR_SOURCES = (
+    "TensorBuilder",
+    "Home",
+    "Network Builder",
+    "Configuration",
+    "Help",
+    "Copyright 2020, Julian_Orteil\nAll Rights Reserved"
+)
+
+
+def _size_policy(
+    horizontal: QSizePolicy.Policy,
+    vertical: QSizePolicy.Policy,
+    horizontal_stretch: int,
+    vertical_stretch: int
+) -> QSizePolicy:
+    size_policy = QSizePolicy(horizontal, vertical)
+    size_policy.setHorizontalStretch(horizontal_stretch)
+    size_policy.setVerticalStretch(vertical_stretch)
+
+    return size_policy
+
+
+# Size policy prototypes, named after their policies and stretches.
+# 'setSizePolicy()' stores a copy, so they are shared between widgets
+_SP_EE_0_0 = _size_policy(QSizePolicy.Expanding, QSizePolicy.Expanding, 0, 0)
+_SP_EE_1_0 = _size_policy(QSizePolicy.Expanding, QSizePolicy.Expanding, 1, 0)
+_SP_EE_6_0 = _size_policy(QSizePolicy.Expanding, QSizePolicy.Expanding, 6, 0)
+_SP_EE_6_25 = _size_policy(QSizePolicy.Expanding, QSizePolicy.Expanding, 6, 25)
+_SP_EF_0_0 = _size_policy(QSizePolicy.Expanding, QSizePolicy.Fixed, 0, 0)
+
+
+@dataclass(frozen=True)
+class _UiPrototypes:
+    # The resources shared by every main window, built once by
+    # '_prepare_prototypes()'
+    stylesheet: str
+    window_icon: QIcon
+    app_logo: QPixmap
+    nav_font: QFont
+    nav_icons: Dict[str, QIcon]
+    copyright_font: QFont
+
+
+@lru_cache(maxsize=1)
+def _prepare_prototypes() -> _UiPrototypes:
+    # Built lazily on the first call to 'setup_ui', as fonts and icons
+    # cannot be created before the QApplication. Every later window
+    # reuses the same objects
+    stylesheet_file = QFile(":/styles/main.qss")
+    stylesheet_file.open(QFile.ReadOnly)
+
+    # The navbar icons share a single sprite of square cells, so it
+    # only has to be decoded once for every button
+    sprite = QPixmap(":/images/images/navbar_icons.png")
+    size = sprite.height()
+
+    nav_icons = {
+        name: QIcon(sprite.copy(index * size, 0, size, size))
+        for index, name in enumerate(_NAV_ICON_NAMES)
+    }
+
+    return _UiPrototypes(
+        stylesheet=bytes(stylesheet_file.readAll()).decode("utf-8"),
+        window_icon=QIcon(QPixmap(":/images/images/tensorbuilder-icon.png")),
+        app_logo=QPixmap(
+            ":/images/images/tensorbuilder-logo-horizontal-black-white-small.png"
+        ),
+        nav_font=QFont("Segoe UI", 12),
+        nav_icons=nav_icons,
+        copyright_font=QFont("Segoe UI", 8)
+    )
+
+
 class UiMainWindow(object):
     """The primary builder class of the main window.
 
@@ -67,7 +148,8 @@ class UiMainWindow(object):
     """
 
     _central_widget: QWidget
-    _central_layout: QGridLayout
+    _central_layout: QVBoxLayout
+    _body_layout: QHBoxLayout
 
     _main_container: QFrame
 
@@ -84,92 +166,48 @@ class UiMainWindow(object):
     _app_logo: QLabel
     _menubar_main_container: QFrame
 
+    _deferred_setup_done: bool
+
     def setup_ui(self, TensorBuilder: QMainWindow):
-        """Creates and configures the widgets of the main window."""
+        """Creates and configures the widgets of the main window.
 
-        # Setup the window
-        TensorBuilder.resize(1920, 1080)
+        Only the window and its containers are built here. The contents
+        of the navbar and the menubar are built once control returns to
+        the event loop, so the window can be shown without waiting on
+        them.
+        """
 
-        icon = QIcon()
-        icon.addPixmap(
-            QPixmap(":/images/images/tensorbuilder-icon.png"),
-            QIcon.Normal,
-            QIcon.Off
-        )
+        # Hold off repaints until every widget has been added, so the
+        # layouts are resolved once rather than after every insertion
+        TensorBuilder.setUpdatesEnabled(False)
 
-        TensorBuilder.setWindowIcon(icon)
-        TensorBuilder.setMinimumSize(QSize(800, 600))  # Conform to Microsoft standards
-        TensorBuilder.setObjectName("TensorBuilder")
+        self._deferred_setup_done = False
 
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Expanding
-        )
-        size_policy.setHorizontalStretch(0)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(TensorBuilder.sizePolicy().hasHeightForWidth())
-
-        TensorBuilder.setSizePolicy(size_policy)
-        TensorBuilder.setStyleSheet(
-            "QPushButton {\n"
-            "    background-color: rgba(255, 255, 255, 0);\n"
-            "    padding: 5px 0px 5px 25px;\n"
-            "    text-align: left;\n"
-            "}\n"
-            "\n"
-            "QPushButton::hover {\n"
-            "    background-color: rgba(255, 255, 255, 50);\n"
-            "    border-radius: 10px;\n"
-            "}\n"
-            "\n"
-            "QPushButton::pressed {\n"
-            "    background-color: rgba(255, 255, 255, 127);\n"
-            "}\n"
-            "\n"
-            "#central_widget {\n"
-            "    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, "
-            "stop:0 rgba(255, 172, 0, 255), stop:1 rgba(255, 37, 0, 255));\n"
-            "}\n"
-            "\n"
-            "#copyright_label {\n"
-            "    color: gray;\n"
-            "}\n"
-            "\n"
-            "#main_container {\n"
-            "    background-color: white;\n"
-            "    border-top-left-radius: 15px;\n"
-            "}\n"
-            "\n"
-            "#searchbox {\n"
-            "    border-bottom: 1px solid rgb(190, 190, 190);\n"
-            "    border-left: none;\n"
-            "    border-right: none;\n"
-            "    border-top: none;\n"
-            "    margin-left: 5px;\n"
-            "    margin-right: 5px;\n"
-            "    padding-left: 10px;\n"
-            "}`"
-        )
+        prototypes = _prepare_prototypes()
+
+        # Setup the window
+        TensorBuilder.resize(1920, 1080)
+        TensorBuilder.setWindowIcon(prototypes.window_icon)
+        TensorBuilder.setMinimumSize(_MINIMUM_SIZE)
+        TensorBuilder.setObjectName("TensorBuilder")
+        TensorBuilder.setSizePolicy(_SP_EE_0_0)
+        TensorBuilder.setStyleSheet(prototypes.stylesheet)
 
         # Create and configure the central widget
         self._central_widget = QWidget(TensorBuilder)
         self._central_widget.setObjectName("central_widget")
+        self._central_widget.setSizePolicy(_SP_EE_0_0)
 
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Expanding
-        )
-        size_policy.setHorizontalStretch(0)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(self._central_widget.sizePolicy().hasHeightForWidth())
-
-        self._central_widget.setSizePolicy(size_policy)
-
-        self._central_layout = QGridLayout(self._central_widget)
+        self._central_layout = QVBoxLayout(self._central_widget)
         self._central_layout.setContentsMargins(0, 0, 0, 0)
         self._central_layout.setObjectName("central_layout")
         self._central_layout.setSpacing(0)
 
+        self._body_layout = QHBoxLayout()
+        self._body_layout.setContentsMargins(0, 0, 0, 0)
+        self._body_layout.setObjectName("body_layout")
+        self._body_layout.setSpacing(0)
+
         # Create the main container
         self._setup_main_container()
 
@@ -179,15 +217,45 @@ class UiMainWindow(object):
         # Create the menubar
         self._setup_menubar()
 
-        # Add widgets to the central layout
-        self._central_layout.addWidget(self._menubar, 0, 0, 1, 2)
-        self._central_layout.addWidget(self._main_container, 1, 1, 1, 1)
-        self._central_layout.addWidget(self._navbar, 1, 0, 1, 1)
+        # Add widgets to the central layout, with the menubar above the
+        # navbar and the main container. The body takes the vertical
+        # stretch of the main container, as a layout has no size policy
+        self._body_layout.addWidget(self._navbar)
+        self._body_layout.addWidget(self._main_container)
+
+        self._central_layout.addWidget(self._menubar)
+        self._central_layout.addLayout(self._body_layout, 25)
 
         TensorBuilder.setCentralWidget(self._central_widget)
 
-        self._retranslate_ui(TensorBuilder)
-        QMetaObject.connectSlotsByName(TensorBuilder)
+        # The title is needed as soon as the window is shown, so only the
+        # contents are left to the deferred setup
+        self._retranslate_window(TensorBuilder)
+
+        TensorBuilder.setUpdatesEnabled(True)
+
+        # Build the rest of the widgets after the window is first shown.
+        # The timer is owned by the window, so it is cancelled if the
+        # window is deleted before the event loop gets to it
+        deferred_timer = QTimer(TensorBuilder)
+        deferred_timer.setSingleShot(True)
+        deferred_timer.timeout.connect(partial(self._setup_deferred, TensorBuilder))
+        deferred_timer.timeout.connect(deferred_timer.deleteLater)
+        deferred_timer.start(0)
+
+    def _setup_deferred(self, TensorBuilder: QMainWindow) -> None:
+        TensorBuilder.setUpdatesEnabled(False)
+
+        # Fill the navbar and the menubar
+        self._setup_navbar_widgets()
+        self._setup_menubar_widgets()
+
+        # The button signals are wired explicitly by the view, so there
+        # is no need to scan for 'on_<name>_<signal>' slots here
+        self._retranslate_ui()
+        self._deferred_setup_done = True
+
+        TensorBuilder.setUpdatesEnabled(True)
 
     def _setup_main_container(self) -> None:
         # Create the main container
@@ -195,16 +263,7 @@ class UiMainWindow(object):
         self._main_container.setFrameShadow(QFrame.Raised)
         self._main_container.setFrameShape(QFrame.StyledPanel)
         self._main_container.setObjectName("main_container")
-
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Expanding
-        )
-        size_policy.setHorizontalStretch(6)
-        size_policy.setVerticalStretch(25)
-        size_policy.setHeightForWidth(self._main_container.sizePolicy().hasHeightForWidth())
-
-        self._main_container.setSizePolicy(size_policy)
+        self._main_container.setSizePolicy(_SP_EE_6_25)
 
     def _setup_navbar(self) -> None:
         # Create the navbar
@@ -213,146 +272,37 @@ class UiMainWindow(object):
         self._navbar.setFrameShape(QFrame.StyledPanel)
         self._navbar.setMinimumSize(QSize(275, 0))
         self._navbar.setObjectName("navbar")
-
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Expanding
-        )
-        size_policy.setHorizontalStretch(1)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(self._navbar.sizePolicy().hasHeightForWidth())
-
-        self._navbar.setSizePolicy(size_policy)
+        self._navbar.setSizePolicy(_SP_EE_1_0)
 
         self._navbar_layout = QVBoxLayout(self._navbar)
         self._navbar_layout.setContentsMargins(0, 25, 0, 15)
         self._navbar_layout.setObjectName("navbar_layout")
         self._navbar_layout.setSpacing(15)
 
-        # Create the home button
-        self._home_button = QPushButton(self._navbar)
-
-        font = QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-
-        self._home_button.setFont(font)
-
-        home_icon = QIcon()
-        home_icon.addPixmap(
-            QPixmap(":/images/images/home_icon.png"),
-            QIcon.Normal,
-            QIcon.Off
-        )
-
-        self._home_button.setIcon(home_icon)
-        self._home_button.setIconSize(QSize(20, 20))
-        self._home_button.setObjectName("home_button")
-
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Fixed
+    def _setup_navbar_widgets(self) -> None:
+        # Create the navbar buttons
+        self._home_button = self._make_nav_button(
+            "home_button",
+            "home"
         )
-        size_policy.setHorizontalStretch(0)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(self._home_button.sizePolicy().hasHeightForWidth())
-
-        self._home_button.setSizePolicy(size_policy)
         self._home_button.setStyleSheet(
             "background-color: rgba(255, 255, 255, 50);\n"
             "border-radius: 0px;"
         )
 
-        # Create the builder button
-        self._builder_button = QPushButton(self._navbar)
-
-        font = QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-
-        self._builder_button.setFont(font)
-
-        builder_icon = QIcon()
-        builder_icon.addPixmap(
-            QPixmap(":/images/images/builder_icon.png"),
-            QIcon.Normal,
-            QIcon.Off
-        )
-
-        self._builder_button.setIcon(builder_icon)
-        self._builder_button.setIconSize(QSize(20, 20))
-        self._builder_button.setObjectName("builder_button")
-
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Fixed
-        )
-        size_policy.setHorizontalStretch(0)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(self._builder_button.sizePolicy().hasHeightForWidth())
-
-        self._builder_button.setSizePolicy(size_policy)
-
-        # Create the configuration button
-        self._configuration_button = QPushButton(self._navbar)
-
-        font = QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-
-        self._configuration_button.setFont(font)
-
-        configuration_icon = QIcon()
-        configuration_icon.addPixmap(
-            QPixmap(":/images/images/configuration_icon.png"),
-            QIcon.Normal,
-            QIcon.Off
+        self._builder_button = self._make_nav_button(
+            "builder_button",
+            "builder"
         )
-
-        self._configuration_button.setIcon(configuration_icon)
-        self._configuration_button.setIconSize(QSize(20, 20))
-        self._configuration_button.setObjectName("configuration_button")
-
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Fixed
+        self._configuration_button = self._make_nav_button(
+            "configuration_button",
+            "configuration"
         )
-        size_policy.setHorizontalStretch(0)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(self._configuration_button.sizePolicy().hasHeightForWidth())
-
-        self._configuration_button.setSizePolicy(size_policy)
-
-        # Create the help button
-        self._help_button = QPushButton(self._navbar)
-
-        font = QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-
-        self._help_button.setFont(font)
-
-        help_icon = QIcon()
-        help_icon.addPixmap(
-            QPixmap(":/images/images/documentation_icon.png"),
-            QIcon.Normal,
-            QIcon.Off
+        self._help_button = self._make_nav_button(
+            "help_button",
+            "help"
         )
 
-        self._help_button.setIcon(help_icon)
-        self._help_button.setIconSize(QSize(20, 20))
-        self._help_button.setObjectName("help_button")
-
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Fixed
-        )
-        size_policy.setHorizontalStretch(0)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(self._help_button.sizePolicy().hasHeightForWidth())
-
-        self._help_button.setSizePolicy(size_policy)
-
         navbar_vertical_spacer = QSpacerItem(
             20,
             40,
@@ -363,11 +313,7 @@ class UiMainWindow(object):
         self._copyright_label = QLabel(self._navbar)
         self._copyright_label.setAlignment(Qt.AlignCenter)
 
-        font = QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(8)
-
-        self._copyright_label.setFont(font)
+        self._copyright_label.setFont(_prepare_prototypes().copyright_font)
         self._copyright_label.setObjectName("copyright_label")
 
         # Add widgets to navbar layout
@@ -378,74 +324,89 @@ class UiMainWindow(object):
         self._navbar_layout.addItem(navbar_vertical_spacer)
         self._navbar_layout.addWidget(self._copyright_label)
 
+    def _make_nav_button(self, object_name: str, icon_name: str) -> QPushButton:
+        prototypes = _prepare_prototypes()
+
+        button = QPushButton(self._navbar)
+        button.setFont(prototypes.nav_font)
+        button.setIcon(prototypes.nav_icons[icon_name])
+        button.setIconSize(_NAV_ICON_SIZE)
+        button.setObjectName(object_name)
+        button.setSizePolicy(_SP_EF_0_0)
+
+        return button
+
     def _setup_menubar(self) -> None:
         # Create the menubar
         self._menubar = QFrame(self._central_widget)
         self._menubar.setFrameShadow(QFrame.Raised)
         self._menubar.setFrameShape(QFrame.StyledPanel)
         self._menubar.setObjectName("menubar")
-
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Expanding
-        )
-        size_policy.setHorizontalStretch(1)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(self._menubar.sizePolicy().hasHeightForWidth())
-
-        self._menubar.setSizePolicy(size_policy)
+        self._menubar.setSizePolicy(_SP_EE_1_0)
 
         self._menubar_layout = QHBoxLayout(self._menubar)
         self._menubar_layout.setContentsMargins(0, 0, 0, 0)
         self._menubar_layout.setObjectName("menubar_layout")
         self._menubar_layout.setSpacing(0)
 
+    def _setup_menubar_widgets(self) -> None:
         # Create the app logo
         self._app_logo = QLabel(self._menubar)
         self._app_logo.setObjectName("app_logo")
-        self._app_logo.setPixmap(
-            QPixmap(":/images/images/tensorbuilder-logo-horizontal-black-white-small.png")
-        )
+        self._app_logo.setPixmap(_prepare_prototypes().app_logo)
         self._app_logo.setText('')
-
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Expanding
-        )
-        size_policy.setHorizontalStretch(1)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(self._app_logo.sizePolicy().hasHeightForWidth())
-
-        self._app_logo.setSizePolicy(size_policy)
+        self._app_logo.setSizePolicy(_SP_EE_1_0)
 
         # Create the menubar main container
         self._menubar_main_container = QFrame(self._menubar)
         self._menubar_main_container.setFrameShadow(QFrame.Raised)
         self._menubar_main_container.setFrameShape(QFrame.StyledPanel)
         self._menubar_main_container.setObjectName("menubar_main_container")
-
-        size_policy = QSizePolicy(
-            QSizePolicy.Expanding,
-            QSizePolicy.Expanding
-        )
-        size_policy.setHorizontalStretch(6)
-        size_policy.setVerticalStretch(0)
-        size_policy.setHeightForWidth(self._menubar_main_container.sizePolicy().hasHeightForWidth())
-
-        self._menubar_main_container.setSizePolicy(size_policy)
+        self._menubar_main_container.setSizePolicy(_SP_EE_6_0)
 
         # Add widgets to the menu layout
         self._menubar_layout.addWidget(self._app_logo)
         self._menubar_layout.addWidget(self._menubar_main_container)
 
-    def _retranslate_ui(self, TensorBuilder: QMainWindow) -> None:
-        _translate = QCoreApplication.translate
-
-        TensorBuilder.setWindowTitle(_translate("TensorBuilder", "TensorBuilder"))
-        self._home_button.setText(_translate("TensorBuilder", "Home"))
-        self._builder_button.setText(_translate("TensorBuilder", "Network Builder"))
-        self._configuration_button.setText(_translate("TensorBuilder", "Configuration"))
-        self._help_button.setText(_translate("TensorBuilder", "Help"))
-        self._copyright_label.setText(
-            _translate("TensorBuilder", "Copyright 2020, Julian_Orteil\nAll Rights Reserved")
-        )
+    def _on_language_change(self, TensorBuilder: QMainWindow) -> None:
+        # Should be called by the window when it receives a LanguageChange
+        # event, as the cached texts belong to the previous translator
+        _TR_CACHE.clear()
+        self._retranslate_window(TensorBuilder)
+
+        # Before the deferred setup there are no texts to update; it
+        # translates them itself once the widgets exist
+        if self._deferred_setup_done:
+            self._retranslate_ui()
+
+    def _translations(self) -> Tuple[str, ...]:
+        locale_name = QLocale().name()
+
+        translations = _TR_CACHE.get(locale_name)
+        if translations is None:
+            _translate = QCoreApplication.translate
+
+            translations = tuple(
+                _translate("TensorBuilder", source) for source in _TR_SOURCES
+            )
+            _TR_CACHE[locale_name] = translations
+
+        return translations
+
+    def _retranslate_window(self, TensorBuilder: QMainWindow) -> None:
+        TensorBuilder.setWindowTitle(self._translations()[0])
+
+    def _retranslate_ui(self) -> None:
+        (
+            home_text,
+            builder_text,
+            configuration_text,
+            help_text,
+            copyright_text
+        ) = self._translations()[1:]
+
+        self._home_button.setText(home_text)
+        self._builder_button.setText(builder_text)
+        self._configuration_button.setText(configuration_text)
+        self._help_button.setText(help_text)
+        self._copyright_label.setText(copyright_text)
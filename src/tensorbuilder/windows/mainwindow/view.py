@@ -23,10 +23,7 @@ defined by the '__all__' attribute.
 """
 
 
-from __future__ import absolute_import
 from __future__ import annotations
-from __future__ import division
-from __future__ import print_function
 
 
 __all__ = ["MainWindowView"]
@@ -35,12 +32,15 @@ __all__ = ["MainWindowView"]
 from typing import Optional
 
 from loguru import logger
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import QEvent, QObject, Qt, pyqtSignal
 
 from tensorbuilder.utils import QMainWindow
 from .ui import UiMainWindow
 
 
+_QUALNAME = f"{__name__}.MainWindowView"
+
+
 class MainWindowView(UiMainWindow, QMainWindow):
     """Manages display events for the main window.
 
@@ -84,37 +84,43 @@ class MainWindowView(UiMainWindow, QMainWindow):
         self,
         parent: Optional[QObject] = None
     ) -> None:
-        logger.debug(f"Initializing {__name__}.{__class__.__name__}")
+        logger.debug("Initializing {}", _QUALNAME)
         super().__init__(parent=parent)
 
         # Build the window widgets
         self.setup_ui(self)
 
-        # Connect signals to slots
-        self._connect_signals()
+        logger.success("Successfully initialized {}", _QUALNAME)
 
-        logger.success(f"Successfully initialized {__name__}.{__class__.__name__}")
+    def changeEvent(self, event: QEvent) -> None:
+        if event.type() == QEvent.LanguageChange:
+            self._on_language_change(self)
 
-    def _connect_signals(self) -> None:
-        logger.debug("Connecting main window view signals")
+        super().changeEvent(event)
 
-        self._home_button.clicked.connect(self._on_home_button_clicked)
-        self._builder_button.clicked.connect(self._on_builder_button_clicked)
-        self._configuration_button.clicked.connect(self._on_configuration_button_clicked)
-        self._help_button.clicked.connect(self._on_help_button_clicked)
+    def _setup_deferred(self, TensorBuilder: QMainWindow) -> None:
+        super()._setup_deferred(TensorBuilder)
 
-    @pyqtSlot()
-    def _on_home_button_clicked(self) -> None:
-        self.home_button_clicked.emit()
-
-    @pyqtSlot()
-    def _on_builder_button_clicked(self) -> None:
-        self.builder_button_clicked.emit()
+        # Connect signals to slots once the navbar buttons exist
+        self._connect_signals()
 
-    @pyqtSlot()
-    def _on_configuration_button_clicked(self) -> None:
-        self.configuration_button_clicked.emit()
+    def _connect_signals(self) -> None:
+        logger.debug("Connecting main window view signals")
 
-    @pyqtSlot()
-    def _on_help_button_clicked(self) -> None:
-        self.help_button_clicked.emit()
+        # The buttons and the view always live in the GUI thread
+        self._home_button.clicked.connect(
+            self.home_button_clicked,
+            Qt.DirectConnection
+        )
+        self._builder_button.clicked.connect(
+            self.builder_button_clicked,
+            Qt.DirectConnection
+        )
+        self._configuration_button.clicked.connect(
+            self.configuration_button_clicked,
+            Qt.DirectConnection
+        )
+        self._help_button.clicked.connect(
+            self.help_button_clicked,
+            Qt.DirectConnection
+        )